@@ -16,12 +16,16 @@ if(BUILD_DOCUMENTATION)
             ${PROJECT_SOURCE_DIR}/src/gm/base
             ${PROJECT_SOURCE_DIR}/src/gm/types
             ${PROJECT_SOURCE_DIR}/src/gm/functions
+            ${PROJECT_SOURCE_DIR}/src/gm/bvh
         DEPENDENCIES
             gm
     )
 endif()
 
 if(BUILD_PYTHON_BINDINGS)
-    find_package(Python COMPONENTS Development Interpreter)
+    find_package(Python COMPONENTS Development Interpreter OPTIONAL_COMPONENTS NumPy)
     message(STATUS "Found python executable: ${Python_EXECUTABLE}")
+    if(Python_NumPy_FOUND)
+        message(STATUS "Found NumPy headers: ${Python_NumPy_INCLUDE_DIRS}")
+    endif()
 endif()
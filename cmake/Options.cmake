@@ -4,3 +4,11 @@ option(BUILD_TESTING "Build & run automated tests." OFF)
 option(BUILD_DOCUMENTATION "Build doxygen documentation." OFF)
 option(BUILD_PYTHON_BINDINGS "Build python bindings." OFF)
 option(BUILD_BENCHMARKING "Build performance benchmarking." OFF)
+
+set(GM_SIMD "OFF" CACHE STRING "SIMD instruction set of the accelerated float vector, matrix & function code paths (OFF, SSE, AVX2).")
+set_property(CACHE GM_SIMD PROPERTY STRINGS OFF SSE AVX2)
+
+set(GM_PYTHON_BACKEND "pybind11" CACHE STRING "Backend of the python bindings (pybind11, lean, all): the pybind11 gm module, the lean CPython API gmlean module, or both.")
+set_property(CACHE GM_PYTHON_BACKEND PROPERTY STRINGS pybind11 lean all)
+
+set(GM_PYTHON_MAX_IMPORT_MILLISECONDS "100" CACHE STRING "Maximum time of importing the gm python module, in milliseconds, over which the import time benchmark test fails.")
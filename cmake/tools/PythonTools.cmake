@@ -38,7 +38,7 @@ function(
     )
 
     # Apply properties.
-    _cpp_target_properties(${LIBRARY_NAME}
+    _cpp_target_properties(${TARGET_NAME}
         INCLUDE_PATHS
             ${args_INCLUDE_PATHS}
         DEFINES
@@ -0,0 +1,95 @@
+#pragma once
+
+/// \file base/batch.h
+///
+/// Argument views for the batched function overloads, in the functions/batch/ headers.
+///
+/// A batched function evaluates its scalar counterpart over \p i_count elements.  Each input argument is
+/// a \ref BatchInput, which either views \p i_count contiguous values, or broadcasts a single uniform value
+/// across all the elements.  Outputs are contiguous arrays of \p i_count values.
+///
+/// Batched functions follow a no-alias contract: the memory of an output array must not overlap with the
+/// memory of any other input or output argument.  The outputs are qualified with \ref GM_RESTRICT such
+/// that compilers may vectorize the element loop, so violating the contract is undefined behavior.
+
+#include <gm/gm.h>
+
+#include <cstddef>
+#include <vector>
+
+/// \def GM_RESTRICT
+///
+/// Qualifies a pointer as the only means of accessing the memory it points to, within its scope.
+#if defined( _MSC_VER )
+#define GM_RESTRICT __restrict
+#else
+#define GM_RESTRICT __restrict__
+#endif
+
+GM_NS_OPEN
+
+/// \class BatchInput
+///
+/// Read-only view of an input argument of a batched function.
+///
+/// A view constructed from a pointer (or array) is \em varying, where each element is read from consecutive
+/// memory.  A view constructed from a single value is \em uniform, where the same value is read for every
+/// element.  Elements are addressed with a stride of 1 or 0 respectively, such that compilers can version
+/// the loops of batched functions on the stride.
+///
+/// The view does not own the viewed memory, which must outlive the batched function call.
+template < typename ValueT >
+class BatchInput final
+{
+public:
+    /// Construct a varying view of the contiguous values starting at \p i_values.
+    ///
+    /// \param i_values Pointer to the first value.
+    GM_HOST_DEVICE constexpr inline BatchInput( const ValueT* i_values )
+        : m_data( i_values )
+        , m_stride( 1 )
+    {
+    }
+
+    /// Construct a varying view of the values of the array \p i_values.
+    ///
+    /// \param i_values The array of values.
+    inline BatchInput( const std::vector< ValueT >& i_values )
+        : m_data( i_values.data() )
+        , m_stride( 1 )
+    {
+    }
+
+    /// Construct a uniform view, broadcasting \p i_value across all the elements.
+    ///
+    /// \param i_value The uniform value.
+    GM_HOST_DEVICE constexpr inline BatchInput( const ValueT& i_value )
+        : m_data( &i_value )
+        , m_stride( 0 )
+    {
+    }
+
+    /// Read the value of the element at \p i_index.
+    ///
+    /// \param i_index Index of the element.
+    ///
+    /// \return The value of the element.
+    GM_HOST_DEVICE constexpr inline const ValueT& operator[]( size_t i_index ) const
+    {
+        return m_data[ i_index * m_stride ];
+    }
+
+    /// Check if this view broadcasts a single value across all the elements.
+    ///
+    /// \return True if this view is uniform.
+    GM_HOST_DEVICE constexpr inline bool IsUniform() const
+    {
+        return m_stride == 0;
+    }
+
+private:
+    const ValueT* m_data   = nullptr;
+    size_t        m_stride = 0;
+};
+
+GM_NS_CLOSE
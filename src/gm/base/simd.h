@@ -0,0 +1,28 @@
+#pragma once
+
+/// \file base/simd.h
+///
+/// SIMD instruction set selection, for the accelerated code paths of the float vector and matrix types
+/// and the linear algebra functions.
+///
+/// The instruction set is chosen at compile time, via the \p GM_SIMD CMake option which defines
+/// \p GM_SIMD_SSE (SSE4.1) and / or \p GM_SIMD_AVX2 (AVX2 and FMA).  The scalar code paths are used
+/// when neither are defined, and always in CUDA device code.
+
+#include <gm/gm.h>
+
+/// \def GM_SIMD_SSE_ENABLED
+///
+/// Defined when the SSE4.1 code paths are compiled.
+#if ( defined( GM_SIMD_SSE ) || defined( GM_SIMD_AVX2 ) ) && !defined( __CUDA_ARCH__ )
+#define GM_SIMD_SSE_ENABLED
+#include <smmintrin.h>
+#endif
+
+/// \def GM_SIMD_AVX2_ENABLED
+///
+/// Defined when the AVX2 and FMA code paths are compiled.  Implies \ref GM_SIMD_SSE_ENABLED.
+#if defined( GM_SIMD_AVX2 ) && !defined( __CUDA_ARCH__ )
+#define GM_SIMD_AVX2_ENABLED
+#include <immintrin.h>
+#endif
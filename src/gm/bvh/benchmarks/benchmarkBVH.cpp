@@ -0,0 +1,63 @@
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/bvh/bvh.h>
+
+#include <vector>
+
+// A grid of unit boxes, spaced 2 units apart on the XY plane.
+static gm::Vec3fRangeArray GridBounds( int i_size )
+{
+    gm::Vec3fRangeArray bounds;
+    for ( int y = 0; y < i_size; ++y )
+    {
+        for ( int x = 0; x < i_size; ++x )
+        {
+            bounds.push_back( gm::Vec3fRange( gm::Vec3f( 2.0f * x, 2.0f * y, 0.0f ),
+                                              gm::Vec3f( 2.0f * x + 1.0f, 2.0f * y + 1.0f, 1.0f ) ) );
+        }
+    }
+    return bounds;
+}
+
+TEST_CASE( "BVH_Build" )
+{
+    gm::Vec3fRangeArray bounds = GridBounds( 256 );
+    BENCHMARK( "BVH_Build_65536" )
+    {
+        return gm::BVH( bounds );
+    };
+}
+
+TEST_CASE( "BVH_ClosestHit" )
+{
+    gm::Vec3fRangeArray bounds = GridBounds( 256 );
+    gm::BVH             bvh( bounds );
+    gm::Vec3f           rayOrigin( 300.5f, 200.5f, 5.0f );
+    gm::Vec3f           rayDirection( 0.0f, 0.0f, -1.0f );
+
+    BENCHMARK( "BVH_ClosestHit_65536" )
+    {
+        int            primitiveIndex = -1;
+        gm::FloatRange intersections;
+        bvh.ClosestHit( rayOrigin, rayDirection, bounds, primitiveIndex, intersections );
+        return primitiveIndex;
+    };
+
+    BENCHMARK( "BruteForce_ClosestHit_65536" )
+    {
+        int            primitiveIndex = -1;
+        gm::FloatRange closest( std::numeric_limits< float >::max(), std::numeric_limits< float >::max() );
+        for ( size_t index = 0; index < bounds.size(); ++index )
+        {
+            gm::FloatRange intersections;
+            if ( gm::RayAABBIntersection( rayOrigin, rayDirection, bounds[ index ], intersections ) &&
+                 intersections.Min() < closest.Min() )
+            {
+                primitiveIndex = static_cast< int >( index );
+                closest        = intersections;
+            }
+        }
+        return primitiveIndex;
+    };
+}
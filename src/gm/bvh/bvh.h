@@ -0,0 +1,527 @@
+#pragma once
+
+/// \file bvh/bvh.h
+/// \ingroup gm_bvh
+///
+/// Bounding volume hierarchy (BVH) over axis-aligned bounding boxes.
+///
+/// The hierarchy is built top-down with the surface area heuristic (SAH), evaluated over a fixed number of
+/// bins per axis.  Ray queries visit only the nodes whose bounds are intersected by the ray, reducing the number
+/// of primitive tests from linear to logarithmic in the number of primitives.
+
+#include <gm/gm.h>
+
+#include <gm/base/diagnostic.h>
+
+#include <gm/types/floatRange.h>
+#include <gm/types/ray.h>
+#include <gm/types/vec3f.h>
+#include <gm/types/vec3fRange.h>
+#include <gm/types/vec3fRangeArray.h>
+
+#include <gm/functions/expand.h>
+#include <gm/functions/rayAABBIntersection.h>
+
+#include <algorithm>
+#include <cstdint>
+#include <limits>
+#include <vector>
+
+GM_NS_OPEN
+
+/// \class BVH
+/// \ingroup gm_bvh
+///
+/// Bounding volume hierarchy over a set of primitives, each described by its axis-aligned bounding box.
+///
+/// The primitives are identified by their index in the array of bounds the hierarchy was built from.
+///
+/// Example usage:
+/// \code{.cpp}
+/// gm::BVH bvh( primitiveBounds );
+///
+/// int            primitiveIndex;
+/// gm::FloatRange intersections;
+/// if ( bvh.ClosestHit( rayOrigin,
+///                      rayDirection,
+///                      []( size_t i_primitiveIndex, gm::FloatRange& o_intersections ) {
+///                          return IntersectTriangle( i_primitiveIndex, o_intersections );
+///                      },
+///                      primitiveIndex,
+///                      intersections ) )
+/// {
+///     // ...
+/// }
+/// \endcode
+class BVH final
+{
+public:
+    /// The default maximum number of primitives stored in a leaf node.
+    static constexpr size_t c_defaultMaxLeafSize = 4;
+
+    /// The default number of bins per axis, in which split candidates are evaluated.
+    static constexpr size_t c_defaultBinCount = 16;
+
+    /// The maximum depth of the hierarchy, bounding the size of the traversal stack.
+    static constexpr size_t c_maxDepth = 64;
+
+    // --------------------------------------------------------------------- //
+    /// \name Construction
+    // --------------------------------------------------------------------- //
+
+    /// Default constructor, initializing an empty hierarchy.
+    inline BVH() = default;
+
+    /// Construct a hierarchy over the primitives described by \p i_primitiveBounds.
+    ///
+    /// \sa Build
+    inline explicit BVH( const Vec3fRangeArray& i_primitiveBounds,
+                         size_t                 i_maxLeafSize = c_defaultMaxLeafSize,
+                         size_t                 i_binCount    = c_defaultBinCount )
+    {
+        Build( i_primitiveBounds, i_maxLeafSize, i_binCount );
+    }
+
+    /// Build the hierarchy over the primitives described by \p i_primitiveBounds, replacing any existing nodes.
+    ///
+    /// \param i_primitiveBounds The bounds of each primitive.
+    /// \param i_maxLeafSize Nodes with this many primitives or less are not split further.
+    /// \param i_binCount The number of bins per axis, in which split candidates are evaluated.
+    inline void Build( const Vec3fRangeArray& i_primitiveBounds,
+                       size_t                 i_maxLeafSize = c_defaultMaxLeafSize,
+                       size_t                 i_binCount    = c_defaultBinCount )
+    {
+        GM_ASSERT( i_maxLeafSize > 0 );
+        GM_ASSERT( i_binCount > 1 );
+
+        size_t primitiveCount = i_primitiveBounds.size();
+        m_nodes.clear();
+        m_primitiveIndices.resize( primitiveCount );
+        if ( primitiveCount == 0 )
+        {
+            return;
+        }
+
+        std::vector< Vec3f > centroids( primitiveCount );
+        for ( size_t primitiveIndex = 0; primitiveIndex < primitiveCount; ++primitiveIndex )
+        {
+            m_primitiveIndices[ primitiveIndex ] = static_cast< uint32_t >( primitiveIndex );
+            centroids[ primitiveIndex ] =
+                ( i_primitiveBounds[ primitiveIndex ].Min() + i_primitiveBounds[ primitiveIndex ].Max() ) * 0.5f;
+        }
+
+        m_nodes.reserve( 2 * primitiveCount - 1 );
+        _BuildNode( i_primitiveBounds.data(), centroids, 0, primitiveCount, 0, i_maxLeafSize, i_binCount );
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Queries
+    // --------------------------------------------------------------------- //
+
+    /// Check if the hierarchy is empty.
+    inline bool IsEmpty() const
+    {
+        return m_nodes.empty();
+    }
+
+    /// Get the number of primitives.
+    inline size_t GetPrimitiveCount() const
+    {
+        return m_primitiveIndices.size();
+    }
+
+    /// Get the number of nodes.
+    inline size_t GetNodeCount() const
+    {
+        return m_nodes.size();
+    }
+
+    /// Get the bounds of all the primitives.
+    ///
+    /// \pre The hierarchy must not be empty.
+    inline const Vec3fRange& GetBounds() const
+    {
+        GM_ASSERT( !IsEmpty() );
+        return m_nodes[ 0 ].m_bounds;
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Ray traversal
+    // --------------------------------------------------------------------- //
+
+    /// Find the primitive closest to the ray origin, intersected by a ray.
+    ///
+    /// Nodes are visited front to back, and are skipped once a closer primitive intersection has been found.
+    ///
+    /// \param i_rayOrigin The origin of the ray.
+    /// \param i_rayDirection The normalised direction of the ray.
+    /// \param i_intersector Callable intersecting the ray with a single primitive, with the signature
+    /// <tt>bool( size_t i_primitiveIndex, FloatRange& o_intersections )</tt>.  The minimum of the output
+    /// intersections is the ray magnitude of the primitive hit.
+    /// \param o_primitiveIndex The index of the closest primitive intersected.
+    /// \param o_intersections The intersections of the closest primitive intersected.
+    ///
+    /// \retval true The ray intersects a primitive.
+    /// \retval false The ray does not intersect any primitive.  The outputs are left unmodified.
+    template < typename IntersectorT >
+    inline bool ClosestHit( const Vec3f&        i_rayOrigin,
+                            const Vec3f&        i_rayDirection,
+                            const IntersectorT& i_intersector,
+                            int&                o_primitiveIndex,
+                            FloatRange&         o_intersections ) const
+    {
+        float closestMagnitude = std::numeric_limits< float >::max();
+        bool  hit              = false;
+        _Traverse( Ray( i_rayOrigin, i_rayDirection ),
+                   closestMagnitude,
+                   /* i_nearestFirst */ true,
+                   [&]( uint32_t i_primitiveIndex ) {
+                       FloatRange intersections;
+                       if ( i_intersector( static_cast< size_t >( i_primitiveIndex ), intersections ) &&
+                            intersections.Min() < closestMagnitude )
+                       {
+                           closestMagnitude = intersections.Min();
+                           o_primitiveIndex = static_cast< int >( i_primitiveIndex );
+                           o_intersections  = intersections;
+                           hit              = true;
+                       }
+                       return false;
+                   } );
+        return hit;
+    }
+
+    /// Find the primitive closest to the ray origin, whose bounds are intersected by a ray.
+    ///
+    /// \param i_rayOrigin The origin of the ray.
+    /// \param i_rayDirection The normalised direction of the ray.
+    /// \param i_primitiveBounds The bounds of each primitive, which the hierarchy was built from.
+    /// \param o_primitiveIndex The index of the closest primitive intersected.
+    /// \param o_intersections The intersections of the bounds of the closest primitive intersected.
+    ///
+    /// \retval true The ray intersects the bounds of a primitive.
+    /// \retval false The ray does not intersect the bounds of any primitive.  The outputs are left unmodified.
+    inline bool ClosestHit( const Vec3f&           i_rayOrigin,
+                            const Vec3f&           i_rayDirection,
+                            const Vec3fRangeArray& i_primitiveBounds,
+                            int&                   o_primitiveIndex,
+                            FloatRange&            o_intersections ) const
+    {
+        Ray ray( i_rayOrigin, i_rayDirection );
+        return ClosestHit(
+            i_rayOrigin,
+            i_rayDirection,
+            [&]( size_t i_primitiveIndex, FloatRange& o_primitiveIntersections ) {
+                return RayAABBIntersection( ray, i_primitiveBounds[ i_primitiveIndex ], o_primitiveIntersections );
+            },
+            o_primitiveIndex,
+            o_intersections );
+    }
+
+    /// Check if a ray intersects any primitive.
+    ///
+    /// The traversal terminates upon the first primitive intersection found, which is not necessarily the closest.
+    ///
+    /// \param i_rayOrigin The origin of the ray.
+    /// \param i_rayDirection The normalised direction of the ray.
+    /// \param i_intersector Callable intersecting the ray with a single primitive, with the signature
+    /// <tt>bool( size_t i_primitiveIndex, FloatRange& o_intersections )</tt>.
+    ///
+    /// \retval true The ray intersects a primitive.
+    /// \retval false The ray does not intersect any primitive.
+    template < typename IntersectorT >
+    inline bool AnyHit( const Vec3f& i_rayOrigin, const Vec3f& i_rayDirection, const IntersectorT& i_intersector ) const
+    {
+        float maxMagnitude = std::numeric_limits< float >::max();
+        return _Traverse( Ray( i_rayOrigin, i_rayDirection ),
+                          maxMagnitude,
+                          /* i_nearestFirst */ false,
+                          [&]( uint32_t i_primitiveIndex ) {
+                              FloatRange intersections;
+                              return i_intersector( static_cast< size_t >( i_primitiveIndex ), intersections );
+                          } );
+    }
+
+    /// Check if a ray intersects the bounds of any primitive.
+    ///
+    /// \param i_rayOrigin The origin of the ray.
+    /// \param i_rayDirection The normalised direction of the ray.
+    /// \param i_primitiveBounds The bounds of each primitive, which the hierarchy was built from.
+    ///
+    /// \retval true The ray intersects the bounds of a primitive.
+    /// \retval false The ray does not intersect the bounds of any primitive.
+    inline bool
+    AnyHit( const Vec3f& i_rayOrigin, const Vec3f& i_rayDirection, const Vec3fRangeArray& i_primitiveBounds ) const
+    {
+        Ray ray( i_rayOrigin, i_rayDirection );
+        return AnyHit(
+            i_rayOrigin,
+            i_rayDirection,
+            [&]( size_t i_primitiveIndex, FloatRange& o_primitiveIntersections ) {
+                return RayAABBIntersection( ray, i_primitiveBounds[ i_primitiveIndex ], o_primitiveIntersections );
+            } );
+    }
+
+private:
+    // A node of the hierarchy, stored depth first: the first child of an interior node immediately
+    // follows it, and the second child is at m_offset.  Leaf nodes reference m_count primitive indices,
+    // starting at m_offset.
+    struct Node
+    {
+        Vec3fRange m_bounds;
+        uint32_t   m_offset = 0;
+        uint32_t   m_count  = 0;
+    };
+
+    // A split candidate bin, accumulating the primitives whose centroid falls within it.
+    struct Bin
+    {
+        Vec3fRange m_bounds = _EmptyBounds();
+        size_t     m_count  = 0;
+    };
+
+    // Bounds which are expanded to exactly the first value or range they are expanded by.
+    static inline Vec3fRange _EmptyBounds()
+    {
+        return Vec3fRange( Vec3f( std::numeric_limits< float >::max(),
+                                  std::numeric_limits< float >::max(),
+                                  std::numeric_limits< float >::max() ),
+                           Vec3f( std::numeric_limits< float >::lowest(),
+                                  std::numeric_limits< float >::lowest(),
+                                  std::numeric_limits< float >::lowest() ) );
+    }
+
+    // Half of the surface area of the bounds, proportional to the probability of a ray intersecting them.
+    static inline float _HalfSurfaceArea( const Vec3fRange& i_bounds )
+    {
+        Vec3f extent = i_bounds.Max() - i_bounds.Min();
+        return extent[ 0 ] * extent[ 1 ] + extent[ 1 ] * extent[ 2 ] + extent[ 2 ] * extent[ 0 ];
+    }
+
+    // Recursively build the node over the primitive indices within [i_begin, i_end), returning its index.
+    inline uint32_t _BuildNode( const Vec3fRange*           i_primitiveBounds,
+                                const std::vector< Vec3f >& i_centroids,
+                                size_t                      i_begin,
+                                size_t                      i_end,
+                                size_t                      i_depth,
+                                size_t                      i_maxLeafSize,
+                                size_t                      i_binCount )
+    {
+        uint32_t nodeIndex = static_cast< uint32_t >( m_nodes.size() );
+        m_nodes.emplace_back();
+
+        Vec3fRange bounds         = _EmptyBounds();
+        Vec3fRange centroidBounds = _EmptyBounds();
+        for ( size_t index = i_begin; index < i_end; ++index )
+        {
+            uint32_t primitiveIndex = m_primitiveIndices[ index ];
+            bounds                  = Expand( bounds, i_primitiveBounds[ primitiveIndex ] );
+            centroidBounds          = Expand( centroidBounds, i_centroids[ primitiveIndex ] );
+        }
+        m_nodes[ nodeIndex ].m_bounds = bounds;
+
+        size_t count = i_end - i_begin;
+        size_t split = i_end;
+        if ( count > i_maxLeafSize && i_depth + 1 < c_maxDepth )
+        {
+            split = _FindSplit( i_primitiveBounds, i_centroids, i_begin, i_end, centroidBounds, i_binCount );
+        }
+
+        if ( split == i_end )
+        {
+            m_nodes[ nodeIndex ].m_offset = static_cast< uint32_t >( i_begin );
+            m_nodes[ nodeIndex ].m_count  = static_cast< uint32_t >( count );
+            return nodeIndex;
+        }
+
+        _BuildNode( i_primitiveBounds, i_centroids, i_begin, split, i_depth + 1, i_maxLeafSize, i_binCount );
+        uint32_t secondChildIndex =
+            _BuildNode( i_primitiveBounds, i_centroids, split, i_end, i_depth + 1, i_maxLeafSize, i_binCount );
+        m_nodes[ nodeIndex ].m_offset = secondChildIndex;
+        return nodeIndex;
+    }
+
+    // Find the binned split with the lowest surface area heuristic cost, and partition the primitive indices
+    // within [i_begin, i_end) by it.  Returns the partition point.
+    inline size_t _FindSplit( const Vec3fRange*           i_primitiveBounds,
+                              const std::vector< Vec3f >& i_centroids,
+                              size_t                      i_begin,
+                              size_t                      i_end,
+                              const Vec3fRange&           i_centroidBounds,
+                              size_t                      i_binCount )
+    {
+        std::vector< Bin >   bins( i_binCount );
+        std::vector< float > secondAreas( i_binCount );
+
+        float  bestCost  = std::numeric_limits< float >::max();
+        int    bestAxis  = -1;
+        size_t bestSplit = 0;
+        for ( int axis = 0; axis < 3; ++axis )
+        {
+            float axisMin    = i_centroidBounds.Min()[ axis ];
+            float axisExtent = i_centroidBounds.Max()[ axis ] - axisMin;
+            if ( axisExtent <= 0.0f )
+            {
+                // All the centroids coincide along this axis.
+                continue;
+            }
+
+            // Distribute the primitives into bins, by centroid.
+            std::fill( bins.begin(), bins.end(), Bin() );
+            float binScale = static_cast< float >( i_binCount ) / axisExtent;
+            for ( size_t index = i_begin; index < i_end; ++index )
+            {
+                uint32_t primitiveIndex = m_primitiveIndices[ index ];
+                Bin& bin = bins[ _BinIndex( i_centroids[ primitiveIndex ][ axis ], axisMin, binScale, i_binCount ) ];
+                bin.m_bounds = Expand( bin.m_bounds, i_primitiveBounds[ primitiveIndex ] );
+                ++bin.m_count;
+            }
+
+            // Sweep from the last bin, to compute the area of the second partition of each split candidate.
+            Vec3fRange secondBounds = _EmptyBounds();
+            for ( size_t binIndex = i_binCount - 1; binIndex > 0; --binIndex )
+            {
+                if ( bins[ binIndex ].m_count > 0 )
+                {
+                    secondBounds = Expand( secondBounds, bins[ binIndex ].m_bounds );
+                }
+                secondAreas[ binIndex ] = _HalfSurfaceArea( secondBounds );
+            }
+
+            // Sweep from the first bin, evaluating the cost of splitting before each bin.
+            Vec3fRange firstBounds = _EmptyBounds();
+            size_t     firstCount  = 0;
+            for ( size_t binIndex = 1; binIndex < i_binCount; ++binIndex )
+            {
+                if ( bins[ binIndex - 1 ].m_count > 0 )
+                {
+                    firstBounds = Expand( firstBounds, bins[ binIndex - 1 ].m_bounds );
+                    firstCount += bins[ binIndex - 1 ].m_count;
+                }
+
+                size_t secondCount = ( i_end - i_begin ) - firstCount;
+                if ( firstCount == 0 || secondCount == 0 )
+                {
+                    continue;
+                }
+
+                float cost = _HalfSurfaceArea( firstBounds ) * static_cast< float >( firstCount ) +
+                             secondAreas[ binIndex ] * static_cast< float >( secondCount );
+                if ( cost < bestCost )
+                {
+                    bestCost  = cost;
+                    bestAxis  = axis;
+                    bestSplit = binIndex;
+                }
+            }
+        }
+
+        if ( bestAxis < 0 )
+        {
+            // All the centroids coincide, split the primitives evenly to keep the leaves small.
+            return i_begin + ( i_end - i_begin ) / 2;
+        }
+
+        float     axisMin  = i_centroidBounds.Min()[ bestAxis ];
+        float     binScale = static_cast< float >( i_binCount ) / ( i_centroidBounds.Max()[ bestAxis ] - axisMin );
+        uint32_t* middle   = std::partition(
+            m_primitiveIndices.data() + i_begin,
+            m_primitiveIndices.data() + i_end,
+            [&]( uint32_t i_primitiveIndex ) {
+                return _BinIndex( i_centroids[ i_primitiveIndex ][ bestAxis ], axisMin, binScale, i_binCount ) <
+                       bestSplit;
+            } );
+        return static_cast< size_t >( middle - m_primitiveIndices.data() );
+    }
+
+    // The index of the bin containing the centroid coordinate \p i_value.
+    static inline size_t _BinIndex( float i_value, float i_axisMin, float i_binScale, size_t i_binCount )
+    {
+        size_t binIndex = static_cast< size_t >( ( i_value - i_axisMin ) * i_binScale );
+        return std::min( binIndex, i_binCount - 1 );
+    }
+
+    // Visit the primitives of the leaf nodes intersected by the ray, until i_visitor returns true.
+    // Nodes entered beyond i_maxMagnitude are skipped.  i_maxMagnitude is referenced, such that the visitor
+    // can narrow it.  The ray caches its reciprocal direction, which is shared by all the node intersection tests.
+    template < typename VisitorT >
+    inline bool
+    _Traverse( const Ray& i_ray, const float& i_maxMagnitude, bool i_nearestFirst, const VisitorT& i_visitor ) const
+    {
+        if ( m_nodes.empty() )
+        {
+            return false;
+        }
+
+        struct StackEntry
+        {
+            uint32_t m_nodeIndex;
+            float    m_entryMagnitude;
+        };
+
+        FloatRange intersections;
+        if ( !RayAABBIntersection( i_ray, m_nodes[ 0 ].m_bounds, intersections ) )
+        {
+            return false;
+        }
+
+        StackEntry stack[ c_maxDepth + 1 ];
+        size_t     stackSize = 0;
+        stack[ stackSize++ ] = StackEntry{0, intersections.Min()};
+        while ( stackSize > 0 )
+        {
+            StackEntry entry = stack[ --stackSize ];
+            if ( entry.m_entryMagnitude > i_maxMagnitude )
+            {
+                continue;
+            }
+
+            const Node& node = m_nodes[ entry.m_nodeIndex ];
+            if ( node.m_count > 0 )
+            {
+                for ( uint32_t index = node.m_offset; index < node.m_offset + node.m_count; ++index )
+                {
+                    if ( i_visitor( m_primitiveIndices[ index ] ) )
+                    {
+                        return true;
+                    }
+                }
+
+                continue;
+            }
+
+            uint32_t   firstIndex  = entry.m_nodeIndex + 1;
+            uint32_t   secondIndex = node.m_offset;
+            FloatRange firstIntersections;
+            FloatRange secondIntersections;
+            bool       firstHit = RayAABBIntersection( i_ray, m_nodes[ firstIndex ].m_bounds, firstIntersections ) &&
+                            firstIntersections.Min() <= i_maxMagnitude;
+            bool secondHit = RayAABBIntersection( i_ray, m_nodes[ secondIndex ].m_bounds, secondIntersections ) &&
+                             secondIntersections.Min() <= i_maxMagnitude;
+
+            // Push the farther child first, such that the nearer child is visited first.
+            if ( firstHit && secondHit && i_nearestFirst && firstIntersections.Min() < secondIntersections.Min() )
+            {
+                stack[ stackSize++ ] = StackEntry{secondIndex, secondIntersections.Min()};
+                stack[ stackSize++ ] = StackEntry{firstIndex, firstIntersections.Min()};
+            }
+            else
+            {
+                if ( firstHit )
+                {
+                    stack[ stackSize++ ] = StackEntry{firstIndex, firstIntersections.Min()};
+                }
+                if ( secondHit )
+                {
+                    stack[ stackSize++ ] = StackEntry{secondIndex, secondIntersections.Min()};
+                }
+            }
+        }
+
+        return false;
+    }
+
+    std::vector< Node >     m_nodes;
+    std::vector< uint32_t > m_primitiveIndices;
+};
+
+GM_NS_CLOSE
@@ -0,0 +1,181 @@
+#include <catch2/catch.hpp>
+
+#include <gm/bvh/bvh.h>
+
+#include <gm/functions/normalize.h>
+#include <gm/functions/randomNumber.h>
+
+#include <vector>
+
+// A grid of unit boxes, spaced 2 units apart on the XY plane, spanning z = [0, 1].
+static gm::Vec3fRangeArray GridBounds( int i_size )
+{
+    gm::Vec3fRangeArray bounds;
+    for ( int y = 0; y < i_size; ++y )
+    {
+        for ( int x = 0; x < i_size; ++x )
+        {
+            bounds.push_back( gm::Vec3fRange( gm::Vec3f( 2.0f * x, 2.0f * y, 0.0f ),
+                                              gm::Vec3f( 2.0f * x + 1.0f, 2.0f * y + 1.0f, 1.0f ) ) );
+        }
+    }
+    return bounds;
+}
+
+// Brute force closest hit, against all the bounds.
+static int BruteForceClosestHit( const gm::Vec3fRangeArray& i_bounds,
+                                 const gm::Vec3f&           i_rayOrigin,
+                                 const gm::Vec3f&           i_rayDirection,
+                                 gm::FloatRange&            o_intersections )
+{
+    int primitiveIndex = -1;
+    for ( size_t index = 0; index < i_bounds.size(); ++index )
+    {
+        gm::FloatRange intersections;
+        if ( gm::RayAABBIntersection( i_rayOrigin, i_rayDirection, i_bounds[ index ], intersections ) &&
+             ( primitiveIndex < 0 || intersections.Min() < o_intersections.Min() ) )
+        {
+            primitiveIndex  = static_cast< int >( index );
+            o_intersections = intersections;
+        }
+    }
+    return primitiveIndex;
+}
+
+TEST_CASE( "BVH_Empty" )
+{
+    gm::Vec3fRangeArray bounds;
+    gm::BVH             bvh( bounds );
+    CHECK( bvh.IsEmpty() );
+
+    int            primitiveIndex = -1;
+    gm::FloatRange intersections;
+    CHECK( !bvh.ClosestHit( gm::Vec3f( 0, 0, -1 ), gm::Vec3f( 0, 0, 1 ), bounds, primitiveIndex, intersections ) );
+    CHECK( !bvh.AnyHit( gm::Vec3f( 0, 0, -1 ), gm::Vec3f( 0, 0, 1 ), bounds ) );
+}
+
+TEST_CASE( "BVH_Build" )
+{
+    gm::Vec3fRangeArray bounds = GridBounds( 16 );
+    gm::BVH             bvh( bounds );
+    CHECK( bvh.GetPrimitiveCount() == 256 );
+    CHECK( bvh.GetNodeCount() > 1 );
+    CHECK( bvh.GetNodeCount() < 2 * bounds.size() );
+    CHECK( bvh.GetBounds() == gm::Vec3fRange( gm::Vec3f( 0, 0, 0 ), gm::Vec3f( 31, 31, 1 ) ) );
+}
+
+TEST_CASE( "BVH_BuildCoincidentCentroids" )
+{
+    gm::Vec3fRangeArray bounds( 100, gm::Vec3fRange( gm::Vec3f( 0, 0, 0 ), gm::Vec3f( 1, 1, 1 ) ) );
+    gm::BVH             bvh( bounds, /* i_maxLeafSize */ 4 );
+    CHECK( bvh.GetPrimitiveCount() == 100 );
+    CHECK( bvh.GetNodeCount() > 1 );
+
+    int            primitiveIndex = -1;
+    gm::FloatRange intersections;
+    CHECK( bvh.ClosestHit( gm::Vec3f( 0.5f, 0.5f, -1 ), gm::Vec3f( 0, 0, 1 ), bounds, primitiveIndex, intersections ) );
+    CHECK( intersections.Min() == 1.0f );
+}
+
+TEST_CASE( "BVH_ClosestHit" )
+{
+    gm::Vec3fRangeArray bounds = GridBounds( 16 );
+    gm::BVH             bvh( bounds );
+
+    // Straight down, onto the box at grid coordinates (3, 5).
+    {
+        int            primitiveIndex = -1;
+        gm::FloatRange intersections;
+        CHECK( bvh.ClosestHit( gm::Vec3f( 6.5f, 10.5f, 5.0f ),
+                               gm::Vec3f( 0, 0, -1 ),
+                               bounds,
+                               primitiveIndex,
+                               intersections ) );
+        CHECK( primitiveIndex == 5 * 16 + 3 );
+        CHECK( intersections.Min() == Approx( 4.0f ) );
+        CHECK( intersections.Max() == Approx( 5.0f ) );
+    }
+
+    // Through a gap between boxes.
+    {
+        int            primitiveIndex = -1;
+        gm::FloatRange intersections;
+        CHECK( !bvh.ClosestHit( gm::Vec3f( 1.5f, 1.5f, 5.0f ),
+                                gm::Vec3f( 0, 0, -1 ),
+                                bounds,
+                                primitiveIndex,
+                                intersections ) );
+        CHECK( primitiveIndex == -1 );
+    }
+
+    // Along a row of boxes, from outside the grid: the first box of the row is the closest.
+    {
+        int            primitiveIndex = -1;
+        gm::FloatRange intersections;
+        CHECK( bvh.ClosestHit( gm::Vec3f( -5.0f, 4.5f, 0.5f ),
+                               gm::Vec3f( 1, 0, 0 ),
+                               bounds,
+                               primitiveIndex,
+                               intersections ) );
+        CHECK( primitiveIndex == 2 * 16 );
+        CHECK( intersections.Min() == Approx( 5.0f ) );
+    }
+}
+
+TEST_CASE( "BVH_ClosestHitMatchesBruteForce" )
+{
+    gm::Vec3fRangeArray bounds = GridBounds( 12 );
+    gm::BVH             bvh( bounds );
+
+    for ( int rayIndex = 0; rayIndex < 256; ++rayIndex )
+    {
+        gm::Vec3f rayOrigin( gm::RandomNumber( gm::FloatRange( -4.0f, 28.0f ) ),
+                             gm::RandomNumber( gm::FloatRange( -4.0f, 28.0f ) ),
+                             gm::RandomNumber( gm::FloatRange( 2.0f, 6.0f ) ) );
+        gm::Vec3f rayDirection = gm::Normalize( gm::Vec3f( gm::RandomNumber( gm::FloatRange( -1.0f, 1.0f ) ),
+                                                           gm::RandomNumber( gm::FloatRange( -1.0f, 1.0f ) ),
+                                                           gm::RandomNumber( gm::FloatRange( -1.0f, -0.1f ) ) ) );
+
+        gm::FloatRange expectedIntersections;
+        int            expectedIndex = BruteForceClosestHit( bounds, rayOrigin, rayDirection, expectedIntersections );
+
+        int            primitiveIndex = -1;
+        gm::FloatRange intersections;
+        bool           hit = bvh.ClosestHit( rayOrigin, rayDirection, bounds, primitiveIndex, intersections );
+        CHECK( hit == ( expectedIndex >= 0 ) );
+        CHECK( bvh.AnyHit( rayOrigin, rayDirection, bounds ) == hit );
+        if ( hit )
+        {
+            CHECK( intersections.Min() == Approx( expectedIntersections.Min() ) );
+        }
+    }
+}
+
+TEST_CASE( "BVH_ClosestHitIntersector" )
+{
+    gm::Vec3fRangeArray bounds = GridBounds( 4 );
+    gm::BVH             bvh( bounds );
+
+    // Only the primitives of even index are intersectable.
+    int            visits         = 0;
+    int            primitiveIndex = -1;
+    gm::FloatRange intersections;
+    CHECK( bvh.ClosestHit(
+        gm::Vec3f( -5.0f, 0.5f, 0.5f ),
+        gm::Vec3f( 1, 0, 0 ),
+        [&]( size_t i_primitiveIndex, gm::FloatRange& o_intersections ) {
+            ++visits;
+            return i_primitiveIndex % 2 == 0 && gm::RayAABBIntersection( gm::Vec3f( -5.0f, 0.5f, 0.5f ),
+                                                                         gm::Vec3f( 1, 0, 0 ),
+                                                                         bounds[ i_primitiveIndex ],
+                                                                         o_intersections );
+        },
+        primitiveIndex,
+        intersections ) );
+    CHECK( primitiveIndex == 0 );
+    CHECK( visits > 0 );
+
+    CHECK( !bvh.AnyHit( gm::Vec3f( -5.0f, 0.5f, 0.5f ), gm::Vec3f( 1, 0, 0 ), []( size_t, gm::FloatRange& ) {
+        return false;
+    } ) );
+}
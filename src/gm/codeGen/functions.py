@@ -6,6 +6,34 @@ from utils import UpperCamelCase
 from collections import OrderedDict
 
 
+def UfuncCoreShape(valueType):
+    """
+    Get the core shape of a single value of ``valueType``, as the operand of a NumPy ufunc.
+
+    Returns:
+        tuple: empty for scalars, the vector shape for vectors, and the element shape prefixed by 2 (min, max)
+            for ranges.
+    """
+    if valueType.isScalar:
+        return ()
+    elif valueType.isRange:
+        return (2,) + UfuncCoreShape(valueType.elementType)
+    else:
+        return valueType.shape
+
+
+def UfuncScalarType(valueType):
+    """
+    Get the scalar type of a NumPy ufunc operand of ``valueType``.
+
+    Returns:
+        ScalarType: the innermost scalar type of ``valueType``.
+    """
+    while not valueType.isScalar:
+        valueType = valueType.elementType
+    return valueType
+
+
 class FunctionCategory:
     """
     Categories of functions.
@@ -106,6 +134,175 @@ class FunctionInterface:
         """
         return ", ".join([arg.name for arg in self._arguments.values()])
 
+    @property
+    def batchTypedArgs(self):
+        """
+        Returns:
+            str: comma separated, batched typed and named arguments.  Used as the signature of batched python bindings.
+        """
+
+        def batchTypedArg(arg):
+            if arg.mutability == Mutability.Const:
+                batchClassName = "BatchArg"
+            else:
+                batchClassName = "MutableBatchArg"
+
+            return "const {batchClassName}< {className} >& {name}".format(
+                batchClassName=batchClassName, className=arg.type.className, name=arg.name,
+            )
+
+        return ", ".join([batchTypedArg(arg) for arg in self._arguments.values()])
+
+    @property
+    def batchIndexedArgs(self):
+        """
+        Returns:
+            str: comma separated, named arguments indexed by ``index``.  Used for calling the function
+                on a single element of batched arguments.
+        """
+        return ", ".join(["{name}[ index ]".format(name=arg.name) for arg in self._arguments.values()])
+
+    @property
+    def spanTypedArgs(self):
+        """
+        Returns:
+            str: comma separated, batched typed and named arguments.  Used as the signature of the batched C++
+                overloads, where the inputs are ``BatchInput`` views, followed by the element count, the mutable
+                arguments as output arrays, and the return values as the ``o_result`` output array.
+        """
+        inputArgs = [
+            "const BatchInput< {className} >& {name}".format(className=arg.type.className, name=arg.name)
+            for arg in self.inputArguments
+        ]
+        outputArgs = [
+            "{className}* GM_RESTRICT {name}".format(className=arg.type.className, name=arg.name)
+            for arg in self.outputArguments
+        ]
+        if self._returnType:
+            outputArgs.append("{className}* GM_RESTRICT o_result".format(className=self._returnType.className))
+
+        return ", ".join(inputArgs + ["size_t i_count"] + outputArgs)
+
+    @property
+    def singleArguments(self):
+        """
+        Returns:
+            list: the arguments of the single value python binding of this interface.  Mutable scalar arguments are
+                excluded, as python cannot observe their modification: they are returned instead, see
+                ``singleOutputArguments``.
+        """
+        return [arg for arg in self._arguments.values() if arg not in self.singleOutputArguments]
+
+    @property
+    def singleOutputArguments(self):
+        """
+        Returns:
+            list: the mutable scalar arguments of this interface, returned by its single value python binding
+                as a tuple, following the return value if any.
+        """
+        return [
+            arg for arg in self._arguments.values() if arg.type.isScalar and arg.mutability == Mutability.Mutable
+        ]
+
+    @property
+    def singleTypedArgs(self):
+        """
+        Returns:
+            str: comma separated, cv-qualified typed and named arguments.  Used as the signature of the single
+                value python binding.
+        """
+        return ", ".join(
+            [
+                "{constQualifier} {className}& {name}".format(
+                    constQualifier=arg.constQualifier, className=arg.type.className, name=arg.name,
+                )
+                for arg in self.singleArguments
+            ]
+        )
+
+    @property
+    def isPacket(self):
+        """
+        Returns:
+            bool: True if any of the arguments is a structure-of-arrays packet.  Packet interfaces are not
+                bound in python, where batched overloads are provided instead.
+        """
+        return any(arg.type.isPacket for arg in self._arguments.values())
+
+    @property
+    def isBound(self):
+        """
+        Returns:
+            bool: True if this interface is bound in python.  Packet and aligned types are C++ storage constructs,
+                whose interfaces are not bound.
+        """
+        types = [arg.type for arg in self._arguments.values()]
+        if self._returnType:
+            types.append(self._returnType)
+        return not any(valueType.isPacket or valueType.isAligned for valueType in types)
+
+    @property
+    def isBatchable(self):
+        """
+        Returns:
+            bool: True if all the arguments and the return type can be batched into packed arrays, such that
+                a batched python overload can be bound.
+        """
+        types = [arg.type for arg in self._arguments.values()]
+        if self._returnType:
+            types.append(self._returnType)
+        return self.isBound and not any(valueType.isComposite for valueType in types)
+
+    @property
+    def isLean(self):
+        """
+        Returns:
+            bool: True if this interface is bound in the lean CPython API module, whose types are the scalars, vectors,
+                matrices and quaternions.  Mutable scalar arguments are excluded, as python cannot observe their
+                modification.
+        """
+        for arg in self._arguments.values():
+            if arg.type.isScalar and arg.mutability == Mutability.Mutable:
+                return False
+
+        types = [arg.type for arg in self._arguments.values()]
+        if self._returnType:
+            types.append(self._returnType)
+        return self.isBound and all(valueType.isScalar or valueType.isVector for valueType in types)
+
+    @property
+    def ufuncOperandTypes(self):
+        """
+        Returns:
+            list: the types of the operands of the NumPy ufunc evaluating this interface, in kernel order: the
+                const arguments, followed by the mutable arguments, and the return type.
+        """
+        types = [arg.type for arg in self.inputArguments + self.outputArguments]
+        if self._returnType:
+            types.append(self._returnType)
+        return types
+
+    @property
+    def ufuncSignature(self):
+        """
+        Returns:
+            str: the core signature of the generalized NumPy ufunc evaluating this interface, with fixed core
+                dimensions such as ``(3),(3)->()``, or None if all the operands are scalars, in which case the
+                interface is evaluated by an element-wise ufunc.
+        """
+        types = self.ufuncOperandTypes
+        if all(valueType.isScalar for valueType in types):
+            return None
+
+        def coreDimensions(valueType):
+            return "({})".format(",".join(str(size) for size in UfuncCoreShape(valueType)))
+
+        inputCount = len(self.inputArguments)
+        return "{inputs}->{outputs}".format(
+            inputs=",".join(coreDimensions(valueType) for valueType in types[:inputCount]),
+            outputs=",".join(coreDimensions(valueType) for valueType in types[inputCount:]),
+        )
+
     @property
     def testSuffix(self):
         """
@@ -122,12 +319,35 @@ class FunctionInterface:
         """
         return self._arguments.values()
 
+    @property
+    def inputArguments(self):
+        """
+        Returns:
+            list: the const arguments defined by this interface.
+        """
+        return [arg for arg in self._arguments.values() if arg.mutability == Mutability.Const]
+
+    @property
+    def outputArguments(self):
+        """
+        Returns:
+            list: the mutable arguments defined by this interface.
+        """
+        return [arg for arg in self._arguments.values() if arg.mutability == Mutability.Mutable]
+
     def Arg(self, key):
         """
         Retrieve a ``FunctionArg` from this interface, by key.
         """
         return self._arguments[key]
 
+    def HasArg(self, key):
+        """
+        Check if this interface has an argument called ``key``.  Useful for templates of functions whose
+        interfaces have different argument sets.
+        """
+        return key in self._arguments
+
     def ArgType(self, key):
         """
         Convenience function to get the type of argument assigned by ``key``.
@@ -167,12 +387,14 @@ class Function:
         interfaces (list): list of interfaces which describe the different variations of
             arguments and return types.
         category (str): named category that this function belongs to.
+        parallel (bool): whether batched calls of this function can be distributed across threads.
     """
 
-    def __init__(self, name, interfaces, category):
+    def __init__(self, name, interfaces, category, parallel=True):
         self._name = name
         self.interfaces = interfaces
         self.category = category
+        self.parallel = parallel
 
     @property
     def headerFileName(self):
@@ -181,6 +403,49 @@ class Function:
         """
         return "{name}.h".format(name=self._name,)
 
+    @property
+    def spanInterfaces(self):
+        """
+        Returns:
+            list: the interfaces of this function which have batched C++ overloads.  Structure-of-arrays
+                packet interfaces are already batched, and are excluded.
+        """
+        return [interface for interface in self.interfaces if not interface.isPacket]
+
+    @property
+    def kernelInterfaces(self):
+        """
+        Returns:
+            list: the batchable interfaces of this function, whose batched python overloads are evaluated by
+                kernels compiled once per instruction set.  Only functions which can be parallelized, and are
+                thus free of shared state, are dispatched to kernels.
+        """
+        if not self.parallel:
+            return []
+
+        return [interface for interface in self.interfaces if interface.isBatchable]
+
+    @property
+    def leanInterfaces(self):
+        """
+        Returns:
+            list: the interfaces of this function which are bound in the lean CPython API module.
+        """
+        return [interface for interface in self.interfaces if interface.isLean]
+
+    def KernelName(self, interface):
+        """
+        Get the name of the kernel evaluating the batched ``interface`` of this function.
+        """
+        return self.TypedName(interface)
+
+    def TypedName(self, interface):
+        """
+        Get the explicitly typed name of ``interface``, suffixed by its argument types, under which it is bound in
+        python without the other overloads of this function.
+        """
+        return "{name}_{suffix}".format(name=self.name, suffix=interface.testSuffix)
+
     @property
     def name(self):
         """
@@ -208,8 +473,8 @@ class FunctionGroup:
     Group of functions which share a common code-generation context.
     """
 
-    def __init__(self, functionNames, interfaces, category):
+    def __init__(self, functionNames, interfaces, category, parallel=True):
         self.functions = []
         for name in functionNames:
-            function = Function(name, interfaces, category)
+            function = Function(name, interfaces, category, parallel=parallel)
             self.functions.append(function)
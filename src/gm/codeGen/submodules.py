@@ -0,0 +1,117 @@
+"""
+Description of the submodules of the python module, which are bound on first attribute access, used during code-gen.
+"""
+
+from collections import OrderedDict
+
+
+"""
+Docstrings of the submodules, by category of types and functions.
+"""
+SUBMODULE_DOCS = {
+    "vector": "Vector and matrix types.",
+    "quaternion": "Quaternion types.",
+    "range": "Range (min, max) types.",
+    "composite": "Composite types.",
+    "array": "Array types, of contiguous elements.",
+    "basic": "Basic functions.",
+    "linearAlgebra": "Linear algebra functions.",
+    "rayTracing": "Ray tracing functions.",
+}
+
+
+class Submodule:
+    """
+    A submodule of the python module, whose bindings are deferred until one of its attributes is first accessed.
+
+    Args:
+        name (str): name of the submodule, under the python module.
+        doc (str): docstring of the submodule.
+        binders (list): names of the C++ functions binding the submodule, called in order.
+        attributes (list): names of the attributes of the submodule, which are also exposed by the python module.
+        dependencies (list): names of the submodules whose types are referenced by the bindings, and which are
+            bound first.
+    """
+
+    def __init__(self, name, doc, binders=None, attributes=None, dependencies=None):
+        self.name = name
+        self.doc = doc
+        self.binders = binders or []
+        self.attributes = attributes or []
+        self.dependencies = dependencies or []
+
+
+def ReferencedTypes(valueType):
+    """
+    Get the value types referenced by the python bindings of ``valueType``.
+
+    Returns:
+        list: the element types of containers, or the element types of composites.
+    """
+    if valueType.isComposite:
+        return [element.type for element in valueType.elements + valueType.derivedElements]
+    elif valueType.isScalar:
+        return []
+    else:
+        return [valueType.elementType]
+
+
+def _AddDependencies(submodule, valueTypes):
+    """
+    Add the categories of the non-scalar ``valueTypes`` to the dependencies of ``submodule``.
+    """
+    for valueType in valueTypes:
+        if not valueType.isScalar and valueType.CATEGORY != submodule.name:
+            if valueType.CATEGORY not in submodule.dependencies:
+                submodule.dependencies.append(valueType.CATEGORY)
+
+
+def TypeSubmodules(valueTypes):
+    """
+    Group the bound ``valueTypes`` into submodules, by type category.  The views of array types are bound along
+    with them.
+
+    Returns:
+        list: Submodule(s), in order of first appearance of their category.
+    """
+    submodules = OrderedDict()
+    for valueType in valueTypes:
+        submodule = submodules.setdefault(
+            valueType.CATEGORY, Submodule(valueType.CATEGORY, SUBMODULE_DOCS[valueType.CATEGORY])
+        )
+        submodule.binders.append("Bind{className}".format(className=valueType.className))
+        submodule.attributes.append(valueType.className)
+        if valueType.isArray:
+            submodule.binders.append("Bind{className}View".format(className=valueType.className))
+            submodule.attributes.append("{className}View".format(className=valueType.className))
+        _AddDependencies(submodule, ReferencedTypes(valueType))
+
+    return submodules.values()
+
+
+def FunctionSubmodules(functions):
+    """
+    Group ``functions`` into submodules, by function category.  Each submodule depends on the submodules of the
+    types referenced by the bound interfaces of its functions.
+
+    Returns:
+        list: Submodule(s), in order of first appearance of their category.
+    """
+    submodules = OrderedDict()
+    for function in functions:
+        submodule = submodules.setdefault(
+            function.category, Submodule(function.category, SUBMODULE_DOCS[function.category])
+        )
+        submodule.binders.append("Bind{name}".format(name=function.name))
+        submodule.attributes.append(function.name)
+        for interface in function.interfaces:
+            if not interface.isBound:
+                continue
+
+            submodule.attributes.append(function.TypedName(interface))
+            types = [arg.type for arg in interface.arguments]
+            if interface.returnType:
+                types.append(interface.returnType)
+            _AddDependencies(submodule, types)
+
+    return submodules.values()
@@ -50,6 +50,24 @@ class NamedElement:
         return UpperCamelCase(self.name)
 
 
+class DerivedElement(NamedElement):
+    """
+    DerivedElement is a named child of a CompositeType, whose value is computed from the other elements upon
+    construction, rather than specified.  It is used to cache values which are expensive to re-compute.
+
+    Args:
+        name (str): is used to uniquely address this element from the parent type.
+        type (object): the data type.
+        initializer (str): C++ constructor arguments initializing the value of this element.  The arguments may
+            reference the constructor arguments of the composite elements (i_<name>), and the member variables of
+            previously declared derived elements (m_<name>).
+    """
+
+    def __init__(self, name, type, initializer):
+        NamedElement.__init__(self, name, type)
+        self.initializer = initializer
+
+
 class ValueType:
     """
     Abstract base class for all value types in the GraphicsMath library.
@@ -144,6 +162,36 @@ class ValueType:
         """
         return False
 
+    @property
+    def isArray(self):
+        """
+        Implementation should return ``True`` if it is an ArrayType.  By default, ``False`` will be returned.
+
+        Returns:
+            bool: False
+        """
+        return False
+
+    @property
+    def isPacket(self):
+        """
+        Implementation should return ``True`` if it is a PacketType.  By default, ``False`` will be returned.
+
+        Returns:
+            bool: False
+        """
+        return False
+
+    @property
+    def isAligned(self):
+        """
+        Implementation should return ``True`` if it is an AlignedVectorType.  By default, ``False`` will be returned.
+
+        Returns:
+            bool: False
+        """
+        return False
+
 
 class ScalarType(ValueType):
     """
@@ -409,6 +457,99 @@ class VectorType(ElementContainerType):
         return [NamedElement(elementNames[elementIndex], self.elementType) for elementIndex in range(self.elementSize)]
 
 
+class QuaternionType(VectorType):
+    """
+    Code generation representation of a quaternion, storing a rotation in 4 elements.
+
+    The elements are ordered (x, y, z, w), where x, y and z are the imaginary components and w is the real
+    component, such that the element-wise vector operations (addition, scaling, dot product, normalization)
+    apply to quaternions as-is.
+
+    Args:
+        elementType (ValueType): The value type of the elements within this quaternion.
+
+    Class members:
+        CATEGORY (str): The named category of all quaternion value types.
+    """
+
+    CATEGORY = "quaternion"
+
+    def __init__(self, elementType):
+        VectorType.__init__(self, (4,), elementType)
+
+    def __hash__(self):
+        """
+        QuaternionType(s) are unique by its element type, and distinct from a vector of the same shape.
+        """
+        return hash((self.shape, self.elementType, self.CATEGORY))
+
+    @property
+    def className(self):
+        return "Quat{elementType}".format(elementType=self.elementType.className[0])
+
+    @property
+    def headerFileName(self):
+        return "quat{elementType}.h".format(elementType=self.elementType.className[0])
+
+    @property
+    def varName(self):
+        return "quaternion"
+
+
+class AlignedVectorType(VectorType):
+    """
+    Code generation representation of a vector or matrix type stored at an over-aligned address.
+
+    The alignment pads the storage of the vector to a multiple of the alignment, such that packed arrays of an
+    aligned type never straddle an alignment boundary, and can be loaded with aligned SIMD instructions.  For
+    example, a Vec3fA occupies 16 bytes rather than the 12 bytes of a Vec3f.
+
+    Args:
+        vectorType (VectorType): The unaligned vector type, which this type is a padded variant of.
+        alignment (int): The alignment of this type, in bytes.
+
+    Class members:
+        CATEGORY (str): The named category of all aligned vector value types.
+    """
+
+    CATEGORY = "alignedVector"
+
+    def __init__(self, vectorType, alignment):
+        assert isinstance(vectorType, VectorType)
+        VectorType.__init__(self, vectorType.shape, vectorType.elementType)
+        self.unalignedType = vectorType
+        self.alignment = alignment
+
+    def __hash__(self):
+        """
+        AlignedVectorType(s) are unique by its shape, element type and alignment, and distinct from the unaligned
+        vector of the same shape.
+        """
+        return hash((self.shape, self.elementType, self.alignment, self.CATEGORY))
+
+    @property
+    def className(self):
+        """
+        The class name of the unaligned type, joined with an "A" suffix.
+        """
+        return "{className}A".format(className=self.unalignedType.className)
+
+    @property
+    def headerFileName(self):
+        """
+        The header file name of the unaligned type, joined with an "A" suffix.
+        """
+        return "{fileName}A.h".format(fileName=os.path.splitext(self.unalignedType.headerFileName)[0])
+
+    @property
+    def isAligned(self):
+        """
+        Returns:
+            bool: True, this class is indeed an aligned vector type.
+        """
+        return True
+
+
 class RangeType(ElementContainerType):
     """
     Code generation object for representing a range of values, of a particular type, with lower and upper limits (min and max).
@@ -471,16 +612,217 @@ class RangeType(ElementContainerType):
         return True
 
 
+class ArrayType(ElementContainerType):
+    """
+    Code generation object for a packed, contiguous and dynamically sized array of scalar, vector or range elements.
+
+    Elements are stored by value, back to back, such that an array of N Vec3f(s) occupies exactly N * 12 bytes
+    and can be exposed to other languages as a single N x 3 buffer of floats.
+
+    Args:
+        elementType (ValueType): The value type of the elements within this array.
+
+    Class members:
+        CATEGORY (str): The named category of all array value types.
+    """
+
+    CATEGORY = "array"
+
+    def __init__(self, elementType):
+        assert isinstance(elementType, (ScalarType, VectorType, RangeType))
+        self.elementType = elementType
+
+    @property
+    def className(self):
+        """
+        The class name of an ArrayType is the class name of its element type joined
+        with an "Array" suffix.
+
+        Returns:
+            str: the class name of this array type.
+        """
+        return "{elementTypeName}Array".format(elementTypeName=(UpperCamelCase(self.elementType.className)))
+
+    @property
+    def headerFileName(self):
+        """
+        The header file name of an ArrayType is the header file name of its element type joined
+        with an "Array" suffix, or the lowerCamelCased className for scalar element types.
+
+        Returns:
+            str: the header file name of this ArrayType.
+        """
+        if self.elementType.isScalar:
+            return "{elementTypeName}Array.h".format(elementTypeName=LowerCamelCase(self.elementType.className),)
+        else:
+            return "{elementHeaderFileName}Array.h".format(
+                elementHeaderFileName=os.path.splitext(self.elementType.headerFileName)[0]
+            )
+
+    @property
+    def scalarType(self):
+        """
+        Returns:
+            ScalarType: the innermost scalar type stored by this array.
+        """
+        valueType = self.elementType
+        while not valueType.isScalar:
+            valueType = valueType.elementType
+        return valueType
+
+    @property
+    def elementShape(self):
+        """
+        The shape of a single array element, in terms of scalar values.
+
+        Returns:
+            tuple: empty for scalar elements, the vector shape for vector elements, and the vector
+                shape prefixed by 2 (min, max) for range elements.
+        """
+        if self.elementType.isScalar:
+            return ()
+        elif self.elementType.isVector:
+            return self.elementType.shape
+        else:
+            if self.elementType.elementType.isScalar:
+                return (2,)
+            return (2,) + self.elementType.elementType.shape
+
+    @property
+    def elementScalarSize(self):
+        """
+        Returns:
+            int: the number of scalar values in a single array element.
+        """
+        return functools.reduce(lambda x, y: x * y, self.elementShape, 1)
+
+    @property
+    def bufferStrides(self):
+        """
+        The strides of the (N,) + ``elementShape`` buffer exposing the storage of this array, in number of scalars.
+
+        Returns:
+            tuple: the stride of each buffer dimension.
+        """
+        shape = self.elementShape
+        return tuple(functools.reduce(lambda x, y: x * y, shape[index:], 1) for index in range(len(shape) + 1))
+
+    @property
+    def isArray(self):
+        """
+        Returns:
+            bool: True, this class is indeed an array type.
+        """
+        return True
+
+
+class PacketType(ElementContainerType):
+    """
+    Code generation object for a structure-of-arrays (SoA) packet, storing a fixed number of lanes of
+    a single index float vector, or float range element type.
+
+    Each scalar component of the element type is stored as a contiguous, lane-wide array.  For example, the x
+    components of all 8 lanes of a Vec3fPacket8 are adjacent in memory, such that they can be loaded into a single
+    SIMD register and processed at once.
+
+    Args:
+        elementType (ValueType): The value type of a single lane.
+        laneCount (int): The number of lanes.
+
+    Class members:
+        CATEGORY (str): The named category of all packet value types.
+    """
+
+    CATEGORY = "packet"
+
+    def __init__(self, elementType, laneCount):
+        assert isinstance(elementType, (VectorType, RangeType))
+        if elementType.isVector:
+            assert len(elementType.shape) == 1
+        else:
+            assert elementType.elementType.isScalar
+        assert elementType.isFloatingPoint
+        self.elementType = elementType
+        self.laneCount = laneCount
+
+    def __hash__(self):
+        """
+        The hash combination of its element type, lane count and category.
+        """
+        return hash((self.elementType, self.laneCount, self.CATEGORY))
+
+    @property
+    def className(self):
+        """
+        The class name of a PacketType is the class name of its element type joined
+        with a "Packet" suffix and the lane count.
+
+        Returns:
+            str: the class name of this packet type.
+        """
+        return "{elementTypeName}Packet{laneCount}".format(
+            elementTypeName=UpperCamelCase(self.elementType.className), laneCount=self.laneCount,
+        )
+
+    @property
+    def headerFileName(self):
+        """
+        Returns:
+            str: the header file name of this PacketType.
+        """
+        return "{name}.h".format(name=LowerCamelCase(self.className))
+
+    @property
+    def scalarType(self):
+        """
+        Returns:
+            ScalarType: the scalar type of each lane component.
+        """
+        return self.elementType.elementType
+
+    @property
+    def componentCount(self):
+        """
+        Returns:
+            int: the number of scalar components in a single lane, which is the number of lane-wide arrays.
+        """
+        if self.elementType.isVector:
+            return self.elementType.elementSize
+        else:
+            return 2
+
+    @property
+    def alignment(self):
+        """
+        Returns:
+            int: the byte alignment of the lane-wide arrays, to allow aligned SIMD loads of up to 8 lanes.
+        """
+        return min(self.laneCount, 8) * 4
+
+    @property
+    def isPacket(self):
+        """
+        Returns:
+            bool: True, this class is indeed a packet type.
+        """
+        return True
+
+
 class CompositeType(ValueType):
     """
     Code generation for an C++ composite data type.
     A composite type is a structure composed of one or more elements.
     Each element can be of type pod, vector, or another composite.
 
+    A composite type can also cache derived elements, computed from its elements upon construction.
+    To keep the derived elements consistent, such composite types are immutable: their elements are
+    only accessible through const accessors.
+
     Args:
         name (str): name of the composite type.
         elements (list): list of NamedElement(s).
         extraIncludes (list): list of extras includes to encode near the top of the source file.
+        derivedElements (list): list of DerivedElement(s).
 
     Class members:
         CATEGORY (str): The named category of all Composite value types.
@@ -488,16 +830,25 @@ class CompositeType(ValueType):
 
     CATEGORY = "composite"
 
-    def __init__(self, name, elements, extraIncludes=None):
-        for element in elements:
+    def __init__(self, name, elements, extraIncludes=None, derivedElements=None):
+        for element in elements + (derivedElements or []):
             assert isinstance(element.type, ValueType)
         self.name = name
         self.elements = elements
         self.elementSize = len(self.elements)
         self.extraIncludes = extraIncludes or []
+        self.derivedElements = derivedElements or []
 
     def __hash__(self):
-        return hash((self.name, self.elements))
+        return hash((self.name, tuple(self.elements)))
+
+    @property
+    def isMutable(self):
+        """
+        Returns:
+            bool: True if the elements of this composite type can be modified after construction.
+        """
+        return not self.derivedElements
 
     @property
     def className(self):
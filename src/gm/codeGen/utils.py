@@ -9,13 +9,18 @@ import subprocess
 import math
 import logging
 import tempfile
-import difflib
+import hashlib
+import json
+import inspect
+import collections
+import multiprocessing
 
 from jinja2 import (
     Environment,
     Template,
     StrictUndefined,
     FileSystemLoader,
+    meta,
 )
 
 """
@@ -48,6 +53,28 @@ Global logger
 global LOGGER
 LOGGER = logging.getLogger("GraphicsMath")
 
+"""
+Global code generation cache, set up by SetupCache.  If None, then all outputs are always generated.
+"""
+global CACHE
+CACHE = None
+
+"""
+Global queue of code generation jobs, generated upon GenerateQueuedCode.
+"""
+GenerationJob = collections.namedtuple("GenerationJob", ["relTemplatePath", "outputAbsPath", "kwargs", "key"])
+QUEUE = []
+
+"""
+Maximum number of files passed to a single code formatter invocation.
+"""
+FORMAT_BATCH_SIZE = 64
+
+"""
+Version of the code generation cache format.  Bump to invalidate all existing caches.
+"""
+CACHE_VERSION = 1
+
 
 def SetupLogging(level=logging.INFO):
     """
@@ -129,6 +156,37 @@ def RunCommand(command, expectedCode=0):
             )
         )
 
+    return stdout
+
+
+def RunCommands(commands, jobs=1, expectedCode=0):
+    """
+    Run each of the ``commands`` in a subprocess, with up to ``jobs`` processes running at once.
+
+    Args:
+        commands (list): The commands to run.
+        jobs (int): The maximum number of processes to run at once.
+        expectedCode (int): Expected return code of each process.
+    """
+    pending = list(commands)
+    running = []
+    while pending or running:
+        while pending and len(running) < jobs:
+            command = pending.pop(0)
+            LOGGER.debug("Running command {}".format(command))
+            process = subprocess.Popen(shlex.split(command), stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            running.append(process)
+
+        process = running.pop(0)
+        stdout, _ = process.communicate()
+        if process.returncode != expectedCode:
+            LOGGER.error(stdout)
+            raise RuntimeError(
+                "Expected return code {expectedCode} != {returnCode}".format(
+                    expectedCode=expectedCode, returnCode=process.returncode,
+                )
+            )
+
 
 def WriteFile(filePath, content):
     """
@@ -203,6 +261,35 @@ def RenderTemplate(templatePath, **kwargs):
         return code
 
 
+def GetFormatCommand(filePath):
+    """
+    Args:
+        filePath (str): path of the file to format.
+
+    Returns:
+        str: the formatter executable for ``filePath``, or None if the file is not formatted.
+    """
+    if GetFileExt(filePath) == PY_SOURCE_EXT:
+        return "black"
+    elif GetFileExt(filePath) in (CPP_SOURCE_EXT, CPP_HEADER_EXT):
+        return "clang-format"
+    return None
+
+
+def _RenderJob(args):
+    """
+    Render the template of a code generation job.  Module level, such that it can be sent to pool processes.
+
+    Args:
+        args (tuple): the template path relative to the template directory, and the template context.
+
+    Returns:
+        str: the rendered code.
+    """
+    relTemplatePath, kwargs = args
+    return RenderTemplate(GetTemplateFile(relTemplatePath), **kwargs)
+
+
 def FormatCode(filePath):
     """
     Run automated code formatting and modify ``filePath`` in place.
@@ -216,41 +303,287 @@ def FormatCode(filePath):
         RunCommand("clang-format -i " + filePath)
 
 
+def FormatFiles(filePaths, jobs=1):
+    """
+    Run automated code formatting and modify ``filePaths`` in place.
+
+    Each code formatter is invoked on batches of files, instead of once per file, and up to ``jobs``
+    formatter processes are run at once.
+
+    Args:
+        filePaths (list): input files to automatically format.
+        jobs (int): the maximum number of formatter processes to run at once.
+    """
+    formatCommands = {
+        "black": "black",
+        "clang-format": "clang-format -i",
+    }
+
+    filePathsByFormatter = collections.OrderedDict()
+    for filePath in filePaths:
+        formatter = GetFormatCommand(filePath)
+        if formatter:
+            filePathsByFormatter.setdefault(formatter, []).append(filePath)
+
+    commands = []
+    for formatter, formatterFilePaths in filePathsByFormatter.items():
+        # Split evenly across the jobs, with bounded command lengths.
+        batchSize = min(FORMAT_BATCH_SIZE, int(math.ceil(len(formatterFilePaths) / float(jobs))))
+        for index in range(0, len(formatterFilePaths), batchSize):
+            commands.append(
+                " ".join([formatCommands[formatter]] + formatterFilePaths[index : index + batchSize])
+            )
+
+    RunCommands(commands, jobs=jobs)
+
+
+def HashContent(content):
+    """
+    Args:
+        content (str): content to hash.
+
+    Returns:
+        str: hex digest of ``content``.
+    """
+    if not isinstance(content, bytes):
+        content = content.encode("utf-8")
+    return hashlib.sha1(content).hexdigest()
+
+
+def Fingerprint(value):
+    """
+    Compute a deterministic, structural string representation of a template context value.
+
+    Objects are represented by their class name and attributes, such that equivalent contexts
+    produce equal fingerprints across code generation runs.  Functions, classes and modules are
+    represented by their name, their implementation is covered by the code generation sources hash
+    (see GenerationCache).
+
+    Args:
+        value (object): the value to fingerprint.
+
+    Returns:
+        str: the fingerprint.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, type(u""))):
+        return repr(value)
+    elif isinstance(value, (list, tuple)):
+        return "[" + ",".join(Fingerprint(element) for element in value) + "]"
+    elif isinstance(value, (set, frozenset)):
+        return "{" + ",".join(sorted(Fingerprint(element) for element in value)) + "}"
+    elif isinstance(value, collections.OrderedDict):
+        return "{" + ",".join(Fingerprint(key) + ":" + Fingerprint(item) for key, item in value.items()) + "}"
+    elif isinstance(value, dict):
+        return "{" + ",".join(sorted(Fingerprint(key) + ":" + Fingerprint(item) for key, item in value.items())) + "}"
+    elif inspect.ismodule(value) or inspect.isroutine(value) or inspect.isclass(value):
+        return "<" + value.__name__ + ">"
+    elif hasattr(value, "__dict__"):
+        return value.__class__.__name__ + Fingerprint(vars(value))
+    elif hasattr(value, "__iter__"):
+        # Views, such as dict.values() in python 3.
+        return Fingerprint(list(value))
+    else:
+        raise TypeError("Cannot fingerprint value of type {!r}".format(type(value)))
+
+
+class GenerationCache:
+    """
+    Persistent cache of generated source files, such that outputs whose inputs are unchanged
+    are skipped, instead of being rendered and formatted again.
+
+    Each output is keyed on:
+    - the content of its template, and of the templates it extends, includes or imports.
+    - the fingerprint of its template context (see Fingerprint).
+    - the content of the code generation sources (the codeGen package and the top-level script).
+    - the version of the code formatter.
+
+    The content hash of each output is also recorded, such that outputs modified or removed outside
+    of code generation are generated again.
+
+    Args:
+        filePath (str): path of the cache file.
+        sourcePaths (list): paths of the code generation sources.
+        force (bool): if True, the existing cache entries are discarded such that all outputs are generated.
+    """
+
+    def __init__(self, filePath, sourcePaths, force=False):
+        self.filePath = filePath
+        self._entries = {}
+        self._templateHashes = {}
+        self._formatterVersions = {}
+        self._sourcesHash = HashContent("".join(self._ReadFile(sourcePath) for sourcePath in sorted(sourcePaths)))
+        self.generatedCount = 0
+        self.skippedCount = 0
+
+        if not force and os.path.isfile(filePath):
+            try:
+                with open(filePath, "r") as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION:
+                    self._entries = data["entries"]
+            except ValueError:
+                LOGGER.warning("Ignoring corrupt code generation cache {!r}".format(filePath))
+
+    def Key(self, relTemplatePath, outputPath, **kwargs):
+        """
+        Compute the cache key of an output.
+
+        Returns:
+            str: the cache key.
+        """
+        formatCommand = GetFormatCommand(outputPath)
+        return HashContent(
+            "\n".join(
+                [
+                    self._sourcesHash,
+                    self._TemplateHash(relTemplatePath),
+                    Fingerprint(kwargs),
+                    self._FormatterVersion(formatCommand) if formatCommand else "",
+                ]
+            )
+        )
+
+    def IsUpToDate(self, outputPath, key):
+        """
+        Returns:
+            bool: True if ``outputPath`` was generated with ``key``, and was not modified since.
+        """
+        entry = self._entries.get(outputPath)
+        if entry is None or entry["key"] != key or not os.path.isfile(outputPath):
+            return False
+        return HashContent(self._ReadFile(outputPath)) == entry["contentHash"]
+
+    def Update(self, outputPath, key):
+        """
+        Record ``outputPath`` as generated with ``key``.
+        """
+        self._entries[outputPath] = {"key": key, "contentHash": HashContent(self._ReadFile(outputPath))}
+
+    def Save(self):
+        """
+        Write the cache to disk.
+        """
+        WriteFile(self.filePath, json.dumps({"version": CACHE_VERSION, "entries": self._entries}, sort_keys=True))
+
+    @staticmethod
+    def _ReadFile(filePath):
+        with open(filePath, "r") as f:
+            return f.read()
+
+    def _TemplateHash(self, relTemplatePath):
+        # Hash of the template content, combined with the templates it references.
+        if relTemplatePath not in self._templateHashes:
+            # Guard against cyclic references.
+            self._templateHashes[relTemplatePath] = ""
+            source = self._ReadFile(GetTemplateFile(relTemplatePath))
+            referencedPaths = sorted(
+                path for path in meta.find_referenced_templates(JINJA2_ENVIRONMENT.parse(source)) if path
+            )
+            self._templateHashes[relTemplatePath] = HashContent(
+                "\n".join([source] + [self._TemplateHash(path) for path in referencedPaths])
+            )
+        return self._templateHashes[relTemplatePath]
+
+    def _FormatterVersion(self, formatCommand):
+        if formatCommand not in self._formatterVersions:
+            self._formatterVersions[formatCommand] = RunCommand(formatCommand + " --version").strip()
+        return self._formatterVersions[formatCommand]
+
+
+def SetupCache(filePath, sourcePaths, force=False):
+    """
+    Set up the global code generation cache.
+
+    Args:
+        filePath (str): path of the cache file.
+        sourcePaths (list): paths of the code generation sources.
+        force (bool): if True, the existing cache entries are discarded such that all outputs are generated.
+    """
+    global CACHE
+    CACHE = GenerationCache(filePath, sourcePaths, force=force)
+
+
 def GenerateCode(relTemplatePath, outputPath, **kwargs):
     """
-    Generate code by rendering the specified jinja2 template at ``relTemplatePath``, passing in ``kwargs``,
-    and saving the results onto disk at ``outputPath``.
+    Queue the generation of code by rendering the specified jinja2 template at ``relTemplatePath``, passing
+    in ``kwargs``, and saving the results onto disk at ``outputPath``.
+
+    The queued code is generated upon GenerateQueuedCode, such that the rendering and formatting of
+    many files can be distributed across processes.
+
+    Outputs which are up to date with respect to the global code generation cache are skipped.
 
     Returns:
         str: the file path to the generated code on disk.
     """
-    code = RenderTemplate(GetTemplateFile(relTemplatePath), **kwargs)
     outputAbsPath = os.path.abspath(outputPath)
+    key = None
+    if CACHE is not None:
+        key = CACHE.Key(relTemplatePath, outputAbsPath, **kwargs)
+        if CACHE.IsUpToDate(outputAbsPath, key):
+            LOGGER.debug("Skipped up to date file {!r}".format(outputAbsPath))
+            CACHE.skippedCount += 1
+            return outputAbsPath
+
+    QUEUE.append(GenerationJob(relTemplatePath, outputAbsPath, kwargs, key))
+    return outputAbsPath
 
-    if os.path.isfile(outputAbsPath):
-        # Read old file contents.
-        with open(outputAbsPath, "r") as f:
-            oldContent = f.read()
-
-        # Generate new code file.
-        tempFilePath = os.path.join(
-            os.path.dirname(outputAbsPath),
-            "_TMP_" + os.path.basename(outputAbsPath)
-        )
 
-        WriteFile(tempFilePath, code)
-        FormatCode(tempFilePath)
-        with open(tempFilePath, "r") as f:
-            newContent = f.read()
+def GenerateQueuedCode(jobs=1):
+    """
+    Generate the code queued by GenerateCode.
 
-        # If there is code diff, then overwrite old file.
-        codeDiff = difflib.unified_diff(oldContent, newContent)
-        if list(codeDiff):
-            WriteFile(outputAbsPath, newContent)
+    The templates are rendered across a pool of ``jobs`` processes, then formatted by invoking each code
+    formatter on batches of files, running up to ``jobs`` formatter processes at once.  Existing files are only
+    overwritten if their code has changed.
 
-        os.remove(tempFilePath)
+    Args:
+        jobs (int): the number of processes to use.
+    """
+    queue = list(QUEUE)
+    del QUEUE[:]
+    if not queue:
+        return
+
+    PrintMessage("Rendering and formatting {count} file(s)...".format(count=len(queue)))
+
+    renderArgs = [(job.relTemplatePath, job.kwargs) for job in queue]
+    if jobs > 1:
+        pool = multiprocessing.Pool(jobs)
+        try:
+            codes = pool.map(_RenderJob, renderArgs)
+        finally:
+            pool.close()
+            pool.join()
     else:
-        WriteFile(outputAbsPath, code)
-        FormatCode(outputAbsPath)
+        codes = [_RenderJob(args) for args in renderArgs]
 
-    return outputAbsPath
+    # Render into temporary files, such that existing files are left untouched if their code has not changed.
+    tempFilePaths = []
+    for job, code in zip(queue, codes):
+        tempFilePath = os.path.join(os.path.dirname(job.outputAbsPath), "_TMP_" + os.path.basename(job.outputAbsPath))
+        WriteFile(tempFilePath, code)
+        tempFilePaths.append(tempFilePath)
+
+    try:
+        FormatFiles(tempFilePaths, jobs=jobs)
+
+        for job, tempFilePath in zip(queue, tempFilePaths):
+            with open(tempFilePath, "r") as f:
+                newContent = f.read()
+
+            oldContent = None
+            if os.path.isfile(job.outputAbsPath):
+                with open(job.outputAbsPath, "r") as f:
+                    oldContent = f.read()
+
+            # If there is code diff, then overwrite old file.
+            if newContent != oldContent:
+                WriteFile(job.outputAbsPath, newContent)
+
+            if CACHE is not None:
+                CACHE.Update(job.outputAbsPath, job.key)
+                CACHE.generatedCount += 1
+    finally:
+        for tempFilePath in tempFilePaths:
+            os.remove(tempFilePath)
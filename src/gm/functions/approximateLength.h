@@ -0,0 +1,91 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/approximateLength.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Fast approximation of the \b length, or magnitude, of a vector.
+///
+/// The length is computed as the product of the squared length and its approximated reciprocal square root,
+/// trading a maximum relative error of \f$6 \times 10^{-6}\f$ for the cost of an exact square root.
+/// See \ref ApproximateReciprocalSquareRoot.
+
+#include <gm/gm.h>
+
+#include <gm/types/quatf.h>
+#include <gm/types/vec2f.h>
+#include <gm/types/vec3f.h>
+#include <gm/types/vec4f.h>
+
+#include <algorithm>
+#include <limits>
+
+#include <gm/functions/approximateReciprocalSquareRoot.h>
+#include <gm/functions/lengthSquared.h>
+
+GM_NS_OPEN
+
+/// Approximate the length of the vector \p i_vector.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vector The input vector.
+///
+/// \return The approximated length of the vector, with a maximum relative error of \f$6 \times 10^{-6}\f$.
+GM_HOST_DEVICE inline float ApproximateLength( const Vec2f& i_vector )
+{
+    // Clamping to the smallest normal value, rather than branching on zero length, keeps batched loops free
+    // of branches.  Zero length vectors produce a product of zero.
+    float lengthSquared = LengthSquared( i_vector );
+    return lengthSquared *
+           ApproximateReciprocalSquareRoot( std::max( lengthSquared, std::numeric_limits< float >::min() ) );
+}
+
+/// Approximate the length of the vector \p i_vector.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vector The input vector.
+///
+/// \return The approximated length of the vector, with a maximum relative error of \f$6 \times 10^{-6}\f$.
+GM_HOST_DEVICE inline float ApproximateLength( const Vec3f& i_vector )
+{
+    // Clamping to the smallest normal value, rather than branching on zero length, keeps batched loops free
+    // of branches.  Zero length vectors produce a product of zero.
+    float lengthSquared = LengthSquared( i_vector );
+    return lengthSquared *
+           ApproximateReciprocalSquareRoot( std::max( lengthSquared, std::numeric_limits< float >::min() ) );
+}
+
+/// Approximate the length of the vector \p i_vector.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vector The input vector.
+///
+/// \return The approximated length of the vector, with a maximum relative error of \f$6 \times 10^{-6}\f$.
+GM_HOST_DEVICE inline float ApproximateLength( const Vec4f& i_vector )
+{
+    // Clamping to the smallest normal value, rather than branching on zero length, keeps batched loops free
+    // of branches.  Zero length vectors produce a product of zero.
+    float lengthSquared = LengthSquared( i_vector );
+    return lengthSquared *
+           ApproximateReciprocalSquareRoot( std::max( lengthSquared, std::numeric_limits< float >::min() ) );
+}
+
+/// Approximate the length of the vector \p i_vector.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vector The input vector.
+///
+/// \return The approximated length of the vector, with a maximum relative error of \f$6 \times 10^{-6}\f$.
+GM_HOST_DEVICE inline float ApproximateLength( const Quatf& i_vector )
+{
+    // Clamping to the smallest normal value, rather than branching on zero length, keeps batched loops free
+    // of branches.  Zero length vectors produce a product of zero.
+    float lengthSquared = LengthSquared( i_vector );
+    return lengthSquared *
+           ApproximateReciprocalSquareRoot( std::max( lengthSquared, std::numeric_limits< float >::min() ) );
+}
+
+GM_NS_CLOSE
\ No newline at end of file
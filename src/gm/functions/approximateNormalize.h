@@ -0,0 +1,81 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/approximateNormalize.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Fast approximation of vector normalization.
+///
+/// The vector is multiplied by the approximated reciprocal square root of its squared length, rather than
+/// divided by its exact length.  The length of the normalized vector deviates from 1 by at most
+/// \f$6 \times 10^{-6}\f$.  See \ref ApproximateReciprocalSquareRoot.
+
+#include <gm/gm.h>
+
+#include <gm/types/quatf.h>
+#include <gm/types/vec2f.h>
+#include <gm/types/vec3f.h>
+#include <gm/types/vec4f.h>
+
+#include <gm/base/diagnostic.h>
+#include <gm/functions/approximateReciprocalSquareRoot.h>
+#include <gm/functions/lengthSquared.h>
+
+GM_NS_OPEN
+
+/// Approximate the normalised vector from the input vector \p i_vector.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vector Input vector.
+///
+/// \return Approximately normalised vector.
+GM_HOST_DEVICE inline Vec2f ApproximateNormalize( const Vec2f& i_vector )
+{
+    float lengthSquared = LengthSquared( i_vector );
+    GM_ASSERT( lengthSquared != 0.0f );
+    return i_vector * ApproximateReciprocalSquareRoot( lengthSquared );
+}
+
+/// Approximate the normalised vector from the input vector \p i_vector.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vector Input vector.
+///
+/// \return Approximately normalised vector.
+GM_HOST_DEVICE inline Vec3f ApproximateNormalize( const Vec3f& i_vector )
+{
+    float lengthSquared = LengthSquared( i_vector );
+    GM_ASSERT( lengthSquared != 0.0f );
+    return i_vector * ApproximateReciprocalSquareRoot( lengthSquared );
+}
+
+/// Approximate the normalised vector from the input vector \p i_vector.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vector Input vector.
+///
+/// \return Approximately normalised vector.
+GM_HOST_DEVICE inline Vec4f ApproximateNormalize( const Vec4f& i_vector )
+{
+    float lengthSquared = LengthSquared( i_vector );
+    GM_ASSERT( lengthSquared != 0.0f );
+    return i_vector * ApproximateReciprocalSquareRoot( lengthSquared );
+}
+
+/// Approximate the normalised vector from the input vector \p i_vector.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vector Input vector.
+///
+/// \return Approximately normalised vector.
+GM_HOST_DEVICE inline Quatf ApproximateNormalize( const Quatf& i_vector )
+{
+    float lengthSquared = LengthSquared( i_vector );
+    GM_ASSERT( lengthSquared != 0.0f );
+    return i_vector * ApproximateReciprocalSquareRoot( lengthSquared );
+}
+
+GM_NS_CLOSE
\ No newline at end of file
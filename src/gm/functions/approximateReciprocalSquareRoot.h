@@ -0,0 +1,58 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/approximateReciprocalSquareRoot.h
+/// \ingroup gm_functions_basic
+///
+/// Fast approximation of the reciprocal square root, \f$1 / \sqrt{x}\f$.
+///
+/// An initial estimate is refined with Newton-Raphson iterations
+/// \f[
+/// y_{n+1} = y_n ( 1.5 - 0.5 x y_n^2 )
+/// \f]
+/// The estimate is computed by the \p rsqrtss instruction followed by a single iteration when the SSE code paths
+/// are enabled (maximum relative error of \f$3 \times 10^{-7}\f$), otherwise by integer manipulation of the
+/// floating point representation followed by two iterations (maximum relative error of \f$5 \times 10^{-6}\f$).
+
+#include <gm/gm.h>
+
+#include <cstdint>
+#include <cstring>
+
+#include <gm/base/diagnostic.h>
+#include <gm/base/simd.h>
+
+GM_NS_OPEN
+
+/// Approximate the reciprocal square root of \p i_value.
+/// \ingroup gm_functions_basic
+///
+/// The maximum relative error is \f$5 \times 10^{-6}\f$.
+///
+/// \param i_value The input value.
+///
+/// \pre \p i_value must be greater than 0.
+///
+/// \return The approximated reciprocal square root of \p i_value.
+GM_HOST_DEVICE inline float ApproximateReciprocalSquareRoot( const float& i_value )
+{
+    GM_ASSERT( i_value > 0.0f );
+    const float halfValue = 0.5f * i_value;
+#if defined( GM_SIMD_SSE_ENABLED )
+    float estimate = _mm_cvtss_f32( _mm_rsqrt_ss( _mm_set_ss( i_value ) ) );
+    return estimate * ( 1.5f - halfValue * estimate * estimate );
+#else
+    uint32_t bits;
+    std::memcpy( &bits, &i_value, sizeof( bits ) );
+    bits = 0x5f375a86u - ( bits >> 1 );
+    float estimate;
+    std::memcpy( &estimate, &bits, sizeof( estimate ) );
+    estimate = estimate * ( 1.5f - halfValue * estimate * estimate );
+    return estimate * ( 1.5f - halfValue * estimate * estimate );
+#endif
+}
+
+GM_NS_CLOSE
\ No newline at end of file
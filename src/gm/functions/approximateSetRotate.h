@@ -0,0 +1,81 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/approximateSetRotate.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Set a rotation for an specified axis on a transformation matrix or quaternion, with respect to the left hand rule.
+///
+/// The sine and cosine of the angle are approximated with \ref ApproximateSineCosine, for a maximum absolute
+/// error of \f$2 \times 10^{-7}\f$ in each, within \f$[-8192, 8192]\f$ radians.
+
+#include <gm/gm.h>
+
+#include <gm/types/mat4f.h>
+#include <gm/types/quatf.h>
+#include <gm/types/vec3f.h>
+
+#include <gm/functions/approximateSineCosine.h>
+#include <gm/functions/normalize.h>
+#include <gm/functions/radians.h>
+
+GM_NS_OPEN
+
+/// Set a \p i_axis rotation of \p i_angle degrees onto the transformation
+/// matrix \p o_matrix, approximating the sine and cosine of the angle.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_angle The angle of rotation in degrees.
+/// \param i_axis The axis of rotation.
+/// \param o_matrix Transformation matrix.
+GM_HOST_DEVICE inline void ApproximateSetRotate( const float& i_angle, const Vec3f& i_axis, Mat4f& o_matrix )
+{
+    // Axis must be normalised.
+    Vec3f normAxis = Normalize( i_axis );
+
+    // Compute cosine and sine.
+    float radians = Radians( i_angle );
+    float sinTheta, cosTheta;
+    ApproximateSineCosine( radians, sinTheta, cosTheta );
+
+    o_matrix( 0, 0 ) = normAxis[ 0 ] * normAxis[ 0 ] + ( 1 - normAxis[ 0 ] * normAxis[ 0 ] ) * cosTheta;
+    o_matrix( 0, 1 ) = normAxis[ 0 ] * normAxis[ 1 ] * ( 1 - cosTheta ) - normAxis[ 2 ] * sinTheta;
+    o_matrix( 0, 2 ) = normAxis[ 0 ] * normAxis[ 2 ] * ( 1 - cosTheta ) + normAxis[ 1 ] * sinTheta;
+    o_matrix( 0, 3 ) = 0;
+
+    o_matrix( 1, 0 ) = normAxis[ 0 ] * normAxis[ 1 ] * ( 1 - cosTheta ) + normAxis[ 2 ] * sinTheta;
+    o_matrix( 1, 1 ) = normAxis[ 1 ] * normAxis[ 1 ] + ( 1 - normAxis[ 1 ] * normAxis[ 1 ] ) * cosTheta;
+    o_matrix( 1, 2 ) = normAxis[ 1 ] * normAxis[ 2 ] * ( 1 - cosTheta ) - normAxis[ 0 ] * sinTheta;
+    o_matrix( 1, 3 ) = 0;
+
+    o_matrix( 2, 0 ) = normAxis[ 0 ] * normAxis[ 2 ] * ( 1 - cosTheta ) - normAxis[ 1 ] * sinTheta;
+    o_matrix( 2, 1 ) = normAxis[ 1 ] * normAxis[ 2 ] * ( 1 - cosTheta ) + normAxis[ 0 ] * sinTheta;
+    o_matrix( 2, 2 ) = normAxis[ 2 ] * normAxis[ 2 ] + ( 1 - normAxis[ 2 ] * normAxis[ 2 ] ) * cosTheta;
+    o_matrix( 2, 3 ) = 0;
+}
+
+/// Set a \p i_axis rotation of \p i_angle degrees onto the quaternion \p o_quaternion, approximating
+/// the sine and cosine of the half angle.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_angle The angle of rotation in degrees.
+/// \param i_axis The axis of rotation.
+/// \param o_quaternion The output unit quaternion.
+GM_HOST_DEVICE inline void ApproximateSetRotate( const float& i_angle, const Vec3f& i_axis, Quatf& o_quaternion )
+{
+    // Axis must be normalised.
+    Vec3f normAxis = Normalize( i_axis );
+
+    // Compute the sine and cosine of the half angle.
+    float halfRadians = Radians( i_angle ) * 0.5f;
+    float sinHalfTheta, cosHalfTheta;
+    ApproximateSineCosine( halfRadians, sinHalfTheta, cosHalfTheta );
+
+    o_quaternion =
+        Quatf( normAxis[ 0 ] * sinHalfTheta, normAxis[ 1 ] * sinHalfTheta, normAxis[ 2 ] * sinHalfTheta, cosHalfTheta );
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,68 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/approximateSineCosine.h
+/// \ingroup gm_functions_basic
+///
+/// Fast approximation of the sine and cosine of an angle, computed together.
+///
+/// The angle is reduced into \f$[-\pi/4, \pi/4]\f$ by subtracting the nearest multiple of \f$\pi/2\f$ (in three
+/// parts, such that the reduction is exact in single precision for moderate angles), then the sine and cosine of
+/// the reduced angle are evaluated with minimax polynomials and assigned by quadrant without branching.
+///
+/// The maximum absolute error is \f$2 \times 10^{-7}\f$ for angles within \f$[-8192, 8192]\f$ radians, and
+/// degrades for larger angles.  The angle must be finite and within \f$[-10^9, 10^9]\f$ radians, such that its
+/// quadrant can be represented as an int.
+
+#include <gm/gm.h>
+
+#include <gm/base/diagnostic.h>
+
+GM_NS_OPEN
+
+/// Approximate the sine and cosine of \p i_angle.
+/// \ingroup gm_functions_basic
+///
+/// \param i_angle The input angle in units of \em radians.
+/// \param o_sine The approximated sine of \p i_angle.
+/// \param o_cosine The approximated cosine of \p i_angle.
+///
+/// \pre \p i_angle must be in the range of [-1e9, 1e9].
+GM_HOST_DEVICE inline void ApproximateSineCosine( const float& i_angle, float& o_sine, float& o_cosine )
+{
+    GM_ASSERT_MSG( i_angle >= -1e9f && i_angle <= 1e9f, "Expected i_angle between [-1e9,1e9], got %f\n", i_angle );
+
+    // Nearest quadrant.
+    const float scaledAngle   = i_angle * 0.636619772368f;
+    const int   quadrant      = static_cast< int >( scaledAngle + ( scaledAngle >= 0.0f ? 0.5f : -0.5f ) );
+    const float quadrantAngle = static_cast< float >( quadrant );
+
+    // Cody-Waite reduction, with pi / 2 split into parts whose products with the quadrant are exact.
+    float reduced = i_angle - quadrantAngle * 1.5703125f;
+    reduced       = reduced - quadrantAngle * 4.837512969970703125e-4f;
+    reduced       = reduced - quadrantAngle * 7.54978995489188216e-8f;
+
+    // Minimax polynomials over [-pi / 4, pi / 4].
+    const float reducedSquared = reduced * reduced;
+    const float reducedSine =
+        reduced +
+        reduced * reducedSquared *
+            ( -1.6666654611e-1f + reducedSquared * ( 8.3321608736e-3f + reducedSquared * -1.9515295891e-4f ) );
+    const float reducedCosine =
+        1.0f - 0.5f * reducedSquared +
+        reducedSquared * reducedSquared *
+            ( 4.166664568298827e-2f +
+              reducedSquared * ( -1.388731625493765e-3f + reducedSquared * 2.443315711809948e-5f ) );
+
+    // Odd quadrants swap the sine and cosine, the sine is negated in quadrants 2, 3 and the cosine in 1, 2.
+    const bool  swap           = ( quadrant & 1 ) != 0;
+    const float quadrantSine   = swap ? reducedCosine : reducedSine;
+    const float quadrantCosine = swap ? reducedSine : reducedCosine;
+    o_sine                     = ( quadrant & 2 ) != 0 ? -quadrantSine : quadrantSine;
+    o_cosine                   = ( ( quadrant + 1 ) & 2 ) != 0 ? -quadrantCosine : quadrantCosine;
+}
+
+GM_NS_CLOSE
\ No newline at end of file
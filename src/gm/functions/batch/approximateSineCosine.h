@@ -0,0 +1,41 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/approximateSineCosine.h
+/// \ingroup gm_functions_basic
+///
+/// Batched ApproximateSineCosine, evaluating \ref ApproximateSineCosine over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/approximateSineCosine.h>
+
+GM_NS_OPEN
+
+/// Batched ApproximateSineCosine, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_angle Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_sine Array of \p i_count output float(s).
+/// \param o_cosine Array of \p i_count output float(s).
+GM_HOST_DEVICE inline void ApproximateSineCosine( const BatchInput< float >& i_angle,
+                                                  size_t                     i_count,
+                                                  float* GM_RESTRICT         o_sine,
+                                                  float* GM_RESTRICT         o_cosine )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        ApproximateSineCosine( i_angle[ index ], o_sine[ index ], o_cosine[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
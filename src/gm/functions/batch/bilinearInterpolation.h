@@ -0,0 +1,191 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/bilinearInterpolation.h
+/// \ingroup gm_functions_basic
+///
+/// Batched BilinearInterpolation, evaluating \ref BilinearInterpolation over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/bilinearInterpolation.h>
+
+GM_NS_OPEN
+
+/// Batched BilinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_corner00 Input float(s), varying or uniform.
+/// \param i_corner10 Input float(s), varying or uniform.
+/// \param i_corner01 Input float(s), varying or uniform.
+/// \param i_corner11 Input float(s), varying or uniform.
+/// \param i_weight Input Vec2f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void BilinearInterpolation( const BatchInput< float >& i_corner00,
+                                                  const BatchInput< float >& i_corner10,
+                                                  const BatchInput< float >& i_corner01,
+                                                  const BatchInput< float >& i_corner11,
+                                                  const BatchInput< Vec2f >& i_weight,
+                                                  size_t                     i_count,
+                                                  float* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = BilinearInterpolation( i_corner00[ index ],
+                                                   i_corner10[ index ],
+                                                   i_corner01[ index ],
+                                                   i_corner11[ index ],
+                                                   i_weight[ index ] );
+    }
+}
+
+/// Batched BilinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_corner00 Input Mat3f(s), varying or uniform.
+/// \param i_corner10 Input Mat3f(s), varying or uniform.
+/// \param i_corner01 Input Mat3f(s), varying or uniform.
+/// \param i_corner11 Input Mat3f(s), varying or uniform.
+/// \param i_weight Input Vec2f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat3f(s).
+GM_HOST_DEVICE inline void BilinearInterpolation( const BatchInput< Mat3f >& i_corner00,
+                                                  const BatchInput< Mat3f >& i_corner10,
+                                                  const BatchInput< Mat3f >& i_corner01,
+                                                  const BatchInput< Mat3f >& i_corner11,
+                                                  const BatchInput< Vec2f >& i_weight,
+                                                  size_t                     i_count,
+                                                  Mat3f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = BilinearInterpolation( i_corner00[ index ],
+                                                   i_corner10[ index ],
+                                                   i_corner01[ index ],
+                                                   i_corner11[ index ],
+                                                   i_weight[ index ] );
+    }
+}
+
+/// Batched BilinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_corner00 Input Mat4f(s), varying or uniform.
+/// \param i_corner10 Input Mat4f(s), varying or uniform.
+/// \param i_corner01 Input Mat4f(s), varying or uniform.
+/// \param i_corner11 Input Mat4f(s), varying or uniform.
+/// \param i_weight Input Vec2f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat4f(s).
+GM_HOST_DEVICE inline void BilinearInterpolation( const BatchInput< Mat4f >& i_corner00,
+                                                  const BatchInput< Mat4f >& i_corner10,
+                                                  const BatchInput< Mat4f >& i_corner01,
+                                                  const BatchInput< Mat4f >& i_corner11,
+                                                  const BatchInput< Vec2f >& i_weight,
+                                                  size_t                     i_count,
+                                                  Mat4f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = BilinearInterpolation( i_corner00[ index ],
+                                                   i_corner10[ index ],
+                                                   i_corner01[ index ],
+                                                   i_corner11[ index ],
+                                                   i_weight[ index ] );
+    }
+}
+
+/// Batched BilinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_corner00 Input Vec2f(s), varying or uniform.
+/// \param i_corner10 Input Vec2f(s), varying or uniform.
+/// \param i_corner01 Input Vec2f(s), varying or uniform.
+/// \param i_corner11 Input Vec2f(s), varying or uniform.
+/// \param i_weight Input Vec2f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec2f(s).
+GM_HOST_DEVICE inline void BilinearInterpolation( const BatchInput< Vec2f >& i_corner00,
+                                                  const BatchInput< Vec2f >& i_corner10,
+                                                  const BatchInput< Vec2f >& i_corner01,
+                                                  const BatchInput< Vec2f >& i_corner11,
+                                                  const BatchInput< Vec2f >& i_weight,
+                                                  size_t                     i_count,
+                                                  Vec2f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = BilinearInterpolation( i_corner00[ index ],
+                                                   i_corner10[ index ],
+                                                   i_corner01[ index ],
+                                                   i_corner11[ index ],
+                                                   i_weight[ index ] );
+    }
+}
+
+/// Batched BilinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_corner00 Input Vec3f(s), varying or uniform.
+/// \param i_corner10 Input Vec3f(s), varying or uniform.
+/// \param i_corner01 Input Vec3f(s), varying or uniform.
+/// \param i_corner11 Input Vec3f(s), varying or uniform.
+/// \param i_weight Input Vec2f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3f(s).
+GM_HOST_DEVICE inline void BilinearInterpolation( const BatchInput< Vec3f >& i_corner00,
+                                                  const BatchInput< Vec3f >& i_corner10,
+                                                  const BatchInput< Vec3f >& i_corner01,
+                                                  const BatchInput< Vec3f >& i_corner11,
+                                                  const BatchInput< Vec2f >& i_weight,
+                                                  size_t                     i_count,
+                                                  Vec3f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = BilinearInterpolation( i_corner00[ index ],
+                                                   i_corner10[ index ],
+                                                   i_corner01[ index ],
+                                                   i_corner11[ index ],
+                                                   i_weight[ index ] );
+    }
+}
+
+/// Batched BilinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_corner00 Input Vec4f(s), varying or uniform.
+/// \param i_corner10 Input Vec4f(s), varying or uniform.
+/// \param i_corner01 Input Vec4f(s), varying or uniform.
+/// \param i_corner11 Input Vec4f(s), varying or uniform.
+/// \param i_weight Input Vec2f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec4f(s).
+GM_HOST_DEVICE inline void BilinearInterpolation( const BatchInput< Vec4f >& i_corner00,
+                                                  const BatchInput< Vec4f >& i_corner10,
+                                                  const BatchInput< Vec4f >& i_corner01,
+                                                  const BatchInput< Vec4f >& i_corner11,
+                                                  const BatchInput< Vec2f >& i_weight,
+                                                  size_t                     i_count,
+                                                  Vec4f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = BilinearInterpolation( i_corner00[ index ],
+                                                   i_corner10[ index ],
+                                                   i_corner01[ index ],
+                                                   i_corner11[ index ],
+                                                   i_weight[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,311 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/contains.h
+/// \ingroup gm_functions_basic
+///
+/// Batched Contains, evaluating \ref Contains over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/contains.h>
+
+GM_NS_OPEN
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input FloatRange(s), varying or uniform.
+/// \param i_containee Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< FloatRange >& i_container,
+                                     const BatchInput< float >&      i_containee,
+                                     size_t                          i_count,
+                                     bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input FloatRange(s), varying or uniform.
+/// \param i_containee Input FloatRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< FloatRange >& i_container,
+                                     const BatchInput< FloatRange >& i_containee,
+                                     size_t                          i_count,
+                                     bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input IntRange(s), varying or uniform.
+/// \param i_containee Input int(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< IntRange >& i_container,
+                                     const BatchInput< int >&      i_containee,
+                                     size_t                        i_count,
+                                     bool* GM_RESTRICT             o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input IntRange(s), varying or uniform.
+/// \param i_containee Input IntRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< IntRange >& i_container,
+                                     const BatchInput< IntRange >& i_containee,
+                                     size_t                        i_count,
+                                     bool* GM_RESTRICT             o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input Vec2fRange(s), varying or uniform.
+/// \param i_containee Input Vec2f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< Vec2fRange >& i_container,
+                                     const BatchInput< Vec2f >&      i_containee,
+                                     size_t                          i_count,
+                                     bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input Vec2fRange(s), varying or uniform.
+/// \param i_containee Input Vec2fRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< Vec2fRange >& i_container,
+                                     const BatchInput< Vec2fRange >& i_containee,
+                                     size_t                          i_count,
+                                     bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input Vec3fRange(s), varying or uniform.
+/// \param i_containee Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< Vec3fRange >& i_container,
+                                     const BatchInput< Vec3f >&      i_containee,
+                                     size_t                          i_count,
+                                     bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input Vec3fRange(s), varying or uniform.
+/// \param i_containee Input Vec3fRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< Vec3fRange >& i_container,
+                                     const BatchInput< Vec3fRange >& i_containee,
+                                     size_t                          i_count,
+                                     bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input Vec4fRange(s), varying or uniform.
+/// \param i_containee Input Vec4f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< Vec4fRange >& i_container,
+                                     const BatchInput< Vec4f >&      i_containee,
+                                     size_t                          i_count,
+                                     bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input Vec4fRange(s), varying or uniform.
+/// \param i_containee Input Vec4fRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< Vec4fRange >& i_container,
+                                     const BatchInput< Vec4fRange >& i_containee,
+                                     size_t                          i_count,
+                                     bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input Vec2iRange(s), varying or uniform.
+/// \param i_containee Input Vec2i(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< Vec2iRange >& i_container,
+                                     const BatchInput< Vec2i >&      i_containee,
+                                     size_t                          i_count,
+                                     bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input Vec2iRange(s), varying or uniform.
+/// \param i_containee Input Vec2iRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< Vec2iRange >& i_container,
+                                     const BatchInput< Vec2iRange >& i_containee,
+                                     size_t                          i_count,
+                                     bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input Vec3iRange(s), varying or uniform.
+/// \param i_containee Input Vec3i(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< Vec3iRange >& i_container,
+                                     const BatchInput< Vec3i >&      i_containee,
+                                     size_t                          i_count,
+                                     bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input Vec3iRange(s), varying or uniform.
+/// \param i_containee Input Vec3iRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< Vec3iRange >& i_container,
+                                     const BatchInput< Vec3iRange >& i_containee,
+                                     size_t                          i_count,
+                                     bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input Vec4iRange(s), varying or uniform.
+/// \param i_containee Input Vec4i(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< Vec4iRange >& i_container,
+                                     const BatchInput< Vec4i >&      i_containee,
+                                     size_t                          i_count,
+                                     bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+/// Batched Contains, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_container Input Vec4iRange(s), varying or uniform.
+/// \param i_containee Input Vec4iRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Contains( const BatchInput< Vec4iRange >& i_container,
+                                     const BatchInput< Vec4iRange >& i_containee,
+                                     size_t                          i_count,
+                                     bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Contains( i_container[ index ], i_containee[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,139 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/content.h
+/// \ingroup gm_functions_basic
+///
+/// Batched Content, evaluating \ref Content over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/content.h>
+
+GM_NS_OPEN
+
+/// Batched Content, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_range Input FloatRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void
+Content( const BatchInput< FloatRange >& i_range, size_t i_count, float* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Content( i_range[ index ] );
+    }
+}
+
+/// Batched Content, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_range Input IntRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned int(s).
+GM_HOST_DEVICE inline void Content( const BatchInput< IntRange >& i_range, size_t i_count, int* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Content( i_range[ index ] );
+    }
+}
+
+/// Batched Content, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_range Input Vec2fRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void
+Content( const BatchInput< Vec2fRange >& i_range, size_t i_count, float* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Content( i_range[ index ] );
+    }
+}
+
+/// Batched Content, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_range Input Vec3fRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void
+Content( const BatchInput< Vec3fRange >& i_range, size_t i_count, float* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Content( i_range[ index ] );
+    }
+}
+
+/// Batched Content, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_range Input Vec4fRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void
+Content( const BatchInput< Vec4fRange >& i_range, size_t i_count, float* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Content( i_range[ index ] );
+    }
+}
+
+/// Batched Content, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_range Input Vec2iRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned int(s).
+GM_HOST_DEVICE inline void Content( const BatchInput< Vec2iRange >& i_range, size_t i_count, int* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Content( i_range[ index ] );
+    }
+}
+
+/// Batched Content, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_range Input Vec3iRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned int(s).
+GM_HOST_DEVICE inline void Content( const BatchInput< Vec3iRange >& i_range, size_t i_count, int* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Content( i_range[ index ] );
+    }
+}
+
+/// Batched Content, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_range Input Vec4iRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned int(s).
+GM_HOST_DEVICE inline void Content( const BatchInput< Vec4iRange >& i_range, size_t i_count, int* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Content( i_range[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
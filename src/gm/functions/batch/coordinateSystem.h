@@ -0,0 +1,41 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/coordinateSystem.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched CoordinateSystem, evaluating \ref CoordinateSystem over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/coordinateSystem.h>
+
+GM_NS_OPEN
+
+/// Batched CoordinateSystem, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vectorA Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_vectorB Array of \p i_count output Vec3f(s).
+/// \param o_vectorC Array of \p i_count output Vec3f(s).
+GM_HOST_DEVICE inline void CoordinateSystem( const BatchInput< Vec3f >& i_vectorA,
+                                             size_t                     i_count,
+                                             Vec3f* GM_RESTRICT         o_vectorB,
+                                             Vec3f* GM_RESTRICT         o_vectorC )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        CoordinateSystem( i_vectorA[ index ], o_vectorB[ index ], o_vectorC[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
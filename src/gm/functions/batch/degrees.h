@@ -0,0 +1,37 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/degrees.h
+/// \ingroup gm_functions_basic
+///
+/// Batched Degrees, evaluating \ref Degrees over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/degrees.h>
+
+GM_NS_OPEN
+
+/// Batched Degrees, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_angle Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void Degrees( const BatchInput< float >& i_angle, size_t i_count, float* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Degrees( i_angle[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,59 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/distance.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched Distance, evaluating \ref Distance over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/distance.h>
+
+GM_NS_OPEN
+
+/// Batched Distance, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_pointA Input Vec2f(s), varying or uniform.
+/// \param i_pointB Input Vec2f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void Distance( const BatchInput< Vec2f >& i_pointA,
+                                     const BatchInput< Vec2f >& i_pointB,
+                                     size_t                     i_count,
+                                     float* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Distance( i_pointA[ index ], i_pointB[ index ] );
+    }
+}
+
+/// Batched Distance, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_pointA Input Vec3f(s), varying or uniform.
+/// \param i_pointB Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void Distance( const BatchInput< Vec3f >& i_pointA,
+                                     const BatchInput< Vec3f >& i_pointB,
+                                     size_t                     i_count,
+                                     float* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Distance( i_pointA[ index ], i_pointB[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
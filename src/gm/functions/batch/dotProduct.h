@@ -0,0 +1,95 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/dotProduct.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched DotProduct, evaluating \ref DotProduct over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/dotProduct.h>
+
+GM_NS_OPEN
+
+/// Batched DotProduct, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_lhs Input Vec2f(s), varying or uniform.
+/// \param i_rhs Input Vec2f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void DotProduct( const BatchInput< Vec2f >& i_lhs,
+                                       const BatchInput< Vec2f >& i_rhs,
+                                       size_t                     i_count,
+                                       float* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = DotProduct( i_lhs[ index ], i_rhs[ index ] );
+    }
+}
+
+/// Batched DotProduct, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_lhs Input Vec3f(s), varying or uniform.
+/// \param i_rhs Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void DotProduct( const BatchInput< Vec3f >& i_lhs,
+                                       const BatchInput< Vec3f >& i_rhs,
+                                       size_t                     i_count,
+                                       float* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = DotProduct( i_lhs[ index ], i_rhs[ index ] );
+    }
+}
+
+/// Batched DotProduct, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_lhs Input Vec4f(s), varying or uniform.
+/// \param i_rhs Input Vec4f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void DotProduct( const BatchInput< Vec4f >& i_lhs,
+                                       const BatchInput< Vec4f >& i_rhs,
+                                       size_t                     i_count,
+                                       float* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = DotProduct( i_lhs[ index ], i_rhs[ index ] );
+    }
+}
+
+/// Batched DotProduct, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_lhs Input Quatf(s), varying or uniform.
+/// \param i_rhs Input Quatf(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void DotProduct( const BatchInput< Quatf >& i_lhs,
+                                       const BatchInput< Quatf >& i_rhs,
+                                       size_t                     i_count,
+                                       float* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = DotProduct( i_lhs[ index ], i_rhs[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,77 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/faceForward.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched FaceForward, evaluating \ref FaceForward over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/faceForward.h>
+
+GM_NS_OPEN
+
+/// Batched FaceForward, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_normal Input Vec2f(s), varying or uniform.
+/// \param i_guide Input Vec2f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec2f(s).
+GM_HOST_DEVICE inline void FaceForward( const BatchInput< Vec2f >& i_normal,
+                                        const BatchInput< Vec2f >& i_guide,
+                                        size_t                     i_count,
+                                        Vec2f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = FaceForward( i_normal[ index ], i_guide[ index ] );
+    }
+}
+
+/// Batched FaceForward, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_normal Input Vec3f(s), varying or uniform.
+/// \param i_guide Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3f(s).
+GM_HOST_DEVICE inline void FaceForward( const BatchInput< Vec3f >& i_normal,
+                                        const BatchInput< Vec3f >& i_guide,
+                                        size_t                     i_count,
+                                        Vec3f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = FaceForward( i_normal[ index ], i_guide[ index ] );
+    }
+}
+
+/// Batched FaceForward, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_normal Input Vec4f(s), varying or uniform.
+/// \param i_guide Input Vec4f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec4f(s).
+GM_HOST_DEVICE inline void FaceForward( const BatchInput< Vec4f >& i_normal,
+                                        const BatchInput< Vec4f >& i_guide,
+                                        size_t                     i_count,
+                                        Vec4f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = FaceForward( i_normal[ index ], i_guide[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,107 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/floor.h
+/// \ingroup gm_functions_basic
+///
+/// Batched Floor, evaluating \ref Floor over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/floor.h>
+
+GM_NS_OPEN
+
+/// Batched Floor, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_value Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void Floor( const BatchInput< float >& i_value, size_t i_count, float* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Floor( i_value[ index ] );
+    }
+}
+
+/// Batched Floor, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_value Input Vec2f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec2f(s).
+GM_HOST_DEVICE inline void Floor( const BatchInput< Vec2f >& i_value, size_t i_count, Vec2f* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Floor( i_value[ index ] );
+    }
+}
+
+/// Batched Floor, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_value Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3f(s).
+GM_HOST_DEVICE inline void Floor( const BatchInput< Vec3f >& i_value, size_t i_count, Vec3f* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Floor( i_value[ index ] );
+    }
+}
+
+/// Batched Floor, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_value Input Vec4f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec4f(s).
+GM_HOST_DEVICE inline void Floor( const BatchInput< Vec4f >& i_value, size_t i_count, Vec4f* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Floor( i_value[ index ] );
+    }
+}
+
+/// Batched Floor, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_value Input Mat3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat3f(s).
+GM_HOST_DEVICE inline void Floor( const BatchInput< Mat3f >& i_value, size_t i_count, Mat3f* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Floor( i_value[ index ] );
+    }
+}
+
+/// Batched Floor, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_value Input Mat4f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat4f(s).
+GM_HOST_DEVICE inline void Floor( const BatchInput< Mat4f >& i_value, size_t i_count, Mat4f* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Floor( i_value[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,167 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/intersection.h
+/// \ingroup gm_functions_basic
+///
+/// Batched Intersection, evaluating \ref Intersection over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/intersection.h>
+
+GM_NS_OPEN
+
+/// Batched Intersection, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_lhs Input FloatRange(s), varying or uniform.
+/// \param i_rhs Input FloatRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned FloatRange(s).
+GM_HOST_DEVICE inline void Intersection( const BatchInput< FloatRange >& i_lhs,
+                                         const BatchInput< FloatRange >& i_rhs,
+                                         size_t                          i_count,
+                                         FloatRange* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Intersection( i_lhs[ index ], i_rhs[ index ] );
+    }
+}
+
+/// Batched Intersection, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_lhs Input IntRange(s), varying or uniform.
+/// \param i_rhs Input IntRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned IntRange(s).
+GM_HOST_DEVICE inline void Intersection( const BatchInput< IntRange >& i_lhs,
+                                         const BatchInput< IntRange >& i_rhs,
+                                         size_t                        i_count,
+                                         IntRange* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Intersection( i_lhs[ index ], i_rhs[ index ] );
+    }
+}
+
+/// Batched Intersection, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_lhs Input Vec2fRange(s), varying or uniform.
+/// \param i_rhs Input Vec2fRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec2fRange(s).
+GM_HOST_DEVICE inline void Intersection( const BatchInput< Vec2fRange >& i_lhs,
+                                         const BatchInput< Vec2fRange >& i_rhs,
+                                         size_t                          i_count,
+                                         Vec2fRange* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Intersection( i_lhs[ index ], i_rhs[ index ] );
+    }
+}
+
+/// Batched Intersection, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_lhs Input Vec3fRange(s), varying or uniform.
+/// \param i_rhs Input Vec3fRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3fRange(s).
+GM_HOST_DEVICE inline void Intersection( const BatchInput< Vec3fRange >& i_lhs,
+                                         const BatchInput< Vec3fRange >& i_rhs,
+                                         size_t                          i_count,
+                                         Vec3fRange* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Intersection( i_lhs[ index ], i_rhs[ index ] );
+    }
+}
+
+/// Batched Intersection, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_lhs Input Vec4fRange(s), varying or uniform.
+/// \param i_rhs Input Vec4fRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec4fRange(s).
+GM_HOST_DEVICE inline void Intersection( const BatchInput< Vec4fRange >& i_lhs,
+                                         const BatchInput< Vec4fRange >& i_rhs,
+                                         size_t                          i_count,
+                                         Vec4fRange* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Intersection( i_lhs[ index ], i_rhs[ index ] );
+    }
+}
+
+/// Batched Intersection, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_lhs Input Vec2iRange(s), varying or uniform.
+/// \param i_rhs Input Vec2iRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec2iRange(s).
+GM_HOST_DEVICE inline void Intersection( const BatchInput< Vec2iRange >& i_lhs,
+                                         const BatchInput< Vec2iRange >& i_rhs,
+                                         size_t                          i_count,
+                                         Vec2iRange* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Intersection( i_lhs[ index ], i_rhs[ index ] );
+    }
+}
+
+/// Batched Intersection, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_lhs Input Vec3iRange(s), varying or uniform.
+/// \param i_rhs Input Vec3iRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3iRange(s).
+GM_HOST_DEVICE inline void Intersection( const BatchInput< Vec3iRange >& i_lhs,
+                                         const BatchInput< Vec3iRange >& i_rhs,
+                                         size_t                          i_count,
+                                         Vec3iRange* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Intersection( i_lhs[ index ], i_rhs[ index ] );
+    }
+}
+
+/// Batched Intersection, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_lhs Input Vec4iRange(s), varying or uniform.
+/// \param i_rhs Input Vec4iRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec4iRange(s).
+GM_HOST_DEVICE inline void Intersection( const BatchInput< Vec4iRange >& i_lhs,
+                                         const BatchInput< Vec4iRange >& i_rhs,
+                                         size_t                          i_count,
+                                         Vec4iRange* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Intersection( i_lhs[ index ], i_rhs[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
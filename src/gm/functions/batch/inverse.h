@@ -0,0 +1,55 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/inverse.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched Inverse, evaluating \ref Inverse over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/inverse.h>
+
+GM_NS_OPEN
+
+/// Batched Inverse, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_matrix Input Mat3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_inverse Array of \p i_count output Mat3f(s).
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void
+Inverse( const BatchInput< Mat3f >& i_matrix, size_t i_count, Mat3f* GM_RESTRICT o_inverse, bool* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Inverse( i_matrix[ index ], o_inverse[ index ] );
+    }
+}
+
+/// Batched Inverse, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_matrix Input Mat4f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_inverse Array of \p i_count output Mat4f(s).
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void
+Inverse( const BatchInput< Mat4f >& i_matrix, size_t i_count, Mat4f* GM_RESTRICT o_inverse, bool* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Inverse( i_matrix[ index ], o_inverse[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,38 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/inverseRigid.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched InverseRigid, evaluating \ref InverseRigid over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/inverseRigid.h>
+
+GM_NS_OPEN
+
+/// Batched InverseRigid, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_matrix Input Mat4f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat4f(s).
+GM_HOST_DEVICE inline void
+InverseRigid( const BatchInput< Mat4f >& i_matrix, size_t i_count, Mat4f* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = InverseRigid( i_matrix[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
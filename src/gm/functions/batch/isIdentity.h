@@ -0,0 +1,51 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/isIdentity.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched IsIdentity, evaluating \ref IsIdentity over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/isIdentity.h>
+
+GM_NS_OPEN
+
+/// Batched IsIdentity, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_matrix Input Mat3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void IsIdentity( const BatchInput< Mat3f >& i_matrix, size_t i_count, bool* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = IsIdentity( i_matrix[ index ] );
+    }
+}
+
+/// Batched IsIdentity, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_matrix Input Mat4f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void IsIdentity( const BatchInput< Mat4f >& i_matrix, size_t i_count, bool* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = IsIdentity( i_matrix[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
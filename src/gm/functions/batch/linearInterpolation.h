@@ -0,0 +1,223 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/linearInterpolation.h
+/// \ingroup gm_functions_basic
+///
+/// Batched LinearInterpolation, evaluating \ref LinearInterpolation over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/linearInterpolation.h>
+
+GM_NS_OPEN
+
+/// Batched LinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_source Input float(s), varying or uniform.
+/// \param i_target Input float(s), varying or uniform.
+/// \param i_weight Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void LinearInterpolation( const BatchInput< float >& i_source,
+                                                const BatchInput< float >& i_target,
+                                                const BatchInput< float >& i_weight,
+                                                size_t                     i_count,
+                                                float* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearInterpolation( i_source[ index ], i_target[ index ], i_weight[ index ] );
+    }
+}
+
+/// Batched LinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_source Input Mat3f(s), varying or uniform.
+/// \param i_target Input Mat3f(s), varying or uniform.
+/// \param i_weight Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat3f(s).
+GM_HOST_DEVICE inline void LinearInterpolation( const BatchInput< Mat3f >& i_source,
+                                                const BatchInput< Mat3f >& i_target,
+                                                const BatchInput< float >& i_weight,
+                                                size_t                     i_count,
+                                                Mat3f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearInterpolation( i_source[ index ], i_target[ index ], i_weight[ index ] );
+    }
+}
+
+/// Batched LinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_source Input Mat4f(s), varying or uniform.
+/// \param i_target Input Mat4f(s), varying or uniform.
+/// \param i_weight Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat4f(s).
+GM_HOST_DEVICE inline void LinearInterpolation( const BatchInput< Mat4f >& i_source,
+                                                const BatchInput< Mat4f >& i_target,
+                                                const BatchInput< float >& i_weight,
+                                                size_t                     i_count,
+                                                Mat4f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearInterpolation( i_source[ index ], i_target[ index ], i_weight[ index ] );
+    }
+}
+
+/// Batched LinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_source Input Vec2f(s), varying or uniform.
+/// \param i_target Input Vec2f(s), varying or uniform.
+/// \param i_weight Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec2f(s).
+GM_HOST_DEVICE inline void LinearInterpolation( const BatchInput< Vec2f >& i_source,
+                                                const BatchInput< Vec2f >& i_target,
+                                                const BatchInput< float >& i_weight,
+                                                size_t                     i_count,
+                                                Vec2f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearInterpolation( i_source[ index ], i_target[ index ], i_weight[ index ] );
+    }
+}
+
+/// Batched LinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_source Input Vec3f(s), varying or uniform.
+/// \param i_target Input Vec3f(s), varying or uniform.
+/// \param i_weight Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3f(s).
+GM_HOST_DEVICE inline void LinearInterpolation( const BatchInput< Vec3f >& i_source,
+                                                const BatchInput< Vec3f >& i_target,
+                                                const BatchInput< float >& i_weight,
+                                                size_t                     i_count,
+                                                Vec3f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearInterpolation( i_source[ index ], i_target[ index ], i_weight[ index ] );
+    }
+}
+
+/// Batched LinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_source Input Vec4f(s), varying or uniform.
+/// \param i_target Input Vec4f(s), varying or uniform.
+/// \param i_weight Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec4f(s).
+GM_HOST_DEVICE inline void LinearInterpolation( const BatchInput< Vec4f >& i_source,
+                                                const BatchInput< Vec4f >& i_target,
+                                                const BatchInput< float >& i_weight,
+                                                size_t                     i_count,
+                                                Vec4f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearInterpolation( i_source[ index ], i_target[ index ], i_weight[ index ] );
+    }
+}
+
+/// Batched LinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_source Input Vec2fRange(s), varying or uniform.
+/// \param i_target Input Vec2fRange(s), varying or uniform.
+/// \param i_weight Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec2fRange(s).
+GM_HOST_DEVICE inline void LinearInterpolation( const BatchInput< Vec2fRange >& i_source,
+                                                const BatchInput< Vec2fRange >& i_target,
+                                                const BatchInput< float >&      i_weight,
+                                                size_t                          i_count,
+                                                Vec2fRange* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearInterpolation( i_source[ index ], i_target[ index ], i_weight[ index ] );
+    }
+}
+
+/// Batched LinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_source Input Vec3fRange(s), varying or uniform.
+/// \param i_target Input Vec3fRange(s), varying or uniform.
+/// \param i_weight Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3fRange(s).
+GM_HOST_DEVICE inline void LinearInterpolation( const BatchInput< Vec3fRange >& i_source,
+                                                const BatchInput< Vec3fRange >& i_target,
+                                                const BatchInput< float >&      i_weight,
+                                                size_t                          i_count,
+                                                Vec3fRange* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearInterpolation( i_source[ index ], i_target[ index ], i_weight[ index ] );
+    }
+}
+
+/// Batched LinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_source Input Vec4fRange(s), varying or uniform.
+/// \param i_target Input Vec4fRange(s), varying or uniform.
+/// \param i_weight Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec4fRange(s).
+GM_HOST_DEVICE inline void LinearInterpolation( const BatchInput< Vec4fRange >& i_source,
+                                                const BatchInput< Vec4fRange >& i_target,
+                                                const BatchInput< float >&      i_weight,
+                                                size_t                          i_count,
+                                                Vec4fRange* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearInterpolation( i_source[ index ], i_target[ index ], i_weight[ index ] );
+    }
+}
+
+/// Batched LinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_source Input FloatRange(s), varying or uniform.
+/// \param i_target Input FloatRange(s), varying or uniform.
+/// \param i_weight Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned FloatRange(s).
+GM_HOST_DEVICE inline void LinearInterpolation( const BatchInput< FloatRange >& i_source,
+                                                const BatchInput< FloatRange >& i_target,
+                                                const BatchInput< float >&      i_weight,
+                                                size_t                          i_count,
+                                                FloatRange* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearInterpolation( i_source[ index ], i_target[ index ], i_weight[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
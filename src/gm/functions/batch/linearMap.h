@@ -0,0 +1,143 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/linearMap.h
+/// \ingroup gm_functions_basic
+///
+/// Batched LinearMap, evaluating \ref LinearMap over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/linearMap.h>
+
+GM_NS_OPEN
+
+/// Batched LinearMap, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_sourceValue Input float(s), varying or uniform.
+/// \param i_sourceRange Input FloatRange(s), varying or uniform.
+/// \param i_targetRange Input FloatRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void LinearMap( const BatchInput< float >&      i_sourceValue,
+                                      const BatchInput< FloatRange >& i_sourceRange,
+                                      const BatchInput< FloatRange >& i_targetRange,
+                                      size_t                          i_count,
+                                      float* GM_RESTRICT              o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearMap( i_sourceValue[ index ], i_sourceRange[ index ], i_targetRange[ index ] );
+    }
+}
+
+/// Batched LinearMap, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_sourceValue Input Mat3f(s), varying or uniform.
+/// \param i_sourceRange Input FloatRange(s), varying or uniform.
+/// \param i_targetRange Input FloatRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat3f(s).
+GM_HOST_DEVICE inline void LinearMap( const BatchInput< Mat3f >&      i_sourceValue,
+                                      const BatchInput< FloatRange >& i_sourceRange,
+                                      const BatchInput< FloatRange >& i_targetRange,
+                                      size_t                          i_count,
+                                      Mat3f* GM_RESTRICT              o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearMap( i_sourceValue[ index ], i_sourceRange[ index ], i_targetRange[ index ] );
+    }
+}
+
+/// Batched LinearMap, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_sourceValue Input Mat4f(s), varying or uniform.
+/// \param i_sourceRange Input FloatRange(s), varying or uniform.
+/// \param i_targetRange Input FloatRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat4f(s).
+GM_HOST_DEVICE inline void LinearMap( const BatchInput< Mat4f >&      i_sourceValue,
+                                      const BatchInput< FloatRange >& i_sourceRange,
+                                      const BatchInput< FloatRange >& i_targetRange,
+                                      size_t                          i_count,
+                                      Mat4f* GM_RESTRICT              o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearMap( i_sourceValue[ index ], i_sourceRange[ index ], i_targetRange[ index ] );
+    }
+}
+
+/// Batched LinearMap, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_sourceValue Input Vec2f(s), varying or uniform.
+/// \param i_sourceRange Input FloatRange(s), varying or uniform.
+/// \param i_targetRange Input FloatRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec2f(s).
+GM_HOST_DEVICE inline void LinearMap( const BatchInput< Vec2f >&      i_sourceValue,
+                                      const BatchInput< FloatRange >& i_sourceRange,
+                                      const BatchInput< FloatRange >& i_targetRange,
+                                      size_t                          i_count,
+                                      Vec2f* GM_RESTRICT              o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearMap( i_sourceValue[ index ], i_sourceRange[ index ], i_targetRange[ index ] );
+    }
+}
+
+/// Batched LinearMap, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_sourceValue Input Vec3f(s), varying or uniform.
+/// \param i_sourceRange Input FloatRange(s), varying or uniform.
+/// \param i_targetRange Input FloatRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3f(s).
+GM_HOST_DEVICE inline void LinearMap( const BatchInput< Vec3f >&      i_sourceValue,
+                                      const BatchInput< FloatRange >& i_sourceRange,
+                                      const BatchInput< FloatRange >& i_targetRange,
+                                      size_t                          i_count,
+                                      Vec3f* GM_RESTRICT              o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearMap( i_sourceValue[ index ], i_sourceRange[ index ], i_targetRange[ index ] );
+    }
+}
+
+/// Batched LinearMap, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_sourceValue Input Vec4f(s), varying or uniform.
+/// \param i_sourceRange Input FloatRange(s), varying or uniform.
+/// \param i_targetRange Input FloatRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec4f(s).
+GM_HOST_DEVICE inline void LinearMap( const BatchInput< Vec4f >&      i_sourceValue,
+                                      const BatchInput< FloatRange >& i_sourceRange,
+                                      const BatchInput< FloatRange >& i_targetRange,
+                                      size_t                          i_count,
+                                      Vec4f* GM_RESTRICT              o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LinearMap( i_sourceValue[ index ], i_sourceRange[ index ], i_targetRange[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
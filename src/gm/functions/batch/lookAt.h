@@ -0,0 +1,43 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/lookAt.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched LookAt, evaluating \ref LookAt over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/lookAt.h>
+
+GM_NS_OPEN
+
+/// Batched LookAt, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_position Input Vec3f(s), varying or uniform.
+/// \param i_look Input Vec3f(s), varying or uniform.
+/// \param i_up Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat4f(s).
+GM_HOST_DEVICE inline void LookAt( const BatchInput< Vec3f >& i_position,
+                                   const BatchInput< Vec3f >& i_look,
+                                   const BatchInput< Vec3f >& i_up,
+                                   size_t                     i_count,
+                                   Mat4f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = LookAt( i_position[ index ], i_look[ index ], i_up[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,59 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/matrixProduct.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched MatrixProduct, evaluating \ref MatrixProduct over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/matrixProduct.h>
+
+GM_NS_OPEN
+
+/// Batched MatrixProduct, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_lhs Input Mat3f(s), varying or uniform.
+/// \param i_rhs Input Mat3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat3f(s).
+GM_HOST_DEVICE inline void MatrixProduct( const BatchInput< Mat3f >& i_lhs,
+                                          const BatchInput< Mat3f >& i_rhs,
+                                          size_t                     i_count,
+                                          Mat3f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = MatrixProduct( i_lhs[ index ], i_rhs[ index ] );
+    }
+}
+
+/// Batched MatrixProduct, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_lhs Input Mat4f(s), varying or uniform.
+/// \param i_rhs Input Mat4f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat4f(s).
+GM_HOST_DEVICE inline void MatrixProduct( const BatchInput< Mat4f >& i_lhs,
+                                          const BatchInput< Mat4f >& i_rhs,
+                                          size_t                     i_count,
+                                          Mat4f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = MatrixProduct( i_lhs[ index ], i_rhs[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
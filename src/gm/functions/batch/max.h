@@ -0,0 +1,219 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/max.h
+/// \ingroup gm_functions_basic
+///
+/// Batched Max, evaluating \ref Max over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/max.h>
+
+GM_NS_OPEN
+
+/// Batched Max, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_valueA Input float(s), varying or uniform.
+/// \param i_valueB Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void Max( const BatchInput< float >& i_valueA,
+                                const BatchInput< float >& i_valueB,
+                                size_t                     i_count,
+                                float* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Max( i_valueA[ index ], i_valueB[ index ] );
+    }
+}
+
+/// Batched Max, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_valueA Input int(s), varying or uniform.
+/// \param i_valueB Input int(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned int(s).
+GM_HOST_DEVICE inline void
+Max( const BatchInput< int >& i_valueA, const BatchInput< int >& i_valueB, size_t i_count, int* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Max( i_valueA[ index ], i_valueB[ index ] );
+    }
+}
+
+/// Batched Max, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_valueA Input bool(s), varying or uniform.
+/// \param i_valueB Input bool(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void Max( const BatchInput< bool >& i_valueA,
+                                const BatchInput< bool >& i_valueB,
+                                size_t                    i_count,
+                                bool* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Max( i_valueA[ index ], i_valueB[ index ] );
+    }
+}
+
+/// Batched Max, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_valueA Input Vec2f(s), varying or uniform.
+/// \param i_valueB Input Vec2f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec2f(s).
+GM_HOST_DEVICE inline void Max( const BatchInput< Vec2f >& i_valueA,
+                                const BatchInput< Vec2f >& i_valueB,
+                                size_t                     i_count,
+                                Vec2f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Max( i_valueA[ index ], i_valueB[ index ] );
+    }
+}
+
+/// Batched Max, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_valueA Input Vec3f(s), varying or uniform.
+/// \param i_valueB Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3f(s).
+GM_HOST_DEVICE inline void Max( const BatchInput< Vec3f >& i_valueA,
+                                const BatchInput< Vec3f >& i_valueB,
+                                size_t                     i_count,
+                                Vec3f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Max( i_valueA[ index ], i_valueB[ index ] );
+    }
+}
+
+/// Batched Max, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_valueA Input Vec4f(s), varying or uniform.
+/// \param i_valueB Input Vec4f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec4f(s).
+GM_HOST_DEVICE inline void Max( const BatchInput< Vec4f >& i_valueA,
+                                const BatchInput< Vec4f >& i_valueB,
+                                size_t                     i_count,
+                                Vec4f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Max( i_valueA[ index ], i_valueB[ index ] );
+    }
+}
+
+/// Batched Max, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_valueA Input Vec2i(s), varying or uniform.
+/// \param i_valueB Input Vec2i(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec2i(s).
+GM_HOST_DEVICE inline void Max( const BatchInput< Vec2i >& i_valueA,
+                                const BatchInput< Vec2i >& i_valueB,
+                                size_t                     i_count,
+                                Vec2i* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Max( i_valueA[ index ], i_valueB[ index ] );
+    }
+}
+
+/// Batched Max, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_valueA Input Vec3i(s), varying or uniform.
+/// \param i_valueB Input Vec3i(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3i(s).
+GM_HOST_DEVICE inline void Max( const BatchInput< Vec3i >& i_valueA,
+                                const BatchInput< Vec3i >& i_valueB,
+                                size_t                     i_count,
+                                Vec3i* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Max( i_valueA[ index ], i_valueB[ index ] );
+    }
+}
+
+/// Batched Max, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_valueA Input Vec4i(s), varying or uniform.
+/// \param i_valueB Input Vec4i(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec4i(s).
+GM_HOST_DEVICE inline void Max( const BatchInput< Vec4i >& i_valueA,
+                                const BatchInput< Vec4i >& i_valueB,
+                                size_t                     i_count,
+                                Vec4i* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Max( i_valueA[ index ], i_valueB[ index ] );
+    }
+}
+
+/// Batched Max, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_valueA Input Mat3f(s), varying or uniform.
+/// \param i_valueB Input Mat3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat3f(s).
+GM_HOST_DEVICE inline void Max( const BatchInput< Mat3f >& i_valueA,
+                                const BatchInput< Mat3f >& i_valueB,
+                                size_t                     i_count,
+                                Mat3f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Max( i_valueA[ index ], i_valueB[ index ] );
+    }
+}
+
+/// Batched Max, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_valueA Input Mat4f(s), varying or uniform.
+/// \param i_valueB Input Mat4f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat4f(s).
+GM_HOST_DEVICE inline void Max( const BatchInput< Mat4f >& i_valueA,
+                                const BatchInput< Mat4f >& i_valueB,
+                                size_t                     i_count,
+                                Mat4f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Max( i_valueA[ index ], i_valueB[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
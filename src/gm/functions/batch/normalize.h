@@ -0,0 +1,79 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/normalize.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched Normalize, evaluating \ref Normalize over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/normalize.h>
+
+GM_NS_OPEN
+
+/// Batched Normalize, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vector Input Vec2f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec2f(s).
+GM_HOST_DEVICE inline void Normalize( const BatchInput< Vec2f >& i_vector, size_t i_count, Vec2f* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Normalize( i_vector[ index ] );
+    }
+}
+
+/// Batched Normalize, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vector Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3f(s).
+GM_HOST_DEVICE inline void Normalize( const BatchInput< Vec3f >& i_vector, size_t i_count, Vec3f* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Normalize( i_vector[ index ] );
+    }
+}
+
+/// Batched Normalize, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vector Input Vec4f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec4f(s).
+GM_HOST_DEVICE inline void Normalize( const BatchInput< Vec4f >& i_vector, size_t i_count, Vec4f* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Normalize( i_vector[ index ] );
+    }
+}
+
+/// Batched Normalize, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vector Input Quatf(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Quatf(s).
+GM_HOST_DEVICE inline void Normalize( const BatchInput< Quatf >& i_vector, size_t i_count, Quatf* GM_RESTRICT o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = Normalize( i_vector[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
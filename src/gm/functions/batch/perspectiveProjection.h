@@ -0,0 +1,77 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/perspectiveProjection.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched PerspectiveProjection, evaluating \ref PerspectiveProjection over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/perspectiveProjection.h>
+
+GM_NS_OPEN
+
+/// Batched PerspectiveProjection, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_left Input float(s), varying or uniform.
+/// \param i_right Input float(s), varying or uniform.
+/// \param i_bottom Input float(s), varying or uniform.
+/// \param i_top Input float(s), varying or uniform.
+/// \param i_near Input float(s), varying or uniform.
+/// \param i_far Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat4f(s).
+GM_HOST_DEVICE inline void PerspectiveProjection( const BatchInput< float >& i_left,
+                                                  const BatchInput< float >& i_right,
+                                                  const BatchInput< float >& i_bottom,
+                                                  const BatchInput< float >& i_top,
+                                                  const BatchInput< float >& i_near,
+                                                  const BatchInput< float >& i_far,
+                                                  size_t                     i_count,
+                                                  Mat4f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = PerspectiveProjection( i_left[ index ],
+                                                   i_right[ index ],
+                                                   i_bottom[ index ],
+                                                   i_top[ index ],
+                                                   i_near[ index ],
+                                                   i_far[ index ] );
+    }
+}
+
+/// Batched PerspectiveProjection, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_fieldOfView Input float(s), varying or uniform.
+/// \param i_aspectRatio Input float(s), varying or uniform.
+/// \param i_near Input float(s), varying or uniform.
+/// \param i_far Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat4f(s).
+GM_HOST_DEVICE inline void PerspectiveProjection( const BatchInput< float >& i_fieldOfView,
+                                                  const BatchInput< float >& i_aspectRatio,
+                                                  const BatchInput< float >& i_near,
+                                                  const BatchInput< float >& i_far,
+                                                  size_t                     i_count,
+                                                  Mat4f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] =
+            PerspectiveProjection( i_fieldOfView[ index ], i_aspectRatio[ index ], i_near[ index ], i_far[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
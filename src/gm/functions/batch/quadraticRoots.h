@@ -0,0 +1,45 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/quadraticRoots.h
+/// \ingroup gm_functions_basic
+///
+/// Batched QuadraticRoots, evaluating \ref QuadraticRoots over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/quadraticRoots.h>
+
+GM_NS_OPEN
+
+/// Batched QuadraticRoots, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_a Input float(s), varying or uniform.
+/// \param i_b Input float(s), varying or uniform.
+/// \param i_c Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_roots Array of \p i_count output Vec2f(s).
+/// \param o_result Array of \p i_count returned int(s).
+GM_HOST_DEVICE inline void QuadraticRoots( const BatchInput< float >& i_a,
+                                           const BatchInput< float >& i_b,
+                                           const BatchInput< float >& i_c,
+                                           size_t                     i_count,
+                                           Vec2f* GM_RESTRICT         o_roots,
+                                           int* GM_RESTRICT           o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = QuadraticRoots( i_a[ index ], i_b[ index ], i_c[ index ], o_roots[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,41 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/quaternionProduct.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched QuaternionProduct, evaluating \ref QuaternionProduct over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/quaternionProduct.h>
+
+GM_NS_OPEN
+
+/// Batched QuaternionProduct, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_lhs Input Quatf(s), varying or uniform.
+/// \param i_rhs Input Quatf(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Quatf(s).
+GM_HOST_DEVICE inline void QuaternionProduct( const BatchInput< Quatf >& i_lhs,
+                                              const BatchInput< Quatf >& i_rhs,
+                                              size_t                     i_count,
+                                              Quatf* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = QuaternionProduct( i_lhs[ index ], i_rhs[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
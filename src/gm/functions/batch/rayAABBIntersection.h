@@ -0,0 +1,118 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/rayAABBIntersection.h
+/// \ingroup gm_functions_rayTracing
+///
+/// Batched RayAABBIntersection, evaluating \ref RayAABBIntersection over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/rayAABBIntersection.h>
+
+GM_NS_OPEN
+
+/// Batched RayAABBIntersection, over \p i_count elements.
+/// \ingroup gm_functions_rayTracing
+///
+/// \param i_rayOrigin Input Vec2f(s), varying or uniform.
+/// \param i_rayDirection Input Vec2f(s), varying or uniform.
+/// \param i_aabb Input Vec2fRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_intersections Array of \p i_count output FloatRange(s).
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void RayAABBIntersection( const BatchInput< Vec2f >&      i_rayOrigin,
+                                                const BatchInput< Vec2f >&      i_rayDirection,
+                                                const BatchInput< Vec2fRange >& i_aabb,
+                                                size_t                          i_count,
+                                                FloatRange* GM_RESTRICT         o_intersections,
+                                                bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = RayAABBIntersection( i_rayOrigin[ index ],
+                                                 i_rayDirection[ index ],
+                                                 i_aabb[ index ],
+                                                 o_intersections[ index ] );
+    }
+}
+
+/// Batched RayAABBIntersection, over \p i_count elements.
+/// \ingroup gm_functions_rayTracing
+///
+/// \param i_rayOrigin Input Vec3f(s), varying or uniform.
+/// \param i_rayDirection Input Vec3f(s), varying or uniform.
+/// \param i_aabb Input Vec3fRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_intersections Array of \p i_count output FloatRange(s).
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void RayAABBIntersection( const BatchInput< Vec3f >&      i_rayOrigin,
+                                                const BatchInput< Vec3f >&      i_rayDirection,
+                                                const BatchInput< Vec3fRange >& i_aabb,
+                                                size_t                          i_count,
+                                                FloatRange* GM_RESTRICT         o_intersections,
+                                                bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = RayAABBIntersection( i_rayOrigin[ index ],
+                                                 i_rayDirection[ index ],
+                                                 i_aabb[ index ],
+                                                 o_intersections[ index ] );
+    }
+}
+
+/// Batched RayAABBIntersection, over \p i_count elements.
+/// \ingroup gm_functions_rayTracing
+///
+/// \param i_rayOrigin Input Vec4f(s), varying or uniform.
+/// \param i_rayDirection Input Vec4f(s), varying or uniform.
+/// \param i_aabb Input Vec4fRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_intersections Array of \p i_count output FloatRange(s).
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void RayAABBIntersection( const BatchInput< Vec4f >&      i_rayOrigin,
+                                                const BatchInput< Vec4f >&      i_rayDirection,
+                                                const BatchInput< Vec4fRange >& i_aabb,
+                                                size_t                          i_count,
+                                                FloatRange* GM_RESTRICT         o_intersections,
+                                                bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = RayAABBIntersection( i_rayOrigin[ index ],
+                                                 i_rayDirection[ index ],
+                                                 i_aabb[ index ],
+                                                 o_intersections[ index ] );
+    }
+}
+
+/// Batched RayAABBIntersection, over \p i_count elements.
+/// \ingroup gm_functions_rayTracing
+///
+/// \param i_ray Input Ray(s), varying or uniform.
+/// \param i_aabb Input Vec3fRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_intersections Array of \p i_count output FloatRange(s).
+/// \param o_result Array of \p i_count returned bool(s).
+GM_HOST_DEVICE inline void RayAABBIntersection( const BatchInput< Ray >&        i_ray,
+                                                const BatchInput< Vec3fRange >& i_aabb,
+                                                size_t                          i_count,
+                                                FloatRange* GM_RESTRICT         o_intersections,
+                                                bool* GM_RESTRICT               o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = RayAABBIntersection( i_ray[ index ], i_aabb[ index ], o_intersections[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,63 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/rayPosition.h
+/// \ingroup gm_functions_rayTracing
+///
+/// Batched RayPosition, evaluating \ref RayPosition over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/rayPosition.h>
+
+GM_NS_OPEN
+
+/// Batched RayPosition, over \p i_count elements.
+/// \ingroup gm_functions_rayTracing
+///
+/// \param i_origin Input Vec2f(s), varying or uniform.
+/// \param i_direction Input Vec2f(s), varying or uniform.
+/// \param i_magnitude Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec2f(s).
+GM_HOST_DEVICE inline void RayPosition( const BatchInput< Vec2f >& i_origin,
+                                        const BatchInput< Vec2f >& i_direction,
+                                        const BatchInput< float >& i_magnitude,
+                                        size_t                     i_count,
+                                        Vec2f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = RayPosition( i_origin[ index ], i_direction[ index ], i_magnitude[ index ] );
+    }
+}
+
+/// Batched RayPosition, over \p i_count elements.
+/// \ingroup gm_functions_rayTracing
+///
+/// \param i_origin Input Vec3f(s), varying or uniform.
+/// \param i_direction Input Vec3f(s), varying or uniform.
+/// \param i_magnitude Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3f(s).
+GM_HOST_DEVICE inline void RayPosition( const BatchInput< Vec3f >& i_origin,
+                                        const BatchInput< Vec3f >& i_direction,
+                                        const BatchInput< float >& i_magnitude,
+                                        size_t                     i_count,
+                                        Vec3f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = RayPosition( i_origin[ index ], i_direction[ index ], i_magnitude[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,51 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/raySphereIntersection.h
+/// \ingroup gm_functions_rayTracing
+///
+/// Batched RaySphereIntersection, evaluating \ref RaySphereIntersection over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/raySphereIntersection.h>
+
+GM_NS_OPEN
+
+/// Batched RaySphereIntersection, over \p i_count elements.
+/// \ingroup gm_functions_rayTracing
+///
+/// \param i_sphereOrigin Input Vec3f(s), varying or uniform.
+/// \param i_sphereRadius Input float(s), varying or uniform.
+/// \param i_rayOrigin Input Vec3f(s), varying or uniform.
+/// \param i_rayDirection Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_intersections Array of \p i_count output FloatRange(s).
+/// \param o_result Array of \p i_count returned int(s).
+GM_HOST_DEVICE inline void RaySphereIntersection( const BatchInput< Vec3f >& i_sphereOrigin,
+                                                  const BatchInput< float >& i_sphereRadius,
+                                                  const BatchInput< Vec3f >& i_rayOrigin,
+                                                  const BatchInput< Vec3f >& i_rayDirection,
+                                                  size_t                     i_count,
+                                                  FloatRange* GM_RESTRICT    o_intersections,
+                                                  int* GM_RESTRICT           o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = RaySphereIntersection( i_sphereOrigin[ index ],
+                                                   i_sphereRadius[ index ],
+                                                   i_rayOrigin[ index ],
+                                                   i_rayDirection[ index ],
+                                                   o_intersections[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,89 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/setRotate.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched SetRotate, evaluating \ref SetRotate over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/setRotate.h>
+
+GM_NS_OPEN
+
+/// Batched SetRotate, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_angle Input float(s), varying or uniform.
+/// \param i_axis Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_matrix Array of \p i_count output Mat4f(s).
+GM_HOST_DEVICE inline void SetRotate( const BatchInput< float >& i_angle,
+                                      const BatchInput< Vec3f >& i_axis,
+                                      size_t                     i_count,
+                                      Mat4f* GM_RESTRICT         o_matrix )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        SetRotate( i_angle[ index ], i_axis[ index ], o_matrix[ index ] );
+    }
+}
+
+/// Batched SetRotate, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_angle Input float(s), varying or uniform.
+/// \param i_axis Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_quaternion Array of \p i_count output Quatf(s).
+GM_HOST_DEVICE inline void SetRotate( const BatchInput< float >& i_angle,
+                                      const BatchInput< Vec3f >& i_axis,
+                                      size_t                     i_count,
+                                      Quatf* GM_RESTRICT         o_quaternion )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        SetRotate( i_angle[ index ], i_axis[ index ], o_quaternion[ index ] );
+    }
+}
+
+/// Batched SetRotate, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_quaternion Input Quatf(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_matrix Array of \p i_count output Mat3f(s).
+GM_HOST_DEVICE inline void
+SetRotate( const BatchInput< Quatf >& i_quaternion, size_t i_count, Mat3f* GM_RESTRICT o_matrix )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        SetRotate( i_quaternion[ index ], o_matrix[ index ] );
+    }
+}
+
+/// Batched SetRotate, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_quaternion Input Quatf(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_matrix Array of \p i_count output Mat4f(s).
+GM_HOST_DEVICE inline void
+SetRotate( const BatchInput< Quatf >& i_quaternion, size_t i_count, Mat4f* GM_RESTRICT o_matrix )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        SetRotate( i_quaternion[ index ], o_matrix[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,37 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/setRotateX.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched SetRotateX, evaluating \ref SetRotateX over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/setRotateX.h>
+
+GM_NS_OPEN
+
+/// Batched SetRotateX, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_angle Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_matrix Array of \p i_count output Mat4f(s).
+GM_HOST_DEVICE inline void SetRotateX( const BatchInput< float >& i_angle, size_t i_count, Mat4f* GM_RESTRICT o_matrix )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        SetRotateX( i_angle[ index ], o_matrix[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,44 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/sphericalLinearInterpolation.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched SphericalLinearInterpolation, evaluating \ref SphericalLinearInterpolation over contiguous arrays of
+/// elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/sphericalLinearInterpolation.h>
+
+GM_NS_OPEN
+
+/// Batched SphericalLinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_source Input Quatf(s), varying or uniform.
+/// \param i_target Input Quatf(s), varying or uniform.
+/// \param i_weight Input float(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Quatf(s).
+GM_HOST_DEVICE inline void SphericalLinearInterpolation( const BatchInput< Quatf >& i_source,
+                                                         const BatchInput< Quatf >& i_target,
+                                                         const BatchInput< float >& i_weight,
+                                                         size_t                     i_count,
+                                                         Quatf* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = SphericalLinearInterpolation( i_source[ index ], i_target[ index ], i_weight[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
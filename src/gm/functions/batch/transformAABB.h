@@ -0,0 +1,41 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/transformAABB.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched TransformAABB, evaluating \ref TransformAABB over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/transformAABB.h>
+
+GM_NS_OPEN
+
+/// Batched TransformAABB, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_matrix Input Mat4f(s), varying or uniform.
+/// \param i_aabb Input Vec3fRange(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3fRange(s).
+GM_HOST_DEVICE inline void TransformAABB( const BatchInput< Mat4f >&      i_matrix,
+                                          const BatchInput< Vec3fRange >& i_aabb,
+                                          size_t                          i_count,
+                                          Vec3fRange* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = TransformAABB( i_matrix[ index ], i_aabb[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,59 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/transformPoint.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched TransformPoint, evaluating \ref TransformPoint over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/transformPoint.h>
+
+GM_NS_OPEN
+
+/// Batched TransformPoint, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_matrix Input Mat4f(s), varying or uniform.
+/// \param i_point Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3f(s).
+GM_HOST_DEVICE inline void TransformPoint( const BatchInput< Mat4f >& i_matrix,
+                                           const BatchInput< Vec3f >& i_point,
+                                           size_t                     i_count,
+                                           Vec3f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = TransformPoint( i_matrix[ index ], i_point[ index ] );
+    }
+}
+
+/// Batched TransformPoint, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_matrix Input Mat4fA(s), varying or uniform.
+/// \param i_point Input Vec3fA(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3fA(s).
+GM_HOST_DEVICE inline void TransformPoint( const BatchInput< Mat4fA >& i_matrix,
+                                           const BatchInput< Vec3fA >& i_point,
+                                           size_t                      i_count,
+                                           Vec3fA* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = TransformPoint( i_matrix[ index ], i_point[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
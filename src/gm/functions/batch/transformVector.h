@@ -0,0 +1,77 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/transformVector.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched TransformVector, evaluating \ref TransformVector over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/transformVector.h>
+
+GM_NS_OPEN
+
+/// Batched TransformVector, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_matrix Input Mat3f(s), varying or uniform.
+/// \param i_vector Input Vec2f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec2f(s).
+GM_HOST_DEVICE inline void TransformVector( const BatchInput< Mat3f >& i_matrix,
+                                            const BatchInput< Vec2f >& i_vector,
+                                            size_t                     i_count,
+                                            Vec2f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = TransformVector( i_matrix[ index ], i_vector[ index ] );
+    }
+}
+
+/// Batched TransformVector, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_matrix Input Mat4f(s), varying or uniform.
+/// \param i_vector Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3f(s).
+GM_HOST_DEVICE inline void TransformVector( const BatchInput< Mat4f >& i_matrix,
+                                            const BatchInput< Vec3f >& i_vector,
+                                            size_t                     i_count,
+                                            Vec3f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = TransformVector( i_matrix[ index ], i_vector[ index ] );
+    }
+}
+
+/// Batched TransformVector, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_quaternion Input Quatf(s), varying or uniform.
+/// \param i_vector Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3f(s).
+GM_HOST_DEVICE inline void TransformVector( const BatchInput< Quatf >& i_quaternion,
+                                            const BatchInput< Vec3f >& i_vector,
+                                            size_t                     i_count,
+                                            Vec3f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = TransformVector( i_quaternion[ index ], i_vector[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
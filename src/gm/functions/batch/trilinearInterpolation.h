@@ -0,0 +1,263 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/trilinearInterpolation.h
+/// \ingroup gm_functions_basic
+///
+/// Batched TrilinearInterpolation, evaluating \ref TrilinearInterpolation over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/trilinearInterpolation.h>
+
+GM_NS_OPEN
+
+/// Batched TrilinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_corner000 Input float(s), varying or uniform.
+/// \param i_corner100 Input float(s), varying or uniform.
+/// \param i_corner010 Input float(s), varying or uniform.
+/// \param i_corner110 Input float(s), varying or uniform.
+/// \param i_corner001 Input float(s), varying or uniform.
+/// \param i_corner101 Input float(s), varying or uniform.
+/// \param i_corner011 Input float(s), varying or uniform.
+/// \param i_corner111 Input float(s), varying or uniform.
+/// \param i_weight Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned float(s).
+GM_HOST_DEVICE inline void TrilinearInterpolation( const BatchInput< float >& i_corner000,
+                                                   const BatchInput< float >& i_corner100,
+                                                   const BatchInput< float >& i_corner010,
+                                                   const BatchInput< float >& i_corner110,
+                                                   const BatchInput< float >& i_corner001,
+                                                   const BatchInput< float >& i_corner101,
+                                                   const BatchInput< float >& i_corner011,
+                                                   const BatchInput< float >& i_corner111,
+                                                   const BatchInput< Vec3f >& i_weight,
+                                                   size_t                     i_count,
+                                                   float* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = TrilinearInterpolation( i_corner000[ index ],
+                                                    i_corner100[ index ],
+                                                    i_corner010[ index ],
+                                                    i_corner110[ index ],
+                                                    i_corner001[ index ],
+                                                    i_corner101[ index ],
+                                                    i_corner011[ index ],
+                                                    i_corner111[ index ],
+                                                    i_weight[ index ] );
+    }
+}
+
+/// Batched TrilinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_corner000 Input Mat3f(s), varying or uniform.
+/// \param i_corner100 Input Mat3f(s), varying or uniform.
+/// \param i_corner010 Input Mat3f(s), varying or uniform.
+/// \param i_corner110 Input Mat3f(s), varying or uniform.
+/// \param i_corner001 Input Mat3f(s), varying or uniform.
+/// \param i_corner101 Input Mat3f(s), varying or uniform.
+/// \param i_corner011 Input Mat3f(s), varying or uniform.
+/// \param i_corner111 Input Mat3f(s), varying or uniform.
+/// \param i_weight Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat3f(s).
+GM_HOST_DEVICE inline void TrilinearInterpolation( const BatchInput< Mat3f >& i_corner000,
+                                                   const BatchInput< Mat3f >& i_corner100,
+                                                   const BatchInput< Mat3f >& i_corner010,
+                                                   const BatchInput< Mat3f >& i_corner110,
+                                                   const BatchInput< Mat3f >& i_corner001,
+                                                   const BatchInput< Mat3f >& i_corner101,
+                                                   const BatchInput< Mat3f >& i_corner011,
+                                                   const BatchInput< Mat3f >& i_corner111,
+                                                   const BatchInput< Vec3f >& i_weight,
+                                                   size_t                     i_count,
+                                                   Mat3f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = TrilinearInterpolation( i_corner000[ index ],
+                                                    i_corner100[ index ],
+                                                    i_corner010[ index ],
+                                                    i_corner110[ index ],
+                                                    i_corner001[ index ],
+                                                    i_corner101[ index ],
+                                                    i_corner011[ index ],
+                                                    i_corner111[ index ],
+                                                    i_weight[ index ] );
+    }
+}
+
+/// Batched TrilinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_corner000 Input Mat4f(s), varying or uniform.
+/// \param i_corner100 Input Mat4f(s), varying or uniform.
+/// \param i_corner010 Input Mat4f(s), varying or uniform.
+/// \param i_corner110 Input Mat4f(s), varying or uniform.
+/// \param i_corner001 Input Mat4f(s), varying or uniform.
+/// \param i_corner101 Input Mat4f(s), varying or uniform.
+/// \param i_corner011 Input Mat4f(s), varying or uniform.
+/// \param i_corner111 Input Mat4f(s), varying or uniform.
+/// \param i_weight Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat4f(s).
+GM_HOST_DEVICE inline void TrilinearInterpolation( const BatchInput< Mat4f >& i_corner000,
+                                                   const BatchInput< Mat4f >& i_corner100,
+                                                   const BatchInput< Mat4f >& i_corner010,
+                                                   const BatchInput< Mat4f >& i_corner110,
+                                                   const BatchInput< Mat4f >& i_corner001,
+                                                   const BatchInput< Mat4f >& i_corner101,
+                                                   const BatchInput< Mat4f >& i_corner011,
+                                                   const BatchInput< Mat4f >& i_corner111,
+                                                   const BatchInput< Vec3f >& i_weight,
+                                                   size_t                     i_count,
+                                                   Mat4f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = TrilinearInterpolation( i_corner000[ index ],
+                                                    i_corner100[ index ],
+                                                    i_corner010[ index ],
+                                                    i_corner110[ index ],
+                                                    i_corner001[ index ],
+                                                    i_corner101[ index ],
+                                                    i_corner011[ index ],
+                                                    i_corner111[ index ],
+                                                    i_weight[ index ] );
+    }
+}
+
+/// Batched TrilinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_corner000 Input Vec2f(s), varying or uniform.
+/// \param i_corner100 Input Vec2f(s), varying or uniform.
+/// \param i_corner010 Input Vec2f(s), varying or uniform.
+/// \param i_corner110 Input Vec2f(s), varying or uniform.
+/// \param i_corner001 Input Vec2f(s), varying or uniform.
+/// \param i_corner101 Input Vec2f(s), varying or uniform.
+/// \param i_corner011 Input Vec2f(s), varying or uniform.
+/// \param i_corner111 Input Vec2f(s), varying or uniform.
+/// \param i_weight Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec2f(s).
+GM_HOST_DEVICE inline void TrilinearInterpolation( const BatchInput< Vec2f >& i_corner000,
+                                                   const BatchInput< Vec2f >& i_corner100,
+                                                   const BatchInput< Vec2f >& i_corner010,
+                                                   const BatchInput< Vec2f >& i_corner110,
+                                                   const BatchInput< Vec2f >& i_corner001,
+                                                   const BatchInput< Vec2f >& i_corner101,
+                                                   const BatchInput< Vec2f >& i_corner011,
+                                                   const BatchInput< Vec2f >& i_corner111,
+                                                   const BatchInput< Vec3f >& i_weight,
+                                                   size_t                     i_count,
+                                                   Vec2f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = TrilinearInterpolation( i_corner000[ index ],
+                                                    i_corner100[ index ],
+                                                    i_corner010[ index ],
+                                                    i_corner110[ index ],
+                                                    i_corner001[ index ],
+                                                    i_corner101[ index ],
+                                                    i_corner011[ index ],
+                                                    i_corner111[ index ],
+                                                    i_weight[ index ] );
+    }
+}
+
+/// Batched TrilinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_corner000 Input Vec3f(s), varying or uniform.
+/// \param i_corner100 Input Vec3f(s), varying or uniform.
+/// \param i_corner010 Input Vec3f(s), varying or uniform.
+/// \param i_corner110 Input Vec3f(s), varying or uniform.
+/// \param i_corner001 Input Vec3f(s), varying or uniform.
+/// \param i_corner101 Input Vec3f(s), varying or uniform.
+/// \param i_corner011 Input Vec3f(s), varying or uniform.
+/// \param i_corner111 Input Vec3f(s), varying or uniform.
+/// \param i_weight Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec3f(s).
+GM_HOST_DEVICE inline void TrilinearInterpolation( const BatchInput< Vec3f >& i_corner000,
+                                                   const BatchInput< Vec3f >& i_corner100,
+                                                   const BatchInput< Vec3f >& i_corner010,
+                                                   const BatchInput< Vec3f >& i_corner110,
+                                                   const BatchInput< Vec3f >& i_corner001,
+                                                   const BatchInput< Vec3f >& i_corner101,
+                                                   const BatchInput< Vec3f >& i_corner011,
+                                                   const BatchInput< Vec3f >& i_corner111,
+                                                   const BatchInput< Vec3f >& i_weight,
+                                                   size_t                     i_count,
+                                                   Vec3f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = TrilinearInterpolation( i_corner000[ index ],
+                                                    i_corner100[ index ],
+                                                    i_corner010[ index ],
+                                                    i_corner110[ index ],
+                                                    i_corner001[ index ],
+                                                    i_corner101[ index ],
+                                                    i_corner011[ index ],
+                                                    i_corner111[ index ],
+                                                    i_weight[ index ] );
+    }
+}
+
+/// Batched TrilinearInterpolation, over \p i_count elements.
+/// \ingroup gm_functions_basic
+///
+/// \param i_corner000 Input Vec4f(s), varying or uniform.
+/// \param i_corner100 Input Vec4f(s), varying or uniform.
+/// \param i_corner010 Input Vec4f(s), varying or uniform.
+/// \param i_corner110 Input Vec4f(s), varying or uniform.
+/// \param i_corner001 Input Vec4f(s), varying or uniform.
+/// \param i_corner101 Input Vec4f(s), varying or uniform.
+/// \param i_corner011 Input Vec4f(s), varying or uniform.
+/// \param i_corner111 Input Vec4f(s), varying or uniform.
+/// \param i_weight Input Vec3f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Vec4f(s).
+GM_HOST_DEVICE inline void TrilinearInterpolation( const BatchInput< Vec4f >& i_corner000,
+                                                   const BatchInput< Vec4f >& i_corner100,
+                                                   const BatchInput< Vec4f >& i_corner010,
+                                                   const BatchInput< Vec4f >& i_corner110,
+                                                   const BatchInput< Vec4f >& i_corner001,
+                                                   const BatchInput< Vec4f >& i_corner101,
+                                                   const BatchInput< Vec4f >& i_corner011,
+                                                   const BatchInput< Vec4f >& i_corner111,
+                                                   const BatchInput< Vec3f >& i_weight,
+                                                   size_t                     i_count,
+                                                   Vec4f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = TrilinearInterpolation( i_corner000[ index ],
+                                                    i_corner100[ index ],
+                                                    i_corner010[ index ],
+                                                    i_corner110[ index ],
+                                                    i_corner001[ index ],
+                                                    i_corner101[ index ],
+                                                    i_corner011[ index ],
+                                                    i_corner111[ index ],
+                                                    i_weight[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
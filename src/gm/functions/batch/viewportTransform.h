@@ -0,0 +1,41 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/batch/viewportTransform.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Batched ViewportTransform, evaluating \ref ViewportTransform over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/viewportTransform.h>
+
+GM_NS_OPEN
+
+/// Batched ViewportTransform, over \p i_count elements.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_dimensions Input Vec2f(s), varying or uniform.
+/// \param i_offset Input Vec2f(s), varying or uniform.
+/// \param i_count The number of elements.
+/// \param o_result Array of \p i_count returned Mat4f(s).
+GM_HOST_DEVICE inline void ViewportTransform( const BatchInput< Vec2f >& i_dimensions,
+                                              const BatchInput< Vec2f >& i_offset,
+                                              size_t                     i_count,
+                                              Mat4f* GM_RESTRICT         o_result )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        o_result[ index ] = ViewportTransform( i_dimensions[ index ], i_offset[ index ] );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,162 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/approximateLength.h>
+#include <gm/functions/batch/approximateLength.h>
+#include <gm/functions/batch/length.h>
+#include <gm/functions/length.h>
+
+#include <cmath>
+#include <vector>
+
+TEST_CASE( "ApproximateLength_Vec2f" )
+{
+    gm::Vec2f vector( 1.0f, 2.0f );
+    BENCHMARK( "Length" )
+    {
+        return gm::Length( vector );
+    };
+    BENCHMARK( "ApproximateLength" )
+    {
+        return gm::ApproximateLength( vector );
+    };
+}
+
+TEST_CASE( "ApproximateLength_Batch_Vec2f" )
+{
+    const size_t             count = 4096;
+    std::vector< gm::Vec2f > vectors( count );
+    std::vector< float >     results( count );
+    for ( size_t index = 0; index < count; ++index )
+    {
+        vectors[ index ] = gm::Vec2f( std::sin( index * 1.0f ) + 2.0f, std::sin( index * 2.0f ) + 2.0f );
+    }
+
+    BENCHMARK( "Length_4096" )
+    {
+        gm::Length( vectors, count, results.data() );
+        return results[ count - 1 ];
+    };
+    BENCHMARK( "ApproximateLength_4096" )
+    {
+        gm::ApproximateLength( vectors, count, results.data() );
+        return results[ count - 1 ];
+    };
+}
+
+TEST_CASE( "ApproximateLength_Vec3f" )
+{
+    gm::Vec3f vector( 1.0f, 2.0f, 3.0f );
+    BENCHMARK( "Length" )
+    {
+        return gm::Length( vector );
+    };
+    BENCHMARK( "ApproximateLength" )
+    {
+        return gm::ApproximateLength( vector );
+    };
+}
+
+TEST_CASE( "ApproximateLength_Batch_Vec3f" )
+{
+    const size_t             count = 4096;
+    std::vector< gm::Vec3f > vectors( count );
+    std::vector< float >     results( count );
+    for ( size_t index = 0; index < count; ++index )
+    {
+        vectors[ index ] = gm::Vec3f( std::sin( index * 1.0f ) + 2.0f,
+                                      std::sin( index * 2.0f ) + 2.0f,
+                                      std::sin( index * 3.0f ) + 2.0f );
+    }
+
+    BENCHMARK( "Length_4096" )
+    {
+        gm::Length( vectors, count, results.data() );
+        return results[ count - 1 ];
+    };
+    BENCHMARK( "ApproximateLength_4096" )
+    {
+        gm::ApproximateLength( vectors, count, results.data() );
+        return results[ count - 1 ];
+    };
+}
+
+TEST_CASE( "ApproximateLength_Vec4f" )
+{
+    gm::Vec4f vector( 1.0f, 2.0f, 3.0f, 4.0f );
+    BENCHMARK( "Length" )
+    {
+        return gm::Length( vector );
+    };
+    BENCHMARK( "ApproximateLength" )
+    {
+        return gm::ApproximateLength( vector );
+    };
+}
+
+TEST_CASE( "ApproximateLength_Batch_Vec4f" )
+{
+    const size_t             count = 4096;
+    std::vector< gm::Vec4f > vectors( count );
+    std::vector< float >     results( count );
+    for ( size_t index = 0; index < count; ++index )
+    {
+        vectors[ index ] = gm::Vec4f( std::sin( index * 1.0f ) + 2.0f,
+                                      std::sin( index * 2.0f ) + 2.0f,
+                                      std::sin( index * 3.0f ) + 2.0f,
+                                      std::sin( index * 4.0f ) + 2.0f );
+    }
+
+    BENCHMARK( "Length_4096" )
+    {
+        gm::Length( vectors, count, results.data() );
+        return results[ count - 1 ];
+    };
+    BENCHMARK( "ApproximateLength_4096" )
+    {
+        gm::ApproximateLength( vectors, count, results.data() );
+        return results[ count - 1 ];
+    };
+}
+
+TEST_CASE( "ApproximateLength_Quatf" )
+{
+    gm::Quatf quaternion( 1.0f, 2.0f, 3.0f, 4.0f );
+    BENCHMARK( "Length" )
+    {
+        return gm::Length( quaternion );
+    };
+    BENCHMARK( "ApproximateLength" )
+    {
+        return gm::ApproximateLength( quaternion );
+    };
+}
+
+TEST_CASE( "ApproximateLength_Batch_Quatf" )
+{
+    const size_t             count = 4096;
+    std::vector< gm::Quatf > quaternions( count );
+    std::vector< float >     results( count );
+    for ( size_t index = 0; index < count; ++index )
+    {
+        quaternions[ index ] = gm::Quatf( std::sin( index * 1.0f ) + 2.0f,
+                                          std::sin( index * 2.0f ) + 2.0f,
+                                          std::sin( index * 3.0f ) + 2.0f,
+                                          std::sin( index * 4.0f ) + 2.0f );
+    }
+
+    BENCHMARK( "Length_4096" )
+    {
+        gm::Length( quaternions, count, results.data() );
+        return results[ count - 1 ];
+    };
+    BENCHMARK( "ApproximateLength_4096" )
+    {
+        gm::ApproximateLength( quaternions, count, results.data() );
+        return results[ count - 1 ];
+    };
+}
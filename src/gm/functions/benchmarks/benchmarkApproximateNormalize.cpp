@@ -0,0 +1,162 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/approximateNormalize.h>
+#include <gm/functions/batch/approximateNormalize.h>
+#include <gm/functions/batch/normalize.h>
+#include <gm/functions/normalize.h>
+
+#include <cmath>
+#include <vector>
+
+TEST_CASE( "ApproximateNormalize_Vec2f" )
+{
+    gm::Vec2f vector( 1.0f, 2.0f );
+    BENCHMARK( "Normalize" )
+    {
+        return gm::Normalize( vector );
+    };
+    BENCHMARK( "ApproximateNormalize" )
+    {
+        return gm::ApproximateNormalize( vector );
+    };
+}
+
+TEST_CASE( "ApproximateNormalize_Batch_Vec2f" )
+{
+    const size_t             count = 4096;
+    std::vector< gm::Vec2f > vectors( count );
+    std::vector< gm::Vec2f > results( count );
+    for ( size_t index = 0; index < count; ++index )
+    {
+        vectors[ index ] = gm::Vec2f( std::sin( index * 1.0f ) + 2.0f, std::sin( index * 2.0f ) + 2.0f );
+    }
+
+    BENCHMARK( "Normalize_4096" )
+    {
+        gm::Normalize( vectors, count, results.data() );
+        return results[ count - 1 ];
+    };
+    BENCHMARK( "ApproximateNormalize_4096" )
+    {
+        gm::ApproximateNormalize( vectors, count, results.data() );
+        return results[ count - 1 ];
+    };
+}
+
+TEST_CASE( "ApproximateNormalize_Vec3f" )
+{
+    gm::Vec3f vector( 1.0f, 2.0f, 3.0f );
+    BENCHMARK( "Normalize" )
+    {
+        return gm::Normalize( vector );
+    };
+    BENCHMARK( "ApproximateNormalize" )
+    {
+        return gm::ApproximateNormalize( vector );
+    };
+}
+
+TEST_CASE( "ApproximateNormalize_Batch_Vec3f" )
+{
+    const size_t             count = 4096;
+    std::vector< gm::Vec3f > vectors( count );
+    std::vector< gm::Vec3f > results( count );
+    for ( size_t index = 0; index < count; ++index )
+    {
+        vectors[ index ] = gm::Vec3f( std::sin( index * 1.0f ) + 2.0f,
+                                      std::sin( index * 2.0f ) + 2.0f,
+                                      std::sin( index * 3.0f ) + 2.0f );
+    }
+
+    BENCHMARK( "Normalize_4096" )
+    {
+        gm::Normalize( vectors, count, results.data() );
+        return results[ count - 1 ];
+    };
+    BENCHMARK( "ApproximateNormalize_4096" )
+    {
+        gm::ApproximateNormalize( vectors, count, results.data() );
+        return results[ count - 1 ];
+    };
+}
+
+TEST_CASE( "ApproximateNormalize_Vec4f" )
+{
+    gm::Vec4f vector( 1.0f, 2.0f, 3.0f, 4.0f );
+    BENCHMARK( "Normalize" )
+    {
+        return gm::Normalize( vector );
+    };
+    BENCHMARK( "ApproximateNormalize" )
+    {
+        return gm::ApproximateNormalize( vector );
+    };
+}
+
+TEST_CASE( "ApproximateNormalize_Batch_Vec4f" )
+{
+    const size_t             count = 4096;
+    std::vector< gm::Vec4f > vectors( count );
+    std::vector< gm::Vec4f > results( count );
+    for ( size_t index = 0; index < count; ++index )
+    {
+        vectors[ index ] = gm::Vec4f( std::sin( index * 1.0f ) + 2.0f,
+                                      std::sin( index * 2.0f ) + 2.0f,
+                                      std::sin( index * 3.0f ) + 2.0f,
+                                      std::sin( index * 4.0f ) + 2.0f );
+    }
+
+    BENCHMARK( "Normalize_4096" )
+    {
+        gm::Normalize( vectors, count, results.data() );
+        return results[ count - 1 ];
+    };
+    BENCHMARK( "ApproximateNormalize_4096" )
+    {
+        gm::ApproximateNormalize( vectors, count, results.data() );
+        return results[ count - 1 ];
+    };
+}
+
+TEST_CASE( "ApproximateNormalize_Quatf" )
+{
+    gm::Quatf quaternion( 1.0f, 2.0f, 3.0f, 4.0f );
+    BENCHMARK( "Normalize" )
+    {
+        return gm::Normalize( quaternion );
+    };
+    BENCHMARK( "ApproximateNormalize" )
+    {
+        return gm::ApproximateNormalize( quaternion );
+    };
+}
+
+TEST_CASE( "ApproximateNormalize_Batch_Quatf" )
+{
+    const size_t             count = 4096;
+    std::vector< gm::Quatf > quaternions( count );
+    std::vector< gm::Quatf > results( count );
+    for ( size_t index = 0; index < count; ++index )
+    {
+        quaternions[ index ] = gm::Quatf( std::sin( index * 1.0f ) + 2.0f,
+                                          std::sin( index * 2.0f ) + 2.0f,
+                                          std::sin( index * 3.0f ) + 2.0f,
+                                          std::sin( index * 4.0f ) + 2.0f );
+    }
+
+    BENCHMARK( "Normalize_4096" )
+    {
+        gm::Normalize( quaternions, count, results.data() );
+        return results[ count - 1 ];
+    };
+    BENCHMARK( "ApproximateNormalize_4096" )
+    {
+        gm::ApproximateNormalize( quaternions, count, results.data() );
+        return results[ count - 1 ];
+    };
+}
@@ -0,0 +1,17 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/approximateReciprocalSquareRoot.h>
+
+TEST_CASE( "ApproximateReciprocalSquareRoot_float" )
+{
+    float value;
+    BENCHMARK( "ApproximateReciprocalSquareRoot" )
+    {
+        return gm::ApproximateReciprocalSquareRoot( value );
+    };
+}
@@ -0,0 +1,43 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/approximateSetRotate.h>
+#include <gm/functions/setRotate.h>
+
+TEST_CASE( "ApproximateSetRotate_float_Vec3f_Mat4f" )
+{
+    gm::Mat4f rotation;
+    gm::Vec3f axis( 1, 2, 3 );
+    float     angle = 30.0f;
+    BENCHMARK( "SetRotate" )
+    {
+        gm::SetRotate( angle, axis, rotation );
+        return rotation;
+    };
+    BENCHMARK( "ApproximateSetRotate" )
+    {
+        gm::ApproximateSetRotate( angle, axis, rotation );
+        return rotation;
+    };
+}
+
+TEST_CASE( "ApproximateSetRotate_float_Vec3f_Quatf" )
+{
+    gm::Quatf rotation;
+    gm::Vec3f axis( 1, 2, 3 );
+    float     angle = 30.0f;
+    BENCHMARK( "SetRotate" )
+    {
+        gm::SetRotate( angle, axis, rotation );
+        return rotation;
+    };
+    BENCHMARK( "ApproximateSetRotate" )
+    {
+        gm::ApproximateSetRotate( angle, axis, rotation );
+        return rotation;
+    };
+}
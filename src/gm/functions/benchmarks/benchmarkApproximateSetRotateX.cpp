@@ -0,0 +1,25 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/approximateSetRotateX.h>
+#include <gm/functions/setRotateX.h>
+
+TEST_CASE( "ApproximateSetRotateX_float_Mat4f" )
+{
+    gm::Mat4f matrix = gm::Mat4f::Identity();
+    float     angle  = 30.0f;
+    BENCHMARK( "SetRotateX" )
+    {
+        gm::SetRotateX( angle, matrix );
+        return matrix;
+    };
+    BENCHMARK( "ApproximateSetRotateX" )
+    {
+        gm::ApproximateSetRotateX( angle, matrix );
+        return matrix;
+    };
+}
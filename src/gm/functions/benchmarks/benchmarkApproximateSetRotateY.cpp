@@ -0,0 +1,25 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/approximateSetRotateY.h>
+#include <gm/functions/setRotateY.h>
+
+TEST_CASE( "ApproximateSetRotateY_float_Mat4f" )
+{
+    gm::Mat4f matrix = gm::Mat4f::Identity();
+    float     angle  = 30.0f;
+    BENCHMARK( "SetRotateY" )
+    {
+        gm::SetRotateY( angle, matrix );
+        return matrix;
+    };
+    BENCHMARK( "ApproximateSetRotateY" )
+    {
+        gm::ApproximateSetRotateY( angle, matrix );
+        return matrix;
+    };
+}
@@ -0,0 +1,25 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/approximateSetRotateZ.h>
+#include <gm/functions/setRotateZ.h>
+
+TEST_CASE( "ApproximateSetRotateZ_float_Mat4f" )
+{
+    gm::Mat4f matrix = gm::Mat4f::Identity();
+    float     angle  = 30.0f;
+    BENCHMARK( "SetRotateZ" )
+    {
+        gm::SetRotateZ( angle, matrix );
+        return matrix;
+    };
+    BENCHMARK( "ApproximateSetRotateZ" )
+    {
+        gm::ApproximateSetRotateZ( angle, matrix );
+        return matrix;
+    };
+}
@@ -0,0 +1,54 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/approximateSineCosine.h>
+#include <gm/functions/batch/approximateSineCosine.h>
+
+#include <cmath>
+#include <vector>
+
+TEST_CASE( "ApproximateSineCosine_float_float_float" )
+{
+    float angle = 2.5f;
+    BENCHMARK( "SineCosine" )
+    {
+        return std::sin( angle ) + std::cos( angle );
+    };
+    BENCHMARK( "ApproximateSineCosine" )
+    {
+        float sine, cosine;
+        gm::ApproximateSineCosine( angle, sine, cosine );
+        return sine + cosine;
+    };
+}
+
+TEST_CASE( "ApproximateSineCosine_Batch_float_float_float" )
+{
+    const size_t         count = 4096;
+    std::vector< float > angles( count );
+    std::vector< float > sines( count );
+    std::vector< float > cosines( count );
+    for ( size_t index = 0; index < count; ++index )
+    {
+        angles[ index ] = index * 0.1f - 200.0f;
+    }
+
+    BENCHMARK( "SineCosine_4096" )
+    {
+        for ( size_t index = 0; index < count; ++index )
+        {
+            sines[ index ]   = std::sin( angles[ index ] );
+            cosines[ index ] = std::cos( angles[ index ] );
+        }
+        return sines[ count - 1 ] + cosines[ count - 1 ];
+    };
+    BENCHMARK( "ApproximateSineCosine_4096" )
+    {
+        gm::ApproximateSineCosine( angles, count, sines.data(), cosines.data() );
+        return sines[ count - 1 ] + cosines[ count - 1 ];
+    };
+}
@@ -36,3 +36,13 @@ TEST_CASE( "DotProduct_Vec4f_Vec4f" )
         return gm::DotProduct( lhs, rhs );
     };
 }
+
+TEST_CASE( "DotProduct_Quatf_Quatf" )
+{
+    gm::Quatf lhs;
+    gm::Quatf rhs;
+    BENCHMARK( "DotProduct" )
+    {
+        return gm::DotProduct( lhs, rhs );
+    };
+}
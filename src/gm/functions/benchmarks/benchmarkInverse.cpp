@@ -7,12 +7,90 @@
 
 #include <gm/functions/inverse.h>
 
+#include <gm/functions/batch/inverse.h>
+#include <gm/functions/batch/inverseAffine.h>
+#include <gm/functions/batch/inverseRigid.h>
+#include <gm/functions/inverseAffine.h>
+#include <gm/functions/inverseRigid.h>
+#include <gm/functions/matrixProduct.h>
+#include <gm/functions/randomNumber.h>
+#include <gm/functions/setRotateX.h>
+#include <gm/functions/setRotateY.h>
+#include <gm/functions/setTranslate.h>
+
+#include <memory>
+#include <vector>
+
+// Rigid transformation with rotation and translation, which is valid input for all of the inverses.
+static inline gm::Mat4f RandomTransform()
+{
+    gm::Mat4f rotateX = gm::Mat4f::Identity();
+    gm::SetRotateX( gm::RandomNumber( gm::FloatRange( 0.0f, 360.0f ) ), rotateX );
+    gm::Mat4f rotateY = gm::Mat4f::Identity();
+    gm::SetRotateY( gm::RandomNumber( gm::FloatRange( 0.0f, 360.0f ) ), rotateY );
+    gm::Mat4f matrix = gm::MatrixProduct( rotateX, rotateY );
+    gm::SetTranslate( gm::Vec3f( gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ),
+                                 gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ),
+                                 gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ) ),
+                      matrix );
+    return matrix;
+}
+
+TEST_CASE( "Inverse_Mat3f_Mat3f" )
+{
+    gm::Mat3f matrix( 1, 7, 0.25, 0, 5, 8, 2, -3, 1 );
+    gm::Mat3f inverse;
+    BENCHMARK( "Inverse" )
+    {
+        gm::Inverse( matrix, inverse );
+        return inverse;
+    };
+}
+
 TEST_CASE( "Inverse_Mat4f_Mat4f" )
 {
-    gm::Mat4f matrix;
+    gm::Mat4f matrix = RandomTransform();
     gm::Mat4f inverse;
     BENCHMARK( "Inverse" )
     {
-        return gm::Inverse( matrix, inverse );
+        gm::Inverse( matrix, inverse );
+        return inverse;
+    };
+    BENCHMARK( "InverseAffine" )
+    {
+        gm::InverseAffine( matrix, inverse );
+        return inverse;
+    };
+    BENCHMARK( "InverseRigid" )
+    {
+        return gm::InverseRigid( matrix );
+    };
+}
+
+TEST_CASE( "Inverse_Batch_Mat4f_Mat4f" )
+{
+    const size_t              count = 4096;
+    std::vector< gm::Mat4f >  matrices( count );
+    std::vector< gm::Mat4f >  inverses( count );
+    std::unique_ptr< bool[] > invertible( new bool[ count ] );
+    for ( size_t index = 0; index < count; ++index )
+    {
+        matrices[ index ] = RandomTransform();
+    }
+
+    BENCHMARK( "Inverse_4096" )
+    {
+        gm::Inverse( matrices, count, inverses.data(), invertible.get() );
+        return inverses[ count - 1 ];
+    };
+    BENCHMARK( "InverseAffine_4096" )
+    {
+        gm::InverseAffine( matrices, count, inverses.data(), invertible.get() );
+        return inverses[ count - 1 ];
+    };
+    BENCHMARK( "InverseRigid_4096" )
+    {
+        gm::InverseRigid( matrices, count, inverses.data() );
+        return inverses[ count - 1 ];
     };
 }
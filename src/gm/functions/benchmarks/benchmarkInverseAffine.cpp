@@ -0,0 +1,18 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/inverseAffine.h>
+
+TEST_CASE( "InverseAffine_Mat4f_Mat4f" )
+{
+    gm::Mat4f matrix;
+    gm::Mat4f inverse;
+    BENCHMARK( "InverseAffine" )
+    {
+        return gm::InverseAffine( matrix, inverse );
+    };
+}
@@ -0,0 +1,17 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/inverseRigid.h>
+
+TEST_CASE( "InverseRigid_Mat4f" )
+{
+    gm::Mat4f matrix;
+    BENCHMARK( "InverseRigid" )
+    {
+        return gm::InverseRigid( matrix );
+    };
+}
@@ -33,3 +33,12 @@ TEST_CASE( "Length_Vec4f" )
         return gm::Length( vector );
     };
 }
+
+TEST_CASE( "Length_Quatf" )
+{
+    gm::Quatf vector;
+    BENCHMARK( "Length" )
+    {
+        return gm::Length( vector );
+    };
+}
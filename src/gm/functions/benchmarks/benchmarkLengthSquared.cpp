@@ -33,3 +33,12 @@ TEST_CASE( "LengthSquared_Vec4f" )
         return gm::LengthSquared( vector );
     };
 }
+
+TEST_CASE( "LengthSquared_Quatf" )
+{
+    gm::Quatf vector;
+    BENCHMARK( "LengthSquared" )
+    {
+        return gm::LengthSquared( vector );
+    };
+}
@@ -33,3 +33,12 @@ TEST_CASE( "Normalize_Vec4f" )
         return gm::Normalize( vector );
     };
 }
+
+TEST_CASE( "Normalize_Quatf" )
+{
+    gm::Quatf vector;
+    BENCHMARK( "Normalize" )
+    {
+        return gm::Normalize( vector );
+    };
+}
@@ -0,0 +1,19 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/normalizedLinearInterpolation.h>
+
+TEST_CASE( "NormalizedLinearInterpolation_Quatf_Quatf_float" )
+{
+    gm::Quatf source;
+    gm::Quatf target;
+    float     weight;
+    BENCHMARK( "NormalizedLinearInterpolation" )
+    {
+        return gm::NormalizedLinearInterpolation( source, target, weight );
+    };
+}
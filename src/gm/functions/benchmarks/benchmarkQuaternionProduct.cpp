@@ -0,0 +1,18 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/quaternionProduct.h>
+
+TEST_CASE( "QuaternionProduct_Quatf_Quatf" )
+{
+    gm::Quatf lhs;
+    gm::Quatf rhs;
+    BENCHMARK( "QuaternionProduct" )
+    {
+        return gm::QuaternionProduct( lhs, rhs );
+    };
+}
@@ -42,3 +42,50 @@ TEST_CASE( "RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRange" )
         return gm::RayAABBIntersection( rayOrigin, rayDirection, aabb, intersections );
     };
 }
+
+TEST_CASE( "RayAABBIntersection_Ray_Vec3fRange_FloatRange" )
+{
+    gm::Ray        ray;
+    gm::Vec3fRange aabb;
+    gm::FloatRange intersections;
+    BENCHMARK( "RayAABBIntersection" )
+    {
+        return gm::RayAABBIntersection( ray, aabb, intersections );
+    };
+}
+
+TEST_CASE( "RayAABBIntersection_Vec3fPacket4_Vec3fPacket4_Vec3fRange_FloatRangePacket4" )
+{
+    gm::Vec3fPacket4      rayOrigin;
+    gm::Vec3fPacket4      rayDirection;
+    gm::Vec3fRange        aabb;
+    gm::FloatRangePacket4 intersections;
+    BENCHMARK( "RayAABBIntersection" )
+    {
+        return gm::RayAABBIntersection( rayOrigin, rayDirection, aabb, intersections );
+    };
+}
+
+TEST_CASE( "RayAABBIntersection_Vec3fPacket8_Vec3fPacket8_Vec3fRange_FloatRangePacket8" )
+{
+    gm::Vec3fPacket8      rayOrigin;
+    gm::Vec3fPacket8      rayDirection;
+    gm::Vec3fRange        aabb;
+    gm::FloatRangePacket8 intersections;
+    BENCHMARK( "RayAABBIntersection" )
+    {
+        return gm::RayAABBIntersection( rayOrigin, rayDirection, aabb, intersections );
+    };
+}
+
+TEST_CASE( "RayAABBIntersection_Vec3fPacket16_Vec3fPacket16_Vec3fRange_FloatRangePacket16" )
+{
+    gm::Vec3fPacket16      rayOrigin;
+    gm::Vec3fPacket16      rayDirection;
+    gm::Vec3fRange         aabb;
+    gm::FloatRangePacket16 intersections;
+    BENCHMARK( "RayAABBIntersection" )
+    {
+        return gm::RayAABBIntersection( rayOrigin, rayDirection, aabb, intersections );
+    };
+}
@@ -19,3 +19,42 @@ TEST_CASE( "RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRange" )
         return gm::RaySphereIntersection( sphereOrigin, sphereRadius, rayOrigin, rayDirection, intersections );
     };
 }
+
+TEST_CASE( "RaySphereIntersection_Vec3f_float_Vec3fPacket4_Vec3fPacket4_FloatRangePacket4" )
+{
+    gm::Vec3f             sphereOrigin;
+    float                 sphereRadius;
+    gm::Vec3fPacket4      rayOrigin;
+    gm::Vec3fPacket4      rayDirection;
+    gm::FloatRangePacket4 intersections;
+    BENCHMARK( "RaySphereIntersection" )
+    {
+        return gm::RaySphereIntersection( sphereOrigin, sphereRadius, rayOrigin, rayDirection, intersections );
+    };
+}
+
+TEST_CASE( "RaySphereIntersection_Vec3f_float_Vec3fPacket8_Vec3fPacket8_FloatRangePacket8" )
+{
+    gm::Vec3f             sphereOrigin;
+    float                 sphereRadius;
+    gm::Vec3fPacket8      rayOrigin;
+    gm::Vec3fPacket8      rayDirection;
+    gm::FloatRangePacket8 intersections;
+    BENCHMARK( "RaySphereIntersection" )
+    {
+        return gm::RaySphereIntersection( sphereOrigin, sphereRadius, rayOrigin, rayDirection, intersections );
+    };
+}
+
+TEST_CASE( "RaySphereIntersection_Vec3f_float_Vec3fPacket16_Vec3fPacket16_FloatRangePacket16" )
+{
+    gm::Vec3f              sphereOrigin;
+    float                  sphereRadius;
+    gm::Vec3fPacket16      rayOrigin;
+    gm::Vec3fPacket16      rayDirection;
+    gm::FloatRangePacket16 intersections;
+    BENCHMARK( "RaySphereIntersection" )
+    {
+        return gm::RaySphereIntersection( sphereOrigin, sphereRadius, rayOrigin, rayDirection, intersections );
+    };
+}
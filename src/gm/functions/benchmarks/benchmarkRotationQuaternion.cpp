@@ -0,0 +1,26 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/rotationQuaternion.h>
+
+TEST_CASE( "RotationQuaternion_Mat3f" )
+{
+    gm::Mat3f matrix;
+    BENCHMARK( "RotationQuaternion" )
+    {
+        return gm::RotationQuaternion( matrix );
+    };
+}
+
+TEST_CASE( "RotationQuaternion_Mat4f" )
+{
+    gm::Mat4f matrix;
+    BENCHMARK( "RotationQuaternion" )
+    {
+        return gm::RotationQuaternion( matrix );
+    };
+}
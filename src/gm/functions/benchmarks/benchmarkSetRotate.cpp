@@ -17,3 +17,34 @@ TEST_CASE( "SetRotate_float_Vec3f_Mat4f" )
         return gm::SetRotate( angle, axis, matrix );
     };
 }
+
+TEST_CASE( "SetRotate_float_Vec3f_Quatf" )
+{
+    float     angle;
+    gm::Vec3f axis;
+    gm::Quatf quaternion;
+    BENCHMARK( "SetRotate" )
+    {
+        return gm::SetRotate( angle, axis, quaternion );
+    };
+}
+
+TEST_CASE( "SetRotate_Quatf_Mat3f" )
+{
+    gm::Quatf quaternion;
+    gm::Mat3f matrix;
+    BENCHMARK( "SetRotate" )
+    {
+        return gm::SetRotate( quaternion, matrix );
+    };
+}
+
+TEST_CASE( "SetRotate_Quatf_Mat4f" )
+{
+    gm::Quatf quaternion;
+    gm::Mat4f matrix;
+    BENCHMARK( "SetRotate" )
+    {
+        return gm::SetRotate( quaternion, matrix );
+    };
+}
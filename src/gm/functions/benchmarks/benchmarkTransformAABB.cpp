@@ -7,12 +7,104 @@
 
 #include <gm/functions/transformAABB.h>
 
+#include <gm/functions/batch/transformAABB.h>
+#include <gm/functions/expand.h>
+#include <gm/functions/matrixProduct.h>
+#include <gm/functions/randomNumber.h>
+#include <gm/functions/setRotateX.h>
+#include <gm/functions/setScale.h>
+#include <gm/functions/setTranslate.h>
+#include <gm/functions/transformPoint.h>
+
+#include <vector>
+
+// Reference implementation, transforming and expanding by each of the 8 corner points of the AABB.
+static inline gm::Vec3fRange TransformAABBCorners( const gm::Mat4f& i_matrix, const gm::Vec3fRange& i_aabb )
+{
+    gm::Vec3fRange newAABB;
+    for ( int corner = 0; corner < 8; ++corner )
+    {
+        gm::Vec3f point( ( corner & 1 ) ? i_aabb.Max()[ 0 ] : i_aabb.Min()[ 0 ],
+                         ( corner & 2 ) ? i_aabb.Max()[ 1 ] : i_aabb.Min()[ 1 ],
+                         ( corner & 4 ) ? i_aabb.Max()[ 2 ] : i_aabb.Min()[ 2 ] );
+        newAABB = gm::Expand( newAABB, gm::TransformPoint( i_matrix, point ) );
+    }
+    return newAABB;
+}
+
+// Affine transformation with rotation, scale and translation.
+static inline gm::Mat4f RandomTransform()
+{
+    gm::Mat4f rotate = gm::Mat4f::Identity();
+    gm::SetRotateX( gm::RandomNumber( gm::FloatRange( 0.0f, 360.0f ) ), rotate );
+    gm::Mat4f scale = gm::Mat4f::Identity();
+    gm::SetScale( gm::Vec3f( 2, 3, 4 ), scale );
+    gm::Mat4f matrix = gm::MatrixProduct( scale, rotate );
+    gm::SetTranslate( gm::Vec3f( gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ),
+                                 gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ),
+                                 gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ) ),
+                      matrix );
+    return matrix;
+}
+
+static inline gm::Vec3fRange RandomAABB()
+{
+    gm::Vec3f point( gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ),
+                     gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ),
+                     gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ) );
+    return gm::Vec3fRange( point, point + gm::Vec3f( 1, 2, 3 ) );
+}
+
 TEST_CASE( "TransformAABB_Mat4f_Vec3fRange" )
 {
-    gm::Mat4f      matrix;
-    gm::Vec3fRange aabb;
+    gm::Mat4f      matrix = RandomTransform();
+    gm::Vec3fRange aabb   = RandomAABB();
+    BENCHMARK( "TransformAABB_Corners" )
+    {
+        return TransformAABBCorners( matrix, aabb );
+    };
     BENCHMARK( "TransformAABB" )
     {
         return gm::TransformAABB( matrix, aabb );
     };
 }
+
+TEST_CASE( "TransformAABB_Batch_Mat4f_Vec3fRange" )
+{
+    const size_t                  count = 4096;
+    std::vector< gm::Mat4f >      matrices( count );
+    std::vector< gm::Vec3fRange > aabbs( count );
+    std::vector< gm::Vec3fRange > transformedAABBs( count );
+    for ( size_t index = 0; index < count; ++index )
+    {
+        matrices[ index ] = RandomTransform();
+        aabbs[ index ]    = RandomAABB();
+    }
+
+    BENCHMARK( "TransformAABB_Corners_SingleMatrix_4096" )
+    {
+        for ( size_t index = 0; index < count; ++index )
+        {
+            transformedAABBs[ index ] = TransformAABBCorners( matrices[ 0 ], aabbs[ index ] );
+        }
+        return transformedAABBs[ count - 1 ];
+    };
+    BENCHMARK( "TransformAABB_SingleMatrix_4096" )
+    {
+        gm::TransformAABB( matrices[ 0 ], aabbs, count, transformedAABBs.data() );
+        return transformedAABBs[ count - 1 ];
+    };
+    BENCHMARK( "TransformAABB_Corners_ManyMatrices_4096" )
+    {
+        for ( size_t index = 0; index < count; ++index )
+        {
+            transformedAABBs[ index ] = TransformAABBCorners( matrices[ index ], aabbs[ index ] );
+        }
+        return transformedAABBs[ count - 1 ];
+    };
+    BENCHMARK( "TransformAABB_ManyMatrices_4096" )
+    {
+        gm::TransformAABB( matrices, aabbs, count, transformedAABBs.data() );
+        return transformedAABBs[ count - 1 ];
+    };
+}
@@ -16,3 +16,13 @@ TEST_CASE( "TransformPoint_Mat4f_Vec3f" )
         return gm::TransformPoint( matrix, point );
     };
 }
+
+TEST_CASE( "TransformPoint_Mat4fA_Vec3fA" )
+{
+    gm::Mat4fA matrix;
+    gm::Vec3fA point;
+    BENCHMARK( "TransformPoint" )
+    {
+        return gm::TransformPoint( matrix, point );
+    };
+}
@@ -26,3 +26,13 @@ TEST_CASE( "TransformVector_Mat4f_Vec3f" )
         return gm::TransformVector( matrix, vector );
     };
 }
+
+TEST_CASE( "TransformVector_Quatf_Vec3f" )
+{
+    gm::Quatf quaternion;
+    gm::Vec3f vector;
+    BENCHMARK( "TransformVector" )
+    {
+        return gm::TransformVector( quaternion, vector );
+    };
+}
@@ -50,11 +50,11 @@ GM_HOST_DEVICE inline float BilinearInterpolation( const float& i_corner00,
                    i_weight.Y() );
 
     // Linearly interpolate along the X axis to produce two intermediate values.
-    float interm0 = gm::LinearInterpolation( i_corner00, i_corner10, i_weight.X() );
-    float interm1 = gm::LinearInterpolation( i_corner01, i_corner11, i_weight.X() );
+    float interm0 = LinearInterpolation( i_corner00, i_corner10, i_weight.X() );
+    float interm1 = LinearInterpolation( i_corner01, i_corner11, i_weight.X() );
 
     // Linearly interpolate the intermediate values along the Y axis.
-    return gm::LinearInterpolation( interm0, interm1, i_weight.Y() );
+    return LinearInterpolation( interm0, interm1, i_weight.Y() );
 }
 
 /// Bilinearly interpolate in a 2D rectilinear grid.
@@ -83,11 +83,11 @@ GM_HOST_DEVICE inline Mat3f BilinearInterpolation( const Mat3f& i_corner00,
                    i_weight.Y() );
 
     // Linearly interpolate along the X axis to produce two intermediate values.
-    gm::Mat3f interm0 = gm::LinearInterpolation( i_corner00, i_corner10, i_weight.X() );
-    gm::Mat3f interm1 = gm::LinearInterpolation( i_corner01, i_corner11, i_weight.X() );
+    Mat3f interm0 = LinearInterpolation( i_corner00, i_corner10, i_weight.X() );
+    Mat3f interm1 = LinearInterpolation( i_corner01, i_corner11, i_weight.X() );
 
     // Linearly interpolate the intermediate values along the Y axis.
-    return gm::LinearInterpolation( interm0, interm1, i_weight.Y() );
+    return LinearInterpolation( interm0, interm1, i_weight.Y() );
 }
 
 /// Bilinearly interpolate in a 2D rectilinear grid.
@@ -116,11 +116,11 @@ GM_HOST_DEVICE inline Mat4f BilinearInterpolation( const Mat4f& i_corner00,
                    i_weight.Y() );
 
     // Linearly interpolate along the X axis to produce two intermediate values.
-    gm::Mat4f interm0 = gm::LinearInterpolation( i_corner00, i_corner10, i_weight.X() );
-    gm::Mat4f interm1 = gm::LinearInterpolation( i_corner01, i_corner11, i_weight.X() );
+    Mat4f interm0 = LinearInterpolation( i_corner00, i_corner10, i_weight.X() );
+    Mat4f interm1 = LinearInterpolation( i_corner01, i_corner11, i_weight.X() );
 
     // Linearly interpolate the intermediate values along the Y axis.
-    return gm::LinearInterpolation( interm0, interm1, i_weight.Y() );
+    return LinearInterpolation( interm0, interm1, i_weight.Y() );
 }
 
 /// Bilinearly interpolate in a 2D rectilinear grid.
@@ -149,11 +149,11 @@ GM_HOST_DEVICE inline Vec2f BilinearInterpolation( const Vec2f& i_corner00,
                    i_weight.Y() );
 
     // Linearly interpolate along the X axis to produce two intermediate values.
-    gm::Vec2f interm0 = gm::LinearInterpolation( i_corner00, i_corner10, i_weight.X() );
-    gm::Vec2f interm1 = gm::LinearInterpolation( i_corner01, i_corner11, i_weight.X() );
+    Vec2f interm0 = LinearInterpolation( i_corner00, i_corner10, i_weight.X() );
+    Vec2f interm1 = LinearInterpolation( i_corner01, i_corner11, i_weight.X() );
 
     // Linearly interpolate the intermediate values along the Y axis.
-    return gm::LinearInterpolation( interm0, interm1, i_weight.Y() );
+    return LinearInterpolation( interm0, interm1, i_weight.Y() );
 }
 
 /// Bilinearly interpolate in a 2D rectilinear grid.
@@ -182,11 +182,11 @@ GM_HOST_DEVICE inline Vec3f BilinearInterpolation( const Vec3f& i_corner00,
                    i_weight.Y() );
 
     // Linearly interpolate along the X axis to produce two intermediate values.
-    gm::Vec3f interm0 = gm::LinearInterpolation( i_corner00, i_corner10, i_weight.X() );
-    gm::Vec3f interm1 = gm::LinearInterpolation( i_corner01, i_corner11, i_weight.X() );
+    Vec3f interm0 = LinearInterpolation( i_corner00, i_corner10, i_weight.X() );
+    Vec3f interm1 = LinearInterpolation( i_corner01, i_corner11, i_weight.X() );
 
     // Linearly interpolate the intermediate values along the Y axis.
-    return gm::LinearInterpolation( interm0, interm1, i_weight.Y() );
+    return LinearInterpolation( interm0, interm1, i_weight.Y() );
 }
 
 /// Bilinearly interpolate in a 2D rectilinear grid.
@@ -215,11 +215,11 @@ GM_HOST_DEVICE inline Vec4f BilinearInterpolation( const Vec4f& i_corner00,
                    i_weight.Y() );
 
     // Linearly interpolate along the X axis to produce two intermediate values.
-    gm::Vec4f interm0 = gm::LinearInterpolation( i_corner00, i_corner10, i_weight.X() );
-    gm::Vec4f interm1 = gm::LinearInterpolation( i_corner01, i_corner11, i_weight.X() );
+    Vec4f interm0 = LinearInterpolation( i_corner00, i_corner10, i_weight.X() );
+    Vec4f interm1 = LinearInterpolation( i_corner01, i_corner11, i_weight.X() );
 
     // Linearly interpolate the intermediate values along the Y axis.
-    return gm::LinearInterpolation( interm0, interm1, i_weight.Y() );
+    return LinearInterpolation( interm0, interm1, i_weight.Y() );
 }
 
 GM_NS_CLOSE
\ No newline at end of file
@@ -17,10 +17,13 @@
 
 #include <gm/gm.h>
 
+#include <gm/types/quatf.h>
 #include <gm/types/vec2f.h>
 #include <gm/types/vec3f.h>
 #include <gm/types/vec4f.h>
 
+#include <gm/base/simd.h>
+
 GM_NS_OPEN
 
 /// Compute the dot product of two \ref Vec2f, \p i_lhs
@@ -59,7 +62,36 @@ GM_HOST_DEVICE inline float DotProduct( const Vec3f& i_lhs, const Vec3f& i_rhs )
 /// \return Dot product of the two vectors.
 GM_HOST_DEVICE inline float DotProduct( const Vec4f& i_lhs, const Vec4f& i_rhs )
 {
+#if defined( GM_SIMD_SSE_ENABLED )
+    // Horizontal sum of the element-wise product.
+    __m128 product = _mm_mul_ps( _mm_loadu_ps( i_lhs.Data() ), _mm_loadu_ps( i_rhs.Data() ) );
+    __m128 sum     = _mm_add_ps( product, _mm_movehl_ps( product, product ) );
+    sum            = _mm_add_ss( sum, _mm_shuffle_ps( sum, sum, _MM_SHUFFLE( 1, 1, 1, 1 ) ) );
+    return _mm_cvtss_f32( sum );
+#else
+    return i_lhs[ 0 ] * i_rhs[ 0 ] + i_lhs[ 1 ] * i_rhs[ 1 ] + i_lhs[ 2 ] * i_rhs[ 2 ] + i_lhs[ 3 ] * i_rhs[ 3 ];
+#endif
+}
+
+/// Compute the dot product of two \ref Quatf, \p i_lhs
+/// and \p i_rhs, and return the result.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_lhs Left hand side vector.
+/// \param i_rhs Right hand side vector.
+///
+/// \return Dot product of the two vectors.
+GM_HOST_DEVICE inline float DotProduct( const Quatf& i_lhs, const Quatf& i_rhs )
+{
+#if defined( GM_SIMD_SSE_ENABLED )
+    // Horizontal sum of the element-wise product.
+    __m128 product = _mm_mul_ps( _mm_loadu_ps( i_lhs.Data() ), _mm_loadu_ps( i_rhs.Data() ) );
+    __m128 sum     = _mm_add_ps( product, _mm_movehl_ps( product, product ) );
+    sum            = _mm_add_ss( sum, _mm_shuffle_ps( sum, sum, _MM_SHUFFLE( 1, 1, 1, 1 ) ) );
+    return _mm_cvtss_f32( sum );
+#else
     return i_lhs[ 0 ] * i_rhs[ 0 ] + i_lhs[ 1 ] * i_rhs[ 1 ] + i_lhs[ 2 ] * i_rhs[ 2 ] + i_lhs[ 3 ] * i_rhs[ 3 ];
+#endif
 }
 
 GM_NS_CLOSE
\ No newline at end of file
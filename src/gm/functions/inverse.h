@@ -9,7 +9,8 @@
 ///
 /// Matrix inverse.
 ///
-/// Using Gauss-Jordan elimination, compute the inverse matrix.
+/// Using cofactor expansion, compute the inverse matrix as the adjugate (the transposed matrix of cofactors)
+/// divided by the determinant.
 ///
 /// The inverse matrix of \f$A\f$ is the unique matrix \f$A^-1\f$ such that
 /// \f[
@@ -17,303 +18,106 @@
 /// \f]
 /// where \f$I\f$ is the identity matrix.
 ///
-/// This is a fairly involved operation, and one of the few implementations in GraphicsMath where
-/// helper functions are available to improve readability.
+/// The cofactors are expanded in closed form, without pivoting or data-dependent branches, such that the cost
+/// is the same for every matrix.  The 4x4 cofactors share their 2x2 sub-determinants, following
+/// Eberly's "The Laplace Expansion Theorem: Computing the Determinants and Inverses of Matrices" (2008).
+///
+/// For affine or rigid transformations, prefer the cheaper \ref InverseAffine and \ref InverseRigid.
 
 #include <gm/gm.h>
 
+#include <gm/types/mat3f.h>
 #include <gm/types/mat4f.h>
 
-#include <gm/base/diagnostic.h>
-#include <gm/functions/setIdentity.h>
-#include <gm/types/vec4f.h>
-
 GM_NS_OPEN
 
-/// Find a row \em below row \p i_pivotRowIndex in matrix \p o_matrix such that its co-efficient
-/// (at \p i_pivotColIndex) is not 0, then exchange it with the pivot row.
+/// Compute the inverse of matrix i_matrix.
+/// \ingroup gm_functions_linearAlgebra
 ///
-/// \return a positive integer if a viable row is found.  Otherwise, \p -1.
-GM_HOST_DEVICE inline int _FindRowToExchange( const Mat4f& i_matrix, int i_pivotIndex )
-{
-    GM_ASSERT( i_matrix( i_pivotIndex, i_pivotIndex ) == 0 );
-
-    for ( int rowIndex = i_pivotIndex + 1; rowIndex < 4; rowIndex++ )
-    {
-        if ( i_matrix( rowIndex, i_pivotIndex ) != 0 )
-        {
-            return rowIndex;
-        }
-    }
-
-    return -1;
-}
-
-/// Exchange row \p i_rowIndexA and row \p i_rowIndexB on matrix \p o_matrix in-place.
-GM_HOST_DEVICE inline void _RowExchange( int i_rowIndexA, int i_rowIndexB, Mat4f& o_matrix )
-{
-    Vec4f rowA( o_matrix( i_rowIndexA, 0 ),
-                o_matrix( i_rowIndexA, 1 ),
-                o_matrix( i_rowIndexA, 2 ),
-                o_matrix( i_rowIndexA, 3 ) );
-
-    o_matrix( i_rowIndexA, 0 ) = o_matrix( i_rowIndexB, 0 );
-    o_matrix( i_rowIndexA, 1 ) = o_matrix( i_rowIndexB, 1 );
-    o_matrix( i_rowIndexA, 2 ) = o_matrix( i_rowIndexB, 2 );
-    o_matrix( i_rowIndexA, 3 ) = o_matrix( i_rowIndexB, 3 );
-
-    o_matrix( i_rowIndexB, 0 ) = rowA[ 0 ];
-    o_matrix( i_rowIndexB, 1 ) = rowA[ 1 ];
-    o_matrix( i_rowIndexB, 2 ) = rowA[ 2 ];
-    o_matrix( i_rowIndexB, 3 ) = rowA[ 3 ];
-}
-
-/// Perform a Gauss elimination step by zeroing out all the co-efficients below the pivot row,
-/// by subtracting a factor the row from them.
-GM_HOST_DEVICE inline void _GaussEliminationStep( int i_pivotIndex, Mat4f& o_matrix, Mat4f& o_inverse )
+/// \param i_matrix The input matrix to invert.
+/// \param o_inverse The inverse of \p i_matrix.  Undefined if \p i_matrix is not invertible.
+///
+/// \return Whether or not i_matrix is invertable.
+GM_HOST_DEVICE inline bool Inverse( const Mat3f& i_matrix, Mat3f& o_inverse )
 {
-    GM_ASSERT( o_matrix( i_pivotIndex, i_pivotIndex ) != 0 );
+    const Mat3f& m = i_matrix;
 
-    // Precompute the reciprocal of the pivot co-efficient.
-    const float pivotReciprocal = 1.0 / o_matrix( i_pivotIndex, i_pivotIndex );
+    // Cofactors of the first column, shared by the determinant.
+    const float c00 = m( 1, 1 ) * m( 2, 2 ) - m( 1, 2 ) * m( 2, 1 );
+    const float c10 = m( 1, 2 ) * m( 2, 0 ) - m( 1, 0 ) * m( 2, 2 );
+    const float c20 = m( 1, 0 ) * m( 2, 1 ) - m( 1, 1 ) * m( 2, 0 );
 
-    // Cache the pivot rows.
-    Vec4f pivotRow( o_matrix( i_pivotIndex, 0 ),
-                    o_matrix( i_pivotIndex, 1 ),
-                    o_matrix( i_pivotIndex, 2 ),
-                    o_matrix( i_pivotIndex, 3 ) );
-
-    Vec4f inversePivotRow( o_inverse( i_pivotIndex, 0 ),
-                           o_inverse( i_pivotIndex, 1 ),
-                           o_inverse( i_pivotIndex, 2 ),
-                           o_inverse( i_pivotIndex, 3 ) );
-
-    for ( int rowIndex = i_pivotIndex + 1; rowIndex < 4; rowIndex++ )
+    const float determinant = m( 0, 0 ) * c00 + m( 0, 1 ) * c10 + m( 0, 2 ) * c20;
+    if ( determinant == 0.0f )
     {
-        float coefficient = o_matrix( rowIndex, i_pivotIndex );
-        if ( coefficient != 0 )
-        {
-            float eliminationFactor = coefficient * pivotReciprocal;
-            Vec4f eliminationRow    = pivotRow * eliminationFactor;
-            for ( int colIndex = i_pivotIndex; colIndex < 4; colIndex++ )
-            {
-                o_matrix( rowIndex, colIndex ) -= eliminationRow[ colIndex ];
-            }
-
-            Vec4f inverseEliminationRow = inversePivotRow * eliminationFactor;
-            for ( int colIndex = 0; colIndex < 4; colIndex++ )
-            {
-                o_inverse( rowIndex, colIndex ) -= inverseEliminationRow[ colIndex ];
-            }
-        }
+        return false;
     }
-}
-
-/// Perform a Jordan elimination step by zeroing out all the co-efficients above the pivot row.
-/// by subtracting a factor the row from them.
-///
-/// FIXME: This code duplication sucks.  We can reduce Gauss and Jordan steps into a single function
-/// fairly elegantly with an IntRange which supports reverse iteration (where the min is greater than the max).
-GM_HOST_DEVICE inline void _JordanEliminationStep( int i_pivotIndex, Mat4f& o_matrix, Mat4f& o_inverse )
-{
-    GM_ASSERT( o_matrix( i_pivotIndex, i_pivotIndex ) != 0 );
-
-    // Precompute the reciprocal of the pivot co-efficient.
-    const float pivotReciprocal = 1.0 / o_matrix( i_pivotIndex, i_pivotIndex );
-
-    // Cache the pivot rows.
-    Vec4f pivotRow( o_matrix( i_pivotIndex, 0 ),
-                    o_matrix( i_pivotIndex, 1 ),
-                    o_matrix( i_pivotIndex, 2 ),
-                    o_matrix( i_pivotIndex, 3 ) );
-
-    Vec4f inversePivotRow( o_inverse( i_pivotIndex, 0 ),
-                           o_inverse( i_pivotIndex, 1 ),
-                           o_inverse( i_pivotIndex, 2 ),
-                           o_inverse( i_pivotIndex, 3 ) );
 
-    for ( int rowIndex = i_pivotIndex - 1; rowIndex >= 0; rowIndex-- )
-    {
-        float coefficient = o_matrix( rowIndex, i_pivotIndex );
-        if ( coefficient != 0.0f )
-        {
-            float eliminationFactor = coefficient * pivotReciprocal;
-            Vec4f eliminationRow    = pivotRow * eliminationFactor;
-            for ( int colIndex = i_pivotIndex; colIndex >= 0; colIndex-- )
-            {
-                o_matrix( rowIndex, colIndex ) -= eliminationRow[ colIndex ];
-            }
+    const float invDeterminant = 1.0f / determinant;
+    o_inverse                  = Mat3f( c00 * invDeterminant,
+                       ( m( 0, 2 ) * m( 2, 1 ) - m( 0, 1 ) * m( 2, 2 ) ) * invDeterminant,
+                       ( m( 0, 1 ) * m( 1, 2 ) - m( 0, 2 ) * m( 1, 1 ) ) * invDeterminant,
+                       c10 * invDeterminant,
+                       ( m( 0, 0 ) * m( 2, 2 ) - m( 0, 2 ) * m( 2, 0 ) ) * invDeterminant,
+                       ( m( 0, 2 ) * m( 1, 0 ) - m( 0, 0 ) * m( 1, 2 ) ) * invDeterminant,
+                       c20 * invDeterminant,
+                       ( m( 0, 1 ) * m( 2, 0 ) - m( 0, 0 ) * m( 2, 1 ) ) * invDeterminant,
+                       ( m( 0, 0 ) * m( 1, 1 ) - m( 0, 1 ) * m( 1, 0 ) ) * invDeterminant );
 
-            Vec4f inverseEliminationRow = inversePivotRow * eliminationFactor;
-            for ( int colIndex = 3; colIndex >= 0; colIndex-- )
-            {
-                o_inverse( rowIndex, colIndex ) -= inverseEliminationRow[ colIndex ];
-            }
-        }
-    }
+    return true;
 }
 
 /// Compute the inverse of matrix i_matrix.
 /// \ingroup gm_functions_linearAlgebra
 ///
 /// \param i_matrix The input matrix to invert.
-/// \param o_inverse The inverse of \p i_matrix.
+/// \param o_inverse The inverse of \p i_matrix.  Undefined if \p i_matrix is not invertible.
 ///
 /// \return Whether or not i_matrix is invertable.
 GM_HOST_DEVICE inline bool Inverse( const Mat4f& i_matrix, Mat4f& o_inverse )
 {
-    // Left working matrix.  This will assume the identity matrix after
-    // the full Gauss-Jordan elimination.
-    Mat4f matrix = i_matrix;
-
-    // This matrix begins as the identity, and will assume the inverse after elimination.
-    SetIdentity( o_inverse );
-
-    //
-    // Gauss step: multiply A by elimination matrix to produce upper-echelon matrix.
-    //
-
-    // Pivot #0
-    if ( matrix( 0, 0 ) == 0 )
+    const Mat4f& m = i_matrix;
+
+    // 2x2 sub-determinants of the upper two rows.
+    const float s0 = m( 0, 0 ) * m( 1, 1 ) - m( 1, 0 ) * m( 0, 1 );
+    const float s1 = m( 0, 0 ) * m( 1, 2 ) - m( 1, 0 ) * m( 0, 2 );
+    const float s2 = m( 0, 0 ) * m( 1, 3 ) - m( 1, 0 ) * m( 0, 3 );
+    const float s3 = m( 0, 1 ) * m( 1, 2 ) - m( 1, 1 ) * m( 0, 2 );
+    const float s4 = m( 0, 1 ) * m( 1, 3 ) - m( 1, 1 ) * m( 0, 3 );
+    const float s5 = m( 0, 2 ) * m( 1, 3 ) - m( 1, 2 ) * m( 0, 3 );
+
+    // 2x2 sub-determinants of the lower two rows.
+    const float c0 = m( 2, 0 ) * m( 3, 1 ) - m( 3, 0 ) * m( 2, 1 );
+    const float c1 = m( 2, 0 ) * m( 3, 2 ) - m( 3, 0 ) * m( 2, 2 );
+    const float c2 = m( 2, 0 ) * m( 3, 3 ) - m( 3, 0 ) * m( 2, 3 );
+    const float c3 = m( 2, 1 ) * m( 3, 2 ) - m( 3, 1 ) * m( 2, 2 );
+    const float c4 = m( 2, 1 ) * m( 3, 3 ) - m( 3, 1 ) * m( 2, 3 );
+    const float c5 = m( 2, 2 ) * m( 3, 3 ) - m( 3, 2 ) * m( 2, 3 );
+
+    const float determinant = s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0;
+    if ( determinant == 0.0f )
     {
-        // Try to perform row exchange.
-        int rowToExchange = _FindRowToExchange( matrix, 0 );
-        if ( rowToExchange != -1 )
-        {
-            _RowExchange( 0, rowToExchange, matrix );
-            _RowExchange( 0, rowToExchange, o_inverse );
-        }
-        else
-        {
-            // A matrix is invertible if and only if all its columns are independent.  Failure to find a
-            // row to exchange to produce a pivot means that this column is singular (it is a combination of
-            // the previous columns), thus this matrix is not generally invertible.
-            return false;
-        }
+        return false;
     }
 
-    _GaussEliminationStep( 0, matrix, o_inverse );
-
-    // Pivot #1
-    if ( matrix( 1, 1 ) == 0 )
-    {
-        // Try to perform row exchange.
-        int rowToExchange = _FindRowToExchange( matrix, 1 );
-        if ( rowToExchange != -1 )
-        {
-            _RowExchange( 1, rowToExchange, matrix );
-            _RowExchange( 1, rowToExchange, o_inverse );
-        }
-        else
-        {
-            // A matrix is invertible if and only if all its columns are independent.  Failure to find a
-            // row to exchange to produce a pivot means that this column is singular (it is a combination of
-            // the previous columns), thus this matrix is not generally invertible.
-            return false;
-        }
-    }
-
-    _GaussEliminationStep( 1, matrix, o_inverse );
-
-    // Pivot #2
-    if ( matrix( 2, 2 ) == 0 )
-    {
-        // Try to perform row exchange.
-        int rowToExchange = _FindRowToExchange( matrix, 2 );
-        if ( rowToExchange != -1 )
-        {
-            _RowExchange( 2, rowToExchange, matrix );
-            _RowExchange( 2, rowToExchange, o_inverse );
-        }
-        else
-        {
-            // A matrix is invertible if and only if all its columns are independent.  Failure to find a
-            // row to exchange to produce a pivot means that this column is singular (it is a combination of
-            // the previous columns), thus this matrix is not generally invertible.
-            return false;
-        }
-    }
-
-    _GaussEliminationStep( 2, matrix, o_inverse );
-
-    // Pivot #3
-    if ( matrix( 3, 3 ) == 0 )
-    {
-        // Try to perform row exchange.
-        int rowToExchange = _FindRowToExchange( matrix, 3 );
-        if ( rowToExchange != -1 )
-        {
-            _RowExchange( 3, rowToExchange, matrix );
-            _RowExchange( 3, rowToExchange, o_inverse );
-        }
-        else
-        {
-            // A matrix is invertible if and only if all its columns are independent.  Failure to find a
-            // row to exchange to produce a pivot means that this column is singular (it is a combination of
-            // the previous columns), thus this matrix is not generally invertible.
-            return false;
-        }
-    }
-
-    _GaussEliminationStep( 3, matrix, o_inverse );
-
-    //
-    // Jordan step: Multiply upper echelon matrix U by E to reduce to diagonal matrix.
-    //
-
-    _JordanEliminationStep( 3, matrix, o_inverse );
-    _JordanEliminationStep( 2, matrix, o_inverse );
-    _JordanEliminationStep( 1, matrix, o_inverse );
-
-    //
-    // Rows of inverse by diagonal coefficients of left matrix D.
-    //
-    {
-        const float pivot = matrix( 0, 0 );
-        if ( pivot != 1.0f )
-        {
-            const float pivotInverse = 1.0f / pivot;
-            o_inverse( 0, 0 ) *= pivotInverse;
-            o_inverse( 0, 1 ) *= pivotInverse;
-            o_inverse( 0, 2 ) *= pivotInverse;
-            o_inverse( 0, 3 ) *= pivotInverse;
-        }
-    }
-    {
-        const float pivot = matrix( 1, 1 );
-        if ( pivot != 1.0f )
-        {
-            const float pivotInverse = 1.0f / pivot;
-            o_inverse( 1, 0 ) *= pivotInverse;
-            o_inverse( 1, 1 ) *= pivotInverse;
-            o_inverse( 1, 2 ) *= pivotInverse;
-            o_inverse( 1, 3 ) *= pivotInverse;
-        }
-    }
-    {
-        const float pivot = matrix( 2, 2 );
-        if ( pivot != 1.0f )
-        {
-            const float pivotInverse = 1.0f / pivot;
-            o_inverse( 2, 0 ) *= pivotInverse;
-            o_inverse( 2, 1 ) *= pivotInverse;
-            o_inverse( 2, 2 ) *= pivotInverse;
-            o_inverse( 2, 3 ) *= pivotInverse;
-        }
-    }
-    {
-        const float pivot = matrix( 3, 3 );
-        if ( pivot != 1.0f )
-        {
-            const float pivotInverse = 1.0f / pivot;
-            o_inverse( 3, 0 ) *= pivotInverse;
-            o_inverse( 3, 1 ) *= pivotInverse;
-            o_inverse( 3, 2 ) *= pivotInverse;
-            o_inverse( 3, 3 ) *= pivotInverse;
-        }
-    }
+    const float invDeterminant = 1.0f / determinant;
+    o_inverse                  = Mat4f( ( m( 1, 1 ) * c5 - m( 1, 2 ) * c4 + m( 1, 3 ) * c3 ) * invDeterminant,
+                       ( -m( 0, 1 ) * c5 + m( 0, 2 ) * c4 - m( 0, 3 ) * c3 ) * invDeterminant,
+                       ( m( 3, 1 ) * s5 - m( 3, 2 ) * s4 + m( 3, 3 ) * s3 ) * invDeterminant,
+                       ( -m( 2, 1 ) * s5 + m( 2, 2 ) * s4 - m( 2, 3 ) * s3 ) * invDeterminant,
+                       ( -m( 1, 0 ) * c5 + m( 1, 2 ) * c2 - m( 1, 3 ) * c1 ) * invDeterminant,
+                       ( m( 0, 0 ) * c5 - m( 0, 2 ) * c2 + m( 0, 3 ) * c1 ) * invDeterminant,
+                       ( -m( 3, 0 ) * s5 + m( 3, 2 ) * s2 - m( 3, 3 ) * s1 ) * invDeterminant,
+                       ( m( 2, 0 ) * s5 - m( 2, 2 ) * s2 + m( 2, 3 ) * s1 ) * invDeterminant,
+                       ( m( 1, 0 ) * c4 - m( 1, 1 ) * c2 + m( 1, 3 ) * c0 ) * invDeterminant,
+                       ( -m( 0, 0 ) * c4 + m( 0, 1 ) * c2 - m( 0, 3 ) * c0 ) * invDeterminant,
+                       ( m( 3, 0 ) * s4 - m( 3, 1 ) * s2 + m( 3, 3 ) * s0 ) * invDeterminant,
+                       ( -m( 2, 0 ) * s4 + m( 2, 1 ) * s2 - m( 2, 3 ) * s0 ) * invDeterminant,
+                       ( -m( 1, 0 ) * c3 + m( 1, 1 ) * c1 - m( 1, 2 ) * c0 ) * invDeterminant,
+                       ( m( 0, 0 ) * c3 - m( 0, 1 ) * c1 + m( 0, 2 ) * c0 ) * invDeterminant,
+                       ( -m( 3, 0 ) * s3 + m( 3, 1 ) * s1 - m( 3, 2 ) * s0 ) * invDeterminant,
+                       ( m( 2, 0 ) * s3 - m( 2, 1 ) * s1 + m( 2, 2 ) * s0 ) * invDeterminant );
 
-    // Succesful inversion.
     return true;
 }
 
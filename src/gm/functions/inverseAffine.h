@@ -0,0 +1,90 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/inverseAffine.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Affine matrix inverse.
+///
+/// Compute the inverse of an affine transformation matrix, where the bottom row is (0, 0, 0, 1).
+///
+/// An affine transformation \f$M\f$ is composed of a linear transformation \f$L\f$ (the upper left 3x3 block)
+/// followed by a translation \f$t\f$, thus its inverse is
+/// \f[
+/// M^-1 = \begin{bmatrix} L^-1 & -L^-1 t \\ 0 & 1 \end{bmatrix}
+/// \f]
+/// which only requires the closed form inverse of the 3x3 linear transformation.
+
+#include <gm/gm.h>
+
+#include <gm/types/mat4f.h>
+
+#include <gm/base/diagnostic.h>
+
+GM_NS_OPEN
+
+/// Compute the inverse of the affine transformation matrix i_matrix.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \pre The bottom row of \p i_matrix is (0, 0, 0, 1).
+///
+/// \param i_matrix The input affine transformation matrix to invert.
+/// \param o_inverse The inverse of \p i_matrix.  Undefined if \p i_matrix is not invertible.
+///
+/// \return Whether or not i_matrix is invertable.
+GM_HOST_DEVICE inline bool InverseAffine( const Mat4f& i_matrix, Mat4f& o_inverse )
+{
+    const Mat4f& m = i_matrix;
+    GM_ASSERT( m( 3, 0 ) == 0.0f && m( 3, 1 ) == 0.0f && m( 3, 2 ) == 0.0f && m( 3, 3 ) == 1.0f );
+
+    // Cofactors of the first column of the linear transformation, shared by the determinant.
+    const float c00 = m( 1, 1 ) * m( 2, 2 ) - m( 1, 2 ) * m( 2, 1 );
+    const float c10 = m( 1, 2 ) * m( 2, 0 ) - m( 1, 0 ) * m( 2, 2 );
+    const float c20 = m( 1, 0 ) * m( 2, 1 ) - m( 1, 1 ) * m( 2, 0 );
+
+    const float determinant = m( 0, 0 ) * c00 + m( 0, 1 ) * c10 + m( 0, 2 ) * c20;
+    if ( determinant == 0.0f )
+    {
+        return false;
+    }
+
+    // Inverse of the linear transformation.
+    const float invDeterminant = 1.0f / determinant;
+    const float i00            = c00 * invDeterminant;
+    const float i01            = ( m( 0, 2 ) * m( 2, 1 ) - m( 0, 1 ) * m( 2, 2 ) ) * invDeterminant;
+    const float i02            = ( m( 0, 1 ) * m( 1, 2 ) - m( 0, 2 ) * m( 1, 1 ) ) * invDeterminant;
+    const float i10            = c10 * invDeterminant;
+    const float i11            = ( m( 0, 0 ) * m( 2, 2 ) - m( 0, 2 ) * m( 2, 0 ) ) * invDeterminant;
+    const float i12            = ( m( 0, 2 ) * m( 1, 0 ) - m( 0, 0 ) * m( 1, 2 ) ) * invDeterminant;
+    const float i20            = c20 * invDeterminant;
+    const float i21            = ( m( 0, 1 ) * m( 2, 0 ) - m( 0, 0 ) * m( 2, 1 ) ) * invDeterminant;
+    const float i22            = ( m( 0, 0 ) * m( 1, 1 ) - m( 0, 1 ) * m( 1, 0 ) ) * invDeterminant;
+
+    // Translation, by the inverse linear transformation of the negated translation.
+    const float tx = m( 0, 3 );
+    const float ty = m( 1, 3 );
+    const float tz = m( 2, 3 );
+
+    o_inverse = Mat4f( i00,
+                       i01,
+                       i02,
+                       -( i00 * tx + i01 * ty + i02 * tz ),
+                       i10,
+                       i11,
+                       i12,
+                       -( i10 * tx + i11 * ty + i12 * tz ),
+                       i20,
+                       i21,
+                       i22,
+                       -( i20 * tx + i21 * ty + i22 * tz ),
+                       0.0f,
+                       0.0f,
+                       0.0f,
+                       1.0f );
+    return true;
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,64 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/inverseRigid.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Rigid matrix inverse.
+///
+/// Compute the inverse of a rigid transformation matrix, composed only of a rotation \f$R\f$ followed by a
+/// translation \f$t\f$.
+///
+/// The rotation is orthonormal, such that its inverse is its transpose, thus
+/// \f[
+/// M^-1 = \begin{bmatrix} R^T & -R^T t \\ 0 & 1 \end{bmatrix}
+/// \f]
+/// A rigid transformation is always invertible.
+
+#include <gm/gm.h>
+
+#include <gm/types/mat4f.h>
+
+#include <gm/base/diagnostic.h>
+
+GM_NS_OPEN
+
+/// Compute the inverse of the rigid transformation matrix i_matrix.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \pre The upper left 3x3 block of \p i_matrix is a rotation, and its bottom row is (0, 0, 0, 1).
+///
+/// \param i_matrix The input rigid transformation matrix to invert.
+///
+/// \return The inverse of \p i_matrix.
+GM_HOST_DEVICE inline Mat4f InverseRigid( const Mat4f& i_matrix )
+{
+    const Mat4f& m = i_matrix;
+    GM_ASSERT( m( 3, 0 ) == 0.0f && m( 3, 1 ) == 0.0f && m( 3, 2 ) == 0.0f && m( 3, 3 ) == 1.0f );
+
+    const float tx = m( 0, 3 );
+    const float ty = m( 1, 3 );
+    const float tz = m( 2, 3 );
+
+    return Mat4f( m( 0, 0 ),
+                  m( 1, 0 ),
+                  m( 2, 0 ),
+                  -( m( 0, 0 ) * tx + m( 1, 0 ) * ty + m( 2, 0 ) * tz ),
+                  m( 0, 1 ),
+                  m( 1, 1 ),
+                  m( 2, 1 ),
+                  -( m( 0, 1 ) * tx + m( 1, 1 ) * ty + m( 2, 1 ) * tz ),
+                  m( 0, 2 ),
+                  m( 1, 2 ),
+                  m( 2, 2 ),
+                  -( m( 0, 2 ) * tx + m( 1, 2 ) * ty + m( 2, 2 ) * tz ),
+                  0.0f,
+                  0.0f,
+                  0.0f,
+                  1.0f );
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -14,6 +14,7 @@
 
 #include <gm/gm.h>
 
+#include <gm/types/quatf.h>
 #include <gm/types/vec2f.h>
 #include <gm/types/vec3f.h>
 #include <gm/types/vec4f.h>
@@ -55,4 +56,15 @@ GM_HOST_DEVICE inline float Length( const Vec4f& i_vector )
     return sqrt( LengthSquared( i_vector ) );
 }
 
+/// Compute the length of the vector \p i_vector.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vector The input vector.
+///
+/// \return The length of the vector.
+GM_HOST_DEVICE inline float Length( const Quatf& i_vector )
+{
+    return sqrt( LengthSquared( i_vector ) );
+}
+
 GM_NS_CLOSE
\ No newline at end of file
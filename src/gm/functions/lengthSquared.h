@@ -13,6 +13,7 @@
 
 #include <gm/gm.h>
 
+#include <gm/types/quatf.h>
 #include <gm/types/vec2f.h>
 #include <gm/types/vec3f.h>
 #include <gm/types/vec4f.h>
@@ -54,4 +55,15 @@ GM_HOST_DEVICE inline float LengthSquared( const Vec4f& i_vector )
     return DotProduct( i_vector, i_vector );
 }
 
+/// Compute the length squared of the vector \p i_vector.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vector The input vector.
+///
+/// \return the length squared of the vector.
+GM_HOST_DEVICE inline float LengthSquared( const Quatf& i_vector )
+{
+    return DotProduct( i_vector, i_vector );
+}
+
 GM_NS_CLOSE
\ No newline at end of file
@@ -22,6 +22,8 @@
 #include <gm/types/mat3f.h>
 #include <gm/types/mat4f.h>
 
+#include <gm/base/simd.h>
+
 GM_NS_OPEN
 
 /// Multiply input matrices \p i_lhs and \p i_rhs
@@ -55,6 +57,36 @@ GM_HOST_DEVICE inline Mat3f MatrixProduct( const Mat3f& i_lhs, const Mat3f& i_rh
 /// \return The matrix product.
 GM_HOST_DEVICE inline Mat4f MatrixProduct( const Mat4f& i_lhs, const Mat4f& i_rhs )
 {
+#if defined( GM_SIMD_SSE_ENABLED )
+    // Each row of the product is the linear combination of the rows of i_rhs, weighted by the
+    // elements of the corresponding row of i_lhs.
+    const float* lhsData      = i_lhs.Data();
+    const float* rhsData      = i_rhs.Data();
+    __m128       rhsRows[ 4 ] = {_mm_loadu_ps( rhsData + 0 ),
+                           _mm_loadu_ps( rhsData + 4 ),
+                           _mm_loadu_ps( rhsData + 8 ),
+                           _mm_loadu_ps( rhsData + 12 )};
+
+    Mat4f  product;
+    float* productData = product.Data();
+    for ( int row = 0; row < 4; ++row )
+    {
+        const float* lhsRow     = lhsData + row * 4;
+        __m128       productRow = _mm_mul_ps( _mm_set1_ps( lhsRow[ 0 ] ), rhsRows[ 0 ] );
+#if defined( GM_SIMD_AVX2_ENABLED )
+        productRow = _mm_fmadd_ps( _mm_set1_ps( lhsRow[ 1 ] ), rhsRows[ 1 ], productRow );
+        productRow = _mm_fmadd_ps( _mm_set1_ps( lhsRow[ 2 ] ), rhsRows[ 2 ], productRow );
+        productRow = _mm_fmadd_ps( _mm_set1_ps( lhsRow[ 3 ] ), rhsRows[ 3 ], productRow );
+#else
+        productRow = _mm_add_ps( productRow, _mm_mul_ps( _mm_set1_ps( lhsRow[ 1 ] ), rhsRows[ 1 ] ) );
+        productRow = _mm_add_ps( productRow, _mm_mul_ps( _mm_set1_ps( lhsRow[ 2 ] ), rhsRows[ 2 ] ) );
+        productRow = _mm_add_ps( productRow, _mm_mul_ps( _mm_set1_ps( lhsRow[ 3 ] ), rhsRows[ 3 ] ) );
+#endif
+        _mm_storeu_ps( productData + row * 4, productRow );
+    }
+
+    return product;
+#else
     return Mat4f( i_lhs( 0, 0 ) * i_rhs( 0, 0 ) + i_lhs( 0, 1 ) * i_rhs( 1, 0 ) + i_lhs( 0, 2 ) * i_rhs( 2, 0 ) +
                       i_lhs( 0, 3 ) * i_rhs( 3, 0 ),
                   i_lhs( 0, 0 ) * i_rhs( 0, 1 ) + i_lhs( 0, 1 ) * i_rhs( 1, 1 ) + i_lhs( 0, 2 ) * i_rhs( 2, 1 ) +
@@ -87,6 +119,7 @@ GM_HOST_DEVICE inline Mat4f MatrixProduct( const Mat4f& i_lhs, const Mat4f& i_rh
                       i_lhs( 3, 3 ) * i_rhs( 3, 2 ),
                   i_lhs( 3, 0 ) * i_rhs( 0, 3 ) + i_lhs( 3, 1 ) * i_rhs( 1, 3 ) + i_lhs( 3, 2 ) * i_rhs( 2, 3 ) +
                       i_lhs( 3, 3 ) * i_rhs( 3, 3 ) );
+#endif
 }
 
 GM_NS_CLOSE
\ No newline at end of file
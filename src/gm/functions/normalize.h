@@ -14,6 +14,7 @@
 
 #include <gm/gm.h>
 
+#include <gm/types/quatf.h>
 #include <gm/types/vec2f.h>
 #include <gm/types/vec3f.h>
 #include <gm/types/vec4f.h>
@@ -62,4 +63,17 @@ GM_HOST_DEVICE inline Vec4f Normalize( const Vec4f& i_vector )
     return i_vector / length;
 }
 
+/// Compute the normalised vector from the input vector \p i_vector.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_vector Input vector.
+///
+/// \return Normalised vector.
+GM_HOST_DEVICE inline Quatf Normalize( const Quatf& i_vector )
+{
+    float length = Length( i_vector );
+    GM_ASSERT( length != 0.0f );
+    return i_vector / length;
+}
+
 GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,52 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/normalizedLinearInterpolation.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Normalized linear interpolation (nlerp).
+///
+/// Linearly interpolate from a source to target unit quaternion, then normalize the result:
+///
+/// \f[ \frac{(1-w)S+wT}{\lVert(1-w)S+wT\rVert}=V \f]
+///
+/// The interpolated rotation follows the same arc as \ref SphericalLinearInterpolation, without trigonometric
+/// functions, at the cost of a non-constant angular velocity.  This is a good approximation for closely
+/// spaced rotations, such as consecutive animation keys.
+///
+/// The shortest of the two arcs is taken, by negating the target if required.
+
+#include <gm/gm.h>
+
+#include <gm/types/quatf.h>
+
+#include <gm/functions/dotProduct.h>
+#include <gm/functions/normalize.h>
+
+GM_NS_OPEN
+
+/// Linearly interpolate between the unit quaternions \p i_source and \p i_target, with weight \p i_weight,
+/// then normalize.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_source Source unit quaternion to interpolate from.
+/// \param i_target Target unit quaternion to interpolate to.
+/// \param i_weight Describes the percentage of \p i_target in the final, interpolated value.
+///
+/// \pre \p i_weight must be in the range of [0,1].
+///
+/// \return Interpolated unit quaternion.
+GM_HOST_DEVICE inline Quatf
+NormalizedLinearInterpolation( const Quatf& i_source, const Quatf& i_target, const float& i_weight )
+{
+    GM_ASSERT_MSG( i_weight >= 0.0f && i_weight <= 1.0f, "Expected i_weight between [0,1], got %f\n", i_weight );
+
+    // Take the shortest arc.
+    const float targetWeight = DotProduct( i_source, i_target ) < 0.0f ? -i_weight : i_weight;
+    return Normalize( i_source * ( 1.0f - i_weight ) + i_target * targetWeight );
+}
+
+GM_NS_CLOSE
\ No newline at end of file
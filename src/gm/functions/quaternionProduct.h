@@ -0,0 +1,38 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/quaternionProduct.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Quaternion product.
+///
+/// Compute the Hamilton product of two quaternions, composing their rotations.
+
+#include <gm/gm.h>
+
+#include <gm/types/quatf.h>
+
+GM_NS_OPEN
+
+/// Compute the product of two quaternions \p i_lhs and \p i_rhs.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// The product of two unit quaternions is the rotation of \p i_rhs, followed by the rotation of \p i_lhs,
+/// like the product of their rotation matrices.
+///
+/// \param i_lhs Left hand side quaternion.
+/// \param i_rhs Right hand side quaternion.
+///
+/// \return The quaternion product.
+GM_HOST_DEVICE inline Quatf QuaternionProduct( const Quatf& i_lhs, const Quatf& i_rhs )
+{
+    return Quatf( i_lhs.W() * i_rhs.X() + i_lhs.X() * i_rhs.W() + i_lhs.Y() * i_rhs.Z() - i_lhs.Z() * i_rhs.Y(),
+                  i_lhs.W() * i_rhs.Y() - i_lhs.X() * i_rhs.Z() + i_lhs.Y() * i_rhs.W() + i_lhs.Z() * i_rhs.X(),
+                  i_lhs.W() * i_rhs.Z() + i_lhs.X() * i_rhs.Y() - i_lhs.Y() * i_rhs.X() + i_lhs.Z() * i_rhs.W(),
+                  i_lhs.W() * i_rhs.W() - i_lhs.X() * i_rhs.X() - i_lhs.Y() * i_rhs.Y() - i_lhs.Z() * i_rhs.Z() );
+}
+
+GM_NS_CLOSE
\ No newline at end of file
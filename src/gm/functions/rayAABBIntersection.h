@@ -42,9 +42,16 @@
 #include <gm/gm.h>
 
 #include <gm/types/floatRange.h>
+#include <gm/types/floatRangePacket16.h>
+#include <gm/types/floatRangePacket4.h>
+#include <gm/types/floatRangePacket8.h>
+#include <gm/types/ray.h>
 #include <gm/types/vec2f.h>
 #include <gm/types/vec2fRange.h>
 #include <gm/types/vec3f.h>
+#include <gm/types/vec3fPacket16.h>
+#include <gm/types/vec3fPacket4.h>
+#include <gm/types/vec3fPacket8.h>
 #include <gm/types/vec3fRange.h>
 #include <gm/types/vec4f.h>
 #include <gm/types/vec4fRange.h>
@@ -59,6 +66,10 @@
 #include <gm/functions/min.h>
 #include <gm/functions/rayPosition.h>
 
+#include <gm/base/simd.h>
+
+#include <limits>
+
 GM_NS_OPEN
 
 /// Check if a ray intersects a axis-aligned bounding box (AABB).
@@ -87,8 +98,8 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec2f&      i_rayOrigin,
     {
         float inverseAxisDir = 1.0f / i_rayDirection[ 0 ];
 
-        gm::FloatRange axisIntersections( ( i_aabb.Min()[ 0 ] - i_rayOrigin[ 0 ] ) * inverseAxisDir,
-                                          ( i_aabb.Max()[ 0 ] - i_rayOrigin[ 0 ] ) * inverseAxisDir );
+        FloatRange axisIntersections( ( i_aabb.Min()[ 0 ] - i_rayOrigin[ 0 ] ) * inverseAxisDir,
+                                      ( i_aabb.Max()[ 0 ] - i_rayOrigin[ 0 ] ) * inverseAxisDir );
 
         // Handle negative ray direction on this particular axis.
         if ( inverseAxisDir < 0.0f )
@@ -97,7 +108,7 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec2f&      i_rayOrigin,
         }
 
         // Find the intersection of the local axis and global magnitudes.  This "narrows" the bounded region.
-        o_intersections = gm::Intersection( o_intersections, axisIntersections );
+        o_intersections = Intersection( o_intersections, axisIntersections );
 
         // If there is no overlap, then intersections will be empty.
         if ( o_intersections.IsEmpty() )
@@ -111,8 +122,8 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec2f&      i_rayOrigin,
     {
         float inverseAxisDir = 1.0f / i_rayDirection[ 1 ];
 
-        gm::FloatRange axisIntersections( ( i_aabb.Min()[ 1 ] - i_rayOrigin[ 1 ] ) * inverseAxisDir,
-                                          ( i_aabb.Max()[ 1 ] - i_rayOrigin[ 1 ] ) * inverseAxisDir );
+        FloatRange axisIntersections( ( i_aabb.Min()[ 1 ] - i_rayOrigin[ 1 ] ) * inverseAxisDir,
+                                      ( i_aabb.Max()[ 1 ] - i_rayOrigin[ 1 ] ) * inverseAxisDir );
 
         // Handle negative ray direction on this particular axis.
         if ( inverseAxisDir < 0.0f )
@@ -121,7 +132,7 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec2f&      i_rayOrigin,
         }
 
         // Find the intersection of the local axis and global magnitudes.  This "narrows" the bounded region.
-        o_intersections = gm::Intersection( o_intersections, axisIntersections );
+        o_intersections = Intersection( o_intersections, axisIntersections );
 
         // If there is no overlap, then intersections will be empty.
         if ( o_intersections.IsEmpty() )
@@ -159,8 +170,8 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec3f&      i_rayOrigin,
     {
         float inverseAxisDir = 1.0f / i_rayDirection[ 0 ];
 
-        gm::FloatRange axisIntersections( ( i_aabb.Min()[ 0 ] - i_rayOrigin[ 0 ] ) * inverseAxisDir,
-                                          ( i_aabb.Max()[ 0 ] - i_rayOrigin[ 0 ] ) * inverseAxisDir );
+        FloatRange axisIntersections( ( i_aabb.Min()[ 0 ] - i_rayOrigin[ 0 ] ) * inverseAxisDir,
+                                      ( i_aabb.Max()[ 0 ] - i_rayOrigin[ 0 ] ) * inverseAxisDir );
 
         // Handle negative ray direction on this particular axis.
         if ( inverseAxisDir < 0.0f )
@@ -169,7 +180,7 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec3f&      i_rayOrigin,
         }
 
         // Find the intersection of the local axis and global magnitudes.  This "narrows" the bounded region.
-        o_intersections = gm::Intersection( o_intersections, axisIntersections );
+        o_intersections = Intersection( o_intersections, axisIntersections );
 
         // If there is no overlap, then intersections will be empty.
         if ( o_intersections.IsEmpty() )
@@ -183,8 +194,8 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec3f&      i_rayOrigin,
     {
         float inverseAxisDir = 1.0f / i_rayDirection[ 1 ];
 
-        gm::FloatRange axisIntersections( ( i_aabb.Min()[ 1 ] - i_rayOrigin[ 1 ] ) * inverseAxisDir,
-                                          ( i_aabb.Max()[ 1 ] - i_rayOrigin[ 1 ] ) * inverseAxisDir );
+        FloatRange axisIntersections( ( i_aabb.Min()[ 1 ] - i_rayOrigin[ 1 ] ) * inverseAxisDir,
+                                      ( i_aabb.Max()[ 1 ] - i_rayOrigin[ 1 ] ) * inverseAxisDir );
 
         // Handle negative ray direction on this particular axis.
         if ( inverseAxisDir < 0.0f )
@@ -193,7 +204,7 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec3f&      i_rayOrigin,
         }
 
         // Find the intersection of the local axis and global magnitudes.  This "narrows" the bounded region.
-        o_intersections = gm::Intersection( o_intersections, axisIntersections );
+        o_intersections = Intersection( o_intersections, axisIntersections );
 
         // If there is no overlap, then intersections will be empty.
         if ( o_intersections.IsEmpty() )
@@ -207,8 +218,8 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec3f&      i_rayOrigin,
     {
         float inverseAxisDir = 1.0f / i_rayDirection[ 2 ];
 
-        gm::FloatRange axisIntersections( ( i_aabb.Min()[ 2 ] - i_rayOrigin[ 2 ] ) * inverseAxisDir,
-                                          ( i_aabb.Max()[ 2 ] - i_rayOrigin[ 2 ] ) * inverseAxisDir );
+        FloatRange axisIntersections( ( i_aabb.Min()[ 2 ] - i_rayOrigin[ 2 ] ) * inverseAxisDir,
+                                      ( i_aabb.Max()[ 2 ] - i_rayOrigin[ 2 ] ) * inverseAxisDir );
 
         // Handle negative ray direction on this particular axis.
         if ( inverseAxisDir < 0.0f )
@@ -217,7 +228,7 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec3f&      i_rayOrigin,
         }
 
         // Find the intersection of the local axis and global magnitudes.  This "narrows" the bounded region.
-        o_intersections = gm::Intersection( o_intersections, axisIntersections );
+        o_intersections = Intersection( o_intersections, axisIntersections );
 
         // If there is no overlap, then intersections will be empty.
         if ( o_intersections.IsEmpty() )
@@ -255,8 +266,8 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec4f&      i_rayOrigin,
     {
         float inverseAxisDir = 1.0f / i_rayDirection[ 0 ];
 
-        gm::FloatRange axisIntersections( ( i_aabb.Min()[ 0 ] - i_rayOrigin[ 0 ] ) * inverseAxisDir,
-                                          ( i_aabb.Max()[ 0 ] - i_rayOrigin[ 0 ] ) * inverseAxisDir );
+        FloatRange axisIntersections( ( i_aabb.Min()[ 0 ] - i_rayOrigin[ 0 ] ) * inverseAxisDir,
+                                      ( i_aabb.Max()[ 0 ] - i_rayOrigin[ 0 ] ) * inverseAxisDir );
 
         // Handle negative ray direction on this particular axis.
         if ( inverseAxisDir < 0.0f )
@@ -265,7 +276,7 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec4f&      i_rayOrigin,
         }
 
         // Find the intersection of the local axis and global magnitudes.  This "narrows" the bounded region.
-        o_intersections = gm::Intersection( o_intersections, axisIntersections );
+        o_intersections = Intersection( o_intersections, axisIntersections );
 
         // If there is no overlap, then intersections will be empty.
         if ( o_intersections.IsEmpty() )
@@ -279,8 +290,8 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec4f&      i_rayOrigin,
     {
         float inverseAxisDir = 1.0f / i_rayDirection[ 1 ];
 
-        gm::FloatRange axisIntersections( ( i_aabb.Min()[ 1 ] - i_rayOrigin[ 1 ] ) * inverseAxisDir,
-                                          ( i_aabb.Max()[ 1 ] - i_rayOrigin[ 1 ] ) * inverseAxisDir );
+        FloatRange axisIntersections( ( i_aabb.Min()[ 1 ] - i_rayOrigin[ 1 ] ) * inverseAxisDir,
+                                      ( i_aabb.Max()[ 1 ] - i_rayOrigin[ 1 ] ) * inverseAxisDir );
 
         // Handle negative ray direction on this particular axis.
         if ( inverseAxisDir < 0.0f )
@@ -289,7 +300,7 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec4f&      i_rayOrigin,
         }
 
         // Find the intersection of the local axis and global magnitudes.  This "narrows" the bounded region.
-        o_intersections = gm::Intersection( o_intersections, axisIntersections );
+        o_intersections = Intersection( o_intersections, axisIntersections );
 
         // If there is no overlap, then intersections will be empty.
         if ( o_intersections.IsEmpty() )
@@ -303,8 +314,8 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec4f&      i_rayOrigin,
     {
         float inverseAxisDir = 1.0f / i_rayDirection[ 2 ];
 
-        gm::FloatRange axisIntersections( ( i_aabb.Min()[ 2 ] - i_rayOrigin[ 2 ] ) * inverseAxisDir,
-                                          ( i_aabb.Max()[ 2 ] - i_rayOrigin[ 2 ] ) * inverseAxisDir );
+        FloatRange axisIntersections( ( i_aabb.Min()[ 2 ] - i_rayOrigin[ 2 ] ) * inverseAxisDir,
+                                      ( i_aabb.Max()[ 2 ] - i_rayOrigin[ 2 ] ) * inverseAxisDir );
 
         // Handle negative ray direction on this particular axis.
         if ( inverseAxisDir < 0.0f )
@@ -313,7 +324,7 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec4f&      i_rayOrigin,
         }
 
         // Find the intersection of the local axis and global magnitudes.  This "narrows" the bounded region.
-        o_intersections = gm::Intersection( o_intersections, axisIntersections );
+        o_intersections = Intersection( o_intersections, axisIntersections );
 
         // If there is no overlap, then intersections will be empty.
         if ( o_intersections.IsEmpty() )
@@ -327,8 +338,8 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec4f&      i_rayOrigin,
     {
         float inverseAxisDir = 1.0f / i_rayDirection[ 3 ];
 
-        gm::FloatRange axisIntersections( ( i_aabb.Min()[ 3 ] - i_rayOrigin[ 3 ] ) * inverseAxisDir,
-                                          ( i_aabb.Max()[ 3 ] - i_rayOrigin[ 3 ] ) * inverseAxisDir );
+        FloatRange axisIntersections( ( i_aabb.Min()[ 3 ] - i_rayOrigin[ 3 ] ) * inverseAxisDir,
+                                      ( i_aabb.Max()[ 3 ] - i_rayOrigin[ 3 ] ) * inverseAxisDir );
 
         // Handle negative ray direction on this particular axis.
         if ( inverseAxisDir < 0.0f )
@@ -337,7 +348,7 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec4f&      i_rayOrigin,
         }
 
         // Find the intersection of the local axis and global magnitudes.  This "narrows" the bounded region.
-        o_intersections = gm::Intersection( o_intersections, axisIntersections );
+        o_intersections = Intersection( o_intersections, axisIntersections );
 
         // If there is no overlap, then intersections will be empty.
         if ( o_intersections.IsEmpty() )
@@ -349,4 +360,589 @@ GM_HOST_DEVICE inline bool RayAABBIntersection( const Vec4f&      i_rayOrigin,
     return true;
 }
 
+/// Check if a ray intersects a axis-aligned bounding box (AABB).
+///
+/// The ray caches the reciprocal of its direction and the sign of each axis, such that each axis
+/// intersection is computed with multiplications only, and the near and far planes are selected
+/// by the sign without swapping.  Prefer this overload when testing a ray against many AABBs.
+///
+/// \param i_ray The ray.
+/// \param i_aabb The axis-aligned bounding box.
+/// \param o_intersections The output ray magnitudes intersecting the AABB.
+/// If there are no intersections, then o_intersections will be undefined.
+///
+/// \retval true The ray intersects the AABB.
+/// \retval false The ray does not intersect the AABB.
+GM_HOST_DEVICE inline bool
+RayAABBIntersection( const Ray& i_ray, const Vec3fRange& i_aabb, FloatRange& o_intersections )
+{
+    GM_ASSERT_MSG( AlmostEqual( Length( i_ray.Direction() ), 1.0f ), "Direction of i_ray is not normalised!" );
+
+    // Initialize intersection magnitudes to ray limits.
+    float minMagnitude = 0.0f;
+    float maxMagnitude = std::numeric_limits< float >::max();
+
+    // Narrow the magnitudes by the intersections of the near and far planes of axis 0.
+    {
+        const Vec3f& nearPlanes = i_ray.DirectionSign()[ 0 ] ? i_aabb.Max() : i_aabb.Min();
+        const Vec3f& farPlanes  = i_ray.DirectionSign()[ 0 ] ? i_aabb.Min() : i_aabb.Max();
+        float        axisMin    = ( nearPlanes[ 0 ] - i_ray.Origin()[ 0 ] ) * i_ray.InverseDirection()[ 0 ];
+        float        axisMax    = ( farPlanes[ 0 ] - i_ray.Origin()[ 0 ] ) * i_ray.InverseDirection()[ 0 ];
+
+        // The accumulated magnitudes are the first operand, such that they are preserved over NaN axis
+        // intersections.
+        minMagnitude = Max( minMagnitude, axisMin );
+        maxMagnitude = Min( maxMagnitude, axisMax );
+    }
+
+    // Narrow the magnitudes by the intersections of the near and far planes of axis 1.
+    {
+        const Vec3f& nearPlanes = i_ray.DirectionSign()[ 1 ] ? i_aabb.Max() : i_aabb.Min();
+        const Vec3f& farPlanes  = i_ray.DirectionSign()[ 1 ] ? i_aabb.Min() : i_aabb.Max();
+        float        axisMin    = ( nearPlanes[ 1 ] - i_ray.Origin()[ 1 ] ) * i_ray.InverseDirection()[ 1 ];
+        float        axisMax    = ( farPlanes[ 1 ] - i_ray.Origin()[ 1 ] ) * i_ray.InverseDirection()[ 1 ];
+
+        // The accumulated magnitudes are the first operand, such that they are preserved over NaN axis
+        // intersections.
+        minMagnitude = Max( minMagnitude, axisMin );
+        maxMagnitude = Min( maxMagnitude, axisMax );
+    }
+
+    // Narrow the magnitudes by the intersections of the near and far planes of axis 2.
+    {
+        const Vec3f& nearPlanes = i_ray.DirectionSign()[ 2 ] ? i_aabb.Max() : i_aabb.Min();
+        const Vec3f& farPlanes  = i_ray.DirectionSign()[ 2 ] ? i_aabb.Min() : i_aabb.Max();
+        float        axisMin    = ( nearPlanes[ 2 ] - i_ray.Origin()[ 2 ] ) * i_ray.InverseDirection()[ 2 ];
+        float        axisMax    = ( farPlanes[ 2 ] - i_ray.Origin()[ 2 ] ) * i_ray.InverseDirection()[ 2 ];
+
+        // The accumulated magnitudes are the first operand, such that they are preserved over NaN axis
+        // intersections.
+        minMagnitude = Max( minMagnitude, axisMin );
+        maxMagnitude = Min( maxMagnitude, axisMax );
+    }
+
+    o_intersections.Min() = minMagnitude;
+    o_intersections.Max() = maxMagnitude;
+
+    return minMagnitude <= maxMagnitude;
+}
+
+/// Check if each ray of a packet of 4 rays intersects a single axis-aligned bounding box (AABB).
+///
+/// The AABB is loaded once and tested against all the rays at once, using SIMD instructions if enabled
+/// (see base/simd.h).
+///
+/// \param i_rayOrigin The origins of the rays.
+/// \param i_rayDirection The directions of the rays.
+/// \param i_aabb The axis-aligned bounding box.
+/// \param o_intersections The output ray magnitudes intersecting the AABB, per ray.
+/// The magnitudes of rays which do not intersect the AABB will be undefined.
+///
+/// \return The hit mask, where bit \p N is set if the ray in lane \p N intersects the AABB.
+GM_HOST_DEVICE inline int RayAABBIntersection( const Vec3fPacket4& i_rayOrigin,
+                                               const Vec3fPacket4& i_rayDirection,
+                                               const Vec3fRange&   i_aabb,
+                                               FloatRangePacket4&  o_intersections )
+{
+    int hitMask = 0;
+#if defined( GM_SIMD_SSE_ENABLED )
+    for ( size_t laneOffset = 0; laneOffset < 4; laneOffset += 4 )
+    {
+        // Initialize intersection magnitudes to ray limits.
+        __m128 minMagnitudes = _mm_setzero_ps();
+        __m128 maxMagnitudes = _mm_set1_ps( std::numeric_limits< float >::max() );
+
+        // Narrow the magnitudes by the ordered intersections of axis 0.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            __m128 inverseAxisDir =
+                _mm_div_ps( _mm_set1_ps( 1.0f ), _mm_load_ps( i_rayDirection.Lanes( 0 ) + laneOffset ) );
+            __m128 axisOrigin = _mm_load_ps( i_rayOrigin.Lanes( 0 ) + laneOffset );
+            __m128 axisMin = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Min()[ 0 ] ), axisOrigin ), inverseAxisDir );
+            __m128 axisMax = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Max()[ 0 ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes  = _mm_max_ps( _mm_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes  = _mm_min_ps( _mm_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 1.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            __m128 inverseAxisDir =
+                _mm_div_ps( _mm_set1_ps( 1.0f ), _mm_load_ps( i_rayDirection.Lanes( 1 ) + laneOffset ) );
+            __m128 axisOrigin = _mm_load_ps( i_rayOrigin.Lanes( 1 ) + laneOffset );
+            __m128 axisMin = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Min()[ 1 ] ), axisOrigin ), inverseAxisDir );
+            __m128 axisMax = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Max()[ 1 ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes  = _mm_max_ps( _mm_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes  = _mm_min_ps( _mm_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 2.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            __m128 inverseAxisDir =
+                _mm_div_ps( _mm_set1_ps( 1.0f ), _mm_load_ps( i_rayDirection.Lanes( 2 ) + laneOffset ) );
+            __m128 axisOrigin = _mm_load_ps( i_rayOrigin.Lanes( 2 ) + laneOffset );
+            __m128 axisMin = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Min()[ 2 ] ), axisOrigin ), inverseAxisDir );
+            __m128 axisMax = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Max()[ 2 ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes  = _mm_max_ps( _mm_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes  = _mm_min_ps( _mm_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+        _mm_store_ps( o_intersections.Lanes( 0 ) + laneOffset, minMagnitudes );
+        _mm_store_ps( o_intersections.Lanes( 1 ) + laneOffset, maxMagnitudes );
+
+        // Rays with overlapping intersections across all axis intersect the AABB.
+        hitMask |= _mm_movemask_ps( _mm_cmple_ps( minMagnitudes, maxMagnitudes ) ) << laneOffset;
+    }
+#else
+    for ( size_t laneIndex = 0; laneIndex < 4; ++laneIndex )
+    {
+        // Initialize intersection magnitudes to ray limits.
+        float minMagnitude = 0.0f;
+        float maxMagnitude = std::numeric_limits< float >::max();
+
+        // Narrow the magnitudes by the ordered intersections of axis 0.
+        {
+            float inverseAxisDir = 1.0f / i_rayDirection( 0, laneIndex );
+            float axisMin        = ( i_aabb.Min()[ 0 ] - i_rayOrigin( 0, laneIndex ) ) * inverseAxisDir;
+            float axisMax        = ( i_aabb.Max()[ 0 ] - i_rayOrigin( 0, laneIndex ) ) * inverseAxisDir;
+            if ( inverseAxisDir < 0.0f )
+            {
+                std::swap( axisMin, axisMax );
+            }
+
+            // The accumulated magnitudes are the first operand, such that they are preserved over NaN axis
+            // intersections.
+            minMagnitude = Max( minMagnitude, axisMin );
+            maxMagnitude = Min( maxMagnitude, axisMax );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 1.
+        {
+            float inverseAxisDir = 1.0f / i_rayDirection( 1, laneIndex );
+            float axisMin        = ( i_aabb.Min()[ 1 ] - i_rayOrigin( 1, laneIndex ) ) * inverseAxisDir;
+            float axisMax        = ( i_aabb.Max()[ 1 ] - i_rayOrigin( 1, laneIndex ) ) * inverseAxisDir;
+            if ( inverseAxisDir < 0.0f )
+            {
+                std::swap( axisMin, axisMax );
+            }
+
+            // The accumulated magnitudes are the first operand, such that they are preserved over NaN axis
+            // intersections.
+            minMagnitude = Max( minMagnitude, axisMin );
+            maxMagnitude = Min( maxMagnitude, axisMax );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 2.
+        {
+            float inverseAxisDir = 1.0f / i_rayDirection( 2, laneIndex );
+            float axisMin        = ( i_aabb.Min()[ 2 ] - i_rayOrigin( 2, laneIndex ) ) * inverseAxisDir;
+            float axisMax        = ( i_aabb.Max()[ 2 ] - i_rayOrigin( 2, laneIndex ) ) * inverseAxisDir;
+            if ( inverseAxisDir < 0.0f )
+            {
+                std::swap( axisMin, axisMax );
+            }
+
+            // The accumulated magnitudes are the first operand, such that they are preserved over NaN axis
+            // intersections.
+            minMagnitude = Max( minMagnitude, axisMin );
+            maxMagnitude = Min( maxMagnitude, axisMax );
+        }
+
+        o_intersections( 0, laneIndex ) = minMagnitude;
+        o_intersections( 1, laneIndex ) = maxMagnitude;
+
+        // Rays with overlapping intersections across all axis intersect the AABB.
+        if ( minMagnitude <= maxMagnitude )
+        {
+            hitMask |= 1 << laneIndex;
+        }
+    }
+#endif
+
+    return hitMask;
+}
+
+/// Check if each ray of a packet of 8 rays intersects a single axis-aligned bounding box (AABB).
+///
+/// The AABB is loaded once and tested against all the rays at once, using SIMD instructions if enabled
+/// (see base/simd.h).
+///
+/// \param i_rayOrigin The origins of the rays.
+/// \param i_rayDirection The directions of the rays.
+/// \param i_aabb The axis-aligned bounding box.
+/// \param o_intersections The output ray magnitudes intersecting the AABB, per ray.
+/// The magnitudes of rays which do not intersect the AABB will be undefined.
+///
+/// \return The hit mask, where bit \p N is set if the ray in lane \p N intersects the AABB.
+GM_HOST_DEVICE inline int RayAABBIntersection( const Vec3fPacket8& i_rayOrigin,
+                                               const Vec3fPacket8& i_rayDirection,
+                                               const Vec3fRange&   i_aabb,
+                                               FloatRangePacket8&  o_intersections )
+{
+    int hitMask = 0;
+#if defined( GM_SIMD_AVX2_ENABLED )
+    for ( size_t laneOffset = 0; laneOffset < 8; laneOffset += 8 )
+    {
+        // Initialize intersection magnitudes to ray limits.
+        __m256 minMagnitudes = _mm256_setzero_ps();
+        __m256 maxMagnitudes = _mm256_set1_ps( std::numeric_limits< float >::max() );
+
+        // Narrow the magnitudes by the ordered intersections of axis 0.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            __m256 inverseAxisDir =
+                _mm256_div_ps( _mm256_set1_ps( 1.0f ), _mm256_load_ps( i_rayDirection.Lanes( 0 ) + laneOffset ) );
+            __m256 axisOrigin = _mm256_load_ps( i_rayOrigin.Lanes( 0 ) + laneOffset );
+            __m256 axisMin =
+                _mm256_mul_ps( _mm256_sub_ps( _mm256_set1_ps( i_aabb.Min()[ 0 ] ), axisOrigin ), inverseAxisDir );
+            __m256 axisMax =
+                _mm256_mul_ps( _mm256_sub_ps( _mm256_set1_ps( i_aabb.Max()[ 0 ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes = _mm256_max_ps( _mm256_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes = _mm256_min_ps( _mm256_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 1.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            __m256 inverseAxisDir =
+                _mm256_div_ps( _mm256_set1_ps( 1.0f ), _mm256_load_ps( i_rayDirection.Lanes( 1 ) + laneOffset ) );
+            __m256 axisOrigin = _mm256_load_ps( i_rayOrigin.Lanes( 1 ) + laneOffset );
+            __m256 axisMin =
+                _mm256_mul_ps( _mm256_sub_ps( _mm256_set1_ps( i_aabb.Min()[ 1 ] ), axisOrigin ), inverseAxisDir );
+            __m256 axisMax =
+                _mm256_mul_ps( _mm256_sub_ps( _mm256_set1_ps( i_aabb.Max()[ 1 ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes = _mm256_max_ps( _mm256_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes = _mm256_min_ps( _mm256_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 2.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            __m256 inverseAxisDir =
+                _mm256_div_ps( _mm256_set1_ps( 1.0f ), _mm256_load_ps( i_rayDirection.Lanes( 2 ) + laneOffset ) );
+            __m256 axisOrigin = _mm256_load_ps( i_rayOrigin.Lanes( 2 ) + laneOffset );
+            __m256 axisMin =
+                _mm256_mul_ps( _mm256_sub_ps( _mm256_set1_ps( i_aabb.Min()[ 2 ] ), axisOrigin ), inverseAxisDir );
+            __m256 axisMax =
+                _mm256_mul_ps( _mm256_sub_ps( _mm256_set1_ps( i_aabb.Max()[ 2 ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes = _mm256_max_ps( _mm256_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes = _mm256_min_ps( _mm256_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+        _mm256_store_ps( o_intersections.Lanes( 0 ) + laneOffset, minMagnitudes );
+        _mm256_store_ps( o_intersections.Lanes( 1 ) + laneOffset, maxMagnitudes );
+
+        // Rays with overlapping intersections across all axis intersect the AABB.
+        hitMask |= _mm256_movemask_ps( _mm256_cmp_ps( minMagnitudes, maxMagnitudes, _CMP_LE_OQ ) ) << laneOffset;
+    }
+#elif defined( GM_SIMD_SSE_ENABLED )
+    for ( size_t laneOffset = 0; laneOffset < 8; laneOffset += 4 )
+    {
+        // Initialize intersection magnitudes to ray limits.
+        __m128 minMagnitudes = _mm_setzero_ps();
+        __m128 maxMagnitudes = _mm_set1_ps( std::numeric_limits< float >::max() );
+
+        // Narrow the magnitudes by the ordered intersections of axis 0.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            __m128 inverseAxisDir =
+                _mm_div_ps( _mm_set1_ps( 1.0f ), _mm_load_ps( i_rayDirection.Lanes( 0 ) + laneOffset ) );
+            __m128 axisOrigin = _mm_load_ps( i_rayOrigin.Lanes( 0 ) + laneOffset );
+            __m128 axisMin = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Min()[ 0 ] ), axisOrigin ), inverseAxisDir );
+            __m128 axisMax = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Max()[ 0 ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes  = _mm_max_ps( _mm_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes  = _mm_min_ps( _mm_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 1.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            __m128 inverseAxisDir =
+                _mm_div_ps( _mm_set1_ps( 1.0f ), _mm_load_ps( i_rayDirection.Lanes( 1 ) + laneOffset ) );
+            __m128 axisOrigin = _mm_load_ps( i_rayOrigin.Lanes( 1 ) + laneOffset );
+            __m128 axisMin = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Min()[ 1 ] ), axisOrigin ), inverseAxisDir );
+            __m128 axisMax = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Max()[ 1 ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes  = _mm_max_ps( _mm_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes  = _mm_min_ps( _mm_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 2.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            __m128 inverseAxisDir =
+                _mm_div_ps( _mm_set1_ps( 1.0f ), _mm_load_ps( i_rayDirection.Lanes( 2 ) + laneOffset ) );
+            __m128 axisOrigin = _mm_load_ps( i_rayOrigin.Lanes( 2 ) + laneOffset );
+            __m128 axisMin = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Min()[ 2 ] ), axisOrigin ), inverseAxisDir );
+            __m128 axisMax = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Max()[ 2 ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes  = _mm_max_ps( _mm_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes  = _mm_min_ps( _mm_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+        _mm_store_ps( o_intersections.Lanes( 0 ) + laneOffset, minMagnitudes );
+        _mm_store_ps( o_intersections.Lanes( 1 ) + laneOffset, maxMagnitudes );
+
+        // Rays with overlapping intersections across all axis intersect the AABB.
+        hitMask |= _mm_movemask_ps( _mm_cmple_ps( minMagnitudes, maxMagnitudes ) ) << laneOffset;
+    }
+#else
+    for ( size_t laneIndex = 0; laneIndex < 8; ++laneIndex )
+    {
+        // Initialize intersection magnitudes to ray limits.
+        float minMagnitude = 0.0f;
+        float maxMagnitude = std::numeric_limits< float >::max();
+
+        // Narrow the magnitudes by the ordered intersections of axis 0.
+        {
+            float inverseAxisDir = 1.0f / i_rayDirection( 0, laneIndex );
+            float axisMin        = ( i_aabb.Min()[ 0 ] - i_rayOrigin( 0, laneIndex ) ) * inverseAxisDir;
+            float axisMax        = ( i_aabb.Max()[ 0 ] - i_rayOrigin( 0, laneIndex ) ) * inverseAxisDir;
+            if ( inverseAxisDir < 0.0f )
+            {
+                std::swap( axisMin, axisMax );
+            }
+
+            // The accumulated magnitudes are the first operand, such that they are preserved over NaN axis
+            // intersections.
+            minMagnitude = Max( minMagnitude, axisMin );
+            maxMagnitude = Min( maxMagnitude, axisMax );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 1.
+        {
+            float inverseAxisDir = 1.0f / i_rayDirection( 1, laneIndex );
+            float axisMin        = ( i_aabb.Min()[ 1 ] - i_rayOrigin( 1, laneIndex ) ) * inverseAxisDir;
+            float axisMax        = ( i_aabb.Max()[ 1 ] - i_rayOrigin( 1, laneIndex ) ) * inverseAxisDir;
+            if ( inverseAxisDir < 0.0f )
+            {
+                std::swap( axisMin, axisMax );
+            }
+
+            // The accumulated magnitudes are the first operand, such that they are preserved over NaN axis
+            // intersections.
+            minMagnitude = Max( minMagnitude, axisMin );
+            maxMagnitude = Min( maxMagnitude, axisMax );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 2.
+        {
+            float inverseAxisDir = 1.0f / i_rayDirection( 2, laneIndex );
+            float axisMin        = ( i_aabb.Min()[ 2 ] - i_rayOrigin( 2, laneIndex ) ) * inverseAxisDir;
+            float axisMax        = ( i_aabb.Max()[ 2 ] - i_rayOrigin( 2, laneIndex ) ) * inverseAxisDir;
+            if ( inverseAxisDir < 0.0f )
+            {
+                std::swap( axisMin, axisMax );
+            }
+
+            // The accumulated magnitudes are the first operand, such that they are preserved over NaN axis
+            // intersections.
+            minMagnitude = Max( minMagnitude, axisMin );
+            maxMagnitude = Min( maxMagnitude, axisMax );
+        }
+
+        o_intersections( 0, laneIndex ) = minMagnitude;
+        o_intersections( 1, laneIndex ) = maxMagnitude;
+
+        // Rays with overlapping intersections across all axis intersect the AABB.
+        if ( minMagnitude <= maxMagnitude )
+        {
+            hitMask |= 1 << laneIndex;
+        }
+    }
+#endif
+
+    return hitMask;
+}
+
+/// Check if each ray of a packet of 16 rays intersects a single axis-aligned bounding box (AABB).
+///
+/// The AABB is loaded once and tested against all the rays at once, using SIMD instructions if enabled
+/// (see base/simd.h).
+///
+/// \param i_rayOrigin The origins of the rays.
+/// \param i_rayDirection The directions of the rays.
+/// \param i_aabb The axis-aligned bounding box.
+/// \param o_intersections The output ray magnitudes intersecting the AABB, per ray.
+/// The magnitudes of rays which do not intersect the AABB will be undefined.
+///
+/// \return The hit mask, where bit \p N is set if the ray in lane \p N intersects the AABB.
+GM_HOST_DEVICE inline int RayAABBIntersection( const Vec3fPacket16& i_rayOrigin,
+                                               const Vec3fPacket16& i_rayDirection,
+                                               const Vec3fRange&    i_aabb,
+                                               FloatRangePacket16&  o_intersections )
+{
+    int hitMask = 0;
+#if defined( GM_SIMD_AVX2_ENABLED )
+    for ( size_t laneOffset = 0; laneOffset < 16; laneOffset += 8 )
+    {
+        // Initialize intersection magnitudes to ray limits.
+        __m256 minMagnitudes = _mm256_setzero_ps();
+        __m256 maxMagnitudes = _mm256_set1_ps( std::numeric_limits< float >::max() );
+
+        // Narrow the magnitudes by the ordered intersections of axis 0.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            __m256 inverseAxisDir =
+                _mm256_div_ps( _mm256_set1_ps( 1.0f ), _mm256_load_ps( i_rayDirection.Lanes( 0 ) + laneOffset ) );
+            __m256 axisOrigin = _mm256_load_ps( i_rayOrigin.Lanes( 0 ) + laneOffset );
+            __m256 axisMin =
+                _mm256_mul_ps( _mm256_sub_ps( _mm256_set1_ps( i_aabb.Min()[ 0 ] ), axisOrigin ), inverseAxisDir );
+            __m256 axisMax =
+                _mm256_mul_ps( _mm256_sub_ps( _mm256_set1_ps( i_aabb.Max()[ 0 ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes = _mm256_max_ps( _mm256_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes = _mm256_min_ps( _mm256_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 1.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            __m256 inverseAxisDir =
+                _mm256_div_ps( _mm256_set1_ps( 1.0f ), _mm256_load_ps( i_rayDirection.Lanes( 1 ) + laneOffset ) );
+            __m256 axisOrigin = _mm256_load_ps( i_rayOrigin.Lanes( 1 ) + laneOffset );
+            __m256 axisMin =
+                _mm256_mul_ps( _mm256_sub_ps( _mm256_set1_ps( i_aabb.Min()[ 1 ] ), axisOrigin ), inverseAxisDir );
+            __m256 axisMax =
+                _mm256_mul_ps( _mm256_sub_ps( _mm256_set1_ps( i_aabb.Max()[ 1 ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes = _mm256_max_ps( _mm256_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes = _mm256_min_ps( _mm256_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 2.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            __m256 inverseAxisDir =
+                _mm256_div_ps( _mm256_set1_ps( 1.0f ), _mm256_load_ps( i_rayDirection.Lanes( 2 ) + laneOffset ) );
+            __m256 axisOrigin = _mm256_load_ps( i_rayOrigin.Lanes( 2 ) + laneOffset );
+            __m256 axisMin =
+                _mm256_mul_ps( _mm256_sub_ps( _mm256_set1_ps( i_aabb.Min()[ 2 ] ), axisOrigin ), inverseAxisDir );
+            __m256 axisMax =
+                _mm256_mul_ps( _mm256_sub_ps( _mm256_set1_ps( i_aabb.Max()[ 2 ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes = _mm256_max_ps( _mm256_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes = _mm256_min_ps( _mm256_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+        _mm256_store_ps( o_intersections.Lanes( 0 ) + laneOffset, minMagnitudes );
+        _mm256_store_ps( o_intersections.Lanes( 1 ) + laneOffset, maxMagnitudes );
+
+        // Rays with overlapping intersections across all axis intersect the AABB.
+        hitMask |= _mm256_movemask_ps( _mm256_cmp_ps( minMagnitudes, maxMagnitudes, _CMP_LE_OQ ) ) << laneOffset;
+    }
+#elif defined( GM_SIMD_SSE_ENABLED )
+    for ( size_t laneOffset = 0; laneOffset < 16; laneOffset += 4 )
+    {
+        // Initialize intersection magnitudes to ray limits.
+        __m128 minMagnitudes = _mm_setzero_ps();
+        __m128 maxMagnitudes = _mm_set1_ps( std::numeric_limits< float >::max() );
+
+        // Narrow the magnitudes by the ordered intersections of axis 0.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            __m128 inverseAxisDir =
+                _mm_div_ps( _mm_set1_ps( 1.0f ), _mm_load_ps( i_rayDirection.Lanes( 0 ) + laneOffset ) );
+            __m128 axisOrigin = _mm_load_ps( i_rayOrigin.Lanes( 0 ) + laneOffset );
+            __m128 axisMin = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Min()[ 0 ] ), axisOrigin ), inverseAxisDir );
+            __m128 axisMax = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Max()[ 0 ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes  = _mm_max_ps( _mm_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes  = _mm_min_ps( _mm_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 1.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            __m128 inverseAxisDir =
+                _mm_div_ps( _mm_set1_ps( 1.0f ), _mm_load_ps( i_rayDirection.Lanes( 1 ) + laneOffset ) );
+            __m128 axisOrigin = _mm_load_ps( i_rayOrigin.Lanes( 1 ) + laneOffset );
+            __m128 axisMin = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Min()[ 1 ] ), axisOrigin ), inverseAxisDir );
+            __m128 axisMax = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Max()[ 1 ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes  = _mm_max_ps( _mm_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes  = _mm_min_ps( _mm_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 2.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            __m128 inverseAxisDir =
+                _mm_div_ps( _mm_set1_ps( 1.0f ), _mm_load_ps( i_rayDirection.Lanes( 2 ) + laneOffset ) );
+            __m128 axisOrigin = _mm_load_ps( i_rayOrigin.Lanes( 2 ) + laneOffset );
+            __m128 axisMin = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Min()[ 2 ] ), axisOrigin ), inverseAxisDir );
+            __m128 axisMax = _mm_mul_ps( _mm_sub_ps( _mm_set1_ps( i_aabb.Max()[ 2 ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes  = _mm_max_ps( _mm_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes  = _mm_min_ps( _mm_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+        _mm_store_ps( o_intersections.Lanes( 0 ) + laneOffset, minMagnitudes );
+        _mm_store_ps( o_intersections.Lanes( 1 ) + laneOffset, maxMagnitudes );
+
+        // Rays with overlapping intersections across all axis intersect the AABB.
+        hitMask |= _mm_movemask_ps( _mm_cmple_ps( minMagnitudes, maxMagnitudes ) ) << laneOffset;
+    }
+#else
+    for ( size_t laneIndex = 0; laneIndex < 16; ++laneIndex )
+    {
+        // Initialize intersection magnitudes to ray limits.
+        float minMagnitude = 0.0f;
+        float maxMagnitude = std::numeric_limits< float >::max();
+
+        // Narrow the magnitudes by the ordered intersections of axis 0.
+        {
+            float inverseAxisDir = 1.0f / i_rayDirection( 0, laneIndex );
+            float axisMin        = ( i_aabb.Min()[ 0 ] - i_rayOrigin( 0, laneIndex ) ) * inverseAxisDir;
+            float axisMax        = ( i_aabb.Max()[ 0 ] - i_rayOrigin( 0, laneIndex ) ) * inverseAxisDir;
+            if ( inverseAxisDir < 0.0f )
+            {
+                std::swap( axisMin, axisMax );
+            }
+
+            // The accumulated magnitudes are the first operand, such that they are preserved over NaN axis
+            // intersections.
+            minMagnitude = Max( minMagnitude, axisMin );
+            maxMagnitude = Min( maxMagnitude, axisMax );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 1.
+        {
+            float inverseAxisDir = 1.0f / i_rayDirection( 1, laneIndex );
+            float axisMin        = ( i_aabb.Min()[ 1 ] - i_rayOrigin( 1, laneIndex ) ) * inverseAxisDir;
+            float axisMax        = ( i_aabb.Max()[ 1 ] - i_rayOrigin( 1, laneIndex ) ) * inverseAxisDir;
+            if ( inverseAxisDir < 0.0f )
+            {
+                std::swap( axisMin, axisMax );
+            }
+
+            // The accumulated magnitudes are the first operand, such that they are preserved over NaN axis
+            // intersections.
+            minMagnitude = Max( minMagnitude, axisMin );
+            maxMagnitude = Min( maxMagnitude, axisMax );
+        }
+
+        // Narrow the magnitudes by the ordered intersections of axis 2.
+        {
+            float inverseAxisDir = 1.0f / i_rayDirection( 2, laneIndex );
+            float axisMin        = ( i_aabb.Min()[ 2 ] - i_rayOrigin( 2, laneIndex ) ) * inverseAxisDir;
+            float axisMax        = ( i_aabb.Max()[ 2 ] - i_rayOrigin( 2, laneIndex ) ) * inverseAxisDir;
+            if ( inverseAxisDir < 0.0f )
+            {
+                std::swap( axisMin, axisMax );
+            }
+
+            // The accumulated magnitudes are the first operand, such that they are preserved over NaN axis
+            // intersections.
+            minMagnitude = Max( minMagnitude, axisMin );
+            maxMagnitude = Min( maxMagnitude, axisMax );
+        }
+
+        o_intersections( 0, laneIndex ) = minMagnitude;
+        o_intersections( 1, laneIndex ) = maxMagnitude;
+
+        // Rays with overlapping intersections across all axis intersect the AABB.
+        if ( minMagnitude <= maxMagnitude )
+        {
+            hitMask |= 1 << laneIndex;
+        }
+    }
+#endif
+
+    return hitMask;
+}
+
 GM_NS_CLOSE
\ No newline at end of file
@@ -56,13 +56,22 @@
 #include <gm/gm.h>
 
 #include <gm/types/floatRange.h>
+#include <gm/types/floatRangePacket16.h>
+#include <gm/types/floatRangePacket4.h>
+#include <gm/types/floatRangePacket8.h>
 #include <gm/types/vec3f.h>
+#include <gm/types/vec3fPacket16.h>
+#include <gm/types/vec3fPacket4.h>
+#include <gm/types/vec3fPacket8.h>
 
 #include <gm/base/diagnostic.h>
 #include <gm/functions/dotProduct.h>
 #include <gm/functions/length.h>
+#include <gm/functions/max.h>
 #include <gm/functions/quadraticRoots.h>
 
+#include <gm/base/simd.h>
+
 GM_NS_OPEN
 
 /// Compute the intersection(s) between a ray and an implicit sphere.
@@ -173,4 +182,460 @@ GM_HOST_DEVICE inline int RaySphereIntersection( const Vec3f& i_sphereOrigin,
     }
 }
 
+/// Compute the intersections between each ray of a packet of 4 rays and a single implicit sphere.
+/// \ingroup gm_functions_rayTracing
+///
+/// The sphere is loaded once and tested against all the rays at once, using SIMD instructions if enabled
+/// (see base/simd.h).
+///
+/// \param i_sphereOrigin The origin or center of the sphere.
+/// \param i_sphereRadius The radius of the sphere.
+/// \param i_rayOrigin The origins of the rays.
+/// \param i_rayDirection The directions of the rays.
+/// \param o_intersections The ray magnitudes of the intersections, per ray.  If a ray intersects the sphere
+/// exactly once, both magnitudes are equal.  If the origin of a ray is inside the sphere, the minimum magnitude
+/// is 0.  The magnitudes of rays which do not intersect the sphere will be undefined.
+///
+/// \return The hit mask, where bit \p N is set if the ray in lane \p N intersects the sphere.
+GM_HOST_DEVICE inline int RaySphereIntersection( const Vec3f&        i_sphereOrigin,
+                                                 const float&        i_sphereRadius,
+                                                 const Vec3fPacket4& i_rayOrigin,
+                                                 const Vec3fPacket4& i_rayDirection,
+                                                 FloatRangePacket4&  o_intersections )
+{
+    int hitMask = 0;
+#if defined( GM_SIMD_SSE_ENABLED )
+    for ( size_t laneOffset = 0; laneOffset < 4; laneOffset += 4 )
+    {
+        // Compute quadratic co-efficients
+        __m128 a     = _mm_setzero_ps();
+        __m128 halfB = _mm_setzero_ps();
+        __m128 c     = _mm_set1_ps( -i_sphereRadius * i_sphereRadius );
+        {
+            __m128 axisDirection = _mm_load_ps( i_rayDirection.Lanes( 0 ) + laneOffset );
+            __m128 axisOriginDiff =
+                _mm_sub_ps( _mm_load_ps( i_rayOrigin.Lanes( 0 ) + laneOffset ), _mm_set1_ps( i_sphereOrigin[ 0 ] ) );
+            a     = _mm_add_ps( a, _mm_mul_ps( axisDirection, axisDirection ) );
+            halfB = _mm_add_ps( halfB, _mm_mul_ps( axisDirection, axisOriginDiff ) );
+            c     = _mm_add_ps( c, _mm_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+        {
+            __m128 axisDirection = _mm_load_ps( i_rayDirection.Lanes( 1 ) + laneOffset );
+            __m128 axisOriginDiff =
+                _mm_sub_ps( _mm_load_ps( i_rayOrigin.Lanes( 1 ) + laneOffset ), _mm_set1_ps( i_sphereOrigin[ 1 ] ) );
+            a     = _mm_add_ps( a, _mm_mul_ps( axisDirection, axisDirection ) );
+            halfB = _mm_add_ps( halfB, _mm_mul_ps( axisDirection, axisOriginDiff ) );
+            c     = _mm_add_ps( c, _mm_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+        {
+            __m128 axisDirection = _mm_load_ps( i_rayDirection.Lanes( 2 ) + laneOffset );
+            __m128 axisOriginDiff =
+                _mm_sub_ps( _mm_load_ps( i_rayOrigin.Lanes( 2 ) + laneOffset ), _mm_set1_ps( i_sphereOrigin[ 2 ] ) );
+            a     = _mm_add_ps( a, _mm_mul_ps( axisDirection, axisDirection ) );
+            halfB = _mm_add_ps( halfB, _mm_mul_ps( axisDirection, axisOriginDiff ) );
+            c     = _mm_add_ps( c, _mm_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+        __m128 b = _mm_add_ps( halfB, halfB );
+
+        // Solve for quadratic roots.  Negative discriminants are clamped, their lanes are masked out of the hits.
+        __m128 zero         = _mm_setzero_ps();
+        __m128 discriminant = _mm_sub_ps( _mm_mul_ps( b, b ), _mm_mul_ps( _mm_set1_ps( 4.0f ), _mm_mul_ps( a, c ) ) );
+        __m128 discriminantRoot = _mm_sqrt_ps( _mm_max_ps( discriminant, zero ) );
+        __m128 reciprocal       = _mm_div_ps( _mm_set1_ps( 1.0f ), _mm_add_ps( a, a ) );
+        __m128 nearRoot         = _mm_mul_ps( _mm_sub_ps( _mm_sub_ps( zero, b ), discriminantRoot ), reciprocal );
+        __m128 farRoot          = _mm_mul_ps( _mm_add_ps( _mm_sub_ps( zero, b ), discriminantRoot ), reciprocal );
+
+        // If the nearest intersection is behind the ray origin, then the ray origin is either inside the
+        // sphere (c < 0), or on its surface.
+        __m128 insideMagnitude = _mm_blendv_ps( farRoot, zero, _mm_cmplt_ps( c, zero ) );
+        nearRoot               = _mm_blendv_ps( nearRoot, insideMagnitude, _mm_cmplt_ps( nearRoot, zero ) );
+        _mm_store_ps( o_intersections.Lanes( 0 ) + laneOffset, nearRoot );
+        _mm_store_ps( o_intersections.Lanes( 1 ) + laneOffset, farRoot );
+
+        // Rays with real roots, where the farthest root is not behind the ray origin, intersect the sphere.
+        __m128 hits = _mm_and_ps( _mm_cmpge_ps( discriminant, zero ), _mm_cmpge_ps( farRoot, zero ) );
+        hitMask |= _mm_movemask_ps( hits ) << laneOffset;
+    }
+#else
+    for ( size_t laneIndex = 0; laneIndex < 4; ++laneIndex )
+    {
+        // Compute quadratic co-efficients
+        Vec3f rayDirection( i_rayDirection( 0, laneIndex ),
+                            i_rayDirection( 1, laneIndex ),
+                            i_rayDirection( 2, laneIndex ) );
+        Vec3f originDiff =
+            Vec3f( i_rayOrigin( 0, laneIndex ), i_rayOrigin( 1, laneIndex ), i_rayOrigin( 2, laneIndex ) ) -
+            i_sphereOrigin;
+        float a = DotProduct( rayDirection, rayDirection );
+        float b = 2.0f * DotProduct( rayDirection, originDiff );
+        float c = DotProduct( originDiff, originDiff ) - i_sphereRadius * i_sphereRadius;
+
+        // Solve for quadratic roots.  Negative discriminants are clamped, their lanes are masked out of the hits.
+        float discriminant     = ( b * b ) - ( 4.0f * a * c );
+        float discriminantRoot = std::sqrt( Max( discriminant, 0.0f ) );
+        float reciprocal       = 1.0f / ( 2.0f * a );
+        float nearRoot         = ( -b - discriminantRoot ) * reciprocal;
+        float farRoot          = ( -b + discriminantRoot ) * reciprocal;
+
+        // If the nearest intersection is behind the ray origin, then the ray origin is either inside the
+        // sphere (c < 0), or on its surface.
+        if ( nearRoot < 0.0f )
+        {
+            nearRoot = c < 0.0f ? 0.0f : farRoot;
+        }
+
+        o_intersections( 0, laneIndex ) = nearRoot;
+        o_intersections( 1, laneIndex ) = farRoot;
+
+        // Rays with real roots, where the farthest root is not behind the ray origin, intersect the sphere.
+        if ( discriminant >= 0.0f && farRoot >= 0.0f )
+        {
+            hitMask |= 1 << laneIndex;
+        }
+    }
+#endif
+
+    return hitMask;
+}
+
+/// Compute the intersections between each ray of a packet of 8 rays and a single implicit sphere.
+/// \ingroup gm_functions_rayTracing
+///
+/// The sphere is loaded once and tested against all the rays at once, using SIMD instructions if enabled
+/// (see base/simd.h).
+///
+/// \param i_sphereOrigin The origin or center of the sphere.
+/// \param i_sphereRadius The radius of the sphere.
+/// \param i_rayOrigin The origins of the rays.
+/// \param i_rayDirection The directions of the rays.
+/// \param o_intersections The ray magnitudes of the intersections, per ray.  If a ray intersects the sphere
+/// exactly once, both magnitudes are equal.  If the origin of a ray is inside the sphere, the minimum magnitude
+/// is 0.  The magnitudes of rays which do not intersect the sphere will be undefined.
+///
+/// \return The hit mask, where bit \p N is set if the ray in lane \p N intersects the sphere.
+GM_HOST_DEVICE inline int RaySphereIntersection( const Vec3f&        i_sphereOrigin,
+                                                 const float&        i_sphereRadius,
+                                                 const Vec3fPacket8& i_rayOrigin,
+                                                 const Vec3fPacket8& i_rayDirection,
+                                                 FloatRangePacket8&  o_intersections )
+{
+    int hitMask = 0;
+#if defined( GM_SIMD_AVX2_ENABLED )
+    for ( size_t laneOffset = 0; laneOffset < 8; laneOffset += 8 )
+    {
+        // Compute quadratic co-efficients
+        __m256 a     = _mm256_setzero_ps();
+        __m256 halfB = _mm256_setzero_ps();
+        __m256 c     = _mm256_set1_ps( -i_sphereRadius * i_sphereRadius );
+        {
+            __m256 axisDirection  = _mm256_load_ps( i_rayDirection.Lanes( 0 ) + laneOffset );
+            __m256 axisOriginDiff = _mm256_sub_ps( _mm256_load_ps( i_rayOrigin.Lanes( 0 ) + laneOffset ),
+                                                   _mm256_set1_ps( i_sphereOrigin[ 0 ] ) );
+            a                     = _mm256_add_ps( a, _mm256_mul_ps( axisDirection, axisDirection ) );
+            halfB                 = _mm256_add_ps( halfB, _mm256_mul_ps( axisDirection, axisOriginDiff ) );
+            c                     = _mm256_add_ps( c, _mm256_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+        {
+            __m256 axisDirection  = _mm256_load_ps( i_rayDirection.Lanes( 1 ) + laneOffset );
+            __m256 axisOriginDiff = _mm256_sub_ps( _mm256_load_ps( i_rayOrigin.Lanes( 1 ) + laneOffset ),
+                                                   _mm256_set1_ps( i_sphereOrigin[ 1 ] ) );
+            a                     = _mm256_add_ps( a, _mm256_mul_ps( axisDirection, axisDirection ) );
+            halfB                 = _mm256_add_ps( halfB, _mm256_mul_ps( axisDirection, axisOriginDiff ) );
+            c                     = _mm256_add_ps( c, _mm256_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+        {
+            __m256 axisDirection  = _mm256_load_ps( i_rayDirection.Lanes( 2 ) + laneOffset );
+            __m256 axisOriginDiff = _mm256_sub_ps( _mm256_load_ps( i_rayOrigin.Lanes( 2 ) + laneOffset ),
+                                                   _mm256_set1_ps( i_sphereOrigin[ 2 ] ) );
+            a                     = _mm256_add_ps( a, _mm256_mul_ps( axisDirection, axisDirection ) );
+            halfB                 = _mm256_add_ps( halfB, _mm256_mul_ps( axisDirection, axisOriginDiff ) );
+            c                     = _mm256_add_ps( c, _mm256_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+        __m256 b = _mm256_add_ps( halfB, halfB );
+
+        // Solve for quadratic roots.  Negative discriminants are clamped, their lanes are masked out of the hits.
+        __m256 zero = _mm256_setzero_ps();
+        __m256 discriminant =
+            _mm256_sub_ps( _mm256_mul_ps( b, b ), _mm256_mul_ps( _mm256_set1_ps( 4.0f ), _mm256_mul_ps( a, c ) ) );
+        __m256 discriminantRoot = _mm256_sqrt_ps( _mm256_max_ps( discriminant, zero ) );
+        __m256 reciprocal       = _mm256_div_ps( _mm256_set1_ps( 1.0f ), _mm256_add_ps( a, a ) );
+        __m256 nearRoot = _mm256_mul_ps( _mm256_sub_ps( _mm256_sub_ps( zero, b ), discriminantRoot ), reciprocal );
+        __m256 farRoot  = _mm256_mul_ps( _mm256_add_ps( _mm256_sub_ps( zero, b ), discriminantRoot ), reciprocal );
+
+        // If the nearest intersection is behind the ray origin, then the ray origin is either inside the
+        // sphere (c < 0), or on its surface.
+        __m256 insideMagnitude = _mm256_blendv_ps( farRoot, zero, _mm256_cmp_ps( c, zero, _CMP_LT_OQ ) );
+        nearRoot = _mm256_blendv_ps( nearRoot, insideMagnitude, _mm256_cmp_ps( nearRoot, zero, _CMP_LT_OQ ) );
+        _mm256_store_ps( o_intersections.Lanes( 0 ) + laneOffset, nearRoot );
+        _mm256_store_ps( o_intersections.Lanes( 1 ) + laneOffset, farRoot );
+
+        // Rays with real roots, where the farthest root is not behind the ray origin, intersect the sphere.
+        __m256 hits = _mm256_and_ps( _mm256_cmp_ps( discriminant, zero, _CMP_GE_OQ ),
+                                     _mm256_cmp_ps( farRoot, zero, _CMP_GE_OQ ) );
+        hitMask |= _mm256_movemask_ps( hits ) << laneOffset;
+    }
+#elif defined( GM_SIMD_SSE_ENABLED )
+    for ( size_t laneOffset = 0; laneOffset < 8; laneOffset += 4 )
+    {
+        // Compute quadratic co-efficients
+        __m128 a     = _mm_setzero_ps();
+        __m128 halfB = _mm_setzero_ps();
+        __m128 c     = _mm_set1_ps( -i_sphereRadius * i_sphereRadius );
+        {
+            __m128 axisDirection = _mm_load_ps( i_rayDirection.Lanes( 0 ) + laneOffset );
+            __m128 axisOriginDiff =
+                _mm_sub_ps( _mm_load_ps( i_rayOrigin.Lanes( 0 ) + laneOffset ), _mm_set1_ps( i_sphereOrigin[ 0 ] ) );
+            a     = _mm_add_ps( a, _mm_mul_ps( axisDirection, axisDirection ) );
+            halfB = _mm_add_ps( halfB, _mm_mul_ps( axisDirection, axisOriginDiff ) );
+            c     = _mm_add_ps( c, _mm_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+        {
+            __m128 axisDirection = _mm_load_ps( i_rayDirection.Lanes( 1 ) + laneOffset );
+            __m128 axisOriginDiff =
+                _mm_sub_ps( _mm_load_ps( i_rayOrigin.Lanes( 1 ) + laneOffset ), _mm_set1_ps( i_sphereOrigin[ 1 ] ) );
+            a     = _mm_add_ps( a, _mm_mul_ps( axisDirection, axisDirection ) );
+            halfB = _mm_add_ps( halfB, _mm_mul_ps( axisDirection, axisOriginDiff ) );
+            c     = _mm_add_ps( c, _mm_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+        {
+            __m128 axisDirection = _mm_load_ps( i_rayDirection.Lanes( 2 ) + laneOffset );
+            __m128 axisOriginDiff =
+                _mm_sub_ps( _mm_load_ps( i_rayOrigin.Lanes( 2 ) + laneOffset ), _mm_set1_ps( i_sphereOrigin[ 2 ] ) );
+            a     = _mm_add_ps( a, _mm_mul_ps( axisDirection, axisDirection ) );
+            halfB = _mm_add_ps( halfB, _mm_mul_ps( axisDirection, axisOriginDiff ) );
+            c     = _mm_add_ps( c, _mm_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+        __m128 b = _mm_add_ps( halfB, halfB );
+
+        // Solve for quadratic roots.  Negative discriminants are clamped, their lanes are masked out of the hits.
+        __m128 zero         = _mm_setzero_ps();
+        __m128 discriminant = _mm_sub_ps( _mm_mul_ps( b, b ), _mm_mul_ps( _mm_set1_ps( 4.0f ), _mm_mul_ps( a, c ) ) );
+        __m128 discriminantRoot = _mm_sqrt_ps( _mm_max_ps( discriminant, zero ) );
+        __m128 reciprocal       = _mm_div_ps( _mm_set1_ps( 1.0f ), _mm_add_ps( a, a ) );
+        __m128 nearRoot         = _mm_mul_ps( _mm_sub_ps( _mm_sub_ps( zero, b ), discriminantRoot ), reciprocal );
+        __m128 farRoot          = _mm_mul_ps( _mm_add_ps( _mm_sub_ps( zero, b ), discriminantRoot ), reciprocal );
+
+        // If the nearest intersection is behind the ray origin, then the ray origin is either inside the
+        // sphere (c < 0), or on its surface.
+        __m128 insideMagnitude = _mm_blendv_ps( farRoot, zero, _mm_cmplt_ps( c, zero ) );
+        nearRoot               = _mm_blendv_ps( nearRoot, insideMagnitude, _mm_cmplt_ps( nearRoot, zero ) );
+        _mm_store_ps( o_intersections.Lanes( 0 ) + laneOffset, nearRoot );
+        _mm_store_ps( o_intersections.Lanes( 1 ) + laneOffset, farRoot );
+
+        // Rays with real roots, where the farthest root is not behind the ray origin, intersect the sphere.
+        __m128 hits = _mm_and_ps( _mm_cmpge_ps( discriminant, zero ), _mm_cmpge_ps( farRoot, zero ) );
+        hitMask |= _mm_movemask_ps( hits ) << laneOffset;
+    }
+#else
+    for ( size_t laneIndex = 0; laneIndex < 8; ++laneIndex )
+    {
+        // Compute quadratic co-efficients
+        Vec3f rayDirection( i_rayDirection( 0, laneIndex ),
+                            i_rayDirection( 1, laneIndex ),
+                            i_rayDirection( 2, laneIndex ) );
+        Vec3f originDiff =
+            Vec3f( i_rayOrigin( 0, laneIndex ), i_rayOrigin( 1, laneIndex ), i_rayOrigin( 2, laneIndex ) ) -
+            i_sphereOrigin;
+        float a = DotProduct( rayDirection, rayDirection );
+        float b = 2.0f * DotProduct( rayDirection, originDiff );
+        float c = DotProduct( originDiff, originDiff ) - i_sphereRadius * i_sphereRadius;
+
+        // Solve for quadratic roots.  Negative discriminants are clamped, their lanes are masked out of the hits.
+        float discriminant     = ( b * b ) - ( 4.0f * a * c );
+        float discriminantRoot = std::sqrt( Max( discriminant, 0.0f ) );
+        float reciprocal       = 1.0f / ( 2.0f * a );
+        float nearRoot         = ( -b - discriminantRoot ) * reciprocal;
+        float farRoot          = ( -b + discriminantRoot ) * reciprocal;
+
+        // If the nearest intersection is behind the ray origin, then the ray origin is either inside the
+        // sphere (c < 0), or on its surface.
+        if ( nearRoot < 0.0f )
+        {
+            nearRoot = c < 0.0f ? 0.0f : farRoot;
+        }
+
+        o_intersections( 0, laneIndex ) = nearRoot;
+        o_intersections( 1, laneIndex ) = farRoot;
+
+        // Rays with real roots, where the farthest root is not behind the ray origin, intersect the sphere.
+        if ( discriminant >= 0.0f && farRoot >= 0.0f )
+        {
+            hitMask |= 1 << laneIndex;
+        }
+    }
+#endif
+
+    return hitMask;
+}
+
+/// Compute the intersections between each ray of a packet of 16 rays and a single implicit sphere.
+/// \ingroup gm_functions_rayTracing
+///
+/// The sphere is loaded once and tested against all the rays at once, using SIMD instructions if enabled
+/// (see base/simd.h).
+///
+/// \param i_sphereOrigin The origin or center of the sphere.
+/// \param i_sphereRadius The radius of the sphere.
+/// \param i_rayOrigin The origins of the rays.
+/// \param i_rayDirection The directions of the rays.
+/// \param o_intersections The ray magnitudes of the intersections, per ray.  If a ray intersects the sphere
+/// exactly once, both magnitudes are equal.  If the origin of a ray is inside the sphere, the minimum magnitude
+/// is 0.  The magnitudes of rays which do not intersect the sphere will be undefined.
+///
+/// \return The hit mask, where bit \p N is set if the ray in lane \p N intersects the sphere.
+GM_HOST_DEVICE inline int RaySphereIntersection( const Vec3f&         i_sphereOrigin,
+                                                 const float&         i_sphereRadius,
+                                                 const Vec3fPacket16& i_rayOrigin,
+                                                 const Vec3fPacket16& i_rayDirection,
+                                                 FloatRangePacket16&  o_intersections )
+{
+    int hitMask = 0;
+#if defined( GM_SIMD_AVX2_ENABLED )
+    for ( size_t laneOffset = 0; laneOffset < 16; laneOffset += 8 )
+    {
+        // Compute quadratic co-efficients
+        __m256 a     = _mm256_setzero_ps();
+        __m256 halfB = _mm256_setzero_ps();
+        __m256 c     = _mm256_set1_ps( -i_sphereRadius * i_sphereRadius );
+        {
+            __m256 axisDirection  = _mm256_load_ps( i_rayDirection.Lanes( 0 ) + laneOffset );
+            __m256 axisOriginDiff = _mm256_sub_ps( _mm256_load_ps( i_rayOrigin.Lanes( 0 ) + laneOffset ),
+                                                   _mm256_set1_ps( i_sphereOrigin[ 0 ] ) );
+            a                     = _mm256_add_ps( a, _mm256_mul_ps( axisDirection, axisDirection ) );
+            halfB                 = _mm256_add_ps( halfB, _mm256_mul_ps( axisDirection, axisOriginDiff ) );
+            c                     = _mm256_add_ps( c, _mm256_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+        {
+            __m256 axisDirection  = _mm256_load_ps( i_rayDirection.Lanes( 1 ) + laneOffset );
+            __m256 axisOriginDiff = _mm256_sub_ps( _mm256_load_ps( i_rayOrigin.Lanes( 1 ) + laneOffset ),
+                                                   _mm256_set1_ps( i_sphereOrigin[ 1 ] ) );
+            a                     = _mm256_add_ps( a, _mm256_mul_ps( axisDirection, axisDirection ) );
+            halfB                 = _mm256_add_ps( halfB, _mm256_mul_ps( axisDirection, axisOriginDiff ) );
+            c                     = _mm256_add_ps( c, _mm256_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+        {
+            __m256 axisDirection  = _mm256_load_ps( i_rayDirection.Lanes( 2 ) + laneOffset );
+            __m256 axisOriginDiff = _mm256_sub_ps( _mm256_load_ps( i_rayOrigin.Lanes( 2 ) + laneOffset ),
+                                                   _mm256_set1_ps( i_sphereOrigin[ 2 ] ) );
+            a                     = _mm256_add_ps( a, _mm256_mul_ps( axisDirection, axisDirection ) );
+            halfB                 = _mm256_add_ps( halfB, _mm256_mul_ps( axisDirection, axisOriginDiff ) );
+            c                     = _mm256_add_ps( c, _mm256_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+        __m256 b = _mm256_add_ps( halfB, halfB );
+
+        // Solve for quadratic roots.  Negative discriminants are clamped, their lanes are masked out of the hits.
+        __m256 zero = _mm256_setzero_ps();
+        __m256 discriminant =
+            _mm256_sub_ps( _mm256_mul_ps( b, b ), _mm256_mul_ps( _mm256_set1_ps( 4.0f ), _mm256_mul_ps( a, c ) ) );
+        __m256 discriminantRoot = _mm256_sqrt_ps( _mm256_max_ps( discriminant, zero ) );
+        __m256 reciprocal       = _mm256_div_ps( _mm256_set1_ps( 1.0f ), _mm256_add_ps( a, a ) );
+        __m256 nearRoot = _mm256_mul_ps( _mm256_sub_ps( _mm256_sub_ps( zero, b ), discriminantRoot ), reciprocal );
+        __m256 farRoot  = _mm256_mul_ps( _mm256_add_ps( _mm256_sub_ps( zero, b ), discriminantRoot ), reciprocal );
+
+        // If the nearest intersection is behind the ray origin, then the ray origin is either inside the
+        // sphere (c < 0), or on its surface.
+        __m256 insideMagnitude = _mm256_blendv_ps( farRoot, zero, _mm256_cmp_ps( c, zero, _CMP_LT_OQ ) );
+        nearRoot = _mm256_blendv_ps( nearRoot, insideMagnitude, _mm256_cmp_ps( nearRoot, zero, _CMP_LT_OQ ) );
+        _mm256_store_ps( o_intersections.Lanes( 0 ) + laneOffset, nearRoot );
+        _mm256_store_ps( o_intersections.Lanes( 1 ) + laneOffset, farRoot );
+
+        // Rays with real roots, where the farthest root is not behind the ray origin, intersect the sphere.
+        __m256 hits = _mm256_and_ps( _mm256_cmp_ps( discriminant, zero, _CMP_GE_OQ ),
+                                     _mm256_cmp_ps( farRoot, zero, _CMP_GE_OQ ) );
+        hitMask |= _mm256_movemask_ps( hits ) << laneOffset;
+    }
+#elif defined( GM_SIMD_SSE_ENABLED )
+    for ( size_t laneOffset = 0; laneOffset < 16; laneOffset += 4 )
+    {
+        // Compute quadratic co-efficients
+        __m128 a     = _mm_setzero_ps();
+        __m128 halfB = _mm_setzero_ps();
+        __m128 c     = _mm_set1_ps( -i_sphereRadius * i_sphereRadius );
+        {
+            __m128 axisDirection = _mm_load_ps( i_rayDirection.Lanes( 0 ) + laneOffset );
+            __m128 axisOriginDiff =
+                _mm_sub_ps( _mm_load_ps( i_rayOrigin.Lanes( 0 ) + laneOffset ), _mm_set1_ps( i_sphereOrigin[ 0 ] ) );
+            a     = _mm_add_ps( a, _mm_mul_ps( axisDirection, axisDirection ) );
+            halfB = _mm_add_ps( halfB, _mm_mul_ps( axisDirection, axisOriginDiff ) );
+            c     = _mm_add_ps( c, _mm_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+        {
+            __m128 axisDirection = _mm_load_ps( i_rayDirection.Lanes( 1 ) + laneOffset );
+            __m128 axisOriginDiff =
+                _mm_sub_ps( _mm_load_ps( i_rayOrigin.Lanes( 1 ) + laneOffset ), _mm_set1_ps( i_sphereOrigin[ 1 ] ) );
+            a     = _mm_add_ps( a, _mm_mul_ps( axisDirection, axisDirection ) );
+            halfB = _mm_add_ps( halfB, _mm_mul_ps( axisDirection, axisOriginDiff ) );
+            c     = _mm_add_ps( c, _mm_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+        {
+            __m128 axisDirection = _mm_load_ps( i_rayDirection.Lanes( 2 ) + laneOffset );
+            __m128 axisOriginDiff =
+                _mm_sub_ps( _mm_load_ps( i_rayOrigin.Lanes( 2 ) + laneOffset ), _mm_set1_ps( i_sphereOrigin[ 2 ] ) );
+            a     = _mm_add_ps( a, _mm_mul_ps( axisDirection, axisDirection ) );
+            halfB = _mm_add_ps( halfB, _mm_mul_ps( axisDirection, axisOriginDiff ) );
+            c     = _mm_add_ps( c, _mm_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+        __m128 b = _mm_add_ps( halfB, halfB );
+
+        // Solve for quadratic roots.  Negative discriminants are clamped, their lanes are masked out of the hits.
+        __m128 zero         = _mm_setzero_ps();
+        __m128 discriminant = _mm_sub_ps( _mm_mul_ps( b, b ), _mm_mul_ps( _mm_set1_ps( 4.0f ), _mm_mul_ps( a, c ) ) );
+        __m128 discriminantRoot = _mm_sqrt_ps( _mm_max_ps( discriminant, zero ) );
+        __m128 reciprocal       = _mm_div_ps( _mm_set1_ps( 1.0f ), _mm_add_ps( a, a ) );
+        __m128 nearRoot         = _mm_mul_ps( _mm_sub_ps( _mm_sub_ps( zero, b ), discriminantRoot ), reciprocal );
+        __m128 farRoot          = _mm_mul_ps( _mm_add_ps( _mm_sub_ps( zero, b ), discriminantRoot ), reciprocal );
+
+        // If the nearest intersection is behind the ray origin, then the ray origin is either inside the
+        // sphere (c < 0), or on its surface.
+        __m128 insideMagnitude = _mm_blendv_ps( farRoot, zero, _mm_cmplt_ps( c, zero ) );
+        nearRoot               = _mm_blendv_ps( nearRoot, insideMagnitude, _mm_cmplt_ps( nearRoot, zero ) );
+        _mm_store_ps( o_intersections.Lanes( 0 ) + laneOffset, nearRoot );
+        _mm_store_ps( o_intersections.Lanes( 1 ) + laneOffset, farRoot );
+
+        // Rays with real roots, where the farthest root is not behind the ray origin, intersect the sphere.
+        __m128 hits = _mm_and_ps( _mm_cmpge_ps( discriminant, zero ), _mm_cmpge_ps( farRoot, zero ) );
+        hitMask |= _mm_movemask_ps( hits ) << laneOffset;
+    }
+#else
+    for ( size_t laneIndex = 0; laneIndex < 16; ++laneIndex )
+    {
+        // Compute quadratic co-efficients
+        Vec3f rayDirection( i_rayDirection( 0, laneIndex ),
+                            i_rayDirection( 1, laneIndex ),
+                            i_rayDirection( 2, laneIndex ) );
+        Vec3f originDiff =
+            Vec3f( i_rayOrigin( 0, laneIndex ), i_rayOrigin( 1, laneIndex ), i_rayOrigin( 2, laneIndex ) ) -
+            i_sphereOrigin;
+        float a = DotProduct( rayDirection, rayDirection );
+        float b = 2.0f * DotProduct( rayDirection, originDiff );
+        float c = DotProduct( originDiff, originDiff ) - i_sphereRadius * i_sphereRadius;
+
+        // Solve for quadratic roots.  Negative discriminants are clamped, their lanes are masked out of the hits.
+        float discriminant     = ( b * b ) - ( 4.0f * a * c );
+        float discriminantRoot = std::sqrt( Max( discriminant, 0.0f ) );
+        float reciprocal       = 1.0f / ( 2.0f * a );
+        float nearRoot         = ( -b - discriminantRoot ) * reciprocal;
+        float farRoot          = ( -b + discriminantRoot ) * reciprocal;
+
+        // If the nearest intersection is behind the ray origin, then the ray origin is either inside the
+        // sphere (c < 0), or on its surface.
+        if ( nearRoot < 0.0f )
+        {
+            nearRoot = c < 0.0f ? 0.0f : farRoot;
+        }
+
+        o_intersections( 0, laneIndex ) = nearRoot;
+        o_intersections( 1, laneIndex ) = farRoot;
+
+        // Rays with real roots, where the farthest root is not behind the ray origin, intersect the sphere.
+        if ( discriminant >= 0.0f && farRoot >= 0.0f )
+        {
+            hitMask |= 1 << laneIndex;
+        }
+    }
+#endif
+
+    return hitMask;
+}
+
 GM_NS_CLOSE
\ No newline at end of file
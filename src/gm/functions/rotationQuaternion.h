@@ -0,0 +1,118 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/rotationQuaternion.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Rotation quaternion.
+///
+/// Convert the rotation of a transformation matrix into a unit quaternion, using Shepperd's method
+/// ("Quaternion from Rotation Matrix", 1978): the quaternion is solved from the largest of its squared
+/// elements, which are derived from the trace and diagonal of the matrix, for numerical stability.
+
+#include <gm/gm.h>
+
+#include <gm/types/mat3f.h>
+#include <gm/types/mat4f.h>
+#include <gm/types/quatf.h>
+
+#include <cmath>
+
+GM_NS_OPEN
+
+/// Compute the unit quaternion representing the rotation of the transformation matrix \p i_matrix.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \pre The upper left 3x3 elements of \p i_matrix is a rotation matrix, without scale or shear.
+///
+/// \param i_matrix The transformation matrix.
+///
+/// \return The unit quaternion of the rotation.
+GM_HOST_DEVICE inline Quatf RotationQuaternion( const Mat3f& i_matrix )
+{
+    const Mat3f& m     = i_matrix;
+    const float  trace = m( 0, 0 ) + m( 1, 1 ) + m( 2, 2 );
+    if ( trace > 0.0f )
+    {
+        const float scale = 0.5f / std::sqrt( trace + 1.0f );
+        return Quatf( ( m( 2, 1 ) - m( 1, 2 ) ) * scale,
+                      ( m( 0, 2 ) - m( 2, 0 ) ) * scale,
+                      ( m( 1, 0 ) - m( 0, 1 ) ) * scale,
+                      0.25f / scale );
+    }
+    else if ( m( 0, 0 ) > m( 1, 1 ) && m( 0, 0 ) > m( 2, 2 ) )
+    {
+        const float scale = 0.5f / std::sqrt( 1.0f + m( 0, 0 ) - m( 1, 1 ) - m( 2, 2 ) );
+        return Quatf( 0.25f / scale,
+                      ( m( 0, 1 ) + m( 1, 0 ) ) * scale,
+                      ( m( 0, 2 ) + m( 2, 0 ) ) * scale,
+                      ( m( 2, 1 ) - m( 1, 2 ) ) * scale );
+    }
+    else if ( m( 1, 1 ) > m( 2, 2 ) )
+    {
+        const float scale = 0.5f / std::sqrt( 1.0f + m( 1, 1 ) - m( 0, 0 ) - m( 2, 2 ) );
+        return Quatf( ( m( 0, 1 ) + m( 1, 0 ) ) * scale,
+                      0.25f / scale,
+                      ( m( 1, 2 ) + m( 2, 1 ) ) * scale,
+                      ( m( 0, 2 ) - m( 2, 0 ) ) * scale );
+    }
+    else
+    {
+        const float scale = 0.5f / std::sqrt( 1.0f + m( 2, 2 ) - m( 0, 0 ) - m( 1, 1 ) );
+        return Quatf( ( m( 0, 2 ) + m( 2, 0 ) ) * scale,
+                      ( m( 1, 2 ) + m( 2, 1 ) ) * scale,
+                      0.25f / scale,
+                      ( m( 1, 0 ) - m( 0, 1 ) ) * scale );
+    }
+}
+
+/// Compute the unit quaternion representing the rotation of the transformation matrix \p i_matrix.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \pre The upper left 3x3 elements of \p i_matrix is a rotation matrix, without scale or shear.
+///
+/// \param i_matrix The transformation matrix.
+///
+/// \return The unit quaternion of the rotation.
+GM_HOST_DEVICE inline Quatf RotationQuaternion( const Mat4f& i_matrix )
+{
+    const Mat4f& m     = i_matrix;
+    const float  trace = m( 0, 0 ) + m( 1, 1 ) + m( 2, 2 );
+    if ( trace > 0.0f )
+    {
+        const float scale = 0.5f / std::sqrt( trace + 1.0f );
+        return Quatf( ( m( 2, 1 ) - m( 1, 2 ) ) * scale,
+                      ( m( 0, 2 ) - m( 2, 0 ) ) * scale,
+                      ( m( 1, 0 ) - m( 0, 1 ) ) * scale,
+                      0.25f / scale );
+    }
+    else if ( m( 0, 0 ) > m( 1, 1 ) && m( 0, 0 ) > m( 2, 2 ) )
+    {
+        const float scale = 0.5f / std::sqrt( 1.0f + m( 0, 0 ) - m( 1, 1 ) - m( 2, 2 ) );
+        return Quatf( 0.25f / scale,
+                      ( m( 0, 1 ) + m( 1, 0 ) ) * scale,
+                      ( m( 0, 2 ) + m( 2, 0 ) ) * scale,
+                      ( m( 2, 1 ) - m( 1, 2 ) ) * scale );
+    }
+    else if ( m( 1, 1 ) > m( 2, 2 ) )
+    {
+        const float scale = 0.5f / std::sqrt( 1.0f + m( 1, 1 ) - m( 0, 0 ) - m( 2, 2 ) );
+        return Quatf( ( m( 0, 1 ) + m( 1, 0 ) ) * scale,
+                      0.25f / scale,
+                      ( m( 1, 2 ) + m( 2, 1 ) ) * scale,
+                      ( m( 0, 2 ) - m( 2, 0 ) ) * scale );
+    }
+    else
+    {
+        const float scale = 0.5f / std::sqrt( 1.0f + m( 2, 2 ) - m( 0, 0 ) - m( 1, 1 ) );
+        return Quatf( ( m( 0, 2 ) + m( 2, 0 ) ) * scale,
+                      ( m( 1, 2 ) + m( 2, 1 ) ) * scale,
+                      0.25f / scale,
+                      ( m( 1, 0 ) - m( 0, 1 ) ) * scale );
+    }
+}
+
+GM_NS_CLOSE
\ No newline at end of file
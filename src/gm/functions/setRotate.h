@@ -7,11 +7,16 @@
 /// \file functions/setRotate.h
 /// \ingroup gm_functions_linearAlgebra
 ///
-/// Set a rotation for an specified axis on a transformation matrix, with respect to the left hand rule.
+/// Set a rotation for an specified axis on a transformation matrix or quaternion, with respect to the left hand rule.
+///
+/// A rotation matrix can also be set from a unit quaternion, without re-computing the sine and cosine
+/// of the rotation angle.
 
 #include <gm/gm.h>
 
+#include <gm/types/mat3f.h>
 #include <gm/types/mat4f.h>
+#include <gm/types/quatf.h>
 #include <gm/types/vec3f.h>
 
 #include <gm/functions/normalize.h>
@@ -51,4 +56,107 @@ GM_HOST_DEVICE inline void SetRotate( const float& i_angle, const Vec3f& i_axis,
     o_matrix( 2, 3 ) = 0;
 }
 
+/// Set a \p i_axis rotation of \p i_angle degrees onto the quaternion \p o_quaternion.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_angle The angle of rotation in degrees.
+/// \param i_axis The axis of rotation.
+/// \param o_quaternion The output unit quaternion.
+GM_HOST_DEVICE inline void SetRotate( const float& i_angle, const Vec3f& i_axis, Quatf& o_quaternion )
+{
+    // Axis must be normalised.
+    Vec3f normAxis = Normalize( i_axis );
+
+    // Compute the sine and cosine of the half angle.
+    float halfRadians  = Radians( i_angle ) * 0.5f;
+    float sinHalfTheta = std::sin( halfRadians );
+
+    o_quaternion = Quatf( normAxis[ 0 ] * sinHalfTheta,
+                          normAxis[ 1 ] * sinHalfTheta,
+                          normAxis[ 2 ] * sinHalfTheta,
+                          std::cos( halfRadians ) );
+}
+
+/// Set the rotation of the unit quaternion \p i_quaternion onto the transformation matrix \p o_matrix.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Only the upper left 3x3 rotation elements of \p o_matrix are set.
+///
+/// \param i_quaternion The unit quaternion describing the rotation.
+/// \param o_matrix Transformation matrix.
+GM_HOST_DEVICE inline void SetRotate( const Quatf& i_quaternion, Mat3f& o_matrix )
+{
+    const float x = i_quaternion.X();
+    const float y = i_quaternion.Y();
+    const float z = i_quaternion.Z();
+    const float w = i_quaternion.W();
+
+    const float x2 = x + x;
+    const float y2 = y + y;
+    const float z2 = z + z;
+
+    const float xx2 = x * x2;
+    const float yy2 = y * y2;
+    const float zz2 = z * z2;
+    const float xy2 = x * y2;
+    const float xz2 = x * z2;
+    const float yz2 = y * z2;
+    const float wx2 = w * x2;
+    const float wy2 = w * y2;
+    const float wz2 = w * z2;
+
+    o_matrix( 0, 0 ) = 1.0f - ( yy2 + zz2 );
+    o_matrix( 0, 1 ) = xy2 - wz2;
+    o_matrix( 0, 2 ) = xz2 + wy2;
+
+    o_matrix( 1, 0 ) = xy2 + wz2;
+    o_matrix( 1, 1 ) = 1.0f - ( xx2 + zz2 );
+    o_matrix( 1, 2 ) = yz2 - wx2;
+
+    o_matrix( 2, 0 ) = xz2 - wy2;
+    o_matrix( 2, 1 ) = yz2 + wx2;
+    o_matrix( 2, 2 ) = 1.0f - ( xx2 + yy2 );
+}
+
+/// Set the rotation of the unit quaternion \p i_quaternion onto the transformation matrix \p o_matrix.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Only the upper left 3x3 rotation elements of \p o_matrix are set.
+///
+/// \param i_quaternion The unit quaternion describing the rotation.
+/// \param o_matrix Transformation matrix.
+GM_HOST_DEVICE inline void SetRotate( const Quatf& i_quaternion, Mat4f& o_matrix )
+{
+    const float x = i_quaternion.X();
+    const float y = i_quaternion.Y();
+    const float z = i_quaternion.Z();
+    const float w = i_quaternion.W();
+
+    const float x2 = x + x;
+    const float y2 = y + y;
+    const float z2 = z + z;
+
+    const float xx2 = x * x2;
+    const float yy2 = y * y2;
+    const float zz2 = z * z2;
+    const float xy2 = x * y2;
+    const float xz2 = x * z2;
+    const float yz2 = y * z2;
+    const float wx2 = w * x2;
+    const float wy2 = w * y2;
+    const float wz2 = w * z2;
+
+    o_matrix( 0, 0 ) = 1.0f - ( yy2 + zz2 );
+    o_matrix( 0, 1 ) = xy2 - wz2;
+    o_matrix( 0, 2 ) = xz2 + wy2;
+
+    o_matrix( 1, 0 ) = xy2 + wz2;
+    o_matrix( 1, 1 ) = 1.0f - ( xx2 + zz2 );
+    o_matrix( 1, 2 ) = yz2 - wx2;
+
+    o_matrix( 2, 0 ) = xz2 - wy2;
+    o_matrix( 2, 1 ) = yz2 + wx2;
+    o_matrix( 2, 2 ) = 1.0f - ( xx2 + yy2 );
+}
+
 GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,67 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file functions/sphericalLinearInterpolation.h
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Spherical linear interpolation (slerp).
+///
+/// Interpolate from a source to target unit quaternion along the great arc between them, such that the
+/// rotation changes at a constant angular velocity with respect to the weight:
+///
+/// \f[ \frac{\sin((1-w)\theta)}{\sin\theta}S+\frac{\sin(w\theta)}{\sin\theta}T=V \f]
+/// \f[ \theta=\arccos(S \cdot T) \f]
+///
+/// The shortest of the two arcs is taken, by negating the target if required.  Nearly parallel quaternions
+/// fall back to a normalized linear interpolation, where \f$\sin\theta\f$ approaches 0.
+
+#include <gm/gm.h>
+
+#include <gm/types/quatf.h>
+
+#include <gm/functions/dotProduct.h>
+#include <gm/functions/normalize.h>
+
+#include <cmath>
+
+GM_NS_OPEN
+
+/// Spherically interpolate between the unit quaternions \p i_source and \p i_target, with weight \p i_weight.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_source Source unit quaternion to interpolate from.
+/// \param i_target Target unit quaternion to interpolate to.
+/// \param i_weight Describes the percentage of \p i_target in the final, interpolated value.
+///
+/// \pre \p i_weight must be in the range of [0,1].
+///
+/// \return Spherically interpolated unit quaternion.
+GM_HOST_DEVICE inline Quatf
+SphericalLinearInterpolation( const Quatf& i_source, const Quatf& i_target, const float& i_weight )
+{
+    GM_ASSERT_MSG( i_weight >= 0.0f && i_weight <= 1.0f, "Expected i_weight between [0,1], got %f\n", i_weight );
+
+    // Take the shortest arc.
+    float cosTheta = DotProduct( i_source, i_target );
+    Quatf target   = i_target;
+    if ( cosTheta < 0.0f )
+    {
+        cosTheta = -cosTheta;
+        target   = -target;
+    }
+
+    if ( cosTheta > 0.9995f )
+    {
+        return Normalize( i_source * ( 1.0f - i_weight ) + target * i_weight );
+    }
+
+    const float theta       = std::acos( cosTheta );
+    const float invSinTheta = 1.0f / std::sin( theta );
+    return i_source * ( std::sin( ( 1.0f - i_weight ) * theta ) * invSinTheta ) +
+           target * ( std::sin( i_weight * theta ) * invSinTheta );
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,83 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/functions/approximateLength.h>
+#include <gm/functions/length.h>
+
+#include <algorithm>
+#include <cmath>
+
+TEST_CASE( "ApproximateLength_Vec2f" )
+{
+    CHECK( gm::ApproximateLength( gm::Vec2f() ) == 0.0f );
+
+    // Relative error bound, with respect to the exact length.
+    double maxRelativeError = 0.0;
+    for ( int index = 1; index < 4096; ++index )
+    {
+        gm::Vec2f vector( std::sin( index * 1.0f ) * index, std::sin( index * 2.0f ) * index );
+        double    expected      = gm::Length( vector );
+        double    relativeError = std::abs( gm::ApproximateLength( vector ) - expected ) / expected;
+        maxRelativeError        = std::max( maxRelativeError, relativeError );
+    }
+    CHECK( maxRelativeError <= 6.0e-6 );
+}
+
+TEST_CASE( "ApproximateLength_Vec3f" )
+{
+    CHECK( gm::ApproximateLength( gm::Vec3f() ) == 0.0f );
+
+    // Relative error bound, with respect to the exact length.
+    double maxRelativeError = 0.0;
+    for ( int index = 1; index < 4096; ++index )
+    {
+        gm::Vec3f vector( std::sin( index * 1.0f ) * index,
+                          std::sin( index * 2.0f ) * index,
+                          std::sin( index * 3.0f ) * index );
+        double    expected      = gm::Length( vector );
+        double    relativeError = std::abs( gm::ApproximateLength( vector ) - expected ) / expected;
+        maxRelativeError        = std::max( maxRelativeError, relativeError );
+    }
+    CHECK( maxRelativeError <= 6.0e-6 );
+}
+
+TEST_CASE( "ApproximateLength_Vec4f" )
+{
+    CHECK( gm::ApproximateLength( gm::Vec4f() ) == 0.0f );
+
+    // Relative error bound, with respect to the exact length.
+    double maxRelativeError = 0.0;
+    for ( int index = 1; index < 4096; ++index )
+    {
+        gm::Vec4f vector( std::sin( index * 1.0f ) * index,
+                          std::sin( index * 2.0f ) * index,
+                          std::sin( index * 3.0f ) * index,
+                          std::sin( index * 4.0f ) * index );
+        double    expected      = gm::Length( vector );
+        double    relativeError = std::abs( gm::ApproximateLength( vector ) - expected ) / expected;
+        maxRelativeError        = std::max( maxRelativeError, relativeError );
+    }
+    CHECK( maxRelativeError <= 6.0e-6 );
+}
+
+TEST_CASE( "ApproximateLength_Quatf" )
+{
+    CHECK( gm::ApproximateLength( gm::Quatf() ) == 0.0f );
+
+    // Relative error bound, with respect to the exact length.
+    double maxRelativeError = 0.0;
+    for ( int index = 1; index < 4096; ++index )
+    {
+        gm::Quatf quaternion( std::sin( index * 1.0f ) * index,
+                              std::sin( index * 2.0f ) * index,
+                              std::sin( index * 3.0f ) * index,
+                              std::sin( index * 4.0f ) * index );
+        double    expected      = gm::Length( quaternion );
+        double    relativeError = std::abs( gm::ApproximateLength( quaternion ) - expected ) / expected;
+        maxRelativeError        = std::max( maxRelativeError, relativeError );
+    }
+    CHECK( maxRelativeError <= 6.0e-6 );
+}
@@ -0,0 +1,100 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/functions/approximateNormalize.h>
+#include <gm/functions/length.h>
+#include <gm/functions/normalize.h>
+
+#include <algorithm>
+#include <cmath>
+
+TEST_CASE( "ApproximateNormalize_Vec2f" )
+{
+    // The normalized vectors are of unit length and parallel to the exact normalized vectors, within the error bound.
+    double maxError = 0.0;
+    for ( int index = 1; index < 4096; ++index )
+    {
+        gm::Vec2f vector( std::sin( index * 1.0f ) * index, std::sin( index * 2.0f ) * index );
+        gm::Vec2f normalized = gm::ApproximateNormalize( vector );
+        gm::Vec2f expected   = gm::Normalize( vector );
+        maxError             = std::max( maxError, std::abs( gm::Length( normalized ) - 1.0 ) );
+        for ( size_t elementIndex = 0; elementIndex < 2; ++elementIndex )
+        {
+            maxError =
+                std::max( maxError,
+                          static_cast< double >( std::abs( normalized[ elementIndex ] - expected[ elementIndex ] ) ) );
+        }
+    }
+    CHECK( maxError <= 6.0e-6 );
+}
+
+TEST_CASE( "ApproximateNormalize_Vec3f" )
+{
+    // The normalized vectors are of unit length and parallel to the exact normalized vectors, within the error bound.
+    double maxError = 0.0;
+    for ( int index = 1; index < 4096; ++index )
+    {
+        gm::Vec3f vector( std::sin( index * 1.0f ) * index,
+                          std::sin( index * 2.0f ) * index,
+                          std::sin( index * 3.0f ) * index );
+        gm::Vec3f normalized = gm::ApproximateNormalize( vector );
+        gm::Vec3f expected   = gm::Normalize( vector );
+        maxError             = std::max( maxError, std::abs( gm::Length( normalized ) - 1.0 ) );
+        for ( size_t elementIndex = 0; elementIndex < 3; ++elementIndex )
+        {
+            maxError =
+                std::max( maxError,
+                          static_cast< double >( std::abs( normalized[ elementIndex ] - expected[ elementIndex ] ) ) );
+        }
+    }
+    CHECK( maxError <= 6.0e-6 );
+}
+
+TEST_CASE( "ApproximateNormalize_Vec4f" )
+{
+    // The normalized vectors are of unit length and parallel to the exact normalized vectors, within the error bound.
+    double maxError = 0.0;
+    for ( int index = 1; index < 4096; ++index )
+    {
+        gm::Vec4f vector( std::sin( index * 1.0f ) * index,
+                          std::sin( index * 2.0f ) * index,
+                          std::sin( index * 3.0f ) * index,
+                          std::sin( index * 4.0f ) * index );
+        gm::Vec4f normalized = gm::ApproximateNormalize( vector );
+        gm::Vec4f expected   = gm::Normalize( vector );
+        maxError             = std::max( maxError, std::abs( gm::Length( normalized ) - 1.0 ) );
+        for ( size_t elementIndex = 0; elementIndex < 4; ++elementIndex )
+        {
+            maxError =
+                std::max( maxError,
+                          static_cast< double >( std::abs( normalized[ elementIndex ] - expected[ elementIndex ] ) ) );
+        }
+    }
+    CHECK( maxError <= 6.0e-6 );
+}
+
+TEST_CASE( "ApproximateNormalize_Quatf" )
+{
+    // The normalized vectors are of unit length and parallel to the exact normalized vectors, within the error bound.
+    double maxError = 0.0;
+    for ( int index = 1; index < 4096; ++index )
+    {
+        gm::Quatf quaternion( std::sin( index * 1.0f ) * index,
+                              std::sin( index * 2.0f ) * index,
+                              std::sin( index * 3.0f ) * index,
+                              std::sin( index * 4.0f ) * index );
+        gm::Quatf normalized = gm::ApproximateNormalize( quaternion );
+        gm::Quatf expected   = gm::Normalize( quaternion );
+        maxError             = std::max( maxError, std::abs( gm::Length( normalized ) - 1.0 ) );
+        for ( size_t elementIndex = 0; elementIndex < 4; ++elementIndex )
+        {
+            maxError =
+                std::max( maxError,
+                          static_cast< double >( std::abs( normalized[ elementIndex ] - expected[ elementIndex ] ) ) );
+        }
+    }
+    CHECK( maxError <= 6.0e-6 );
+}
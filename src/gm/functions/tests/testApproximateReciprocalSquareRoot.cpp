@@ -0,0 +1,25 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/functions/approximateReciprocalSquareRoot.h>
+
+#include <algorithm>
+#include <cmath>
+
+TEST_CASE( "ApproximateReciprocalSquareRoot_float" )
+{
+    CHECK( gm::ApproximateReciprocalSquareRoot( 4.0f ) == Approx( 0.5 ) );
+
+    // Relative error bound, over values spanning many orders of magnitude.
+    double maxRelativeError = 0.0;
+    for ( float value = 1.0e-20f; value < 1.0e20f; value *= 1.0007f )
+    {
+        double expected      = 1.0 / std::sqrt( static_cast< double >( value ) );
+        double relativeError = std::abs( gm::ApproximateReciprocalSquareRoot( value ) - expected ) / expected;
+        maxRelativeError     = std::max( maxRelativeError, relativeError );
+    }
+    CHECK( maxRelativeError <= 5.0e-6 );
+}
@@ -0,0 +1,67 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/functions/approximateSetRotate.h>
+#include <gm/functions/setRotate.h>
+
+#include <algorithm>
+#include <cmath>
+
+TEST_CASE( "ApproximateSetRotate_float_Vec3f_Mat4f" )
+{
+    // Absolute error bound of the elements, with respect to the exact rotation.  Each element is a sum of
+    // products of the approximated sine and cosine with the unit axis elements.
+    const gm::Vec3f axes[]   = {gm::Vec3f( 1, 0, 0 ),
+                              gm::Vec3f( 0, 1, 0 ),
+                              gm::Vec3f( 1, 2, 3 ),
+                              gm::Vec3f( -4, 1, 0.5 )};
+    double          maxError = 0.0;
+    for ( const gm::Vec3f& axis : axes )
+    {
+        for ( float angle = -720.0f; angle <= 720.0f; angle += 0.37f )
+        {
+            gm::Mat4f rotation;
+            gm::Mat4f expected;
+            gm::ApproximateSetRotate( angle, axis, rotation );
+            gm::SetRotate( angle, axis, expected );
+            for ( size_t elementIndex = 0; elementIndex < 16; ++elementIndex )
+            {
+                maxError = std::max(
+                    maxError,
+                    static_cast< double >( std::abs( rotation[ elementIndex ] - expected[ elementIndex ] ) ) );
+            }
+        }
+    }
+    CHECK( maxError <= 1.0e-6 );
+}
+
+TEST_CASE( "ApproximateSetRotate_float_Vec3f_Quatf" )
+{
+    // Absolute error bound of the elements, with respect to the exact rotation.  Each element is a sum of
+    // products of the approximated sine and cosine with the unit axis elements.
+    const gm::Vec3f axes[]   = {gm::Vec3f( 1, 0, 0 ),
+                              gm::Vec3f( 0, 1, 0 ),
+                              gm::Vec3f( 1, 2, 3 ),
+                              gm::Vec3f( -4, 1, 0.5 )};
+    double          maxError = 0.0;
+    for ( const gm::Vec3f& axis : axes )
+    {
+        for ( float angle = -720.0f; angle <= 720.0f; angle += 0.37f )
+        {
+            gm::Quatf rotation;
+            gm::Quatf expected;
+            gm::ApproximateSetRotate( angle, axis, rotation );
+            gm::SetRotate( angle, axis, expected );
+            for ( size_t elementIndex = 0; elementIndex < 4; ++elementIndex )
+            {
+                maxError = std::max(
+                    maxError,
+                    static_cast< double >( std::abs( rotation[ elementIndex ] - expected[ elementIndex ] ) ) );
+            }
+        }
+    }
+    CHECK( maxError <= 1.0e-6 );
+}
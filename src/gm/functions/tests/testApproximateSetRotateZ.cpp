@@ -0,0 +1,33 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/functions/approximateSetRotateZ.h>
+#include <gm/functions/setRotateZ.h>
+
+#include <algorithm>
+#include <cmath>
+
+TEST_CASE( "ApproximateSetRotateZ_float_Mat4f" )
+{
+    // Absolute error bound of the rotation elements, with respect to the exact rotation.
+    double maxError = 0.0;
+    for ( float angle = -720.0f; angle <= 720.0f; angle += 0.37f )
+    {
+        gm::Mat4f matrix   = gm::Mat4f::Identity();
+        gm::Mat4f expected = gm::Mat4f::Identity();
+        gm::ApproximateSetRotateZ( angle, matrix );
+        gm::SetRotateZ( angle, expected );
+        for ( size_t elementIndex = 0; elementIndex < 16; ++elementIndex )
+        {
+            maxError =
+                std::max( maxError,
+                          static_cast< double >( std::abs( matrix[ elementIndex ] - expected[ elementIndex ] ) ) );
+        }
+    }
+
+    // The exact sine and cosine are within half a unit in the last place.
+    CHECK( maxError <= 2.0e-7 + 6.0e-8 );
+}
@@ -0,0 +1,28 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/functions/approximateSineCosine.h>
+
+#include <algorithm>
+#include <cmath>
+
+TEST_CASE( "ApproximateSineCosine_float_float_float" )
+{
+    float sine, cosine;
+    gm::ApproximateSineCosine( 0.0f, sine, cosine );
+    CHECK( sine == 0.0f );
+    CHECK( cosine == 1.0f );
+
+    // Absolute error bound, over the documented range of angles, including many quadrants.
+    double maxError = 0.0;
+    for ( float angle = -8192.0f; angle <= 8192.0f; angle += 0.0013f )
+    {
+        gm::ApproximateSineCosine( angle, sine, cosine );
+        maxError = std::max( maxError, std::abs( sine - std::sin( static_cast< double >( angle ) ) ) );
+        maxError = std::max( maxError, std::abs( cosine - std::cos( static_cast< double >( angle ) ) ) );
+    }
+    CHECK( maxError <= 2.0e-7 );
+}
@@ -0,0 +1,112 @@
+#include <catch2/catch.hpp>
+
+#include <gm/functions/batch/coordinateSystem.h>
+#include <gm/functions/batch/dotProduct.h>
+#include <gm/functions/batch/linearInterpolation.h>
+#include <gm/functions/batch/quadraticRoots.h>
+#include <gm/functions/batch/setTranslate.h>
+#include <gm/functions/batch/transformPoint.h>
+
+#include <vector>
+
+TEST_CASE( "BatchInput_Varying" )
+{
+    std::vector< float >    values = {1.0f, 2.0f, 3.0f};
+    gm::BatchInput< float > input( values );
+    CHECK( !input.IsUniform() );
+    CHECK( input[ 0 ] == 1.0f );
+    CHECK( input[ 2 ] == 3.0f );
+}
+
+TEST_CASE( "BatchInput_Uniform" )
+{
+    float                   value = 5.0f;
+    gm::BatchInput< float > input( value );
+    CHECK( input.IsUniform() );
+    CHECK( input[ 0 ] == 5.0f );
+    CHECK( input[ 2 ] == 5.0f );
+}
+
+TEST_CASE( "Batch_DotProduct_Vec3f" )
+{
+    std::vector< gm::Vec3f > lhs = {gm::Vec3f( 1, 0, 0 ), gm::Vec3f( 0, 1, 0 ), gm::Vec3f( 1, 2, 3 )};
+    std::vector< gm::Vec3f > rhs = {gm::Vec3f( 1, 0, 0 ), gm::Vec3f( 1, 0, 0 ), gm::Vec3f( 4, 5, 6 )};
+    std::vector< float >     products( lhs.size() );
+    gm::DotProduct( lhs, rhs, lhs.size(), products.data() );
+    CHECK( products == std::vector< float >( {1.0f, 0.0f, 32.0f} ) );
+}
+
+TEST_CASE( "Batch_LinearInterpolation_Vec3f_UniformWeight" )
+{
+    std::vector< gm::Vec3f > sources = {gm::Vec3f( 0, 0, 0 ), gm::Vec3f( 2, 4, 6 )};
+    std::vector< gm::Vec3f > targets = {gm::Vec3f( 2, 2, 2 ), gm::Vec3f( 4, 8, 12 )};
+    std::vector< gm::Vec3f > results( sources.size() );
+    gm::LinearInterpolation( sources, targets, 0.5f, sources.size(), results.data() );
+    CHECK( results[ 0 ] == gm::Vec3f( 1, 1, 1 ) );
+    CHECK( results[ 1 ] == gm::Vec3f( 3, 6, 9 ) );
+}
+
+TEST_CASE( "Batch_TransformPoint_UniformMatrix" )
+{
+    gm::Mat4f matrix = gm::Mat4f::Identity();
+    gm::SetTranslate( gm::Vec3f( 1, 2, 3 ), matrix );
+
+    std::vector< gm::Vec3f > points = {gm::Vec3f( 0, 0, 0 ), gm::Vec3f( 1, 1, 1 ), gm::Vec3f( -1, -2, -3 )};
+    std::vector< gm::Vec3f > transformed( points.size() );
+    gm::TransformPoint( matrix, points, points.size(), transformed.data() );
+    for ( size_t index = 0; index < points.size(); ++index )
+    {
+        CHECK( transformed[ index ] == gm::TransformPoint( matrix, points[ index ] ) );
+    }
+}
+
+TEST_CASE( "Batch_TransformPoint_Aligned" )
+{
+    gm::Mat4f matrix = gm::Mat4f::Identity();
+    gm::SetTranslate( gm::Vec3f( 1, 2, 3 ), matrix );
+
+    std::vector< gm::Vec3fA > points = {gm::Vec3fA( 0, 0, 0 ), gm::Vec3fA( 1, 1, 1 ), gm::Vec3fA( -1, -2, -3 )};
+    std::vector< gm::Vec3fA > transformed( points.size() );
+    gm::TransformPoint( gm::Mat4fA( matrix ), points, points.size(), transformed.data() );
+    for ( size_t index = 0; index < points.size(); ++index )
+    {
+        CHECK( transformed[ index ].GetUnaligned() == gm::TransformPoint( matrix, points[ index ].GetUnaligned() ) );
+    }
+}
+
+TEST_CASE( "Batch_SetTranslate_Mat4f" )
+{
+    std::vector< gm::Vec3f > translations = {gm::Vec3f( 1, 2, 3 ), gm::Vec3f( 4, 5, 6 )};
+    std::vector< gm::Mat4f > matrices( translations.size(), gm::Mat4f::Identity() );
+    gm::SetTranslate( translations, translations.size(), matrices.data() );
+    CHECK( matrices[ 0 ]( 0, 3 ) == 1.0f );
+    CHECK( matrices[ 1 ]( 2, 3 ) == 6.0f );
+}
+
+TEST_CASE( "Batch_CoordinateSystem_Vec3f" )
+{
+    std::vector< gm::Vec3f > vectorsA = {gm::Vec3f( 1, 0, 0 ), gm::Vec3f( 0, 1, 0 )};
+    std::vector< gm::Vec3f > vectorsB( vectorsA.size() );
+    std::vector< gm::Vec3f > vectorsC( vectorsA.size() );
+    gm::CoordinateSystem( vectorsA, vectorsA.size(), vectorsB.data(), vectorsC.data() );
+    for ( size_t index = 0; index < vectorsA.size(); ++index )
+    {
+        gm::Vec3f vectorB, vectorC;
+        gm::CoordinateSystem( vectorsA[ index ], vectorB, vectorC );
+        CHECK( vectorsB[ index ] == vectorB );
+        CHECK( vectorsC[ index ] == vectorC );
+    }
+}
+
+TEST_CASE( "Batch_QuadraticRoots_float" )
+{
+    std::vector< float >     a = {1.0f, -4.0f, 2.0f};
+    std::vector< float >     b = {-3.0f, 12.0f, -11.0f};
+    std::vector< float >     c = {4.0f, -9.0f, 5.0f};
+    std::vector< gm::Vec2f > roots( a.size() );
+    std::vector< int >       rootCounts( a.size() );
+    gm::QuadraticRoots( a, b, c, a.size(), roots.data(), rootCounts.data() );
+    CHECK( rootCounts == std::vector< int >( {0, 1, 2} ) );
+    CHECK( roots[ 1 ][ 0 ] == 1.5f );
+    CHECK( roots[ 2 ] == gm::Vec2f( 0.5f, 5.0f ) );
+}
@@ -26,3 +26,10 @@ TEST_CASE( "DotProduct_Vec4f" )
     gm::Vec4f vectorB = gm::Vec4f( 0.0f, 5.0f, 10.0f, 15.0f );
     CHECK( gm::DotProduct( vectorA, vectorB ) == 70.0f );
 }
+
+TEST_CASE( "DotProduct_Quatf" )
+{
+    gm::Quatf quaternionA = gm::Quatf( 0.0f, 1.0f, 2.0f, 3.0f );
+    gm::Quatf quaternionB = gm::Quatf( 0.0f, 5.0f, 10.0f, 15.0f );
+    CHECK( gm::DotProduct( quaternionA, quaternionB ) == 70.0f );
+}
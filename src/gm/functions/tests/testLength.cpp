@@ -23,3 +23,9 @@ TEST_CASE( "Length_Vec4f" )
     gm::Vec4f vector( 0.0f, 2.0f, 4.0f, 6.0f );
     CHECK( gm::Length( vector ) == Approx( 7.48331477355f ) );
 }
+
+TEST_CASE( "Length_Quatf" )
+{
+    gm::Quatf quaternion( 0.0f, 2.0f, 4.0f, 6.0f );
+    CHECK( gm::Length( quaternion ) == Approx( 7.48331477355f ) );
+}
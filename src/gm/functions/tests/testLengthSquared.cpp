@@ -23,3 +23,9 @@ TEST_CASE( "LengthSquared_Vec4f" )
     gm::Vec4f vector( 0.0f, 2.0f, 4.0f, 6.0f );
     CHECK( gm::LengthSquared( vector ) == 56.0f );
 }
+
+TEST_CASE( "LengthSquared_Quatf" )
+{
+    gm::Quatf quaternion( 0.0f, 2.0f, 4.0f, 6.0f );
+    CHECK( gm::LengthSquared( quaternion ) == 56.0f );
+}
@@ -23,3 +23,9 @@ TEST_CASE( "Normalize_Vec4f" )
     gm::Vec4f vector( 0.0f, 2.0f, 4.0f, 6.0f );
     CHECK( gm::Normalize( vector ) == gm::Vec4f( 0.0f, 0.267261241912f, 0.534522483825f, 0.801783725737f ) );
 }
+
+TEST_CASE( "Normalize_Quatf" )
+{
+    gm::Quatf quaternion( 0.0f, 2.0f, 4.0f, 6.0f );
+    CHECK( gm::Normalize( quaternion ) == gm::Quatf( 0.0f, 0.267261241912f, 0.534522483825f, 0.801783725737f ) );
+}
@@ -451,3 +451,168 @@ TEST_CASE( "RayAABBIntersection_Vec4fRange" )
             /* intersections */ intersections ) );
     }
 }
+
+TEST_CASE( "RayAABBIntersection_Vec3fPacket4" )
+{
+    gm::Vec3fRange aabb( gm::Vec3f( -2, -2, -2 ), gm::Vec3f( 2, 2, 2 ) );
+
+    // Volume intersection, ray origin inside aabb, skim intersection, and no intersection.
+    const gm::Vec3f rayOrigins[ 4 ]    = {gm::Vec3f( -4, -4, -4 ),
+                                       gm::Vec3f( -1, 0, 0 ),
+                                       gm::Vec3f( -4, 0, 0 ),
+                                       gm::Vec3f( -5, 0, 0 )};
+    const gm::Vec3f rayDirections[ 4 ] = {gm::Normalize( gm::Vec3f( 1, 1, 1 ) ),
+                                          gm::Normalize( gm::Vec3f( -1, -1, -1 ) ),
+                                          gm::Normalize( gm::Vec3f( 1, 1, 1 ) ),
+                                          gm::Normalize( gm::Vec3f( 1, 1, 1 ) )};
+
+    gm::Vec3fPacket4 rayOrigin;
+    gm::Vec3fPacket4 rayDirection;
+    for ( size_t laneIndex = 0; laneIndex < 4; ++laneIndex )
+    {
+        rayOrigin.SetLane( laneIndex, rayOrigins[ laneIndex % 4 ] );
+        rayDirection.SetLane( laneIndex, rayDirections[ laneIndex % 4 ] );
+    }
+
+    gm::FloatRangePacket4 intersections;
+    int                   hitMask = gm::RayAABBIntersection( rayOrigin, rayDirection, aabb, intersections );
+
+    // Each lane must match the single ray intersection test.
+    for ( size_t laneIndex = 0; laneIndex < 4; ++laneIndex )
+    {
+        gm::FloatRange laneIntersections;
+        bool           hit = gm::RayAABBIntersection( rayOrigins[ laneIndex % 4 ],
+                                            rayDirections[ laneIndex % 4 ],
+                                            aabb,
+                                            laneIntersections );
+        CHECK( ( ( hitMask >> laneIndex ) & 1 ) == int( hit ) );
+        if ( hit )
+        {
+            CHECK( intersections.GetLane( laneIndex ).Min() == Approx( laneIntersections.Min() ) );
+            CHECK( intersections.GetLane( laneIndex ).Max() == Approx( laneIntersections.Max() ) );
+        }
+    }
+}
+
+TEST_CASE( "RayAABBIntersection_Vec3fPacket8" )
+{
+    gm::Vec3fRange aabb( gm::Vec3f( -2, -2, -2 ), gm::Vec3f( 2, 2, 2 ) );
+
+    // Volume intersection, ray origin inside aabb, skim intersection, and no intersection.
+    const gm::Vec3f rayOrigins[ 4 ]    = {gm::Vec3f( -4, -4, -4 ),
+                                       gm::Vec3f( -1, 0, 0 ),
+                                       gm::Vec3f( -4, 0, 0 ),
+                                       gm::Vec3f( -5, 0, 0 )};
+    const gm::Vec3f rayDirections[ 4 ] = {gm::Normalize( gm::Vec3f( 1, 1, 1 ) ),
+                                          gm::Normalize( gm::Vec3f( -1, -1, -1 ) ),
+                                          gm::Normalize( gm::Vec3f( 1, 1, 1 ) ),
+                                          gm::Normalize( gm::Vec3f( 1, 1, 1 ) )};
+
+    gm::Vec3fPacket8 rayOrigin;
+    gm::Vec3fPacket8 rayDirection;
+    for ( size_t laneIndex = 0; laneIndex < 8; ++laneIndex )
+    {
+        rayOrigin.SetLane( laneIndex, rayOrigins[ laneIndex % 4 ] );
+        rayDirection.SetLane( laneIndex, rayDirections[ laneIndex % 4 ] );
+    }
+
+    gm::FloatRangePacket8 intersections;
+    int                   hitMask = gm::RayAABBIntersection( rayOrigin, rayDirection, aabb, intersections );
+
+    // Each lane must match the single ray intersection test.
+    for ( size_t laneIndex = 0; laneIndex < 8; ++laneIndex )
+    {
+        gm::FloatRange laneIntersections;
+        bool           hit = gm::RayAABBIntersection( rayOrigins[ laneIndex % 4 ],
+                                            rayDirections[ laneIndex % 4 ],
+                                            aabb,
+                                            laneIntersections );
+        CHECK( ( ( hitMask >> laneIndex ) & 1 ) == int( hit ) );
+        if ( hit )
+        {
+            CHECK( intersections.GetLane( laneIndex ).Min() == Approx( laneIntersections.Min() ) );
+            CHECK( intersections.GetLane( laneIndex ).Max() == Approx( laneIntersections.Max() ) );
+        }
+    }
+}
+
+TEST_CASE( "RayAABBIntersection_Vec3fPacket16" )
+{
+    gm::Vec3fRange aabb( gm::Vec3f( -2, -2, -2 ), gm::Vec3f( 2, 2, 2 ) );
+
+    // Volume intersection, ray origin inside aabb, skim intersection, and no intersection.
+    const gm::Vec3f rayOrigins[ 4 ]    = {gm::Vec3f( -4, -4, -4 ),
+                                       gm::Vec3f( -1, 0, 0 ),
+                                       gm::Vec3f( -4, 0, 0 ),
+                                       gm::Vec3f( -5, 0, 0 )};
+    const gm::Vec3f rayDirections[ 4 ] = {gm::Normalize( gm::Vec3f( 1, 1, 1 ) ),
+                                          gm::Normalize( gm::Vec3f( -1, -1, -1 ) ),
+                                          gm::Normalize( gm::Vec3f( 1, 1, 1 ) ),
+                                          gm::Normalize( gm::Vec3f( 1, 1, 1 ) )};
+
+    gm::Vec3fPacket16 rayOrigin;
+    gm::Vec3fPacket16 rayDirection;
+    for ( size_t laneIndex = 0; laneIndex < 16; ++laneIndex )
+    {
+        rayOrigin.SetLane( laneIndex, rayOrigins[ laneIndex % 4 ] );
+        rayDirection.SetLane( laneIndex, rayDirections[ laneIndex % 4 ] );
+    }
+
+    gm::FloatRangePacket16 intersections;
+    int                    hitMask = gm::RayAABBIntersection( rayOrigin, rayDirection, aabb, intersections );
+
+    // Each lane must match the single ray intersection test.
+    for ( size_t laneIndex = 0; laneIndex < 16; ++laneIndex )
+    {
+        gm::FloatRange laneIntersections;
+        bool           hit = gm::RayAABBIntersection( rayOrigins[ laneIndex % 4 ],
+                                            rayDirections[ laneIndex % 4 ],
+                                            aabb,
+                                            laneIntersections );
+        CHECK( ( ( hitMask >> laneIndex ) & 1 ) == int( hit ) );
+        if ( hit )
+        {
+            CHECK( intersections.GetLane( laneIndex ).Min() == Approx( laneIntersections.Min() ) );
+            CHECK( intersections.GetLane( laneIndex ).Max() == Approx( laneIntersections.Max() ) );
+        }
+    }
+}
+
+TEST_CASE( "RayAABBIntersection_Ray" )
+{
+    gm::Vec3fRange aabb( gm::Vec3f( -2, -2, -2 ), gm::Vec3f( 2, 2, 2 ) );
+
+    // Volume intersection, ray origin inside aabb, skim intersection, no intersection, and axis aligned
+    // rays with zero direction components.
+    const gm::Vec3f rayOrigins[ 7 ]    = {gm::Vec3f( -4, -4, -4 ),
+                                       gm::Vec3f( -1, 0, 0 ),
+                                       gm::Vec3f( -4, 0, 0 ),
+                                       gm::Vec3f( -5, 0, 0 ),
+                                       gm::Vec3f( 0, 0, -4 ),
+                                       gm::Vec3f( 0, 3, -4 ),
+                                       gm::Vec3f( 4, 1, 1 )};
+    const gm::Vec3f rayDirections[ 7 ] = {gm::Normalize( gm::Vec3f( 1, 1, 1 ) ),
+                                          gm::Normalize( gm::Vec3f( -1, -1, -1 ) ),
+                                          gm::Normalize( gm::Vec3f( 1, 1, 1 ) ),
+                                          gm::Normalize( gm::Vec3f( 1, 1, 1 ) ),
+                                          gm::Vec3f( 0, 0, 1 ),
+                                          gm::Vec3f( 0, 0, 1 ),
+                                          gm::Vec3f( -1, 0, 0 )};
+
+    // Must match the intersection test of the ray origin and direction.
+    for ( size_t rayIndex = 0; rayIndex < 7; ++rayIndex )
+    {
+        gm::FloatRange expectedIntersections;
+        bool           expectedHit =
+            gm::RayAABBIntersection( rayOrigins[ rayIndex ], rayDirections[ rayIndex ], aabb, expectedIntersections );
+
+        gm::FloatRange intersections;
+        gm::Ray        ray( rayOrigins[ rayIndex ], rayDirections[ rayIndex ] );
+        CHECK( gm::RayAABBIntersection( ray, aabb, intersections ) == expectedHit );
+        if ( expectedHit )
+        {
+            CHECK( intersections.Min() == Approx( expectedIntersections.Min() ) );
+            CHECK( intersections.Max() == Approx( expectedIntersections.Max() ) );
+        }
+    }
+}
@@ -32,4 +32,127 @@ TEST_CASE( "RaySphereIntersection_float" )
         CHECK( intersections.Min() == 0.5f );
         CHECK( intersections.Max() == 1.5f );
     }
-}
\ No newline at end of file
+}
+
+TEST_CASE( "RaySphereIntersection_Vec3fPacket4" )
+{
+    gm::Vec3f sphereOrigin( 0, 0, -1.0f );
+    float     sphereRadius = 0.5f;
+
+    // No intersections, 2 intersections, ray origin inside the sphere, and sphere behind the ray.
+    const gm::Vec3f      rayOrigins[ 4 ]            = {gm::Vec3f( 0, 0, 0 ),
+                                       gm::Vec3f( 0, 0, 0 ),
+                                       gm::Vec3f( 0, 0, -1 ),
+                                       gm::Vec3f( 0, 0, 0 )};
+    const gm::Vec3f      rayDirections[ 4 ]         = {gm::Normalize( gm::Vec3f( 0, 1, -1 ) ),
+                                          gm::Vec3f( 0, 0, -1 ),
+                                          gm::Vec3f( 0, 0, -1 ),
+                                          gm::Vec3f( 0, 0, 1 )};
+    const bool           expectedHits[ 4 ]          = {false, true, true, false};
+    const gm::FloatRange expectedIntersections[ 4 ] = {gm::FloatRange(),
+                                                       gm::FloatRange( 0.5f, 1.5f ),
+                                                       gm::FloatRange( 0.0f, 0.5f ),
+                                                       gm::FloatRange()};
+
+    gm::Vec3fPacket4 rayOrigin;
+    gm::Vec3fPacket4 rayDirection;
+    for ( size_t laneIndex = 0; laneIndex < 4; ++laneIndex )
+    {
+        rayOrigin.SetLane( laneIndex, rayOrigins[ laneIndex % 4 ] );
+        rayDirection.SetLane( laneIndex, rayDirections[ laneIndex % 4 ] );
+    }
+
+    gm::FloatRangePacket4 intersections;
+    int hitMask = gm::RaySphereIntersection( sphereOrigin, sphereRadius, rayOrigin, rayDirection, intersections );
+    for ( size_t laneIndex = 0; laneIndex < 4; ++laneIndex )
+    {
+        CHECK( ( ( hitMask >> laneIndex ) & 1 ) == int( expectedHits[ laneIndex % 4 ] ) );
+        if ( expectedHits[ laneIndex % 4 ] )
+        {
+            CHECK( intersections.GetLane( laneIndex ).Min() == Approx( expectedIntersections[ laneIndex % 4 ].Min() ) );
+            CHECK( intersections.GetLane( laneIndex ).Max() == Approx( expectedIntersections[ laneIndex % 4 ].Max() ) );
+        }
+    }
+}
+
+TEST_CASE( "RaySphereIntersection_Vec3fPacket8" )
+{
+    gm::Vec3f sphereOrigin( 0, 0, -1.0f );
+    float     sphereRadius = 0.5f;
+
+    // No intersections, 2 intersections, ray origin inside the sphere, and sphere behind the ray.
+    const gm::Vec3f      rayOrigins[ 4 ]            = {gm::Vec3f( 0, 0, 0 ),
+                                       gm::Vec3f( 0, 0, 0 ),
+                                       gm::Vec3f( 0, 0, -1 ),
+                                       gm::Vec3f( 0, 0, 0 )};
+    const gm::Vec3f      rayDirections[ 4 ]         = {gm::Normalize( gm::Vec3f( 0, 1, -1 ) ),
+                                          gm::Vec3f( 0, 0, -1 ),
+                                          gm::Vec3f( 0, 0, -1 ),
+                                          gm::Vec3f( 0, 0, 1 )};
+    const bool           expectedHits[ 4 ]          = {false, true, true, false};
+    const gm::FloatRange expectedIntersections[ 4 ] = {gm::FloatRange(),
+                                                       gm::FloatRange( 0.5f, 1.5f ),
+                                                       gm::FloatRange( 0.0f, 0.5f ),
+                                                       gm::FloatRange()};
+
+    gm::Vec3fPacket8 rayOrigin;
+    gm::Vec3fPacket8 rayDirection;
+    for ( size_t laneIndex = 0; laneIndex < 8; ++laneIndex )
+    {
+        rayOrigin.SetLane( laneIndex, rayOrigins[ laneIndex % 4 ] );
+        rayDirection.SetLane( laneIndex, rayDirections[ laneIndex % 4 ] );
+    }
+
+    gm::FloatRangePacket8 intersections;
+    int hitMask = gm::RaySphereIntersection( sphereOrigin, sphereRadius, rayOrigin, rayDirection, intersections );
+    for ( size_t laneIndex = 0; laneIndex < 8; ++laneIndex )
+    {
+        CHECK( ( ( hitMask >> laneIndex ) & 1 ) == int( expectedHits[ laneIndex % 4 ] ) );
+        if ( expectedHits[ laneIndex % 4 ] )
+        {
+            CHECK( intersections.GetLane( laneIndex ).Min() == Approx( expectedIntersections[ laneIndex % 4 ].Min() ) );
+            CHECK( intersections.GetLane( laneIndex ).Max() == Approx( expectedIntersections[ laneIndex % 4 ].Max() ) );
+        }
+    }
+}
+
+TEST_CASE( "RaySphereIntersection_Vec3fPacket16" )
+{
+    gm::Vec3f sphereOrigin( 0, 0, -1.0f );
+    float     sphereRadius = 0.5f;
+
+    // No intersections, 2 intersections, ray origin inside the sphere, and sphere behind the ray.
+    const gm::Vec3f      rayOrigins[ 4 ]            = {gm::Vec3f( 0, 0, 0 ),
+                                       gm::Vec3f( 0, 0, 0 ),
+                                       gm::Vec3f( 0, 0, -1 ),
+                                       gm::Vec3f( 0, 0, 0 )};
+    const gm::Vec3f      rayDirections[ 4 ]         = {gm::Normalize( gm::Vec3f( 0, 1, -1 ) ),
+                                          gm::Vec3f( 0, 0, -1 ),
+                                          gm::Vec3f( 0, 0, -1 ),
+                                          gm::Vec3f( 0, 0, 1 )};
+    const bool           expectedHits[ 4 ]          = {false, true, true, false};
+    const gm::FloatRange expectedIntersections[ 4 ] = {gm::FloatRange(),
+                                                       gm::FloatRange( 0.5f, 1.5f ),
+                                                       gm::FloatRange( 0.0f, 0.5f ),
+                                                       gm::FloatRange()};
+
+    gm::Vec3fPacket16 rayOrigin;
+    gm::Vec3fPacket16 rayDirection;
+    for ( size_t laneIndex = 0; laneIndex < 16; ++laneIndex )
+    {
+        rayOrigin.SetLane( laneIndex, rayOrigins[ laneIndex % 4 ] );
+        rayDirection.SetLane( laneIndex, rayDirections[ laneIndex % 4 ] );
+    }
+
+    gm::FloatRangePacket16 intersections;
+    int hitMask = gm::RaySphereIntersection( sphereOrigin, sphereRadius, rayOrigin, rayDirection, intersections );
+    for ( size_t laneIndex = 0; laneIndex < 16; ++laneIndex )
+    {
+        CHECK( ( ( hitMask >> laneIndex ) & 1 ) == int( expectedHits[ laneIndex % 4 ] ) );
+        if ( expectedHits[ laneIndex % 4 ] )
+        {
+            CHECK( intersections.GetLane( laneIndex ).Min() == Approx( expectedIntersections[ laneIndex % 4 ].Min() ) );
+            CHECK( intersections.GetLane( laneIndex ).Max() == Approx( expectedIntersections[ laneIndex % 4 ].Max() ) );
+        }
+    }
+}
@@ -0,0 +1,71 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/functions/batch/rotationQuaternion.h>
+#include <gm/functions/batch/setRotate.h>
+#include <gm/functions/dotProduct.h>
+#include <gm/functions/rotationQuaternion.h>
+#include <gm/functions/setRotate.h>
+
+#include <cmath>
+#include <vector>
+
+// Quaternions q and -q represent the same rotation.
+static bool SameRotation( const gm::Quatf& i_lhs, const gm::Quatf& i_rhs )
+{
+    return std::abs( std::abs( gm::DotProduct( i_lhs, i_rhs ) ) - 1.0f ) < 1e-5f;
+}
+
+TEST_CASE( "RotationQuaternion_Mat4f" )
+{
+    CHECK( gm::RotationQuaternion( gm::Mat4f::Identity() ) == gm::Quatf::Identity() );
+
+    // Each of the branches, by the largest of the quaternion elements.
+    for ( float angle : {30.0f, 90.0f, 179.0f, 180.0f, 270.0f} )
+    {
+        for ( const gm::Vec3f& axis : {gm::Vec3f( 1, 0, 0 ),
+                                       gm::Vec3f( 0, 1, 0 ),
+                                       gm::Vec3f( 0, 0, 1 ),
+                                       gm::Vec3f( 1, -2, 3 ),
+                                       gm::Vec3f( -3, 1, 1 )} )
+        {
+            gm::Quatf rotation;
+            gm::SetRotate( angle, axis, rotation );
+
+            gm::Mat4f matrix = gm::Mat4f::Identity();
+            gm::SetRotate( rotation, matrix );
+            CHECK( SameRotation( gm::RotationQuaternion( matrix ), rotation ) );
+        }
+    }
+}
+
+TEST_CASE( "RotationQuaternion_Mat3f" )
+{
+    gm::Quatf rotation;
+    gm::SetRotate( 200, gm::Vec3f( 2, 1, -1 ), rotation );
+
+    gm::Mat3f matrix = gm::Mat3f::Identity();
+    gm::SetRotate( rotation, matrix );
+    CHECK( SameRotation( gm::RotationQuaternion( matrix ), rotation ) );
+}
+
+TEST_CASE( "RotationQuaternion_Batch" )
+{
+    std::vector< gm::Quatf > rotations( 3 );
+    gm::SetRotate( 30, gm::Vec3f( 1, 0, 0 ), rotations[ 0 ] );
+    gm::SetRotate( 160, gm::Vec3f( 0, 1, 1 ), rotations[ 1 ] );
+    gm::SetRotate( 300, gm::Vec3f( 1, 2, 3 ), rotations[ 2 ] );
+
+    std::vector< gm::Mat4f > matrices( rotations.size(), gm::Mat4f::Identity() );
+    gm::SetRotate( rotations, rotations.size(), matrices.data() );
+
+    std::vector< gm::Quatf > converted( rotations.size() );
+    gm::RotationQuaternion( matrices, matrices.size(), converted.data() );
+    for ( size_t index = 0; index < rotations.size(); ++index )
+    {
+        CHECK( SameRotation( converted[ index ], rotations[ index ] ) );
+    }
+}
\ No newline at end of file
@@ -37,4 +37,46 @@ TEST_CASE( "SetRotate_Mat4f" )
     gm::SetIdentity( matrix );
     gm::SetRotate( 45, gm::Vec3f( 0, 0, 1 ), matrix );
     CHECK( matrix == gm::Mat4f( 0.707107, -0.707107, 0, 0, 0.707107, 0.707107, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1 ) );
+}
+
+TEST_CASE( "SetRotate_Quatf" )
+{
+    // Rotation quaternions produce the same matrices as the angle and axis.
+    for ( float angle : {0.0f, 45.0f, 90.0f, 210.0f} )
+    {
+        for ( const gm::Vec3f& axis : {gm::Vec3f( 1, 0, 0 ), gm::Vec3f( 0, 1, 0 ), gm::Vec3f( 1, 2, 3 )} )
+        {
+            gm::Quatf quaternion;
+            gm::SetRotate( angle, axis, quaternion );
+
+            gm::Mat4f expected;
+            gm::SetIdentity( expected );
+            gm::SetRotate( angle, axis, expected );
+
+            gm::Mat4f matrix;
+            gm::SetIdentity( matrix );
+            gm::SetRotate( quaternion, matrix );
+            CHECK( matrix == expected );
+
+            gm::Mat3f matrix3;
+            gm::SetIdentity( matrix3 );
+            gm::SetRotate( quaternion, matrix3 );
+            CHECK( matrix3 == gm::Mat3f( expected( 0, 0 ),
+                                         expected( 0, 1 ),
+                                         expected( 0, 2 ),
+                                         expected( 1, 0 ),
+                                         expected( 1, 1 ),
+                                         expected( 1, 2 ),
+                                         expected( 2, 0 ),
+                                         expected( 2, 1 ),
+                                         expected( 2, 2 ) ) );
+        }
+    }
+
+    // Only the rotation elements are set.
+    gm::Quatf quaternion;
+    gm::SetRotate( 90, gm::Vec3f( 0, 0, 1 ), quaternion );
+    gm::Mat4f matrix( 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16 );
+    gm::SetRotate( quaternion, matrix );
+    CHECK( matrix == gm::Mat4f( 0, -1, 0, 4, 1, 0, 0, 8, 0, 0, 1, 12, 13, 14, 15, 16 ) );
 }
\ No newline at end of file
@@ -0,0 +1,41 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/functions/length.h>
+#include <gm/functions/setRotate.h>
+#include <gm/functions/sphericalLinearInterpolation.h>
+
+TEST_CASE( "SphericalLinearInterpolation_Quatf_Quatf_float" )
+{
+    gm::Quatf source;
+    gm::SetRotate( 0, gm::Vec3f( 0, 0, 1 ), source );
+    gm::Quatf target;
+    gm::SetRotate( 90, gm::Vec3f( 0, 0, 1 ), target );
+
+    // End points.
+    CHECK( gm::SphericalLinearInterpolation( source, target, 0.0f ) == source );
+    CHECK( gm::SphericalLinearInterpolation( source, target, 1.0f ) == target );
+
+    // Constant angular velocity.
+    for ( float weight : {0.25f, 0.5f, 0.75f} )
+    {
+        gm::Quatf expected;
+        gm::SetRotate( 90 * weight, gm::Vec3f( 0, 0, 1 ), expected );
+        gm::Quatf interpolated = gm::SphericalLinearInterpolation( source, target, weight );
+        CHECK( interpolated == expected );
+        CHECK( gm::Length( interpolated ) == Approx( 1.0f ) );
+    }
+
+    // Shortest arc, with the target in the opposite hemisphere.
+    gm::Quatf expected;
+    gm::SetRotate( 45, gm::Vec3f( 0, 0, 1 ), expected );
+    CHECK( gm::SphericalLinearInterpolation( source, -target, 0.5f ) == expected );
+
+    // Nearly parallel.
+    gm::Quatf nearTarget;
+    gm::SetRotate( 0.01f, gm::Vec3f( 0, 0, 1 ), nearTarget );
+    CHECK( gm::Length( gm::SphericalLinearInterpolation( source, nearTarget, 0.5f ) ) == Approx( 1.0f ) );
+}
\ No newline at end of file
@@ -4,11 +4,14 @@
 
 #include <catch2/catch.hpp>
 
+#include <gm/functions/batch/transformAABB.h>
+#include <gm/functions/expand.h>
 #include <gm/functions/setIdentity.h>
 #include <gm/functions/setRotateX.h>
 #include <gm/functions/setScale.h>
 #include <gm/functions/setTranslate.h>
 #include <gm/functions/transformAABB.h>
+#include <gm/functions/transformPoint.h>
 
 TEST_CASE( "TransformAABB_Vec3fRange" )
 {
@@ -30,4 +33,55 @@ TEST_CASE( "TransformAABB_Vec3fRange" )
     gm::SetIdentity( matrix );
     gm::SetScale( gm::Vec3f( 2, 3, 4 ), matrix );
     CHECK( gm::TransformAABB( matrix, aabb ) == gm::Vec3fRange( gm::Vec3f( 2, 3, 4 ), gm::Vec3f( 6, 9, 12 ) ) );
+}
+
+TEST_CASE( "TransformAABB_Vec3fRange_MatchesCorners" )
+{
+    gm::Vec3fRange aabb( gm::Vec3f( -1, 2, -3 ), gm::Vec3f( 4, 5, 6 ) );
+
+    // Affine transformation, with negative scale.
+    gm::Mat4f matrix = gm::Mat4f::Identity();
+    gm::SetRotateX( 30, matrix );
+    gm::SetScale( gm::Vec3f( -2, 3, 4 ), matrix );
+    gm::SetTranslate( gm::Vec3f( 1, 2, 3 ), matrix );
+
+    // Projective transformation.
+    gm::Mat4f projective = matrix;
+    projective( 3, 2 )   = 0.1f;
+    projective( 3, 3 )   = 2.0f;
+
+    for ( const gm::Mat4f& transform : {matrix, projective} )
+    {
+        gm::Vec3fRange expected;
+        for ( int corner = 0; corner < 8; ++corner )
+        {
+            gm::Vec3f point( ( corner & 1 ) ? aabb.Max()[ 0 ] : aabb.Min()[ 0 ],
+                             ( corner & 2 ) ? aabb.Max()[ 1 ] : aabb.Min()[ 1 ],
+                             ( corner & 4 ) ? aabb.Max()[ 2 ] : aabb.Min()[ 2 ] );
+            expected = gm::Expand( expected, gm::TransformPoint( transform, point ) );
+        }
+
+        CHECK( gm::TransformAABB( transform, aabb ) == expected );
+    }
+}
+
+TEST_CASE( "TransformAABB_Vec3fRange_Batch" )
+{
+    gm::Mat4f matrices[ 2 ] = {gm::Mat4f::Identity(), gm::Mat4f::Identity()};
+    gm::SetTranslate( gm::Vec3f( 1, 2, 3 ), matrices[ 0 ] );
+    gm::SetScale( gm::Vec3f( 2, 3, 4 ), matrices[ 1 ] );
+
+    gm::Vec3fRange aabbs[ 2 ] = {gm::Vec3fRange( gm::Vec3f( 1, 1, 1 ), gm::Vec3f( 3, 3, 3 ) ),
+                                 gm::Vec3fRange( gm::Vec3f( 0, 0, 0 ), gm::Vec3f( 1, 1, 1 ) )};
+    gm::Vec3fRange transformedAABBs[ 2 ];
+
+    // Single matrix.
+    gm::TransformAABB( matrices[ 0 ], aabbs, 2, transformedAABBs );
+    CHECK( transformedAABBs[ 0 ] == gm::Vec3fRange( gm::Vec3f( 2, 3, 4 ), gm::Vec3f( 4, 5, 6 ) ) );
+    CHECK( transformedAABBs[ 1 ] == gm::Vec3fRange( gm::Vec3f( 1, 2, 3 ), gm::Vec3f( 2, 3, 4 ) ) );
+
+    // One matrix per AABB.
+    gm::TransformAABB( matrices, aabbs, 2, transformedAABBs );
+    CHECK( transformedAABBs[ 0 ] == gm::Vec3fRange( gm::Vec3f( 2, 3, 4 ), gm::Vec3f( 4, 5, 6 ) ) );
+    CHECK( transformedAABBs[ 1 ] == gm::Vec3fRange( gm::Vec3f( 0, 0, 0 ), gm::Vec3f( 2, 3, 4 ) ) );
 }
\ No newline at end of file
@@ -12,7 +12,11 @@
 #include <gm/gm.h>
 
 #include <gm/types/mat4f.h>
+#include <gm/types/mat4fA.h>
 #include <gm/types/vec3f.h>
+#include <gm/types/vec3fA.h>
+
+#include <gm/base/simd.h>
 
 GM_NS_OPEN
 
@@ -25,6 +29,28 @@ GM_NS_OPEN
 /// \return Transformed point.
 GM_HOST_DEVICE inline Vec3f TransformPoint( const Mat4f& i_matrix, const Vec3f& i_point )
 {
+#if defined( GM_SIMD_SSE_ENABLED )
+    // Linear combination of the matrix columns, weighted by the homogeneous point (x, y, z, 1).
+    const float* matrixData = i_matrix.Data();
+    __m128       column0    = _mm_loadu_ps( matrixData + 0 );
+    __m128       column1    = _mm_loadu_ps( matrixData + 4 );
+    __m128       column2    = _mm_loadu_ps( matrixData + 8 );
+    __m128       column3    = _mm_loadu_ps( matrixData + 12 );
+    _MM_TRANSPOSE4_PS( column0, column1, column2, column3 );
+#if defined( GM_SIMD_AVX2_ENABLED )
+    __m128 transformed = _mm_fmadd_ps( column0, _mm_set1_ps( i_point.X() ), column3 );
+    transformed        = _mm_fmadd_ps( column1, _mm_set1_ps( i_point.Y() ), transformed );
+    transformed        = _mm_fmadd_ps( column2, _mm_set1_ps( i_point.Z() ), transformed );
+#else
+    __m128 transformed = _mm_add_ps( _mm_mul_ps( column0, _mm_set1_ps( i_point.X() ) ), column3 );
+    transformed        = _mm_add_ps( _mm_mul_ps( column1, _mm_set1_ps( i_point.Y() ) ), transformed );
+    transformed        = _mm_add_ps( _mm_mul_ps( column2, _mm_set1_ps( i_point.Z() ) ), transformed );
+#endif
+    float transformedElements[ 4 ];
+    _mm_storeu_ps( transformedElements, transformed );
+    Vec3f transformedPoint( transformedElements[ 0 ], transformedElements[ 1 ], transformedElements[ 2 ] );
+    float homogenousWeight = transformedElements[ 3 ];
+#else
     Vec3f transformedPoint( i_point.X() * i_matrix( 0, 0 ) + i_point.Y() * i_matrix( 0, 1 ) +
                                 i_point.Z() * i_matrix( 0, 2 ) + i_matrix( 0, 3 ),
                             i_point.X() * i_matrix( 1, 0 ) + i_point.Y() * i_matrix( 1, 1 ) +
@@ -33,6 +59,57 @@ GM_HOST_DEVICE inline Vec3f TransformPoint( const Mat4f& i_matrix, const Vec3f&
                                 i_point.Z() * i_matrix( 2, 2 ) + i_matrix( 2, 3 ) );
     float homogenousWeight = i_point.X() * i_matrix( 3, 0 ) + i_point.Y() * i_matrix( 3, 1 ) +
                              i_point.Z() * i_matrix( 3, 2 ) + i_matrix( 3, 3 );
+#endif
+    if ( homogenousWeight == 1.0 )
+    {
+        return transformedPoint;
+    }
+    else
+    {
+        return transformedPoint / homogenousWeight;
+    }
+}
+
+/// Transform a \p i_point with the transformation matrix \p i_matrix.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// \param i_matrix The transformation matrix.
+/// \param i_point The point to transform.
+///
+/// \return Transformed point.
+GM_HOST_DEVICE inline Vec3fA TransformPoint( const Mat4fA& i_matrix, const Vec3fA& i_point )
+{
+#if defined( GM_SIMD_SSE_ENABLED )
+    // Linear combination of the matrix columns, weighted by the homogeneous point (x, y, z, 1).
+    const float* matrixData = i_matrix.Data();
+    __m128       column0    = _mm_load_ps( matrixData + 0 );
+    __m128       column1    = _mm_load_ps( matrixData + 4 );
+    __m128       column2    = _mm_load_ps( matrixData + 8 );
+    __m128       column3    = _mm_load_ps( matrixData + 12 );
+    _MM_TRANSPOSE4_PS( column0, column1, column2, column3 );
+#if defined( GM_SIMD_AVX2_ENABLED )
+    __m128 transformed = _mm_fmadd_ps( column0, _mm_set1_ps( i_point.X() ), column3 );
+    transformed        = _mm_fmadd_ps( column1, _mm_set1_ps( i_point.Y() ), transformed );
+    transformed        = _mm_fmadd_ps( column2, _mm_set1_ps( i_point.Z() ), transformed );
+#else
+    __m128 transformed = _mm_add_ps( _mm_mul_ps( column0, _mm_set1_ps( i_point.X() ) ), column3 );
+    transformed        = _mm_add_ps( _mm_mul_ps( column1, _mm_set1_ps( i_point.Y() ) ), transformed );
+    transformed        = _mm_add_ps( _mm_mul_ps( column2, _mm_set1_ps( i_point.Z() ) ), transformed );
+#endif
+    float transformedElements[ 4 ];
+    _mm_storeu_ps( transformedElements, transformed );
+    Vec3fA transformedPoint( transformedElements[ 0 ], transformedElements[ 1 ], transformedElements[ 2 ] );
+    float  homogenousWeight = transformedElements[ 3 ];
+#else
+    Vec3fA transformedPoint( i_point.X() * i_matrix( 0, 0 ) + i_point.Y() * i_matrix( 0, 1 ) +
+                                 i_point.Z() * i_matrix( 0, 2 ) + i_matrix( 0, 3 ),
+                             i_point.X() * i_matrix( 1, 0 ) + i_point.Y() * i_matrix( 1, 1 ) +
+                                 i_point.Z() * i_matrix( 1, 2 ) + i_matrix( 1, 3 ),
+                             i_point.X() * i_matrix( 2, 0 ) + i_point.Y() * i_matrix( 2, 1 ) +
+                                 i_point.Z() * i_matrix( 2, 2 ) + i_matrix( 2, 3 ) );
+    float  homogenousWeight = i_point.X() * i_matrix( 3, 0 ) + i_point.Y() * i_matrix( 3, 1 ) +
+                             i_point.Z() * i_matrix( 3, 2 ) + i_matrix( 3, 3 );
+#endif
     if ( homogenousWeight == 1.0 )
     {
         return transformedPoint;
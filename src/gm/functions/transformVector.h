@@ -7,15 +7,18 @@
 /// \file functions/transformVector.h
 /// \ingroup gm_functions_linearAlgebra
 ///
-/// Vector transformation.
+/// Vector transformation, by a transformation matrix or a rotation quaternion.
 
 #include <gm/gm.h>
 
 #include <gm/types/mat3f.h>
 #include <gm/types/mat4f.h>
+#include <gm/types/quatf.h>
 #include <gm/types/vec2f.h>
 #include <gm/types/vec3f.h>
 
+#include <gm/base/simd.h>
+
 GM_NS_OPEN
 
 /// Transform a \p i_vector with the transformation matrix \p i_matrix.
@@ -40,10 +43,58 @@ GM_HOST_DEVICE inline Vec2f TransformVector( const Mat3f& i_matrix, const Vec2f&
 /// \return Transformed vector.
 GM_HOST_DEVICE inline Vec3f TransformVector( const Mat4f& i_matrix, const Vec3f& i_vector )
 {
+#if defined( GM_SIMD_SSE_ENABLED )
+    // Linear combination of the matrix columns, weighted by the vector elements.
+    const float* matrixData = i_matrix.Data();
+    __m128       column0    = _mm_loadu_ps( matrixData + 0 );
+    __m128       column1    = _mm_loadu_ps( matrixData + 4 );
+    __m128       column2    = _mm_loadu_ps( matrixData + 8 );
+    __m128       column3    = _mm_loadu_ps( matrixData + 12 );
+    _MM_TRANSPOSE4_PS( column0, column1, column2, column3 );
+#if defined( GM_SIMD_AVX2_ENABLED )
+    __m128 transformed = _mm_mul_ps( column0, _mm_set1_ps( i_vector[ 0 ] ) );
+    transformed        = _mm_fmadd_ps( column1, _mm_set1_ps( i_vector[ 1 ] ), transformed );
+    transformed        = _mm_fmadd_ps( column2, _mm_set1_ps( i_vector[ 2 ] ), transformed );
+#else
+    __m128 transformed = _mm_mul_ps( column0, _mm_set1_ps( i_vector[ 0 ] ) );
+    transformed        = _mm_add_ps( _mm_mul_ps( column1, _mm_set1_ps( i_vector[ 1 ] ) ), transformed );
+    transformed        = _mm_add_ps( _mm_mul_ps( column2, _mm_set1_ps( i_vector[ 2 ] ) ), transformed );
+#endif
+    float transformedElements[ 4 ];
+    _mm_storeu_ps( transformedElements, transformed );
+    return Vec3f( transformedElements[ 0 ], transformedElements[ 1 ], transformedElements[ 2 ] );
+#else
     return Vec3f(
         i_vector[ 0 ] * i_matrix( 0, 0 ) + i_vector[ 1 ] * i_matrix( 0, 1 ) + i_vector[ 2 ] * i_matrix( 0, 2 ),
         i_vector[ 0 ] * i_matrix( 1, 0 ) + i_vector[ 1 ] * i_matrix( 1, 1 ) + i_vector[ 2 ] * i_matrix( 1, 2 ),
         i_vector[ 0 ] * i_matrix( 2, 0 ) + i_vector[ 1 ] * i_matrix( 2, 1 ) + i_vector[ 2 ] * i_matrix( 2, 2 ) );
+#endif
+}
+
+/// Rotate a \p i_vector with the unit quaternion \p i_quaternion.
+/// \ingroup gm_functions_linearAlgebra
+///
+/// Computes \f$q v q^*\f$ in the expanded form \f$v + w t + u \times t\f$, where \f$u\f$ and \f$w\f$ are
+/// the imaginary and real components of \f$q\f$, and \f$t = 2 u \times v\f$.
+///
+/// \param i_quaternion The unit quaternion describing the rotation.
+/// \param i_vector The vector to rotate.
+///
+/// \return Rotated vector.
+GM_HOST_DEVICE inline Vec3f TransformVector( const Quatf& i_quaternion, const Vec3f& i_vector )
+{
+    const float x = i_quaternion.X();
+    const float y = i_quaternion.Y();
+    const float z = i_quaternion.Z();
+    const float w = i_quaternion.W();
+
+    const float tx = 2.0f * ( y * i_vector[ 2 ] - z * i_vector[ 1 ] );
+    const float ty = 2.0f * ( z * i_vector[ 0 ] - x * i_vector[ 2 ] );
+    const float tz = 2.0f * ( x * i_vector[ 1 ] - y * i_vector[ 0 ] );
+
+    return Vec3f( i_vector[ 0 ] + w * tx + ( y * tz - z * ty ),
+                  i_vector[ 1 ] + w * ty + ( z * tx - x * tz ),
+                  i_vector[ 2 ] + w * tz + ( x * ty - y * tx ) );
 }
 
 GM_NS_CLOSE
\ No newline at end of file
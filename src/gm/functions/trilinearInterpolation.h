@@ -114,16 +114,16 @@ GM_HOST_DEVICE inline Mat3f TrilinearInterpolation( const Mat3f& i_corner000,
                    i_weight.Z() );
 
     // Bilinearly interpolate the two sides orthogonal to the Z-axis of the grid.
-    gm::Mat3f interm0 = BilinearInterpolation( i_corner000,
-                                               i_corner100,
-                                               i_corner010,
-                                               i_corner110,
-                                               Vec2f( i_weight.X(), i_weight.Y() ) );
-    gm::Mat3f interm1 = BilinearInterpolation( i_corner001,
-                                               i_corner101,
-                                               i_corner011,
-                                               i_corner111,
-                                               Vec2f( i_weight.X(), i_weight.Y() ) );
+    Mat3f interm0 = BilinearInterpolation( i_corner000,
+                                           i_corner100,
+                                           i_corner010,
+                                           i_corner110,
+                                           Vec2f( i_weight.X(), i_weight.Y() ) );
+    Mat3f interm1 = BilinearInterpolation( i_corner001,
+                                           i_corner101,
+                                           i_corner011,
+                                           i_corner111,
+                                           Vec2f( i_weight.X(), i_weight.Y() ) );
 
     // Linearly interpolate the two intermediate values based on the Z weight.
     return LinearInterpolation( interm0, interm1, i_weight.Z() );
@@ -166,16 +166,16 @@ GM_HOST_DEVICE inline Mat4f TrilinearInterpolation( const Mat4f& i_corner000,
                    i_weight.Z() );
 
     // Bilinearly interpolate the two sides orthogonal to the Z-axis of the grid.
-    gm::Mat4f interm0 = BilinearInterpolation( i_corner000,
-                                               i_corner100,
-                                               i_corner010,
-                                               i_corner110,
-                                               Vec2f( i_weight.X(), i_weight.Y() ) );
-    gm::Mat4f interm1 = BilinearInterpolation( i_corner001,
-                                               i_corner101,
-                                               i_corner011,
-                                               i_corner111,
-                                               Vec2f( i_weight.X(), i_weight.Y() ) );
+    Mat4f interm0 = BilinearInterpolation( i_corner000,
+                                           i_corner100,
+                                           i_corner010,
+                                           i_corner110,
+                                           Vec2f( i_weight.X(), i_weight.Y() ) );
+    Mat4f interm1 = BilinearInterpolation( i_corner001,
+                                           i_corner101,
+                                           i_corner011,
+                                           i_corner111,
+                                           Vec2f( i_weight.X(), i_weight.Y() ) );
 
     // Linearly interpolate the two intermediate values based on the Z weight.
     return LinearInterpolation( interm0, interm1, i_weight.Z() );
@@ -218,16 +218,16 @@ GM_HOST_DEVICE inline Vec2f TrilinearInterpolation( const Vec2f& i_corner000,
                    i_weight.Z() );
 
     // Bilinearly interpolate the two sides orthogonal to the Z-axis of the grid.
-    gm::Vec2f interm0 = BilinearInterpolation( i_corner000,
-                                               i_corner100,
-                                               i_corner010,
-                                               i_corner110,
-                                               Vec2f( i_weight.X(), i_weight.Y() ) );
-    gm::Vec2f interm1 = BilinearInterpolation( i_corner001,
-                                               i_corner101,
-                                               i_corner011,
-                                               i_corner111,
-                                               Vec2f( i_weight.X(), i_weight.Y() ) );
+    Vec2f interm0 = BilinearInterpolation( i_corner000,
+                                           i_corner100,
+                                           i_corner010,
+                                           i_corner110,
+                                           Vec2f( i_weight.X(), i_weight.Y() ) );
+    Vec2f interm1 = BilinearInterpolation( i_corner001,
+                                           i_corner101,
+                                           i_corner011,
+                                           i_corner111,
+                                           Vec2f( i_weight.X(), i_weight.Y() ) );
 
     // Linearly interpolate the two intermediate values based on the Z weight.
     return LinearInterpolation( interm0, interm1, i_weight.Z() );
@@ -270,16 +270,16 @@ GM_HOST_DEVICE inline Vec3f TrilinearInterpolation( const Vec3f& i_corner000,
                    i_weight.Z() );
 
     // Bilinearly interpolate the two sides orthogonal to the Z-axis of the grid.
-    gm::Vec3f interm0 = BilinearInterpolation( i_corner000,
-                                               i_corner100,
-                                               i_corner010,
-                                               i_corner110,
-                                               Vec2f( i_weight.X(), i_weight.Y() ) );
-    gm::Vec3f interm1 = BilinearInterpolation( i_corner001,
-                                               i_corner101,
-                                               i_corner011,
-                                               i_corner111,
-                                               Vec2f( i_weight.X(), i_weight.Y() ) );
+    Vec3f interm0 = BilinearInterpolation( i_corner000,
+                                           i_corner100,
+                                           i_corner010,
+                                           i_corner110,
+                                           Vec2f( i_weight.X(), i_weight.Y() ) );
+    Vec3f interm1 = BilinearInterpolation( i_corner001,
+                                           i_corner101,
+                                           i_corner011,
+                                           i_corner111,
+                                           Vec2f( i_weight.X(), i_weight.Y() ) );
 
     // Linearly interpolate the two intermediate values based on the Z weight.
     return LinearInterpolation( interm0, interm1, i_weight.Z() );
@@ -322,16 +322,16 @@ GM_HOST_DEVICE inline Vec4f TrilinearInterpolation( const Vec4f& i_corner000,
                    i_weight.Z() );
 
     // Bilinearly interpolate the two sides orthogonal to the Z-axis of the grid.
-    gm::Vec4f interm0 = BilinearInterpolation( i_corner000,
-                                               i_corner100,
-                                               i_corner010,
-                                               i_corner110,
-                                               Vec2f( i_weight.X(), i_weight.Y() ) );
-    gm::Vec4f interm1 = BilinearInterpolation( i_corner001,
-                                               i_corner101,
-                                               i_corner011,
-                                               i_corner111,
-                                               Vec2f( i_weight.X(), i_weight.Y() ) );
+    Vec4f interm0 = BilinearInterpolation( i_corner000,
+                                           i_corner100,
+                                           i_corner010,
+                                           i_corner110,
+                                           Vec2f( i_weight.X(), i_weight.Y() ) );
+    Vec4f interm1 = BilinearInterpolation( i_corner001,
+                                           i_corner101,
+                                           i_corner011,
+                                           i_corner111,
+                                           Vec2f( i_weight.X(), i_weight.Y() ) );
 
     // Linearly interpolate the two intermediate values based on the Z weight.
     return LinearInterpolation( interm0, interm1, i_weight.Z() );
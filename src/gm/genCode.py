@@ -7,10 +7,14 @@ Main entry point / script for generating GraphicsMath C++ and Python source code
 import os
 import argparse
 import logging
+import multiprocessing
 
+from codeGen import utils
 from codeGen.utils import (
     GetTemplateFile,
     GenerateCode,
+    SetupCache,
+    GenerateQueuedCode,
     WriteFile,
     FormatCode,
     LowerCamelCase,
@@ -22,9 +26,14 @@ from codeGen.utils import (
 from codeGen.types import (
     ScalarType,
     VectorType,
+    QuaternionType,
+    AlignedVectorType,
     RangeType,
+    ArrayType,
     CompositeType,
+    PacketType,
     NamedElement,
+    DerivedElement,
     INT,
     FLOAT,
     BOOL,
@@ -37,8 +46,12 @@ from codeGen.functions import (
     FunctionArg,
     Mutability,
     FunctionCategory,
+    UfuncCoreShape,
+    UfuncScalarType,
 )
 
+from codeGen.submodules import TypeSubmodules, FunctionSubmodules
+
 
 """
 Name of the subdirectory where all type header files reside.
@@ -60,11 +73,36 @@ Name of the benchmarks sub-directory, under functions/, where benchmarking code
 """
 BENCHMARKS_DIR = "benchmarks"
 
+"""
+Name of the batch sub-directory, under functions/, where the batched function overloads reside.
+"""
+BATCH_DIR = "batch"
+
 """
 Name of the python subdirectory, where the bindings reside.
 """
 PYTHON_DIR = "python"
 
+"""
+Name of the kernels sub-directory, under python/, where the batched function kernels reside.
+"""
+KERNELS_DIR = "kernels"
+
+"""
+Name of the NumPy ufuncs sub-directory, under python/, where the ufuncs of the batched functions reside.
+"""
+UFUNCS_DIR = "ufuncs"
+
+"""
+Name of the lean sub-directory, under python/, where the lean CPython API bindings reside.
+"""
+LEAN_DIR = "lean"
+
+"""
+Name of the code generation cache file, recording the inputs of previously generated files.
+"""
+CACHE_FILE = ".genCodeCache.json"
+
 """
 Global set of Scalar value types.
 """
@@ -93,6 +131,22 @@ SINGLE_INDEX_VECTOR_TYPES_INT = [
 
 VECTOR_TYPES = SINGLE_INDEX_VECTOR_TYPES_FLOAT + SINGLE_INDEX_VECTOR_TYPES_INT + MATRIX_TYPES
 
+"""
+Global set of quaternion value types to generate, for compact storage and interpolation of rotations.
+"""
+QUATERNION_TYPES = [QuaternionType(ScalarType(FLOAT))]
+
+"""
+Global set of over-aligned vector and matrix types to generate, for SIMD friendly storage in packed buffers.
+"""
+ALIGNED_VECTOR_TYPES = [
+    AlignedVectorType(VectorType((3,), ScalarType(FLOAT)), 16),
+    AlignedVectorType(VectorType((4,), ScalarType(FLOAT)), 16),
+    AlignedVectorType(VectorType((3, 3), ScalarType(FLOAT)), 16),
+    AlignedVectorType(VectorType((4, 4), ScalarType(FLOAT)), 32),
+]
+ALIGNED_VECTOR_TYPES_BY_NAME = {alignedType.className: alignedType for alignedType in ALIGNED_VECTOR_TYPES}
+
 """
 RANGE_TYPES is the fixed, global set of range-based types (min, max) to generate code for.
 """
@@ -106,6 +160,24 @@ RANGE_TYPES_VECTOR = [
 
 RANGE_TYPES_FLOAT = [RangeType(valueType) for valueType in (SINGLE_INDEX_VECTOR_TYPES_FLOAT + [ScalarType(FLOAT)])]
 
+"""
+ARRAY_TYPES is the fixed, global set of packed, contiguous array types to generate code for.
+"""
+ARRAY_TYPES = [
+    ArrayType(valueType) for valueType in NUMERIC_SCALAR_TYPES + VECTOR_TYPES + QUATERNION_TYPES + RANGE_TYPES
+]
+
+"""
+PACKET_TYPES is the fixed, global set of structure-of-arrays packet types to generate code for, used by
+the packet overloads of ray tracing functions.
+"""
+PACKET_LANE_COUNTS = [4, 8, 16]
+PACKET_TYPES = [
+    PacketType(valueType, laneCount)
+    for valueType in [VectorType((3,), ScalarType(FLOAT)), RangeType(ScalarType(FLOAT))]
+    for laneCount in PACKET_LANE_COUNTS
+]
+
 
 """
 COMPOSITE_TYPES is a dict of type name (str) -> type object (CompositeType).
@@ -119,6 +191,17 @@ It is populated in GenerateFunctions.
 """
 FUNCTIONS = {}
 
+def GetCodeGenSources():
+    """
+    Returns:
+        list: paths of the python sources driving code generation, which affect all generated files.
+    """
+    codeGenDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "codeGen")
+    return [os.path.abspath(__file__)] + [
+        os.path.join(codeGenDir, fileName) for fileName in os.listdir(codeGenDir) if fileName.endswith(".py")
+    ]
+
+
 #
 # Code generation for types.
 #
@@ -128,7 +211,26 @@ def PopulateCompositeTypes():
     """
     Populate the COMPOSITE_TYPES dictionary.
     """
-    compositeTypes = []
+    vec3fType = VectorType((3,), ScalarType(FLOAT))
+    compositeTypes = [
+        # Ray, caching the reciprocal of its direction and the sign of each axis, for repeated intersection tests.
+        CompositeType(
+            "ray",
+            elements=[NamedElement("origin", vec3fType), NamedElement("direction", vec3fType),],
+            derivedElements=[
+                DerivedElement(
+                    "inverseDirection",
+                    vec3fType,
+                    "1.0f / i_direction.X(), 1.0f / i_direction.Y(), 1.0f / i_direction.Z()",
+                ),
+                DerivedElement(
+                    "directionSign",
+                    VectorType((3,), ScalarType(INT)),
+                    "m_inverseDirection.X() < 0.0f, m_inverseDirection.Y() < 0.0f, m_inverseDirection.Z() < 0.0f",
+                ),
+            ],
+        ),
+    ]
     for compositeType in compositeTypes:
         COMPOSITE_TYPES[compositeType.name] = compositeType
 
@@ -136,12 +238,12 @@ def PopulateCompositeTypes():
 def GenerateTypes():
     """
     Top-level entry point for generating all data type source files.
-    Vectors and matrices types will be generated.
+    Vectors, matrices, quaternions, ranges, composites, arrays, aligned and packet types will be generated.
 
     Returns:
         tuple: (
             list: paths to of generated source files.
-            list: associated ValueType(s)
+            list: associated ValueType(s), bound in the python module.
         )
     """
     PrintMessage("Generating types...")
@@ -149,7 +251,17 @@ def GenerateTypes():
     PopulateCompositeTypes()
 
     filePaths = []
-    valueTypes = VECTOR_TYPES + RANGE_TYPES + COMPOSITE_TYPES.values()
+
+    # Binary serialization, array views, instance free lists and buffer export counts, shared by the python bindings of all types.
+    for headerFileName in ("serialization.h", "arrayView.h", "freeList.h", "bufferExports.h"):
+        filePaths.append(
+            GenerateCode(
+                os.path.join(PYTHON_DIR, TYPES_DIR, headerFileName), os.path.join(PYTHON_DIR, TYPES_DIR, headerFileName),
+            )
+        )
+
+    # Array types are last, such that their element types are bound first in the python module.
+    valueTypes = VECTOR_TYPES + QUATERNION_TYPES + RANGE_TYPES + COMPOSITE_TYPES.values() + ARRAY_TYPES
     for valueType in valueTypes:
         # C++ source code.
         filePaths.append(
@@ -184,6 +296,16 @@ def GenerateTypes():
             )
         )
 
+        # Python bindings of the views of arrays, over the storage of python buffers.
+        if valueType.isArray:
+            filePaths.append(
+                GenerateCode(
+                    os.path.join(PYTHON_DIR, TYPES_DIR, "bindArrayViewType.cpp"),
+                    os.path.join(PYTHON_DIR, TYPES_DIR, "bind{className}View.cpp".format(className=valueType.className)),
+                    valueType=valueType,
+                )
+            )
+
         # Tests for python bindings.
         filePaths.append(
             GenerateCode(
@@ -199,6 +321,36 @@ def GenerateTypes():
                 valueType=valueType,
             )
         )
+        if valueType.isArray:
+            filePaths.append(
+                GenerateCode(
+                    os.path.join(PYTHON_DIR, TYPES_DIR, TESTS_DIR, "testArrayViewType.py"),
+                    os.path.join(
+                        PYTHON_DIR, TYPES_DIR, TESTS_DIR, "test{className}View.py".format(className=valueType.className),
+                    ),
+                    valueType=valueType,
+                )
+            )
+
+    # Packet and aligned types are C++ only constructs for SIMD friendly processing, python bindings are not
+    # generated.  Python code should instead use the batched function overloads.
+    for valueType in ALIGNED_VECTOR_TYPES + PACKET_TYPES:
+        filePaths.append(
+            GenerateCode(
+                os.path.join(TYPES_DIR, "{category}Type.h".format(category=valueType.CATEGORY,)),
+                os.path.join(TYPES_DIR, valueType.headerFileName),
+                valueType=valueType,
+            )
+        )
+        filePaths.append(
+            GenerateCode(
+                os.path.join(
+                    TYPES_DIR, TESTS_DIR, "test{category}Type.cpp".format(category=UpperCamelCase(valueType.CATEGORY),),
+                ),
+                os.path.join(TYPES_DIR, TESTS_DIR, "test{className}.cpp".format(className=valueType.className),),
+                valueType=valueType,
+            )
+        )
 
     return filePaths, valueTypes
 
@@ -250,7 +402,7 @@ def GenerateFunctions():
 
     # Vector product(s).
     vectorProductOps = []
-    for vectorType in SINGLE_INDEX_VECTOR_TYPES_FLOAT:
+    for vectorType in SINGLE_INDEX_VECTOR_TYPES_FLOAT + QUATERNION_TYPES:
         vectorProductOps.append(
             FunctionInterface(
                 arguments=[
@@ -289,7 +441,7 @@ def GenerateFunctions():
 
     # Vector reduction.
     vectorReductionOps = []
-    for vectorType in SINGLE_INDEX_VECTOR_TYPES_FLOAT:
+    for vectorType in SINGLE_INDEX_VECTOR_TYPES_FLOAT + QUATERNION_TYPES:
         vectorReductionOps.append(
             FunctionInterface(
                 arguments=[FunctionArg("vector", vectorType, Mutability.Const),], returnType=vectorType.elementType,
@@ -298,7 +450,7 @@ def GenerateFunctions():
 
     # Vector unary operation.
     vectorOps = []
-    for vectorType in SINGLE_INDEX_VECTOR_TYPES_FLOAT:
+    for vectorType in SINGLE_INDEX_VECTOR_TYPES_FLOAT + QUATERNION_TYPES:
         vectorOps.append(
             FunctionInterface(arguments=[FunctionArg("vector", vectorType, Mutability.Const),], returnType=vectorType,)
         )
@@ -378,6 +530,66 @@ def GenerateFunctions():
             )
         )
 
+    for quaternionType in QUATERNION_TYPES:
+        # Quaternion from an arbituary rotation.
+        setRotateOps.append(
+            FunctionInterface(
+                arguments=[
+                    FunctionArg("angle", quaternionType.elementType, Mutability.Const,),
+                    FunctionArg("axis", VectorType((3,), quaternionType.elementType), Mutability.Const,),
+                    FunctionArg("quaternion", quaternionType, Mutability.Mutable),
+                ],
+            )
+        )
+
+        # Rotation matrix from a quaternion.
+        for matrixType in MATRIX_TYPES:
+            setRotateOps.append(
+                FunctionInterface(
+                    arguments=[
+                        FunctionArg("quaternion", quaternionType, Mutability.Const),
+                        FunctionArg("matrix", matrixType, Mutability.Mutable),
+                    ],
+                )
+            )
+
+    # Quaternion from a rotation matrix.
+    rotationQuaternionOps = []
+    for quaternionType in QUATERNION_TYPES:
+        for matrixType in MATRIX_TYPES:
+            rotationQuaternionOps.append(
+                FunctionInterface(
+                    arguments=[FunctionArg("matrix", matrixType, Mutability.Const),], returnType=quaternionType,
+                )
+            )
+
+    # Quaternion product.
+    quaternionProductOps = []
+    for quaternionType in QUATERNION_TYPES:
+        quaternionProductOps.append(
+            FunctionInterface(
+                arguments=[
+                    FunctionArg("lhs", quaternionType, Mutability.Const),
+                    FunctionArg("rhs", quaternionType, Mutability.Const),
+                ],
+                returnType=quaternionType,
+            )
+        )
+
+    # Quaternion interpolation.
+    quaternionInterpolationOps = []
+    for quaternionType in QUATERNION_TYPES:
+        quaternionInterpolationOps.append(
+            FunctionInterface(
+                arguments=[
+                    FunctionArg("source", quaternionType, Mutability.Const),
+                    FunctionArg("target", quaternionType, Mutability.Const),
+                    FunctionArg("weight", quaternionType.elementType, Mutability.Const),
+                ],
+                returnType=quaternionType,
+            )
+        )
+
     # Angle interfaces.
     angleOps = []
     for scalarType in (ScalarType(FLOAT),):
@@ -385,6 +597,26 @@ def GenerateFunctions():
             FunctionInterface(arguments=[FunctionArg("angle", scalarType, Mutability.Const),], returnType=scalarType,)
         )
 
+    # Approximate reciprocal square root.
+    reciprocalSquareRootOps = []
+    for scalarType in (ScalarType(FLOAT),):
+        reciprocalSquareRootOps.append(
+            FunctionInterface(arguments=[FunctionArg("value", scalarType, Mutability.Const),], returnType=scalarType,)
+        )
+
+    # Sine and cosine of an angle, computed together.
+    sineCosineOps = []
+    for scalarType in (ScalarType(FLOAT),):
+        sineCosineOps.append(
+            FunctionInterface(
+                arguments=[
+                    FunctionArg("angle", scalarType, Mutability.Const),
+                    FunctionArg("sine", scalarType, Mutability.Mutable),
+                    FunctionArg("cosine", scalarType, Mutability.Mutable),
+                ],
+            )
+        )
+
     # Euclidean space point operations.
     pointReductionOps = []
     for vectorType in (
@@ -595,6 +827,24 @@ def GenerateFunctions():
             )
         )
 
+    # Structure-of-arrays packet variants, intersecting multiple rays against a single sphere.
+    for laneCount in PACKET_LANE_COUNTS:
+        vectorPacketType = PacketType(VectorType((3,), ScalarType(FLOAT)), laneCount)
+        raySphereIntersectionOps.append(
+            FunctionInterface(
+                arguments=[
+                    FunctionArg("sphereOrigin", vectorPacketType.elementType, Mutability.Const),
+                    FunctionArg("sphereRadius", vectorPacketType.scalarType, Mutability.Const),
+                    FunctionArg("rayOrigin", vectorPacketType, Mutability.Const),
+                    FunctionArg("rayDirection", vectorPacketType, Mutability.Const),
+                    FunctionArg(
+                        "intersections", PacketType(RangeType(ScalarType(FLOAT)), laneCount), Mutability.Mutable,
+                    ),
+                ],
+                returnType=ScalarType(INT),
+            )
+        )
+
     rayAABBIntersectionOps = []
     for valueType in SINGLE_INDEX_VECTOR_TYPES_FLOAT:
         rayAABBIntersectionOps.append(
@@ -609,6 +859,35 @@ def GenerateFunctions():
             )
         )
 
+    # Ray variant, with the reciprocal direction pre-computed for repeated tests against many AABBs.
+    rayAABBIntersectionOps.append(
+        FunctionInterface(
+            arguments=[
+                FunctionArg("ray", COMPOSITE_TYPES["ray"], Mutability.Const),
+                FunctionArg("aabb", RangeType(VectorType((3,), ScalarType(FLOAT))), Mutability.Const),
+                FunctionArg("intersections", RangeType(ScalarType(FLOAT)), Mutability.Mutable,),
+            ],
+            returnType=ScalarType(BOOL),
+        )
+    )
+
+    # Structure-of-arrays packet variants, intersecting multiple rays against a single AABB.
+    for laneCount in PACKET_LANE_COUNTS:
+        vectorPacketType = PacketType(VectorType((3,), ScalarType(FLOAT)), laneCount)
+        rayAABBIntersectionOps.append(
+            FunctionInterface(
+                arguments=[
+                    FunctionArg("rayOrigin", vectorPacketType, Mutability.Const),
+                    FunctionArg("rayDirection", vectorPacketType, Mutability.Const),
+                    FunctionArg("aabb", RangeType(vectorPacketType.elementType), Mutability.Const),
+                    FunctionArg(
+                        "intersections", PacketType(RangeType(ScalarType(FLOAT)), laneCount), Mutability.Mutable,
+                    ),
+                ],
+                returnType=ScalarType(INT),
+            )
+        )
+
     # Random number generation.
     randomOps = []
     for valueType in NUMERIC_SCALAR_TYPES:
@@ -654,13 +933,29 @@ def GenerateFunctions():
             )
         )
 
+    # Vector rotation by a quaternion.
+    for quaternionType in QUATERNION_TYPES:
+        vectorType = VectorType((3,), quaternionType.elementType)
+        transformVectorOps.append(
+            FunctionInterface(
+                arguments=[
+                    FunctionArg("quaternion", quaternionType, Mutability.Const),
+                    FunctionArg("vector", vectorType, Mutability.Const),
+                ],
+                returnType=vectorType,
+            )
+        )
+
     # Transform point.
     transformPointOps = []
-    for valueType in (VectorType((3,), ScalarType(FLOAT)),):
+    for matrixType, valueType in (
+        (VectorType((4, 4), ScalarType(FLOAT)), VectorType((3,), ScalarType(FLOAT))),
+        (ALIGNED_VECTOR_TYPES_BY_NAME["Mat4fA"], ALIGNED_VECTOR_TYPES_BY_NAME["Vec3fA"]),
+    ):
         transformPointOps.append(
             FunctionInterface(
                 arguments=[
-                    FunctionArg("matrix", VectorType((4, 4), ScalarType(FLOAT)), Mutability.Const),
+                    FunctionArg("matrix", matrixType, Mutability.Const),
                     FunctionArg("point", valueType, Mutability.Const),
                 ],
                 returnType=valueType,
@@ -698,7 +993,7 @@ def GenerateFunctions():
 
     # Matrix inverse.
     matrixInverseOps = []
-    for valueType in (VectorType((4,4), ScalarType(FLOAT)),):
+    for valueType in (VectorType((3,3), ScalarType(FLOAT)), VectorType((4,4), ScalarType(FLOAT)),):
         matrixInverseOps.append(
             FunctionInterface(
                 arguments=[
@@ -709,6 +1004,25 @@ def GenerateFunctions():
             )
         )
 
+    # Affine matrix inverse.
+    affineInverseOps = [
+        FunctionInterface(
+            arguments=[
+                FunctionArg("matrix", VectorType((4, 4), ScalarType(FLOAT)), Mutability.Const),
+                FunctionArg("inverse", VectorType((4, 4), ScalarType(FLOAT)), Mutability.Mutable),
+            ],
+            returnType=ScalarType(BOOL),
+        )
+    ]
+
+    # Rigid matrix inverse.
+    rigidInverseOps = [
+        FunctionInterface(
+            arguments=[FunctionArg("matrix", VectorType((4, 4), ScalarType(FLOAT)), Mutability.Const),],
+            returnType=VectorType((4, 4), ScalarType(FLOAT)),
+        )
+    ]
+
     orthographicProjectionOps = [
         FunctionInterface(
             arguments=[
@@ -765,7 +1079,11 @@ def GenerateFunctions():
         FunctionGroup(["min", "max",], binaryComparisonOps, FunctionCategory.BASIC),
         FunctionGroup(["quadraticRoots",], quadraticOps, FunctionCategory.BASIC),
         FunctionGroup(["degrees", "radians",], angleOps, FunctionCategory.BASIC),
-        FunctionGroup(["randomNumber",], randomOps, FunctionCategory.BASIC),
+        FunctionGroup(["approximateReciprocalSquareRoot",], reciprocalSquareRootOps, FunctionCategory.BASIC),
+        FunctionGroup(["approximateSineCosine",], sineCosineOps, FunctionCategory.BASIC),
+        # The per-thread generators are identically seeded, so batches are generated serially to avoid
+        # repeating the same sequence across threads.
+        FunctionGroup(["randomNumber",], randomOps, FunctionCategory.BASIC, parallel=False),
         FunctionGroup(["linearInterpolation",], linearInterpolationOps, FunctionCategory.BASIC),
         FunctionGroup(["bilinearInterpolation",], bilinearInterpolationOps, FunctionCategory.BASIC),
         FunctionGroup(["trilinearInterpolation",], trilinearInterpolationOps, FunctionCategory.BASIC),
@@ -788,6 +1106,26 @@ def GenerateFunctions():
         FunctionGroup(["setTranslate", "setScale",], setVectorTransformOps, FunctionCategory.LINEAR_ALGEBRA,),
         FunctionGroup(["setRotateX", "setRotateY", "setRotateZ",], setRotateXYZOps, FunctionCategory.LINEAR_ALGEBRA,),
         FunctionGroup(["setRotate",], setRotateOps, FunctionCategory.LINEAR_ALGEBRA,),
+        # Approximate variants, trading accuracy for speed.
+        FunctionGroup(["approximateNormalize",], vectorOps, FunctionCategory.LINEAR_ALGEBRA),
+        FunctionGroup(["approximateLength",], vectorReductionOps, FunctionCategory.LINEAR_ALGEBRA),
+        FunctionGroup(
+            ["approximateSetRotateX", "approximateSetRotateY", "approximateSetRotateZ",],
+            setRotateXYZOps,
+            FunctionCategory.LINEAR_ALGEBRA,
+        ),
+        FunctionGroup(
+            ["approximateSetRotate",],
+            [interface for interface in setRotateOps if interface.HasArg("angle")],
+            FunctionCategory.LINEAR_ALGEBRA,
+        ),
+        FunctionGroup(["rotationQuaternion",], rotationQuaternionOps, FunctionCategory.LINEAR_ALGEBRA,),
+        FunctionGroup(["quaternionProduct",], quaternionProductOps, FunctionCategory.LINEAR_ALGEBRA,),
+        FunctionGroup(
+            ["sphericalLinearInterpolation", "normalizedLinearInterpolation",],
+            quaternionInterpolationOps,
+            FunctionCategory.LINEAR_ALGEBRA,
+        ),
         FunctionGroup(["coordinateSystem",], coordSysOps, FunctionCategory.LINEAR_ALGEBRA,),
         FunctionGroup(["faceForward",], faceForwardOps, FunctionCategory.LINEAR_ALGEBRA,),
         FunctionGroup(["transformVector",], transformVectorOps, FunctionCategory.LINEAR_ALGEBRA,),
@@ -795,6 +1133,8 @@ def GenerateFunctions():
         FunctionGroup(["transformAABB",], transformAABBOps, FunctionCategory.LINEAR_ALGEBRA,),
         FunctionGroup(["lookAt",], lookAtOps, FunctionCategory.LINEAR_ALGEBRA,),
         FunctionGroup(["inverse",], matrixInverseOps, FunctionCategory.LINEAR_ALGEBRA,),
+        FunctionGroup(["inverseAffine",], affineInverseOps, FunctionCategory.LINEAR_ALGEBRA,),
+        FunctionGroup(["inverseRigid",], rigidInverseOps, FunctionCategory.LINEAR_ALGEBRA,),
         FunctionGroup(["orthographicProjection",], orthographicProjectionOps, FunctionCategory.LINEAR_ALGEBRA,),
         FunctionGroup(["perspectiveProjection",], perspectiveProjectionOps, FunctionCategory.LINEAR_ALGEBRA,),
         FunctionGroup(["viewportTransform",], viewportTransformOps, FunctionCategory.LINEAR_ALGEBRA,),
@@ -806,6 +1146,26 @@ def GenerateFunctions():
 
     # Generate code.
     filePaths = []
+
+    # Python batched argument conversion and overload dispatch, shared by all function bindings.
+    filePaths.append(
+        GenerateCode(
+            os.path.join(PYTHON_DIR, FUNCTIONS_DIR, "parallel.h"), os.path.join(PYTHON_DIR, FUNCTIONS_DIR, "parallel.h"),
+        )
+    )
+    filePaths.append(
+        GenerateCode(
+            os.path.join(PYTHON_DIR, FUNCTIONS_DIR, "dispatch.h"), os.path.join(PYTHON_DIR, FUNCTIONS_DIR, "dispatch.h"),
+        )
+    )
+    filePaths.append(
+        GenerateCode(
+            os.path.join(PYTHON_DIR, FUNCTIONS_DIR, "batch.h"),
+            os.path.join(PYTHON_DIR, FUNCTIONS_DIR, "batch.h"),
+            arrayTypes=ARRAY_TYPES,
+        )
+    )
+
     for functionGroup in functionGroups:
         for function in functionGroup.functions:
             # Generate C++ source code.
@@ -817,6 +1177,16 @@ def GenerateFunctions():
                 )
             )
 
+            # Generate batched C++ overloads, over contiguous arrays.
+            if function.spanInterfaces:
+                filePaths.append(
+                    GenerateCode(
+                        os.path.join(FUNCTIONS_DIR, BATCH_DIR, "batchFunction.h"),
+                        os.path.join(FUNCTIONS_DIR, BATCH_DIR, function.headerFileName),
+                        function=function,
+                    )
+                )
+
             # Generate C++ test code (if the template is available).
             # Some tests are hand-authored.
             testTemplatePath = os.path.join(FUNCTIONS_DIR, TESTS_DIR, "test{name}.cpp".format(name=function.name))
@@ -830,13 +1200,13 @@ def GenerateFunctions():
                 )
 
             # Benchmarking.
-            filePaths.append(
-                GenerateCode(
-                    os.path.join(FUNCTIONS_DIR, BENCHMARKS_DIR, "benchmarkFunction.cpp"),
-                    os.path.join(FUNCTIONS_DIR, BENCHMARKS_DIR, "benchmark{name}.cpp".format(name=function.name),),
-                    function=function,
-                )
-            )
+            # Some functions have hand-authored benchmarks, comparing alternative implementations.
+            benchmarkPath = os.path.join(FUNCTIONS_DIR, BENCHMARKS_DIR, "benchmark{name}.cpp".format(name=function.name))
+            if os.path.isfile(GetTemplateFile(benchmarkPath)):
+                benchmarkTemplatePath = benchmarkPath
+            else:
+                benchmarkTemplatePath = os.path.join(FUNCTIONS_DIR, BENCHMARKS_DIR, "benchmarkFunction.cpp")
+            filePaths.append(GenerateCode(benchmarkTemplatePath, benchmarkPath, function=function,))
 
             # Python bindings source.
             filePaths.append(
@@ -847,6 +1217,13 @@ def GenerateFunctions():
                 )
             )
 
+            # Python bindings test code (if the template is available).
+            pyTestTemplatePath = os.path.join(
+                PYTHON_DIR, FUNCTIONS_DIR, TESTS_DIR, "test{name}.py".format(name=function.name)
+            )
+            if os.path.isfile(GetTemplateFile(pyTestTemplatePath)):
+                filePaths.append(GenerateCode(pyTestTemplatePath, pyTestTemplatePath, function=function,))
+
             # Register in global FUNCTIONS
             assert function.name not in FUNCTIONS
             FUNCTIONS[function.name] = function
@@ -866,6 +1243,19 @@ if __name__ == "__main__":
         help="Set the logging level to DEBUG, producing more verbose outputs.",
         action="store_true",
     )
+    parser.add_argument(
+        "-f",
+        "--force",
+        help="Generate all source files, ignoring the code generation cache of previously generated files.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        help="Number of processes used to render and format source files.  Defaults to the number of CPUs.",
+        type=int,
+        default=multiprocessing.cpu_count(),
+    )
 
     args = parser.parse_args()
     if args.verbose:
@@ -873,6 +1263,9 @@ if __name__ == "__main__":
     else:
         SetupLogging()
 
+    # Skip the outputs which are up to date since the previous run.
+    SetupCache(CACHE_FILE, GetCodeGenSources(), force=args.force)
+
     # Generate the complete set ValueTypes first, pre-requisite to generating functions.
     filePaths, valueTypes = GenerateTypes()
 
@@ -887,6 +1280,75 @@ if __name__ == "__main__":
             os.path.join(PYTHON_DIR, "module.cpp"),
             types=valueTypes,
             functions=FUNCTIONS.values(),
+            submodules=list(TypeSubmodules(valueTypes)) + list(FunctionSubmodules(FUNCTIONS.values())),
             UpperCamelCase=UpperCamelCase,
         )
     )
+    for headerFileName in ("submodules.h", "visibility.h"):
+        filePaths.append(
+            GenerateCode(os.path.join(PYTHON_DIR, headerFileName), os.path.join(PYTHON_DIR, headerFileName))
+        )
+
+    # Batched function kernels, compiled once per instruction set.
+    for kernelsFileName in ("kernels.h", "kernelSet.cpp"):
+        filePaths.append(
+            GenerateCode(
+                os.path.join(PYTHON_DIR, KERNELS_DIR, kernelsFileName),
+                os.path.join(PYTHON_DIR, KERNELS_DIR, kernelsFileName),
+                functions=FUNCTIONS.values(),
+            )
+        )
+
+    # NumPy ufuncs evaluating the batched function kernels.
+    filePaths.append(
+        GenerateCode(
+            os.path.join(PYTHON_DIR, UFUNCS_DIR, "ufuncs.cpp"),
+            os.path.join(PYTHON_DIR, UFUNCS_DIR, "ufuncs.cpp"),
+            functions=FUNCTIONS.values(),
+            UfuncCoreShape=UfuncCoreShape,
+            UfuncScalarType=UfuncScalarType,
+        )
+    )
+
+    # Lean CPython API bindings, of the vector, matrix and quaternion types and the functions over them.
+    leanTypes = VECTOR_TYPES + QUATERNION_TYPES
+    leanFunctions = [function for function in FUNCTIONS.values() if function.leanInterfaces]
+    filePaths.append(
+        GenerateCode(
+            os.path.join(PYTHON_DIR, LEAN_DIR, "lean.h"), os.path.join(PYTHON_DIR, LEAN_DIR, "lean.h"), types=leanTypes,
+        )
+    )
+    for valueType in leanTypes:
+        filePaths.append(
+            GenerateCode(
+                os.path.join(PYTHON_DIR, LEAN_DIR, "bindVectorType.cpp"),
+                os.path.join(PYTHON_DIR, LEAN_DIR, "bind{className}.cpp".format(className=valueType.className)),
+                valueType=valueType,
+            )
+        )
+    for function in leanFunctions:
+        filePaths.append(
+            GenerateCode(
+                os.path.join(PYTHON_DIR, LEAN_DIR, "bindFunction.cpp"),
+                os.path.join(PYTHON_DIR, LEAN_DIR, "bind{name}.cpp".format(name=function.name)),
+                function=function,
+            )
+        )
+    filePaths.append(
+        GenerateCode(
+            os.path.join(PYTHON_DIR, LEAN_DIR, "module.cpp"),
+            os.path.join(PYTHON_DIR, LEAN_DIR, "module.cpp"),
+            types=leanTypes,
+            functions=leanFunctions,
+        )
+    )
+
+    # Render and format all the source files queued above.
+    GenerateQueuedCode(jobs=max(1, args.jobs))
+
+    utils.CACHE.Save()
+    PrintMessage(
+        "Generated {generated} file(s), skipped {skipped} up to date file(s).".format(
+            generated=utils.CACHE.generatedCount, skipped=utils.CACHE.skippedCount
+        )
+    )
@@ -9,7 +9,12 @@
 /// \def GM_NS
 ///
 /// The namespace hosting all the symbols in the GraphicsMath library.
+///
+/// May be pre-defined to compile the library into a distinct namespace, such as when the same functions
+/// are compiled for multiple instruction sets into a single binary.
+#if !defined( GM_NS )
 #define GM_NS gm
+#endif
 
 /// \def GM_NS_USING
 ///
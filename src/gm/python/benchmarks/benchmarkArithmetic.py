@@ -0,0 +1,94 @@
+"""
+Time of tight loops of arithmetic operators on gm value types, with and without their instance free lists.
+
+The free lists are disabled by setting their capacity to 0, which matches allocating every result anew, and are
+then restored to their default capacity.  The best of several samples is reported, per operation.
+
+Usage:
+    python benchmarkArithmetic.py [--iterations ITERATIONS] [--repeat REPEAT]
+"""
+
+import argparse
+import timeit
+
+import gm
+
+SETUP = """
+import gm
+a = gm.Vec3f(1, 2, 3)
+b = gm.Vec3f(4, 5, 6)
+m = gm.Mat4f()
+n = gm.Mat4f()
+"""
+
+# Statements timed, each creating short-lived results.
+STATEMENTS = [
+    "a + b",
+    "a * 2.0",
+    "-a",
+    "(a + b) * 0.5 - a",
+    "m + n",
+    "-m",
+    "(m + n) * 0.5 - m",
+]
+
+TYPES = [gm.Vec3f, gm.Mat4f]
+
+
+def BestTime(statement, iterations, repeat):
+    """
+    Args:
+        statement (str): python statement to time.
+        iterations (int): number of executions of ``statement`` per sample.
+        repeat (int): number of samples.
+
+    Returns:
+        float: the best time of a single execution, in nanoseconds.
+    """
+    samples = timeit.repeat(statement, setup=SETUP, number=iterations, repeat=repeat)
+    return min(samples) / iterations * 1e9
+
+
+def Main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=200000,
+        help="Number of executions per sample.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of samples per case, the best is reported.",
+    )
+    args = parser.parse_args()
+
+    capacities = {valueType: valueType.GetFreeListCapacity() for valueType in TYPES}
+
+    print(
+        "{:<24} {:>16} {:>16} {:>10}".format(
+            "Statement", "No pool (ns)", "Pool (ns)", "Speedup"
+        )
+    )
+    for statement in STATEMENTS:
+        for valueType in TYPES:
+            valueType.SetFreeListCapacity(0)
+        before = BestTime(statement, args.iterations, args.repeat)
+
+        for valueType, capacity in capacities.items():
+            valueType.SetFreeListCapacity(capacity)
+        after = BestTime(statement, args.iterations, args.repeat)
+
+        print(
+            "{:<24} {:16.1f} {:16.1f} {:9.2f}x".format(
+                statement, before, after, before / after
+            )
+        )
+
+
+if __name__ == "__main__":
+    Main()
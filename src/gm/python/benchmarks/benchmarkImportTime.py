@@ -0,0 +1,107 @@
+"""
+Time of importing the gm python module, and of binding each of its submodules on first attribute access.
+
+Each sample is taken in a fresh python process, such that nothing is bound yet, and the best sample is
+reported.  With --max-milliseconds, the benchmark fails when importing gm takes longer, to catch regressions.
+
+Usage:
+    python benchmarkImportTime.py [--repeat REPEAT] [--max-milliseconds MAX_MILLISECONDS]
+"""
+
+import argparse
+import subprocess
+import sys
+
+# Submodules bound on first attribute access, with their dependencies.
+SUBMODULES = [
+    "vector",
+    "quaternion",
+    "range",
+    "composite",
+    "array",
+    "basic",
+    "linearAlgebra",
+    "rayTracing",
+    "bvh",
+    "io",
+    "ufuncs",
+]
+
+TIMING_SOURCE = """
+import time
+start = time.perf_counter()
+import gm
+imported = time.perf_counter()
+{access}
+accessed = time.perf_counter()
+print(imported - start, accessed - imported)
+"""
+
+
+def ImportTime(access, repeat):
+    """
+    Args:
+        access (str): python statement run after importing gm, and timed separately.
+        repeat (int): number of fresh processes sampled.
+
+    Returns:
+        tuple: the best times of importing gm, and of running ``access``, in milliseconds.
+    """
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, "-c", TIMING_SOURCE.format(access=access)],
+            universal_newlines=True,
+        )
+        samples.append([float(value) * 1e3 for value in output.split()])
+
+    return (
+        min(sample[0] for sample in samples),
+        min(sample[1] for sample in samples),
+    )
+
+
+def Main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="Number of fresh processes per case, the best is reported.",
+    )
+    parser.add_argument(
+        "--max-milliseconds",
+        type=float,
+        default=None,
+        help="Fail if importing gm takes longer than this many milliseconds.",
+    )
+    args = parser.parse_args()
+
+    importTime, _ = ImportTime("pass", args.repeat)
+    print("import gm: {:.2f} ms".format(importTime))
+
+    print("{:<24} {:>12}".format("First access", "Time (ms)"))
+    for name in SUBMODULES:
+        _, accessTime = ImportTime(
+            "getattr(gm, {name!r}, None)".format(name=name), args.repeat
+        )
+        print("{:<24} {:12.2f}".format("gm." + name, accessTime))
+
+    _, accessTime = ImportTime(
+        "[getattr(gm, name) for name in gm.__all__]", args.repeat
+    )
+    print("{:<24} {:12.2f}".format("all attributes", accessTime))
+
+    if args.max_milliseconds is not None and importTime > args.max_milliseconds:
+        print(
+            "Importing gm took {:.2f} ms, over the {:.2f} ms limit.".format(
+                importTime, args.max_milliseconds
+            )
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    Main()
@@ -0,0 +1,127 @@
+#include <pybind11/pybind11.h>
+
+#include <gm/bvh/bvh.h>
+
+#include "../functions/batch.h"
+
+// Python bindings for BVH.
+//
+// The python BVH object owns a copy of the primitive bounds it was built from, such that ray queries can
+// be performed against the bounding boxes themselves.
+
+GM_NS_USING
+
+namespace
+{
+/// A BVH, along with the primitive bounds it was built from.
+class PyBVH
+{
+public:
+    inline PyBVH( const BatchArg< Vec3fRange >& i_primitiveBounds, size_t i_maxLeafSize, size_t i_binCount )
+    {
+        if ( i_primitiveBounds.IsBroadcast() )
+        {
+            throw pybind11::value_error( "Expected an array of primitive bounds." );
+        }
+
+        m_primitiveBounds.resize( i_primitiveBounds.Size() );
+        for ( size_t index = 0; index < m_primitiveBounds.size(); ++index )
+        {
+            m_primitiveBounds[ index ] = i_primitiveBounds[ index ];
+        }
+
+        pybind11::gil_scoped_release release;
+        m_bvh.Build( m_primitiveBounds, i_maxLeafSize, i_binCount );
+    }
+
+    inline const BVH& GetBVH() const
+    {
+        return m_bvh;
+    }
+
+    inline const Vec3fRangeArray& GetPrimitiveBounds() const
+    {
+        return m_primitiveBounds;
+    }
+
+private:
+    Vec3fRangeArray m_primitiveBounds;
+    BVH             m_bvh;
+};
+} // namespace
+
+void BindBVH( pybind11::module& o_module )
+{
+    pybind11::class_< PyBVH > cls( o_module, "BVH" );
+
+    cls.def( pybind11::init< const BatchArg< Vec3fRange >&, size_t, size_t >(),
+             pybind11::arg( "primitiveBounds" ),
+             pybind11::arg( "maxLeafSize" ) = BVH::c_defaultMaxLeafSize,
+             pybind11::arg( "binCount" )    = BVH::c_defaultBinCount );
+
+    cls.def_property_readonly( "primitiveCount",
+                               []( const PyBVH& i_bvh ) { return i_bvh.GetBVH().GetPrimitiveCount(); } );
+    cls.def_property_readonly( "nodeCount", []( const PyBVH& i_bvh ) { return i_bvh.GetBVH().GetNodeCount(); } );
+    cls.def_property_readonly( "bounds", []( const PyBVH& i_bvh ) { return i_bvh.GetBVH().GetBounds(); } );
+
+    // Single ray queries.
+    cls.def(
+        "ClosestHit",
+        []( const PyBVH& i_bvh, const Vec3f& i_rayOrigin, const Vec3f& i_rayDirection, FloatRange& o_intersections ) {
+            int primitiveIndex = -1;
+            i_bvh.GetBVH().ClosestHit( i_rayOrigin,
+                                       i_rayDirection,
+                                       i_bvh.GetPrimitiveBounds(),
+                                       primitiveIndex,
+                                       o_intersections );
+            return primitiveIndex;
+        } );
+    cls.def( "AnyHit", []( const PyBVH& i_bvh, const Vec3f& i_rayOrigin, const Vec3f& i_rayDirection ) {
+        return i_bvh.GetBVH().AnyHit( i_rayOrigin, i_rayDirection, i_bvh.GetPrimitiveBounds() );
+    } );
+
+    // Batched ray queries, registered after the single ray queries such that they are only considered
+    // when none of the latter match.  The rays are processed without holding the GIL.
+    cls.def( "ClosestHit",
+             []( const PyBVH&                         i_bvh,
+                 const BatchArg< Vec3f >&             i_rayOrigin,
+                 const BatchArg< Vec3f >&             i_rayDirection,
+                 const MutableBatchArg< FloatRange >& o_intersections ) {
+                 size_t size     = ResolveBatchSize( {&i_rayOrigin, &i_rayDirection, &o_intersections} );
+                 auto   result   = AllocateBatchResult< int >( size );
+                 int*   o_result = BatchResultData< int >( result );
+                 {
+                     pybind11::gil_scoped_release release;
+                     ParallelFor( size, [&]( size_t i_begin, size_t i_end ) {
+                         for ( size_t index = i_begin; index < i_end; ++index )
+                         {
+                             o_result[ index ] = -1;
+                             i_bvh.GetBVH().ClosestHit( i_rayOrigin[ index ],
+                                                        i_rayDirection[ index ],
+                                                        i_bvh.GetPrimitiveBounds(),
+                                                        o_result[ index ],
+                                                        o_intersections[ index ] );
+                         }
+                     } );
+                 }
+                 return result;
+             } );
+    cls.def( "AnyHit",
+             []( const PyBVH& i_bvh, const BatchArg< Vec3f >& i_rayOrigin, const BatchArg< Vec3f >& i_rayDirection ) {
+                 size_t size     = ResolveBatchSize( {&i_rayOrigin, &i_rayDirection} );
+                 auto   result   = AllocateBatchResult< bool >( size );
+                 bool*  o_result = BatchResultData< bool >( result );
+                 {
+                     pybind11::gil_scoped_release release;
+                     ParallelFor( size, [&]( size_t i_begin, size_t i_end ) {
+                         for ( size_t index = i_begin; index < i_end; ++index )
+                         {
+                             o_result[ index ] = i_bvh.GetBVH().AnyHit( i_rayOrigin[ index ],
+                                                                        i_rayDirection[ index ],
+                                                                        i_bvh.GetPrimitiveBounds() );
+                         }
+                     } );
+                 }
+                 return result;
+             } );
+}
@@ -0,0 +1,73 @@
+import unittest
+
+import numpy
+import gm
+
+
+def GridBounds(size):
+    """Boxes of width 0.5 centered at each point of a size x size grid on the XY plane, at z = 0."""
+    bounds = numpy.zeros((size * size, 2, 3), dtype=numpy.float32)
+    for y in range(size):
+        for x in range(size):
+            bounds[y * size + x] = [
+                [x - 0.25, y - 0.25, -0.25],
+                [x + 0.25, y + 0.25, 0.25],
+            ]
+    return bounds
+
+
+class TestBVH(unittest.TestCase):
+    def testBuild(self):
+        bvh = gm.BVH(GridBounds(8), maxLeafSize=2)
+        self.assertEqual(bvh.primitiveCount, 64)
+        self.assertGreater(bvh.nodeCount, 1)
+        self.assertEqual(bvh.bounds.min, gm.Vec3f(-0.25, -0.25, -0.25))
+        self.assertEqual(bvh.bounds.max, gm.Vec3f(7.25, 7.25, 0.25))
+
+    def testBuildFromArray(self):
+        bounds = gm.Vec3fRangeArray(
+            [gm.Vec3fRange(gm.Vec3f(0, 0, 0), gm.Vec3f(1, 1, 1))]
+        )
+        bvh = gm.BVH(bounds)
+        self.assertEqual(bvh.primitiveCount, 1)
+
+    def testClosestHit(self):
+        bvh = gm.BVH(GridBounds(8))
+        intersections = gm.FloatRange()
+        self.assertEqual(
+            bvh.ClosestHit(gm.Vec3f(3, 5, -4), gm.Vec3f(0, 0, 1), intersections),
+            5 * 8 + 3,
+        )
+        self.assertAlmostEqual(intersections.min, 3.75)
+        self.assertAlmostEqual(intersections.max, 4.25)
+        self.assertEqual(
+            bvh.ClosestHit(gm.Vec3f(3.5, 5, -4), gm.Vec3f(0, 0, 1), intersections), -1
+        )
+
+    def testAnyHit(self):
+        bvh = gm.BVH(GridBounds(8))
+        self.assertTrue(bvh.AnyHit(gm.Vec3f(-4, 2, 0), gm.Vec3f(1, 0, 0)))
+        self.assertFalse(bvh.AnyHit(gm.Vec3f(-4, 2.5, 0), gm.Vec3f(1, 0, 0)))
+
+    def testBatchClosestHit(self):
+        bvh = gm.BVH(GridBounds(8))
+        origins = numpy.array(
+            [[0, 0, -4], [3.5, 0, -4], [7, 7, -4]], dtype=numpy.float32
+        )
+        intersections = gm.FloatRangeArray(3)
+        hits = bvh.ClosestHit(origins, gm.Vec3f(0, 0, 1), intersections)
+        self.assertEqual(hits.dtype, numpy.int32)
+        self.assertEqual(list(hits), [0, -1, 63])
+        numpy.testing.assert_allclose(
+            numpy.asarray(intersections)[2], [3.75, 4.25], rtol=1e-6
+        )
+
+    def testBatchAnyHit(self):
+        bvh = gm.BVH(GridBounds(8))
+        origins = numpy.array([[0, 0, -4], [3.5, 0, -4]], dtype=numpy.float32)
+        hits = bvh.AnyHit(origins, gm.Vec3f(0, 0, 1))
+        self.assertEqual(list(hits), [True, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
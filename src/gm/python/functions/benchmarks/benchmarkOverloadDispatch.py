@@ -0,0 +1,92 @@
+"""
+Per-call latency of overloaded function bindings, for single value arguments.
+
+Each case is timed through the overloaded entry point (e.g. gm.Min), whose cost used to grow with the
+number of overloads registered before the matching one, and through the explicitly typed name of the
+same overload (e.g. gm.Min_Mat4f_Mat4f), which skips overload resolution altogether.
+
+Usage:
+    python benchmarkOverloadDispatch.py [--repeat REPEAT] [--number NUMBER]
+"""
+
+import argparse
+import timeit
+
+import gm
+
+
+def Cases():
+    """
+    Returns:
+        list: (function name, typed name, arguments) tuples, ordered from the first to the last overload.
+    """
+    matrix = gm.Mat4f()
+    gm.SetIdentity(matrix)
+    return [
+        ("Min", "Min_float_float", (1.0, 2.0)),
+        ("Min", "Min_Vec3f_Vec3f", (gm.Vec3f(1, 2, 3), gm.Vec3f(3, 2, 1))),
+        ("Min", "Min_Mat4f_Mat4f", (matrix, matrix)),
+        ("Clamp", "Clamp_float_FloatRange", (0.5, gm.FloatRange(0, 1))),
+        ("Clamp", "Clamp_Mat4f_FloatRange", (matrix, gm.FloatRange(0, 1))),
+        (
+            "LinearInterpolation",
+            "LinearInterpolation_float_float_float",
+            (0.0, 1.0, 0.5),
+        ),
+        (
+            "LinearInterpolation",
+            "LinearInterpolation_Vec4f_Vec4f_float",
+            (gm.Vec4f(0, 0, 0, 0), gm.Vec4f(1, 1, 1, 1), 0.5),
+        ),
+        (
+            "LinearInterpolation",
+            "LinearInterpolation_FloatRange_FloatRange_float",
+            (gm.FloatRange(0, 1), gm.FloatRange(1, 2), 0.5),
+        ),
+        (
+            "DotProduct",
+            "DotProduct_Vec3f_Vec3f",
+            (gm.Vec3f(1, 2, 3), gm.Vec3f(3, 2, 1)),
+        ),
+        ("TransformPoint", "TransformPoint_Mat4f_Vec3f", (matrix, gm.Vec3f(1, 2, 3))),
+    ]
+
+
+def Latency(function, arguments, repeat, number):
+    """
+    Returns:
+        float: the best per-call latency of ``function(*arguments)``, in nanoseconds.
+    """
+    timer = timeit.Timer(lambda: function(*arguments))
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def Main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of timed repetitions, the best is reported.",
+    )
+    parser.add_argument(
+        "--number", type=int, default=100000, help="Number of calls per repetition."
+    )
+    args = parser.parse_args()
+
+    print("{:<50} {:>12} {:>12}".format("Overload", "Entry (ns)", "Typed (ns)"))
+    for name, typedName, arguments in Cases():
+        entry = Latency(getattr(gm, name), arguments, args.repeat, args.number)
+        if hasattr(gm, typedName):
+            typed = "{:12.1f}".format(
+                Latency(getattr(gm, typedName), arguments, args.repeat, args.number)
+            )
+        else:
+            typed = "{:>12}".format("n/a")
+        print("{:<50} {:12.1f} {}".format(typedName, entry, typed))
+
+
+if __name__ == "__main__":
+    Main()
@@ -6,16 +6,304 @@
 
 #include <gm/functions/abs.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for Abs.
 
 GM_NS_USING
 
 void BindAbs( pybind11::module& o_module )
 {
-    o_module.def( "Abs", []( const float& i_value ) { return Abs( i_value ); } );
-    o_module.def( "Abs", []( const Vec2f& i_value ) { return Abs( i_value ); } );
-    o_module.def( "Abs", []( const Vec3f& i_value ) { return Abs( i_value ); } );
-    o_module.def( "Abs", []( const Vec4f& i_value ) { return Abs( i_value ); } );
-    o_module.def( "Abs", []( const Mat3f& i_value ) { return Abs( i_value ); } );
-    o_module.def( "Abs", []( const Mat4f& i_value ) { return Abs( i_value ); } );
+    // Abs_float.
+    auto                        single0 = []( const float& i_value ) { return Abs( i_value ); };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< float > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Abs( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< float >& i_value ) {
+        size_t size     = ResolveBatchSize( {&i_value} );
+        auto   result   = AllocateBatchResult< float >( size );
+        float* o_result = BatchResultData< float >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Abs_float;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< float >( invoke0 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single0, pybind11::name( "Abs_float" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch0,
+                                            pybind11::name( "Abs_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Abs_float", std::move( dispatcher ), overloads );
+    }
+
+    // Abs_Vec2f.
+    auto                        single1 = []( const Vec2f& i_value ) { return Abs( i_value ); };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2f > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Abs( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< Vec2f >& i_value ) {
+        size_t size     = ResolveBatchSize( {&i_value} );
+        auto   result   = AllocateBatchResult< Vec2f >( size );
+        Vec2f* o_result = BatchResultData< Vec2f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Abs_Vec2f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2f >( invoke1 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single1, pybind11::name( "Abs_Vec2f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch1,
+                                            pybind11::name( "Abs_Vec2f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Abs_Vec2f", std::move( dispatcher ), overloads );
+    }
+
+    // Abs_Vec3f.
+    auto                        single2 = []( const Vec3f& i_value ) { return Abs( i_value ); };
+    OverloadDispatcher::Invoker invoke2 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Abs( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch2 = []( const BatchArg< Vec3f >& i_value ) {
+        size_t size     = ResolveBatchSize( {&i_value} );
+        auto   result   = AllocateBatchResult< Vec3f >( size );
+        Vec3f* o_result = BatchResultData< Vec3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Abs_Vec3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f >( invoke2 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single2, pybind11::name( "Abs_Vec3f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch2,
+                                            pybind11::name( "Abs_Vec3f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Abs_Vec3f", std::move( dispatcher ), overloads );
+    }
+
+    // Abs_Vec4f.
+    auto                        single3 = []( const Vec4f& i_value ) { return Abs( i_value ); };
+    OverloadDispatcher::Invoker invoke3 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4f > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Abs( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch3 = []( const BatchArg< Vec4f >& i_value ) {
+        size_t size     = ResolveBatchSize( {&i_value} );
+        auto   result   = AllocateBatchResult< Vec4f >( size );
+        Vec4f* o_result = BatchResultData< Vec4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Abs_Vec4f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4f >( invoke3 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single3, pybind11::name( "Abs_Vec4f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch3,
+                                            pybind11::name( "Abs_Vec4f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Abs_Vec4f", std::move( dispatcher ), overloads );
+    }
+
+    // Abs_Mat3f.
+    auto                        single4 = []( const Mat3f& i_value ) { return Abs( i_value ); };
+    OverloadDispatcher::Invoker invoke4 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat3f > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Abs( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch4 = []( const BatchArg< Mat3f >& i_value ) {
+        size_t size     = ResolveBatchSize( {&i_value} );
+        auto   result   = AllocateBatchResult< Mat3f >( size );
+        Mat3f* o_result = BatchResultData< Mat3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Abs_Mat3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat3f >( invoke4 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single4, pybind11::name( "Abs_Mat3f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch4,
+                                            pybind11::name( "Abs_Mat3f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Abs_Mat3f", std::move( dispatcher ), overloads );
+    }
+
+    // Abs_Mat4f.
+    auto                        single5 = []( const Mat4f& i_value ) { return Abs( i_value ); };
+    OverloadDispatcher::Invoker invoke5 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat4f > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Abs( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch5 = []( const BatchArg< Mat4f >& i_value ) {
+        size_t size     = ResolveBatchSize( {&i_value} );
+        auto   result   = AllocateBatchResult< Mat4f >( size );
+        Mat4f* o_result = BatchResultData< Mat4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Abs_Mat4f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat4f >( invoke5 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single5, pybind11::name( "Abs_Mat4f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch5,
+                                            pybind11::name( "Abs_Mat4f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Abs_Mat4f", std::move( dispatcher ), overloads );
+    }
+
+    // Abs, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< float >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "Abs" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2f >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "Abs" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3f >( invoke2 );
+    overloads = pybind11::cpp_function( single2,
+                                        pybind11::name( "Abs" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4f >( invoke3 );
+    overloads = pybind11::cpp_function( single3,
+                                        pybind11::name( "Abs" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Mat3f >( invoke4 );
+    overloads = pybind11::cpp_function( single4,
+                                        pybind11::name( "Abs" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Mat4f >( invoke5 );
+    overloads = pybind11::cpp_function( single5,
+                                        pybind11::name( "Abs" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "Abs" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "Abs" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch2,
+                                        pybind11::name( "Abs" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch3,
+                                        pybind11::name( "Abs" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch4,
+                                        pybind11::name( "Abs" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch5,
+                                        pybind11::name( "Abs" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "Abs", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
@@ -0,0 +1,219 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <pybind11/pybind11.h>
+
+#include <gm/functions/approximateNormalize.h>
+
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
+// Python bindings for ApproximateNormalize.
+
+GM_NS_USING
+
+void BindApproximateNormalize( pybind11::module& o_module )
+{
+    // ApproximateNormalize_Vec2f.
+    auto                        single0 = []( const Vec2f& i_vector ) { return ApproximateNormalize( i_vector ); };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2f > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( ApproximateNormalize( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< Vec2f >& i_vector ) {
+        size_t size     = ResolveBatchSize( {&i_vector} );
+        auto   result   = AllocateBatchResult< Vec2f >( size );
+        Vec2f* o_result = BatchResultData< Vec2f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_vector ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().ApproximateNormalize_Vec2f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2f >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "ApproximateNormalize_Vec2f" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "ApproximateNormalize_Vec2f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "ApproximateNormalize_Vec2f", std::move( dispatcher ), overloads );
+    }
+
+    // ApproximateNormalize_Vec3f.
+    auto                        single1 = []( const Vec3f& i_vector ) { return ApproximateNormalize( i_vector ); };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( ApproximateNormalize( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< Vec3f >& i_vector ) {
+        size_t size     = ResolveBatchSize( {&i_vector} );
+        auto   result   = AllocateBatchResult< Vec3f >( size );
+        Vec3f* o_result = BatchResultData< Vec3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_vector ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().ApproximateNormalize_Vec3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f >( invoke1 );
+        pybind11::object overloads = pybind11::cpp_function( single1,
+                                                             pybind11::name( "ApproximateNormalize_Vec3f" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch1,
+                                            pybind11::name( "ApproximateNormalize_Vec3f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "ApproximateNormalize_Vec3f", std::move( dispatcher ), overloads );
+    }
+
+    // ApproximateNormalize_Vec4f.
+    auto                        single2 = []( const Vec4f& i_vector ) { return ApproximateNormalize( i_vector ); };
+    OverloadDispatcher::Invoker invoke2 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4f > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( ApproximateNormalize( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch2 = []( const BatchArg< Vec4f >& i_vector ) {
+        size_t size     = ResolveBatchSize( {&i_vector} );
+        auto   result   = AllocateBatchResult< Vec4f >( size );
+        Vec4f* o_result = BatchResultData< Vec4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_vector ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().ApproximateNormalize_Vec4f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4f >( invoke2 );
+        pybind11::object overloads = pybind11::cpp_function( single2,
+                                                             pybind11::name( "ApproximateNormalize_Vec4f" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch2,
+                                            pybind11::name( "ApproximateNormalize_Vec4f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "ApproximateNormalize_Vec4f", std::move( dispatcher ), overloads );
+    }
+
+    // ApproximateNormalize_Quatf.
+    auto                        single3 = []( const Quatf& i_vector ) { return ApproximateNormalize( i_vector ); };
+    OverloadDispatcher::Invoker invoke3 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Quatf > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( ApproximateNormalize( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch3 = []( const BatchArg< Quatf >& i_vector ) {
+        size_t size     = ResolveBatchSize( {&i_vector} );
+        auto   result   = AllocateBatchResult< Quatf >( size );
+        Quatf* o_result = BatchResultData< Quatf >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_vector ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().ApproximateNormalize_Quatf;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Quatf >( invoke3 );
+        pybind11::object overloads = pybind11::cpp_function( single3,
+                                                             pybind11::name( "ApproximateNormalize_Quatf" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch3,
+                                            pybind11::name( "ApproximateNormalize_Quatf" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "ApproximateNormalize_Quatf", std::move( dispatcher ), overloads );
+    }
+
+    // ApproximateNormalize, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< Vec2f >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "ApproximateNormalize" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3f >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "ApproximateNormalize" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4f >( invoke2 );
+    overloads = pybind11::cpp_function( single2,
+                                        pybind11::name( "ApproximateNormalize" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Quatf >( invoke3 );
+    overloads = pybind11::cpp_function( single3,
+                                        pybind11::name( "ApproximateNormalize" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "ApproximateNormalize" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "ApproximateNormalize" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch2,
+                                        pybind11::name( "ApproximateNormalize" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch3,
+                                        pybind11::name( "ApproximateNormalize" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "ApproximateNormalize", std::move( dispatcher ), overloads );
+}
\ No newline at end of file
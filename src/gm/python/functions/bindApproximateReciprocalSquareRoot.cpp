@@ -0,0 +1,78 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <pybind11/pybind11.h>
+
+#include <gm/functions/approximateReciprocalSquareRoot.h>
+
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
+// Python bindings for ApproximateReciprocalSquareRoot.
+
+GM_NS_USING
+
+void BindApproximateReciprocalSquareRoot( pybind11::module& o_module )
+{
+    // ApproximateReciprocalSquareRoot_float.
+    auto single0 = []( const float& i_value ) { return ApproximateReciprocalSquareRoot( i_value ); };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< float > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( ApproximateReciprocalSquareRoot( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< float >& i_value ) {
+        size_t size     = ResolveBatchSize( {&i_value} );
+        auto   result   = AllocateBatchResult< float >( size );
+        float* o_result = BatchResultData< float >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().ApproximateReciprocalSquareRoot_float;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< float >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "ApproximateReciprocalSquareRoot_float" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "ApproximateReciprocalSquareRoot_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "ApproximateReciprocalSquareRoot_float",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // ApproximateReciprocalSquareRoot, dispatching calls on the types of single value arguments.  Other calls are
+    // resolved by pybind11, where the batched overloads are registered after all the single value overloads, such that
+    // they are only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< float >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "ApproximateReciprocalSquareRoot" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "ApproximateReciprocalSquareRoot" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "ApproximateReciprocalSquareRoot", std::move( dispatcher ), overloads );
+}
\ No newline at end of file
@@ -0,0 +1,143 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <pybind11/pybind11.h>
+
+#include <gm/functions/approximateSetRotate.h>
+
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
+// Python bindings for ApproximateSetRotate.
+
+GM_NS_USING
+
+void BindApproximateSetRotate( pybind11::module& o_module )
+{
+    // ApproximateSetRotate_float_Vec3f_Mat4f.
+    auto single0 = []( const float& i_angle, const Vec3f& i_axis, Mat4f& o_matrix ) {
+        ApproximateSetRotate( i_angle, i_axis, o_matrix );
+    };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< float > arg0;
+        DispatchArg< Vec3f > arg1;
+        DispatchArg< Mat4f > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        ApproximateSetRotate( arg0.Get(), arg1.Get(), arg2.Get() );
+        Py_INCREF( Py_None );
+        *o_result = Py_None;
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< float >&        i_angle,
+                      const BatchArg< Vec3f >&        i_axis,
+                      const MutableBatchArg< Mat4f >& o_matrix ) {
+        size_t size = ResolveBatchSize( {&i_angle, &i_axis, &o_matrix} );
+
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_angle ),
+                                                  gm_kernels::MakeKernelArg( i_axis ),
+                                                  gm_kernels::MakeKernelArg( o_matrix )};
+            gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().ApproximateSetRotate_float_Vec3f_Mat4f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< float, Vec3f, Mat4f >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "ApproximateSetRotate_float_Vec3f_Mat4f" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "ApproximateSetRotate_float_Vec3f_Mat4f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "ApproximateSetRotate_float_Vec3f_Mat4f",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // ApproximateSetRotate_float_Vec3f_Quatf.
+    auto single1 = []( const float& i_angle, const Vec3f& i_axis, Quatf& o_quaternion ) {
+        ApproximateSetRotate( i_angle, i_axis, o_quaternion );
+    };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< float > arg0;
+        DispatchArg< Vec3f > arg1;
+        DispatchArg< Quatf > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        ApproximateSetRotate( arg0.Get(), arg1.Get(), arg2.Get() );
+        Py_INCREF( Py_None );
+        *o_result = Py_None;
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< float >&        i_angle,
+                      const BatchArg< Vec3f >&        i_axis,
+                      const MutableBatchArg< Quatf >& o_quaternion ) {
+        size_t size = ResolveBatchSize( {&i_angle, &i_axis, &o_quaternion} );
+
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_angle ),
+                                                  gm_kernels::MakeKernelArg( i_axis ),
+                                                  gm_kernels::MakeKernelArg( o_quaternion )};
+            gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().ApproximateSetRotate_float_Vec3f_Quatf;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< float, Vec3f, Quatf >( invoke1 );
+        pybind11::object overloads = pybind11::cpp_function( single1,
+                                                             pybind11::name( "ApproximateSetRotate_float_Vec3f_Quatf" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch1,
+                                            pybind11::name( "ApproximateSetRotate_float_Vec3f_Quatf" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "ApproximateSetRotate_float_Vec3f_Quatf",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // ApproximateSetRotate, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< float, Vec3f, Mat4f >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "ApproximateSetRotate" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< float, Vec3f, Quatf >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "ApproximateSetRotate" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "ApproximateSetRotate" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "ApproximateSetRotate" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "ApproximateSetRotate", std::move( dispatcher ), overloads );
+}
\ No newline at end of file
@@ -0,0 +1,76 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <pybind11/pybind11.h>
+
+#include <gm/functions/approximateSetRotateX.h>
+
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
+// Python bindings for ApproximateSetRotateX.
+
+GM_NS_USING
+
+void BindApproximateSetRotateX( pybind11::module& o_module )
+{
+    // ApproximateSetRotateX_float_Mat4f.
+    auto single0 = []( const float& i_angle, Mat4f& o_matrix ) { ApproximateSetRotateX( i_angle, o_matrix ); };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< float > arg0;
+        DispatchArg< Mat4f > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        ApproximateSetRotateX( arg0.Get(), arg1.Get() );
+        Py_INCREF( Py_None );
+        *o_result = Py_None;
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< float >& i_angle, const MutableBatchArg< Mat4f >& o_matrix ) {
+        size_t size = ResolveBatchSize( {&i_angle, &o_matrix} );
+
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_angle ),
+                                                  gm_kernels::MakeKernelArg( o_matrix )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().ApproximateSetRotateX_float_Mat4f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< float, Mat4f >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "ApproximateSetRotateX_float_Mat4f" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "ApproximateSetRotateX_float_Mat4f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "ApproximateSetRotateX_float_Mat4f", std::move( dispatcher ), overloads );
+    }
+
+    // ApproximateSetRotateX, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< float, Mat4f >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "ApproximateSetRotateX" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "ApproximateSetRotateX" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "ApproximateSetRotateX", std::move( dispatcher ), overloads );
+}
\ No newline at end of file
@@ -0,0 +1,90 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <pybind11/pybind11.h>
+
+#include <gm/functions/approximateSineCosine.h>
+
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+#include <tuple>
+
+// Python bindings for ApproximateSineCosine.
+
+GM_NS_USING
+
+void BindApproximateSineCosine( pybind11::module& o_module )
+{
+    // ApproximateSineCosine_float_float_float.
+    // The mutable scalar arguments are returned as a tuple, as python cannot observe their modification.
+    auto single0 = []( const float& i_angle ) {
+        float o_sine{};
+        float o_cosine{};
+        ApproximateSineCosine( i_angle, o_sine, o_cosine );
+        return std::make_tuple( o_sine, o_cosine );
+    };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< float > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        float o_sine{};
+        float o_cosine{};
+        ApproximateSineCosine( arg0.Get(), o_sine, o_cosine );
+        *o_result = DispatchResult( std::make_tuple( o_sine, o_cosine ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< float >&        i_angle,
+                      const MutableBatchArg< float >& o_sine,
+                      const MutableBatchArg< float >& o_cosine ) {
+        size_t size = ResolveBatchSize( {&i_angle, &o_sine, &o_cosine} );
+
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_angle ),
+                                                  gm_kernels::MakeKernelArg( o_sine ),
+                                                  gm_kernels::MakeKernelArg( o_cosine )};
+            gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().ApproximateSineCosine_float_float_float;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< float >( invoke0 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single0,
+                                    pybind11::name( "ApproximateSineCosine_float_float_float" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch0,
+                                            pybind11::name( "ApproximateSineCosine_float_float_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "ApproximateSineCosine_float_float_float",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // ApproximateSineCosine, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< float >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "ApproximateSineCosine" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "ApproximateSineCosine" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "ApproximateSineCosine", std::move( dispatcher ), overloads );
+}
\ No newline at end of file
@@ -6,58 +6,460 @@
 
 #include <gm/functions/bilinearInterpolation.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for BilinearInterpolation.
 
 GM_NS_USING
 
 void BindBilinearInterpolation( pybind11::module& o_module )
 {
-    o_module.def( "BilinearInterpolation",
-                  []( const float& i_corner00,
-                      const float& i_corner10,
-                      const float& i_corner01,
-                      const float& i_corner11,
-                      const Vec2f& i_weight ) {
-                      return BilinearInterpolation( i_corner00, i_corner10, i_corner01, i_corner11, i_weight );
-                  } );
-    o_module.def( "BilinearInterpolation",
-                  []( const Mat3f& i_corner00,
-                      const Mat3f& i_corner10,
-                      const Mat3f& i_corner01,
-                      const Mat3f& i_corner11,
-                      const Vec2f& i_weight ) {
-                      return BilinearInterpolation( i_corner00, i_corner10, i_corner01, i_corner11, i_weight );
-                  } );
-    o_module.def( "BilinearInterpolation",
-                  []( const Mat4f& i_corner00,
-                      const Mat4f& i_corner10,
-                      const Mat4f& i_corner01,
-                      const Mat4f& i_corner11,
-                      const Vec2f& i_weight ) {
-                      return BilinearInterpolation( i_corner00, i_corner10, i_corner01, i_corner11, i_weight );
-                  } );
-    o_module.def( "BilinearInterpolation",
-                  []( const Vec2f& i_corner00,
-                      const Vec2f& i_corner10,
-                      const Vec2f& i_corner01,
-                      const Vec2f& i_corner11,
-                      const Vec2f& i_weight ) {
-                      return BilinearInterpolation( i_corner00, i_corner10, i_corner01, i_corner11, i_weight );
-                  } );
-    o_module.def( "BilinearInterpolation",
-                  []( const Vec3f& i_corner00,
-                      const Vec3f& i_corner10,
-                      const Vec3f& i_corner01,
-                      const Vec3f& i_corner11,
-                      const Vec2f& i_weight ) {
-                      return BilinearInterpolation( i_corner00, i_corner10, i_corner01, i_corner11, i_weight );
-                  } );
-    o_module.def( "BilinearInterpolation",
-                  []( const Vec4f& i_corner00,
-                      const Vec4f& i_corner10,
-                      const Vec4f& i_corner01,
-                      const Vec4f& i_corner11,
-                      const Vec2f& i_weight ) {
-                      return BilinearInterpolation( i_corner00, i_corner10, i_corner01, i_corner11, i_weight );
-                  } );
+    // BilinearInterpolation_float_float_float_float_Vec2f.
+    auto single0 = []( const float& i_corner00,
+                       const float& i_corner10,
+                       const float& i_corner01,
+                       const float& i_corner11,
+                       const Vec2f& i_weight ) {
+        return BilinearInterpolation( i_corner00, i_corner10, i_corner01, i_corner11, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< float > arg0;
+        DispatchArg< float > arg1;
+        DispatchArg< float > arg2;
+        DispatchArg< float > arg3;
+        DispatchArg< Vec2f > arg4;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) || !arg4.Load( i_args[ 4 ] ) )
+        {
+            return false;
+        }
+        *o_result =
+            DispatchResult( BilinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get(), arg4.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< float >& i_corner00,
+                      const BatchArg< float >& i_corner10,
+                      const BatchArg< float >& i_corner01,
+                      const BatchArg< float >& i_corner11,
+                      const BatchArg< Vec2f >& i_weight ) {
+        size_t size     = ResolveBatchSize( {&i_corner00, &i_corner10, &i_corner01, &i_corner11, &i_weight} );
+        auto   result   = AllocateBatchResult< float >( size );
+        float* o_result = BatchResultData< float >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_corner00 ),
+                                                  gm_kernels::MakeKernelArg( i_corner10 ),
+                                                  gm_kernels::MakeKernelArg( i_corner01 ),
+                                                  gm_kernels::MakeKernelArg( i_corner11 ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet().BilinearInterpolation_float_float_float_float_Vec2f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< float, float, float, float, Vec2f >( invoke0 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single0,
+                                    pybind11::name( "BilinearInterpolation_float_float_float_float_Vec2f" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch0,
+                                            pybind11::name( "BilinearInterpolation_float_float_float_float_Vec2f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "BilinearInterpolation_float_float_float_float_Vec2f",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f.
+    auto single1 = []( const Mat3f& i_corner00,
+                       const Mat3f& i_corner10,
+                       const Mat3f& i_corner01,
+                       const Mat3f& i_corner11,
+                       const Vec2f& i_weight ) {
+        return BilinearInterpolation( i_corner00, i_corner10, i_corner01, i_corner11, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat3f > arg0;
+        DispatchArg< Mat3f > arg1;
+        DispatchArg< Mat3f > arg2;
+        DispatchArg< Mat3f > arg3;
+        DispatchArg< Vec2f > arg4;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) || !arg4.Load( i_args[ 4 ] ) )
+        {
+            return false;
+        }
+        *o_result =
+            DispatchResult( BilinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get(), arg4.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< Mat3f >& i_corner00,
+                      const BatchArg< Mat3f >& i_corner10,
+                      const BatchArg< Mat3f >& i_corner01,
+                      const BatchArg< Mat3f >& i_corner11,
+                      const BatchArg< Vec2f >& i_weight ) {
+        size_t size     = ResolveBatchSize( {&i_corner00, &i_corner10, &i_corner01, &i_corner11, &i_weight} );
+        auto   result   = AllocateBatchResult< Mat3f >( size );
+        Mat3f* o_result = BatchResultData< Mat3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_corner00 ),
+                                                  gm_kernels::MakeKernelArg( i_corner10 ),
+                                                  gm_kernels::MakeKernelArg( i_corner01 ),
+                                                  gm_kernels::MakeKernelArg( i_corner11 ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet().BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat3f, Mat3f, Mat3f, Mat3f, Vec2f >( invoke1 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single1,
+                                    pybind11::name( "BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch1,
+                                            pybind11::name( "BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f.
+    auto single2 = []( const Mat4f& i_corner00,
+                       const Mat4f& i_corner10,
+                       const Mat4f& i_corner01,
+                       const Mat4f& i_corner11,
+                       const Vec2f& i_weight ) {
+        return BilinearInterpolation( i_corner00, i_corner10, i_corner01, i_corner11, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke2 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat4f > arg0;
+        DispatchArg< Mat4f > arg1;
+        DispatchArg< Mat4f > arg2;
+        DispatchArg< Mat4f > arg3;
+        DispatchArg< Vec2f > arg4;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) || !arg4.Load( i_args[ 4 ] ) )
+        {
+            return false;
+        }
+        *o_result =
+            DispatchResult( BilinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get(), arg4.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch2 = []( const BatchArg< Mat4f >& i_corner00,
+                      const BatchArg< Mat4f >& i_corner10,
+                      const BatchArg< Mat4f >& i_corner01,
+                      const BatchArg< Mat4f >& i_corner11,
+                      const BatchArg< Vec2f >& i_weight ) {
+        size_t size     = ResolveBatchSize( {&i_corner00, &i_corner10, &i_corner01, &i_corner11, &i_weight} );
+        auto   result   = AllocateBatchResult< Mat4f >( size );
+        Mat4f* o_result = BatchResultData< Mat4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_corner00 ),
+                                                  gm_kernels::MakeKernelArg( i_corner10 ),
+                                                  gm_kernels::MakeKernelArg( i_corner01 ),
+                                                  gm_kernels::MakeKernelArg( i_corner11 ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet().BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat4f, Mat4f, Mat4f, Mat4f, Vec2f >( invoke2 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single2,
+                                    pybind11::name( "BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch2,
+                                            pybind11::name( "BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f.
+    auto single3 = []( const Vec2f& i_corner00,
+                       const Vec2f& i_corner10,
+                       const Vec2f& i_corner01,
+                       const Vec2f& i_corner11,
+                       const Vec2f& i_weight ) {
+        return BilinearInterpolation( i_corner00, i_corner10, i_corner01, i_corner11, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke3 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2f > arg0;
+        DispatchArg< Vec2f > arg1;
+        DispatchArg< Vec2f > arg2;
+        DispatchArg< Vec2f > arg3;
+        DispatchArg< Vec2f > arg4;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) || !arg4.Load( i_args[ 4 ] ) )
+        {
+            return false;
+        }
+        *o_result =
+            DispatchResult( BilinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get(), arg4.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch3 = []( const BatchArg< Vec2f >& i_corner00,
+                      const BatchArg< Vec2f >& i_corner10,
+                      const BatchArg< Vec2f >& i_corner01,
+                      const BatchArg< Vec2f >& i_corner11,
+                      const BatchArg< Vec2f >& i_weight ) {
+        size_t size     = ResolveBatchSize( {&i_corner00, &i_corner10, &i_corner01, &i_corner11, &i_weight} );
+        auto   result   = AllocateBatchResult< Vec2f >( size );
+        Vec2f* o_result = BatchResultData< Vec2f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_corner00 ),
+                                                  gm_kernels::MakeKernelArg( i_corner10 ),
+                                                  gm_kernels::MakeKernelArg( i_corner01 ),
+                                                  gm_kernels::MakeKernelArg( i_corner11 ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet().BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2f, Vec2f, Vec2f, Vec2f, Vec2f >( invoke3 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single3,
+                                    pybind11::name( "BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch3,
+                                            pybind11::name( "BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f.
+    auto single4 = []( const Vec3f& i_corner00,
+                       const Vec3f& i_corner10,
+                       const Vec3f& i_corner01,
+                       const Vec3f& i_corner11,
+                       const Vec2f& i_weight ) {
+        return BilinearInterpolation( i_corner00, i_corner10, i_corner01, i_corner11, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke4 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f > arg0;
+        DispatchArg< Vec3f > arg1;
+        DispatchArg< Vec3f > arg2;
+        DispatchArg< Vec3f > arg3;
+        DispatchArg< Vec2f > arg4;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) || !arg4.Load( i_args[ 4 ] ) )
+        {
+            return false;
+        }
+        *o_result =
+            DispatchResult( BilinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get(), arg4.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch4 = []( const BatchArg< Vec3f >& i_corner00,
+                      const BatchArg< Vec3f >& i_corner10,
+                      const BatchArg< Vec3f >& i_corner01,
+                      const BatchArg< Vec3f >& i_corner11,
+                      const BatchArg< Vec2f >& i_weight ) {
+        size_t size     = ResolveBatchSize( {&i_corner00, &i_corner10, &i_corner01, &i_corner11, &i_weight} );
+        auto   result   = AllocateBatchResult< Vec3f >( size );
+        Vec3f* o_result = BatchResultData< Vec3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_corner00 ),
+                                                  gm_kernels::MakeKernelArg( i_corner10 ),
+                                                  gm_kernels::MakeKernelArg( i_corner01 ),
+                                                  gm_kernels::MakeKernelArg( i_corner11 ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet().BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f, Vec3f, Vec3f, Vec3f, Vec2f >( invoke4 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single4,
+                                    pybind11::name( "BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch4,
+                                            pybind11::name( "BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f.
+    auto single5 = []( const Vec4f& i_corner00,
+                       const Vec4f& i_corner10,
+                       const Vec4f& i_corner01,
+                       const Vec4f& i_corner11,
+                       const Vec2f& i_weight ) {
+        return BilinearInterpolation( i_corner00, i_corner10, i_corner01, i_corner11, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke5 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4f > arg0;
+        DispatchArg< Vec4f > arg1;
+        DispatchArg< Vec4f > arg2;
+        DispatchArg< Vec4f > arg3;
+        DispatchArg< Vec2f > arg4;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) || !arg4.Load( i_args[ 4 ] ) )
+        {
+            return false;
+        }
+        *o_result =
+            DispatchResult( BilinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get(), arg4.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch5 = []( const BatchArg< Vec4f >& i_corner00,
+                      const BatchArg< Vec4f >& i_corner10,
+                      const BatchArg< Vec4f >& i_corner01,
+                      const BatchArg< Vec4f >& i_corner11,
+                      const BatchArg< Vec2f >& i_weight ) {
+        size_t size     = ResolveBatchSize( {&i_corner00, &i_corner10, &i_corner01, &i_corner11, &i_weight} );
+        auto   result   = AllocateBatchResult< Vec4f >( size );
+        Vec4f* o_result = BatchResultData< Vec4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_corner00 ),
+                                                  gm_kernels::MakeKernelArg( i_corner10 ),
+                                                  gm_kernels::MakeKernelArg( i_corner01 ),
+                                                  gm_kernels::MakeKernelArg( i_corner11 ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet().BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4f, Vec4f, Vec4f, Vec4f, Vec2f >( invoke5 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single5,
+                                    pybind11::name( "BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch5,
+                                            pybind11::name( "BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // BilinearInterpolation, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< float, float, float, float, Vec2f >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "BilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Mat3f, Mat3f, Mat3f, Mat3f, Vec2f >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "BilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Mat4f, Mat4f, Mat4f, Mat4f, Vec2f >( invoke2 );
+    overloads = pybind11::cpp_function( single2,
+                                        pybind11::name( "BilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2f, Vec2f, Vec2f, Vec2f, Vec2f >( invoke3 );
+    overloads = pybind11::cpp_function( single3,
+                                        pybind11::name( "BilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3f, Vec3f, Vec3f, Vec3f, Vec2f >( invoke4 );
+    overloads = pybind11::cpp_function( single4,
+                                        pybind11::name( "BilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4f, Vec4f, Vec4f, Vec4f, Vec2f >( invoke5 );
+    overloads = pybind11::cpp_function( single5,
+                                        pybind11::name( "BilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "BilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "BilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch2,
+                                        pybind11::name( "BilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch3,
+                                        pybind11::name( "BilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch4,
+                                        pybind11::name( "BilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch5,
+                                        pybind11::name( "BilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "BilinearInterpolation", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
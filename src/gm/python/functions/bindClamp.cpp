@@ -6,26 +6,512 @@
 
 #include <gm/functions/clamp.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for Clamp.
 
 GM_NS_USING
 
 void BindClamp( pybind11::module& o_module )
 {
-    o_module.def( "Clamp",
-                  []( const float& i_value, const FloatRange& i_range ) { return Clamp( i_value, i_range ); } );
-    o_module.def( "Clamp", []( const int& i_value, const IntRange& i_range ) { return Clamp( i_value, i_range ); } );
-    o_module.def( "Clamp",
-                  []( const Vec2f& i_value, const FloatRange& i_range ) { return Clamp( i_value, i_range ); } );
-    o_module.def( "Clamp",
-                  []( const Vec3f& i_value, const FloatRange& i_range ) { return Clamp( i_value, i_range ); } );
-    o_module.def( "Clamp",
-                  []( const Vec4f& i_value, const FloatRange& i_range ) { return Clamp( i_value, i_range ); } );
-    o_module.def( "Clamp", []( const Vec2i& i_value, const IntRange& i_range ) { return Clamp( i_value, i_range ); } );
-    o_module.def( "Clamp", []( const Vec3i& i_value, const IntRange& i_range ) { return Clamp( i_value, i_range ); } );
-    o_module.def( "Clamp", []( const Vec4i& i_value, const IntRange& i_range ) { return Clamp( i_value, i_range ); } );
-    o_module.def( "Clamp",
-                  []( const Mat3f& i_value, const FloatRange& i_range ) { return Clamp( i_value, i_range ); } );
-    o_module.def( "Clamp",
-                  []( const Mat4f& i_value, const FloatRange& i_range ) { return Clamp( i_value, i_range ); } );
+    // Clamp_float_FloatRange.
+    auto single0 = []( const float& i_value, const FloatRange& i_range ) { return Clamp( i_value, i_range ); };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< float >      arg0;
+        DispatchArg< FloatRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Clamp( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< float >& i_value, const BatchArg< FloatRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_value, &i_range} );
+        auto   result   = AllocateBatchResult< float >( size );
+        float* o_result = BatchResultData< float >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Clamp_float_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< float, FloatRange >( invoke0 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single0, pybind11::name( "Clamp_float_FloatRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch0,
+                                            pybind11::name( "Clamp_float_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Clamp_float_FloatRange", std::move( dispatcher ), overloads );
+    }
+
+    // Clamp_int_IntRange.
+    auto single1 = []( const int& i_value, const IntRange& i_range ) { return Clamp( i_value, i_range ); };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< int >      arg0;
+        DispatchArg< IntRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Clamp( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< int >& i_value, const BatchArg< IntRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_value, &i_range} );
+        auto   result   = AllocateBatchResult< int >( size );
+        int*   o_result = BatchResultData< int >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Clamp_int_IntRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< int, IntRange >( invoke1 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single1, pybind11::name( "Clamp_int_IntRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch1,
+                                            pybind11::name( "Clamp_int_IntRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Clamp_int_IntRange", std::move( dispatcher ), overloads );
+    }
+
+    // Clamp_Vec2f_FloatRange.
+    auto single2 = []( const Vec2f& i_value, const FloatRange& i_range ) { return Clamp( i_value, i_range ); };
+    OverloadDispatcher::Invoker invoke2 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2f >      arg0;
+        DispatchArg< FloatRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Clamp( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch2 = []( const BatchArg< Vec2f >& i_value, const BatchArg< FloatRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_value, &i_range} );
+        auto   result   = AllocateBatchResult< Vec2f >( size );
+        Vec2f* o_result = BatchResultData< Vec2f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Clamp_Vec2f_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2f, FloatRange >( invoke2 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single2, pybind11::name( "Clamp_Vec2f_FloatRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch2,
+                                            pybind11::name( "Clamp_Vec2f_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Clamp_Vec2f_FloatRange", std::move( dispatcher ), overloads );
+    }
+
+    // Clamp_Vec3f_FloatRange.
+    auto single3 = []( const Vec3f& i_value, const FloatRange& i_range ) { return Clamp( i_value, i_range ); };
+    OverloadDispatcher::Invoker invoke3 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f >      arg0;
+        DispatchArg< FloatRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Clamp( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch3 = []( const BatchArg< Vec3f >& i_value, const BatchArg< FloatRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_value, &i_range} );
+        auto   result   = AllocateBatchResult< Vec3f >( size );
+        Vec3f* o_result = BatchResultData< Vec3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Clamp_Vec3f_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f, FloatRange >( invoke3 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single3, pybind11::name( "Clamp_Vec3f_FloatRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch3,
+                                            pybind11::name( "Clamp_Vec3f_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Clamp_Vec3f_FloatRange", std::move( dispatcher ), overloads );
+    }
+
+    // Clamp_Vec4f_FloatRange.
+    auto single4 = []( const Vec4f& i_value, const FloatRange& i_range ) { return Clamp( i_value, i_range ); };
+    OverloadDispatcher::Invoker invoke4 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4f >      arg0;
+        DispatchArg< FloatRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Clamp( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch4 = []( const BatchArg< Vec4f >& i_value, const BatchArg< FloatRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_value, &i_range} );
+        auto   result   = AllocateBatchResult< Vec4f >( size );
+        Vec4f* o_result = BatchResultData< Vec4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Clamp_Vec4f_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4f, FloatRange >( invoke4 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single4, pybind11::name( "Clamp_Vec4f_FloatRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch4,
+                                            pybind11::name( "Clamp_Vec4f_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Clamp_Vec4f_FloatRange", std::move( dispatcher ), overloads );
+    }
+
+    // Clamp_Vec2i_IntRange.
+    auto single5 = []( const Vec2i& i_value, const IntRange& i_range ) { return Clamp( i_value, i_range ); };
+    OverloadDispatcher::Invoker invoke5 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2i >    arg0;
+        DispatchArg< IntRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Clamp( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch5 = []( const BatchArg< Vec2i >& i_value, const BatchArg< IntRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_value, &i_range} );
+        auto   result   = AllocateBatchResult< Vec2i >( size );
+        Vec2i* o_result = BatchResultData< Vec2i >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Clamp_Vec2i_IntRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2i, IntRange >( invoke5 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single5, pybind11::name( "Clamp_Vec2i_IntRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch5,
+                                            pybind11::name( "Clamp_Vec2i_IntRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Clamp_Vec2i_IntRange", std::move( dispatcher ), overloads );
+    }
+
+    // Clamp_Vec3i_IntRange.
+    auto single6 = []( const Vec3i& i_value, const IntRange& i_range ) { return Clamp( i_value, i_range ); };
+    OverloadDispatcher::Invoker invoke6 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3i >    arg0;
+        DispatchArg< IntRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Clamp( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch6 = []( const BatchArg< Vec3i >& i_value, const BatchArg< IntRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_value, &i_range} );
+        auto   result   = AllocateBatchResult< Vec3i >( size );
+        Vec3i* o_result = BatchResultData< Vec3i >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Clamp_Vec3i_IntRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3i, IntRange >( invoke6 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single6, pybind11::name( "Clamp_Vec3i_IntRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch6,
+                                            pybind11::name( "Clamp_Vec3i_IntRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Clamp_Vec3i_IntRange", std::move( dispatcher ), overloads );
+    }
+
+    // Clamp_Vec4i_IntRange.
+    auto single7 = []( const Vec4i& i_value, const IntRange& i_range ) { return Clamp( i_value, i_range ); };
+    OverloadDispatcher::Invoker invoke7 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4i >    arg0;
+        DispatchArg< IntRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Clamp( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch7 = []( const BatchArg< Vec4i >& i_value, const BatchArg< IntRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_value, &i_range} );
+        auto   result   = AllocateBatchResult< Vec4i >( size );
+        Vec4i* o_result = BatchResultData< Vec4i >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Clamp_Vec4i_IntRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4i, IntRange >( invoke7 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single7, pybind11::name( "Clamp_Vec4i_IntRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch7,
+                                            pybind11::name( "Clamp_Vec4i_IntRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Clamp_Vec4i_IntRange", std::move( dispatcher ), overloads );
+    }
+
+    // Clamp_Mat3f_FloatRange.
+    auto single8 = []( const Mat3f& i_value, const FloatRange& i_range ) { return Clamp( i_value, i_range ); };
+    OverloadDispatcher::Invoker invoke8 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat3f >      arg0;
+        DispatchArg< FloatRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Clamp( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch8 = []( const BatchArg< Mat3f >& i_value, const BatchArg< FloatRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_value, &i_range} );
+        auto   result   = AllocateBatchResult< Mat3f >( size );
+        Mat3f* o_result = BatchResultData< Mat3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Clamp_Mat3f_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat3f, FloatRange >( invoke8 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single8, pybind11::name( "Clamp_Mat3f_FloatRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch8,
+                                            pybind11::name( "Clamp_Mat3f_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Clamp_Mat3f_FloatRange", std::move( dispatcher ), overloads );
+    }
+
+    // Clamp_Mat4f_FloatRange.
+    auto single9 = []( const Mat4f& i_value, const FloatRange& i_range ) { return Clamp( i_value, i_range ); };
+    OverloadDispatcher::Invoker invoke9 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat4f >      arg0;
+        DispatchArg< FloatRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Clamp( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch9 = []( const BatchArg< Mat4f >& i_value, const BatchArg< FloatRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_value, &i_range} );
+        auto   result   = AllocateBatchResult< Mat4f >( size );
+        Mat4f* o_result = BatchResultData< Mat4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_value ),
+                                                  gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Clamp_Mat4f_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat4f, FloatRange >( invoke9 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single9, pybind11::name( "Clamp_Mat4f_FloatRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch9,
+                                            pybind11::name( "Clamp_Mat4f_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Clamp_Mat4f_FloatRange", std::move( dispatcher ), overloads );
+    }
+
+    // Clamp, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< float, FloatRange >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< int, IntRange >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2f, FloatRange >( invoke2 );
+    overloads = pybind11::cpp_function( single2,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3f, FloatRange >( invoke3 );
+    overloads = pybind11::cpp_function( single3,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4f, FloatRange >( invoke4 );
+    overloads = pybind11::cpp_function( single4,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2i, IntRange >( invoke5 );
+    overloads = pybind11::cpp_function( single5,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3i, IntRange >( invoke6 );
+    overloads = pybind11::cpp_function( single6,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4i, IntRange >( invoke7 );
+    overloads = pybind11::cpp_function( single7,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Mat3f, FloatRange >( invoke8 );
+    overloads = pybind11::cpp_function( single8,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Mat4f, FloatRange >( invoke9 );
+    overloads = pybind11::cpp_function( single9,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch2,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch3,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch4,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch5,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch6,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch7,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch8,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch9,
+                                        pybind11::name( "Clamp" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "Clamp", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
@@ -6,58 +6,853 @@
 
 #include <gm/functions/contains.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for Contains.
 
 GM_NS_USING
 
 void BindContains( pybind11::module& o_module )
 {
-    o_module.def( "Contains", []( const FloatRange& i_container, const float& i_containee ) {
+    // Contains_FloatRange_float.
+    auto single0 = []( const FloatRange& i_container, const float& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
-    o_module.def( "Contains", []( const FloatRange& i_container, const FloatRange& i_containee ) {
+    };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< FloatRange > arg0;
+        DispatchArg< float >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< FloatRange >& i_container, const BatchArg< float >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_FloatRange_float;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< FloatRange, float >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "Contains_FloatRange_float" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "Contains_FloatRange_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_FloatRange_float", std::move( dispatcher ), overloads );
+    }
+
+    // Contains_FloatRange_FloatRange.
+    auto single1 = []( const FloatRange& i_container, const FloatRange& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
-    o_module.def( "Contains", []( const IntRange& i_container, const int& i_containee ) {
+    };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< FloatRange > arg0;
+        DispatchArg< FloatRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< FloatRange >& i_container, const BatchArg< FloatRange >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_FloatRange_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< FloatRange, FloatRange >( invoke1 );
+        pybind11::object overloads = pybind11::cpp_function( single1,
+                                                             pybind11::name( "Contains_FloatRange_FloatRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch1,
+                                            pybind11::name( "Contains_FloatRange_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_FloatRange_FloatRange", std::move( dispatcher ), overloads );
+    }
+
+    // Contains_IntRange_int.
+    auto single2 = []( const IntRange& i_container, const int& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
-    o_module.def( "Contains", []( const IntRange& i_container, const IntRange& i_containee ) {
+    };
+    OverloadDispatcher::Invoker invoke2 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< IntRange > arg0;
+        DispatchArg< int >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch2 = []( const BatchArg< IntRange >& i_container, const BatchArg< int >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_IntRange_int;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< IntRange, int >( invoke2 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single2, pybind11::name( "Contains_IntRange_int" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch2,
+                                            pybind11::name( "Contains_IntRange_int" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_IntRange_int", std::move( dispatcher ), overloads );
+    }
+
+    // Contains_IntRange_IntRange.
+    auto single3 = []( const IntRange& i_container, const IntRange& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
-    o_module.def( "Contains", []( const Vec2fRange& i_container, const Vec2f& i_containee ) {
+    };
+    OverloadDispatcher::Invoker invoke3 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< IntRange > arg0;
+        DispatchArg< IntRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch3 = []( const BatchArg< IntRange >& i_container, const BatchArg< IntRange >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_IntRange_IntRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< IntRange, IntRange >( invoke3 );
+        pybind11::object overloads = pybind11::cpp_function( single3,
+                                                             pybind11::name( "Contains_IntRange_IntRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch3,
+                                            pybind11::name( "Contains_IntRange_IntRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_IntRange_IntRange", std::move( dispatcher ), overloads );
+    }
+
+    // Contains_Vec2fRange_Vec2f.
+    auto single4 = []( const Vec2fRange& i_container, const Vec2f& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
-    o_module.def( "Contains", []( const Vec2fRange& i_container, const Vec2fRange& i_containee ) {
+    };
+    OverloadDispatcher::Invoker invoke4 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2fRange > arg0;
+        DispatchArg< Vec2f >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch4 = []( const BatchArg< Vec2fRange >& i_container, const BatchArg< Vec2f >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_Vec2fRange_Vec2f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2fRange, Vec2f >( invoke4 );
+        pybind11::object overloads = pybind11::cpp_function( single4,
+                                                             pybind11::name( "Contains_Vec2fRange_Vec2f" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch4,
+                                            pybind11::name( "Contains_Vec2fRange_Vec2f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_Vec2fRange_Vec2f", std::move( dispatcher ), overloads );
+    }
+
+    // Contains_Vec2fRange_Vec2fRange.
+    auto single5 = []( const Vec2fRange& i_container, const Vec2fRange& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
-    o_module.def( "Contains", []( const Vec3fRange& i_container, const Vec3f& i_containee ) {
+    };
+    OverloadDispatcher::Invoker invoke5 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2fRange > arg0;
+        DispatchArg< Vec2fRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch5 = []( const BatchArg< Vec2fRange >& i_container, const BatchArg< Vec2fRange >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_Vec2fRange_Vec2fRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2fRange, Vec2fRange >( invoke5 );
+        pybind11::object overloads = pybind11::cpp_function( single5,
+                                                             pybind11::name( "Contains_Vec2fRange_Vec2fRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch5,
+                                            pybind11::name( "Contains_Vec2fRange_Vec2fRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_Vec2fRange_Vec2fRange", std::move( dispatcher ), overloads );
+    }
+
+    // Contains_Vec3fRange_Vec3f.
+    auto single6 = []( const Vec3fRange& i_container, const Vec3f& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
-    o_module.def( "Contains", []( const Vec3fRange& i_container, const Vec3fRange& i_containee ) {
+    };
+    OverloadDispatcher::Invoker invoke6 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3fRange > arg0;
+        DispatchArg< Vec3f >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch6 = []( const BatchArg< Vec3fRange >& i_container, const BatchArg< Vec3f >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_Vec3fRange_Vec3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3fRange, Vec3f >( invoke6 );
+        pybind11::object overloads = pybind11::cpp_function( single6,
+                                                             pybind11::name( "Contains_Vec3fRange_Vec3f" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch6,
+                                            pybind11::name( "Contains_Vec3fRange_Vec3f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_Vec3fRange_Vec3f", std::move( dispatcher ), overloads );
+    }
+
+    // Contains_Vec3fRange_Vec3fRange.
+    auto single7 = []( const Vec3fRange& i_container, const Vec3fRange& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
-    o_module.def( "Contains", []( const Vec4fRange& i_container, const Vec4f& i_containee ) {
+    };
+    OverloadDispatcher::Invoker invoke7 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3fRange > arg0;
+        DispatchArg< Vec3fRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch7 = []( const BatchArg< Vec3fRange >& i_container, const BatchArg< Vec3fRange >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_Vec3fRange_Vec3fRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3fRange, Vec3fRange >( invoke7 );
+        pybind11::object overloads = pybind11::cpp_function( single7,
+                                                             pybind11::name( "Contains_Vec3fRange_Vec3fRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch7,
+                                            pybind11::name( "Contains_Vec3fRange_Vec3fRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_Vec3fRange_Vec3fRange", std::move( dispatcher ), overloads );
+    }
+
+    // Contains_Vec4fRange_Vec4f.
+    auto single8 = []( const Vec4fRange& i_container, const Vec4f& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
-    o_module.def( "Contains", []( const Vec4fRange& i_container, const Vec4fRange& i_containee ) {
+    };
+    OverloadDispatcher::Invoker invoke8 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4fRange > arg0;
+        DispatchArg< Vec4f >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch8 = []( const BatchArg< Vec4fRange >& i_container, const BatchArg< Vec4f >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_Vec4fRange_Vec4f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4fRange, Vec4f >( invoke8 );
+        pybind11::object overloads = pybind11::cpp_function( single8,
+                                                             pybind11::name( "Contains_Vec4fRange_Vec4f" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch8,
+                                            pybind11::name( "Contains_Vec4fRange_Vec4f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_Vec4fRange_Vec4f", std::move( dispatcher ), overloads );
+    }
+
+    // Contains_Vec4fRange_Vec4fRange.
+    auto single9 = []( const Vec4fRange& i_container, const Vec4fRange& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
-    o_module.def( "Contains", []( const Vec2iRange& i_container, const Vec2i& i_containee ) {
+    };
+    OverloadDispatcher::Invoker invoke9 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4fRange > arg0;
+        DispatchArg< Vec4fRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch9 = []( const BatchArg< Vec4fRange >& i_container, const BatchArg< Vec4fRange >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_Vec4fRange_Vec4fRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4fRange, Vec4fRange >( invoke9 );
+        pybind11::object overloads = pybind11::cpp_function( single9,
+                                                             pybind11::name( "Contains_Vec4fRange_Vec4fRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch9,
+                                            pybind11::name( "Contains_Vec4fRange_Vec4fRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_Vec4fRange_Vec4fRange", std::move( dispatcher ), overloads );
+    }
+
+    // Contains_Vec2iRange_Vec2i.
+    auto single10 = []( const Vec2iRange& i_container, const Vec2i& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
-    o_module.def( "Contains", []( const Vec2iRange& i_container, const Vec2iRange& i_containee ) {
+    };
+    OverloadDispatcher::Invoker invoke10 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2iRange > arg0;
+        DispatchArg< Vec2i >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch10 = []( const BatchArg< Vec2iRange >& i_container, const BatchArg< Vec2i >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_Vec2iRange_Vec2i;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2iRange, Vec2i >( invoke10 );
+        pybind11::object overloads = pybind11::cpp_function( single10,
+                                                             pybind11::name( "Contains_Vec2iRange_Vec2i" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch10,
+                                            pybind11::name( "Contains_Vec2iRange_Vec2i" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_Vec2iRange_Vec2i", std::move( dispatcher ), overloads );
+    }
+
+    // Contains_Vec2iRange_Vec2iRange.
+    auto single11 = []( const Vec2iRange& i_container, const Vec2iRange& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
-    o_module.def( "Contains", []( const Vec3iRange& i_container, const Vec3i& i_containee ) {
+    };
+    OverloadDispatcher::Invoker invoke11 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2iRange > arg0;
+        DispatchArg< Vec2iRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch11 = []( const BatchArg< Vec2iRange >& i_container, const BatchArg< Vec2iRange >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_Vec2iRange_Vec2iRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2iRange, Vec2iRange >( invoke11 );
+        pybind11::object overloads = pybind11::cpp_function( single11,
+                                                             pybind11::name( "Contains_Vec2iRange_Vec2iRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch11,
+                                            pybind11::name( "Contains_Vec2iRange_Vec2iRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_Vec2iRange_Vec2iRange", std::move( dispatcher ), overloads );
+    }
+
+    // Contains_Vec3iRange_Vec3i.
+    auto single12 = []( const Vec3iRange& i_container, const Vec3i& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
-    o_module.def( "Contains", []( const Vec3iRange& i_container, const Vec3iRange& i_containee ) {
+    };
+    OverloadDispatcher::Invoker invoke12 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3iRange > arg0;
+        DispatchArg< Vec3i >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch12 = []( const BatchArg< Vec3iRange >& i_container, const BatchArg< Vec3i >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_Vec3iRange_Vec3i;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3iRange, Vec3i >( invoke12 );
+        pybind11::object overloads = pybind11::cpp_function( single12,
+                                                             pybind11::name( "Contains_Vec3iRange_Vec3i" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch12,
+                                            pybind11::name( "Contains_Vec3iRange_Vec3i" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_Vec3iRange_Vec3i", std::move( dispatcher ), overloads );
+    }
+
+    // Contains_Vec3iRange_Vec3iRange.
+    auto single13 = []( const Vec3iRange& i_container, const Vec3iRange& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
-    o_module.def( "Contains", []( const Vec4iRange& i_container, const Vec4i& i_containee ) {
+    };
+    OverloadDispatcher::Invoker invoke13 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3iRange > arg0;
+        DispatchArg< Vec3iRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch13 = []( const BatchArg< Vec3iRange >& i_container, const BatchArg< Vec3iRange >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_Vec3iRange_Vec3iRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3iRange, Vec3iRange >( invoke13 );
+        pybind11::object overloads = pybind11::cpp_function( single13,
+                                                             pybind11::name( "Contains_Vec3iRange_Vec3iRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch13,
+                                            pybind11::name( "Contains_Vec3iRange_Vec3iRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_Vec3iRange_Vec3iRange", std::move( dispatcher ), overloads );
+    }
+
+    // Contains_Vec4iRange_Vec4i.
+    auto single14 = []( const Vec4iRange& i_container, const Vec4i& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
-    o_module.def( "Contains", []( const Vec4iRange& i_container, const Vec4iRange& i_containee ) {
+    };
+    OverloadDispatcher::Invoker invoke14 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4iRange > arg0;
+        DispatchArg< Vec4i >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch14 = []( const BatchArg< Vec4iRange >& i_container, const BatchArg< Vec4i >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_Vec4iRange_Vec4i;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4iRange, Vec4i >( invoke14 );
+        pybind11::object overloads = pybind11::cpp_function( single14,
+                                                             pybind11::name( "Contains_Vec4iRange_Vec4i" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch14,
+                                            pybind11::name( "Contains_Vec4iRange_Vec4i" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_Vec4iRange_Vec4i", std::move( dispatcher ), overloads );
+    }
+
+    // Contains_Vec4iRange_Vec4iRange.
+    auto single15 = []( const Vec4iRange& i_container, const Vec4iRange& i_containee ) {
         return Contains( i_container, i_containee );
-    } );
+    };
+    OverloadDispatcher::Invoker invoke15 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4iRange > arg0;
+        DispatchArg< Vec4iRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Contains( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch15 = []( const BatchArg< Vec4iRange >& i_container, const BatchArg< Vec4iRange >& i_containee ) {
+        size_t size     = ResolveBatchSize( {&i_container, &i_containee} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_container ),
+                                                  gm_kernels::MakeKernelArg( i_containee ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Contains_Vec4iRange_Vec4iRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4iRange, Vec4iRange >( invoke15 );
+        pybind11::object overloads = pybind11::cpp_function( single15,
+                                                             pybind11::name( "Contains_Vec4iRange_Vec4iRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch15,
+                                            pybind11::name( "Contains_Vec4iRange_Vec4iRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Contains_Vec4iRange_Vec4iRange", std::move( dispatcher ), overloads );
+    }
+
+    // Contains, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< FloatRange, float >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< FloatRange, FloatRange >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< IntRange, int >( invoke2 );
+    overloads = pybind11::cpp_function( single2,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< IntRange, IntRange >( invoke3 );
+    overloads = pybind11::cpp_function( single3,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2fRange, Vec2f >( invoke4 );
+    overloads = pybind11::cpp_function( single4,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2fRange, Vec2fRange >( invoke5 );
+    overloads = pybind11::cpp_function( single5,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3fRange, Vec3f >( invoke6 );
+    overloads = pybind11::cpp_function( single6,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3fRange, Vec3fRange >( invoke7 );
+    overloads = pybind11::cpp_function( single7,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4fRange, Vec4f >( invoke8 );
+    overloads = pybind11::cpp_function( single8,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4fRange, Vec4fRange >( invoke9 );
+    overloads = pybind11::cpp_function( single9,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2iRange, Vec2i >( invoke10 );
+    overloads = pybind11::cpp_function( single10,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2iRange, Vec2iRange >( invoke11 );
+    overloads = pybind11::cpp_function( single11,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3iRange, Vec3i >( invoke12 );
+    overloads = pybind11::cpp_function( single12,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3iRange, Vec3iRange >( invoke13 );
+    overloads = pybind11::cpp_function( single13,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4iRange, Vec4i >( invoke14 );
+    overloads = pybind11::cpp_function( single14,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4iRange, Vec4iRange >( invoke15 );
+    overloads = pybind11::cpp_function( single15,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch2,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch3,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch4,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch5,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch6,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch7,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch8,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch9,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch10,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch11,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch12,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch13,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch14,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch15,
+                                        pybind11::name( "Contains" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "Contains", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
@@ -6,13 +6,80 @@
 
 #include <gm/functions/coordinateSystem.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for CoordinateSystem.
 
 GM_NS_USING
 
 void BindCoordinateSystem( pybind11::module& o_module )
 {
-    o_module.def( "CoordinateSystem", []( const Vec3f& i_vectorA, Vec3f& o_vectorB, Vec3f& o_vectorC ) {
+    // CoordinateSystem_Vec3f_Vec3f_Vec3f.
+    auto single0 = []( const Vec3f& i_vectorA, Vec3f& o_vectorB, Vec3f& o_vectorC ) {
         CoordinateSystem( i_vectorA, o_vectorB, o_vectorC );
-    } );
+    };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f > arg0;
+        DispatchArg< Vec3f > arg1;
+        DispatchArg< Vec3f > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        CoordinateSystem( arg0.Get(), arg1.Get(), arg2.Get() );
+        Py_INCREF( Py_None );
+        *o_result = Py_None;
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< Vec3f >&        i_vectorA,
+                      const MutableBatchArg< Vec3f >& o_vectorB,
+                      const MutableBatchArg< Vec3f >& o_vectorC ) {
+        size_t size = ResolveBatchSize( {&i_vectorA, &o_vectorB, &o_vectorC} );
+
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_vectorA ),
+                                                  gm_kernels::MakeKernelArg( o_vectorB ),
+                                                  gm_kernels::MakeKernelArg( o_vectorC )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().CoordinateSystem_Vec3f_Vec3f_Vec3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f, Vec3f, Vec3f >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "CoordinateSystem_Vec3f_Vec3f_Vec3f" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "CoordinateSystem_Vec3f_Vec3f_Vec3f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "CoordinateSystem_Vec3f_Vec3f_Vec3f",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // CoordinateSystem, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< Vec3f, Vec3f, Vec3f >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "CoordinateSystem" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "CoordinateSystem" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "CoordinateSystem", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
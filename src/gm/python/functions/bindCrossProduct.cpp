@@ -6,12 +6,72 @@
 
 #include <gm/functions/crossProduct.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for CrossProduct.
 
 GM_NS_USING
 
 void BindCrossProduct( pybind11::module& o_module )
 {
-    o_module.def( "CrossProduct",
-                  []( const Vec3f& i_lhs, const Vec3f& i_rhs ) { return CrossProduct( i_lhs, i_rhs ); } );
+    // CrossProduct_Vec3f_Vec3f.
+    auto single0 = []( const Vec3f& i_lhs, const Vec3f& i_rhs ) { return CrossProduct( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f > arg0;
+        DispatchArg< Vec3f > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( CrossProduct( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< Vec3f >& i_lhs, const BatchArg< Vec3f >& i_rhs ) {
+        size_t size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto   result   = AllocateBatchResult< Vec3f >( size );
+        Vec3f* o_result = BatchResultData< Vec3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().CrossProduct_Vec3f_Vec3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f, Vec3f >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "CrossProduct_Vec3f_Vec3f" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "CrossProduct_Vec3f_Vec3f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "CrossProduct_Vec3f_Vec3f", std::move( dispatcher ), overloads );
+    }
+
+    // CrossProduct, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< Vec3f, Vec3f >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "CrossProduct" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "CrossProduct" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "CrossProduct", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
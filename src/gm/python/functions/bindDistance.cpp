@@ -6,14 +6,120 @@
 
 #include <gm/functions/distance.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for Distance.
 
 GM_NS_USING
 
 void BindDistance( pybind11::module& o_module )
 {
-    o_module.def( "Distance",
-                  []( const Vec2f& i_pointA, const Vec2f& i_pointB ) { return Distance( i_pointA, i_pointB ); } );
-    o_module.def( "Distance",
-                  []( const Vec3f& i_pointA, const Vec3f& i_pointB ) { return Distance( i_pointA, i_pointB ); } );
+    // Distance_Vec2f_Vec2f.
+    auto single0 = []( const Vec2f& i_pointA, const Vec2f& i_pointB ) { return Distance( i_pointA, i_pointB ); };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2f > arg0;
+        DispatchArg< Vec2f > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Distance( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< Vec2f >& i_pointA, const BatchArg< Vec2f >& i_pointB ) {
+        size_t size     = ResolveBatchSize( {&i_pointA, &i_pointB} );
+        auto   result   = AllocateBatchResult< float >( size );
+        float* o_result = BatchResultData< float >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_pointA ),
+                                                  gm_kernels::MakeKernelArg( i_pointB ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Distance_Vec2f_Vec2f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2f, Vec2f >( invoke0 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single0, pybind11::name( "Distance_Vec2f_Vec2f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch0,
+                                            pybind11::name( "Distance_Vec2f_Vec2f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Distance_Vec2f_Vec2f", std::move( dispatcher ), overloads );
+    }
+
+    // Distance_Vec3f_Vec3f.
+    auto single1 = []( const Vec3f& i_pointA, const Vec3f& i_pointB ) { return Distance( i_pointA, i_pointB ); };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f > arg0;
+        DispatchArg< Vec3f > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Distance( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< Vec3f >& i_pointA, const BatchArg< Vec3f >& i_pointB ) {
+        size_t size     = ResolveBatchSize( {&i_pointA, &i_pointB} );
+        auto   result   = AllocateBatchResult< float >( size );
+        float* o_result = BatchResultData< float >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_pointA ),
+                                                  gm_kernels::MakeKernelArg( i_pointB ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Distance_Vec3f_Vec3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f, Vec3f >( invoke1 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single1, pybind11::name( "Distance_Vec3f_Vec3f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch1,
+                                            pybind11::name( "Distance_Vec3f_Vec3f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Distance_Vec3f_Vec3f", std::move( dispatcher ), overloads );
+    }
+
+    // Distance, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< Vec2f, Vec2f >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "Distance" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3f, Vec3f >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "Distance" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "Distance" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "Distance" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "Distance", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
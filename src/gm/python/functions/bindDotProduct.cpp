@@ -6,13 +6,218 @@
 
 #include <gm/functions/dotProduct.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for DotProduct.
 
 GM_NS_USING
 
 void BindDotProduct( pybind11::module& o_module )
 {
-    o_module.def( "DotProduct", []( const Vec2f& i_lhs, const Vec2f& i_rhs ) { return DotProduct( i_lhs, i_rhs ); } );
-    o_module.def( "DotProduct", []( const Vec3f& i_lhs, const Vec3f& i_rhs ) { return DotProduct( i_lhs, i_rhs ); } );
-    o_module.def( "DotProduct", []( const Vec4f& i_lhs, const Vec4f& i_rhs ) { return DotProduct( i_lhs, i_rhs ); } );
+    // DotProduct_Vec2f_Vec2f.
+    auto single0 = []( const Vec2f& i_lhs, const Vec2f& i_rhs ) { return DotProduct( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2f > arg0;
+        DispatchArg< Vec2f > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( DotProduct( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< Vec2f >& i_lhs, const BatchArg< Vec2f >& i_rhs ) {
+        size_t size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto   result   = AllocateBatchResult< float >( size );
+        float* o_result = BatchResultData< float >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().DotProduct_Vec2f_Vec2f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2f, Vec2f >( invoke0 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single0, pybind11::name( "DotProduct_Vec2f_Vec2f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch0,
+                                            pybind11::name( "DotProduct_Vec2f_Vec2f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "DotProduct_Vec2f_Vec2f", std::move( dispatcher ), overloads );
+    }
+
+    // DotProduct_Vec3f_Vec3f.
+    auto single1 = []( const Vec3f& i_lhs, const Vec3f& i_rhs ) { return DotProduct( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f > arg0;
+        DispatchArg< Vec3f > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( DotProduct( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< Vec3f >& i_lhs, const BatchArg< Vec3f >& i_rhs ) {
+        size_t size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto   result   = AllocateBatchResult< float >( size );
+        float* o_result = BatchResultData< float >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().DotProduct_Vec3f_Vec3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f, Vec3f >( invoke1 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single1, pybind11::name( "DotProduct_Vec3f_Vec3f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch1,
+                                            pybind11::name( "DotProduct_Vec3f_Vec3f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "DotProduct_Vec3f_Vec3f", std::move( dispatcher ), overloads );
+    }
+
+    // DotProduct_Vec4f_Vec4f.
+    auto single2 = []( const Vec4f& i_lhs, const Vec4f& i_rhs ) { return DotProduct( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke2 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4f > arg0;
+        DispatchArg< Vec4f > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( DotProduct( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch2 = []( const BatchArg< Vec4f >& i_lhs, const BatchArg< Vec4f >& i_rhs ) {
+        size_t size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto   result   = AllocateBatchResult< float >( size );
+        float* o_result = BatchResultData< float >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().DotProduct_Vec4f_Vec4f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4f, Vec4f >( invoke2 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single2, pybind11::name( "DotProduct_Vec4f_Vec4f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch2,
+                                            pybind11::name( "DotProduct_Vec4f_Vec4f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "DotProduct_Vec4f_Vec4f", std::move( dispatcher ), overloads );
+    }
+
+    // DotProduct_Quatf_Quatf.
+    auto single3 = []( const Quatf& i_lhs, const Quatf& i_rhs ) { return DotProduct( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke3 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Quatf > arg0;
+        DispatchArg< Quatf > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( DotProduct( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch3 = []( const BatchArg< Quatf >& i_lhs, const BatchArg< Quatf >& i_rhs ) {
+        size_t size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto   result   = AllocateBatchResult< float >( size );
+        float* o_result = BatchResultData< float >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().DotProduct_Quatf_Quatf;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Quatf, Quatf >( invoke3 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single3, pybind11::name( "DotProduct_Quatf_Quatf" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch3,
+                                            pybind11::name( "DotProduct_Quatf_Quatf" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "DotProduct_Quatf_Quatf", std::move( dispatcher ), overloads );
+    }
+
+    // DotProduct, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< Vec2f, Vec2f >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "DotProduct" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3f, Vec3f >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "DotProduct" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4f, Vec4f >( invoke2 );
+    overloads = pybind11::cpp_function( single2,
+                                        pybind11::name( "DotProduct" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Quatf, Quatf >( invoke3 );
+    overloads = pybind11::cpp_function( single3,
+                                        pybind11::name( "DotProduct" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "DotProduct" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "DotProduct" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch2,
+                                        pybind11::name( "DotProduct" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch3,
+                                        pybind11::name( "DotProduct" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "DotProduct", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
@@ -6,26 +6,817 @@
 
 #include <gm/functions/expand.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for Expand.
 
 GM_NS_USING
 
 void BindExpand( pybind11::module& o_module )
 {
-    o_module.def( "Expand", []( const FloatRange& i_lhs, const FloatRange& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
-    o_module.def( "Expand", []( const FloatRange& i_lhs, const float& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
-    o_module.def( "Expand", []( const IntRange& i_lhs, const IntRange& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
-    o_module.def( "Expand", []( const IntRange& i_lhs, const int& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
-    o_module.def( "Expand", []( const Vec2fRange& i_lhs, const Vec2fRange& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
-    o_module.def( "Expand", []( const Vec2fRange& i_lhs, const Vec2f& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
-    o_module.def( "Expand", []( const Vec3fRange& i_lhs, const Vec3fRange& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
-    o_module.def( "Expand", []( const Vec3fRange& i_lhs, const Vec3f& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
-    o_module.def( "Expand", []( const Vec4fRange& i_lhs, const Vec4fRange& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
-    o_module.def( "Expand", []( const Vec4fRange& i_lhs, const Vec4f& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
-    o_module.def( "Expand", []( const Vec2iRange& i_lhs, const Vec2iRange& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
-    o_module.def( "Expand", []( const Vec2iRange& i_lhs, const Vec2i& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
-    o_module.def( "Expand", []( const Vec3iRange& i_lhs, const Vec3iRange& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
-    o_module.def( "Expand", []( const Vec3iRange& i_lhs, const Vec3i& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
-    o_module.def( "Expand", []( const Vec4iRange& i_lhs, const Vec4iRange& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
-    o_module.def( "Expand", []( const Vec4iRange& i_lhs, const Vec4i& i_rhs ) { return Expand( i_lhs, i_rhs ); } );
+    // Expand_FloatRange_FloatRange.
+    auto single0 = []( const FloatRange& i_lhs, const FloatRange& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< FloatRange > arg0;
+        DispatchArg< FloatRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< FloatRange >& i_lhs, const BatchArg< FloatRange >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< FloatRange >( size );
+        FloatRange* o_result = BatchResultData< FloatRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_FloatRange_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< FloatRange, FloatRange >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "Expand_FloatRange_FloatRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "Expand_FloatRange_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_FloatRange_FloatRange", std::move( dispatcher ), overloads );
+    }
+
+    // Expand_FloatRange_float.
+    auto single1 = []( const FloatRange& i_lhs, const float& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< FloatRange > arg0;
+        DispatchArg< float >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< FloatRange >& i_lhs, const BatchArg< float >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< FloatRange >( size );
+        FloatRange* o_result = BatchResultData< FloatRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_FloatRange_float;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< FloatRange, float >( invoke1 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single1, pybind11::name( "Expand_FloatRange_float" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch1,
+                                            pybind11::name( "Expand_FloatRange_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_FloatRange_float", std::move( dispatcher ), overloads );
+    }
+
+    // Expand_IntRange_IntRange.
+    auto single2 = []( const IntRange& i_lhs, const IntRange& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke2 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< IntRange > arg0;
+        DispatchArg< IntRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch2 = []( const BatchArg< IntRange >& i_lhs, const BatchArg< IntRange >& i_rhs ) {
+        size_t    size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto      result   = AllocateBatchResult< IntRange >( size );
+        IntRange* o_result = BatchResultData< IntRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_IntRange_IntRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< IntRange, IntRange >( invoke2 );
+        pybind11::object overloads = pybind11::cpp_function( single2,
+                                                             pybind11::name( "Expand_IntRange_IntRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch2,
+                                            pybind11::name( "Expand_IntRange_IntRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_IntRange_IntRange", std::move( dispatcher ), overloads );
+    }
+
+    // Expand_IntRange_int.
+    auto single3 = []( const IntRange& i_lhs, const int& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke3 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< IntRange > arg0;
+        DispatchArg< int >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch3 = []( const BatchArg< IntRange >& i_lhs, const BatchArg< int >& i_rhs ) {
+        size_t    size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto      result   = AllocateBatchResult< IntRange >( size );
+        IntRange* o_result = BatchResultData< IntRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_IntRange_int;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< IntRange, int >( invoke3 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single3, pybind11::name( "Expand_IntRange_int" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch3,
+                                            pybind11::name( "Expand_IntRange_int" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_IntRange_int", std::move( dispatcher ), overloads );
+    }
+
+    // Expand_Vec2fRange_Vec2fRange.
+    auto single4 = []( const Vec2fRange& i_lhs, const Vec2fRange& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke4 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2fRange > arg0;
+        DispatchArg< Vec2fRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch4 = []( const BatchArg< Vec2fRange >& i_lhs, const BatchArg< Vec2fRange >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec2fRange >( size );
+        Vec2fRange* o_result = BatchResultData< Vec2fRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_Vec2fRange_Vec2fRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2fRange, Vec2fRange >( invoke4 );
+        pybind11::object overloads = pybind11::cpp_function( single4,
+                                                             pybind11::name( "Expand_Vec2fRange_Vec2fRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch4,
+                                            pybind11::name( "Expand_Vec2fRange_Vec2fRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_Vec2fRange_Vec2fRange", std::move( dispatcher ), overloads );
+    }
+
+    // Expand_Vec2fRange_Vec2f.
+    auto single5 = []( const Vec2fRange& i_lhs, const Vec2f& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke5 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2fRange > arg0;
+        DispatchArg< Vec2f >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch5 = []( const BatchArg< Vec2fRange >& i_lhs, const BatchArg< Vec2f >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec2fRange >( size );
+        Vec2fRange* o_result = BatchResultData< Vec2fRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_Vec2fRange_Vec2f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2fRange, Vec2f >( invoke5 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single5, pybind11::name( "Expand_Vec2fRange_Vec2f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch5,
+                                            pybind11::name( "Expand_Vec2fRange_Vec2f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_Vec2fRange_Vec2f", std::move( dispatcher ), overloads );
+    }
+
+    // Expand_Vec3fRange_Vec3fRange.
+    auto single6 = []( const Vec3fRange& i_lhs, const Vec3fRange& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke6 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3fRange > arg0;
+        DispatchArg< Vec3fRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch6 = []( const BatchArg< Vec3fRange >& i_lhs, const BatchArg< Vec3fRange >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec3fRange >( size );
+        Vec3fRange* o_result = BatchResultData< Vec3fRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_Vec3fRange_Vec3fRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3fRange, Vec3fRange >( invoke6 );
+        pybind11::object overloads = pybind11::cpp_function( single6,
+                                                             pybind11::name( "Expand_Vec3fRange_Vec3fRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch6,
+                                            pybind11::name( "Expand_Vec3fRange_Vec3fRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_Vec3fRange_Vec3fRange", std::move( dispatcher ), overloads );
+    }
+
+    // Expand_Vec3fRange_Vec3f.
+    auto single7 = []( const Vec3fRange& i_lhs, const Vec3f& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke7 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3fRange > arg0;
+        DispatchArg< Vec3f >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch7 = []( const BatchArg< Vec3fRange >& i_lhs, const BatchArg< Vec3f >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec3fRange >( size );
+        Vec3fRange* o_result = BatchResultData< Vec3fRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_Vec3fRange_Vec3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3fRange, Vec3f >( invoke7 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single7, pybind11::name( "Expand_Vec3fRange_Vec3f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch7,
+                                            pybind11::name( "Expand_Vec3fRange_Vec3f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_Vec3fRange_Vec3f", std::move( dispatcher ), overloads );
+    }
+
+    // Expand_Vec4fRange_Vec4fRange.
+    auto single8 = []( const Vec4fRange& i_lhs, const Vec4fRange& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke8 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4fRange > arg0;
+        DispatchArg< Vec4fRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch8 = []( const BatchArg< Vec4fRange >& i_lhs, const BatchArg< Vec4fRange >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec4fRange >( size );
+        Vec4fRange* o_result = BatchResultData< Vec4fRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_Vec4fRange_Vec4fRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4fRange, Vec4fRange >( invoke8 );
+        pybind11::object overloads = pybind11::cpp_function( single8,
+                                                             pybind11::name( "Expand_Vec4fRange_Vec4fRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch8,
+                                            pybind11::name( "Expand_Vec4fRange_Vec4fRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_Vec4fRange_Vec4fRange", std::move( dispatcher ), overloads );
+    }
+
+    // Expand_Vec4fRange_Vec4f.
+    auto single9 = []( const Vec4fRange& i_lhs, const Vec4f& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke9 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4fRange > arg0;
+        DispatchArg< Vec4f >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch9 = []( const BatchArg< Vec4fRange >& i_lhs, const BatchArg< Vec4f >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec4fRange >( size );
+        Vec4fRange* o_result = BatchResultData< Vec4fRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_Vec4fRange_Vec4f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4fRange, Vec4f >( invoke9 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single9, pybind11::name( "Expand_Vec4fRange_Vec4f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch9,
+                                            pybind11::name( "Expand_Vec4fRange_Vec4f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_Vec4fRange_Vec4f", std::move( dispatcher ), overloads );
+    }
+
+    // Expand_Vec2iRange_Vec2iRange.
+    auto single10 = []( const Vec2iRange& i_lhs, const Vec2iRange& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke10 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2iRange > arg0;
+        DispatchArg< Vec2iRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch10 = []( const BatchArg< Vec2iRange >& i_lhs, const BatchArg< Vec2iRange >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec2iRange >( size );
+        Vec2iRange* o_result = BatchResultData< Vec2iRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_Vec2iRange_Vec2iRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2iRange, Vec2iRange >( invoke10 );
+        pybind11::object overloads = pybind11::cpp_function( single10,
+                                                             pybind11::name( "Expand_Vec2iRange_Vec2iRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch10,
+                                            pybind11::name( "Expand_Vec2iRange_Vec2iRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_Vec2iRange_Vec2iRange", std::move( dispatcher ), overloads );
+    }
+
+    // Expand_Vec2iRange_Vec2i.
+    auto single11 = []( const Vec2iRange& i_lhs, const Vec2i& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke11 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2iRange > arg0;
+        DispatchArg< Vec2i >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch11 = []( const BatchArg< Vec2iRange >& i_lhs, const BatchArg< Vec2i >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec2iRange >( size );
+        Vec2iRange* o_result = BatchResultData< Vec2iRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_Vec2iRange_Vec2i;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2iRange, Vec2i >( invoke11 );
+        pybind11::object overloads = pybind11::cpp_function( single11,
+                                                             pybind11::name( "Expand_Vec2iRange_Vec2i" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch11,
+                                            pybind11::name( "Expand_Vec2iRange_Vec2i" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_Vec2iRange_Vec2i", std::move( dispatcher ), overloads );
+    }
+
+    // Expand_Vec3iRange_Vec3iRange.
+    auto single12 = []( const Vec3iRange& i_lhs, const Vec3iRange& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke12 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3iRange > arg0;
+        DispatchArg< Vec3iRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch12 = []( const BatchArg< Vec3iRange >& i_lhs, const BatchArg< Vec3iRange >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec3iRange >( size );
+        Vec3iRange* o_result = BatchResultData< Vec3iRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_Vec3iRange_Vec3iRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3iRange, Vec3iRange >( invoke12 );
+        pybind11::object overloads = pybind11::cpp_function( single12,
+                                                             pybind11::name( "Expand_Vec3iRange_Vec3iRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch12,
+                                            pybind11::name( "Expand_Vec3iRange_Vec3iRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_Vec3iRange_Vec3iRange", std::move( dispatcher ), overloads );
+    }
+
+    // Expand_Vec3iRange_Vec3i.
+    auto single13 = []( const Vec3iRange& i_lhs, const Vec3i& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke13 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3iRange > arg0;
+        DispatchArg< Vec3i >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch13 = []( const BatchArg< Vec3iRange >& i_lhs, const BatchArg< Vec3i >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec3iRange >( size );
+        Vec3iRange* o_result = BatchResultData< Vec3iRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_Vec3iRange_Vec3i;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3iRange, Vec3i >( invoke13 );
+        pybind11::object overloads = pybind11::cpp_function( single13,
+                                                             pybind11::name( "Expand_Vec3iRange_Vec3i" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch13,
+                                            pybind11::name( "Expand_Vec3iRange_Vec3i" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_Vec3iRange_Vec3i", std::move( dispatcher ), overloads );
+    }
+
+    // Expand_Vec4iRange_Vec4iRange.
+    auto single14 = []( const Vec4iRange& i_lhs, const Vec4iRange& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke14 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4iRange > arg0;
+        DispatchArg< Vec4iRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch14 = []( const BatchArg< Vec4iRange >& i_lhs, const BatchArg< Vec4iRange >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec4iRange >( size );
+        Vec4iRange* o_result = BatchResultData< Vec4iRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_Vec4iRange_Vec4iRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4iRange, Vec4iRange >( invoke14 );
+        pybind11::object overloads = pybind11::cpp_function( single14,
+                                                             pybind11::name( "Expand_Vec4iRange_Vec4iRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch14,
+                                            pybind11::name( "Expand_Vec4iRange_Vec4iRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_Vec4iRange_Vec4iRange", std::move( dispatcher ), overloads );
+    }
+
+    // Expand_Vec4iRange_Vec4i.
+    auto single15 = []( const Vec4iRange& i_lhs, const Vec4i& i_rhs ) { return Expand( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke15 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4iRange > arg0;
+        DispatchArg< Vec4i >      arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Expand( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch15 = []( const BatchArg< Vec4iRange >& i_lhs, const BatchArg< Vec4i >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec4iRange >( size );
+        Vec4iRange* o_result = BatchResultData< Vec4iRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Expand_Vec4iRange_Vec4i;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4iRange, Vec4i >( invoke15 );
+        pybind11::object overloads = pybind11::cpp_function( single15,
+                                                             pybind11::name( "Expand_Vec4iRange_Vec4i" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch15,
+                                            pybind11::name( "Expand_Vec4iRange_Vec4i" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Expand_Vec4iRange_Vec4i", std::move( dispatcher ), overloads );
+    }
+
+    // Expand, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< FloatRange, FloatRange >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< FloatRange, float >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< IntRange, IntRange >( invoke2 );
+    overloads = pybind11::cpp_function( single2,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< IntRange, int >( invoke3 );
+    overloads = pybind11::cpp_function( single3,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2fRange, Vec2fRange >( invoke4 );
+    overloads = pybind11::cpp_function( single4,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2fRange, Vec2f >( invoke5 );
+    overloads = pybind11::cpp_function( single5,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3fRange, Vec3fRange >( invoke6 );
+    overloads = pybind11::cpp_function( single6,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3fRange, Vec3f >( invoke7 );
+    overloads = pybind11::cpp_function( single7,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4fRange, Vec4fRange >( invoke8 );
+    overloads = pybind11::cpp_function( single8,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4fRange, Vec4f >( invoke9 );
+    overloads = pybind11::cpp_function( single9,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2iRange, Vec2iRange >( invoke10 );
+    overloads = pybind11::cpp_function( single10,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2iRange, Vec2i >( invoke11 );
+    overloads = pybind11::cpp_function( single11,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3iRange, Vec3iRange >( invoke12 );
+    overloads = pybind11::cpp_function( single12,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3iRange, Vec3i >( invoke13 );
+    overloads = pybind11::cpp_function( single13,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4iRange, Vec4iRange >( invoke14 );
+    overloads = pybind11::cpp_function( single14,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4iRange, Vec4i >( invoke15 );
+    overloads = pybind11::cpp_function( single15,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch2,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch3,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch4,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch5,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch6,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch7,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch8,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch9,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch10,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch11,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch12,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch13,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch14,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch15,
+                                        pybind11::name( "Expand" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "Expand", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
@@ -6,26 +6,443 @@
 
 #include <gm/functions/intersection.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for Intersection.
 
 GM_NS_USING
 
 void BindIntersection( pybind11::module& o_module )
 {
-    o_module.def( "Intersection",
-                  []( const FloatRange& i_lhs, const FloatRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); } );
-    o_module.def( "Intersection",
-                  []( const IntRange& i_lhs, const IntRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); } );
-    o_module.def( "Intersection",
-                  []( const Vec2fRange& i_lhs, const Vec2fRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); } );
-    o_module.def( "Intersection",
-                  []( const Vec3fRange& i_lhs, const Vec3fRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); } );
-    o_module.def( "Intersection",
-                  []( const Vec4fRange& i_lhs, const Vec4fRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); } );
-    o_module.def( "Intersection",
-                  []( const Vec2iRange& i_lhs, const Vec2iRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); } );
-    o_module.def( "Intersection",
-                  []( const Vec3iRange& i_lhs, const Vec3iRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); } );
-    o_module.def( "Intersection",
-                  []( const Vec4iRange& i_lhs, const Vec4iRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); } );
+    // Intersection_FloatRange_FloatRange.
+    auto single0 = []( const FloatRange& i_lhs, const FloatRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< FloatRange > arg0;
+        DispatchArg< FloatRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Intersection( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< FloatRange >& i_lhs, const BatchArg< FloatRange >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< FloatRange >( size );
+        FloatRange* o_result = BatchResultData< FloatRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Intersection_FloatRange_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< FloatRange, FloatRange >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "Intersection_FloatRange_FloatRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "Intersection_FloatRange_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "Intersection_FloatRange_FloatRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // Intersection_IntRange_IntRange.
+    auto single1 = []( const IntRange& i_lhs, const IntRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< IntRange > arg0;
+        DispatchArg< IntRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Intersection( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< IntRange >& i_lhs, const BatchArg< IntRange >& i_rhs ) {
+        size_t    size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto      result   = AllocateBatchResult< IntRange >( size );
+        IntRange* o_result = BatchResultData< IntRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Intersection_IntRange_IntRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< IntRange, IntRange >( invoke1 );
+        pybind11::object overloads = pybind11::cpp_function( single1,
+                                                             pybind11::name( "Intersection_IntRange_IntRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch1,
+                                            pybind11::name( "Intersection_IntRange_IntRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Intersection_IntRange_IntRange", std::move( dispatcher ), overloads );
+    }
+
+    // Intersection_Vec2fRange_Vec2fRange.
+    auto single2 = []( const Vec2fRange& i_lhs, const Vec2fRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke2 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2fRange > arg0;
+        DispatchArg< Vec2fRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Intersection( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch2 = []( const BatchArg< Vec2fRange >& i_lhs, const BatchArg< Vec2fRange >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec2fRange >( size );
+        Vec2fRange* o_result = BatchResultData< Vec2fRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Intersection_Vec2fRange_Vec2fRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2fRange, Vec2fRange >( invoke2 );
+        pybind11::object overloads = pybind11::cpp_function( single2,
+                                                             pybind11::name( "Intersection_Vec2fRange_Vec2fRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch2,
+                                            pybind11::name( "Intersection_Vec2fRange_Vec2fRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "Intersection_Vec2fRange_Vec2fRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // Intersection_Vec3fRange_Vec3fRange.
+    auto single3 = []( const Vec3fRange& i_lhs, const Vec3fRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke3 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3fRange > arg0;
+        DispatchArg< Vec3fRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Intersection( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch3 = []( const BatchArg< Vec3fRange >& i_lhs, const BatchArg< Vec3fRange >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec3fRange >( size );
+        Vec3fRange* o_result = BatchResultData< Vec3fRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Intersection_Vec3fRange_Vec3fRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3fRange, Vec3fRange >( invoke3 );
+        pybind11::object overloads = pybind11::cpp_function( single3,
+                                                             pybind11::name( "Intersection_Vec3fRange_Vec3fRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch3,
+                                            pybind11::name( "Intersection_Vec3fRange_Vec3fRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "Intersection_Vec3fRange_Vec3fRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // Intersection_Vec4fRange_Vec4fRange.
+    auto single4 = []( const Vec4fRange& i_lhs, const Vec4fRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke4 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4fRange > arg0;
+        DispatchArg< Vec4fRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Intersection( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch4 = []( const BatchArg< Vec4fRange >& i_lhs, const BatchArg< Vec4fRange >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec4fRange >( size );
+        Vec4fRange* o_result = BatchResultData< Vec4fRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Intersection_Vec4fRange_Vec4fRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4fRange, Vec4fRange >( invoke4 );
+        pybind11::object overloads = pybind11::cpp_function( single4,
+                                                             pybind11::name( "Intersection_Vec4fRange_Vec4fRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch4,
+                                            pybind11::name( "Intersection_Vec4fRange_Vec4fRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "Intersection_Vec4fRange_Vec4fRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // Intersection_Vec2iRange_Vec2iRange.
+    auto single5 = []( const Vec2iRange& i_lhs, const Vec2iRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke5 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2iRange > arg0;
+        DispatchArg< Vec2iRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Intersection( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch5 = []( const BatchArg< Vec2iRange >& i_lhs, const BatchArg< Vec2iRange >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec2iRange >( size );
+        Vec2iRange* o_result = BatchResultData< Vec2iRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Intersection_Vec2iRange_Vec2iRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2iRange, Vec2iRange >( invoke5 );
+        pybind11::object overloads = pybind11::cpp_function( single5,
+                                                             pybind11::name( "Intersection_Vec2iRange_Vec2iRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch5,
+                                            pybind11::name( "Intersection_Vec2iRange_Vec2iRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "Intersection_Vec2iRange_Vec2iRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // Intersection_Vec3iRange_Vec3iRange.
+    auto single6 = []( const Vec3iRange& i_lhs, const Vec3iRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke6 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3iRange > arg0;
+        DispatchArg< Vec3iRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Intersection( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch6 = []( const BatchArg< Vec3iRange >& i_lhs, const BatchArg< Vec3iRange >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec3iRange >( size );
+        Vec3iRange* o_result = BatchResultData< Vec3iRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Intersection_Vec3iRange_Vec3iRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3iRange, Vec3iRange >( invoke6 );
+        pybind11::object overloads = pybind11::cpp_function( single6,
+                                                             pybind11::name( "Intersection_Vec3iRange_Vec3iRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch6,
+                                            pybind11::name( "Intersection_Vec3iRange_Vec3iRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "Intersection_Vec3iRange_Vec3iRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // Intersection_Vec4iRange_Vec4iRange.
+    auto single7 = []( const Vec4iRange& i_lhs, const Vec4iRange& i_rhs ) { return Intersection( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke7 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4iRange > arg0;
+        DispatchArg< Vec4iRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Intersection( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch7 = []( const BatchArg< Vec4iRange >& i_lhs, const BatchArg< Vec4iRange >& i_rhs ) {
+        size_t      size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto        result   = AllocateBatchResult< Vec4iRange >( size );
+        Vec4iRange* o_result = BatchResultData< Vec4iRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Intersection_Vec4iRange_Vec4iRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4iRange, Vec4iRange >( invoke7 );
+        pybind11::object overloads = pybind11::cpp_function( single7,
+                                                             pybind11::name( "Intersection_Vec4iRange_Vec4iRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch7,
+                                            pybind11::name( "Intersection_Vec4iRange_Vec4iRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "Intersection_Vec4iRange_Vec4iRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // Intersection, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< FloatRange, FloatRange >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< IntRange, IntRange >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2fRange, Vec2fRange >( invoke2 );
+    overloads = pybind11::cpp_function( single2,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3fRange, Vec3fRange >( invoke3 );
+    overloads = pybind11::cpp_function( single3,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4fRange, Vec4fRange >( invoke4 );
+    overloads = pybind11::cpp_function( single4,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2iRange, Vec2iRange >( invoke5 );
+    overloads = pybind11::cpp_function( single5,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3iRange, Vec3iRange >( invoke6 );
+    overloads = pybind11::cpp_function( single6,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4iRange, Vec4iRange >( invoke7 );
+    overloads = pybind11::cpp_function( single7,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch2,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch3,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch4,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch5,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch6,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch7,
+                                        pybind11::name( "Intersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "Intersection", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
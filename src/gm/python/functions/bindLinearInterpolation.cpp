@@ -6,44 +6,614 @@
 
 #include <gm/functions/linearInterpolation.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for LinearInterpolation.
 
 GM_NS_USING
 
 void BindLinearInterpolation( pybind11::module& o_module )
 {
-    o_module.def( "LinearInterpolation", []( const float& i_source, const float& i_target, const float& i_weight ) {
-        return LinearInterpolation( i_source, i_target, i_weight );
-    } );
-    o_module.def( "LinearInterpolation", []( const Mat3f& i_source, const Mat3f& i_target, const float& i_weight ) {
-        return LinearInterpolation( i_source, i_target, i_weight );
-    } );
-    o_module.def( "LinearInterpolation", []( const Mat4f& i_source, const Mat4f& i_target, const float& i_weight ) {
-        return LinearInterpolation( i_source, i_target, i_weight );
-    } );
-    o_module.def( "LinearInterpolation", []( const Vec2f& i_source, const Vec2f& i_target, const float& i_weight ) {
-        return LinearInterpolation( i_source, i_target, i_weight );
-    } );
-    o_module.def( "LinearInterpolation", []( const Vec3f& i_source, const Vec3f& i_target, const float& i_weight ) {
-        return LinearInterpolation( i_source, i_target, i_weight );
-    } );
-    o_module.def( "LinearInterpolation", []( const Vec4f& i_source, const Vec4f& i_target, const float& i_weight ) {
-        return LinearInterpolation( i_source, i_target, i_weight );
-    } );
-    o_module.def( "LinearInterpolation",
-                  []( const Vec2fRange& i_source, const Vec2fRange& i_target, const float& i_weight ) {
-                      return LinearInterpolation( i_source, i_target, i_weight );
-                  } );
-    o_module.def( "LinearInterpolation",
-                  []( const Vec3fRange& i_source, const Vec3fRange& i_target, const float& i_weight ) {
-                      return LinearInterpolation( i_source, i_target, i_weight );
-                  } );
-    o_module.def( "LinearInterpolation",
-                  []( const Vec4fRange& i_source, const Vec4fRange& i_target, const float& i_weight ) {
-                      return LinearInterpolation( i_source, i_target, i_weight );
-                  } );
-    o_module.def( "LinearInterpolation",
-                  []( const FloatRange& i_source, const FloatRange& i_target, const float& i_weight ) {
-                      return LinearInterpolation( i_source, i_target, i_weight );
-                  } );
+    // LinearInterpolation_float_float_float.
+    auto single0 = []( const float& i_source, const float& i_target, const float& i_weight ) {
+        return LinearInterpolation( i_source, i_target, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< float > arg0;
+        DispatchArg< float > arg1;
+        DispatchArg< float > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 =
+        []( const BatchArg< float >& i_source, const BatchArg< float >& i_target, const BatchArg< float >& i_weight ) {
+            size_t size     = ResolveBatchSize( {&i_source, &i_target, &i_weight} );
+            auto   result   = AllocateBatchResult< float >( size );
+            float* o_result = BatchResultData< float >( result );
+            {
+                pybind11::gil_scoped_release release;
+                const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_source ),
+                                                      gm_kernels::MakeKernelArg( i_target ),
+                                                      gm_kernels::MakeKernelArg( i_weight ),
+                                                      gm_kernels::MakeKernelArg( o_result )};
+                gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().LinearInterpolation_float_float_float;
+                ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+            }
+            return result;
+        };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< float, float, float >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "LinearInterpolation_float_float_float" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "LinearInterpolation_float_float_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearInterpolation_float_float_float",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearInterpolation_Mat3f_Mat3f_float.
+    auto single1 = []( const Mat3f& i_source, const Mat3f& i_target, const float& i_weight ) {
+        return LinearInterpolation( i_source, i_target, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat3f > arg0;
+        DispatchArg< Mat3f > arg1;
+        DispatchArg< float > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 =
+        []( const BatchArg< Mat3f >& i_source, const BatchArg< Mat3f >& i_target, const BatchArg< float >& i_weight ) {
+            size_t size     = ResolveBatchSize( {&i_source, &i_target, &i_weight} );
+            auto   result   = AllocateBatchResult< Mat3f >( size );
+            Mat3f* o_result = BatchResultData< Mat3f >( result );
+            {
+                pybind11::gil_scoped_release release;
+                const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_source ),
+                                                      gm_kernels::MakeKernelArg( i_target ),
+                                                      gm_kernels::MakeKernelArg( i_weight ),
+                                                      gm_kernels::MakeKernelArg( o_result )};
+                gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().LinearInterpolation_Mat3f_Mat3f_float;
+                ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+            }
+            return result;
+        };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat3f, Mat3f, float >( invoke1 );
+        pybind11::object overloads = pybind11::cpp_function( single1,
+                                                             pybind11::name( "LinearInterpolation_Mat3f_Mat3f_float" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch1,
+                                            pybind11::name( "LinearInterpolation_Mat3f_Mat3f_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearInterpolation_Mat3f_Mat3f_float",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearInterpolation_Mat4f_Mat4f_float.
+    auto single2 = []( const Mat4f& i_source, const Mat4f& i_target, const float& i_weight ) {
+        return LinearInterpolation( i_source, i_target, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke2 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat4f > arg0;
+        DispatchArg< Mat4f > arg1;
+        DispatchArg< float > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch2 =
+        []( const BatchArg< Mat4f >& i_source, const BatchArg< Mat4f >& i_target, const BatchArg< float >& i_weight ) {
+            size_t size     = ResolveBatchSize( {&i_source, &i_target, &i_weight} );
+            auto   result   = AllocateBatchResult< Mat4f >( size );
+            Mat4f* o_result = BatchResultData< Mat4f >( result );
+            {
+                pybind11::gil_scoped_release release;
+                const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_source ),
+                                                      gm_kernels::MakeKernelArg( i_target ),
+                                                      gm_kernels::MakeKernelArg( i_weight ),
+                                                      gm_kernels::MakeKernelArg( o_result )};
+                gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().LinearInterpolation_Mat4f_Mat4f_float;
+                ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+            }
+            return result;
+        };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat4f, Mat4f, float >( invoke2 );
+        pybind11::object overloads = pybind11::cpp_function( single2,
+                                                             pybind11::name( "LinearInterpolation_Mat4f_Mat4f_float" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch2,
+                                            pybind11::name( "LinearInterpolation_Mat4f_Mat4f_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearInterpolation_Mat4f_Mat4f_float",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearInterpolation_Vec2f_Vec2f_float.
+    auto single3 = []( const Vec2f& i_source, const Vec2f& i_target, const float& i_weight ) {
+        return LinearInterpolation( i_source, i_target, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke3 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2f > arg0;
+        DispatchArg< Vec2f > arg1;
+        DispatchArg< float > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch3 =
+        []( const BatchArg< Vec2f >& i_source, const BatchArg< Vec2f >& i_target, const BatchArg< float >& i_weight ) {
+            size_t size     = ResolveBatchSize( {&i_source, &i_target, &i_weight} );
+            auto   result   = AllocateBatchResult< Vec2f >( size );
+            Vec2f* o_result = BatchResultData< Vec2f >( result );
+            {
+                pybind11::gil_scoped_release release;
+                const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_source ),
+                                                      gm_kernels::MakeKernelArg( i_target ),
+                                                      gm_kernels::MakeKernelArg( i_weight ),
+                                                      gm_kernels::MakeKernelArg( o_result )};
+                gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().LinearInterpolation_Vec2f_Vec2f_float;
+                ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+            }
+            return result;
+        };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2f, Vec2f, float >( invoke3 );
+        pybind11::object overloads = pybind11::cpp_function( single3,
+                                                             pybind11::name( "LinearInterpolation_Vec2f_Vec2f_float" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch3,
+                                            pybind11::name( "LinearInterpolation_Vec2f_Vec2f_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearInterpolation_Vec2f_Vec2f_float",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearInterpolation_Vec3f_Vec3f_float.
+    auto single4 = []( const Vec3f& i_source, const Vec3f& i_target, const float& i_weight ) {
+        return LinearInterpolation( i_source, i_target, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke4 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f > arg0;
+        DispatchArg< Vec3f > arg1;
+        DispatchArg< float > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch4 =
+        []( const BatchArg< Vec3f >& i_source, const BatchArg< Vec3f >& i_target, const BatchArg< float >& i_weight ) {
+            size_t size     = ResolveBatchSize( {&i_source, &i_target, &i_weight} );
+            auto   result   = AllocateBatchResult< Vec3f >( size );
+            Vec3f* o_result = BatchResultData< Vec3f >( result );
+            {
+                pybind11::gil_scoped_release release;
+                const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_source ),
+                                                      gm_kernels::MakeKernelArg( i_target ),
+                                                      gm_kernels::MakeKernelArg( i_weight ),
+                                                      gm_kernels::MakeKernelArg( o_result )};
+                gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().LinearInterpolation_Vec3f_Vec3f_float;
+                ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+            }
+            return result;
+        };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f, Vec3f, float >( invoke4 );
+        pybind11::object overloads = pybind11::cpp_function( single4,
+                                                             pybind11::name( "LinearInterpolation_Vec3f_Vec3f_float" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch4,
+                                            pybind11::name( "LinearInterpolation_Vec3f_Vec3f_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearInterpolation_Vec3f_Vec3f_float",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearInterpolation_Vec4f_Vec4f_float.
+    auto single5 = []( const Vec4f& i_source, const Vec4f& i_target, const float& i_weight ) {
+        return LinearInterpolation( i_source, i_target, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke5 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4f > arg0;
+        DispatchArg< Vec4f > arg1;
+        DispatchArg< float > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch5 =
+        []( const BatchArg< Vec4f >& i_source, const BatchArg< Vec4f >& i_target, const BatchArg< float >& i_weight ) {
+            size_t size     = ResolveBatchSize( {&i_source, &i_target, &i_weight} );
+            auto   result   = AllocateBatchResult< Vec4f >( size );
+            Vec4f* o_result = BatchResultData< Vec4f >( result );
+            {
+                pybind11::gil_scoped_release release;
+                const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_source ),
+                                                      gm_kernels::MakeKernelArg( i_target ),
+                                                      gm_kernels::MakeKernelArg( i_weight ),
+                                                      gm_kernels::MakeKernelArg( o_result )};
+                gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().LinearInterpolation_Vec4f_Vec4f_float;
+                ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+            }
+            return result;
+        };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4f, Vec4f, float >( invoke5 );
+        pybind11::object overloads = pybind11::cpp_function( single5,
+                                                             pybind11::name( "LinearInterpolation_Vec4f_Vec4f_float" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch5,
+                                            pybind11::name( "LinearInterpolation_Vec4f_Vec4f_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearInterpolation_Vec4f_Vec4f_float",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearInterpolation_Vec2fRange_Vec2fRange_float.
+    auto single6 = []( const Vec2fRange& i_source, const Vec2fRange& i_target, const float& i_weight ) {
+        return LinearInterpolation( i_source, i_target, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke6 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2fRange > arg0;
+        DispatchArg< Vec2fRange > arg1;
+        DispatchArg< float >      arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch6 = []( const BatchArg< Vec2fRange >& i_source,
+                      const BatchArg< Vec2fRange >& i_target,
+                      const BatchArg< float >&      i_weight ) {
+        size_t      size     = ResolveBatchSize( {&i_source, &i_target, &i_weight} );
+        auto        result   = AllocateBatchResult< Vec2fRange >( size );
+        Vec2fRange* o_result = BatchResultData< Vec2fRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_source ),
+                                                  gm_kernels::MakeKernelArg( i_target ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet().LinearInterpolation_Vec2fRange_Vec2fRange_float;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2fRange, Vec2fRange, float >( invoke6 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single6,
+                                    pybind11::name( "LinearInterpolation_Vec2fRange_Vec2fRange_float" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch6,
+                                            pybind11::name( "LinearInterpolation_Vec2fRange_Vec2fRange_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearInterpolation_Vec2fRange_Vec2fRange_float",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearInterpolation_Vec3fRange_Vec3fRange_float.
+    auto single7 = []( const Vec3fRange& i_source, const Vec3fRange& i_target, const float& i_weight ) {
+        return LinearInterpolation( i_source, i_target, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke7 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3fRange > arg0;
+        DispatchArg< Vec3fRange > arg1;
+        DispatchArg< float >      arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch7 = []( const BatchArg< Vec3fRange >& i_source,
+                      const BatchArg< Vec3fRange >& i_target,
+                      const BatchArg< float >&      i_weight ) {
+        size_t      size     = ResolveBatchSize( {&i_source, &i_target, &i_weight} );
+        auto        result   = AllocateBatchResult< Vec3fRange >( size );
+        Vec3fRange* o_result = BatchResultData< Vec3fRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_source ),
+                                                  gm_kernels::MakeKernelArg( i_target ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet().LinearInterpolation_Vec3fRange_Vec3fRange_float;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3fRange, Vec3fRange, float >( invoke7 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single7,
+                                    pybind11::name( "LinearInterpolation_Vec3fRange_Vec3fRange_float" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch7,
+                                            pybind11::name( "LinearInterpolation_Vec3fRange_Vec3fRange_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearInterpolation_Vec3fRange_Vec3fRange_float",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearInterpolation_Vec4fRange_Vec4fRange_float.
+    auto single8 = []( const Vec4fRange& i_source, const Vec4fRange& i_target, const float& i_weight ) {
+        return LinearInterpolation( i_source, i_target, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke8 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4fRange > arg0;
+        DispatchArg< Vec4fRange > arg1;
+        DispatchArg< float >      arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch8 = []( const BatchArg< Vec4fRange >& i_source,
+                      const BatchArg< Vec4fRange >& i_target,
+                      const BatchArg< float >&      i_weight ) {
+        size_t      size     = ResolveBatchSize( {&i_source, &i_target, &i_weight} );
+        auto        result   = AllocateBatchResult< Vec4fRange >( size );
+        Vec4fRange* o_result = BatchResultData< Vec4fRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_source ),
+                                                  gm_kernels::MakeKernelArg( i_target ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet().LinearInterpolation_Vec4fRange_Vec4fRange_float;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4fRange, Vec4fRange, float >( invoke8 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single8,
+                                    pybind11::name( "LinearInterpolation_Vec4fRange_Vec4fRange_float" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch8,
+                                            pybind11::name( "LinearInterpolation_Vec4fRange_Vec4fRange_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearInterpolation_Vec4fRange_Vec4fRange_float",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearInterpolation_FloatRange_FloatRange_float.
+    auto single9 = []( const FloatRange& i_source, const FloatRange& i_target, const float& i_weight ) {
+        return LinearInterpolation( i_source, i_target, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke9 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< FloatRange > arg0;
+        DispatchArg< FloatRange > arg1;
+        DispatchArg< float >      arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch9 = []( const BatchArg< FloatRange >& i_source,
+                      const BatchArg< FloatRange >& i_target,
+                      const BatchArg< float >&      i_weight ) {
+        size_t      size     = ResolveBatchSize( {&i_source, &i_target, &i_weight} );
+        auto        result   = AllocateBatchResult< FloatRange >( size );
+        FloatRange* o_result = BatchResultData< FloatRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_source ),
+                                                  gm_kernels::MakeKernelArg( i_target ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet().LinearInterpolation_FloatRange_FloatRange_float;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< FloatRange, FloatRange, float >( invoke9 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single9,
+                                    pybind11::name( "LinearInterpolation_FloatRange_FloatRange_float" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch9,
+                                            pybind11::name( "LinearInterpolation_FloatRange_FloatRange_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearInterpolation_FloatRange_FloatRange_float",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearInterpolation, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< float, float, float >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Mat3f, Mat3f, float >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Mat4f, Mat4f, float >( invoke2 );
+    overloads = pybind11::cpp_function( single2,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2f, Vec2f, float >( invoke3 );
+    overloads = pybind11::cpp_function( single3,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3f, Vec3f, float >( invoke4 );
+    overloads = pybind11::cpp_function( single4,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4f, Vec4f, float >( invoke5 );
+    overloads = pybind11::cpp_function( single5,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2fRange, Vec2fRange, float >( invoke6 );
+    overloads = pybind11::cpp_function( single6,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3fRange, Vec3fRange, float >( invoke7 );
+    overloads = pybind11::cpp_function( single7,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4fRange, Vec4fRange, float >( invoke8 );
+    overloads = pybind11::cpp_function( single8,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< FloatRange, FloatRange, float >( invoke9 );
+    overloads = pybind11::cpp_function( single9,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch2,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch3,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch4,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch5,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch6,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch7,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch8,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch9,
+                                        pybind11::name( "LinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "LinearInterpolation", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
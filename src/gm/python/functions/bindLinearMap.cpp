@@ -6,34 +6,376 @@
 
 #include <gm/functions/linearMap.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for LinearMap.
 
 GM_NS_USING
 
 void BindLinearMap( pybind11::module& o_module )
 {
-    o_module.def( "LinearMap",
-                  []( const float& i_sourceValue, const FloatRange& i_sourceRange, const FloatRange& i_targetRange ) {
-                      return LinearMap( i_sourceValue, i_sourceRange, i_targetRange );
-                  } );
-    o_module.def( "LinearMap",
-                  []( const Mat3f& i_sourceValue, const FloatRange& i_sourceRange, const FloatRange& i_targetRange ) {
-                      return LinearMap( i_sourceValue, i_sourceRange, i_targetRange );
-                  } );
-    o_module.def( "LinearMap",
-                  []( const Mat4f& i_sourceValue, const FloatRange& i_sourceRange, const FloatRange& i_targetRange ) {
-                      return LinearMap( i_sourceValue, i_sourceRange, i_targetRange );
-                  } );
-    o_module.def( "LinearMap",
-                  []( const Vec2f& i_sourceValue, const FloatRange& i_sourceRange, const FloatRange& i_targetRange ) {
-                      return LinearMap( i_sourceValue, i_sourceRange, i_targetRange );
-                  } );
-    o_module.def( "LinearMap",
-                  []( const Vec3f& i_sourceValue, const FloatRange& i_sourceRange, const FloatRange& i_targetRange ) {
-                      return LinearMap( i_sourceValue, i_sourceRange, i_targetRange );
-                  } );
-    o_module.def( "LinearMap",
-                  []( const Vec4f& i_sourceValue, const FloatRange& i_sourceRange, const FloatRange& i_targetRange ) {
-                      return LinearMap( i_sourceValue, i_sourceRange, i_targetRange );
-                  } );
+    // LinearMap_float_FloatRange_FloatRange.
+    auto single0 = []( const float& i_sourceValue, const FloatRange& i_sourceRange, const FloatRange& i_targetRange ) {
+        return LinearMap( i_sourceValue, i_sourceRange, i_targetRange );
+    };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< float >      arg0;
+        DispatchArg< FloatRange > arg1;
+        DispatchArg< FloatRange > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearMap( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< float >&      i_sourceValue,
+                      const BatchArg< FloatRange >& i_sourceRange,
+                      const BatchArg< FloatRange >& i_targetRange ) {
+        size_t size     = ResolveBatchSize( {&i_sourceValue, &i_sourceRange, &i_targetRange} );
+        auto   result   = AllocateBatchResult< float >( size );
+        float* o_result = BatchResultData< float >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_sourceValue ),
+                                                  gm_kernels::MakeKernelArg( i_sourceRange ),
+                                                  gm_kernels::MakeKernelArg( i_targetRange ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().LinearMap_float_FloatRange_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< float, FloatRange, FloatRange >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "LinearMap_float_FloatRange_FloatRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "LinearMap_float_FloatRange_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearMap_float_FloatRange_FloatRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearMap_Mat3f_FloatRange_FloatRange.
+    auto single1 = []( const Mat3f& i_sourceValue, const FloatRange& i_sourceRange, const FloatRange& i_targetRange ) {
+        return LinearMap( i_sourceValue, i_sourceRange, i_targetRange );
+    };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat3f >      arg0;
+        DispatchArg< FloatRange > arg1;
+        DispatchArg< FloatRange > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearMap( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< Mat3f >&      i_sourceValue,
+                      const BatchArg< FloatRange >& i_sourceRange,
+                      const BatchArg< FloatRange >& i_targetRange ) {
+        size_t size     = ResolveBatchSize( {&i_sourceValue, &i_sourceRange, &i_targetRange} );
+        auto   result   = AllocateBatchResult< Mat3f >( size );
+        Mat3f* o_result = BatchResultData< Mat3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_sourceValue ),
+                                                  gm_kernels::MakeKernelArg( i_sourceRange ),
+                                                  gm_kernels::MakeKernelArg( i_targetRange ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().LinearMap_Mat3f_FloatRange_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat3f, FloatRange, FloatRange >( invoke1 );
+        pybind11::object overloads = pybind11::cpp_function( single1,
+                                                             pybind11::name( "LinearMap_Mat3f_FloatRange_FloatRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch1,
+                                            pybind11::name( "LinearMap_Mat3f_FloatRange_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearMap_Mat3f_FloatRange_FloatRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearMap_Mat4f_FloatRange_FloatRange.
+    auto single2 = []( const Mat4f& i_sourceValue, const FloatRange& i_sourceRange, const FloatRange& i_targetRange ) {
+        return LinearMap( i_sourceValue, i_sourceRange, i_targetRange );
+    };
+    OverloadDispatcher::Invoker invoke2 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat4f >      arg0;
+        DispatchArg< FloatRange > arg1;
+        DispatchArg< FloatRange > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearMap( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch2 = []( const BatchArg< Mat4f >&      i_sourceValue,
+                      const BatchArg< FloatRange >& i_sourceRange,
+                      const BatchArg< FloatRange >& i_targetRange ) {
+        size_t size     = ResolveBatchSize( {&i_sourceValue, &i_sourceRange, &i_targetRange} );
+        auto   result   = AllocateBatchResult< Mat4f >( size );
+        Mat4f* o_result = BatchResultData< Mat4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_sourceValue ),
+                                                  gm_kernels::MakeKernelArg( i_sourceRange ),
+                                                  gm_kernels::MakeKernelArg( i_targetRange ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().LinearMap_Mat4f_FloatRange_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat4f, FloatRange, FloatRange >( invoke2 );
+        pybind11::object overloads = pybind11::cpp_function( single2,
+                                                             pybind11::name( "LinearMap_Mat4f_FloatRange_FloatRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch2,
+                                            pybind11::name( "LinearMap_Mat4f_FloatRange_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearMap_Mat4f_FloatRange_FloatRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearMap_Vec2f_FloatRange_FloatRange.
+    auto single3 = []( const Vec2f& i_sourceValue, const FloatRange& i_sourceRange, const FloatRange& i_targetRange ) {
+        return LinearMap( i_sourceValue, i_sourceRange, i_targetRange );
+    };
+    OverloadDispatcher::Invoker invoke3 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2f >      arg0;
+        DispatchArg< FloatRange > arg1;
+        DispatchArg< FloatRange > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearMap( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch3 = []( const BatchArg< Vec2f >&      i_sourceValue,
+                      const BatchArg< FloatRange >& i_sourceRange,
+                      const BatchArg< FloatRange >& i_targetRange ) {
+        size_t size     = ResolveBatchSize( {&i_sourceValue, &i_sourceRange, &i_targetRange} );
+        auto   result   = AllocateBatchResult< Vec2f >( size );
+        Vec2f* o_result = BatchResultData< Vec2f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_sourceValue ),
+                                                  gm_kernels::MakeKernelArg( i_sourceRange ),
+                                                  gm_kernels::MakeKernelArg( i_targetRange ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().LinearMap_Vec2f_FloatRange_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2f, FloatRange, FloatRange >( invoke3 );
+        pybind11::object overloads = pybind11::cpp_function( single3,
+                                                             pybind11::name( "LinearMap_Vec2f_FloatRange_FloatRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch3,
+                                            pybind11::name( "LinearMap_Vec2f_FloatRange_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearMap_Vec2f_FloatRange_FloatRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearMap_Vec3f_FloatRange_FloatRange.
+    auto single4 = []( const Vec3f& i_sourceValue, const FloatRange& i_sourceRange, const FloatRange& i_targetRange ) {
+        return LinearMap( i_sourceValue, i_sourceRange, i_targetRange );
+    };
+    OverloadDispatcher::Invoker invoke4 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f >      arg0;
+        DispatchArg< FloatRange > arg1;
+        DispatchArg< FloatRange > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearMap( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch4 = []( const BatchArg< Vec3f >&      i_sourceValue,
+                      const BatchArg< FloatRange >& i_sourceRange,
+                      const BatchArg< FloatRange >& i_targetRange ) {
+        size_t size     = ResolveBatchSize( {&i_sourceValue, &i_sourceRange, &i_targetRange} );
+        auto   result   = AllocateBatchResult< Vec3f >( size );
+        Vec3f* o_result = BatchResultData< Vec3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_sourceValue ),
+                                                  gm_kernels::MakeKernelArg( i_sourceRange ),
+                                                  gm_kernels::MakeKernelArg( i_targetRange ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().LinearMap_Vec3f_FloatRange_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f, FloatRange, FloatRange >( invoke4 );
+        pybind11::object overloads = pybind11::cpp_function( single4,
+                                                             pybind11::name( "LinearMap_Vec3f_FloatRange_FloatRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch4,
+                                            pybind11::name( "LinearMap_Vec3f_FloatRange_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearMap_Vec3f_FloatRange_FloatRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearMap_Vec4f_FloatRange_FloatRange.
+    auto single5 = []( const Vec4f& i_sourceValue, const FloatRange& i_sourceRange, const FloatRange& i_targetRange ) {
+        return LinearMap( i_sourceValue, i_sourceRange, i_targetRange );
+    };
+    OverloadDispatcher::Invoker invoke5 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4f >      arg0;
+        DispatchArg< FloatRange > arg1;
+        DispatchArg< FloatRange > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LinearMap( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch5 = []( const BatchArg< Vec4f >&      i_sourceValue,
+                      const BatchArg< FloatRange >& i_sourceRange,
+                      const BatchArg< FloatRange >& i_targetRange ) {
+        size_t size     = ResolveBatchSize( {&i_sourceValue, &i_sourceRange, &i_targetRange} );
+        auto   result   = AllocateBatchResult< Vec4f >( size );
+        Vec4f* o_result = BatchResultData< Vec4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_sourceValue ),
+                                                  gm_kernels::MakeKernelArg( i_sourceRange ),
+                                                  gm_kernels::MakeKernelArg( i_targetRange ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().LinearMap_Vec4f_FloatRange_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4f, FloatRange, FloatRange >( invoke5 );
+        pybind11::object overloads = pybind11::cpp_function( single5,
+                                                             pybind11::name( "LinearMap_Vec4f_FloatRange_FloatRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch5,
+                                            pybind11::name( "LinearMap_Vec4f_FloatRange_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "LinearMap_Vec4f_FloatRange_FloatRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // LinearMap, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< float, FloatRange, FloatRange >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "LinearMap" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Mat3f, FloatRange, FloatRange >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "LinearMap" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Mat4f, FloatRange, FloatRange >( invoke2 );
+    overloads = pybind11::cpp_function( single2,
+                                        pybind11::name( "LinearMap" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2f, FloatRange, FloatRange >( invoke3 );
+    overloads = pybind11::cpp_function( single3,
+                                        pybind11::name( "LinearMap" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3f, FloatRange, FloatRange >( invoke4 );
+    overloads = pybind11::cpp_function( single4,
+                                        pybind11::name( "LinearMap" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4f, FloatRange, FloatRange >( invoke5 );
+    overloads = pybind11::cpp_function( single5,
+                                        pybind11::name( "LinearMap" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "LinearMap" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "LinearMap" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch2,
+                                        pybind11::name( "LinearMap" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch3,
+                                        pybind11::name( "LinearMap" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch4,
+                                        pybind11::name( "LinearMap" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch5,
+                                        pybind11::name( "LinearMap" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "LinearMap", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
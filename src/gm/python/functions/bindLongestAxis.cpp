@@ -6,16 +6,304 @@
 
 #include <gm/functions/longestAxis.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for LongestAxis.
 
 GM_NS_USING
 
 void BindLongestAxis( pybind11::module& o_module )
 {
-    o_module.def( "LongestAxis", []( const Vec2fRange& i_range ) { return LongestAxis( i_range ); } );
-    o_module.def( "LongestAxis", []( const Vec3fRange& i_range ) { return LongestAxis( i_range ); } );
-    o_module.def( "LongestAxis", []( const Vec4fRange& i_range ) { return LongestAxis( i_range ); } );
-    o_module.def( "LongestAxis", []( const Vec2iRange& i_range ) { return LongestAxis( i_range ); } );
-    o_module.def( "LongestAxis", []( const Vec3iRange& i_range ) { return LongestAxis( i_range ); } );
-    o_module.def( "LongestAxis", []( const Vec4iRange& i_range ) { return LongestAxis( i_range ); } );
+    // LongestAxis_Vec2fRange.
+    auto                        single0 = []( const Vec2fRange& i_range ) { return LongestAxis( i_range ); };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2fRange > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LongestAxis( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< Vec2fRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_range} );
+        auto   result   = AllocateBatchResult< int >( size );
+        int*   o_result = BatchResultData< int >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().LongestAxis_Vec2fRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2fRange >( invoke0 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single0, pybind11::name( "LongestAxis_Vec2fRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch0,
+                                            pybind11::name( "LongestAxis_Vec2fRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "LongestAxis_Vec2fRange", std::move( dispatcher ), overloads );
+    }
+
+    // LongestAxis_Vec3fRange.
+    auto                        single1 = []( const Vec3fRange& i_range ) { return LongestAxis( i_range ); };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3fRange > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LongestAxis( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< Vec3fRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_range} );
+        auto   result   = AllocateBatchResult< int >( size );
+        int*   o_result = BatchResultData< int >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().LongestAxis_Vec3fRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3fRange >( invoke1 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single1, pybind11::name( "LongestAxis_Vec3fRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch1,
+                                            pybind11::name( "LongestAxis_Vec3fRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "LongestAxis_Vec3fRange", std::move( dispatcher ), overloads );
+    }
+
+    // LongestAxis_Vec4fRange.
+    auto                        single2 = []( const Vec4fRange& i_range ) { return LongestAxis( i_range ); };
+    OverloadDispatcher::Invoker invoke2 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4fRange > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LongestAxis( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch2 = []( const BatchArg< Vec4fRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_range} );
+        auto   result   = AllocateBatchResult< int >( size );
+        int*   o_result = BatchResultData< int >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().LongestAxis_Vec4fRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4fRange >( invoke2 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single2, pybind11::name( "LongestAxis_Vec4fRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch2,
+                                            pybind11::name( "LongestAxis_Vec4fRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "LongestAxis_Vec4fRange", std::move( dispatcher ), overloads );
+    }
+
+    // LongestAxis_Vec2iRange.
+    auto                        single3 = []( const Vec2iRange& i_range ) { return LongestAxis( i_range ); };
+    OverloadDispatcher::Invoker invoke3 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2iRange > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LongestAxis( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch3 = []( const BatchArg< Vec2iRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_range} );
+        auto   result   = AllocateBatchResult< int >( size );
+        int*   o_result = BatchResultData< int >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().LongestAxis_Vec2iRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2iRange >( invoke3 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single3, pybind11::name( "LongestAxis_Vec2iRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch3,
+                                            pybind11::name( "LongestAxis_Vec2iRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "LongestAxis_Vec2iRange", std::move( dispatcher ), overloads );
+    }
+
+    // LongestAxis_Vec3iRange.
+    auto                        single4 = []( const Vec3iRange& i_range ) { return LongestAxis( i_range ); };
+    OverloadDispatcher::Invoker invoke4 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3iRange > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LongestAxis( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch4 = []( const BatchArg< Vec3iRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_range} );
+        auto   result   = AllocateBatchResult< int >( size );
+        int*   o_result = BatchResultData< int >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().LongestAxis_Vec3iRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3iRange >( invoke4 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single4, pybind11::name( "LongestAxis_Vec3iRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch4,
+                                            pybind11::name( "LongestAxis_Vec3iRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "LongestAxis_Vec3iRange", std::move( dispatcher ), overloads );
+    }
+
+    // LongestAxis_Vec4iRange.
+    auto                        single5 = []( const Vec4iRange& i_range ) { return LongestAxis( i_range ); };
+    OverloadDispatcher::Invoker invoke5 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4iRange > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LongestAxis( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch5 = []( const BatchArg< Vec4iRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_range} );
+        auto   result   = AllocateBatchResult< int >( size );
+        int*   o_result = BatchResultData< int >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_range ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().LongestAxis_Vec4iRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4iRange >( invoke5 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single5, pybind11::name( "LongestAxis_Vec4iRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch5,
+                                            pybind11::name( "LongestAxis_Vec4iRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "LongestAxis_Vec4iRange", std::move( dispatcher ), overloads );
+    }
+
+    // LongestAxis, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< Vec2fRange >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "LongestAxis" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3fRange >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "LongestAxis" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4fRange >( invoke2 );
+    overloads = pybind11::cpp_function( single2,
+                                        pybind11::name( "LongestAxis" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2iRange >( invoke3 );
+    overloads = pybind11::cpp_function( single3,
+                                        pybind11::name( "LongestAxis" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3iRange >( invoke4 );
+    overloads = pybind11::cpp_function( single4,
+                                        pybind11::name( "LongestAxis" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4iRange >( invoke5 );
+    overloads = pybind11::cpp_function( single5,
+                                        pybind11::name( "LongestAxis" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "LongestAxis" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "LongestAxis" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch2,
+                                        pybind11::name( "LongestAxis" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch3,
+                                        pybind11::name( "LongestAxis" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch4,
+                                        pybind11::name( "LongestAxis" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch5,
+                                        pybind11::name( "LongestAxis" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "LongestAxis", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
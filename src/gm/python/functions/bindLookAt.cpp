@@ -6,13 +6,77 @@
 
 #include <gm/functions/lookAt.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for LookAt.
 
 GM_NS_USING
 
 void BindLookAt( pybind11::module& o_module )
 {
-    o_module.def( "LookAt", []( const Vec3f& i_position, const Vec3f& i_look, const Vec3f& i_up ) {
+    // LookAt_Vec3f_Vec3f_Vec3f.
+    auto single0 = []( const Vec3f& i_position, const Vec3f& i_look, const Vec3f& i_up ) {
         return LookAt( i_position, i_look, i_up );
-    } );
+    };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f > arg0;
+        DispatchArg< Vec3f > arg1;
+        DispatchArg< Vec3f > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( LookAt( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 =
+        []( const BatchArg< Vec3f >& i_position, const BatchArg< Vec3f >& i_look, const BatchArg< Vec3f >& i_up ) {
+            size_t size     = ResolveBatchSize( {&i_position, &i_look, &i_up} );
+            auto   result   = AllocateBatchResult< Mat4f >( size );
+            Mat4f* o_result = BatchResultData< Mat4f >( result );
+            {
+                pybind11::gil_scoped_release release;
+                const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_position ),
+                                                      gm_kernels::MakeKernelArg( i_look ),
+                                                      gm_kernels::MakeKernelArg( i_up ),
+                                                      gm_kernels::MakeKernelArg( o_result )};
+                gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().LookAt_Vec3f_Vec3f_Vec3f;
+                ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+            }
+            return result;
+        };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f, Vec3f, Vec3f >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "LookAt_Vec3f_Vec3f_Vec3f" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "LookAt_Vec3f_Vec3f_Vec3f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "LookAt_Vec3f_Vec3f_Vec3f", std::move( dispatcher ), overloads );
+    }
+
+    // LookAt, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< Vec3f, Vec3f, Vec3f >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "LookAt" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "LookAt" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "LookAt", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
@@ -6,14 +6,122 @@
 
 #include <gm/functions/matrixProduct.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for MatrixProduct.
 
 GM_NS_USING
 
 void BindMatrixProduct( pybind11::module& o_module )
 {
-    o_module.def( "MatrixProduct",
-                  []( const Mat3f& i_lhs, const Mat3f& i_rhs ) { return MatrixProduct( i_lhs, i_rhs ); } );
-    o_module.def( "MatrixProduct",
-                  []( const Mat4f& i_lhs, const Mat4f& i_rhs ) { return MatrixProduct( i_lhs, i_rhs ); } );
+    // MatrixProduct_Mat3f_Mat3f.
+    auto single0 = []( const Mat3f& i_lhs, const Mat3f& i_rhs ) { return MatrixProduct( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat3f > arg0;
+        DispatchArg< Mat3f > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( MatrixProduct( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< Mat3f >& i_lhs, const BatchArg< Mat3f >& i_rhs ) {
+        size_t size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto   result   = AllocateBatchResult< Mat3f >( size );
+        Mat3f* o_result = BatchResultData< Mat3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().MatrixProduct_Mat3f_Mat3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat3f, Mat3f >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "MatrixProduct_Mat3f_Mat3f" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "MatrixProduct_Mat3f_Mat3f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "MatrixProduct_Mat3f_Mat3f", std::move( dispatcher ), overloads );
+    }
+
+    // MatrixProduct_Mat4f_Mat4f.
+    auto single1 = []( const Mat4f& i_lhs, const Mat4f& i_rhs ) { return MatrixProduct( i_lhs, i_rhs ); };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat4f > arg0;
+        DispatchArg< Mat4f > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( MatrixProduct( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< Mat4f >& i_lhs, const BatchArg< Mat4f >& i_rhs ) {
+        size_t size     = ResolveBatchSize( {&i_lhs, &i_rhs} );
+        auto   result   = AllocateBatchResult< Mat4f >( size );
+        Mat4f* o_result = BatchResultData< Mat4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_lhs ),
+                                                  gm_kernels::MakeKernelArg( i_rhs ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().MatrixProduct_Mat4f_Mat4f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat4f, Mat4f >( invoke1 );
+        pybind11::object overloads = pybind11::cpp_function( single1,
+                                                             pybind11::name( "MatrixProduct_Mat4f_Mat4f" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch1,
+                                            pybind11::name( "MatrixProduct_Mat4f_Mat4f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "MatrixProduct_Mat4f_Mat4f", std::move( dispatcher ), overloads );
+    }
+
+    // MatrixProduct, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< Mat3f, Mat3f >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "MatrixProduct" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Mat4f, Mat4f >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "MatrixProduct" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "MatrixProduct" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "MatrixProduct" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "MatrixProduct", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
@@ -6,21 +6,561 @@
 
 #include <gm/functions/max.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for Max.
 
 GM_NS_USING
 
 void BindMax( pybind11::module& o_module )
 {
-    o_module.def( "Max", []( const float& i_valueA, const float& i_valueB ) { return Max( i_valueA, i_valueB ); } );
-    o_module.def( "Max", []( const int& i_valueA, const int& i_valueB ) { return Max( i_valueA, i_valueB ); } );
-    o_module.def( "Max", []( const bool& i_valueA, const bool& i_valueB ) { return Max( i_valueA, i_valueB ); } );
-    o_module.def( "Max", []( const Vec2f& i_valueA, const Vec2f& i_valueB ) { return Max( i_valueA, i_valueB ); } );
-    o_module.def( "Max", []( const Vec3f& i_valueA, const Vec3f& i_valueB ) { return Max( i_valueA, i_valueB ); } );
-    o_module.def( "Max", []( const Vec4f& i_valueA, const Vec4f& i_valueB ) { return Max( i_valueA, i_valueB ); } );
-    o_module.def( "Max", []( const Vec2i& i_valueA, const Vec2i& i_valueB ) { return Max( i_valueA, i_valueB ); } );
-    o_module.def( "Max", []( const Vec3i& i_valueA, const Vec3i& i_valueB ) { return Max( i_valueA, i_valueB ); } );
-    o_module.def( "Max", []( const Vec4i& i_valueA, const Vec4i& i_valueB ) { return Max( i_valueA, i_valueB ); } );
-    o_module.def( "Max", []( const Mat3f& i_valueA, const Mat3f& i_valueB ) { return Max( i_valueA, i_valueB ); } );
-    o_module.def( "Max", []( const Mat4f& i_valueA, const Mat4f& i_valueB ) { return Max( i_valueA, i_valueB ); } );
+    // Max_float_float.
+    auto single0 = []( const float& i_valueA, const float& i_valueB ) { return Max( i_valueA, i_valueB ); };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< float > arg0;
+        DispatchArg< float > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Max( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< float >& i_valueA, const BatchArg< float >& i_valueB ) {
+        size_t size     = ResolveBatchSize( {&i_valueA, &i_valueB} );
+        auto   result   = AllocateBatchResult< float >( size );
+        float* o_result = BatchResultData< float >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_valueA ),
+                                                  gm_kernels::MakeKernelArg( i_valueB ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Max_float_float;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< float, float >( invoke0 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single0, pybind11::name( "Max_float_float" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch0,
+                                            pybind11::name( "Max_float_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Max_float_float", std::move( dispatcher ), overloads );
+    }
+
+    // Max_int_int.
+    auto single1 = []( const int& i_valueA, const int& i_valueB ) { return Max( i_valueA, i_valueB ); };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< int > arg0;
+        DispatchArg< int > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Max( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< int >& i_valueA, const BatchArg< int >& i_valueB ) {
+        size_t size     = ResolveBatchSize( {&i_valueA, &i_valueB} );
+        auto   result   = AllocateBatchResult< int >( size );
+        int*   o_result = BatchResultData< int >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_valueA ),
+                                                  gm_kernels::MakeKernelArg( i_valueB ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Max_int_int;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< int, int >( invoke1 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single1, pybind11::name( "Max_int_int" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch1,
+                                            pybind11::name( "Max_int_int" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Max_int_int", std::move( dispatcher ), overloads );
+    }
+
+    // Max_bool_bool.
+    auto single2 = []( const bool& i_valueA, const bool& i_valueB ) { return Max( i_valueA, i_valueB ); };
+    OverloadDispatcher::Invoker invoke2 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< bool > arg0;
+        DispatchArg< bool > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Max( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch2 = []( const BatchArg< bool >& i_valueA, const BatchArg< bool >& i_valueB ) {
+        size_t size     = ResolveBatchSize( {&i_valueA, &i_valueB} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_valueA ),
+                                                  gm_kernels::MakeKernelArg( i_valueB ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Max_bool_bool;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< bool, bool >( invoke2 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single2, pybind11::name( "Max_bool_bool" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch2,
+                                            pybind11::name( "Max_bool_bool" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Max_bool_bool", std::move( dispatcher ), overloads );
+    }
+
+    // Max_Vec2f_Vec2f.
+    auto single3 = []( const Vec2f& i_valueA, const Vec2f& i_valueB ) { return Max( i_valueA, i_valueB ); };
+    OverloadDispatcher::Invoker invoke3 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2f > arg0;
+        DispatchArg< Vec2f > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Max( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch3 = []( const BatchArg< Vec2f >& i_valueA, const BatchArg< Vec2f >& i_valueB ) {
+        size_t size     = ResolveBatchSize( {&i_valueA, &i_valueB} );
+        auto   result   = AllocateBatchResult< Vec2f >( size );
+        Vec2f* o_result = BatchResultData< Vec2f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_valueA ),
+                                                  gm_kernels::MakeKernelArg( i_valueB ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Max_Vec2f_Vec2f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2f, Vec2f >( invoke3 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single3, pybind11::name( "Max_Vec2f_Vec2f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch3,
+                                            pybind11::name( "Max_Vec2f_Vec2f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Max_Vec2f_Vec2f", std::move( dispatcher ), overloads );
+    }
+
+    // Max_Vec3f_Vec3f.
+    auto single4 = []( const Vec3f& i_valueA, const Vec3f& i_valueB ) { return Max( i_valueA, i_valueB ); };
+    OverloadDispatcher::Invoker invoke4 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f > arg0;
+        DispatchArg< Vec3f > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Max( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch4 = []( const BatchArg< Vec3f >& i_valueA, const BatchArg< Vec3f >& i_valueB ) {
+        size_t size     = ResolveBatchSize( {&i_valueA, &i_valueB} );
+        auto   result   = AllocateBatchResult< Vec3f >( size );
+        Vec3f* o_result = BatchResultData< Vec3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_valueA ),
+                                                  gm_kernels::MakeKernelArg( i_valueB ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Max_Vec3f_Vec3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f, Vec3f >( invoke4 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single4, pybind11::name( "Max_Vec3f_Vec3f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch4,
+                                            pybind11::name( "Max_Vec3f_Vec3f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Max_Vec3f_Vec3f", std::move( dispatcher ), overloads );
+    }
+
+    // Max_Vec4f_Vec4f.
+    auto single5 = []( const Vec4f& i_valueA, const Vec4f& i_valueB ) { return Max( i_valueA, i_valueB ); };
+    OverloadDispatcher::Invoker invoke5 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4f > arg0;
+        DispatchArg< Vec4f > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Max( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch5 = []( const BatchArg< Vec4f >& i_valueA, const BatchArg< Vec4f >& i_valueB ) {
+        size_t size     = ResolveBatchSize( {&i_valueA, &i_valueB} );
+        auto   result   = AllocateBatchResult< Vec4f >( size );
+        Vec4f* o_result = BatchResultData< Vec4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_valueA ),
+                                                  gm_kernels::MakeKernelArg( i_valueB ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Max_Vec4f_Vec4f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4f, Vec4f >( invoke5 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single5, pybind11::name( "Max_Vec4f_Vec4f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch5,
+                                            pybind11::name( "Max_Vec4f_Vec4f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Max_Vec4f_Vec4f", std::move( dispatcher ), overloads );
+    }
+
+    // Max_Vec2i_Vec2i.
+    auto single6 = []( const Vec2i& i_valueA, const Vec2i& i_valueB ) { return Max( i_valueA, i_valueB ); };
+    OverloadDispatcher::Invoker invoke6 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2i > arg0;
+        DispatchArg< Vec2i > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Max( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch6 = []( const BatchArg< Vec2i >& i_valueA, const BatchArg< Vec2i >& i_valueB ) {
+        size_t size     = ResolveBatchSize( {&i_valueA, &i_valueB} );
+        auto   result   = AllocateBatchResult< Vec2i >( size );
+        Vec2i* o_result = BatchResultData< Vec2i >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_valueA ),
+                                                  gm_kernels::MakeKernelArg( i_valueB ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Max_Vec2i_Vec2i;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2i, Vec2i >( invoke6 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single6, pybind11::name( "Max_Vec2i_Vec2i" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch6,
+                                            pybind11::name( "Max_Vec2i_Vec2i" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Max_Vec2i_Vec2i", std::move( dispatcher ), overloads );
+    }
+
+    // Max_Vec3i_Vec3i.
+    auto single7 = []( const Vec3i& i_valueA, const Vec3i& i_valueB ) { return Max( i_valueA, i_valueB ); };
+    OverloadDispatcher::Invoker invoke7 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3i > arg0;
+        DispatchArg< Vec3i > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Max( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch7 = []( const BatchArg< Vec3i >& i_valueA, const BatchArg< Vec3i >& i_valueB ) {
+        size_t size     = ResolveBatchSize( {&i_valueA, &i_valueB} );
+        auto   result   = AllocateBatchResult< Vec3i >( size );
+        Vec3i* o_result = BatchResultData< Vec3i >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_valueA ),
+                                                  gm_kernels::MakeKernelArg( i_valueB ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Max_Vec3i_Vec3i;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3i, Vec3i >( invoke7 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single7, pybind11::name( "Max_Vec3i_Vec3i" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch7,
+                                            pybind11::name( "Max_Vec3i_Vec3i" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Max_Vec3i_Vec3i", std::move( dispatcher ), overloads );
+    }
+
+    // Max_Vec4i_Vec4i.
+    auto single8 = []( const Vec4i& i_valueA, const Vec4i& i_valueB ) { return Max( i_valueA, i_valueB ); };
+    OverloadDispatcher::Invoker invoke8 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4i > arg0;
+        DispatchArg< Vec4i > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Max( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch8 = []( const BatchArg< Vec4i >& i_valueA, const BatchArg< Vec4i >& i_valueB ) {
+        size_t size     = ResolveBatchSize( {&i_valueA, &i_valueB} );
+        auto   result   = AllocateBatchResult< Vec4i >( size );
+        Vec4i* o_result = BatchResultData< Vec4i >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_valueA ),
+                                                  gm_kernels::MakeKernelArg( i_valueB ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Max_Vec4i_Vec4i;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4i, Vec4i >( invoke8 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single8, pybind11::name( "Max_Vec4i_Vec4i" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch8,
+                                            pybind11::name( "Max_Vec4i_Vec4i" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Max_Vec4i_Vec4i", std::move( dispatcher ), overloads );
+    }
+
+    // Max_Mat3f_Mat3f.
+    auto single9 = []( const Mat3f& i_valueA, const Mat3f& i_valueB ) { return Max( i_valueA, i_valueB ); };
+    OverloadDispatcher::Invoker invoke9 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat3f > arg0;
+        DispatchArg< Mat3f > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Max( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch9 = []( const BatchArg< Mat3f >& i_valueA, const BatchArg< Mat3f >& i_valueB ) {
+        size_t size     = ResolveBatchSize( {&i_valueA, &i_valueB} );
+        auto   result   = AllocateBatchResult< Mat3f >( size );
+        Mat3f* o_result = BatchResultData< Mat3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_valueA ),
+                                                  gm_kernels::MakeKernelArg( i_valueB ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Max_Mat3f_Mat3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat3f, Mat3f >( invoke9 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single9, pybind11::name( "Max_Mat3f_Mat3f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch9,
+                                            pybind11::name( "Max_Mat3f_Mat3f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Max_Mat3f_Mat3f", std::move( dispatcher ), overloads );
+    }
+
+    // Max_Mat4f_Mat4f.
+    auto single10 = []( const Mat4f& i_valueA, const Mat4f& i_valueB ) { return Max( i_valueA, i_valueB ); };
+    OverloadDispatcher::Invoker invoke10 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat4f > arg0;
+        DispatchArg< Mat4f > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( Max( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch10 = []( const BatchArg< Mat4f >& i_valueA, const BatchArg< Mat4f >& i_valueB ) {
+        size_t size     = ResolveBatchSize( {&i_valueA, &i_valueB} );
+        auto   result   = AllocateBatchResult< Mat4f >( size );
+        Mat4f* o_result = BatchResultData< Mat4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_valueA ),
+                                                  gm_kernels::MakeKernelArg( i_valueB ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().Max_Mat4f_Mat4f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat4f, Mat4f >( invoke10 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single10, pybind11::name( "Max_Mat4f_Mat4f" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch10,
+                                            pybind11::name( "Max_Mat4f_Mat4f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "Max_Mat4f_Mat4f", std::move( dispatcher ), overloads );
+    }
+
+    // Max, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< float, float >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< int, int >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< bool, bool >( invoke2 );
+    overloads = pybind11::cpp_function( single2,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2f, Vec2f >( invoke3 );
+    overloads = pybind11::cpp_function( single3,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3f, Vec3f >( invoke4 );
+    overloads = pybind11::cpp_function( single4,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4f, Vec4f >( invoke5 );
+    overloads = pybind11::cpp_function( single5,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2i, Vec2i >( invoke6 );
+    overloads = pybind11::cpp_function( single6,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3i, Vec3i >( invoke7 );
+    overloads = pybind11::cpp_function( single7,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4i, Vec4i >( invoke8 );
+    overloads = pybind11::cpp_function( single8,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Mat3f, Mat3f >( invoke9 );
+    overloads = pybind11::cpp_function( single9,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Mat4f, Mat4f >( invoke10 );
+    overloads = pybind11::cpp_function( single10,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch2,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch3,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch4,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch5,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch6,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch7,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch8,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch9,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch10,
+                                        pybind11::name( "Max" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "Max", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
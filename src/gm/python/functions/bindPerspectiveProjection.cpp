@@ -6,23 +6,165 @@
 
 #include <gm/functions/perspectiveProjection.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for PerspectiveProjection.
 
 GM_NS_USING
 
 void BindPerspectiveProjection( pybind11::module& o_module )
 {
-    o_module.def(
-        "PerspectiveProjection",
-        []( const float& i_left,
-            const float& i_right,
-            const float& i_bottom,
-            const float& i_top,
-            const float& i_near,
-            const float& i_far ) { return PerspectiveProjection( i_left, i_right, i_bottom, i_top, i_near, i_far ); } );
-    o_module.def(
-        "PerspectiveProjection",
+    // PerspectiveProjection_float_float_float_float_float_float.
+    auto single0 = []( const float& i_left,
+                       const float& i_right,
+                       const float& i_bottom,
+                       const float& i_top,
+                       const float& i_near,
+                       const float& i_far ) {
+        return PerspectiveProjection( i_left, i_right, i_bottom, i_top, i_near, i_far );
+    };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< float > arg0;
+        DispatchArg< float > arg1;
+        DispatchArg< float > arg2;
+        DispatchArg< float > arg3;
+        DispatchArg< float > arg4;
+        DispatchArg< float > arg5;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) || !arg4.Load( i_args[ 4 ] ) || !arg5.Load( i_args[ 5 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult(
+            PerspectiveProjection( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get(), arg4.Get(), arg5.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< float >& i_left,
+                      const BatchArg< float >& i_right,
+                      const BatchArg< float >& i_bottom,
+                      const BatchArg< float >& i_top,
+                      const BatchArg< float >& i_near,
+                      const BatchArg< float >& i_far ) {
+        size_t size     = ResolveBatchSize( {&i_left, &i_right, &i_bottom, &i_top, &i_near, &i_far} );
+        auto   result   = AllocateBatchResult< Mat4f >( size );
+        Mat4f* o_result = BatchResultData< Mat4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_left ),
+                                                  gm_kernels::MakeKernelArg( i_right ),
+                                                  gm_kernels::MakeKernelArg( i_bottom ),
+                                                  gm_kernels::MakeKernelArg( i_top ),
+                                                  gm_kernels::MakeKernelArg( i_near ),
+                                                  gm_kernels::MakeKernelArg( i_far ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet().PerspectiveProjection_float_float_float_float_float_float;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< float, float, float, float, float, float >( invoke0 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single0,
+                                    pybind11::name( "PerspectiveProjection_float_float_float_float_float_float" ),
+                                    pybind11::scope( o_module ) );
+        overloads =
+            pybind11::cpp_function( batch0,
+                                    pybind11::name( "PerspectiveProjection_float_float_float_float_float_float" ),
+                                    pybind11::scope( o_module ),
+                                    pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "PerspectiveProjection_float_float_float_float_float_float",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // PerspectiveProjection_float_float_float_float.
+    auto single1 =
         []( const float& i_fieldOfView, const float& i_aspectRatio, const float& i_near, const float& i_far ) {
             return PerspectiveProjection( i_fieldOfView, i_aspectRatio, i_near, i_far );
-        } );
+        };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< float > arg0;
+        DispatchArg< float > arg1;
+        DispatchArg< float > arg2;
+        DispatchArg< float > arg3;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( PerspectiveProjection( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< float >& i_fieldOfView,
+                      const BatchArg< float >& i_aspectRatio,
+                      const BatchArg< float >& i_near,
+                      const BatchArg< float >& i_far ) {
+        size_t size     = ResolveBatchSize( {&i_fieldOfView, &i_aspectRatio, &i_near, &i_far} );
+        auto   result   = AllocateBatchResult< Mat4f >( size );
+        Mat4f* o_result = BatchResultData< Mat4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_fieldOfView ),
+                                                  gm_kernels::MakeKernelArg( i_aspectRatio ),
+                                                  gm_kernels::MakeKernelArg( i_near ),
+                                                  gm_kernels::MakeKernelArg( i_far ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().PerspectiveProjection_float_float_float_float;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< float, float, float, float >( invoke1 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single1,
+                                    pybind11::name( "PerspectiveProjection_float_float_float_float" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch1,
+                                            pybind11::name( "PerspectiveProjection_float_float_float_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "PerspectiveProjection_float_float_float_float",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // PerspectiveProjection, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< float, float, float, float, float, float >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "PerspectiveProjection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< float, float, float, float >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "PerspectiveProjection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "PerspectiveProjection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "PerspectiveProjection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "PerspectiveProjection", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
@@ -6,13 +6,85 @@
 
 #include <gm/functions/quadraticRoots.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for QuadraticRoots.
 
 GM_NS_USING
 
 void BindQuadraticRoots( pybind11::module& o_module )
 {
-    o_module.def( "QuadraticRoots", []( const float& i_a, const float& i_b, const float& i_c, Vec2f& o_roots ) {
+    // QuadraticRoots_float_float_float_Vec2f.
+    auto single0 = []( const float& i_a, const float& i_b, const float& i_c, Vec2f& o_roots ) {
         return QuadraticRoots( i_a, i_b, i_c, o_roots );
-    } );
+    };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< float > arg0;
+        DispatchArg< float > arg1;
+        DispatchArg< float > arg2;
+        DispatchArg< Vec2f > arg3;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( QuadraticRoots( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< float >&        i_a,
+                      const BatchArg< float >&        i_b,
+                      const BatchArg< float >&        i_c,
+                      const MutableBatchArg< Vec2f >& o_roots ) {
+        size_t size     = ResolveBatchSize( {&i_a, &i_b, &i_c, &o_roots} );
+        auto   result   = AllocateBatchResult< int >( size );
+        int*   o_result = BatchResultData< int >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_a ),
+                                                  gm_kernels::MakeKernelArg( i_b ),
+                                                  gm_kernels::MakeKernelArg( i_c ),
+                                                  gm_kernels::MakeKernelArg( o_roots ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().QuadraticRoots_float_float_float_Vec2f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< float, float, float, Vec2f >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "QuadraticRoots_float_float_float_Vec2f" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "QuadraticRoots_float_float_float_Vec2f" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "QuadraticRoots_float_float_float_Vec2f",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // QuadraticRoots, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< float, float, float, Vec2f >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "QuadraticRoots" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "QuadraticRoots" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "QuadraticRoots", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
@@ -6,12 +6,117 @@
 
 #include <gm/functions/randomNumber.h>
 
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for RandomNumber.
 
 GM_NS_USING
 
 void BindRandomNumber( pybind11::module& o_module )
 {
-    o_module.def( "RandomNumber", []( const FloatRange& i_range ) { return RandomNumber( i_range ); } );
-    o_module.def( "RandomNumber", []( const IntRange& i_range ) { return RandomNumber( i_range ); } );
+    // RandomNumber_FloatRange.
+    auto                        single0 = []( const FloatRange& i_range ) { return RandomNumber( i_range ); };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< FloatRange > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( RandomNumber( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL.
+    auto batch0 = []( const BatchArg< FloatRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_range} );
+        auto   result   = AllocateBatchResult< float >( size );
+        float* o_result = BatchResultData< float >( result );
+        {
+            pybind11::gil_scoped_release release;
+            // Executed serially, see Function.parallel in codeGen/functions.py.
+            for ( size_t index = 0; index < size; ++index )
+            {
+                o_result[ index ] = RandomNumber( i_range[ index ] );
+            }
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< FloatRange >( invoke0 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single0, pybind11::name( "RandomNumber_FloatRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch0,
+                                            pybind11::name( "RandomNumber_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "RandomNumber_FloatRange", std::move( dispatcher ), overloads );
+    }
+
+    // RandomNumber_IntRange.
+    auto                        single1 = []( const IntRange& i_range ) { return RandomNumber( i_range ); };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< IntRange > arg0;
+        if ( !arg0.Load( i_args[ 0 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( RandomNumber( arg0.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL.
+    auto batch1 = []( const BatchArg< IntRange >& i_range ) {
+        size_t size     = ResolveBatchSize( {&i_range} );
+        auto   result   = AllocateBatchResult< int >( size );
+        int*   o_result = BatchResultData< int >( result );
+        {
+            pybind11::gil_scoped_release release;
+            // Executed serially, see Function.parallel in codeGen/functions.py.
+            for ( size_t index = 0; index < size; ++index )
+            {
+                o_result[ index ] = RandomNumber( i_range[ index ] );
+            }
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< IntRange >( invoke1 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single1, pybind11::name( "RandomNumber_IntRange" ), pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch1,
+                                            pybind11::name( "RandomNumber_IntRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "RandomNumber_IntRange", std::move( dispatcher ), overloads );
+    }
+
+    // RandomNumber, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< FloatRange >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "RandomNumber" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< IntRange >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "RandomNumber" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "RandomNumber" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "RandomNumber" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "RandomNumber", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
@@ -6,31 +6,260 @@
 
 #include <gm/functions/rayAABBIntersection.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for RayAABBIntersection.
 
 GM_NS_USING
 
 void BindRayAABBIntersection( pybind11::module& o_module )
 {
-    o_module.def( "RayAABBIntersection",
-                  []( const Vec2f&      i_rayOrigin,
-                      const Vec2f&      i_rayDirection,
-                      const Vec2fRange& i_aabb,
-                      FloatRange&       o_intersections ) {
-                      return RayAABBIntersection( i_rayOrigin, i_rayDirection, i_aabb, o_intersections );
-                  } );
-    o_module.def( "RayAABBIntersection",
-                  []( const Vec3f&      i_rayOrigin,
-                      const Vec3f&      i_rayDirection,
-                      const Vec3fRange& i_aabb,
-                      FloatRange&       o_intersections ) {
-                      return RayAABBIntersection( i_rayOrigin, i_rayDirection, i_aabb, o_intersections );
-                  } );
-    o_module.def( "RayAABBIntersection",
-                  []( const Vec4f&      i_rayOrigin,
-                      const Vec4f&      i_rayDirection,
-                      const Vec4fRange& i_aabb,
-                      FloatRange&       o_intersections ) {
-                      return RayAABBIntersection( i_rayOrigin, i_rayDirection, i_aabb, o_intersections );
-                  } );
+    // RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRange.
+    auto single0 = []( const Vec2f&      i_rayOrigin,
+                       const Vec2f&      i_rayDirection,
+                       const Vec2fRange& i_aabb,
+                       FloatRange&       o_intersections ) {
+        return RayAABBIntersection( i_rayOrigin, i_rayDirection, i_aabb, o_intersections );
+    };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2f >      arg0;
+        DispatchArg< Vec2f >      arg1;
+        DispatchArg< Vec2fRange > arg2;
+        DispatchArg< FloatRange > arg3;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( RayAABBIntersection( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< Vec2f >&             i_rayOrigin,
+                      const BatchArg< Vec2f >&             i_rayDirection,
+                      const BatchArg< Vec2fRange >&        i_aabb,
+                      const MutableBatchArg< FloatRange >& o_intersections ) {
+        size_t size     = ResolveBatchSize( {&i_rayOrigin, &i_rayDirection, &i_aabb, &o_intersections} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_rayOrigin ),
+                                                  gm_kernels::MakeKernelArg( i_rayDirection ),
+                                                  gm_kernels::MakeKernelArg( i_aabb ),
+                                                  gm_kernels::MakeKernelArg( o_intersections ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet().RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2f, Vec2f, Vec2fRange, FloatRange >( invoke0 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single0,
+                                    pybind11::name( "RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRange" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch0,
+                                            pybind11::name( "RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRange.
+    auto single1 = []( const Vec3f&      i_rayOrigin,
+                       const Vec3f&      i_rayDirection,
+                       const Vec3fRange& i_aabb,
+                       FloatRange&       o_intersections ) {
+        return RayAABBIntersection( i_rayOrigin, i_rayDirection, i_aabb, o_intersections );
+    };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f >      arg0;
+        DispatchArg< Vec3f >      arg1;
+        DispatchArg< Vec3fRange > arg2;
+        DispatchArg< FloatRange > arg3;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( RayAABBIntersection( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< Vec3f >&             i_rayOrigin,
+                      const BatchArg< Vec3f >&             i_rayDirection,
+                      const BatchArg< Vec3fRange >&        i_aabb,
+                      const MutableBatchArg< FloatRange >& o_intersections ) {
+        size_t size     = ResolveBatchSize( {&i_rayOrigin, &i_rayDirection, &i_aabb, &o_intersections} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_rayOrigin ),
+                                                  gm_kernels::MakeKernelArg( i_rayDirection ),
+                                                  gm_kernels::MakeKernelArg( i_aabb ),
+                                                  gm_kernels::MakeKernelArg( o_intersections ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet().RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f, Vec3f, Vec3fRange, FloatRange >( invoke1 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single1,
+                                    pybind11::name( "RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRange" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch1,
+                                            pybind11::name( "RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRange.
+    auto single2 = []( const Vec4f&      i_rayOrigin,
+                       const Vec4f&      i_rayDirection,
+                       const Vec4fRange& i_aabb,
+                       FloatRange&       o_intersections ) {
+        return RayAABBIntersection( i_rayOrigin, i_rayDirection, i_aabb, o_intersections );
+    };
+    OverloadDispatcher::Invoker invoke2 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4f >      arg0;
+        DispatchArg< Vec4f >      arg1;
+        DispatchArg< Vec4fRange > arg2;
+        DispatchArg< FloatRange > arg3;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( RayAABBIntersection( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch2 = []( const BatchArg< Vec4f >&             i_rayOrigin,
+                      const BatchArg< Vec4f >&             i_rayDirection,
+                      const BatchArg< Vec4fRange >&        i_aabb,
+                      const MutableBatchArg< FloatRange >& o_intersections ) {
+        size_t size     = ResolveBatchSize( {&i_rayOrigin, &i_rayDirection, &i_aabb, &o_intersections} );
+        auto   result   = AllocateBatchResult< bool >( size );
+        bool*  o_result = BatchResultData< bool >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_rayOrigin ),
+                                                  gm_kernels::MakeKernelArg( i_rayDirection ),
+                                                  gm_kernels::MakeKernelArg( i_aabb ),
+                                                  gm_kernels::MakeKernelArg( o_intersections ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet().RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4f, Vec4f, Vec4fRange, FloatRange >( invoke2 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single2,
+                                    pybind11::name( "RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRange" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch2,
+                                            pybind11::name( "RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // RayAABBIntersection_Ray_Vec3fRange_FloatRange.
+    auto single3 = []( const Ray& i_ray, const Vec3fRange& i_aabb, FloatRange& o_intersections ) {
+        return RayAABBIntersection( i_ray, i_aabb, o_intersections );
+    };
+    OverloadDispatcher::Invoker invoke3 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Ray >        arg0;
+        DispatchArg< Vec3fRange > arg1;
+        DispatchArg< FloatRange > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( RayAABBIntersection( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Ray, Vec3fRange, FloatRange >( invoke3 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single3,
+                                    pybind11::name( "RayAABBIntersection_Ray_Vec3fRange_FloatRange" ),
+                                    pybind11::scope( o_module ) );
+        OverloadDispatcher::Define( o_module,
+                                    "RayAABBIntersection_Ray_Vec3fRange_FloatRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // RayAABBIntersection, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< Vec2f, Vec2f, Vec2fRange, FloatRange >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "RayAABBIntersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3f, Vec3f, Vec3fRange, FloatRange >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "RayAABBIntersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4f, Vec4f, Vec4fRange, FloatRange >( invoke2 );
+    overloads = pybind11::cpp_function( single2,
+                                        pybind11::name( "RayAABBIntersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Ray, Vec3fRange, FloatRange >( invoke3 );
+    overloads = pybind11::cpp_function( single3,
+                                        pybind11::name( "RayAABBIntersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "RayAABBIntersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "RayAABBIntersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch2,
+                                        pybind11::name( "RayAABBIntersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "RayAABBIntersection", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
@@ -6,16 +6,134 @@
 
 #include <gm/functions/rayPosition.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for RayPosition.
 
 GM_NS_USING
 
 void BindRayPosition( pybind11::module& o_module )
 {
-    o_module.def( "RayPosition", []( const Vec2f& i_origin, const Vec2f& i_direction, const float& i_magnitude ) {
+    // RayPosition_Vec2f_Vec2f_float.
+    auto single0 = []( const Vec2f& i_origin, const Vec2f& i_direction, const float& i_magnitude ) {
         return RayPosition( i_origin, i_direction, i_magnitude );
-    } );
-    o_module.def( "RayPosition", []( const Vec3f& i_origin, const Vec3f& i_direction, const float& i_magnitude ) {
+    };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2f > arg0;
+        DispatchArg< Vec2f > arg1;
+        DispatchArg< float > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( RayPosition( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< Vec2f >& i_origin,
+                      const BatchArg< Vec2f >& i_direction,
+                      const BatchArg< float >& i_magnitude ) {
+        size_t size     = ResolveBatchSize( {&i_origin, &i_direction, &i_magnitude} );
+        auto   result   = AllocateBatchResult< Vec2f >( size );
+        Vec2f* o_result = BatchResultData< Vec2f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_origin ),
+                                                  gm_kernels::MakeKernelArg( i_direction ),
+                                                  gm_kernels::MakeKernelArg( i_magnitude ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().RayPosition_Vec2f_Vec2f_float;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2f, Vec2f, float >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "RayPosition_Vec2f_Vec2f_float" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "RayPosition_Vec2f_Vec2f_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "RayPosition_Vec2f_Vec2f_float", std::move( dispatcher ), overloads );
+    }
+
+    // RayPosition_Vec3f_Vec3f_float.
+    auto single1 = []( const Vec3f& i_origin, const Vec3f& i_direction, const float& i_magnitude ) {
         return RayPosition( i_origin, i_direction, i_magnitude );
-    } );
+    };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f > arg0;
+        DispatchArg< Vec3f > arg1;
+        DispatchArg< float > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( RayPosition( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< Vec3f >& i_origin,
+                      const BatchArg< Vec3f >& i_direction,
+                      const BatchArg< float >& i_magnitude ) {
+        size_t size     = ResolveBatchSize( {&i_origin, &i_direction, &i_magnitude} );
+        auto   result   = AllocateBatchResult< Vec3f >( size );
+        Vec3f* o_result = BatchResultData< Vec3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_origin ),
+                                                  gm_kernels::MakeKernelArg( i_direction ),
+                                                  gm_kernels::MakeKernelArg( i_magnitude ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().RayPosition_Vec3f_Vec3f_float;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f, Vec3f, float >( invoke1 );
+        pybind11::object overloads = pybind11::cpp_function( single1,
+                                                             pybind11::name( "RayPosition_Vec3f_Vec3f_float" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch1,
+                                            pybind11::name( "RayPosition_Vec3f_Vec3f_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "RayPosition_Vec3f_Vec3f_float", std::move( dispatcher ), overloads );
+    }
+
+    // RayPosition, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< Vec2f, Vec2f, float >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "RayPosition" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3f, Vec3f, float >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "RayPosition" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "RayPosition" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "RayPosition" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "RayPosition", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
@@ -6,22 +6,97 @@
 
 #include <gm/functions/raySphereIntersection.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for RaySphereIntersection.
 
 GM_NS_USING
 
 void BindRaySphereIntersection( pybind11::module& o_module )
 {
-    o_module.def( "RaySphereIntersection",
-                  []( const Vec3f& i_sphereOrigin,
-                      const float& i_sphereRadius,
-                      const Vec3f& i_rayOrigin,
-                      const Vec3f& i_rayDirection,
-                      FloatRange&  o_intersections ) {
-                      return RaySphereIntersection( i_sphereOrigin,
-                                                    i_sphereRadius,
-                                                    i_rayOrigin,
-                                                    i_rayDirection,
-                                                    o_intersections );
-                  } );
+    // RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRange.
+    auto single0 = []( const Vec3f& i_sphereOrigin,
+                       const float& i_sphereRadius,
+                       const Vec3f& i_rayOrigin,
+                       const Vec3f& i_rayDirection,
+                       FloatRange&  o_intersections ) {
+        return RaySphereIntersection( i_sphereOrigin, i_sphereRadius, i_rayOrigin, i_rayDirection, o_intersections );
+    };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f >      arg0;
+        DispatchArg< float >      arg1;
+        DispatchArg< Vec3f >      arg2;
+        DispatchArg< Vec3f >      arg3;
+        DispatchArg< FloatRange > arg4;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) || !arg4.Load( i_args[ 4 ] ) )
+        {
+            return false;
+        }
+        *o_result =
+            DispatchResult( RaySphereIntersection( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get(), arg4.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< Vec3f >&             i_sphereOrigin,
+                      const BatchArg< float >&             i_sphereRadius,
+                      const BatchArg< Vec3f >&             i_rayOrigin,
+                      const BatchArg< Vec3f >&             i_rayDirection,
+                      const MutableBatchArg< FloatRange >& o_intersections ) {
+        size_t size =
+            ResolveBatchSize( {&i_sphereOrigin, &i_sphereRadius, &i_rayOrigin, &i_rayDirection, &o_intersections} );
+        auto result   = AllocateBatchResult< int >( size );
+        int* o_result = BatchResultData< int >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_sphereOrigin ),
+                                                  gm_kernels::MakeKernelArg( i_sphereRadius ),
+                                                  gm_kernels::MakeKernelArg( i_rayOrigin ),
+                                                  gm_kernels::MakeKernelArg( i_rayDirection ),
+                                                  gm_kernels::MakeKernelArg( o_intersections ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet().RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f, float, Vec3f, Vec3f, FloatRange >( invoke0 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single0,
+                                    pybind11::name( "RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRange" ),
+                                    pybind11::scope( o_module ) );
+        overloads =
+            pybind11::cpp_function( batch0,
+                                    pybind11::name( "RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRange" ),
+                                    pybind11::scope( o_module ),
+                                    pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRange",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // RaySphereIntersection, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< Vec3f, float, Vec3f, Vec3f, FloatRange >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "RaySphereIntersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "RaySphereIntersection" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "RaySphereIntersection", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
@@ -0,0 +1,87 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <pybind11/pybind11.h>
+
+#include <gm/functions/sphericalLinearInterpolation.h>
+
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
+// Python bindings for SphericalLinearInterpolation.
+
+GM_NS_USING
+
+void BindSphericalLinearInterpolation( pybind11::module& o_module )
+{
+    // SphericalLinearInterpolation_Quatf_Quatf_float.
+    auto single0 = []( const Quatf& i_source, const Quatf& i_target, const float& i_weight ) {
+        return SphericalLinearInterpolation( i_source, i_target, i_weight );
+    };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Quatf > arg0;
+        DispatchArg< Quatf > arg1;
+        DispatchArg< float > arg2;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( SphericalLinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< Quatf >& i_source,
+                      const BatchArg< Quatf >& i_target,
+                      const BatchArg< float >& i_weight ) {
+        size_t size     = ResolveBatchSize( {&i_source, &i_target, &i_weight} );
+        auto   result   = AllocateBatchResult< Quatf >( size );
+        Quatf* o_result = BatchResultData< Quatf >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_source ),
+                                                  gm_kernels::MakeKernelArg( i_target ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().SphericalLinearInterpolation_Quatf_Quatf_float;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Quatf, Quatf, float >( invoke0 );
+        pybind11::object overloads =
+            pybind11::cpp_function( single0,
+                                    pybind11::name( "SphericalLinearInterpolation_Quatf_Quatf_float" ),
+                                    pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function( batch0,
+                                            pybind11::name( "SphericalLinearInterpolation_Quatf_Quatf_float" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "SphericalLinearInterpolation_Quatf_Quatf_float",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // SphericalLinearInterpolation, dispatching calls on the types of single value arguments.  Other calls are resolved
+    // by pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< Quatf, Quatf, float >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "SphericalLinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "SphericalLinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "SphericalLinearInterpolation", std::move( dispatcher ), overloads );
+}
\ No newline at end of file
@@ -6,12 +6,72 @@
 
 #include <gm/functions/transformAABB.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for TransformAABB.
 
 GM_NS_USING
 
 void BindTransformAABB( pybind11::module& o_module )
 {
-    o_module.def( "TransformAABB",
-                  []( const Mat4f& i_matrix, const Vec3fRange& i_aabb ) { return TransformAABB( i_matrix, i_aabb ); } );
+    // TransformAABB_Mat4f_Vec3fRange.
+    auto single0 = []( const Mat4f& i_matrix, const Vec3fRange& i_aabb ) { return TransformAABB( i_matrix, i_aabb ); };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat4f >      arg0;
+        DispatchArg< Vec3fRange > arg1;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( TransformAABB( arg0.Get(), arg1.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< Mat4f >& i_matrix, const BatchArg< Vec3fRange >& i_aabb ) {
+        size_t      size     = ResolveBatchSize( {&i_matrix, &i_aabb} );
+        auto        result   = AllocateBatchResult< Vec3fRange >( size );
+        Vec3fRange* o_result = BatchResultData< Vec3fRange >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_matrix ),
+                                                  gm_kernels::MakeKernelArg( i_aabb ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel = gm_kernels::GetActiveKernelSet().TransformAABB_Mat4f_Vec3fRange;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat4f, Vec3fRange >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function( single0,
+                                                             pybind11::name( "TransformAABB_Mat4f_Vec3fRange" ),
+                                                             pybind11::scope( o_module ) );
+        overloads                  = pybind11::cpp_function( batch0,
+                                            pybind11::name( "TransformAABB_Mat4f_Vec3fRange" ),
+                                            pybind11::scope( o_module ),
+                                            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module, "TransformAABB_Mat4f_Vec3fRange", std::move( dispatcher ), overloads );
+    }
+
+    // TransformAABB, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< Mat4f, Vec3fRange >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "TransformAABB" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "TransformAABB" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "TransformAABB", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
@@ -6,130 +6,712 @@
 
 #include <gm/functions/trilinearInterpolation.h>
 
+#include "../kernels/kernels.h"
+#include "batch.h"
+#include "dispatch.h"
+
+#include <memory>
+
 // Python bindings for TrilinearInterpolation.
 
 GM_NS_USING
 
 void BindTrilinearInterpolation( pybind11::module& o_module )
 {
-    o_module.def( "TrilinearInterpolation",
-                  []( const float& i_corner000,
-                      const float& i_corner100,
-                      const float& i_corner010,
-                      const float& i_corner110,
-                      const float& i_corner001,
-                      const float& i_corner101,
-                      const float& i_corner011,
-                      const float& i_corner111,
-                      const Vec3f& i_weight ) {
-                      return TrilinearInterpolation( i_corner000,
-                                                     i_corner100,
-                                                     i_corner010,
-                                                     i_corner110,
-                                                     i_corner001,
-                                                     i_corner101,
-                                                     i_corner011,
-                                                     i_corner111,
-                                                     i_weight );
-                  } );
-    o_module.def( "TrilinearInterpolation",
-                  []( const Mat3f& i_corner000,
-                      const Mat3f& i_corner100,
-                      const Mat3f& i_corner010,
-                      const Mat3f& i_corner110,
-                      const Mat3f& i_corner001,
-                      const Mat3f& i_corner101,
-                      const Mat3f& i_corner011,
-                      const Mat3f& i_corner111,
-                      const Vec3f& i_weight ) {
-                      return TrilinearInterpolation( i_corner000,
-                                                     i_corner100,
-                                                     i_corner010,
-                                                     i_corner110,
-                                                     i_corner001,
-                                                     i_corner101,
-                                                     i_corner011,
-                                                     i_corner111,
-                                                     i_weight );
-                  } );
-    o_module.def( "TrilinearInterpolation",
-                  []( const Mat4f& i_corner000,
-                      const Mat4f& i_corner100,
-                      const Mat4f& i_corner010,
-                      const Mat4f& i_corner110,
-                      const Mat4f& i_corner001,
-                      const Mat4f& i_corner101,
-                      const Mat4f& i_corner011,
-                      const Mat4f& i_corner111,
-                      const Vec3f& i_weight ) {
-                      return TrilinearInterpolation( i_corner000,
-                                                     i_corner100,
-                                                     i_corner010,
-                                                     i_corner110,
-                                                     i_corner001,
-                                                     i_corner101,
-                                                     i_corner011,
-                                                     i_corner111,
-                                                     i_weight );
-                  } );
-    o_module.def( "TrilinearInterpolation",
-                  []( const Vec2f& i_corner000,
-                      const Vec2f& i_corner100,
-                      const Vec2f& i_corner010,
-                      const Vec2f& i_corner110,
-                      const Vec2f& i_corner001,
-                      const Vec2f& i_corner101,
-                      const Vec2f& i_corner011,
-                      const Vec2f& i_corner111,
-                      const Vec3f& i_weight ) {
-                      return TrilinearInterpolation( i_corner000,
-                                                     i_corner100,
-                                                     i_corner010,
-                                                     i_corner110,
-                                                     i_corner001,
-                                                     i_corner101,
-                                                     i_corner011,
-                                                     i_corner111,
-                                                     i_weight );
-                  } );
-    o_module.def( "TrilinearInterpolation",
-                  []( const Vec3f& i_corner000,
-                      const Vec3f& i_corner100,
-                      const Vec3f& i_corner010,
-                      const Vec3f& i_corner110,
-                      const Vec3f& i_corner001,
-                      const Vec3f& i_corner101,
-                      const Vec3f& i_corner011,
-                      const Vec3f& i_corner111,
-                      const Vec3f& i_weight ) {
-                      return TrilinearInterpolation( i_corner000,
-                                                     i_corner100,
-                                                     i_corner010,
-                                                     i_corner110,
-                                                     i_corner001,
-                                                     i_corner101,
-                                                     i_corner011,
-                                                     i_corner111,
-                                                     i_weight );
-                  } );
-    o_module.def( "TrilinearInterpolation",
-                  []( const Vec4f& i_corner000,
-                      const Vec4f& i_corner100,
-                      const Vec4f& i_corner010,
-                      const Vec4f& i_corner110,
-                      const Vec4f& i_corner001,
-                      const Vec4f& i_corner101,
-                      const Vec4f& i_corner011,
-                      const Vec4f& i_corner111,
-                      const Vec3f& i_weight ) {
-                      return TrilinearInterpolation( i_corner000,
-                                                     i_corner100,
-                                                     i_corner010,
-                                                     i_corner110,
-                                                     i_corner001,
-                                                     i_corner101,
-                                                     i_corner011,
-                                                     i_corner111,
-                                                     i_weight );
-                  } );
+    // TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f.
+    auto single0 = []( const float& i_corner000,
+                       const float& i_corner100,
+                       const float& i_corner010,
+                       const float& i_corner110,
+                       const float& i_corner001,
+                       const float& i_corner101,
+                       const float& i_corner011,
+                       const float& i_corner111,
+                       const Vec3f& i_weight ) {
+        return TrilinearInterpolation( i_corner000,
+                                       i_corner100,
+                                       i_corner010,
+                                       i_corner110,
+                                       i_corner001,
+                                       i_corner101,
+                                       i_corner011,
+                                       i_corner111,
+                                       i_weight );
+    };
+    OverloadDispatcher::Invoker invoke0 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< float > arg0;
+        DispatchArg< float > arg1;
+        DispatchArg< float > arg2;
+        DispatchArg< float > arg3;
+        DispatchArg< float > arg4;
+        DispatchArg< float > arg5;
+        DispatchArg< float > arg6;
+        DispatchArg< float > arg7;
+        DispatchArg< Vec3f > arg8;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) || !arg4.Load( i_args[ 4 ] ) || !arg5.Load( i_args[ 5 ] ) ||
+             !arg6.Load( i_args[ 6 ] ) || !arg7.Load( i_args[ 7 ] ) || !arg8.Load( i_args[ 8 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( TrilinearInterpolation( arg0.Get(),
+                                                            arg1.Get(),
+                                                            arg2.Get(),
+                                                            arg3.Get(),
+                                                            arg4.Get(),
+                                                            arg5.Get(),
+                                                            arg6.Get(),
+                                                            arg7.Get(),
+                                                            arg8.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch0 = []( const BatchArg< float >& i_corner000,
+                      const BatchArg< float >& i_corner100,
+                      const BatchArg< float >& i_corner010,
+                      const BatchArg< float >& i_corner110,
+                      const BatchArg< float >& i_corner001,
+                      const BatchArg< float >& i_corner101,
+                      const BatchArg< float >& i_corner011,
+                      const BatchArg< float >& i_corner111,
+                      const BatchArg< Vec3f >& i_weight ) {
+        size_t size     = ResolveBatchSize( {&i_corner000,
+                                         &i_corner100,
+                                         &i_corner010,
+                                         &i_corner110,
+                                         &i_corner001,
+                                         &i_corner101,
+                                         &i_corner011,
+                                         &i_corner111,
+                                         &i_weight} );
+        auto   result   = AllocateBatchResult< float >( size );
+        float* o_result = BatchResultData< float >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_corner000 ),
+                                                  gm_kernels::MakeKernelArg( i_corner100 ),
+                                                  gm_kernels::MakeKernelArg( i_corner010 ),
+                                                  gm_kernels::MakeKernelArg( i_corner110 ),
+                                                  gm_kernels::MakeKernelArg( i_corner001 ),
+                                                  gm_kernels::MakeKernelArg( i_corner101 ),
+                                                  gm_kernels::MakeKernelArg( i_corner011 ),
+                                                  gm_kernels::MakeKernelArg( i_corner111 ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet()
+                    .TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< float, float, float, float, float, float, float, float, Vec3f >( invoke0 );
+        pybind11::object overloads = pybind11::cpp_function(
+            single0,
+            pybind11::name( "TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f" ),
+            pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function(
+            batch0,
+            pybind11::name( "TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f" ),
+            pybind11::scope( o_module ),
+            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f.
+    auto single1 = []( const Mat3f& i_corner000,
+                       const Mat3f& i_corner100,
+                       const Mat3f& i_corner010,
+                       const Mat3f& i_corner110,
+                       const Mat3f& i_corner001,
+                       const Mat3f& i_corner101,
+                       const Mat3f& i_corner011,
+                       const Mat3f& i_corner111,
+                       const Vec3f& i_weight ) {
+        return TrilinearInterpolation( i_corner000,
+                                       i_corner100,
+                                       i_corner010,
+                                       i_corner110,
+                                       i_corner001,
+                                       i_corner101,
+                                       i_corner011,
+                                       i_corner111,
+                                       i_weight );
+    };
+    OverloadDispatcher::Invoker invoke1 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat3f > arg0;
+        DispatchArg< Mat3f > arg1;
+        DispatchArg< Mat3f > arg2;
+        DispatchArg< Mat3f > arg3;
+        DispatchArg< Mat3f > arg4;
+        DispatchArg< Mat3f > arg5;
+        DispatchArg< Mat3f > arg6;
+        DispatchArg< Mat3f > arg7;
+        DispatchArg< Vec3f > arg8;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) || !arg4.Load( i_args[ 4 ] ) || !arg5.Load( i_args[ 5 ] ) ||
+             !arg6.Load( i_args[ 6 ] ) || !arg7.Load( i_args[ 7 ] ) || !arg8.Load( i_args[ 8 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( TrilinearInterpolation( arg0.Get(),
+                                                            arg1.Get(),
+                                                            arg2.Get(),
+                                                            arg3.Get(),
+                                                            arg4.Get(),
+                                                            arg5.Get(),
+                                                            arg6.Get(),
+                                                            arg7.Get(),
+                                                            arg8.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch1 = []( const BatchArg< Mat3f >& i_corner000,
+                      const BatchArg< Mat3f >& i_corner100,
+                      const BatchArg< Mat3f >& i_corner010,
+                      const BatchArg< Mat3f >& i_corner110,
+                      const BatchArg< Mat3f >& i_corner001,
+                      const BatchArg< Mat3f >& i_corner101,
+                      const BatchArg< Mat3f >& i_corner011,
+                      const BatchArg< Mat3f >& i_corner111,
+                      const BatchArg< Vec3f >& i_weight ) {
+        size_t size     = ResolveBatchSize( {&i_corner000,
+                                         &i_corner100,
+                                         &i_corner010,
+                                         &i_corner110,
+                                         &i_corner001,
+                                         &i_corner101,
+                                         &i_corner011,
+                                         &i_corner111,
+                                         &i_weight} );
+        auto   result   = AllocateBatchResult< Mat3f >( size );
+        Mat3f* o_result = BatchResultData< Mat3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_corner000 ),
+                                                  gm_kernels::MakeKernelArg( i_corner100 ),
+                                                  gm_kernels::MakeKernelArg( i_corner010 ),
+                                                  gm_kernels::MakeKernelArg( i_corner110 ),
+                                                  gm_kernels::MakeKernelArg( i_corner001 ),
+                                                  gm_kernels::MakeKernelArg( i_corner101 ),
+                                                  gm_kernels::MakeKernelArg( i_corner011 ),
+                                                  gm_kernels::MakeKernelArg( i_corner111 ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet()
+                    .TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat3f, Mat3f, Mat3f, Mat3f, Mat3f, Mat3f, Mat3f, Mat3f, Vec3f >( invoke1 );
+        pybind11::object overloads = pybind11::cpp_function(
+            single1,
+            pybind11::name( "TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f" ),
+            pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function(
+            batch1,
+            pybind11::name( "TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f" ),
+            pybind11::scope( o_module ),
+            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f.
+    auto single2 = []( const Mat4f& i_corner000,
+                       const Mat4f& i_corner100,
+                       const Mat4f& i_corner010,
+                       const Mat4f& i_corner110,
+                       const Mat4f& i_corner001,
+                       const Mat4f& i_corner101,
+                       const Mat4f& i_corner011,
+                       const Mat4f& i_corner111,
+                       const Vec3f& i_weight ) {
+        return TrilinearInterpolation( i_corner000,
+                                       i_corner100,
+                                       i_corner010,
+                                       i_corner110,
+                                       i_corner001,
+                                       i_corner101,
+                                       i_corner011,
+                                       i_corner111,
+                                       i_weight );
+    };
+    OverloadDispatcher::Invoker invoke2 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Mat4f > arg0;
+        DispatchArg< Mat4f > arg1;
+        DispatchArg< Mat4f > arg2;
+        DispatchArg< Mat4f > arg3;
+        DispatchArg< Mat4f > arg4;
+        DispatchArg< Mat4f > arg5;
+        DispatchArg< Mat4f > arg6;
+        DispatchArg< Mat4f > arg7;
+        DispatchArg< Vec3f > arg8;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) || !arg4.Load( i_args[ 4 ] ) || !arg5.Load( i_args[ 5 ] ) ||
+             !arg6.Load( i_args[ 6 ] ) || !arg7.Load( i_args[ 7 ] ) || !arg8.Load( i_args[ 8 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( TrilinearInterpolation( arg0.Get(),
+                                                            arg1.Get(),
+                                                            arg2.Get(),
+                                                            arg3.Get(),
+                                                            arg4.Get(),
+                                                            arg5.Get(),
+                                                            arg6.Get(),
+                                                            arg7.Get(),
+                                                            arg8.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch2 = []( const BatchArg< Mat4f >& i_corner000,
+                      const BatchArg< Mat4f >& i_corner100,
+                      const BatchArg< Mat4f >& i_corner010,
+                      const BatchArg< Mat4f >& i_corner110,
+                      const BatchArg< Mat4f >& i_corner001,
+                      const BatchArg< Mat4f >& i_corner101,
+                      const BatchArg< Mat4f >& i_corner011,
+                      const BatchArg< Mat4f >& i_corner111,
+                      const BatchArg< Vec3f >& i_weight ) {
+        size_t size     = ResolveBatchSize( {&i_corner000,
+                                         &i_corner100,
+                                         &i_corner010,
+                                         &i_corner110,
+                                         &i_corner001,
+                                         &i_corner101,
+                                         &i_corner011,
+                                         &i_corner111,
+                                         &i_weight} );
+        auto   result   = AllocateBatchResult< Mat4f >( size );
+        Mat4f* o_result = BatchResultData< Mat4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_corner000 ),
+                                                  gm_kernels::MakeKernelArg( i_corner100 ),
+                                                  gm_kernels::MakeKernelArg( i_corner010 ),
+                                                  gm_kernels::MakeKernelArg( i_corner110 ),
+                                                  gm_kernels::MakeKernelArg( i_corner001 ),
+                                                  gm_kernels::MakeKernelArg( i_corner101 ),
+                                                  gm_kernels::MakeKernelArg( i_corner011 ),
+                                                  gm_kernels::MakeKernelArg( i_corner111 ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet()
+                    .TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Mat4f, Mat4f, Mat4f, Mat4f, Mat4f, Mat4f, Mat4f, Mat4f, Vec3f >( invoke2 );
+        pybind11::object overloads = pybind11::cpp_function(
+            single2,
+            pybind11::name( "TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f" ),
+            pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function(
+            batch2,
+            pybind11::name( "TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f" ),
+            pybind11::scope( o_module ),
+            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f.
+    auto single3 = []( const Vec2f& i_corner000,
+                       const Vec2f& i_corner100,
+                       const Vec2f& i_corner010,
+                       const Vec2f& i_corner110,
+                       const Vec2f& i_corner001,
+                       const Vec2f& i_corner101,
+                       const Vec2f& i_corner011,
+                       const Vec2f& i_corner111,
+                       const Vec3f& i_weight ) {
+        return TrilinearInterpolation( i_corner000,
+                                       i_corner100,
+                                       i_corner010,
+                                       i_corner110,
+                                       i_corner001,
+                                       i_corner101,
+                                       i_corner011,
+                                       i_corner111,
+                                       i_weight );
+    };
+    OverloadDispatcher::Invoker invoke3 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec2f > arg0;
+        DispatchArg< Vec2f > arg1;
+        DispatchArg< Vec2f > arg2;
+        DispatchArg< Vec2f > arg3;
+        DispatchArg< Vec2f > arg4;
+        DispatchArg< Vec2f > arg5;
+        DispatchArg< Vec2f > arg6;
+        DispatchArg< Vec2f > arg7;
+        DispatchArg< Vec3f > arg8;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) || !arg4.Load( i_args[ 4 ] ) || !arg5.Load( i_args[ 5 ] ) ||
+             !arg6.Load( i_args[ 6 ] ) || !arg7.Load( i_args[ 7 ] ) || !arg8.Load( i_args[ 8 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( TrilinearInterpolation( arg0.Get(),
+                                                            arg1.Get(),
+                                                            arg2.Get(),
+                                                            arg3.Get(),
+                                                            arg4.Get(),
+                                                            arg5.Get(),
+                                                            arg6.Get(),
+                                                            arg7.Get(),
+                                                            arg8.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch3 = []( const BatchArg< Vec2f >& i_corner000,
+                      const BatchArg< Vec2f >& i_corner100,
+                      const BatchArg< Vec2f >& i_corner010,
+                      const BatchArg< Vec2f >& i_corner110,
+                      const BatchArg< Vec2f >& i_corner001,
+                      const BatchArg< Vec2f >& i_corner101,
+                      const BatchArg< Vec2f >& i_corner011,
+                      const BatchArg< Vec2f >& i_corner111,
+                      const BatchArg< Vec3f >& i_weight ) {
+        size_t size     = ResolveBatchSize( {&i_corner000,
+                                         &i_corner100,
+                                         &i_corner010,
+                                         &i_corner110,
+                                         &i_corner001,
+                                         &i_corner101,
+                                         &i_corner011,
+                                         &i_corner111,
+                                         &i_weight} );
+        auto   result   = AllocateBatchResult< Vec2f >( size );
+        Vec2f* o_result = BatchResultData< Vec2f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_corner000 ),
+                                                  gm_kernels::MakeKernelArg( i_corner100 ),
+                                                  gm_kernels::MakeKernelArg( i_corner010 ),
+                                                  gm_kernels::MakeKernelArg( i_corner110 ),
+                                                  gm_kernels::MakeKernelArg( i_corner001 ),
+                                                  gm_kernels::MakeKernelArg( i_corner101 ),
+                                                  gm_kernels::MakeKernelArg( i_corner011 ),
+                                                  gm_kernels::MakeKernelArg( i_corner111 ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet()
+                    .TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec2f, Vec2f, Vec2f, Vec2f, Vec2f, Vec2f, Vec2f, Vec2f, Vec3f >( invoke3 );
+        pybind11::object overloads = pybind11::cpp_function(
+            single3,
+            pybind11::name( "TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f" ),
+            pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function(
+            batch3,
+            pybind11::name( "TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f" ),
+            pybind11::scope( o_module ),
+            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f.
+    auto single4 = []( const Vec3f& i_corner000,
+                       const Vec3f& i_corner100,
+                       const Vec3f& i_corner010,
+                       const Vec3f& i_corner110,
+                       const Vec3f& i_corner001,
+                       const Vec3f& i_corner101,
+                       const Vec3f& i_corner011,
+                       const Vec3f& i_corner111,
+                       const Vec3f& i_weight ) {
+        return TrilinearInterpolation( i_corner000,
+                                       i_corner100,
+                                       i_corner010,
+                                       i_corner110,
+                                       i_corner001,
+                                       i_corner101,
+                                       i_corner011,
+                                       i_corner111,
+                                       i_weight );
+    };
+    OverloadDispatcher::Invoker invoke4 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec3f > arg0;
+        DispatchArg< Vec3f > arg1;
+        DispatchArg< Vec3f > arg2;
+        DispatchArg< Vec3f > arg3;
+        DispatchArg< Vec3f > arg4;
+        DispatchArg< Vec3f > arg5;
+        DispatchArg< Vec3f > arg6;
+        DispatchArg< Vec3f > arg7;
+        DispatchArg< Vec3f > arg8;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) || !arg4.Load( i_args[ 4 ] ) || !arg5.Load( i_args[ 5 ] ) ||
+             !arg6.Load( i_args[ 6 ] ) || !arg7.Load( i_args[ 7 ] ) || !arg8.Load( i_args[ 8 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( TrilinearInterpolation( arg0.Get(),
+                                                            arg1.Get(),
+                                                            arg2.Get(),
+                                                            arg3.Get(),
+                                                            arg4.Get(),
+                                                            arg5.Get(),
+                                                            arg6.Get(),
+                                                            arg7.Get(),
+                                                            arg8.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch4 = []( const BatchArg< Vec3f >& i_corner000,
+                      const BatchArg< Vec3f >& i_corner100,
+                      const BatchArg< Vec3f >& i_corner010,
+                      const BatchArg< Vec3f >& i_corner110,
+                      const BatchArg< Vec3f >& i_corner001,
+                      const BatchArg< Vec3f >& i_corner101,
+                      const BatchArg< Vec3f >& i_corner011,
+                      const BatchArg< Vec3f >& i_corner111,
+                      const BatchArg< Vec3f >& i_weight ) {
+        size_t size     = ResolveBatchSize( {&i_corner000,
+                                         &i_corner100,
+                                         &i_corner010,
+                                         &i_corner110,
+                                         &i_corner001,
+                                         &i_corner101,
+                                         &i_corner011,
+                                         &i_corner111,
+                                         &i_weight} );
+        auto   result   = AllocateBatchResult< Vec3f >( size );
+        Vec3f* o_result = BatchResultData< Vec3f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_corner000 ),
+                                                  gm_kernels::MakeKernelArg( i_corner100 ),
+                                                  gm_kernels::MakeKernelArg( i_corner010 ),
+                                                  gm_kernels::MakeKernelArg( i_corner110 ),
+                                                  gm_kernels::MakeKernelArg( i_corner001 ),
+                                                  gm_kernels::MakeKernelArg( i_corner101 ),
+                                                  gm_kernels::MakeKernelArg( i_corner011 ),
+                                                  gm_kernels::MakeKernelArg( i_corner111 ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet()
+                    .TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec3f, Vec3f, Vec3f, Vec3f, Vec3f, Vec3f, Vec3f, Vec3f, Vec3f >( invoke4 );
+        pybind11::object overloads = pybind11::cpp_function(
+            single4,
+            pybind11::name( "TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f" ),
+            pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function(
+            batch4,
+            pybind11::name( "TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f" ),
+            pybind11::scope( o_module ),
+            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f.
+    auto single5 = []( const Vec4f& i_corner000,
+                       const Vec4f& i_corner100,
+                       const Vec4f& i_corner010,
+                       const Vec4f& i_corner110,
+                       const Vec4f& i_corner001,
+                       const Vec4f& i_corner101,
+                       const Vec4f& i_corner011,
+                       const Vec4f& i_corner111,
+                       const Vec3f& i_weight ) {
+        return TrilinearInterpolation( i_corner000,
+                                       i_corner100,
+                                       i_corner010,
+                                       i_corner110,
+                                       i_corner001,
+                                       i_corner101,
+                                       i_corner011,
+                                       i_corner111,
+                                       i_weight );
+    };
+    OverloadDispatcher::Invoker invoke5 = []( PyObject* const* i_args, PyObject** o_result ) {
+        DispatchArg< Vec4f > arg0;
+        DispatchArg< Vec4f > arg1;
+        DispatchArg< Vec4f > arg2;
+        DispatchArg< Vec4f > arg3;
+        DispatchArg< Vec4f > arg4;
+        DispatchArg< Vec4f > arg5;
+        DispatchArg< Vec4f > arg6;
+        DispatchArg< Vec4f > arg7;
+        DispatchArg< Vec3f > arg8;
+        if ( !arg0.Load( i_args[ 0 ] ) || !arg1.Load( i_args[ 1 ] ) || !arg2.Load( i_args[ 2 ] ) ||
+             !arg3.Load( i_args[ 3 ] ) || !arg4.Load( i_args[ 4 ] ) || !arg5.Load( i_args[ 5 ] ) ||
+             !arg6.Load( i_args[ 6 ] ) || !arg7.Load( i_args[ 7 ] ) || !arg8.Load( i_args[ 8 ] ) )
+        {
+            return false;
+        }
+        *o_result = DispatchResult( TrilinearInterpolation( arg0.Get(),
+                                                            arg1.Get(),
+                                                            arg2.Get(),
+                                                            arg3.Get(),
+                                                            arg4.Get(),
+                                                            arg5.Get(),
+                                                            arg6.Get(),
+                                                            arg7.Get(),
+                                                            arg8.Get() ) );
+        return true;
+    };
+    // The elements are processed without holding the GIL, by the kernel compiled for the instruction set of the host.
+    auto batch5 = []( const BatchArg< Vec4f >& i_corner000,
+                      const BatchArg< Vec4f >& i_corner100,
+                      const BatchArg< Vec4f >& i_corner010,
+                      const BatchArg< Vec4f >& i_corner110,
+                      const BatchArg< Vec4f >& i_corner001,
+                      const BatchArg< Vec4f >& i_corner101,
+                      const BatchArg< Vec4f >& i_corner011,
+                      const BatchArg< Vec4f >& i_corner111,
+                      const BatchArg< Vec3f >& i_weight ) {
+        size_t size     = ResolveBatchSize( {&i_corner000,
+                                         &i_corner100,
+                                         &i_corner010,
+                                         &i_corner110,
+                                         &i_corner001,
+                                         &i_corner101,
+                                         &i_corner011,
+                                         &i_corner111,
+                                         &i_weight} );
+        auto   result   = AllocateBatchResult< Vec4f >( size );
+        Vec4f* o_result = BatchResultData< Vec4f >( result );
+        {
+            pybind11::gil_scoped_release release;
+            const gm_kernels::KernelArg  args[] = {gm_kernels::MakeKernelArg( i_corner000 ),
+                                                  gm_kernels::MakeKernelArg( i_corner100 ),
+                                                  gm_kernels::MakeKernelArg( i_corner010 ),
+                                                  gm_kernels::MakeKernelArg( i_corner110 ),
+                                                  gm_kernels::MakeKernelArg( i_corner001 ),
+                                                  gm_kernels::MakeKernelArg( i_corner101 ),
+                                                  gm_kernels::MakeKernelArg( i_corner011 ),
+                                                  gm_kernels::MakeKernelArg( i_corner111 ),
+                                                  gm_kernels::MakeKernelArg( i_weight ),
+                                                  gm_kernels::MakeKernelArg( o_result )};
+            gm_kernels::Kernel           kernel =
+                gm_kernels::GetActiveKernelSet()
+                    .TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f;
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        }
+        return result;
+    };
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< Vec4f, Vec4f, Vec4f, Vec4f, Vec4f, Vec4f, Vec4f, Vec4f, Vec3f >( invoke5 );
+        pybind11::object overloads = pybind11::cpp_function(
+            single5,
+            pybind11::name( "TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f" ),
+            pybind11::scope( o_module ) );
+        overloads = pybind11::cpp_function(
+            batch5,
+            pybind11::name( "TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f" ),
+            pybind11::scope( o_module ),
+            pybind11::sibling( overloads ) );
+        OverloadDispatcher::Define( o_module,
+                                    "TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f",
+                                    std::move( dispatcher ),
+                                    overloads );
+    }
+
+    // TrilinearInterpolation, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object                      overloads = pybind11::none();
+    dispatcher->AddOverload< float, float, float, float, float, float, float, float, Vec3f >( invoke0 );
+    overloads = pybind11::cpp_function( single0,
+                                        pybind11::name( "TrilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Mat3f, Mat3f, Mat3f, Mat3f, Mat3f, Mat3f, Mat3f, Mat3f, Vec3f >( invoke1 );
+    overloads = pybind11::cpp_function( single1,
+                                        pybind11::name( "TrilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Mat4f, Mat4f, Mat4f, Mat4f, Mat4f, Mat4f, Mat4f, Mat4f, Vec3f >( invoke2 );
+    overloads = pybind11::cpp_function( single2,
+                                        pybind11::name( "TrilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec2f, Vec2f, Vec2f, Vec2f, Vec2f, Vec2f, Vec2f, Vec2f, Vec3f >( invoke3 );
+    overloads = pybind11::cpp_function( single3,
+                                        pybind11::name( "TrilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec3f, Vec3f, Vec3f, Vec3f, Vec3f, Vec3f, Vec3f, Vec3f, Vec3f >( invoke4 );
+    overloads = pybind11::cpp_function( single4,
+                                        pybind11::name( "TrilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    dispatcher->AddOverload< Vec4f, Vec4f, Vec4f, Vec4f, Vec4f, Vec4f, Vec4f, Vec4f, Vec3f >( invoke5 );
+    overloads = pybind11::cpp_function( single5,
+                                        pybind11::name( "TrilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch0,
+                                        pybind11::name( "TrilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch1,
+                                        pybind11::name( "TrilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch2,
+                                        pybind11::name( "TrilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch3,
+                                        pybind11::name( "TrilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch4,
+                                        pybind11::name( "TrilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    overloads = pybind11::cpp_function( batch5,
+                                        pybind11::name( "TrilinearInterpolation" ),
+                                        pybind11::scope( o_module ),
+                                        pybind11::sibling( overloads ) );
+    OverloadDispatcher::Define( o_module, "TrilinearInterpolation", std::move( dispatcher ), overloads );
 }
\ No newline at end of file
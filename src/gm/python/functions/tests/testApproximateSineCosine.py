@@ -0,0 +1,33 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import math
+import unittest
+
+import numpy
+import gm
+
+
+class TestApproximateSineCosine(unittest.TestCase):
+    def testSingle(self):
+        sine, cosine = gm.ApproximateSineCosine(1.0)
+        self.assertAlmostEqual(sine, math.sin(1.0), places=6)
+        self.assertAlmostEqual(cosine, math.cos(1.0), places=6)
+
+    def testSingleTypedName(self):
+        sine, cosine = gm.ApproximateSineCosine_float_float_float(-2.5)
+        self.assertAlmostEqual(sine, math.sin(-2.5), places=6)
+        self.assertAlmostEqual(cosine, math.cos(-2.5), places=6)
+
+    def testSingleIntegerConversion(self):
+        sine, cosine = gm.ApproximateSineCosine(0)
+        self.assertEqual((sine, cosine), (0.0, 1.0))
+
+    def testBatch(self):
+        angles = numpy.linspace(-10, 10, 1000, dtype=numpy.float32)
+        sines = numpy.zeros_like(angles)
+        cosines = numpy.zeros_like(angles)
+        gm.ApproximateSineCosine(angles, sines, cosines)
+        numpy.testing.assert_allclose(sines, numpy.sin(angles), atol=1e-6)
+        numpy.testing.assert_allclose(cosines, numpy.cos(angles), atol=1e-6)
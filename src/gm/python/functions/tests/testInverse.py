@@ -0,0 +1,52 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import unittest
+
+import numpy
+import gm
+
+
+class TestInverse(unittest.TestCase):
+    def testMat3f(self):
+        inverse = gm.Mat3f()
+        self.assertTrue(gm.Inverse(gm.Mat3f(2, 0, 0, 0, 4, 0, 0, 0, 8), inverse))
+        self.assertEqual(inverse, gm.Mat3f(0.5, 0, 0, 0, 0.25, 0, 0, 0, 0.125))
+
+    def testMat4f(self):
+        matrix = gm.Mat4f(1, 7, 0.25, 8, 0, 5, 8, 9, 2, -3, 1, 1.3, 8, 1, 2, 1.3)
+        inverse = gm.Mat4f()
+        self.assertTrue(gm.Inverse(matrix, inverse))
+        identity = gm.Mat4f()
+        gm.SetIdentity(identity)
+        self.assertEqual(gm.MatrixProduct(matrix, inverse), identity)
+
+    def testSingular(self):
+        self.assertFalse(gm.Inverse(gm.Mat3f(1, 2, 3, 2, 4, 6, 0, 1, 1), gm.Mat3f()))
+
+    def testBatch(self):
+        matrices = (
+            numpy.random.rand(100, 4, 4).astype(numpy.float32)
+            + numpy.eye(4, dtype=numpy.float32) * 4
+        )
+        inverses = numpy.zeros_like(matrices)
+        invertible = gm.Inverse(matrices, inverses)
+        self.assertIsInstance(invertible, numpy.ndarray)
+        self.assertTrue(invertible.all())
+        numpy.testing.assert_allclose(
+            numpy.matmul(matrices, inverses),
+            numpy.broadcast_to(numpy.eye(4), matrices.shape),
+            atol=1e-5,
+        )
+
+    def testBatchSingular(self):
+        matrices = numpy.stack(
+            [
+                numpy.eye(3, dtype=numpy.float32),
+                numpy.zeros((3, 3), dtype=numpy.float32),
+            ]
+        )
+        inverses = numpy.zeros_like(matrices)
+        numpy.testing.assert_array_equal(gm.Inverse(matrices, inverses), [True, False])
+        numpy.testing.assert_array_equal(inverses[0], numpy.eye(3))
@@ -0,0 +1,29 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import unittest
+
+import numpy
+import gm
+
+
+class TestLinearInterpolation(unittest.TestCase):
+    def testBatchWeights(self):
+        weights = numpy.array([0.0, 0.5, 1.0], dtype=numpy.float32)
+        values = gm.LinearInterpolation(gm.Vec3f(0, 0, 0), gm.Vec3f(2, 4, 6), weights)
+        numpy.testing.assert_allclose(values, [[0, 0, 0], [1, 2, 3], [2, 4, 6]])
+
+    def testBatchScalars(self):
+        values = gm.LinearInterpolation(
+            numpy.zeros(2, dtype=numpy.float32),
+            4.0,
+            numpy.array([0.25, 0.5], dtype=numpy.float32),
+        )
+        self.assertEqual(values.shape, (2,))
+        numpy.testing.assert_allclose(values, [1, 2])
+
+    def testBatchRanges(self):
+        sources = gm.FloatRangeArray([gm.FloatRange(0, 2), gm.FloatRange(2, 4)])
+        values = gm.LinearInterpolation(sources, gm.FloatRange(4, 6), 0.5)
+        numpy.testing.assert_allclose(values, [[2, 4], [3, 5]])
@@ -0,0 +1,71 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import unittest
+
+import numpy
+import gm
+
+
+class TestMin(unittest.TestCase):
+    def testTypedNames(self):
+        self.assertTrue(callable(gm.Min_float_float))
+        self.assertTrue(callable(gm.Min_int_int))
+        self.assertTrue(callable(gm.Min_bool_bool))
+        self.assertTrue(callable(gm.Min_Vec2f_Vec2f))
+        self.assertTrue(callable(gm.Min_Vec3f_Vec3f))
+        self.assertTrue(callable(gm.Min_Vec4f_Vec4f))
+        self.assertTrue(callable(gm.Min_Vec2i_Vec2i))
+        self.assertTrue(callable(gm.Min_Vec3i_Vec3i))
+        self.assertTrue(callable(gm.Min_Vec4i_Vec4i))
+        self.assertTrue(callable(gm.Min_Mat3f_Mat3f))
+        self.assertTrue(callable(gm.Min_Mat4f_Mat4f))
+        self.assertEqual(
+            gm.Min_Vec3f_Vec3f(gm.Vec3f(1, 5, 3), gm.Vec3f(4, 2, 6)), gm.Vec3f(1, 2, 3)
+        )
+
+    def testTypedNameRejectsOtherTypes(self):
+        with self.assertRaises(TypeError):
+            gm.Min_Vec3f_Vec3f(gm.Vec4f(), gm.Vec4f())
+
+    def testDispatch(self):
+        self.assertEqual(gm.Min(1.5, 2.5), 1.5)
+        self.assertEqual(
+            gm.Min(gm.Vec4i(1, 5, 3, 8), gm.Vec4i(4, 2, 6, 7)), gm.Vec4i(1, 2, 3, 7)
+        )
+
+        matrix = gm.Mat4f()
+        self.assertEqual(gm.Min(matrix, matrix), matrix)
+
+    def testDispatchResolvesLikePybind11(self):
+        # Integers resolve to the int overload, as the float overload only accepts them with a conversion.
+        result = gm.Min(1, 2)
+        self.assertIs(type(result), int)
+        self.assertEqual(result, 1)
+
+        # Mixed types are implicitly converted by pybind11.
+        self.assertEqual(gm.Min(1.5, 2), 1.5)
+
+        # Integers out of the range of int are converted to float by pybind11.
+        result = gm.Min(2 ** 40, 1)
+        self.assertIs(type(result), float)
+        self.assertEqual(result, 1.0)
+
+    def testDispatchSubclass(self):
+        class Vector(gm.Vec3f):
+            pass
+
+        self.assertEqual(gm.Min(Vector(1, 5, 3), gm.Vec3f(4, 2, 6)), gm.Vec3f(1, 2, 3))
+
+    def testBatchFallback(self):
+        values = gm.Min(numpy.array([1, 5], dtype=numpy.float32), 2.0)
+        numpy.testing.assert_array_equal(values, [1, 2])
+
+    def testDoc(self):
+        self.assertEqual(gm.Min.__name__, "Min")
+        self.assertIn("Overloaded function", gm.Min.__doc__)
+
+
+if __name__ == "__main__":
+    unittest.main()
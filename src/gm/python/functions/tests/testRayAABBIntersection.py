@@ -0,0 +1,50 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import unittest
+
+import numpy
+import gm
+
+
+class TestRayAABBIntersection(unittest.TestCase):
+    def testBatchMutableIntersections(self):
+        origins = numpy.array([[-4, 0, 0], [-4, 4, 0], [0, 0, 0]], dtype=numpy.float32)
+        intersections = gm.FloatRangeArray(3)
+        hits = gm.RayAABBIntersection(
+            origins,
+            gm.Vec3f(1, 0, 0),
+            gm.Vec3fRange(gm.Vec3f(-2, -2, -2), gm.Vec3f(2, 2, 2)),
+            intersections,
+        )
+        self.assertEqual(hits.dtype, numpy.bool_)
+        self.assertEqual(list(hits), [True, False, True])
+        numpy.testing.assert_allclose(
+            numpy.asarray(intersections)[0], [2, 6], rtol=1e-6
+        )
+
+    def testBatchReadOnlyIntersections(self):
+        intersections = numpy.zeros((1, 2), dtype=numpy.float32)
+        intersections.flags.writeable = False
+        with self.assertRaises(TypeError):
+            gm.RayAABBIntersection(
+                numpy.zeros((1, 3), dtype=numpy.float32),
+                gm.Vec3f(1, 0, 0),
+                gm.Vec3fRange(gm.Vec3f(-2, -2, -2), gm.Vec3f(2, 2, 2)),
+                intersections,
+            )
+
+    def testRay(self):
+        ray = gm.Ray(gm.Vec3f(-4, 0, 0), gm.Vec3f(1, 0, 0))
+        intersections = gm.FloatRange()
+        self.assertTrue(
+            gm.RayAABBIntersection(
+                ray,
+                gm.Vec3fRange(gm.Vec3f(-2, -2, -2), gm.Vec3f(2, 2, 2)),
+                intersections,
+            )
+        )
+        self.assertAlmostEqual(intersections.min, 2)
+        self.assertAlmostEqual(intersections.max, 6)
+        self.assertEqual(ray.directionSign, gm.Vec3i(0, 0, 0))
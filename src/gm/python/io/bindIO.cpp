@@ -0,0 +1,511 @@
+#include <pybind11/pybind11.h>
+
+#include "../types/serialization.h"
+#include "../visibility.h"
+
+#include <algorithm>
+#include <fstream>
+#include <sstream>
+#include <string>
+#include <vector>
+
+// Python bindings for memory-mapping raw and PLY files into array views.
+//
+// Files are mapped with the python mmap module, and viewed by array view types (gm.Vec3fArrayView, gm.Mat4fArrayView,
+// ...), such that their elements are read and written in place, without copying.  Files larger than memory are
+// streamed in chunks, each mapping its own window of the file.
+//
+// Raw files are packed little-endian elements, and PLY files must be binary little-endian, with a vertex element of
+// float properties first, matching the viewed element type.
+
+GM_NS_USING
+
+namespace
+{
+/// The vertex block of a binary little-endian PLY file.
+struct PLYVertexBlock
+{
+    size_t                     byteOffset = 0;
+    size_t                     count      = 0;
+    std::vector< std::string > properties;
+};
+
+/// Get the size of the elements of the array view type \p i_viewType, in bytes.
+size_t _GetElementByteSize( const pybind11::object& i_viewType )
+{
+    if ( !pybind11::hasattr( i_viewType, "elementByteSize" ) )
+    {
+        throw pybind11::type_error( "Expected an array view type, such as gm.Vec3fArrayView." );
+    }
+
+    return i_viewType.attr( "elementByteSize" ).cast< size_t >();
+}
+
+/// Throw a ValueError on big-endian hosts, where little-endian files cannot be viewed in place.
+void _CheckLittleEndianHost()
+{
+    if ( !IsLittleEndianHost() )
+    {
+        throw pybind11::value_error( "Viewing little-endian files in place requires a little-endian host." );
+    }
+}
+
+/// Open the file \p i_path in binary \p i_mode.
+pybind11::object _Open( const std::string& i_path, const char* i_mode )
+{
+    return pybind11::module::import( "io" ).attr( "open" )( i_path, i_mode );
+}
+
+/// Get the size of the file \p i_path, in bytes.
+size_t _GetFileSize( const std::string& i_path )
+{
+    return pybind11::module::import( "os" ).attr( "path" ).attr( "getsize" )( i_path ).cast< size_t >();
+}
+
+/// Resolve the number of \p i_elementByteSize elements of a file of \p i_fileSize bytes, from \p i_byteOffset.  A
+/// negative \p i_size spans the rest of the file, which must then hold a whole number of elements.
+size_t _ResolveSize( size_t i_fileSize, size_t i_byteOffset, pybind11::ssize_t i_size, size_t i_elementByteSize )
+{
+    size_t available = i_fileSize > i_byteOffset ? i_fileSize - i_byteOffset : 0;
+    if ( i_size < 0 )
+    {
+        if ( available % i_elementByteSize != 0 )
+        {
+            throw pybind11::value_error( "Expected a multiple of " + std::to_string( i_elementByteSize ) +
+                                         " bytes, got " + std::to_string( available ) + "." );
+        }
+        return available / i_elementByteSize;
+    }
+
+    if ( static_cast< size_t >( i_size ) * i_elementByteSize > available )
+    {
+        throw pybind11::value_error( "Expected at least " + std::to_string( i_size * i_elementByteSize ) +
+                                     " bytes, got " + std::to_string( available ) + "." );
+    }
+    return static_cast< size_t >( i_size );
+}
+
+/// Map the window of \p i_file holding \p i_size elements from \p i_byteOffset, and view it as \p i_viewType.
+///
+/// The mapping is aligned down to the allocation granularity, and owned by the returned view.
+pybind11::object _MapView( const pybind11::object& i_file,
+                           const pybind11::object& i_viewType,
+                           size_t                  i_byteOffset,
+                           size_t                  i_size,
+                           bool                    i_writable )
+{
+    if ( i_size == 0 )
+    {
+        return i_viewType( pybind11::bytes(), 0, 0 );
+    }
+
+    pybind11::module mmap        = pybind11::module::import( "mmap" );
+    size_t           granularity = mmap.attr( "ALLOCATIONGRANULARITY" ).cast< size_t >();
+    size_t           mapOffset   = i_byteOffset - i_byteOffset % granularity;
+    size_t           byteCount   = i_byteOffset - mapOffset + i_size * _GetElementByteSize( i_viewType );
+
+    pybind11::object mapping =
+        mmap.attr( "mmap" )( i_file.attr( "fileno" )(),
+                             byteCount,
+                             pybind11::arg( "access" ) = mmap.attr( i_writable ? "ACCESS_WRITE" : "ACCESS_READ" ),
+                             pybind11::arg( "offset" ) = mapOffset );
+    return i_viewType( mapping, i_byteOffset - mapOffset, i_size );
+}
+
+/// Map the \p i_size elements of the file \p i_path from \p i_byteOffset, as a single view.
+pybind11::object _MapFile( const std::string&      i_path,
+                           const pybind11::object& i_viewType,
+                           size_t                  i_byteOffset,
+                           size_t                  i_size,
+                           bool                    i_writable )
+{
+    // The mapping outlives the file object, which is closed.
+    pybind11::object file = _Open( i_path, i_writable ? "r+b" : "rb" );
+    try
+    {
+        pybind11::object view = _MapView( file, i_viewType, i_byteOffset, i_size, i_writable );
+        file.attr( "close" )();
+        return view;
+    }
+    catch ( ... )
+    {
+        file.attr( "close" )();
+        throw;
+    }
+}
+
+/// Create the file \p i_path, with a \p i_header followed by storage for \p i_size elements, and map the elements.
+pybind11::object
+_CreateFile( const std::string& i_path, const pybind11::object& i_viewType, const std::string& i_header, size_t i_size )
+{
+    pybind11::object file = _Open( i_path, "w+b" );
+    try
+    {
+        file.attr( "write" )( pybind11::bytes( i_header ) );
+        file.attr( "truncate" )( i_header.size() + i_size * _GetElementByteSize( i_viewType ) );
+        file.attr( "flush" )();
+        pybind11::object view = _MapView( file, i_viewType, i_header.size(), i_size, /* writable */ true );
+        file.attr( "close" )();
+        return view;
+    }
+    catch ( ... )
+    {
+        file.attr( "close" )();
+        throw;
+    }
+}
+
+/// \class ChunkIterator
+///
+/// Iterate over the elements of a file in views of up to a fixed number of elements, each mapping its own window of
+/// the file, such that files larger than memory can be processed.
+///
+/// The file is closed once all the chunks are mapped, or earlier by close(), on exiting a with statement, or on
+/// destruction of the iterator, such that breaking out of the iteration does not leave it open.  The chunks already
+/// mapped remain valid.
+class GM_PYTHON_HIDDEN ChunkIterator
+{
+public:
+    inline ChunkIterator( const std::string&      i_path,
+                          const pybind11::object& i_viewType,
+                          size_t                  i_byteOffset,
+                          size_t                  i_size,
+                          size_t                  i_chunkSize,
+                          bool                    i_writable )
+        : m_file( _Open( i_path, i_writable ? "r+b" : "rb" ) )
+        , m_viewType( i_viewType )
+        , m_byteOffset( i_byteOffset )
+        , m_size( i_size )
+        , m_chunkSize( i_chunkSize )
+        , m_writable( i_writable )
+    {
+        if ( m_chunkSize == 0 )
+        {
+            m_file.attr( "close" )();
+            throw pybind11::value_error( "Expected a positive chunk size." );
+        }
+    }
+
+    // The iterator owns the open file, so is only moved.
+    ChunkIterator( ChunkIterator&& )      = default;
+    ChunkIterator( const ChunkIterator& ) = delete;
+    ChunkIterator& operator=( const ChunkIterator& ) = delete;
+
+    inline ~ChunkIterator()
+    {
+        try
+        {
+            Close();
+        }
+        catch ( pybind11::error_already_set& e )
+        {
+            e.restore();
+            PyErr_WriteUnraisable( nullptr );
+        }
+    }
+
+    /// Get the number of chunks.
+    inline size_t GetChunkCount() const
+    {
+        return ( m_size + m_chunkSize - 1 ) / m_chunkSize;
+    }
+
+    /// Map the next chunk, closing the file once all the chunks are mapped.
+    inline pybind11::object Next()
+    {
+        if ( m_index >= m_size || !m_file )
+        {
+            Close();
+            throw pybind11::stop_iteration();
+        }
+
+        size_t           count = std::min( m_chunkSize, m_size - m_index );
+        pybind11::object view  = _MapView( m_file,
+                                          m_viewType,
+                                          m_byteOffset + m_index * _GetElementByteSize( m_viewType ),
+                                          count,
+                                          m_writable );
+        m_index += count;
+        return view;
+    }
+
+    /// Close the file, ending the iteration, if not already closed.
+    inline void Close()
+    {
+        if ( m_file )
+        {
+            pybind11::object file = std::move( m_file );
+            file.attr( "close" )();
+        }
+    }
+
+private:
+    pybind11::object m_file;
+    pybind11::object m_viewType;
+    size_t           m_byteOffset = 0;
+    size_t           m_size       = 0;
+    size_t           m_chunkSize  = 0;
+    bool             m_writable   = false;
+    size_t           m_index      = 0;
+};
+
+/// Read the header of the binary little-endian PLY file \p i_path, locating its vertex block.
+PLYVertexBlock _ReadPLYHeader( const std::string& i_path )
+{
+    std::ifstream stream( i_path, std::ios::binary );
+    if ( !stream )
+    {
+        throw pybind11::value_error( "Cannot open PLY file '" + i_path + "'." );
+    }
+
+    std::string line;
+    std::getline( stream, line );
+    if ( line != "ply" && line != "ply\r" )
+    {
+        throw pybind11::value_error( "Expected a PLY file, '" + i_path + "' has no PLY magic number." );
+    }
+
+    PLYVertexBlock block;
+    bool           inVertexElement  = false;
+    bool           hasVertexElement = false;
+    while ( std::getline( stream, line ) )
+    {
+        if ( !line.empty() && line.back() == '\r' )
+        {
+            line.pop_back();
+        }
+
+        std::istringstream words( line );
+        std::string        keyword;
+        words >> keyword;
+        if ( keyword == "format" )
+        {
+            std::string format;
+            words >> format;
+            if ( format != "binary_little_endian" )
+            {
+                throw pybind11::value_error( "Expected a binary_little_endian PLY file, got format '" + format + "'." );
+            }
+        }
+        else if ( keyword == "element" )
+        {
+            std::string name;
+            words >> name;
+            if ( !hasVertexElement && name != "vertex" )
+            {
+                throw pybind11::value_error( "Expected the vertex element first, got element '" + name + "'." );
+            }
+
+            inVertexElement = !hasVertexElement;
+            if ( inVertexElement )
+            {
+                words >> block.count;
+                hasVertexElement = true;
+            }
+        }
+        else if ( keyword == "property" && inVertexElement )
+        {
+            std::string type, name;
+            words >> type >> name;
+            if ( type != "float" && type != "float32" )
+            {
+                throw pybind11::value_error( "Expected float vertex properties, got '" + type + "' property '" + name +
+                                             "'." );
+            }
+            block.properties.push_back( name );
+        }
+        else if ( keyword == "end_header" )
+        {
+            if ( !hasVertexElement )
+            {
+                throw pybind11::value_error( "Expected a vertex element in PLY file '" + i_path + "'." );
+            }
+
+            // The vertices are viewed in place, so must be aligned like their float properties.
+            block.byteOffset = static_cast< size_t >( stream.tellg() );
+            if ( block.byteOffset % alignof( float ) != 0 )
+            {
+                throw pybind11::value_error( "Expected the vertices of PLY file '" + i_path + "' aligned to " +
+                                             std::to_string( alignof( float ) ) +
+                                             " bytes, such as in files written by CreatePLY." );
+            }
+            return block;
+        }
+    }
+
+    throw pybind11::value_error( "Expected an end_header line in PLY file '" + i_path + "'." );
+}
+
+/// Read the vertex block of the PLY file \p i_path, checking that its vertices are \p i_viewType elements.
+PLYVertexBlock _ReadPLYVertexBlock( const std::string& i_path, const pybind11::object& i_viewType )
+{
+    PLYVertexBlock block = _ReadPLYHeader( i_path );
+    if ( block.properties.size() * sizeof( float ) != _GetElementByteSize( i_viewType ) )
+    {
+        std::string properties;
+        for ( const std::string& property : block.properties )
+        {
+            properties += ( properties.empty() ? "" : " " ) + property;
+        }
+
+        throw pybind11::value_error( "Expected vertices of " +
+                                     std::to_string( _GetElementByteSize( i_viewType ) / sizeof( float ) ) +
+                                     " float properties, got ( " + properties + " )." );
+    }
+
+    _ResolveSize( _GetFileSize( i_path ), block.byteOffset, block.count, _GetElementByteSize( i_viewType ) );
+    return block;
+}
+
+/// Get the default vertex property names of \p i_viewType elements.
+pybind11::list _GetDefaultPLYProperties( const pybind11::object& i_viewType )
+{
+    size_t         propertyCount = _GetElementByteSize( i_viewType ) / sizeof( float );
+    pybind11::list properties;
+    const char*    names[] = {"x", "y", "z", "w"};
+    if ( propertyCount != 3 && propertyCount != 4 )
+    {
+        throw pybind11::value_error( "Expected the names of the " + std::to_string( propertyCount ) +
+                                     " vertex properties." );
+    }
+
+    for ( size_t index = 0; index < propertyCount; ++index )
+    {
+        properties.append( names[ index ] );
+    }
+    return properties;
+}
+} // namespace
+
+void BindIO( pybind11::module& o_module )
+{
+    pybind11::class_< ChunkIterator > chunkIterator( o_module, "ChunkIterator" );
+    chunkIterator.def( "__iter__", []( pybind11::object i_iterator ) { return i_iterator; } );
+    chunkIterator.def( "__next__", &ChunkIterator::Next );
+    chunkIterator.def( "__len__", &ChunkIterator::GetChunkCount );
+    chunkIterator.def( "close", &ChunkIterator::Close, "Close the file, ending the iteration." );
+    chunkIterator.def( "__enter__", []( pybind11::object i_iterator ) { return i_iterator; } );
+    chunkIterator.def( "__exit__", []( ChunkIterator& o_iterator, pybind11::args ) { o_iterator.Close(); } );
+
+    // Raw files, of packed little-endian elements.
+    o_module.def(
+        "MapRaw",
+        []( const std::string&      i_path,
+            const pybind11::object& i_viewType,
+            size_t                  i_byteOffset,
+            pybind11::ssize_t       i_size,
+            bool                    i_writable ) {
+            _CheckLittleEndianHost();
+            size_t size =
+                _ResolveSize( _GetFileSize( i_path ), i_byteOffset, i_size, _GetElementByteSize( i_viewType ) );
+            return _MapFile( i_path, i_viewType, i_byteOffset, size, i_writable );
+        },
+        "Map the elements of a raw file into a view, written back to the file if writable.",
+        pybind11::arg( "path" ),
+        pybind11::arg( "viewType" ),
+        pybind11::arg( "byteOffset" ) = 0,
+        pybind11::arg( "size" )       = -1,
+        pybind11::arg( "writable" )   = false );
+
+    o_module.def(
+        "IterateRaw",
+        []( const std::string&      i_path,
+            const pybind11::object& i_viewType,
+            size_t                  i_chunkSize,
+            size_t                  i_byteOffset,
+            pybind11::ssize_t       i_size,
+            bool                    i_writable ) {
+            _CheckLittleEndianHost();
+            size_t size =
+                _ResolveSize( _GetFileSize( i_path ), i_byteOffset, i_size, _GetElementByteSize( i_viewType ) );
+            return ChunkIterator( i_path, i_viewType, i_byteOffset, size, i_chunkSize, i_writable );
+        },
+        "Iterate over the elements of a raw file, in views of up to chunkSize elements.",
+        pybind11::arg( "path" ),
+        pybind11::arg( "viewType" ),
+        pybind11::arg( "chunkSize" ),
+        pybind11::arg( "byteOffset" ) = 0,
+        pybind11::arg( "size" )       = -1,
+        pybind11::arg( "writable" )   = false );
+
+    o_module.def(
+        "CreateRaw",
+        []( const std::string& i_path, const pybind11::object& i_viewType, size_t i_size ) {
+            _CheckLittleEndianHost();
+            return _CreateFile( i_path, i_viewType, std::string(), i_size );
+        },
+        "Create a raw file of size elements, mapped into a writable view.",
+        pybind11::arg( "path" ),
+        pybind11::arg( "viewType" ),
+        pybind11::arg( "size" ) );
+
+    // Binary little-endian PLY files, of float vertex properties.
+    o_module.def(
+        "MapPLY",
+        []( const std::string& i_path, const pybind11::object& i_viewType, bool i_writable ) {
+            _CheckLittleEndianHost();
+            PLYVertexBlock block = _ReadPLYVertexBlock( i_path, i_viewType );
+            return _MapFile( i_path, i_viewType, block.byteOffset, block.count, i_writable );
+        },
+        "Map the vertices of a binary little-endian PLY file into a view, written back to the file if writable.",
+        pybind11::arg( "path" ),
+        pybind11::arg( "viewType" ),
+        pybind11::arg( "writable" ) = false );
+
+    o_module.def(
+        "IteratePLY",
+        []( const std::string& i_path, const pybind11::object& i_viewType, size_t i_chunkSize, bool i_writable ) {
+            _CheckLittleEndianHost();
+            PLYVertexBlock block = _ReadPLYVertexBlock( i_path, i_viewType );
+            return ChunkIterator( i_path, i_viewType, block.byteOffset, block.count, i_chunkSize, i_writable );
+        },
+        "Iterate over the vertices of a binary little-endian PLY file, in views of up to chunkSize vertices.",
+        pybind11::arg( "path" ),
+        pybind11::arg( "viewType" ),
+        pybind11::arg( "chunkSize" ),
+        pybind11::arg( "writable" ) = false );
+
+    o_module.def(
+        "CreatePLY",
+        []( const std::string&      i_path,
+            const pybind11::object& i_viewType,
+            size_t                  i_size,
+            pybind11::object        i_properties ) {
+            _CheckLittleEndianHost();
+            if ( i_properties.is_none() )
+            {
+                i_properties = _GetDefaultPLYProperties( i_viewType );
+            }
+
+            std::string header =
+                "ply\nformat binary_little_endian 1.0\nelement vertex " + std::to_string( i_size ) + "\n";
+            size_t propertyCount = 0;
+            for ( pybind11::handle property : i_properties )
+            {
+                header += "property float " + property.cast< std::string >() + "\n";
+                ++propertyCount;
+            }
+
+            // Pad the header with a comment, such that the vertices are aligned like their float properties.
+            const std::string comment = "comment gm";
+            const std::string end     = "end_header\n";
+            size_t            padding =
+                ( alignof( float ) - ( header.size() + comment.size() + 1 + end.size() ) % alignof( float ) ) %
+                alignof( float );
+            header += comment + std::string( padding, ' ' ) + "\n" + end;
+
+            if ( propertyCount * sizeof( float ) != _GetElementByteSize( i_viewType ) )
+            {
+                throw pybind11::value_error( "Expected " +
+                                             std::to_string( _GetElementByteSize( i_viewType ) / sizeof( float ) ) +
+                                             " vertex properties, got " + std::to_string( propertyCount ) + "." );
+            }
+
+            return _CreateFile( i_path, i_viewType, header, i_size );
+        },
+        "Create a binary little-endian PLY file of size vertices, mapped into a writable view.",
+        pybind11::arg( "path" ),
+        pybind11::arg( "viewType" ),
+        pybind11::arg( "size" ),
+        pybind11::arg( "properties" ) = pybind11::none() );
+}
@@ -0,0 +1,159 @@
+import array
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import gm
+
+
+class TestIO(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def Path(self, name):
+        return os.path.join(self.directory, name)
+
+    def WriteRaw(self, name, count):
+        path = self.Path(name)
+        with open(path, "wb") as rawFile:
+            rawFile.write(array.array("f", range(count * 3)).tobytes())
+        return path
+
+    def testMapRaw(self):
+        path = self.WriteRaw("points.raw", 4)
+        points = gm.io.MapRaw(path, gm.Vec3fArrayView)
+        self.assertEqual(len(points), 4)
+        self.assertTrue(points.readOnly)
+        self.assertEqual(points[1], gm.Vec3f(3, 4, 5))
+        with self.assertRaises(TypeError):
+            points[0] = points[1]
+        points.Release()
+
+        points = gm.io.MapRaw(path, gm.Vec3fArrayView, byteOffset=12, size=2)
+        self.assertEqual(list(points), [gm.Vec3f(3, 4, 5), gm.Vec3f(6, 7, 8)])
+        points.Release()
+
+        with self.assertRaises(ValueError):
+            gm.io.MapRaw(path, gm.Vec3fArrayView, size=5)
+        with self.assertRaises(ValueError):
+            gm.io.MapRaw(path, gm.Mat4fArrayView)
+        with self.assertRaises(TypeError):
+            gm.io.MapRaw(path, gm.Vec3fArray)
+
+    def testWriteBack(self):
+        path = self.WriteRaw("points.raw", 4)
+        points = gm.io.MapRaw(path, gm.Vec3fArrayView, writable=True)
+        self.assertFalse(points.readOnly)
+        points[0] = gm.Vec3f(-1, -2, -3)
+        points.Release()
+
+        with open(path, "rb") as rawFile:
+            values = array.array("f", rawFile.read())
+        self.assertEqual(values[:4].tolist(), [-1, -2, -3, 3])
+
+    def testCreateRaw(self):
+        path = self.Path("transforms.raw")
+        transforms = gm.io.CreateRaw(path, gm.Mat4fArrayView, 3)
+        transforms[2] = gm.Mat4f()
+        transforms.Release()
+
+        self.assertEqual(os.path.getsize(path), 3 * 64)
+        transforms = gm.io.MapRaw(path, gm.Mat4fArrayView)
+        self.assertEqual(transforms[0], gm.Mat4f(*([0] * 16)))
+        self.assertEqual(transforms[2], gm.Mat4f())
+        transforms.Release()
+
+    def testIterateRaw(self):
+        path = self.WriteRaw("points.raw", 10)
+        chunks = gm.io.IterateRaw(path, gm.Vec3fArrayView, 4, writable=True)
+        self.assertEqual(len(chunks), 3)
+
+        sizes = []
+        for chunk in chunks:
+            sizes.append(len(chunk))
+            for index in range(len(chunk)):
+                chunk[index] = chunk[index] * 2
+            chunk.Release()
+        self.assertEqual(sizes, [4, 4, 2])
+
+        points = gm.io.MapRaw(path, gm.Vec3fArrayView)
+        self.assertEqual(points[9], gm.Vec3f(54, 56, 58))
+        points.Release()
+
+    def testIterateClose(self):
+        path = self.WriteRaw("points.raw", 10)
+
+        # Breaking out of the iteration closes the file with the iterator, without a ResourceWarning.
+        script = (
+            "import gc, gm\n"
+            "for chunk in gm.io.IterateRaw({path!r}, gm.Vec3fArrayView, 4):\n"
+            "    chunk.Release()\n"
+            "    break\n"
+            "gc.collect()\n"
+        ).format(path=path)
+        process = subprocess.run(
+            [sys.executable, "-W", "always::ResourceWarning", "-c", script],
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        self.assertEqual(process.returncode, 0)
+        self.assertEqual(process.stderr, "")
+
+        chunks = gm.io.IterateRaw(path, gm.Vec3fArrayView, 4)
+        next(chunks).Release()
+        chunks.close()
+        self.assertEqual(list(chunks), [])
+
+        with gm.io.IterateRaw(path, gm.Vec3fArrayView, 4) as chunks:
+            chunk = next(chunks)
+        self.assertEqual(list(chunks), [])
+        self.assertEqual(chunk[1], gm.Vec3f(3, 4, 5))
+        chunk.Release()
+
+    def testPLY(self):
+        path = self.Path("points.ply")
+        points = gm.io.CreatePLY(path, gm.Vec3fArrayView, 2)
+        points[0] = gm.Vec3f(1, 2, 3)
+        points[1] = gm.Vec3f(4, 5, 6)
+        points.Release()
+
+        with open(path, "rb") as plyFile:
+            self.assertTrue(
+                plyFile.read().startswith(b"ply\nformat binary_little_endian")
+            )
+
+        points = gm.io.MapPLY(path, gm.Vec3fArrayView)
+        self.assertEqual(list(points), [gm.Vec3f(1, 2, 3), gm.Vec3f(4, 5, 6)])
+        points.Release()
+
+        chunks = [
+            chunk.Copy() for chunk in gm.io.IteratePLY(path, gm.Vec3fArrayView, 1)
+        ]
+        self.assertEqual(
+            chunks,
+            [gm.Vec3fArray([gm.Vec3f(1, 2, 3)]), gm.Vec3fArray([gm.Vec3f(4, 5, 6)])],
+        )
+
+        with self.assertRaises(ValueError):
+            gm.io.MapPLY(path, gm.Vec4fArrayView)
+
+    def testUnsupportedPLY(self):
+        path = self.Path("points.ply")
+        with open(path, "wb") as plyFile:
+            plyFile.write(
+                b"ply\nformat ascii 1.0\nelement vertex 1\n"
+                b"property float x\nproperty float y\nproperty float z\nend_header\n"
+                b"0 0 0\n"
+            )
+        with self.assertRaises(ValueError):
+            gm.io.MapPLY(path, gm.Vec3fArrayView)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include "kernels.h"
+
+#include <cstdlib>
+#include <cstring>
+
+#if defined( _MSC_VER ) && ( defined( _M_X64 ) || defined( _M_IX86 ) )
+#include <immintrin.h>
+#include <intrin.h>
+#endif
+
+// Selection of the batched function kernel set, based on the instruction sets supported by the host.
+//
+// GM_KERNEL_SET_<name> is defined for each kernel set compiled into the module, see python/CMakeLists.txt.
+
+namespace gm_kernels
+{
+const KernelSet& GetKernelSetBaseline();
+#if defined( GM_KERNEL_SET_SSE42 )
+const KernelSet& GetKernelSetSSE42();
+#endif
+#if defined( GM_KERNEL_SET_AVX2 )
+const KernelSet& GetKernelSetAVX2();
+#endif
+#if defined( GM_KERNEL_SET_AVX512 )
+const KernelSet& GetKernelSetAVX512();
+#endif
+
+/// \struct KernelSetEntry
+///
+/// A compiled kernel set, along with whether the host supports its instruction set.
+struct KernelSetEntry
+{
+    const KernelSet& kernelSet;
+    bool             supported;
+};
+
+CpuFeatures DetectCpuFeatures()
+{
+    CpuFeatures features;
+#if ( defined( __GNUC__ ) || defined( __clang__ ) ) && ( defined( __x86_64__ ) || defined( __i386__ ) )
+    // Also checks that the operating system saves the extended registers.
+    __builtin_cpu_init();
+    features.sse42   = __builtin_cpu_supports( "sse4.2" );
+    features.avx2    = __builtin_cpu_supports( "avx2" );
+    features.fma     = __builtin_cpu_supports( "fma" );
+    features.avx512f = __builtin_cpu_supports( "avx512f" );
+#elif defined( _MSC_VER ) && ( defined( _M_X64 ) || defined( _M_IX86 ) )
+    int registers[ 4 ];
+    __cpuid( registers, 0 );
+    const int maxLeaf = registers[ 0 ];
+
+    __cpuid( registers, 1 );
+    const bool osxsave = ( registers[ 2 ] & ( 1 << 27 ) ) != 0;
+    features.sse42     = ( registers[ 2 ] & ( 1 << 20 ) ) != 0;
+    features.fma       = ( registers[ 2 ] & ( 1 << 12 ) ) != 0;
+
+    // The operating system must save the YMM (and ZMM) registers across context switches.
+    const unsigned long long xcr0       = osxsave ? _xgetbv( 0 ) : 0;
+    const bool               ymmEnabled = ( xcr0 & 0x6 ) == 0x6;
+    const bool               zmmEnabled = ( xcr0 & 0xe6 ) == 0xe6;
+    features.fma                        = features.fma && ymmEnabled;
+    if ( maxLeaf >= 7 )
+    {
+        __cpuidex( registers, 7, 0 );
+        features.avx2    = ymmEnabled && ( registers[ 1 ] & ( 1 << 5 ) ) != 0;
+        features.avx512f = zmmEnabled && ( registers[ 1 ] & ( 1 << 16 ) ) != 0;
+    }
+#endif
+    return features;
+}
+
+/// Get the compiled kernel sets, in order of preference.
+static std::vector< KernelSetEntry > GetKernelSetEntries()
+{
+    CpuFeatures                   features = DetectCpuFeatures();
+    std::vector< KernelSetEntry > entries;
+#if defined( GM_KERNEL_SET_AVX512 )
+    entries.push_back( {GetKernelSetAVX512(), features.avx512f && features.avx2 && features.fma} );
+#endif
+#if defined( GM_KERNEL_SET_AVX2 )
+    entries.push_back( {GetKernelSetAVX2(), features.avx2 && features.fma} );
+#endif
+#if defined( GM_KERNEL_SET_SSE42 )
+    entries.push_back( {GetKernelSetSSE42(), features.sse42} );
+#endif
+    entries.push_back( {GetKernelSetBaseline(), true} );
+    return entries;
+}
+
+std::vector< const char* > GetKernelSetNames()
+{
+    std::vector< const char* > names;
+    for ( const KernelSetEntry& entry : GetKernelSetEntries() )
+    {
+        names.push_back( entry.kernelSet.name );
+    }
+    return names;
+}
+
+/// Select the most preferred kernel set supported by the host, or the supported kernel set named by
+/// the GM_KERNEL_SET environment variable.
+static const KernelSet& SelectKernelSet()
+{
+    std::vector< KernelSetEntry > entries = GetKernelSetEntries();
+
+    const char* requested = std::getenv( "GM_KERNEL_SET" );
+    if ( requested != nullptr )
+    {
+        for ( const KernelSetEntry& entry : entries )
+        {
+            if ( entry.supported && std::strcmp( entry.kernelSet.name, requested ) == 0 )
+            {
+                return entry.kernelSet;
+            }
+        }
+    }
+
+    for ( const KernelSetEntry& entry : entries )
+    {
+        if ( entry.supported )
+        {
+            return entry.kernelSet;
+        }
+    }
+
+    return GetKernelSetBaseline();
+}
+
+const KernelSet& GetActiveKernelSet()
+{
+    static const KernelSet& s_kernelSet = SelectKernelSet();
+    return s_kernelSet;
+}
+
+} // namespace gm_kernels
+
+void BindKernels( pybind11::module& o_module )
+{
+    o_module.def( "GetCpuFeatures", []() {
+        gm_kernels::CpuFeatures features = gm_kernels::DetectCpuFeatures();
+        pybind11::dict          result;
+        result[ "sse4.2" ]  = features.sse42;
+        result[ "avx2" ]    = features.avx2;
+        result[ "fma" ]     = features.fma;
+        result[ "avx512f" ] = features.avx512f;
+        return result;
+    } );
+    o_module.def( "GetKernelSets", []() {
+        std::vector< std::string > names;
+        for ( const char* name : gm_kernels::GetKernelSetNames() )
+        {
+            names.push_back( name );
+        }
+        return names;
+    } );
+    o_module.def( "GetActiveKernelSet", []() { return std::string( gm_kernels::GetActiveKernelSet().name ); } );
+
+    // Select the kernel set at import time, rather than on the first batched function call.
+    gm_kernels::GetActiveKernelSet();
+}
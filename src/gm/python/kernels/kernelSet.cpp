@@ -0,0 +1,2158 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+// Kernel set of all the batched functions, compiled once per instruction set, see kernels.h.
+//
+// GM_KERNEL_SET names the kernel set, and GM_NS is defined to a namespace distinct to this kernel set.
+
+#include <gm/gm.h>
+
+#include <gm/functions/batch/abs.h>
+#include <gm/functions/batch/approximateLength.h>
+#include <gm/functions/batch/approximateNormalize.h>
+#include <gm/functions/batch/approximateReciprocalSquareRoot.h>
+#include <gm/functions/batch/approximateSetRotate.h>
+#include <gm/functions/batch/approximateSetRotateX.h>
+#include <gm/functions/batch/approximateSetRotateY.h>
+#include <gm/functions/batch/approximateSetRotateZ.h>
+#include <gm/functions/batch/approximateSineCosine.h>
+#include <gm/functions/batch/bilinearInterpolation.h>
+#include <gm/functions/batch/ceil.h>
+#include <gm/functions/batch/clamp.h>
+#include <gm/functions/batch/contains.h>
+#include <gm/functions/batch/content.h>
+#include <gm/functions/batch/coordinateSystem.h>
+#include <gm/functions/batch/crossProduct.h>
+#include <gm/functions/batch/degrees.h>
+#include <gm/functions/batch/distance.h>
+#include <gm/functions/batch/dotProduct.h>
+#include <gm/functions/batch/expand.h>
+#include <gm/functions/batch/faceForward.h>
+#include <gm/functions/batch/floor.h>
+#include <gm/functions/batch/hasScale.h>
+#include <gm/functions/batch/intersection.h>
+#include <gm/functions/batch/inverse.h>
+#include <gm/functions/batch/inverseAffine.h>
+#include <gm/functions/batch/inverseRigid.h>
+#include <gm/functions/batch/isIdentity.h>
+#include <gm/functions/batch/length.h>
+#include <gm/functions/batch/lengthSquared.h>
+#include <gm/functions/batch/linearInterpolation.h>
+#include <gm/functions/batch/linearMap.h>
+#include <gm/functions/batch/longestAxis.h>
+#include <gm/functions/batch/lookAt.h>
+#include <gm/functions/batch/matrixProduct.h>
+#include <gm/functions/batch/max.h>
+#include <gm/functions/batch/min.h>
+#include <gm/functions/batch/normalize.h>
+#include <gm/functions/batch/normalizedLinearInterpolation.h>
+#include <gm/functions/batch/orthographicProjection.h>
+#include <gm/functions/batch/perspectiveProjection.h>
+#include <gm/functions/batch/quadraticRoots.h>
+#include <gm/functions/batch/quaternionProduct.h>
+#include <gm/functions/batch/radians.h>
+#include <gm/functions/batch/rayAABBIntersection.h>
+#include <gm/functions/batch/rayPosition.h>
+#include <gm/functions/batch/raySphereIntersection.h>
+#include <gm/functions/batch/rotationQuaternion.h>
+#include <gm/functions/batch/setIdentity.h>
+#include <gm/functions/batch/setRotate.h>
+#include <gm/functions/batch/setRotateX.h>
+#include <gm/functions/batch/setRotateY.h>
+#include <gm/functions/batch/setRotateZ.h>
+#include <gm/functions/batch/setScale.h>
+#include <gm/functions/batch/setTranslate.h>
+#include <gm/functions/batch/sphericalLinearInterpolation.h>
+#include <gm/functions/batch/transformAABB.h>
+#include <gm/functions/batch/transformPoint.h>
+#include <gm/functions/batch/transformVector.h>
+#include <gm/functions/batch/transpose.h>
+#include <gm/functions/batch/trilinearInterpolation.h>
+#include <gm/functions/batch/viewportTransform.h>
+
+#include "kernels.h"
+
+#if !defined( GM_KERNEL_SET )
+#error "GM_KERNEL_SET must be defined."
+#endif
+
+#define _GM_KERNEL_SET_STRING( set ) #set
+#define GM_KERNEL_SET_STRING( set ) _GM_KERNEL_SET_STRING( set )
+#define _GM_KERNEL_SET_GETTER( set ) GetKernelSet##set
+#define GM_KERNEL_SET_GETTER( set ) _GM_KERNEL_SET_GETTER( set )
+
+// The kernel sets are compiled with hidden visibility, and their hidden symbols made local after compilation (see
+// python/CMakeLists.txt), such that the inline functions compiled for an instruction set are only called by its
+// kernels.  The getter of the kernel set is the single symbol left global, for the dispatch.
+#if defined( __GNUC__ )
+#define GM_KERNEL_SET_VISIBLE __attribute__( ( visibility( "default" ) ) )
+#else
+#define GM_KERNEL_SET_VISIBLE
+#endif
+
+GM_NS_USING
+
+namespace
+{
+/// View the kernel argument \p i_arg as the inputs of the elements starting at \p i_begin.
+template < typename ValueT >
+inline BatchInput< ValueT > KernelInput( const gm_kernels::KernelArg& i_arg, size_t i_begin )
+{
+    const ValueT* data = static_cast< const ValueT* >( i_arg.data );
+    if ( i_arg.stride == 0 )
+    {
+        return BatchInput< ValueT >( *data );
+    }
+    else
+    {
+        return BatchInput< ValueT >( data + i_begin );
+    }
+}
+
+/// View the kernel argument \p i_arg as the outputs of the elements starting at \p i_begin.
+template < typename ValueT >
+inline ValueT* KernelOutput( const gm_kernels::KernelArg& i_arg, size_t i_begin )
+{
+    return const_cast< ValueT* >( static_cast< const ValueT* >( i_arg.data ) ) + i_begin;
+}
+
+void LinearInterpolation_float_float_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LinearInterpolation( KernelInput< float >( i_args[ 0 ], i_begin ),
+                         KernelInput< float >( i_args[ 1 ], i_begin ),
+                         KernelInput< float >( i_args[ 2 ], i_begin ),
+                         i_end - i_begin,
+                         KernelOutput< float >( i_args[ 3 ], i_begin ) );
+}
+
+void LinearInterpolation_Mat3f_Mat3f_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LinearInterpolation( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+                         KernelInput< Mat3f >( i_args[ 1 ], i_begin ),
+                         KernelInput< float >( i_args[ 2 ], i_begin ),
+                         i_end - i_begin,
+                         KernelOutput< Mat3f >( i_args[ 3 ], i_begin ) );
+}
+
+void LinearInterpolation_Mat4f_Mat4f_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LinearInterpolation( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+                         KernelInput< Mat4f >( i_args[ 1 ], i_begin ),
+                         KernelInput< float >( i_args[ 2 ], i_begin ),
+                         i_end - i_begin,
+                         KernelOutput< Mat4f >( i_args[ 3 ], i_begin ) );
+}
+
+void LinearInterpolation_Vec2f_Vec2f_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LinearInterpolation( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+                         KernelInput< Vec2f >( i_args[ 1 ], i_begin ),
+                         KernelInput< float >( i_args[ 2 ], i_begin ),
+                         i_end - i_begin,
+                         KernelOutput< Vec2f >( i_args[ 3 ], i_begin ) );
+}
+
+void LinearInterpolation_Vec3f_Vec3f_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LinearInterpolation( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+                         KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+                         KernelInput< float >( i_args[ 2 ], i_begin ),
+                         i_end - i_begin,
+                         KernelOutput< Vec3f >( i_args[ 3 ], i_begin ) );
+}
+
+void LinearInterpolation_Vec4f_Vec4f_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LinearInterpolation( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+                         KernelInput< Vec4f >( i_args[ 1 ], i_begin ),
+                         KernelInput< float >( i_args[ 2 ], i_begin ),
+                         i_end - i_begin,
+                         KernelOutput< Vec4f >( i_args[ 3 ], i_begin ) );
+}
+
+void LinearInterpolation_Vec2fRange_Vec2fRange_float( const gm_kernels::KernelArg* i_args,
+                                                      size_t                       i_begin,
+                                                      size_t                       i_end )
+{
+    LinearInterpolation( KernelInput< Vec2fRange >( i_args[ 0 ], i_begin ),
+                         KernelInput< Vec2fRange >( i_args[ 1 ], i_begin ),
+                         KernelInput< float >( i_args[ 2 ], i_begin ),
+                         i_end - i_begin,
+                         KernelOutput< Vec2fRange >( i_args[ 3 ], i_begin ) );
+}
+
+void LinearInterpolation_Vec3fRange_Vec3fRange_float( const gm_kernels::KernelArg* i_args,
+                                                      size_t                       i_begin,
+                                                      size_t                       i_end )
+{
+    LinearInterpolation( KernelInput< Vec3fRange >( i_args[ 0 ], i_begin ),
+                         KernelInput< Vec3fRange >( i_args[ 1 ], i_begin ),
+                         KernelInput< float >( i_args[ 2 ], i_begin ),
+                         i_end - i_begin,
+                         KernelOutput< Vec3fRange >( i_args[ 3 ], i_begin ) );
+}
+
+void LinearInterpolation_Vec4fRange_Vec4fRange_float( const gm_kernels::KernelArg* i_args,
+                                                      size_t                       i_begin,
+                                                      size_t                       i_end )
+{
+    LinearInterpolation( KernelInput< Vec4fRange >( i_args[ 0 ], i_begin ),
+                         KernelInput< Vec4fRange >( i_args[ 1 ], i_begin ),
+                         KernelInput< float >( i_args[ 2 ], i_begin ),
+                         i_end - i_begin,
+                         KernelOutput< Vec4fRange >( i_args[ 3 ], i_begin ) );
+}
+
+void LinearInterpolation_FloatRange_FloatRange_float( const gm_kernels::KernelArg* i_args,
+                                                      size_t                       i_begin,
+                                                      size_t                       i_end )
+{
+    LinearInterpolation( KernelInput< FloatRange >( i_args[ 0 ], i_begin ),
+                         KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+                         KernelInput< float >( i_args[ 2 ], i_begin ),
+                         i_end - i_begin,
+                         KernelOutput< FloatRange >( i_args[ 3 ], i_begin ) );
+}
+
+void Normalize_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Normalize( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< Vec2f >( i_args[ 1 ], i_begin ) );
+}
+
+void Normalize_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Normalize( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< Vec3f >( i_args[ 1 ], i_begin ) );
+}
+
+void Normalize_Vec4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Normalize( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< Vec4f >( i_args[ 1 ], i_begin ) );
+}
+
+void Normalize_Quatf( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Normalize( KernelInput< Quatf >( i_args[ 0 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< Quatf >( i_args[ 1 ], i_begin ) );
+}
+
+void Inverse_Mat3f_Mat3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Inverse( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+             i_end - i_begin,
+             KernelOutput< Mat3f >( i_args[ 1 ], i_begin ),
+             KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Inverse_Mat4f_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Inverse( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+             i_end - i_begin,
+             KernelOutput< Mat4f >( i_args[ 1 ], i_begin ),
+             KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Min_float_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Min( KernelInput< float >( i_args[ 0 ], i_begin ),
+         KernelInput< float >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< float >( i_args[ 2 ], i_begin ) );
+}
+
+void Min_int_int( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Min( KernelInput< int >( i_args[ 0 ], i_begin ),
+         KernelInput< int >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< int >( i_args[ 2 ], i_begin ) );
+}
+
+void Min_bool_bool( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Min( KernelInput< bool >( i_args[ 0 ], i_begin ),
+         KernelInput< bool >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Min_Vec2f_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Min( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+         KernelInput< Vec2f >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Vec2f >( i_args[ 2 ], i_begin ) );
+}
+
+void Min_Vec3f_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Min( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+         KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Vec3f >( i_args[ 2 ], i_begin ) );
+}
+
+void Min_Vec4f_Vec4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Min( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+         KernelInput< Vec4f >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Vec4f >( i_args[ 2 ], i_begin ) );
+}
+
+void Min_Vec2i_Vec2i( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Min( KernelInput< Vec2i >( i_args[ 0 ], i_begin ),
+         KernelInput< Vec2i >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Vec2i >( i_args[ 2 ], i_begin ) );
+}
+
+void Min_Vec3i_Vec3i( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Min( KernelInput< Vec3i >( i_args[ 0 ], i_begin ),
+         KernelInput< Vec3i >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Vec3i >( i_args[ 2 ], i_begin ) );
+}
+
+void Min_Vec4i_Vec4i( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Min( KernelInput< Vec4i >( i_args[ 0 ], i_begin ),
+         KernelInput< Vec4i >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Vec4i >( i_args[ 2 ], i_begin ) );
+}
+
+void Min_Mat3f_Mat3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Min( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+         KernelInput< Mat3f >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Mat3f >( i_args[ 2 ], i_begin ) );
+}
+
+void Min_Mat4f_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Min( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+         KernelInput< Mat4f >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Mat4f >( i_args[ 2 ], i_begin ) );
+}
+
+void QuaternionProduct_Quatf_Quatf( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    QuaternionProduct( KernelInput< Quatf >( i_args[ 0 ], i_begin ),
+                       KernelInput< Quatf >( i_args[ 1 ], i_begin ),
+                       i_end - i_begin,
+                       KernelOutput< Quatf >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_FloatRange_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< FloatRange >( i_args[ 0 ], i_begin ),
+              KernelInput< float >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_FloatRange_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< FloatRange >( i_args[ 0 ], i_begin ),
+              KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_IntRange_int( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< IntRange >( i_args[ 0 ], i_begin ),
+              KernelInput< int >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_IntRange_IntRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< IntRange >( i_args[ 0 ], i_begin ),
+              KernelInput< IntRange >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_Vec2fRange_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< Vec2fRange >( i_args[ 0 ], i_begin ),
+              KernelInput< Vec2f >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_Vec2fRange_Vec2fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< Vec2fRange >( i_args[ 0 ], i_begin ),
+              KernelInput< Vec2fRange >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_Vec3fRange_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< Vec3fRange >( i_args[ 0 ], i_begin ),
+              KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_Vec3fRange_Vec3fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< Vec3fRange >( i_args[ 0 ], i_begin ),
+              KernelInput< Vec3fRange >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_Vec4fRange_Vec4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< Vec4fRange >( i_args[ 0 ], i_begin ),
+              KernelInput< Vec4f >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_Vec4fRange_Vec4fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< Vec4fRange >( i_args[ 0 ], i_begin ),
+              KernelInput< Vec4fRange >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_Vec2iRange_Vec2i( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< Vec2iRange >( i_args[ 0 ], i_begin ),
+              KernelInput< Vec2i >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_Vec2iRange_Vec2iRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< Vec2iRange >( i_args[ 0 ], i_begin ),
+              KernelInput< Vec2iRange >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_Vec3iRange_Vec3i( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< Vec3iRange >( i_args[ 0 ], i_begin ),
+              KernelInput< Vec3i >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_Vec3iRange_Vec3iRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< Vec3iRange >( i_args[ 0 ], i_begin ),
+              KernelInput< Vec3iRange >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_Vec4iRange_Vec4i( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< Vec4iRange >( i_args[ 0 ], i_begin ),
+              KernelInput< Vec4i >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Contains_Vec4iRange_Vec4iRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Contains( KernelInput< Vec4iRange >( i_args[ 0 ], i_begin ),
+              KernelInput< Vec4iRange >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void ApproximateSetRotate_float_Vec3f_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ApproximateSetRotate( KernelInput< float >( i_args[ 0 ], i_begin ),
+                          KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+                          i_end - i_begin,
+                          KernelOutput< Mat4f >( i_args[ 2 ], i_begin ) );
+}
+
+void ApproximateSetRotate_float_Vec3f_Quatf( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ApproximateSetRotate( KernelInput< float >( i_args[ 0 ], i_begin ),
+                          KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+                          i_end - i_begin,
+                          KernelOutput< Quatf >( i_args[ 2 ], i_begin ) );
+}
+
+void Content_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Content( KernelInput< FloatRange >( i_args[ 0 ], i_begin ),
+             i_end - i_begin,
+             KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void Content_IntRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Content( KernelInput< IntRange >( i_args[ 0 ], i_begin ),
+             i_end - i_begin,
+             KernelOutput< int >( i_args[ 1 ], i_begin ) );
+}
+
+void Content_Vec2fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Content( KernelInput< Vec2fRange >( i_args[ 0 ], i_begin ),
+             i_end - i_begin,
+             KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void Content_Vec3fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Content( KernelInput< Vec3fRange >( i_args[ 0 ], i_begin ),
+             i_end - i_begin,
+             KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void Content_Vec4fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Content( KernelInput< Vec4fRange >( i_args[ 0 ], i_begin ),
+             i_end - i_begin,
+             KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void Content_Vec2iRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Content( KernelInput< Vec2iRange >( i_args[ 0 ], i_begin ),
+             i_end - i_begin,
+             KernelOutput< int >( i_args[ 1 ], i_begin ) );
+}
+
+void Content_Vec3iRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Content( KernelInput< Vec3iRange >( i_args[ 0 ], i_begin ),
+             i_end - i_begin,
+             KernelOutput< int >( i_args[ 1 ], i_begin ) );
+}
+
+void Content_Vec4iRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Content( KernelInput< Vec4iRange >( i_args[ 0 ], i_begin ),
+             i_end - i_begin,
+             KernelOutput< int >( i_args[ 1 ], i_begin ) );
+}
+
+void SphericalLinearInterpolation_Quatf_Quatf_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    SphericalLinearInterpolation( KernelInput< Quatf >( i_args[ 0 ], i_begin ),
+                                  KernelInput< Quatf >( i_args[ 1 ], i_begin ),
+                                  KernelInput< float >( i_args[ 2 ], i_begin ),
+                                  i_end - i_begin,
+                                  KernelOutput< Quatf >( i_args[ 3 ], i_begin ) );
+}
+
+void Abs_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Abs( KernelInput< float >( i_args[ 0 ], i_begin ), i_end - i_begin, KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void Abs_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Abs( KernelInput< Vec2f >( i_args[ 0 ], i_begin ), i_end - i_begin, KernelOutput< Vec2f >( i_args[ 1 ], i_begin ) );
+}
+
+void Abs_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Abs( KernelInput< Vec3f >( i_args[ 0 ], i_begin ), i_end - i_begin, KernelOutput< Vec3f >( i_args[ 1 ], i_begin ) );
+}
+
+void Abs_Vec4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Abs( KernelInput< Vec4f >( i_args[ 0 ], i_begin ), i_end - i_begin, KernelOutput< Vec4f >( i_args[ 1 ], i_begin ) );
+}
+
+void Abs_Mat3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Abs( KernelInput< Mat3f >( i_args[ 0 ], i_begin ), i_end - i_begin, KernelOutput< Mat3f >( i_args[ 1 ], i_begin ) );
+}
+
+void Abs_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Abs( KernelInput< Mat4f >( i_args[ 0 ], i_begin ), i_end - i_begin, KernelOutput< Mat4f >( i_args[ 1 ], i_begin ) );
+}
+
+void IsIdentity_Mat3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    IsIdentity( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+                i_end - i_begin,
+                KernelOutput< bool >( i_args[ 1 ], i_begin ) );
+}
+
+void IsIdentity_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    IsIdentity( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+                i_end - i_begin,
+                KernelOutput< bool >( i_args[ 1 ], i_begin ) );
+}
+
+void ApproximateNormalize_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ApproximateNormalize( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+                          i_end - i_begin,
+                          KernelOutput< Vec2f >( i_args[ 1 ], i_begin ) );
+}
+
+void ApproximateNormalize_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ApproximateNormalize( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+                          i_end - i_begin,
+                          KernelOutput< Vec3f >( i_args[ 1 ], i_begin ) );
+}
+
+void ApproximateNormalize_Vec4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ApproximateNormalize( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+                          i_end - i_begin,
+                          KernelOutput< Vec4f >( i_args[ 1 ], i_begin ) );
+}
+
+void ApproximateNormalize_Quatf( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ApproximateNormalize( KernelInput< Quatf >( i_args[ 0 ], i_begin ),
+                          i_end - i_begin,
+                          KernelOutput< Quatf >( i_args[ 1 ], i_begin ) );
+}
+
+void TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f( const gm_kernels::KernelArg* i_args,
+                                                                                   size_t                       i_begin,
+                                                                                   size_t                       i_end )
+{
+    TrilinearInterpolation( KernelInput< float >( i_args[ 0 ], i_begin ),
+                            KernelInput< float >( i_args[ 1 ], i_begin ),
+                            KernelInput< float >( i_args[ 2 ], i_begin ),
+                            KernelInput< float >( i_args[ 3 ], i_begin ),
+                            KernelInput< float >( i_args[ 4 ], i_begin ),
+                            KernelInput< float >( i_args[ 5 ], i_begin ),
+                            KernelInput< float >( i_args[ 6 ], i_begin ),
+                            KernelInput< float >( i_args[ 7 ], i_begin ),
+                            KernelInput< Vec3f >( i_args[ 8 ], i_begin ),
+                            i_end - i_begin,
+                            KernelOutput< float >( i_args[ 9 ], i_begin ) );
+}
+
+void TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f( const gm_kernels::KernelArg* i_args,
+                                                                                   size_t                       i_begin,
+                                                                                   size_t                       i_end )
+{
+    TrilinearInterpolation( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+                            KernelInput< Mat3f >( i_args[ 1 ], i_begin ),
+                            KernelInput< Mat3f >( i_args[ 2 ], i_begin ),
+                            KernelInput< Mat3f >( i_args[ 3 ], i_begin ),
+                            KernelInput< Mat3f >( i_args[ 4 ], i_begin ),
+                            KernelInput< Mat3f >( i_args[ 5 ], i_begin ),
+                            KernelInput< Mat3f >( i_args[ 6 ], i_begin ),
+                            KernelInput< Mat3f >( i_args[ 7 ], i_begin ),
+                            KernelInput< Vec3f >( i_args[ 8 ], i_begin ),
+                            i_end - i_begin,
+                            KernelOutput< Mat3f >( i_args[ 9 ], i_begin ) );
+}
+
+void TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f( const gm_kernels::KernelArg* i_args,
+                                                                                   size_t                       i_begin,
+                                                                                   size_t                       i_end )
+{
+    TrilinearInterpolation( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+                            KernelInput< Mat4f >( i_args[ 1 ], i_begin ),
+                            KernelInput< Mat4f >( i_args[ 2 ], i_begin ),
+                            KernelInput< Mat4f >( i_args[ 3 ], i_begin ),
+                            KernelInput< Mat4f >( i_args[ 4 ], i_begin ),
+                            KernelInput< Mat4f >( i_args[ 5 ], i_begin ),
+                            KernelInput< Mat4f >( i_args[ 6 ], i_begin ),
+                            KernelInput< Mat4f >( i_args[ 7 ], i_begin ),
+                            KernelInput< Vec3f >( i_args[ 8 ], i_begin ),
+                            i_end - i_begin,
+                            KernelOutput< Mat4f >( i_args[ 9 ], i_begin ) );
+}
+
+void TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f( const gm_kernels::KernelArg* i_args,
+                                                                                   size_t                       i_begin,
+                                                                                   size_t                       i_end )
+{
+    TrilinearInterpolation( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+                            KernelInput< Vec2f >( i_args[ 1 ], i_begin ),
+                            KernelInput< Vec2f >( i_args[ 2 ], i_begin ),
+                            KernelInput< Vec2f >( i_args[ 3 ], i_begin ),
+                            KernelInput< Vec2f >( i_args[ 4 ], i_begin ),
+                            KernelInput< Vec2f >( i_args[ 5 ], i_begin ),
+                            KernelInput< Vec2f >( i_args[ 6 ], i_begin ),
+                            KernelInput< Vec2f >( i_args[ 7 ], i_begin ),
+                            KernelInput< Vec3f >( i_args[ 8 ], i_begin ),
+                            i_end - i_begin,
+                            KernelOutput< Vec2f >( i_args[ 9 ], i_begin ) );
+}
+
+void TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f( const gm_kernels::KernelArg* i_args,
+                                                                                   size_t                       i_begin,
+                                                                                   size_t                       i_end )
+{
+    TrilinearInterpolation( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+                            KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+                            KernelInput< Vec3f >( i_args[ 2 ], i_begin ),
+                            KernelInput< Vec3f >( i_args[ 3 ], i_begin ),
+                            KernelInput< Vec3f >( i_args[ 4 ], i_begin ),
+                            KernelInput< Vec3f >( i_args[ 5 ], i_begin ),
+                            KernelInput< Vec3f >( i_args[ 6 ], i_begin ),
+                            KernelInput< Vec3f >( i_args[ 7 ], i_begin ),
+                            KernelInput< Vec3f >( i_args[ 8 ], i_begin ),
+                            i_end - i_begin,
+                            KernelOutput< Vec3f >( i_args[ 9 ], i_begin ) );
+}
+
+void TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f( const gm_kernels::KernelArg* i_args,
+                                                                                   size_t                       i_begin,
+                                                                                   size_t                       i_end )
+{
+    TrilinearInterpolation( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+                            KernelInput< Vec4f >( i_args[ 1 ], i_begin ),
+                            KernelInput< Vec4f >( i_args[ 2 ], i_begin ),
+                            KernelInput< Vec4f >( i_args[ 3 ], i_begin ),
+                            KernelInput< Vec4f >( i_args[ 4 ], i_begin ),
+                            KernelInput< Vec4f >( i_args[ 5 ], i_begin ),
+                            KernelInput< Vec4f >( i_args[ 6 ], i_begin ),
+                            KernelInput< Vec4f >( i_args[ 7 ], i_begin ),
+                            KernelInput< Vec3f >( i_args[ 8 ], i_begin ),
+                            i_end - i_begin,
+                            KernelOutput< Vec4f >( i_args[ 9 ], i_begin ) );
+}
+
+void OrthographicProjection_float_float_float_float_float_float( const gm_kernels::KernelArg* i_args,
+                                                                 size_t                       i_begin,
+                                                                 size_t                       i_end )
+{
+    OrthographicProjection( KernelInput< float >( i_args[ 0 ], i_begin ),
+                            KernelInput< float >( i_args[ 1 ], i_begin ),
+                            KernelInput< float >( i_args[ 2 ], i_begin ),
+                            KernelInput< float >( i_args[ 3 ], i_begin ),
+                            KernelInput< float >( i_args[ 4 ], i_begin ),
+                            KernelInput< float >( i_args[ 5 ], i_begin ),
+                            i_end - i_begin,
+                            KernelOutput< Mat4f >( i_args[ 6 ], i_begin ) );
+}
+
+void BilinearInterpolation_float_float_float_float_Vec2f( const gm_kernels::KernelArg* i_args,
+                                                          size_t                       i_begin,
+                                                          size_t                       i_end )
+{
+    BilinearInterpolation( KernelInput< float >( i_args[ 0 ], i_begin ),
+                           KernelInput< float >( i_args[ 1 ], i_begin ),
+                           KernelInput< float >( i_args[ 2 ], i_begin ),
+                           KernelInput< float >( i_args[ 3 ], i_begin ),
+                           KernelInput< Vec2f >( i_args[ 4 ], i_begin ),
+                           i_end - i_begin,
+                           KernelOutput< float >( i_args[ 5 ], i_begin ) );
+}
+
+void BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f( const gm_kernels::KernelArg* i_args,
+                                                          size_t                       i_begin,
+                                                          size_t                       i_end )
+{
+    BilinearInterpolation( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+                           KernelInput< Mat3f >( i_args[ 1 ], i_begin ),
+                           KernelInput< Mat3f >( i_args[ 2 ], i_begin ),
+                           KernelInput< Mat3f >( i_args[ 3 ], i_begin ),
+                           KernelInput< Vec2f >( i_args[ 4 ], i_begin ),
+                           i_end - i_begin,
+                           KernelOutput< Mat3f >( i_args[ 5 ], i_begin ) );
+}
+
+void BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f( const gm_kernels::KernelArg* i_args,
+                                                          size_t                       i_begin,
+                                                          size_t                       i_end )
+{
+    BilinearInterpolation( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+                           KernelInput< Mat4f >( i_args[ 1 ], i_begin ),
+                           KernelInput< Mat4f >( i_args[ 2 ], i_begin ),
+                           KernelInput< Mat4f >( i_args[ 3 ], i_begin ),
+                           KernelInput< Vec2f >( i_args[ 4 ], i_begin ),
+                           i_end - i_begin,
+                           KernelOutput< Mat4f >( i_args[ 5 ], i_begin ) );
+}
+
+void BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f( const gm_kernels::KernelArg* i_args,
+                                                          size_t                       i_begin,
+                                                          size_t                       i_end )
+{
+    BilinearInterpolation( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+                           KernelInput< Vec2f >( i_args[ 1 ], i_begin ),
+                           KernelInput< Vec2f >( i_args[ 2 ], i_begin ),
+                           KernelInput< Vec2f >( i_args[ 3 ], i_begin ),
+                           KernelInput< Vec2f >( i_args[ 4 ], i_begin ),
+                           i_end - i_begin,
+                           KernelOutput< Vec2f >( i_args[ 5 ], i_begin ) );
+}
+
+void BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f( const gm_kernels::KernelArg* i_args,
+                                                          size_t                       i_begin,
+                                                          size_t                       i_end )
+{
+    BilinearInterpolation( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+                           KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+                           KernelInput< Vec3f >( i_args[ 2 ], i_begin ),
+                           KernelInput< Vec3f >( i_args[ 3 ], i_begin ),
+                           KernelInput< Vec2f >( i_args[ 4 ], i_begin ),
+                           i_end - i_begin,
+                           KernelOutput< Vec3f >( i_args[ 5 ], i_begin ) );
+}
+
+void BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f( const gm_kernels::KernelArg* i_args,
+                                                          size_t                       i_begin,
+                                                          size_t                       i_end )
+{
+    BilinearInterpolation( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+                           KernelInput< Vec4f >( i_args[ 1 ], i_begin ),
+                           KernelInput< Vec4f >( i_args[ 2 ], i_begin ),
+                           KernelInput< Vec4f >( i_args[ 3 ], i_begin ),
+                           KernelInput< Vec2f >( i_args[ 4 ], i_begin ),
+                           i_end - i_begin,
+                           KernelOutput< Vec4f >( i_args[ 5 ], i_begin ) );
+}
+
+void InverseAffine_Mat4f_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    InverseAffine( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+                   i_end - i_begin,
+                   KernelOutput< Mat4f >( i_args[ 1 ], i_begin ),
+                   KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void TransformAABB_Mat4f_Vec3fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    TransformAABB( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+                   KernelInput< Vec3fRange >( i_args[ 1 ], i_begin ),
+                   i_end - i_begin,
+                   KernelOutput< Vec3fRange >( i_args[ 2 ], i_begin ) );
+}
+
+void CrossProduct_Vec3f_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    CrossProduct( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+                  KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+                  i_end - i_begin,
+                  KernelOutput< Vec3f >( i_args[ 2 ], i_begin ) );
+}
+
+void LongestAxis_Vec2fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LongestAxis( KernelInput< Vec2fRange >( i_args[ 0 ], i_begin ),
+                 i_end - i_begin,
+                 KernelOutput< int >( i_args[ 1 ], i_begin ) );
+}
+
+void LongestAxis_Vec3fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LongestAxis( KernelInput< Vec3fRange >( i_args[ 0 ], i_begin ),
+                 i_end - i_begin,
+                 KernelOutput< int >( i_args[ 1 ], i_begin ) );
+}
+
+void LongestAxis_Vec4fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LongestAxis( KernelInput< Vec4fRange >( i_args[ 0 ], i_begin ),
+                 i_end - i_begin,
+                 KernelOutput< int >( i_args[ 1 ], i_begin ) );
+}
+
+void LongestAxis_Vec2iRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LongestAxis( KernelInput< Vec2iRange >( i_args[ 0 ], i_begin ),
+                 i_end - i_begin,
+                 KernelOutput< int >( i_args[ 1 ], i_begin ) );
+}
+
+void LongestAxis_Vec3iRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LongestAxis( KernelInput< Vec3iRange >( i_args[ 0 ], i_begin ),
+                 i_end - i_begin,
+                 KernelOutput< int >( i_args[ 1 ], i_begin ) );
+}
+
+void LongestAxis_Vec4iRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LongestAxis( KernelInput< Vec4iRange >( i_args[ 0 ], i_begin ),
+                 i_end - i_begin,
+                 KernelOutput< int >( i_args[ 1 ], i_begin ) );
+}
+
+void SetTranslate_Vec2f_Mat3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    SetTranslate( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+                  i_end - i_begin,
+                  KernelOutput< Mat3f >( i_args[ 1 ], i_begin ) );
+}
+
+void SetTranslate_Vec3f_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    SetTranslate( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+                  i_end - i_begin,
+                  KernelOutput< Mat4f >( i_args[ 1 ], i_begin ) );
+}
+
+void Max_float_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Max( KernelInput< float >( i_args[ 0 ], i_begin ),
+         KernelInput< float >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< float >( i_args[ 2 ], i_begin ) );
+}
+
+void Max_int_int( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Max( KernelInput< int >( i_args[ 0 ], i_begin ),
+         KernelInput< int >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< int >( i_args[ 2 ], i_begin ) );
+}
+
+void Max_bool_bool( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Max( KernelInput< bool >( i_args[ 0 ], i_begin ),
+         KernelInput< bool >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< bool >( i_args[ 2 ], i_begin ) );
+}
+
+void Max_Vec2f_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Max( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+         KernelInput< Vec2f >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Vec2f >( i_args[ 2 ], i_begin ) );
+}
+
+void Max_Vec3f_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Max( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+         KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Vec3f >( i_args[ 2 ], i_begin ) );
+}
+
+void Max_Vec4f_Vec4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Max( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+         KernelInput< Vec4f >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Vec4f >( i_args[ 2 ], i_begin ) );
+}
+
+void Max_Vec2i_Vec2i( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Max( KernelInput< Vec2i >( i_args[ 0 ], i_begin ),
+         KernelInput< Vec2i >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Vec2i >( i_args[ 2 ], i_begin ) );
+}
+
+void Max_Vec3i_Vec3i( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Max( KernelInput< Vec3i >( i_args[ 0 ], i_begin ),
+         KernelInput< Vec3i >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Vec3i >( i_args[ 2 ], i_begin ) );
+}
+
+void Max_Vec4i_Vec4i( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Max( KernelInput< Vec4i >( i_args[ 0 ], i_begin ),
+         KernelInput< Vec4i >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Vec4i >( i_args[ 2 ], i_begin ) );
+}
+
+void Max_Mat3f_Mat3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Max( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+         KernelInput< Mat3f >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Mat3f >( i_args[ 2 ], i_begin ) );
+}
+
+void Max_Mat4f_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Max( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+         KernelInput< Mat4f >( i_args[ 1 ], i_begin ),
+         i_end - i_begin,
+         KernelOutput< Mat4f >( i_args[ 2 ], i_begin ) );
+}
+
+void Floor_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Floor( KernelInput< float >( i_args[ 0 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void Floor_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Floor( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< Vec2f >( i_args[ 1 ], i_begin ) );
+}
+
+void Floor_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Floor( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< Vec3f >( i_args[ 1 ], i_begin ) );
+}
+
+void Floor_Vec4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Floor( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< Vec4f >( i_args[ 1 ], i_begin ) );
+}
+
+void Floor_Mat3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Floor( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< Mat3f >( i_args[ 1 ], i_begin ) );
+}
+
+void Floor_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Floor( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< Mat4f >( i_args[ 1 ], i_begin ) );
+}
+
+void Transpose_Mat3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Transpose( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< Mat3f >( i_args[ 1 ], i_begin ) );
+}
+
+void Transpose_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Transpose( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< Mat4f >( i_args[ 1 ], i_begin ) );
+}
+
+void SetScale_Vec2f_Mat3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    SetScale( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< Mat3f >( i_args[ 1 ], i_begin ) );
+}
+
+void SetScale_Vec3f_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    SetScale( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< Mat4f >( i_args[ 1 ], i_begin ) );
+}
+
+void Ceil_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Ceil( KernelInput< float >( i_args[ 0 ], i_begin ),
+          i_end - i_begin,
+          KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void Ceil_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Ceil( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+          i_end - i_begin,
+          KernelOutput< Vec2f >( i_args[ 1 ], i_begin ) );
+}
+
+void Ceil_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Ceil( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+          i_end - i_begin,
+          KernelOutput< Vec3f >( i_args[ 1 ], i_begin ) );
+}
+
+void Ceil_Vec4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Ceil( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+          i_end - i_begin,
+          KernelOutput< Vec4f >( i_args[ 1 ], i_begin ) );
+}
+
+void Ceil_Mat3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Ceil( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+          i_end - i_begin,
+          KernelOutput< Mat3f >( i_args[ 1 ], i_begin ) );
+}
+
+void Ceil_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Ceil( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+          i_end - i_begin,
+          KernelOutput< Mat4f >( i_args[ 1 ], i_begin ) );
+}
+
+void FaceForward_Vec2f_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    FaceForward( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+                 KernelInput< Vec2f >( i_args[ 1 ], i_begin ),
+                 i_end - i_begin,
+                 KernelOutput< Vec2f >( i_args[ 2 ], i_begin ) );
+}
+
+void FaceForward_Vec3f_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    FaceForward( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+                 KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+                 i_end - i_begin,
+                 KernelOutput< Vec3f >( i_args[ 2 ], i_begin ) );
+}
+
+void FaceForward_Vec4f_Vec4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    FaceForward( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+                 KernelInput< Vec4f >( i_args[ 1 ], i_begin ),
+                 i_end - i_begin,
+                 KernelOutput< Vec4f >( i_args[ 2 ], i_begin ) );
+}
+
+void RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRange( const gm_kernels::KernelArg* i_args,
+                                                            size_t                       i_begin,
+                                                            size_t                       i_end )
+{
+    RayAABBIntersection( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+                         KernelInput< Vec2f >( i_args[ 1 ], i_begin ),
+                         KernelInput< Vec2fRange >( i_args[ 2 ], i_begin ),
+                         i_end - i_begin,
+                         KernelOutput< FloatRange >( i_args[ 3 ], i_begin ),
+                         KernelOutput< bool >( i_args[ 4 ], i_begin ) );
+}
+
+void RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRange( const gm_kernels::KernelArg* i_args,
+                                                            size_t                       i_begin,
+                                                            size_t                       i_end )
+{
+    RayAABBIntersection( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+                         KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+                         KernelInput< Vec3fRange >( i_args[ 2 ], i_begin ),
+                         i_end - i_begin,
+                         KernelOutput< FloatRange >( i_args[ 3 ], i_begin ),
+                         KernelOutput< bool >( i_args[ 4 ], i_begin ) );
+}
+
+void RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRange( const gm_kernels::KernelArg* i_args,
+                                                            size_t                       i_begin,
+                                                            size_t                       i_end )
+{
+    RayAABBIntersection( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+                         KernelInput< Vec4f >( i_args[ 1 ], i_begin ),
+                         KernelInput< Vec4fRange >( i_args[ 2 ], i_begin ),
+                         i_end - i_begin,
+                         KernelOutput< FloatRange >( i_args[ 3 ], i_begin ),
+                         KernelOutput< bool >( i_args[ 4 ], i_begin ) );
+}
+
+void ApproximateLength_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ApproximateLength( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+                       i_end - i_begin,
+                       KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void ApproximateLength_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ApproximateLength( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+                       i_end - i_begin,
+                       KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void ApproximateLength_Vec4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ApproximateLength( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+                       i_end - i_begin,
+                       KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void ApproximateLength_Quatf( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ApproximateLength( KernelInput< Quatf >( i_args[ 0 ], i_begin ),
+                       i_end - i_begin,
+                       KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void LookAt_Vec3f_Vec3f_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LookAt( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+            KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+            KernelInput< Vec3f >( i_args[ 2 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< Mat4f >( i_args[ 3 ], i_begin ) );
+}
+
+void ApproximateSetRotateZ_float_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ApproximateSetRotateZ( KernelInput< float >( i_args[ 0 ], i_begin ),
+                           i_end - i_begin,
+                           KernelOutput< Mat4f >( i_args[ 1 ], i_begin ) );
+}
+
+void HasScale_Mat3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    HasScale( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 1 ], i_begin ) );
+}
+
+void HasScale_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    HasScale( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< bool >( i_args[ 1 ], i_begin ) );
+}
+
+void DotProduct_Vec2f_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    DotProduct( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+                KernelInput< Vec2f >( i_args[ 1 ], i_begin ),
+                i_end - i_begin,
+                KernelOutput< float >( i_args[ 2 ], i_begin ) );
+}
+
+void DotProduct_Vec3f_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    DotProduct( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+                KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+                i_end - i_begin,
+                KernelOutput< float >( i_args[ 2 ], i_begin ) );
+}
+
+void DotProduct_Vec4f_Vec4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    DotProduct( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+                KernelInput< Vec4f >( i_args[ 1 ], i_begin ),
+                i_end - i_begin,
+                KernelOutput< float >( i_args[ 2 ], i_begin ) );
+}
+
+void DotProduct_Quatf_Quatf( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    DotProduct( KernelInput< Quatf >( i_args[ 0 ], i_begin ),
+                KernelInput< Quatf >( i_args[ 1 ], i_begin ),
+                i_end - i_begin,
+                KernelOutput< float >( i_args[ 2 ], i_begin ) );
+}
+
+void ApproximateSineCosine_float_float_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ApproximateSineCosine( KernelInput< float >( i_args[ 0 ], i_begin ),
+                           i_end - i_begin,
+                           KernelOutput< float >( i_args[ 1 ], i_begin ),
+                           KernelOutput< float >( i_args[ 2 ], i_begin ) );
+}
+
+void Intersection_FloatRange_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Intersection( KernelInput< FloatRange >( i_args[ 0 ], i_begin ),
+                  KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+                  i_end - i_begin,
+                  KernelOutput< FloatRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Intersection_IntRange_IntRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Intersection( KernelInput< IntRange >( i_args[ 0 ], i_begin ),
+                  KernelInput< IntRange >( i_args[ 1 ], i_begin ),
+                  i_end - i_begin,
+                  KernelOutput< IntRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Intersection_Vec2fRange_Vec2fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Intersection( KernelInput< Vec2fRange >( i_args[ 0 ], i_begin ),
+                  KernelInput< Vec2fRange >( i_args[ 1 ], i_begin ),
+                  i_end - i_begin,
+                  KernelOutput< Vec2fRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Intersection_Vec3fRange_Vec3fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Intersection( KernelInput< Vec3fRange >( i_args[ 0 ], i_begin ),
+                  KernelInput< Vec3fRange >( i_args[ 1 ], i_begin ),
+                  i_end - i_begin,
+                  KernelOutput< Vec3fRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Intersection_Vec4fRange_Vec4fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Intersection( KernelInput< Vec4fRange >( i_args[ 0 ], i_begin ),
+                  KernelInput< Vec4fRange >( i_args[ 1 ], i_begin ),
+                  i_end - i_begin,
+                  KernelOutput< Vec4fRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Intersection_Vec2iRange_Vec2iRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Intersection( KernelInput< Vec2iRange >( i_args[ 0 ], i_begin ),
+                  KernelInput< Vec2iRange >( i_args[ 1 ], i_begin ),
+                  i_end - i_begin,
+                  KernelOutput< Vec2iRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Intersection_Vec3iRange_Vec3iRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Intersection( KernelInput< Vec3iRange >( i_args[ 0 ], i_begin ),
+                  KernelInput< Vec3iRange >( i_args[ 1 ], i_begin ),
+                  i_end - i_begin,
+                  KernelOutput< Vec3iRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Intersection_Vec4iRange_Vec4iRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Intersection( KernelInput< Vec4iRange >( i_args[ 0 ], i_begin ),
+                  KernelInput< Vec4iRange >( i_args[ 1 ], i_begin ),
+                  i_end - i_begin,
+                  KernelOutput< Vec4iRange >( i_args[ 2 ], i_begin ) );
+}
+
+void SetRotateY_float_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    SetRotateY( KernelInput< float >( i_args[ 0 ], i_begin ),
+                i_end - i_begin,
+                KernelOutput< Mat4f >( i_args[ 1 ], i_begin ) );
+}
+
+void SetRotateX_float_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    SetRotateX( KernelInput< float >( i_args[ 0 ], i_begin ),
+                i_end - i_begin,
+                KernelOutput< Mat4f >( i_args[ 1 ], i_begin ) );
+}
+
+void Expand_FloatRange_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< FloatRange >( i_args[ 0 ], i_begin ),
+            KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< FloatRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Expand_FloatRange_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< FloatRange >( i_args[ 0 ], i_begin ),
+            KernelInput< float >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< FloatRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Expand_IntRange_IntRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< IntRange >( i_args[ 0 ], i_begin ),
+            KernelInput< IntRange >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< IntRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Expand_IntRange_int( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< IntRange >( i_args[ 0 ], i_begin ),
+            KernelInput< int >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< IntRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Expand_Vec2fRange_Vec2fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< Vec2fRange >( i_args[ 0 ], i_begin ),
+            KernelInput< Vec2fRange >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< Vec2fRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Expand_Vec2fRange_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< Vec2fRange >( i_args[ 0 ], i_begin ),
+            KernelInput< Vec2f >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< Vec2fRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Expand_Vec3fRange_Vec3fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< Vec3fRange >( i_args[ 0 ], i_begin ),
+            KernelInput< Vec3fRange >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< Vec3fRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Expand_Vec3fRange_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< Vec3fRange >( i_args[ 0 ], i_begin ),
+            KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< Vec3fRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Expand_Vec4fRange_Vec4fRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< Vec4fRange >( i_args[ 0 ], i_begin ),
+            KernelInput< Vec4fRange >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< Vec4fRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Expand_Vec4fRange_Vec4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< Vec4fRange >( i_args[ 0 ], i_begin ),
+            KernelInput< Vec4f >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< Vec4fRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Expand_Vec2iRange_Vec2iRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< Vec2iRange >( i_args[ 0 ], i_begin ),
+            KernelInput< Vec2iRange >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< Vec2iRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Expand_Vec2iRange_Vec2i( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< Vec2iRange >( i_args[ 0 ], i_begin ),
+            KernelInput< Vec2i >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< Vec2iRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Expand_Vec3iRange_Vec3iRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< Vec3iRange >( i_args[ 0 ], i_begin ),
+            KernelInput< Vec3iRange >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< Vec3iRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Expand_Vec3iRange_Vec3i( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< Vec3iRange >( i_args[ 0 ], i_begin ),
+            KernelInput< Vec3i >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< Vec3iRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Expand_Vec4iRange_Vec4iRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< Vec4iRange >( i_args[ 0 ], i_begin ),
+            KernelInput< Vec4iRange >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< Vec4iRange >( i_args[ 2 ], i_begin ) );
+}
+
+void Expand_Vec4iRange_Vec4i( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Expand( KernelInput< Vec4iRange >( i_args[ 0 ], i_begin ),
+            KernelInput< Vec4i >( i_args[ 1 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< Vec4iRange >( i_args[ 2 ], i_begin ) );
+}
+
+void SetRotateZ_float_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    SetRotateZ( KernelInput< float >( i_args[ 0 ], i_begin ),
+                i_end - i_begin,
+                KernelOutput< Mat4f >( i_args[ 1 ], i_begin ) );
+}
+
+void Distance_Vec2f_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Distance( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+              KernelInput< Vec2f >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< float >( i_args[ 2 ], i_begin ) );
+}
+
+void Distance_Vec3f_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Distance( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+              KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+              i_end - i_begin,
+              KernelOutput< float >( i_args[ 2 ], i_begin ) );
+}
+
+void RayPosition_Vec2f_Vec2f_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    RayPosition( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+                 KernelInput< Vec2f >( i_args[ 1 ], i_begin ),
+                 KernelInput< float >( i_args[ 2 ], i_begin ),
+                 i_end - i_begin,
+                 KernelOutput< Vec2f >( i_args[ 3 ], i_begin ) );
+}
+
+void RayPosition_Vec3f_Vec3f_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    RayPosition( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+                 KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+                 KernelInput< float >( i_args[ 2 ], i_begin ),
+                 i_end - i_begin,
+                 KernelOutput< Vec3f >( i_args[ 3 ], i_begin ) );
+}
+
+void TransformPoint_Mat4f_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    TransformPoint( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+                    KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+                    i_end - i_begin,
+                    KernelOutput< Vec3f >( i_args[ 2 ], i_begin ) );
+}
+
+void NormalizedLinearInterpolation_Quatf_Quatf_float( const gm_kernels::KernelArg* i_args,
+                                                      size_t                       i_begin,
+                                                      size_t                       i_end )
+{
+    NormalizedLinearInterpolation( KernelInput< Quatf >( i_args[ 0 ], i_begin ),
+                                   KernelInput< Quatf >( i_args[ 1 ], i_begin ),
+                                   KernelInput< float >( i_args[ 2 ], i_begin ),
+                                   i_end - i_begin,
+                                   KernelOutput< Quatf >( i_args[ 3 ], i_begin ) );
+}
+
+void Radians_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Radians( KernelInput< float >( i_args[ 0 ], i_begin ),
+             i_end - i_begin,
+             KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void CoordinateSystem_Vec3f_Vec3f_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    CoordinateSystem( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+                      i_end - i_begin,
+                      KernelOutput< Vec3f >( i_args[ 1 ], i_begin ),
+                      KernelOutput< Vec3f >( i_args[ 2 ], i_begin ) );
+}
+
+void Length_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Length( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void Length_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Length( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void Length_Vec4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Length( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void Length_Quatf( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Length( KernelInput< Quatf >( i_args[ 0 ], i_begin ),
+            i_end - i_begin,
+            KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void ApproximateReciprocalSquareRoot_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ApproximateReciprocalSquareRoot( KernelInput< float >( i_args[ 0 ], i_begin ),
+                                     i_end - i_begin,
+                                     KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void ApproximateSetRotateX_float_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ApproximateSetRotateX( KernelInput< float >( i_args[ 0 ], i_begin ),
+                           i_end - i_begin,
+                           KernelOutput< Mat4f >( i_args[ 1 ], i_begin ) );
+}
+
+void SetIdentity_Mat3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    SetIdentity( i_end - i_begin, KernelOutput< Mat3f >( i_args[ 0 ], i_begin ) );
+}
+
+void SetIdentity_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    SetIdentity( i_end - i_begin, KernelOutput< Mat4f >( i_args[ 0 ], i_begin ) );
+}
+
+void LinearMap_float_FloatRange_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LinearMap( KernelInput< float >( i_args[ 0 ], i_begin ),
+               KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+               KernelInput< FloatRange >( i_args[ 2 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< float >( i_args[ 3 ], i_begin ) );
+}
+
+void LinearMap_Mat3f_FloatRange_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LinearMap( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+               KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+               KernelInput< FloatRange >( i_args[ 2 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< Mat3f >( i_args[ 3 ], i_begin ) );
+}
+
+void LinearMap_Mat4f_FloatRange_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LinearMap( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+               KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+               KernelInput< FloatRange >( i_args[ 2 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< Mat4f >( i_args[ 3 ], i_begin ) );
+}
+
+void LinearMap_Vec2f_FloatRange_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LinearMap( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+               KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+               KernelInput< FloatRange >( i_args[ 2 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< Vec2f >( i_args[ 3 ], i_begin ) );
+}
+
+void LinearMap_Vec3f_FloatRange_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LinearMap( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+               KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+               KernelInput< FloatRange >( i_args[ 2 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< Vec3f >( i_args[ 3 ], i_begin ) );
+}
+
+void LinearMap_Vec4f_FloatRange_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LinearMap( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+               KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+               KernelInput< FloatRange >( i_args[ 2 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< Vec4f >( i_args[ 3 ], i_begin ) );
+}
+
+void Clamp_float_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Clamp( KernelInput< float >( i_args[ 0 ], i_begin ),
+           KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< float >( i_args[ 2 ], i_begin ) );
+}
+
+void Clamp_int_IntRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Clamp( KernelInput< int >( i_args[ 0 ], i_begin ),
+           KernelInput< IntRange >( i_args[ 1 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< int >( i_args[ 2 ], i_begin ) );
+}
+
+void Clamp_Vec2f_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Clamp( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+           KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< Vec2f >( i_args[ 2 ], i_begin ) );
+}
+
+void Clamp_Vec3f_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Clamp( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+           KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< Vec3f >( i_args[ 2 ], i_begin ) );
+}
+
+void Clamp_Vec4f_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Clamp( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+           KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< Vec4f >( i_args[ 2 ], i_begin ) );
+}
+
+void Clamp_Vec2i_IntRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Clamp( KernelInput< Vec2i >( i_args[ 0 ], i_begin ),
+           KernelInput< IntRange >( i_args[ 1 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< Vec2i >( i_args[ 2 ], i_begin ) );
+}
+
+void Clamp_Vec3i_IntRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Clamp( KernelInput< Vec3i >( i_args[ 0 ], i_begin ),
+           KernelInput< IntRange >( i_args[ 1 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< Vec3i >( i_args[ 2 ], i_begin ) );
+}
+
+void Clamp_Vec4i_IntRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Clamp( KernelInput< Vec4i >( i_args[ 0 ], i_begin ),
+           KernelInput< IntRange >( i_args[ 1 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< Vec4i >( i_args[ 2 ], i_begin ) );
+}
+
+void Clamp_Mat3f_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Clamp( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+           KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< Mat3f >( i_args[ 2 ], i_begin ) );
+}
+
+void Clamp_Mat4f_FloatRange( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Clamp( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+           KernelInput< FloatRange >( i_args[ 1 ], i_begin ),
+           i_end - i_begin,
+           KernelOutput< Mat4f >( i_args[ 2 ], i_begin ) );
+}
+
+void LengthSquared_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LengthSquared( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+                   i_end - i_begin,
+                   KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void LengthSquared_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LengthSquared( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+                   i_end - i_begin,
+                   KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void LengthSquared_Vec4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LengthSquared( KernelInput< Vec4f >( i_args[ 0 ], i_begin ),
+                   i_end - i_begin,
+                   KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void LengthSquared_Quatf( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    LengthSquared( KernelInput< Quatf >( i_args[ 0 ], i_begin ),
+                   i_end - i_begin,
+                   KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void InverseRigid_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    InverseRigid( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+                  i_end - i_begin,
+                  KernelOutput< Mat4f >( i_args[ 1 ], i_begin ) );
+}
+
+void RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRange( const gm_kernels::KernelArg* i_args,
+                                                               size_t                       i_begin,
+                                                               size_t                       i_end )
+{
+    RaySphereIntersection( KernelInput< Vec3f >( i_args[ 0 ], i_begin ),
+                           KernelInput< float >( i_args[ 1 ], i_begin ),
+                           KernelInput< Vec3f >( i_args[ 2 ], i_begin ),
+                           KernelInput< Vec3f >( i_args[ 3 ], i_begin ),
+                           i_end - i_begin,
+                           KernelOutput< FloatRange >( i_args[ 4 ], i_begin ),
+                           KernelOutput< int >( i_args[ 5 ], i_begin ) );
+}
+
+void PerspectiveProjection_float_float_float_float_float_float( const gm_kernels::KernelArg* i_args,
+                                                                size_t                       i_begin,
+                                                                size_t                       i_end )
+{
+    PerspectiveProjection( KernelInput< float >( i_args[ 0 ], i_begin ),
+                           KernelInput< float >( i_args[ 1 ], i_begin ),
+                           KernelInput< float >( i_args[ 2 ], i_begin ),
+                           KernelInput< float >( i_args[ 3 ], i_begin ),
+                           KernelInput< float >( i_args[ 4 ], i_begin ),
+                           KernelInput< float >( i_args[ 5 ], i_begin ),
+                           i_end - i_begin,
+                           KernelOutput< Mat4f >( i_args[ 6 ], i_begin ) );
+}
+
+void PerspectiveProjection_float_float_float_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    PerspectiveProjection( KernelInput< float >( i_args[ 0 ], i_begin ),
+                           KernelInput< float >( i_args[ 1 ], i_begin ),
+                           KernelInput< float >( i_args[ 2 ], i_begin ),
+                           KernelInput< float >( i_args[ 3 ], i_begin ),
+                           i_end - i_begin,
+                           KernelOutput< Mat4f >( i_args[ 4 ], i_begin ) );
+}
+
+void SetRotate_float_Vec3f_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    SetRotate( KernelInput< float >( i_args[ 0 ], i_begin ),
+               KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< Mat4f >( i_args[ 2 ], i_begin ) );
+}
+
+void SetRotate_float_Vec3f_Quatf( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    SetRotate( KernelInput< float >( i_args[ 0 ], i_begin ),
+               KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< Quatf >( i_args[ 2 ], i_begin ) );
+}
+
+void SetRotate_Quatf_Mat3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    SetRotate( KernelInput< Quatf >( i_args[ 0 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< Mat3f >( i_args[ 1 ], i_begin ) );
+}
+
+void SetRotate_Quatf_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    SetRotate( KernelInput< Quatf >( i_args[ 0 ], i_begin ),
+               i_end - i_begin,
+               KernelOutput< Mat4f >( i_args[ 1 ], i_begin ) );
+}
+
+void ViewportTransform_Vec2f_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ViewportTransform( KernelInput< Vec2f >( i_args[ 0 ], i_begin ),
+                       KernelInput< Vec2f >( i_args[ 1 ], i_begin ),
+                       i_end - i_begin,
+                       KernelOutput< Mat4f >( i_args[ 2 ], i_begin ) );
+}
+
+void MatrixProduct_Mat3f_Mat3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    MatrixProduct( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+                   KernelInput< Mat3f >( i_args[ 1 ], i_begin ),
+                   i_end - i_begin,
+                   KernelOutput< Mat3f >( i_args[ 2 ], i_begin ) );
+}
+
+void MatrixProduct_Mat4f_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    MatrixProduct( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+                   KernelInput< Mat4f >( i_args[ 1 ], i_begin ),
+                   i_end - i_begin,
+                   KernelOutput< Mat4f >( i_args[ 2 ], i_begin ) );
+}
+
+void TransformVector_Mat3f_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    TransformVector( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+                     KernelInput< Vec2f >( i_args[ 1 ], i_begin ),
+                     i_end - i_begin,
+                     KernelOutput< Vec2f >( i_args[ 2 ], i_begin ) );
+}
+
+void TransformVector_Mat4f_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    TransformVector( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+                     KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+                     i_end - i_begin,
+                     KernelOutput< Vec3f >( i_args[ 2 ], i_begin ) );
+}
+
+void TransformVector_Quatf_Vec3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    TransformVector( KernelInput< Quatf >( i_args[ 0 ], i_begin ),
+                     KernelInput< Vec3f >( i_args[ 1 ], i_begin ),
+                     i_end - i_begin,
+                     KernelOutput< Vec3f >( i_args[ 2 ], i_begin ) );
+}
+
+void QuadraticRoots_float_float_float_Vec2f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    QuadraticRoots( KernelInput< float >( i_args[ 0 ], i_begin ),
+                    KernelInput< float >( i_args[ 1 ], i_begin ),
+                    KernelInput< float >( i_args[ 2 ], i_begin ),
+                    i_end - i_begin,
+                    KernelOutput< Vec2f >( i_args[ 3 ], i_begin ),
+                    KernelOutput< int >( i_args[ 4 ], i_begin ) );
+}
+
+void RotationQuaternion_Mat3f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    RotationQuaternion( KernelInput< Mat3f >( i_args[ 0 ], i_begin ),
+                        i_end - i_begin,
+                        KernelOutput< Quatf >( i_args[ 1 ], i_begin ) );
+}
+
+void RotationQuaternion_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    RotationQuaternion( KernelInput< Mat4f >( i_args[ 0 ], i_begin ),
+                        i_end - i_begin,
+                        KernelOutput< Quatf >( i_args[ 1 ], i_begin ) );
+}
+
+void Degrees_float( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    Degrees( KernelInput< float >( i_args[ 0 ], i_begin ),
+             i_end - i_begin,
+             KernelOutput< float >( i_args[ 1 ], i_begin ) );
+}
+
+void ApproximateSetRotateY_float_Mat4f( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    ApproximateSetRotateY( KernelInput< float >( i_args[ 0 ], i_begin ),
+                           i_end - i_begin,
+                           KernelOutput< Mat4f >( i_args[ 1 ], i_begin ) );
+}
+
+} // namespace
+
+namespace gm_kernels
+{
+/// Get the kernel set compiled by this translation unit.
+GM_KERNEL_SET_VISIBLE const KernelSet& GM_KERNEL_SET_GETTER( GM_KERNEL_SET )()
+{
+    static const KernelSet s_kernelSet = {
+        GM_KERNEL_SET_STRING( GM_KERNEL_SET ),
+        &LinearInterpolation_float_float_float,
+        &LinearInterpolation_Mat3f_Mat3f_float,
+        &LinearInterpolation_Mat4f_Mat4f_float,
+        &LinearInterpolation_Vec2f_Vec2f_float,
+        &LinearInterpolation_Vec3f_Vec3f_float,
+        &LinearInterpolation_Vec4f_Vec4f_float,
+        &LinearInterpolation_Vec2fRange_Vec2fRange_float,
+        &LinearInterpolation_Vec3fRange_Vec3fRange_float,
+        &LinearInterpolation_Vec4fRange_Vec4fRange_float,
+        &LinearInterpolation_FloatRange_FloatRange_float,
+        &Normalize_Vec2f,
+        &Normalize_Vec3f,
+        &Normalize_Vec4f,
+        &Normalize_Quatf,
+        &Inverse_Mat3f_Mat3f,
+        &Inverse_Mat4f_Mat4f,
+        &Min_float_float,
+        &Min_int_int,
+        &Min_bool_bool,
+        &Min_Vec2f_Vec2f,
+        &Min_Vec3f_Vec3f,
+        &Min_Vec4f_Vec4f,
+        &Min_Vec2i_Vec2i,
+        &Min_Vec3i_Vec3i,
+        &Min_Vec4i_Vec4i,
+        &Min_Mat3f_Mat3f,
+        &Min_Mat4f_Mat4f,
+        &QuaternionProduct_Quatf_Quatf,
+        &Contains_FloatRange_float,
+        &Contains_FloatRange_FloatRange,
+        &Contains_IntRange_int,
+        &Contains_IntRange_IntRange,
+        &Contains_Vec2fRange_Vec2f,
+        &Contains_Vec2fRange_Vec2fRange,
+        &Contains_Vec3fRange_Vec3f,
+        &Contains_Vec3fRange_Vec3fRange,
+        &Contains_Vec4fRange_Vec4f,
+        &Contains_Vec4fRange_Vec4fRange,
+        &Contains_Vec2iRange_Vec2i,
+        &Contains_Vec2iRange_Vec2iRange,
+        &Contains_Vec3iRange_Vec3i,
+        &Contains_Vec3iRange_Vec3iRange,
+        &Contains_Vec4iRange_Vec4i,
+        &Contains_Vec4iRange_Vec4iRange,
+        &ApproximateSetRotate_float_Vec3f_Mat4f,
+        &ApproximateSetRotate_float_Vec3f_Quatf,
+        &Content_FloatRange,
+        &Content_IntRange,
+        &Content_Vec2fRange,
+        &Content_Vec3fRange,
+        &Content_Vec4fRange,
+        &Content_Vec2iRange,
+        &Content_Vec3iRange,
+        &Content_Vec4iRange,
+        &SphericalLinearInterpolation_Quatf_Quatf_float,
+        &Abs_float,
+        &Abs_Vec2f,
+        &Abs_Vec3f,
+        &Abs_Vec4f,
+        &Abs_Mat3f,
+        &Abs_Mat4f,
+        &IsIdentity_Mat3f,
+        &IsIdentity_Mat4f,
+        &ApproximateNormalize_Vec2f,
+        &ApproximateNormalize_Vec3f,
+        &ApproximateNormalize_Vec4f,
+        &ApproximateNormalize_Quatf,
+        &TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f,
+        &TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f,
+        &TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f,
+        &TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f,
+        &TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f,
+        &TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f,
+        &OrthographicProjection_float_float_float_float_float_float,
+        &BilinearInterpolation_float_float_float_float_Vec2f,
+        &BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f,
+        &BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f,
+        &BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f,
+        &BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f,
+        &BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f,
+        &InverseAffine_Mat4f_Mat4f,
+        &TransformAABB_Mat4f_Vec3fRange,
+        &CrossProduct_Vec3f_Vec3f,
+        &LongestAxis_Vec2fRange,
+        &LongestAxis_Vec3fRange,
+        &LongestAxis_Vec4fRange,
+        &LongestAxis_Vec2iRange,
+        &LongestAxis_Vec3iRange,
+        &LongestAxis_Vec4iRange,
+        &SetTranslate_Vec2f_Mat3f,
+        &SetTranslate_Vec3f_Mat4f,
+        &Max_float_float,
+        &Max_int_int,
+        &Max_bool_bool,
+        &Max_Vec2f_Vec2f,
+        &Max_Vec3f_Vec3f,
+        &Max_Vec4f_Vec4f,
+        &Max_Vec2i_Vec2i,
+        &Max_Vec3i_Vec3i,
+        &Max_Vec4i_Vec4i,
+        &Max_Mat3f_Mat3f,
+        &Max_Mat4f_Mat4f,
+        &Floor_float,
+        &Floor_Vec2f,
+        &Floor_Vec3f,
+        &Floor_Vec4f,
+        &Floor_Mat3f,
+        &Floor_Mat4f,
+        &Transpose_Mat3f,
+        &Transpose_Mat4f,
+        &SetScale_Vec2f_Mat3f,
+        &SetScale_Vec3f_Mat4f,
+        &Ceil_float,
+        &Ceil_Vec2f,
+        &Ceil_Vec3f,
+        &Ceil_Vec4f,
+        &Ceil_Mat3f,
+        &Ceil_Mat4f,
+        &FaceForward_Vec2f_Vec2f,
+        &FaceForward_Vec3f_Vec3f,
+        &FaceForward_Vec4f_Vec4f,
+        &RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRange,
+        &RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRange,
+        &RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRange,
+        &ApproximateLength_Vec2f,
+        &ApproximateLength_Vec3f,
+        &ApproximateLength_Vec4f,
+        &ApproximateLength_Quatf,
+        &LookAt_Vec3f_Vec3f_Vec3f,
+        &ApproximateSetRotateZ_float_Mat4f,
+        &HasScale_Mat3f,
+        &HasScale_Mat4f,
+        &DotProduct_Vec2f_Vec2f,
+        &DotProduct_Vec3f_Vec3f,
+        &DotProduct_Vec4f_Vec4f,
+        &DotProduct_Quatf_Quatf,
+        &ApproximateSineCosine_float_float_float,
+        &Intersection_FloatRange_FloatRange,
+        &Intersection_IntRange_IntRange,
+        &Intersection_Vec2fRange_Vec2fRange,
+        &Intersection_Vec3fRange_Vec3fRange,
+        &Intersection_Vec4fRange_Vec4fRange,
+        &Intersection_Vec2iRange_Vec2iRange,
+        &Intersection_Vec3iRange_Vec3iRange,
+        &Intersection_Vec4iRange_Vec4iRange,
+        &SetRotateY_float_Mat4f,
+        &SetRotateX_float_Mat4f,
+        &Expand_FloatRange_FloatRange,
+        &Expand_FloatRange_float,
+        &Expand_IntRange_IntRange,
+        &Expand_IntRange_int,
+        &Expand_Vec2fRange_Vec2fRange,
+        &Expand_Vec2fRange_Vec2f,
+        &Expand_Vec3fRange_Vec3fRange,
+        &Expand_Vec3fRange_Vec3f,
+        &Expand_Vec4fRange_Vec4fRange,
+        &Expand_Vec4fRange_Vec4f,
+        &Expand_Vec2iRange_Vec2iRange,
+        &Expand_Vec2iRange_Vec2i,
+        &Expand_Vec3iRange_Vec3iRange,
+        &Expand_Vec3iRange_Vec3i,
+        &Expand_Vec4iRange_Vec4iRange,
+        &Expand_Vec4iRange_Vec4i,
+        &SetRotateZ_float_Mat4f,
+        &Distance_Vec2f_Vec2f,
+        &Distance_Vec3f_Vec3f,
+        &RayPosition_Vec2f_Vec2f_float,
+        &RayPosition_Vec3f_Vec3f_float,
+        &TransformPoint_Mat4f_Vec3f,
+        &NormalizedLinearInterpolation_Quatf_Quatf_float,
+        &Radians_float,
+        &CoordinateSystem_Vec3f_Vec3f_Vec3f,
+        &Length_Vec2f,
+        &Length_Vec3f,
+        &Length_Vec4f,
+        &Length_Quatf,
+        &ApproximateReciprocalSquareRoot_float,
+        &ApproximateSetRotateX_float_Mat4f,
+        &SetIdentity_Mat3f,
+        &SetIdentity_Mat4f,
+        &LinearMap_float_FloatRange_FloatRange,
+        &LinearMap_Mat3f_FloatRange_FloatRange,
+        &LinearMap_Mat4f_FloatRange_FloatRange,
+        &LinearMap_Vec2f_FloatRange_FloatRange,
+        &LinearMap_Vec3f_FloatRange_FloatRange,
+        &LinearMap_Vec4f_FloatRange_FloatRange,
+        &Clamp_float_FloatRange,
+        &Clamp_int_IntRange,
+        &Clamp_Vec2f_FloatRange,
+        &Clamp_Vec3f_FloatRange,
+        &Clamp_Vec4f_FloatRange,
+        &Clamp_Vec2i_IntRange,
+        &Clamp_Vec3i_IntRange,
+        &Clamp_Vec4i_IntRange,
+        &Clamp_Mat3f_FloatRange,
+        &Clamp_Mat4f_FloatRange,
+        &LengthSquared_Vec2f,
+        &LengthSquared_Vec3f,
+        &LengthSquared_Vec4f,
+        &LengthSquared_Quatf,
+        &InverseRigid_Mat4f,
+        &RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRange,
+        &PerspectiveProjection_float_float_float_float_float_float,
+        &PerspectiveProjection_float_float_float_float,
+        &SetRotate_float_Vec3f_Mat4f,
+        &SetRotate_float_Vec3f_Quatf,
+        &SetRotate_Quatf_Mat3f,
+        &SetRotate_Quatf_Mat4f,
+        &ViewportTransform_Vec2f_Vec2f,
+        &MatrixProduct_Mat3f_Mat3f,
+        &MatrixProduct_Mat4f_Mat4f,
+        &TransformVector_Mat3f_Vec2f,
+        &TransformVector_Mat4f_Vec3f,
+        &TransformVector_Quatf_Vec3f,
+        &QuadraticRoots_float_float_float_Vec2f,
+        &RotationQuaternion_Mat3f,
+        &RotationQuaternion_Mat4f,
+        &Degrees_float,
+        &ApproximateSetRotateY_float_Mat4f,
+
+    };
+    return s_kernelSet;
+}
+} // namespace gm_kernels
\ No newline at end of file
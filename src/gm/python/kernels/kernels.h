@@ -0,0 +1,305 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+// Batched function kernels, compiled once per instruction set and selected at import time.
+//
+// Each kernel set is compiled from kernels/kernelSet.cpp, with the flags of its instruction set and with
+// GM_NS defined to a distinct namespace, such that the inline gm functions compiled for different instruction
+// sets never collide at link time.  The kernel interface below is thus declared in a fixed namespace, and only
+// exchanges type-erased pointers.
+
+#include <cstddef>
+#include <vector>
+
+namespace gm_kernels
+{
+/// \struct KernelArg
+///
+/// Type-erased argument of a kernel, referencing either an array of elements or a single element
+/// broadcasted across the batch.
+struct KernelArg
+{
+    /// The first element.
+    const void* data;
+
+    /// The distance between consecutive elements, in elements: 1 for arrays, 0 for broadcasted elements.
+    size_t stride;
+};
+
+/// Evaluate a batched function over the elements [\p i_begin, \p i_end).
+///
+/// \param i_args The inputs, followed by the outputs of the batched C++ overload, see functions/batch/.
+/// \param i_begin The first element.
+/// \param i_end One past the last element.
+using Kernel = void ( * )( const KernelArg* i_args, size_t i_begin, size_t i_end );
+
+/// \struct KernelSet
+///
+/// The kernels of all the batched functions, compiled for a single instruction set.
+struct KernelSet
+{
+    /// The name of the instruction set.
+    const char* name;
+
+    Kernel LinearInterpolation_float_float_float;
+    Kernel LinearInterpolation_Mat3f_Mat3f_float;
+    Kernel LinearInterpolation_Mat4f_Mat4f_float;
+    Kernel LinearInterpolation_Vec2f_Vec2f_float;
+    Kernel LinearInterpolation_Vec3f_Vec3f_float;
+    Kernel LinearInterpolation_Vec4f_Vec4f_float;
+    Kernel LinearInterpolation_Vec2fRange_Vec2fRange_float;
+    Kernel LinearInterpolation_Vec3fRange_Vec3fRange_float;
+    Kernel LinearInterpolation_Vec4fRange_Vec4fRange_float;
+    Kernel LinearInterpolation_FloatRange_FloatRange_float;
+    Kernel Normalize_Vec2f;
+    Kernel Normalize_Vec3f;
+    Kernel Normalize_Vec4f;
+    Kernel Normalize_Quatf;
+    Kernel Inverse_Mat3f_Mat3f;
+    Kernel Inverse_Mat4f_Mat4f;
+    Kernel Min_float_float;
+    Kernel Min_int_int;
+    Kernel Min_bool_bool;
+    Kernel Min_Vec2f_Vec2f;
+    Kernel Min_Vec3f_Vec3f;
+    Kernel Min_Vec4f_Vec4f;
+    Kernel Min_Vec2i_Vec2i;
+    Kernel Min_Vec3i_Vec3i;
+    Kernel Min_Vec4i_Vec4i;
+    Kernel Min_Mat3f_Mat3f;
+    Kernel Min_Mat4f_Mat4f;
+    Kernel QuaternionProduct_Quatf_Quatf;
+    Kernel Contains_FloatRange_float;
+    Kernel Contains_FloatRange_FloatRange;
+    Kernel Contains_IntRange_int;
+    Kernel Contains_IntRange_IntRange;
+    Kernel Contains_Vec2fRange_Vec2f;
+    Kernel Contains_Vec2fRange_Vec2fRange;
+    Kernel Contains_Vec3fRange_Vec3f;
+    Kernel Contains_Vec3fRange_Vec3fRange;
+    Kernel Contains_Vec4fRange_Vec4f;
+    Kernel Contains_Vec4fRange_Vec4fRange;
+    Kernel Contains_Vec2iRange_Vec2i;
+    Kernel Contains_Vec2iRange_Vec2iRange;
+    Kernel Contains_Vec3iRange_Vec3i;
+    Kernel Contains_Vec3iRange_Vec3iRange;
+    Kernel Contains_Vec4iRange_Vec4i;
+    Kernel Contains_Vec4iRange_Vec4iRange;
+    Kernel ApproximateSetRotate_float_Vec3f_Mat4f;
+    Kernel ApproximateSetRotate_float_Vec3f_Quatf;
+    Kernel Content_FloatRange;
+    Kernel Content_IntRange;
+    Kernel Content_Vec2fRange;
+    Kernel Content_Vec3fRange;
+    Kernel Content_Vec4fRange;
+    Kernel Content_Vec2iRange;
+    Kernel Content_Vec3iRange;
+    Kernel Content_Vec4iRange;
+    Kernel SphericalLinearInterpolation_Quatf_Quatf_float;
+    Kernel Abs_float;
+    Kernel Abs_Vec2f;
+    Kernel Abs_Vec3f;
+    Kernel Abs_Vec4f;
+    Kernel Abs_Mat3f;
+    Kernel Abs_Mat4f;
+    Kernel IsIdentity_Mat3f;
+    Kernel IsIdentity_Mat4f;
+    Kernel ApproximateNormalize_Vec2f;
+    Kernel ApproximateNormalize_Vec3f;
+    Kernel ApproximateNormalize_Vec4f;
+    Kernel ApproximateNormalize_Quatf;
+    Kernel TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f;
+    Kernel TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f;
+    Kernel TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f;
+    Kernel TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f;
+    Kernel TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f;
+    Kernel TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f;
+    Kernel OrthographicProjection_float_float_float_float_float_float;
+    Kernel BilinearInterpolation_float_float_float_float_Vec2f;
+    Kernel BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f;
+    Kernel BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f;
+    Kernel BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f;
+    Kernel BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f;
+    Kernel BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f;
+    Kernel InverseAffine_Mat4f_Mat4f;
+    Kernel TransformAABB_Mat4f_Vec3fRange;
+    Kernel CrossProduct_Vec3f_Vec3f;
+    Kernel LongestAxis_Vec2fRange;
+    Kernel LongestAxis_Vec3fRange;
+    Kernel LongestAxis_Vec4fRange;
+    Kernel LongestAxis_Vec2iRange;
+    Kernel LongestAxis_Vec3iRange;
+    Kernel LongestAxis_Vec4iRange;
+    Kernel SetTranslate_Vec2f_Mat3f;
+    Kernel SetTranslate_Vec3f_Mat4f;
+    Kernel Max_float_float;
+    Kernel Max_int_int;
+    Kernel Max_bool_bool;
+    Kernel Max_Vec2f_Vec2f;
+    Kernel Max_Vec3f_Vec3f;
+    Kernel Max_Vec4f_Vec4f;
+    Kernel Max_Vec2i_Vec2i;
+    Kernel Max_Vec3i_Vec3i;
+    Kernel Max_Vec4i_Vec4i;
+    Kernel Max_Mat3f_Mat3f;
+    Kernel Max_Mat4f_Mat4f;
+    Kernel Floor_float;
+    Kernel Floor_Vec2f;
+    Kernel Floor_Vec3f;
+    Kernel Floor_Vec4f;
+    Kernel Floor_Mat3f;
+    Kernel Floor_Mat4f;
+    Kernel Transpose_Mat3f;
+    Kernel Transpose_Mat4f;
+    Kernel SetScale_Vec2f_Mat3f;
+    Kernel SetScale_Vec3f_Mat4f;
+    Kernel Ceil_float;
+    Kernel Ceil_Vec2f;
+    Kernel Ceil_Vec3f;
+    Kernel Ceil_Vec4f;
+    Kernel Ceil_Mat3f;
+    Kernel Ceil_Mat4f;
+    Kernel FaceForward_Vec2f_Vec2f;
+    Kernel FaceForward_Vec3f_Vec3f;
+    Kernel FaceForward_Vec4f_Vec4f;
+    Kernel RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRange;
+    Kernel RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRange;
+    Kernel RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRange;
+    Kernel ApproximateLength_Vec2f;
+    Kernel ApproximateLength_Vec3f;
+    Kernel ApproximateLength_Vec4f;
+    Kernel ApproximateLength_Quatf;
+    Kernel LookAt_Vec3f_Vec3f_Vec3f;
+    Kernel ApproximateSetRotateZ_float_Mat4f;
+    Kernel HasScale_Mat3f;
+    Kernel HasScale_Mat4f;
+    Kernel DotProduct_Vec2f_Vec2f;
+    Kernel DotProduct_Vec3f_Vec3f;
+    Kernel DotProduct_Vec4f_Vec4f;
+    Kernel DotProduct_Quatf_Quatf;
+    Kernel ApproximateSineCosine_float_float_float;
+    Kernel Intersection_FloatRange_FloatRange;
+    Kernel Intersection_IntRange_IntRange;
+    Kernel Intersection_Vec2fRange_Vec2fRange;
+    Kernel Intersection_Vec3fRange_Vec3fRange;
+    Kernel Intersection_Vec4fRange_Vec4fRange;
+    Kernel Intersection_Vec2iRange_Vec2iRange;
+    Kernel Intersection_Vec3iRange_Vec3iRange;
+    Kernel Intersection_Vec4iRange_Vec4iRange;
+    Kernel SetRotateY_float_Mat4f;
+    Kernel SetRotateX_float_Mat4f;
+    Kernel Expand_FloatRange_FloatRange;
+    Kernel Expand_FloatRange_float;
+    Kernel Expand_IntRange_IntRange;
+    Kernel Expand_IntRange_int;
+    Kernel Expand_Vec2fRange_Vec2fRange;
+    Kernel Expand_Vec2fRange_Vec2f;
+    Kernel Expand_Vec3fRange_Vec3fRange;
+    Kernel Expand_Vec3fRange_Vec3f;
+    Kernel Expand_Vec4fRange_Vec4fRange;
+    Kernel Expand_Vec4fRange_Vec4f;
+    Kernel Expand_Vec2iRange_Vec2iRange;
+    Kernel Expand_Vec2iRange_Vec2i;
+    Kernel Expand_Vec3iRange_Vec3iRange;
+    Kernel Expand_Vec3iRange_Vec3i;
+    Kernel Expand_Vec4iRange_Vec4iRange;
+    Kernel Expand_Vec4iRange_Vec4i;
+    Kernel SetRotateZ_float_Mat4f;
+    Kernel Distance_Vec2f_Vec2f;
+    Kernel Distance_Vec3f_Vec3f;
+    Kernel RayPosition_Vec2f_Vec2f_float;
+    Kernel RayPosition_Vec3f_Vec3f_float;
+    Kernel TransformPoint_Mat4f_Vec3f;
+    Kernel NormalizedLinearInterpolation_Quatf_Quatf_float;
+    Kernel Radians_float;
+    Kernel CoordinateSystem_Vec3f_Vec3f_Vec3f;
+    Kernel Length_Vec2f;
+    Kernel Length_Vec3f;
+    Kernel Length_Vec4f;
+    Kernel Length_Quatf;
+    Kernel ApproximateReciprocalSquareRoot_float;
+    Kernel ApproximateSetRotateX_float_Mat4f;
+    Kernel SetIdentity_Mat3f;
+    Kernel SetIdentity_Mat4f;
+    Kernel LinearMap_float_FloatRange_FloatRange;
+    Kernel LinearMap_Mat3f_FloatRange_FloatRange;
+    Kernel LinearMap_Mat4f_FloatRange_FloatRange;
+    Kernel LinearMap_Vec2f_FloatRange_FloatRange;
+    Kernel LinearMap_Vec3f_FloatRange_FloatRange;
+    Kernel LinearMap_Vec4f_FloatRange_FloatRange;
+    Kernel Clamp_float_FloatRange;
+    Kernel Clamp_int_IntRange;
+    Kernel Clamp_Vec2f_FloatRange;
+    Kernel Clamp_Vec3f_FloatRange;
+    Kernel Clamp_Vec4f_FloatRange;
+    Kernel Clamp_Vec2i_IntRange;
+    Kernel Clamp_Vec3i_IntRange;
+    Kernel Clamp_Vec4i_IntRange;
+    Kernel Clamp_Mat3f_FloatRange;
+    Kernel Clamp_Mat4f_FloatRange;
+    Kernel LengthSquared_Vec2f;
+    Kernel LengthSquared_Vec3f;
+    Kernel LengthSquared_Vec4f;
+    Kernel LengthSquared_Quatf;
+    Kernel InverseRigid_Mat4f;
+    Kernel RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRange;
+    Kernel PerspectiveProjection_float_float_float_float_float_float;
+    Kernel PerspectiveProjection_float_float_float_float;
+    Kernel SetRotate_float_Vec3f_Mat4f;
+    Kernel SetRotate_float_Vec3f_Quatf;
+    Kernel SetRotate_Quatf_Mat3f;
+    Kernel SetRotate_Quatf_Mat4f;
+    Kernel ViewportTransform_Vec2f_Vec2f;
+    Kernel MatrixProduct_Mat3f_Mat3f;
+    Kernel MatrixProduct_Mat4f_Mat4f;
+    Kernel TransformVector_Mat3f_Vec2f;
+    Kernel TransformVector_Mat4f_Vec3f;
+    Kernel TransformVector_Quatf_Vec3f;
+    Kernel QuadraticRoots_float_float_float_Vec2f;
+    Kernel RotationQuaternion_Mat3f;
+    Kernel RotationQuaternion_Mat4f;
+    Kernel Degrees_float;
+    Kernel ApproximateSetRotateY_float_Mat4f;
+};
+
+/// \struct CpuFeatures
+///
+/// The instruction set extensions supported by the host CPU and operating system.
+struct CpuFeatures
+{
+    bool sse42   = false;
+    bool avx2    = false;
+    bool fma     = false;
+    bool avx512f = false;
+};
+
+/// Detect the instruction set extensions supported by the host.
+CpuFeatures DetectCpuFeatures();
+
+/// Get the names of the kernel sets compiled into the module, in order of preference.
+std::vector< const char* > GetKernelSetNames();
+
+/// Get the kernel set used for batched function calls.
+///
+/// The most preferred kernel set supported by the host is selected on first use.  The selection can be
+/// overriden with the GM_KERNEL_SET environment variable, naming a compiled kernel set.
+const KernelSet& GetActiveKernelSet();
+
+/// Convert the python batched argument \p i_arg into a kernel argument.
+template < typename BatchArgT >
+inline KernelArg MakeKernelArg( const BatchArgT& i_arg )
+{
+    return KernelArg{i_arg.Data(), i_arg.IsBroadcast() ? size_t( 0 ) : size_t( 1 )};
+}
+
+/// Convert the result array \p i_result into a kernel argument.
+template < typename ValueT >
+inline KernelArg MakeKernelArg( ValueT* i_result )
+{
+    return KernelArg{i_result, 1};
+}
+
+} // namespace gm_kernels
\ No newline at end of file
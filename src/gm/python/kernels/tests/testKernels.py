@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import numpy
+import gm
+
+
+class TestKernels(unittest.TestCase):
+    def testCpuFeatures(self):
+        features = gm.GetCpuFeatures()
+        self.assertEqual(sorted(features.keys()), ["avx2", "avx512f", "fma", "sse4.2"])
+        for supported in features.values():
+            self.assertIsInstance(supported, bool)
+
+    def testKernelSets(self):
+        kernelSets = gm.GetKernelSets()
+        self.assertEqual(kernelSets[-1], "Baseline")
+        self.assertIn(gm.GetActiveKernelSet(), kernelSets)
+
+    def testActiveKernelSetSupported(self):
+        features = gm.GetCpuFeatures()
+        activeKernelSet = gm.GetActiveKernelSet()
+        if activeKernelSet == "AVX512":
+            self.assertTrue(features["avx512f"])
+        elif activeKernelSet == "AVX2":
+            self.assertTrue(features["avx2"] and features["fma"])
+        elif activeKernelSet == "SSE42":
+            self.assertTrue(features["sse4.2"])
+
+    def testKernelSetOverride(self):
+        # Each kernel set must produce the same results as the baseline.
+        script = (
+            "import gm, numpy; "
+            "points = numpy.arange(300, dtype=numpy.float32).reshape(100, 3); "
+            "print(gm.GetActiveKernelSet()); "
+            "print(gm.Length(points).tolist())"
+        )
+        outputs = {}
+        for kernelSet in gm.GetKernelSets():
+            environment = dict(os.environ, GM_KERNEL_SET=kernelSet)
+            output = subprocess.check_output(
+                [sys.executable, "-c", script], env=environment
+            )
+            activeKernelSet, lengths = output.decode().splitlines()
+            outputs[activeKernelSet] = numpy.array(eval(lengths), dtype=numpy.float32)
+
+        self.assertIn("Baseline", outputs)
+        for lengths in outputs.values():
+            numpy.testing.assert_allclose(lengths, outputs["Baseline"], rtol=1e-6)
@@ -0,0 +1,105 @@
+"""
+Per-call latency of the lean CPython API bindings (gmlean), compared to the pybind11 bindings (gm).
+
+Each case is a tiny function or operator on single values, whose cost is dominated by the overhead of the
+bindings: argument conversion, overload resolution and the allocation of the result.
+
+Usage:
+    python benchmarkLeanBindings.py [--repeat REPEAT] [--number NUMBER]
+"""
+
+import argparse
+import operator
+import timeit
+
+import gm
+import gmlean
+
+
+def Cases(module):
+    """
+    Args:
+        module (module): the bindings to benchmark, gm or gmlean.
+
+    Returns:
+        list: (name, function, arguments) tuples.
+    """
+    lhs = module.Vec3f(1, 2, 3)
+    rhs = module.Vec3f(3, 2, 1)
+    matrix = module.Mat4f()
+    module.SetIdentity(matrix)
+    return [
+        ("Vec3f(x, y, z)", module.Vec3f, (1.0, 2.0, 3.0)),
+        ("Vec3f.__add__", operator.add, (lhs, rhs)),
+        ("Vec3f.__mul__", operator.mul, (lhs, 2.0)),
+        ("Vec3f.__neg__", operator.neg, (lhs,)),
+        ("Vec3f.__eq__", operator.eq, (lhs, rhs)),
+        ("Vec3f.__getitem__", operator.getitem, (lhs, 1)),
+        ("Vec3f.x", operator.attrgetter("x"), (lhs,)),
+        ("DotProduct(Vec3f, Vec3f)", module.DotProduct, (lhs, rhs)),
+        ("DotProduct_Vec3f_Vec3f", module.DotProduct_Vec3f_Vec3f, (lhs, rhs)),
+        ("CrossProduct(Vec3f, Vec3f)", module.CrossProduct, (lhs, rhs)),
+        ("Length(Vec3f)", module.Length, (lhs,)),
+        ("Normalize(Vec3f)", module.Normalize, (lhs,)),
+        ("Min(float, float)", module.Min, (1.0, 2.0)),
+        ("Min(Mat4f, Mat4f)", module.Min, (matrix, matrix)),
+        (
+            "LinearInterpolation(Vec3f, Vec3f, float)",
+            module.LinearInterpolation,
+            (lhs, rhs, 0.5),
+        ),
+        ("MatrixProduct(Mat4f, Mat4f)", module.MatrixProduct, (matrix, matrix)),
+        ("TransformPoint(Mat4f, Vec3f)", module.TransformPoint, (matrix, lhs)),
+    ]
+
+
+def Latency(function, arguments, repeat, number):
+    """
+    Returns:
+        float: the best per-call latency of ``function(*arguments)``, in nanoseconds.
+    """
+    timer = timeit.Timer(lambda: function(*arguments))
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def Main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of timed repetitions, the best is reported.",
+    )
+    parser.add_argument(
+        "--number", type=int, default=100000, help="Number of calls per repetition."
+    )
+    args = parser.parse_args()
+
+    # The python overhead of timing a call, common to both bindings.
+    print(
+        "Latency of a no-op python function: {:.1f} ns".format(
+            Latency(lambda: None, (), args.repeat, args.number)
+        )
+    )
+
+    print(
+        "{:<42} {:>14} {:>14} {:>9}".format(
+            "Case", "pybind11 (ns)", "lean (ns)", "Speedup"
+        )
+    )
+    for (name, function, arguments), (_, leanFunction, leanArguments) in zip(
+        Cases(gm), Cases(gmlean)
+    ):
+        latency = Latency(function, arguments, args.repeat, args.number)
+        leanLatency = Latency(leanFunction, leanArguments, args.repeat, args.number)
+        print(
+            "{:<42} {:14.1f} {:14.1f} {:8.1f}x".format(
+                name, latency, leanLatency, latency / leanLatency,
+            )
+        )
+
+
+if __name__ == "__main__":
+    Main()
@@ -0,0 +1,200 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/abs.h>
+
+// Lean python bindings for Abs.
+
+GM_NS_USING
+
+// Abs_float, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< float > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Abs( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Abs_float", i_args, i_argCount );
+}
+
+// Abs_Vec2f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec2f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Abs( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Abs_Vec2f", i_args, i_argCount );
+}
+
+// Abs_Vec3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke2( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec3f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Abs( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call2( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke2( i_args, false, &result ) || Invoke2( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Abs_Vec3f", i_args, i_argCount );
+}
+
+// Abs_Vec4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke3( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec4f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Abs( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call3( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke3( i_args, false, &result ) || Invoke3( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Abs_Vec4f", i_args, i_argCount );
+}
+
+// Abs_Mat3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke4( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat3f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Abs( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call4( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke4( i_args, false, &result ) || Invoke4( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Abs_Mat3f", i_args, i_argCount );
+}
+
+// Abs_Mat4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke5( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat4f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Abs( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call5( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke5( i_args, false, &result ) || Invoke5( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Abs_Mat4f", i_args, i_argCount );
+}
+
+// Abs, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 1 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke1( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke2( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke3( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke4( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke5( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "Abs", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"Abs",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "Abs(*args)\n"
+     "Overloaded function.\n"
+     "\n1. Abs(value: float) -> float\n"
+     "\n2. Abs(value: Vec2f) -> Vec2f\n"
+     "\n3. Abs(value: Vec3f) -> Vec3f\n"
+     "\n4. Abs(value: Vec4f) -> Vec4f\n"
+     "\n5. Abs(value: Mat3f) -> Mat3f\n"
+     "\n6. Abs(value: Mat4f) -> Mat4f\n"},
+    {"Abs_float", LeanFastCall( Call0 ), METH_FASTCALL, "Abs_float(value: float) -> float"},
+    {"Abs_Vec2f", LeanFastCall( Call1 ), METH_FASTCALL, "Abs_Vec2f(value: Vec2f) -> Vec2f"},
+    {"Abs_Vec3f", LeanFastCall( Call2 ), METH_FASTCALL, "Abs_Vec3f(value: Vec3f) -> Vec3f"},
+    {"Abs_Vec4f", LeanFastCall( Call3 ), METH_FASTCALL, "Abs_Vec4f(value: Vec4f) -> Vec4f"},
+    {"Abs_Mat3f", LeanFastCall( Call4 ), METH_FASTCALL, "Abs_Mat3f(value: Mat3f) -> Mat3f"},
+    {"Abs_Mat4f", LeanFastCall( Call5 ), METH_FASTCALL, "Abs_Mat4f(value: Mat4f) -> Mat4f"},
+    {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanAbsMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
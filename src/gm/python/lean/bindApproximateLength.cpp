@@ -0,0 +1,157 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/approximateLength.h>
+
+// Lean python bindings for ApproximateLength.
+
+GM_NS_USING
+
+// ApproximateLength_Vec2f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec2f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( ApproximateLength( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "ApproximateLength_Vec2f", i_args, i_argCount );
+}
+
+// ApproximateLength_Vec3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec3f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( ApproximateLength( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "ApproximateLength_Vec3f", i_args, i_argCount );
+}
+
+// ApproximateLength_Vec4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke2( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec4f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( ApproximateLength( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call2( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke2( i_args, false, &result ) || Invoke2( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "ApproximateLength_Vec4f", i_args, i_argCount );
+}
+
+// ApproximateLength_Quatf, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke3( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Quatf > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( ApproximateLength( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call3( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke3( i_args, false, &result ) || Invoke3( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "ApproximateLength_Quatf", i_args, i_argCount );
+}
+
+// ApproximateLength, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 1 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke1( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke2( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke3( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "ApproximateLength", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"ApproximateLength",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "ApproximateLength(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. ApproximateLength(vector: Vec2f) -> float\n"
+                                   "\n2. ApproximateLength(vector: Vec3f) -> float\n"
+                                   "\n3. ApproximateLength(vector: Vec4f) -> float\n"
+                                   "\n4. ApproximateLength(vector: Quatf) -> float\n"},
+                                  {"ApproximateLength_Vec2f",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "ApproximateLength_Vec2f(vector: Vec2f) -> float"},
+                                  {"ApproximateLength_Vec3f",
+                                   LeanFastCall( Call1 ),
+                                   METH_FASTCALL,
+                                   "ApproximateLength_Vec3f(vector: Vec3f) -> float"},
+                                  {"ApproximateLength_Vec4f",
+                                   LeanFastCall( Call2 ),
+                                   METH_FASTCALL,
+                                   "ApproximateLength_Vec4f(vector: Vec4f) -> float"},
+                                  {"ApproximateLength_Quatf",
+                                   LeanFastCall( Call3 ),
+                                   METH_FASTCALL,
+                                   "ApproximateLength_Quatf(vector: Quatf) -> float"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanApproximateLengthMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,68 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/approximateReciprocalSquareRoot.h>
+
+// Lean python bindings for ApproximateReciprocalSquareRoot.
+
+GM_NS_USING
+
+// ApproximateReciprocalSquareRoot_float, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< float > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( ApproximateReciprocalSquareRoot( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "ApproximateReciprocalSquareRoot_float", i_args, i_argCount );
+}
+
+// ApproximateReciprocalSquareRoot, resolving its overloads in order, first without and then with implicit conversions
+// of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 1 && Invoke0( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "ApproximateReciprocalSquareRoot", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"ApproximateReciprocalSquareRoot",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "ApproximateReciprocalSquareRoot(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. ApproximateReciprocalSquareRoot(value: float) -> float\n"},
+                                  {"ApproximateReciprocalSquareRoot_float",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "ApproximateReciprocalSquareRoot_float(value: float) -> float"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanApproximateReciprocalSquareRootMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,108 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/approximateSetRotate.h>
+
+// Lean python bindings for ApproximateSetRotate.
+
+GM_NS_USING
+
+// ApproximateSetRotate_float_Vec3f_Mat4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< float > arg0;
+    LeanArg< Vec3f > arg1;
+    LeanArg< Mat4f > arg2;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) )
+    {
+        return false;
+    }
+    ApproximateSetRotate( arg0.Get(), arg1.Get(), arg2.Get() );
+    Py_INCREF( Py_None );
+    *o_result = Py_None;
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 3 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "ApproximateSetRotate_float_Vec3f_Mat4f", i_args, i_argCount );
+}
+
+// ApproximateSetRotate_float_Vec3f_Quatf, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< float > arg0;
+    LeanArg< Vec3f > arg1;
+    LeanArg< Quatf > arg2;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) )
+    {
+        return false;
+    }
+    ApproximateSetRotate( arg0.Get(), arg1.Get(), arg2.Get() );
+    Py_INCREF( Py_None );
+    *o_result = Py_None;
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 3 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "ApproximateSetRotate_float_Vec3f_Quatf", i_args, i_argCount );
+}
+
+// ApproximateSetRotate, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 3 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 3 && Invoke1( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "ApproximateSetRotate", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"ApproximateSetRotate",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "ApproximateSetRotate(*args)\n"
+     "Overloaded function.\n"
+     "\n1. ApproximateSetRotate(angle: float, axis: Vec3f, matrix: Mat4f) -> None\n"
+     "\n2. ApproximateSetRotate(angle: float, axis: Vec3f, quaternion: Quatf) -> None\n"},
+    {"ApproximateSetRotate_float_Vec3f_Mat4f",
+     LeanFastCall( Call0 ),
+     METH_FASTCALL,
+     "ApproximateSetRotate_float_Vec3f_Mat4f(angle: float, axis: Vec3f, matrix: Mat4f) -> None"},
+    {"ApproximateSetRotate_float_Vec3f_Quatf",
+     LeanFastCall( Call1 ),
+     METH_FASTCALL,
+     "ApproximateSetRotate_float_Vec3f_Quatf(angle: float, axis: Vec3f, quaternion: Quatf) -> None"},
+    {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanApproximateSetRotateMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,70 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/approximateSetRotateY.h>
+
+// Lean python bindings for ApproximateSetRotateY.
+
+GM_NS_USING
+
+// ApproximateSetRotateY_float_Mat4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< float > arg0;
+    LeanArg< Mat4f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    ApproximateSetRotateY( arg0.Get(), arg1.Get() );
+    Py_INCREF( Py_None );
+    *o_result = Py_None;
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "ApproximateSetRotateY_float_Mat4f", i_args, i_argCount );
+}
+
+// ApproximateSetRotateY, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 2 && Invoke0( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "ApproximateSetRotateY", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"ApproximateSetRotateY",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "ApproximateSetRotateY(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. ApproximateSetRotateY(angle: float, matrix: Mat4f) -> None\n"},
+                                  {"ApproximateSetRotateY_float_Mat4f",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "ApproximateSetRotateY_float_Mat4f(angle: float, matrix: Mat4f) -> None"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanApproximateSetRotateYMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
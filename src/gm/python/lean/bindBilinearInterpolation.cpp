@@ -0,0 +1,265 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/bilinearInterpolation.h>
+
+// Lean python bindings for BilinearInterpolation.
+
+GM_NS_USING
+
+// BilinearInterpolation_float_float_float_float_Vec2f, returning false if the arguments could not be loaded, without
+// setting a python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< float > arg0;
+    LeanArg< float > arg1;
+    LeanArg< float > arg2;
+    LeanArg< float > arg3;
+    LeanArg< Vec2f > arg4;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) || !arg3.Load( i_args[ 3 ], i_convert ) ||
+         !arg4.Load( i_args[ 4 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( BilinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get(), arg4.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 5 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "BilinearInterpolation_float_float_float_float_Vec2f", i_args, i_argCount );
+}
+
+// BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f, returning false if the arguments could not be loaded, without
+// setting a python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat3f > arg0;
+    LeanArg< Mat3f > arg1;
+    LeanArg< Mat3f > arg2;
+    LeanArg< Mat3f > arg3;
+    LeanArg< Vec2f > arg4;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) || !arg3.Load( i_args[ 3 ], i_convert ) ||
+         !arg4.Load( i_args[ 4 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( BilinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get(), arg4.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 5 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f", i_args, i_argCount );
+}
+
+// BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f, returning false if the arguments could not be loaded, without
+// setting a python error.
+static bool Invoke2( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat4f > arg0;
+    LeanArg< Mat4f > arg1;
+    LeanArg< Mat4f > arg2;
+    LeanArg< Mat4f > arg3;
+    LeanArg< Vec2f > arg4;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) || !arg3.Load( i_args[ 3 ], i_convert ) ||
+         !arg4.Load( i_args[ 4 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( BilinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get(), arg4.Get() ) );
+    return true;
+}
+
+static PyObject* Call2( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 5 && ( Invoke2( i_args, false, &result ) || Invoke2( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f", i_args, i_argCount );
+}
+
+// BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f, returning false if the arguments could not be loaded, without
+// setting a python error.
+static bool Invoke3( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec2f > arg0;
+    LeanArg< Vec2f > arg1;
+    LeanArg< Vec2f > arg2;
+    LeanArg< Vec2f > arg3;
+    LeanArg< Vec2f > arg4;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) || !arg3.Load( i_args[ 3 ], i_convert ) ||
+         !arg4.Load( i_args[ 4 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( BilinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get(), arg4.Get() ) );
+    return true;
+}
+
+static PyObject* Call3( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 5 && ( Invoke3( i_args, false, &result ) || Invoke3( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f", i_args, i_argCount );
+}
+
+// BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f, returning false if the arguments could not be loaded, without
+// setting a python error.
+static bool Invoke4( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec3f > arg0;
+    LeanArg< Vec3f > arg1;
+    LeanArg< Vec3f > arg2;
+    LeanArg< Vec3f > arg3;
+    LeanArg< Vec2f > arg4;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) || !arg3.Load( i_args[ 3 ], i_convert ) ||
+         !arg4.Load( i_args[ 4 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( BilinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get(), arg4.Get() ) );
+    return true;
+}
+
+static PyObject* Call4( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 5 && ( Invoke4( i_args, false, &result ) || Invoke4( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f", i_args, i_argCount );
+}
+
+// BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f, returning false if the arguments could not be loaded, without
+// setting a python error.
+static bool Invoke5( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec4f > arg0;
+    LeanArg< Vec4f > arg1;
+    LeanArg< Vec4f > arg2;
+    LeanArg< Vec4f > arg3;
+    LeanArg< Vec2f > arg4;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) || !arg3.Load( i_args[ 3 ], i_convert ) ||
+         !arg4.Load( i_args[ 4 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( BilinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get(), arg4.Get() ) );
+    return true;
+}
+
+static PyObject* Call5( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 5 && ( Invoke5( i_args, false, &result ) || Invoke5( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f", i_args, i_argCount );
+}
+
+// BilinearInterpolation, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 5 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 5 && Invoke1( i_args, convert, &result ) ) ||
+             ( i_argCount == 5 && Invoke2( i_args, convert, &result ) ) ||
+             ( i_argCount == 5 && Invoke3( i_args, convert, &result ) ) ||
+             ( i_argCount == 5 && Invoke4( i_args, convert, &result ) ) ||
+             ( i_argCount == 5 && Invoke5( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "BilinearInterpolation", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"BilinearInterpolation",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "BilinearInterpolation(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. BilinearInterpolation(corner00: float, corner10: float, corner01: float, "
+                                   "corner11: float, weight: Vec2f) -> float\n"
+                                   "\n2. BilinearInterpolation(corner00: Mat3f, corner10: Mat3f, corner01: Mat3f, "
+                                   "corner11: Mat3f, weight: Vec2f) -> Mat3f\n"
+                                   "\n3. BilinearInterpolation(corner00: Mat4f, corner10: Mat4f, corner01: Mat4f, "
+                                   "corner11: Mat4f, weight: Vec2f) -> Mat4f\n"
+                                   "\n4. BilinearInterpolation(corner00: Vec2f, corner10: Vec2f, corner01: Vec2f, "
+                                   "corner11: Vec2f, weight: Vec2f) -> Vec2f\n"
+                                   "\n5. BilinearInterpolation(corner00: Vec3f, corner10: Vec3f, corner01: Vec3f, "
+                                   "corner11: Vec3f, weight: Vec2f) -> Vec3f\n"
+                                   "\n6. BilinearInterpolation(corner00: Vec4f, corner10: Vec4f, corner01: Vec4f, "
+                                   "corner11: Vec4f, weight: Vec2f) -> Vec4f\n"},
+                                  {"BilinearInterpolation_float_float_float_float_Vec2f",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "BilinearInterpolation_float_float_float_float_Vec2f(corner00: float, corner10: "
+                                   "float, corner01: float, corner11: float, weight: Vec2f) -> float"},
+                                  {"BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f",
+                                   LeanFastCall( Call1 ),
+                                   METH_FASTCALL,
+                                   "BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f(corner00: Mat3f, corner10: "
+                                   "Mat3f, corner01: Mat3f, corner11: Mat3f, weight: Vec2f) -> Mat3f"},
+                                  {"BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f",
+                                   LeanFastCall( Call2 ),
+                                   METH_FASTCALL,
+                                   "BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f(corner00: Mat4f, corner10: "
+                                   "Mat4f, corner01: Mat4f, corner11: Mat4f, weight: Vec2f) -> Mat4f"},
+                                  {"BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f",
+                                   LeanFastCall( Call3 ),
+                                   METH_FASTCALL,
+                                   "BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f(corner00: Vec2f, corner10: "
+                                   "Vec2f, corner01: Vec2f, corner11: Vec2f, weight: Vec2f) -> Vec2f"},
+                                  {"BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f",
+                                   LeanFastCall( Call4 ),
+                                   METH_FASTCALL,
+                                   "BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f(corner00: Vec3f, corner10: "
+                                   "Vec3f, corner01: Vec3f, corner11: Vec3f, weight: Vec2f) -> Vec3f"},
+                                  {"BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f",
+                                   LeanFastCall( Call5 ),
+                                   METH_FASTCALL,
+                                   "BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f(corner00: Vec4f, corner10: "
+                                   "Vec4f, corner01: Vec4f, corner11: Vec4f, weight: Vec2f) -> Vec4f"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanBilinearInterpolationMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,65 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/degrees.h>
+
+// Lean python bindings for Degrees.
+
+GM_NS_USING
+
+// Degrees_float, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< float > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Degrees( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Degrees_float", i_args, i_argCount );
+}
+
+// Degrees, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 1 && Invoke0( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "Degrees", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"Degrees",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "Degrees(*args)\n"
+     "Overloaded function.\n"
+     "\n1. Degrees(angle: float) -> float\n"},
+    {"Degrees_float", LeanFastCall( Call0 ), METH_FASTCALL, "Degrees_float(angle: float) -> float"},
+    {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanDegreesMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,99 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/distance.h>
+
+// Lean python bindings for Distance.
+
+GM_NS_USING
+
+// Distance_Vec2f_Vec2f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec2f > arg0;
+    LeanArg< Vec2f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Distance( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Distance_Vec2f_Vec2f", i_args, i_argCount );
+}
+
+// Distance_Vec3f_Vec3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec3f > arg0;
+    LeanArg< Vec3f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Distance( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Distance_Vec3f_Vec3f", i_args, i_argCount );
+}
+
+// Distance, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 2 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke1( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "Distance", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"Distance",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "Distance(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. Distance(pointA: Vec2f, pointB: Vec2f) -> float\n"
+                                   "\n2. Distance(pointA: Vec3f, pointB: Vec3f) -> float\n"},
+                                  {"Distance_Vec2f_Vec2f",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "Distance_Vec2f_Vec2f(pointA: Vec2f, pointB: Vec2f) -> float"},
+                                  {"Distance_Vec3f_Vec3f",
+                                   LeanFastCall( Call1 ),
+                                   METH_FASTCALL,
+                                   "Distance_Vec3f_Vec3f(pointA: Vec3f, pointB: Vec3f) -> float"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanDistanceMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,161 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/dotProduct.h>
+
+// Lean python bindings for DotProduct.
+
+GM_NS_USING
+
+// DotProduct_Vec2f_Vec2f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec2f > arg0;
+    LeanArg< Vec2f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( DotProduct( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "DotProduct_Vec2f_Vec2f", i_args, i_argCount );
+}
+
+// DotProduct_Vec3f_Vec3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec3f > arg0;
+    LeanArg< Vec3f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( DotProduct( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "DotProduct_Vec3f_Vec3f", i_args, i_argCount );
+}
+
+// DotProduct_Vec4f_Vec4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke2( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec4f > arg0;
+    LeanArg< Vec4f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( DotProduct( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call2( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke2( i_args, false, &result ) || Invoke2( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "DotProduct_Vec4f_Vec4f", i_args, i_argCount );
+}
+
+// DotProduct_Quatf_Quatf, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke3( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Quatf > arg0;
+    LeanArg< Quatf > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( DotProduct( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call3( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke3( i_args, false, &result ) || Invoke3( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "DotProduct_Quatf_Quatf", i_args, i_argCount );
+}
+
+// DotProduct, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 2 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke1( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke2( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke3( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "DotProduct", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"DotProduct",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "DotProduct(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. DotProduct(lhs: Vec2f, rhs: Vec2f) -> float\n"
+                                   "\n2. DotProduct(lhs: Vec3f, rhs: Vec3f) -> float\n"
+                                   "\n3. DotProduct(lhs: Vec4f, rhs: Vec4f) -> float\n"
+                                   "\n4. DotProduct(lhs: Quatf, rhs: Quatf) -> float\n"},
+                                  {"DotProduct_Vec2f_Vec2f",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "DotProduct_Vec2f_Vec2f(lhs: Vec2f, rhs: Vec2f) -> float"},
+                                  {"DotProduct_Vec3f_Vec3f",
+                                   LeanFastCall( Call1 ),
+                                   METH_FASTCALL,
+                                   "DotProduct_Vec3f_Vec3f(lhs: Vec3f, rhs: Vec3f) -> float"},
+                                  {"DotProduct_Vec4f_Vec4f",
+                                   LeanFastCall( Call2 ),
+                                   METH_FASTCALL,
+                                   "DotProduct_Vec4f_Vec4f(lhs: Vec4f, rhs: Vec4f) -> float"},
+                                  {"DotProduct_Quatf_Quatf",
+                                   LeanFastCall( Call3 ),
+                                   METH_FASTCALL,
+                                   "DotProduct_Quatf_Quatf(lhs: Quatf, rhs: Quatf) -> float"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanDotProductMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,130 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/faceForward.h>
+
+// Lean python bindings for FaceForward.
+
+GM_NS_USING
+
+// FaceForward_Vec2f_Vec2f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec2f > arg0;
+    LeanArg< Vec2f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( FaceForward( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "FaceForward_Vec2f_Vec2f", i_args, i_argCount );
+}
+
+// FaceForward_Vec3f_Vec3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec3f > arg0;
+    LeanArg< Vec3f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( FaceForward( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "FaceForward_Vec3f_Vec3f", i_args, i_argCount );
+}
+
+// FaceForward_Vec4f_Vec4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke2( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec4f > arg0;
+    LeanArg< Vec4f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( FaceForward( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call2( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke2( i_args, false, &result ) || Invoke2( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "FaceForward_Vec4f_Vec4f", i_args, i_argCount );
+}
+
+// FaceForward, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 2 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke1( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke2( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "FaceForward", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"FaceForward",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "FaceForward(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. FaceForward(normal: Vec2f, guide: Vec2f) -> Vec2f\n"
+                                   "\n2. FaceForward(normal: Vec3f, guide: Vec3f) -> Vec3f\n"
+                                   "\n3. FaceForward(normal: Vec4f, guide: Vec4f) -> Vec4f\n"},
+                                  {"FaceForward_Vec2f_Vec2f",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "FaceForward_Vec2f_Vec2f(normal: Vec2f, guide: Vec2f) -> Vec2f"},
+                                  {"FaceForward_Vec3f_Vec3f",
+                                   LeanFastCall( Call1 ),
+                                   METH_FASTCALL,
+                                   "FaceForward_Vec3f_Vec3f(normal: Vec3f, guide: Vec3f) -> Vec3f"},
+                                  {"FaceForward_Vec4f_Vec4f",
+                                   LeanFastCall( Call2 ),
+                                   METH_FASTCALL,
+                                   "FaceForward_Vec4f_Vec4f(normal: Vec4f, guide: Vec4f) -> Vec4f"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanFaceForwardMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,200 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/floor.h>
+
+// Lean python bindings for Floor.
+
+GM_NS_USING
+
+// Floor_float, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< float > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Floor( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Floor_float", i_args, i_argCount );
+}
+
+// Floor_Vec2f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec2f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Floor( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Floor_Vec2f", i_args, i_argCount );
+}
+
+// Floor_Vec3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke2( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec3f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Floor( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call2( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke2( i_args, false, &result ) || Invoke2( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Floor_Vec3f", i_args, i_argCount );
+}
+
+// Floor_Vec4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke3( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec4f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Floor( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call3( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke3( i_args, false, &result ) || Invoke3( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Floor_Vec4f", i_args, i_argCount );
+}
+
+// Floor_Mat3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke4( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat3f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Floor( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call4( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke4( i_args, false, &result ) || Invoke4( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Floor_Mat3f", i_args, i_argCount );
+}
+
+// Floor_Mat4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke5( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat4f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Floor( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call5( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke5( i_args, false, &result ) || Invoke5( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Floor_Mat4f", i_args, i_argCount );
+}
+
+// Floor, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 1 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke1( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke2( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke3( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke4( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke5( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "Floor", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"Floor",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "Floor(*args)\n"
+     "Overloaded function.\n"
+     "\n1. Floor(value: float) -> float\n"
+     "\n2. Floor(value: Vec2f) -> Vec2f\n"
+     "\n3. Floor(value: Vec3f) -> Vec3f\n"
+     "\n4. Floor(value: Vec4f) -> Vec4f\n"
+     "\n5. Floor(value: Mat3f) -> Mat3f\n"
+     "\n6. Floor(value: Mat4f) -> Mat4f\n"},
+    {"Floor_float", LeanFastCall( Call0 ), METH_FASTCALL, "Floor_float(value: float) -> float"},
+    {"Floor_Vec2f", LeanFastCall( Call1 ), METH_FASTCALL, "Floor_Vec2f(value: Vec2f) -> Vec2f"},
+    {"Floor_Vec3f", LeanFastCall( Call2 ), METH_FASTCALL, "Floor_Vec3f(value: Vec3f) -> Vec3f"},
+    {"Floor_Vec4f", LeanFastCall( Call3 ), METH_FASTCALL, "Floor_Vec4f(value: Vec4f) -> Vec4f"},
+    {"Floor_Mat3f", LeanFastCall( Call4 ), METH_FASTCALL, "Floor_Mat3f(value: Mat3f) -> Mat3f"},
+    {"Floor_Mat4f", LeanFastCall( Call5 ), METH_FASTCALL, "Floor_Mat4f(value: Mat4f) -> Mat4f"},
+    {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanFloorMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
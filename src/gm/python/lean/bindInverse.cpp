@@ -0,0 +1,99 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/inverse.h>
+
+// Lean python bindings for Inverse.
+
+GM_NS_USING
+
+// Inverse_Mat3f_Mat3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat3f > arg0;
+    LeanArg< Mat3f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Inverse( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Inverse_Mat3f_Mat3f", i_args, i_argCount );
+}
+
+// Inverse_Mat4f_Mat4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat4f > arg0;
+    LeanArg< Mat4f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Inverse( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Inverse_Mat4f_Mat4f", i_args, i_argCount );
+}
+
+// Inverse, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 2 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke1( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "Inverse", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"Inverse",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "Inverse(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. Inverse(matrix: Mat3f, inverse: Mat3f) -> bool\n"
+                                   "\n2. Inverse(matrix: Mat4f, inverse: Mat4f) -> bool\n"},
+                                  {"Inverse_Mat3f_Mat3f",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "Inverse_Mat3f_Mat3f(matrix: Mat3f, inverse: Mat3f) -> bool"},
+                                  {"Inverse_Mat4f_Mat4f",
+                                   LeanFastCall( Call1 ),
+                                   METH_FASTCALL,
+                                   "Inverse_Mat4f_Mat4f(matrix: Mat4f, inverse: Mat4f) -> bool"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanInverseMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,68 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/inverseAffine.h>
+
+// Lean python bindings for InverseAffine.
+
+GM_NS_USING
+
+// InverseAffine_Mat4f_Mat4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat4f > arg0;
+    LeanArg< Mat4f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( InverseAffine( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "InverseAffine_Mat4f_Mat4f", i_args, i_argCount );
+}
+
+// InverseAffine, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 2 && Invoke0( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "InverseAffine", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"InverseAffine",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "InverseAffine(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. InverseAffine(matrix: Mat4f, inverse: Mat4f) -> bool\n"},
+                                  {"InverseAffine_Mat4f_Mat4f",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "InverseAffine_Mat4f_Mat4f(matrix: Mat4f, inverse: Mat4f) -> bool"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanInverseAffineMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,92 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/isIdentity.h>
+
+// Lean python bindings for IsIdentity.
+
+GM_NS_USING
+
+// IsIdentity_Mat3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat3f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( IsIdentity( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "IsIdentity_Mat3f", i_args, i_argCount );
+}
+
+// IsIdentity_Mat4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat4f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( IsIdentity( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "IsIdentity_Mat4f", i_args, i_argCount );
+}
+
+// IsIdentity, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 1 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke1( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "IsIdentity", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"IsIdentity",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "IsIdentity(*args)\n"
+     "Overloaded function.\n"
+     "\n1. IsIdentity(matrix: Mat3f) -> bool\n"
+     "\n2. IsIdentity(matrix: Mat4f) -> bool\n"},
+    {"IsIdentity_Mat3f", LeanFastCall( Call0 ), METH_FASTCALL, "IsIdentity_Mat3f(matrix: Mat3f) -> bool"},
+    {"IsIdentity_Mat4f", LeanFastCall( Call1 ), METH_FASTCALL, "IsIdentity_Mat4f(matrix: Mat4f) -> bool"},
+    {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanIsIdentityMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,146 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/lengthSquared.h>
+
+// Lean python bindings for LengthSquared.
+
+GM_NS_USING
+
+// LengthSquared_Vec2f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec2f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( LengthSquared( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "LengthSquared_Vec2f", i_args, i_argCount );
+}
+
+// LengthSquared_Vec3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec3f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( LengthSquared( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "LengthSquared_Vec3f", i_args, i_argCount );
+}
+
+// LengthSquared_Vec4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke2( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec4f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( LengthSquared( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call2( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke2( i_args, false, &result ) || Invoke2( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "LengthSquared_Vec4f", i_args, i_argCount );
+}
+
+// LengthSquared_Quatf, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke3( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Quatf > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( LengthSquared( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call3( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke3( i_args, false, &result ) || Invoke3( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "LengthSquared_Quatf", i_args, i_argCount );
+}
+
+// LengthSquared, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 1 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke1( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke2( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke3( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "LengthSquared", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"LengthSquared",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "LengthSquared(*args)\n"
+     "Overloaded function.\n"
+     "\n1. LengthSquared(vector: Vec2f) -> float\n"
+     "\n2. LengthSquared(vector: Vec3f) -> float\n"
+     "\n3. LengthSquared(vector: Vec4f) -> float\n"
+     "\n4. LengthSquared(vector: Quatf) -> float\n"},
+    {"LengthSquared_Vec2f", LeanFastCall( Call0 ), METH_FASTCALL, "LengthSquared_Vec2f(vector: Vec2f) -> float"},
+    {"LengthSquared_Vec3f", LeanFastCall( Call1 ), METH_FASTCALL, "LengthSquared_Vec3f(vector: Vec3f) -> float"},
+    {"LengthSquared_Vec4f", LeanFastCall( Call2 ), METH_FASTCALL, "LengthSquared_Vec4f(vector: Vec4f) -> float"},
+    {"LengthSquared_Quatf", LeanFastCall( Call3 ), METH_FASTCALL, "LengthSquared_Quatf(vector: Quatf) -> float"},
+    {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanLengthSquaredMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,236 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/linearInterpolation.h>
+
+// Lean python bindings for LinearInterpolation.
+
+GM_NS_USING
+
+// LinearInterpolation_float_float_float, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< float > arg0;
+    LeanArg< float > arg1;
+    LeanArg< float > arg2;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 3 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "LinearInterpolation_float_float_float", i_args, i_argCount );
+}
+
+// LinearInterpolation_Mat3f_Mat3f_float, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat3f > arg0;
+    LeanArg< Mat3f > arg1;
+    LeanArg< float > arg2;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 3 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "LinearInterpolation_Mat3f_Mat3f_float", i_args, i_argCount );
+}
+
+// LinearInterpolation_Mat4f_Mat4f_float, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke2( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat4f > arg0;
+    LeanArg< Mat4f > arg1;
+    LeanArg< float > arg2;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+    return true;
+}
+
+static PyObject* Call2( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 3 && ( Invoke2( i_args, false, &result ) || Invoke2( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "LinearInterpolation_Mat4f_Mat4f_float", i_args, i_argCount );
+}
+
+// LinearInterpolation_Vec2f_Vec2f_float, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke3( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec2f > arg0;
+    LeanArg< Vec2f > arg1;
+    LeanArg< float > arg2;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+    return true;
+}
+
+static PyObject* Call3( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 3 && ( Invoke3( i_args, false, &result ) || Invoke3( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "LinearInterpolation_Vec2f_Vec2f_float", i_args, i_argCount );
+}
+
+// LinearInterpolation_Vec3f_Vec3f_float, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke4( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec3f > arg0;
+    LeanArg< Vec3f > arg1;
+    LeanArg< float > arg2;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+    return true;
+}
+
+static PyObject* Call4( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 3 && ( Invoke4( i_args, false, &result ) || Invoke4( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "LinearInterpolation_Vec3f_Vec3f_float", i_args, i_argCount );
+}
+
+// LinearInterpolation_Vec4f_Vec4f_float, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke5( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec4f > arg0;
+    LeanArg< Vec4f > arg1;
+    LeanArg< float > arg2;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( LinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+    return true;
+}
+
+static PyObject* Call5( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 3 && ( Invoke5( i_args, false, &result ) || Invoke5( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "LinearInterpolation_Vec4f_Vec4f_float", i_args, i_argCount );
+}
+
+// LinearInterpolation, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 3 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 3 && Invoke1( i_args, convert, &result ) ) ||
+             ( i_argCount == 3 && Invoke2( i_args, convert, &result ) ) ||
+             ( i_argCount == 3 && Invoke3( i_args, convert, &result ) ) ||
+             ( i_argCount == 3 && Invoke4( i_args, convert, &result ) ) ||
+             ( i_argCount == 3 && Invoke5( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "LinearInterpolation", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"LinearInterpolation",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "LinearInterpolation(*args)\n"
+     "Overloaded function.\n"
+     "\n1. LinearInterpolation(source: float, target: float, weight: float) -> float\n"
+     "\n2. LinearInterpolation(source: Mat3f, target: Mat3f, weight: float) -> Mat3f\n"
+     "\n3. LinearInterpolation(source: Mat4f, target: Mat4f, weight: float) -> Mat4f\n"
+     "\n4. LinearInterpolation(source: Vec2f, target: Vec2f, weight: float) -> Vec2f\n"
+     "\n5. LinearInterpolation(source: Vec3f, target: Vec3f, weight: float) -> Vec3f\n"
+     "\n6. LinearInterpolation(source: Vec4f, target: Vec4f, weight: float) -> Vec4f\n"},
+    {"LinearInterpolation_float_float_float",
+     LeanFastCall( Call0 ),
+     METH_FASTCALL,
+     "LinearInterpolation_float_float_float(source: float, target: float, weight: float) -> float"},
+    {"LinearInterpolation_Mat3f_Mat3f_float",
+     LeanFastCall( Call1 ),
+     METH_FASTCALL,
+     "LinearInterpolation_Mat3f_Mat3f_float(source: Mat3f, target: Mat3f, weight: float) -> Mat3f"},
+    {"LinearInterpolation_Mat4f_Mat4f_float",
+     LeanFastCall( Call2 ),
+     METH_FASTCALL,
+     "LinearInterpolation_Mat4f_Mat4f_float(source: Mat4f, target: Mat4f, weight: float) -> Mat4f"},
+    {"LinearInterpolation_Vec2f_Vec2f_float",
+     LeanFastCall( Call3 ),
+     METH_FASTCALL,
+     "LinearInterpolation_Vec2f_Vec2f_float(source: Vec2f, target: Vec2f, weight: float) -> Vec2f"},
+    {"LinearInterpolation_Vec3f_Vec3f_float",
+     LeanFastCall( Call4 ),
+     METH_FASTCALL,
+     "LinearInterpolation_Vec3f_Vec3f_float(source: Vec3f, target: Vec3f, weight: float) -> Vec3f"},
+    {"LinearInterpolation_Vec4f_Vec4f_float",
+     LeanFastCall( Call5 ),
+     METH_FASTCALL,
+     "LinearInterpolation_Vec4f_Vec4f_float(source: Vec4f, target: Vec4f, weight: float) -> Vec4f"},
+    {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanLinearInterpolationMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
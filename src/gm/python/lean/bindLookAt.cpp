@@ -0,0 +1,70 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/lookAt.h>
+
+// Lean python bindings for LookAt.
+
+GM_NS_USING
+
+// LookAt_Vec3f_Vec3f_Vec3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec3f > arg0;
+    LeanArg< Vec3f > arg1;
+    LeanArg< Vec3f > arg2;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( LookAt( arg0.Get(), arg1.Get(), arg2.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 3 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "LookAt_Vec3f_Vec3f_Vec3f", i_args, i_argCount );
+}
+
+// LookAt, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 3 && Invoke0( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "LookAt", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"LookAt",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "LookAt(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. LookAt(position: Vec3f, look: Vec3f, up: Vec3f) -> Mat4f\n"},
+                                  {"LookAt_Vec3f_Vec3f_Vec3f",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "LookAt_Vec3f_Vec3f_Vec3f(position: Vec3f, look: Vec3f, up: Vec3f) -> Mat4f"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanLookAtMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
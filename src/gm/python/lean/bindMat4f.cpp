@@ -0,0 +1,375 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+// Lean python bindings for Mat4f.
+
+GM_NS_USING
+
+using LeanMat4f = LeanObject< Mat4f >;
+
+PyTypeObject GM_NS::LeanMat4fType = {PyVarObject_HEAD_INIT( nullptr, 0 )};
+
+/// Get the value held by the python object \p i_self.
+static inline Mat4f& Value( PyObject* i_self )
+{
+    return reinterpret_cast< LeanMat4f* >( i_self )->m_value;
+}
+
+/// Load the value initialized by the positional arguments \p i_args: none for the default value, one per element, or
+/// a single C-contiguous buffer of elements.
+///
+/// \return false with the python error set, if the arguments do not match any of the initializers.
+static bool LoadInitializer( PyObject* const* i_args, Py_ssize_t i_argCount, Mat4f& o_matrix )
+{
+    if ( i_argCount == 0 )
+    {
+        o_matrix = Mat4f();
+        return true;
+    }
+
+    if ( i_argCount == 1 )
+    {
+        return LeanLoadBuffer( i_args[ 0 ], 16, o_matrix.Data() );
+    }
+
+    if ( i_argCount == 16 )
+    {
+        float elements[ 16 ];
+        for ( Py_ssize_t index = 0; index < 16; ++index )
+        {
+            LeanArg< float > element;
+            if ( !element.Load( i_args[ index ], /* i_convert */ true ) )
+            {
+                PyErr_Format( PyExc_TypeError,
+                              "Mat4f(): expected float elements, got '%s' at index %zd.",
+                              Py_TYPE( i_args[ index ] )->tp_name,
+                              index );
+                return false;
+            }
+            elements[ index ] = element.Get();
+        }
+
+        o_matrix = Mat4f( elements[ 0 ],
+                          elements[ 1 ],
+                          elements[ 2 ],
+                          elements[ 3 ],
+                          elements[ 4 ],
+                          elements[ 5 ],
+                          elements[ 6 ],
+                          elements[ 7 ],
+                          elements[ 8 ],
+                          elements[ 9 ],
+                          elements[ 10 ],
+                          elements[ 11 ],
+                          elements[ 12 ],
+                          elements[ 13 ],
+                          elements[ 14 ],
+                          elements[ 15 ] );
+        return true;
+    }
+
+    PyErr_Format( PyExc_TypeError, "Mat4f() takes 0, 1 or 16 positional arguments, got %zd.", i_argCount );
+    return false;
+}
+
+// Allocation, to the default value.
+static PyObject* New( PyTypeObject* i_type, PyObject* /* i_args */, PyObject* /* i_kwargs */ )
+{
+    return LeanNew( i_type, Mat4f() );
+}
+
+// Initialization, such that subclasses can call the base initializer.
+static int Init( PyObject* o_self, PyObject* i_args, PyObject* i_kwargs )
+{
+    if ( i_kwargs != nullptr && PyDict_GET_SIZE( i_kwargs ) != 0 )
+    {
+        PyErr_SetString( PyExc_TypeError, "Mat4f() takes no keyword arguments." );
+        return -1;
+    }
+
+    PyObject* const* args = reinterpret_cast< PyTupleObject* >( i_args )->ob_item;
+    return LoadInitializer( args, PyTuple_GET_SIZE( i_args ), Value( o_self ) ) ? 0 : -1;
+}
+
+#if PY_VERSION_HEX >= 0x03090000
+// Vectorcall of the type, allocating and initializing the value in a single step, without an argument tuple.
+static PyObject* Vectorcall( PyObject* i_type, PyObject* const* i_args, size_t i_argCountf, PyObject* i_kwnames )
+{
+    if ( i_kwnames != nullptr && PyTuple_GET_SIZE( i_kwnames ) != 0 )
+    {
+        PyErr_SetString( PyExc_TypeError, "Mat4f() takes no keyword arguments." );
+        return nullptr;
+    }
+
+    Mat4f matrix;
+    if ( !LoadInitializer( i_args, PyVectorcall_NARGS( i_argCountf ), matrix ) )
+    {
+        return nullptr;
+    }
+
+    return LeanNew( reinterpret_cast< PyTypeObject* >( i_type ), matrix );
+}
+#endif
+
+// Deallocation.  Values are trivially destructible.
+static void Dealloc( PyObject* o_self )
+{
+    Py_TYPE( o_self )->tp_free( o_self );
+}
+
+// Object representation.
+static PyObject* Repr( PyObject* i_self )
+{
+    std::string string = Value( i_self ).GetString( "gmlean." );
+    return PyUnicode_FromStringAndSize( string.c_str(), string.size() );
+}
+
+// Equality.
+static PyObject* RichCompare( PyObject* i_lhs, PyObject* i_rhs, int i_operator )
+{
+    LeanArg< Mat4f > lhs;
+    LeanArg< Mat4f > rhs;
+    if ( ( i_operator != Py_EQ && i_operator != Py_NE ) || !lhs.Load( i_lhs, false ) || !rhs.Load( i_rhs, false ) )
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    bool equal = lhs.Get() == rhs.Get();
+    return PyBool_FromLong( i_operator == Py_EQ ? equal : !equal );
+}
+
+// Vector addition.
+static PyObject* Add( PyObject* i_lhs, PyObject* i_rhs )
+{
+    LeanArg< Mat4f > lhs;
+    LeanArg< Mat4f > rhs;
+    if ( !lhs.Load( i_lhs, false ) || !rhs.Load( i_rhs, false ) )
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    return LeanResult( lhs.Get() + rhs.Get() );
+}
+
+// Vector subtraction.
+static PyObject* Subtract( PyObject* i_lhs, PyObject* i_rhs )
+{
+    LeanArg< Mat4f > lhs;
+    LeanArg< Mat4f > rhs;
+    if ( !lhs.Load( i_lhs, false ) || !rhs.Load( i_rhs, false ) )
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    return LeanResult( lhs.Get() - rhs.Get() );
+}
+
+// Vector-scalar and scalar-vector multiplication.
+static PyObject* Multiply( PyObject* i_lhs, PyObject* i_rhs )
+{
+    LeanArg< Mat4f > matrix;
+    LeanArg< float > scalar;
+    if ( matrix.Load( i_lhs, false ) && scalar.Load( i_rhs, true ) )
+    {
+        return LeanResult( matrix.Get() * scalar.Get() );
+    }
+
+    if ( matrix.Load( i_rhs, false ) && scalar.Load( i_lhs, true ) )
+    {
+        return LeanResult( scalar.Get() * matrix.Get() );
+    }
+
+    Py_RETURN_NOTIMPLEMENTED;
+}
+
+// Vector-scalar division.
+static PyObject* TrueDivide( PyObject* i_lhs, PyObject* i_rhs )
+{
+    LeanArg< Mat4f > matrix;
+    LeanArg< float > scalar;
+    if ( !matrix.Load( i_lhs, false ) || !scalar.Load( i_rhs, true ) )
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    if ( scalar.Get() == 0.0f )
+    {
+        PyErr_SetString( PyExc_ZeroDivisionError, "division by zero" );
+        return nullptr;
+    }
+
+    return LeanResult( matrix.Get() / scalar.Get() );
+}
+
+// Unary negation.
+static PyObject* Negative( PyObject* i_self )
+{
+    return LeanResult( -Value( i_self ) );
+}
+
+// Element indexed read access.
+static PyObject* GetItem( PyObject* i_self, Py_ssize_t i_index )
+{
+    if ( i_index < 0 || i_index >= 16 )
+    {
+        PyErr_SetString( PyExc_IndexError, "index out of range" );
+        return nullptr;
+    }
+
+    return LeanResult( Value( i_self )[ i_index ] );
+}
+
+// Element indexed write access.
+static int SetItem( PyObject* o_self, Py_ssize_t i_index, PyObject* i_value )
+{
+    if ( i_index < 0 || i_index >= 16 )
+    {
+        PyErr_SetString( PyExc_IndexError, "index out of range" );
+        return -1;
+    }
+
+    LeanArg< float > element;
+    if ( i_value == nullptr || !element.Load( i_value, true ) )
+    {
+        PyErr_SetString( PyExc_TypeError, "Mat4f elements must be assigned float values." );
+        return -1;
+    }
+
+    Value( o_self )[ i_index ] = element.Get();
+    return 0;
+}
+
+/// Get the index of the element addressed by the python key \p i_key, either an element index or a
+/// (row, column) tuple.
+///
+/// \return -1 with the python error set, if the key is out of range.
+static Py_ssize_t ElementIndex( PyObject* i_key )
+{
+    if ( PyTuple_Check( i_key ) )
+    {
+        if ( PyTuple_GET_SIZE( i_key ) != 2 )
+        {
+            PyErr_SetString( PyExc_IndexError, "expected a (row, column) index" );
+            return -1;
+        }
+
+        Py_ssize_t row = LeanIndex( PyTuple_GET_ITEM( i_key, 0 ), 4 );
+        if ( row < 0 )
+        {
+            return -1;
+        }
+
+        Py_ssize_t column = LeanIndex( PyTuple_GET_ITEM( i_key, 1 ), 4 );
+        if ( column < 0 )
+        {
+            return -1;
+        }
+
+        return row * 4 + column;
+    }
+
+    return LeanIndex( i_key, 16 );
+}
+
+// Subscript read access.
+static PyObject* Subscript( PyObject* i_self, PyObject* i_key )
+{
+    Py_ssize_t index = ElementIndex( i_key );
+    return index < 0 ? nullptr : GetItem( i_self, index );
+}
+
+// Subscript write access.
+static int AssignSubscript( PyObject* o_self, PyObject* i_key, PyObject* i_value )
+{
+    Py_ssize_t index = ElementIndex( i_key );
+    return index < 0 ? -1 : SetItem( o_self, index, i_value );
+}
+
+// Buffer protocol, exposing the element storage without copying.
+static int GetBuffer( PyObject* i_self, Py_buffer* o_view, int i_flags )
+{
+    static Py_ssize_t s_shape[]   = {4, 4};
+    static Py_ssize_t s_strides[] = {sizeof( float ) * 4, sizeof( float )};
+    return LeanGetBuffer( i_self, Value( i_self ).Data(), 2, s_shape, s_strides, o_view, i_flags );
+}
+
+// Element size.
+static PyObject* GetElementSize( PyObject* /* i_self */, PyObject* /* i_args */ )
+{
+    return PyLong_FromSize_t( Mat4f::GetElementSize() );
+}
+
+// Check for nans.
+static PyObject* HasNaNs( PyObject* i_self, PyObject* /* i_args */ )
+{
+    return PyBool_FromLong( Value( i_self ).HasNaNs() );
+}
+
+static PyMethodDef s_methods[] = {{"GetElementSize", GetElementSize, METH_NOARGS | METH_STATIC, "Number of elements."},
+                                  {"HasNaNs", HasNaNs, METH_NOARGS, "Check for nans."},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+static PyGetSetDef s_getSets[] = {{nullptr, nullptr, nullptr, nullptr, nullptr}};
+
+static PyNumberMethods s_numberMethods = {};
+
+static PySequenceMethods s_sequenceMethods = {};
+
+static PyMappingMethods s_mappingMethods = {};
+
+static PyBufferProcs s_bufferProcs = {};
+
+int LeanBindMat4f( PyObject* o_module )
+{
+    s_numberMethods.nb_add         = Add;
+    s_numberMethods.nb_subtract    = Subtract;
+    s_numberMethods.nb_multiply    = Multiply;
+    s_numberMethods.nb_true_divide = TrueDivide;
+    s_numberMethods.nb_negative    = Negative;
+
+    s_sequenceMethods.sq_item     = GetItem;
+    s_sequenceMethods.sq_ass_item = SetItem;
+
+    s_mappingMethods.mp_subscript     = Subscript;
+    s_mappingMethods.mp_ass_subscript = AssignSubscript;
+
+    s_bufferProcs.bf_getbuffer = GetBuffer;
+
+    PyTypeObject& type  = LeanMat4fType;
+    type.tp_name        = "gmlean.Mat4f";
+    type.tp_doc         = "Mat4f, stored inline in the python object.";
+    type.tp_basicsize   = sizeof( LeanMat4f );
+    type.tp_flags       = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE;
+    type.tp_new         = New;
+    type.tp_init        = Init;
+    type.tp_dealloc     = Dealloc;
+    type.tp_repr        = Repr;
+    type.tp_richcompare = RichCompare;
+    type.tp_hash        = PyObject_HashNotImplemented;
+    type.tp_as_number   = &s_numberMethods;
+    type.tp_as_sequence = &s_sequenceMethods;
+    type.tp_as_mapping  = &s_mappingMethods;
+    type.tp_as_buffer   = &s_bufferProcs;
+    type.tp_methods     = s_methods;
+    type.tp_getset      = s_getSets;
+#if PY_VERSION_HEX >= 0x03090000
+    type.tp_vectorcall = Vectorcall;
+#endif
+
+    if ( PyType_Ready( &type ) < 0 )
+    {
+        return -1;
+    }
+
+    Py_INCREF( &type );
+    if ( PyModule_AddObject( o_module, "Mat4f", reinterpret_cast< PyObject* >( &type ) ) < 0 )
+    {
+        Py_DECREF( &type );
+        return -1;
+    }
+
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,99 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/matrixProduct.h>
+
+// Lean python bindings for MatrixProduct.
+
+GM_NS_USING
+
+// MatrixProduct_Mat3f_Mat3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat3f > arg0;
+    LeanArg< Mat3f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( MatrixProduct( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "MatrixProduct_Mat3f_Mat3f", i_args, i_argCount );
+}
+
+// MatrixProduct_Mat4f_Mat4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat4f > arg0;
+    LeanArg< Mat4f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( MatrixProduct( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "MatrixProduct_Mat4f_Mat4f", i_args, i_argCount );
+}
+
+// MatrixProduct, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 2 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke1( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "MatrixProduct", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"MatrixProduct",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "MatrixProduct(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. MatrixProduct(lhs: Mat3f, rhs: Mat3f) -> Mat3f\n"
+                                   "\n2. MatrixProduct(lhs: Mat4f, rhs: Mat4f) -> Mat4f\n"},
+                                  {"MatrixProduct_Mat3f_Mat3f",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "MatrixProduct_Mat3f_Mat3f(lhs: Mat3f, rhs: Mat3f) -> Mat3f"},
+                                  {"MatrixProduct_Mat4f_Mat4f",
+                                   LeanFastCall( Call1 ),
+                                   METH_FASTCALL,
+                                   "MatrixProduct_Mat4f_Mat4f(lhs: Mat4f, rhs: Mat4f) -> Mat4f"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanMatrixProductMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,349 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/max.h>
+
+// Lean python bindings for Max.
+
+GM_NS_USING
+
+// Max_float_float, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< float > arg0;
+    LeanArg< float > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Max( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Max_float_float", i_args, i_argCount );
+}
+
+// Max_int_int, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< int > arg0;
+    LeanArg< int > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Max( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Max_int_int", i_args, i_argCount );
+}
+
+// Max_bool_bool, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke2( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< bool > arg0;
+    LeanArg< bool > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Max( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call2( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke2( i_args, false, &result ) || Invoke2( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Max_bool_bool", i_args, i_argCount );
+}
+
+// Max_Vec2f_Vec2f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke3( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec2f > arg0;
+    LeanArg< Vec2f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Max( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call3( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke3( i_args, false, &result ) || Invoke3( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Max_Vec2f_Vec2f", i_args, i_argCount );
+}
+
+// Max_Vec3f_Vec3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke4( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec3f > arg0;
+    LeanArg< Vec3f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Max( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call4( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke4( i_args, false, &result ) || Invoke4( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Max_Vec3f_Vec3f", i_args, i_argCount );
+}
+
+// Max_Vec4f_Vec4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke5( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec4f > arg0;
+    LeanArg< Vec4f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Max( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call5( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke5( i_args, false, &result ) || Invoke5( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Max_Vec4f_Vec4f", i_args, i_argCount );
+}
+
+// Max_Vec2i_Vec2i, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke6( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec2i > arg0;
+    LeanArg< Vec2i > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Max( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call6( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke6( i_args, false, &result ) || Invoke6( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Max_Vec2i_Vec2i", i_args, i_argCount );
+}
+
+// Max_Vec3i_Vec3i, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke7( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec3i > arg0;
+    LeanArg< Vec3i > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Max( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call7( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke7( i_args, false, &result ) || Invoke7( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Max_Vec3i_Vec3i", i_args, i_argCount );
+}
+
+// Max_Vec4i_Vec4i, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke8( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec4i > arg0;
+    LeanArg< Vec4i > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Max( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call8( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke8( i_args, false, &result ) || Invoke8( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Max_Vec4i_Vec4i", i_args, i_argCount );
+}
+
+// Max_Mat3f_Mat3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke9( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat3f > arg0;
+    LeanArg< Mat3f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Max( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call9( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke9( i_args, false, &result ) || Invoke9( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Max_Mat3f_Mat3f", i_args, i_argCount );
+}
+
+// Max_Mat4f_Mat4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke10( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat4f > arg0;
+    LeanArg< Mat4f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Max( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call10( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke10( i_args, false, &result ) || Invoke10( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Max_Mat4f_Mat4f", i_args, i_argCount );
+}
+
+// Max, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 2 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke1( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke2( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke3( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke4( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke5( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke6( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke7( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke8( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke9( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke10( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "Max", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"Max",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "Max(*args)\n"
+     "Overloaded function.\n"
+     "\n1. Max(valueA: float, valueB: float) -> float\n"
+     "\n2. Max(valueA: int, valueB: int) -> int\n"
+     "\n3. Max(valueA: bool, valueB: bool) -> bool\n"
+     "\n4. Max(valueA: Vec2f, valueB: Vec2f) -> Vec2f\n"
+     "\n5. Max(valueA: Vec3f, valueB: Vec3f) -> Vec3f\n"
+     "\n6. Max(valueA: Vec4f, valueB: Vec4f) -> Vec4f\n"
+     "\n7. Max(valueA: Vec2i, valueB: Vec2i) -> Vec2i\n"
+     "\n8. Max(valueA: Vec3i, valueB: Vec3i) -> Vec3i\n"
+     "\n9. Max(valueA: Vec4i, valueB: Vec4i) -> Vec4i\n"
+     "\n10. Max(valueA: Mat3f, valueB: Mat3f) -> Mat3f\n"
+     "\n11. Max(valueA: Mat4f, valueB: Mat4f) -> Mat4f\n"},
+    {"Max_float_float", LeanFastCall( Call0 ), METH_FASTCALL, "Max_float_float(valueA: float, valueB: float) -> float"},
+    {"Max_int_int", LeanFastCall( Call1 ), METH_FASTCALL, "Max_int_int(valueA: int, valueB: int) -> int"},
+    {"Max_bool_bool", LeanFastCall( Call2 ), METH_FASTCALL, "Max_bool_bool(valueA: bool, valueB: bool) -> bool"},
+    {"Max_Vec2f_Vec2f", LeanFastCall( Call3 ), METH_FASTCALL, "Max_Vec2f_Vec2f(valueA: Vec2f, valueB: Vec2f) -> Vec2f"},
+    {"Max_Vec3f_Vec3f", LeanFastCall( Call4 ), METH_FASTCALL, "Max_Vec3f_Vec3f(valueA: Vec3f, valueB: Vec3f) -> Vec3f"},
+    {"Max_Vec4f_Vec4f", LeanFastCall( Call5 ), METH_FASTCALL, "Max_Vec4f_Vec4f(valueA: Vec4f, valueB: Vec4f) -> Vec4f"},
+    {"Max_Vec2i_Vec2i", LeanFastCall( Call6 ), METH_FASTCALL, "Max_Vec2i_Vec2i(valueA: Vec2i, valueB: Vec2i) -> Vec2i"},
+    {"Max_Vec3i_Vec3i", LeanFastCall( Call7 ), METH_FASTCALL, "Max_Vec3i_Vec3i(valueA: Vec3i, valueB: Vec3i) -> Vec3i"},
+    {"Max_Vec4i_Vec4i", LeanFastCall( Call8 ), METH_FASTCALL, "Max_Vec4i_Vec4i(valueA: Vec4i, valueB: Vec4i) -> Vec4i"},
+    {"Max_Mat3f_Mat3f", LeanFastCall( Call9 ), METH_FASTCALL, "Max_Mat3f_Mat3f(valueA: Mat3f, valueB: Mat3f) -> Mat3f"},
+    {"Max_Mat4f_Mat4f",
+     LeanFastCall( Call10 ),
+     METH_FASTCALL,
+     "Max_Mat4f_Mat4f(valueA: Mat4f, valueB: Mat4f) -> Mat4f"},
+    {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanMaxMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
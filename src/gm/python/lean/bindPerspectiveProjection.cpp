@@ -0,0 +1,113 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/perspectiveProjection.h>
+
+// Lean python bindings for PerspectiveProjection.
+
+GM_NS_USING
+
+// PerspectiveProjection_float_float_float_float_float_float, returning false if the arguments could not be loaded,
+// without setting a python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< float > arg0;
+    LeanArg< float > arg1;
+    LeanArg< float > arg2;
+    LeanArg< float > arg3;
+    LeanArg< float > arg4;
+    LeanArg< float > arg5;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) || !arg3.Load( i_args[ 3 ], i_convert ) ||
+         !arg4.Load( i_args[ 4 ], i_convert ) || !arg5.Load( i_args[ 5 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result =
+        LeanResult( PerspectiveProjection( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get(), arg4.Get(), arg5.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 6 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "PerspectiveProjection_float_float_float_float_float_float", i_args, i_argCount );
+}
+
+// PerspectiveProjection_float_float_float_float, returning false if the arguments could not be loaded, without setting
+// a python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< float > arg0;
+    LeanArg< float > arg1;
+    LeanArg< float > arg2;
+    LeanArg< float > arg3;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) || !arg3.Load( i_args[ 3 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( PerspectiveProjection( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 4 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "PerspectiveProjection_float_float_float_float", i_args, i_argCount );
+}
+
+// PerspectiveProjection, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 6 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 4 && Invoke1( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "PerspectiveProjection", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"PerspectiveProjection",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "PerspectiveProjection(*args)\n"
+     "Overloaded function.\n"
+     "\n1. PerspectiveProjection(left: float, right: float, bottom: float, top: float, near: float, far: float) -> "
+     "Mat4f\n"
+     "\n2. PerspectiveProjection(fieldOfView: float, aspectRatio: float, near: float, far: float) -> Mat4f\n"},
+    {"PerspectiveProjection_float_float_float_float_float_float",
+     LeanFastCall( Call0 ),
+     METH_FASTCALL,
+     "PerspectiveProjection_float_float_float_float_float_float(left: float, right: float, bottom: float, top: float, "
+     "near: float, far: float) -> Mat4f"},
+    {"PerspectiveProjection_float_float_float_float",
+     LeanFastCall( Call1 ),
+     METH_FASTCALL,
+     "PerspectiveProjection_float_float_float_float(fieldOfView: float, aspectRatio: float, near: float, far: float) "
+     "-> Mat4f"},
+    {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanPerspectiveProjectionMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
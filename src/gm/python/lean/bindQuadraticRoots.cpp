@@ -0,0 +1,72 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/quadraticRoots.h>
+
+// Lean python bindings for QuadraticRoots.
+
+GM_NS_USING
+
+// QuadraticRoots_float_float_float_Vec2f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< float > arg0;
+    LeanArg< float > arg1;
+    LeanArg< float > arg2;
+    LeanArg< Vec2f > arg3;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) || !arg3.Load( i_args[ 3 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( QuadraticRoots( arg0.Get(), arg1.Get(), arg2.Get(), arg3.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 4 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "QuadraticRoots_float_float_float_Vec2f", i_args, i_argCount );
+}
+
+// QuadraticRoots, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 4 && Invoke0( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "QuadraticRoots", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"QuadraticRoots",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "QuadraticRoots(*args)\n"
+     "Overloaded function.\n"
+     "\n1. QuadraticRoots(a: float, b: float, c: float, roots: Vec2f) -> int\n"},
+    {"QuadraticRoots_float_float_float_Vec2f",
+     LeanFastCall( Call0 ),
+     METH_FASTCALL,
+     "QuadraticRoots_float_float_float_Vec2f(a: float, b: float, c: float, roots: Vec2f) -> int"},
+    {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanQuadraticRootsMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
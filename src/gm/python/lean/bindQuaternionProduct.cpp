@@ -0,0 +1,68 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/quaternionProduct.h>
+
+// Lean python bindings for QuaternionProduct.
+
+GM_NS_USING
+
+// QuaternionProduct_Quatf_Quatf, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Quatf > arg0;
+    LeanArg< Quatf > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( QuaternionProduct( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "QuaternionProduct_Quatf_Quatf", i_args, i_argCount );
+}
+
+// QuaternionProduct, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 2 && Invoke0( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "QuaternionProduct", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"QuaternionProduct",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "QuaternionProduct(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. QuaternionProduct(lhs: Quatf, rhs: Quatf) -> Quatf\n"},
+                                  {"QuaternionProduct_Quatf_Quatf",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "QuaternionProduct_Quatf_Quatf(lhs: Quatf, rhs: Quatf) -> Quatf"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanQuaternionProductMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
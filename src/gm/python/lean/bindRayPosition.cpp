@@ -0,0 +1,104 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/rayPosition.h>
+
+// Lean python bindings for RayPosition.
+
+GM_NS_USING
+
+// RayPosition_Vec2f_Vec2f_float, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec2f > arg0;
+    LeanArg< Vec2f > arg1;
+    LeanArg< float > arg2;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( RayPosition( arg0.Get(), arg1.Get(), arg2.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 3 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "RayPosition_Vec2f_Vec2f_float", i_args, i_argCount );
+}
+
+// RayPosition_Vec3f_Vec3f_float, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec3f > arg0;
+    LeanArg< Vec3f > arg1;
+    LeanArg< float > arg2;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( RayPosition( arg0.Get(), arg1.Get(), arg2.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 3 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "RayPosition_Vec3f_Vec3f_float", i_args, i_argCount );
+}
+
+// RayPosition, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 3 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 3 && Invoke1( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "RayPosition", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"RayPosition",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "RayPosition(*args)\n"
+     "Overloaded function.\n"
+     "\n1. RayPosition(origin: Vec2f, direction: Vec2f, magnitude: float) -> Vec2f\n"
+     "\n2. RayPosition(origin: Vec3f, direction: Vec3f, magnitude: float) -> Vec3f\n"},
+    {"RayPosition_Vec2f_Vec2f_float",
+     LeanFastCall( Call0 ),
+     METH_FASTCALL,
+     "RayPosition_Vec2f_Vec2f_float(origin: Vec2f, direction: Vec2f, magnitude: float) -> Vec2f"},
+    {"RayPosition_Vec3f_Vec3f_float",
+     LeanFastCall( Call1 ),
+     METH_FASTCALL,
+     "RayPosition_Vec3f_Vec3f_float(origin: Vec3f, direction: Vec3f, magnitude: float) -> Vec3f"},
+    {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanRayPositionMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,96 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/setIdentity.h>
+
+// Lean python bindings for SetIdentity.
+
+GM_NS_USING
+
+// SetIdentity_Mat3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat3f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    SetIdentity( arg0.Get() );
+    Py_INCREF( Py_None );
+    *o_result = Py_None;
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "SetIdentity_Mat3f", i_args, i_argCount );
+}
+
+// SetIdentity_Mat4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat4f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    SetIdentity( arg0.Get() );
+    Py_INCREF( Py_None );
+    *o_result = Py_None;
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "SetIdentity_Mat4f", i_args, i_argCount );
+}
+
+// SetIdentity, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 1 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke1( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "SetIdentity", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"SetIdentity",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "SetIdentity(*args)\n"
+     "Overloaded function.\n"
+     "\n1. SetIdentity(matrix: Mat3f) -> None\n"
+     "\n2. SetIdentity(matrix: Mat4f) -> None\n"},
+    {"SetIdentity_Mat3f", LeanFastCall( Call0 ), METH_FASTCALL, "SetIdentity_Mat3f(matrix: Mat3f) -> None"},
+    {"SetIdentity_Mat4f", LeanFastCall( Call1 ), METH_FASTCALL, "SetIdentity_Mat4f(matrix: Mat4f) -> None"},
+    {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanSetIdentityMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
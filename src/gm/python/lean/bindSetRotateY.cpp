@@ -0,0 +1,70 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/setRotateY.h>
+
+// Lean python bindings for SetRotateY.
+
+GM_NS_USING
+
+// SetRotateY_float_Mat4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< float > arg0;
+    LeanArg< Mat4f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    SetRotateY( arg0.Get(), arg1.Get() );
+    Py_INCREF( Py_None );
+    *o_result = Py_None;
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "SetRotateY_float_Mat4f", i_args, i_argCount );
+}
+
+// SetRotateY, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 2 && Invoke0( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "SetRotateY", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"SetRotateY",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "SetRotateY(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. SetRotateY(angle: float, matrix: Mat4f) -> None\n"},
+                                  {"SetRotateY_float_Mat4f",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "SetRotateY_float_Mat4f(angle: float, matrix: Mat4f) -> None"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanSetRotateYMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
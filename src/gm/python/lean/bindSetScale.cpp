@@ -0,0 +1,103 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/setScale.h>
+
+// Lean python bindings for SetScale.
+
+GM_NS_USING
+
+// SetScale_Vec2f_Mat3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec2f > arg0;
+    LeanArg< Mat3f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    SetScale( arg0.Get(), arg1.Get() );
+    Py_INCREF( Py_None );
+    *o_result = Py_None;
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "SetScale_Vec2f_Mat3f", i_args, i_argCount );
+}
+
+// SetScale_Vec3f_Mat4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec3f > arg0;
+    LeanArg< Mat4f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    SetScale( arg0.Get(), arg1.Get() );
+    Py_INCREF( Py_None );
+    *o_result = Py_None;
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "SetScale_Vec3f_Mat4f", i_args, i_argCount );
+}
+
+// SetScale, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 2 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke1( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "SetScale", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"SetScale",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "SetScale(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. SetScale(vector: Vec2f, matrix: Mat3f) -> None\n"
+                                   "\n2. SetScale(vector: Vec3f, matrix: Mat4f) -> None\n"},
+                                  {"SetScale_Vec2f_Mat3f",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "SetScale_Vec2f_Mat3f(vector: Vec2f, matrix: Mat3f) -> None"},
+                                  {"SetScale_Vec3f_Mat4f",
+                                   LeanFastCall( Call1 ),
+                                   METH_FASTCALL,
+                                   "SetScale_Vec3f_Mat4f(vector: Vec3f, matrix: Mat4f) -> None"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanSetScaleMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,72 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/sphericalLinearInterpolation.h>
+
+// Lean python bindings for SphericalLinearInterpolation.
+
+GM_NS_USING
+
+// SphericalLinearInterpolation_Quatf_Quatf_float, returning false if the arguments could not be loaded, without setting
+// a python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Quatf > arg0;
+    LeanArg< Quatf > arg1;
+    LeanArg< float > arg2;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( SphericalLinearInterpolation( arg0.Get(), arg1.Get(), arg2.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 3 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "SphericalLinearInterpolation_Quatf_Quatf_float", i_args, i_argCount );
+}
+
+// SphericalLinearInterpolation, resolving its overloads in order, first without and then with implicit conversions of
+// scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 3 && Invoke0( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "SphericalLinearInterpolation", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"SphericalLinearInterpolation",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "SphericalLinearInterpolation(*args)\n"
+     "Overloaded function.\n"
+     "\n1. SphericalLinearInterpolation(source: Quatf, target: Quatf, weight: float) -> Quatf\n"},
+    {"SphericalLinearInterpolation_Quatf_Quatf_float",
+     LeanFastCall( Call0 ),
+     METH_FASTCALL,
+     "SphericalLinearInterpolation_Quatf_Quatf_float(source: Quatf, target: Quatf, weight: float) -> Quatf"},
+    {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanSphericalLinearInterpolationMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
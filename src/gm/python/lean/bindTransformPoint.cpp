@@ -0,0 +1,68 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/transformPoint.h>
+
+// Lean python bindings for TransformPoint.
+
+GM_NS_USING
+
+// TransformPoint_Mat4f_Vec3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat4f > arg0;
+    LeanArg< Vec3f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( TransformPoint( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "TransformPoint_Mat4f_Vec3f", i_args, i_argCount );
+}
+
+// TransformPoint, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 2 && Invoke0( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "TransformPoint", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"TransformPoint",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "TransformPoint(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. TransformPoint(matrix: Mat4f, point: Vec3f) -> Vec3f\n"},
+                                  {"TransformPoint_Mat4f_Vec3f",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "TransformPoint_Mat4f_Vec3f(matrix: Mat4f, point: Vec3f) -> Vec3f"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanTransformPointMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,130 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/transformVector.h>
+
+// Lean python bindings for TransformVector.
+
+GM_NS_USING
+
+// TransformVector_Mat3f_Vec2f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat3f > arg0;
+    LeanArg< Vec2f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( TransformVector( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "TransformVector_Mat3f_Vec2f", i_args, i_argCount );
+}
+
+// TransformVector_Mat4f_Vec3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat4f > arg0;
+    LeanArg< Vec3f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( TransformVector( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "TransformVector_Mat4f_Vec3f", i_args, i_argCount );
+}
+
+// TransformVector_Quatf_Vec3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke2( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Quatf > arg0;
+    LeanArg< Vec3f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( TransformVector( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call2( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke2( i_args, false, &result ) || Invoke2( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "TransformVector_Quatf_Vec3f", i_args, i_argCount );
+}
+
+// TransformVector, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 2 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke1( i_args, convert, &result ) ) ||
+             ( i_argCount == 2 && Invoke2( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "TransformVector", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"TransformVector",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "TransformVector(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. TransformVector(matrix: Mat3f, vector: Vec2f) -> Vec2f\n"
+                                   "\n2. TransformVector(matrix: Mat4f, vector: Vec3f) -> Vec3f\n"
+                                   "\n3. TransformVector(quaternion: Quatf, vector: Vec3f) -> Vec3f\n"},
+                                  {"TransformVector_Mat3f_Vec2f",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "TransformVector_Mat3f_Vec2f(matrix: Mat3f, vector: Vec2f) -> Vec2f"},
+                                  {"TransformVector_Mat4f_Vec3f",
+                                   LeanFastCall( Call1 ),
+                                   METH_FASTCALL,
+                                   "TransformVector_Mat4f_Vec3f(matrix: Mat4f, vector: Vec3f) -> Vec3f"},
+                                  {"TransformVector_Quatf_Vec3f",
+                                   LeanFastCall( Call2 ),
+                                   METH_FASTCALL,
+                                   "TransformVector_Quatf_Vec3f(quaternion: Quatf, vector: Vec3f) -> Vec3f"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanTransformVectorMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
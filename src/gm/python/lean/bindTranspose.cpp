@@ -0,0 +1,92 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/transpose.h>
+
+// Lean python bindings for Transpose.
+
+GM_NS_USING
+
+// Transpose_Mat3f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat3f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Transpose( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Transpose_Mat3f", i_args, i_argCount );
+}
+
+// Transpose_Mat4f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat4f > arg0;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( Transpose( arg0.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 1 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "Transpose_Mat4f", i_args, i_argCount );
+}
+
+// Transpose, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 1 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 1 && Invoke1( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "Transpose", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"Transpose",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "Transpose(*args)\n"
+     "Overloaded function.\n"
+     "\n1. Transpose(matrix: Mat3f) -> Mat3f\n"
+     "\n2. Transpose(matrix: Mat4f) -> Mat4f\n"},
+    {"Transpose_Mat3f", LeanFastCall( Call0 ), METH_FASTCALL, "Transpose_Mat3f(matrix: Mat3f) -> Mat3f"},
+    {"Transpose_Mat4f", LeanFastCall( Call1 ), METH_FASTCALL, "Transpose_Mat4f(matrix: Mat4f) -> Mat4f"},
+    {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanTransposeMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
@@ -0,0 +1,369 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/trilinearInterpolation.h>
+
+// Lean python bindings for TrilinearInterpolation.
+
+GM_NS_USING
+
+// TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f, returning false if the arguments could
+// not be loaded, without setting a python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< float > arg0;
+    LeanArg< float > arg1;
+    LeanArg< float > arg2;
+    LeanArg< float > arg3;
+    LeanArg< float > arg4;
+    LeanArg< float > arg5;
+    LeanArg< float > arg6;
+    LeanArg< float > arg7;
+    LeanArg< Vec3f > arg8;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) || !arg3.Load( i_args[ 3 ], i_convert ) ||
+         !arg4.Load( i_args[ 4 ], i_convert ) || !arg5.Load( i_args[ 5 ], i_convert ) ||
+         !arg6.Load( i_args[ 6 ], i_convert ) || !arg7.Load( i_args[ 7 ], i_convert ) ||
+         !arg8.Load( i_args[ 8 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( TrilinearInterpolation( arg0.Get(),
+                                                    arg1.Get(),
+                                                    arg2.Get(),
+                                                    arg3.Get(),
+                                                    arg4.Get(),
+                                                    arg5.Get(),
+                                                    arg6.Get(),
+                                                    arg7.Get(),
+                                                    arg8.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 9 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f",
+                              i_args,
+                              i_argCount );
+}
+
+// TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f, returning false if the arguments could
+// not be loaded, without setting a python error.
+static bool Invoke1( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat3f > arg0;
+    LeanArg< Mat3f > arg1;
+    LeanArg< Mat3f > arg2;
+    LeanArg< Mat3f > arg3;
+    LeanArg< Mat3f > arg4;
+    LeanArg< Mat3f > arg5;
+    LeanArg< Mat3f > arg6;
+    LeanArg< Mat3f > arg7;
+    LeanArg< Vec3f > arg8;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) || !arg3.Load( i_args[ 3 ], i_convert ) ||
+         !arg4.Load( i_args[ 4 ], i_convert ) || !arg5.Load( i_args[ 5 ], i_convert ) ||
+         !arg6.Load( i_args[ 6 ], i_convert ) || !arg7.Load( i_args[ 7 ], i_convert ) ||
+         !arg8.Load( i_args[ 8 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( TrilinearInterpolation( arg0.Get(),
+                                                    arg1.Get(),
+                                                    arg2.Get(),
+                                                    arg3.Get(),
+                                                    arg4.Get(),
+                                                    arg5.Get(),
+                                                    arg6.Get(),
+                                                    arg7.Get(),
+                                                    arg8.Get() ) );
+    return true;
+}
+
+static PyObject* Call1( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 9 && ( Invoke1( i_args, false, &result ) || Invoke1( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f",
+                              i_args,
+                              i_argCount );
+}
+
+// TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f, returning false if the arguments could
+// not be loaded, without setting a python error.
+static bool Invoke2( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Mat4f > arg0;
+    LeanArg< Mat4f > arg1;
+    LeanArg< Mat4f > arg2;
+    LeanArg< Mat4f > arg3;
+    LeanArg< Mat4f > arg4;
+    LeanArg< Mat4f > arg5;
+    LeanArg< Mat4f > arg6;
+    LeanArg< Mat4f > arg7;
+    LeanArg< Vec3f > arg8;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) || !arg3.Load( i_args[ 3 ], i_convert ) ||
+         !arg4.Load( i_args[ 4 ], i_convert ) || !arg5.Load( i_args[ 5 ], i_convert ) ||
+         !arg6.Load( i_args[ 6 ], i_convert ) || !arg7.Load( i_args[ 7 ], i_convert ) ||
+         !arg8.Load( i_args[ 8 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( TrilinearInterpolation( arg0.Get(),
+                                                    arg1.Get(),
+                                                    arg2.Get(),
+                                                    arg3.Get(),
+                                                    arg4.Get(),
+                                                    arg5.Get(),
+                                                    arg6.Get(),
+                                                    arg7.Get(),
+                                                    arg8.Get() ) );
+    return true;
+}
+
+static PyObject* Call2( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 9 && ( Invoke2( i_args, false, &result ) || Invoke2( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f",
+                              i_args,
+                              i_argCount );
+}
+
+// TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f, returning false if the arguments could
+// not be loaded, without setting a python error.
+static bool Invoke3( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec2f > arg0;
+    LeanArg< Vec2f > arg1;
+    LeanArg< Vec2f > arg2;
+    LeanArg< Vec2f > arg3;
+    LeanArg< Vec2f > arg4;
+    LeanArg< Vec2f > arg5;
+    LeanArg< Vec2f > arg6;
+    LeanArg< Vec2f > arg7;
+    LeanArg< Vec3f > arg8;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) || !arg3.Load( i_args[ 3 ], i_convert ) ||
+         !arg4.Load( i_args[ 4 ], i_convert ) || !arg5.Load( i_args[ 5 ], i_convert ) ||
+         !arg6.Load( i_args[ 6 ], i_convert ) || !arg7.Load( i_args[ 7 ], i_convert ) ||
+         !arg8.Load( i_args[ 8 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( TrilinearInterpolation( arg0.Get(),
+                                                    arg1.Get(),
+                                                    arg2.Get(),
+                                                    arg3.Get(),
+                                                    arg4.Get(),
+                                                    arg5.Get(),
+                                                    arg6.Get(),
+                                                    arg7.Get(),
+                                                    arg8.Get() ) );
+    return true;
+}
+
+static PyObject* Call3( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 9 && ( Invoke3( i_args, false, &result ) || Invoke3( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f",
+                              i_args,
+                              i_argCount );
+}
+
+// TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f, returning false if the arguments could
+// not be loaded, without setting a python error.
+static bool Invoke4( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec3f > arg0;
+    LeanArg< Vec3f > arg1;
+    LeanArg< Vec3f > arg2;
+    LeanArg< Vec3f > arg3;
+    LeanArg< Vec3f > arg4;
+    LeanArg< Vec3f > arg5;
+    LeanArg< Vec3f > arg6;
+    LeanArg< Vec3f > arg7;
+    LeanArg< Vec3f > arg8;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) || !arg3.Load( i_args[ 3 ], i_convert ) ||
+         !arg4.Load( i_args[ 4 ], i_convert ) || !arg5.Load( i_args[ 5 ], i_convert ) ||
+         !arg6.Load( i_args[ 6 ], i_convert ) || !arg7.Load( i_args[ 7 ], i_convert ) ||
+         !arg8.Load( i_args[ 8 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( TrilinearInterpolation( arg0.Get(),
+                                                    arg1.Get(),
+                                                    arg2.Get(),
+                                                    arg3.Get(),
+                                                    arg4.Get(),
+                                                    arg5.Get(),
+                                                    arg6.Get(),
+                                                    arg7.Get(),
+                                                    arg8.Get() ) );
+    return true;
+}
+
+static PyObject* Call4( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 9 && ( Invoke4( i_args, false, &result ) || Invoke4( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f",
+                              i_args,
+                              i_argCount );
+}
+
+// TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f, returning false if the arguments could
+// not be loaded, without setting a python error.
+static bool Invoke5( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec4f > arg0;
+    LeanArg< Vec4f > arg1;
+    LeanArg< Vec4f > arg2;
+    LeanArg< Vec4f > arg3;
+    LeanArg< Vec4f > arg4;
+    LeanArg< Vec4f > arg5;
+    LeanArg< Vec4f > arg6;
+    LeanArg< Vec4f > arg7;
+    LeanArg< Vec3f > arg8;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) ||
+         !arg2.Load( i_args[ 2 ], i_convert ) || !arg3.Load( i_args[ 3 ], i_convert ) ||
+         !arg4.Load( i_args[ 4 ], i_convert ) || !arg5.Load( i_args[ 5 ], i_convert ) ||
+         !arg6.Load( i_args[ 6 ], i_convert ) || !arg7.Load( i_args[ 7 ], i_convert ) ||
+         !arg8.Load( i_args[ 8 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( TrilinearInterpolation( arg0.Get(),
+                                                    arg1.Get(),
+                                                    arg2.Get(),
+                                                    arg3.Get(),
+                                                    arg4.Get(),
+                                                    arg5.Get(),
+                                                    arg6.Get(),
+                                                    arg7.Get(),
+                                                    arg8.Get() ) );
+    return true;
+}
+
+static PyObject* Call5( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 9 && ( Invoke5( i_args, false, &result ) || Invoke5( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f",
+                              i_args,
+                              i_argCount );
+}
+
+// TrilinearInterpolation, resolving its overloads in order, first without and then with implicit conversions of
+// scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 9 && Invoke0( i_args, convert, &result ) ) ||
+             ( i_argCount == 9 && Invoke1( i_args, convert, &result ) ) ||
+             ( i_argCount == 9 && Invoke2( i_args, convert, &result ) ) ||
+             ( i_argCount == 9 && Invoke3( i_args, convert, &result ) ) ||
+             ( i_argCount == 9 && Invoke4( i_args, convert, &result ) ) ||
+             ( i_argCount == 9 && Invoke5( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "TrilinearInterpolation", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"TrilinearInterpolation",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "TrilinearInterpolation(*args)\n"
+     "Overloaded function.\n"
+     "\n1. TrilinearInterpolation(corner000: float, corner100: float, corner010: float, corner110: float, corner001: "
+     "float, corner101: float, corner011: float, corner111: float, weight: Vec3f) -> float\n"
+     "\n2. TrilinearInterpolation(corner000: Mat3f, corner100: Mat3f, corner010: Mat3f, corner110: Mat3f, corner001: "
+     "Mat3f, corner101: Mat3f, corner011: Mat3f, corner111: Mat3f, weight: Vec3f) -> Mat3f\n"
+     "\n3. TrilinearInterpolation(corner000: Mat4f, corner100: Mat4f, corner010: Mat4f, corner110: Mat4f, corner001: "
+     "Mat4f, corner101: Mat4f, corner011: Mat4f, corner111: Mat4f, weight: Vec3f) -> Mat4f\n"
+     "\n4. TrilinearInterpolation(corner000: Vec2f, corner100: Vec2f, corner010: Vec2f, corner110: Vec2f, corner001: "
+     "Vec2f, corner101: Vec2f, corner011: Vec2f, corner111: Vec2f, weight: Vec3f) -> Vec2f\n"
+     "\n5. TrilinearInterpolation(corner000: Vec3f, corner100: Vec3f, corner010: Vec3f, corner110: Vec3f, corner001: "
+     "Vec3f, corner101: Vec3f, corner011: Vec3f, corner111: Vec3f, weight: Vec3f) -> Vec3f\n"
+     "\n6. TrilinearInterpolation(corner000: Vec4f, corner100: Vec4f, corner010: Vec4f, corner110: Vec4f, corner001: "
+     "Vec4f, corner101: Vec4f, corner011: Vec4f, corner111: Vec4f, weight: Vec3f) -> Vec4f\n"},
+    {"TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f",
+     LeanFastCall( Call0 ),
+     METH_FASTCALL,
+     "TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f(corner000: float, corner100: float, "
+     "corner010: float, corner110: float, corner001: float, corner101: float, corner011: float, corner111: float, "
+     "weight: Vec3f) -> float"},
+    {"TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f",
+     LeanFastCall( Call1 ),
+     METH_FASTCALL,
+     "TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f(corner000: Mat3f, corner100: Mat3f, "
+     "corner010: Mat3f, corner110: Mat3f, corner001: Mat3f, corner101: Mat3f, corner011: Mat3f, corner111: Mat3f, "
+     "weight: Vec3f) -> Mat3f"},
+    {"TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f",
+     LeanFastCall( Call2 ),
+     METH_FASTCALL,
+     "TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f(corner000: Mat4f, corner100: Mat4f, "
+     "corner010: Mat4f, corner110: Mat4f, corner001: Mat4f, corner101: Mat4f, corner011: Mat4f, corner111: Mat4f, "
+     "weight: Vec3f) -> Mat4f"},
+    {"TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f",
+     LeanFastCall( Call3 ),
+     METH_FASTCALL,
+     "TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f(corner000: Vec2f, corner100: Vec2f, "
+     "corner010: Vec2f, corner110: Vec2f, corner001: Vec2f, corner101: Vec2f, corner011: Vec2f, corner111: Vec2f, "
+     "weight: Vec3f) -> Vec2f"},
+    {"TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f",
+     LeanFastCall( Call4 ),
+     METH_FASTCALL,
+     "TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f(corner000: Vec3f, corner100: Vec3f, "
+     "corner010: Vec3f, corner110: Vec3f, corner001: Vec3f, corner101: Vec3f, corner011: Vec3f, corner111: Vec3f, "
+     "weight: Vec3f) -> Vec3f"},
+    {"TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f",
+     LeanFastCall( Call5 ),
+     METH_FASTCALL,
+     "TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f(corner000: Vec4f, corner100: Vec4f, "
+     "corner010: Vec4f, corner110: Vec4f, corner001: Vec4f, corner101: Vec4f, corner011: Vec4f, corner111: Vec4f, "
+     "weight: Vec3f) -> Vec4f"},
+    {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanTrilinearInterpolationMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
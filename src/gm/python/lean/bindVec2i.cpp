@@ -0,0 +1,363 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+// Lean python bindings for Vec2i.
+
+GM_NS_USING
+
+using LeanVec2i = LeanObject< Vec2i >;
+
+PyTypeObject GM_NS::LeanVec2iType = {PyVarObject_HEAD_INIT( nullptr, 0 )};
+
+/// Get the value held by the python object \p i_self.
+static inline Vec2i& Value( PyObject* i_self )
+{
+    return reinterpret_cast< LeanVec2i* >( i_self )->m_value;
+}
+
+/// Load the value initialized by the positional arguments \p i_args: none for the default value, one per element, or
+/// a single C-contiguous buffer of elements.
+///
+/// \return false with the python error set, if the arguments do not match any of the initializers.
+static bool LoadInitializer( PyObject* const* i_args, Py_ssize_t i_argCount, Vec2i& o_vector )
+{
+    if ( i_argCount == 0 )
+    {
+        o_vector = Vec2i();
+        return true;
+    }
+
+    if ( i_argCount == 1 )
+    {
+        return LeanLoadBuffer( i_args[ 0 ], 2, o_vector.Data() );
+    }
+
+    if ( i_argCount == 2 )
+    {
+        int elements[ 2 ];
+        for ( Py_ssize_t index = 0; index < 2; ++index )
+        {
+            LeanArg< int > element;
+            if ( !element.Load( i_args[ index ], /* i_convert */ true ) )
+            {
+                PyErr_Format( PyExc_TypeError,
+                              "Vec2i(): expected int elements, got '%s' at index %zd.",
+                              Py_TYPE( i_args[ index ] )->tp_name,
+                              index );
+                return false;
+            }
+            elements[ index ] = element.Get();
+        }
+
+        o_vector = Vec2i( elements[ 0 ], elements[ 1 ] );
+        return true;
+    }
+
+    PyErr_Format( PyExc_TypeError, "Vec2i() takes 0, 1 or 2 positional arguments, got %zd.", i_argCount );
+    return false;
+}
+
+// Allocation, to the default value.
+static PyObject* New( PyTypeObject* i_type, PyObject* /* i_args */, PyObject* /* i_kwargs */ )
+{
+    return LeanNew( i_type, Vec2i() );
+}
+
+// Initialization, such that subclasses can call the base initializer.
+static int Init( PyObject* o_self, PyObject* i_args, PyObject* i_kwargs )
+{
+    if ( i_kwargs != nullptr && PyDict_GET_SIZE( i_kwargs ) != 0 )
+    {
+        PyErr_SetString( PyExc_TypeError, "Vec2i() takes no keyword arguments." );
+        return -1;
+    }
+
+    PyObject* const* args = reinterpret_cast< PyTupleObject* >( i_args )->ob_item;
+    return LoadInitializer( args, PyTuple_GET_SIZE( i_args ), Value( o_self ) ) ? 0 : -1;
+}
+
+#if PY_VERSION_HEX >= 0x03090000
+// Vectorcall of the type, allocating and initializing the value in a single step, without an argument tuple.
+static PyObject* Vectorcall( PyObject* i_type, PyObject* const* i_args, size_t i_argCountf, PyObject* i_kwnames )
+{
+    if ( i_kwnames != nullptr && PyTuple_GET_SIZE( i_kwnames ) != 0 )
+    {
+        PyErr_SetString( PyExc_TypeError, "Vec2i() takes no keyword arguments." );
+        return nullptr;
+    }
+
+    Vec2i vector;
+    if ( !LoadInitializer( i_args, PyVectorcall_NARGS( i_argCountf ), vector ) )
+    {
+        return nullptr;
+    }
+
+    return LeanNew( reinterpret_cast< PyTypeObject* >( i_type ), vector );
+}
+#endif
+
+// Deallocation.  Values are trivially destructible.
+static void Dealloc( PyObject* o_self )
+{
+    Py_TYPE( o_self )->tp_free( o_self );
+}
+
+// Object representation.
+static PyObject* Repr( PyObject* i_self )
+{
+    std::string string = Value( i_self ).GetString( "gmlean." );
+    return PyUnicode_FromStringAndSize( string.c_str(), string.size() );
+}
+
+// Equality.
+static PyObject* RichCompare( PyObject* i_lhs, PyObject* i_rhs, int i_operator )
+{
+    LeanArg< Vec2i > lhs;
+    LeanArg< Vec2i > rhs;
+    if ( ( i_operator != Py_EQ && i_operator != Py_NE ) || !lhs.Load( i_lhs, false ) || !rhs.Load( i_rhs, false ) )
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    bool equal = lhs.Get() == rhs.Get();
+    return PyBool_FromLong( i_operator == Py_EQ ? equal : !equal );
+}
+
+// Vector addition.
+static PyObject* Add( PyObject* i_lhs, PyObject* i_rhs )
+{
+    LeanArg< Vec2i > lhs;
+    LeanArg< Vec2i > rhs;
+    if ( !lhs.Load( i_lhs, false ) || !rhs.Load( i_rhs, false ) )
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    return LeanResult( lhs.Get() + rhs.Get() );
+}
+
+// Vector subtraction.
+static PyObject* Subtract( PyObject* i_lhs, PyObject* i_rhs )
+{
+    LeanArg< Vec2i > lhs;
+    LeanArg< Vec2i > rhs;
+    if ( !lhs.Load( i_lhs, false ) || !rhs.Load( i_rhs, false ) )
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    return LeanResult( lhs.Get() - rhs.Get() );
+}
+
+// Vector-scalar and scalar-vector multiplication.
+static PyObject* Multiply( PyObject* i_lhs, PyObject* i_rhs )
+{
+    LeanArg< Vec2i > vector;
+    LeanArg< int >   scalar;
+    if ( vector.Load( i_lhs, false ) && scalar.Load( i_rhs, true ) )
+    {
+        return LeanResult( vector.Get() * scalar.Get() );
+    }
+
+    if ( vector.Load( i_rhs, false ) && scalar.Load( i_lhs, true ) )
+    {
+        return LeanResult( scalar.Get() * vector.Get() );
+    }
+
+    Py_RETURN_NOTIMPLEMENTED;
+}
+
+// Vector-scalar division.
+static PyObject* TrueDivide( PyObject* i_lhs, PyObject* i_rhs )
+{
+    LeanArg< Vec2i > vector;
+    LeanArg< int >   scalar;
+    if ( !vector.Load( i_lhs, false ) || !scalar.Load( i_rhs, true ) )
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    if ( scalar.Get() == 0 )
+    {
+        PyErr_SetString( PyExc_ZeroDivisionError, "division by zero" );
+        return nullptr;
+    }
+
+    return LeanResult( vector.Get() / scalar.Get() );
+}
+
+// Unary negation.
+static PyObject* Negative( PyObject* i_self )
+{
+    return LeanResult( -Value( i_self ) );
+}
+
+// Element indexed read access.
+static PyObject* GetItem( PyObject* i_self, Py_ssize_t i_index )
+{
+    if ( i_index < 0 || i_index >= 2 )
+    {
+        PyErr_SetString( PyExc_IndexError, "index out of range" );
+        return nullptr;
+    }
+
+    return LeanResult( Value( i_self )[ i_index ] );
+}
+
+// Element indexed write access.
+static int SetItem( PyObject* o_self, Py_ssize_t i_index, PyObject* i_value )
+{
+    if ( i_index < 0 || i_index >= 2 )
+    {
+        PyErr_SetString( PyExc_IndexError, "index out of range" );
+        return -1;
+    }
+
+    LeanArg< int > element;
+    if ( i_value == nullptr || !element.Load( i_value, true ) )
+    {
+        PyErr_SetString( PyExc_TypeError, "Vec2i elements must be assigned int values." );
+        return -1;
+    }
+
+    Value( o_self )[ i_index ] = element.Get();
+    return 0;
+}
+
+/// Get the index of the element addressed by the python key \p i_key.
+///
+/// \return -1 with the python error set, if the key is out of range.
+static Py_ssize_t ElementIndex( PyObject* i_key )
+{
+    return LeanIndex( i_key, 2 );
+}
+
+// Subscript read access.
+static PyObject* Subscript( PyObject* i_self, PyObject* i_key )
+{
+    Py_ssize_t index = ElementIndex( i_key );
+    return index < 0 ? nullptr : GetItem( i_self, index );
+}
+
+// Subscript write access.
+static int AssignSubscript( PyObject* o_self, PyObject* i_key, PyObject* i_value )
+{
+    Py_ssize_t index = ElementIndex( i_key );
+    return index < 0 ? -1 : SetItem( o_self, index, i_value );
+}
+
+// Buffer protocol, exposing the element storage without copying.
+static int GetBuffer( PyObject* i_self, Py_buffer* o_view, int i_flags )
+{
+    static Py_ssize_t s_shape[]   = {2};
+    static Py_ssize_t s_strides[] = {sizeof( int )};
+    return LeanGetBuffer( i_self, Value( i_self ).Data(), 1, s_shape, s_strides, o_view, i_flags );
+}
+
+// Named X element getter.
+static PyObject* GetX( PyObject* i_self, void* /* i_closure */ )
+{
+    return LeanResult( Value( i_self ).X() );
+}
+
+// Named X element setter.
+static int SetX( PyObject* o_self, PyObject* i_value, void* /* i_closure */ )
+{
+    return SetItem( o_self, 0, i_value );
+}
+
+// Named Y element getter.
+static PyObject* GetY( PyObject* i_self, void* /* i_closure */ )
+{
+    return LeanResult( Value( i_self ).Y() );
+}
+
+// Named Y element setter.
+static int SetY( PyObject* o_self, PyObject* i_value, void* /* i_closure */ )
+{
+    return SetItem( o_self, 1, i_value );
+}
+
+// Element size.
+static PyObject* GetElementSize( PyObject* /* i_self */, PyObject* /* i_args */ )
+{
+    return PyLong_FromSize_t( Vec2i::GetElementSize() );
+}
+
+static PyMethodDef s_methods[] = {{"GetElementSize", GetElementSize, METH_NOARGS | METH_STATIC, "Number of elements."},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+static PyGetSetDef s_getSets[] = {{const_cast< char* >( "x" ),
+                                   GetX,
+                                   SetX,
+                                   const_cast< char* >( "Named property getter / setter for the element at index 0." ),
+                                   nullptr},
+                                  {const_cast< char* >( "y" ),
+                                   GetY,
+                                   SetY,
+                                   const_cast< char* >( "Named property getter / setter for the element at index 1." ),
+                                   nullptr},
+                                  {nullptr, nullptr, nullptr, nullptr, nullptr}};
+
+static PyNumberMethods s_numberMethods = {};
+
+static PySequenceMethods s_sequenceMethods = {};
+
+static PyMappingMethods s_mappingMethods = {};
+
+static PyBufferProcs s_bufferProcs = {};
+
+int LeanBindVec2i( PyObject* o_module )
+{
+    s_numberMethods.nb_add         = Add;
+    s_numberMethods.nb_subtract    = Subtract;
+    s_numberMethods.nb_multiply    = Multiply;
+    s_numberMethods.nb_true_divide = TrueDivide;
+    s_numberMethods.nb_negative    = Negative;
+
+    s_sequenceMethods.sq_item     = GetItem;
+    s_sequenceMethods.sq_ass_item = SetItem;
+
+    s_mappingMethods.mp_subscript     = Subscript;
+    s_mappingMethods.mp_ass_subscript = AssignSubscript;
+
+    s_bufferProcs.bf_getbuffer = GetBuffer;
+
+    PyTypeObject& type  = LeanVec2iType;
+    type.tp_name        = "gmlean.Vec2i";
+    type.tp_doc         = "Vec2i, stored inline in the python object.";
+    type.tp_basicsize   = sizeof( LeanVec2i );
+    type.tp_flags       = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE;
+    type.tp_new         = New;
+    type.tp_init        = Init;
+    type.tp_dealloc     = Dealloc;
+    type.tp_repr        = Repr;
+    type.tp_richcompare = RichCompare;
+    type.tp_hash        = PyObject_HashNotImplemented;
+    type.tp_as_number   = &s_numberMethods;
+    type.tp_as_sequence = &s_sequenceMethods;
+    type.tp_as_mapping  = &s_mappingMethods;
+    type.tp_as_buffer   = &s_bufferProcs;
+    type.tp_methods     = s_methods;
+    type.tp_getset      = s_getSets;
+#if PY_VERSION_HEX >= 0x03090000
+    type.tp_vectorcall = Vectorcall;
+#endif
+
+    if ( PyType_Ready( &type ) < 0 )
+    {
+        return -1;
+    }
+
+    Py_INCREF( &type );
+    if ( PyModule_AddObject( o_module, "Vec2i", reinterpret_cast< PyObject* >( &type ) ) < 0 )
+    {
+        Py_DECREF( &type );
+        return -1;
+    }
+
+    return 0;
+}
\ No newline at end of file
@@ -0,0 +1,68 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+#include <gm/functions/viewportTransform.h>
+
+// Lean python bindings for ViewportTransform.
+
+GM_NS_USING
+
+// ViewportTransform_Vec2f_Vec2f, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke0( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    LeanArg< Vec2f > arg0;
+    LeanArg< Vec2f > arg1;
+    if ( !arg0.Load( i_args[ 0 ], i_convert ) || !arg1.Load( i_args[ 1 ], i_convert ) )
+    {
+        return false;
+    }
+    *o_result = LeanResult( ViewportTransform( arg0.Get(), arg1.Get() ) );
+    return true;
+}
+
+static PyObject* Call0( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == 2 && ( Invoke0( i_args, false, &result ) || Invoke0( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "ViewportTransform_Vec2f_Vec2f", i_args, i_argCount );
+}
+
+// ViewportTransform, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( ( i_argCount == 2 && Invoke0( i_args, convert, &result ) ) )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "ViewportTransform", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {{"ViewportTransform",
+                                   LeanFastCall( Call ),
+                                   METH_FASTCALL,
+                                   "ViewportTransform(*args)\n"
+                                   "Overloaded function.\n"
+                                   "\n1. ViewportTransform(dimensions: Vec2f, offset: Vec2f) -> Mat4f\n"},
+                                  {"ViewportTransform_Vec2f_Vec2f",
+                                   LeanFastCall( Call0 ),
+                                   METH_FASTCALL,
+                                   "ViewportTransform_Vec2f_Vec2f(dimensions: Vec2f, offset: Vec2f) -> Mat4f"},
+                                  {nullptr, nullptr, 0, nullptr}};
+
+PyMethodDef* GetLeanViewportTransformMethods()
+{
+    return s_methods;
+}
\ No newline at end of file
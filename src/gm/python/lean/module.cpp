@@ -0,0 +1,153 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include "lean.h"
+
+// Type Declarations.
+int LeanBindVec2f( PyObject* );
+int LeanBindVec3f( PyObject* );
+int LeanBindVec4f( PyObject* );
+int LeanBindVec2i( PyObject* );
+int LeanBindVec3i( PyObject* );
+int LeanBindVec4i( PyObject* );
+int LeanBindMat3f( PyObject* );
+int LeanBindMat4f( PyObject* );
+int LeanBindQuatf( PyObject* );
+
+// Function Declarations.
+PyMethodDef* GetLeanLinearInterpolationMethods();
+PyMethodDef* GetLeanNormalizeMethods();
+PyMethodDef* GetLeanInverseMethods();
+PyMethodDef* GetLeanMinMethods();
+PyMethodDef* GetLeanQuaternionProductMethods();
+PyMethodDef* GetLeanApproximateSetRotateMethods();
+PyMethodDef* GetLeanSphericalLinearInterpolationMethods();
+PyMethodDef* GetLeanAbsMethods();
+PyMethodDef* GetLeanIsIdentityMethods();
+PyMethodDef* GetLeanApproximateNormalizeMethods();
+PyMethodDef* GetLeanTrilinearInterpolationMethods();
+PyMethodDef* GetLeanOrthographicProjectionMethods();
+PyMethodDef* GetLeanBilinearInterpolationMethods();
+PyMethodDef* GetLeanInverseAffineMethods();
+PyMethodDef* GetLeanCrossProductMethods();
+PyMethodDef* GetLeanSetTranslateMethods();
+PyMethodDef* GetLeanMaxMethods();
+PyMethodDef* GetLeanFloorMethods();
+PyMethodDef* GetLeanTransposeMethods();
+PyMethodDef* GetLeanSetScaleMethods();
+PyMethodDef* GetLeanCeilMethods();
+PyMethodDef* GetLeanFaceForwardMethods();
+PyMethodDef* GetLeanApproximateLengthMethods();
+PyMethodDef* GetLeanLookAtMethods();
+PyMethodDef* GetLeanApproximateSetRotateZMethods();
+PyMethodDef* GetLeanHasScaleMethods();
+PyMethodDef* GetLeanDotProductMethods();
+PyMethodDef* GetLeanSetRotateYMethods();
+PyMethodDef* GetLeanSetRotateXMethods();
+PyMethodDef* GetLeanSetRotateZMethods();
+PyMethodDef* GetLeanDistanceMethods();
+PyMethodDef* GetLeanRayPositionMethods();
+PyMethodDef* GetLeanTransformPointMethods();
+PyMethodDef* GetLeanNormalizedLinearInterpolationMethods();
+PyMethodDef* GetLeanRadiansMethods();
+PyMethodDef* GetLeanCoordinateSystemMethods();
+PyMethodDef* GetLeanLengthMethods();
+PyMethodDef* GetLeanApproximateReciprocalSquareRootMethods();
+PyMethodDef* GetLeanApproximateSetRotateXMethods();
+PyMethodDef* GetLeanSetIdentityMethods();
+PyMethodDef* GetLeanLengthSquaredMethods();
+PyMethodDef* GetLeanInverseRigidMethods();
+PyMethodDef* GetLeanPerspectiveProjectionMethods();
+PyMethodDef* GetLeanSetRotateMethods();
+PyMethodDef* GetLeanViewportTransformMethods();
+PyMethodDef* GetLeanMatrixProductMethods();
+PyMethodDef* GetLeanTransformVectorMethods();
+PyMethodDef* GetLeanQuadraticRootsMethods();
+PyMethodDef* GetLeanRotationQuaternionMethods();
+PyMethodDef* GetLeanDegreesMethods();
+PyMethodDef* GetLeanApproximateSetRotateYMethods();
+
+static PyModuleDef s_moduleDef = {PyModuleDef_HEAD_INIT,
+                                  "gmlean",
+                                  "Lean GraphicsMath python module, binding the vector, matrix and quaternion types, "
+                                  "and the functions of single values over them, directly against the CPython API.",
+                                  -1,
+                                  nullptr};
+
+PyMODINIT_FUNC PyInit_gmlean()
+{
+    PyObject* module = PyModule_Create( &s_moduleDef );
+    if ( module == nullptr )
+    {
+        return nullptr;
+    }
+
+    // Types.
+    if ( LeanBindVec2f( module ) < 0 || LeanBindVec3f( module ) < 0 || LeanBindVec4f( module ) < 0 ||
+         LeanBindVec2i( module ) < 0 || LeanBindVec3i( module ) < 0 || LeanBindVec4i( module ) < 0 ||
+         LeanBindMat3f( module ) < 0 || LeanBindMat4f( module ) < 0 || LeanBindQuatf( module ) < 0 )
+    {
+        Py_DECREF( module );
+        return nullptr;
+    }
+
+    // Functions.
+    if ( PyModule_AddFunctions( module, GetLeanLinearInterpolationMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanNormalizeMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanInverseMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanMinMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanQuaternionProductMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanApproximateSetRotateMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanSphericalLinearInterpolationMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanAbsMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanIsIdentityMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanApproximateNormalizeMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanTrilinearInterpolationMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanOrthographicProjectionMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanBilinearInterpolationMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanInverseAffineMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanCrossProductMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanSetTranslateMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanMaxMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanFloorMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanTransposeMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanSetScaleMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanCeilMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanFaceForwardMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanApproximateLengthMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanLookAtMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanApproximateSetRotateZMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanHasScaleMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanDotProductMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanSetRotateYMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanSetRotateXMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanSetRotateZMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanDistanceMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanRayPositionMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanTransformPointMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanNormalizedLinearInterpolationMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanRadiansMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanCoordinateSystemMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanLengthMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanApproximateReciprocalSquareRootMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanApproximateSetRotateXMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanSetIdentityMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanLengthSquaredMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanInverseRigidMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanPerspectiveProjectionMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanSetRotateMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanViewportTransformMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanMatrixProductMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanTransformVectorMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanQuadraticRootsMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanRotationQuaternionMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanDegreesMethods() ) < 0 ||
+         PyModule_AddFunctions( module, GetLeanApproximateSetRotateYMethods() ) < 0 )
+    {
+        Py_DECREF( module );
+        return nullptr;
+    }
+
+    return module;
+}
\ No newline at end of file
@@ -0,0 +1,103 @@
+import unittest
+
+import gmlean
+
+try:
+    import gm
+except ImportError:
+    gm = None
+
+
+class TestLeanFunctions(unittest.TestCase):
+    def testDispatch(self):
+        self.assertEqual(
+            gmlean.DotProduct(gmlean.Vec3f(1, 2, 3), gmlean.Vec3f(4, 5, 6)), 32
+        )
+        self.assertEqual(
+            gmlean.Min(gmlean.Vec4i(1, 5, 3, 8), gmlean.Vec4i(4, 2, 6, 7)),
+            gmlean.Vec4i(1, 2, 3, 7),
+        )
+        self.assertEqual(
+            gmlean.CrossProduct(gmlean.Vec3f(1, 0, 0), gmlean.Vec3f(0, 1, 0)),
+            gmlean.Vec3f(0, 0, 1),
+        )
+
+    def testTypedNames(self):
+        self.assertEqual(gmlean.Min_float_float(1.5, 2.5), 1.5)
+        self.assertEqual(
+            gmlean.Length_Vec3f(gmlean.Vec3f(3, 4, 0)),
+            gmlean.Length(gmlean.Vec3f(3, 4, 0)),
+        )
+        with self.assertRaises(TypeError):
+            gmlean.DotProduct_Vec3f_Vec3f(gmlean.Vec4f(), gmlean.Vec4f())
+
+    def testScalarResolution(self):
+        # Exact types are resolved first, then implicit conversions of scalars.
+        result = gmlean.Min(1, 2)
+        self.assertIs(type(result), int)
+        self.assertEqual(result, 1)
+        self.assertEqual(gmlean.Min(1.5, 2), 1.5)
+
+        result = gmlean.Min(2 ** 40, 1)
+        self.assertIs(type(result), float)
+        self.assertEqual(result, 1.0)
+
+        self.assertEqual(
+            gmlean.LinearInterpolation(gmlean.Vec3f(0, 0, 0), gmlean.Vec3f(2, 4, 6), 1),
+            gmlean.Vec3f(2, 4, 6),
+        )
+
+    def testMutableArguments(self):
+        matrix = gmlean.Mat4f()
+        self.assertIsNone(gmlean.SetIdentity(matrix))
+        self.assertTrue(gmlean.IsIdentity(matrix))
+
+        translate = gmlean.Mat4f()
+        gmlean.SetIdentity(translate)
+        gmlean.SetTranslate(gmlean.Vec3f(1, 2, 3), translate)
+        self.assertEqual(
+            gmlean.TransformPoint(translate, gmlean.Vec3f(1, 1, 1)),
+            gmlean.Vec3f(2, 3, 4),
+        )
+
+    def testSubclassArguments(self):
+        class Vector(gmlean.Vec3f):
+            pass
+
+        self.assertEqual(gmlean.Length(Vector(3, 4, 0)), 5)
+
+    def testArgumentErrors(self):
+        with self.assertRaises(TypeError):
+            gmlean.DotProduct(1, 2)
+        with self.assertRaises(TypeError):
+            gmlean.DotProduct(gmlean.Vec3f())
+        with self.assertRaises(TypeError):
+            gmlean.DotProduct(gmlean.Vec3f(), rhs=gmlean.Vec3f())
+
+    def testDoc(self):
+        self.assertEqual(gmlean.DotProduct.__name__, "DotProduct")
+        self.assertIn(
+            "DotProduct(lhs: Vec3f, rhs: Vec3f) -> float", gmlean.DotProduct.__doc__
+        )
+
+    @unittest.skipIf(gm is None, "The pybind11 module is not built.")
+    def testMatchesPybind11Module(self):
+        matrix = gm.Mat4f()
+        gm.SetRotate(0.5, gm.Vec3f(0, 0, 1), matrix)
+        leanMatrix = gmlean.Mat4f(matrix)
+        self.assertEqual(list(leanMatrix), list(matrix))
+
+        point = gmlean.TransformPoint(leanMatrix, gmlean.Vec3f(1, 2, 3))
+        self.assertEqual(
+            list(point), list(gm.TransformPoint(matrix, gm.Vec3f(1, 2, 3)))
+        )
+        inverse = gm.Mat4f()
+        leanInverse = gmlean.Mat4f()
+        self.assertEqual(
+            gmlean.Inverse(leanMatrix, leanInverse), gm.Inverse(matrix, inverse)
+        )
+        self.assertEqual(list(leanInverse), list(inverse))
+
+
+if __name__ == "__main__":
+    unittest.main()
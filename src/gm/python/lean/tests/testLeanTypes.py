@@ -0,0 +1,122 @@
+import unittest
+
+import numpy
+import gmlean
+
+
+class TestLeanTypes(unittest.TestCase):
+    def testInitializers(self):
+        self.assertEqual(gmlean.Vec3f(), gmlean.Vec3f(0, 0, 0))
+        self.assertEqual(list(gmlean.Vec3f(1, 2, 3)), [1, 2, 3])
+        self.assertEqual(list(gmlean.Vec2i(4, 5)), [4, 5])
+        self.assertEqual(
+            gmlean.Vec4f(numpy.array([1, 2, 3, 4], dtype=numpy.float32)),
+            gmlean.Vec4f(1, 2, 3, 4),
+        )
+        self.assertEqual(
+            gmlean.Mat3f(numpy.arange(9, dtype=numpy.float32).reshape(3, 3)),
+            gmlean.Mat3f(*range(9)),
+        )
+
+    def testInitializerErrors(self):
+        with self.assertRaises(TypeError):
+            gmlean.Vec3f(1, 2)
+        with self.assertRaises(TypeError):
+            gmlean.Vec3i(1.5, 2, 3)
+        with self.assertRaises(TypeError):
+            gmlean.Vec3f(x=1)
+        with self.assertRaises(TypeError):
+            gmlean.Vec3f(numpy.zeros(3, dtype=numpy.float64))
+        with self.assertRaises(ValueError):
+            gmlean.Vec3f(numpy.zeros(4, dtype=numpy.float32))
+        with self.assertRaises(ValueError):
+            gmlean.Vec3f(numpy.zeros(6, dtype=numpy.float32)[::2])
+
+    def testRepr(self):
+        self.assertEqual(repr(gmlean.Vec3f(1, 2, 3)), "gmlean.Vec3f( 1, 2, 3 )")
+
+    def testElementAccess(self):
+        vector = gmlean.Vec3f(1, 2, 3)
+        self.assertEqual(vector[2], 3)
+        self.assertEqual((vector.x, vector.y, vector.z), (1, 2, 3))
+        vector[0] = 4
+        vector.y = 5
+        self.assertEqual(vector, gmlean.Vec3f(4, 5, 3))
+        with self.assertRaises(IndexError):
+            vector[3]
+        with self.assertRaises(IndexError):
+            vector[-1]
+        with self.assertRaises(TypeError):
+            vector[0] = "a"
+
+        quaternion = gmlean.Quatf(1, 2, 3, 4)
+        self.assertEqual(quaternion.w, 4)
+
+    def testMatrixElementAccess(self):
+        matrix = gmlean.Mat4f(*range(16))
+        self.assertEqual(matrix[1, 2], 6)
+        self.assertEqual(matrix[6], 6)
+        matrix[3, 0] = -1
+        self.assertEqual(matrix[12], -1)
+        with self.assertRaises(IndexError):
+            matrix[4, 0]
+        with self.assertRaises(IndexError):
+            matrix[0, 0, 0]
+
+    def testArithmetic(self):
+        lhs = gmlean.Vec3f(1, 2, 3)
+        rhs = gmlean.Vec3f(4, 5, 6)
+        self.assertEqual(lhs + rhs, gmlean.Vec3f(5, 7, 9))
+        self.assertEqual(rhs - lhs, gmlean.Vec3f(3, 3, 3))
+        self.assertEqual(lhs * 2, gmlean.Vec3f(2, 4, 6))
+        self.assertEqual(2 * lhs, gmlean.Vec3f(2, 4, 6))
+        self.assertEqual(lhs / 2, gmlean.Vec3f(0.5, 1, 1.5))
+        self.assertEqual(-lhs, gmlean.Vec3f(-1, -2, -3))
+        self.assertEqual(gmlean.Vec2i(3, 4) * 2, gmlean.Vec2i(6, 8))
+        with self.assertRaises(ZeroDivisionError):
+            lhs / 0
+        with self.assertRaises(TypeError):
+            lhs + gmlean.Vec4f()
+        with self.assertRaises(TypeError):
+            gmlean.Vec2i(3, 4) * 1.5
+
+    def testEquality(self):
+        self.assertEqual(gmlean.Vec3f(1, 2, 3), gmlean.Vec3f(1, 2, 3))
+        self.assertNotEqual(gmlean.Vec3f(1, 2, 3), gmlean.Vec3f(1, 2, 4))
+        self.assertNotEqual(gmlean.Vec3f(1, 2, 3), (1, 2, 3))
+        with self.assertRaises(TypeError):
+            hash(gmlean.Vec3f())
+
+    def testBufferProtocol(self):
+        vector = gmlean.Vec3f(1, 2, 3)
+        array = numpy.asarray(vector)
+        self.assertEqual(array.dtype, numpy.float32)
+        array[1] = 7
+        self.assertEqual(vector.y, 7)
+
+        matrix = numpy.asarray(gmlean.Mat3f(*range(9)))
+        self.assertEqual(matrix.shape, (3, 3))
+        numpy.testing.assert_array_equal(matrix, numpy.arange(9).reshape(3, 3))
+
+        self.assertEqual(numpy.asarray(gmlean.Vec4i(1, 2, 3, 4)).dtype, numpy.int32)
+
+    def testMethods(self):
+        self.assertEqual(gmlean.Mat4f.GetElementSize(), 16)
+        self.assertEqual(gmlean.Vec3f().GetElementSize(), 3)
+        self.assertFalse(gmlean.Vec3f().HasNaNs())
+        self.assertEqual(gmlean.Quatf.Identity(), gmlean.Quatf(0, 0, 0, 1))
+
+    def testSubclass(self):
+        class Vector(gmlean.Vec3f):
+            def __init__(self, *args):
+                super().__init__(*args)
+                self.name = "vector"
+
+        vector = Vector(1, 2, 3)
+        self.assertEqual(vector.name, "vector")
+        self.assertEqual(vector, gmlean.Vec3f(1, 2, 3))
+        self.assertIs(type(vector + vector), gmlean.Vec3f)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,10 @@
 
 #include <pybind11/pybind11.h>
 
-// Type Declarations.
+#include "functions/parallel.h"
+#include "submodules.h"
+
+// Declarations of the bindings of each submodule.
 void BindVec2f( pybind11::module& );
 void BindVec3f( pybind11::module& );
 void BindVec4f( pybind11::module& );
@@ -13,6 +16,7 @@ void BindVec3i( pybind11::module& );
 void BindVec4i( pybind11::module& );
 void BindMat3f( pybind11::module& );
 void BindMat4f( pybind11::module& );
+void BindQuatf( pybind11::module& );
 void BindFloatRange( pybind11::module& );
 void BindIntRange( pybind11::module& );
 void BindVec2fRange( pybind11::module& );
@@ -21,128 +25,554 @@ void BindVec4fRange( pybind11::module& );
 void BindVec2iRange( pybind11::module& );
 void BindVec3iRange( pybind11::module& );
 void BindVec4iRange( pybind11::module& );
-
-// Function Declarations.
+void BindRay( pybind11::module& );
+void BindFloatArray( pybind11::module& );
+void BindFloatArrayView( pybind11::module& );
+void BindIntArray( pybind11::module& );
+void BindIntArrayView( pybind11::module& );
+void BindVec2fArray( pybind11::module& );
+void BindVec2fArrayView( pybind11::module& );
+void BindVec3fArray( pybind11::module& );
+void BindVec3fArrayView( pybind11::module& );
+void BindVec4fArray( pybind11::module& );
+void BindVec4fArrayView( pybind11::module& );
+void BindVec2iArray( pybind11::module& );
+void BindVec2iArrayView( pybind11::module& );
+void BindVec3iArray( pybind11::module& );
+void BindVec3iArrayView( pybind11::module& );
+void BindVec4iArray( pybind11::module& );
+void BindVec4iArrayView( pybind11::module& );
+void BindMat3fArray( pybind11::module& );
+void BindMat3fArrayView( pybind11::module& );
+void BindMat4fArray( pybind11::module& );
+void BindMat4fArrayView( pybind11::module& );
+void BindQuatfArray( pybind11::module& );
+void BindQuatfArrayView( pybind11::module& );
+void BindFloatRangeArray( pybind11::module& );
+void BindFloatRangeArrayView( pybind11::module& );
+void BindIntRangeArray( pybind11::module& );
+void BindIntRangeArrayView( pybind11::module& );
+void BindVec2fRangeArray( pybind11::module& );
+void BindVec2fRangeArrayView( pybind11::module& );
+void BindVec3fRangeArray( pybind11::module& );
+void BindVec3fRangeArrayView( pybind11::module& );
+void BindVec4fRangeArray( pybind11::module& );
+void BindVec4fRangeArrayView( pybind11::module& );
+void BindVec2iRangeArray( pybind11::module& );
+void BindVec2iRangeArrayView( pybind11::module& );
+void BindVec3iRangeArray( pybind11::module& );
+void BindVec3iRangeArrayView( pybind11::module& );
+void BindVec4iRangeArray( pybind11::module& );
+void BindVec4iRangeArrayView( pybind11::module& );
 void BindLinearInterpolation( pybind11::module& );
-void BindNormalize( pybind11::module& );
-void BindInverse( pybind11::module& );
 void BindMin( pybind11::module& );
 void BindContains( pybind11::module& );
 void BindContent( pybind11::module& );
 void BindAbs( pybind11::module& );
-void BindDegrees( pybind11::module& );
 void BindTrilinearInterpolation( pybind11::module& );
-void BindOrthographicProjection( pybind11::module& );
 void BindBilinearInterpolation( pybind11::module& );
 void BindRandomNumber( pybind11::module& );
-void BindTransformAABB( pybind11::module& );
-void BindCrossProduct( pybind11::module& );
 void BindLongestAxis( pybind11::module& );
-void BindSetTranslate( pybind11::module& );
 void BindMax( pybind11::module& );
 void BindFloor( pybind11::module& );
+void BindCeil( pybind11::module& );
+void BindApproximateSineCosine( pybind11::module& );
+void BindIntersection( pybind11::module& );
+void BindExpand( pybind11::module& );
+void BindRadians( pybind11::module& );
+void BindApproximateReciprocalSquareRoot( pybind11::module& );
+void BindLinearMap( pybind11::module& );
+void BindClamp( pybind11::module& );
+void BindQuadraticRoots( pybind11::module& );
+void BindDegrees( pybind11::module& );
+void BindNormalize( pybind11::module& );
+void BindInverse( pybind11::module& );
+void BindQuaternionProduct( pybind11::module& );
+void BindApproximateSetRotate( pybind11::module& );
+void BindSphericalLinearInterpolation( pybind11::module& );
+void BindIsIdentity( pybind11::module& );
+void BindApproximateNormalize( pybind11::module& );
+void BindOrthographicProjection( pybind11::module& );
+void BindInverseAffine( pybind11::module& );
+void BindTransformAABB( pybind11::module& );
+void BindCrossProduct( pybind11::module& );
+void BindSetTranslate( pybind11::module& );
 void BindTranspose( pybind11::module& );
 void BindSetScale( pybind11::module& );
-void BindCeil( pybind11::module& );
 void BindFaceForward( pybind11::module& );
-void BindRayAABBIntersection( pybind11::module& );
+void BindApproximateLength( pybind11::module& );
 void BindLookAt( pybind11::module& );
+void BindApproximateSetRotateZ( pybind11::module& );
 void BindHasScale( pybind11::module& );
 void BindDotProduct( pybind11::module& );
-void BindIntersection( pybind11::module& );
 void BindSetRotateY( pybind11::module& );
 void BindSetRotateX( pybind11::module& );
-void BindExpand( pybind11::module& );
 void BindSetRotateZ( pybind11::module& );
 void BindDistance( pybind11::module& );
-void BindRayPosition( pybind11::module& );
 void BindTransformPoint( pybind11::module& );
-void BindRadians( pybind11::module& );
+void BindNormalizedLinearInterpolation( pybind11::module& );
 void BindCoordinateSystem( pybind11::module& );
 void BindLength( pybind11::module& );
+void BindApproximateSetRotateX( pybind11::module& );
 void BindSetIdentity( pybind11::module& );
-void BindLinearMap( pybind11::module& );
-void BindClamp( pybind11::module& );
 void BindLengthSquared( pybind11::module& );
-void BindRaySphereIntersection( pybind11::module& );
+void BindInverseRigid( pybind11::module& );
 void BindPerspectiveProjection( pybind11::module& );
 void BindSetRotate( pybind11::module& );
 void BindViewportTransform( pybind11::module& );
 void BindMatrixProduct( pybind11::module& );
 void BindTransformVector( pybind11::module& );
-void BindQuadraticRoots( pybind11::module& );
-void BindIsIdentity( pybind11::module& );
+void BindRotationQuaternion( pybind11::module& );
+void BindApproximateSetRotateY( pybind11::module& );
+void BindRayAABBIntersection( pybind11::module& );
+void BindRayPosition( pybind11::module& );
+void BindRaySphereIntersection( pybind11::module& );
+
+// Bounding volume hierarchy.
+void BindBVH( pybind11::module& );
+
+// Memory-mapped file I/O.
+void BindIO( pybind11::module& );
+
+// Batched function kernel sets.
+void BindKernels( pybind11::module& );
+
+#if defined( GM_NUMPY_UFUNCS )
+// NumPy universal functions.
+void BindUfuncs( pybind11::module& );
+#endif
 
 PYBIND11_MODULE( gm, o_module )
 {
     o_module.doc() = "GraphicsMath python module.";
 
-    // Types.
-    BindVec2f( o_module );
-    BindVec3f( o_module );
-    BindVec4f( o_module );
-    BindVec2i( o_module );
-    BindVec3i( o_module );
-    BindVec4i( o_module );
-    BindMat3f( o_module );
-    BindMat4f( o_module );
-    BindFloatRange( o_module );
-    BindIntRange( o_module );
-    BindVec2fRange( o_module );
-    BindVec3fRange( o_module );
-    BindVec4fRange( o_module );
-    BindVec2iRange( o_module );
-    BindVec3iRange( o_module );
-    BindVec4iRange( o_module );
-
-    // Functions.
-    BindLinearInterpolation( o_module );
-    BindNormalize( o_module );
-    BindInverse( o_module );
-    BindMin( o_module );
-    BindContains( o_module );
-    BindContent( o_module );
-    BindAbs( o_module );
-    BindDegrees( o_module );
-    BindTrilinearInterpolation( o_module );
-    BindOrthographicProjection( o_module );
-    BindBilinearInterpolation( o_module );
-    BindRandomNumber( o_module );
-    BindTransformAABB( o_module );
-    BindCrossProduct( o_module );
-    BindLongestAxis( o_module );
-    BindSetTranslate( o_module );
-    BindMax( o_module );
-    BindFloor( o_module );
-    BindTranspose( o_module );
-    BindSetScale( o_module );
-    BindCeil( o_module );
-    BindFaceForward( o_module );
-    BindRayAABBIntersection( o_module );
-    BindLookAt( o_module );
-    BindHasScale( o_module );
-    BindDotProduct( o_module );
-    BindIntersection( o_module );
-    BindSetRotateY( o_module );
-    BindSetRotateX( o_module );
-    BindExpand( o_module );
-    BindSetRotateZ( o_module );
-    BindDistance( o_module );
-    BindRayPosition( o_module );
-    BindTransformPoint( o_module );
-    BindRadians( o_module );
-    BindCoordinateSystem( o_module );
-    BindLength( o_module );
-    BindSetIdentity( o_module );
-    BindLinearMap( o_module );
-    BindClamp( o_module );
-    BindLengthSquared( o_module );
-    BindRaySphereIntersection( o_module );
-    BindPerspectiveProjection( o_module );
-    BindSetRotate( o_module );
-    BindViewportTransform( o_module );
-    BindMatrixProduct( o_module );
-    BindTransformVector( o_module );
-    BindQuadraticRoots( o_module );
-    BindIsIdentity( o_module );
-}
+    // Types and functions are bound into submodules by category, on first attribute access.
+    static GM_NS::LazySubmodules s_submodules;
+
+    s_submodules.Add( "vector",
+                      "Vector and matrix types.",
+                      {&BindVec2f, &BindVec3f, &BindVec4f, &BindVec2i, &BindVec3i, &BindVec4i, &BindMat3f, &BindMat4f},
+                      {"Vec2f", "Vec3f", "Vec4f", "Vec2i", "Vec3i", "Vec4i", "Mat3f", "Mat4f"},
+                      {} );
+    s_submodules.Add( "quaternion", "Quaternion types.", {&BindQuatf}, {"Quatf"}, {} );
+    s_submodules.Add(
+        "range",
+        "Range (min, max) types.",
+        {&BindFloatRange,
+         &BindIntRange,
+         &BindVec2fRange,
+         &BindVec3fRange,
+         &BindVec4fRange,
+         &BindVec2iRange,
+         &BindVec3iRange,
+         &BindVec4iRange},
+        {"FloatRange", "IntRange", "Vec2fRange", "Vec3fRange", "Vec4fRange", "Vec2iRange", "Vec3iRange", "Vec4iRange"},
+        {"vector"} );
+    s_submodules.Add( "composite", "Composite types.", {&BindRay}, {"Ray"}, {"vector"} );
+    s_submodules.Add( "array",
+                      "Array types, of contiguous elements.",
+                      {&BindFloatArray,      &BindFloatArrayView,      &BindIntArray,        &BindIntArrayView,
+                       &BindVec2fArray,      &BindVec2fArrayView,      &BindVec3fArray,      &BindVec3fArrayView,
+                       &BindVec4fArray,      &BindVec4fArrayView,      &BindVec2iArray,      &BindVec2iArrayView,
+                       &BindVec3iArray,      &BindVec3iArrayView,      &BindVec4iArray,      &BindVec4iArrayView,
+                       &BindMat3fArray,      &BindMat3fArrayView,      &BindMat4fArray,      &BindMat4fArrayView,
+                       &BindQuatfArray,      &BindQuatfArrayView,      &BindFloatRangeArray, &BindFloatRangeArrayView,
+                       &BindIntRangeArray,   &BindIntRangeArrayView,   &BindVec2fRangeArray, &BindVec2fRangeArrayView,
+                       &BindVec3fRangeArray, &BindVec3fRangeArrayView, &BindVec4fRangeArray, &BindVec4fRangeArrayView,
+                       &BindVec2iRangeArray, &BindVec2iRangeArrayView, &BindVec3iRangeArray, &BindVec3iRangeArrayView,
+                       &BindVec4iRangeArray, &BindVec4iRangeArrayView},
+                      {"FloatArray",      "FloatArrayView",      "IntArray",        "IntArrayView",
+                       "Vec2fArray",      "Vec2fArrayView",      "Vec3fArray",      "Vec3fArrayView",
+                       "Vec4fArray",      "Vec4fArrayView",      "Vec2iArray",      "Vec2iArrayView",
+                       "Vec3iArray",      "Vec3iArrayView",      "Vec4iArray",      "Vec4iArrayView",
+                       "Mat3fArray",      "Mat3fArrayView",      "Mat4fArray",      "Mat4fArrayView",
+                       "QuatfArray",      "QuatfArrayView",      "FloatRangeArray", "FloatRangeArrayView",
+                       "IntRangeArray",   "IntRangeArrayView",   "Vec2fRangeArray", "Vec2fRangeArrayView",
+                       "Vec3fRangeArray", "Vec3fRangeArrayView", "Vec4fRangeArray", "Vec4fRangeArrayView",
+                       "Vec2iRangeArray", "Vec2iRangeArrayView", "Vec3iRangeArray", "Vec3iRangeArrayView",
+                       "Vec4iRangeArray", "Vec4iRangeArrayView"},
+                      {"vector", "quaternion", "range"} );
+    s_submodules.Add( "basic",
+                      "Basic functions.",
+                      {&BindLinearInterpolation,
+                       &BindMin,
+                       &BindContains,
+                       &BindContent,
+                       &BindAbs,
+                       &BindTrilinearInterpolation,
+                       &BindBilinearInterpolation,
+                       &BindRandomNumber,
+                       &BindLongestAxis,
+                       &BindMax,
+                       &BindFloor,
+                       &BindCeil,
+                       &BindApproximateSineCosine,
+                       &BindIntersection,
+                       &BindExpand,
+                       &BindRadians,
+                       &BindApproximateReciprocalSquareRoot,
+                       &BindLinearMap,
+                       &BindClamp,
+                       &BindQuadraticRoots,
+                       &BindDegrees},
+                      {"LinearInterpolation",
+                       "LinearInterpolation_float_float_float",
+                       "LinearInterpolation_Mat3f_Mat3f_float",
+                       "LinearInterpolation_Mat4f_Mat4f_float",
+                       "LinearInterpolation_Vec2f_Vec2f_float",
+                       "LinearInterpolation_Vec3f_Vec3f_float",
+                       "LinearInterpolation_Vec4f_Vec4f_float",
+                       "LinearInterpolation_Vec2fRange_Vec2fRange_float",
+                       "LinearInterpolation_Vec3fRange_Vec3fRange_float",
+                       "LinearInterpolation_Vec4fRange_Vec4fRange_float",
+                       "LinearInterpolation_FloatRange_FloatRange_float",
+                       "Min",
+                       "Min_float_float",
+                       "Min_int_int",
+                       "Min_bool_bool",
+                       "Min_Vec2f_Vec2f",
+                       "Min_Vec3f_Vec3f",
+                       "Min_Vec4f_Vec4f",
+                       "Min_Vec2i_Vec2i",
+                       "Min_Vec3i_Vec3i",
+                       "Min_Vec4i_Vec4i",
+                       "Min_Mat3f_Mat3f",
+                       "Min_Mat4f_Mat4f",
+                       "Contains",
+                       "Contains_FloatRange_float",
+                       "Contains_FloatRange_FloatRange",
+                       "Contains_IntRange_int",
+                       "Contains_IntRange_IntRange",
+                       "Contains_Vec2fRange_Vec2f",
+                       "Contains_Vec2fRange_Vec2fRange",
+                       "Contains_Vec3fRange_Vec3f",
+                       "Contains_Vec3fRange_Vec3fRange",
+                       "Contains_Vec4fRange_Vec4f",
+                       "Contains_Vec4fRange_Vec4fRange",
+                       "Contains_Vec2iRange_Vec2i",
+                       "Contains_Vec2iRange_Vec2iRange",
+                       "Contains_Vec3iRange_Vec3i",
+                       "Contains_Vec3iRange_Vec3iRange",
+                       "Contains_Vec4iRange_Vec4i",
+                       "Contains_Vec4iRange_Vec4iRange",
+                       "Content",
+                       "Content_FloatRange",
+                       "Content_IntRange",
+                       "Content_Vec2fRange",
+                       "Content_Vec3fRange",
+                       "Content_Vec4fRange",
+                       "Content_Vec2iRange",
+                       "Content_Vec3iRange",
+                       "Content_Vec4iRange",
+                       "Abs",
+                       "Abs_float",
+                       "Abs_Vec2f",
+                       "Abs_Vec3f",
+                       "Abs_Vec4f",
+                       "Abs_Mat3f",
+                       "Abs_Mat4f",
+                       "TrilinearInterpolation",
+                       "TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f",
+                       "TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f",
+                       "TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f",
+                       "TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f",
+                       "TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f",
+                       "TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f",
+                       "BilinearInterpolation",
+                       "BilinearInterpolation_float_float_float_float_Vec2f",
+                       "BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f",
+                       "BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f",
+                       "BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f",
+                       "BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f",
+                       "BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f",
+                       "RandomNumber",
+                       "RandomNumber_FloatRange",
+                       "RandomNumber_IntRange",
+                       "LongestAxis",
+                       "LongestAxis_Vec2fRange",
+                       "LongestAxis_Vec3fRange",
+                       "LongestAxis_Vec4fRange",
+                       "LongestAxis_Vec2iRange",
+                       "LongestAxis_Vec3iRange",
+                       "LongestAxis_Vec4iRange",
+                       "Max",
+                       "Max_float_float",
+                       "Max_int_int",
+                       "Max_bool_bool",
+                       "Max_Vec2f_Vec2f",
+                       "Max_Vec3f_Vec3f",
+                       "Max_Vec4f_Vec4f",
+                       "Max_Vec2i_Vec2i",
+                       "Max_Vec3i_Vec3i",
+                       "Max_Vec4i_Vec4i",
+                       "Max_Mat3f_Mat3f",
+                       "Max_Mat4f_Mat4f",
+                       "Floor",
+                       "Floor_float",
+                       "Floor_Vec2f",
+                       "Floor_Vec3f",
+                       "Floor_Vec4f",
+                       "Floor_Mat3f",
+                       "Floor_Mat4f",
+                       "Ceil",
+                       "Ceil_float",
+                       "Ceil_Vec2f",
+                       "Ceil_Vec3f",
+                       "Ceil_Vec4f",
+                       "Ceil_Mat3f",
+                       "Ceil_Mat4f",
+                       "ApproximateSineCosine",
+                       "ApproximateSineCosine_float_float_float",
+                       "Intersection",
+                       "Intersection_FloatRange_FloatRange",
+                       "Intersection_IntRange_IntRange",
+                       "Intersection_Vec2fRange_Vec2fRange",
+                       "Intersection_Vec3fRange_Vec3fRange",
+                       "Intersection_Vec4fRange_Vec4fRange",
+                       "Intersection_Vec2iRange_Vec2iRange",
+                       "Intersection_Vec3iRange_Vec3iRange",
+                       "Intersection_Vec4iRange_Vec4iRange",
+                       "Expand",
+                       "Expand_FloatRange_FloatRange",
+                       "Expand_FloatRange_float",
+                       "Expand_IntRange_IntRange",
+                       "Expand_IntRange_int",
+                       "Expand_Vec2fRange_Vec2fRange",
+                       "Expand_Vec2fRange_Vec2f",
+                       "Expand_Vec3fRange_Vec3fRange",
+                       "Expand_Vec3fRange_Vec3f",
+                       "Expand_Vec4fRange_Vec4fRange",
+                       "Expand_Vec4fRange_Vec4f",
+                       "Expand_Vec2iRange_Vec2iRange",
+                       "Expand_Vec2iRange_Vec2i",
+                       "Expand_Vec3iRange_Vec3iRange",
+                       "Expand_Vec3iRange_Vec3i",
+                       "Expand_Vec4iRange_Vec4iRange",
+                       "Expand_Vec4iRange_Vec4i",
+                       "Radians",
+                       "Radians_float",
+                       "ApproximateReciprocalSquareRoot",
+                       "ApproximateReciprocalSquareRoot_float",
+                       "LinearMap",
+                       "LinearMap_float_FloatRange_FloatRange",
+                       "LinearMap_Mat3f_FloatRange_FloatRange",
+                       "LinearMap_Mat4f_FloatRange_FloatRange",
+                       "LinearMap_Vec2f_FloatRange_FloatRange",
+                       "LinearMap_Vec3f_FloatRange_FloatRange",
+                       "LinearMap_Vec4f_FloatRange_FloatRange",
+                       "Clamp",
+                       "Clamp_float_FloatRange",
+                       "Clamp_int_IntRange",
+                       "Clamp_Vec2f_FloatRange",
+                       "Clamp_Vec3f_FloatRange",
+                       "Clamp_Vec4f_FloatRange",
+                       "Clamp_Vec2i_IntRange",
+                       "Clamp_Vec3i_IntRange",
+                       "Clamp_Vec4i_IntRange",
+                       "Clamp_Mat3f_FloatRange",
+                       "Clamp_Mat4f_FloatRange",
+                       "QuadraticRoots",
+                       "QuadraticRoots_float_float_float_Vec2f",
+                       "Degrees",
+                       "Degrees_float"},
+                      {"vector", "range"} );
+    s_submodules.Add( "linearAlgebra",
+                      "Linear algebra functions.",
+                      {&BindNormalize,
+                       &BindInverse,
+                       &BindQuaternionProduct,
+                       &BindApproximateSetRotate,
+                       &BindSphericalLinearInterpolation,
+                       &BindIsIdentity,
+                       &BindApproximateNormalize,
+                       &BindOrthographicProjection,
+                       &BindInverseAffine,
+                       &BindTransformAABB,
+                       &BindCrossProduct,
+                       &BindSetTranslate,
+                       &BindTranspose,
+                       &BindSetScale,
+                       &BindFaceForward,
+                       &BindApproximateLength,
+                       &BindLookAt,
+                       &BindApproximateSetRotateZ,
+                       &BindHasScale,
+                       &BindDotProduct,
+                       &BindSetRotateY,
+                       &BindSetRotateX,
+                       &BindSetRotateZ,
+                       &BindDistance,
+                       &BindTransformPoint,
+                       &BindNormalizedLinearInterpolation,
+                       &BindCoordinateSystem,
+                       &BindLength,
+                       &BindApproximateSetRotateX,
+                       &BindSetIdentity,
+                       &BindLengthSquared,
+                       &BindInverseRigid,
+                       &BindPerspectiveProjection,
+                       &BindSetRotate,
+                       &BindViewportTransform,
+                       &BindMatrixProduct,
+                       &BindTransformVector,
+                       &BindRotationQuaternion,
+                       &BindApproximateSetRotateY},
+                      {"Normalize",
+                       "Normalize_Vec2f",
+                       "Normalize_Vec3f",
+                       "Normalize_Vec4f",
+                       "Normalize_Quatf",
+                       "Inverse",
+                       "Inverse_Mat3f_Mat3f",
+                       "Inverse_Mat4f_Mat4f",
+                       "QuaternionProduct",
+                       "QuaternionProduct_Quatf_Quatf",
+                       "ApproximateSetRotate",
+                       "ApproximateSetRotate_float_Vec3f_Mat4f",
+                       "ApproximateSetRotate_float_Vec3f_Quatf",
+                       "SphericalLinearInterpolation",
+                       "SphericalLinearInterpolation_Quatf_Quatf_float",
+                       "IsIdentity",
+                       "IsIdentity_Mat3f",
+                       "IsIdentity_Mat4f",
+                       "ApproximateNormalize",
+                       "ApproximateNormalize_Vec2f",
+                       "ApproximateNormalize_Vec3f",
+                       "ApproximateNormalize_Vec4f",
+                       "ApproximateNormalize_Quatf",
+                       "OrthographicProjection",
+                       "OrthographicProjection_float_float_float_float_float_float",
+                       "InverseAffine",
+                       "InverseAffine_Mat4f_Mat4f",
+                       "TransformAABB",
+                       "TransformAABB_Mat4f_Vec3fRange",
+                       "CrossProduct",
+                       "CrossProduct_Vec3f_Vec3f",
+                       "SetTranslate",
+                       "SetTranslate_Vec2f_Mat3f",
+                       "SetTranslate_Vec3f_Mat4f",
+                       "Transpose",
+                       "Transpose_Mat3f",
+                       "Transpose_Mat4f",
+                       "SetScale",
+                       "SetScale_Vec2f_Mat3f",
+                       "SetScale_Vec3f_Mat4f",
+                       "FaceForward",
+                       "FaceForward_Vec2f_Vec2f",
+                       "FaceForward_Vec3f_Vec3f",
+                       "FaceForward_Vec4f_Vec4f",
+                       "ApproximateLength",
+                       "ApproximateLength_Vec2f",
+                       "ApproximateLength_Vec3f",
+                       "ApproximateLength_Vec4f",
+                       "ApproximateLength_Quatf",
+                       "LookAt",
+                       "LookAt_Vec3f_Vec3f_Vec3f",
+                       "ApproximateSetRotateZ",
+                       "ApproximateSetRotateZ_float_Mat4f",
+                       "HasScale",
+                       "HasScale_Mat3f",
+                       "HasScale_Mat4f",
+                       "DotProduct",
+                       "DotProduct_Vec2f_Vec2f",
+                       "DotProduct_Vec3f_Vec3f",
+                       "DotProduct_Vec4f_Vec4f",
+                       "DotProduct_Quatf_Quatf",
+                       "SetRotateY",
+                       "SetRotateY_float_Mat4f",
+                       "SetRotateX",
+                       "SetRotateX_float_Mat4f",
+                       "SetRotateZ",
+                       "SetRotateZ_float_Mat4f",
+                       "Distance",
+                       "Distance_Vec2f_Vec2f",
+                       "Distance_Vec3f_Vec3f",
+                       "TransformPoint",
+                       "TransformPoint_Mat4f_Vec3f",
+                       "NormalizedLinearInterpolation",
+                       "NormalizedLinearInterpolation_Quatf_Quatf_float",
+                       "CoordinateSystem",
+                       "CoordinateSystem_Vec3f_Vec3f_Vec3f",
+                       "Length",
+                       "Length_Vec2f",
+                       "Length_Vec3f",
+                       "Length_Vec4f",
+                       "Length_Quatf",
+                       "ApproximateSetRotateX",
+                       "ApproximateSetRotateX_float_Mat4f",
+                       "SetIdentity",
+                       "SetIdentity_Mat3f",
+                       "SetIdentity_Mat4f",
+                       "LengthSquared",
+                       "LengthSquared_Vec2f",
+                       "LengthSquared_Vec3f",
+                       "LengthSquared_Vec4f",
+                       "LengthSquared_Quatf",
+                       "InverseRigid",
+                       "InverseRigid_Mat4f",
+                       "PerspectiveProjection",
+                       "PerspectiveProjection_float_float_float_float_float_float",
+                       "PerspectiveProjection_float_float_float_float",
+                       "SetRotate",
+                       "SetRotate_float_Vec3f_Mat4f",
+                       "SetRotate_float_Vec3f_Quatf",
+                       "SetRotate_Quatf_Mat3f",
+                       "SetRotate_Quatf_Mat4f",
+                       "ViewportTransform",
+                       "ViewportTransform_Vec2f_Vec2f",
+                       "MatrixProduct",
+                       "MatrixProduct_Mat3f_Mat3f",
+                       "MatrixProduct_Mat4f_Mat4f",
+                       "TransformVector",
+                       "TransformVector_Mat3f_Vec2f",
+                       "TransformVector_Mat4f_Vec3f",
+                       "TransformVector_Quatf_Vec3f",
+                       "RotationQuaternion",
+                       "RotationQuaternion_Mat3f",
+                       "RotationQuaternion_Mat4f",
+                       "ApproximateSetRotateY",
+                       "ApproximateSetRotateY_float_Mat4f"},
+                      {"vector", "quaternion", "range"} );
+    s_submodules.Add( "rayTracing",
+                      "Ray tracing functions.",
+                      {&BindRayAABBIntersection, &BindRayPosition, &BindRaySphereIntersection},
+                      {"RayAABBIntersection",
+                       "RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRange",
+                       "RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRange",
+                       "RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRange",
+                       "RayAABBIntersection_Ray_Vec3fRange_FloatRange",
+                       "RayPosition",
+                       "RayPosition_Vec2f_Vec2f_float",
+                       "RayPosition_Vec3f_Vec3f_float",
+                       "RaySphereIntersection",
+                       "RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRange"},
+                      {"vector", "range", "composite"} );
+
+    // Bounding volume hierarchy.
+    s_submodules.Add( "bvh", "Bounding volume hierarchy.", {&BindBVH}, {"BVH"}, {"vector", "range", "array"} );
+
+    // Memory-mapped file I/O, of raw and PLY files into array views.
+    s_submodules.Add( "io",
+                      "Memory-mapped raw and PLY files, viewed as gm arrays.",
+                      {&BindIO},
+                      {"MapRaw", "IterateRaw", "CreateRaw", "MapPLY", "IteratePLY", "CreatePLY"},
+                      {"array"} );
+
+#if defined( GM_NUMPY_UFUNCS )
+    // NumPy universal functions of batched functions, such that NumPy is only imported on demand.
+    s_submodules.Add( "ufuncs", "NumPy universal functions of the batchable gm functions.", {&BindUfuncs}, {}, {} );
+#endif
+
+    // Instruction set of batched function calls.
+    BindKernels( o_module );
+
+    // Threading of batched function calls.
+    o_module.def( "GetThreadCount", []() { return GM_NS::BatchThreadPool::GetInstance().GetThreadCount(); } );
+    o_module.def( "SetThreadCount", []( size_t i_threadCount ) {
+        pybind11::gil_scoped_release release;
+        GM_NS::BatchThreadPool::GetInstance().SetThreadCount( i_threadCount );
+    } );
+
+    // Bind the submodules on first attribute access.
+    s_submodules.Install( o_module );
+}
\ No newline at end of file
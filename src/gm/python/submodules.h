@@ -0,0 +1,308 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+// Submodules of the python module, bound on first attribute access.
+//
+// Binding all the types and functions, with all their overloads, dominates the time of importing the module.
+// Instead, the bindings are grouped into submodules by category, and the module level __getattr__ (PEP 562) binds
+// the submodule providing a missing attribute, after the submodules it depends on.  The attributes of a bound
+// submodule are also set on the parent module, such that gm.Vec3f is gm.vector.Vec3f, and further accesses are
+// plain attribute lookups.
+//
+// Submodules can also be imported (import gm.vector, from gm.vector import Vec3f): the module is made a package
+// without a search path, whose submodules are found by a finder on sys.meta_path, which binds them.
+//
+// A submodule is bound into a detached module object, published in the parent module and sys.modules once all of its
+// binders have run.  The binders may release the GIL (importing NumPy does), so other threads accessing the
+// submodule meanwhile wait for its binding to complete, rather than observe it partially bound.
+
+#include <pybind11/pybind11.h>
+
+#include <gm/gm.h>
+
+#include "visibility.h"
+
+#include <condition_variable>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <unordered_map>
+#include <vector>
+
+GM_NS_OPEN
+
+/// \class LazySubmodules
+///
+/// The registry of the submodules of a python module, bound on first attribute access.
+class GM_PYTHON_HIDDEN LazySubmodules
+{
+public:
+    /// Bind the types or functions of a submodule into \p o_submodule.
+    using Binder = void ( * )( pybind11::module& o_submodule );
+
+    /// Register the submodule \p i_name, bound by calling \p i_binders in order, after binding the submodules
+    /// \p i_dependencies.  The attributes \p i_attributes of the submodule are also exposed by the parent module.
+    inline void Add( const char*                i_name,
+                     const char*                i_doc,
+                     std::vector< Binder >      i_binders,
+                     std::vector< const char* > i_attributes,
+                     std::vector< const char* > i_dependencies )
+    {
+        size_t index = m_submodules.size();
+        m_submodules.push_back(
+            Submodule{i_name, i_doc, std::move( i_binders ), std::move( i_attributes ), std::move( i_dependencies )} );
+
+        m_attributes[ i_name ] = index;
+        for ( const char* attribute : m_submodules.back().attributes )
+        {
+            m_attributes[ attribute ] = index;
+        }
+    }
+
+    /// Install the __getattr__ and __dir__ hooks of \p o_module, which must outlive the registry, after its eagerly
+    /// bound attributes.  __all__ lists the lazily bound attributes too, such that star imports bind them.
+    ///
+    /// The import finder of the submodules is also appended to sys.meta_path.
+    inline void Install( pybind11::module& o_module )
+    {
+        pybind11::list names;
+        for ( auto item : o_module.attr( "__dict__" ).cast< pybind11::dict >() )
+        {
+            if ( item.first.cast< std::string >()[ 0 ] != '_' )
+            {
+                names.append( item.first );
+            }
+        }
+        for ( const Submodule& submodule : m_submodules )
+        {
+            for ( const char* attribute : submodule.attributes )
+            {
+                names.append( pybind11::str( attribute ) );
+            }
+        }
+        o_module.attr( "__all__" ) = names;
+
+        // The hooks are set directly, without chaining overloads to the __dir__ method of the module type.
+        m_module = o_module.ptr();
+        o_module.add_object( "__getattr__",
+                             pybind11::cpp_function( [this]( const std::string& i_name ) { return GetAttr( i_name ); },
+                                                     pybind11::name( "__getattr__" ) ),
+                             /* overwrite */ true );
+        o_module.add_object( "__dir__",
+                             pybind11::cpp_function( [this]() { return Dir(); }, pybind11::name( "__dir__" ) ),
+                             /* overwrite */ true );
+
+        // The finder is its own loader, creating the module of a submodule by binding it.
+        o_module.attr( "__path__" ) = pybind11::list();
+        pybind11::object finder     = pybind11::module::import( "types" ).attr( "SimpleNamespace" )();
+        finder.attr( "find_spec" )  = pybind11::cpp_function(
+            [this, finder]( const std::string& i_name, pybind11::object, pybind11::object ) {
+                return FindSpec( i_name, finder );
+            },
+            pybind11::arg( "fullname" ),
+            pybind11::arg( "path" ),
+            pybind11::arg( "target" ) = pybind11::none() );
+        finder.attr( "create_module" ) =
+            pybind11::cpp_function( [this]( pybind11::object i_spec ) { return CreateModule( i_spec ); } );
+        finder.attr( "exec_module" ) = pybind11::cpp_function( []( pybind11::object ) {} );
+        pybind11::module::import( "sys" ).attr( "meta_path" ).attr( "append" )( finder );
+    }
+
+    /// Bind the submodule \p i_name, if not already bound.
+    inline void Load( const std::string& i_name )
+    {
+        auto it = m_attributes.find( i_name );
+        if ( it != m_attributes.end() )
+        {
+            Load( m_submodules[ it->second ] );
+        }
+    }
+
+private:
+    /// The binding state of a submodule.
+    ///
+    /// A submodule whose binding failed is not bound again, as the types its binders registered with pybind11
+    /// before the failure cannot be registered twice.
+    enum class State
+    {
+        Unbound,
+        Binding,
+        Bound,
+        Failed
+    };
+
+    struct Submodule
+    {
+        const char*                name;
+        const char*                doc;
+        std::vector< Binder >      binders;
+        std::vector< const char* > attributes;
+        std::vector< const char* > dependencies;
+        State                      state = State::Unbound;
+        std::thread::id            bindingThread;
+    };
+
+    /// Bind \p io_submodule after its dependencies, and expose its attributes in the parent module.
+    ///
+    /// The binding state is only modified while holding the GIL, and under \ref m_mutex such that threads waiting
+    /// for the binding of another thread, without the GIL, observe its completion.
+    inline void Load( Submodule& io_submodule )
+    {
+        if ( io_submodule.state == State::Binding && io_submodule.bindingThread != std::this_thread::get_id() )
+        {
+            pybind11::gil_scoped_release   release;
+            std::unique_lock< std::mutex > lock( m_mutex );
+            m_condition.wait( lock, [&io_submodule] { return io_submodule.state != State::Binding; } );
+        }
+
+        if ( io_submodule.state == State::Failed )
+        {
+            throw pybind11::import_error( std::string( "Binding of the submodule '" ) + io_submodule.name +
+                                          "' failed previously." );
+        }
+
+        // Bound, or being bound by this thread, from one of its dependencies or binders.
+        if ( io_submodule.state != State::Unbound )
+        {
+            return;
+        }
+
+        SetState( io_submodule, State::Binding );
+        pybind11::module parent = pybind11::reinterpret_borrow< pybind11::module >( m_module );
+        pybind11::module submodule;
+        try
+        {
+            for ( const char* dependency : io_submodule.dependencies )
+            {
+                Load( dependency );
+            }
+
+            std::string name = parent.attr( "__name__" ).cast< std::string >() + "." + io_submodule.name;
+            submodule        = pybind11::reinterpret_steal< pybind11::module >( PyModule_New( name.c_str() ) );
+            if ( !submodule )
+            {
+                throw pybind11::error_already_set();
+            }
+            submodule.attr( "__doc__" ) = pybind11::str( io_submodule.doc );
+
+            for ( Binder binder : io_submodule.binders )
+            {
+                binder( submodule );
+            }
+        }
+        catch ( ... )
+        {
+            SetState( io_submodule, State::Failed );
+            throw;
+        }
+
+        for ( const char* attribute : io_submodule.attributes )
+        {
+            if ( !pybind11::hasattr( submodule, attribute ) )
+            {
+                continue;
+            }
+
+            // Types keep the parent module as their __module__, such that they are pickled and printed by their
+            // public name, which is resolved by a fresh process through __getattr__.
+            pybind11::object value = submodule.attr( attribute );
+            if ( PyType_Check( value.ptr() ) )
+            {
+                value.attr( "__module__" ) = parent.attr( "__name__" );
+            }
+            parent.attr( attribute ) = value;
+        }
+
+        pybind11::module::import( "sys" ).attr( "modules" )[ submodule.attr( "__name__" ) ] = submodule;
+        parent.attr( io_submodule.name )                                                    = submodule;
+        SetState( io_submodule, State::Bound );
+    }
+
+    /// Set the binding state of \p io_submodule, waking up the threads waiting for its binding to complete.
+    inline void SetState( Submodule& io_submodule, State i_state )
+    {
+        {
+            std::lock_guard< std::mutex > lock( m_mutex );
+            io_submodule.state         = i_state;
+            io_submodule.bindingThread = std::this_thread::get_id();
+        }
+        m_condition.notify_all();
+    }
+
+    /// The module level __getattr__, called for attributes missing from the module.
+    inline pybind11::object GetAttr( const std::string& i_name )
+    {
+        Load( i_name );
+
+        // The module dictionary is queried directly, as getattr would recurse into __getattr__.
+        PyObject* attribute = PyDict_GetItemString( PyModule_GetDict( m_module ), i_name.c_str() );
+        if ( attribute == nullptr )
+        {
+            PyErr_Format( PyExc_AttributeError,
+                          "module '%s' has no attribute '%s'",
+                          PyModule_GetName( m_module ),
+                          i_name.c_str() );
+            throw pybind11::error_already_set();
+        }
+
+        return pybind11::reinterpret_borrow< pybind11::object >( attribute );
+    }
+
+    /// The find_spec method of the import finder, returning the spec of the submodule of fully qualified name
+    /// \p i_name, loaded by \p i_loader, or None for other modules.
+    inline pybind11::object FindSpec( const std::string& i_name, const pybind11::object& i_loader ) const
+    {
+        std::string prefix = std::string( PyModule_GetName( m_module ) ) + ".";
+        if ( i_name.compare( 0, prefix.size(), prefix ) == 0 )
+        {
+            for ( const Submodule& submodule : m_submodules )
+            {
+                if ( i_name.compare( prefix.size(), std::string::npos, submodule.name ) == 0 )
+                {
+                    return pybind11::module::import( "importlib.machinery" ).attr( "ModuleSpec" )( i_name, i_loader );
+                }
+            }
+        }
+
+        return pybind11::none();
+    }
+
+    /// The create_module method of the import loader, binding the submodule of the spec \p i_spec.
+    inline pybind11::object CreateModule( const pybind11::object& i_spec )
+    {
+        std::string name = i_spec.attr( "name" ).cast< std::string >();
+        Load( name.substr( name.rfind( '.' ) + 1 ) );
+        return pybind11::module::import( "sys" ).attr( "modules" )[ pybind11::str( name ) ];
+    }
+
+    /// The module level __dir__, listing both the bound and the lazily bound attributes.
+    inline pybind11::list Dir() const
+    {
+        pybind11::set names;
+        for ( auto item : pybind11::reinterpret_borrow< pybind11::dict >( PyModule_GetDict( m_module ) ) )
+        {
+            names.add( item.first );
+        }
+        for ( const auto& attribute : m_attributes )
+        {
+            names.add( pybind11::str( attribute.first ) );
+        }
+
+        pybind11::list sortedNames( names );
+        sortedNames.attr( "sort" )();
+        return sortedNames;
+    }
+
+    PyObject*                                 m_module = nullptr;
+    std::vector< Submodule >                  m_submodules;
+    std::unordered_map< std::string, size_t > m_attributes;
+
+    // Guards the binding states, for the threads waiting on the binding of a submodule by another thread.
+    std::mutex              m_mutex;
+    std::condition_variable m_condition;
+};
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,62 @@
+import unittest
+import weakref
+
+import gm
+
+
+class TestFreeList(unittest.TestCase):
+    def setUp(self):
+        self.capacity = gm.Vec3f.GetFreeListCapacity()
+
+    def tearDown(self):
+        gm.Vec3f.SetFreeListCapacity(self.capacity)
+
+    def testRecycledResults(self):
+        gm.Vec3f.SetFreeListCapacity(0)
+        gm.Vec3f.SetFreeListCapacity(4)
+        a = gm.Vec3f(1, 2, 3)
+        b = gm.Vec3f(4, 5, 6)
+
+        # Results kept on deallocation are recycled by the next result, with its new value.
+        result = a + b
+        address = id(result)
+        del result
+        self.assertEqual(gm.Vec3f.GetFreeListSize(), 1)
+        result = -a
+        self.assertEqual(id(result), address)
+        self.assertEqual(gm.Vec3f.GetFreeListSize(), 0)
+        self.assertEqual(result, gm.Vec3f(-1, -2, -3))
+        self.assertEqual(a, gm.Vec3f(1, 2, 3))
+
+    def testCapacity(self):
+        gm.Vec3f.SetFreeListCapacity(2)
+        self.assertEqual(gm.Vec3f.GetFreeListCapacity(), 2)
+        results = [gm.Vec3f(index, 0, 0) * 2 for index in range(5)]
+        del results
+        self.assertEqual(gm.Vec3f.GetFreeListSize(), 2)
+
+        gm.Vec3f.SetFreeListCapacity(0)
+        self.assertEqual(gm.Vec3f.GetFreeListSize(), 0)
+        result = gm.Vec3f(1, 2, 3) * 2
+        del result
+        self.assertEqual(gm.Vec3f.GetFreeListSize(), 0)
+
+    def testWeakReferencedInstances(self):
+        gm.Vec3f.SetFreeListCapacity(0)
+        gm.Vec3f.SetFreeListCapacity(4)
+        a = gm.Vec3f(1, 2, 3)
+        result = a + a
+        reference = weakref.ref(result)
+        del result
+        self.assertIsNone(reference())
+        self.assertEqual(gm.Vec3f.GetFreeListSize(), 0)
+
+    def testMat4f(self):
+        total = gm.Mat4f(*([0] * 16))
+        for _ in range(100):
+            total = total + gm.Mat4f() * 0.5
+        self.assertEqual(total, gm.Mat4f() * 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import multiprocessing
+import subprocess
+import sys
+import textwrap
+import unittest
+
+import gm
+
+
+def ScaleChunk(view):
+    """
+    Scale the points of a chunk of a shared view in place, from a worker process.
+
+    Returns:
+        str: the name of the shared memory block the worker attached to.
+    """
+    for index in range(len(view)):
+        view[index] = view[index] * 2
+    name = view.owner.name
+    view.Release()
+    return name
+
+
+class TestSharedMemory(unittest.TestCase):
+    def testWorkerPool(self):
+        points = gm.Vec3fArrayView.CreateShared(1000)
+        owner = points.owner
+        try:
+            for index in range(len(points)):
+                points[index] = gm.Vec3f(index, index, index)
+
+            # The chunks are pickled by name, and written in place by the workers.
+            chunks = [points[start : start + 250] for start in range(0, 1000, 250)]
+            with multiprocessing.Pool(4) as pool:
+                names = pool.map(ScaleChunk, chunks)
+
+            self.assertEqual(set(names), {owner.name})
+            for index in (0, 1, 499, 999):
+                self.assertEqual(points[index], gm.Vec3f(index, index, index) * 2)
+        finally:
+            chunks = None
+            points.Release()
+            owner.close()
+            owner.unlink()
+
+    def testDeleteAttachedView(self):
+        # The SharedMemory owner of an attached view must outlive its exported buffer, or its __del__ fails to
+        # close the block, and reports the error on stderr.
+        process = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                textwrap.dedent(
+                    """
+                    import gm
+                    points = gm.Vec3fArrayView.CreateShared(4)
+                    owner = points.owner
+                    attached = gm.Vec3fArrayView.AttachShared(owner.name)
+                    del attached
+                    points.Release()
+                    owner.close()
+                    owner.unlink()
+                    """
+                ),
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        self.assertEqual(process.returncode, 0)
+        self.assertEqual(process.stderr, "")
+
+    def testBatchedFunctions(self):
+        points = gm.Vec3fArrayView.CreateShared(3)
+        owner = points.owner
+        try:
+            points[0] = gm.Vec3f(3, 0, 0)
+            points[1] = gm.Vec3f(0, 4, 0)
+            points[2] = gm.Vec3f(0, 0, 5)
+            self.assertEqual(list(gm.Length(points)), [3, 4, 5])
+        finally:
+            points.Release()
+            owner.close()
+            owner.unlink()
+
+
+if __name__ == "__main__":
+    unittest.main()
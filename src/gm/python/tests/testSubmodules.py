@@ -0,0 +1,123 @@
+import subprocess
+import sys
+import textwrap
+import unittest
+
+import gm
+
+
+def RunInFreshProcess(source):
+    """
+    Run ``source`` in a fresh python process, such that no submodule is bound yet.
+
+    Returns:
+        str: the standard output of the process.
+    """
+    return subprocess.check_output(
+        [sys.executable, "-c", textwrap.dedent(source)], universal_newlines=True
+    )
+
+
+class TestSubmodules(unittest.TestCase):
+    def testImportBindsNothing(self):
+        output = RunInFreshProcess(
+            """
+            import sys
+            import gm
+            print(sorted(name for name in sys.modules if name.startswith("gm.")))
+            print("numpy" in sys.modules)
+            """
+        )
+        self.assertEqual(output.split("\n")[:2], ["[]", "False"])
+
+    def testTypeAccess(self):
+        self.assertIs(gm.Vec3f, gm.vector.Vec3f)
+        self.assertIs(gm.FloatRange, gm.range.FloatRange)
+        self.assertEqual(gm.Vec3f.__module__, "gm")
+        self.assertEqual(gm.Vec3f(1, 2, 3), gm.vector.Vec3f(1, 2, 3))
+
+    def testFunctionAccessBindsDependencies(self):
+        output = RunInFreshProcess(
+            """
+            import sys
+            import gm
+            gm.Clamp_Mat4f_FloatRange
+            print(sorted(name for name in sys.modules if name.startswith("gm.")))
+            """
+        )
+        self.assertEqual(output.strip(), "['gm.basic', 'gm.range', 'gm.vector']")
+
+    def testEachSubmoduleBindsAlone(self):
+        for name in [
+            "vector",
+            "quaternion",
+            "range",
+            "composite",
+            "array",
+            "basic",
+            "linearAlgebra",
+            "rayTracing",
+            "bvh",
+            "io",
+        ]:
+            RunInFreshProcess("import gm; gm.{name}".format(name=name))
+
+    def testImportSubmodule(self):
+        output = RunInFreshProcess(
+            """
+            import sys
+            import gm.vector
+            from gm.range import FloatRange
+            print(gm.vector.Vec3f is gm.Vec3f, FloatRange is gm.FloatRange)
+            print(sorted(name for name in sys.modules if name.startswith("gm.")))
+            """
+        )
+        self.assertEqual(
+            output.split("\n")[:2], ["True True", "['gm.range', 'gm.vector']"]
+        )
+
+        with self.assertRaises(ImportError):
+            import gm.missing
+
+    @unittest.skipUnless("ufuncs" in dir(gm), "Requires the NumPy universal functions.")
+    def testConcurrentFirstAccess(self):
+        # Importing NumPy releases the GIL while the ufuncs submodule is bound, such that the other threads must
+        # wait for its binding to complete.
+        output = RunInFreshProcess(
+            """
+            import threading
+            import gm
+
+            errors = []
+            def Access():
+                try:
+                    gm.ufuncs.DotProduct_Vec3f_Vec3f
+                except Exception as e:
+                    errors.append(repr(e))
+
+            threads = [threading.Thread(target=Access) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            print(errors)
+            """
+        )
+        self.assertEqual(output.strip(), "[]")
+
+    def testDir(self):
+        names = dir(gm)
+        self.assertIn("Vec3fArray", names)
+        self.assertIn("Min_Vec3f_Vec3f", names)
+        self.assertIn("rayTracing", names)
+        self.assertIn("GetThreadCount", names)
+        self.assertIn("Vec3fArray", gm.__all__)
+
+    def testMissingAttribute(self):
+        with self.assertRaises(AttributeError):
+            gm.Vec5f
+        self.assertFalse(hasattr(gm, "Vec5f"))
+
+
+if __name__ == "__main__":
+    unittest.main()
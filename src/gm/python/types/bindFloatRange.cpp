@@ -6,10 +6,33 @@
 
 #include <gm/types/floatRange.h>
 
+#include "serialization.h"
+
 // Python bindings for FloatRange.
 
 GM_NS_USING
 
+/// Serialize \p i_range into the fixed little-endian layout of serialization.h, the minimum then the maximum.
+static pybind11::bytes _ToBytes( const FloatRange& i_range )
+{
+    BytesWriter writer( 2 * sizeof( float ) );
+    writer.Write( &i_range.Min(), 1 );
+    writer.Write( &i_range.Max(), 1 );
+    return writer.GetBytes();
+}
+
+/// Deserialize a FloatRange from the fixed little-endian layout of serialization.h.
+static FloatRange _FromBytes( const pybind11::buffer& i_buffer )
+{
+    BytesReader reader( i_buffer );
+    reader.ExpectByteCount( 2 * sizeof( float ), "FloatRange" );
+
+    float min, max;
+    reader.Read( &min, 1 );
+    reader.Read( &max, 1 );
+    return FloatRange( min, max );
+}
+
 void BindFloatRange( pybind11::module& o_module )
 {
     pybind11::class_< FloatRange > cls( o_module, "FloatRange" );
@@ -38,4 +61,15 @@ void BindFloatRange( pybind11::module& o_module )
                                 pybind11::return_value_policy::reference_internal ),
         pybind11::cpp_function( []( FloatRange& o_range, const float& i_max ) { o_range.Max() = i_max; } ),
         "Property getter / setter for the maximum." );
+
+    // Serialization, into a fixed little-endian layout.
+    cls.def( "to_bytes", &_ToBytes );
+    cls.def_static( "from_bytes", &_FromBytes );
+
+    // Pickling, with the serialized bytes as the state.
+    cls.def( pybind11::pickle( []( const FloatRange& i_range ) { return pybind11::buffer( _ToBytes( i_range ) ); },
+                               &_FromBytes ) );
+    cls.def( "__reduce_ex__", []( const pybind11::object& i_range, int i_protocol ) {
+        return ReduceEx( i_range, i_protocol, /* outOfBand */ false );
+    } );
 }
\ No newline at end of file
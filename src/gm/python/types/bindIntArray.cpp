@@ -0,0 +1,292 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <pybind11/pybind11.h>
+
+#include <gm/types/intArray.h>
+
+#include "bufferExports.h"
+#include "serialization.h"
+
+#include <cstring>
+#include <sstream>
+
+// Python bindings for IntArray.
+
+GM_NS_USING
+
+PYBIND11_MAKE_OPAQUE( IntArray );
+
+/// Convert a (possibly negative) python index into an element offset, throwing an IndexError if out of bounds.
+static size_t _WrapIndex( pybind11::ssize_t i_index, size_t i_size )
+{
+    if ( i_index < 0 )
+    {
+        i_index += static_cast< pybind11::ssize_t >( i_size );
+    }
+
+    if ( i_index < 0 || static_cast< size_t >( i_index ) >= i_size )
+    {
+        throw pybind11::index_error();
+    }
+
+    return static_cast< size_t >( i_index );
+}
+
+/// Append the contents of a C-contiguous buffer of int(s) to the back of \p o_array,
+/// as a single block copy.
+static void _ExtendFromBuffer( IntArray& o_array, const pybind11::buffer& i_buffer )
+{
+    pybind11::buffer_info info = i_buffer.request();
+    if ( info.format != pybind11::format_descriptor< int >::format() )
+    {
+        throw pybind11::type_error( "Expected buffer of int elements, got format '" + info.format + "'." );
+    }
+
+    pybind11::ssize_t stride = info.itemsize;
+    for ( pybind11::ssize_t dim = info.ndim - 1; dim >= 0; --dim )
+    {
+        if ( info.shape[ dim ] > 1 && info.strides[ dim ] != stride )
+        {
+            throw pybind11::value_error( "Expected a C-contiguous buffer." );
+        }
+        stride *= info.shape[ dim ];
+    }
+
+    if ( info.size % 1 != 0 )
+    {
+        throw pybind11::value_error( "Expected a multiple of 1 int elements, got " + std::to_string( info.size ) +
+                                     "." );
+    }
+
+    size_t offset = o_array.size();
+    o_array.resize( offset + info.size / 1 );
+    if ( info.size > 0 )
+    {
+        std::memcpy( o_array.data() + offset, info.ptr, info.size * sizeof( int ) );
+    }
+}
+
+/// Serialize the elements of \p i_array into the fixed little-endian layout of serialization.h, as a single block
+/// copy on little-endian hosts.
+static pybind11::bytes _ToBytes( const IntArray& i_array )
+{
+    BytesWriter writer( i_array.size() * sizeof( int ) );
+    writer.Write( reinterpret_cast< const int* >( i_array.data() ), i_array.size() * 1 );
+    return writer.GetBytes();
+}
+
+/// Deserialize a IntArray from the fixed little-endian layout of serialization.h.
+static IntArray _FromBytes( const pybind11::buffer& i_buffer )
+{
+    BytesReader reader( i_buffer );
+    reader.ExpectByteCountMultiple( sizeof( int ), "IntArray" );
+
+    IntArray array( reader.GetByteCount() / sizeof( int ) );
+    reader.Read( reinterpret_cast< int* >( array.data() ), array.size() * 1 );
+    return array;
+}
+
+void BindIntArray( pybind11::module& o_module )
+{
+    pybind11::class_< IntArray > cls( o_module, "IntArray", pybind11::buffer_protocol() );
+
+    // Default initializer.
+    cls.def( pybind11::init<>() );
+
+    // Buffer initializer, copying a C-contiguous buffer of int(s) in a single block.
+    cls.def( pybind11::init( []( pybind11::buffer i_buffer ) {
+        IntArray array;
+        _ExtendFromBuffer( array, i_buffer );
+        return array;
+    } ) );
+
+    // Sized initializer, with default valued elements.
+    cls.def( pybind11::init( []( size_t i_size ) { return IntArray( i_size ); } ) );
+
+    // Initialize from an iterable of elements.
+    cls.def( pybind11::init( []( pybind11::iterable i_iterable ) {
+        IntArray array;
+        for ( pybind11::handle item : i_iterable )
+        {
+            array.push_back( item.cast< int >() );
+        }
+        return array;
+    } ) );
+
+    // Object representation.
+    cls.def( "__repr__", []( const IntArray& i_array ) {
+        std::stringstream ss;
+        ss << "gm.IntArray( [";
+        for ( size_t index = 0; index < i_array.size(); ++index )
+        {
+            if ( index > 0 )
+            {
+                ss << ", ";
+            }
+            ss << i_array[ index ];
+        }
+        ss << "] )";
+        return pybind11::str( ss.str() );
+    } );
+
+    // Number of elements.
+    cls.def( "__len__", []( const IntArray& i_array ) { return i_array.size(); } );
+
+    // Element indexed read access.
+    cls.def( "__getitem__", []( const IntArray& i_array, pybind11::ssize_t i_index ) {
+        return i_array[ _WrapIndex( i_index, i_array.size() ) ];
+    } );
+
+    // Element indexed write access.
+    cls.def( "__setitem__", []( IntArray& o_array, pybind11::ssize_t i_index, const int& i_value ) {
+        o_array[ _WrapIndex( i_index, o_array.size() ) ] = i_value;
+    } );
+
+    // Element indexed removal.
+    cls.def( "__delitem__", []( IntArray& o_array, pybind11::ssize_t i_index ) {
+        PyBufferExports< IntArray >::CheckResizable( o_array );
+        o_array.erase( o_array.begin() + _WrapIndex( i_index, o_array.size() ) );
+    } );
+
+    // Slice read access, producing a new array.
+    cls.def( "__getitem__", []( const IntArray& i_array, pybind11::slice i_slice ) {
+        size_t start, stop, step, length;
+        if ( !i_slice.compute( i_array.size(), &start, &stop, &step, &length ) )
+        {
+            throw pybind11::error_already_set();
+        }
+
+        IntArray sliced;
+        sliced.reserve( length );
+        for ( size_t index = 0; index < length; ++index, start += step )
+        {
+            sliced.push_back( i_array[ start ] );
+        }
+        return sliced;
+    } );
+
+    // Slice write access, from an array of the same length.
+    cls.def( "__setitem__", []( IntArray& o_array, pybind11::slice i_slice, const IntArray& i_values ) {
+        size_t start, stop, step, length;
+        if ( !i_slice.compute( o_array.size(), &start, &stop, &step, &length ) )
+        {
+            throw pybind11::error_already_set();
+        }
+
+        if ( length != i_values.size() )
+        {
+            throw pybind11::value_error( "Slice assignment requires an array of " + std::to_string( length ) +
+                                         " elements, got " + std::to_string( i_values.size() ) + "." );
+        }
+
+        // Assigning the array into a slice of itself would overwrite elements before reading them: copy it first.
+        const bool isSelf = &i_values == &o_array;
+        IntArray   copy;
+        if ( isSelf )
+        {
+            copy = i_values;
+        }
+
+        const IntArray& values = isSelf ? copy : i_values;
+        for ( size_t index = 0; index < length; ++index, start += step )
+        {
+            o_array[ start ] = values[ index ];
+        }
+    } );
+
+    // Element iteration.
+    cls.def(
+        "__iter__",
+        []( const IntArray& i_array ) {
+            return pybind11::make_iterator< pybind11::return_value_policy::copy >( i_array.begin(), i_array.end() );
+        },
+        pybind11::keep_alive< 0, 1 >() );
+
+    // Equality.
+    cls.def( "__eq__", []( const IntArray& i_lhs, const IntArray& i_rhs ) { return i_lhs == i_rhs; } );
+
+    // Append a single element.
+    cls.def( "append", []( IntArray& o_array, const int& i_value ) {
+        PyBufferExports< IntArray >::CheckResizable( o_array );
+        o_array.push_back( i_value );
+    } );
+
+    // Append all the elements of another array, as a single block copy.
+    cls.def( "extend", []( IntArray& o_array, const IntArray& i_array ) {
+        PyBufferExports< IntArray >::CheckResizable( o_array );
+        if ( &i_array == &o_array )
+        {
+            // The insertion would invalidate the iterators over the array itself: append its elements by index,
+            // into reserved storage.
+            const size_t size = o_array.size();
+            o_array.reserve( 2 * size );
+            for ( size_t index = 0; index < size; ++index )
+            {
+                o_array.push_back( o_array[ index ] );
+            }
+            return;
+        }
+
+        o_array.insert( o_array.end(), i_array.begin(), i_array.end() );
+    } );
+
+    // Append the contents of a C-contiguous buffer, as a single block copy.
+    cls.def( "extend", []( IntArray& o_array, const pybind11::buffer& i_buffer ) {
+        PyBufferExports< IntArray >::CheckResizable( o_array );
+        _ExtendFromBuffer( o_array, i_buffer );
+    } );
+
+    // Append the elements of an arbitrary iterable.
+    cls.def( "extend", []( IntArray& o_array, pybind11::iterable i_iterable ) {
+        PyBufferExports< IntArray >::CheckResizable( o_array );
+        for ( pybind11::handle item : i_iterable )
+        {
+            o_array.push_back( item.cast< int >() );
+        }
+    } );
+
+    // Resize the number of elements.
+    cls.def( "resize", []( IntArray& o_array, size_t i_size ) {
+        PyBufferExports< IntArray >::CheckResizable( o_array );
+        o_array.resize( i_size );
+    } );
+
+    // Reserve storage for a number of elements.
+    cls.def( "reserve", []( IntArray& o_array, size_t i_size ) {
+        PyBufferExports< IntArray >::CheckResizable( o_array );
+        o_array.reserve( i_size );
+    } );
+
+    // Remove all the elements.
+    cls.def( "clear", []( IntArray& o_array ) {
+        PyBufferExports< IntArray >::CheckResizable( o_array );
+        o_array.clear();
+    } );
+
+    // Buffer protocol, exposing the element storage as a (N) int buffer without copying.
+    cls.def_buffer( []( IntArray& o_array ) -> pybind11::buffer_info {
+        return pybind11::buffer_info( reinterpret_cast< int* >( o_array.data() ),
+                                      sizeof( int ),
+                                      pybind11::format_descriptor< int >::format(),
+                                      1,
+                                      {static_cast< pybind11::ssize_t >( o_array.size() )},
+                                      {sizeof( int ) * 1} );
+    } );
+
+    // Count the live buffer exports, such that the array cannot be resized while its storage is exported.
+    PyBufferExports< IntArray >::Install( cls );
+
+    // Serialization, into a fixed little-endian layout.
+    cls.def( "to_bytes", &_ToBytes );
+    cls.def_static( "from_bytes", &_FromBytes );
+
+    // Pickling, with the serialized bytes as the state, or with the element storage as an out-of-band buffer from
+    // pickle protocol 5.
+    cls.def( pybind11::pickle( []( const IntArray& i_array ) { return pybind11::buffer( _ToBytes( i_array ) ); },
+                               &_FromBytes ) );
+    cls.def( "__reduce_ex__", []( const pybind11::object& i_array, int i_protocol ) {
+        return ReduceEx( i_array, i_protocol, /* outOfBand */ true );
+    } );
+}
\ No newline at end of file
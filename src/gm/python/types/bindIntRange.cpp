@@ -6,10 +6,33 @@
 
 #include <gm/types/intRange.h>
 
+#include "serialization.h"
+
 // Python bindings for IntRange.
 
 GM_NS_USING
 
+/// Serialize \p i_range into the fixed little-endian layout of serialization.h, the minimum then the maximum.
+static pybind11::bytes _ToBytes( const IntRange& i_range )
+{
+    BytesWriter writer( 2 * sizeof( int ) );
+    writer.Write( &i_range.Min(), 1 );
+    writer.Write( &i_range.Max(), 1 );
+    return writer.GetBytes();
+}
+
+/// Deserialize a IntRange from the fixed little-endian layout of serialization.h.
+static IntRange _FromBytes( const pybind11::buffer& i_buffer )
+{
+    BytesReader reader( i_buffer );
+    reader.ExpectByteCount( 2 * sizeof( int ), "IntRange" );
+
+    int min, max;
+    reader.Read( &min, 1 );
+    reader.Read( &max, 1 );
+    return IntRange( min, max );
+}
+
 void BindIntRange( pybind11::module& o_module )
 {
     pybind11::class_< IntRange > cls( o_module, "IntRange" );
@@ -36,4 +59,15 @@ void BindIntRange( pybind11::module& o_module )
                                               pybind11::return_value_policy::reference_internal ),
                       pybind11::cpp_function( []( IntRange& o_range, const int& i_max ) { o_range.Max() = i_max; } ),
                       "Property getter / setter for the maximum." );
+
+    // Serialization, into a fixed little-endian layout.
+    cls.def( "to_bytes", &_ToBytes );
+    cls.def_static( "from_bytes", &_FromBytes );
+
+    // Pickling, with the serialized bytes as the state.
+    cls.def( pybind11::pickle( []( const IntRange& i_range ) { return pybind11::buffer( _ToBytes( i_range ) ); },
+                               &_FromBytes ) );
+    cls.def( "__reduce_ex__", []( const pybind11::object& i_range, int i_protocol ) {
+        return ReduceEx( i_range, i_protocol, /* outOfBand */ false );
+    } );
 }
\ No newline at end of file
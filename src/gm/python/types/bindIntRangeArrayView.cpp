@@ -0,0 +1,152 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <pybind11/pybind11.h>
+
+#include <gm/types/intRangeArray.h>
+
+#include "arrayView.h"
+#include "serialization.h"
+
+// Python bindings for IntRangeArrayView, a view of IntRange elements over the storage of a python buffer.
+
+GM_NS_USING
+
+using IntRangeArrayView = PyArrayView< IntRange, int >;
+
+/// Convert a (possibly negative) python index into an element offset, throwing an IndexError if out of bounds.
+static size_t _WrapIndex( pybind11::ssize_t i_index, size_t i_size )
+{
+    if ( i_index < 0 )
+    {
+        i_index += static_cast< pybind11::ssize_t >( i_size );
+    }
+
+    if ( i_index < 0 || static_cast< size_t >( i_index ) >= i_size )
+    {
+        throw pybind11::index_error();
+    }
+
+    return static_cast< size_t >( i_index );
+}
+
+void BindIntRangeArrayView( pybind11::module& o_module )
+{
+    pybind11::class_< IntRangeArrayView > cls( o_module, "IntRangeArrayView", pybind11::buffer_protocol() );
+
+    // Buffer initializer, viewing the storage of any C-contiguous buffer of bytes or int(s) without copying.
+    cls.def( pybind11::init< const pybind11::object&, size_t, pybind11::ssize_t >(),
+             pybind11::arg( "buffer" ),
+             pybind11::arg( "byteOffset" ) = 0,
+             pybind11::arg( "size" )       = -1 );
+
+    // Size of the viewed elements, in bytes.
+    cls.attr( "elementByteSize" ) = sizeof( IntRange );
+
+    // Allocate a view in a new multiprocessing.shared_memory block.
+    cls.def_static( "CreateShared",
+                    &IntRangeArrayView::CreateShared,
+                    pybind11::arg( "size" ),
+                    pybind11::arg( "name" ) = pybind11::none() );
+
+    // Attach a view to an existing multiprocessing.shared_memory block, by name.
+    cls.def_static( "AttachShared",
+                    &IntRangeArrayView::AttachShared,
+                    pybind11::arg( "name" ),
+                    pybind11::arg( "byteOffset" ) = 0,
+                    pybind11::arg( "size" )       = -1 );
+
+    // Object representation, summarized as views are typically large.
+    cls.def( "__repr__", []( const IntRangeArrayView& i_view ) {
+        return pybind11::str( "gm.IntRangeArrayView( size=" + std::to_string( i_view.size() ) +
+                              ", readOnly=" + ( i_view.IsReadOnly() ? "True" : "False" ) + " )" );
+    } );
+
+    // Number of elements.
+    cls.def( "__len__", []( const IntRangeArrayView& i_view ) { return i_view.size(); } );
+
+    // Element indexed read access.
+    cls.def( "__getitem__", []( const IntRangeArrayView& i_view, pybind11::ssize_t i_index ) {
+        return i_view[ _WrapIndex( i_index, i_view.size() ) ];
+    } );
+
+    // Element indexed write access.
+    cls.def( "__setitem__", []( IntRangeArrayView& o_view, pybind11::ssize_t i_index, const IntRange& i_value ) {
+        if ( o_view.IsReadOnly() )
+        {
+            throw pybind11::type_error( "Cannot modify a read-only view." );
+        }
+
+        o_view[ _WrapIndex( i_index, o_view.size() ) ] = i_value;
+    } );
+
+    // Contiguous slice access, producing a view of the same storage, such as a chunk of work for a worker process.
+    cls.def( "__getitem__", []( const IntRangeArrayView& i_view, pybind11::slice i_slice ) {
+        size_t start, stop, step, length;
+        if ( !i_slice.compute( i_view.size(), &start, &stop, &step, &length ) )
+        {
+            throw pybind11::error_already_set();
+        }
+
+        if ( step != 1 && length > 1 )
+        {
+            throw pybind11::value_error( "Expected a contiguous slice, with a step of 1." );
+        }
+
+        return i_view.Slice( length > 0 ? start : 0, length );
+    } );
+
+    // Element iteration.
+    cls.def(
+        "__iter__",
+        []( const IntRangeArrayView& i_view ) {
+            return pybind11::make_iterator< pybind11::return_value_policy::copy >( i_view.data(),
+                                                                                   i_view.data() + i_view.size() );
+        },
+        pybind11::keep_alive< 0, 1 >() );
+
+    // Object owning the viewed storage.
+    cls.def_property_readonly( "owner", &IntRangeArrayView::GetOwner );
+
+    // Offset of the first element, in bytes, into the storage of the owner.
+    cls.def_property_readonly( "byteOffset", &IntRangeArrayView::GetByteOffset );
+
+    // Whether the elements are read-only.
+    cls.def_property_readonly( "readOnly", &IntRangeArrayView::IsReadOnly );
+
+    // Release the viewed buffer, such that its owner can be closed, leaving an empty view.
+    cls.def( "Release", &IntRangeArrayView::Release );
+
+    // Copy the elements into a new IntRangeArray.
+    cls.def( "Copy", []( const IntRangeArrayView& i_view ) {
+        return IntRangeArray( i_view.data(), i_view.data() + i_view.size() );
+    } );
+
+    // Serialization of the elements, into the fixed little-endian layout of IntRangeArray.to_bytes.
+    cls.def( "to_bytes", []( const IntRangeArrayView& i_view ) {
+        BytesWriter writer( i_view.size() * sizeof( IntRange ) );
+        writer.Write( reinterpret_cast< const int* >( i_view.data() ), i_view.size() * 2 );
+        return writer.GetBytes();
+    } );
+
+    // Buffer protocol, exposing the viewed storage as a (N, 2) int buffer without copying.
+    cls.def_buffer( []( IntRangeArrayView& o_view ) -> pybind11::buffer_info {
+        return pybind11::buffer_info(
+            reinterpret_cast< int* >( o_view.data() ),
+            sizeof( int ),
+            pybind11::format_descriptor< int >::format(),
+            2,
+            {static_cast< pybind11::ssize_t >( o_view.size() ), static_cast< pybind11::ssize_t >( 2 )},
+            {sizeof( int ) * 2, sizeof( int ) * 1},
+            o_view.IsReadOnly() );
+    } );
+
+    // Pickling, by name for views of shared memory, such that worker processes attach to the same storage, and by
+    // copy otherwise.
+    cls.def( pybind11::pickle( []( const IntRangeArrayView& i_view ) { return i_view.GetState(); },
+                               &IntRangeArrayView::FromState ) );
+    cls.def( "__reduce_ex__", []( const pybind11::object& i_view, int i_protocol ) {
+        return ReduceEx( i_view, i_protocol, /* outOfBand */ false );
+    } );
+}
\ No newline at end of file
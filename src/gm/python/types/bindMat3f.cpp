@@ -6,13 +6,37 @@
 
 #include <gm/types/mat3f.h>
 
+#include "freeList.h"
+#include "serialization.h"
+
+#include <cstring>
+
 // Python bindings for Mat3f.
 
 GM_NS_USING
 
+/// Serialize \p i_matrix into the fixed little-endian layout of serialization.h.
+static pybind11::bytes _ToBytes( const Mat3f& i_matrix )
+{
+    BytesWriter writer( sizeof( Mat3f ) );
+    writer.Write( i_matrix.Data(), 9 );
+    return writer.GetBytes();
+}
+
+/// Deserialize a Mat3f from the fixed little-endian layout of serialization.h.
+static Mat3f _FromBytes( const pybind11::buffer& i_buffer )
+{
+    BytesReader reader( i_buffer );
+    reader.ExpectByteCount( sizeof( Mat3f ), "Mat3f" );
+
+    Mat3f matrix;
+    reader.Read( matrix.Data(), 9 );
+    return matrix;
+}
+
 void BindMat3f( pybind11::module& o_module )
 {
-    pybind11::class_< Mat3f > cls( o_module, "Mat3f" );
+    pybind11::class_< Mat3f > cls( o_module, "Mat3f", pybind11::buffer_protocol() );
 
     // Default initializer.
     cls.def( pybind11::init<>() );
@@ -28,6 +52,45 @@ void BindMat3f( pybind11::module& o_module )
                              const float&,
                              const float& >() );
 
+    // Buffer initializer, copying the elements of any C-contiguous buffer with matching
+    // element format and count in a single block.
+    cls.def( pybind11::init( []( pybind11::buffer i_buffer ) {
+        pybind11::buffer_info info = i_buffer.request();
+        if ( info.format != pybind11::format_descriptor< float >::format() )
+        {
+            throw pybind11::type_error( "Expected buffer of float elements, got format '" + info.format + "'." );
+        }
+
+        if ( info.size != 9 )
+        {
+            throw pybind11::value_error( "Expected buffer of 9 elements, got " + std::to_string( info.size ) + "." );
+        }
+
+        pybind11::ssize_t stride = info.itemsize;
+        for ( pybind11::ssize_t dim = info.ndim - 1; dim >= 0; --dim )
+        {
+            if ( info.shape[ dim ] > 1 && info.strides[ dim ] != stride )
+            {
+                throw pybind11::value_error( "Expected a C-contiguous buffer." );
+            }
+            stride *= info.shape[ dim ];
+        }
+
+        Mat3f matrix;
+        std::memcpy( matrix.Data(), info.ptr, sizeof( Mat3f ) );
+        return matrix;
+    } ) );
+
+    // Buffer protocol, exposing the element storage without copying.
+    cls.def_buffer( []( Mat3f& o_matrix ) -> pybind11::buffer_info {
+        return pybind11::buffer_info( o_matrix.Data(),
+                                      sizeof( float ),
+                                      pybind11::format_descriptor< float >::format(),
+                                      2,
+                                      {3, 3},
+                                      {sizeof( float ) * 3, sizeof( float )} );
+    } );
+
     // Object representation.
     cls.def( "__repr__", []( const Mat3f& i_vector ) { return pybind11::str( i_vector.GetString( "gm." ) ); } );
 
@@ -85,17 +148,23 @@ void BindMat3f( pybind11::module& o_module )
         o_matrix( row, col ) = i_value;
     } );
 
+    // Recycle instances through a free list, such that the results of the arithmetic operators below are not
+    // allocated anew.
+    PyFreeList< Mat3f >::Install( cls );
+
     // Vector addition.
-    cls.def( "__add__", []( const Mat3f& i_lhs, const Mat3f& i_rhs ) { return i_lhs + i_rhs; } );
+    cls.def( "__add__",
+             []( const Mat3f& i_lhs, const Mat3f& i_rhs ) { return PyFreeList< Mat3f >::New( i_lhs + i_rhs ); } );
 
     // Vector subtraction.
-    cls.def( "__sub__", []( const Mat3f& i_lhs, const Mat3f& i_rhs ) { return i_lhs - i_rhs; } );
+    cls.def( "__sub__",
+             []( const Mat3f& i_lhs, const Mat3f& i_rhs ) { return PyFreeList< Mat3f >::New( i_lhs - i_rhs ); } );
 
     // Vector-scalar Multiplication.
-    cls.def( "__mul__", []( const Mat3f& i_lhs, float i_rhs ) { return i_lhs * i_rhs; } );
+    cls.def( "__mul__", []( const Mat3f& i_lhs, float i_rhs ) { return PyFreeList< Mat3f >::New( i_lhs * i_rhs ); } );
 
     // Scalar-vector Multiplication.
-    cls.def( "__rmul__", []( const Mat3f& i_rhs, float i_lhs ) { return i_lhs * i_rhs; } );
+    cls.def( "__rmul__", []( const Mat3f& i_rhs, float i_lhs ) { return PyFreeList< Mat3f >::New( i_lhs * i_rhs ); } );
 
     // Vector-scalar Division.
     cls.def( "__div__", []( const Mat3f& i_lhs, float i_rhs ) {
@@ -104,11 +173,11 @@ void BindMat3f( pybind11::module& o_module )
             // TODO throw pybind11::zero_division_error();
             throw pybind11::value_error();
         }
-        return i_lhs / i_rhs;
+        return PyFreeList< Mat3f >::New( i_lhs / i_rhs );
     } );
 
     // Unary negation.
-    cls.def( "__neg__", []( const Mat3f& i_vector ) { return -i_vector; } );
+    cls.def( "__neg__", []( const Mat3f& i_vector ) { return PyFreeList< Mat3f >::New( -i_vector ); } );
 
     // Equality.
     cls.def( "__eq__", []( const Mat3f& i_lhs, const Mat3f& i_rhs ) { return i_lhs == i_rhs; } );
@@ -118,4 +187,15 @@ void BindMat3f( pybind11::module& o_module )
 
     // Check for nans.
     cls.def( "HasNaNs", &Mat3f::HasNaNs );
+
+    // Serialization, into a fixed little-endian layout.
+    cls.def( "to_bytes", &_ToBytes );
+    cls.def_static( "from_bytes", &_FromBytes );
+
+    // Pickling, with the serialized bytes as the state.
+    cls.def( pybind11::pickle( []( const Mat3f& i_matrix ) { return pybind11::buffer( _ToBytes( i_matrix ) ); },
+                               &_FromBytes ) );
+    cls.def( "__reduce_ex__", []( const pybind11::object& i_matrix, int i_protocol ) {
+        return ReduceEx( i_matrix, i_protocol, /* outOfBand */ false );
+    } );
 }
\ No newline at end of file
@@ -6,13 +6,37 @@
 
 #include <gm/types/mat4f.h>
 
+#include "freeList.h"
+#include "serialization.h"
+
+#include <cstring>
+
 // Python bindings for Mat4f.
 
 GM_NS_USING
 
+/// Serialize \p i_matrix into the fixed little-endian layout of serialization.h.
+static pybind11::bytes _ToBytes( const Mat4f& i_matrix )
+{
+    BytesWriter writer( sizeof( Mat4f ) );
+    writer.Write( i_matrix.Data(), 16 );
+    return writer.GetBytes();
+}
+
+/// Deserialize a Mat4f from the fixed little-endian layout of serialization.h.
+static Mat4f _FromBytes( const pybind11::buffer& i_buffer )
+{
+    BytesReader reader( i_buffer );
+    reader.ExpectByteCount( sizeof( Mat4f ), "Mat4f" );
+
+    Mat4f matrix;
+    reader.Read( matrix.Data(), 16 );
+    return matrix;
+}
+
 void BindMat4f( pybind11::module& o_module )
 {
-    pybind11::class_< Mat4f > cls( o_module, "Mat4f" );
+    pybind11::class_< Mat4f > cls( o_module, "Mat4f", pybind11::buffer_protocol() );
 
     // Default initializer.
     cls.def( pybind11::init<>() );
@@ -35,6 +59,45 @@ void BindMat4f( pybind11::module& o_module )
                              const float&,
                              const float& >() );
 
+    // Buffer initializer, copying the elements of any C-contiguous buffer with matching
+    // element format and count in a single block.
+    cls.def( pybind11::init( []( pybind11::buffer i_buffer ) {
+        pybind11::buffer_info info = i_buffer.request();
+        if ( info.format != pybind11::format_descriptor< float >::format() )
+        {
+            throw pybind11::type_error( "Expected buffer of float elements, got format '" + info.format + "'." );
+        }
+
+        if ( info.size != 16 )
+        {
+            throw pybind11::value_error( "Expected buffer of 16 elements, got " + std::to_string( info.size ) + "." );
+        }
+
+        pybind11::ssize_t stride = info.itemsize;
+        for ( pybind11::ssize_t dim = info.ndim - 1; dim >= 0; --dim )
+        {
+            if ( info.shape[ dim ] > 1 && info.strides[ dim ] != stride )
+            {
+                throw pybind11::value_error( "Expected a C-contiguous buffer." );
+            }
+            stride *= info.shape[ dim ];
+        }
+
+        Mat4f matrix;
+        std::memcpy( matrix.Data(), info.ptr, sizeof( Mat4f ) );
+        return matrix;
+    } ) );
+
+    // Buffer protocol, exposing the element storage without copying.
+    cls.def_buffer( []( Mat4f& o_matrix ) -> pybind11::buffer_info {
+        return pybind11::buffer_info( o_matrix.Data(),
+                                      sizeof( float ),
+                                      pybind11::format_descriptor< float >::format(),
+                                      2,
+                                      {4, 4},
+                                      {sizeof( float ) * 4, sizeof( float )} );
+    } );
+
     // Object representation.
     cls.def( "__repr__", []( const Mat4f& i_vector ) { return pybind11::str( i_vector.GetString( "gm." ) ); } );
 
@@ -92,17 +155,23 @@ void BindMat4f( pybind11::module& o_module )
         o_matrix( row, col ) = i_value;
     } );
 
+    // Recycle instances through a free list, such that the results of the arithmetic operators below are not
+    // allocated anew.
+    PyFreeList< Mat4f >::Install( cls );
+
     // Vector addition.
-    cls.def( "__add__", []( const Mat4f& i_lhs, const Mat4f& i_rhs ) { return i_lhs + i_rhs; } );
+    cls.def( "__add__",
+             []( const Mat4f& i_lhs, const Mat4f& i_rhs ) { return PyFreeList< Mat4f >::New( i_lhs + i_rhs ); } );
 
     // Vector subtraction.
-    cls.def( "__sub__", []( const Mat4f& i_lhs, const Mat4f& i_rhs ) { return i_lhs - i_rhs; } );
+    cls.def( "__sub__",
+             []( const Mat4f& i_lhs, const Mat4f& i_rhs ) { return PyFreeList< Mat4f >::New( i_lhs - i_rhs ); } );
 
     // Vector-scalar Multiplication.
-    cls.def( "__mul__", []( const Mat4f& i_lhs, float i_rhs ) { return i_lhs * i_rhs; } );
+    cls.def( "__mul__", []( const Mat4f& i_lhs, float i_rhs ) { return PyFreeList< Mat4f >::New( i_lhs * i_rhs ); } );
 
     // Scalar-vector Multiplication.
-    cls.def( "__rmul__", []( const Mat4f& i_rhs, float i_lhs ) { return i_lhs * i_rhs; } );
+    cls.def( "__rmul__", []( const Mat4f& i_rhs, float i_lhs ) { return PyFreeList< Mat4f >::New( i_lhs * i_rhs ); } );
 
     // Vector-scalar Division.
     cls.def( "__div__", []( const Mat4f& i_lhs, float i_rhs ) {
@@ -111,11 +180,11 @@ void BindMat4f( pybind11::module& o_module )
             // TODO throw pybind11::zero_division_error();
             throw pybind11::value_error();
         }
-        return i_lhs / i_rhs;
+        return PyFreeList< Mat4f >::New( i_lhs / i_rhs );
     } );
 
     // Unary negation.
-    cls.def( "__neg__", []( const Mat4f& i_vector ) { return -i_vector; } );
+    cls.def( "__neg__", []( const Mat4f& i_vector ) { return PyFreeList< Mat4f >::New( -i_vector ); } );
 
     // Equality.
     cls.def( "__eq__", []( const Mat4f& i_lhs, const Mat4f& i_rhs ) { return i_lhs == i_rhs; } );
@@ -125,4 +194,15 @@ void BindMat4f( pybind11::module& o_module )
 
     // Check for nans.
     cls.def( "HasNaNs", &Mat4f::HasNaNs );
+
+    // Serialization, into a fixed little-endian layout.
+    cls.def( "to_bytes", &_ToBytes );
+    cls.def_static( "from_bytes", &_FromBytes );
+
+    // Pickling, with the serialized bytes as the state.
+    cls.def( pybind11::pickle( []( const Mat4f& i_matrix ) { return pybind11::buffer( _ToBytes( i_matrix ) ); },
+                               &_FromBytes ) );
+    cls.def( "__reduce_ex__", []( const pybind11::object& i_matrix, int i_protocol ) {
+        return ReduceEx( i_matrix, i_protocol, /* outOfBand */ false );
+    } );
 }
\ No newline at end of file
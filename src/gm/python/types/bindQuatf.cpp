@@ -0,0 +1,184 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <pybind11/pybind11.h>
+
+#include <gm/types/quatf.h>
+
+#include "freeList.h"
+#include "serialization.h"
+
+#include <cstring>
+
+// Python bindings for Quatf.
+
+GM_NS_USING
+
+/// Serialize \p i_quaternion into the fixed little-endian layout of serialization.h.
+static pybind11::bytes _ToBytes( const Quatf& i_quaternion )
+{
+    BytesWriter writer( sizeof( Quatf ) );
+    writer.Write( i_quaternion.Data(), 4 );
+    return writer.GetBytes();
+}
+
+/// Deserialize a Quatf from the fixed little-endian layout of serialization.h.
+static Quatf _FromBytes( const pybind11::buffer& i_buffer )
+{
+    BytesReader reader( i_buffer );
+    reader.ExpectByteCount( sizeof( Quatf ), "Quatf" );
+
+    Quatf quaternion;
+    reader.Read( quaternion.Data(), 4 );
+    return quaternion;
+}
+
+void BindQuatf( pybind11::module& o_module )
+{
+    pybind11::class_< Quatf > cls( o_module, "Quatf", pybind11::buffer_protocol() );
+
+    // Default initializer.
+    cls.def( pybind11::init<>() );
+
+    // Per-element initializer.
+    cls.def( pybind11::init< const float&, const float&, const float&, const float& >() );
+
+    // Buffer initializer, copying the elements of any C-contiguous buffer with matching
+    // element format and count in a single block.
+    cls.def( pybind11::init( []( pybind11::buffer i_buffer ) {
+        pybind11::buffer_info info = i_buffer.request();
+        if ( info.format != pybind11::format_descriptor< float >::format() )
+        {
+            throw pybind11::type_error( "Expected buffer of float elements, got format '" + info.format + "'." );
+        }
+
+        if ( info.size != 4 )
+        {
+            throw pybind11::value_error( "Expected buffer of 4 elements, got " + std::to_string( info.size ) + "." );
+        }
+
+        pybind11::ssize_t stride = info.itemsize;
+        for ( pybind11::ssize_t dim = info.ndim - 1; dim >= 0; --dim )
+        {
+            if ( info.shape[ dim ] > 1 && info.strides[ dim ] != stride )
+            {
+                throw pybind11::value_error( "Expected a C-contiguous buffer." );
+            }
+            stride *= info.shape[ dim ];
+        }
+
+        Quatf quaternion;
+        std::memcpy( quaternion.Data(), info.ptr, sizeof( Quatf ) );
+        return quaternion;
+    } ) );
+
+    // Buffer protocol, exposing the element storage without copying.
+    cls.def_buffer( []( Quatf& o_quaternion ) -> pybind11::buffer_info {
+        return pybind11::buffer_info( o_quaternion.Data(),
+                                      sizeof( float ),
+                                      pybind11::format_descriptor< float >::format(),
+                                      1,
+                                      {4},
+                                      {sizeof( float )} );
+    } );
+
+    // Object representation.
+    cls.def( "__repr__", []( const Quatf& i_vector ) { return pybind11::str( i_vector.GetString( "gm." ) ); } );
+
+    // Element indexed read access.
+    cls.def( "__getitem__", []( const Quatf& i_vector, size_t i_index ) {
+        if ( i_vector.GetElementSize() <= i_index )
+        {
+            throw pybind11::index_error();
+        }
+
+        return i_vector[ i_index ];
+    } );
+
+    // Element indexed write access.
+    cls.def( "__setitem__", []( Quatf& o_vector, size_t i_index, float i_value ) {
+        if ( o_vector.GetElementSize() <= i_index )
+        {
+            throw pybind11::index_error();
+        }
+
+        o_vector[ i_index ] = i_value;
+    } );
+
+    // Named X element accessor.
+    cls.def_property( "x",
+                      pybind11::cpp_function( []( Quatf& i_vector ) -> float& { return i_vector.X(); },
+                                              pybind11::return_value_policy::reference_internal ),
+                      pybind11::cpp_function( []( Quatf& o_vector, const float& i_x ) { o_vector.X() = i_x; } ),
+                      "Named property getter / setter for the element at index 0." ); // Named Y element accessor.
+    cls.def_property( "y",
+                      pybind11::cpp_function( []( Quatf& i_vector ) -> float& { return i_vector.Y(); },
+                                              pybind11::return_value_policy::reference_internal ),
+                      pybind11::cpp_function( []( Quatf& o_vector, const float& i_y ) { o_vector.Y() = i_y; } ),
+                      "Named property getter / setter for the element at index 1." ); // Named Z element accessor.
+    cls.def_property( "z",
+                      pybind11::cpp_function( []( Quatf& i_vector ) -> float& { return i_vector.Z(); },
+                                              pybind11::return_value_policy::reference_internal ),
+                      pybind11::cpp_function( []( Quatf& o_vector, const float& i_z ) { o_vector.Z() = i_z; } ),
+                      "Named property getter / setter for the element at index 2." ); // Named W element accessor.
+    cls.def_property( "w",
+                      pybind11::cpp_function( []( Quatf& i_vector ) -> float& { return i_vector.W(); },
+                                              pybind11::return_value_policy::reference_internal ),
+                      pybind11::cpp_function( []( Quatf& o_vector, const float& i_w ) { o_vector.W() = i_w; } ),
+                      "Named property getter / setter for the element at index 3." );
+
+    // Recycle instances through a free list, such that the results of the arithmetic operators below are not
+    // allocated anew.
+    PyFreeList< Quatf >::Install( cls );
+
+    // Vector addition.
+    cls.def( "__add__",
+             []( const Quatf& i_lhs, const Quatf& i_rhs ) { return PyFreeList< Quatf >::New( i_lhs + i_rhs ); } );
+
+    // Vector subtraction.
+    cls.def( "__sub__",
+             []( const Quatf& i_lhs, const Quatf& i_rhs ) { return PyFreeList< Quatf >::New( i_lhs - i_rhs ); } );
+
+    // Vector-scalar Multiplication.
+    cls.def( "__mul__", []( const Quatf& i_lhs, float i_rhs ) { return PyFreeList< Quatf >::New( i_lhs * i_rhs ); } );
+
+    // Scalar-vector Multiplication.
+    cls.def( "__rmul__", []( const Quatf& i_rhs, float i_lhs ) { return PyFreeList< Quatf >::New( i_lhs * i_rhs ); } );
+
+    // Vector-scalar Division.
+    cls.def( "__div__", []( const Quatf& i_lhs, float i_rhs ) {
+        if ( i_rhs == 0.0f )
+        {
+            // TODO throw pybind11::zero_division_error();
+            throw pybind11::value_error();
+        }
+        return PyFreeList< Quatf >::New( i_lhs / i_rhs );
+    } );
+
+    // Unary negation.
+    cls.def( "__neg__", []( const Quatf& i_vector ) { return PyFreeList< Quatf >::New( -i_vector ); } );
+
+    // Equality.
+    cls.def( "__eq__", []( const Quatf& i_lhs, const Quatf& i_rhs ) { return i_lhs == i_rhs; } );
+
+    // Element size.
+    cls.def( "GetElementSize", &Quatf::GetElementSize );
+
+    // Check for nans.
+    cls.def( "HasNaNs", &Quatf::HasNaNs );
+
+    // Serialization, into a fixed little-endian layout.
+    cls.def( "to_bytes", &_ToBytes );
+    cls.def_static( "from_bytes", &_FromBytes );
+
+    // Pickling, with the serialized bytes as the state.
+    cls.def( pybind11::pickle( []( const Quatf& i_quaternion ) { return pybind11::buffer( _ToBytes( i_quaternion ) ); },
+                               &_FromBytes ) );
+    cls.def( "__reduce_ex__", []( const pybind11::object& i_quaternion, int i_protocol ) {
+        return ReduceEx( i_quaternion, i_protocol, /* outOfBand */ false );
+    } );
+
+    // Identity element.
+    cls.def_static( "Identity", &Quatf::Identity );
+}
\ No newline at end of file
@@ -0,0 +1,86 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <pybind11/pybind11.h>
+
+#include <gm/types/ray.h>
+
+#include "serialization.h"
+
+// Python bindings for Ray.
+
+GM_NS_USING
+
+/// Serialize the elements of \p i_composite, in declaration order, into the fixed little-endian layout of
+/// serialization.h.  Derived elements are recomputed on deserialization.
+static pybind11::bytes _ToBytes( const Ray& i_composite )
+{
+    BytesWriter writer( sizeof( Vec3f ) + sizeof( Vec3f ) );
+    writer.Write( i_composite.Origin().Data(), 3 );
+    writer.Write( i_composite.Direction().Data(), 3 );
+    return writer.GetBytes();
+}
+
+/// Deserialize a Ray from the fixed little-endian layout of serialization.h.
+static Ray _FromBytes( const pybind11::buffer& i_buffer )
+{
+    BytesReader reader( i_buffer );
+    reader.ExpectByteCount( sizeof( Vec3f ) + sizeof( Vec3f ), "Ray" );
+
+    Vec3f origin;
+    reader.Read( origin.Data(), 3 );
+    Vec3f direction;
+    reader.Read( direction.Data(), 3 );
+    return Ray( origin, direction );
+}
+
+void BindRay( pybind11::module& o_module )
+{
+    // Define class.
+    pybind11::class_< Ray > cls( o_module, "Ray" );
+
+    // Default initializer.
+    cls.def( pybind11::init<>() );
+
+    // Element-wise initializer.
+    cls.def( pybind11::init< const Vec3f&, const Vec3f& >() );
+
+    // Object representation.
+    cls.def( "__repr__", []( const Ray& i_composite ) { return pybind11::str( i_composite.GetString( "gm." ) ); } );
+
+    // Property getter for the "origin" element.
+    cls.def_property_readonly(
+        "origin",
+        []( const Ray& i_composite ) { return i_composite.Origin(); },
+        "Property getter for the origin element." );
+
+    // Property getter for the "direction" element.
+    cls.def_property_readonly(
+        "direction",
+        []( const Ray& i_composite ) { return i_composite.Direction(); },
+        "Property getter for the direction element." );
+
+    // Property getter for the "inverseDirection" element.
+    cls.def_property_readonly(
+        "inverseDirection",
+        []( const Ray& i_composite ) { return i_composite.InverseDirection(); },
+        "Property getter for the inverseDirection element." );
+
+    // Property getter for the "directionSign" element.
+    cls.def_property_readonly(
+        "directionSign",
+        []( const Ray& i_composite ) { return i_composite.DirectionSign(); },
+        "Property getter for the directionSign element." );
+
+    // Serialization, into a fixed little-endian layout.
+    cls.def( "to_bytes", &_ToBytes );
+    cls.def_static( "from_bytes", &_FromBytes );
+
+    // Pickling, with the serialized bytes as the state.
+    cls.def( pybind11::pickle( []( const Ray& i_composite ) { return pybind11::buffer( _ToBytes( i_composite ) ); },
+                               &_FromBytes ) );
+    cls.def( "__reduce_ex__", []( const pybind11::object& i_composite, int i_protocol ) {
+        return ReduceEx( i_composite, i_protocol, /* outOfBand */ false );
+    } );
+}
\ No newline at end of file
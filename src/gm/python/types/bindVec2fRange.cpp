@@ -6,10 +6,33 @@
 
 #include <gm/types/vec2fRange.h>
 
+#include "serialization.h"
+
 // Python bindings for Vec2fRange.
 
 GM_NS_USING
 
+/// Serialize \p i_range into the fixed little-endian layout of serialization.h, the minimum then the maximum.
+static pybind11::bytes _ToBytes( const Vec2fRange& i_range )
+{
+    BytesWriter writer( 2 * sizeof( Vec2f ) );
+    writer.Write( i_range.Min().Data(), 2 );
+    writer.Write( i_range.Max().Data(), 2 );
+    return writer.GetBytes();
+}
+
+/// Deserialize a Vec2fRange from the fixed little-endian layout of serialization.h.
+static Vec2fRange _FromBytes( const pybind11::buffer& i_buffer )
+{
+    BytesReader reader( i_buffer );
+    reader.ExpectByteCount( 2 * sizeof( Vec2f ), "Vec2fRange" );
+
+    Vec2f min, max;
+    reader.Read( min.Data(), 2 );
+    reader.Read( max.Data(), 2 );
+    return Vec2fRange( min, max );
+}
+
 void BindVec2fRange( pybind11::module& o_module )
 {
     pybind11::class_< Vec2fRange > cls( o_module, "Vec2fRange" );
@@ -38,4 +61,15 @@ void BindVec2fRange( pybind11::module& o_module )
                                 pybind11::return_value_policy::reference_internal ),
         pybind11::cpp_function( []( Vec2fRange& o_range, const Vec2f& i_max ) { o_range.Max() = i_max; } ),
         "Property getter / setter for the maximum." );
+
+    // Serialization, into a fixed little-endian layout.
+    cls.def( "to_bytes", &_ToBytes );
+    cls.def_static( "from_bytes", &_FromBytes );
+
+    // Pickling, with the serialized bytes as the state.
+    cls.def( pybind11::pickle( []( const Vec2fRange& i_range ) { return pybind11::buffer( _ToBytes( i_range ) ); },
+                               &_FromBytes ) );
+    cls.def( "__reduce_ex__", []( const pybind11::object& i_range, int i_protocol ) {
+        return ReduceEx( i_range, i_protocol, /* outOfBand */ false );
+    } );
 }
\ No newline at end of file
@@ -6,10 +6,33 @@
 
 #include <gm/types/vec3fRange.h>
 
+#include "serialization.h"
+
 // Python bindings for Vec3fRange.
 
 GM_NS_USING
 
+/// Serialize \p i_range into the fixed little-endian layout of serialization.h, the minimum then the maximum.
+static pybind11::bytes _ToBytes( const Vec3fRange& i_range )
+{
+    BytesWriter writer( 2 * sizeof( Vec3f ) );
+    writer.Write( i_range.Min().Data(), 3 );
+    writer.Write( i_range.Max().Data(), 3 );
+    return writer.GetBytes();
+}
+
+/// Deserialize a Vec3fRange from the fixed little-endian layout of serialization.h.
+static Vec3fRange _FromBytes( const pybind11::buffer& i_buffer )
+{
+    BytesReader reader( i_buffer );
+    reader.ExpectByteCount( 2 * sizeof( Vec3f ), "Vec3fRange" );
+
+    Vec3f min, max;
+    reader.Read( min.Data(), 3 );
+    reader.Read( max.Data(), 3 );
+    return Vec3fRange( min, max );
+}
+
 void BindVec3fRange( pybind11::module& o_module )
 {
     pybind11::class_< Vec3fRange > cls( o_module, "Vec3fRange" );
@@ -38,4 +61,15 @@ void BindVec3fRange( pybind11::module& o_module )
                                 pybind11::return_value_policy::reference_internal ),
         pybind11::cpp_function( []( Vec3fRange& o_range, const Vec3f& i_max ) { o_range.Max() = i_max; } ),
         "Property getter / setter for the maximum." );
+
+    // Serialization, into a fixed little-endian layout.
+    cls.def( "to_bytes", &_ToBytes );
+    cls.def_static( "from_bytes", &_FromBytes );
+
+    // Pickling, with the serialized bytes as the state.
+    cls.def( pybind11::pickle( []( const Vec3fRange& i_range ) { return pybind11::buffer( _ToBytes( i_range ) ); },
+                               &_FromBytes ) );
+    cls.def( "__reduce_ex__", []( const pybind11::object& i_range, int i_protocol ) {
+        return ReduceEx( i_range, i_protocol, /* outOfBand */ false );
+    } );
 }
\ No newline at end of file
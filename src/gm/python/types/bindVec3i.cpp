@@ -6,13 +6,37 @@
 
 #include <gm/types/vec3i.h>
 
+#include "freeList.h"
+#include "serialization.h"
+
+#include <cstring>
+
 // Python bindings for Vec3i.
 
 GM_NS_USING
 
+/// Serialize \p i_vector into the fixed little-endian layout of serialization.h.
+static pybind11::bytes _ToBytes( const Vec3i& i_vector )
+{
+    BytesWriter writer( sizeof( Vec3i ) );
+    writer.Write( i_vector.Data(), 3 );
+    return writer.GetBytes();
+}
+
+/// Deserialize a Vec3i from the fixed little-endian layout of serialization.h.
+static Vec3i _FromBytes( const pybind11::buffer& i_buffer )
+{
+    BytesReader reader( i_buffer );
+    reader.ExpectByteCount( sizeof( Vec3i ), "Vec3i" );
+
+    Vec3i vector;
+    reader.Read( vector.Data(), 3 );
+    return vector;
+}
+
 void BindVec3i( pybind11::module& o_module )
 {
-    pybind11::class_< Vec3i > cls( o_module, "Vec3i" );
+    pybind11::class_< Vec3i > cls( o_module, "Vec3i", pybind11::buffer_protocol() );
 
     // Default initializer.
     cls.def( pybind11::init<>() );
@@ -20,6 +44,45 @@ void BindVec3i( pybind11::module& o_module )
     // Per-element initializer.
     cls.def( pybind11::init< const int&, const int&, const int& >() );
 
+    // Buffer initializer, copying the elements of any C-contiguous buffer with matching
+    // element format and count in a single block.
+    cls.def( pybind11::init( []( pybind11::buffer i_buffer ) {
+        pybind11::buffer_info info = i_buffer.request();
+        if ( info.format != pybind11::format_descriptor< int >::format() )
+        {
+            throw pybind11::type_error( "Expected buffer of int elements, got format '" + info.format + "'." );
+        }
+
+        if ( info.size != 3 )
+        {
+            throw pybind11::value_error( "Expected buffer of 3 elements, got " + std::to_string( info.size ) + "." );
+        }
+
+        pybind11::ssize_t stride = info.itemsize;
+        for ( pybind11::ssize_t dim = info.ndim - 1; dim >= 0; --dim )
+        {
+            if ( info.shape[ dim ] > 1 && info.strides[ dim ] != stride )
+            {
+                throw pybind11::value_error( "Expected a C-contiguous buffer." );
+            }
+            stride *= info.shape[ dim ];
+        }
+
+        Vec3i vector;
+        std::memcpy( vector.Data(), info.ptr, sizeof( Vec3i ) );
+        return vector;
+    } ) );
+
+    // Buffer protocol, exposing the element storage without copying.
+    cls.def_buffer( []( Vec3i& o_vector ) -> pybind11::buffer_info {
+        return pybind11::buffer_info( o_vector.Data(),
+                                      sizeof( int ),
+                                      pybind11::format_descriptor< int >::format(),
+                                      1,
+                                      {3},
+                                      {sizeof( int )} );
+    } );
+
     // Object representation.
     cls.def( "__repr__", []( const Vec3i& i_vector ) { return pybind11::str( i_vector.GetString( "gm." ) ); } );
 
@@ -60,17 +123,23 @@ void BindVec3i( pybind11::module& o_module )
                       pybind11::cpp_function( []( Vec3i& o_vector, const int& i_z ) { o_vector.Z() = i_z; } ),
                       "Named property getter / setter for the element at index 2." );
 
+    // Recycle instances through a free list, such that the results of the arithmetic operators below are not
+    // allocated anew.
+    PyFreeList< Vec3i >::Install( cls );
+
     // Vector addition.
-    cls.def( "__add__", []( const Vec3i& i_lhs, const Vec3i& i_rhs ) { return i_lhs + i_rhs; } );
+    cls.def( "__add__",
+             []( const Vec3i& i_lhs, const Vec3i& i_rhs ) { return PyFreeList< Vec3i >::New( i_lhs + i_rhs ); } );
 
     // Vector subtraction.
-    cls.def( "__sub__", []( const Vec3i& i_lhs, const Vec3i& i_rhs ) { return i_lhs - i_rhs; } );
+    cls.def( "__sub__",
+             []( const Vec3i& i_lhs, const Vec3i& i_rhs ) { return PyFreeList< Vec3i >::New( i_lhs - i_rhs ); } );
 
     // Vector-scalar Multiplication.
-    cls.def( "__mul__", []( const Vec3i& i_lhs, int i_rhs ) { return i_lhs * i_rhs; } );
+    cls.def( "__mul__", []( const Vec3i& i_lhs, int i_rhs ) { return PyFreeList< Vec3i >::New( i_lhs * i_rhs ); } );
 
     // Scalar-vector Multiplication.
-    cls.def( "__rmul__", []( const Vec3i& i_rhs, int i_lhs ) { return i_lhs * i_rhs; } );
+    cls.def( "__rmul__", []( const Vec3i& i_rhs, int i_lhs ) { return PyFreeList< Vec3i >::New( i_lhs * i_rhs ); } );
 
     // Vector-scalar Division.
     cls.def( "__div__", []( const Vec3i& i_lhs, int i_rhs ) {
@@ -79,11 +148,11 @@ void BindVec3i( pybind11::module& o_module )
             // TODO throw pybind11::zero_division_error();
             throw pybind11::value_error();
         }
-        return i_lhs / i_rhs;
+        return PyFreeList< Vec3i >::New( i_lhs / i_rhs );
     } );
 
     // Unary negation.
-    cls.def( "__neg__", []( const Vec3i& i_vector ) { return -i_vector; } );
+    cls.def( "__neg__", []( const Vec3i& i_vector ) { return PyFreeList< Vec3i >::New( -i_vector ); } );
 
     // Equality.
     cls.def( "__eq__", []( const Vec3i& i_lhs, const Vec3i& i_rhs ) { return i_lhs == i_rhs; } );
@@ -91,6 +160,14 @@ void BindVec3i( pybind11::module& o_module )
     // Element size.
     cls.def( "GetElementSize", &Vec3i::GetElementSize );
 
-    // Check for nans.
-    cls.def( "HasNaNs", &Vec3i::HasNaNs );
+    // Serialization, into a fixed little-endian layout.
+    cls.def( "to_bytes", &_ToBytes );
+    cls.def_static( "from_bytes", &_FromBytes );
+
+    // Pickling, with the serialized bytes as the state.
+    cls.def( pybind11::pickle( []( const Vec3i& i_vector ) { return pybind11::buffer( _ToBytes( i_vector ) ); },
+                               &_FromBytes ) );
+    cls.def( "__reduce_ex__", []( const pybind11::object& i_vector, int i_protocol ) {
+        return ReduceEx( i_vector, i_protocol, /* outOfBand */ false );
+    } );
 }
\ No newline at end of file
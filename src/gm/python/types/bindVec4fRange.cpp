@@ -6,10 +6,33 @@
 
 #include <gm/types/vec4fRange.h>
 
+#include "serialization.h"
+
 // Python bindings for Vec4fRange.
 
 GM_NS_USING
 
+/// Serialize \p i_range into the fixed little-endian layout of serialization.h, the minimum then the maximum.
+static pybind11::bytes _ToBytes( const Vec4fRange& i_range )
+{
+    BytesWriter writer( 2 * sizeof( Vec4f ) );
+    writer.Write( i_range.Min().Data(), 4 );
+    writer.Write( i_range.Max().Data(), 4 );
+    return writer.GetBytes();
+}
+
+/// Deserialize a Vec4fRange from the fixed little-endian layout of serialization.h.
+static Vec4fRange _FromBytes( const pybind11::buffer& i_buffer )
+{
+    BytesReader reader( i_buffer );
+    reader.ExpectByteCount( 2 * sizeof( Vec4f ), "Vec4fRange" );
+
+    Vec4f min, max;
+    reader.Read( min.Data(), 4 );
+    reader.Read( max.Data(), 4 );
+    return Vec4fRange( min, max );
+}
+
 void BindVec4fRange( pybind11::module& o_module )
 {
     pybind11::class_< Vec4fRange > cls( o_module, "Vec4fRange" );
@@ -38,4 +61,15 @@ void BindVec4fRange( pybind11::module& o_module )
                                 pybind11::return_value_policy::reference_internal ),
         pybind11::cpp_function( []( Vec4fRange& o_range, const Vec4f& i_max ) { o_range.Max() = i_max; } ),
         "Property getter / setter for the maximum." );
+
+    // Serialization, into a fixed little-endian layout.
+    cls.def( "to_bytes", &_ToBytes );
+    cls.def_static( "from_bytes", &_FromBytes );
+
+    // Pickling, with the serialized bytes as the state.
+    cls.def( pybind11::pickle( []( const Vec4fRange& i_range ) { return pybind11::buffer( _ToBytes( i_range ) ); },
+                               &_FromBytes ) );
+    cls.def( "__reduce_ex__", []( const pybind11::object& i_range, int i_protocol ) {
+        return ReduceEx( i_range, i_protocol, /* outOfBand */ false );
+    } );
 }
\ No newline at end of file
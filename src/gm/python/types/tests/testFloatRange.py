@@ -2,6 +2,7 @@
 # This file is auto-generated, please do not modify directly!
 #
 
+import pickle
 import unittest
 import gm
 
@@ -14,3 +15,21 @@ class TestFloatRange(unittest.TestCase):
         gm.FloatRange(
             float(), float(),
         )
+
+    def testToBytes(self):
+        value = gm.FloatRange(1.0, 2.0)
+        data = value.to_bytes()
+        self.assertEqual(len(data), 8)
+        copied = gm.FloatRange.from_bytes(data)
+        self.assertEqual(copied.min, value.min)
+        self.assertEqual(copied.max, value.max)
+
+        with self.assertRaises(ValueError):
+            gm.FloatRange.from_bytes(data + data)
+
+    def testPickle(self):
+        value = gm.FloatRange(1.0, 2.0)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copied = pickle.loads(pickle.dumps(value, protocol=protocol))
+            self.assertEqual(copied.min, value.min)
+            self.assertEqual(copied.max, value.max)
@@ -0,0 +1,194 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import array
+import pickle
+import struct
+import unittest
+import gm
+
+
+class TestFloatRangeArray(unittest.TestCase):
+    def testDefaultInitialization(self):
+        self.assertEqual(len(gm.FloatRangeArray()), 0)
+
+    def testListInitialization(self):
+        values = gm.FloatRangeArray(
+            [
+                gm.FloatRange(),
+                gm.FloatRange(),
+                gm.FloatRange(),
+                gm.FloatRange(),
+                gm.FloatRange(),
+            ]
+        )
+        self.assertEqual(len(values), 5)
+
+    def testSizedInitialization(self):
+        self.assertEqual(len(gm.FloatRangeArray(5)), 5)
+
+    def testAppend(self):
+        values = gm.FloatRangeArray()
+        values.append(gm.FloatRange(1.0, 2.0))
+        values.append(gm.FloatRange(2.0, 3.0))
+        self.assertEqual(
+            values,
+            gm.FloatRangeArray([gm.FloatRange(1.0, 2.0), gm.FloatRange(2.0, 3.0)]),
+        )
+
+    def testExtend(self):
+        values = gm.FloatRangeArray([gm.FloatRange(1.0, 2.0)])
+        values.extend(gm.FloatRangeArray([gm.FloatRange(2.0, 3.0)]))
+        values.extend([gm.FloatRange(3.0, 4.0)])
+        values.extend(array.array("f", [0] * 4))
+        self.assertEqual(len(values), 5)
+        self.assertEqual(
+            values[:3],
+            gm.FloatRangeArray(
+                [
+                    gm.FloatRange(1.0, 2.0),
+                    gm.FloatRange(2.0, 3.0),
+                    gm.FloatRange(3.0, 4.0),
+                ]
+            ),
+        )
+
+    def testExtendSelf(self):
+        values = gm.FloatRangeArray([gm.FloatRange(1.0, 2.0), gm.FloatRange(2.0, 3.0),])
+        values.extend(values)
+        self.assertEqual(
+            values,
+            gm.FloatRangeArray(
+                [
+                    gm.FloatRange(1.0, 2.0),
+                    gm.FloatRange(2.0, 3.0),
+                    gm.FloatRange(1.0, 2.0),
+                    gm.FloatRange(2.0, 3.0),
+                ]
+            ),
+        )
+
+    def testIndexing(self):
+        values = gm.FloatRangeArray(3)
+        values[-1] = gm.FloatRange(2.0, 3.0)
+        self.assertEqual(values[2:], gm.FloatRangeArray([gm.FloatRange(2.0, 3.0)]))
+        with self.assertRaises(IndexError):
+            values[3]
+        del values[0]
+        self.assertEqual(len(values), 2)
+
+    def testSlicing(self):
+        values = gm.FloatRangeArray(
+            [gm.FloatRange(1.0, 2.0), gm.FloatRange(2.0, 3.0), gm.FloatRange(3.0, 4.0),]
+        )
+        self.assertEqual(
+            values[::2],
+            gm.FloatRangeArray([gm.FloatRange(1.0, 2.0), gm.FloatRange(3.0, 4.0)]),
+        )
+
+        values[1:] = gm.FloatRangeArray(
+            [gm.FloatRange(1.0, 2.0), gm.FloatRange(1.0, 2.0)]
+        )
+        self.assertEqual(values[1:2], values[0:1])
+
+        with self.assertRaises(ValueError):
+            values[1:] = gm.FloatRangeArray(1)
+
+    def testSliceAssignmentSelf(self):
+        values = gm.FloatRangeArray(
+            [gm.FloatRange(1.0, 2.0), gm.FloatRange(2.0, 3.0), gm.FloatRange(3.0, 4.0),]
+        )
+        values[::-1] = values
+        self.assertEqual(
+            values,
+            gm.FloatRangeArray(
+                [
+                    gm.FloatRange(3.0, 4.0),
+                    gm.FloatRange(2.0, 3.0),
+                    gm.FloatRange(1.0, 2.0),
+                ]
+            ),
+        )
+
+    def testBufferProtocol(self):
+        values = gm.FloatRangeArray(4)
+        view = memoryview(values)
+        self.assertEqual(view.format, "f")
+        self.assertEqual(view.shape, (4, 2))
+        self.assertEqual(view.nbytes, 32)
+
+    def testBufferExportsPreventResize(self):
+        values = gm.FloatRangeArray(4)
+        view = memoryview(values)
+        for resize in (
+            lambda: values.append(gm.FloatRange(1.0, 2.0)),
+            lambda: values.extend(gm.FloatRangeArray(1)),
+            lambda: values.extend(array.array("f", [0] * 2)),
+            lambda: values.extend([gm.FloatRange(1.0, 2.0)]),
+            lambda: values.resize(10000),
+            lambda: values.reserve(10000),
+            lambda: values.clear(),
+            lambda: values.__delitem__(0),
+        ):
+            with self.assertRaises(BufferError):
+                resize()
+        self.assertEqual(len(values), 4)
+
+        # Once the export is released, the array can be resized again.
+        view.release()
+        values.resize(10000)
+        self.assertEqual(len(values), 10000)
+
+    def testBufferInitialization(self):
+        buf = array.array("f", range(6))
+        values = gm.FloatRangeArray(buf)
+        self.assertEqual(len(values), 3)
+        self.assertEqual(memoryview(values).tobytes(), buf.tobytes())
+
+    def testBufferInitializationMismatch(self):
+        with self.assertRaises(TypeError):
+            gm.FloatRangeArray(array.array("d", [0.0] * 2))
+
+        with self.assertRaises(ValueError):
+            gm.FloatRangeArray(array.array("f", [0] * 3))
+
+    def testPickle(self):
+        values = gm.FloatRangeArray([gm.FloatRange(1.0, 2.0), gm.FloatRange(2.0, 3.0),])
+        self.assertEqual(pickle.loads(pickle.dumps(values)), values)
+
+    def testPickleProtocols(self):
+        values = gm.FloatRangeArray([gm.FloatRange(1.0, 2.0), gm.FloatRange(2.0, 3.0),])
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(
+                pickle.loads(pickle.dumps(values, protocol=protocol)), values
+            )
+
+    @unittest.skipIf(pickle.HIGHEST_PROTOCOL < 5, "Requires pickle protocol 5.")
+    def testPickleOutOfBand(self):
+        values = gm.FloatRangeArray(array.array("f", range(6)))
+        buffers = []
+        data = pickle.dumps(values, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(pickle.loads(data, buffers=buffers), values)
+
+        # The out-of-band buffers can be transferred as raw bytes.
+        self.assertEqual(
+            pickle.loads(data, buffers=[buffer.raw().tobytes() for buffer in buffers]),
+            values,
+        )
+
+        empty = gm.FloatRangeArray()
+        self.assertEqual(pickle.loads(pickle.dumps(empty, protocol=5)), empty)
+
+    def testToBytes(self):
+        values = gm.FloatRangeArray(array.array("f", range(6)))
+        data = values.to_bytes()
+        self.assertEqual(data, struct.pack("<6f", *range(6)))
+        self.assertEqual(gm.FloatRangeArray.from_bytes(data), values)
+        self.assertEqual(gm.FloatRangeArray.from_bytes(bytearray(data)), values)
+        self.assertEqual(len(gm.FloatRangeArray.from_bytes(b"")), 0)
+
+    def testFromBytesMismatch(self):
+        with self.assertRaises(ValueError):
+            gm.FloatRangeArray.from_bytes(b"\x00" * 9)
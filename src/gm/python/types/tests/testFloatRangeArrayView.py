@@ -0,0 +1,86 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import array
+import pickle
+import unittest
+import gm
+
+
+class TestFloatRangeArrayView(unittest.TestCase):
+    def testBufferView(self):
+        buf = array.array("f", range(6))
+        view = gm.FloatRangeArrayView(buf)
+        self.assertEqual(len(view), 3)
+        self.assertEqual(gm.FloatRangeArrayView.elementByteSize, 8)
+        self.assertFalse(view.readOnly)
+        self.assertIs(view.owner, buf)
+        self.assertEqual(view.Copy(), gm.FloatRangeArray(buf))
+
+        # Writes through the view are visible in the viewed buffer.
+        view[2] = view[0]
+        self.assertEqual(buf[4:].tolist(), buf[:2].tolist())
+
+    def testBytesView(self):
+        data = gm.FloatRangeArray(array.array("f", range(6))).to_bytes()
+        view = gm.FloatRangeArrayView(data)
+        self.assertTrue(view.readOnly)
+        self.assertEqual(view.to_bytes(), data)
+        with self.assertRaises(TypeError):
+            view[0] = view[1]
+
+    def testOffsetAndSize(self):
+        buf = array.array("f", range(6))
+        view = gm.FloatRangeArrayView(buf, byteOffset=8, size=1)
+        self.assertEqual(len(view), 1)
+        self.assertEqual(view.byteOffset, 8)
+        self.assertEqual(memoryview(view).tobytes(), buf[2:4].tobytes())
+
+        with self.assertRaises(ValueError):
+            gm.FloatRangeArrayView(buf, byteOffset=8, size=3)
+        with self.assertRaises(TypeError):
+            gm.FloatRangeArrayView(array.array("d", [0.0] * 2))
+
+    def testSlice(self):
+        buf = array.array("f", range(6))
+        view = gm.FloatRangeArrayView(buf)[1:]
+        self.assertEqual(len(view), 2)
+        self.assertEqual(view.byteOffset, 8)
+        self.assertEqual(memoryview(view).tobytes(), buf[2:].tobytes())
+        with self.assertRaises(ValueError):
+            gm.FloatRangeArrayView(buf)[::2]
+
+    def testRelease(self):
+        view = gm.FloatRangeArrayView(array.array("f", range(6)))
+        view.Release()
+        self.assertEqual(len(view), 0)
+        self.assertIsNone(view.owner)
+
+    def testSharedMemory(self):
+        view = gm.FloatRangeArrayView.CreateShared(3)
+        try:
+            memoryview(view).cast("B")[:] = array.array("f", range(6)).tobytes()
+            attached = gm.FloatRangeArrayView.AttachShared(view.owner.name, size=3)
+            self.assertEqual(attached.Copy(), view.Copy())
+
+            # Shared views are pickled by name.
+            copied = pickle.loads(pickle.dumps(view[1:]))
+            self.assertEqual(copied.owner.name, view.owner.name)
+            self.assertEqual(copied.Copy(), view[1:].Copy())
+
+            for sharedView in (attached, copied):
+                owner = sharedView.owner
+                sharedView.Release()
+                owner.close()
+        finally:
+            owner = view.owner
+            view.Release()
+            owner.close()
+            owner.unlink()
+
+    def testPickleCopy(self):
+        view = gm.FloatRangeArrayView(array.array("f", range(6)))
+        copied = pickle.loads(pickle.dumps(view))
+        self.assertFalse(copied.readOnly)
+        self.assertEqual(copied.Copy(), view.Copy())
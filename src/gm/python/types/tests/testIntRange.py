@@ -2,6 +2,7 @@
 # This file is auto-generated, please do not modify directly!
 #
 
+import pickle
 import unittest
 import gm
 
@@ -14,3 +15,21 @@ class TestIntRange(unittest.TestCase):
         gm.IntRange(
             int(), int(),
         )
+
+    def testToBytes(self):
+        value = gm.IntRange(1, 2)
+        data = value.to_bytes()
+        self.assertEqual(len(data), 8)
+        copied = gm.IntRange.from_bytes(data)
+        self.assertEqual(copied.min, value.min)
+        self.assertEqual(copied.max, value.max)
+
+        with self.assertRaises(ValueError):
+            gm.IntRange.from_bytes(data + data)
+
+    def testPickle(self):
+        value = gm.IntRange(1, 2)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copied = pickle.loads(pickle.dumps(value, protocol=protocol))
+            self.assertEqual(copied.min, value.min)
+            self.assertEqual(copied.max, value.max)
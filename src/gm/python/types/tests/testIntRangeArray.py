@@ -0,0 +1,176 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import array
+import pickle
+import struct
+import unittest
+import gm
+
+
+class TestIntRangeArray(unittest.TestCase):
+    def testDefaultInitialization(self):
+        self.assertEqual(len(gm.IntRangeArray()), 0)
+
+    def testListInitialization(self):
+        values = gm.IntRangeArray(
+            [gm.IntRange(), gm.IntRange(), gm.IntRange(), gm.IntRange(), gm.IntRange()]
+        )
+        self.assertEqual(len(values), 5)
+
+    def testSizedInitialization(self):
+        self.assertEqual(len(gm.IntRangeArray(5)), 5)
+
+    def testAppend(self):
+        values = gm.IntRangeArray()
+        values.append(gm.IntRange(1, 2))
+        values.append(gm.IntRange(2, 3))
+        self.assertEqual(
+            values, gm.IntRangeArray([gm.IntRange(1, 2), gm.IntRange(2, 3)])
+        )
+
+    def testExtend(self):
+        values = gm.IntRangeArray([gm.IntRange(1, 2)])
+        values.extend(gm.IntRangeArray([gm.IntRange(2, 3)]))
+        values.extend([gm.IntRange(3, 4)])
+        values.extend(array.array("i", [0] * 4))
+        self.assertEqual(len(values), 5)
+        self.assertEqual(
+            values[:3],
+            gm.IntRangeArray(
+                [gm.IntRange(1, 2), gm.IntRange(2, 3), gm.IntRange(3, 4),]
+            ),
+        )
+
+    def testExtendSelf(self):
+        values = gm.IntRangeArray([gm.IntRange(1, 2), gm.IntRange(2, 3),])
+        values.extend(values)
+        self.assertEqual(
+            values,
+            gm.IntRangeArray(
+                [
+                    gm.IntRange(1, 2),
+                    gm.IntRange(2, 3),
+                    gm.IntRange(1, 2),
+                    gm.IntRange(2, 3),
+                ]
+            ),
+        )
+
+    def testIndexing(self):
+        values = gm.IntRangeArray(3)
+        values[-1] = gm.IntRange(2, 3)
+        self.assertEqual(values[2:], gm.IntRangeArray([gm.IntRange(2, 3)]))
+        with self.assertRaises(IndexError):
+            values[3]
+        del values[0]
+        self.assertEqual(len(values), 2)
+
+    def testSlicing(self):
+        values = gm.IntRangeArray(
+            [gm.IntRange(1, 2), gm.IntRange(2, 3), gm.IntRange(3, 4),]
+        )
+        self.assertEqual(
+            values[::2], gm.IntRangeArray([gm.IntRange(1, 2), gm.IntRange(3, 4)])
+        )
+
+        values[1:] = gm.IntRangeArray([gm.IntRange(1, 2), gm.IntRange(1, 2)])
+        self.assertEqual(values[1:2], values[0:1])
+
+        with self.assertRaises(ValueError):
+            values[1:] = gm.IntRangeArray(1)
+
+    def testSliceAssignmentSelf(self):
+        values = gm.IntRangeArray(
+            [gm.IntRange(1, 2), gm.IntRange(2, 3), gm.IntRange(3, 4),]
+        )
+        values[::-1] = values
+        self.assertEqual(
+            values,
+            gm.IntRangeArray(
+                [gm.IntRange(3, 4), gm.IntRange(2, 3), gm.IntRange(1, 2),]
+            ),
+        )
+
+    def testBufferProtocol(self):
+        values = gm.IntRangeArray(4)
+        view = memoryview(values)
+        self.assertEqual(view.format, "i")
+        self.assertEqual(view.shape, (4, 2))
+        self.assertEqual(view.nbytes, 32)
+
+    def testBufferExportsPreventResize(self):
+        values = gm.IntRangeArray(4)
+        view = memoryview(values)
+        for resize in (
+            lambda: values.append(gm.IntRange(1, 2)),
+            lambda: values.extend(gm.IntRangeArray(1)),
+            lambda: values.extend(array.array("i", [0] * 2)),
+            lambda: values.extend([gm.IntRange(1, 2)]),
+            lambda: values.resize(10000),
+            lambda: values.reserve(10000),
+            lambda: values.clear(),
+            lambda: values.__delitem__(0),
+        ):
+            with self.assertRaises(BufferError):
+                resize()
+        self.assertEqual(len(values), 4)
+
+        # Once the export is released, the array can be resized again.
+        view.release()
+        values.resize(10000)
+        self.assertEqual(len(values), 10000)
+
+    def testBufferInitialization(self):
+        buf = array.array("i", range(6))
+        values = gm.IntRangeArray(buf)
+        self.assertEqual(len(values), 3)
+        self.assertEqual(memoryview(values).tobytes(), buf.tobytes())
+
+    def testBufferInitializationMismatch(self):
+        with self.assertRaises(TypeError):
+            gm.IntRangeArray(array.array("d", [0.0] * 2))
+
+        with self.assertRaises(ValueError):
+            gm.IntRangeArray(array.array("i", [0] * 3))
+
+    def testPickle(self):
+        values = gm.IntRangeArray([gm.IntRange(1, 2), gm.IntRange(2, 3),])
+        self.assertEqual(pickle.loads(pickle.dumps(values)), values)
+
+    def testPickleProtocols(self):
+        values = gm.IntRangeArray([gm.IntRange(1, 2), gm.IntRange(2, 3),])
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(
+                pickle.loads(pickle.dumps(values, protocol=protocol)), values
+            )
+
+    @unittest.skipIf(pickle.HIGHEST_PROTOCOL < 5, "Requires pickle protocol 5.")
+    def testPickleOutOfBand(self):
+        values = gm.IntRangeArray(array.array("i", range(6)))
+        buffers = []
+        data = pickle.dumps(values, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(pickle.loads(data, buffers=buffers), values)
+
+        # The out-of-band buffers can be transferred as raw bytes.
+        self.assertEqual(
+            pickle.loads(data, buffers=[buffer.raw().tobytes() for buffer in buffers]),
+            values,
+        )
+
+        empty = gm.IntRangeArray()
+        self.assertEqual(pickle.loads(pickle.dumps(empty, protocol=5)), empty)
+
+    def testToBytes(self):
+        values = gm.IntRangeArray(array.array("i", range(6)))
+        data = values.to_bytes()
+        self.assertEqual(data, struct.pack("<6i", *range(6)))
+        self.assertEqual(gm.IntRangeArray.from_bytes(data), values)
+        self.assertEqual(gm.IntRangeArray.from_bytes(bytearray(data)), values)
+        self.assertEqual(len(gm.IntRangeArray.from_bytes(b"")), 0)
+
+    def testFromBytesMismatch(self):
+        with self.assertRaises(ValueError):
+            gm.IntRangeArray.from_bytes(b"\x00" * 9)
@@ -2,6 +2,9 @@
 # This file is auto-generated, please do not modify directly!
 #
 
+import array
+import pickle
+import struct
 import unittest
 import gm
 
@@ -47,6 +50,52 @@ class TestMat3f(unittest.TestCase):
         self.assertAlmostEqual(matrix[7], 14.0)
         self.assertAlmostEqual(matrix[8], 16.0)
 
+    def testBufferProtocol(self):
+        matrix = gm.Mat3f(0.0, 2.0, 4.0, 6.0, 8.0, 10.0, 12.0, 14.0, 16.0)
+        view = memoryview(matrix)
+        self.assertEqual(view.format, "f")
+        self.assertEqual(view.shape, (3, 3))
+        self.assertEqual(view.nbytes, 36)
+
+        # Writes through the view are visible on the source object.
+        view[0, 0] = 7.0
+        self.assertEqual(matrix[0], 7.0)
+
+    def testBufferInitialization(self):
+        buf = array.array("f", [0.0, 2.0, 4.0, 6.0, 8.0, 10.0, 12.0, 14.0, 16.0])
+        self.assertEqual(
+            gm.Mat3f(buf), gm.Mat3f(0.0, 2.0, 4.0, 6.0, 8.0, 10.0, 12.0, 14.0, 16.0)
+        )
+
+        # Round trip through another instance.
+        matrix = gm.Mat3f(0.0, 2.0, 4.0, 6.0, 8.0, 10.0, 12.0, 14.0, 16.0)
+        self.assertEqual(gm.Mat3f(matrix), matrix)
+
+    def testBufferInitializationMismatch(self):
+        with self.assertRaises(TypeError):
+            gm.Mat3f(array.array("d", [0.0] * 9))
+
+        with self.assertRaises(ValueError):
+            gm.Mat3f(array.array("f", [0] * 10))
+
+    def testToBytes(self):
+        matrix = gm.Mat3f(0.0, 2.0, 4.0, 6.0, 8.0, 10.0, 12.0, 14.0, 16.0)
+        data = matrix.to_bytes()
+        self.assertEqual(
+            data, struct.pack("<9f", *[matrix[index] for index in range(9)])
+        )
+        self.assertEqual(gm.Mat3f.from_bytes(data), matrix)
+
+        with self.assertRaises(ValueError):
+            gm.Mat3f.from_bytes(data[:-1])
+
+    def testPickle(self):
+        matrix = gm.Mat3f(0.0, 2.0, 4.0, 6.0, 8.0, 10.0, 12.0, 14.0, 16.0)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(
+                pickle.loads(pickle.dumps(matrix, protocol=protocol)), matrix
+            )
+
     def testMatrixElementReadAccess(self):
         matrix = gm.Mat3f(0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0)
 
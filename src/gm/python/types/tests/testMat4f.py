@@ -2,6 +2,9 @@
 # This file is auto-generated, please do not modify directly!
 #
 
+import array
+import pickle
+import struct
 import unittest
 import gm
 
@@ -122,6 +125,158 @@ class TestMat4f(unittest.TestCase):
         self.assertAlmostEqual(matrix[14], 28.0)
         self.assertAlmostEqual(matrix[15], 30.0)
 
+    def testBufferProtocol(self):
+        matrix = gm.Mat4f(
+            0.0,
+            2.0,
+            4.0,
+            6.0,
+            8.0,
+            10.0,
+            12.0,
+            14.0,
+            16.0,
+            18.0,
+            20.0,
+            22.0,
+            24.0,
+            26.0,
+            28.0,
+            30.0,
+        )
+        view = memoryview(matrix)
+        self.assertEqual(view.format, "f")
+        self.assertEqual(view.shape, (4, 4))
+        self.assertEqual(view.nbytes, 64)
+
+        # Writes through the view are visible on the source object.
+        view[0, 0] = 7.0
+        self.assertEqual(matrix[0], 7.0)
+
+    def testBufferInitialization(self):
+        buf = array.array(
+            "f",
+            [
+                0.0,
+                2.0,
+                4.0,
+                6.0,
+                8.0,
+                10.0,
+                12.0,
+                14.0,
+                16.0,
+                18.0,
+                20.0,
+                22.0,
+                24.0,
+                26.0,
+                28.0,
+                30.0,
+            ],
+        )
+        self.assertEqual(
+            gm.Mat4f(buf),
+            gm.Mat4f(
+                0.0,
+                2.0,
+                4.0,
+                6.0,
+                8.0,
+                10.0,
+                12.0,
+                14.0,
+                16.0,
+                18.0,
+                20.0,
+                22.0,
+                24.0,
+                26.0,
+                28.0,
+                30.0,
+            ),
+        )
+
+        # Round trip through another instance.
+        matrix = gm.Mat4f(
+            0.0,
+            2.0,
+            4.0,
+            6.0,
+            8.0,
+            10.0,
+            12.0,
+            14.0,
+            16.0,
+            18.0,
+            20.0,
+            22.0,
+            24.0,
+            26.0,
+            28.0,
+            30.0,
+        )
+        self.assertEqual(gm.Mat4f(matrix), matrix)
+
+    def testBufferInitializationMismatch(self):
+        with self.assertRaises(TypeError):
+            gm.Mat4f(array.array("d", [0.0] * 16))
+
+        with self.assertRaises(ValueError):
+            gm.Mat4f(array.array("f", [0] * 17))
+
+    def testToBytes(self):
+        matrix = gm.Mat4f(
+            0.0,
+            2.0,
+            4.0,
+            6.0,
+            8.0,
+            10.0,
+            12.0,
+            14.0,
+            16.0,
+            18.0,
+            20.0,
+            22.0,
+            24.0,
+            26.0,
+            28.0,
+            30.0,
+        )
+        data = matrix.to_bytes()
+        self.assertEqual(
+            data, struct.pack("<16f", *[matrix[index] for index in range(16)])
+        )
+        self.assertEqual(gm.Mat4f.from_bytes(data), matrix)
+
+        with self.assertRaises(ValueError):
+            gm.Mat4f.from_bytes(data[:-1])
+
+    def testPickle(self):
+        matrix = gm.Mat4f(
+            0.0,
+            2.0,
+            4.0,
+            6.0,
+            8.0,
+            10.0,
+            12.0,
+            14.0,
+            16.0,
+            18.0,
+            20.0,
+            22.0,
+            24.0,
+            26.0,
+            28.0,
+            30.0,
+        )
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(
+                pickle.loads(pickle.dumps(matrix, protocol=protocol)), matrix
+            )
+
     def testMatrixElementReadAccess(self):
         matrix = gm.Mat4f(
             0.0,
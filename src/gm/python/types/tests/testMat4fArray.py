@@ -0,0 +1,884 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import array
+import pickle
+import struct
+import unittest
+import gm
+
+
+class TestMat4fArray(unittest.TestCase):
+    def testDefaultInitialization(self):
+        self.assertEqual(len(gm.Mat4fArray()), 0)
+
+    def testListInitialization(self):
+        values = gm.Mat4fArray(
+            [gm.Mat4f(), gm.Mat4f(), gm.Mat4f(), gm.Mat4f(), gm.Mat4f()]
+        )
+        self.assertEqual(len(values), 5)
+
+    def testSizedInitialization(self):
+        self.assertEqual(len(gm.Mat4fArray(5)), 5)
+
+    def testAppend(self):
+        values = gm.Mat4fArray()
+        values.append(
+            gm.Mat4f(
+                0.0,
+                1.0,
+                2.0,
+                3.0,
+                4.0,
+                5.0,
+                6.0,
+                7.0,
+                8.0,
+                9.0,
+                10.0,
+                11.0,
+                12.0,
+                13.0,
+                14.0,
+                15.0,
+            )
+        )
+        values.append(
+            gm.Mat4f(
+                0.0,
+                2.0,
+                4.0,
+                6.0,
+                8.0,
+                10.0,
+                12.0,
+                14.0,
+                16.0,
+                18.0,
+                20.0,
+                22.0,
+                24.0,
+                26.0,
+                28.0,
+                30.0,
+            )
+        )
+        self.assertEqual(
+            values,
+            gm.Mat4fArray(
+                [
+                    gm.Mat4f(
+                        0.0,
+                        1.0,
+                        2.0,
+                        3.0,
+                        4.0,
+                        5.0,
+                        6.0,
+                        7.0,
+                        8.0,
+                        9.0,
+                        10.0,
+                        11.0,
+                        12.0,
+                        13.0,
+                        14.0,
+                        15.0,
+                    ),
+                    gm.Mat4f(
+                        0.0,
+                        2.0,
+                        4.0,
+                        6.0,
+                        8.0,
+                        10.0,
+                        12.0,
+                        14.0,
+                        16.0,
+                        18.0,
+                        20.0,
+                        22.0,
+                        24.0,
+                        26.0,
+                        28.0,
+                        30.0,
+                    ),
+                ]
+            ),
+        )
+
+    def testExtend(self):
+        values = gm.Mat4fArray(
+            [
+                gm.Mat4f(
+                    0.0,
+                    1.0,
+                    2.0,
+                    3.0,
+                    4.0,
+                    5.0,
+                    6.0,
+                    7.0,
+                    8.0,
+                    9.0,
+                    10.0,
+                    11.0,
+                    12.0,
+                    13.0,
+                    14.0,
+                    15.0,
+                )
+            ]
+        )
+        values.extend(
+            gm.Mat4fArray(
+                [
+                    gm.Mat4f(
+                        0.0,
+                        2.0,
+                        4.0,
+                        6.0,
+                        8.0,
+                        10.0,
+                        12.0,
+                        14.0,
+                        16.0,
+                        18.0,
+                        20.0,
+                        22.0,
+                        24.0,
+                        26.0,
+                        28.0,
+                        30.0,
+                    )
+                ]
+            )
+        )
+        values.extend(
+            [
+                gm.Mat4f(
+                    0.0,
+                    3.0,
+                    6.0,
+                    9.0,
+                    12.0,
+                    15.0,
+                    18.0,
+                    21.0,
+                    24.0,
+                    27.0,
+                    30.0,
+                    33.0,
+                    36.0,
+                    39.0,
+                    42.0,
+                    45.0,
+                )
+            ]
+        )
+        values.extend(array.array("f", [0] * 32))
+        self.assertEqual(len(values), 5)
+        self.assertEqual(
+            values[:3],
+            gm.Mat4fArray(
+                [
+                    gm.Mat4f(
+                        0.0,
+                        1.0,
+                        2.0,
+                        3.0,
+                        4.0,
+                        5.0,
+                        6.0,
+                        7.0,
+                        8.0,
+                        9.0,
+                        10.0,
+                        11.0,
+                        12.0,
+                        13.0,
+                        14.0,
+                        15.0,
+                    ),
+                    gm.Mat4f(
+                        0.0,
+                        2.0,
+                        4.0,
+                        6.0,
+                        8.0,
+                        10.0,
+                        12.0,
+                        14.0,
+                        16.0,
+                        18.0,
+                        20.0,
+                        22.0,
+                        24.0,
+                        26.0,
+                        28.0,
+                        30.0,
+                    ),
+                    gm.Mat4f(
+                        0.0,
+                        3.0,
+                        6.0,
+                        9.0,
+                        12.0,
+                        15.0,
+                        18.0,
+                        21.0,
+                        24.0,
+                        27.0,
+                        30.0,
+                        33.0,
+                        36.0,
+                        39.0,
+                        42.0,
+                        45.0,
+                    ),
+                ]
+            ),
+        )
+
+    def testExtendSelf(self):
+        values = gm.Mat4fArray(
+            [
+                gm.Mat4f(
+                    0.0,
+                    1.0,
+                    2.0,
+                    3.0,
+                    4.0,
+                    5.0,
+                    6.0,
+                    7.0,
+                    8.0,
+                    9.0,
+                    10.0,
+                    11.0,
+                    12.0,
+                    13.0,
+                    14.0,
+                    15.0,
+                ),
+                gm.Mat4f(
+                    0.0,
+                    2.0,
+                    4.0,
+                    6.0,
+                    8.0,
+                    10.0,
+                    12.0,
+                    14.0,
+                    16.0,
+                    18.0,
+                    20.0,
+                    22.0,
+                    24.0,
+                    26.0,
+                    28.0,
+                    30.0,
+                ),
+            ]
+        )
+        values.extend(values)
+        self.assertEqual(
+            values,
+            gm.Mat4fArray(
+                [
+                    gm.Mat4f(
+                        0.0,
+                        1.0,
+                        2.0,
+                        3.0,
+                        4.0,
+                        5.0,
+                        6.0,
+                        7.0,
+                        8.0,
+                        9.0,
+                        10.0,
+                        11.0,
+                        12.0,
+                        13.0,
+                        14.0,
+                        15.0,
+                    ),
+                    gm.Mat4f(
+                        0.0,
+                        2.0,
+                        4.0,
+                        6.0,
+                        8.0,
+                        10.0,
+                        12.0,
+                        14.0,
+                        16.0,
+                        18.0,
+                        20.0,
+                        22.0,
+                        24.0,
+                        26.0,
+                        28.0,
+                        30.0,
+                    ),
+                    gm.Mat4f(
+                        0.0,
+                        1.0,
+                        2.0,
+                        3.0,
+                        4.0,
+                        5.0,
+                        6.0,
+                        7.0,
+                        8.0,
+                        9.0,
+                        10.0,
+                        11.0,
+                        12.0,
+                        13.0,
+                        14.0,
+                        15.0,
+                    ),
+                    gm.Mat4f(
+                        0.0,
+                        2.0,
+                        4.0,
+                        6.0,
+                        8.0,
+                        10.0,
+                        12.0,
+                        14.0,
+                        16.0,
+                        18.0,
+                        20.0,
+                        22.0,
+                        24.0,
+                        26.0,
+                        28.0,
+                        30.0,
+                    ),
+                ]
+            ),
+        )
+
+    def testIndexing(self):
+        values = gm.Mat4fArray(3)
+        values[-1] = gm.Mat4f(
+            0.0,
+            2.0,
+            4.0,
+            6.0,
+            8.0,
+            10.0,
+            12.0,
+            14.0,
+            16.0,
+            18.0,
+            20.0,
+            22.0,
+            24.0,
+            26.0,
+            28.0,
+            30.0,
+        )
+        self.assertEqual(
+            values[2:],
+            gm.Mat4fArray(
+                [
+                    gm.Mat4f(
+                        0.0,
+                        2.0,
+                        4.0,
+                        6.0,
+                        8.0,
+                        10.0,
+                        12.0,
+                        14.0,
+                        16.0,
+                        18.0,
+                        20.0,
+                        22.0,
+                        24.0,
+                        26.0,
+                        28.0,
+                        30.0,
+                    )
+                ]
+            ),
+        )
+        with self.assertRaises(IndexError):
+            values[3]
+        del values[0]
+        self.assertEqual(len(values), 2)
+
+    def testSlicing(self):
+        values = gm.Mat4fArray(
+            [
+                gm.Mat4f(
+                    0.0,
+                    1.0,
+                    2.0,
+                    3.0,
+                    4.0,
+                    5.0,
+                    6.0,
+                    7.0,
+                    8.0,
+                    9.0,
+                    10.0,
+                    11.0,
+                    12.0,
+                    13.0,
+                    14.0,
+                    15.0,
+                ),
+                gm.Mat4f(
+                    0.0,
+                    2.0,
+                    4.0,
+                    6.0,
+                    8.0,
+                    10.0,
+                    12.0,
+                    14.0,
+                    16.0,
+                    18.0,
+                    20.0,
+                    22.0,
+                    24.0,
+                    26.0,
+                    28.0,
+                    30.0,
+                ),
+                gm.Mat4f(
+                    0.0,
+                    3.0,
+                    6.0,
+                    9.0,
+                    12.0,
+                    15.0,
+                    18.0,
+                    21.0,
+                    24.0,
+                    27.0,
+                    30.0,
+                    33.0,
+                    36.0,
+                    39.0,
+                    42.0,
+                    45.0,
+                ),
+            ]
+        )
+        self.assertEqual(
+            values[::2],
+            gm.Mat4fArray(
+                [
+                    gm.Mat4f(
+                        0.0,
+                        1.0,
+                        2.0,
+                        3.0,
+                        4.0,
+                        5.0,
+                        6.0,
+                        7.0,
+                        8.0,
+                        9.0,
+                        10.0,
+                        11.0,
+                        12.0,
+                        13.0,
+                        14.0,
+                        15.0,
+                    ),
+                    gm.Mat4f(
+                        0.0,
+                        3.0,
+                        6.0,
+                        9.0,
+                        12.0,
+                        15.0,
+                        18.0,
+                        21.0,
+                        24.0,
+                        27.0,
+                        30.0,
+                        33.0,
+                        36.0,
+                        39.0,
+                        42.0,
+                        45.0,
+                    ),
+                ]
+            ),
+        )
+
+        values[1:] = gm.Mat4fArray(
+            [
+                gm.Mat4f(
+                    0.0,
+                    1.0,
+                    2.0,
+                    3.0,
+                    4.0,
+                    5.0,
+                    6.0,
+                    7.0,
+                    8.0,
+                    9.0,
+                    10.0,
+                    11.0,
+                    12.0,
+                    13.0,
+                    14.0,
+                    15.0,
+                ),
+                gm.Mat4f(
+                    0.0,
+                    1.0,
+                    2.0,
+                    3.0,
+                    4.0,
+                    5.0,
+                    6.0,
+                    7.0,
+                    8.0,
+                    9.0,
+                    10.0,
+                    11.0,
+                    12.0,
+                    13.0,
+                    14.0,
+                    15.0,
+                ),
+            ]
+        )
+        self.assertEqual(values[1:2], values[0:1])
+
+        with self.assertRaises(ValueError):
+            values[1:] = gm.Mat4fArray(1)
+
+    def testSliceAssignmentSelf(self):
+        values = gm.Mat4fArray(
+            [
+                gm.Mat4f(
+                    0.0,
+                    1.0,
+                    2.0,
+                    3.0,
+                    4.0,
+                    5.0,
+                    6.0,
+                    7.0,
+                    8.0,
+                    9.0,
+                    10.0,
+                    11.0,
+                    12.0,
+                    13.0,
+                    14.0,
+                    15.0,
+                ),
+                gm.Mat4f(
+                    0.0,
+                    2.0,
+                    4.0,
+                    6.0,
+                    8.0,
+                    10.0,
+                    12.0,
+                    14.0,
+                    16.0,
+                    18.0,
+                    20.0,
+                    22.0,
+                    24.0,
+                    26.0,
+                    28.0,
+                    30.0,
+                ),
+                gm.Mat4f(
+                    0.0,
+                    3.0,
+                    6.0,
+                    9.0,
+                    12.0,
+                    15.0,
+                    18.0,
+                    21.0,
+                    24.0,
+                    27.0,
+                    30.0,
+                    33.0,
+                    36.0,
+                    39.0,
+                    42.0,
+                    45.0,
+                ),
+            ]
+        )
+        values[::-1] = values
+        self.assertEqual(
+            values,
+            gm.Mat4fArray(
+                [
+                    gm.Mat4f(
+                        0.0,
+                        3.0,
+                        6.0,
+                        9.0,
+                        12.0,
+                        15.0,
+                        18.0,
+                        21.0,
+                        24.0,
+                        27.0,
+                        30.0,
+                        33.0,
+                        36.0,
+                        39.0,
+                        42.0,
+                        45.0,
+                    ),
+                    gm.Mat4f(
+                        0.0,
+                        2.0,
+                        4.0,
+                        6.0,
+                        8.0,
+                        10.0,
+                        12.0,
+                        14.0,
+                        16.0,
+                        18.0,
+                        20.0,
+                        22.0,
+                        24.0,
+                        26.0,
+                        28.0,
+                        30.0,
+                    ),
+                    gm.Mat4f(
+                        0.0,
+                        1.0,
+                        2.0,
+                        3.0,
+                        4.0,
+                        5.0,
+                        6.0,
+                        7.0,
+                        8.0,
+                        9.0,
+                        10.0,
+                        11.0,
+                        12.0,
+                        13.0,
+                        14.0,
+                        15.0,
+                    ),
+                ]
+            ),
+        )
+
+    def testBufferProtocol(self):
+        values = gm.Mat4fArray(4)
+        view = memoryview(values)
+        self.assertEqual(view.format, "f")
+        self.assertEqual(view.shape, (4, 4, 4))
+        self.assertEqual(view.nbytes, 256)
+
+    def testBufferExportsPreventResize(self):
+        values = gm.Mat4fArray(4)
+        view = memoryview(values)
+        for resize in (
+            lambda: values.append(
+                gm.Mat4f(
+                    0.0,
+                    1.0,
+                    2.0,
+                    3.0,
+                    4.0,
+                    5.0,
+                    6.0,
+                    7.0,
+                    8.0,
+                    9.0,
+                    10.0,
+                    11.0,
+                    12.0,
+                    13.0,
+                    14.0,
+                    15.0,
+                )
+            ),
+            lambda: values.extend(gm.Mat4fArray(1)),
+            lambda: values.extend(array.array("f", [0] * 16)),
+            lambda: values.extend(
+                [
+                    gm.Mat4f(
+                        0.0,
+                        1.0,
+                        2.0,
+                        3.0,
+                        4.0,
+                        5.0,
+                        6.0,
+                        7.0,
+                        8.0,
+                        9.0,
+                        10.0,
+                        11.0,
+                        12.0,
+                        13.0,
+                        14.0,
+                        15.0,
+                    )
+                ]
+            ),
+            lambda: values.resize(10000),
+            lambda: values.reserve(10000),
+            lambda: values.clear(),
+            lambda: values.__delitem__(0),
+        ):
+            with self.assertRaises(BufferError):
+                resize()
+        self.assertEqual(len(values), 4)
+
+        # Once the export is released, the array can be resized again.
+        view.release()
+        values.resize(10000)
+        self.assertEqual(len(values), 10000)
+
+    def testBufferInitialization(self):
+        buf = array.array("f", range(48))
+        values = gm.Mat4fArray(buf)
+        self.assertEqual(len(values), 3)
+        self.assertEqual(memoryview(values).tobytes(), buf.tobytes())
+
+    def testBufferInitializationMismatch(self):
+        with self.assertRaises(TypeError):
+            gm.Mat4fArray(array.array("d", [0.0] * 16))
+
+        with self.assertRaises(ValueError):
+            gm.Mat4fArray(array.array("f", [0] * 17))
+
+    def testPickle(self):
+        values = gm.Mat4fArray(
+            [
+                gm.Mat4f(
+                    0.0,
+                    1.0,
+                    2.0,
+                    3.0,
+                    4.0,
+                    5.0,
+                    6.0,
+                    7.0,
+                    8.0,
+                    9.0,
+                    10.0,
+                    11.0,
+                    12.0,
+                    13.0,
+                    14.0,
+                    15.0,
+                ),
+                gm.Mat4f(
+                    0.0,
+                    2.0,
+                    4.0,
+                    6.0,
+                    8.0,
+                    10.0,
+                    12.0,
+                    14.0,
+                    16.0,
+                    18.0,
+                    20.0,
+                    22.0,
+                    24.0,
+                    26.0,
+                    28.0,
+                    30.0,
+                ),
+            ]
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(values)), values)
+
+    def testPickleProtocols(self):
+        values = gm.Mat4fArray(
+            [
+                gm.Mat4f(
+                    0.0,
+                    1.0,
+                    2.0,
+                    3.0,
+                    4.0,
+                    5.0,
+                    6.0,
+                    7.0,
+                    8.0,
+                    9.0,
+                    10.0,
+                    11.0,
+                    12.0,
+                    13.0,
+                    14.0,
+                    15.0,
+                ),
+                gm.Mat4f(
+                    0.0,
+                    2.0,
+                    4.0,
+                    6.0,
+                    8.0,
+                    10.0,
+                    12.0,
+                    14.0,
+                    16.0,
+                    18.0,
+                    20.0,
+                    22.0,
+                    24.0,
+                    26.0,
+                    28.0,
+                    30.0,
+                ),
+            ]
+        )
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(
+                pickle.loads(pickle.dumps(values, protocol=protocol)), values
+            )
+
+    @unittest.skipIf(pickle.HIGHEST_PROTOCOL < 5, "Requires pickle protocol 5.")
+    def testPickleOutOfBand(self):
+        values = gm.Mat4fArray(array.array("f", range(48)))
+        buffers = []
+        data = pickle.dumps(values, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(pickle.loads(data, buffers=buffers), values)
+
+        # The out-of-band buffers can be transferred as raw bytes.
+        self.assertEqual(
+            pickle.loads(data, buffers=[buffer.raw().tobytes() for buffer in buffers]),
+            values,
+        )
+
+        empty = gm.Mat4fArray()
+        self.assertEqual(pickle.loads(pickle.dumps(empty, protocol=5)), empty)
+
+    def testToBytes(self):
+        values = gm.Mat4fArray(array.array("f", range(48)))
+        data = values.to_bytes()
+        self.assertEqual(data, struct.pack("<48f", *range(48)))
+        self.assertEqual(gm.Mat4fArray.from_bytes(data), values)
+        self.assertEqual(gm.Mat4fArray.from_bytes(bytearray(data)), values)
+        self.assertEqual(len(gm.Mat4fArray.from_bytes(b"")), 0)
+
+    def testFromBytesMismatch(self):
+        with self.assertRaises(ValueError):
+            gm.Mat4fArray.from_bytes(b"\x00" * 65)
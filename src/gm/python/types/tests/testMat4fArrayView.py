@@ -0,0 +1,86 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import array
+import pickle
+import unittest
+import gm
+
+
+class TestMat4fArrayView(unittest.TestCase):
+    def testBufferView(self):
+        buf = array.array("f", range(48))
+        view = gm.Mat4fArrayView(buf)
+        self.assertEqual(len(view), 3)
+        self.assertEqual(gm.Mat4fArrayView.elementByteSize, 64)
+        self.assertFalse(view.readOnly)
+        self.assertIs(view.owner, buf)
+        self.assertEqual(view.Copy(), gm.Mat4fArray(buf))
+
+        # Writes through the view are visible in the viewed buffer.
+        view[2] = view[0]
+        self.assertEqual(buf[32:].tolist(), buf[:16].tolist())
+
+    def testBytesView(self):
+        data = gm.Mat4fArray(array.array("f", range(48))).to_bytes()
+        view = gm.Mat4fArrayView(data)
+        self.assertTrue(view.readOnly)
+        self.assertEqual(view.to_bytes(), data)
+        with self.assertRaises(TypeError):
+            view[0] = view[1]
+
+    def testOffsetAndSize(self):
+        buf = array.array("f", range(48))
+        view = gm.Mat4fArrayView(buf, byteOffset=64, size=1)
+        self.assertEqual(len(view), 1)
+        self.assertEqual(view.byteOffset, 64)
+        self.assertEqual(memoryview(view).tobytes(), buf[16:32].tobytes())
+
+        with self.assertRaises(ValueError):
+            gm.Mat4fArrayView(buf, byteOffset=64, size=3)
+        with self.assertRaises(TypeError):
+            gm.Mat4fArrayView(array.array("d", [0.0] * 16))
+
+    def testSlice(self):
+        buf = array.array("f", range(48))
+        view = gm.Mat4fArrayView(buf)[1:]
+        self.assertEqual(len(view), 2)
+        self.assertEqual(view.byteOffset, 64)
+        self.assertEqual(memoryview(view).tobytes(), buf[16:].tobytes())
+        with self.assertRaises(ValueError):
+            gm.Mat4fArrayView(buf)[::2]
+
+    def testRelease(self):
+        view = gm.Mat4fArrayView(array.array("f", range(48)))
+        view.Release()
+        self.assertEqual(len(view), 0)
+        self.assertIsNone(view.owner)
+
+    def testSharedMemory(self):
+        view = gm.Mat4fArrayView.CreateShared(3)
+        try:
+            memoryview(view).cast("B")[:] = array.array("f", range(48)).tobytes()
+            attached = gm.Mat4fArrayView.AttachShared(view.owner.name, size=3)
+            self.assertEqual(attached.Copy(), view.Copy())
+
+            # Shared views are pickled by name.
+            copied = pickle.loads(pickle.dumps(view[1:]))
+            self.assertEqual(copied.owner.name, view.owner.name)
+            self.assertEqual(copied.Copy(), view[1:].Copy())
+
+            for sharedView in (attached, copied):
+                owner = sharedView.owner
+                sharedView.Release()
+                owner.close()
+        finally:
+            owner = view.owner
+            view.Release()
+            owner.close()
+            owner.unlink()
+
+    def testPickleCopy(self):
+        view = gm.Mat4fArrayView(array.array("f", range(48)))
+        copied = pickle.loads(pickle.dumps(view))
+        self.assertFalse(copied.readOnly)
+        self.assertEqual(copied.Copy(), view.Copy())
@@ -0,0 +1,119 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import array
+import pickle
+import struct
+import unittest
+import gm
+
+
+class TestQuatf(unittest.TestCase):
+    def testDefaultInitialization(self):
+        quaternion = gm.Quatf()
+        self.assertEqual(quaternion, gm.Quatf(0.0, 0.0, 0.0, 0.0))
+
+    def testElementInitialization(self):
+        gm.Quatf(0.0, 2.0, 4.0, 6.0)
+
+    def testElementReadAccess(self):
+        quaternion = gm.Quatf(0.0, 2.0, 4.0, 6.0)
+        self.assertAlmostEqual(quaternion[0], 0.0)
+        self.assertAlmostEqual(quaternion[1], 2.0)
+        self.assertAlmostEqual(quaternion[2], 4.0)
+        self.assertAlmostEqual(quaternion[3], 6.0)
+
+    def testElementWriteAccess(self):
+        quaternion = gm.Quatf()
+        quaternion[0] = 0.0
+        quaternion[1] = 2.0
+        quaternion[2] = 4.0
+        quaternion[3] = 6.0
+        self.assertAlmostEqual(quaternion[0], 0.0)
+        self.assertAlmostEqual(quaternion[1], 2.0)
+        self.assertAlmostEqual(quaternion[2], 4.0)
+        self.assertAlmostEqual(quaternion[3], 6.0)
+
+    def testBufferProtocol(self):
+        quaternion = gm.Quatf(0.0, 2.0, 4.0, 6.0)
+        view = memoryview(quaternion)
+        self.assertEqual(view.format, "f")
+        self.assertEqual(view.shape, (4,))
+        self.assertEqual(view.nbytes, 16)
+
+        # Writes through the view are visible on the source object.
+        view[0] = 7.0
+        self.assertEqual(quaternion[0], 7.0)
+
+    def testBufferInitialization(self):
+        buf = array.array("f", [0.0, 2.0, 4.0, 6.0])
+        self.assertEqual(gm.Quatf(buf), gm.Quatf(0.0, 2.0, 4.0, 6.0))
+
+        # Round trip through another instance.
+        quaternion = gm.Quatf(0.0, 2.0, 4.0, 6.0)
+        self.assertEqual(gm.Quatf(quaternion), quaternion)
+
+    def testBufferInitializationMismatch(self):
+        with self.assertRaises(TypeError):
+            gm.Quatf(array.array("d", [0.0] * 4))
+
+        with self.assertRaises(ValueError):
+            gm.Quatf(array.array("f", [0] * 5))
+
+    def testToBytes(self):
+        quaternion = gm.Quatf(0.0, 2.0, 4.0, 6.0)
+        data = quaternion.to_bytes()
+        self.assertEqual(
+            data, struct.pack("<4f", *[quaternion[index] for index in range(4)])
+        )
+        self.assertEqual(gm.Quatf.from_bytes(data), quaternion)
+
+        with self.assertRaises(ValueError):
+            gm.Quatf.from_bytes(data[:-1])
+
+    def testPickle(self):
+        quaternion = gm.Quatf(0.0, 2.0, 4.0, 6.0)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(
+                pickle.loads(pickle.dumps(quaternion, protocol=protocol)), quaternion
+            )
+
+    def testNamedElementReadAccessX(self):
+        quaternion = gm.Quatf(0.0, 1.0, 2.0, 3.0)
+        self.assertEqual(quaternion.x, 0)
+
+    def testNamedElementWriteAccessX(self):
+        quaternion = gm.Quatf()
+        quaternion.x = 0
+        self.assertEqual(quaternion[0], 0)
+
+    def testNamedElementReadAccessY(self):
+        quaternion = gm.Quatf(0.0, 1.0, 2.0, 3.0)
+        self.assertEqual(quaternion.y, 1)
+
+    def testNamedElementWriteAccessY(self):
+        quaternion = gm.Quatf()
+        quaternion.y = 1
+        self.assertEqual(quaternion[1], 1)
+
+    def testNamedElementReadAccessZ(self):
+        quaternion = gm.Quatf(0.0, 1.0, 2.0, 3.0)
+        self.assertEqual(quaternion.z, 2)
+
+    def testNamedElementWriteAccessZ(self):
+        quaternion = gm.Quatf()
+        quaternion.z = 2
+        self.assertEqual(quaternion[2], 2)
+
+    def testNamedElementReadAccessW(self):
+        quaternion = gm.Quatf(0.0, 1.0, 2.0, 3.0)
+        self.assertEqual(quaternion.w, 3)
+
+    def testNamedElementWriteAccessW(self):
+        quaternion = gm.Quatf()
+        quaternion.w = 3
+        self.assertEqual(quaternion[3], 3)
+
+    def testIdentity(self):
+        self.assertEqual(gm.Quatf.Identity(), gm.Quatf(0, 0, 0, 1))
@@ -0,0 +1,202 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import array
+import pickle
+import struct
+import unittest
+import gm
+
+
+class TestQuatfArray(unittest.TestCase):
+    def testDefaultInitialization(self):
+        self.assertEqual(len(gm.QuatfArray()), 0)
+
+    def testListInitialization(self):
+        values = gm.QuatfArray(
+            [gm.Quatf(), gm.Quatf(), gm.Quatf(), gm.Quatf(), gm.Quatf()]
+        )
+        self.assertEqual(len(values), 5)
+
+    def testSizedInitialization(self):
+        self.assertEqual(len(gm.QuatfArray(5)), 5)
+
+    def testAppend(self):
+        values = gm.QuatfArray()
+        values.append(gm.Quatf(0.0, 1.0, 2.0, 3.0))
+        values.append(gm.Quatf(0.0, 2.0, 4.0, 6.0))
+        self.assertEqual(
+            values,
+            gm.QuatfArray([gm.Quatf(0.0, 1.0, 2.0, 3.0), gm.Quatf(0.0, 2.0, 4.0, 6.0)]),
+        )
+
+    def testExtend(self):
+        values = gm.QuatfArray([gm.Quatf(0.0, 1.0, 2.0, 3.0)])
+        values.extend(gm.QuatfArray([gm.Quatf(0.0, 2.0, 4.0, 6.0)]))
+        values.extend([gm.Quatf(0.0, 3.0, 6.0, 9.0)])
+        values.extend(array.array("f", [0] * 8))
+        self.assertEqual(len(values), 5)
+        self.assertEqual(
+            values[:3],
+            gm.QuatfArray(
+                [
+                    gm.Quatf(0.0, 1.0, 2.0, 3.0),
+                    gm.Quatf(0.0, 2.0, 4.0, 6.0),
+                    gm.Quatf(0.0, 3.0, 6.0, 9.0),
+                ]
+            ),
+        )
+
+    def testExtendSelf(self):
+        values = gm.QuatfArray(
+            [gm.Quatf(0.0, 1.0, 2.0, 3.0), gm.Quatf(0.0, 2.0, 4.0, 6.0),]
+        )
+        values.extend(values)
+        self.assertEqual(
+            values,
+            gm.QuatfArray(
+                [
+                    gm.Quatf(0.0, 1.0, 2.0, 3.0),
+                    gm.Quatf(0.0, 2.0, 4.0, 6.0),
+                    gm.Quatf(0.0, 1.0, 2.0, 3.0),
+                    gm.Quatf(0.0, 2.0, 4.0, 6.0),
+                ]
+            ),
+        )
+
+    def testIndexing(self):
+        values = gm.QuatfArray(3)
+        values[-1] = gm.Quatf(0.0, 2.0, 4.0, 6.0)
+        self.assertEqual(values[2:], gm.QuatfArray([gm.Quatf(0.0, 2.0, 4.0, 6.0)]))
+        with self.assertRaises(IndexError):
+            values[3]
+        del values[0]
+        self.assertEqual(len(values), 2)
+
+    def testSlicing(self):
+        values = gm.QuatfArray(
+            [
+                gm.Quatf(0.0, 1.0, 2.0, 3.0),
+                gm.Quatf(0.0, 2.0, 4.0, 6.0),
+                gm.Quatf(0.0, 3.0, 6.0, 9.0),
+            ]
+        )
+        self.assertEqual(
+            values[::2],
+            gm.QuatfArray([gm.Quatf(0.0, 1.0, 2.0, 3.0), gm.Quatf(0.0, 3.0, 6.0, 9.0)]),
+        )
+
+        values[1:] = gm.QuatfArray(
+            [gm.Quatf(0.0, 1.0, 2.0, 3.0), gm.Quatf(0.0, 1.0, 2.0, 3.0)]
+        )
+        self.assertEqual(values[1:2], values[0:1])
+
+        with self.assertRaises(ValueError):
+            values[1:] = gm.QuatfArray(1)
+
+    def testSliceAssignmentSelf(self):
+        values = gm.QuatfArray(
+            [
+                gm.Quatf(0.0, 1.0, 2.0, 3.0),
+                gm.Quatf(0.0, 2.0, 4.0, 6.0),
+                gm.Quatf(0.0, 3.0, 6.0, 9.0),
+            ]
+        )
+        values[::-1] = values
+        self.assertEqual(
+            values,
+            gm.QuatfArray(
+                [
+                    gm.Quatf(0.0, 3.0, 6.0, 9.0),
+                    gm.Quatf(0.0, 2.0, 4.0, 6.0),
+                    gm.Quatf(0.0, 1.0, 2.0, 3.0),
+                ]
+            ),
+        )
+
+    def testBufferProtocol(self):
+        values = gm.QuatfArray(4)
+        view = memoryview(values)
+        self.assertEqual(view.format, "f")
+        self.assertEqual(view.shape, (4, 4))
+        self.assertEqual(view.nbytes, 64)
+
+    def testBufferExportsPreventResize(self):
+        values = gm.QuatfArray(4)
+        view = memoryview(values)
+        for resize in (
+            lambda: values.append(gm.Quatf(0.0, 1.0, 2.0, 3.0)),
+            lambda: values.extend(gm.QuatfArray(1)),
+            lambda: values.extend(array.array("f", [0] * 4)),
+            lambda: values.extend([gm.Quatf(0.0, 1.0, 2.0, 3.0)]),
+            lambda: values.resize(10000),
+            lambda: values.reserve(10000),
+            lambda: values.clear(),
+            lambda: values.__delitem__(0),
+        ):
+            with self.assertRaises(BufferError):
+                resize()
+        self.assertEqual(len(values), 4)
+
+        # Once the export is released, the array can be resized again.
+        view.release()
+        values.resize(10000)
+        self.assertEqual(len(values), 10000)
+
+    def testBufferInitialization(self):
+        buf = array.array("f", range(12))
+        values = gm.QuatfArray(buf)
+        self.assertEqual(len(values), 3)
+        self.assertEqual(memoryview(values).tobytes(), buf.tobytes())
+
+    def testBufferInitializationMismatch(self):
+        with self.assertRaises(TypeError):
+            gm.QuatfArray(array.array("d", [0.0] * 4))
+
+        with self.assertRaises(ValueError):
+            gm.QuatfArray(array.array("f", [0] * 5))
+
+    def testPickle(self):
+        values = gm.QuatfArray(
+            [gm.Quatf(0.0, 1.0, 2.0, 3.0), gm.Quatf(0.0, 2.0, 4.0, 6.0),]
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(values)), values)
+
+    def testPickleProtocols(self):
+        values = gm.QuatfArray(
+            [gm.Quatf(0.0, 1.0, 2.0, 3.0), gm.Quatf(0.0, 2.0, 4.0, 6.0),]
+        )
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(
+                pickle.loads(pickle.dumps(values, protocol=protocol)), values
+            )
+
+    @unittest.skipIf(pickle.HIGHEST_PROTOCOL < 5, "Requires pickle protocol 5.")
+    def testPickleOutOfBand(self):
+        values = gm.QuatfArray(array.array("f", range(12)))
+        buffers = []
+        data = pickle.dumps(values, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(pickle.loads(data, buffers=buffers), values)
+
+        # The out-of-band buffers can be transferred as raw bytes.
+        self.assertEqual(
+            pickle.loads(data, buffers=[buffer.raw().tobytes() for buffer in buffers]),
+            values,
+        )
+
+        empty = gm.QuatfArray()
+        self.assertEqual(pickle.loads(pickle.dumps(empty, protocol=5)), empty)
+
+    def testToBytes(self):
+        values = gm.QuatfArray(array.array("f", range(12)))
+        data = values.to_bytes()
+        self.assertEqual(data, struct.pack("<12f", *range(12)))
+        self.assertEqual(gm.QuatfArray.from_bytes(data), values)
+        self.assertEqual(gm.QuatfArray.from_bytes(bytearray(data)), values)
+        self.assertEqual(len(gm.QuatfArray.from_bytes(b"")), 0)
+
+    def testFromBytesMismatch(self):
+        with self.assertRaises(ValueError):
+            gm.QuatfArray.from_bytes(b"\x00" * 17)
@@ -0,0 +1,86 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import array
+import pickle
+import unittest
+import gm
+
+
+class TestQuatfArrayView(unittest.TestCase):
+    def testBufferView(self):
+        buf = array.array("f", range(12))
+        view = gm.QuatfArrayView(buf)
+        self.assertEqual(len(view), 3)
+        self.assertEqual(gm.QuatfArrayView.elementByteSize, 16)
+        self.assertFalse(view.readOnly)
+        self.assertIs(view.owner, buf)
+        self.assertEqual(view.Copy(), gm.QuatfArray(buf))
+
+        # Writes through the view are visible in the viewed buffer.
+        view[2] = view[0]
+        self.assertEqual(buf[8:].tolist(), buf[:4].tolist())
+
+    def testBytesView(self):
+        data = gm.QuatfArray(array.array("f", range(12))).to_bytes()
+        view = gm.QuatfArrayView(data)
+        self.assertTrue(view.readOnly)
+        self.assertEqual(view.to_bytes(), data)
+        with self.assertRaises(TypeError):
+            view[0] = view[1]
+
+    def testOffsetAndSize(self):
+        buf = array.array("f", range(12))
+        view = gm.QuatfArrayView(buf, byteOffset=16, size=1)
+        self.assertEqual(len(view), 1)
+        self.assertEqual(view.byteOffset, 16)
+        self.assertEqual(memoryview(view).tobytes(), buf[4:8].tobytes())
+
+        with self.assertRaises(ValueError):
+            gm.QuatfArrayView(buf, byteOffset=16, size=3)
+        with self.assertRaises(TypeError):
+            gm.QuatfArrayView(array.array("d", [0.0] * 4))
+
+    def testSlice(self):
+        buf = array.array("f", range(12))
+        view = gm.QuatfArrayView(buf)[1:]
+        self.assertEqual(len(view), 2)
+        self.assertEqual(view.byteOffset, 16)
+        self.assertEqual(memoryview(view).tobytes(), buf[4:].tobytes())
+        with self.assertRaises(ValueError):
+            gm.QuatfArrayView(buf)[::2]
+
+    def testRelease(self):
+        view = gm.QuatfArrayView(array.array("f", range(12)))
+        view.Release()
+        self.assertEqual(len(view), 0)
+        self.assertIsNone(view.owner)
+
+    def testSharedMemory(self):
+        view = gm.QuatfArrayView.CreateShared(3)
+        try:
+            memoryview(view).cast("B")[:] = array.array("f", range(12)).tobytes()
+            attached = gm.QuatfArrayView.AttachShared(view.owner.name, size=3)
+            self.assertEqual(attached.Copy(), view.Copy())
+
+            # Shared views are pickled by name.
+            copied = pickle.loads(pickle.dumps(view[1:]))
+            self.assertEqual(copied.owner.name, view.owner.name)
+            self.assertEqual(copied.Copy(), view[1:].Copy())
+
+            for sharedView in (attached, copied):
+                owner = sharedView.owner
+                sharedView.Release()
+                owner.close()
+        finally:
+            owner = view.owner
+            view.Release()
+            owner.close()
+            owner.unlink()
+
+    def testPickleCopy(self):
+        view = gm.QuatfArrayView(array.array("f", range(12)))
+        copied = pickle.loads(pickle.dumps(view))
+        self.assertFalse(copied.readOnly)
+        self.assertEqual(copied.Copy(), view.Copy())
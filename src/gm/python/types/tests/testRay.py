@@ -0,0 +1,25 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import pickle
+import unittest
+import gm
+
+
+class TestRay(unittest.TestCase):
+    def testDefaultInitialization(self):
+        gm.Ray()
+
+    def testElementInitialization(self):
+        gm.Ray(gm.Vec3f(), gm.Vec3f())
+
+    def testPickle(self):
+        ray = gm.Ray(gm.Vec3f(1.0, 1.0, 1.0), gm.Vec3f(2.0, 2.0, 2.0))
+        self.assertEqual(gm.Ray.from_bytes(ray.to_bytes()).origin, ray.origin)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copied = pickle.loads(pickle.dumps(ray, protocol=protocol))
+            self.assertEqual(copied.origin, ray.origin)
+            self.assertEqual(copied.direction, ray.direction)
+            self.assertEqual(copied.inverseDirection, ray.inverseDirection)
+            self.assertEqual(copied.directionSign, ray.directionSign)
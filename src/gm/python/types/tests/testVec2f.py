@@ -2,6 +2,9 @@
 # This file is auto-generated, please do not modify directly!
 #
 
+import array
+import pickle
+import struct
 import unittest
 import gm
 
@@ -26,6 +29,50 @@ class TestVec2f(unittest.TestCase):
         self.assertAlmostEqual(vector[0], 0.0)
         self.assertAlmostEqual(vector[1], 2.0)
 
+    def testBufferProtocol(self):
+        vector = gm.Vec2f(0.0, 2.0)
+        view = memoryview(vector)
+        self.assertEqual(view.format, "f")
+        self.assertEqual(view.shape, (2,))
+        self.assertEqual(view.nbytes, 8)
+
+        # Writes through the view are visible on the source object.
+        view[0] = 7.0
+        self.assertEqual(vector[0], 7.0)
+
+    def testBufferInitialization(self):
+        buf = array.array("f", [0.0, 2.0])
+        self.assertEqual(gm.Vec2f(buf), gm.Vec2f(0.0, 2.0))
+
+        # Round trip through another instance.
+        vector = gm.Vec2f(0.0, 2.0)
+        self.assertEqual(gm.Vec2f(vector), vector)
+
+    def testBufferInitializationMismatch(self):
+        with self.assertRaises(TypeError):
+            gm.Vec2f(array.array("d", [0.0] * 2))
+
+        with self.assertRaises(ValueError):
+            gm.Vec2f(array.array("f", [0] * 3))
+
+    def testToBytes(self):
+        vector = gm.Vec2f(0.0, 2.0)
+        data = vector.to_bytes()
+        self.assertEqual(
+            data, struct.pack("<2f", *[vector[index] for index in range(2)])
+        )
+        self.assertEqual(gm.Vec2f.from_bytes(data), vector)
+
+        with self.assertRaises(ValueError):
+            gm.Vec2f.from_bytes(data[:-1])
+
+    def testPickle(self):
+        vector = gm.Vec2f(0.0, 2.0)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(
+                pickle.loads(pickle.dumps(vector, protocol=protocol)), vector
+            )
+
     def testNamedElementReadAccessX(self):
         vector = gm.Vec2f(0.0, 1.0)
         self.assertEqual(vector.x, 0)
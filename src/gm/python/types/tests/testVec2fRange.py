@@ -2,6 +2,7 @@
 # This file is auto-generated, please do not modify directly!
 #
 
+import pickle
 import unittest
 import gm
 
@@ -14,3 +15,21 @@ class TestVec2fRange(unittest.TestCase):
         gm.Vec2fRange(
             gm.Vec2f(), gm.Vec2f(),
         )
+
+    def testToBytes(self):
+        value = gm.Vec2fRange(gm.Vec2f(0.0, 1.0), gm.Vec2f(0.0, 2.0))
+        data = value.to_bytes()
+        self.assertEqual(len(data), 16)
+        copied = gm.Vec2fRange.from_bytes(data)
+        self.assertEqual(copied.min, value.min)
+        self.assertEqual(copied.max, value.max)
+
+        with self.assertRaises(ValueError):
+            gm.Vec2fRange.from_bytes(data + data)
+
+    def testPickle(self):
+        value = gm.Vec2fRange(gm.Vec2f(0.0, 1.0), gm.Vec2f(0.0, 2.0))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copied = pickle.loads(pickle.dumps(value, protocol=protocol))
+            self.assertEqual(copied.min, value.min)
+            self.assertEqual(copied.max, value.max)
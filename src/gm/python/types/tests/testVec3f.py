@@ -2,6 +2,9 @@
 # This file is auto-generated, please do not modify directly!
 #
 
+import array
+import pickle
+import struct
 import unittest
 import gm
 
@@ -29,6 +32,50 @@ class TestVec3f(unittest.TestCase):
         self.assertAlmostEqual(vector[1], 2.0)
         self.assertAlmostEqual(vector[2], 4.0)
 
+    def testBufferProtocol(self):
+        vector = gm.Vec3f(0.0, 2.0, 4.0)
+        view = memoryview(vector)
+        self.assertEqual(view.format, "f")
+        self.assertEqual(view.shape, (3,))
+        self.assertEqual(view.nbytes, 12)
+
+        # Writes through the view are visible on the source object.
+        view[0] = 7.0
+        self.assertEqual(vector[0], 7.0)
+
+    def testBufferInitialization(self):
+        buf = array.array("f", [0.0, 2.0, 4.0])
+        self.assertEqual(gm.Vec3f(buf), gm.Vec3f(0.0, 2.0, 4.0))
+
+        # Round trip through another instance.
+        vector = gm.Vec3f(0.0, 2.0, 4.0)
+        self.assertEqual(gm.Vec3f(vector), vector)
+
+    def testBufferInitializationMismatch(self):
+        with self.assertRaises(TypeError):
+            gm.Vec3f(array.array("d", [0.0] * 3))
+
+        with self.assertRaises(ValueError):
+            gm.Vec3f(array.array("f", [0] * 4))
+
+    def testToBytes(self):
+        vector = gm.Vec3f(0.0, 2.0, 4.0)
+        data = vector.to_bytes()
+        self.assertEqual(
+            data, struct.pack("<3f", *[vector[index] for index in range(3)])
+        )
+        self.assertEqual(gm.Vec3f.from_bytes(data), vector)
+
+        with self.assertRaises(ValueError):
+            gm.Vec3f.from_bytes(data[:-1])
+
+    def testPickle(self):
+        vector = gm.Vec3f(0.0, 2.0, 4.0)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(
+                pickle.loads(pickle.dumps(vector, protocol=protocol)), vector
+            )
+
     def testNamedElementReadAccessX(self):
         vector = gm.Vec3f(0.0, 1.0, 2.0)
         self.assertEqual(vector.x, 0)
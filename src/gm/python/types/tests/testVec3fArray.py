@@ -0,0 +1,185 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import array
+import pickle
+import struct
+import unittest
+import gm
+
+
+class TestVec3fArray(unittest.TestCase):
+    def testDefaultInitialization(self):
+        self.assertEqual(len(gm.Vec3fArray()), 0)
+
+    def testListInitialization(self):
+        values = gm.Vec3fArray(
+            [gm.Vec3f(), gm.Vec3f(), gm.Vec3f(), gm.Vec3f(), gm.Vec3f()]
+        )
+        self.assertEqual(len(values), 5)
+
+    def testSizedInitialization(self):
+        self.assertEqual(len(gm.Vec3fArray(5)), 5)
+
+    def testAppend(self):
+        values = gm.Vec3fArray()
+        values.append(gm.Vec3f(0.0, 1.0, 2.0))
+        values.append(gm.Vec3f(0.0, 2.0, 4.0))
+        self.assertEqual(
+            values, gm.Vec3fArray([gm.Vec3f(0.0, 1.0, 2.0), gm.Vec3f(0.0, 2.0, 4.0)])
+        )
+
+    def testExtend(self):
+        values = gm.Vec3fArray([gm.Vec3f(0.0, 1.0, 2.0)])
+        values.extend(gm.Vec3fArray([gm.Vec3f(0.0, 2.0, 4.0)]))
+        values.extend([gm.Vec3f(0.0, 3.0, 6.0)])
+        values.extend(array.array("f", [0] * 6))
+        self.assertEqual(len(values), 5)
+        self.assertEqual(
+            values[:3],
+            gm.Vec3fArray(
+                [
+                    gm.Vec3f(0.0, 1.0, 2.0),
+                    gm.Vec3f(0.0, 2.0, 4.0),
+                    gm.Vec3f(0.0, 3.0, 6.0),
+                ]
+            ),
+        )
+
+    def testExtendSelf(self):
+        values = gm.Vec3fArray([gm.Vec3f(0.0, 1.0, 2.0), gm.Vec3f(0.0, 2.0, 4.0),])
+        values.extend(values)
+        self.assertEqual(
+            values,
+            gm.Vec3fArray(
+                [
+                    gm.Vec3f(0.0, 1.0, 2.0),
+                    gm.Vec3f(0.0, 2.0, 4.0),
+                    gm.Vec3f(0.0, 1.0, 2.0),
+                    gm.Vec3f(0.0, 2.0, 4.0),
+                ]
+            ),
+        )
+
+    def testIndexing(self):
+        values = gm.Vec3fArray(3)
+        values[-1] = gm.Vec3f(0.0, 2.0, 4.0)
+        self.assertEqual(values[2:], gm.Vec3fArray([gm.Vec3f(0.0, 2.0, 4.0)]))
+        with self.assertRaises(IndexError):
+            values[3]
+        del values[0]
+        self.assertEqual(len(values), 2)
+
+    def testSlicing(self):
+        values = gm.Vec3fArray(
+            [gm.Vec3f(0.0, 1.0, 2.0), gm.Vec3f(0.0, 2.0, 4.0), gm.Vec3f(0.0, 3.0, 6.0),]
+        )
+        self.assertEqual(
+            values[::2],
+            gm.Vec3fArray([gm.Vec3f(0.0, 1.0, 2.0), gm.Vec3f(0.0, 3.0, 6.0)]),
+        )
+
+        values[1:] = gm.Vec3fArray([gm.Vec3f(0.0, 1.0, 2.0), gm.Vec3f(0.0, 1.0, 2.0)])
+        self.assertEqual(values[1:2], values[0:1])
+
+        with self.assertRaises(ValueError):
+            values[1:] = gm.Vec3fArray(1)
+
+    def testSliceAssignmentSelf(self):
+        values = gm.Vec3fArray(
+            [gm.Vec3f(0.0, 1.0, 2.0), gm.Vec3f(0.0, 2.0, 4.0), gm.Vec3f(0.0, 3.0, 6.0),]
+        )
+        values[::-1] = values
+        self.assertEqual(
+            values,
+            gm.Vec3fArray(
+                [
+                    gm.Vec3f(0.0, 3.0, 6.0),
+                    gm.Vec3f(0.0, 2.0, 4.0),
+                    gm.Vec3f(0.0, 1.0, 2.0),
+                ]
+            ),
+        )
+
+    def testBufferProtocol(self):
+        values = gm.Vec3fArray(4)
+        view = memoryview(values)
+        self.assertEqual(view.format, "f")
+        self.assertEqual(view.shape, (4, 3))
+        self.assertEqual(view.nbytes, 48)
+
+    def testBufferExportsPreventResize(self):
+        values = gm.Vec3fArray(4)
+        view = memoryview(values)
+        for resize in (
+            lambda: values.append(gm.Vec3f(0.0, 1.0, 2.0)),
+            lambda: values.extend(gm.Vec3fArray(1)),
+            lambda: values.extend(array.array("f", [0] * 3)),
+            lambda: values.extend([gm.Vec3f(0.0, 1.0, 2.0)]),
+            lambda: values.resize(10000),
+            lambda: values.reserve(10000),
+            lambda: values.clear(),
+            lambda: values.__delitem__(0),
+        ):
+            with self.assertRaises(BufferError):
+                resize()
+        self.assertEqual(len(values), 4)
+
+        # Once the export is released, the array can be resized again.
+        view.release()
+        values.resize(10000)
+        self.assertEqual(len(values), 10000)
+
+    def testBufferInitialization(self):
+        buf = array.array("f", range(9))
+        values = gm.Vec3fArray(buf)
+        self.assertEqual(len(values), 3)
+        self.assertEqual(memoryview(values).tobytes(), buf.tobytes())
+
+    def testBufferInitializationMismatch(self):
+        with self.assertRaises(TypeError):
+            gm.Vec3fArray(array.array("d", [0.0] * 3))
+
+        with self.assertRaises(ValueError):
+            gm.Vec3fArray(array.array("f", [0] * 4))
+
+    def testPickle(self):
+        values = gm.Vec3fArray([gm.Vec3f(0.0, 1.0, 2.0), gm.Vec3f(0.0, 2.0, 4.0),])
+        self.assertEqual(pickle.loads(pickle.dumps(values)), values)
+
+    def testPickleProtocols(self):
+        values = gm.Vec3fArray([gm.Vec3f(0.0, 1.0, 2.0), gm.Vec3f(0.0, 2.0, 4.0),])
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(
+                pickle.loads(pickle.dumps(values, protocol=protocol)), values
+            )
+
+    @unittest.skipIf(pickle.HIGHEST_PROTOCOL < 5, "Requires pickle protocol 5.")
+    def testPickleOutOfBand(self):
+        values = gm.Vec3fArray(array.array("f", range(9)))
+        buffers = []
+        data = pickle.dumps(values, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(pickle.loads(data, buffers=buffers), values)
+
+        # The out-of-band buffers can be transferred as raw bytes.
+        self.assertEqual(
+            pickle.loads(data, buffers=[buffer.raw().tobytes() for buffer in buffers]),
+            values,
+        )
+
+        empty = gm.Vec3fArray()
+        self.assertEqual(pickle.loads(pickle.dumps(empty, protocol=5)), empty)
+
+    def testToBytes(self):
+        values = gm.Vec3fArray(array.array("f", range(9)))
+        data = values.to_bytes()
+        self.assertEqual(data, struct.pack("<9f", *range(9)))
+        self.assertEqual(gm.Vec3fArray.from_bytes(data), values)
+        self.assertEqual(gm.Vec3fArray.from_bytes(bytearray(data)), values)
+        self.assertEqual(len(gm.Vec3fArray.from_bytes(b"")), 0)
+
+    def testFromBytesMismatch(self):
+        with self.assertRaises(ValueError):
+            gm.Vec3fArray.from_bytes(b"\x00" * 13)
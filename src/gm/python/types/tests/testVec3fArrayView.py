@@ -0,0 +1,86 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import array
+import pickle
+import unittest
+import gm
+
+
+class TestVec3fArrayView(unittest.TestCase):
+    def testBufferView(self):
+        buf = array.array("f", range(9))
+        view = gm.Vec3fArrayView(buf)
+        self.assertEqual(len(view), 3)
+        self.assertEqual(gm.Vec3fArrayView.elementByteSize, 12)
+        self.assertFalse(view.readOnly)
+        self.assertIs(view.owner, buf)
+        self.assertEqual(view.Copy(), gm.Vec3fArray(buf))
+
+        # Writes through the view are visible in the viewed buffer.
+        view[2] = view[0]
+        self.assertEqual(buf[6:].tolist(), buf[:3].tolist())
+
+    def testBytesView(self):
+        data = gm.Vec3fArray(array.array("f", range(9))).to_bytes()
+        view = gm.Vec3fArrayView(data)
+        self.assertTrue(view.readOnly)
+        self.assertEqual(view.to_bytes(), data)
+        with self.assertRaises(TypeError):
+            view[0] = view[1]
+
+    def testOffsetAndSize(self):
+        buf = array.array("f", range(9))
+        view = gm.Vec3fArrayView(buf, byteOffset=12, size=1)
+        self.assertEqual(len(view), 1)
+        self.assertEqual(view.byteOffset, 12)
+        self.assertEqual(memoryview(view).tobytes(), buf[3:6].tobytes())
+
+        with self.assertRaises(ValueError):
+            gm.Vec3fArrayView(buf, byteOffset=12, size=3)
+        with self.assertRaises(TypeError):
+            gm.Vec3fArrayView(array.array("d", [0.0] * 3))
+
+    def testSlice(self):
+        buf = array.array("f", range(9))
+        view = gm.Vec3fArrayView(buf)[1:]
+        self.assertEqual(len(view), 2)
+        self.assertEqual(view.byteOffset, 12)
+        self.assertEqual(memoryview(view).tobytes(), buf[3:].tobytes())
+        with self.assertRaises(ValueError):
+            gm.Vec3fArrayView(buf)[::2]
+
+    def testRelease(self):
+        view = gm.Vec3fArrayView(array.array("f", range(9)))
+        view.Release()
+        self.assertEqual(len(view), 0)
+        self.assertIsNone(view.owner)
+
+    def testSharedMemory(self):
+        view = gm.Vec3fArrayView.CreateShared(3)
+        try:
+            memoryview(view).cast("B")[:] = array.array("f", range(9)).tobytes()
+            attached = gm.Vec3fArrayView.AttachShared(view.owner.name, size=3)
+            self.assertEqual(attached.Copy(), view.Copy())
+
+            # Shared views are pickled by name.
+            copied = pickle.loads(pickle.dumps(view[1:]))
+            self.assertEqual(copied.owner.name, view.owner.name)
+            self.assertEqual(copied.Copy(), view[1:].Copy())
+
+            for sharedView in (attached, copied):
+                owner = sharedView.owner
+                sharedView.Release()
+                owner.close()
+        finally:
+            owner = view.owner
+            view.Release()
+            owner.close()
+            owner.unlink()
+
+    def testPickleCopy(self):
+        view = gm.Vec3fArrayView(array.array("f", range(9)))
+        copied = pickle.loads(pickle.dumps(view))
+        self.assertFalse(copied.readOnly)
+        self.assertEqual(copied.Copy(), view.Copy())
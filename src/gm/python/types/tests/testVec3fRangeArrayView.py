@@ -0,0 +1,86 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import array
+import pickle
+import unittest
+import gm
+
+
+class TestVec3fRangeArrayView(unittest.TestCase):
+    def testBufferView(self):
+        buf = array.array("f", range(18))
+        view = gm.Vec3fRangeArrayView(buf)
+        self.assertEqual(len(view), 3)
+        self.assertEqual(gm.Vec3fRangeArrayView.elementByteSize, 24)
+        self.assertFalse(view.readOnly)
+        self.assertIs(view.owner, buf)
+        self.assertEqual(view.Copy(), gm.Vec3fRangeArray(buf))
+
+        # Writes through the view are visible in the viewed buffer.
+        view[2] = view[0]
+        self.assertEqual(buf[12:].tolist(), buf[:6].tolist())
+
+    def testBytesView(self):
+        data = gm.Vec3fRangeArray(array.array("f", range(18))).to_bytes()
+        view = gm.Vec3fRangeArrayView(data)
+        self.assertTrue(view.readOnly)
+        self.assertEqual(view.to_bytes(), data)
+        with self.assertRaises(TypeError):
+            view[0] = view[1]
+
+    def testOffsetAndSize(self):
+        buf = array.array("f", range(18))
+        view = gm.Vec3fRangeArrayView(buf, byteOffset=24, size=1)
+        self.assertEqual(len(view), 1)
+        self.assertEqual(view.byteOffset, 24)
+        self.assertEqual(memoryview(view).tobytes(), buf[6:12].tobytes())
+
+        with self.assertRaises(ValueError):
+            gm.Vec3fRangeArrayView(buf, byteOffset=24, size=3)
+        with self.assertRaises(TypeError):
+            gm.Vec3fRangeArrayView(array.array("d", [0.0] * 6))
+
+    def testSlice(self):
+        buf = array.array("f", range(18))
+        view = gm.Vec3fRangeArrayView(buf)[1:]
+        self.assertEqual(len(view), 2)
+        self.assertEqual(view.byteOffset, 24)
+        self.assertEqual(memoryview(view).tobytes(), buf[6:].tobytes())
+        with self.assertRaises(ValueError):
+            gm.Vec3fRangeArrayView(buf)[::2]
+
+    def testRelease(self):
+        view = gm.Vec3fRangeArrayView(array.array("f", range(18)))
+        view.Release()
+        self.assertEqual(len(view), 0)
+        self.assertIsNone(view.owner)
+
+    def testSharedMemory(self):
+        view = gm.Vec3fRangeArrayView.CreateShared(3)
+        try:
+            memoryview(view).cast("B")[:] = array.array("f", range(18)).tobytes()
+            attached = gm.Vec3fRangeArrayView.AttachShared(view.owner.name, size=3)
+            self.assertEqual(attached.Copy(), view.Copy())
+
+            # Shared views are pickled by name.
+            copied = pickle.loads(pickle.dumps(view[1:]))
+            self.assertEqual(copied.owner.name, view.owner.name)
+            self.assertEqual(copied.Copy(), view[1:].Copy())
+
+            for sharedView in (attached, copied):
+                owner = sharedView.owner
+                sharedView.Release()
+                owner.close()
+        finally:
+            owner = view.owner
+            view.Release()
+            owner.close()
+            owner.unlink()
+
+    def testPickleCopy(self):
+        view = gm.Vec3fRangeArrayView(array.array("f", range(18)))
+        copied = pickle.loads(pickle.dumps(view))
+        self.assertFalse(copied.readOnly)
+        self.assertEqual(copied.Copy(), view.Copy())
@@ -2,6 +2,9 @@
 # This file is auto-generated, please do not modify directly!
 #
 
+import array
+import pickle
+import struct
 import unittest
 import gm
 
@@ -29,6 +32,50 @@ class TestVec3i(unittest.TestCase):
         self.assertAlmostEqual(vector[1], 2)
         self.assertAlmostEqual(vector[2], 4)
 
+    def testBufferProtocol(self):
+        vector = gm.Vec3i(0, 2, 4)
+        view = memoryview(vector)
+        self.assertEqual(view.format, "i")
+        self.assertEqual(view.shape, (3,))
+        self.assertEqual(view.nbytes, 12)
+
+        # Writes through the view are visible on the source object.
+        view[0] = 7
+        self.assertEqual(vector[0], 7)
+
+    def testBufferInitialization(self):
+        buf = array.array("i", [0, 2, 4])
+        self.assertEqual(gm.Vec3i(buf), gm.Vec3i(0, 2, 4))
+
+        # Round trip through another instance.
+        vector = gm.Vec3i(0, 2, 4)
+        self.assertEqual(gm.Vec3i(vector), vector)
+
+    def testBufferInitializationMismatch(self):
+        with self.assertRaises(TypeError):
+            gm.Vec3i(array.array("d", [0.0] * 3))
+
+        with self.assertRaises(ValueError):
+            gm.Vec3i(array.array("i", [0] * 4))
+
+    def testToBytes(self):
+        vector = gm.Vec3i(0, 2, 4)
+        data = vector.to_bytes()
+        self.assertEqual(
+            data, struct.pack("<3i", *[vector[index] for index in range(3)])
+        )
+        self.assertEqual(gm.Vec3i.from_bytes(data), vector)
+
+        with self.assertRaises(ValueError):
+            gm.Vec3i.from_bytes(data[:-1])
+
+    def testPickle(self):
+        vector = gm.Vec3i(0, 2, 4)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(
+                pickle.loads(pickle.dumps(vector, protocol=protocol)), vector
+            )
+
     def testNamedElementReadAccessX(self):
         vector = gm.Vec3i(0, 1, 2)
         self.assertEqual(vector.x, 0)
@@ -2,6 +2,7 @@
 # This file is auto-generated, please do not modify directly!
 #
 
+import pickle
 import unittest
 import gm
 
@@ -14,3 +15,21 @@ class TestVec3iRange(unittest.TestCase):
         gm.Vec3iRange(
             gm.Vec3i(), gm.Vec3i(),
         )
+
+    def testToBytes(self):
+        value = gm.Vec3iRange(gm.Vec3i(0, 1, 2), gm.Vec3i(0, 2, 4))
+        data = value.to_bytes()
+        self.assertEqual(len(data), 24)
+        copied = gm.Vec3iRange.from_bytes(data)
+        self.assertEqual(copied.min, value.min)
+        self.assertEqual(copied.max, value.max)
+
+        with self.assertRaises(ValueError):
+            gm.Vec3iRange.from_bytes(data + data)
+
+    def testPickle(self):
+        value = gm.Vec3iRange(gm.Vec3i(0, 1, 2), gm.Vec3i(0, 2, 4))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copied = pickle.loads(pickle.dumps(value, protocol=protocol))
+            self.assertEqual(copied.min, value.min)
+            self.assertEqual(copied.max, value.max)
@@ -2,6 +2,7 @@
 # This file is auto-generated, please do not modify directly!
 #
 
+import pickle
 import unittest
 import gm
 
@@ -14,3 +15,25 @@ class TestVec4fRange(unittest.TestCase):
         gm.Vec4fRange(
             gm.Vec4f(), gm.Vec4f(),
         )
+
+    def testToBytes(self):
+        value = gm.Vec4fRange(
+            gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+        )
+        data = value.to_bytes()
+        self.assertEqual(len(data), 32)
+        copied = gm.Vec4fRange.from_bytes(data)
+        self.assertEqual(copied.min, value.min)
+        self.assertEqual(copied.max, value.max)
+
+        with self.assertRaises(ValueError):
+            gm.Vec4fRange.from_bytes(data + data)
+
+    def testPickle(self):
+        value = gm.Vec4fRange(
+            gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+        )
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copied = pickle.loads(pickle.dumps(value, protocol=protocol))
+            self.assertEqual(copied.min, value.min)
+            self.assertEqual(copied.max, value.max)
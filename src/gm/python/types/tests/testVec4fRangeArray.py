@@ -0,0 +1,323 @@
+#
+# This file is auto-generated, please do not modify directly!
+#
+
+import array
+import pickle
+import struct
+import unittest
+import gm
+
+
+class TestVec4fRangeArray(unittest.TestCase):
+    def testDefaultInitialization(self):
+        self.assertEqual(len(gm.Vec4fRangeArray()), 0)
+
+    def testListInitialization(self):
+        values = gm.Vec4fRangeArray(
+            [
+                gm.Vec4fRange(),
+                gm.Vec4fRange(),
+                gm.Vec4fRange(),
+                gm.Vec4fRange(),
+                gm.Vec4fRange(),
+            ]
+        )
+        self.assertEqual(len(values), 5)
+
+    def testSizedInitialization(self):
+        self.assertEqual(len(gm.Vec4fRangeArray(5)), 5)
+
+    def testAppend(self):
+        values = gm.Vec4fRangeArray()
+        values.append(
+            gm.Vec4fRange(gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0))
+        )
+        values.append(
+            gm.Vec4fRange(gm.Vec4f(0.0, 2.0, 4.0, 6.0), gm.Vec4f(0.0, 3.0, 6.0, 9.0))
+        )
+        self.assertEqual(
+            values,
+            gm.Vec4fRangeArray(
+                [
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+                    ),
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 2.0, 4.0, 6.0), gm.Vec4f(0.0, 3.0, 6.0, 9.0)
+                    ),
+                ]
+            ),
+        )
+
+    def testExtend(self):
+        values = gm.Vec4fRangeArray(
+            [gm.Vec4fRange(gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0))]
+        )
+        values.extend(
+            gm.Vec4fRangeArray(
+                [
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 2.0, 4.0, 6.0), gm.Vec4f(0.0, 3.0, 6.0, 9.0)
+                    )
+                ]
+            )
+        )
+        values.extend(
+            [gm.Vec4fRange(gm.Vec4f(0.0, 3.0, 6.0, 9.0), gm.Vec4f(0.0, 4.0, 8.0, 12.0))]
+        )
+        values.extend(array.array("f", [0] * 16))
+        self.assertEqual(len(values), 5)
+        self.assertEqual(
+            values[:3],
+            gm.Vec4fRangeArray(
+                [
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+                    ),
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 2.0, 4.0, 6.0), gm.Vec4f(0.0, 3.0, 6.0, 9.0)
+                    ),
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 3.0, 6.0, 9.0), gm.Vec4f(0.0, 4.0, 8.0, 12.0)
+                    ),
+                ]
+            ),
+        )
+
+    def testExtendSelf(self):
+        values = gm.Vec4fRangeArray(
+            [
+                gm.Vec4fRange(
+                    gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+                ),
+                gm.Vec4fRange(
+                    gm.Vec4f(0.0, 2.0, 4.0, 6.0), gm.Vec4f(0.0, 3.0, 6.0, 9.0)
+                ),
+            ]
+        )
+        values.extend(values)
+        self.assertEqual(
+            values,
+            gm.Vec4fRangeArray(
+                [
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+                    ),
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 2.0, 4.0, 6.0), gm.Vec4f(0.0, 3.0, 6.0, 9.0)
+                    ),
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+                    ),
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 2.0, 4.0, 6.0), gm.Vec4f(0.0, 3.0, 6.0, 9.0)
+                    ),
+                ]
+            ),
+        )
+
+    def testIndexing(self):
+        values = gm.Vec4fRangeArray(3)
+        values[-1] = gm.Vec4fRange(
+            gm.Vec4f(0.0, 2.0, 4.0, 6.0), gm.Vec4f(0.0, 3.0, 6.0, 9.0)
+        )
+        self.assertEqual(
+            values[2:],
+            gm.Vec4fRangeArray(
+                [
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 2.0, 4.0, 6.0), gm.Vec4f(0.0, 3.0, 6.0, 9.0)
+                    )
+                ]
+            ),
+        )
+        with self.assertRaises(IndexError):
+            values[3]
+        del values[0]
+        self.assertEqual(len(values), 2)
+
+    def testSlicing(self):
+        values = gm.Vec4fRangeArray(
+            [
+                gm.Vec4fRange(
+                    gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+                ),
+                gm.Vec4fRange(
+                    gm.Vec4f(0.0, 2.0, 4.0, 6.0), gm.Vec4f(0.0, 3.0, 6.0, 9.0)
+                ),
+                gm.Vec4fRange(
+                    gm.Vec4f(0.0, 3.0, 6.0, 9.0), gm.Vec4f(0.0, 4.0, 8.0, 12.0)
+                ),
+            ]
+        )
+        self.assertEqual(
+            values[::2],
+            gm.Vec4fRangeArray(
+                [
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+                    ),
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 3.0, 6.0, 9.0), gm.Vec4f(0.0, 4.0, 8.0, 12.0)
+                    ),
+                ]
+            ),
+        )
+
+        values[1:] = gm.Vec4fRangeArray(
+            [
+                gm.Vec4fRange(
+                    gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+                ),
+                gm.Vec4fRange(
+                    gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+                ),
+            ]
+        )
+        self.assertEqual(values[1:2], values[0:1])
+
+        with self.assertRaises(ValueError):
+            values[1:] = gm.Vec4fRangeArray(1)
+
+    def testSliceAssignmentSelf(self):
+        values = gm.Vec4fRangeArray(
+            [
+                gm.Vec4fRange(
+                    gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+                ),
+                gm.Vec4fRange(
+                    gm.Vec4f(0.0, 2.0, 4.0, 6.0), gm.Vec4f(0.0, 3.0, 6.0, 9.0)
+                ),
+                gm.Vec4fRange(
+                    gm.Vec4f(0.0, 3.0, 6.0, 9.0), gm.Vec4f(0.0, 4.0, 8.0, 12.0)
+                ),
+            ]
+        )
+        values[::-1] = values
+        self.assertEqual(
+            values,
+            gm.Vec4fRangeArray(
+                [
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 3.0, 6.0, 9.0), gm.Vec4f(0.0, 4.0, 8.0, 12.0)
+                    ),
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 2.0, 4.0, 6.0), gm.Vec4f(0.0, 3.0, 6.0, 9.0)
+                    ),
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+                    ),
+                ]
+            ),
+        )
+
+    def testBufferProtocol(self):
+        values = gm.Vec4fRangeArray(4)
+        view = memoryview(values)
+        self.assertEqual(view.format, "f")
+        self.assertEqual(view.shape, (4, 2, 4))
+        self.assertEqual(view.nbytes, 128)
+
+    def testBufferExportsPreventResize(self):
+        values = gm.Vec4fRangeArray(4)
+        view = memoryview(values)
+        for resize in (
+            lambda: values.append(
+                gm.Vec4fRange(
+                    gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+                )
+            ),
+            lambda: values.extend(gm.Vec4fRangeArray(1)),
+            lambda: values.extend(array.array("f", [0] * 8)),
+            lambda: values.extend(
+                [
+                    gm.Vec4fRange(
+                        gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+                    )
+                ]
+            ),
+            lambda: values.resize(10000),
+            lambda: values.reserve(10000),
+            lambda: values.clear(),
+            lambda: values.__delitem__(0),
+        ):
+            with self.assertRaises(BufferError):
+                resize()
+        self.assertEqual(len(values), 4)
+
+        # Once the export is released, the array can be resized again.
+        view.release()
+        values.resize(10000)
+        self.assertEqual(len(values), 10000)
+
+    def testBufferInitialization(self):
+        buf = array.array("f", range(24))
+        values = gm.Vec4fRangeArray(buf)
+        self.assertEqual(len(values), 3)
+        self.assertEqual(memoryview(values).tobytes(), buf.tobytes())
+
+    def testBufferInitializationMismatch(self):
+        with self.assertRaises(TypeError):
+            gm.Vec4fRangeArray(array.array("d", [0.0] * 8))
+
+        with self.assertRaises(ValueError):
+            gm.Vec4fRangeArray(array.array("f", [0] * 9))
+
+    def testPickle(self):
+        values = gm.Vec4fRangeArray(
+            [
+                gm.Vec4fRange(
+                    gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+                ),
+                gm.Vec4fRange(
+                    gm.Vec4f(0.0, 2.0, 4.0, 6.0), gm.Vec4f(0.0, 3.0, 6.0, 9.0)
+                ),
+            ]
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(values)), values)
+
+    def testPickleProtocols(self):
+        values = gm.Vec4fRangeArray(
+            [
+                gm.Vec4fRange(
+                    gm.Vec4f(0.0, 1.0, 2.0, 3.0), gm.Vec4f(0.0, 2.0, 4.0, 6.0)
+                ),
+                gm.Vec4fRange(
+                    gm.Vec4f(0.0, 2.0, 4.0, 6.0), gm.Vec4f(0.0, 3.0, 6.0, 9.0)
+                ),
+            ]
+        )
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(
+                pickle.loads(pickle.dumps(values, protocol=protocol)), values
+            )
+
+    @unittest.skipIf(pickle.HIGHEST_PROTOCOL < 5, "Requires pickle protocol 5.")
+    def testPickleOutOfBand(self):
+        values = gm.Vec4fRangeArray(array.array("f", range(24)))
+        buffers = []
+        data = pickle.dumps(values, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(pickle.loads(data, buffers=buffers), values)
+
+        # The out-of-band buffers can be transferred as raw bytes.
+        self.assertEqual(
+            pickle.loads(data, buffers=[buffer.raw().tobytes() for buffer in buffers]),
+            values,
+        )
+
+        empty = gm.Vec4fRangeArray()
+        self.assertEqual(pickle.loads(pickle.dumps(empty, protocol=5)), empty)
+
+    def testToBytes(self):
+        values = gm.Vec4fRangeArray(array.array("f", range(24)))
+        data = values.to_bytes()
+        self.assertEqual(data, struct.pack("<24f", *range(24)))
+        self.assertEqual(gm.Vec4fRangeArray.from_bytes(data), values)
+        self.assertEqual(gm.Vec4fRangeArray.from_bytes(bytearray(data)), values)
+        self.assertEqual(len(gm.Vec4fRangeArray.from_bytes(b"")), 0)
+
+    def testFromBytesMismatch(self):
+        with self.assertRaises(ValueError):
+            gm.Vec4fRangeArray.from_bytes(b"\x00" * 33)
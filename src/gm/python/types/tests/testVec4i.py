@@ -2,6 +2,9 @@
 # This file is auto-generated, please do not modify directly!
 #
 
+import array
+import pickle
+import struct
 import unittest
 import gm
 
@@ -32,6 +35,50 @@ class TestVec4i(unittest.TestCase):
         self.assertAlmostEqual(vector[2], 4)
         self.assertAlmostEqual(vector[3], 6)
 
+    def testBufferProtocol(self):
+        vector = gm.Vec4i(0, 2, 4, 6)
+        view = memoryview(vector)
+        self.assertEqual(view.format, "i")
+        self.assertEqual(view.shape, (4,))
+        self.assertEqual(view.nbytes, 16)
+
+        # Writes through the view are visible on the source object.
+        view[0] = 7
+        self.assertEqual(vector[0], 7)
+
+    def testBufferInitialization(self):
+        buf = array.array("i", [0, 2, 4, 6])
+        self.assertEqual(gm.Vec4i(buf), gm.Vec4i(0, 2, 4, 6))
+
+        # Round trip through another instance.
+        vector = gm.Vec4i(0, 2, 4, 6)
+        self.assertEqual(gm.Vec4i(vector), vector)
+
+    def testBufferInitializationMismatch(self):
+        with self.assertRaises(TypeError):
+            gm.Vec4i(array.array("d", [0.0] * 4))
+
+        with self.assertRaises(ValueError):
+            gm.Vec4i(array.array("i", [0] * 5))
+
+    def testToBytes(self):
+        vector = gm.Vec4i(0, 2, 4, 6)
+        data = vector.to_bytes()
+        self.assertEqual(
+            data, struct.pack("<4i", *[vector[index] for index in range(4)])
+        )
+        self.assertEqual(gm.Vec4i.from_bytes(data), vector)
+
+        with self.assertRaises(ValueError):
+            gm.Vec4i.from_bytes(data[:-1])
+
+    def testPickle(self):
+        vector = gm.Vec4i(0, 2, 4, 6)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(
+                pickle.loads(pickle.dumps(vector, protocol=protocol)), vector
+            )
+
     def testNamedElementReadAccessX(self):
         vector = gm.Vec4i(0, 1, 2, 3)
         self.assertEqual(vector.x, 0)
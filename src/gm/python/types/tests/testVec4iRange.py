@@ -2,6 +2,7 @@
 # This file is auto-generated, please do not modify directly!
 #
 
+import pickle
 import unittest
 import gm
 
@@ -14,3 +15,21 @@ class TestVec4iRange(unittest.TestCase):
         gm.Vec4iRange(
             gm.Vec4i(), gm.Vec4i(),
         )
+
+    def testToBytes(self):
+        value = gm.Vec4iRange(gm.Vec4i(0, 1, 2, 3), gm.Vec4i(0, 2, 4, 6))
+        data = value.to_bytes()
+        self.assertEqual(len(data), 32)
+        copied = gm.Vec4iRange.from_bytes(data)
+        self.assertEqual(copied.min, value.min)
+        self.assertEqual(copied.max, value.max)
+
+        with self.assertRaises(ValueError):
+            gm.Vec4iRange.from_bytes(data + data)
+
+    def testPickle(self):
+        value = gm.Vec4iRange(gm.Vec4i(0, 1, 2, 3), gm.Vec4i(0, 2, 4, 6))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copied = pickle.loads(pickle.dumps(value, protocol=protocol))
+            self.assertEqual(copied.min, value.min)
+            self.assertEqual(copied.max, value.max)
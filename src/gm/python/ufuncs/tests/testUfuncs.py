@@ -0,0 +1,149 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import numpy
+import gm
+
+
+class TestUfuncs(unittest.TestCase):
+    def setUp(self):
+        self.lhs = numpy.arange(30, dtype=numpy.float32).reshape(10, 3)
+        self.rhs = numpy.arange(30, 60, dtype=numpy.float32).reshape(10, 3)
+
+    def testSignature(self):
+        self.assertIsInstance(gm.ufuncs.DotProduct_Vec3f_Vec3f, numpy.ufunc)
+        self.assertEqual(gm.ufuncs.DotProduct_Vec3f_Vec3f.signature, "(3),(3)->()")
+        self.assertEqual(
+            gm.ufuncs.MatrixProduct_Mat4f_Mat4f.signature, "(4,4),(4,4)->(4,4)"
+        )
+        self.assertEqual(gm.ufuncs.Clamp_Vec3f_FloatRange.signature, "(3),(2)->(3)")
+        self.assertIsNone(gm.ufuncs.Max_float_float.signature)
+
+    def testMatchesBatchedFunction(self):
+        numpy.testing.assert_array_equal(
+            gm.ufuncs.DotProduct_Vec3f_Vec3f(self.lhs, self.rhs),
+            gm.DotProduct(self.lhs, self.rhs),
+        )
+        numpy.testing.assert_array_equal(
+            gm.ufuncs.Length_Vec3f(self.lhs), gm.Length(self.lhs)
+        )
+        numpy.testing.assert_array_equal(
+            gm.ufuncs.Normalize_Vec3f(self.rhs), gm.Normalize(self.rhs)
+        )
+
+    def testBroadcasting(self):
+        # Outer dimensions broadcast against each other, and single elements broadcast across the arrays.
+        lhs = self.lhs.reshape(2, 5, 3)
+        rhs = numpy.array([1, 2, 3], dtype=numpy.float32)
+        result = gm.ufuncs.DotProduct_Vec3f_Vec3f(lhs, rhs)
+        self.assertEqual(result.shape, (2, 5))
+        numpy.testing.assert_array_equal(result, (lhs * rhs).sum(axis=-1))
+
+        result = gm.ufuncs.DotProduct_Vec3f_Vec3f(
+            lhs[:, numpy.newaxis], lhs[numpy.newaxis, :]
+        )
+        self.assertEqual(result.shape, (2, 2, 5))
+
+    def testStridedOperands(self):
+        # Non-contiguous elements and core dimensions are gathered into packed blocks.
+        points = numpy.arange(4000, dtype=numpy.float32).reshape(1000, 4)
+        numpy.testing.assert_allclose(
+            gm.ufuncs.Length_Vec3f(points[::-1, 2::-1]),
+            numpy.linalg.norm(points[::-1, :3], axis=-1),
+            rtol=1e-6,
+        )
+
+        matrices = numpy.random.RandomState(0).rand(300, 4, 4).astype(numpy.float32)
+        numpy.testing.assert_array_equal(
+            gm.ufuncs.Transpose_Mat4f(matrices.transpose(0, 2, 1)), matrices
+        )
+
+    def testOut(self):
+        out = numpy.zeros((10, 3), dtype=numpy.float32)
+        result = gm.ufuncs.CrossProduct_Vec3f_Vec3f(self.lhs, self.rhs, out=out)
+        self.assertIs(result, out)
+        numpy.testing.assert_array_equal(out, numpy.cross(self.lhs, self.rhs))
+
+        # Write into a strided view.
+        out = numpy.zeros((10, 6), dtype=numpy.float32)
+        gm.ufuncs.CrossProduct_Vec3f_Vec3f(self.lhs, self.rhs, out=out[:, ::2])
+        numpy.testing.assert_array_equal(out[:, ::2], numpy.cross(self.lhs, self.rhs))
+        numpy.testing.assert_array_equal(out[:, 1::2], 0)
+
+    def testOutAliasesInput(self):
+        # Outputs which are inputs are evaluated through scratch blocks, as the kernels must not write to their
+        # inputs: check each kernel set.
+        script = (
+            "import gm, numpy; "
+            "lhs = numpy.arange(300, dtype=numpy.float32).reshape(100, 3); "
+            "rhs = numpy.arange(300, 600, dtype=numpy.float32).reshape(100, 3); "
+            "expected = numpy.cross(lhs, rhs); "
+            "gm.ufuncs.CrossProduct_Vec3f_Vec3f(lhs, rhs, out=lhs); "
+            "numpy.testing.assert_array_equal(lhs, expected); "
+            "lhs = numpy.arange(300, dtype=numpy.float32).reshape(100, 3); "
+            "gm.ufuncs.CrossProduct_Vec3f_Vec3f(lhs, rhs, out=rhs); "
+            "numpy.testing.assert_array_equal(rhs, expected); "
+            "matrices = numpy.random.RandomState(0).rand(100, 4, 4).astype(numpy.float32); "
+            "expected = numpy.matmul(matrices, matrices); "
+            "gm.ufuncs.MatrixProduct_Mat4f_Mat4f(matrices, matrices, out=matrices); "
+            "numpy.testing.assert_allclose(matrices, expected, rtol=1e-6)"
+        )
+        for kernelSet in gm.GetKernelSets():
+            environment = dict(os.environ, GM_KERNEL_SET=kernelSet)
+            with self.subTest(kernelSet=kernelSet):
+                subprocess.check_call([sys.executable, "-c", script], env=environment)
+
+    def testMultipleOutputs(self):
+        angles = numpy.linspace(-4, 4, 100, dtype=numpy.float32)
+        sine, cosine = gm.ufuncs.ApproximateSineCosine_float_float_float(angles)
+        numpy.testing.assert_allclose(sine, numpy.sin(angles), atol=1e-6)
+        numpy.testing.assert_allclose(cosine, numpy.cos(angles), atol=1e-6)
+
+    def testCasting(self):
+        # Inputs are only cast to the float32 loop when permitted by the casting rule.
+        lhs = self.lhs.astype(numpy.float64)
+        with self.assertRaises(TypeError):
+            gm.ufuncs.DotProduct_Vec3f_Vec3f(lhs, self.rhs)
+
+        result = gm.ufuncs.DotProduct_Vec3f_Vec3f(
+            lhs, [1, 1, 1], dtype=numpy.float32, casting="same_kind"
+        )
+        self.assertEqual(result.dtype, numpy.float32)
+        numpy.testing.assert_array_equal(result, self.lhs.sum(axis=-1))
+
+        with self.assertRaises(TypeError):
+            gm.ufuncs.Length_Vec3f(self.lhs, out=numpy.zeros(10, dtype=numpy.int32))
+
+    def testCoreDimensionMismatch(self):
+        with self.assertRaises(ValueError):
+            gm.ufuncs.DotProduct_Vec3f_Vec3f(
+                numpy.zeros((10, 4), dtype=numpy.float32), self.rhs
+            )
+
+    def testReduce(self):
+        values = numpy.random.RandomState(0).rand(3, 1000).astype(numpy.float32)
+        self.assertEqual(
+            gm.ufuncs.Max_float_float.reduce(values, axis=None), values.max()
+        )
+        numpy.testing.assert_array_equal(
+            gm.ufuncs.Max_float_float.reduce(values, axis=1), values.max(axis=1)
+        )
+        numpy.testing.assert_array_equal(
+            gm.ufuncs.Min_float_float.reduce(values, axis=0), values.min(axis=0)
+        )
+        numpy.testing.assert_array_equal(
+            gm.ufuncs.Max_float_float.accumulate(values, axis=1),
+            numpy.maximum.accumulate(values, axis=1),
+        )
+
+    def testWhere(self):
+        values = numpy.arange(-5, 5, dtype=numpy.float32)
+        out = numpy.full(10, 7, dtype=numpy.float32)
+        gm.ufuncs.Abs_float(values, out=out, where=values < 0)
+        numpy.testing.assert_array_equal(out, numpy.where(values < 0, -values, 7))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,334 @@
+#pragma once
+
+// Inner loops of the NumPy universal functions, evaluating the batched function kernels.
+//
+// NumPy iterates over the broadcasted outer dimensions of the operands, and calls the inner loop of a ufunc
+// with one pointer and one byte step per operand, followed by the byte steps of the core dimensions of each
+// operand.  Loops over packed operands are handed to the kernel as they are, while strided operands are
+// gathered into, and scattered from, contiguous blocks of elements.
+
+#ifndef NPY_NO_DEPRECATED_API
+#define NPY_NO_DEPRECATED_API NPY_1_7_API_VERSION
+#endif
+
+#include <pybind11/pybind11.h>
+
+#include <numpy/ndarraytypes.h>
+#include <numpy/ufuncobject.h>
+
+#include "../functions/parallel.h"
+#include "../kernels/kernels.h"
+
+#include <algorithm>
+#include <cstring>
+#include <initializer_list>
+#include <vector>
+
+namespace gm_ufuncs
+{
+/// Maximum number of core dimensions of a single operand (the min, max and element dimensions of ranges, or the
+/// row and column dimensions of matrices).
+constexpr size_t c_maxCoreDimensions = 2;
+
+/// Number of elements of strided operands gathered into contiguous blocks at a time.
+constexpr npy_intp c_blockSize = 256;
+
+/// \struct UfuncOperand
+///
+/// An operand of a ufunc inner loop, whose elements are blocks of scalars of a fixed core shape.
+struct UfuncOperand
+{
+    /// The first element.
+    char* data;
+
+    /// The distance between consecutive elements, in bytes.
+    npy_intp step;
+
+    /// The size of a single scalar, in bytes.
+    size_t scalarSize;
+
+    /// The number of core dimensions.
+    size_t coreDimensionCount;
+
+    /// The size of each core dimension.
+    npy_intp coreShape[ c_maxCoreDimensions ];
+
+    /// The distance between consecutive scalars along each core dimension, in bytes.
+    npy_intp coreSteps[ c_maxCoreDimensions ];
+
+    /// Get the size of a single packed element, in bytes.
+    inline size_t ElementSize() const
+    {
+        size_t size = scalarSize;
+        for ( size_t dimension = 0; dimension < coreDimensionCount; ++dimension )
+        {
+            size *= coreShape[ dimension ];
+        }
+        return size;
+    }
+
+    /// Check if the scalars of each element are tightly packed, in row-major order.
+    inline bool IsCorePacked() const
+    {
+        npy_intp packedStep = scalarSize;
+        for ( size_t dimension = coreDimensionCount; dimension-- > 0; )
+        {
+            if ( coreShape[ dimension ] > 1 && coreSteps[ dimension ] != packedStep )
+            {
+                return false;
+            }
+            packedStep *= coreShape[ dimension ];
+        }
+        return true;
+    }
+
+    /// Check if this operand can be handed to a kernel as it is: either an array of packed elements, or a single
+    /// element broadcasted across the loop, which is only valid for inputs.
+    inline bool IsPacked( bool i_isInput ) const
+    {
+        return IsCorePacked() && ( step == npy_intp( ElementSize() ) || ( i_isInput && step == 0 ) );
+    }
+
+    /// Get the range of bytes [\p o_begin, \p o_end) spanned by the first \p i_count elements.
+    inline void GetExtent( npy_intp i_count, const char*& o_begin, const char*& o_end ) const
+    {
+        o_begin = data + std::min< npy_intp >( 0, ( i_count - 1 ) * step );
+        o_end   = data + std::max< npy_intp >( 0, ( i_count - 1 ) * step ) + scalarSize;
+        for ( size_t dimension = 0; dimension < coreDimensionCount; ++dimension )
+        {
+            npy_intp offset = ( coreShape[ dimension ] - 1 ) * coreSteps[ dimension ];
+            o_begin += std::min< npy_intp >( 0, offset );
+            o_end += std::max< npy_intp >( 0, offset );
+        }
+    }
+
+    /// Copy the element at \p i_index into the packed element \p o_element.
+    inline void Load( npy_intp i_index, char* o_element ) const
+    {
+        const char* element = data + i_index * step;
+        if ( coreDimensionCount == 0 )
+        {
+            std::memcpy( o_element, element, scalarSize );
+        }
+        else if ( coreDimensionCount == 1 )
+        {
+            for ( npy_intp index = 0; index < coreShape[ 0 ]; ++index )
+            {
+                std::memcpy( o_element + index * scalarSize, element + index * coreSteps[ 0 ], scalarSize );
+            }
+        }
+        else
+        {
+            for ( npy_intp row = 0; row < coreShape[ 0 ]; ++row )
+            {
+                for ( npy_intp column = 0; column < coreShape[ 1 ]; ++column )
+                {
+                    std::memcpy( o_element + ( row * coreShape[ 1 ] + column ) * scalarSize,
+                                 element + row * coreSteps[ 0 ] + column * coreSteps[ 1 ],
+                                 scalarSize );
+                }
+            }
+        }
+    }
+
+    /// Copy the packed element \p i_element into the element at \p i_index.
+    inline void Store( const char* i_element, npy_intp i_index ) const
+    {
+        char* element = data + i_index * step;
+        if ( coreDimensionCount == 0 )
+        {
+            std::memcpy( element, i_element, scalarSize );
+        }
+        else if ( coreDimensionCount == 1 )
+        {
+            for ( npy_intp index = 0; index < coreShape[ 0 ]; ++index )
+            {
+                std::memcpy( element + index * coreSteps[ 0 ], i_element + index * scalarSize, scalarSize );
+            }
+        }
+        else
+        {
+            for ( npy_intp row = 0; row < coreShape[ 0 ]; ++row )
+            {
+                for ( npy_intp column = 0; column < coreShape[ 1 ]; ++column )
+                {
+                    std::memcpy( element + row * coreSteps[ 0 ] + column * coreSteps[ 1 ],
+                                 i_element + ( row * coreShape[ 1 ] + column ) * scalarSize,
+                                 scalarSize );
+                }
+            }
+        }
+    }
+};
+
+/// Describe the operand of scalar type \p ScalarT, starting at \p i_data with elements \p i_step bytes apart,
+/// and of core shape \p i_coreShape.
+///
+/// The core steps of the operand are read from \p io_coreSteps, which is advanced past them.
+template < typename ScalarT >
+inline UfuncOperand MakeUfuncOperand( char*                             i_data,
+                                      npy_intp                          i_step,
+                                      std::initializer_list< npy_intp > i_coreShape,
+                                      const npy_intp*&                  io_coreSteps )
+{
+    UfuncOperand operand{i_data, i_step, sizeof( ScalarT ), i_coreShape.size(), {1, 1}, {0, 0}};
+    size_t       dimension = 0;
+    for ( npy_intp size : i_coreShape )
+    {
+        operand.coreShape[ dimension ] = size;
+        operand.coreSteps[ dimension ] = *io_coreSteps++;
+        ++dimension;
+    }
+    return operand;
+}
+
+/// Evaluate the kernel \p i_kernel, of the active kernel set, over the \p i_count elements of the operands
+/// \p i_operands: the \p i_inputCount inputs, followed by the outputs.
+template < size_t OperandCountT >
+inline void EvaluateUfunc( gm_kernels::Kernel gm_kernels::KernelSet::*i_kernel,
+                           npy_intp                                   i_count,
+                           const UfuncOperand ( &i_operands )[ OperandCountT ],
+                           size_t i_inputCount )
+{
+    const gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().*i_kernel;
+    gm_kernels::KernelArg    args[ OperandCountT ];
+
+    // Reductions and accumulations store each output element into, or right before, the next input element: the
+    // elements must then be evaluated one at a time, in order.
+    bool isSequential = false;
+
+    // The kernels must not write outputs aliasing their inputs (see base/batch.h): outputs evaluated in place are
+    // instead evaluated into a scratch block, then stored.
+    bool isAliased[ OperandCountT ] = {};
+    for ( size_t output = i_inputCount; output < OperandCountT; ++output )
+    {
+        const UfuncOperand& outputOperand = i_operands[ output ];
+        isSequential                      = isSequential || ( outputOperand.step == 0 && i_count > 1 );
+
+        const char* outputBegin;
+        const char* outputEnd;
+        outputOperand.GetExtent( i_count, outputBegin, outputEnd );
+        for ( size_t input = 0; input < i_inputCount; ++input )
+        {
+            const UfuncOperand& inputOperand = i_operands[ input ];
+            if ( inputOperand.data == outputOperand.data && inputOperand.step == outputOperand.step )
+            {
+                // Elements evaluated in place.
+                isAliased[ output ] = true;
+                continue;
+            }
+
+            const char* inputBegin;
+            const char* inputEnd;
+            inputOperand.GetExtent( i_count, inputBegin, inputEnd );
+            isSequential = isSequential || ( inputBegin < outputEnd && outputBegin < inputEnd );
+        }
+    }
+
+    // Packed operands are evaluated in place, distributing the elements across threads.
+    bool isPacked = !isSequential;
+    for ( size_t index = 0; index < OperandCountT; ++index )
+    {
+        isPacked = isPacked && !isAliased[ index ] && i_operands[ index ].IsPacked( index < i_inputCount );
+    }
+
+    if ( isPacked )
+    {
+        for ( size_t index = 0; index < OperandCountT; ++index )
+        {
+            args[ index ] =
+                gm_kernels::KernelArg{i_operands[ index ].data, i_operands[ index ].step == 0 ? size_t( 0 ) : 1};
+        }
+
+        GM_NS::ParallelFor( i_count, [&]( size_t i_begin, size_t i_end ) { kernel( args, i_begin, i_end ); } );
+        return;
+    }
+
+    // Strided and aliased operands are gathered into blocks of packed elements.
+    const npy_intp blockSize = isSequential ? 1 : c_blockSize;
+
+    std::vector< char > blocks[ OperandCountT ];
+    for ( size_t index = 0; index < OperandCountT; ++index )
+    {
+        if ( isAliased[ index ] || !i_operands[ index ].IsPacked( index < i_inputCount ) )
+        {
+            blocks[ index ].resize( i_operands[ index ].ElementSize() * blockSize );
+        }
+    }
+
+    for ( npy_intp begin = 0; begin < i_count; begin += blockSize )
+    {
+        npy_intp count = std::min( blockSize, i_count - begin );
+        for ( size_t index = 0; index < OperandCountT; ++index )
+        {
+            const UfuncOperand& operand = i_operands[ index ];
+            if ( blocks[ index ].empty() )
+            {
+                args[ index ] =
+                    gm_kernels::KernelArg{operand.data + begin * operand.step, operand.step == 0 ? size_t( 0 ) : 1};
+            }
+            else
+            {
+                args[ index ] = gm_kernels::KernelArg{blocks[ index ].data(), 1};
+                if ( index < i_inputCount )
+                {
+                    for ( npy_intp element = 0; element < count; ++element )
+                    {
+                        operand.Load( begin + element, blocks[ index ].data() + element * operand.ElementSize() );
+                    }
+                }
+            }
+        }
+
+        kernel( args, 0, count );
+
+        for ( size_t index = i_inputCount; index < OperandCountT; ++index )
+        {
+            const UfuncOperand& operand = i_operands[ index ];
+            if ( !blocks[ index ].empty() )
+            {
+                for ( npy_intp element = 0; element < count; ++element )
+                {
+                    operand.Store( blocks[ index ].data() + element * operand.ElementSize(), begin + element );
+                }
+            }
+        }
+    }
+}
+
+/// Add the ufunc \p i_name to the module \p o_module, with a single inner loop \p i_loop, over operands of the
+/// NumPy types \p i_types.
+///
+/// \param i_identity The identity of reductions, PyUFunc_ReorderableNone for reductions which can be evaluated
+/// in any order, or PyUFunc_None.
+/// \param i_signature The core signature of a generalized ufunc, or nullptr for an element-wise ufunc.
+inline void AddUfunc( pybind11::module&       o_module,
+                      const char*             i_name,
+                      const char*             i_doc,
+                      PyUFuncGenericFunction* i_loop,
+                      char*                   i_types,
+                      int                     i_inputCount,
+                      int                     i_outputCount,
+                      int                     i_identity,
+                      const char*             i_signature )
+{
+    static void* s_data[] = {nullptr};
+    PyObject*    ufunc    = PyUFunc_FromFuncAndDataAndSignature( i_loop,
+                                                           s_data,
+                                                           i_types,
+                                                           1,
+                                                           i_inputCount,
+                                                           i_outputCount,
+                                                           i_identity,
+                                                           i_name,
+                                                           i_doc,
+                                                           0,
+                                                           i_signature );
+    if ( ufunc == nullptr )
+    {
+        throw pybind11::error_already_set();
+    }
+    o_module.add_object( i_name, pybind11::reinterpret_steal< pybind11::object >( ufunc ) );
+}
+
+} // namespace gm_ufuncs
@@ -0,0 +1,5445 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+// NumPy universal functions, evaluating each batchable function interface with the active kernel set.
+//
+// Each ufunc is named after the kernel of its interface, e.g. DotProduct_Vec3f_Vec3f, and composes with the
+// NumPy iteration machinery: broadcasting of the outer dimensions, out= arguments and type casting.  Interfaces
+// over scalar operands are element-wise ufuncs, the others are generalized ufuncs with fixed core dimensions.
+
+#include "ufunc.h"
+
+namespace
+{
+void LinearInterpolation_float_float_float( char**          i_args,
+                                            const npy_intp* i_dimensions,
+                                            const npy_intp* i_steps,
+                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearInterpolation_float_float_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearInterpolation_float_float_floatLoop[]  = {&LinearInterpolation_float_float_float};
+char                   s_LinearInterpolation_float_float_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LinearInterpolation_Mat3f_Mat3f_float( char**          i_args,
+                                            const npy_intp* i_dimensions,
+                                            const npy_intp* i_steps,
+                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearInterpolation_Mat3f_Mat3f_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearInterpolation_Mat3f_Mat3f_floatLoop[]  = {&LinearInterpolation_Mat3f_Mat3f_float};
+char                   s_LinearInterpolation_Mat3f_Mat3f_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LinearInterpolation_Mat4f_Mat4f_float( char**          i_args,
+                                            const npy_intp* i_dimensions,
+                                            const npy_intp* i_steps,
+                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearInterpolation_Mat4f_Mat4f_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearInterpolation_Mat4f_Mat4f_floatLoop[]  = {&LinearInterpolation_Mat4f_Mat4f_float};
+char                   s_LinearInterpolation_Mat4f_Mat4f_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LinearInterpolation_Vec2f_Vec2f_float( char**          i_args,
+                                            const npy_intp* i_dimensions,
+                                            const npy_intp* i_steps,
+                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearInterpolation_Vec2f_Vec2f_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearInterpolation_Vec2f_Vec2f_floatLoop[]  = {&LinearInterpolation_Vec2f_Vec2f_float};
+char                   s_LinearInterpolation_Vec2f_Vec2f_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LinearInterpolation_Vec3f_Vec3f_float( char**          i_args,
+                                            const npy_intp* i_dimensions,
+                                            const npy_intp* i_steps,
+                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearInterpolation_Vec3f_Vec3f_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearInterpolation_Vec3f_Vec3f_floatLoop[]  = {&LinearInterpolation_Vec3f_Vec3f_float};
+char                   s_LinearInterpolation_Vec3f_Vec3f_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LinearInterpolation_Vec4f_Vec4f_float( char**          i_args,
+                                            const npy_intp* i_dimensions,
+                                            const npy_intp* i_steps,
+                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearInterpolation_Vec4f_Vec4f_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearInterpolation_Vec4f_Vec4f_floatLoop[]  = {&LinearInterpolation_Vec4f_Vec4f_float};
+char                   s_LinearInterpolation_Vec4f_Vec4f_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LinearInterpolation_Vec2fRange_Vec2fRange_float( char**          i_args,
+                                                      const npy_intp* i_dimensions,
+                                                      const npy_intp* i_steps,
+                                                      void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {2, 2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearInterpolation_Vec2fRange_Vec2fRange_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearInterpolation_Vec2fRange_Vec2fRange_floatLoop[] = {
+    &LinearInterpolation_Vec2fRange_Vec2fRange_float};
+char s_LinearInterpolation_Vec2fRange_Vec2fRange_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LinearInterpolation_Vec3fRange_Vec3fRange_float( char**          i_args,
+                                                      const npy_intp* i_dimensions,
+                                                      const npy_intp* i_steps,
+                                                      void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {2, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearInterpolation_Vec3fRange_Vec3fRange_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearInterpolation_Vec3fRange_Vec3fRange_floatLoop[] = {
+    &LinearInterpolation_Vec3fRange_Vec3fRange_float};
+char s_LinearInterpolation_Vec3fRange_Vec3fRange_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LinearInterpolation_Vec4fRange_Vec4fRange_float( char**          i_args,
+                                                      const npy_intp* i_dimensions,
+                                                      const npy_intp* i_steps,
+                                                      void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {2, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearInterpolation_Vec4fRange_Vec4fRange_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearInterpolation_Vec4fRange_Vec4fRange_floatLoop[] = {
+    &LinearInterpolation_Vec4fRange_Vec4fRange_float};
+char s_LinearInterpolation_Vec4fRange_Vec4fRange_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LinearInterpolation_FloatRange_FloatRange_float( char**          i_args,
+                                                      const npy_intp* i_dimensions,
+                                                      const npy_intp* i_steps,
+                                                      void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearInterpolation_FloatRange_FloatRange_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearInterpolation_FloatRange_FloatRange_floatLoop[] = {
+    &LinearInterpolation_FloatRange_FloatRange_float};
+char s_LinearInterpolation_FloatRange_FloatRange_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Normalize_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Normalize_Vec2f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Normalize_Vec2fLoop[]  = {&Normalize_Vec2f};
+char                   s_Normalize_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Normalize_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Normalize_Vec3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Normalize_Vec3fLoop[]  = {&Normalize_Vec3f};
+char                   s_Normalize_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Normalize_Vec4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Normalize_Vec4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Normalize_Vec4fLoop[]  = {&Normalize_Vec4f};
+char                   s_Normalize_Vec4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Normalize_Quatf( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Normalize_Quatf, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Normalize_QuatfLoop[]  = {&Normalize_Quatf};
+char                   s_Normalize_QuatfTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Inverse_Mat3f_Mat3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Inverse_Mat3f_Mat3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Inverse_Mat3f_Mat3fLoop[]  = {&Inverse_Mat3f_Mat3f};
+char                   s_Inverse_Mat3f_Mat3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_BOOL};
+
+void Inverse_Mat4f_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Inverse_Mat4f_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Inverse_Mat4f_Mat4fLoop[]  = {&Inverse_Mat4f_Mat4f};
+char                   s_Inverse_Mat4f_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_BOOL};
+
+void Min_float_float( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Min_float_float, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Min_float_floatLoop[]  = {&Min_float_float};
+char                   s_Min_float_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Min_int_int( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Min_int_int, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Min_int_intLoop[]  = {&Min_int_int};
+char                   s_Min_int_intTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Min_bool_bool( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Min_bool_bool, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Min_bool_boolLoop[]  = {&Min_bool_bool};
+char                   s_Min_bool_boolTypes[] = {NPY_BOOL, NPY_BOOL, NPY_BOOL};
+
+void Min_Vec2f_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Min_Vec2f_Vec2f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Min_Vec2f_Vec2fLoop[]  = {&Min_Vec2f_Vec2f};
+char                   s_Min_Vec2f_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Min_Vec3f_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Min_Vec3f_Vec3f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Min_Vec3f_Vec3fLoop[]  = {&Min_Vec3f_Vec3f};
+char                   s_Min_Vec3f_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Min_Vec4f_Vec4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Min_Vec4f_Vec4f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Min_Vec4f_Vec4fLoop[]  = {&Min_Vec4f_Vec4f};
+char                   s_Min_Vec4f_Vec4fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Min_Vec2i_Vec2i( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Min_Vec2i_Vec2i, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Min_Vec2i_Vec2iLoop[]  = {&Min_Vec2i_Vec2i};
+char                   s_Min_Vec2i_Vec2iTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Min_Vec3i_Vec3i( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Min_Vec3i_Vec3i, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Min_Vec3i_Vec3iLoop[]  = {&Min_Vec3i_Vec3i};
+char                   s_Min_Vec3i_Vec3iTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Min_Vec4i_Vec4i( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Min_Vec4i_Vec4i, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Min_Vec4i_Vec4iLoop[]  = {&Min_Vec4i_Vec4i};
+char                   s_Min_Vec4i_Vec4iTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Min_Mat3f_Mat3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Min_Mat3f_Mat3f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Min_Mat3f_Mat3fLoop[]  = {&Min_Mat3f_Mat3f};
+char                   s_Min_Mat3f_Mat3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Min_Mat4f_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Min_Mat4f_Mat4f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Min_Mat4f_Mat4fLoop[]  = {&Min_Mat4f_Mat4f};
+char                   s_Min_Mat4f_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void QuaternionProduct_Quatf_Quatf( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::QuaternionProduct_Quatf_Quatf, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_QuaternionProduct_Quatf_QuatfLoop[]  = {&QuaternionProduct_Quatf_Quatf};
+char                   s_QuaternionProduct_Quatf_QuatfTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Contains_FloatRange_float( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_FloatRange_float, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_FloatRange_floatLoop[]  = {&Contains_FloatRange_float};
+char                   s_Contains_FloatRange_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_BOOL};
+
+void Contains_FloatRange_FloatRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_FloatRange_FloatRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_FloatRange_FloatRangeLoop[]  = {&Contains_FloatRange_FloatRange};
+char                   s_Contains_FloatRange_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_BOOL};
+
+void Contains_IntRange_int( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_IntRange_int, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_IntRange_intLoop[]  = {&Contains_IntRange_int};
+char                   s_Contains_IntRange_intTypes[] = {NPY_INT, NPY_INT, NPY_BOOL};
+
+void Contains_IntRange_IntRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_IntRange_IntRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_IntRange_IntRangeLoop[]  = {&Contains_IntRange_IntRange};
+char                   s_Contains_IntRange_IntRangeTypes[] = {NPY_INT, NPY_INT, NPY_BOOL};
+
+void Contains_Vec2fRange_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_Vec2fRange_Vec2f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_Vec2fRange_Vec2fLoop[]  = {&Contains_Vec2fRange_Vec2f};
+char                   s_Contains_Vec2fRange_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_BOOL};
+
+void Contains_Vec2fRange_Vec2fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_Vec2fRange_Vec2fRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_Vec2fRange_Vec2fRangeLoop[]  = {&Contains_Vec2fRange_Vec2fRange};
+char                   s_Contains_Vec2fRange_Vec2fRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_BOOL};
+
+void Contains_Vec3fRange_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_Vec3fRange_Vec3f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_Vec3fRange_Vec3fLoop[]  = {&Contains_Vec3fRange_Vec3f};
+char                   s_Contains_Vec3fRange_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_BOOL};
+
+void Contains_Vec3fRange_Vec3fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_Vec3fRange_Vec3fRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_Vec3fRange_Vec3fRangeLoop[]  = {&Contains_Vec3fRange_Vec3fRange};
+char                   s_Contains_Vec3fRange_Vec3fRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_BOOL};
+
+void Contains_Vec4fRange_Vec4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_Vec4fRange_Vec4f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_Vec4fRange_Vec4fLoop[]  = {&Contains_Vec4fRange_Vec4f};
+char                   s_Contains_Vec4fRange_Vec4fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_BOOL};
+
+void Contains_Vec4fRange_Vec4fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_Vec4fRange_Vec4fRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_Vec4fRange_Vec4fRangeLoop[]  = {&Contains_Vec4fRange_Vec4fRange};
+char                   s_Contains_Vec4fRange_Vec4fRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_BOOL};
+
+void Contains_Vec2iRange_Vec2i( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_Vec2iRange_Vec2i, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_Vec2iRange_Vec2iLoop[]  = {&Contains_Vec2iRange_Vec2i};
+char                   s_Contains_Vec2iRange_Vec2iTypes[] = {NPY_INT, NPY_INT, NPY_BOOL};
+
+void Contains_Vec2iRange_Vec2iRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_Vec2iRange_Vec2iRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_Vec2iRange_Vec2iRangeLoop[]  = {&Contains_Vec2iRange_Vec2iRange};
+char                   s_Contains_Vec2iRange_Vec2iRangeTypes[] = {NPY_INT, NPY_INT, NPY_BOOL};
+
+void Contains_Vec3iRange_Vec3i( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_Vec3iRange_Vec3i, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_Vec3iRange_Vec3iLoop[]  = {&Contains_Vec3iRange_Vec3i};
+char                   s_Contains_Vec3iRange_Vec3iTypes[] = {NPY_INT, NPY_INT, NPY_BOOL};
+
+void Contains_Vec3iRange_Vec3iRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_Vec3iRange_Vec3iRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_Vec3iRange_Vec3iRangeLoop[]  = {&Contains_Vec3iRange_Vec3iRange};
+char                   s_Contains_Vec3iRange_Vec3iRangeTypes[] = {NPY_INT, NPY_INT, NPY_BOOL};
+
+void Contains_Vec4iRange_Vec4i( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_Vec4iRange_Vec4i, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_Vec4iRange_Vec4iLoop[]  = {&Contains_Vec4iRange_Vec4i};
+char                   s_Contains_Vec4iRange_Vec4iTypes[] = {NPY_INT, NPY_INT, NPY_BOOL};
+
+void Contains_Vec4iRange_Vec4iRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Contains_Vec4iRange_Vec4iRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Contains_Vec4iRange_Vec4iRangeLoop[]  = {&Contains_Vec4iRange_Vec4iRange};
+char                   s_Contains_Vec4iRange_Vec4iRangeTypes[] = {NPY_INT, NPY_INT, NPY_BOOL};
+
+void ApproximateSetRotate_float_Vec3f_Mat4f( char**          i_args,
+                                             const npy_intp* i_dimensions,
+                                             const npy_intp* i_steps,
+                                             void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ApproximateSetRotate_float_Vec3f_Mat4f,
+                              i_dimensions[ 0 ],
+                              operands,
+                              2 );
+}
+
+PyUFuncGenericFunction s_ApproximateSetRotate_float_Vec3f_Mat4fLoop[]  = {&ApproximateSetRotate_float_Vec3f_Mat4f};
+char                   s_ApproximateSetRotate_float_Vec3f_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void ApproximateSetRotate_float_Vec3f_Quatf( char**          i_args,
+                                             const npy_intp* i_dimensions,
+                                             const npy_intp* i_steps,
+                                             void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ApproximateSetRotate_float_Vec3f_Quatf,
+                              i_dimensions[ 0 ],
+                              operands,
+                              2 );
+}
+
+PyUFuncGenericFunction s_ApproximateSetRotate_float_Vec3f_QuatfLoop[]  = {&ApproximateSetRotate_float_Vec3f_Quatf};
+char                   s_ApproximateSetRotate_float_Vec3f_QuatfTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Content_FloatRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Content_FloatRange, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Content_FloatRangeLoop[]  = {&Content_FloatRange};
+char                   s_Content_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Content_IntRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Content_IntRange, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Content_IntRangeLoop[]  = {&Content_IntRange};
+char                   s_Content_IntRangeTypes[] = {NPY_INT, NPY_INT};
+
+void Content_Vec2fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Content_Vec2fRange, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Content_Vec2fRangeLoop[]  = {&Content_Vec2fRange};
+char                   s_Content_Vec2fRangeTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Content_Vec3fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Content_Vec3fRange, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Content_Vec3fRangeLoop[]  = {&Content_Vec3fRange};
+char                   s_Content_Vec3fRangeTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Content_Vec4fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Content_Vec4fRange, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Content_Vec4fRangeLoop[]  = {&Content_Vec4fRange};
+char                   s_Content_Vec4fRangeTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Content_Vec2iRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Content_Vec2iRange, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Content_Vec2iRangeLoop[]  = {&Content_Vec2iRange};
+char                   s_Content_Vec2iRangeTypes[] = {NPY_INT, NPY_INT};
+
+void Content_Vec3iRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Content_Vec3iRange, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Content_Vec3iRangeLoop[]  = {&Content_Vec3iRange};
+char                   s_Content_Vec3iRangeTypes[] = {NPY_INT, NPY_INT};
+
+void Content_Vec4iRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Content_Vec4iRange, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Content_Vec4iRangeLoop[]  = {&Content_Vec4iRange};
+char                   s_Content_Vec4iRangeTypes[] = {NPY_INT, NPY_INT};
+
+void SphericalLinearInterpolation_Quatf_Quatf_float( char**          i_args,
+                                                     const npy_intp* i_dimensions,
+                                                     const npy_intp* i_steps,
+                                                     void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::SphericalLinearInterpolation_Quatf_Quatf_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_SphericalLinearInterpolation_Quatf_Quatf_floatLoop[] = {
+    &SphericalLinearInterpolation_Quatf_Quatf_float};
+char s_SphericalLinearInterpolation_Quatf_Quatf_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Abs_float( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Abs_float, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Abs_floatLoop[]  = {&Abs_float};
+char                   s_Abs_floatTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Abs_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Abs_Vec2f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Abs_Vec2fLoop[]  = {&Abs_Vec2f};
+char                   s_Abs_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Abs_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Abs_Vec3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Abs_Vec3fLoop[]  = {&Abs_Vec3f};
+char                   s_Abs_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Abs_Vec4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Abs_Vec4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Abs_Vec4fLoop[]  = {&Abs_Vec4f};
+char                   s_Abs_Vec4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Abs_Mat3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Abs_Mat3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Abs_Mat3fLoop[]  = {&Abs_Mat3f};
+char                   s_Abs_Mat3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Abs_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Abs_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Abs_Mat4fLoop[]  = {&Abs_Mat4f};
+char                   s_Abs_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void IsIdentity_Mat3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::IsIdentity_Mat3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_IsIdentity_Mat3fLoop[]  = {&IsIdentity_Mat3f};
+char                   s_IsIdentity_Mat3fTypes[] = {NPY_FLOAT, NPY_BOOL};
+
+void IsIdentity_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::IsIdentity_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_IsIdentity_Mat4fLoop[]  = {&IsIdentity_Mat4f};
+char                   s_IsIdentity_Mat4fTypes[] = {NPY_FLOAT, NPY_BOOL};
+
+void ApproximateNormalize_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ApproximateNormalize_Vec2f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_ApproximateNormalize_Vec2fLoop[]  = {&ApproximateNormalize_Vec2f};
+char                   s_ApproximateNormalize_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void ApproximateNormalize_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ApproximateNormalize_Vec3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_ApproximateNormalize_Vec3fLoop[]  = {&ApproximateNormalize_Vec3f};
+char                   s_ApproximateNormalize_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void ApproximateNormalize_Vec4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ApproximateNormalize_Vec4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_ApproximateNormalize_Vec4fLoop[]  = {&ApproximateNormalize_Vec4f};
+char                   s_ApproximateNormalize_Vec4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void ApproximateNormalize_Quatf( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ApproximateNormalize_Quatf, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_ApproximateNormalize_QuatfLoop[]  = {&ApproximateNormalize_Quatf};
+char                   s_ApproximateNormalize_QuatfTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f( char**          i_args,
+                                                                                   const npy_intp* i_dimensions,
+                                                                                   const npy_intp* i_steps,
+                                                                                   void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 10;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 5 ], i_steps[ 5 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 6 ], i_steps[ 6 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 7 ], i_steps[ 7 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 8 ], i_steps[ 8 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 9 ], i_steps[ 9 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc(
+        &gm_kernels::KernelSet::TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f,
+        i_dimensions[ 0 ],
+        operands,
+        9 );
+}
+
+PyUFuncGenericFunction s_TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3fLoop[] = {
+    &TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f};
+char s_TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3fTypes[] =
+    {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f( char**          i_args,
+                                                                                   const npy_intp* i_dimensions,
+                                                                                   const npy_intp* i_steps,
+                                                                                   void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 10;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 5 ], i_steps[ 5 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 6 ], i_steps[ 6 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 7 ], i_steps[ 7 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 8 ], i_steps[ 8 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 9 ], i_steps[ 9 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc(
+        &gm_kernels::KernelSet::TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f,
+        i_dimensions[ 0 ],
+        operands,
+        9 );
+}
+
+PyUFuncGenericFunction s_TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3fLoop[] = {
+    &TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f};
+char s_TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3fTypes[] =
+    {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f( char**          i_args,
+                                                                                   const npy_intp* i_dimensions,
+                                                                                   const npy_intp* i_steps,
+                                                                                   void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 10;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 5 ], i_steps[ 5 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 6 ], i_steps[ 6 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 7 ], i_steps[ 7 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 8 ], i_steps[ 8 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 9 ], i_steps[ 9 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc(
+        &gm_kernels::KernelSet::TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f,
+        i_dimensions[ 0 ],
+        operands,
+        9 );
+}
+
+PyUFuncGenericFunction s_TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3fLoop[] = {
+    &TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f};
+char s_TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3fTypes[] =
+    {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f( char**          i_args,
+                                                                                   const npy_intp* i_dimensions,
+                                                                                   const npy_intp* i_steps,
+                                                                                   void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 10;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 5 ], i_steps[ 5 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 6 ], i_steps[ 6 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 7 ], i_steps[ 7 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 8 ], i_steps[ 8 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 9 ], i_steps[ 9 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc(
+        &gm_kernels::KernelSet::TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f,
+        i_dimensions[ 0 ],
+        operands,
+        9 );
+}
+
+PyUFuncGenericFunction s_TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3fLoop[] = {
+    &TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f};
+char s_TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3fTypes[] =
+    {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f( char**          i_args,
+                                                                                   const npy_intp* i_dimensions,
+                                                                                   const npy_intp* i_steps,
+                                                                                   void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 10;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 5 ], i_steps[ 5 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 6 ], i_steps[ 6 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 7 ], i_steps[ 7 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 8 ], i_steps[ 8 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 9 ], i_steps[ 9 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc(
+        &gm_kernels::KernelSet::TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f,
+        i_dimensions[ 0 ],
+        operands,
+        9 );
+}
+
+PyUFuncGenericFunction s_TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3fLoop[] = {
+    &TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f};
+char s_TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3fTypes[] =
+    {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f( char**          i_args,
+                                                                                   const npy_intp* i_dimensions,
+                                                                                   const npy_intp* i_steps,
+                                                                                   void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 10;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 5 ], i_steps[ 5 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 6 ], i_steps[ 6 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 7 ], i_steps[ 7 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 8 ], i_steps[ 8 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 9 ], i_steps[ 9 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc(
+        &gm_kernels::KernelSet::TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f,
+        i_dimensions[ 0 ],
+        operands,
+        9 );
+}
+
+PyUFuncGenericFunction s_TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3fLoop[] = {
+    &TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f};
+char s_TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3fTypes[] =
+    {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void OrthographicProjection_float_float_float_float_float_float( char**          i_args,
+                                                                 const npy_intp* i_dimensions,
+                                                                 const npy_intp* i_steps,
+                                                                 void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 7;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 5 ], i_steps[ 5 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 6 ], i_steps[ 6 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::OrthographicProjection_float_float_float_float_float_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              6 );
+}
+
+PyUFuncGenericFunction s_OrthographicProjection_float_float_float_float_float_floatLoop[] = {
+    &OrthographicProjection_float_float_float_float_float_float};
+char s_OrthographicProjection_float_float_float_float_float_floatTypes[] =
+    {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void BilinearInterpolation_float_float_float_float_Vec2f( char**          i_args,
+                                                          const npy_intp* i_dimensions,
+                                                          const npy_intp* i_steps,
+                                                          void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 6;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 5 ], i_steps[ 5 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::BilinearInterpolation_float_float_float_float_Vec2f,
+                              i_dimensions[ 0 ],
+                              operands,
+                              5 );
+}
+
+PyUFuncGenericFunction s_BilinearInterpolation_float_float_float_float_Vec2fLoop[] = {
+    &BilinearInterpolation_float_float_float_float_Vec2f};
+char s_BilinearInterpolation_float_float_float_float_Vec2fTypes[] =
+    {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f( char**          i_args,
+                                                          const npy_intp* i_dimensions,
+                                                          const npy_intp* i_steps,
+                                                          void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 6;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 5 ], i_steps[ 5 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f,
+                              i_dimensions[ 0 ],
+                              operands,
+                              5 );
+}
+
+PyUFuncGenericFunction s_BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2fLoop[] = {
+    &BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f};
+char s_BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2fTypes[] =
+    {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f( char**          i_args,
+                                                          const npy_intp* i_dimensions,
+                                                          const npy_intp* i_steps,
+                                                          void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 6;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 5 ], i_steps[ 5 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f,
+                              i_dimensions[ 0 ],
+                              operands,
+                              5 );
+}
+
+PyUFuncGenericFunction s_BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2fLoop[] = {
+    &BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f};
+char s_BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2fTypes[] =
+    {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f( char**          i_args,
+                                                          const npy_intp* i_dimensions,
+                                                          const npy_intp* i_steps,
+                                                          void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 6;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 5 ], i_steps[ 5 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f,
+                              i_dimensions[ 0 ],
+                              operands,
+                              5 );
+}
+
+PyUFuncGenericFunction s_BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2fLoop[] = {
+    &BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f};
+char s_BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2fTypes[] =
+    {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f( char**          i_args,
+                                                          const npy_intp* i_dimensions,
+                                                          const npy_intp* i_steps,
+                                                          void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 6;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 5 ], i_steps[ 5 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f,
+                              i_dimensions[ 0 ],
+                              operands,
+                              5 );
+}
+
+PyUFuncGenericFunction s_BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2fLoop[] = {
+    &BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f};
+char s_BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2fTypes[] =
+    {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f( char**          i_args,
+                                                          const npy_intp* i_dimensions,
+                                                          const npy_intp* i_steps,
+                                                          void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 6;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 5 ], i_steps[ 5 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f,
+                              i_dimensions[ 0 ],
+                              operands,
+                              5 );
+}
+
+PyUFuncGenericFunction s_BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2fLoop[] = {
+    &BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f};
+char s_BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2fTypes[] =
+    {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void InverseAffine_Mat4f_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::InverseAffine_Mat4f_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_InverseAffine_Mat4f_Mat4fLoop[]  = {&InverseAffine_Mat4f_Mat4f};
+char                   s_InverseAffine_Mat4f_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_BOOL};
+
+void TransformAABB_Mat4f_Vec3fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::TransformAABB_Mat4f_Vec3fRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_TransformAABB_Mat4f_Vec3fRangeLoop[]  = {&TransformAABB_Mat4f_Vec3fRange};
+char                   s_TransformAABB_Mat4f_Vec3fRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void CrossProduct_Vec3f_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::CrossProduct_Vec3f_Vec3f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_CrossProduct_Vec3f_Vec3fLoop[]  = {&CrossProduct_Vec3f_Vec3f};
+char                   s_CrossProduct_Vec3f_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LongestAxis_Vec2fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LongestAxis_Vec2fRange, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_LongestAxis_Vec2fRangeLoop[]  = {&LongestAxis_Vec2fRange};
+char                   s_LongestAxis_Vec2fRangeTypes[] = {NPY_FLOAT, NPY_INT};
+
+void LongestAxis_Vec3fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LongestAxis_Vec3fRange, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_LongestAxis_Vec3fRangeLoop[]  = {&LongestAxis_Vec3fRange};
+char                   s_LongestAxis_Vec3fRangeTypes[] = {NPY_FLOAT, NPY_INT};
+
+void LongestAxis_Vec4fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LongestAxis_Vec4fRange, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_LongestAxis_Vec4fRangeLoop[]  = {&LongestAxis_Vec4fRange};
+char                   s_LongestAxis_Vec4fRangeTypes[] = {NPY_FLOAT, NPY_INT};
+
+void LongestAxis_Vec2iRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LongestAxis_Vec2iRange, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_LongestAxis_Vec2iRangeLoop[]  = {&LongestAxis_Vec2iRange};
+char                   s_LongestAxis_Vec2iRangeTypes[] = {NPY_INT, NPY_INT};
+
+void LongestAxis_Vec3iRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LongestAxis_Vec3iRange, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_LongestAxis_Vec3iRangeLoop[]  = {&LongestAxis_Vec3iRange};
+char                   s_LongestAxis_Vec3iRangeTypes[] = {NPY_INT, NPY_INT};
+
+void LongestAxis_Vec4iRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LongestAxis_Vec4iRange, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_LongestAxis_Vec4iRangeLoop[]  = {&LongestAxis_Vec4iRange};
+char                   s_LongestAxis_Vec4iRangeTypes[] = {NPY_INT, NPY_INT};
+
+void SetTranslate_Vec2f_Mat3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::SetTranslate_Vec2f_Mat3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_SetTranslate_Vec2f_Mat3fLoop[]  = {&SetTranslate_Vec2f_Mat3f};
+char                   s_SetTranslate_Vec2f_Mat3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void SetTranslate_Vec3f_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::SetTranslate_Vec3f_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_SetTranslate_Vec3f_Mat4fLoop[]  = {&SetTranslate_Vec3f_Mat4f};
+char                   s_SetTranslate_Vec3f_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Max_float_float( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Max_float_float, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Max_float_floatLoop[]  = {&Max_float_float};
+char                   s_Max_float_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Max_int_int( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Max_int_int, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Max_int_intLoop[]  = {&Max_int_int};
+char                   s_Max_int_intTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Max_bool_bool( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Max_bool_bool, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Max_bool_boolLoop[]  = {&Max_bool_bool};
+char                   s_Max_bool_boolTypes[] = {NPY_BOOL, NPY_BOOL, NPY_BOOL};
+
+void Max_Vec2f_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Max_Vec2f_Vec2f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Max_Vec2f_Vec2fLoop[]  = {&Max_Vec2f_Vec2f};
+char                   s_Max_Vec2f_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Max_Vec3f_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Max_Vec3f_Vec3f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Max_Vec3f_Vec3fLoop[]  = {&Max_Vec3f_Vec3f};
+char                   s_Max_Vec3f_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Max_Vec4f_Vec4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Max_Vec4f_Vec4f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Max_Vec4f_Vec4fLoop[]  = {&Max_Vec4f_Vec4f};
+char                   s_Max_Vec4f_Vec4fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Max_Vec2i_Vec2i( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Max_Vec2i_Vec2i, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Max_Vec2i_Vec2iLoop[]  = {&Max_Vec2i_Vec2i};
+char                   s_Max_Vec2i_Vec2iTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Max_Vec3i_Vec3i( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Max_Vec3i_Vec3i, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Max_Vec3i_Vec3iLoop[]  = {&Max_Vec3i_Vec3i};
+char                   s_Max_Vec3i_Vec3iTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Max_Vec4i_Vec4i( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Max_Vec4i_Vec4i, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Max_Vec4i_Vec4iLoop[]  = {&Max_Vec4i_Vec4i};
+char                   s_Max_Vec4i_Vec4iTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Max_Mat3f_Mat3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Max_Mat3f_Mat3f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Max_Mat3f_Mat3fLoop[]  = {&Max_Mat3f_Mat3f};
+char                   s_Max_Mat3f_Mat3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Max_Mat4f_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Max_Mat4f_Mat4f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Max_Mat4f_Mat4fLoop[]  = {&Max_Mat4f_Mat4f};
+char                   s_Max_Mat4f_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Floor_float( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Floor_float, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Floor_floatLoop[]  = {&Floor_float};
+char                   s_Floor_floatTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Floor_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Floor_Vec2f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Floor_Vec2fLoop[]  = {&Floor_Vec2f};
+char                   s_Floor_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Floor_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Floor_Vec3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Floor_Vec3fLoop[]  = {&Floor_Vec3f};
+char                   s_Floor_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Floor_Vec4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Floor_Vec4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Floor_Vec4fLoop[]  = {&Floor_Vec4f};
+char                   s_Floor_Vec4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Floor_Mat3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Floor_Mat3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Floor_Mat3fLoop[]  = {&Floor_Mat3f};
+char                   s_Floor_Mat3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Floor_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Floor_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Floor_Mat4fLoop[]  = {&Floor_Mat4f};
+char                   s_Floor_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Transpose_Mat3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Transpose_Mat3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Transpose_Mat3fLoop[]  = {&Transpose_Mat3f};
+char                   s_Transpose_Mat3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Transpose_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Transpose_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Transpose_Mat4fLoop[]  = {&Transpose_Mat4f};
+char                   s_Transpose_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void SetScale_Vec2f_Mat3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::SetScale_Vec2f_Mat3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_SetScale_Vec2f_Mat3fLoop[]  = {&SetScale_Vec2f_Mat3f};
+char                   s_SetScale_Vec2f_Mat3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void SetScale_Vec3f_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::SetScale_Vec3f_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_SetScale_Vec3f_Mat4fLoop[]  = {&SetScale_Vec3f_Mat4f};
+char                   s_SetScale_Vec3f_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Ceil_float( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Ceil_float, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Ceil_floatLoop[]  = {&Ceil_float};
+char                   s_Ceil_floatTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Ceil_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Ceil_Vec2f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Ceil_Vec2fLoop[]  = {&Ceil_Vec2f};
+char                   s_Ceil_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Ceil_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Ceil_Vec3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Ceil_Vec3fLoop[]  = {&Ceil_Vec3f};
+char                   s_Ceil_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Ceil_Vec4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Ceil_Vec4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Ceil_Vec4fLoop[]  = {&Ceil_Vec4f};
+char                   s_Ceil_Vec4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Ceil_Mat3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Ceil_Mat3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Ceil_Mat3fLoop[]  = {&Ceil_Mat3f};
+char                   s_Ceil_Mat3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Ceil_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Ceil_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Ceil_Mat4fLoop[]  = {&Ceil_Mat4f};
+char                   s_Ceil_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void FaceForward_Vec2f_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::FaceForward_Vec2f_Vec2f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_FaceForward_Vec2f_Vec2fLoop[]  = {&FaceForward_Vec2f_Vec2f};
+char                   s_FaceForward_Vec2f_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void FaceForward_Vec3f_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::FaceForward_Vec3f_Vec3f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_FaceForward_Vec3f_Vec3fLoop[]  = {&FaceForward_Vec3f_Vec3f};
+char                   s_FaceForward_Vec3f_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void FaceForward_Vec4f_Vec4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::FaceForward_Vec4f_Vec4f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_FaceForward_Vec4f_Vec4fLoop[]  = {&FaceForward_Vec4f_Vec4f};
+char                   s_FaceForward_Vec4f_Vec4fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRange( char**          i_args,
+                                                            const npy_intp* i_dimensions,
+                                                            const npy_intp* i_steps,
+                                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 5;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 4 ], i_steps[ 4 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRangeLoop[] = {
+    &RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRange};
+char s_RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRangeTypes[] = {NPY_FLOAT,
+                                                                       NPY_FLOAT,
+                                                                       NPY_FLOAT,
+                                                                       NPY_FLOAT,
+                                                                       NPY_BOOL};
+
+void RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRange( char**          i_args,
+                                                            const npy_intp* i_dimensions,
+                                                            const npy_intp* i_steps,
+                                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 5;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 4 ], i_steps[ 4 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRangeLoop[] = {
+    &RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRange};
+char s_RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRangeTypes[] = {NPY_FLOAT,
+                                                                       NPY_FLOAT,
+                                                                       NPY_FLOAT,
+                                                                       NPY_FLOAT,
+                                                                       NPY_BOOL};
+
+void RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRange( char**          i_args,
+                                                            const npy_intp* i_dimensions,
+                                                            const npy_intp* i_steps,
+                                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 5;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 4 ], i_steps[ 4 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRangeLoop[] = {
+    &RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRange};
+char s_RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRangeTypes[] = {NPY_FLOAT,
+                                                                       NPY_FLOAT,
+                                                                       NPY_FLOAT,
+                                                                       NPY_FLOAT,
+                                                                       NPY_BOOL};
+
+void ApproximateLength_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ApproximateLength_Vec2f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_ApproximateLength_Vec2fLoop[]  = {&ApproximateLength_Vec2f};
+char                   s_ApproximateLength_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void ApproximateLength_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ApproximateLength_Vec3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_ApproximateLength_Vec3fLoop[]  = {&ApproximateLength_Vec3f};
+char                   s_ApproximateLength_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void ApproximateLength_Vec4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ApproximateLength_Vec4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_ApproximateLength_Vec4fLoop[]  = {&ApproximateLength_Vec4f};
+char                   s_ApproximateLength_Vec4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void ApproximateLength_Quatf( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ApproximateLength_Quatf, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_ApproximateLength_QuatfLoop[]  = {&ApproximateLength_Quatf};
+char                   s_ApproximateLength_QuatfTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void LookAt_Vec3f_Vec3f_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LookAt_Vec3f_Vec3f_Vec3f, i_dimensions[ 0 ], operands, 3 );
+}
+
+PyUFuncGenericFunction s_LookAt_Vec3f_Vec3f_Vec3fLoop[]  = {&LookAt_Vec3f_Vec3f_Vec3f};
+char                   s_LookAt_Vec3f_Vec3f_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void ApproximateSetRotateZ_float_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ApproximateSetRotateZ_float_Mat4f,
+                              i_dimensions[ 0 ],
+                              operands,
+                              1 );
+}
+
+PyUFuncGenericFunction s_ApproximateSetRotateZ_float_Mat4fLoop[]  = {&ApproximateSetRotateZ_float_Mat4f};
+char                   s_ApproximateSetRotateZ_float_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void HasScale_Mat3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::HasScale_Mat3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_HasScale_Mat3fLoop[]  = {&HasScale_Mat3f};
+char                   s_HasScale_Mat3fTypes[] = {NPY_FLOAT, NPY_BOOL};
+
+void HasScale_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< bool >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::HasScale_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_HasScale_Mat4fLoop[]  = {&HasScale_Mat4f};
+char                   s_HasScale_Mat4fTypes[] = {NPY_FLOAT, NPY_BOOL};
+
+void DotProduct_Vec2f_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::DotProduct_Vec2f_Vec2f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_DotProduct_Vec2f_Vec2fLoop[]  = {&DotProduct_Vec2f_Vec2f};
+char                   s_DotProduct_Vec2f_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void DotProduct_Vec3f_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::DotProduct_Vec3f_Vec3f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_DotProduct_Vec3f_Vec3fLoop[]  = {&DotProduct_Vec3f_Vec3f};
+char                   s_DotProduct_Vec3f_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void DotProduct_Vec4f_Vec4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::DotProduct_Vec4f_Vec4f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_DotProduct_Vec4f_Vec4fLoop[]  = {&DotProduct_Vec4f_Vec4f};
+char                   s_DotProduct_Vec4f_Vec4fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void DotProduct_Quatf_Quatf( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::DotProduct_Quatf_Quatf, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_DotProduct_Quatf_QuatfLoop[]  = {&DotProduct_Quatf_Quatf};
+char                   s_DotProduct_Quatf_QuatfTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void ApproximateSineCosine_float_float_float( char**          i_args,
+                                              const npy_intp* i_dimensions,
+                                              const npy_intp* i_steps,
+                                              void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ApproximateSineCosine_float_float_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              1 );
+}
+
+PyUFuncGenericFunction s_ApproximateSineCosine_float_float_floatLoop[]  = {&ApproximateSineCosine_float_float_float};
+char                   s_ApproximateSineCosine_float_float_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Intersection_FloatRange_FloatRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Intersection_FloatRange_FloatRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              2 );
+}
+
+PyUFuncGenericFunction s_Intersection_FloatRange_FloatRangeLoop[]  = {&Intersection_FloatRange_FloatRange};
+char                   s_Intersection_FloatRange_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Intersection_IntRange_IntRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Intersection_IntRange_IntRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Intersection_IntRange_IntRangeLoop[]  = {&Intersection_IntRange_IntRange};
+char                   s_Intersection_IntRange_IntRangeTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Intersection_Vec2fRange_Vec2fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2, 2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Intersection_Vec2fRange_Vec2fRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              2 );
+}
+
+PyUFuncGenericFunction s_Intersection_Vec2fRange_Vec2fRangeLoop[]  = {&Intersection_Vec2fRange_Vec2fRange};
+char                   s_Intersection_Vec2fRange_Vec2fRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Intersection_Vec3fRange_Vec3fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Intersection_Vec3fRange_Vec3fRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              2 );
+}
+
+PyUFuncGenericFunction s_Intersection_Vec3fRange_Vec3fRangeLoop[]  = {&Intersection_Vec3fRange_Vec3fRange};
+char                   s_Intersection_Vec3fRange_Vec3fRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Intersection_Vec4fRange_Vec4fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Intersection_Vec4fRange_Vec4fRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              2 );
+}
+
+PyUFuncGenericFunction s_Intersection_Vec4fRange_Vec4fRangeLoop[]  = {&Intersection_Vec4fRange_Vec4fRange};
+char                   s_Intersection_Vec4fRange_Vec4fRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Intersection_Vec2iRange_Vec2iRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {2, 2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Intersection_Vec2iRange_Vec2iRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              2 );
+}
+
+PyUFuncGenericFunction s_Intersection_Vec2iRange_Vec2iRangeLoop[]  = {&Intersection_Vec2iRange_Vec2iRange};
+char                   s_Intersection_Vec2iRange_Vec2iRangeTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Intersection_Vec3iRange_Vec3iRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {2, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Intersection_Vec3iRange_Vec3iRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              2 );
+}
+
+PyUFuncGenericFunction s_Intersection_Vec3iRange_Vec3iRangeLoop[]  = {&Intersection_Vec3iRange_Vec3iRange};
+char                   s_Intersection_Vec3iRange_Vec3iRangeTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Intersection_Vec4iRange_Vec4iRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {2, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Intersection_Vec4iRange_Vec4iRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              2 );
+}
+
+PyUFuncGenericFunction s_Intersection_Vec4iRange_Vec4iRangeLoop[]  = {&Intersection_Vec4iRange_Vec4iRange};
+char                   s_Intersection_Vec4iRange_Vec4iRangeTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void SetRotateY_float_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::SetRotateY_float_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_SetRotateY_float_Mat4fLoop[]  = {&SetRotateY_float_Mat4f};
+char                   s_SetRotateY_float_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void SetRotateX_float_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::SetRotateX_float_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_SetRotateX_float_Mat4fLoop[]  = {&SetRotateX_float_Mat4f};
+char                   s_SetRotateX_float_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Expand_FloatRange_FloatRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_FloatRange_FloatRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_FloatRange_FloatRangeLoop[]  = {&Expand_FloatRange_FloatRange};
+char                   s_Expand_FloatRange_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Expand_FloatRange_float( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_FloatRange_float, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_FloatRange_floatLoop[]  = {&Expand_FloatRange_float};
+char                   s_Expand_FloatRange_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Expand_IntRange_IntRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_IntRange_IntRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_IntRange_IntRangeLoop[]  = {&Expand_IntRange_IntRange};
+char                   s_Expand_IntRange_IntRangeTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Expand_IntRange_int( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_IntRange_int, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_IntRange_intLoop[]  = {&Expand_IntRange_int};
+char                   s_Expand_IntRange_intTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Expand_Vec2fRange_Vec2fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2, 2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_Vec2fRange_Vec2fRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_Vec2fRange_Vec2fRangeLoop[]  = {&Expand_Vec2fRange_Vec2fRange};
+char                   s_Expand_Vec2fRange_Vec2fRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Expand_Vec2fRange_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2, 2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_Vec2fRange_Vec2f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_Vec2fRange_Vec2fLoop[]  = {&Expand_Vec2fRange_Vec2f};
+char                   s_Expand_Vec2fRange_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Expand_Vec3fRange_Vec3fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_Vec3fRange_Vec3fRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_Vec3fRange_Vec3fRangeLoop[]  = {&Expand_Vec3fRange_Vec3fRange};
+char                   s_Expand_Vec3fRange_Vec3fRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Expand_Vec3fRange_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_Vec3fRange_Vec3f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_Vec3fRange_Vec3fLoop[]  = {&Expand_Vec3fRange_Vec3f};
+char                   s_Expand_Vec3fRange_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Expand_Vec4fRange_Vec4fRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_Vec4fRange_Vec4fRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_Vec4fRange_Vec4fRangeLoop[]  = {&Expand_Vec4fRange_Vec4fRange};
+char                   s_Expand_Vec4fRange_Vec4fRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Expand_Vec4fRange_Vec4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_Vec4fRange_Vec4f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_Vec4fRange_Vec4fLoop[]  = {&Expand_Vec4fRange_Vec4f};
+char                   s_Expand_Vec4fRange_Vec4fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Expand_Vec2iRange_Vec2iRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {2, 2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_Vec2iRange_Vec2iRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_Vec2iRange_Vec2iRangeLoop[]  = {&Expand_Vec2iRange_Vec2iRange};
+char                   s_Expand_Vec2iRange_Vec2iRangeTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Expand_Vec2iRange_Vec2i( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {2, 2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_Vec2iRange_Vec2i, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_Vec2iRange_Vec2iLoop[]  = {&Expand_Vec2iRange_Vec2i};
+char                   s_Expand_Vec2iRange_Vec2iTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Expand_Vec3iRange_Vec3iRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {2, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_Vec3iRange_Vec3iRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_Vec3iRange_Vec3iRangeLoop[]  = {&Expand_Vec3iRange_Vec3iRange};
+char                   s_Expand_Vec3iRange_Vec3iRangeTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Expand_Vec3iRange_Vec3i( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {2, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_Vec3iRange_Vec3i, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_Vec3iRange_Vec3iLoop[]  = {&Expand_Vec3iRange_Vec3i};
+char                   s_Expand_Vec3iRange_Vec3iTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Expand_Vec4iRange_Vec4iRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {2, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_Vec4iRange_Vec4iRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_Vec4iRange_Vec4iRangeLoop[]  = {&Expand_Vec4iRange_Vec4iRange};
+char                   s_Expand_Vec4iRange_Vec4iRangeTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Expand_Vec4iRange_Vec4i( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {2, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Expand_Vec4iRange_Vec4i, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Expand_Vec4iRange_Vec4iLoop[]  = {&Expand_Vec4iRange_Vec4i};
+char                   s_Expand_Vec4iRange_Vec4iTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void SetRotateZ_float_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::SetRotateZ_float_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_SetRotateZ_float_Mat4fLoop[]  = {&SetRotateZ_float_Mat4f};
+char                   s_SetRotateZ_float_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Distance_Vec2f_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Distance_Vec2f_Vec2f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Distance_Vec2f_Vec2fLoop[]  = {&Distance_Vec2f_Vec2f};
+char                   s_Distance_Vec2f_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Distance_Vec3f_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Distance_Vec3f_Vec3f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Distance_Vec3f_Vec3fLoop[]  = {&Distance_Vec3f_Vec3f};
+char                   s_Distance_Vec3f_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void RayPosition_Vec2f_Vec2f_float( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::RayPosition_Vec2f_Vec2f_float, i_dimensions[ 0 ], operands, 3 );
+}
+
+PyUFuncGenericFunction s_RayPosition_Vec2f_Vec2f_floatLoop[]  = {&RayPosition_Vec2f_Vec2f_float};
+char                   s_RayPosition_Vec2f_Vec2f_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void RayPosition_Vec3f_Vec3f_float( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::RayPosition_Vec3f_Vec3f_float, i_dimensions[ 0 ], operands, 3 );
+}
+
+PyUFuncGenericFunction s_RayPosition_Vec3f_Vec3f_floatLoop[]  = {&RayPosition_Vec3f_Vec3f_float};
+char                   s_RayPosition_Vec3f_Vec3f_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void TransformPoint_Mat4f_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::TransformPoint_Mat4f_Vec3f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_TransformPoint_Mat4f_Vec3fLoop[]  = {&TransformPoint_Mat4f_Vec3f};
+char                   s_TransformPoint_Mat4f_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void NormalizedLinearInterpolation_Quatf_Quatf_float( char**          i_args,
+                                                      const npy_intp* i_dimensions,
+                                                      const npy_intp* i_steps,
+                                                      void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::NormalizedLinearInterpolation_Quatf_Quatf_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_NormalizedLinearInterpolation_Quatf_Quatf_floatLoop[] = {
+    &NormalizedLinearInterpolation_Quatf_Quatf_float};
+char s_NormalizedLinearInterpolation_Quatf_Quatf_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Radians_float( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Radians_float, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Radians_floatLoop[]  = {&Radians_float};
+char                   s_Radians_floatTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void CoordinateSystem_Vec3f_Vec3f_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::CoordinateSystem_Vec3f_Vec3f_Vec3f,
+                              i_dimensions[ 0 ],
+                              operands,
+                              1 );
+}
+
+PyUFuncGenericFunction s_CoordinateSystem_Vec3f_Vec3f_Vec3fLoop[]  = {&CoordinateSystem_Vec3f_Vec3f_Vec3f};
+char                   s_CoordinateSystem_Vec3f_Vec3f_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Length_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Length_Vec2f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Length_Vec2fLoop[]  = {&Length_Vec2f};
+char                   s_Length_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Length_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Length_Vec3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Length_Vec3fLoop[]  = {&Length_Vec3f};
+char                   s_Length_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Length_Vec4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Length_Vec4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Length_Vec4fLoop[]  = {&Length_Vec4f};
+char                   s_Length_Vec4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Length_Quatf( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Length_Quatf, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Length_QuatfLoop[]  = {&Length_Quatf};
+char                   s_Length_QuatfTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void ApproximateReciprocalSquareRoot_float( char**          i_args,
+                                            const npy_intp* i_dimensions,
+                                            const npy_intp* i_steps,
+                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ApproximateReciprocalSquareRoot_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              1 );
+}
+
+PyUFuncGenericFunction s_ApproximateReciprocalSquareRoot_floatLoop[]  = {&ApproximateReciprocalSquareRoot_float};
+char                   s_ApproximateReciprocalSquareRoot_floatTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void ApproximateSetRotateX_float_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ApproximateSetRotateX_float_Mat4f,
+                              i_dimensions[ 0 ],
+                              operands,
+                              1 );
+}
+
+PyUFuncGenericFunction s_ApproximateSetRotateX_float_Mat4fLoop[]  = {&ApproximateSetRotateX_float_Mat4f};
+char                   s_ApproximateSetRotateX_float_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void SetIdentity_Mat3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 1;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::SetIdentity_Mat3f, i_dimensions[ 0 ], operands, 0 );
+}
+
+PyUFuncGenericFunction s_SetIdentity_Mat3fLoop[]  = {&SetIdentity_Mat3f};
+char                   s_SetIdentity_Mat3fTypes[] = {NPY_FLOAT};
+
+void SetIdentity_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 1;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::SetIdentity_Mat4f, i_dimensions[ 0 ], operands, 0 );
+}
+
+PyUFuncGenericFunction s_SetIdentity_Mat4fLoop[]  = {&SetIdentity_Mat4f};
+char                   s_SetIdentity_Mat4fTypes[] = {NPY_FLOAT};
+
+void LinearMap_float_FloatRange_FloatRange( char**          i_args,
+                                            const npy_intp* i_dimensions,
+                                            const npy_intp* i_steps,
+                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearMap_float_FloatRange_FloatRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearMap_float_FloatRange_FloatRangeLoop[]  = {&LinearMap_float_FloatRange_FloatRange};
+char                   s_LinearMap_float_FloatRange_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LinearMap_Mat3f_FloatRange_FloatRange( char**          i_args,
+                                            const npy_intp* i_dimensions,
+                                            const npy_intp* i_steps,
+                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearMap_Mat3f_FloatRange_FloatRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearMap_Mat3f_FloatRange_FloatRangeLoop[]  = {&LinearMap_Mat3f_FloatRange_FloatRange};
+char                   s_LinearMap_Mat3f_FloatRange_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LinearMap_Mat4f_FloatRange_FloatRange( char**          i_args,
+                                            const npy_intp* i_dimensions,
+                                            const npy_intp* i_steps,
+                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearMap_Mat4f_FloatRange_FloatRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearMap_Mat4f_FloatRange_FloatRangeLoop[]  = {&LinearMap_Mat4f_FloatRange_FloatRange};
+char                   s_LinearMap_Mat4f_FloatRange_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LinearMap_Vec2f_FloatRange_FloatRange( char**          i_args,
+                                            const npy_intp* i_dimensions,
+                                            const npy_intp* i_steps,
+                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearMap_Vec2f_FloatRange_FloatRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearMap_Vec2f_FloatRange_FloatRangeLoop[]  = {&LinearMap_Vec2f_FloatRange_FloatRange};
+char                   s_LinearMap_Vec2f_FloatRange_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LinearMap_Vec3f_FloatRange_FloatRange( char**          i_args,
+                                            const npy_intp* i_dimensions,
+                                            const npy_intp* i_steps,
+                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearMap_Vec3f_FloatRange_FloatRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearMap_Vec3f_FloatRange_FloatRangeLoop[]  = {&LinearMap_Vec3f_FloatRange_FloatRange};
+char                   s_LinearMap_Vec3f_FloatRange_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LinearMap_Vec4f_FloatRange_FloatRange( char**          i_args,
+                                            const npy_intp* i_dimensions,
+                                            const npy_intp* i_steps,
+                                            void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 4;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LinearMap_Vec4f_FloatRange_FloatRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_LinearMap_Vec4f_FloatRange_FloatRangeLoop[]  = {&LinearMap_Vec4f_FloatRange_FloatRange};
+char                   s_LinearMap_Vec4f_FloatRange_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Clamp_float_FloatRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Clamp_float_FloatRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Clamp_float_FloatRangeLoop[]  = {&Clamp_float_FloatRange};
+char                   s_Clamp_float_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Clamp_int_IntRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Clamp_int_IntRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Clamp_int_IntRangeLoop[]  = {&Clamp_int_IntRange};
+char                   s_Clamp_int_IntRangeTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Clamp_Vec2f_FloatRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Clamp_Vec2f_FloatRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Clamp_Vec2f_FloatRangeLoop[]  = {&Clamp_Vec2f_FloatRange};
+char                   s_Clamp_Vec2f_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Clamp_Vec3f_FloatRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Clamp_Vec3f_FloatRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Clamp_Vec3f_FloatRangeLoop[]  = {&Clamp_Vec3f_FloatRange};
+char                   s_Clamp_Vec3f_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Clamp_Vec4f_FloatRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Clamp_Vec4f_FloatRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Clamp_Vec4f_FloatRangeLoop[]  = {&Clamp_Vec4f_FloatRange};
+char                   s_Clamp_Vec4f_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Clamp_Vec2i_IntRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Clamp_Vec2i_IntRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Clamp_Vec2i_IntRangeLoop[]  = {&Clamp_Vec2i_IntRange};
+char                   s_Clamp_Vec2i_IntRangeTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Clamp_Vec3i_IntRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Clamp_Vec3i_IntRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Clamp_Vec3i_IntRangeLoop[]  = {&Clamp_Vec3i_IntRange};
+char                   s_Clamp_Vec3i_IntRangeTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Clamp_Vec4i_IntRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 2 ], i_steps[ 2 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Clamp_Vec4i_IntRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Clamp_Vec4i_IntRangeLoop[]  = {&Clamp_Vec4i_IntRange};
+char                   s_Clamp_Vec4i_IntRangeTypes[] = {NPY_INT, NPY_INT, NPY_INT};
+
+void Clamp_Mat3f_FloatRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Clamp_Mat3f_FloatRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Clamp_Mat3f_FloatRangeLoop[]  = {&Clamp_Mat3f_FloatRange};
+char                   s_Clamp_Mat3f_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void Clamp_Mat4f_FloatRange( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Clamp_Mat4f_FloatRange, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_Clamp_Mat4f_FloatRangeLoop[]  = {&Clamp_Mat4f_FloatRange};
+char                   s_Clamp_Mat4f_FloatRangeTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void LengthSquared_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LengthSquared_Vec2f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_LengthSquared_Vec2fLoop[]  = {&LengthSquared_Vec2f};
+char                   s_LengthSquared_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void LengthSquared_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LengthSquared_Vec3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_LengthSquared_Vec3fLoop[]  = {&LengthSquared_Vec3f};
+char                   s_LengthSquared_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void LengthSquared_Vec4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LengthSquared_Vec4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_LengthSquared_Vec4fLoop[]  = {&LengthSquared_Vec4f};
+char                   s_LengthSquared_Vec4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void LengthSquared_Quatf( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::LengthSquared_Quatf, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_LengthSquared_QuatfLoop[]  = {&LengthSquared_Quatf};
+char                   s_LengthSquared_QuatfTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void InverseRigid_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::InverseRigid_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_InverseRigid_Mat4fLoop[]  = {&InverseRigid_Mat4f};
+char                   s_InverseRigid_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRange( char**          i_args,
+                                                               const npy_intp* i_dimensions,
+                                                               const npy_intp* i_steps,
+                                                               void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 6;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 5 ], i_steps[ 5 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRange,
+                              i_dimensions[ 0 ],
+                              operands,
+                              4 );
+}
+
+PyUFuncGenericFunction s_RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRangeLoop[] = {
+    &RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRange};
+char s_RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRangeTypes[] =
+    {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_INT};
+
+void PerspectiveProjection_float_float_float_float_float_float( char**          i_args,
+                                                                const npy_intp* i_dimensions,
+                                                                const npy_intp* i_steps,
+                                                                void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 7;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 5 ], i_steps[ 5 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 6 ], i_steps[ 6 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::PerspectiveProjection_float_float_float_float_float_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              6 );
+}
+
+PyUFuncGenericFunction s_PerspectiveProjection_float_float_float_float_float_floatLoop[] = {
+    &PerspectiveProjection_float_float_float_float_float_float};
+char s_PerspectiveProjection_float_float_float_float_float_floatTypes[] =
+    {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void PerspectiveProjection_float_float_float_float( char**          i_args,
+                                                    const npy_intp* i_dimensions,
+                                                    const npy_intp* i_steps,
+                                                    void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 5;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 4 ], i_steps[ 4 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::PerspectiveProjection_float_float_float_float,
+                              i_dimensions[ 0 ],
+                              operands,
+                              4 );
+}
+
+PyUFuncGenericFunction s_PerspectiveProjection_float_float_float_floatLoop[] = {
+    &PerspectiveProjection_float_float_float_float};
+char s_PerspectiveProjection_float_float_float_floatTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void SetRotate_float_Vec3f_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::SetRotate_float_Vec3f_Mat4f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_SetRotate_float_Vec3f_Mat4fLoop[]  = {&SetRotate_float_Vec3f_Mat4f};
+char                   s_SetRotate_float_Vec3f_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void SetRotate_float_Vec3f_Quatf( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::SetRotate_float_Vec3f_Quatf, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_SetRotate_float_Vec3f_QuatfLoop[]  = {&SetRotate_float_Vec3f_Quatf};
+char                   s_SetRotate_float_Vec3f_QuatfTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void SetRotate_Quatf_Mat3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::SetRotate_Quatf_Mat3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_SetRotate_Quatf_Mat3fLoop[]  = {&SetRotate_Quatf_Mat3f};
+char                   s_SetRotate_Quatf_Mat3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void SetRotate_Quatf_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::SetRotate_Quatf_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_SetRotate_Quatf_Mat4fLoop[]  = {&SetRotate_Quatf_Mat4f};
+char                   s_SetRotate_Quatf_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void ViewportTransform_Vec2f_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ViewportTransform_Vec2f_Vec2f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_ViewportTransform_Vec2f_Vec2fLoop[]  = {&ViewportTransform_Vec2f_Vec2f};
+char                   s_ViewportTransform_Vec2f_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void MatrixProduct_Mat3f_Mat3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3, 3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::MatrixProduct_Mat3f_Mat3f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_MatrixProduct_Mat3f_Mat3fLoop[]  = {&MatrixProduct_Mat3f_Mat3f};
+char                   s_MatrixProduct_Mat3f_Mat3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void MatrixProduct_Mat4f_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::MatrixProduct_Mat4f_Mat4f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_MatrixProduct_Mat4f_Mat4fLoop[]  = {&MatrixProduct_Mat4f_Mat4f};
+char                   s_MatrixProduct_Mat4f_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void TransformVector_Mat3f_Vec2f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {2}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::TransformVector_Mat3f_Vec2f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_TransformVector_Mat3f_Vec2fLoop[]  = {&TransformVector_Mat3f_Vec2f};
+char                   s_TransformVector_Mat3f_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void TransformVector_Mat4f_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::TransformVector_Mat4f_Vec3f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_TransformVector_Mat4f_Vec3fLoop[]  = {&TransformVector_Mat4f_Vec3f};
+char                   s_TransformVector_Mat4f_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void TransformVector_Quatf_Vec3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 3;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {3}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::TransformVector_Quatf_Vec3f, i_dimensions[ 0 ], operands, 2 );
+}
+
+PyUFuncGenericFunction s_TransformVector_Quatf_Vec3fLoop[]  = {&TransformVector_Quatf_Vec3f};
+char                   s_TransformVector_Quatf_Vec3fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT};
+
+void QuadraticRoots_float_float_float_Vec2f( char**          i_args,
+                                             const npy_intp* i_dimensions,
+                                             const npy_intp* i_steps,
+                                             void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 5;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 2 ], i_steps[ 2 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 3 ], i_steps[ 3 ], {2}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< int >( i_args[ 4 ], i_steps[ 4 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::QuadraticRoots_float_float_float_Vec2f,
+                              i_dimensions[ 0 ],
+                              operands,
+                              3 );
+}
+
+PyUFuncGenericFunction s_QuadraticRoots_float_float_float_Vec2fLoop[] = {&QuadraticRoots_float_float_float_Vec2f};
+char s_QuadraticRoots_float_float_float_Vec2fTypes[] = {NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_FLOAT, NPY_INT};
+
+void RotationQuaternion_Mat3f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {3, 3}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::RotationQuaternion_Mat3f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_RotationQuaternion_Mat3fLoop[]  = {&RotationQuaternion_Mat3f};
+char                   s_RotationQuaternion_Mat3fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void RotationQuaternion_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {4, 4}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::RotationQuaternion_Mat4f, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_RotationQuaternion_Mat4fLoop[]  = {&RotationQuaternion_Mat4f};
+char                   s_RotationQuaternion_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void Degrees_float( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::Degrees_float, i_dimensions[ 0 ], operands, 1 );
+}
+
+PyUFuncGenericFunction s_Degrees_floatLoop[]  = {&Degrees_float};
+char                   s_Degrees_floatTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+void ApproximateSetRotateY_float_Mat4f( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp*               coreSteps  = i_steps + 2;
+    const gm_ufuncs::UfuncOperand operands[] = {
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 0 ], i_steps[ 0 ], {}, coreSteps ),
+        gm_ufuncs::MakeUfuncOperand< float >( i_args[ 1 ], i_steps[ 1 ], {4, 4}, coreSteps ),
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::ApproximateSetRotateY_float_Mat4f,
+                              i_dimensions[ 0 ],
+                              operands,
+                              1 );
+}
+
+PyUFuncGenericFunction s_ApproximateSetRotateY_float_Mat4fLoop[]  = {&ApproximateSetRotateY_float_Mat4f};
+char                   s_ApproximateSetRotateY_float_Mat4fTypes[] = {NPY_FLOAT, NPY_FLOAT};
+
+} // namespace
+
+// Bind the ufuncs into the gm.ufuncs submodule \p o_module, importing NumPy.
+void BindUfuncs( pybind11::module& o_module )
+{
+    if ( _import_array() < 0 || _import_umath() < 0 )
+    {
+        throw pybind11::error_already_set();
+    }
+
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearInterpolation_float_float_float",
+                         "Evaluate LinearInterpolation over arrays of ( float, float, float ) elements.",
+                         s_LinearInterpolation_float_float_floatLoop,
+                         s_LinearInterpolation_float_float_floatTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         nullptr );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearInterpolation_Mat3f_Mat3f_float",
+                         "Evaluate LinearInterpolation over arrays of ( Mat3f, Mat3f, float ) elements.",
+                         s_LinearInterpolation_Mat3f_Mat3f_floatLoop,
+                         s_LinearInterpolation_Mat3f_Mat3f_floatTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(3,3),(3,3),()->(3,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearInterpolation_Mat4f_Mat4f_float",
+                         "Evaluate LinearInterpolation over arrays of ( Mat4f, Mat4f, float ) elements.",
+                         s_LinearInterpolation_Mat4f_Mat4f_floatLoop,
+                         s_LinearInterpolation_Mat4f_Mat4f_floatTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(4,4),(4,4),()->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearInterpolation_Vec2f_Vec2f_float",
+                         "Evaluate LinearInterpolation over arrays of ( Vec2f, Vec2f, float ) elements.",
+                         s_LinearInterpolation_Vec2f_Vec2f_floatLoop,
+                         s_LinearInterpolation_Vec2f_Vec2f_floatTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2),()->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearInterpolation_Vec3f_Vec3f_float",
+                         "Evaluate LinearInterpolation over arrays of ( Vec3f, Vec3f, float ) elements.",
+                         s_LinearInterpolation_Vec3f_Vec3f_floatLoop,
+                         s_LinearInterpolation_Vec3f_Vec3f_floatTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(3),(3),()->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearInterpolation_Vec4f_Vec4f_float",
+                         "Evaluate LinearInterpolation over arrays of ( Vec4f, Vec4f, float ) elements.",
+                         s_LinearInterpolation_Vec4f_Vec4f_floatLoop,
+                         s_LinearInterpolation_Vec4f_Vec4f_floatTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(4),(4),()->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearInterpolation_Vec2fRange_Vec2fRange_float",
+                         "Evaluate LinearInterpolation over arrays of ( Vec2fRange, Vec2fRange, float ) elements.",
+                         s_LinearInterpolation_Vec2fRange_Vec2fRange_floatLoop,
+                         s_LinearInterpolation_Vec2fRange_Vec2fRange_floatTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(2,2),(2,2),()->(2,2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearInterpolation_Vec3fRange_Vec3fRange_float",
+                         "Evaluate LinearInterpolation over arrays of ( Vec3fRange, Vec3fRange, float ) elements.",
+                         s_LinearInterpolation_Vec3fRange_Vec3fRange_floatLoop,
+                         s_LinearInterpolation_Vec3fRange_Vec3fRange_floatTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(2,3),(2,3),()->(2,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearInterpolation_Vec4fRange_Vec4fRange_float",
+                         "Evaluate LinearInterpolation over arrays of ( Vec4fRange, Vec4fRange, float ) elements.",
+                         s_LinearInterpolation_Vec4fRange_Vec4fRange_floatLoop,
+                         s_LinearInterpolation_Vec4fRange_Vec4fRange_floatTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(2,4),(2,4),()->(2,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearInterpolation_FloatRange_FloatRange_float",
+                         "Evaluate LinearInterpolation over arrays of ( FloatRange, FloatRange, float ) elements.",
+                         s_LinearInterpolation_FloatRange_FloatRange_floatLoop,
+                         s_LinearInterpolation_FloatRange_FloatRange_floatTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2),()->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Normalize_Vec2f",
+                         "Evaluate Normalize over arrays of ( Vec2f ) elements.",
+                         s_Normalize_Vec2fLoop,
+                         s_Normalize_Vec2fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Normalize_Vec3f",
+                         "Evaluate Normalize over arrays of ( Vec3f ) elements.",
+                         s_Normalize_Vec3fLoop,
+                         s_Normalize_Vec3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Normalize_Vec4f",
+                         "Evaluate Normalize over arrays of ( Vec4f ) elements.",
+                         s_Normalize_Vec4fLoop,
+                         s_Normalize_Vec4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Normalize_Quatf",
+                         "Evaluate Normalize over arrays of ( Quatf ) elements.",
+                         s_Normalize_QuatfLoop,
+                         s_Normalize_QuatfTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Inverse_Mat3f_Mat3f",
+                         "Evaluate Inverse over arrays of ( Mat3f, Mat3f ) elements.",
+                         s_Inverse_Mat3f_Mat3fLoop,
+                         s_Inverse_Mat3f_Mat3fTypes,
+                         1,
+                         2,
+                         PyUFunc_None,
+                         "(3,3)->(3,3),()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Inverse_Mat4f_Mat4f",
+                         "Evaluate Inverse over arrays of ( Mat4f, Mat4f ) elements.",
+                         s_Inverse_Mat4f_Mat4fLoop,
+                         s_Inverse_Mat4f_Mat4fTypes,
+                         1,
+                         2,
+                         PyUFunc_None,
+                         "(4,4)->(4,4),()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Min_float_float",
+                         "Evaluate Min over arrays of ( float, float ) elements.",
+                         s_Min_float_floatLoop,
+                         s_Min_float_floatTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         nullptr );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Min_int_int",
+                         "Evaluate Min over arrays of ( int, int ) elements.",
+                         s_Min_int_intLoop,
+                         s_Min_int_intTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         nullptr );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Min_bool_bool",
+                         "Evaluate Min over arrays of ( bool, bool ) elements.",
+                         s_Min_bool_boolLoop,
+                         s_Min_bool_boolTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         nullptr );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Min_Vec2f_Vec2f",
+                         "Evaluate Min over arrays of ( Vec2f, Vec2f ) elements.",
+                         s_Min_Vec2f_Vec2fLoop,
+                         s_Min_Vec2f_Vec2fTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(2),(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Min_Vec3f_Vec3f",
+                         "Evaluate Min over arrays of ( Vec3f, Vec3f ) elements.",
+                         s_Min_Vec3f_Vec3fLoop,
+                         s_Min_Vec3f_Vec3fTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(3),(3)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Min_Vec4f_Vec4f",
+                         "Evaluate Min over arrays of ( Vec4f, Vec4f ) elements.",
+                         s_Min_Vec4f_Vec4fLoop,
+                         s_Min_Vec4f_Vec4fTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(4),(4)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Min_Vec2i_Vec2i",
+                         "Evaluate Min over arrays of ( Vec2i, Vec2i ) elements.",
+                         s_Min_Vec2i_Vec2iLoop,
+                         s_Min_Vec2i_Vec2iTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(2),(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Min_Vec3i_Vec3i",
+                         "Evaluate Min over arrays of ( Vec3i, Vec3i ) elements.",
+                         s_Min_Vec3i_Vec3iLoop,
+                         s_Min_Vec3i_Vec3iTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(3),(3)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Min_Vec4i_Vec4i",
+                         "Evaluate Min over arrays of ( Vec4i, Vec4i ) elements.",
+                         s_Min_Vec4i_Vec4iLoop,
+                         s_Min_Vec4i_Vec4iTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(4),(4)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Min_Mat3f_Mat3f",
+                         "Evaluate Min over arrays of ( Mat3f, Mat3f ) elements.",
+                         s_Min_Mat3f_Mat3fLoop,
+                         s_Min_Mat3f_Mat3fTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(3,3),(3,3)->(3,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Min_Mat4f_Mat4f",
+                         "Evaluate Min over arrays of ( Mat4f, Mat4f ) elements.",
+                         s_Min_Mat4f_Mat4fLoop,
+                         s_Min_Mat4f_Mat4fTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(4,4),(4,4)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "QuaternionProduct_Quatf_Quatf",
+                         "Evaluate QuaternionProduct over arrays of ( Quatf, Quatf ) elements.",
+                         s_QuaternionProduct_Quatf_QuatfLoop,
+                         s_QuaternionProduct_Quatf_QuatfTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(4),(4)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_FloatRange_float",
+                         "Evaluate Contains over arrays of ( FloatRange, float ) elements.",
+                         s_Contains_FloatRange_floatLoop,
+                         s_Contains_FloatRange_floatTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),()->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_FloatRange_FloatRange",
+                         "Evaluate Contains over arrays of ( FloatRange, FloatRange ) elements.",
+                         s_Contains_FloatRange_FloatRangeLoop,
+                         s_Contains_FloatRange_FloatRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_IntRange_int",
+                         "Evaluate Contains over arrays of ( IntRange, int ) elements.",
+                         s_Contains_IntRange_intLoop,
+                         s_Contains_IntRange_intTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),()->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_IntRange_IntRange",
+                         "Evaluate Contains over arrays of ( IntRange, IntRange ) elements.",
+                         s_Contains_IntRange_IntRangeLoop,
+                         s_Contains_IntRange_IntRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_Vec2fRange_Vec2f",
+                         "Evaluate Contains over arrays of ( Vec2fRange, Vec2f ) elements.",
+                         s_Contains_Vec2fRange_Vec2fLoop,
+                         s_Contains_Vec2fRange_Vec2fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,2),(2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_Vec2fRange_Vec2fRange",
+                         "Evaluate Contains over arrays of ( Vec2fRange, Vec2fRange ) elements.",
+                         s_Contains_Vec2fRange_Vec2fRangeLoop,
+                         s_Contains_Vec2fRange_Vec2fRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,2),(2,2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_Vec3fRange_Vec3f",
+                         "Evaluate Contains over arrays of ( Vec3fRange, Vec3f ) elements.",
+                         s_Contains_Vec3fRange_Vec3fLoop,
+                         s_Contains_Vec3fRange_Vec3fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,3),(3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_Vec3fRange_Vec3fRange",
+                         "Evaluate Contains over arrays of ( Vec3fRange, Vec3fRange ) elements.",
+                         s_Contains_Vec3fRange_Vec3fRangeLoop,
+                         s_Contains_Vec3fRange_Vec3fRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,3),(2,3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_Vec4fRange_Vec4f",
+                         "Evaluate Contains over arrays of ( Vec4fRange, Vec4f ) elements.",
+                         s_Contains_Vec4fRange_Vec4fLoop,
+                         s_Contains_Vec4fRange_Vec4fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,4),(4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_Vec4fRange_Vec4fRange",
+                         "Evaluate Contains over arrays of ( Vec4fRange, Vec4fRange ) elements.",
+                         s_Contains_Vec4fRange_Vec4fRangeLoop,
+                         s_Contains_Vec4fRange_Vec4fRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,4),(2,4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_Vec2iRange_Vec2i",
+                         "Evaluate Contains over arrays of ( Vec2iRange, Vec2i ) elements.",
+                         s_Contains_Vec2iRange_Vec2iLoop,
+                         s_Contains_Vec2iRange_Vec2iTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,2),(2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_Vec2iRange_Vec2iRange",
+                         "Evaluate Contains over arrays of ( Vec2iRange, Vec2iRange ) elements.",
+                         s_Contains_Vec2iRange_Vec2iRangeLoop,
+                         s_Contains_Vec2iRange_Vec2iRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,2),(2,2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_Vec3iRange_Vec3i",
+                         "Evaluate Contains over arrays of ( Vec3iRange, Vec3i ) elements.",
+                         s_Contains_Vec3iRange_Vec3iLoop,
+                         s_Contains_Vec3iRange_Vec3iTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,3),(3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_Vec3iRange_Vec3iRange",
+                         "Evaluate Contains over arrays of ( Vec3iRange, Vec3iRange ) elements.",
+                         s_Contains_Vec3iRange_Vec3iRangeLoop,
+                         s_Contains_Vec3iRange_Vec3iRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,3),(2,3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_Vec4iRange_Vec4i",
+                         "Evaluate Contains over arrays of ( Vec4iRange, Vec4i ) elements.",
+                         s_Contains_Vec4iRange_Vec4iLoop,
+                         s_Contains_Vec4iRange_Vec4iTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,4),(4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Contains_Vec4iRange_Vec4iRange",
+                         "Evaluate Contains over arrays of ( Vec4iRange, Vec4iRange ) elements.",
+                         s_Contains_Vec4iRange_Vec4iRangeLoop,
+                         s_Contains_Vec4iRange_Vec4iRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,4),(2,4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ApproximateSetRotate_float_Vec3f_Mat4f",
+                         "Evaluate ApproximateSetRotate over arrays of ( float, Vec3f, Mat4f ) elements.",
+                         s_ApproximateSetRotate_float_Vec3f_Mat4fLoop,
+                         s_ApproximateSetRotate_float_Vec3f_Mat4fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(),(3)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ApproximateSetRotate_float_Vec3f_Quatf",
+                         "Evaluate ApproximateSetRotate over arrays of ( float, Vec3f, Quatf ) elements.",
+                         s_ApproximateSetRotate_float_Vec3f_QuatfLoop,
+                         s_ApproximateSetRotate_float_Vec3f_QuatfTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(),(3)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Content_FloatRange",
+                         "Evaluate Content over arrays of ( FloatRange ) elements.",
+                         s_Content_FloatRangeLoop,
+                         s_Content_FloatRangeTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Content_IntRange",
+                         "Evaluate Content over arrays of ( IntRange ) elements.",
+                         s_Content_IntRangeLoop,
+                         s_Content_IntRangeTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Content_Vec2fRange",
+                         "Evaluate Content over arrays of ( Vec2fRange ) elements.",
+                         s_Content_Vec2fRangeLoop,
+                         s_Content_Vec2fRangeTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2,2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Content_Vec3fRange",
+                         "Evaluate Content over arrays of ( Vec3fRange ) elements.",
+                         s_Content_Vec3fRangeLoop,
+                         s_Content_Vec3fRangeTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2,3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Content_Vec4fRange",
+                         "Evaluate Content over arrays of ( Vec4fRange ) elements.",
+                         s_Content_Vec4fRangeLoop,
+                         s_Content_Vec4fRangeTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2,4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Content_Vec2iRange",
+                         "Evaluate Content over arrays of ( Vec2iRange ) elements.",
+                         s_Content_Vec2iRangeLoop,
+                         s_Content_Vec2iRangeTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2,2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Content_Vec3iRange",
+                         "Evaluate Content over arrays of ( Vec3iRange ) elements.",
+                         s_Content_Vec3iRangeLoop,
+                         s_Content_Vec3iRangeTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2,3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Content_Vec4iRange",
+                         "Evaluate Content over arrays of ( Vec4iRange ) elements.",
+                         s_Content_Vec4iRangeLoop,
+                         s_Content_Vec4iRangeTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2,4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "SphericalLinearInterpolation_Quatf_Quatf_float",
+                         "Evaluate SphericalLinearInterpolation over arrays of ( Quatf, Quatf, float ) elements.",
+                         s_SphericalLinearInterpolation_Quatf_Quatf_floatLoop,
+                         s_SphericalLinearInterpolation_Quatf_Quatf_floatTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(4),(4),()->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Abs_float",
+                         "Evaluate Abs over arrays of ( float ) elements.",
+                         s_Abs_floatLoop,
+                         s_Abs_floatTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         nullptr );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Abs_Vec2f",
+                         "Evaluate Abs over arrays of ( Vec2f ) elements.",
+                         s_Abs_Vec2fLoop,
+                         s_Abs_Vec2fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Abs_Vec3f",
+                         "Evaluate Abs over arrays of ( Vec3f ) elements.",
+                         s_Abs_Vec3fLoop,
+                         s_Abs_Vec3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Abs_Vec4f",
+                         "Evaluate Abs over arrays of ( Vec4f ) elements.",
+                         s_Abs_Vec4fLoop,
+                         s_Abs_Vec4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Abs_Mat3f",
+                         "Evaluate Abs over arrays of ( Mat3f ) elements.",
+                         s_Abs_Mat3fLoop,
+                         s_Abs_Mat3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3,3)->(3,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Abs_Mat4f",
+                         "Evaluate Abs over arrays of ( Mat4f ) elements.",
+                         s_Abs_Mat4fLoop,
+                         s_Abs_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4,4)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "IsIdentity_Mat3f",
+                         "Evaluate IsIdentity over arrays of ( Mat3f ) elements.",
+                         s_IsIdentity_Mat3fLoop,
+                         s_IsIdentity_Mat3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3,3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "IsIdentity_Mat4f",
+                         "Evaluate IsIdentity over arrays of ( Mat4f ) elements.",
+                         s_IsIdentity_Mat4fLoop,
+                         s_IsIdentity_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4,4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ApproximateNormalize_Vec2f",
+                         "Evaluate ApproximateNormalize over arrays of ( Vec2f ) elements.",
+                         s_ApproximateNormalize_Vec2fLoop,
+                         s_ApproximateNormalize_Vec2fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ApproximateNormalize_Vec3f",
+                         "Evaluate ApproximateNormalize over arrays of ( Vec3f ) elements.",
+                         s_ApproximateNormalize_Vec3fLoop,
+                         s_ApproximateNormalize_Vec3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ApproximateNormalize_Vec4f",
+                         "Evaluate ApproximateNormalize over arrays of ( Vec4f ) elements.",
+                         s_ApproximateNormalize_Vec4fLoop,
+                         s_ApproximateNormalize_Vec4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ApproximateNormalize_Quatf",
+                         "Evaluate ApproximateNormalize over arrays of ( Quatf ) elements.",
+                         s_ApproximateNormalize_QuatfLoop,
+                         s_ApproximateNormalize_QuatfTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3f",
+                         "Evaluate TrilinearInterpolation over arrays of ( float, float, float, float, float, float, "
+                         "float, float, Vec3f ) elements.",
+                         s_TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3fLoop,
+                         s_TrilinearInterpolation_float_float_float_float_float_float_float_float_Vec3fTypes,
+                         9,
+                         1,
+                         PyUFunc_None,
+                         "(),(),(),(),(),(),(),(),(3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3f",
+                         "Evaluate TrilinearInterpolation over arrays of ( Mat3f, Mat3f, Mat3f, Mat3f, Mat3f, Mat3f, "
+                         "Mat3f, Mat3f, Vec3f ) elements.",
+                         s_TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3fLoop,
+                         s_TrilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Mat3f_Vec3fTypes,
+                         9,
+                         1,
+                         PyUFunc_None,
+                         "(3,3),(3,3),(3,3),(3,3),(3,3),(3,3),(3,3),(3,3),(3)->(3,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3f",
+                         "Evaluate TrilinearInterpolation over arrays of ( Mat4f, Mat4f, Mat4f, Mat4f, Mat4f, Mat4f, "
+                         "Mat4f, Mat4f, Vec3f ) elements.",
+                         s_TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3fLoop,
+                         s_TrilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Mat4f_Vec3fTypes,
+                         9,
+                         1,
+                         PyUFunc_None,
+                         "(4,4),(4,4),(4,4),(4,4),(4,4),(4,4),(4,4),(4,4),(3)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3f",
+                         "Evaluate TrilinearInterpolation over arrays of ( Vec2f, Vec2f, Vec2f, Vec2f, Vec2f, Vec2f, "
+                         "Vec2f, Vec2f, Vec3f ) elements.",
+                         s_TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3fLoop,
+                         s_TrilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f_Vec3fTypes,
+                         9,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2),(2),(2),(2),(2),(2),(2),(3)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f",
+                         "Evaluate TrilinearInterpolation over arrays of ( Vec3f, Vec3f, Vec3f, Vec3f, Vec3f, Vec3f, "
+                         "Vec3f, Vec3f, Vec3f ) elements.",
+                         s_TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3fLoop,
+                         s_TrilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3f_Vec3fTypes,
+                         9,
+                         1,
+                         PyUFunc_None,
+                         "(3),(3),(3),(3),(3),(3),(3),(3),(3)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3f",
+                         "Evaluate TrilinearInterpolation over arrays of ( Vec4f, Vec4f, Vec4f, Vec4f, Vec4f, Vec4f, "
+                         "Vec4f, Vec4f, Vec3f ) elements.",
+                         s_TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3fLoop,
+                         s_TrilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec4f_Vec3fTypes,
+                         9,
+                         1,
+                         PyUFunc_None,
+                         "(4),(4),(4),(4),(4),(4),(4),(4),(3)->(4)" );
+    gm_ufuncs::AddUfunc(
+        o_module,
+        "OrthographicProjection_float_float_float_float_float_float",
+        "Evaluate OrthographicProjection over arrays of ( float, float, float, float, float, float ) elements.",
+        s_OrthographicProjection_float_float_float_float_float_floatLoop,
+        s_OrthographicProjection_float_float_float_float_float_floatTypes,
+        6,
+        1,
+        PyUFunc_None,
+        "(),(),(),(),(),()->(4,4)" );
+    gm_ufuncs::AddUfunc(
+        o_module,
+        "BilinearInterpolation_float_float_float_float_Vec2f",
+        "Evaluate BilinearInterpolation over arrays of ( float, float, float, float, Vec2f ) elements.",
+        s_BilinearInterpolation_float_float_float_float_Vec2fLoop,
+        s_BilinearInterpolation_float_float_float_float_Vec2fTypes,
+        5,
+        1,
+        PyUFunc_None,
+        "(),(),(),(),(2)->()" );
+    gm_ufuncs::AddUfunc(
+        o_module,
+        "BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2f",
+        "Evaluate BilinearInterpolation over arrays of ( Mat3f, Mat3f, Mat3f, Mat3f, Vec2f ) elements.",
+        s_BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2fLoop,
+        s_BilinearInterpolation_Mat3f_Mat3f_Mat3f_Mat3f_Vec2fTypes,
+        5,
+        1,
+        PyUFunc_None,
+        "(3,3),(3,3),(3,3),(3,3),(2)->(3,3)" );
+    gm_ufuncs::AddUfunc(
+        o_module,
+        "BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2f",
+        "Evaluate BilinearInterpolation over arrays of ( Mat4f, Mat4f, Mat4f, Mat4f, Vec2f ) elements.",
+        s_BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2fLoop,
+        s_BilinearInterpolation_Mat4f_Mat4f_Mat4f_Mat4f_Vec2fTypes,
+        5,
+        1,
+        PyUFunc_None,
+        "(4,4),(4,4),(4,4),(4,4),(2)->(4,4)" );
+    gm_ufuncs::AddUfunc(
+        o_module,
+        "BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2f",
+        "Evaluate BilinearInterpolation over arrays of ( Vec2f, Vec2f, Vec2f, Vec2f, Vec2f ) elements.",
+        s_BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2fLoop,
+        s_BilinearInterpolation_Vec2f_Vec2f_Vec2f_Vec2f_Vec2fTypes,
+        5,
+        1,
+        PyUFunc_None,
+        "(2),(2),(2),(2),(2)->(2)" );
+    gm_ufuncs::AddUfunc(
+        o_module,
+        "BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2f",
+        "Evaluate BilinearInterpolation over arrays of ( Vec3f, Vec3f, Vec3f, Vec3f, Vec2f ) elements.",
+        s_BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2fLoop,
+        s_BilinearInterpolation_Vec3f_Vec3f_Vec3f_Vec3f_Vec2fTypes,
+        5,
+        1,
+        PyUFunc_None,
+        "(3),(3),(3),(3),(2)->(3)" );
+    gm_ufuncs::AddUfunc(
+        o_module,
+        "BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2f",
+        "Evaluate BilinearInterpolation over arrays of ( Vec4f, Vec4f, Vec4f, Vec4f, Vec2f ) elements.",
+        s_BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2fLoop,
+        s_BilinearInterpolation_Vec4f_Vec4f_Vec4f_Vec4f_Vec2fTypes,
+        5,
+        1,
+        PyUFunc_None,
+        "(4),(4),(4),(4),(2)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "InverseAffine_Mat4f_Mat4f",
+                         "Evaluate InverseAffine over arrays of ( Mat4f, Mat4f ) elements.",
+                         s_InverseAffine_Mat4f_Mat4fLoop,
+                         s_InverseAffine_Mat4f_Mat4fTypes,
+                         1,
+                         2,
+                         PyUFunc_None,
+                         "(4,4)->(4,4),()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "TransformAABB_Mat4f_Vec3fRange",
+                         "Evaluate TransformAABB over arrays of ( Mat4f, Vec3fRange ) elements.",
+                         s_TransformAABB_Mat4f_Vec3fRangeLoop,
+                         s_TransformAABB_Mat4f_Vec3fRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(4,4),(2,3)->(2,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "CrossProduct_Vec3f_Vec3f",
+                         "Evaluate CrossProduct over arrays of ( Vec3f, Vec3f ) elements.",
+                         s_CrossProduct_Vec3f_Vec3fLoop,
+                         s_CrossProduct_Vec3f_Vec3fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(3),(3)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LongestAxis_Vec2fRange",
+                         "Evaluate LongestAxis over arrays of ( Vec2fRange ) elements.",
+                         s_LongestAxis_Vec2fRangeLoop,
+                         s_LongestAxis_Vec2fRangeTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2,2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LongestAxis_Vec3fRange",
+                         "Evaluate LongestAxis over arrays of ( Vec3fRange ) elements.",
+                         s_LongestAxis_Vec3fRangeLoop,
+                         s_LongestAxis_Vec3fRangeTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2,3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LongestAxis_Vec4fRange",
+                         "Evaluate LongestAxis over arrays of ( Vec4fRange ) elements.",
+                         s_LongestAxis_Vec4fRangeLoop,
+                         s_LongestAxis_Vec4fRangeTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2,4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LongestAxis_Vec2iRange",
+                         "Evaluate LongestAxis over arrays of ( Vec2iRange ) elements.",
+                         s_LongestAxis_Vec2iRangeLoop,
+                         s_LongestAxis_Vec2iRangeTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2,2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LongestAxis_Vec3iRange",
+                         "Evaluate LongestAxis over arrays of ( Vec3iRange ) elements.",
+                         s_LongestAxis_Vec3iRangeLoop,
+                         s_LongestAxis_Vec3iRangeTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2,3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LongestAxis_Vec4iRange",
+                         "Evaluate LongestAxis over arrays of ( Vec4iRange ) elements.",
+                         s_LongestAxis_Vec4iRangeLoop,
+                         s_LongestAxis_Vec4iRangeTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2,4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "SetTranslate_Vec2f_Mat3f",
+                         "Evaluate SetTranslate over arrays of ( Vec2f, Mat3f ) elements.",
+                         s_SetTranslate_Vec2f_Mat3fLoop,
+                         s_SetTranslate_Vec2f_Mat3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2)->(3,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "SetTranslate_Vec3f_Mat4f",
+                         "Evaluate SetTranslate over arrays of ( Vec3f, Mat4f ) elements.",
+                         s_SetTranslate_Vec3f_Mat4fLoop,
+                         s_SetTranslate_Vec3f_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Max_float_float",
+                         "Evaluate Max over arrays of ( float, float ) elements.",
+                         s_Max_float_floatLoop,
+                         s_Max_float_floatTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         nullptr );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Max_int_int",
+                         "Evaluate Max over arrays of ( int, int ) elements.",
+                         s_Max_int_intLoop,
+                         s_Max_int_intTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         nullptr );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Max_bool_bool",
+                         "Evaluate Max over arrays of ( bool, bool ) elements.",
+                         s_Max_bool_boolLoop,
+                         s_Max_bool_boolTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         nullptr );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Max_Vec2f_Vec2f",
+                         "Evaluate Max over arrays of ( Vec2f, Vec2f ) elements.",
+                         s_Max_Vec2f_Vec2fLoop,
+                         s_Max_Vec2f_Vec2fTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(2),(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Max_Vec3f_Vec3f",
+                         "Evaluate Max over arrays of ( Vec3f, Vec3f ) elements.",
+                         s_Max_Vec3f_Vec3fLoop,
+                         s_Max_Vec3f_Vec3fTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(3),(3)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Max_Vec4f_Vec4f",
+                         "Evaluate Max over arrays of ( Vec4f, Vec4f ) elements.",
+                         s_Max_Vec4f_Vec4fLoop,
+                         s_Max_Vec4f_Vec4fTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(4),(4)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Max_Vec2i_Vec2i",
+                         "Evaluate Max over arrays of ( Vec2i, Vec2i ) elements.",
+                         s_Max_Vec2i_Vec2iLoop,
+                         s_Max_Vec2i_Vec2iTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(2),(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Max_Vec3i_Vec3i",
+                         "Evaluate Max over arrays of ( Vec3i, Vec3i ) elements.",
+                         s_Max_Vec3i_Vec3iLoop,
+                         s_Max_Vec3i_Vec3iTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(3),(3)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Max_Vec4i_Vec4i",
+                         "Evaluate Max over arrays of ( Vec4i, Vec4i ) elements.",
+                         s_Max_Vec4i_Vec4iLoop,
+                         s_Max_Vec4i_Vec4iTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(4),(4)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Max_Mat3f_Mat3f",
+                         "Evaluate Max over arrays of ( Mat3f, Mat3f ) elements.",
+                         s_Max_Mat3f_Mat3fLoop,
+                         s_Max_Mat3f_Mat3fTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(3,3),(3,3)->(3,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Max_Mat4f_Mat4f",
+                         "Evaluate Max over arrays of ( Mat4f, Mat4f ) elements.",
+                         s_Max_Mat4f_Mat4fLoop,
+                         s_Max_Mat4f_Mat4fTypes,
+                         2,
+                         1,
+                         PyUFunc_ReorderableNone,
+                         "(4,4),(4,4)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Floor_float",
+                         "Evaluate Floor over arrays of ( float ) elements.",
+                         s_Floor_floatLoop,
+                         s_Floor_floatTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         nullptr );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Floor_Vec2f",
+                         "Evaluate Floor over arrays of ( Vec2f ) elements.",
+                         s_Floor_Vec2fLoop,
+                         s_Floor_Vec2fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Floor_Vec3f",
+                         "Evaluate Floor over arrays of ( Vec3f ) elements.",
+                         s_Floor_Vec3fLoop,
+                         s_Floor_Vec3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Floor_Vec4f",
+                         "Evaluate Floor over arrays of ( Vec4f ) elements.",
+                         s_Floor_Vec4fLoop,
+                         s_Floor_Vec4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Floor_Mat3f",
+                         "Evaluate Floor over arrays of ( Mat3f ) elements.",
+                         s_Floor_Mat3fLoop,
+                         s_Floor_Mat3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3,3)->(3,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Floor_Mat4f",
+                         "Evaluate Floor over arrays of ( Mat4f ) elements.",
+                         s_Floor_Mat4fLoop,
+                         s_Floor_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4,4)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Transpose_Mat3f",
+                         "Evaluate Transpose over arrays of ( Mat3f ) elements.",
+                         s_Transpose_Mat3fLoop,
+                         s_Transpose_Mat3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3,3)->(3,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Transpose_Mat4f",
+                         "Evaluate Transpose over arrays of ( Mat4f ) elements.",
+                         s_Transpose_Mat4fLoop,
+                         s_Transpose_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4,4)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "SetScale_Vec2f_Mat3f",
+                         "Evaluate SetScale over arrays of ( Vec2f, Mat3f ) elements.",
+                         s_SetScale_Vec2f_Mat3fLoop,
+                         s_SetScale_Vec2f_Mat3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2)->(3,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "SetScale_Vec3f_Mat4f",
+                         "Evaluate SetScale over arrays of ( Vec3f, Mat4f ) elements.",
+                         s_SetScale_Vec3f_Mat4fLoop,
+                         s_SetScale_Vec3f_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Ceil_float",
+                         "Evaluate Ceil over arrays of ( float ) elements.",
+                         s_Ceil_floatLoop,
+                         s_Ceil_floatTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         nullptr );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Ceil_Vec2f",
+                         "Evaluate Ceil over arrays of ( Vec2f ) elements.",
+                         s_Ceil_Vec2fLoop,
+                         s_Ceil_Vec2fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Ceil_Vec3f",
+                         "Evaluate Ceil over arrays of ( Vec3f ) elements.",
+                         s_Ceil_Vec3fLoop,
+                         s_Ceil_Vec3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Ceil_Vec4f",
+                         "Evaluate Ceil over arrays of ( Vec4f ) elements.",
+                         s_Ceil_Vec4fLoop,
+                         s_Ceil_Vec4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Ceil_Mat3f",
+                         "Evaluate Ceil over arrays of ( Mat3f ) elements.",
+                         s_Ceil_Mat3fLoop,
+                         s_Ceil_Mat3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3,3)->(3,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Ceil_Mat4f",
+                         "Evaluate Ceil over arrays of ( Mat4f ) elements.",
+                         s_Ceil_Mat4fLoop,
+                         s_Ceil_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4,4)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "FaceForward_Vec2f_Vec2f",
+                         "Evaluate FaceForward over arrays of ( Vec2f, Vec2f ) elements.",
+                         s_FaceForward_Vec2f_Vec2fLoop,
+                         s_FaceForward_Vec2f_Vec2fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "FaceForward_Vec3f_Vec3f",
+                         "Evaluate FaceForward over arrays of ( Vec3f, Vec3f ) elements.",
+                         s_FaceForward_Vec3f_Vec3fLoop,
+                         s_FaceForward_Vec3f_Vec3fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(3),(3)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "FaceForward_Vec4f_Vec4f",
+                         "Evaluate FaceForward over arrays of ( Vec4f, Vec4f ) elements.",
+                         s_FaceForward_Vec4f_Vec4fLoop,
+                         s_FaceForward_Vec4f_Vec4fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(4),(4)->(4)" );
+    gm_ufuncs::AddUfunc(
+        o_module,
+        "RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRange",
+        "Evaluate RayAABBIntersection over arrays of ( Vec2f, Vec2f, Vec2fRange, FloatRange ) elements.",
+        s_RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRangeLoop,
+        s_RayAABBIntersection_Vec2f_Vec2f_Vec2fRange_FloatRangeTypes,
+        3,
+        2,
+        PyUFunc_None,
+        "(2),(2),(2,2)->(2),()" );
+    gm_ufuncs::AddUfunc(
+        o_module,
+        "RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRange",
+        "Evaluate RayAABBIntersection over arrays of ( Vec3f, Vec3f, Vec3fRange, FloatRange ) elements.",
+        s_RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRangeLoop,
+        s_RayAABBIntersection_Vec3f_Vec3f_Vec3fRange_FloatRangeTypes,
+        3,
+        2,
+        PyUFunc_None,
+        "(3),(3),(2,3)->(2),()" );
+    gm_ufuncs::AddUfunc(
+        o_module,
+        "RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRange",
+        "Evaluate RayAABBIntersection over arrays of ( Vec4f, Vec4f, Vec4fRange, FloatRange ) elements.",
+        s_RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRangeLoop,
+        s_RayAABBIntersection_Vec4f_Vec4f_Vec4fRange_FloatRangeTypes,
+        3,
+        2,
+        PyUFunc_None,
+        "(4),(4),(2,4)->(2),()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ApproximateLength_Vec2f",
+                         "Evaluate ApproximateLength over arrays of ( Vec2f ) elements.",
+                         s_ApproximateLength_Vec2fLoop,
+                         s_ApproximateLength_Vec2fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ApproximateLength_Vec3f",
+                         "Evaluate ApproximateLength over arrays of ( Vec3f ) elements.",
+                         s_ApproximateLength_Vec3fLoop,
+                         s_ApproximateLength_Vec3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ApproximateLength_Vec4f",
+                         "Evaluate ApproximateLength over arrays of ( Vec4f ) elements.",
+                         s_ApproximateLength_Vec4fLoop,
+                         s_ApproximateLength_Vec4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ApproximateLength_Quatf",
+                         "Evaluate ApproximateLength over arrays of ( Quatf ) elements.",
+                         s_ApproximateLength_QuatfLoop,
+                         s_ApproximateLength_QuatfTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LookAt_Vec3f_Vec3f_Vec3f",
+                         "Evaluate LookAt over arrays of ( Vec3f, Vec3f, Vec3f ) elements.",
+                         s_LookAt_Vec3f_Vec3f_Vec3fLoop,
+                         s_LookAt_Vec3f_Vec3f_Vec3fTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(3),(3),(3)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ApproximateSetRotateZ_float_Mat4f",
+                         "Evaluate ApproximateSetRotateZ over arrays of ( float, Mat4f ) elements.",
+                         s_ApproximateSetRotateZ_float_Mat4fLoop,
+                         s_ApproximateSetRotateZ_float_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "()->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "HasScale_Mat3f",
+                         "Evaluate HasScale over arrays of ( Mat3f ) elements.",
+                         s_HasScale_Mat3fLoop,
+                         s_HasScale_Mat3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3,3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "HasScale_Mat4f",
+                         "Evaluate HasScale over arrays of ( Mat4f ) elements.",
+                         s_HasScale_Mat4fLoop,
+                         s_HasScale_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4,4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "DotProduct_Vec2f_Vec2f",
+                         "Evaluate DotProduct over arrays of ( Vec2f, Vec2f ) elements.",
+                         s_DotProduct_Vec2f_Vec2fLoop,
+                         s_DotProduct_Vec2f_Vec2fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "DotProduct_Vec3f_Vec3f",
+                         "Evaluate DotProduct over arrays of ( Vec3f, Vec3f ) elements.",
+                         s_DotProduct_Vec3f_Vec3fLoop,
+                         s_DotProduct_Vec3f_Vec3fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(3),(3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "DotProduct_Vec4f_Vec4f",
+                         "Evaluate DotProduct over arrays of ( Vec4f, Vec4f ) elements.",
+                         s_DotProduct_Vec4f_Vec4fLoop,
+                         s_DotProduct_Vec4f_Vec4fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(4),(4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "DotProduct_Quatf_Quatf",
+                         "Evaluate DotProduct over arrays of ( Quatf, Quatf ) elements.",
+                         s_DotProduct_Quatf_QuatfLoop,
+                         s_DotProduct_Quatf_QuatfTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(4),(4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ApproximateSineCosine_float_float_float",
+                         "Evaluate ApproximateSineCosine over arrays of ( float, float, float ) elements.",
+                         s_ApproximateSineCosine_float_float_floatLoop,
+                         s_ApproximateSineCosine_float_float_floatTypes,
+                         1,
+                         2,
+                         PyUFunc_None,
+                         nullptr );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Intersection_FloatRange_FloatRange",
+                         "Evaluate Intersection over arrays of ( FloatRange, FloatRange ) elements.",
+                         s_Intersection_FloatRange_FloatRangeLoop,
+                         s_Intersection_FloatRange_FloatRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Intersection_IntRange_IntRange",
+                         "Evaluate Intersection over arrays of ( IntRange, IntRange ) elements.",
+                         s_Intersection_IntRange_IntRangeLoop,
+                         s_Intersection_IntRange_IntRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Intersection_Vec2fRange_Vec2fRange",
+                         "Evaluate Intersection over arrays of ( Vec2fRange, Vec2fRange ) elements.",
+                         s_Intersection_Vec2fRange_Vec2fRangeLoop,
+                         s_Intersection_Vec2fRange_Vec2fRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,2),(2,2)->(2,2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Intersection_Vec3fRange_Vec3fRange",
+                         "Evaluate Intersection over arrays of ( Vec3fRange, Vec3fRange ) elements.",
+                         s_Intersection_Vec3fRange_Vec3fRangeLoop,
+                         s_Intersection_Vec3fRange_Vec3fRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,3),(2,3)->(2,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Intersection_Vec4fRange_Vec4fRange",
+                         "Evaluate Intersection over arrays of ( Vec4fRange, Vec4fRange ) elements.",
+                         s_Intersection_Vec4fRange_Vec4fRangeLoop,
+                         s_Intersection_Vec4fRange_Vec4fRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,4),(2,4)->(2,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Intersection_Vec2iRange_Vec2iRange",
+                         "Evaluate Intersection over arrays of ( Vec2iRange, Vec2iRange ) elements.",
+                         s_Intersection_Vec2iRange_Vec2iRangeLoop,
+                         s_Intersection_Vec2iRange_Vec2iRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,2),(2,2)->(2,2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Intersection_Vec3iRange_Vec3iRange",
+                         "Evaluate Intersection over arrays of ( Vec3iRange, Vec3iRange ) elements.",
+                         s_Intersection_Vec3iRange_Vec3iRangeLoop,
+                         s_Intersection_Vec3iRange_Vec3iRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,3),(2,3)->(2,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Intersection_Vec4iRange_Vec4iRange",
+                         "Evaluate Intersection over arrays of ( Vec4iRange, Vec4iRange ) elements.",
+                         s_Intersection_Vec4iRange_Vec4iRangeLoop,
+                         s_Intersection_Vec4iRange_Vec4iRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,4),(2,4)->(2,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "SetRotateY_float_Mat4f",
+                         "Evaluate SetRotateY over arrays of ( float, Mat4f ) elements.",
+                         s_SetRotateY_float_Mat4fLoop,
+                         s_SetRotateY_float_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "()->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "SetRotateX_float_Mat4f",
+                         "Evaluate SetRotateX over arrays of ( float, Mat4f ) elements.",
+                         s_SetRotateX_float_Mat4fLoop,
+                         s_SetRotateX_float_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "()->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_FloatRange_FloatRange",
+                         "Evaluate Expand over arrays of ( FloatRange, FloatRange ) elements.",
+                         s_Expand_FloatRange_FloatRangeLoop,
+                         s_Expand_FloatRange_FloatRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_FloatRange_float",
+                         "Evaluate Expand over arrays of ( FloatRange, float ) elements.",
+                         s_Expand_FloatRange_floatLoop,
+                         s_Expand_FloatRange_floatTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),()->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_IntRange_IntRange",
+                         "Evaluate Expand over arrays of ( IntRange, IntRange ) elements.",
+                         s_Expand_IntRange_IntRangeLoop,
+                         s_Expand_IntRange_IntRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_IntRange_int",
+                         "Evaluate Expand over arrays of ( IntRange, int ) elements.",
+                         s_Expand_IntRange_intLoop,
+                         s_Expand_IntRange_intTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),()->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_Vec2fRange_Vec2fRange",
+                         "Evaluate Expand over arrays of ( Vec2fRange, Vec2fRange ) elements.",
+                         s_Expand_Vec2fRange_Vec2fRangeLoop,
+                         s_Expand_Vec2fRange_Vec2fRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,2),(2,2)->(2,2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_Vec2fRange_Vec2f",
+                         "Evaluate Expand over arrays of ( Vec2fRange, Vec2f ) elements.",
+                         s_Expand_Vec2fRange_Vec2fLoop,
+                         s_Expand_Vec2fRange_Vec2fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,2),(2)->(2,2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_Vec3fRange_Vec3fRange",
+                         "Evaluate Expand over arrays of ( Vec3fRange, Vec3fRange ) elements.",
+                         s_Expand_Vec3fRange_Vec3fRangeLoop,
+                         s_Expand_Vec3fRange_Vec3fRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,3),(2,3)->(2,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_Vec3fRange_Vec3f",
+                         "Evaluate Expand over arrays of ( Vec3fRange, Vec3f ) elements.",
+                         s_Expand_Vec3fRange_Vec3fLoop,
+                         s_Expand_Vec3fRange_Vec3fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,3),(3)->(2,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_Vec4fRange_Vec4fRange",
+                         "Evaluate Expand over arrays of ( Vec4fRange, Vec4fRange ) elements.",
+                         s_Expand_Vec4fRange_Vec4fRangeLoop,
+                         s_Expand_Vec4fRange_Vec4fRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,4),(2,4)->(2,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_Vec4fRange_Vec4f",
+                         "Evaluate Expand over arrays of ( Vec4fRange, Vec4f ) elements.",
+                         s_Expand_Vec4fRange_Vec4fLoop,
+                         s_Expand_Vec4fRange_Vec4fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,4),(4)->(2,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_Vec2iRange_Vec2iRange",
+                         "Evaluate Expand over arrays of ( Vec2iRange, Vec2iRange ) elements.",
+                         s_Expand_Vec2iRange_Vec2iRangeLoop,
+                         s_Expand_Vec2iRange_Vec2iRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,2),(2,2)->(2,2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_Vec2iRange_Vec2i",
+                         "Evaluate Expand over arrays of ( Vec2iRange, Vec2i ) elements.",
+                         s_Expand_Vec2iRange_Vec2iLoop,
+                         s_Expand_Vec2iRange_Vec2iTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,2),(2)->(2,2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_Vec3iRange_Vec3iRange",
+                         "Evaluate Expand over arrays of ( Vec3iRange, Vec3iRange ) elements.",
+                         s_Expand_Vec3iRange_Vec3iRangeLoop,
+                         s_Expand_Vec3iRange_Vec3iRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,3),(2,3)->(2,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_Vec3iRange_Vec3i",
+                         "Evaluate Expand over arrays of ( Vec3iRange, Vec3i ) elements.",
+                         s_Expand_Vec3iRange_Vec3iLoop,
+                         s_Expand_Vec3iRange_Vec3iTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,3),(3)->(2,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_Vec4iRange_Vec4iRange",
+                         "Evaluate Expand over arrays of ( Vec4iRange, Vec4iRange ) elements.",
+                         s_Expand_Vec4iRange_Vec4iRangeLoop,
+                         s_Expand_Vec4iRange_Vec4iRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,4),(2,4)->(2,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Expand_Vec4iRange_Vec4i",
+                         "Evaluate Expand over arrays of ( Vec4iRange, Vec4i ) elements.",
+                         s_Expand_Vec4iRange_Vec4iLoop,
+                         s_Expand_Vec4iRange_Vec4iTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2,4),(4)->(2,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "SetRotateZ_float_Mat4f",
+                         "Evaluate SetRotateZ over arrays of ( float, Mat4f ) elements.",
+                         s_SetRotateZ_float_Mat4fLoop,
+                         s_SetRotateZ_float_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "()->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Distance_Vec2f_Vec2f",
+                         "Evaluate Distance over arrays of ( Vec2f, Vec2f ) elements.",
+                         s_Distance_Vec2f_Vec2fLoop,
+                         s_Distance_Vec2f_Vec2fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Distance_Vec3f_Vec3f",
+                         "Evaluate Distance over arrays of ( Vec3f, Vec3f ) elements.",
+                         s_Distance_Vec3f_Vec3fLoop,
+                         s_Distance_Vec3f_Vec3fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(3),(3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "RayPosition_Vec2f_Vec2f_float",
+                         "Evaluate RayPosition over arrays of ( Vec2f, Vec2f, float ) elements.",
+                         s_RayPosition_Vec2f_Vec2f_floatLoop,
+                         s_RayPosition_Vec2f_Vec2f_floatTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2),()->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "RayPosition_Vec3f_Vec3f_float",
+                         "Evaluate RayPosition over arrays of ( Vec3f, Vec3f, float ) elements.",
+                         s_RayPosition_Vec3f_Vec3f_floatLoop,
+                         s_RayPosition_Vec3f_Vec3f_floatTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(3),(3),()->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "TransformPoint_Mat4f_Vec3f",
+                         "Evaluate TransformPoint over arrays of ( Mat4f, Vec3f ) elements.",
+                         s_TransformPoint_Mat4f_Vec3fLoop,
+                         s_TransformPoint_Mat4f_Vec3fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(4,4),(3)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "NormalizedLinearInterpolation_Quatf_Quatf_float",
+                         "Evaluate NormalizedLinearInterpolation over arrays of ( Quatf, Quatf, float ) elements.",
+                         s_NormalizedLinearInterpolation_Quatf_Quatf_floatLoop,
+                         s_NormalizedLinearInterpolation_Quatf_Quatf_floatTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(4),(4),()->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Radians_float",
+                         "Evaluate Radians over arrays of ( float ) elements.",
+                         s_Radians_floatLoop,
+                         s_Radians_floatTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         nullptr );
+    gm_ufuncs::AddUfunc( o_module,
+                         "CoordinateSystem_Vec3f_Vec3f_Vec3f",
+                         "Evaluate CoordinateSystem over arrays of ( Vec3f, Vec3f, Vec3f ) elements.",
+                         s_CoordinateSystem_Vec3f_Vec3f_Vec3fLoop,
+                         s_CoordinateSystem_Vec3f_Vec3f_Vec3fTypes,
+                         1,
+                         2,
+                         PyUFunc_None,
+                         "(3)->(3),(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Length_Vec2f",
+                         "Evaluate Length over arrays of ( Vec2f ) elements.",
+                         s_Length_Vec2fLoop,
+                         s_Length_Vec2fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Length_Vec3f",
+                         "Evaluate Length over arrays of ( Vec3f ) elements.",
+                         s_Length_Vec3fLoop,
+                         s_Length_Vec3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Length_Vec4f",
+                         "Evaluate Length over arrays of ( Vec4f ) elements.",
+                         s_Length_Vec4fLoop,
+                         s_Length_Vec4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Length_Quatf",
+                         "Evaluate Length over arrays of ( Quatf ) elements.",
+                         s_Length_QuatfLoop,
+                         s_Length_QuatfTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ApproximateReciprocalSquareRoot_float",
+                         "Evaluate ApproximateReciprocalSquareRoot over arrays of ( float ) elements.",
+                         s_ApproximateReciprocalSquareRoot_floatLoop,
+                         s_ApproximateReciprocalSquareRoot_floatTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         nullptr );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ApproximateSetRotateX_float_Mat4f",
+                         "Evaluate ApproximateSetRotateX over arrays of ( float, Mat4f ) elements.",
+                         s_ApproximateSetRotateX_float_Mat4fLoop,
+                         s_ApproximateSetRotateX_float_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "()->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "SetIdentity_Mat3f",
+                         "Evaluate SetIdentity over arrays of ( Mat3f ) elements.",
+                         s_SetIdentity_Mat3fLoop,
+                         s_SetIdentity_Mat3fTypes,
+                         0,
+                         1,
+                         PyUFunc_None,
+                         "->(3,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "SetIdentity_Mat4f",
+                         "Evaluate SetIdentity over arrays of ( Mat4f ) elements.",
+                         s_SetIdentity_Mat4fLoop,
+                         s_SetIdentity_Mat4fTypes,
+                         0,
+                         1,
+                         PyUFunc_None,
+                         "->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearMap_float_FloatRange_FloatRange",
+                         "Evaluate LinearMap over arrays of ( float, FloatRange, FloatRange ) elements.",
+                         s_LinearMap_float_FloatRange_FloatRangeLoop,
+                         s_LinearMap_float_FloatRange_FloatRangeTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(),(2),(2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearMap_Mat3f_FloatRange_FloatRange",
+                         "Evaluate LinearMap over arrays of ( Mat3f, FloatRange, FloatRange ) elements.",
+                         s_LinearMap_Mat3f_FloatRange_FloatRangeLoop,
+                         s_LinearMap_Mat3f_FloatRange_FloatRangeTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(3,3),(2),(2)->(3,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearMap_Mat4f_FloatRange_FloatRange",
+                         "Evaluate LinearMap over arrays of ( Mat4f, FloatRange, FloatRange ) elements.",
+                         s_LinearMap_Mat4f_FloatRange_FloatRangeLoop,
+                         s_LinearMap_Mat4f_FloatRange_FloatRangeTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(4,4),(2),(2)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearMap_Vec2f_FloatRange_FloatRange",
+                         "Evaluate LinearMap over arrays of ( Vec2f, FloatRange, FloatRange ) elements.",
+                         s_LinearMap_Vec2f_FloatRange_FloatRangeLoop,
+                         s_LinearMap_Vec2f_FloatRange_FloatRangeTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2),(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearMap_Vec3f_FloatRange_FloatRange",
+                         "Evaluate LinearMap over arrays of ( Vec3f, FloatRange, FloatRange ) elements.",
+                         s_LinearMap_Vec3f_FloatRange_FloatRangeLoop,
+                         s_LinearMap_Vec3f_FloatRange_FloatRangeTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(3),(2),(2)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LinearMap_Vec4f_FloatRange_FloatRange",
+                         "Evaluate LinearMap over arrays of ( Vec4f, FloatRange, FloatRange ) elements.",
+                         s_LinearMap_Vec4f_FloatRange_FloatRangeLoop,
+                         s_LinearMap_Vec4f_FloatRange_FloatRangeTypes,
+                         3,
+                         1,
+                         PyUFunc_None,
+                         "(4),(2),(2)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Clamp_float_FloatRange",
+                         "Evaluate Clamp over arrays of ( float, FloatRange ) elements.",
+                         s_Clamp_float_FloatRangeLoop,
+                         s_Clamp_float_FloatRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(),(2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Clamp_int_IntRange",
+                         "Evaluate Clamp over arrays of ( int, IntRange ) elements.",
+                         s_Clamp_int_IntRangeLoop,
+                         s_Clamp_int_IntRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(),(2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Clamp_Vec2f_FloatRange",
+                         "Evaluate Clamp over arrays of ( Vec2f, FloatRange ) elements.",
+                         s_Clamp_Vec2f_FloatRangeLoop,
+                         s_Clamp_Vec2f_FloatRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Clamp_Vec3f_FloatRange",
+                         "Evaluate Clamp over arrays of ( Vec3f, FloatRange ) elements.",
+                         s_Clamp_Vec3f_FloatRangeLoop,
+                         s_Clamp_Vec3f_FloatRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(3),(2)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Clamp_Vec4f_FloatRange",
+                         "Evaluate Clamp over arrays of ( Vec4f, FloatRange ) elements.",
+                         s_Clamp_Vec4f_FloatRangeLoop,
+                         s_Clamp_Vec4f_FloatRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(4),(2)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Clamp_Vec2i_IntRange",
+                         "Evaluate Clamp over arrays of ( Vec2i, IntRange ) elements.",
+                         s_Clamp_Vec2i_IntRangeLoop,
+                         s_Clamp_Vec2i_IntRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Clamp_Vec3i_IntRange",
+                         "Evaluate Clamp over arrays of ( Vec3i, IntRange ) elements.",
+                         s_Clamp_Vec3i_IntRangeLoop,
+                         s_Clamp_Vec3i_IntRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(3),(2)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Clamp_Vec4i_IntRange",
+                         "Evaluate Clamp over arrays of ( Vec4i, IntRange ) elements.",
+                         s_Clamp_Vec4i_IntRangeLoop,
+                         s_Clamp_Vec4i_IntRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(4),(2)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Clamp_Mat3f_FloatRange",
+                         "Evaluate Clamp over arrays of ( Mat3f, FloatRange ) elements.",
+                         s_Clamp_Mat3f_FloatRangeLoop,
+                         s_Clamp_Mat3f_FloatRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(3,3),(2)->(3,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Clamp_Mat4f_FloatRange",
+                         "Evaluate Clamp over arrays of ( Mat4f, FloatRange ) elements.",
+                         s_Clamp_Mat4f_FloatRangeLoop,
+                         s_Clamp_Mat4f_FloatRangeTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(4,4),(2)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LengthSquared_Vec2f",
+                         "Evaluate LengthSquared over arrays of ( Vec2f ) elements.",
+                         s_LengthSquared_Vec2fLoop,
+                         s_LengthSquared_Vec2fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(2)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LengthSquared_Vec3f",
+                         "Evaluate LengthSquared over arrays of ( Vec3f ) elements.",
+                         s_LengthSquared_Vec3fLoop,
+                         s_LengthSquared_Vec3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LengthSquared_Vec4f",
+                         "Evaluate LengthSquared over arrays of ( Vec4f ) elements.",
+                         s_LengthSquared_Vec4fLoop,
+                         s_LengthSquared_Vec4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "LengthSquared_Quatf",
+                         "Evaluate LengthSquared over arrays of ( Quatf ) elements.",
+                         s_LengthSquared_QuatfLoop,
+                         s_LengthSquared_QuatfTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4)->()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "InverseRigid_Mat4f",
+                         "Evaluate InverseRigid over arrays of ( Mat4f ) elements.",
+                         s_InverseRigid_Mat4fLoop,
+                         s_InverseRigid_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4,4)->(4,4)" );
+    gm_ufuncs::AddUfunc(
+        o_module,
+        "RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRange",
+        "Evaluate RaySphereIntersection over arrays of ( Vec3f, float, Vec3f, Vec3f, FloatRange ) elements.",
+        s_RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRangeLoop,
+        s_RaySphereIntersection_Vec3f_float_Vec3f_Vec3f_FloatRangeTypes,
+        4,
+        2,
+        PyUFunc_None,
+        "(3),(),(3),(3)->(2),()" );
+    gm_ufuncs::AddUfunc(
+        o_module,
+        "PerspectiveProjection_float_float_float_float_float_float",
+        "Evaluate PerspectiveProjection over arrays of ( float, float, float, float, float, float ) elements.",
+        s_PerspectiveProjection_float_float_float_float_float_floatLoop,
+        s_PerspectiveProjection_float_float_float_float_float_floatTypes,
+        6,
+        1,
+        PyUFunc_None,
+        "(),(),(),(),(),()->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "PerspectiveProjection_float_float_float_float",
+                         "Evaluate PerspectiveProjection over arrays of ( float, float, float, float ) elements.",
+                         s_PerspectiveProjection_float_float_float_floatLoop,
+                         s_PerspectiveProjection_float_float_float_floatTypes,
+                         4,
+                         1,
+                         PyUFunc_None,
+                         "(),(),(),()->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "SetRotate_float_Vec3f_Mat4f",
+                         "Evaluate SetRotate over arrays of ( float, Vec3f, Mat4f ) elements.",
+                         s_SetRotate_float_Vec3f_Mat4fLoop,
+                         s_SetRotate_float_Vec3f_Mat4fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(),(3)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "SetRotate_float_Vec3f_Quatf",
+                         "Evaluate SetRotate over arrays of ( float, Vec3f, Quatf ) elements.",
+                         s_SetRotate_float_Vec3f_QuatfLoop,
+                         s_SetRotate_float_Vec3f_QuatfTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(),(3)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "SetRotate_Quatf_Mat3f",
+                         "Evaluate SetRotate over arrays of ( Quatf, Mat3f ) elements.",
+                         s_SetRotate_Quatf_Mat3fLoop,
+                         s_SetRotate_Quatf_Mat3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4)->(3,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "SetRotate_Quatf_Mat4f",
+                         "Evaluate SetRotate over arrays of ( Quatf, Mat4f ) elements.",
+                         s_SetRotate_Quatf_Mat4fLoop,
+                         s_SetRotate_Quatf_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ViewportTransform_Vec2f_Vec2f",
+                         "Evaluate ViewportTransform over arrays of ( Vec2f, Vec2f ) elements.",
+                         s_ViewportTransform_Vec2f_Vec2fLoop,
+                         s_ViewportTransform_Vec2f_Vec2fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(2),(2)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "MatrixProduct_Mat3f_Mat3f",
+                         "Evaluate MatrixProduct over arrays of ( Mat3f, Mat3f ) elements.",
+                         s_MatrixProduct_Mat3f_Mat3fLoop,
+                         s_MatrixProduct_Mat3f_Mat3fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(3,3),(3,3)->(3,3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "MatrixProduct_Mat4f_Mat4f",
+                         "Evaluate MatrixProduct over arrays of ( Mat4f, Mat4f ) elements.",
+                         s_MatrixProduct_Mat4f_Mat4fLoop,
+                         s_MatrixProduct_Mat4f_Mat4fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(4,4),(4,4)->(4,4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "TransformVector_Mat3f_Vec2f",
+                         "Evaluate TransformVector over arrays of ( Mat3f, Vec2f ) elements.",
+                         s_TransformVector_Mat3f_Vec2fLoop,
+                         s_TransformVector_Mat3f_Vec2fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(3,3),(2)->(2)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "TransformVector_Mat4f_Vec3f",
+                         "Evaluate TransformVector over arrays of ( Mat4f, Vec3f ) elements.",
+                         s_TransformVector_Mat4f_Vec3fLoop,
+                         s_TransformVector_Mat4f_Vec3fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(4,4),(3)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "TransformVector_Quatf_Vec3f",
+                         "Evaluate TransformVector over arrays of ( Quatf, Vec3f ) elements.",
+                         s_TransformVector_Quatf_Vec3fLoop,
+                         s_TransformVector_Quatf_Vec3fTypes,
+                         2,
+                         1,
+                         PyUFunc_None,
+                         "(4),(3)->(3)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "QuadraticRoots_float_float_float_Vec2f",
+                         "Evaluate QuadraticRoots over arrays of ( float, float, float, Vec2f ) elements.",
+                         s_QuadraticRoots_float_float_float_Vec2fLoop,
+                         s_QuadraticRoots_float_float_float_Vec2fTypes,
+                         3,
+                         2,
+                         PyUFunc_None,
+                         "(),(),()->(2),()" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "RotationQuaternion_Mat3f",
+                         "Evaluate RotationQuaternion over arrays of ( Mat3f ) elements.",
+                         s_RotationQuaternion_Mat3fLoop,
+                         s_RotationQuaternion_Mat3fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(3,3)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "RotationQuaternion_Mat4f",
+                         "Evaluate RotationQuaternion over arrays of ( Mat4f ) elements.",
+                         s_RotationQuaternion_Mat4fLoop,
+                         s_RotationQuaternion_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "(4,4)->(4)" );
+    gm_ufuncs::AddUfunc( o_module,
+                         "Degrees_float",
+                         "Evaluate Degrees over arrays of ( float ) elements.",
+                         s_Degrees_floatLoop,
+                         s_Degrees_floatTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         nullptr );
+    gm_ufuncs::AddUfunc( o_module,
+                         "ApproximateSetRotateY_float_Mat4f",
+                         "Evaluate ApproximateSetRotateY over arrays of ( float, Mat4f ) elements.",
+                         s_ApproximateSetRotateY_float_Mat4fLoop,
+                         s_ApproximateSetRotateY_float_Mat4fTypes,
+                         1,
+                         1,
+                         PyUFunc_None,
+                         "()->(4,4)" );
+}
\ No newline at end of file
@@ -0,0 +1,39 @@
+{% extends "functions/functionBase.h" %}
+{% import "functions/functionUtils.h" as functionUtils %}
+
+{%- block fileDoc -%}
+/// Fast approximation of the \b length, or magnitude, of a vector.
+///
+/// The length is computed as the product of the squared length and its approximated reciprocal square root,
+/// trading a maximum relative error of \f$6 \times 10^{-6}\f$ for the cost of an exact square root.
+/// See \ref ApproximateReciprocalSquareRoot.
+{%- endblock %}
+
+{% block includes %}
+{{ functionUtils.typeIncludes(function) }}
+#include <algorithm>
+#include <limits>
+
+#include <gm/functions/approximateReciprocalSquareRoot.h>
+#include <gm/functions/lengthSquared.h>
+{% endblock %}
+
+{% block body %}
+{% for interface in function.interfaces %}
+{% set vector = interface.ArgName("vector") %}
+{% set vectorType = interface.ArgType("vector") %}
+/// Approximate the length of the vector \p {{ vector }}.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// \param {{ vector }} The input vector.
+///
+/// \return The approximated length of the vector, with a maximum relative error of \f$6 \times 10^{-6}\f$.
+{{- functionUtils.signature(function, interface) -}}
+{
+    // Clamping to the smallest normal value, rather than branching on zero length, keeps batched loops free
+    // of branches.  Zero length vectors produce a product of zero.
+    {{ vectorType.elementType.className }} lengthSquared = LengthSquared( {{ vector }} );
+    return lengthSquared * ApproximateReciprocalSquareRoot( std::max( lengthSquared, std::numeric_limits< {{ vectorType.elementType.className }} >::min() ) );
+}
+{% endfor %}
+{% endblock %}
@@ -0,0 +1,36 @@
+{% extends "functions/functionBase.h" %}
+{% import "functions/functionUtils.h" as functionUtils %}
+
+{%- block fileDoc -%}
+/// Fast approximation of vector normalization.
+///
+/// The vector is multiplied by the approximated reciprocal square root of its squared length, rather than
+/// divided by its exact length.  The length of the normalized vector deviates from 1 by at most
+/// \f$6 \times 10^{-6}\f$.  See \ref ApproximateReciprocalSquareRoot.
+{%- endblock %}
+
+{% block includes %}
+{{ functionUtils.typeIncludes(function) }}
+#include <gm/base/diagnostic.h>
+#include <gm/functions/approximateReciprocalSquareRoot.h>
+#include <gm/functions/lengthSquared.h>
+{% endblock %}
+
+{% block body %}
+{% for interface in function.interfaces %}
+{% set vector = interface.ArgName("vector") %}
+{% set vectorType = interface.ArgType("vector") %}
+/// Approximate the normalised vector from the input vector \p {{ vector }}.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// \param {{ vector }} Input vector.
+///
+/// \return Approximately normalised vector.
+{{- functionUtils.signature(function, interface) -}}
+{
+    {{ vectorType.elementType.className }} lengthSquared = LengthSquared( {{ vector }} );
+    GM_ASSERT( lengthSquared != {{ vectorType.CppValue( 0 ) }} );
+    return {{ vector }} * ApproximateReciprocalSquareRoot( lengthSquared );
+}
+{% endfor %}
+{% endblock %}
@@ -0,0 +1,57 @@
+{% extends "functions/functionBase.h" %}
+{% import "functions/functionUtils.h" as functionUtils %}
+
+{%- block fileDoc -%}
+/// Fast approximation of the reciprocal square root, \f$1 / \sqrt{x}\f$.
+///
+/// An initial estimate is refined with Newton-Raphson iterations
+/// \f[
+/// y_{n+1} = y_n ( 1.5 - 0.5 x y_n^2 )
+/// \f]
+/// The estimate is computed by the \p rsqrtss instruction followed by a single iteration when the SSE code paths
+/// are enabled (maximum relative error of \f$3 \times 10^{-7}\f$), otherwise by integer manipulation of the
+/// floating point representation followed by two iterations (maximum relative error of \f$5 \times 10^{-6}\f$).
+{%- endblock %}
+
+{% block includes %}
+{{ functionUtils.typeIncludes(function) }}
+#include <cstdint>
+#include <cstring>
+
+#include <gm/base/diagnostic.h>
+#include <gm/base/simd.h>
+{% endblock %}
+
+{% block body %}
+{% for interface in function.interfaces %}
+{% set value      = interface.ArgName("value") %}
+{% set valueClass = interface.ArgClass("value") %}
+/// Approximate the reciprocal square root of \p {{ value }}.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// The maximum relative error is \f$5 \times 10^{-6}\f$.
+///
+/// \param {{ value }} The input value.
+///
+/// \pre \p {{ value }} must be greater than 0.
+///
+/// \return The approximated reciprocal square root of \p {{ value }}.
+{{- functionUtils.signature(function, interface) -}}
+{
+    GM_ASSERT( {{ value }} > {{ interface.ArgType("value").CppValue( 0 ) }} );
+    const {{ valueClass }} halfValue = {{ interface.ArgType("value").CppValue( 0.5 ) }} * {{ value }};
+#if defined( GM_SIMD_SSE_ENABLED )
+    {{ valueClass }} estimate = _mm_cvtss_f32( _mm_rsqrt_ss( _mm_set_ss( {{ value }} ) ) );
+    return estimate * ( 1.5f - halfValue * estimate * estimate );
+#else
+    uint32_t bits;
+    std::memcpy( &bits, &{{ value }}, sizeof( bits ) );
+    bits = 0x5f375a86u - ( bits >> 1 );
+    {{ valueClass }} estimate;
+    std::memcpy( &estimate, &bits, sizeof( estimate ) );
+    estimate = estimate * ( 1.5f - halfValue * estimate * estimate );
+    return estimate * ( 1.5f - halfValue * estimate * estimate );
+#endif
+}
+{% endfor %}
+{% endblock %}
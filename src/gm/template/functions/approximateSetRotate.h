@@ -0,0 +1,90 @@
+{% extends "functions/functionBase.h" %}
+{% import "functions/functionUtils.h" as functionUtils %}
+
+{%- block fileDoc -%}
+/// Set a rotation for an specified axis on a transformation matrix or quaternion, with respect to the left hand rule.
+///
+/// The sine and cosine of the angle are approximated with \ref ApproximateSineCosine, for a maximum absolute
+/// error of \f$2 \times 10^{-7}\f$ in each, within \f$[-8192, 8192]\f$ radians.
+{%- endblock %}
+
+{% block includes %}
+{{ functionUtils.typeIncludes(function) }}
+
+#include <gm/functions/approximateSineCosine.h>
+#include <gm/functions/normalize.h>
+#include <gm/functions/radians.h>
+{% endblock %}
+
+{% block body %}
+{% for interface in function.interfaces %}
+{% if interface.HasArg("quaternion") %}
+{% set angle          = interface.ArgName("angle") %}
+{% set angleClass     = interface.ArgClass("angle") %}
+{% set axis           = interface.ArgName("axis") %}
+{% set axisClass      = interface.ArgClass("axis") %}
+{% set quaternion     = interface.ArgName("quaternion") %}
+{% set quaternionType = interface.ArgType("quaternion") %}
+/// Set a \p {{ axis }} rotation of \p {{ angle }} degrees onto the quaternion \p {{ quaternion }}, approximating
+/// the sine and cosine of the half angle.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// \param {{ angle }} The angle of rotation in degrees.
+/// \param {{ axis }} The axis of rotation.
+/// \param {{ quaternion }} The output unit quaternion.
+{{- functionUtils.signature(function, interface) -}}
+{
+    // Axis must be normalised.
+    {{ axisClass }} normAxis = Normalize( {{ axis }} );
+
+    // Compute the sine and cosine of the half angle.
+    {{ angleClass }} halfRadians = Radians( {{ angle }} ) * {{ quaternionType.CppValue( 0.5 ) }};
+    {{ angleClass }} sinHalfTheta, cosHalfTheta;
+    ApproximateSineCosine( halfRadians, sinHalfTheta, cosHalfTheta );
+
+    {{ quaternion }} = {{ quaternionType.className }}( normAxis[ 0 ] * sinHalfTheta,
+                                    normAxis[ 1 ] * sinHalfTheta,
+                                    normAxis[ 2 ] * sinHalfTheta,
+                                    cosHalfTheta );
+}
+{% else %}
+{% set angle      = interface.ArgName("angle") %}
+{% set angleClass = interface.ArgClass("angle") %}
+{% set axis       = interface.ArgName("axis") %}
+{% set axisClass  = interface.ArgClass("axis") %}
+{% set matrix     = interface.ArgName("matrix") %}
+/// Set a \p {{ axis }} rotation of \p {{ angle }} degrees onto the transformation
+/// matrix \p {{ matrix }}, approximating the sine and cosine of the angle.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// \param {{ angle }} The angle of rotation in degrees.
+/// \param {{ axis }} The axis of rotation.
+/// \param {{ matrix }} Transformation matrix.
+{{- functionUtils.signature(function, interface) -}}
+{
+    // Axis must be normalised.
+    {{ axisClass }} normAxis = Normalize( {{ axis }} );
+
+    // Compute cosine and sine.
+    {{ angleClass }} radians = Radians( {{ angle }} );
+    {{ angleClass }} sinTheta, cosTheta;
+    ApproximateSineCosine( radians, sinTheta, cosTheta );
+
+    {{ matrix }}( 0, 0 ) = normAxis[ 0 ] * normAxis[ 0 ] + (1 - normAxis[ 0 ] * normAxis[ 0 ]) * cosTheta;
+    {{ matrix }}( 0, 1 ) = normAxis[ 0 ] * normAxis[ 1 ] * (1 - cosTheta) - normAxis[ 2 ] * sinTheta;
+    {{ matrix }}( 0, 2 ) = normAxis[ 0 ] * normAxis[ 2 ] * (1 - cosTheta) + normAxis[ 1 ] * sinTheta;
+    {{ matrix }}( 0, 3 ) = 0;
+
+    {{ matrix }}( 1, 0 ) = normAxis[ 0 ] * normAxis[ 1 ] * (1 - cosTheta) + normAxis[ 2 ] * sinTheta;
+    {{ matrix }}( 1, 1 ) = normAxis[ 1 ] * normAxis[ 1 ] + (1 - normAxis[ 1 ] * normAxis[ 1 ]) * cosTheta;
+    {{ matrix }}( 1, 2 ) = normAxis[ 1 ] * normAxis[ 2 ] * (1 - cosTheta) - normAxis[ 0 ] * sinTheta;
+    {{ matrix }}( 1, 3 ) = 0;
+
+    {{ matrix }}( 2, 0 ) = normAxis[ 0 ] * normAxis[ 2 ] * (1 - cosTheta) - normAxis[ 1 ] * sinTheta;
+    {{ matrix }}( 2, 1 ) = normAxis[ 1 ] * normAxis[ 2 ] * (1 - cosTheta) + normAxis[ 0 ] * sinTheta;
+    {{ matrix }}( 2, 2 ) = normAxis[ 2 ] * normAxis[ 2 ] + (1 - normAxis[ 2 ] * normAxis[ 2 ]) * cosTheta;
+    {{ matrix }}( 2, 3 ) = 0;
+}
+{% endif %}
+{% endfor %}
+{% endblock %}
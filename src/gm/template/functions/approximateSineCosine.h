@@ -0,0 +1,66 @@
+{% extends "functions/functionBase.h" %}
+{% import "functions/functionUtils.h" as functionUtils %}
+
+{%- block fileDoc -%}
+/// Fast approximation of the sine and cosine of an angle, computed together.
+///
+/// The angle is reduced into \f$[-\pi/4, \pi/4]\f$ by subtracting the nearest multiple of \f$\pi/2\f$ (in three
+/// parts, such that the reduction is exact in single precision for moderate angles), then the sine and cosine of
+/// the reduced angle are evaluated with minimax polynomials and assigned by quadrant without branching.
+///
+/// The maximum absolute error is \f$2 \times 10^{-7}\f$ for angles within \f$[-8192, 8192]\f$ radians, and
+/// degrades for larger angles.  The angle must be finite and within \f$[-10^9, 10^9]\f$ radians, such that its
+/// quadrant can be represented as an int.
+{%- endblock %}
+
+{% block includes %}
+{{ functionUtils.typeIncludes(function) }}
+
+#include <gm/base/diagnostic.h>
+{% endblock %}
+
+{% block body %}
+{% for interface in function.interfaces %}
+{% set angle      = interface.ArgName("angle") %}
+{% set angleType  = interface.ArgType("angle") %}
+{% set angleClass = interface.ArgClass("angle") %}
+{% set sine       = interface.ArgName("sine") %}
+{% set cosine     = interface.ArgName("cosine") %}
+/// Approximate the sine and cosine of \p {{ angle }}.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// \param {{ angle }} The input angle in units of \em radians.
+/// \param {{ sine }} The approximated sine of \p {{ angle }}.
+/// \param {{ cosine }} The approximated cosine of \p {{ angle }}.
+///
+/// \pre \p {{ angle }} must be in the range of [-1e9, 1e9].
+{{- functionUtils.signature(function, interface) -}}
+{
+    GM_ASSERT_MSG( {{ angle }} >= -1e9f && {{ angle }} <= 1e9f,
+                   "Expected {{ angle }} between [-1e9,1e9], got %f\n",
+                   {{ angle }} );
+
+    // Nearest quadrant.
+    const {{ angleClass }} scaledAngle = {{ angle }} * {{ angleType.CppValue( 0.636619772367581343 ) }};
+    const int quadrant = static_cast< int >( scaledAngle + ( scaledAngle >= {{ angleType.CppValue( 0 ) }} ? {{ angleType.CppValue( 0.5 ) }} : {{ angleType.CppValue( -0.5 ) }} ) );
+    const {{ angleClass }} quadrantAngle = static_cast< {{ angleClass }} >( quadrant );
+
+    // Cody-Waite reduction, with pi / 2 split into parts whose products with the quadrant are exact.
+    {{ angleClass }} reduced = {{ angle }} - quadrantAngle * 1.5703125f;
+    reduced = reduced - quadrantAngle * 4.837512969970703125e-4f;
+    reduced = reduced - quadrantAngle * 7.54978995489188216e-8f;
+
+    // Minimax polynomials over [-pi / 4, pi / 4].
+    const {{ angleClass }} reducedSquared = reduced * reduced;
+    const {{ angleClass }} reducedSine = reduced + reduced * reducedSquared * ( -1.6666654611e-1f + reducedSquared * ( 8.3321608736e-3f + reducedSquared * -1.9515295891e-4f ) );
+    const {{ angleClass }} reducedCosine = 1.0f - 0.5f * reducedSquared + reducedSquared * reducedSquared * ( 4.166664568298827e-2f + reducedSquared * ( -1.388731625493765e-3f + reducedSquared * 2.443315711809948e-5f ) );
+
+    // Odd quadrants swap the sine and cosine, the sine is negated in quadrants 2, 3 and the cosine in 1, 2.
+    const bool swap = ( quadrant & 1 ) != 0;
+    const {{ angleClass }} quadrantSine = swap ? reducedCosine : reducedSine;
+    const {{ angleClass }} quadrantCosine = swap ? reducedSine : reducedCosine;
+    {{ sine }} = ( quadrant & 2 ) != 0 ? -quadrantSine : quadrantSine;
+    {{ cosine }} = ( ( quadrant + 1 ) & 2 ) != 0 ? -quadrantCosine : quadrantCosine;
+}
+{% endfor %}
+{% endblock %}
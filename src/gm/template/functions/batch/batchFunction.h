@@ -0,0 +1,45 @@
+{% import "functions/functionUtils.h" as functionUtils %}
+#pragma once
+
+/// \file functions/batch/{{ function.headerFileName }}
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// Batched {{ function.name }}, evaluating \ref {{ function.name }} over contiguous arrays of elements.
+///
+/// Each input is a \ref BatchInput, viewing either an array of values or a single value broadcasted across
+/// all the elements.  The outputs must not alias the inputs nor each other, see base/batch.h.
+
+#include <gm/gm.h>
+
+#include <gm/base/batch.h>
+
+#include <gm/functions/{{ function.headerFileName }}>
+
+GM_NS_OPEN
+
+{% for interface in function.spanInterfaces %}
+/// Batched {{ function.name }}, over \p i_count elements.
+/// \ingroup gm_functions_{{ function.category }}
+///
+{% for arg in interface.inputArguments -%}
+/// \param {{ arg.name }} Input {{ arg.type.className }}(s), varying or uniform.
+{% endfor -%}
+/// \param i_count The number of elements.
+{% for arg in interface.outputArguments -%}
+/// \param {{ arg.name }} Array of \p i_count output {{ arg.type.className }}(s).
+{% endfor -%}
+{% if interface.returnType -%}
+/// \param o_result Array of \p i_count returned {{ interface.returnType.className }}(s).
+{% endif -%}
+GM_HOST_DEVICE inline void {{ function.name }}( {{ interface.spanTypedArgs }} )
+{
+    for ( size_t index = 0; index < i_count; ++index )
+    {
+        {% if interface.returnType -%}
+        o_result[ index ] =
+        {%- endif %} {{ function.name }}( {{ interface.batchIndexedArgs }} );
+    }
+}
+
+{% endfor %}
+GM_NS_CLOSE
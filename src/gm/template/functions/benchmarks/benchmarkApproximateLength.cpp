@@ -0,0 +1,59 @@
+{% set exactName = function.name[ "Approximate"|length: ] -%}
+{% set exactHeaderFileName = exactName[ 0 ]|lower + exactName[ 1: ] + ".h" -%}
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/{{ function.headerFileName }}>
+#include <gm/functions/{{ exactHeaderFileName }}>
+#include <gm/functions/batch/{{ function.headerFileName }}>
+#include <gm/functions/batch/{{ exactHeaderFileName }}>
+
+#include <cmath>
+#include <vector>
+
+{% for interface in function.interfaces %}
+{% set vectorType = interface.ArgType("vector") %}
+{% set resultType = interface.returnType %}
+TEST_CASE( "{{ function.name }}_{{ interface.testSuffix }}" )
+{
+    gm::{{ vectorType.className }} {{ vectorType.varName }}(
+{%- for elementIndex in range(vectorType.elementSize) -%}
+        {{ vectorType.CppValue( elementIndex + 1 ) }}{% if not loop.last %},{% endif %}
+{%- endfor -%}
+    );
+    BENCHMARK( "{{ exactName }}" )
+    {
+        return gm::{{ exactName }}( {{ vectorType.varName }} );
+    };
+    BENCHMARK( "{{ function.name }}" )
+    {
+        return gm::{{ function.name }}( {{ vectorType.varName }} );
+    };
+}
+
+TEST_CASE( "{{ function.name }}_Batch_{{ interface.testSuffix }}" )
+{
+    const size_t count = 4096;
+    std::vector< gm::{{ vectorType.className }} > {{ vectorType.varName }}s( count );
+    std::vector< {{ resultType.namespacedClassName }} > results( count );
+    for ( size_t index = 0; index < count; ++index )
+    {
+        {{ vectorType.varName }}s[ index ] = gm::{{ vectorType.className }}(
+{%- for elementIndex in range(vectorType.elementSize) -%}
+            std::sin( index * {{ elementIndex + 1 }}.0f ) + {{ vectorType.CppValue( 2 ) }}{% if not loop.last %},{% endif %}
+{%- endfor -%}
+        );
+    }
+
+    BENCHMARK( "{{ exactName }}_4096" )
+    {
+        gm::{{ exactName }}( {{ vectorType.varName }}s, count, results.data() );
+        return results[ count - 1 ];
+    };
+    BENCHMARK( "{{ function.name }}_4096" )
+    {
+        gm::{{ function.name }}( {{ vectorType.varName }}s, count, results.data() );
+        return results[ count - 1 ];
+    };
+}
+{% endfor %}
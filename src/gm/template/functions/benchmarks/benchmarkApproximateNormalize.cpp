@@ -0,0 +1 @@
+{% include "functions/benchmarks/benchmarkApproximateLength.cpp" %}
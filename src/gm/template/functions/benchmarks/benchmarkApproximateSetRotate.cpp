@@ -0,0 +1,25 @@
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/{{ function.headerFileName }}>
+#include <gm/functions/setRotate.h>
+
+{% for interface in function.interfaces %}
+{% set targetType = interface.ArgType("matrix") if interface.HasArg("matrix") else interface.ArgType("quaternion") %}
+TEST_CASE( "{{ function.name }}_{{ interface.testSuffix }}" )
+{
+    gm::{{ targetType.className }} rotation;
+    gm::Vec3f axis( 1, 2, 3 );
+    float angle = 30.0f;
+    BENCHMARK( "SetRotate" )
+    {
+        gm::SetRotate( angle, axis, rotation );
+        return rotation;
+    };
+    BENCHMARK( "{{ function.name }}" )
+    {
+        gm::{{ function.name }}( angle, axis, rotation );
+        return rotation;
+    };
+}
+{% endfor %}
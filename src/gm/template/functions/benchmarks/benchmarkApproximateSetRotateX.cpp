@@ -0,0 +1,25 @@
+{% set exactName = function.name[ "Approximate"|length: ] -%}
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/{{ function.headerFileName }}>
+#include <gm/functions/{{ exactName[ 0 ]|lower }}{{ exactName[ 1: ] }}.h>
+
+{% for interface in function.interfaces %}
+{% set matrixType = interface.ArgType("matrix") %}
+TEST_CASE( "{{ function.name }}_{{ interface.testSuffix }}" )
+{
+    gm::{{ matrixType.className }} matrix = gm::{{ matrixType.className }}::Identity();
+    float angle = 30.0f;
+    BENCHMARK( "{{ exactName }}" )
+    {
+        gm::{{ exactName }}( angle, matrix );
+        return matrix;
+    };
+    BENCHMARK( "{{ function.name }}" )
+    {
+        gm::{{ function.name }}( angle, matrix );
+        return matrix;
+    };
+}
+{% endfor %}
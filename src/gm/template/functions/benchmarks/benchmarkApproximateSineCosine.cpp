@@ -0,0 +1,53 @@
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/{{ function.headerFileName }}>
+#include <gm/functions/batch/{{ function.headerFileName }}>
+
+#include <cmath>
+#include <vector>
+
+{% for interface in function.interfaces %}
+{% set angleClass = interface.ArgClass("angle") %}
+TEST_CASE( "{{ function.name }}_{{ interface.testSuffix }}" )
+{
+    {{ angleClass }} angle = 2.5f;
+    BENCHMARK( "SineCosine" )
+    {
+        return std::sin( angle ) + std::cos( angle );
+    };
+    BENCHMARK( "{{ function.name }}" )
+    {
+        {{ angleClass }} sine, cosine;
+        gm::{{ function.name }}( angle, sine, cosine );
+        return sine + cosine;
+    };
+}
+
+TEST_CASE( "{{ function.name }}_Batch_{{ interface.testSuffix }}" )
+{
+    const size_t count = 4096;
+    std::vector< {{ angleClass }} > angles( count );
+    std::vector< {{ angleClass }} > sines( count );
+    std::vector< {{ angleClass }} > cosines( count );
+    for ( size_t index = 0; index < count; ++index )
+    {
+        angles[ index ] = index * 0.1f - 200.0f;
+    }
+
+    BENCHMARK( "SineCosine_4096" )
+    {
+        for ( size_t index = 0; index < count; ++index )
+        {
+            sines[ index ]   = std::sin( angles[ index ] );
+            cosines[ index ] = std::cos( angles[ index ] );
+        }
+        return sines[ count - 1 ] + cosines[ count - 1 ];
+    };
+    BENCHMARK( "{{ function.name }}_4096" )
+    {
+        gm::{{ function.name }}( angles, count, sines.data(), cosines.data() );
+        return sines[ count - 1 ] + cosines[ count - 1 ];
+    };
+}
+{% endfor %}
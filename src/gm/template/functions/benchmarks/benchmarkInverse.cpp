@@ -0,0 +1,97 @@
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/{{ function.headerFileName }}>
+
+#include <gm/functions/batch/{{ function.headerFileName }}>
+#include <gm/functions/batch/inverseAffine.h>
+#include <gm/functions/batch/inverseRigid.h>
+#include <gm/functions/inverseAffine.h>
+#include <gm/functions/inverseRigid.h>
+#include <gm/functions/matrixProduct.h>
+#include <gm/functions/randomNumber.h>
+#include <gm/functions/setRotateX.h>
+#include <gm/functions/setRotateY.h>
+#include <gm/functions/setTranslate.h>
+
+#include <memory>
+#include <vector>
+
+// Rigid transformation with rotation and translation, which is valid input for all of the inverses.
+static inline gm::Mat4f RandomTransform()
+{
+    gm::Mat4f rotateX = gm::Mat4f::Identity();
+    gm::SetRotateX( gm::RandomNumber( gm::FloatRange( 0.0f, 360.0f ) ), rotateX );
+    gm::Mat4f rotateY = gm::Mat4f::Identity();
+    gm::SetRotateY( gm::RandomNumber( gm::FloatRange( 0.0f, 360.0f ) ), rotateY );
+    gm::Mat4f matrix = gm::MatrixProduct( rotateX, rotateY );
+    gm::SetTranslate( gm::Vec3f( gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ),
+                                 gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ),
+                                 gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ) ),
+                      matrix );
+    return matrix;
+}
+
+{% for interface in function.interfaces %}
+{% set matrixType = interface.ArgType("matrix") %}
+{% if matrixType.shape == (4, 4) %}
+TEST_CASE( "{{ function.name }}_{{ interface.testSuffix }}" )
+{
+    gm::{{ matrixType.className }} matrix = RandomTransform();
+    gm::{{ matrixType.className }} inverse;
+    BENCHMARK( "{{ function.name }}" )
+    {
+        gm::{{ function.name }}( matrix, inverse );
+        return inverse;
+    };
+    BENCHMARK( "{{ function.name }}Affine" )
+    {
+        gm::{{ function.name }}Affine( matrix, inverse );
+        return inverse;
+    };
+    BENCHMARK( "{{ function.name }}Rigid" )
+    {
+        return gm::{{ function.name }}Rigid( matrix );
+    };
+}
+
+TEST_CASE( "{{ function.name }}_Batch_{{ interface.testSuffix }}" )
+{
+    const size_t count = 4096;
+    std::vector< gm::{{ matrixType.className }} > matrices( count );
+    std::vector< gm::{{ matrixType.className }} > inverses( count );
+    std::unique_ptr< bool[] >                     invertible( new bool[ count ] );
+    for ( size_t index = 0; index < count; ++index )
+    {
+        matrices[ index ] = RandomTransform();
+    }
+
+    BENCHMARK( "{{ function.name }}_4096" )
+    {
+        gm::{{ function.name }}( matrices, count, inverses.data(), invertible.get() );
+        return inverses[ count - 1 ];
+    };
+    BENCHMARK( "{{ function.name }}Affine_4096" )
+    {
+        gm::{{ function.name }}Affine( matrices, count, inverses.data(), invertible.get() );
+        return inverses[ count - 1 ];
+    };
+    BENCHMARK( "{{ function.name }}Rigid_4096" )
+    {
+        gm::{{ function.name }}Rigid( matrices, count, inverses.data() );
+        return inverses[ count - 1 ];
+    };
+}
+{% else %}
+TEST_CASE( "{{ function.name }}_{{ interface.testSuffix }}" )
+{
+    gm::{{ matrixType.className }} matrix( 1, 7, 0.25, 0, 5, 8, 2, -3, 1 );
+    gm::{{ matrixType.className }} inverse;
+    BENCHMARK( "{{ function.name }}" )
+    {
+        gm::{{ function.name }}( matrix, inverse );
+        return inverse;
+    };
+}
+{% endif %}
+{% endfor %}
@@ -0,0 +1,112 @@
+#define CATCH_CONFIG_ENABLE_BENCHMARKING
+#include <catch2/catch.hpp>
+
+#include <gm/functions/{{ function.headerFileName }}>
+
+#include <gm/functions/batch/{{ function.headerFileName }}>
+#include <gm/functions/expand.h>
+#include <gm/functions/matrixProduct.h>
+#include <gm/functions/randomNumber.h>
+#include <gm/functions/setRotateX.h>
+#include <gm/functions/setScale.h>
+#include <gm/functions/setTranslate.h>
+#include <gm/functions/transformPoint.h>
+
+#include <vector>
+
+{% for interface in function.interfaces %}
+{% set matrixType = interface.ArgType("matrix") %}
+{% set aabbType   = interface.ArgType("aabb") %}
+{% set pointType  = aabbType.elementType %}
+// Reference implementation, transforming and expanding by each of the 8 corner points of the AABB.
+static inline gm::{{ aabbType.className }} TransformAABBCorners( const gm::{{ matrixType.className }}& i_matrix,
+                                                          const gm::{{ aabbType.className }}& i_aabb )
+{
+    gm::{{ aabbType.className }} newAABB;
+    for ( int corner = 0; corner < 8; ++corner )
+    {
+        gm::{{ pointType.className }} point( ( corner & 1 ) ? i_aabb.Max()[ 0 ] : i_aabb.Min()[ 0 ],
+                                     ( corner & 2 ) ? i_aabb.Max()[ 1 ] : i_aabb.Min()[ 1 ],
+                                     ( corner & 4 ) ? i_aabb.Max()[ 2 ] : i_aabb.Min()[ 2 ] );
+        newAABB = gm::Expand( newAABB, gm::TransformPoint( i_matrix, point ) );
+    }
+    return newAABB;
+}
+
+// Affine transformation with rotation, scale and translation.
+static inline gm::{{ matrixType.className }} RandomTransform()
+{
+    gm::{{ matrixType.className }} rotate = gm::{{ matrixType.className }}::Identity();
+    gm::SetRotateX( gm::RandomNumber( gm::FloatRange( 0.0f, 360.0f ) ), rotate );
+    gm::{{ matrixType.className }} scale = gm::{{ matrixType.className }}::Identity();
+    gm::SetScale( gm::{{ pointType.className }}( 2, 3, 4 ), scale );
+    gm::{{ matrixType.className }} matrix = gm::MatrixProduct( scale, rotate );
+    gm::SetTranslate( gm::{{ pointType.className }}( gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ),
+                                               gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ),
+                                               gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ) ),
+                      matrix );
+    return matrix;
+}
+
+static inline gm::{{ aabbType.className }} RandomAABB()
+{
+    gm::{{ pointType.className }} point( gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ),
+                                 gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ),
+                                 gm::RandomNumber( gm::FloatRange( -10.0f, 10.0f ) ) );
+    return gm::{{ aabbType.className }}( point, point + gm::{{ pointType.className }}( 1, 2, 3 ) );
+}
+
+TEST_CASE( "{{ function.name }}_{{ interface.testSuffix }}" )
+{
+    gm::{{ matrixType.className }} matrix = RandomTransform();
+    gm::{{ aabbType.className }} aabb = RandomAABB();
+    BENCHMARK( "{{ function.name }}_Corners" )
+    {
+        return TransformAABBCorners( matrix, aabb );
+    };
+    BENCHMARK( "{{ function.name }}" )
+    {
+        return gm::{{ function.name }}( matrix, aabb );
+    };
+}
+
+TEST_CASE( "{{ function.name }}_Batch_{{ interface.testSuffix }}" )
+{
+    const size_t count = 4096;
+    std::vector< gm::{{ matrixType.className }} > matrices( count );
+    std::vector< gm::{{ aabbType.className }} > aabbs( count );
+    std::vector< gm::{{ aabbType.className }} > transformedAABBs( count );
+    for ( size_t index = 0; index < count; ++index )
+    {
+        matrices[ index ] = RandomTransform();
+        aabbs[ index ] = RandomAABB();
+    }
+
+    BENCHMARK( "{{ function.name }}_Corners_SingleMatrix_4096" )
+    {
+        for ( size_t index = 0; index < count; ++index )
+        {
+            transformedAABBs[ index ] = TransformAABBCorners( matrices[ 0 ], aabbs[ index ] );
+        }
+        return transformedAABBs[ count - 1 ];
+    };
+    BENCHMARK( "{{ function.name }}_SingleMatrix_4096" )
+    {
+        gm::{{ function.name }}( matrices[ 0 ], aabbs, count, transformedAABBs.data() );
+        return transformedAABBs[ count - 1 ];
+    };
+    BENCHMARK( "{{ function.name }}_Corners_ManyMatrices_4096" )
+    {
+        for ( size_t index = 0; index < count; ++index )
+        {
+            transformedAABBs[ index ] = TransformAABBCorners( matrices[ index ], aabbs[ index ] );
+        }
+        return transformedAABBs[ count - 1 ];
+    };
+    BENCHMARK( "{{ function.name }}_ManyMatrices_4096" )
+    {
+        gm::{{ function.name }}( matrices, aabbs, count, transformedAABBs.data() );
+        return transformedAABBs[ count - 1 ];
+    };
+}
+{% endfor %}
@@ -43,11 +43,11 @@
                    {{ weight }}.Y() );
 
     // Linearly interpolate along the X axis to produce two intermediate values.
-    {{ valueType.namespacedClassName }} interm0 = gm::LinearInterpolation( {{ corner00 }}, {{ corner10 }}, {{ weight }}.X() );
-    {{ valueType.namespacedClassName }} interm1 = gm::LinearInterpolation( {{ corner01 }}, {{ corner11 }}, {{ weight }}.X() );
+    {{ valueType.className }} interm0 = LinearInterpolation( {{ corner00 }}, {{ corner10 }}, {{ weight }}.X() );
+    {{ valueType.className }} interm1 = LinearInterpolation( {{ corner01 }}, {{ corner11 }}, {{ weight }}.X() );
 
     // Linearly interpolate the intermediate values along the Y axis.
-    return gm::LinearInterpolation( interm0, interm1, {{ weight }}.Y() );
+    return LinearInterpolation( interm0, interm1, {{ weight }}.Y() );
 }
 {% endfor %}
 {% endblock %}
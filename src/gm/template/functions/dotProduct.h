@@ -1,5 +1,6 @@
 {% extends "functions/functionBase.h" %}
 {% import "functions/functionUtils.h" as functionUtils %}
+{% import "types/simdUtils.h" as simdUtils %}
 
 {%- block fileDoc -%}
 /// Dot product, or inner product between two <em>equal-length</em> vectors.
@@ -13,6 +14,7 @@
 
 {% block includes %}
 {{ functionUtils.typeIncludes(function) }}
+#include <gm/base/simd.h>
 {% endblock %}
 
 {% block body %}
@@ -30,6 +32,15 @@
 /// \return Dot product of the two vectors.
 {{- functionUtils.signature(function, interface) -}}
 {
+{% if simdUtils.IsAccelerated(vectorType) and vectorType.elementSize == 4 -%}
+#if defined( GM_SIMD_SSE_ENABLED )
+    // Horizontal sum of the element-wise product.
+    __m128 product = _mm_mul_ps( _mm_loadu_ps( {{ lhs }}.Data() ), _mm_loadu_ps( {{ rhs }}.Data() ) );
+    __m128 sum     = _mm_add_ps( product, _mm_movehl_ps( product, product ) );
+    sum            = _mm_add_ss( sum, _mm_shuffle_ps( sum, sum, _MM_SHUFFLE( 1, 1, 1, 1 ) ) );
+    return _mm_cvtss_f32( sum );
+#else
+{% endif -%}
     return
 {% for index in range(vectorType.elementSize) -%}
     {{ lhs }}[ {{ index }} ] * {{ rhs }}[ {{ index }} ]
@@ -38,6 +49,9 @@
 {%- endif -%}
 {%- endfor -%}
     ;
+{%- if simdUtils.IsAccelerated(vectorType) and vectorType.elementSize == 4 %}
+#endif
+{%- endif %}
 }
 {% endfor %}
 {% endblock %}
@@ -0,0 +1,80 @@
+{% extends "functions/functionBase.h" %}
+{% import "functions/functionUtils.h" as functionUtils %}
+
+{%- block fileDoc -%}
+/// Affine matrix inverse.
+///
+/// Compute the inverse of an affine transformation matrix, where the bottom row is (0, 0, 0, 1).
+///
+/// An affine transformation \f$M\f$ is composed of a linear transformation \f$L\f$ (the upper left 3x3 block)
+/// followed by a translation \f$t\f$, thus its inverse is
+/// \f[
+/// M^-1 = \begin{bmatrix} L^-1 & -L^-1 t \\ 0 & 1 \end{bmatrix}
+/// \f]
+/// which only requires the closed form inverse of the 3x3 linear transformation.
+{%- endblock %}
+
+{% block includes %}
+{{ functionUtils.typeIncludes(function) }}
+#include <gm/base/diagnostic.h>
+{% endblock %}
+
+{% block body %}
+{% for interface in function.interfaces %}
+{% set matrix     = interface.ArgName("matrix") %}
+{% set inverse    = interface.ArgName("inverse") %}
+{% set matrixType = interface.ArgType("matrix") %}
+{% set scalarType = matrixType.elementType %}
+/// Compute the inverse of the affine transformation matrix {{ matrix }}.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// \pre The bottom row of \p {{ matrix }} is (0, 0, 0, 1).
+///
+/// \param {{ matrix }} The input affine transformation matrix to invert.
+/// \param {{ inverse }} The inverse of \p {{ matrix }}.  Undefined if \p {{ matrix }} is not invertible.
+///
+/// \return Whether or not {{ matrix }} is invertable.
+{{- functionUtils.signature(function, interface) -}}
+{
+    const {{ matrixType.className }}& m = {{ matrix }};
+    GM_ASSERT( m( 3, 0 ) == {{ scalarType.CppValue( 0 ) }} && m( 3, 1 ) == {{ scalarType.CppValue( 0 ) }} &&
+               m( 3, 2 ) == {{ scalarType.CppValue( 0 ) }} && m( 3, 3 ) == {{ scalarType.CppValue( 1 ) }} );
+
+    // Cofactors of the first column of the linear transformation, shared by the determinant.
+    const {{ scalarType.className }} c00 = m( 1, 1 ) * m( 2, 2 ) - m( 1, 2 ) * m( 2, 1 );
+    const {{ scalarType.className }} c10 = m( 1, 2 ) * m( 2, 0 ) - m( 1, 0 ) * m( 2, 2 );
+    const {{ scalarType.className }} c20 = m( 1, 0 ) * m( 2, 1 ) - m( 1, 1 ) * m( 2, 0 );
+
+    const {{ scalarType.className }} determinant = m( 0, 0 ) * c00 + m( 0, 1 ) * c10 + m( 0, 2 ) * c20;
+    if ( determinant == {{ scalarType.CppValue( 0 ) }} )
+    {
+        return false;
+    }
+
+    // Inverse of the linear transformation.
+    const {{ scalarType.className }} invDeterminant = {{ scalarType.CppValue( 1 ) }} / determinant;
+    const {{ scalarType.className }} i00 = c00 * invDeterminant;
+    const {{ scalarType.className }} i01 = ( m( 0, 2 ) * m( 2, 1 ) - m( 0, 1 ) * m( 2, 2 ) ) * invDeterminant;
+    const {{ scalarType.className }} i02 = ( m( 0, 1 ) * m( 1, 2 ) - m( 0, 2 ) * m( 1, 1 ) ) * invDeterminant;
+    const {{ scalarType.className }} i10 = c10 * invDeterminant;
+    const {{ scalarType.className }} i11 = ( m( 0, 0 ) * m( 2, 2 ) - m( 0, 2 ) * m( 2, 0 ) ) * invDeterminant;
+    const {{ scalarType.className }} i12 = ( m( 0, 2 ) * m( 1, 0 ) - m( 0, 0 ) * m( 1, 2 ) ) * invDeterminant;
+    const {{ scalarType.className }} i20 = c20 * invDeterminant;
+    const {{ scalarType.className }} i21 = ( m( 0, 1 ) * m( 2, 0 ) - m( 0, 0 ) * m( 2, 1 ) ) * invDeterminant;
+    const {{ scalarType.className }} i22 = ( m( 0, 0 ) * m( 1, 1 ) - m( 0, 1 ) * m( 1, 0 ) ) * invDeterminant;
+
+    // Translation, by the inverse linear transformation of the negated translation.
+    const {{ scalarType.className }} tx = m( 0, 3 );
+    const {{ scalarType.className }} ty = m( 1, 3 );
+    const {{ scalarType.className }} tz = m( 2, 3 );
+
+    {{ inverse }} = {{ matrixType.className }}(
+        i00, i01, i02, -( i00 * tx + i01 * ty + i02 * tz ),
+        i10, i11, i12, -( i10 * tx + i11 * ty + i12 * tz ),
+        i20, i21, i22, -( i20 * tx + i21 * ty + i22 * tz ),
+        {{ scalarType.CppValue( 0 ) }}, {{ scalarType.CppValue( 0 ) }}, {{ scalarType.CppValue( 0 ) }}, {{ scalarType.CppValue( 1 ) }}
+    );
+    return true;
+}
+{% endfor %}
+{% endblock %}
@@ -0,0 +1,53 @@
+{% extends "functions/functionBase.h" %}
+{% import "functions/functionUtils.h" as functionUtils %}
+
+{%- block fileDoc -%}
+/// Rigid matrix inverse.
+///
+/// Compute the inverse of a rigid transformation matrix, composed only of a rotation \f$R\f$ followed by a
+/// translation \f$t\f$.
+///
+/// The rotation is orthonormal, such that its inverse is its transpose, thus
+/// \f[
+/// M^-1 = \begin{bmatrix} R^T & -R^T t \\ 0 & 1 \end{bmatrix}
+/// \f]
+/// A rigid transformation is always invertible.
+{%- endblock %}
+
+{% block includes %}
+{{ functionUtils.typeIncludes(function) }}
+#include <gm/base/diagnostic.h>
+{% endblock %}
+
+{% block body %}
+{% for interface in function.interfaces %}
+{% set matrix     = interface.ArgName("matrix") %}
+{% set matrixType = interface.ArgType("matrix") %}
+{% set scalarType = matrixType.elementType %}
+/// Compute the inverse of the rigid transformation matrix {{ matrix }}.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// \pre The upper left 3x3 block of \p {{ matrix }} is a rotation, and its bottom row is (0, 0, 0, 1).
+///
+/// \param {{ matrix }} The input rigid transformation matrix to invert.
+///
+/// \return The inverse of \p {{ matrix }}.
+{{- functionUtils.signature(function, interface) -}}
+{
+    const {{ matrixType.className }}& m = {{ matrix }};
+    GM_ASSERT( m( 3, 0 ) == {{ scalarType.CppValue( 0 ) }} && m( 3, 1 ) == {{ scalarType.CppValue( 0 ) }} &&
+               m( 3, 2 ) == {{ scalarType.CppValue( 0 ) }} && m( 3, 3 ) == {{ scalarType.CppValue( 1 ) }} );
+
+    const {{ scalarType.className }} tx = m( 0, 3 );
+    const {{ scalarType.className }} ty = m( 1, 3 );
+    const {{ scalarType.className }} tz = m( 2, 3 );
+
+    return {{ matrixType.className }}(
+        m( 0, 0 ), m( 1, 0 ), m( 2, 0 ), -( m( 0, 0 ) * tx + m( 1, 0 ) * ty + m( 2, 0 ) * tz ),
+        m( 0, 1 ), m( 1, 1 ), m( 2, 1 ), -( m( 0, 1 ) * tx + m( 1, 1 ) * ty + m( 2, 1 ) * tz ),
+        m( 0, 2 ), m( 1, 2 ), m( 2, 2 ), -( m( 0, 2 ) * tx + m( 1, 2 ) * ty + m( 2, 2 ) * tz ),
+        {{ scalarType.CppValue( 0 ) }}, {{ scalarType.CppValue( 0 ) }}, {{ scalarType.CppValue( 0 ) }}, {{ scalarType.CppValue( 1 ) }}
+    );
+}
+{% endfor %}
+{% endblock %}
@@ -1,5 +1,6 @@
 {% extends "functions/functionBase.h" %}
 {% import "functions/functionUtils.h" as functionUtils %}
+{% import "types/simdUtils.h" as simdUtils %}
 
 {%- block fileDoc -%}
 /// Matrix multiplication.
@@ -15,6 +16,7 @@
 
 {% block includes %}
 {{ functionUtils.typeIncludes(function) }}
+#include <gm/base/simd.h>
 {% endblock %}
 
 {% block body %}
@@ -32,6 +34,40 @@
 /// \return The matrix product.
 {{- functionUtils.signature(function, interface) -}}
 {
+{% set accelerated = simdUtils.IsAccelerated(matrixType) and matrixType.shape[1] == 4 -%}
+{% if accelerated -%}
+#if defined( GM_SIMD_SSE_ENABLED )
+    // Each row of the product is the linear combination of the rows of {{ rhs }}, weighted by the
+    // elements of the corresponding row of {{ lhs }}.
+    const float* lhsData = {{ lhs }}.Data();
+    const float* rhsData = {{ rhs }}.Data();
+    __m128 rhsRows[ {{ matrixType.shape[0] }} ] = {
+{%- for row in range(matrixType.shape[0]) -%}
+        _mm_loadu_ps( rhsData + {{ row * 4 }} ){% if not loop.last %},{% endif %}
+{%- endfor -%}
+    };
+
+    {{ matrixType.className }} product;
+    float* productData = product.Data();
+    for ( int row = 0; row < {{ matrixType.shape[0] }}; ++row )
+    {
+        const float* lhsRow = lhsData + row * 4;
+        __m128 productRow = _mm_mul_ps( _mm_set1_ps( lhsRow[ 0 ] ), rhsRows[ 0 ] );
+#if defined( GM_SIMD_AVX2_ENABLED )
+{% for index in range(1, matrixType.shape[0]) -%}
+        productRow = _mm_fmadd_ps( _mm_set1_ps( lhsRow[ {{ index }} ] ), rhsRows[ {{ index }} ], productRow );
+{% endfor -%}
+#else
+{% for index in range(1, matrixType.shape[0]) -%}
+        productRow = _mm_add_ps( productRow, _mm_mul_ps( _mm_set1_ps( lhsRow[ {{ index }} ] ), rhsRows[ {{ index }} ] ) );
+{% endfor -%}
+#endif
+        _mm_storeu_ps( productData + row * 4, productRow );
+    }
+
+    return product;
+#else
+{% endif -%}
     return {{ matrixType.className }}(
 {%- for row in range(matrixType.shape[0] ) -%}
 {%- for col in range(matrixType.shape[1] ) -%}
@@ -46,6 +82,9 @@
 {%- endfor -%}
 {%- endfor -%}
     );
+{%- if accelerated %}
+#endif
+{%- endif %}
 }
 {% endfor %}
 {% endblock %}
@@ -0,0 +1,54 @@
+{% extends "functions/functionBase.h" %}
+{% import "functions/functionUtils.h" as functionUtils %}
+
+{%- block fileDoc -%}
+/// Normalized linear interpolation (nlerp).
+///
+/// Linearly interpolate from a source to target unit quaternion, then normalize the result:
+///
+/// \f[ \frac{(1-w)S+wT}{\lVert(1-w)S+wT\rVert}=V \f]
+///
+/// The interpolated rotation follows the same arc as \ref SphericalLinearInterpolation, without trigonometric
+/// functions, at the cost of a non-constant angular velocity.  This is a good approximation for closely
+/// spaced rotations, such as consecutive animation keys.
+///
+/// The shortest of the two arcs is taken, by negating the target if required.
+{%- endblock %}
+
+{% block includes %}
+{{ functionUtils.typeIncludes(function) }}
+
+#include <gm/functions/dotProduct.h>
+#include <gm/functions/normalize.h>
+{% endblock %}
+
+{% block body %}
+{% for interface in function.interfaces %}
+{% set quaternionType = interface.ArgType("source") %}
+{% set source         = interface.ArgName("source") %}
+{% set target         = interface.ArgName("target") %}
+{% set weight         = interface.ArgName("weight") %}
+/// Linearly interpolate between the unit quaternions \p {{ source }} and \p {{ target }}, with weight \p {{ weight }},
+/// then normalize.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// \param {{ source }} Source unit quaternion to interpolate from.
+/// \param {{ target }} Target unit quaternion to interpolate to.
+/// \param {{ weight }} Describes the percentage of \p {{ target }} in the final, interpolated value.
+///
+/// \pre \p {{ weight }} must be in the range of [0,1].
+///
+/// \return Interpolated unit quaternion.
+{{- functionUtils.signature(function, interface) -}}
+{
+    GM_ASSERT_MSG( {{ weight }} >= 0.0f && {{ weight }} <= 1.0f,
+                   "Expected {{ weight }} between [0,1], got %f\n",
+                   {{ weight }} );
+
+    // Take the shortest arc.
+    const {{ quaternionType.elementType.className }} targetWeight =
+        DotProduct( {{ source }}, {{ target }} ) < {{ quaternionType.CppValue( 0 ) }} ? -{{ weight }} : {{ weight }};
+    return Normalize( {{ source }} * ( {{ quaternionType.CppValue( 1 ) }} - {{ weight }} ) + {{ target }} * targetWeight );
+}
+{% endfor %}
+{% endblock %}
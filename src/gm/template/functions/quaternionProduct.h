@@ -0,0 +1,39 @@
+{% extends "functions/functionBase.h" %}
+{% import "functions/functionUtils.h" as functionUtils %}
+
+{%- block fileDoc -%}
+/// Quaternion product.
+///
+/// Compute the Hamilton product of two quaternions, composing their rotations.
+{%- endblock %}
+
+{% block includes %}
+{{ functionUtils.typeIncludes(function) }}
+{% endblock %}
+
+{% block body %}
+{% for interface in function.interfaces %}
+{% set lhs            = interface.ArgName("lhs") %}
+{% set rhs            = interface.ArgName("rhs") %}
+{% set quaternionType = interface.ArgType("lhs") %}
+/// Compute the product of two quaternions \p {{ lhs }} and \p {{ rhs }}.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// The product of two unit quaternions is the rotation of \p {{ rhs }}, followed by the rotation of \p {{ lhs }},
+/// like the product of their rotation matrices.
+///
+/// \param {{ lhs }} Left hand side quaternion.
+/// \param {{ rhs }} Right hand side quaternion.
+///
+/// \return The quaternion product.
+{{- functionUtils.signature(function, interface) -}}
+{
+    return {{ quaternionType.className }}(
+        {{ lhs }}.W() * {{ rhs }}.X() + {{ lhs }}.X() * {{ rhs }}.W() + {{ lhs }}.Y() * {{ rhs }}.Z() - {{ lhs }}.Z() * {{ rhs }}.Y(),
+        {{ lhs }}.W() * {{ rhs }}.Y() - {{ lhs }}.X() * {{ rhs }}.Z() + {{ lhs }}.Y() * {{ rhs }}.W() + {{ lhs }}.Z() * {{ rhs }}.X(),
+        {{ lhs }}.W() * {{ rhs }}.Z() + {{ lhs }}.X() * {{ rhs }}.Y() - {{ lhs }}.Y() * {{ rhs }}.X() + {{ lhs }}.Z() * {{ rhs }}.W(),
+        {{ lhs }}.W() * {{ rhs }}.W() - {{ lhs }}.X() * {{ rhs }}.X() - {{ lhs }}.Y() * {{ rhs }}.Y() - {{ lhs }}.Z() * {{ rhs }}.Z()
+    );
+}
+{% endfor %}
+{% endblock %}
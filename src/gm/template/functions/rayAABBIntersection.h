@@ -1,5 +1,6 @@
 {% extends "functions/functionBase.h" %}
 {% import "functions/functionUtils.h" as functionUtils %}
+{% import "types/simdUtils.h" as simdUtils %}
 
 {%- block fileDoc -%}
 /// Ray axis-aligned bounding box (AABB) intersection test.
@@ -47,10 +48,14 @@
 #include <gm/functions/intersection.h>
 #include <gm/functions/min.h>
 #include <gm/functions/max.h>
+
+#include <gm/base/simd.h>
+
+#include <limits>
 {% endblock %}
 
 {% block body %}
-{% for interface in function.interfaces %}
+{% for interface in function.interfaces if interface.HasArg("rayOrigin") and not interface.isPacket %}
 {% set rayOrigin         = interface.ArgName("rayOrigin") %}
 {% set rayDirection      = interface.ArgName("rayDirection") %}
 {% set rayDirectionType  = interface.ArgType("rayDirection") %}
@@ -85,7 +90,7 @@
             {{ rayDirectionType.elementType.CppValue(1.0) }} /
             {{ rayDirection }}[ {{ axis }} ];
 
-        gm::{{ interface.ArgClass("intersections") }} axisIntersections(
+        {{ interface.ArgClass("intersections") }} axisIntersections(
             ( {{ aabb }}.Min()[ {{ axis }} ] - {{ rayOrigin }}[ {{ axis }} ] ) * inverseAxisDir,
             ( {{ aabb }}.Max()[ {{ axis }} ] - {{ rayOrigin }}[ {{ axis }} ] ) * inverseAxisDir
         );
@@ -97,7 +102,7 @@
         }
 
         // Find the intersection of the local axis and global magnitudes.  This "narrows" the bounded region.
-        {{ intersections }} = gm::Intersection( {{ intersections }}, axisIntersections );
+        {{ intersections }} = Intersection( {{ intersections }}, axisIntersections );
 
         // If there is no overlap, then intersections will be empty.
         if ( {{ intersections }}.IsEmpty() )
@@ -111,4 +116,146 @@
     return true;
 }
 {% endfor %}
+
+{% for interface in function.interfaces if interface.HasArg("ray") %}
+{% set ray               = interface.ArgName("ray") %}
+{% set aabb              = interface.ArgName("aabb") %}
+{% set intersections     = interface.ArgName("intersections") %}
+/// Check if a ray intersects a axis-aligned bounding box (AABB).
+///
+/// The ray caches the reciprocal of its direction and the sign of each axis, such that each axis
+/// intersection is computed with multiplications only, and the near and far planes are selected
+/// by the sign without swapping.  Prefer this overload when testing a ray against many AABBs.
+///
+/// \param {{ ray }} The ray.
+/// \param {{ aabb }} The axis-aligned bounding box.
+/// \param {{ intersections }} The output ray magnitudes intersecting the AABB.
+/// If there are no intersections, then {{ intersections }} will be undefined.
+///
+/// \retval true The ray intersects the AABB.
+/// \retval false The ray does not intersect the AABB.
+{{- functionUtils.signature(function, interface) -}}
+{
+    GM_ASSERT_MSG( AlmostEqual( Length( {{ ray }}.Direction() ), 1.0f ),
+                   "Direction of {{ ray }} is not normalised!" );
+
+    // Initialize intersection magnitudes to ray limits.
+    float minMagnitude = 0.0f;
+    float maxMagnitude = std::numeric_limits< float >::max();
+
+{% for axis in range(3) -%}
+    // Narrow the magnitudes by the intersections of the near and far planes of axis {{ axis }}.
+    {
+        const Vec3f& nearPlanes = {{ ray }}.DirectionSign()[ {{ axis }} ] ? {{ aabb }}.Max() : {{ aabb }}.Min();
+        const Vec3f& farPlanes = {{ ray }}.DirectionSign()[ {{ axis }} ] ? {{ aabb }}.Min() : {{ aabb }}.Max();
+        float axisMin = ( nearPlanes[ {{ axis }} ] - {{ ray }}.Origin()[ {{ axis }} ] ) * {{ ray }}.InverseDirection()[ {{ axis }} ];
+        float axisMax = ( farPlanes[ {{ axis }} ] - {{ ray }}.Origin()[ {{ axis }} ] ) * {{ ray }}.InverseDirection()[ {{ axis }} ];
+
+        // The accumulated magnitudes are the first operand, such that they are preserved over NaN axis
+        // intersections.
+        minMagnitude = Max( minMagnitude, axisMin );
+        maxMagnitude = Min( maxMagnitude, axisMax );
+    }
+
+{% endfor -%}
+    {{ intersections }}.Min() = minMagnitude;
+    {{ intersections }}.Max() = maxMagnitude;
+
+    return minMagnitude <= maxMagnitude;
+}
+{% endfor %}
+
+{% for interface in function.interfaces if interface.isPacket %}
+{% set rayOrigin         = interface.ArgName("rayOrigin") %}
+{% set rayDirection      = interface.ArgName("rayDirection") %}
+{% set rayPacketType     = interface.ArgType("rayDirection") %}
+{% set aabb              = interface.ArgName("aabb") %}
+{% set intersections     = interface.ArgName("intersections") %}
+{% set laneCount         = rayPacketType.laneCount %}
+{% set registerSets      = simdUtils.REGISTER_SETS|selectattr("width", "le", laneCount)|list %}
+/// Check if each ray of a packet of {{ laneCount }} rays intersects a single axis-aligned bounding box (AABB).
+///
+/// The AABB is loaded once and tested against all the rays at once, using SIMD instructions if enabled
+/// (see base/simd.h).
+///
+/// \param {{ rayOrigin }} The origins of the rays.
+/// \param {{ rayDirection }} The directions of the rays.
+/// \param {{ aabb }} The axis-aligned bounding box.
+/// \param {{ intersections }} The output ray magnitudes intersecting the AABB, per ray.
+/// The magnitudes of rays which do not intersect the AABB will be undefined.
+///
+/// \return The hit mask, where bit \p N is set if the ray in lane \p N intersects the AABB.
+{{- functionUtils.signature(function, interface) -}}
+{
+    int hitMask = 0;
+{% for registerSet in registerSets -%}
+#{% if not loop.first %}el{% endif %}if defined( {{ registerSet.guard }} )
+    for ( size_t laneOffset = 0; laneOffset < {{ laneCount }}; laneOffset += {{ registerSet.width }} )
+    {
+        // Initialize intersection magnitudes to ray limits.
+        {{ registerSet.reg }} minMagnitudes = {{ registerSet.prefix }}_setzero_ps();
+        {{ registerSet.reg }} maxMagnitudes = {{ registerSet.prefix }}_set1_ps( std::numeric_limits< float >::max() );
+
+{% for axis in range(3) -%}
+        // Narrow the magnitudes by the ordered intersections of axis {{ axis }}.  The accumulated magnitudes are the
+        // second operand of min & max, such that they are preserved over NaN axis intersections.
+        {
+            {{ registerSet.reg }} inverseAxisDir = {{ registerSet.prefix }}_div_ps( {{ registerSet.prefix }}_set1_ps( 1.0f ),
+                {{ registerSet.prefix }}_load_ps( {{ rayDirection }}.Lanes( {{ axis }} ) + laneOffset ) );
+            {{ registerSet.reg }} axisOrigin = {{ registerSet.prefix }}_load_ps( {{ rayOrigin }}.Lanes( {{ axis }} ) + laneOffset );
+            {{ registerSet.reg }} axisMin = {{ registerSet.prefix }}_mul_ps(
+                {{ registerSet.prefix }}_sub_ps( {{ registerSet.prefix }}_set1_ps( {{ aabb }}.Min()[ {{ axis }} ] ), axisOrigin ), inverseAxisDir );
+            {{ registerSet.reg }} axisMax = {{ registerSet.prefix }}_mul_ps(
+                {{ registerSet.prefix }}_sub_ps( {{ registerSet.prefix }}_set1_ps( {{ aabb }}.Max()[ {{ axis }} ] ), axisOrigin ), inverseAxisDir );
+            minMagnitudes = {{ registerSet.prefix }}_max_ps( {{ registerSet.prefix }}_min_ps( axisMin, axisMax ), minMagnitudes );
+            maxMagnitudes = {{ registerSet.prefix }}_min_ps( {{ registerSet.prefix }}_max_ps( axisMin, axisMax ), maxMagnitudes );
+        }
+
+{% endfor -%}
+        {{ registerSet.prefix }}_store_ps( {{ intersections }}.Lanes( 0 ) + laneOffset, minMagnitudes );
+        {{ registerSet.prefix }}_store_ps( {{ intersections }}.Lanes( 1 ) + laneOffset, maxMagnitudes );
+
+        // Rays with overlapping intersections across all axis intersect the AABB.
+        hitMask |= {{ registerSet.prefix }}_movemask_ps( {{ simdUtils.Compare(registerSet, "LE", "minMagnitudes", "maxMagnitudes") }} ) << laneOffset;
+    }
+{% endfor -%}
+#else
+    for ( size_t laneIndex = 0; laneIndex < {{ laneCount }}; ++laneIndex )
+    {
+        // Initialize intersection magnitudes to ray limits.
+        float minMagnitude = 0.0f;
+        float maxMagnitude = std::numeric_limits< float >::max();
+
+{% for axis in range(3) -%}
+        // Narrow the magnitudes by the ordered intersections of axis {{ axis }}.
+        {
+            float inverseAxisDir = 1.0f / {{ rayDirection }}( {{ axis }}, laneIndex );
+            float axisMin = ( {{ aabb }}.Min()[ {{ axis }} ] - {{ rayOrigin }}( {{ axis }}, laneIndex ) ) * inverseAxisDir;
+            float axisMax = ( {{ aabb }}.Max()[ {{ axis }} ] - {{ rayOrigin }}( {{ axis }}, laneIndex ) ) * inverseAxisDir;
+            if ( inverseAxisDir < 0.0f )
+            {
+                std::swap( axisMin, axisMax );
+            }
+
+            // The accumulated magnitudes are the first operand, such that they are preserved over NaN axis
+            // intersections.
+            minMagnitude = Max( minMagnitude, axisMin );
+            maxMagnitude = Min( maxMagnitude, axisMax );
+        }
+
+{% endfor -%}
+        {{ intersections }}( 0, laneIndex ) = minMagnitude;
+        {{ intersections }}( 1, laneIndex ) = maxMagnitude;
+
+        // Rays with overlapping intersections across all axis intersect the AABB.
+        if ( minMagnitude <= maxMagnitude )
+        {
+            hitMask |= 1 << laneIndex;
+        }
+    }
+#endif
+
+    return hitMask;
+}
+{% endfor %}
 {% endblock %}
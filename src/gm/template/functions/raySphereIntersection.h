@@ -1,5 +1,6 @@
 {% extends "functions/functionBase.h" %}
 {% import "functions/functionUtils.h" as functionUtils %}
+{% import "types/simdUtils.h" as simdUtils %}
 
 {%- block fileDoc -%}
 /// Ray sphere intersection test.
@@ -54,10 +55,13 @@
 #include <gm/functions/dotProduct.h>
 #include <gm/functions/quadraticRoots.h>
 #include <gm/functions/length.h>
+#include <gm/functions/max.h>
+
+#include <gm/base/simd.h>
 {% endblock %}
 
 {% block body %}
-{% for interface in function.interfaces %}
+{% for interface in function.interfaces if not interface.isPacket %}
 {% set sphereOrigin      = interface.ArgName("sphereOrigin") %}
 {% set sphereRadius      = interface.ArgName("sphereRadius") %}
 {% set rayOrigin         = interface.ArgName("rayOrigin") %}
@@ -170,4 +174,112 @@
     }
 }
 {% endfor %}
+
+{% for interface in function.interfaces if interface.isPacket %}
+{% set sphereOrigin      = interface.ArgName("sphereOrigin") %}
+{% set sphereRadius      = interface.ArgName("sphereRadius") %}
+{% set rayOrigin         = interface.ArgName("rayOrigin") %}
+{% set rayDirection      = interface.ArgName("rayDirection") %}
+{% set intersections     = interface.ArgName("intersections") %}
+{% set laneCount         = interface.ArgType("rayDirection").laneCount %}
+{% set registerSets      = simdUtils.REGISTER_SETS|selectattr("width", "le", laneCount)|list %}
+/// Compute the intersections between each ray of a packet of {{ laneCount }} rays and a single implicit sphere.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// The sphere is loaded once and tested against all the rays at once, using SIMD instructions if enabled
+/// (see base/simd.h).
+///
+/// \param {{ sphereOrigin }} The origin or center of the sphere.
+/// \param {{ sphereRadius }} The radius of the sphere.
+/// \param {{ rayOrigin }} The origins of the rays.
+/// \param {{ rayDirection }} The directions of the rays.
+/// \param {{ intersections }} The ray magnitudes of the intersections, per ray.  If a ray intersects the sphere
+/// exactly once, both magnitudes are equal.  If the origin of a ray is inside the sphere, the minimum magnitude
+/// is 0.  The magnitudes of rays which do not intersect the sphere will be undefined.
+///
+/// \return The hit mask, where bit \p N is set if the ray in lane \p N intersects the sphere.
+{{- functionUtils.signature(function, interface) -}}
+{
+    int hitMask = 0;
+{% for registerSet in registerSets -%}
+{% set reg = registerSet.reg -%}
+{% set mm = registerSet.prefix -%}
+#{% if not loop.first %}el{% endif %}if defined( {{ registerSet.guard }} )
+    for ( size_t laneOffset = 0; laneOffset < {{ laneCount }}; laneOffset += {{ registerSet.width }} )
+    {
+        // Compute quadratic co-efficients
+        {{ reg }} a = {{ mm }}_setzero_ps();
+        {{ reg }} halfB = {{ mm }}_setzero_ps();
+        {{ reg }} c = {{ mm }}_set1_ps( -{{ sphereRadius }} * {{ sphereRadius }} );
+{% for axis in range(3) -%}
+        {
+            {{ reg }} axisDirection = {{ mm }}_load_ps( {{ rayDirection }}.Lanes( {{ axis }} ) + laneOffset );
+            {{ reg }} axisOriginDiff = {{ mm }}_sub_ps( {{ mm }}_load_ps( {{ rayOrigin }}.Lanes( {{ axis }} ) + laneOffset ),
+                                                        {{ mm }}_set1_ps( {{ sphereOrigin }}[ {{ axis }} ] ) );
+            a = {{ mm }}_add_ps( a, {{ mm }}_mul_ps( axisDirection, axisDirection ) );
+            halfB = {{ mm }}_add_ps( halfB, {{ mm }}_mul_ps( axisDirection, axisOriginDiff ) );
+            c = {{ mm }}_add_ps( c, {{ mm }}_mul_ps( axisOriginDiff, axisOriginDiff ) );
+        }
+{% endfor -%}
+        {{ reg }} b = {{ mm }}_add_ps( halfB, halfB );
+
+        // Solve for quadratic roots.  Negative discriminants are clamped, their lanes are masked out of the hits.
+        {{ reg }} zero = {{ mm }}_setzero_ps();
+        {{ reg }} discriminant = {{ mm }}_sub_ps( {{ mm }}_mul_ps( b, b ), {{ mm }}_mul_ps( {{ mm }}_set1_ps( 4.0f ), {{ mm }}_mul_ps( a, c ) ) );
+        {{ reg }} discriminantRoot = {{ mm }}_sqrt_ps( {{ mm }}_max_ps( discriminant, zero ) );
+        {{ reg }} reciprocal = {{ mm }}_div_ps( {{ mm }}_set1_ps( 1.0f ), {{ mm }}_add_ps( a, a ) );
+        {{ reg }} nearRoot = {{ mm }}_mul_ps( {{ mm }}_sub_ps( {{ mm }}_sub_ps( zero, b ), discriminantRoot ), reciprocal );
+        {{ reg }} farRoot = {{ mm }}_mul_ps( {{ mm }}_add_ps( {{ mm }}_sub_ps( zero, b ), discriminantRoot ), reciprocal );
+
+        // If the nearest intersection is behind the ray origin, then the ray origin is either inside the
+        // sphere (c < 0), or on its surface.
+        {{ reg }} insideMagnitude = {{ mm }}_blendv_ps( farRoot, zero, {{ simdUtils.Compare(registerSet, "LT", "c", "zero") }} );
+        nearRoot = {{ mm }}_blendv_ps( nearRoot, insideMagnitude, {{ simdUtils.Compare(registerSet, "LT", "nearRoot", "zero") }} );
+        {{ mm }}_store_ps( {{ intersections }}.Lanes( 0 ) + laneOffset, nearRoot );
+        {{ mm }}_store_ps( {{ intersections }}.Lanes( 1 ) + laneOffset, farRoot );
+
+        // Rays with real roots, where the farthest root is not behind the ray origin, intersect the sphere.
+        {{ reg }} hits = {{ mm }}_and_ps( {{ simdUtils.Compare(registerSet, "GE", "discriminant", "zero") }},
+                                          {{ simdUtils.Compare(registerSet, "GE", "farRoot", "zero") }} );
+        hitMask |= {{ mm }}_movemask_ps( hits ) << laneOffset;
+    }
+{% endfor -%}
+#else
+    for ( size_t laneIndex = 0; laneIndex < {{ laneCount }}; ++laneIndex )
+    {
+        // Compute quadratic co-efficients
+        Vec3f rayDirection( {{ rayDirection }}( 0, laneIndex ), {{ rayDirection }}( 1, laneIndex ), {{ rayDirection }}( 2, laneIndex ) );
+        Vec3f originDiff = Vec3f( {{ rayOrigin }}( 0, laneIndex ), {{ rayOrigin }}( 1, laneIndex ), {{ rayOrigin }}( 2, laneIndex ) ) - {{ sphereOrigin }};
+        float a = DotProduct( rayDirection, rayDirection );
+        float b = 2.0f * DotProduct( rayDirection, originDiff );
+        float c = DotProduct( originDiff, originDiff ) - {{ sphereRadius }} * {{ sphereRadius }};
+
+        // Solve for quadratic roots.  Negative discriminants are clamped, their lanes are masked out of the hits.
+        float discriminant = ( b * b ) - ( 4.0f * a * c );
+        float discriminantRoot = std::sqrt( Max( discriminant, 0.0f ) );
+        float reciprocal = 1.0f / ( 2.0f * a );
+        float nearRoot = ( -b - discriminantRoot ) * reciprocal;
+        float farRoot = ( -b + discriminantRoot ) * reciprocal;
+
+        // If the nearest intersection is behind the ray origin, then the ray origin is either inside the
+        // sphere (c < 0), or on its surface.
+        if ( nearRoot < 0.0f )
+        {
+            nearRoot = c < 0.0f ? 0.0f : farRoot;
+        }
+
+        {{ intersections }}( 0, laneIndex ) = nearRoot;
+        {{ intersections }}( 1, laneIndex ) = farRoot;
+
+        // Rays with real roots, where the farthest root is not behind the ray origin, intersect the sphere.
+        if ( discriminant >= 0.0f && farRoot >= 0.0f )
+        {
+            hitMask |= 1 << laneIndex;
+        }
+    }
+#endif
+
+    return hitMask;
+}
+{% endfor %}
 {% endblock %}
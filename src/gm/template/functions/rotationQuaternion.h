@@ -0,0 +1,70 @@
+{% extends "functions/functionBase.h" %}
+{% import "functions/functionUtils.h" as functionUtils %}
+
+{%- block fileDoc -%}
+/// Rotation quaternion.
+///
+/// Convert the rotation of a transformation matrix into a unit quaternion, using Shepperd's method
+/// ("Quaternion from Rotation Matrix", 1978): the quaternion is solved from the largest of its squared
+/// elements, which are derived from the trace and diagonal of the matrix, for numerical stability.
+{%- endblock %}
+
+{% block includes %}
+{{ functionUtils.typeIncludes(function) }}
+
+#include <cmath>
+{% endblock %}
+
+{% block body %}
+{% for interface in function.interfaces %}
+{% set matrix         = interface.ArgName("matrix") %}
+{% set matrixType     = interface.ArgType("matrix") %}
+{% set quaternionType = interface.returnType %}
+{% set scalarClass    = quaternionType.elementType.className %}
+/// Compute the unit quaternion representing the rotation of the transformation matrix \p {{ matrix }}.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// \pre The upper left 3x3 elements of \p {{ matrix }} is a rotation matrix, without scale or shear.
+///
+/// \param {{ matrix }} The transformation matrix.
+///
+/// \return The unit quaternion of the rotation.
+{{- functionUtils.signature(function, interface) -}}
+{
+    const {{ matrixType.className }}& m = {{ matrix }};
+    const {{ scalarClass }} trace = m( 0, 0 ) + m( 1, 1 ) + m( 2, 2 );
+    if ( trace > {{ quaternionType.CppValue( 0 ) }} )
+    {
+        const {{ scalarClass }} scale = {{ quaternionType.CppValue( 0.5 ) }} / std::sqrt( trace + {{ quaternionType.CppValue( 1 ) }} );
+        return {{ quaternionType.className }}( ( m( 2, 1 ) - m( 1, 2 ) ) * scale,
+                                                 ( m( 0, 2 ) - m( 2, 0 ) ) * scale,
+                                                 ( m( 1, 0 ) - m( 0, 1 ) ) * scale,
+                                                 {{ quaternionType.CppValue( 0.25 ) }} / scale );
+    }
+    else if ( m( 0, 0 ) > m( 1, 1 ) && m( 0, 0 ) > m( 2, 2 ) )
+    {
+        const {{ scalarClass }} scale = {{ quaternionType.CppValue( 0.5 ) }} / std::sqrt( {{ quaternionType.CppValue( 1 ) }} + m( 0, 0 ) - m( 1, 1 ) - m( 2, 2 ) );
+        return {{ quaternionType.className }}( {{ quaternionType.CppValue( 0.25 ) }} / scale,
+                                                 ( m( 0, 1 ) + m( 1, 0 ) ) * scale,
+                                                 ( m( 0, 2 ) + m( 2, 0 ) ) * scale,
+                                                 ( m( 2, 1 ) - m( 1, 2 ) ) * scale );
+    }
+    else if ( m( 1, 1 ) > m( 2, 2 ) )
+    {
+        const {{ scalarClass }} scale = {{ quaternionType.CppValue( 0.5 ) }} / std::sqrt( {{ quaternionType.CppValue( 1 ) }} + m( 1, 1 ) - m( 0, 0 ) - m( 2, 2 ) );
+        return {{ quaternionType.className }}( ( m( 0, 1 ) + m( 1, 0 ) ) * scale,
+                                                 {{ quaternionType.CppValue( 0.25 ) }} / scale,
+                                                 ( m( 1, 2 ) + m( 2, 1 ) ) * scale,
+                                                 ( m( 0, 2 ) - m( 2, 0 ) ) * scale );
+    }
+    else
+    {
+        const {{ scalarClass }} scale = {{ quaternionType.CppValue( 0.5 ) }} / std::sqrt( {{ quaternionType.CppValue( 1 ) }} + m( 2, 2 ) - m( 0, 0 ) - m( 1, 1 ) );
+        return {{ quaternionType.className }}( ( m( 0, 2 ) + m( 2, 0 ) ) * scale,
+                                                 ( m( 1, 2 ) + m( 2, 1 ) ) * scale,
+                                                 {{ quaternionType.CppValue( 0.25 ) }} / scale,
+                                                 ( m( 1, 0 ) - m( 0, 1 ) ) * scale );
+    }
+}
+{% endfor %}
+{% endblock %}
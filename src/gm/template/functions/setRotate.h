@@ -2,7 +2,10 @@
 {% import "functions/functionUtils.h" as functionUtils %}
 
 {%- block fileDoc -%}
-/// Set a rotation for an specified axis on a transformation matrix, with respect to the left hand rule.
+/// Set a rotation for an specified axis on a transformation matrix or quaternion, with respect to the left hand rule.
+///
+/// A rotation matrix can also be set from a unit quaternion, without re-computing the sine and cosine
+/// of the rotation angle.
 {%- endblock %}
 
 {% block includes %}
@@ -14,6 +17,80 @@
 
 {% block body %}
 {% for interface in function.interfaces %}
+{% if interface.HasArg("angle") and interface.HasArg("quaternion") %}
+{% set angle          = interface.ArgName("angle") %}
+{% set angleClass     = interface.ArgClass("angle") %}
+{% set axis           = interface.ArgName("axis") %}
+{% set axisClass      = interface.ArgClass("axis") %}
+{% set quaternion     = interface.ArgName("quaternion") %}
+{% set quaternionType = interface.ArgType("quaternion") %}
+/// Set a \p {{ axis }} rotation of \p {{ angle }} degrees onto the quaternion \p {{ quaternion }}.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// \param {{ angle }} The angle of rotation in degrees.
+/// \param {{ axis }} The axis of rotation.
+/// \param {{ quaternion }} The output unit quaternion.
+{{- functionUtils.signature(function, interface) -}}
+{
+    // Axis must be normalised.
+    {{ axisClass }} normAxis = Normalize( {{ axis }} );
+
+    // Compute the sine and cosine of the half angle.
+    {{ angleClass }} halfRadians = Radians( {{ angle }} ) * {{ quaternionType.CppValue( 0.5 ) }};
+    {{ angleClass }} sinHalfTheta = std::sin( halfRadians );
+
+    {{ quaternion }} = {{ quaternionType.className }}( normAxis[ 0 ] * sinHalfTheta,
+                                    normAxis[ 1 ] * sinHalfTheta,
+                                    normAxis[ 2 ] * sinHalfTheta,
+                                    std::cos( halfRadians ) );
+}
+{% elif interface.HasArg("quaternion") %}
+{% set quaternion     = interface.ArgName("quaternion") %}
+{% set quaternionType = interface.ArgType("quaternion") %}
+{% set matrix         = interface.ArgName("matrix") %}
+{% set matrixType     = interface.ArgType("matrix") %}
+{% set scalarClass    = quaternionType.elementType.className %}
+/// Set the rotation of the unit quaternion \p {{ quaternion }} onto the transformation matrix \p {{ matrix }}.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// Only the upper left 3x3 rotation elements of \p {{ matrix }} are set.
+///
+/// \param {{ quaternion }} The unit quaternion describing the rotation.
+/// \param {{ matrix }} Transformation matrix.
+{{- functionUtils.signature(function, interface) -}}
+{
+    const {{ scalarClass }} x = {{ quaternion }}.X();
+    const {{ scalarClass }} y = {{ quaternion }}.Y();
+    const {{ scalarClass }} z = {{ quaternion }}.Z();
+    const {{ scalarClass }} w = {{ quaternion }}.W();
+
+    const {{ scalarClass }} x2 = x + x;
+    const {{ scalarClass }} y2 = y + y;
+    const {{ scalarClass }} z2 = z + z;
+
+    const {{ scalarClass }} xx2 = x * x2;
+    const {{ scalarClass }} yy2 = y * y2;
+    const {{ scalarClass }} zz2 = z * z2;
+    const {{ scalarClass }} xy2 = x * y2;
+    const {{ scalarClass }} xz2 = x * z2;
+    const {{ scalarClass }} yz2 = y * z2;
+    const {{ scalarClass }} wx2 = w * x2;
+    const {{ scalarClass }} wy2 = w * y2;
+    const {{ scalarClass }} wz2 = w * z2;
+
+    {{ matrix }}( 0, 0 ) = {{ quaternionType.CppValue( 1 ) }} - ( yy2 + zz2 );
+    {{ matrix }}( 0, 1 ) = xy2 - wz2;
+    {{ matrix }}( 0, 2 ) = xz2 + wy2;
+
+    {{ matrix }}( 1, 0 ) = xy2 + wz2;
+    {{ matrix }}( 1, 1 ) = {{ quaternionType.CppValue( 1 ) }} - ( xx2 + zz2 );
+    {{ matrix }}( 1, 2 ) = yz2 - wx2;
+
+    {{ matrix }}( 2, 0 ) = xz2 - wy2;
+    {{ matrix }}( 2, 1 ) = yz2 + wx2;
+    {{ matrix }}( 2, 2 ) = {{ quaternionType.CppValue( 1 ) }} - ( xx2 + yy2 );
+}
+{% else %}
 {% set angle      = interface.ArgName("angle") %}
 {% set angleClass = interface.ArgClass("angle") %}
 {% set axis       = interface.ArgName("axis") %}
@@ -51,5 +128,6 @@
     o_matrix( 2, 2 ) = normAxis[ 2 ] * normAxis[ 2 ] + (1 - normAxis[ 2 ] * normAxis[ 2 ]) * cosTheta;
     o_matrix( 2, 3 ) = 0;
 }
+{% endif %}
 {% endfor %}
 {% endblock %}
@@ -0,0 +1,69 @@
+{% extends "functions/functionBase.h" %}
+{% import "functions/functionUtils.h" as functionUtils %}
+
+{%- block fileDoc -%}
+/// Spherical linear interpolation (slerp).
+///
+/// Interpolate from a source to target unit quaternion along the great arc between them, such that the
+/// rotation changes at a constant angular velocity with respect to the weight:
+///
+/// \f[ \frac{\sin((1-w)\theta)}{\sin\theta}S+\frac{\sin(w\theta)}{\sin\theta}T=V \f]
+/// \f[ \theta=\arccos(S \cdot T) \f]
+///
+/// The shortest of the two arcs is taken, by negating the target if required.  Nearly parallel quaternions
+/// fall back to a normalized linear interpolation, where \f$\sin\theta\f$ approaches 0.
+{%- endblock %}
+
+{% block includes %}
+{{ functionUtils.typeIncludes(function) }}
+
+#include <gm/functions/dotProduct.h>
+#include <gm/functions/normalize.h>
+
+#include <cmath>
+{% endblock %}
+
+{% block body %}
+{% for interface in function.interfaces %}
+{% set quaternionType = interface.ArgType("source") %}
+{% set scalarClass    = quaternionType.elementType.className %}
+{% set source         = interface.ArgName("source") %}
+{% set target         = interface.ArgName("target") %}
+{% set weight         = interface.ArgName("weight") %}
+/// Spherically interpolate between the unit quaternions \p {{ source }} and \p {{ target }}, with weight \p {{ weight }}.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// \param {{ source }} Source unit quaternion to interpolate from.
+/// \param {{ target }} Target unit quaternion to interpolate to.
+/// \param {{ weight }} Describes the percentage of \p {{ target }} in the final, interpolated value.
+///
+/// \pre \p {{ weight }} must be in the range of [0,1].
+///
+/// \return Spherically interpolated unit quaternion.
+{{- functionUtils.signature(function, interface) -}}
+{
+    GM_ASSERT_MSG( {{ weight }} >= 0.0f && {{ weight }} <= 1.0f,
+                   "Expected {{ weight }} between [0,1], got %f\n",
+                   {{ weight }} );
+
+    // Take the shortest arc.
+    {{ scalarClass }} cosTheta = DotProduct( {{ source }}, {{ target }} );
+    {{ quaternionType.className }} target = {{ target }};
+    if ( cosTheta < {{ quaternionType.CppValue( 0 ) }} )
+    {
+        cosTheta = -cosTheta;
+        target = -target;
+    }
+
+    if ( cosTheta > {{ quaternionType.CppValue( 0.9995 ) }} )
+    {
+        return Normalize( {{ source }} * ( {{ quaternionType.CppValue( 1 ) }} - {{ weight }} ) + target * {{ weight }} );
+    }
+
+    const {{ scalarClass }} theta = std::acos( cosTheta );
+    const {{ scalarClass }} invSinTheta = {{ quaternionType.CppValue( 1 ) }} / std::sin( theta );
+    return {{ source }} * ( std::sin( ( {{ quaternionType.CppValue( 1 ) }} - {{ weight }} ) * theta ) * invSinTheta ) +
+           target * ( std::sin( {{ weight }} * theta ) * invSinTheta );
+}
+{% endfor %}
+{% endblock %}
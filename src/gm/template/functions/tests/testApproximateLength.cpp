@@ -0,0 +1,30 @@
+#include <catch2/catch.hpp>
+
+#include <gm/functions/{{ function.headerFileName }}>
+#include <gm/functions/length.h>
+
+#include <algorithm>
+#include <cmath>
+
+{% for interface in function.interfaces %}
+{% set vectorType = interface.ArgType("vector") %}
+TEST_CASE( "{{ function.name }}_{{ interface.testSuffix }}" )
+{
+    CHECK( gm::{{ function.name }}( gm::{{ vectorType.className }}() ) == {{ vectorType.CppValue( 0 ) }} );
+
+    // Relative error bound, with respect to the exact length.
+    double maxRelativeError = 0.0;
+    for ( int index = 1; index < 4096; ++index )
+    {
+        gm::{{ vectorType.className }} {{ vectorType.varName }}(
+{%- for elementIndex in range(vectorType.elementSize) -%}
+            std::sin( index * {{ elementIndex + 1 }}.0f ) * index{% if not loop.last %},{% endif %}
+{%- endfor -%}
+        );
+        double expected = gm::Length( {{ vectorType.varName }} );
+        double relativeError = std::abs( gm::{{ function.name }}( {{ vectorType.varName }} ) - expected ) / expected;
+        maxRelativeError = std::max( maxRelativeError, relativeError );
+    }
+    CHECK( maxRelativeError <= 6.0e-6 );
+}
+{% endfor %}
@@ -0,0 +1,34 @@
+#include <catch2/catch.hpp>
+
+#include <gm/functions/{{ function.headerFileName }}>
+#include <gm/functions/length.h>
+#include <gm/functions/normalize.h>
+
+#include <algorithm>
+#include <cmath>
+
+{% for interface in function.interfaces %}
+{% set vectorType = interface.ArgType("vector") %}
+TEST_CASE( "{{ function.name }}_{{ interface.testSuffix }}" )
+{
+    // The normalized vectors are of unit length and parallel to the exact normalized vectors, within the error bound.
+    double maxError = 0.0;
+    for ( int index = 1; index < 4096; ++index )
+    {
+        gm::{{ vectorType.className }} {{ vectorType.varName }}(
+{%- for elementIndex in range(vectorType.elementSize) -%}
+            std::sin( index * {{ elementIndex + 1 }}.0f ) * index{% if not loop.last %},{% endif %}
+{%- endfor -%}
+        );
+        gm::{{ vectorType.className }} normalized = gm::{{ function.name }}( {{ vectorType.varName }} );
+        gm::{{ vectorType.className }} expected = gm::Normalize( {{ vectorType.varName }} );
+        maxError = std::max( maxError, std::abs( gm::Length( normalized ) - 1.0 ) );
+        for ( size_t elementIndex = 0; elementIndex < {{ vectorType.elementSize }}; ++elementIndex )
+        {
+            maxError = std::max( maxError,
+                                 static_cast< double >( std::abs( normalized[ elementIndex ] - expected[ elementIndex ] ) ) );
+        }
+    }
+    CHECK( maxError <= 6.0e-6 );
+}
+{% endfor %}
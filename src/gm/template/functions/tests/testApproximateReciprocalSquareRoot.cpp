@@ -0,0 +1,24 @@
+#include <catch2/catch.hpp>
+
+#include <gm/functions/{{ function.headerFileName }}>
+
+#include <algorithm>
+#include <cmath>
+
+{% for interface in function.interfaces %}
+{% set valueClass = interface.ArgClass("value") %}
+TEST_CASE( "{{ function.name }}_{{ interface.testSuffix }}" )
+{
+    CHECK( gm::{{ function.name }}( {{ interface.ArgType("value").CppValue( 4 ) }} ) == Approx( 0.5 ) );
+
+    // Relative error bound, over values spanning many orders of magnitude.
+    double maxRelativeError = 0.0;
+    for ( {{ valueClass }} value = 1.0e-20f; value < 1.0e20f; value *= 1.0007f )
+    {
+        double expected = 1.0 / std::sqrt( static_cast< double >( value ) );
+        double relativeError = std::abs( gm::{{ function.name }}( value ) - expected ) / expected;
+        maxRelativeError = std::max( maxRelativeError, relativeError );
+    }
+    CHECK( maxRelativeError <= 5.0e-6 );
+}
+{% endfor %}
@@ -0,0 +1,34 @@
+#include <catch2/catch.hpp>
+
+#include <gm/functions/{{ function.headerFileName }}>
+#include <gm/functions/setRotate.h>
+
+#include <algorithm>
+#include <cmath>
+
+{% for interface in function.interfaces %}
+{% set targetType = interface.ArgType("matrix") if interface.HasArg("matrix") else interface.ArgType("quaternion") %}
+TEST_CASE( "{{ function.name }}_{{ interface.testSuffix }}" )
+{
+    // Absolute error bound of the elements, with respect to the exact rotation.  Each element is a sum of
+    // products of the approximated sine and cosine with the unit axis elements.
+    const gm::Vec3f axes[] = {gm::Vec3f( 1, 0, 0 ), gm::Vec3f( 0, 1, 0 ), gm::Vec3f( 1, 2, 3 ), gm::Vec3f( -4, 1, 0.5 )};
+    double maxError = 0.0;
+    for ( const gm::Vec3f& axis : axes )
+    {
+        for ( float angle = -720.0f; angle <= 720.0f; angle += 0.37f )
+        {
+            gm::{{ targetType.className }} rotation;
+            gm::{{ targetType.className }} expected;
+            gm::{{ function.name }}( angle, axis, rotation );
+            gm::SetRotate( angle, axis, expected );
+            for ( size_t elementIndex = 0; elementIndex < {{ targetType.elementSize }}; ++elementIndex )
+            {
+                maxError = std::max(
+                    maxError, static_cast< double >( std::abs( rotation[ elementIndex ] - expected[ elementIndex ] ) ) );
+            }
+        }
+    }
+    CHECK( maxError <= 1.0e-6 );
+}
+{% endfor %}
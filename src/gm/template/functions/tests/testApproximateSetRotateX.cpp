@@ -0,0 +1,32 @@
+{% set exactName = function.name[ "Approximate"|length: ] -%}
+#include <catch2/catch.hpp>
+
+#include <gm/functions/{{ function.headerFileName }}>
+#include <gm/functions/{{ exactName[ 0 ]|lower }}{{ exactName[ 1: ] }}.h>
+
+#include <algorithm>
+#include <cmath>
+
+{% for interface in function.interfaces %}
+{% set matrixType = interface.ArgType("matrix") %}
+TEST_CASE( "{{ function.name }}_{{ interface.testSuffix }}" )
+{
+    // Absolute error bound of the rotation elements, with respect to the exact rotation.
+    double maxError = 0.0;
+    for ( float angle = -720.0f; angle <= 720.0f; angle += 0.37f )
+    {
+        gm::{{ matrixType.className }} matrix = gm::{{ matrixType.className }}::Identity();
+        gm::{{ matrixType.className }} expected = gm::{{ matrixType.className }}::Identity();
+        gm::{{ function.name }}( angle, matrix );
+        gm::{{ exactName }}( angle, expected );
+        for ( size_t elementIndex = 0; elementIndex < {{ matrixType.elementSize }}; ++elementIndex )
+        {
+            maxError = std::max( maxError,
+                                 static_cast< double >( std::abs( matrix[ elementIndex ] - expected[ elementIndex ] ) ) );
+        }
+    }
+
+    // The exact sine and cosine are within half a unit in the last place.
+    CHECK( maxError <= 2.0e-7 + 6.0e-8 );
+}
+{% endfor %}
@@ -0,0 +1 @@
+{% include "functions/tests/testApproximateSetRotateX.cpp" %}
@@ -0,0 +1,27 @@
+#include <catch2/catch.hpp>
+
+#include <gm/functions/{{ function.headerFileName }}>
+
+#include <algorithm>
+#include <cmath>
+
+{% for interface in function.interfaces %}
+{% set angleClass = interface.ArgClass("angle") %}
+TEST_CASE( "{{ function.name }}_{{ interface.testSuffix }}" )
+{
+    {{ angleClass }} sine, cosine;
+    gm::{{ function.name }}( 0.0f, sine, cosine );
+    CHECK( sine == 0.0f );
+    CHECK( cosine == 1.0f );
+
+    // Absolute error bound, over the documented range of angles, including many quadrants.
+    double maxError = 0.0;
+    for ( {{ angleClass }} angle = -8192.0f; angle <= 8192.0f; angle += 0.0013f )
+    {
+        gm::{{ function.name }}( angle, sine, cosine );
+        maxError = std::max( maxError, std::abs( sine - std::sin( static_cast< double >( angle ) ) ) );
+        maxError = std::max( maxError, std::abs( cosine - std::cos( static_cast< double >( angle ) ) ) );
+    }
+    CHECK( maxError <= 2.0e-7 );
+}
+{% endfor %}
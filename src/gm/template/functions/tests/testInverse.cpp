@@ -1,7 +1,11 @@
 #include <catch2/catch.hpp>
 
+#include <gm/functions/batch/inverse.h>
 #include <gm/functions/matrixProduct.h>
 #include <gm/functions/inverse.h>
+#include <gm/functions/setIdentity.h>
+
+#include <vector>
 
 template < typename MatrixT >
 void CHECK_INVERSE( const MatrixT& i_matrix )
@@ -14,6 +18,28 @@ void CHECK_INVERSE( const MatrixT& i_matrix )
     CHECK( gm::MatrixProduct( inverse, i_matrix ) == identity );
 }
 
+TEST_CASE( "Inverse_Mat3f" )
+{
+    CHECK_INVERSE( gm::Mat3f(
+            1,  7, 0.25,
+            0,  5, 8,
+            2, -3, 1
+        )
+    );
+
+    // Zero pivot in the first row.
+    CHECK_INVERSE( gm::Mat3f(
+            0,  2, 1,
+            3,  0, 4,
+            1, -1, 0.5
+        )
+    );
+
+    // Singular.
+    gm::Mat3f inverse;
+    CHECK( !gm::Inverse( gm::Mat3f( 1, 2, 3, 2, 4, 6, 0, 1, 1 ), inverse ) );
+}
+
 TEST_CASE( "Inverse_Mat4f" )
 {
     CHECK_INVERSE( gm::Mat4f(
@@ -31,4 +57,40 @@ TEST_CASE( "Inverse_Mat4f" )
             1,  1, 5,   1.3
         )
     );
+
+    // Zero pivots along the diagonal.
+    CHECK_INVERSE( gm::Mat4f(
+            0, 1, 0, 0,
+            0, 0, 2, 0,
+            0, 0, 0, 4,
+            8, 0, 0, 0
+        )
+    );
+
+    // Singular.
+    gm::Mat4f inverse;
+    CHECK( !gm::Inverse( gm::Mat4f( 1, 2, 3, 4, 2, 4, 6, 8, 0, 1, 0, 1, 1, 0, 1, 0 ), inverse ) );
+}
+
+TEST_CASE( "Inverse_Batch" )
+{
+    std::vector< gm::Mat4f > matrices = {
+        gm::Mat4f( 1, 7, 0.25, 8, 0, 5, 8, 9, 2, -3, 1, 1.3, 8, 1, 2, 1.3 ),
+        gm::Mat4f( 5, 7, 52, 1.0, 1, 5, 72, 0.5, 0, -3, 2.5, 5.5, 1, 1, 5, 1.3 ),
+        gm::Mat4f( 1, 2, 3, 4, 2, 4, 6, 8, 0, 1, 0, 1, 1, 0, 1, 0 ),
+    };
+
+    std::vector< gm::Mat4f > inverses( matrices.size() );
+    bool                     invertible[ 3 ];
+    gm::Inverse( matrices, matrices.size(), inverses.data(), invertible );
+    for ( size_t index = 0; index < 2; ++index )
+    {
+        gm::Mat4f inverse;
+        CHECK( gm::Inverse( matrices[ index ], inverse ) );
+        CHECK( invertible[ index ] );
+        CHECK( inverses[ index ] == inverse );
+    }
+
+    // A singular matrix fails on its own, while still inverting the others.
+    CHECK( !invertible[ 2 ] );
 }
@@ -0,0 +1,69 @@
+#include <catch2/catch.hpp>
+
+#include <gm/functions/batch/inverseAffine.h>
+#include <gm/functions/inverse.h>
+#include <gm/functions/inverseAffine.h>
+#include <gm/functions/matrixProduct.h>
+#include <gm/functions/setRotateX.h>
+#include <gm/functions/setRotateY.h>
+#include <gm/functions/setScale.h>
+#include <gm/functions/setTranslate.h>
+
+#include <vector>
+
+static gm::Mat4f AffineTransform( float i_angle, const gm::Vec3f& i_scale, const gm::Vec3f& i_translate )
+{
+    gm::Mat4f rotateX = gm::Mat4f::Identity();
+    gm::SetRotateX( i_angle, rotateX );
+    gm::Mat4f rotateY = gm::Mat4f::Identity();
+    gm::SetRotateY( i_angle * 0.5f, rotateY );
+    gm::Mat4f scale = gm::Mat4f::Identity();
+    gm::SetScale( i_scale, scale );
+    gm::Mat4f matrix = gm::MatrixProduct( gm::MatrixProduct( rotateX, rotateY ), scale );
+    gm::SetTranslate( i_translate, matrix );
+    return matrix;
+}
+
+TEST_CASE( "InverseAffine_Mat4f" )
+{
+    for ( const gm::Mat4f& matrix : {
+              AffineTransform( 0, gm::Vec3f( 1, 1, 1 ), gm::Vec3f( 1, 2, 3 ) ),
+              AffineTransform( 30, gm::Vec3f( 2, 3, 4 ), gm::Vec3f( -5, 0, 2 ) ),
+              AffineTransform( 135, gm::Vec3f( -1, 0.5, 8 ), gm::Vec3f( 0, 10, -3 ) ),
+          } )
+    {
+        gm::Mat4f inverse;
+        CHECK( gm::InverseAffine( matrix, inverse ) );
+        CHECK( gm::MatrixProduct( matrix, inverse ) == gm::Mat4f::Identity() );
+        CHECK( gm::MatrixProduct( inverse, matrix ) == gm::Mat4f::Identity() );
+
+        // Matches the general inverse.
+        gm::Mat4f generalInverse;
+        CHECK( gm::Inverse( matrix, generalInverse ) );
+        CHECK( inverse == generalInverse );
+    }
+
+    // Singular, with a zero scale.
+    gm::Mat4f inverse;
+    CHECK( !gm::InverseAffine( AffineTransform( 30, gm::Vec3f( 1, 0, 1 ), gm::Vec3f( 1, 2, 3 ) ), inverse ) );
+}
+
+TEST_CASE( "InverseAffine_Batch" )
+{
+    std::vector< gm::Mat4f > matrices = {
+        AffineTransform( 30, gm::Vec3f( 2, 3, 4 ), gm::Vec3f( -5, 0, 2 ) ),
+        AffineTransform( 135, gm::Vec3f( -1, 0.5, 8 ), gm::Vec3f( 0, 10, -3 ) ),
+        AffineTransform( 30, gm::Vec3f( 1, 0, 1 ), gm::Vec3f( 1, 2, 3 ) ),
+    };
+
+    std::vector< gm::Mat4f > inverses( matrices.size() );
+    bool                     invertible[ 3 ];
+    gm::InverseAffine( matrices, matrices.size(), inverses.data(), invertible );
+    for ( size_t index = 0; index < 2; ++index )
+    {
+        CHECK( invertible[ index ] );
+        CHECK( gm::MatrixProduct( matrices[ index ], inverses[ index ] ) == gm::Mat4f::Identity() );
+    }
+
+    CHECK( !invertible[ 2 ] );
+}
@@ -0,0 +1,56 @@
+#include <catch2/catch.hpp>
+
+#include <gm/functions/batch/inverseRigid.h>
+#include <gm/functions/inverse.h>
+#include <gm/functions/inverseRigid.h>
+#include <gm/functions/matrixProduct.h>
+#include <gm/functions/setRotateX.h>
+#include <gm/functions/setRotateZ.h>
+#include <gm/functions/setTranslate.h>
+
+#include <vector>
+
+static gm::Mat4f RigidTransform( float i_angle, const gm::Vec3f& i_translate )
+{
+    gm::Mat4f rotateX = gm::Mat4f::Identity();
+    gm::SetRotateX( i_angle, rotateX );
+    gm::Mat4f rotateZ = gm::Mat4f::Identity();
+    gm::SetRotateZ( i_angle * 2.0f, rotateZ );
+    gm::Mat4f matrix = gm::MatrixProduct( rotateZ, rotateX );
+    gm::SetTranslate( i_translate, matrix );
+    return matrix;
+}
+
+TEST_CASE( "InverseRigid_Mat4f" )
+{
+    for ( const gm::Mat4f& matrix : {
+              RigidTransform( 0, gm::Vec3f( 1, 2, 3 ) ),
+              RigidTransform( 30, gm::Vec3f( -5, 0, 2 ) ),
+              RigidTransform( 250, gm::Vec3f( 0, 10, -3 ) ),
+          } )
+    {
+        gm::Mat4f inverse = gm::InverseRigid( matrix );
+        CHECK( gm::MatrixProduct( matrix, inverse ) == gm::Mat4f::Identity() );
+        CHECK( gm::MatrixProduct( inverse, matrix ) == gm::Mat4f::Identity() );
+
+        // Matches the general inverse.
+        gm::Mat4f generalInverse;
+        CHECK( gm::Inverse( matrix, generalInverse ) );
+        CHECK( inverse == generalInverse );
+    }
+}
+
+TEST_CASE( "InverseRigid_Batch" )
+{
+    std::vector< gm::Mat4f > matrices = {
+        RigidTransform( 30, gm::Vec3f( -5, 0, 2 ) ),
+        RigidTransform( 250, gm::Vec3f( 0, 10, -3 ) ),
+    };
+
+    std::vector< gm::Mat4f > inverses( matrices.size() );
+    gm::InverseRigid( matrices, matrices.size(), inverses.data() );
+    for ( size_t index = 0; index < matrices.size(); ++index )
+    {
+        CHECK( inverses[ index ] == gm::InverseRigid( matrices[ index ] ) );
+    }
+}
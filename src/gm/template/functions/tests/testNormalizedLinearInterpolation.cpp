@@ -0,0 +1,26 @@
+#include <catch2/catch.hpp>
+
+#include <gm/functions/length.h>
+#include <gm/functions/normalizedLinearInterpolation.h>
+#include <gm/functions/setRotate.h>
+
+TEST_CASE( "NormalizedLinearInterpolation_Quatf_Quatf_float" )
+{
+    gm::Quatf source;
+    gm::SetRotate( 0, gm::Vec3f( 0, 0, 1 ), source );
+    gm::Quatf target;
+    gm::SetRotate( 90, gm::Vec3f( 0, 0, 1 ), target );
+
+    // End points.
+    CHECK( gm::NormalizedLinearInterpolation( source, target, 0.0f ) == source );
+    CHECK( gm::NormalizedLinearInterpolation( source, target, 1.0f ) == target );
+
+    // The mid point is exact, by symmetry.
+    gm::Quatf expected;
+    gm::SetRotate( 45, gm::Vec3f( 0, 0, 1 ), expected );
+    CHECK( gm::NormalizedLinearInterpolation( source, target, 0.5f ) == expected );
+    CHECK( gm::Length( gm::NormalizedLinearInterpolation( source, target, 0.25f ) ) == Approx( 1.0f ) );
+
+    // Shortest arc, with the target in the opposite hemisphere.
+    CHECK( gm::NormalizedLinearInterpolation( source, -target, 0.5f ) == expected );
+}
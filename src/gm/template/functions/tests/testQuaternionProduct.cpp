@@ -0,0 +1,35 @@
+#include <catch2/catch.hpp>
+
+#include <gm/functions/matrixProduct.h>
+#include <gm/functions/quaternionProduct.h>
+#include <gm/functions/setRotate.h>
+
+TEST_CASE( "QuaternionProduct_Quatf_Quatf" )
+{
+    gm::Quatf rotation;
+    gm::SetRotate( 30, gm::Vec3f( 1, 2, 3 ), rotation );
+
+    // Identity.
+    CHECK( gm::QuaternionProduct( gm::Quatf::Identity(), rotation ) == rotation );
+    CHECK( gm::QuaternionProduct( rotation, gm::Quatf::Identity() ) == rotation );
+
+    // Composition of rotations about the same axis.
+    gm::Quatf doubleRotation;
+    gm::SetRotate( 60, gm::Vec3f( 1, 2, 3 ), doubleRotation );
+    CHECK( gm::QuaternionProduct( rotation, rotation ) == doubleRotation );
+
+    // Composition matches the product of the rotation matrices.
+    gm::Quatf rotationA;
+    gm::SetRotate( 45, gm::Vec3f( 0, 1, 0 ), rotationA );
+    gm::Quatf rotationB;
+    gm::SetRotate( 120, gm::Vec3f( 1, 0, 1 ), rotationB );
+
+    gm::Mat3f matrixA = gm::Mat3f::Identity();
+    gm::SetRotate( rotationA, matrixA );
+    gm::Mat3f matrixB = gm::Mat3f::Identity();
+    gm::SetRotate( rotationB, matrixB );
+
+    gm::Mat3f matrix = gm::Mat3f::Identity();
+    gm::SetRotate( gm::QuaternionProduct( rotationA, rotationB ), matrix );
+    CHECK( matrix == gm::MatrixProduct( matrixA, matrixB ) );
+}
@@ -5,7 +5,7 @@
 
 {% import "types/typeUtils.h" as typeUtils %}
 
-{% for interface in function.interfaces %}
+{% for interface in function.interfaces if interface.HasArg("rayOrigin") and not interface.isPacket %}
 TEST_CASE( "{{ function.name }}_{{ interface.ArgClass("aabb") }}" )
 {
     // Bounding volume.
@@ -93,3 +93,79 @@ TEST_CASE( "{{ function.name }}_{{ interface.ArgClass("aabb") }}" )
 {%- endfor %}
 }
 {% endfor %}
+
+{% for interface in function.interfaces if interface.isPacket %}
+{% set laneCount = interface.ArgType("rayDirection").laneCount %}
+TEST_CASE( "{{ function.name }}_{{ interface.ArgClass("rayDirection") }}" )
+{
+    gm::{{ interface.ArgClass("aabb") }} aabb( gm::Vec3f( -2, -2, -2 ), gm::Vec3f( 2, 2, 2 ) );
+
+    // Volume intersection, ray origin inside aabb, skim intersection, and no intersection.
+    const gm::Vec3f rayOrigins[ 4 ] = {gm::Vec3f( -4, -4, -4 ), gm::Vec3f( -1, 0, 0 ), gm::Vec3f( -4, 0, 0 ),
+                                       gm::Vec3f( -5, 0, 0 )};
+    const gm::Vec3f rayDirections[ 4 ] = {gm::Normalize( gm::Vec3f( 1, 1, 1 ) ),
+                                          gm::Normalize( gm::Vec3f( -1, -1, -1 ) ),
+                                          gm::Normalize( gm::Vec3f( 1, 1, 1 ) ),
+                                          gm::Normalize( gm::Vec3f( 1, 1, 1 ) )};
+
+    gm::{{ interface.ArgClass("rayOrigin") }} rayOrigin;
+    gm::{{ interface.ArgClass("rayDirection") }} rayDirection;
+    for ( size_t laneIndex = 0; laneIndex < {{ laneCount }}; ++laneIndex )
+    {
+        rayOrigin.SetLane( laneIndex, rayOrigins[ laneIndex % 4 ] );
+        rayDirection.SetLane( laneIndex, rayDirections[ laneIndex % 4 ] );
+    }
+
+    gm::{{ interface.ArgClass("intersections") }} intersections;
+    int hitMask = gm::{{ function.name }}( rayOrigin, rayDirection, aabb, intersections );
+
+    // Each lane must match the single ray intersection test.
+    for ( size_t laneIndex = 0; laneIndex < {{ laneCount }}; ++laneIndex )
+    {
+        gm::FloatRange laneIntersections;
+        bool hit = gm::{{ function.name }}( rayOrigins[ laneIndex % 4 ], rayDirections[ laneIndex % 4 ], aabb, laneIntersections );
+        CHECK( ( ( hitMask >> laneIndex ) & 1 ) == int( hit ) );
+        if ( hit )
+        {
+            CHECK( intersections.GetLane( laneIndex ).Min() == Approx( laneIntersections.Min() ) );
+            CHECK( intersections.GetLane( laneIndex ).Max() == Approx( laneIntersections.Max() ) );
+        }
+    }
+}
+{% endfor %}
+
+{% for interface in function.interfaces if interface.HasArg("ray") %}
+TEST_CASE( "{{ function.name }}_{{ interface.ArgClass("ray") }}" )
+{
+    gm::{{ interface.ArgClass("aabb") }} aabb( gm::Vec3f( -2, -2, -2 ), gm::Vec3f( 2, 2, 2 ) );
+
+    // Volume intersection, ray origin inside aabb, skim intersection, no intersection, and axis aligned
+    // rays with zero direction components.
+    const gm::Vec3f rayOrigins[ 7 ] = {gm::Vec3f( -4, -4, -4 ), gm::Vec3f( -1, 0, 0 ), gm::Vec3f( -4, 0, 0 ),
+                                       gm::Vec3f( -5, 0, 0 ),   gm::Vec3f( 0, 0, -4 ), gm::Vec3f( 0, 3, -4 ),
+                                       gm::Vec3f( 4, 1, 1 )};
+    const gm::Vec3f rayDirections[ 7 ] = {gm::Normalize( gm::Vec3f( 1, 1, 1 ) ),
+                                          gm::Normalize( gm::Vec3f( -1, -1, -1 ) ),
+                                          gm::Normalize( gm::Vec3f( 1, 1, 1 ) ),
+                                          gm::Normalize( gm::Vec3f( 1, 1, 1 ) ),
+                                          gm::Vec3f( 0, 0, 1 ),
+                                          gm::Vec3f( 0, 0, 1 ),
+                                          gm::Vec3f( -1, 0, 0 )};
+
+    // Must match the intersection test of the ray origin and direction.
+    for ( size_t rayIndex = 0; rayIndex < 7; ++rayIndex )
+    {
+        gm::{{ interface.ArgClass("intersections") }} expectedIntersections;
+        bool expectedHit = gm::{{ function.name }}( rayOrigins[ rayIndex ], rayDirections[ rayIndex ], aabb, expectedIntersections );
+
+        gm::{{ interface.ArgClass("intersections") }} intersections;
+        gm::{{ interface.ArgClass("ray") }} ray( rayOrigins[ rayIndex ], rayDirections[ rayIndex ] );
+        CHECK( gm::{{ function.name }}( ray, aabb, intersections ) == expectedHit );
+        if ( expectedHit )
+        {
+            CHECK( intersections.Min() == Approx( expectedIntersections.Min() ) );
+            CHECK( intersections.Max() == Approx( expectedIntersections.Max() ) );
+        }
+    }
+}
+{% endfor %}
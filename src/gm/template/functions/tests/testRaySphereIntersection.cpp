@@ -29,3 +29,41 @@ TEST_CASE( "RaySphereIntersection_float" )
         CHECK( intersections.Max() == 1.5f );
     }
 }
+
+{% for interface in function.interfaces if interface.isPacket %}
+{% set laneCount = interface.ArgType("rayDirection").laneCount %}
+TEST_CASE( "RaySphereIntersection_{{ interface.ArgClass("rayDirection") }}" )
+{
+    gm::Vec3f sphereOrigin( 0, 0, -1.0f );
+    float     sphereRadius = 0.5f;
+
+    // No intersections, 2 intersections, ray origin inside the sphere, and sphere behind the ray.
+    const gm::Vec3f rayOrigins[ 4 ] = {gm::Vec3f( 0, 0, 0 ), gm::Vec3f( 0, 0, 0 ), gm::Vec3f( 0, 0, -1 ),
+                                       gm::Vec3f( 0, 0, 0 )};
+    const gm::Vec3f rayDirections[ 4 ] = {gm::Normalize( gm::Vec3f( 0, 1, -1 ) ), gm::Vec3f( 0, 0, -1 ),
+                                          gm::Vec3f( 0, 0, -1 ), gm::Vec3f( 0, 0, 1 )};
+    const bool expectedHits[ 4 ] = {false, true, true, false};
+    const gm::FloatRange expectedIntersections[ 4 ] = {gm::FloatRange(), gm::FloatRange( 0.5f, 1.5f ),
+                                                       gm::FloatRange( 0.0f, 0.5f ), gm::FloatRange()};
+
+    gm::{{ interface.ArgClass("rayOrigin") }} rayOrigin;
+    gm::{{ interface.ArgClass("rayDirection") }} rayDirection;
+    for ( size_t laneIndex = 0; laneIndex < {{ laneCount }}; ++laneIndex )
+    {
+        rayOrigin.SetLane( laneIndex, rayOrigins[ laneIndex % 4 ] );
+        rayDirection.SetLane( laneIndex, rayDirections[ laneIndex % 4 ] );
+    }
+
+    gm::{{ interface.ArgClass("intersections") }} intersections;
+    int hitMask = gm::RaySphereIntersection( sphereOrigin, sphereRadius, rayOrigin, rayDirection, intersections );
+    for ( size_t laneIndex = 0; laneIndex < {{ laneCount }}; ++laneIndex )
+    {
+        CHECK( ( ( hitMask >> laneIndex ) & 1 ) == int( expectedHits[ laneIndex % 4 ] ) );
+        if ( expectedHits[ laneIndex % 4 ] )
+        {
+            CHECK( intersections.GetLane( laneIndex ).Min() == Approx( expectedIntersections[ laneIndex % 4 ].Min() ) );
+            CHECK( intersections.GetLane( laneIndex ).Max() == Approx( expectedIntersections[ laneIndex % 4 ].Max() ) );
+        }
+    }
+}
+{% endfor %}
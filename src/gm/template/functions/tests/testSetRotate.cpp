@@ -64,3 +64,44 @@ TEST_CASE( "{{ function.name }}_Mat4f" )
         0,         0,         0, 1
     ) );
 }
+
+TEST_CASE( "{{ function.name }}_Quatf" )
+{
+    // Rotation quaternions produce the same matrices as the angle and axis.
+    for ( float angle : {0.0f, 45.0f, 90.0f, 210.0f} )
+    {
+        for ( const gm::Vec3f& axis : {gm::Vec3f( 1, 0, 0 ), gm::Vec3f( 0, 1, 0 ), gm::Vec3f( 1, 2, 3 )} )
+        {
+            gm::Quatf quaternion;
+            gm::{{ function.name }}( angle, axis, quaternion );
+
+            gm::Mat4f expected;
+            gm::SetIdentity( expected );
+            gm::{{ function.name }}( angle, axis, expected );
+
+            gm::Mat4f matrix;
+            gm::SetIdentity( matrix );
+            gm::{{ function.name }}( quaternion, matrix );
+            CHECK( matrix == expected );
+
+            gm::Mat3f matrix3;
+            gm::SetIdentity( matrix3 );
+            gm::{{ function.name }}( quaternion, matrix3 );
+            CHECK( matrix3 == gm::Mat3f( expected( 0, 0 ), expected( 0, 1 ), expected( 0, 2 ),
+                                         expected( 1, 0 ), expected( 1, 1 ), expected( 1, 2 ),
+                                         expected( 2, 0 ), expected( 2, 1 ), expected( 2, 2 ) ) );
+        }
+    }
+
+    // Only the rotation elements are set.
+    gm::Quatf quaternion;
+    gm::{{ function.name }}( 90, gm::Vec3f( 0, 0, 1 ), quaternion );
+    gm::Mat4f matrix( 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16 );
+    gm::{{ function.name }}( quaternion, matrix );
+    CHECK( matrix == gm::Mat4f(
+        0, -1, 0, 4,
+        1,  0, 0, 8,
+        0,  0, 1, 12,
+        13, 14, 15, 16
+    ) );
+}
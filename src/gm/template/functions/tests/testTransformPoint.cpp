@@ -26,3 +26,15 @@ TEST_CASE( "TransformPoint_Vec3f" )
     gm::SetScale( gm::Vec3f( 2, 3, 4 ), matrix );
     CHECK( gm::TransformPoint( matrix, point ) == gm::Vec3f( 4, 12, 24 ) );
 }
+
+TEST_CASE( "TransformPoint_Mat4fA_Vec3fA" )
+{
+    gm::Mat4f matrix;
+    gm::SetIdentity( matrix );
+    gm::SetRotateX( 30, matrix );
+    gm::SetTranslate( gm::Vec3f( 1, 2, 3 ), matrix );
+    gm::Vec3f point( 2, 4, 6 );
+
+    gm::Vec3fA transformed = gm::TransformPoint( gm::Mat4fA( matrix ), gm::Vec3fA( point ) );
+    CHECK( transformed.GetUnaligned() == gm::TransformPoint( matrix, point ) );
+}
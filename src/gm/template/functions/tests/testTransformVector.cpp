@@ -1,6 +1,7 @@
 #include <catch2/catch.hpp>
 
 #include <gm/functions/setIdentity.h>
+#include <gm/functions/setRotate.h>
 #include <gm/functions/setRotateX.h>
 #include <gm/functions/setScale.h>
 #include <gm/functions/setTranslate.h>
@@ -26,3 +27,20 @@ TEST_CASE( "TransformVector_Vec3f" )
     gm::SetScale( gm::Vec3f( 2, 3, 4 ), matrix );
     CHECK( gm::TransformVector( matrix, vector ) == gm::Vec3f( 4, 12, 24 ) );
 }
+
+TEST_CASE( "TransformVector_Quatf_Vec3f" )
+{
+    gm::Vec3f vector( 2, 4, 6 );
+    CHECK( gm::TransformVector( gm::Quatf::Identity(), vector ) == vector );
+
+    // Matches the rotation matrix.
+    for ( float angle : {30.0f, 90.0f, 250.0f} )
+    {
+        gm::Quatf quaternion;
+        gm::SetRotate( angle, gm::Vec3f( 1, -2, 3 ), quaternion );
+        gm::Mat4f matrix;
+        gm::SetIdentity( matrix );
+        gm::SetRotate( quaternion, matrix );
+        CHECK( gm::TransformVector( quaternion, vector ) == gm::TransformVector( matrix, vector ) );
+    }
+}
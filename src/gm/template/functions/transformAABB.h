@@ -1,17 +1,27 @@
 {% extends "functions/functionBase.h" %}
 {% import "functions/functionUtils.h" as functionUtils %}
+{% import "types/simdUtils.h" as simdUtils %}
 
 {%- block fileDoc -%}
 /// Axis-aligned bounding box (AABB) transformation.
 ///
-/// The 8 points forming the AABB are individually transformed, then a new AABB is expanded
-/// based on the 6 points.
+/// Affine transformations are computed with Arvo's method ("Transforming Axis-Aligned Bounding Boxes",
+/// Graphics Gems, 1990): each axis of the transformed AABB is the translation, plus the sum of the minimum
+/// and maximum products of the matrix row with the AABB extents along each axis.  This is equivalent to
+/// transforming and expanding by the 8 corner points of the AABB, at a fraction of the cost.
+///
+/// Projective transformations fall back to transforming the 8 corner points, then expanding a new AABB
+/// to include them.
 {%- endblock %}
 
 {% block includes %}
 {{ functionUtils.typeIncludes(function) }}
 #include <gm/functions/transformPoint.h>
 #include <gm/functions/expand.h>
+#include <gm/functions/max.h>
+#include <gm/functions/min.h>
+
+#include <gm/base/simd.h>
 {% endblock %}
 
 {% block body %}
@@ -29,6 +39,63 @@
 /// \return Transformed axis-aligned bounding box.
 {{- functionUtils.signature(function, interface) -}}
 {
+    if ( {{ matrix }}( 3, 0 ) == 0.0f && {{ matrix }}( 3, 1 ) == 0.0f && {{ matrix }}( 3, 2 ) == 0.0f &&
+         {{ matrix }}( 3, 3 ) == 1.0f )
+    {
+{% set accelerated = simdUtils.IsAccelerated(matrixType) and matrixType.shape == (4, 4) -%}
+{% if accelerated -%}
+#if defined( GM_SIMD_SSE_ENABLED )
+        // Accumulate the products of each matrix column with the AABB extents along the column axis, computing
+        // all the axes of the transformed AABB at once.
+        const float* matrixData = {{ matrix }}.Data();
+        __m128 column0 = _mm_loadu_ps( matrixData + 0 );
+        __m128 column1 = _mm_loadu_ps( matrixData + 4 );
+        __m128 column2 = _mm_loadu_ps( matrixData + 8 );
+        __m128 column3 = _mm_loadu_ps( matrixData + 12 );
+        _MM_TRANSPOSE4_PS( column0, column1, column2, column3 );
+
+        __m128 minimum = column3;
+        __m128 maximum = column3;
+{% for axis in range(3) -%}
+        {
+            __m128 minProduct = _mm_mul_ps( column{{ axis }}, _mm_set1_ps( {{ aabb }}.Min()[ {{ axis }} ] ) );
+            __m128 maxProduct = _mm_mul_ps( column{{ axis }}, _mm_set1_ps( {{ aabb }}.Max()[ {{ axis }} ] ) );
+            minimum = _mm_add_ps( minimum, _mm_min_ps( minProduct, maxProduct ) );
+            maximum = _mm_add_ps( maximum, _mm_max_ps( minProduct, maxProduct ) );
+        }
+{% endfor -%}
+
+        float minElements[ 4 ];
+        float maxElements[ 4 ];
+        _mm_storeu_ps( minElements, minimum );
+        _mm_storeu_ps( maxElements, maximum );
+        return {{ aabbType.className }}(
+            {{ aabbType.elementType.className }}( minElements[ 0 ], minElements[ 1 ], minElements[ 2 ] ),
+            {{ aabbType.elementType.className }}( maxElements[ 0 ], maxElements[ 1 ], maxElements[ 2 ] ) );
+#else
+{% endif -%}
+        // Start from the translation, then accumulate the products of each matrix row with the AABB extents.
+        {{ aabbType.className }} newAABB(
+            {{ aabbType.elementType.className }}( {{ matrix }}( 0, 3 ), {{ matrix }}( 1, 3 ), {{ matrix }}( 2, 3 ) ),
+            {{ aabbType.elementType.className }}( {{ matrix }}( 0, 3 ), {{ matrix }}( 1, 3 ), {{ matrix }}( 2, 3 ) ) );
+        for ( int row = 0; row < 3; ++row )
+        {
+            for ( int column = 0; column < 3; ++column )
+            {
+                float minProduct = {{ matrix }}( row, column ) * {{ aabb }}.Min()[ column ];
+                float maxProduct = {{ matrix }}( row, column ) * {{ aabb }}.Max()[ column ];
+                newAABB.Min()[ row ] += Min( minProduct, maxProduct );
+                newAABB.Max()[ row ] += Max( minProduct, maxProduct );
+            }
+        }
+
+        return newAABB;
+{%- if accelerated %}
+#endif
+{%- endif %}
+    }
+
+    // Projective transformation.
     {{ aabbType.className }} newAABB;
     newAABB = Expand( newAABB, TransformPoint( {{ matrix }}, {{ aabb }}.Min() ) );
     newAABB = Expand( newAABB, TransformPoint( {{ matrix }},
@@ -1,5 +1,6 @@
 {% extends "functions/functionBase.h" %}
 {% import "functions/functionUtils.h" as functionUtils %}
+{% import "types/simdUtils.h" as simdUtils %}
 
 {%- block fileDoc -%}
 /// Point transformation.
@@ -7,6 +8,7 @@
 
 {% block includes %}
 {{ functionUtils.typeIncludes(function) }}
+#include <gm/base/simd.h>
 {% endblock %}
 
 {% block body %}
@@ -24,6 +26,32 @@
 /// \return Transformed point.
 {{- functionUtils.signature(function, interface) -}}
 {
+{% set accelerated = simdUtils.IsAccelerated(matrixType) and matrixType.shape == (4, 4) -%}
+{% if accelerated -%}
+#if defined( GM_SIMD_SSE_ENABLED )
+    // Linear combination of the matrix columns, weighted by the homogeneous point (x, y, z, 1).
+    {%- set access = "" if matrixType.isAligned else "u" %}
+    const float* matrixData = {{ matrix }}.Data();
+    __m128 column0 = _mm_load{{ access }}_ps( matrixData + 0 );
+    __m128 column1 = _mm_load{{ access }}_ps( matrixData + 4 );
+    __m128 column2 = _mm_load{{ access }}_ps( matrixData + 8 );
+    __m128 column3 = _mm_load{{ access }}_ps( matrixData + 12 );
+    _MM_TRANSPOSE4_PS( column0, column1, column2, column3 );
+#if defined( GM_SIMD_AVX2_ENABLED )
+    __m128 transformed = _mm_fmadd_ps( column0, _mm_set1_ps( {{ point }}.X() ), column3 );
+    transformed = _mm_fmadd_ps( column1, _mm_set1_ps( {{ point }}.Y() ), transformed );
+    transformed = _mm_fmadd_ps( column2, _mm_set1_ps( {{ point }}.Z() ), transformed );
+#else
+    __m128 transformed = _mm_add_ps( _mm_mul_ps( column0, _mm_set1_ps( {{ point }}.X() ) ), column3 );
+    transformed = _mm_add_ps( _mm_mul_ps( column1, _mm_set1_ps( {{ point }}.Y() ) ), transformed );
+    transformed = _mm_add_ps( _mm_mul_ps( column2, _mm_set1_ps( {{ point }}.Z() ) ), transformed );
+#endif
+    float transformedElements[ 4 ];
+    _mm_storeu_ps( transformedElements, transformed );
+    {{ pointType.className }} transformedPoint( transformedElements[ 0 ], transformedElements[ 1 ], transformedElements[ 2 ] );
+    {{ pointType.elementType.className }} homogenousWeight = transformedElements[ 3 ];
+#else
+{% endif -%}
     {{ pointType.className }} transformedPoint(
         {{ point }}.X() * {{ matrix }}( 0, 0 ) + {{ point }}.Y() * {{ matrix }}( 0, 1 ) +
             {{ point }}.Z() * {{ matrix }}( 0, 2 ) + {{ matrix }}( 0, 3 ),
@@ -34,6 +62,9 @@
     );
     {{ pointType.elementType.className }} homogenousWeight = {{ point }}.X() * {{ matrix }}( 3, 0 ) +
         {{ point }}.Y() * {{ matrix }}( 3, 1 ) + {{ point }}.Z() * {{ matrix }}( 3, 2 ) + {{ matrix }}( 3, 3 );
+{%- if accelerated %}
+#endif
+{%- endif %}
     if ( homogenousWeight == 1.0 )
     {
         return transformedPoint;
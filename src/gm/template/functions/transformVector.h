@@ -1,18 +1,49 @@
 {% extends "functions/functionBase.h" %}
 {% import "functions/functionUtils.h" as functionUtils %}
+{% import "types/simdUtils.h" as simdUtils %}
 
 {%- block fileDoc -%}
-/// Vector transformation.
+/// Vector transformation, by a transformation matrix or a rotation quaternion.
 {%- endblock %}
 
 {% block includes %}
 {{ functionUtils.typeIncludes(function) }}
+#include <gm/base/simd.h>
 {% endblock %}
 
 {% block body %}
 {% for interface in function.interfaces %}
 {% set vector     = interface.ArgName("vector") %}
 {% set vectorType = interface.ArgType("vector") %}
+{% if interface.HasArg("quaternion") %}
+{% set quaternion  = interface.ArgName("quaternion") %}
+{% set scalarClass = vectorType.elementType.className %}
+/// Rotate a \p {{ vector }} with the unit quaternion \p {{ quaternion }}.
+/// \ingroup gm_functions_{{ function.category }}
+///
+/// Computes \f$q v q^*\f$ in the expanded form \f$v + w t + u \times t\f$, where \f$u\f$ and \f$w\f$ are
+/// the imaginary and real components of \f$q\f$, and \f$t = 2 u \times v\f$.
+///
+/// \param {{ quaternion }} The unit quaternion describing the rotation.
+/// \param {{ vector }} The vector to rotate.
+///
+/// \return Rotated vector.
+{{- functionUtils.signature(function, interface) -}}
+{
+    const {{ scalarClass }} x = {{ quaternion }}.X();
+    const {{ scalarClass }} y = {{ quaternion }}.Y();
+    const {{ scalarClass }} z = {{ quaternion }}.Z();
+    const {{ scalarClass }} w = {{ quaternion }}.W();
+
+    const {{ scalarClass }} tx = {{ vectorType.CppValue( 2 ) }} * ( y * {{ vector }}[ 2 ] - z * {{ vector }}[ 1 ] );
+    const {{ scalarClass }} ty = {{ vectorType.CppValue( 2 ) }} * ( z * {{ vector }}[ 0 ] - x * {{ vector }}[ 2 ] );
+    const {{ scalarClass }} tz = {{ vectorType.CppValue( 2 ) }} * ( x * {{ vector }}[ 1 ] - y * {{ vector }}[ 0 ] );
+
+    return {{ vectorType.className }}( {{ vector }}[ 0 ] + w * tx + ( y * tz - z * ty ),
+                                       {{ vector }}[ 1 ] + w * ty + ( z * tx - x * tz ),
+                                       {{ vector }}[ 2 ] + w * tz + ( x * ty - y * tx ) );
+}
+{% else %}
 {% set matrix     = interface.ArgName("matrix") %}
 {% set matrixType = interface.ArgType("matrix") %}
 /// Transform a \p {{ vector }} with the transformation matrix \p {{ matrix }}.
@@ -24,6 +55,30 @@
 /// \return Transformed vector.
 {{- functionUtils.signature(function, interface) -}}
 {
+{% set accelerated = simdUtils.IsAccelerated(matrixType) and matrixType.shape == (4, 4) -%}
+{% if accelerated -%}
+#if defined( GM_SIMD_SSE_ENABLED )
+    // Linear combination of the matrix columns, weighted by the vector elements.
+    const float* matrixData = {{ matrix }}.Data();
+    __m128 column0 = _mm_loadu_ps( matrixData + 0 );
+    __m128 column1 = _mm_loadu_ps( matrixData + 4 );
+    __m128 column2 = _mm_loadu_ps( matrixData + 8 );
+    __m128 column3 = _mm_loadu_ps( matrixData + 12 );
+    _MM_TRANSPOSE4_PS( column0, column1, column2, column3 );
+#if defined( GM_SIMD_AVX2_ENABLED )
+    __m128 transformed = _mm_mul_ps( column0, _mm_set1_ps( {{ vector }}[ 0 ] ) );
+    transformed = _mm_fmadd_ps( column1, _mm_set1_ps( {{ vector }}[ 1 ] ), transformed );
+    transformed = _mm_fmadd_ps( column2, _mm_set1_ps( {{ vector }}[ 2 ] ), transformed );
+#else
+    __m128 transformed = _mm_mul_ps( column0, _mm_set1_ps( {{ vector }}[ 0 ] ) );
+    transformed = _mm_add_ps( _mm_mul_ps( column1, _mm_set1_ps( {{ vector }}[ 1 ] ) ), transformed );
+    transformed = _mm_add_ps( _mm_mul_ps( column2, _mm_set1_ps( {{ vector }}[ 2 ] ) ), transformed );
+#endif
+    float transformedElements[ 4 ];
+    _mm_storeu_ps( transformedElements, transformed );
+    return {{ vectorType.className }}( transformedElements[ 0 ], transformedElements[ 1 ], transformedElements[ 2 ] );
+#else
+{% endif -%}
     return {{ vectorType.className }}(
 {%- for row in range(vectorType.elementSize) -%}
 {%- for col in range(vectorType.elementSize) -%}
@@ -37,6 +92,10 @@
 {%- endif -%}
 {%- endfor -%}
     );
+{%- if accelerated %}
+#endif
+{%- endif %}
 }
+{% endif %}
 {% endfor %}
 {% endblock %}
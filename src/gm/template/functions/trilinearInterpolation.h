@@ -55,14 +55,14 @@
                    {{ weight }}.Z() );
 
     // Bilinearly interpolate the two sides orthogonal to the Z-axis of the grid.
-    {{ valueType.namespacedClassName }} interm0 = BilinearInterpolation(
+    {{ valueType.className }} interm0 = BilinearInterpolation(
         {{ corner000 }},
         {{ corner100 }},
         {{ corner010 }},
         {{ corner110 }},
         Vec2f( {{ weight }}.X(), {{ weight }}.Y() )
     );
-    {{ valueType.namespacedClassName }} interm1 = BilinearInterpolation(
+    {{ valueType.className }} interm1 = BilinearInterpolation(
         {{ corner001 }},
         {{ corner101 }},
         {{ corner011 }},
@@ -0,0 +1,392 @@
+#pragma once
+
+// Python batched argument and result conversion, shared by all the function bindings.
+//
+// Each function binding provides a batched overload, where every argument can be an array of
+// elements (a numpy.ndarray, a packed gm array type, or any C-contiguous buffer) with a leading
+// batch dimension, or a single value which is broadcasted across the batch.
+
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+#include <gm/gm.h>
+
+#include "../visibility.h"
+#include "parallel.h"
+
+{% for arrayType in arrayTypes -%}
+{% if not arrayType.elementType.isScalar -%}
+#include <gm/types/{{ arrayType.elementType.headerFileName }}>
+{% endif -%}
+{% endfor %}
+
+#include <cstring>
+#include <initializer_list>
+#include <memory>
+#include <vector>
+
+GM_NS_OPEN
+
+/// \struct BatchTraits
+///
+/// Describes the storage layout of a single element of a batched argument or result, as
+/// a tightly packed block of scalars of shape \ref BatchTraits::Shape.
+template < typename ValueT >
+struct BatchTraits;
+
+{% for arrayType in arrayTypes -%}
+template <>
+struct BatchTraits< {{ arrayType.elementType.className }} >
+{
+    using ScalarT = {{ arrayType.scalarType.className }};
+
+    static std::vector< pybind11::ssize_t > Shape()
+    {
+        return { {{ arrayType.elementShape|join(", ") }} };
+    }
+};
+
+{% endfor -%}
+template <>
+struct BatchTraits< bool >
+{
+    using ScalarT = bool;
+
+    static std::vector< pybind11::ssize_t > Shape()
+    {
+        return {};
+    }
+};
+
+/// \class BatchArgBase
+///
+/// Common batch size information of batched arguments.
+class BatchArgBase
+{
+public:
+    /// Whether this argument is a single value, broadcasted across the batch.
+    inline bool IsBroadcast() const
+    {
+        return m_broadcast;
+    }
+
+    /// The number of elements in this argument.
+    inline size_t Size() const
+    {
+        return m_size;
+    }
+
+protected:
+    bool   m_broadcast = true;
+    size_t m_size      = 1;
+};
+
+/// \class BatchArg
+///
+/// Read-only batched argument, either referencing the elements of a C-contiguous buffer
+/// or holding a single value broadcasted across the batch.
+template < typename ValueT >
+class GM_PYTHON_HIDDEN BatchArg : public BatchArgBase
+{
+public:
+    /// Element access, at \p i_index of the batch.
+    inline const ValueT& operator[]( size_t i_index ) const
+    {
+        return m_data != nullptr ? m_data[ i_index ] : m_value;
+    }
+
+    /// The first element of the batch, or the broadcasted value.
+    inline const ValueT* Data() const
+    {
+        return m_data != nullptr ? m_data : &m_value;
+    }
+
+    /// Load a single value, to be broadcasted across the batch.
+    inline void SetValue( const ValueT& i_value )
+    {
+        m_buffer.reset();
+        m_data      = nullptr;
+        m_value     = i_value;
+        m_broadcast = true;
+        m_size      = 1;
+    }
+
+    /// Load the elements of a batch from \p io_buffer.
+    inline void SetBuffer( std::shared_ptr< pybind11::buffer_info > io_buffer )
+    {
+        m_buffer    = std::move( io_buffer );
+        m_data      = reinterpret_cast< const ValueT* >( m_buffer->ptr );
+        m_broadcast = false;
+        m_size      = m_buffer->shape[ 0 ];
+    }
+
+private:
+    std::shared_ptr< pybind11::buffer_info > m_buffer;
+    const ValueT*                            m_data = nullptr;
+    ValueT                                   m_value;
+};
+
+/// \class MutableBatchArg
+///
+/// Mutable batched argument, referencing the elements of a writable, C-contiguous buffer
+/// which are modified in place.  Mutable arguments are never broadcasted.
+template < typename ValueT >
+class GM_PYTHON_HIDDEN MutableBatchArg : public BatchArgBase
+{
+public:
+    /// Element access, at \p i_index of the batch.
+    inline ValueT& operator[]( size_t i_index ) const
+    {
+        return m_data[ i_index ];
+    }
+
+    /// The first element of the batch.
+    inline ValueT* Data() const
+    {
+        return m_data;
+    }
+
+    /// Load the elements of a batch from \p io_buffer.
+    inline void SetBuffer( std::shared_ptr< pybind11::buffer_info > io_buffer )
+    {
+        m_buffer    = std::move( io_buffer );
+        m_data      = reinterpret_cast< ValueT* >( m_buffer->ptr );
+        m_broadcast = false;
+        m_size      = m_buffer->shape[ 0 ];
+    }
+
+private:
+    std::shared_ptr< pybind11::buffer_info > m_buffer;
+    ValueT*                                  m_data = nullptr;
+};
+
+/// Check if \p i_object is a single value of any of the gm value types.
+///
+/// Single values may also support the buffer protocol, but should never be interpreted as a batch of
+/// their elements.
+inline bool IsSingleValue( pybind11::handle i_object )
+{
+    return
+{%- for arrayType in arrayTypes if not arrayType.elementType.isScalar %}
+        {% if not loop.first %}|| {% endif %}pybind11::isinstance< {{ arrayType.elementType.className }} >( i_object )
+{%- endfor -%}
+        ;
+}
+
+/// Check if \p i_info is a C-contiguous buffer of \p ValueT elements, with a leading batch dimension.
+template < typename ValueT >
+inline bool IsBatchBuffer( const pybind11::buffer_info& i_info )
+{
+    using ScalarT = typename BatchTraits< ValueT >::ScalarT;
+    if ( i_info.format != pybind11::format_descriptor< ScalarT >::format() ||
+         i_info.itemsize != sizeof( ScalarT ) )
+    {
+        return false;
+    }
+
+    std::vector< pybind11::ssize_t > shape = BatchTraits< ValueT >::Shape();
+    if ( i_info.ndim != static_cast< pybind11::ssize_t >( shape.size() ) + 1 )
+    {
+        return false;
+    }
+
+    pybind11::ssize_t stride = i_info.itemsize;
+    for ( pybind11::ssize_t dim = i_info.ndim - 1; dim >= 0; --dim )
+    {
+        if ( dim > 0 && i_info.shape[ dim ] != shape[ dim - 1 ] )
+        {
+            return false;
+        }
+
+        if ( i_info.shape[ dim ] > 1 && i_info.strides[ dim ] != stride )
+        {
+            return false;
+        }
+
+        stride *= i_info.shape[ dim ];
+    }
+
+    return true;
+}
+
+/// Request a strided buffer view of \p i_object, returning a null pointer if the object does not support
+/// the buffer protocol or cannot provide the requested access.
+inline std::shared_ptr< pybind11::buffer_info > RequestBatchBuffer( pybind11::handle i_object, bool i_writable )
+{
+    if ( !PyObject_CheckBuffer( i_object.ptr() ) )
+    {
+        return nullptr;
+    }
+
+    int flags = PyBUF_STRIDES | PyBUF_FORMAT;
+    if ( i_writable )
+    {
+        flags |= PyBUF_WRITABLE;
+    }
+
+    Py_buffer* view = new Py_buffer();
+    if ( PyObject_GetBuffer( i_object.ptr(), view, flags ) != 0 )
+    {
+        delete view;
+        PyErr_Clear();
+        return nullptr;
+    }
+
+    return std::make_shared< pybind11::buffer_info >( view );
+}
+
+/// Resolve the number of elements of a batched function call, from its batched arguments.
+///
+/// Broadcasted arguments are matched against any batch size.  If all the arguments are broadcasted,
+/// the batch consists of a single element.
+///
+/// \param i_args The batched arguments of the function call.
+///
+/// \return The number of elements in the batch.
+inline size_t ResolveBatchSize( std::initializer_list< const BatchArgBase* > i_args )
+{
+    bool   resolved = false;
+    size_t size     = 1;
+    for ( const BatchArgBase* arg : i_args )
+    {
+        if ( arg->IsBroadcast() )
+        {
+            continue;
+        }
+
+        if ( !resolved )
+        {
+            size     = arg->Size();
+            resolved = true;
+        }
+        else if ( arg->Size() != size )
+        {
+            throw pybind11::value_error( "Mismatching batch sizes: " + std::to_string( size ) + " and " +
+                                         std::to_string( arg->Size() ) + "." );
+        }
+    }
+
+    return size;
+}
+
+/// Allocate a numpy array to store \p i_size batched result elements of \p ValueT.
+template < typename ValueT >
+inline pybind11::array_t< typename BatchTraits< ValueT >::ScalarT > AllocateBatchResult( size_t i_size )
+{
+    std::vector< pybind11::ssize_t > shape = BatchTraits< ValueT >::Shape();
+    shape.insert( shape.begin(), static_cast< pybind11::ssize_t >( i_size ) );
+    return pybind11::array_t< typename BatchTraits< ValueT >::ScalarT >( shape );
+}
+
+/// Mutable access to the elements of a result array allocated by \ref AllocateBatchResult.
+template < typename ValueT >
+inline ValueT* BatchResultData( pybind11::array_t< typename BatchTraits< ValueT >::ScalarT >& o_result )
+{
+    return reinterpret_cast< ValueT* >( o_result.mutable_data() );
+}
+
+GM_NS_CLOSE
+
+namespace pybind11
+{
+namespace detail
+{
+/// Conversion of a python object into a read-only batched argument.
+///
+/// The following are accepted, in order of preference:
+/// - A single value, broadcasted across the batch.
+/// - A C-contiguous buffer of matching scalar format and element shape, with a leading batch dimension.
+/// - When implicit conversion is allowed, any object convertible to such a numpy array.
+template < typename ValueT >
+struct type_caster< GM_NS::BatchArg< ValueT > >
+{
+public:
+    PYBIND11_TYPE_CASTER( GM_NS::BatchArg< ValueT >, _( "Batch[" ) + make_caster< ValueT >::name + _( "]" ) );
+
+    bool load( handle i_source, bool i_convert )
+    {
+        using ScalarT = typename GM_NS::BatchTraits< ValueT >::ScalarT;
+
+        make_caster< ValueT > valueCaster;
+        if ( valueCaster.load( i_source, i_convert ) )
+        {
+            value.SetValue( cast_op< const ValueT& >( valueCaster ) );
+            return true;
+        }
+
+        if ( GM_NS::IsSingleValue( i_source ) )
+        {
+            return false;
+        }
+
+        std::shared_ptr< buffer_info > info = GM_NS::RequestBatchBuffer( i_source, /* i_writable */ false );
+        if ( info != nullptr && GM_NS::IsBatchBuffer< ValueT >( *info ) )
+        {
+            value.SetBuffer( std::move( info ) );
+            return true;
+        }
+
+        if ( !i_convert )
+        {
+            return false;
+        }
+
+        array_t< ScalarT, array::c_style | array::forcecast > converted =
+            array_t< ScalarT, array::c_style | array::forcecast >::ensure( i_source );
+        if ( !converted )
+        {
+            return false;
+        }
+
+        info = std::make_shared< buffer_info >( converted.request() );
+        if ( GM_NS::IsBatchBuffer< ValueT >( *info ) )
+        {
+            value.SetBuffer( std::move( info ) );
+            return true;
+        }
+
+        // A converted array with exactly the element shape is a single, broadcasted value.
+        std::vector< ssize_t > shape = GM_NS::BatchTraits< ValueT >::Shape();
+        if ( info->shape == shape )
+        {
+            ValueT single;
+            std::memcpy( &single, info->ptr, sizeof( ValueT ) );
+            value.SetValue( single );
+            return true;
+        }
+
+        return false;
+    }
+};
+
+/// Conversion of a python object into a mutable batched argument.
+///
+/// Only writable, C-contiguous buffers of matching scalar format and element shape, with a leading
+/// batch dimension, are accepted, such that the elements can be modified in place.
+template < typename ValueT >
+struct type_caster< GM_NS::MutableBatchArg< ValueT > >
+{
+public:
+    PYBIND11_TYPE_CASTER( GM_NS::MutableBatchArg< ValueT >,
+                          _( "MutableBatch[" ) + make_caster< ValueT >::name + _( "]" ) );
+
+    bool load( handle i_source, bool )
+    {
+        if ( GM_NS::IsSingleValue( i_source ) )
+        {
+            return false;
+        }
+
+        std::shared_ptr< buffer_info > info = GM_NS::RequestBatchBuffer( i_source, /* i_writable */ true );
+        if ( info == nullptr || !GM_NS::IsBatchBuffer< ValueT >( *info ) )
+        {
+            return false;
+        }
+
+        value.SetBuffer( std::move( info ) );
+        return true;
+    }
+};
+
+} // namespace detail
+} // namespace pybind11
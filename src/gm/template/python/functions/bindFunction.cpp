@@ -2,21 +2,165 @@
 
 #include <gm/functions/{{ function.headerFileName }}>
 
+#include "batch.h"
+#include "dispatch.h"
+{%- if function.kernelInterfaces %}
+#include "../kernels/kernels.h"
+{%- endif %}
+
+#include <memory>
+{%- if function.interfaces|selectattr("singleOutputArguments")|list %}
+#include <tuple>
+{%- endif %}
+
 // Python bindings for {{ function.name }}.
 
 GM_NS_USING
 
 void Bind{{ function.name }}( pybind11::module& o_module )
 {
-    {% for interface in function.interfaces -%}
-    o_module.def( "{{ function.name }}",
-        []( {{ interface.typedArgs }} )
+    {% for interface in function.interfaces if interface.isBound -%}
+    {% set index = loop.index0 -%}
+    // {{ function.TypedName(interface) }}.
+    {%- if interface.singleOutputArguments %}
+    // The mutable scalar arguments are returned as a tuple, as python cannot observe their modification.
+    {%- endif %}
+    auto single{{ index }} = []( {{ interface.singleTypedArgs }} )
+    {
+        {%- if interface.singleOutputArguments %}
+        {% for arg in interface.singleOutputArguments -%}
+        {{ arg.type.className }} {{ arg.name }}{};
+        {% endfor -%}
+        {% if interface.returnType -%}
+        auto result = {{ function.name }}( {{ interface.namedArgs }} );
+        return std::make_tuple( result, {% for arg in interface.singleOutputArguments -%}
+            {{ arg.name }}{% if not loop.last %}, {% endif %}
+        {%- endfor %} );
+        {%- else -%}
+        {{ function.name }}( {{ interface.namedArgs }} );
+        return std::make_tuple( {% for arg in interface.singleOutputArguments -%}
+            {{ arg.name }}{% if not loop.last %}, {% endif %}
+        {%- endfor %} );
+        {%- endif %}
+        {%- else -%}
+        {%- if interface.returnType -%}
+        return{{ " " }}
+        {%- endif -%}
+        {{ function.name }}( {{ interface.namedArgs }} );
+        {%- endif %}
+    };
+    OverloadDispatcher::Invoker invoke{{ index }} = []( PyObject* const* i_args, PyObject** o_result )
+    {
+        {% for arg in interface.singleArguments -%}
+        DispatchArg< {{ arg.type.className }} > arg{{ loop.index0 }};
+        {% endfor -%}
+        if ( {% for arg in interface.singleArguments -%}
+            !arg{{ loop.index0 }}.Load( i_args[ {{ loop.index0 }} ] ){% if not loop.last %} || {% endif %}
+        {%- endfor %} )
+        {
+            return false;
+        }
+        {% if interface.singleOutputArguments -%}
+        {% for arg in interface.singleOutputArguments -%}
+        {{ arg.type.className }} {{ arg.name }}{};
+        {% endfor -%}
+        {% if interface.returnType -%}
+        auto result ={{ " " }}
+        {%- endif -%}
+        {{ function.name }}( {% for arg in interface.arguments -%}
+            {% if arg in interface.singleOutputArguments %}{{ arg.name }}{% else %}arg{{ interface.singleArguments.index(arg) }}.Get(){% endif %}{% if not loop.last %}, {% endif %}
+        {%- endfor %} );
+        *o_result = DispatchResult( std::make_tuple( {% if interface.returnType %}result, {% endif %}{% for arg in interface.singleOutputArguments -%}
+            {{ arg.name }}{% if not loop.last %}, {% endif %}
+        {%- endfor %} ) );
+        {%- elif interface.returnType -%}
+        *o_result = DispatchResult( {{ function.name }}( {% for arg in interface.arguments -%}
+            arg{{ loop.index0 }}.Get(){% if not loop.last %}, {% endif %}
+        {%- endfor %} ) );
+        {%- else -%}
+        {{ function.name }}( {% for arg in interface.arguments -%}
+            arg{{ loop.index0 }}.Get(){% if not loop.last %}, {% endif %}
+        {%- endfor %} );
+        Py_INCREF( Py_None );
+        *o_result = Py_None;
+        {%- endif %}
+        return true;
+    };
+    {%- if interface.isBatchable %}
+    // The elements are processed without holding the GIL{% if function.parallel %}, by the kernel compiled for the instruction set of the host{% endif %}.
+    auto batch{{ index }} = []( {{ interface.batchTypedArgs }} )
+    {
+        size_t size = ResolveBatchSize( {
+        {%- for arg in interface.arguments -%}
+        &{{ arg.name }}{% if not loop.last %}, {% endif %}
+        {%- endfor -%}
+        } );
+        {% if interface.returnType -%}
+        auto result = AllocateBatchResult< {{ interface.returnType.className }} >( size );
+        {{ interface.returnType.className }}* o_result = BatchResultData< {{ interface.returnType.className }} >( result );
+        {%- endif %}
         {
+            pybind11::gil_scoped_release release;
+            {% if function.parallel -%}
+            const gm_kernels::KernelArg args[] = {
+            {%- for arg in interface.inputArguments + interface.outputArguments -%}
+                gm_kernels::MakeKernelArg( {{ arg.name }} ){% if not loop.last or interface.returnType %}, {% endif %}
+            {%- endfor -%}
             {%- if interface.returnType -%}
-            return{{ " " }}
+                gm_kernels::MakeKernelArg( o_result )
             {%- endif -%}
-            {{ function.name }}( {{ interface.namedArgs }} );
+            };
+            gm_kernels::Kernel kernel = gm_kernels::GetActiveKernelSet().{{ function.KernelName(interface) }};
+            ParallelFor( size, [&]( size_t i_begin, size_t i_end ) {
+                kernel( args, i_begin, i_end );
+            } );
+            {%- else -%}
+            // Executed serially, see Function.parallel in codeGen/functions.py.
+            for ( size_t index = 0; index < size; ++index )
+            {
+                {% if interface.returnType -%}
+                o_result[ index ] ={{ " " }}
+                {%- endif -%}
+                {{ function.name }}( {{ interface.batchIndexedArgs }} );
+            }
+            {%- endif %}
         }
-    );
-    {% endfor %}
+        {%- if interface.returnType %}
+        return result;
+        {%- endif %}
+    };
+    {%- endif %}
+
+    {
+        std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+        dispatcher->AddOverload< {% for arg in interface.singleArguments -%}
+            {{ arg.type.className }}{% if not loop.last %}, {% endif %}
+        {%- endfor %} >( invoke{{ index }} );
+        pybind11::object overloads = pybind11::cpp_function( single{{ index }}, pybind11::name( "{{ function.TypedName(interface) }}" ), pybind11::scope( o_module ) );
+        {%- if interface.isBatchable %}
+        overloads = pybind11::cpp_function( batch{{ index }}, pybind11::name( "{{ function.TypedName(interface) }}" ), pybind11::scope( o_module ), pybind11::sibling( overloads ) );
+        {%- endif %}
+        OverloadDispatcher::Define( o_module, "{{ function.TypedName(interface) }}", std::move( dispatcher ), overloads );
+    }
+
+    {% endfor -%}
+
+    // {{ function.name }}, dispatching calls on the types of single value arguments.  Other calls are resolved by
+    // pybind11, where the batched overloads are registered after all the single value overloads, such that they are
+    // only considered when none of the latter match.
+    std::unique_ptr< OverloadDispatcher > dispatcher( new OverloadDispatcher() );
+    pybind11::object overloads = pybind11::none();
+    {% for interface in function.interfaces if interface.isBound -%}
+    {% set index = loop.index0 -%}
+    dispatcher->AddOverload< {% for arg in interface.singleArguments -%}
+        {{ arg.type.className }}{% if not loop.last %}, {% endif %}
+    {%- endfor %} >( invoke{{ index }} );
+    overloads = pybind11::cpp_function( single{{ index }}, pybind11::name( "{{ function.name }}" ), pybind11::scope( o_module ), pybind11::sibling( overloads ) );
+    {% endfor -%}
+    {% for interface in function.interfaces if interface.isBound -%}
+    {% if interface.isBatchable -%}
+    overloads = pybind11::cpp_function( batch{{ loop.index0 }}, pybind11::name( "{{ function.name }}" ), pybind11::scope( o_module ), pybind11::sibling( overloads ) );
+    {% endif -%}
+    {% endfor -%}
+    OverloadDispatcher::Define( o_module, "{{ function.name }}", std::move( dispatcher ), overloads );
 }
@@ -0,0 +1,309 @@
+#pragma once
+
+// Overload dispatch of the function bindings, on the python types of single value arguments.
+//
+// pybind11 resolves a call to an overloaded function by attempting to convert the arguments of each overload in
+// turn, such that the cost of a call grows with the number of overloads registered before the matching one.
+// Instead, each function is bound to an entry point which looks up the python types of the positional arguments
+// in a table of its single value overloads, and calls the matching one directly.  Calls which do not match
+// (keyword arguments, implicit conversions, batched arguments) are forwarded to the pybind11 overloads.
+
+#include <pybind11/pybind11.h>
+
+#include <gm/gm.h>
+
+#include "../visibility.h"
+
+#include <climits>
+#include <exception>
+#include <memory>
+#include <string>
+#include <typeinfo>
+#include <vector>
+
+GM_NS_OPEN
+
+/// \class DispatchArg
+///
+/// A python argument, loaded as the C++ value of type \p ValueT.
+///
+/// The python type of the argument must be the type of \ref DispatchArg::Type, or a subtype of it.  These are
+/// the types accepted by pybind11 without implicit conversions, such that the dispatched overload is the one
+/// pybind11 would resolve.
+template < typename ValueT >
+class DispatchArg
+{
+public:
+    /// Get the python type of values of type \p ValueT.
+    static inline PyTypeObject* Type()
+    {
+        return reinterpret_cast< PyTypeObject* >( pybind11::detail::get_type_handle( typeid( ValueT ), true ).ptr() );
+    }
+
+    /// Load the C++ value held by the python instance \p i_arg.
+    ///
+    /// \return true if the value was loaded.
+    inline bool Load( PyObject* i_arg )
+    {
+        pybind11::detail::instance* instance = reinterpret_cast< pybind11::detail::instance* >( i_arg );
+        m_value                              = instance->get_value_and_holder().template value_ptr< ValueT >();
+        return m_value != nullptr;
+    }
+
+    /// Get the loaded value, referenced in place such that mutable arguments are modified by the call.
+    inline ValueT& Get()
+    {
+        return *m_value;
+    }
+
+private:
+    ValueT* m_value = nullptr;
+};
+
+template <>
+class DispatchArg< float >
+{
+public:
+    static inline PyTypeObject* Type()
+    {
+        return &PyFloat_Type;
+    }
+
+    inline bool Load( PyObject* i_arg )
+    {
+        m_value = static_cast< float >( PyFloat_AS_DOUBLE( i_arg ) );
+        return true;
+    }
+
+    inline float& Get()
+    {
+        return m_value;
+    }
+
+private:
+    float m_value = 0.0f;
+};
+
+template <>
+class DispatchArg< int >
+{
+public:
+    static inline PyTypeObject* Type()
+    {
+        return &PyLong_Type;
+    }
+
+    inline bool Load( PyObject* i_arg )
+    {
+        // Out of range values are left to pybind11, which raises the conversion error.
+        long value = PyLong_AsLong( i_arg );
+        if ( value == -1 && PyErr_Occurred() )
+        {
+            PyErr_Clear();
+            return false;
+        }
+        if ( value < INT_MIN || value > INT_MAX )
+        {
+            return false;
+        }
+        m_value = static_cast< int >( value );
+        return true;
+    }
+
+    inline int& Get()
+    {
+        return m_value;
+    }
+
+private:
+    int m_value = 0;
+};
+
+template <>
+class DispatchArg< bool >
+{
+public:
+    static inline PyTypeObject* Type()
+    {
+        return &PyBool_Type;
+    }
+
+    inline bool Load( PyObject* i_arg )
+    {
+        m_value = i_arg == Py_True;
+        return true;
+    }
+
+    inline bool& Get()
+    {
+        return m_value;
+    }
+
+private:
+    bool m_value = false;
+};
+
+/// Convert the result \p i_result of a dispatched call into a new python reference.
+template < typename ValueT >
+inline PyObject* DispatchResult( ValueT&& i_result )
+{
+    return pybind11::cast( std::forward< ValueT >( i_result ), pybind11::return_value_policy::move ).release().ptr();
+}
+
+/// \class OverloadDispatcher
+///
+/// The entry point of an overloaded function, dispatching calls through a table of overloads keyed by the python
+/// types of their arguments.
+class GM_PYTHON_HIDDEN OverloadDispatcher
+{
+public:
+    /// The maximum number of arguments of a dispatched overload.
+    static constexpr size_t c_maxArgCount = 9;
+
+    /// Call an overload with the positional arguments \p i_args, whose types match the overload.
+    ///
+    /// \param o_result The new reference to the result of the call, or nullptr with the python error set.
+    ///
+    /// \return false if the arguments could not be loaded, in which case the call is forwarded to pybind11.
+    using Invoker = bool ( * )( PyObject* const* i_args, PyObject** o_result );
+
+    /// Add an overload to the table, over arguments of types \p ValueTs, in order of precedence.
+    template < typename... ValueTs >
+    inline void AddOverload( Invoker i_invoker )
+    {
+        static_assert( sizeof...( ValueTs ) <= c_maxArgCount, "Too many arguments for dispatch." );
+        Overload overload{sizeof...( ValueTs ), {DispatchArg< ValueTs >::Type()...}, i_invoker};
+        m_overloads.push_back( overload );
+    }
+
+    /// Define the function \p i_name in \p o_module, dispatching calls through the overloads of \p i_dispatcher,
+    /// and forwarding the calls which do not match any of them to \p i_fallback, the pybind11 function of all the
+    /// overloads.
+    static inline void Define( pybind11::module&                     o_module,
+                               const char*                           i_name,
+                               std::unique_ptr< OverloadDispatcher > i_dispatcher,
+                               pybind11::object                      i_fallback )
+    {
+        // The dispatcher is owned by the function object, through its self argument.
+        OverloadDispatcher* dispatcher = i_dispatcher.get();
+        pybind11::capsule   self( i_dispatcher.release(),
+                                []( void* i_pointer ) { delete static_cast< OverloadDispatcher* >( i_pointer ); } );
+
+        dispatcher->m_name     = i_name;
+        dispatcher->m_doc      = pybind11::str( i_fallback.attr( "__doc__" ) );
+        dispatcher->m_fallback = std::move( i_fallback );
+
+        PyMethodDef& methodDef = dispatcher->m_methodDef;
+        methodDef.ml_name      = dispatcher->m_name.c_str();
+        methodDef.ml_meth      = reinterpret_cast< PyCFunction >( reinterpret_cast< void ( * )() >( &Call ) );
+        methodDef.ml_flags     = METH_VARARGS | METH_KEYWORDS;
+        methodDef.ml_doc       = dispatcher->m_doc.c_str();
+
+        PyObject* function = PyCFunction_NewEx( &methodDef, self.ptr(), o_module.attr( "__name__" ).ptr() );
+        if ( function == nullptr )
+        {
+            throw pybind11::error_already_set();
+        }
+        o_module.add_object( i_name, pybind11::reinterpret_steal< pybind11::object >( function ) );
+    }
+
+private:
+    /// An entry of the dispatch table.
+    struct Overload
+    {
+        size_t        argCount;
+        PyTypeObject* types[ c_maxArgCount ];
+        Invoker       invoker;
+    };
+
+    /// Check if the python type \p i_type is \p i_overloadType, or a subtype of it.
+    static inline bool IsCompatible( PyTypeObject* i_type, PyTypeObject* i_overloadType )
+    {
+        return i_type == i_overloadType || PyType_IsSubtype( i_type, i_overloadType );
+    }
+
+    /// Find the first overload whose argument types match the positional arguments \p i_args.
+    inline const Overload* FindOverload( PyObject* const* i_args, size_t i_argCount ) const
+    {
+        for ( const Overload& overload : m_overloads )
+        {
+            if ( overload.argCount != i_argCount )
+            {
+                continue;
+            }
+
+            size_t argIndex = 0;
+            while ( argIndex < i_argCount && IsCompatible( Py_TYPE( i_args[ argIndex ] ), overload.types[ argIndex ] ) )
+            {
+                ++argIndex;
+            }
+
+            if ( argIndex == i_argCount )
+            {
+                return &overload;
+            }
+        }
+
+        return nullptr;
+    }
+
+    /// Set the python error of \p i_exception through the registered exception translators, as pybind11 does for the
+    /// exceptions thrown by its own function bindings: such that the standard exceptions map to the matching python
+    /// exception types, and the translators registered by other extension modules apply.
+    static void TranslateException( std::exception_ptr i_exception )
+    {
+        for ( auto& translator : pybind11::detail::get_internals().registered_exception_translators )
+        {
+            try
+            {
+                translator( i_exception );
+                return;
+            }
+            catch ( ... )
+            {
+                i_exception = std::current_exception();
+            }
+        }
+
+        PyErr_SetString( PyExc_SystemError, "Exception escaped from default exception translator!" );
+    }
+
+    /// The python entry point.
+    static PyObject* Call( PyObject* i_self, PyObject* i_args, PyObject* i_kwargs )
+    {
+        OverloadDispatcher* dispatcher =
+            static_cast< OverloadDispatcher* >( PyCapsule_GetPointer( i_self, /* name */ nullptr ) );
+
+        if ( i_kwargs == nullptr || PyDict_Size( i_kwargs ) == 0 )
+        {
+            PyObject* const* args     = reinterpret_cast< PyTupleObject* >( i_args )->ob_item;
+            const Overload*  overload = dispatcher->FindOverload( args, PyTuple_GET_SIZE( i_args ) );
+            if ( overload != nullptr )
+            {
+                try
+                {
+                    PyObject* result = nullptr;
+                    if ( overload->invoker( args, &result ) )
+                    {
+                        return result;
+                    }
+                }
+                catch ( ... )
+                {
+                    TranslateException( std::current_exception() );
+                    return nullptr;
+                }
+            }
+        }
+
+        return PyObject_Call( dispatcher->m_fallback.ptr(), i_args, i_kwargs );
+    }
+
+    std::vector< Overload > m_overloads;
+    std::string             m_name;
+    std::string             m_doc;
+    pybind11::object        m_fallback;
+    PyMethodDef             m_methodDef{};
+};
+
+GM_NS_CLOSE
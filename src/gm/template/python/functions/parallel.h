@@ -0,0 +1,247 @@
+#pragma once
+
+// Internal thread pool, distributing the elements of batched function calls across cores.
+
+#include <gm/gm.h>
+#include <gm/base/os.h>
+
+#include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <functional>
+#include <mutex>
+#include <new>
+#include <thread>
+#include <vector>
+
+#if !defined( GM_WINDOWS )
+#include <pthread.h>
+#endif
+
+GM_NS_OPEN
+
+/// \class BatchThreadPool
+///
+/// A process-wide pool of worker threads, executing parallel loops over the elements of a batch.
+///
+/// The calling thread participates in the execution of each loop.  Only a single loop is distributed
+/// across the workers at a time: concurrent loops, submitted from other threads while the pool is busy,
+/// are executed serially by their calling thread.
+///
+/// The pool is fork-safe: the worker threads do not survive a fork, so the child process discards
+/// the pool state inherited from its parent, and spawns its own workers on its first parallel loop.
+class BatchThreadPool
+{
+public:
+    /// The minimum number of elements processed by a single task.  Batches smaller than this
+    /// are executed serially by the calling thread.
+    static constexpr size_t c_minChunkSize = 4096;
+
+    /// The number of tasks each thread is expected to process per loop, for load balancing.
+    static constexpr size_t c_chunksPerThread = 4;
+
+    /// Get the process-wide thread pool instance.
+    static inline BatchThreadPool& GetInstance()
+    {
+        static BatchThreadPool s_instance;
+        return s_instance;
+    }
+
+    /// Get the default number of threads, which is the number of hardware threads.
+    static inline size_t GetDefaultThreadCount()
+    {
+        return std::max( size_t( 1 ), size_t( std::thread::hardware_concurrency() ) );
+    }
+
+    inline ~BatchThreadPool()
+    {
+        _StopWorkers();
+    }
+
+    /// Get the number of threads, including the calling thread, used to execute a parallel loop.
+    inline size_t GetThreadCount() const
+    {
+        return m_threadCount;
+    }
+
+    /// Set the number of threads, including the calling thread, used to execute a parallel loop.
+    ///
+    /// \param i_threadCount The number of threads.  If 0, the default thread count is used.
+    inline void SetThreadCount( size_t i_threadCount )
+    {
+        std::lock_guard< std::mutex > submitLock( m_submitMutex );
+        _StopWorkers();
+        m_threadCount = i_threadCount > 0 ? i_threadCount : GetDefaultThreadCount();
+    }
+
+    /// Execute \p i_task over the index range [0, \p i_size), split into contiguous sub-ranges.
+    ///
+    /// \param i_size The number of elements.
+    /// \param i_task The task, called with the begin and end index of each sub-range.
+    inline void ParallelFor( size_t i_size, const std::function< void( size_t, size_t ) >& i_task )
+    {
+        std::unique_lock< std::mutex > submitLock( m_submitMutex, std::try_to_lock );
+        if ( !submitLock.owns_lock() || m_threadCount <= 1 || i_size <= c_minChunkSize )
+        {
+            i_task( 0, i_size );
+            return;
+        }
+
+        _StartWorkers();
+
+        size_t chunkCount = m_threadCount * c_chunksPerThread;
+        {
+            std::lock_guard< std::mutex > lock( m_mutex );
+            m_task          = &i_task;
+            m_size          = i_size;
+            m_chunkSize     = std::max( static_cast< size_t >( c_minChunkSize ), ( i_size + chunkCount - 1 ) / chunkCount );
+            m_nextIndex     = 0;
+            m_activeWorkers = m_workers.size();
+            ++m_generation;
+        }
+        m_wakeCondition.notify_all();
+
+        _RunChunks();
+
+        std::unique_lock< std::mutex > lock( m_mutex );
+        m_doneCondition.wait( lock, [this] { return m_activeWorkers == 0; } );
+        m_task = nullptr;
+    }
+
+private:
+    inline BatchThreadPool()
+        : m_threadCount( GetDefaultThreadCount() )
+    {
+#if !defined( GM_WINDOWS )
+        pthread_atfork( nullptr, nullptr, &BatchThreadPool::_AtForkChild );
+#endif
+    }
+
+    // Reset the pool in a forked child process, where only the forking thread exists.
+    //
+    // The handles of the parent's worker threads are detached rather than joined, and the mutexes and
+    // condition variables, possibly held or waited on by those threads at the time of the fork, are
+    // re-initialized.  Workers are spawned again on the next parallel loop.
+    static inline void _AtForkChild()
+    {
+        BatchThreadPool& pool = GetInstance();
+        for ( std::thread& worker : pool.m_workers )
+        {
+            worker.detach();
+        }
+        pool.m_workers.clear();
+
+        new ( &pool.m_submitMutex ) std::mutex();
+        new ( &pool.m_mutex ) std::mutex();
+        new ( &pool.m_wakeCondition ) std::condition_variable();
+        new ( &pool.m_doneCondition ) std::condition_variable();
+        pool.m_stop          = false;
+        pool.m_task          = nullptr;
+        pool.m_size          = 0;
+        pool.m_chunkSize     = 0;
+        pool.m_activeWorkers = 0;
+        pool.m_nextIndex     = 0;
+    }
+
+    // Spawn the worker threads, if not already running.
+    inline void _StartWorkers()
+    {
+        if ( !m_workers.empty() )
+        {
+            return;
+        }
+
+        m_stop = false;
+        for ( size_t workerIndex = 0; workerIndex + 1 < m_threadCount; ++workerIndex )
+        {
+            m_workers.emplace_back( &BatchThreadPool::_WorkerLoop, this, m_generation );
+        }
+    }
+
+    // Stop and join all the worker threads.
+    inline void _StopWorkers()
+    {
+        {
+            std::lock_guard< std::mutex > lock( m_mutex );
+            m_stop = true;
+        }
+        m_wakeCondition.notify_all();
+
+        for ( std::thread& worker : m_workers )
+        {
+            worker.join();
+        }
+        m_workers.clear();
+    }
+
+    // Wait for parallel loops to be submitted, and participate in their execution.
+    inline void _WorkerLoop( size_t i_generation )
+    {
+        size_t generation = i_generation;
+        while ( true )
+        {
+            {
+                std::unique_lock< std::mutex > lock( m_mutex );
+                m_wakeCondition.wait( lock, [this, generation] { return m_stop || m_generation != generation; } );
+                if ( m_stop )
+                {
+                    return;
+                }
+                generation = m_generation;
+            }
+
+            _RunChunks();
+
+            {
+                std::lock_guard< std::mutex > lock( m_mutex );
+                if ( --m_activeWorkers == 0 )
+                {
+                    m_doneCondition.notify_one();
+                }
+            }
+        }
+    }
+
+    // Process chunks of the current loop until all of its elements have been claimed.
+    inline void _RunChunks()
+    {
+        while ( true )
+        {
+            size_t begin = m_nextIndex.fetch_add( m_chunkSize );
+            if ( begin >= m_size )
+            {
+                return;
+            }
+
+            ( *m_task )( begin, std::min( begin + m_chunkSize, m_size ) );
+        }
+    }
+
+    std::atomic< size_t > m_threadCount;
+    std::vector< std::thread > m_workers;
+
+    // Serializes the submission of parallel loops, and thread count changes.
+    std::mutex m_submitMutex;
+
+    // Guards the state of the current loop, shared with the workers.
+    std::mutex              m_mutex;
+    std::condition_variable m_wakeCondition;
+    std::condition_variable m_doneCondition;
+    bool                    m_stop       = false;
+    size_t                  m_generation = 0;
+
+    // Current parallel loop.
+    const std::function< void( size_t, size_t ) >* m_task          = nullptr;
+    size_t                                         m_size          = 0;
+    size_t                                         m_chunkSize     = 0;
+    size_t                                         m_activeWorkers = 0;
+    std::atomic< size_t >                          m_nextIndex{0};
+};
+
+/// Execute \p i_task over the index range [0, \p i_size) using the process-wide \ref BatchThreadPool.
+inline void ParallelFor( size_t i_size, const std::function< void( size_t, size_t ) >& i_task )
+{
+    BatchThreadPool::GetInstance().ParallelFor( i_size, i_task );
+}
+
+GM_NS_CLOSE
@@ -0,0 +1,22 @@
+import unittest
+
+import numpy
+import gm
+
+
+class Test{{ function.name }}(unittest.TestCase):
+
+    def testBatchWeights(self):
+        weights = numpy.array([0.0, 0.5, 1.0], dtype=numpy.float32)
+        values = gm.{{ function.name }}(gm.Vec3f(0, 0, 0), gm.Vec3f(2, 4, 6), weights)
+        numpy.testing.assert_allclose(values, [[0, 0, 0], [1, 2, 3], [2, 4, 6]])
+
+    def testBatchScalars(self):
+        values = gm.{{ function.name }}(numpy.zeros(2, dtype=numpy.float32), 4.0, numpy.array([0.25, 0.5], dtype=numpy.float32))
+        self.assertEqual(values.shape, (2,))
+        numpy.testing.assert_allclose(values, [1, 2])
+
+    def testBatchRanges(self):
+        sources = gm.FloatRangeArray([gm.FloatRange(0, 2), gm.FloatRange(2, 4)])
+        values = gm.{{ function.name }}(sources, gm.FloatRange(4, 6), 0.5)
+        numpy.testing.assert_allclose(values, [[2, 4], [3, 5]])
@@ -0,0 +1,56 @@
+import unittest
+
+import numpy
+import gm
+
+
+class Test{{ function.name }}(unittest.TestCase):
+
+    def testTypedNames(self):
+{%- for interface in function.interfaces if interface.isBound %}
+        self.assertTrue(callable(gm.{{ function.TypedName(interface) }}))
+{%- endfor %}
+        self.assertEqual(gm.{{ function.name }}_Vec3f_Vec3f(gm.Vec3f(1, 5, 3), gm.Vec3f(4, 2, 6)), gm.Vec3f(1, 2, 3))
+
+    def testTypedNameRejectsOtherTypes(self):
+        with self.assertRaises(TypeError):
+            gm.{{ function.name }}_Vec3f_Vec3f(gm.Vec4f(), gm.Vec4f())
+
+    def testDispatch(self):
+        self.assertEqual(gm.{{ function.name }}(1.5, 2.5), 1.5)
+        self.assertEqual(gm.{{ function.name }}(gm.Vec4i(1, 5, 3, 8), gm.Vec4i(4, 2, 6, 7)), gm.Vec4i(1, 2, 3, 7))
+
+        matrix = gm.Mat4f()
+        self.assertEqual(gm.{{ function.name }}(matrix, matrix), matrix)
+
+    def testDispatchResolvesLikePybind11(self):
+        # Integers resolve to the int overload, as the float overload only accepts them with a conversion.
+        result = gm.{{ function.name }}(1, 2)
+        self.assertIs(type(result), int)
+        self.assertEqual(result, 1)
+
+        # Mixed types are implicitly converted by pybind11.
+        self.assertEqual(gm.{{ function.name }}(1.5, 2), 1.5)
+
+        # Integers out of the range of int are converted to float by pybind11.
+        result = gm.{{ function.name }}(2 ** 40, 1)
+        self.assertIs(type(result), float)
+        self.assertEqual(result, 1.0)
+
+    def testDispatchSubclass(self):
+        class Vector(gm.Vec3f):
+            pass
+
+        self.assertEqual(gm.{{ function.name }}(Vector(1, 5, 3), gm.Vec3f(4, 2, 6)), gm.Vec3f(1, 2, 3))
+
+    def testBatchFallback(self):
+        values = gm.{{ function.name }}(numpy.array([1, 5], dtype=numpy.float32), 2.0)
+        numpy.testing.assert_array_equal(values, [1, 2])
+
+    def testDoc(self):
+        self.assertEqual(gm.{{ function.name }}.__name__, "{{ function.name }}")
+        self.assertIn("Overloaded function", gm.{{ function.name }}.__doc__)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import os
+import threading
+import unittest
+
+import numpy
+import gm
+
+
+class Test{{ function.name }}(unittest.TestCase):
+
+    def setUp(self):
+        self.matrix = gm.Mat4f()
+        gm.SetIdentity(self.matrix)
+        gm.SetTranslate(gm.Vec3f(1, 2, 3), self.matrix)
+
+    def testSingle(self):
+        self.assertEqual(gm.{{ function.name }}(self.matrix, gm.Vec3f(2, 4, 6)), gm.Vec3f(3, 6, 9))
+
+    def testBatchBroadcastMatrix(self):
+        points = numpy.arange(12, dtype=numpy.float32).reshape(4, 3)
+        transformed = gm.{{ function.name }}(self.matrix, points)
+        self.assertIsInstance(transformed, numpy.ndarray)
+        self.assertEqual(transformed.dtype, numpy.float32)
+        self.assertEqual(transformed.shape, (4, 3))
+        numpy.testing.assert_allclose(transformed, points + numpy.array([1, 2, 3], dtype=numpy.float32))
+
+    def testBatchMatrices(self):
+        matrices = numpy.stack([numpy.asarray(self.matrix)] * 2)
+        transformed = gm.{{ function.name }}(matrices, gm.Vec3f(2, 4, 6))
+        numpy.testing.assert_allclose(transformed, [[3, 6, 9], [3, 6, 9]])
+
+    def testBatchPackedArray(self):
+        points = gm.Vec3fArray([gm.Vec3f(2, 4, 6), gm.Vec3f(0, 0, 0)])
+        transformed = gm.{{ function.name }}(self.matrix, points)
+        numpy.testing.assert_allclose(transformed, [[3, 6, 9], [1, 2, 3]])
+
+    def testBatchImplicitConversion(self):
+        transformed = gm.{{ function.name }}(self.matrix, numpy.zeros((2, 3), dtype=numpy.float64))
+        self.assertEqual(transformed.dtype, numpy.float32)
+        numpy.testing.assert_allclose(transformed, [[1, 2, 3], [1, 2, 3]])
+
+    def testBatchEmpty(self):
+        transformed = gm.{{ function.name }}(self.matrix, numpy.zeros((0, 3), dtype=numpy.float32))
+        self.assertEqual(transformed.shape, (0, 3))
+
+    def testBatchSizeMismatch(self):
+        matrices = numpy.stack([numpy.asarray(self.matrix)] * 2)
+        with self.assertRaises(ValueError):
+            gm.{{ function.name }}(matrices, numpy.zeros((3, 3), dtype=numpy.float32))
+
+    def testBatchParallel(self):
+        points = numpy.random.rand(100000, 3).astype(numpy.float32)
+        threadCount = gm.GetThreadCount()
+        try:
+            gm.SetThreadCount(1)
+            self.assertEqual(gm.GetThreadCount(), 1)
+            serial = gm.{{ function.name }}(self.matrix, points)
+
+            gm.SetThreadCount(4)
+            self.assertEqual(gm.GetThreadCount(), 4)
+            numpy.testing.assert_array_equal(gm.{{ function.name }}(self.matrix, points), serial)
+        finally:
+            gm.SetThreadCount(threadCount)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def testBatchForkedChild(self):
+        points = numpy.random.rand(200000, 3).astype(numpy.float32)
+        threadCount = gm.GetThreadCount()
+        try:
+            gm.SetThreadCount(4)
+            expected = gm.{{ function.name }}(self.matrix, points)
+
+            # The child process must respawn its own workers, rather than wait for the parent's.
+            pid = os.fork()
+            if pid == 0:
+                try:
+                    transformed = gm.{{ function.name }}(self.matrix, points)
+                    os._exit(0 if numpy.array_equal(transformed, expected) else 1)
+                except BaseException:
+                    os._exit(2)
+
+            _, status = os.waitpid(pid, 0)
+            self.assertTrue(os.WIFEXITED(status))
+            self.assertEqual(os.WEXITSTATUS(status), 0)
+        finally:
+            gm.SetThreadCount(threadCount)
+
+    def testBatchConcurrentCallers(self):
+        points = numpy.random.rand(100000, 3).astype(numpy.float32)
+        expected = gm.{{ function.name }}(self.matrix, points)
+        results = [None] * 4
+
+        def Transform(index):
+            results[index] = gm.{{ function.name }}(self.matrix, points)
+
+        threads = [threading.Thread(target=Transform, args=(index,)) for index in range(len(results))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for result in results:
+            numpy.testing.assert_array_equal(result, expected)
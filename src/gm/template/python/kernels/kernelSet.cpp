@@ -0,0 +1,94 @@
+// Kernel set of all the batched functions, compiled once per instruction set, see kernels.h.
+//
+// GM_KERNEL_SET names the kernel set, and GM_NS is defined to a namespace distinct to this kernel set.
+
+#include <gm/gm.h>
+
+{% for function in functions if function.kernelInterfaces -%}
+#include <gm/functions/batch/{{ function.headerFileName }}>
+{% endfor %}
+
+#include "kernels.h"
+
+#if !defined( GM_KERNEL_SET )
+#error "GM_KERNEL_SET must be defined."
+#endif
+
+#define _GM_KERNEL_SET_STRING( set ) #set
+#define GM_KERNEL_SET_STRING( set ) _GM_KERNEL_SET_STRING( set )
+#define _GM_KERNEL_SET_GETTER( set ) GetKernelSet##set
+#define GM_KERNEL_SET_GETTER( set ) _GM_KERNEL_SET_GETTER( set )
+
+// The kernel sets are compiled with hidden visibility, and their hidden symbols made local after compilation (see
+// python/CMakeLists.txt), such that the inline functions compiled for an instruction set are only called by its
+// kernels.  The getter of the kernel set is the single symbol left global, for the dispatch.
+#if defined( __GNUC__ )
+#define GM_KERNEL_SET_VISIBLE __attribute__( ( visibility( "default" ) ) )
+#else
+#define GM_KERNEL_SET_VISIBLE
+#endif
+
+GM_NS_USING
+
+namespace
+{
+/// View the kernel argument \p i_arg as the inputs of the elements starting at \p i_begin.
+template < typename ValueT >
+inline BatchInput< ValueT > KernelInput( const gm_kernels::KernelArg& i_arg, size_t i_begin )
+{
+    const ValueT* data = static_cast< const ValueT* >( i_arg.data );
+    if ( i_arg.stride == 0 )
+    {
+        return BatchInput< ValueT >( *data );
+    }
+    else
+    {
+        return BatchInput< ValueT >( data + i_begin );
+    }
+}
+
+/// View the kernel argument \p i_arg as the outputs of the elements starting at \p i_begin.
+template < typename ValueT >
+inline ValueT* KernelOutput( const gm_kernels::KernelArg& i_arg, size_t i_begin )
+{
+    return const_cast< ValueT* >( static_cast< const ValueT* >( i_arg.data ) ) + i_begin;
+}
+
+{% for function in functions -%}
+{% for interface in function.kernelInterfaces -%}
+void {{ function.KernelName(interface) }}( const gm_kernels::KernelArg* i_args, size_t i_begin, size_t i_end )
+{
+    {{ function.name }}(
+    {%- for arg in interface.inputArguments -%}
+        KernelInput< {{ arg.type.className }} >( i_args[ {{ loop.index0 }} ], i_begin ),
+    {%- endfor -%}
+        i_end - i_begin
+    {%- for arg in interface.outputArguments -%}
+        , KernelOutput< {{ arg.type.className }} >( i_args[ {{ interface.inputArguments|length + loop.index0 }} ], i_begin )
+    {%- endfor -%}
+    {%- if interface.returnType -%}
+        , KernelOutput< {{ interface.returnType.className }} >( i_args[ {{ interface.arguments|length }} ], i_begin )
+    {%- endif -%}
+    );
+}
+
+{% endfor -%}
+{% endfor %}
+} // namespace
+
+namespace gm_kernels
+{
+/// Get the kernel set compiled by this translation unit.
+GM_KERNEL_SET_VISIBLE const KernelSet& GM_KERNEL_SET_GETTER( GM_KERNEL_SET )()
+{
+    static const KernelSet s_kernelSet = {
+        GM_KERNEL_SET_STRING( GM_KERNEL_SET ),
+{% for function in functions -%}
+{% for interface in function.kernelInterfaces -%}
+        &{{ function.KernelName(interface) }},
+{% endfor -%}
+{% endfor %}
+    };
+    return s_kernelSet;
+}
+} // namespace gm_kernels
@@ -0,0 +1,87 @@
+#pragma once
+
+// Batched function kernels, compiled once per instruction set and selected at import time.
+//
+// Each kernel set is compiled from kernels/kernelSet.cpp, with the flags of its instruction set and with
+// GM_NS defined to a distinct namespace, such that the inline gm functions compiled for different instruction
+// sets never collide at link time.  The kernel interface below is thus declared in a fixed namespace, and only
+// exchanges type-erased pointers.
+
+#include <cstddef>
+#include <vector>
+
+namespace gm_kernels
+{
+/// \struct KernelArg
+///
+/// Type-erased argument of a kernel, referencing either an array of elements or a single element
+/// broadcasted across the batch.
+struct KernelArg
+{
+    /// The first element.
+    const void* data;
+
+    /// The distance between consecutive elements, in elements: 1 for arrays, 0 for broadcasted elements.
+    size_t stride;
+};
+
+/// Evaluate a batched function over the elements [\p i_begin, \p i_end).
+///
+/// \param i_args The inputs, followed by the outputs of the batched C++ overload, see functions/batch/.
+/// \param i_begin The first element.
+/// \param i_end One past the last element.
+using Kernel = void ( * )( const KernelArg* i_args, size_t i_begin, size_t i_end );
+
+/// \struct KernelSet
+///
+/// The kernels of all the batched functions, compiled for a single instruction set.
+struct KernelSet
+{
+    /// The name of the instruction set.
+    const char* name;
+
+{% for function in functions -%}
+{% for interface in function.kernelInterfaces -%}
+    Kernel {{ function.KernelName(interface) }};
+{% endfor -%}
+{% endfor %}
+};
+
+/// \struct CpuFeatures
+///
+/// The instruction set extensions supported by the host CPU and operating system.
+struct CpuFeatures
+{
+    bool sse42   = false;
+    bool avx2    = false;
+    bool fma     = false;
+    bool avx512f = false;
+};
+
+/// Detect the instruction set extensions supported by the host.
+CpuFeatures DetectCpuFeatures();
+
+/// Get the names of the kernel sets compiled into the module, in order of preference.
+std::vector< const char* > GetKernelSetNames();
+
+/// Get the kernel set used for batched function calls.
+///
+/// The most preferred kernel set supported by the host is selected on first use.  The selection can be
+/// overriden with the GM_KERNEL_SET environment variable, naming a compiled kernel set.
+const KernelSet& GetActiveKernelSet();
+
+/// Convert the python batched argument \p i_arg into a kernel argument.
+template < typename BatchArgT >
+inline KernelArg MakeKernelArg( const BatchArgT& i_arg )
+{
+    return KernelArg{i_arg.Data(), i_arg.IsBroadcast() ? size_t( 0 ) : size_t( 1 )};
+}
+
+/// Convert the result array \p i_result into a kernel argument.
+template < typename ValueT >
+inline KernelArg MakeKernelArg( ValueT* i_result )
+{
+    return KernelArg{i_result, 1};
+}
+
+} // namespace gm_kernels
@@ -0,0 +1,97 @@
+#include "lean.h"
+
+#include <gm/functions/{{ function.headerFileName }}>
+
+// Lean python bindings for {{ function.name }}.
+
+GM_NS_USING
+
+{% for interface in function.leanInterfaces -%}
+{% set index = loop.index0 -%}
+// {{ function.TypedName(interface) }}, returning false if the arguments could not be loaded, without setting a
+// python error.
+static bool Invoke{{ index }}( PyObject* const* i_args, bool i_convert, PyObject** o_result )
+{
+    {% for arg in interface.arguments -%}
+    LeanArg< {{ arg.type.className }} > arg{{ loop.index0 }};
+    {% endfor -%}
+    if ( {% for arg in interface.arguments -%}
+        !arg{{ loop.index0 }}.Load( i_args[ {{ loop.index0 }} ], i_convert ){% if not loop.last %} || {% endif %}
+    {%- endfor %} )
+    {
+        return false;
+    }
+    {% if interface.returnType -%}
+    *o_result = LeanResult( {{ function.name }}( {% for arg in interface.arguments -%}
+        arg{{ loop.index0 }}.Get(){% if not loop.last %}, {% endif %}
+    {%- endfor %} ) );
+    {%- else -%}
+    {{ function.name }}( {% for arg in interface.arguments -%}
+        arg{{ loop.index0 }}.Get(){% if not loop.last %}, {% endif %}
+    {%- endfor %} );
+    Py_INCREF( Py_None );
+    *o_result = Py_None;
+    {%- endif %}
+    return true;
+}
+
+static PyObject* Call{{ index }}( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    if ( i_argCount == {{ interface.arguments|length }} && ( Invoke{{ index }}( i_args, false, &result ) || Invoke{{ index }}( i_args, true, &result ) ) )
+    {
+        return result;
+    }
+
+    return LeanArgumentError( "{{ function.TypedName(interface) }}", i_args, i_argCount );
+}
+
+{% endfor -%}
+
+// {{ function.name }}, resolving its overloads in order, first without and then with implicit conversions of scalars.
+static PyObject* Call( PyObject* /* i_self */, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    PyObject* result = nullptr;
+    for ( bool convert : {false, true} )
+    {
+        if ( {% for interface in function.leanInterfaces -%}
+            ( i_argCount == {{ interface.arguments|length }} && Invoke{{ loop.index0 }}( i_args, convert, &result ) ){% if not loop.last %} || {% endif %}
+        {%- endfor %} )
+        {
+            return result;
+        }
+    }
+
+    return LeanArgumentError( "{{ function.name }}", i_args, i_argCount );
+}
+
+static PyMethodDef s_methods[] = {
+    {"{{ function.name }}",
+     LeanFastCall( Call ),
+     METH_FASTCALL,
+     "{{ function.name }}(*args)\n"
+     "Overloaded function.\n"
+     {%- for interface in function.leanInterfaces %}
+     "\n{{ loop.index }}. {{ function.name }}(
+     {%- for arg in interface.arguments -%}
+     {{ arg.key }}: {{ arg.type.className }}{% if not loop.last %}, {% endif %}
+     {%- endfor -%}
+     ) -> {% if interface.returnType %}{{ interface.returnType.className }}{% else %}None{% endif %}\n"
+     {%- endfor %}},
+    {%- for interface in function.leanInterfaces %}
+    {"{{ function.TypedName(interface) }}",
+     LeanFastCall( Call{{ loop.index0 }} ),
+     METH_FASTCALL,
+     "{{ function.TypedName(interface) }}(
+     {%- for arg in interface.arguments -%}
+     {{ arg.key }}: {{ arg.type.className }}{% if not loop.last %}, {% endif %}
+     {%- endfor -%}
+     ) -> {% if interface.returnType %}{{ interface.returnType.className }}{% else %}None{% endif %}"},
+    {%- endfor %}
+    {nullptr, nullptr, 0, nullptr}
+};
+
+PyMethodDef* GetLean{{ function.name }}Methods()
+{
+    return s_methods;
+}
@@ -0,0 +1,414 @@
+#include "lean.h"
+{%- set className = valueType.className %}
+{%- set elementClassName = valueType.elementType.className %}
+
+// Lean python bindings for {{ className }}.
+
+GM_NS_USING
+
+using Lean{{ className }} = LeanObject< {{ className }} >;
+
+PyTypeObject GM_NS::Lean{{ className }}Type = {PyVarObject_HEAD_INIT( nullptr, 0 )};
+
+/// Get the value held by the python object \p i_self.
+static inline {{ className }}& Value( PyObject* i_self )
+{
+    return reinterpret_cast< Lean{{ className }}* >( i_self )->m_value;
+}
+
+/// Load the value initialized by the positional arguments \p i_args: none for the default value, one per element, or
+/// a single C-contiguous buffer of elements.
+///
+/// \return false with the python error set, if the arguments do not match any of the initializers.
+static bool LoadInitializer( PyObject* const* i_args, Py_ssize_t i_argCount, {{ className }}& o_{{ valueType.varName }} )
+{
+    if ( i_argCount == 0 )
+    {
+        o_{{ valueType.varName }} = {{ className }}();
+        return true;
+    }
+
+    if ( i_argCount == 1 )
+    {
+        return LeanLoadBuffer( i_args[ 0 ], {{ valueType.elementSize }}, o_{{ valueType.varName }}.Data() );
+    }
+
+    if ( i_argCount == {{ valueType.elementSize }} )
+    {
+        {{ elementClassName }} elements[ {{ valueType.elementSize }} ];
+        for ( Py_ssize_t index = 0; index < {{ valueType.elementSize }}; ++index )
+        {
+            LeanArg< {{ elementClassName }} > element;
+            if ( !element.Load( i_args[ index ], /* i_convert */ true ) )
+            {
+                PyErr_Format( PyExc_TypeError,
+                              "{{ className }}(): expected {{ elementClassName }} elements, got '%s' at index %zd.",
+                              Py_TYPE( i_args[ index ] )->tp_name,
+                              index );
+                return false;
+            }
+            elements[ index ] = element.Get();
+        }
+
+        o_{{ valueType.varName }} = {{ className }}(
+            {%- for index in range(valueType.elementSize) -%}
+            elements[ {{ index }} ]{% if not loop.last %}, {% endif %}
+            {%- endfor -%}
+        );
+        return true;
+    }
+
+    PyErr_Format( PyExc_TypeError,
+                  "{{ className }}() takes 0, 1 or {{ valueType.elementSize }} positional arguments, got %zd.",
+                  i_argCount );
+    return false;
+}
+
+// Allocation, to the default value.
+static PyObject* New( PyTypeObject* i_type, PyObject* /* i_args */, PyObject* /* i_kwargs */ )
+{
+    return LeanNew( i_type, {{ className }}() );
+}
+
+// Initialization, such that subclasses can call the base initializer.
+static int Init( PyObject* o_self, PyObject* i_args, PyObject* i_kwargs )
+{
+    if ( i_kwargs != nullptr && PyDict_GET_SIZE( i_kwargs ) != 0 )
+    {
+        PyErr_SetString( PyExc_TypeError, "{{ className }}() takes no keyword arguments." );
+        return -1;
+    }
+
+    PyObject* const* args = reinterpret_cast< PyTupleObject* >( i_args )->ob_item;
+    return LoadInitializer( args, PyTuple_GET_SIZE( i_args ), Value( o_self ) ) ? 0 : -1;
+}
+
+#if PY_VERSION_HEX >= 0x03090000
+// Vectorcall of the type, allocating and initializing the value in a single step, without an argument tuple.
+static PyObject* Vectorcall( PyObject* i_type, PyObject* const* i_args, size_t i_argCountf, PyObject* i_kwnames )
+{
+    if ( i_kwnames != nullptr && PyTuple_GET_SIZE( i_kwnames ) != 0 )
+    {
+        PyErr_SetString( PyExc_TypeError, "{{ className }}() takes no keyword arguments." );
+        return nullptr;
+    }
+
+    {{ className }} {{ valueType.varName }};
+    if ( !LoadInitializer( i_args, PyVectorcall_NARGS( i_argCountf ), {{ valueType.varName }} ) )
+    {
+        return nullptr;
+    }
+
+    return LeanNew( reinterpret_cast< PyTypeObject* >( i_type ), {{ valueType.varName }} );
+}
+#endif
+
+// Deallocation.  Values are trivially destructible.
+static void Dealloc( PyObject* o_self )
+{
+    Py_TYPE( o_self )->tp_free( o_self );
+}
+
+// Object representation.
+static PyObject* Repr( PyObject* i_self )
+{
+    std::string string = Value( i_self ).GetString( "gmlean." );
+    return PyUnicode_FromStringAndSize( string.c_str(), string.size() );
+}
+
+// Equality.
+static PyObject* RichCompare( PyObject* i_lhs, PyObject* i_rhs, int i_operator )
+{
+    LeanArg< {{ className }} > lhs;
+    LeanArg< {{ className }} > rhs;
+    if ( ( i_operator != Py_EQ && i_operator != Py_NE ) || !lhs.Load( i_lhs, false ) || !rhs.Load( i_rhs, false ) )
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    bool equal = lhs.Get() == rhs.Get();
+    return PyBool_FromLong( i_operator == Py_EQ ? equal : !equal );
+}
+
+// Vector addition.
+static PyObject* Add( PyObject* i_lhs, PyObject* i_rhs )
+{
+    LeanArg< {{ className }} > lhs;
+    LeanArg< {{ className }} > rhs;
+    if ( !lhs.Load( i_lhs, false ) || !rhs.Load( i_rhs, false ) )
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    return LeanResult( lhs.Get() + rhs.Get() );
+}
+
+// Vector subtraction.
+static PyObject* Subtract( PyObject* i_lhs, PyObject* i_rhs )
+{
+    LeanArg< {{ className }} > lhs;
+    LeanArg< {{ className }} > rhs;
+    if ( !lhs.Load( i_lhs, false ) || !rhs.Load( i_rhs, false ) )
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    return LeanResult( lhs.Get() - rhs.Get() );
+}
+
+// Vector-scalar and scalar-vector multiplication.
+static PyObject* Multiply( PyObject* i_lhs, PyObject* i_rhs )
+{
+    LeanArg< {{ className }} > {{ valueType.varName }};
+    LeanArg< {{ elementClassName }} > scalar;
+    if ( {{ valueType.varName }}.Load( i_lhs, false ) && scalar.Load( i_rhs, true ) )
+    {
+        return LeanResult( {{ valueType.varName }}.Get() * scalar.Get() );
+    }
+
+    if ( {{ valueType.varName }}.Load( i_rhs, false ) && scalar.Load( i_lhs, true ) )
+    {
+        return LeanResult( scalar.Get() * {{ valueType.varName }}.Get() );
+    }
+
+    Py_RETURN_NOTIMPLEMENTED;
+}
+
+// Vector-scalar division.
+static PyObject* TrueDivide( PyObject* i_lhs, PyObject* i_rhs )
+{
+    LeanArg< {{ className }} > {{ valueType.varName }};
+    LeanArg< {{ elementClassName }} > scalar;
+    if ( !{{ valueType.varName }}.Load( i_lhs, false ) || !scalar.Load( i_rhs, true ) )
+    {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    if ( scalar.Get() == {{ valueType.elementType.CppValue( 0 ) }} )
+    {
+        PyErr_SetString( PyExc_ZeroDivisionError, "division by zero" );
+        return nullptr;
+    }
+
+    return LeanResult( {{ valueType.varName }}.Get() / scalar.Get() );
+}
+
+// Unary negation.
+static PyObject* Negative( PyObject* i_self )
+{
+    return LeanResult( -Value( i_self ) );
+}
+
+// Element indexed read access.
+static PyObject* GetItem( PyObject* i_self, Py_ssize_t i_index )
+{
+    if ( i_index < 0 || i_index >= {{ valueType.elementSize }} )
+    {
+        PyErr_SetString( PyExc_IndexError, "index out of range" );
+        return nullptr;
+    }
+
+    return LeanResult( Value( i_self )[ i_index ] );
+}
+
+// Element indexed write access.
+static int SetItem( PyObject* o_self, Py_ssize_t i_index, PyObject* i_value )
+{
+    if ( i_index < 0 || i_index >= {{ valueType.elementSize }} )
+    {
+        PyErr_SetString( PyExc_IndexError, "index out of range" );
+        return -1;
+    }
+
+    LeanArg< {{ elementClassName }} > element;
+    if ( i_value == nullptr || !element.Load( i_value, true ) )
+    {
+        PyErr_SetString( PyExc_TypeError, "{{ className }} elements must be assigned {{ elementClassName }} values." );
+        return -1;
+    }
+
+    Value( o_self )[ i_index ] = element.Get();
+    return 0;
+}
+
+/// Get the index of the element addressed by the python key \p i_key{% if valueType.shape|length == 2 %}, either an element index or a
+/// (row, column) tuple{% endif %}.
+///
+/// \return -1 with the python error set, if the key is out of range.
+static Py_ssize_t ElementIndex( PyObject* i_key )
+{
+    {%- if valueType.shape|length == 2 %}
+    if ( PyTuple_Check( i_key ) )
+    {
+        if ( PyTuple_GET_SIZE( i_key ) != 2 )
+        {
+            PyErr_SetString( PyExc_IndexError, "expected a (row, column) index" );
+            return -1;
+        }
+
+        Py_ssize_t row = LeanIndex( PyTuple_GET_ITEM( i_key, 0 ), {{ valueType.shape[0] }} );
+        if ( row < 0 )
+        {
+            return -1;
+        }
+
+        Py_ssize_t column = LeanIndex( PyTuple_GET_ITEM( i_key, 1 ), {{ valueType.shape[1] }} );
+        if ( column < 0 )
+        {
+            return -1;
+        }
+
+        return row * {{ valueType.shape[1] }} + column;
+    }
+
+    {% endif %}
+    return LeanIndex( i_key, {{ valueType.elementSize }} );
+}
+
+// Subscript read access.
+static PyObject* Subscript( PyObject* i_self, PyObject* i_key )
+{
+    Py_ssize_t index = ElementIndex( i_key );
+    return index < 0 ? nullptr : GetItem( i_self, index );
+}
+
+// Subscript write access.
+static int AssignSubscript( PyObject* o_self, PyObject* i_key, PyObject* i_value )
+{
+    Py_ssize_t index = ElementIndex( i_key );
+    return index < 0 ? -1 : SetItem( o_self, index, i_value );
+}
+
+// Buffer protocol, exposing the element storage without copying.
+static int GetBuffer( PyObject* i_self, Py_buffer* o_view, int i_flags )
+{
+    {%- if valueType.shape|length == 2 %}
+    static Py_ssize_t s_shape[]   = { {{ valueType.shape[0] }}, {{ valueType.shape[1] }} };
+    static Py_ssize_t s_strides[] = {sizeof( {{ elementClassName }} ) * {{ valueType.shape[1] }}, sizeof( {{ elementClassName }} )};
+    {%- else %}
+    static Py_ssize_t s_shape[]   = { {{ valueType.shape[0] }} };
+    static Py_ssize_t s_strides[] = {sizeof( {{ elementClassName }} )};
+    {%- endif %}
+    return LeanGetBuffer( i_self, Value( i_self ).Data(), {{ valueType.shape|length }}, s_shape, s_strides, o_view, i_flags );
+}
+
+{%- for namedElement in valueType.namedElements %}
+
+// Named {{ namedElement.accessorName }} element getter.
+static PyObject* Get{{ namedElement.accessorName }}( PyObject* i_self, void* /* i_closure */ )
+{
+    return LeanResult( Value( i_self ).{{ namedElement.accessorName }}() );
+}
+
+// Named {{ namedElement.accessorName }} element setter.
+static int Set{{ namedElement.accessorName }}( PyObject* o_self, PyObject* i_value, void* /* i_closure */ )
+{
+    return SetItem( o_self, {{ loop.index0 }}, i_value );
+}
+{%- endfor %}
+
+// Element size.
+static PyObject* GetElementSize( PyObject* /* i_self */, PyObject* /* i_args */ )
+{
+    return PyLong_FromSize_t( {{ className }}::GetElementSize() );
+}
+
+{%- if valueType.isFloatingPoint %}
+
+// Check for nans.
+static PyObject* HasNaNs( PyObject* i_self, PyObject* /* i_args */ )
+{
+    return PyBool_FromLong( Value( i_self ).HasNaNs() );
+}
+{%- endif %}
+
+{%- if valueType.CATEGORY == "quaternion" %}
+
+// Identity element.
+static PyObject* Identity( PyObject* /* i_self */, PyObject* /* i_args */ )
+{
+    return LeanResult( {{ className }}::Identity() );
+}
+{%- endif %}
+
+static PyMethodDef s_methods[] = {
+    {"GetElementSize", GetElementSize, METH_NOARGS | METH_STATIC, "Number of elements."},
+    {%- if valueType.isFloatingPoint %}
+    {"HasNaNs", HasNaNs, METH_NOARGS, "Check for nans."},
+    {%- endif %}
+    {%- if valueType.CATEGORY == "quaternion" %}
+    {"Identity", Identity, METH_NOARGS | METH_STATIC, "Identity element."},
+    {%- endif %}
+    {nullptr, nullptr, 0, nullptr}
+};
+
+static PyGetSetDef s_getSets[] = {
+    {%- for namedElement in valueType.namedElements %}
+    {const_cast< char* >( "{{ namedElement.name }}" ),
+     Get{{ namedElement.accessorName }},
+     Set{{ namedElement.accessorName }},
+     const_cast< char* >( "Named property getter / setter for the element at index {{ loop.index0 }}." ),
+     nullptr},
+    {%- endfor %}
+    {nullptr, nullptr, nullptr, nullptr, nullptr}
+};
+
+static PyNumberMethods s_numberMethods = {};
+
+static PySequenceMethods s_sequenceMethods = {};
+
+static PyMappingMethods s_mappingMethods = {};
+
+static PyBufferProcs s_bufferProcs = {};
+
+int LeanBind{{ className }}( PyObject* o_module )
+{
+    s_numberMethods.nb_add         = Add;
+    s_numberMethods.nb_subtract    = Subtract;
+    s_numberMethods.nb_multiply    = Multiply;
+    s_numberMethods.nb_true_divide = TrueDivide;
+    s_numberMethods.nb_negative    = Negative;
+
+    s_sequenceMethods.sq_item     = GetItem;
+    s_sequenceMethods.sq_ass_item = SetItem;
+
+    s_mappingMethods.mp_subscript     = Subscript;
+    s_mappingMethods.mp_ass_subscript = AssignSubscript;
+
+    s_bufferProcs.bf_getbuffer = GetBuffer;
+
+    PyTypeObject& type = Lean{{ className }}Type;
+    type.tp_name       = "gmlean.{{ className }}";
+    type.tp_doc        = "{{ className }}, stored inline in the python object.";
+    type.tp_basicsize  = sizeof( Lean{{ className }} );
+    type.tp_flags      = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE;
+    type.tp_new        = New;
+    type.tp_init       = Init;
+    type.tp_dealloc    = Dealloc;
+    type.tp_repr       = Repr;
+    type.tp_richcompare = RichCompare;
+    type.tp_hash       = PyObject_HashNotImplemented;
+    type.tp_as_number   = &s_numberMethods;
+    type.tp_as_sequence = &s_sequenceMethods;
+    type.tp_as_mapping  = &s_mappingMethods;
+    type.tp_as_buffer   = &s_bufferProcs;
+    type.tp_methods     = s_methods;
+    type.tp_getset      = s_getSets;
+#if PY_VERSION_HEX >= 0x03090000
+    type.tp_vectorcall = Vectorcall;
+#endif
+
+    if ( PyType_Ready( &type ) < 0 )
+    {
+        return -1;
+    }
+
+    Py_INCREF( &type );
+    if ( PyModule_AddObject( o_module, "{{ className }}", reinterpret_cast< PyObject* >( &type ) ) < 0 )
+    {
+        Py_DECREF( &type );
+        return -1;
+    }
+
+    return 0;
+}
@@ -0,0 +1,363 @@
+#pragma once
+
+// Lean python bindings of the value types and functions, written directly against the CPython API.
+//
+// The pybind11 module resolves every call through a generic path: the bound callables are type-erased, each
+// argument goes through a type caster, and each instance holds its value through a holder.  For tiny functions,
+// such as DotProduct or the arithmetic operators of the vector types, this overhead dominates the cost of the call.
+// The lean module instead stores values inline in python objects of static types, and binds the functions as
+// METH_FASTCALL entry points which test the types of their arguments in generated code.
+
+#include <Python.h>
+
+#include <gm/gm.h>
+{% for type in types %}
+#include <gm/types/{{ type.headerFileName }}>
+{%- endfor %}
+
+#include <climits>
+#include <cstring>
+#include <new>
+#include <string>
+
+GM_NS_OPEN
+
+/// \struct LeanObject
+///
+/// The python object of a lean value type, storing its value of type \p ValueT inline.
+template < typename ValueT >
+struct LeanObject
+{
+    PyObject ob_base;
+    ValueT   m_value;
+};
+
+/// \struct LeanTraits
+///
+/// Properties of the lean python type bound for values of type \p ValueT.
+template < typename ValueT >
+struct LeanTraits;
+{% for type in types %}
+extern PyTypeObject Lean{{ type.className }}Type;
+
+template <>
+struct LeanTraits< {{ type.className }} >
+{
+    static inline PyTypeObject* Type()
+    {
+        return &Lean{{ type.className }}Type;
+    }
+};
+{% endfor %}
+
+/// \class LeanArg
+///
+/// A python argument, loaded as the C++ value of type \p ValueT.
+///
+/// Overloads are resolved in two passes, as in pybind11: the first pass only accepts python values of the exact
+/// type (or a subtype), while the second pass also accepts implicit conversions of scalars.
+template < typename ValueT >
+class LeanArg
+{
+public:
+    /// Load the value held by the python object \p i_arg, referenced in place.
+    ///
+    /// \return true if the value was loaded, without setting a python error otherwise.
+    inline bool Load( PyObject* i_arg, bool /* i_convert */ )
+    {
+        PyTypeObject* type = LeanTraits< ValueT >::Type();
+        if ( Py_TYPE( i_arg ) != type && !PyType_IsSubtype( Py_TYPE( i_arg ), type ) )
+        {
+            return false;
+        }
+
+        m_value = &reinterpret_cast< LeanObject< ValueT >* >( i_arg )->m_value;
+        return true;
+    }
+
+    /// Get the loaded value, such that mutable arguments are modified in place.
+    inline ValueT& Get()
+    {
+        return *m_value;
+    }
+
+private:
+    ValueT* m_value = nullptr;
+};
+
+template <>
+class LeanArg< float >
+{
+public:
+    inline bool Load( PyObject* i_arg, bool i_convert )
+    {
+        if ( PyFloat_Check( i_arg ) )
+        {
+            m_value = static_cast< float >( PyFloat_AS_DOUBLE( i_arg ) );
+            return true;
+        }
+
+        if ( !i_convert )
+        {
+            return false;
+        }
+
+        double value = PyFloat_AsDouble( i_arg );
+        if ( value == -1.0 && PyErr_Occurred() )
+        {
+            PyErr_Clear();
+            return false;
+        }
+
+        m_value = static_cast< float >( value );
+        return true;
+    }
+
+    inline float& Get()
+    {
+        return m_value;
+    }
+
+private:
+    float m_value = 0.0f;
+};
+
+template <>
+class LeanArg< int >
+{
+public:
+    inline bool Load( PyObject* i_arg, bool i_convert )
+    {
+        // Floats are never truncated into integers.
+        if ( PyFloat_Check( i_arg ) || ( !i_convert && !PyLong_Check( i_arg ) ) )
+        {
+            return false;
+        }
+
+        long value = PyLong_AsLong( i_arg );
+        if ( value == -1 && PyErr_Occurred() )
+        {
+            PyErr_Clear();
+            return false;
+        }
+
+        if ( value < INT_MIN || value > INT_MAX )
+        {
+            return false;
+        }
+
+        m_value = static_cast< int >( value );
+        return true;
+    }
+
+    inline int& Get()
+    {
+        return m_value;
+    }
+
+private:
+    int m_value = 0;
+};
+
+template <>
+class LeanArg< bool >
+{
+public:
+    inline bool Load( PyObject* i_arg, bool /* i_convert */ )
+    {
+        if ( i_arg != Py_True && i_arg != Py_False )
+        {
+            return false;
+        }
+
+        m_value = i_arg == Py_True;
+        return true;
+    }
+
+    inline bool& Get()
+    {
+        return m_value;
+    }
+
+private:
+    bool m_value = false;
+};
+
+/// Allocate a new python object of the lean type \p i_type, holding a copy of \p i_value.
+///
+/// \return the new reference, or nullptr with the python error set.
+template < typename ValueT >
+inline PyObject* LeanNew( PyTypeObject* i_type, const ValueT& i_value )
+{
+    PyObject* object = i_type->tp_alloc( i_type, 0 );
+    if ( object != nullptr )
+    {
+        new ( &reinterpret_cast< LeanObject< ValueT >* >( object )->m_value ) ValueT( i_value );
+    }
+    return object;
+}
+
+/// Convert the result \p i_result of a call into a new python reference.
+template < typename ValueT >
+inline PyObject* LeanResult( const ValueT& i_result )
+{
+    return LeanNew( LeanTraits< ValueT >::Type(), i_result );
+}
+
+inline PyObject* LeanResult( float i_result )
+{
+    return PyFloat_FromDouble( i_result );
+}
+
+inline PyObject* LeanResult( int i_result )
+{
+    return PyLong_FromLong( i_result );
+}
+
+inline PyObject* LeanResult( bool i_result )
+{
+    return PyBool_FromLong( i_result );
+}
+
+/// Get the buffer format character of elements of type \p ElementT.
+template < typename ElementT >
+inline const char* LeanFormat();
+
+template <>
+inline const char* LeanFormat< float >()
+{
+    return "f";
+}
+
+template <>
+inline const char* LeanFormat< int >()
+{
+    return "i";
+}
+
+/// Copy the elements of the C-contiguous buffer exported by \p i_object into \p o_data, an array of \p i_size
+/// elements of type \p ElementT.
+///
+/// \return false with the python error set, if the buffer format or size does not match.
+template < typename ElementT >
+inline bool LeanLoadBuffer( PyObject* i_object, Py_ssize_t i_size, ElementT* o_data )
+{
+    Py_buffer view;
+    if ( PyObject_GetBuffer( i_object, &view, PyBUF_FORMAT | PyBUF_STRIDES ) < 0 )
+    {
+        return false;
+    }
+
+    bool loaded = false;
+    if ( view.format == nullptr || std::string( view.format ) != LeanFormat< ElementT >() )
+    {
+        PyErr_Format( PyExc_TypeError,
+                      "Expected buffer of format '%s', got format '%s'.",
+                      LeanFormat< ElementT >(),
+                      view.format != nullptr ? view.format : "B" );
+    }
+    else if ( view.len != i_size * static_cast< Py_ssize_t >( sizeof( ElementT ) ) )
+    {
+        PyErr_Format( PyExc_ValueError,
+                      "Expected buffer of %zd elements, got %zd.",
+                      i_size,
+                      view.len / static_cast< Py_ssize_t >( sizeof( ElementT ) ) );
+    }
+    else if ( !PyBuffer_IsContiguous( &view, 'C' ) )
+    {
+        PyErr_SetString( PyExc_ValueError, "Expected a C-contiguous buffer." );
+    }
+    else
+    {
+        std::memcpy( o_data, view.buf, view.len );
+        loaded = true;
+    }
+
+    PyBuffer_Release( &view );
+    return loaded;
+}
+
+/// Export the \p i_ndim dimensional element storage \p i_data of the python object \p i_owner through \p o_view,
+/// for the buffer protocol.
+template < typename ElementT >
+inline int LeanGetBuffer( PyObject*   i_owner,
+                          ElementT*   i_data,
+                          int         i_ndim,
+                          Py_ssize_t* i_shape,
+                          Py_ssize_t* i_strides,
+                          Py_buffer*  o_view,
+                          int         i_flags )
+{
+    Py_ssize_t size = 1;
+    for ( int dim = 0; dim < i_ndim; ++dim )
+    {
+        size *= i_shape[ dim ];
+    }
+
+    Py_INCREF( i_owner );
+    o_view->obj        = i_owner;
+    o_view->buf        = i_data;
+    o_view->len        = size * static_cast< Py_ssize_t >( sizeof( ElementT ) );
+    o_view->readonly   = 0;
+    o_view->itemsize   = sizeof( ElementT );
+    o_view->format     = ( i_flags & PyBUF_FORMAT ) ? const_cast< char* >( LeanFormat< ElementT >() ) : nullptr;
+    o_view->ndim       = i_ndim;
+    o_view->shape      = ( i_flags & PyBUF_ND ) ? i_shape : nullptr;
+    o_view->strides    = ( i_flags & PyBUF_STRIDES ) == PyBUF_STRIDES ? i_strides : nullptr;
+    o_view->suboffsets = nullptr;
+    o_view->internal   = nullptr;
+    return 0;
+}
+
+/// Convert the python index \p i_index, into an index within [0, \p i_size).
+///
+/// \return -1 with an IndexError set, if the index is out of range.
+inline Py_ssize_t LeanIndex( PyObject* i_index, Py_ssize_t i_size )
+{
+    Py_ssize_t index = PyNumber_AsSsize_t( i_index, PyExc_IndexError );
+    if ( index == -1 && PyErr_Occurred() )
+    {
+        return -1;
+    }
+
+    if ( index < 0 || index >= i_size )
+    {
+        PyErr_SetString( PyExc_IndexError, "index out of range" );
+        return -1;
+    }
+
+    return index;
+}
+
+/// Raise the TypeError of a call to the function \p i_name, whose positional arguments \p i_args do not match any
+/// of its overloads.
+///
+/// \return nullptr.
+inline PyObject* LeanArgumentError( const char* i_name, PyObject* const* i_args, Py_ssize_t i_argCount )
+{
+    std::string types;
+    for ( Py_ssize_t argIndex = 0; argIndex < i_argCount; ++argIndex )
+    {
+        if ( argIndex > 0 )
+        {
+            types += ", ";
+        }
+        types += Py_TYPE( i_args[ argIndex ] )->tp_name;
+    }
+
+    PyErr_Format( PyExc_TypeError,
+                  "%s(): incompatible function arguments, invoked with (%s).  See help(%s) for the supported "
+                  "argument types.",
+                  i_name,
+                  types.c_str(),
+                  i_name );
+    return nullptr;
+}
+
+/// Cast the METH_FASTCALL entry point \p i_function for a PyMethodDef.
+inline PyCFunction LeanFastCall( PyObject* ( *i_function )( PyObject*, PyObject* const*, Py_ssize_t ) )
+{
+    return reinterpret_cast< PyCFunction >( reinterpret_cast< void ( * )() >( i_function ) );
+}
+
+GM_NS_CLOSE
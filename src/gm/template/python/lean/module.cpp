@@ -0,0 +1,47 @@
+#include "lean.h"
+
+// Type Declarations.
+{% for type in types -%}
+int LeanBind{{ type.className }}( PyObject* );
+{% endfor %}
+
+// Function Declarations.
+{% for function in functions -%}
+PyMethodDef* GetLean{{ function.name }}Methods();
+{% endfor %}
+
+static PyModuleDef s_moduleDef = {PyModuleDef_HEAD_INIT,
+                                  "gmlean",
+                                  "Lean GraphicsMath python module, binding the vector, matrix and quaternion types, "
+                                  "and the functions of single values over them, directly against the CPython API.",
+                                  -1,
+                                  nullptr};
+
+PyMODINIT_FUNC PyInit_gmlean()
+{
+    PyObject* module = PyModule_Create( &s_moduleDef );
+    if ( module == nullptr )
+    {
+        return nullptr;
+    }
+
+    // Types.
+    if ( {% for type in types -%}
+        LeanBind{{ type.className }}( module ) < 0{% if not loop.last %} || {% endif %}
+    {%- endfor %} )
+    {
+        Py_DECREF( module );
+        return nullptr;
+    }
+
+    // Functions.
+    if ( {% for function in functions -%}
+        PyModule_AddFunctions( module, GetLean{{ function.name }}Methods() ) < 0{% if not loop.last %} || {% endif %}
+    {%- endfor %} )
+    {
+        Py_DECREF( module );
+        return nullptr;
+    }
+
+    return module;
+}
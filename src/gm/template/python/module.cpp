@@ -1,27 +1,67 @@
 #include <pybind11/pybind11.h>
 
-// Type Declarations.
-{% for type in types -%}
-void Bind{{ type.className }}( pybind11::module& );
-{% endfor %}
+#include "functions/parallel.h"
+#include "submodules.h"
 
-// Function Declarations.
-{% for function in functions -%}
-void Bind{{ function.name }}( pybind11::module& );
+// Declarations of the bindings of each submodule.
+{% for submodule in submodules -%}
+{% for binder in submodule.binders -%}
+void {{ binder }}( pybind11::module& );
+{% endfor -%}
 {% endfor %}
+// Bounding volume hierarchy.
+void BindBVH( pybind11::module& );
+
+// Memory-mapped file I/O.
+void BindIO( pybind11::module& );
+
+// Batched function kernel sets.
+void BindKernels( pybind11::module& );
+
+#if defined( GM_NUMPY_UFUNCS )
+// NumPy universal functions.
+void BindUfuncs( pybind11::module& );
+#endif
 
 PYBIND11_MODULE( gm, o_module )
 {
     o_module.doc() = "GraphicsMath python module.";
 
-    // Types.
-{% for type in types -%}
-    Bind{{ type.className }}( o_module );
+    // Types and functions are bound into submodules by category, on first attribute access.
+    static GM_NS::LazySubmodules s_submodules;
+{% for submodule in submodules %}
+    s_submodules.Add( "{{ submodule.name }}",
+                      "{{ submodule.doc }}",
+                      { {% for binder in submodule.binders %}&{{ binder }}{% if not loop.last %}, {% endif %}{% endfor %} },
+                      { {% for attribute in submodule.attributes %}"{{ attribute }}"{% if not loop.last %}, {% endif %}{% endfor %} },
+                      { {% for dependency in submodule.dependencies %}"{{ dependency }}"{% if not loop.last %}, {% endif %}{% endfor %} } );
 {%- endfor %}
 
-    // Functions.
-{% for function in functions -%}
-    Bind{{ function.name }}( o_module );
-{%- endfor %}
-}
+    // Bounding volume hierarchy.
+    s_submodules.Add( "bvh", "Bounding volume hierarchy.", {&BindBVH}, {"BVH"}, {"vector", "range", "array"} );
 
+    // Memory-mapped file I/O, of raw and PLY files into array views.
+    s_submodules.Add( "io",
+                      "Memory-mapped raw and PLY files, viewed as gm arrays.",
+                      {&BindIO},
+                      {"MapRaw", "IterateRaw", "CreateRaw", "MapPLY", "IteratePLY", "CreatePLY"},
+                      {"array"} );
+
+#if defined( GM_NUMPY_UFUNCS )
+    // NumPy universal functions of batched functions, such that NumPy is only imported on demand.
+    s_submodules.Add( "ufuncs", "NumPy universal functions of the batchable gm functions.", {&BindUfuncs}, {}, {} );
+#endif
+
+    // Instruction set of batched function calls.
+    BindKernels( o_module );
+
+    // Threading of batched function calls.
+    o_module.def( "GetThreadCount", []() { return GM_NS::BatchThreadPool::GetInstance().GetThreadCount(); } );
+    o_module.def( "SetThreadCount", []( size_t i_threadCount ) {
+        pybind11::gil_scoped_release release;
+        GM_NS::BatchThreadPool::GetInstance().SetThreadCount( i_threadCount );
+    } );
+
+    // Bind the submodules on first attribute access.
+    s_submodules.Install( o_module );
+}
@@ -0,0 +1,250 @@
+#pragma once
+
+// Fixed size, non-owning views of packed elements, over the storage of python buffers.
+//
+// A view references the C-contiguous storage of any python buffer, such as a multiprocessing.shared_memory block,
+// an mmap, or a numpy array, without copying.  The elements are read and written in place, in the byte order of
+// the host, and the view can be passed to batched functions like any other buffer.  The exporting object is kept
+// alive, and its buffer held, for the lifetime of the view or until the view is released.
+
+#include <pybind11/pybind11.h>
+
+#include <gm/gm.h>
+
+#include "../visibility.h"
+
+#include <algorithm>
+#include <cstdint>
+#include <memory>
+#include <string>
+
+GM_NS_OPEN
+
+/// \class PyArrayView
+///
+/// A fixed size view of packed \p ValueT elements, each made of \p ScalarT scalars, over the storage of a python
+/// buffer.
+template < typename ValueT, typename ScalarT >
+class GM_PYTHON_HIDDEN PyArrayView
+{
+public:
+    /// Create a view of \p i_size elements of the buffer exported by \p i_object, starting \p i_byteOffset bytes
+    /// into its storage.  A negative \p i_size spans the rest of the storage, which must then hold a whole number of
+    /// elements.
+    ///
+    /// The buffer must be C-contiguous, and either be a buffer of bytes, which is reinterpreted, or of \p ScalarT
+    /// scalars.  The view is writable if the buffer is.
+    inline PyArrayView( const pybind11::object& i_object, size_t i_byteOffset, pybind11::ssize_t i_size )
+        : m_owner( i_object )
+    {
+        Py_buffer* view = new Py_buffer();
+        if ( PyObject_GetBuffer( i_object.ptr(), view, PyBUF_RECORDS ) != 0 )
+        {
+            PyErr_Clear();
+            if ( PyObject_GetBuffer( i_object.ptr(), view, PyBUF_RECORDS_RO ) != 0 )
+            {
+                delete view;
+                throw pybind11::error_already_set();
+            }
+        }
+
+        m_buffer = std::make_shared< pybind11::buffer_info >( view );
+        if ( !PyBuffer_IsContiguous( view, 'C' ) )
+        {
+            throw pybind11::value_error( "Expected a C-contiguous buffer." );
+        }
+
+        const std::string& format = m_buffer->format;
+        if ( format != "B" && format != "b" && format != "c" &&
+             format != pybind11::format_descriptor< ScalarT >::format() )
+        {
+            throw pybind11::type_error( "Expected a buffer of bytes or of " +
+                                        pybind11::format_descriptor< ScalarT >::format() + " scalars, got format '" +
+                                        format + "'." );
+        }
+
+        size_t byteCount = static_cast< size_t >( view->len );
+        if ( i_byteOffset > byteCount )
+        {
+            throw pybind11::value_error( "Byte offset " + std::to_string( i_byteOffset ) + " exceeds the " +
+                                         std::to_string( byteCount ) + " bytes of the buffer." );
+        }
+
+        size_t available = byteCount - i_byteOffset;
+        if ( i_size < 0 )
+        {
+            if ( available % sizeof( ValueT ) != 0 )
+            {
+                throw pybind11::value_error( "Expected a multiple of " + std::to_string( sizeof( ValueT ) ) +
+                                             " bytes, got " + std::to_string( available ) + "." );
+            }
+            m_size = available / sizeof( ValueT );
+        }
+        else
+        {
+            m_size = static_cast< size_t >( i_size );
+            if ( m_size * sizeof( ValueT ) > available )
+            {
+                throw pybind11::value_error( "Expected at least " + std::to_string( m_size * sizeof( ValueT ) ) +
+                                             " bytes, got " + std::to_string( available ) + "." );
+            }
+        }
+
+        m_data = reinterpret_cast< ValueT* >( static_cast< char* >( view->buf ) + i_byteOffset );
+        if ( reinterpret_cast< std::uintptr_t >( m_data ) % alignof( ScalarT ) != 0 )
+        {
+            throw pybind11::value_error( "Expected storage aligned to " + std::to_string( alignof( ScalarT ) ) +
+                                         " bytes." );
+        }
+    }
+
+    /// Create a view of \p i_size elements in a new multiprocessing.shared_memory block, named \p i_name, or with a
+    /// unique generated name if \p i_name is None.
+    ///
+    /// The block is not unlinked when the view is destroyed: its creator should call unlink() on the
+    /// SharedMemory owner once all processes are done with it.
+    static inline PyArrayView CreateShared( size_t i_size, const pybind11::object& i_name )
+    {
+        // Zero sized shared memory blocks are not supported.
+        size_t           byteCount    = std::max< size_t >( i_size * sizeof( ValueT ), 1 );
+        pybind11::object sharedMemory = pybind11::module::import( "multiprocessing.shared_memory" )
+                                            .attr( "SharedMemory" )( i_name, /* create */ true, byteCount );
+        return FromSharedMemory( sharedMemory, 0, i_size );
+    }
+
+    /// Create a view of \p i_size elements, starting \p i_byteOffset bytes into the existing
+    /// multiprocessing.shared_memory block named \p i_name.  A negative \p i_size spans as many whole elements as
+    /// the block holds, which the platform may have rounded up in size.
+    static inline PyArrayView AttachShared( const std::string& i_name, size_t i_byteOffset, pybind11::ssize_t i_size )
+    {
+        pybind11::object sharedMemory =
+            pybind11::module::import( "multiprocessing.shared_memory" ).attr( "SharedMemory" )( i_name );
+        if ( i_size < 0 )
+        {
+            size_t byteCount = sharedMemory.attr( "size" ).cast< size_t >();
+            i_size           = static_cast< pybind11::ssize_t >(
+                byteCount > i_byteOffset ? ( byteCount - i_byteOffset ) / sizeof( ValueT ) : 0 );
+        }
+
+        return FromSharedMemory( sharedMemory, i_byteOffset, i_size );
+    }
+
+    /// Create a view of the \p i_length elements starting at \p i_start, sharing the buffer of this view.
+    inline PyArrayView Slice( size_t i_start, size_t i_length ) const
+    {
+        PyArrayView slice( *this );
+        slice.m_data += i_start;
+        slice.m_size = i_length;
+        return slice;
+    }
+
+    /// Release the buffer and the owner of this view, which is then empty.
+    inline void Release()
+    {
+        m_buffer.reset();
+        m_owner        = pybind11::none();
+        m_sharedMemory = false;
+        m_data         = nullptr;
+        m_size         = 0;
+    }
+
+    /// Get the number of elements.
+    inline size_t size() const
+    {
+        return m_size;
+    }
+
+    /// Get the elements.
+    inline ValueT* data() const
+    {
+        return m_data;
+    }
+
+    /// Get the element at \p i_index.
+    inline ValueT& operator[]( size_t i_index ) const
+    {
+        return m_data[ i_index ];
+    }
+
+    /// Whether the elements of this view are read-only.
+    inline bool IsReadOnly() const
+    {
+        return m_buffer == nullptr || m_buffer->readonly;
+    }
+
+    /// Get the object owning the storage of this view: the SharedMemory block of a shared view, the exporting
+    /// object of the buffer otherwise, or None if released.
+    inline const pybind11::object& GetOwner() const
+    {
+        return m_owner;
+    }
+
+    /// Get the offset of the first element of this view, in bytes, into the storage of its owner.
+    inline size_t GetByteOffset() const
+    {
+        return m_buffer == nullptr
+                   ? 0
+                   : static_cast< size_t >( reinterpret_cast< char* >( m_data ) - static_cast< char* >( m_buffer->ptr ) );
+    }
+
+    /// Get the state of this view, for pickling.
+    ///
+    /// Views of shared memory are pickled by the name of their block, such that they can be sent to the workers of
+    /// a multiprocessing pool, which attach to the same physical storage.  Other views are pickled by copy.
+    inline pybind11::tuple GetState() const
+    {
+        if ( m_sharedMemory )
+        {
+            return pybind11::make_tuple( m_owner.attr( "name" ), GetByteOffset(), m_size );
+        }
+
+        return pybind11::make_tuple( pybind11::none(),
+                                     0,
+                                     m_size,
+                                     pybind11::bytes( reinterpret_cast< const char* >( m_data ),
+                                                      m_size * sizeof( ValueT ) ) );
+    }
+
+    /// Create a view from the state of \ref GetState.
+    static inline PyArrayView FromState( const pybind11::tuple& i_state )
+    {
+        if ( i_state.size() == 3 )
+        {
+            return AttachShared( i_state[ 0 ].cast< std::string >(),
+                                 i_state[ 1 ].cast< size_t >(),
+                                 i_state[ 2 ].cast< pybind11::ssize_t >() );
+        }
+        else if ( i_state.size() == 4 )
+        {
+            pybind11::object storage = pybind11::reinterpret_steal< pybind11::object >(
+                PyByteArray_FromObject( i_state[ 3 ].ptr() ) );
+            if ( !storage )
+            {
+                throw pybind11::error_already_set();
+            }
+            return PyArrayView( storage, 0, i_state[ 2 ].cast< pybind11::ssize_t >() );
+        }
+
+        throw std::runtime_error( "Invalid state for an array view." );
+    }
+
+private:
+    static inline PyArrayView
+    FromSharedMemory( const pybind11::object& i_sharedMemory, size_t i_byteOffset, pybind11::ssize_t i_size )
+    {
+        PyArrayView view( i_sharedMemory.attr( "buf" ), i_byteOffset, i_size );
+        view.m_owner        = i_sharedMemory;
+        view.m_sharedMemory = true;
+        return view;
+    }
+
+    // The owner is declared first, such that it is destroyed after the buffer: a SharedMemory owner cannot close its
+    // block while the buffer of the view is still exported.
+    pybind11::object                         m_owner;
+    std::shared_ptr< pybind11::buffer_info > m_buffer;
+    bool                                     m_sharedMemory = false;
+    ValueT*                                  m_data         = nullptr;
+    size_t                                   m_size         = 0;
+};
+
+GM_NS_CLOSE
@@ -2,10 +2,43 @@
 
 #include <gm/types/{{ valueType.headerFileName }}>
 
+#include "serialization.h"
+
 // Python bindings for {{ valueType.className }}.
 
 GM_NS_USING
 
+/// Serialize the elements of \p i_composite, in declaration order, into the fixed little-endian layout of
+/// serialization.h.  Derived elements are recomputed on deserialization.
+static pybind11::bytes _ToBytes( const {{ valueType.className }}& i_composite )
+{
+    BytesWriter writer( {% for element in valueType.elements %}sizeof( {{ element.type.className }} ){% if not loop.last %} + {% endif %}{% endfor %} );
+{%- for element in valueType.elements %}
+{%- if element.type.isScalar %}
+    writer.Write( &i_composite.{{ element.accessorName }}(), 1 );
+{%- else %}
+    writer.Write( i_composite.{{ element.accessorName }}().Data(), {{ element.type.elementSize }} );
+{%- endif %}
+{%- endfor %}
+    return writer.GetBytes();
+}
+
+/// Deserialize a {{ valueType.className }} from the fixed little-endian layout of serialization.h.
+static {{ valueType.className }} _FromBytes( const pybind11::buffer& i_buffer )
+{
+    BytesReader reader( i_buffer );
+    reader.ExpectByteCount( {% for element in valueType.elements %}sizeof( {{ element.type.className }} ){% if not loop.last %} + {% endif %}{% endfor %}, "{{ valueType.className }}" );
+{% for element in valueType.elements %}
+    {{ element.type.className }} {{ element.name }};
+{%- if element.type.isScalar %}
+    reader.Read( &{{ element.name }}, 1 );
+{%- else %}
+    reader.Read( {{ element.name }}.Data(), {{ element.type.elementSize }} );
+{%- endif %}
+{%- endfor %}
+    return {{ valueType.className }}( {% for element in valueType.elements %}{{ element.name }}{% if not loop.last %}, {% endif %}{% endfor %} );
+}
+
 void Bind{{ valueType.className }}( pybind11::module& o_module )
 {
     // Define class.
@@ -29,7 +62,7 @@ void Bind{{ valueType.className }}( pybind11::module& o_module )
         return pybind11::str( i_composite.GetString( "gm." ) );
     } );
 
-{% for element in valueType.elements %}
+{% for element in valueType.elements if valueType.isMutable %}
     // Property getter/setter for the "{{ element.name }}" element.
     cls.def_property( "{{ element.name }}",
         pybind11::cpp_function(
@@ -48,4 +81,26 @@ void Bind{{ valueType.className }}( pybind11::module& o_module )
         "Property getter / setter for the {{ element.name }} element."
     );
 {% endfor %}
+{% for element in valueType.elements + valueType.derivedElements if not valueType.isMutable %}
+    // Property getter for the "{{ element.name }}" element.
+    cls.def_property_readonly( "{{ element.name }}",
+        []( const {{ valueType.className }}& i_composite )
+        {
+           return i_composite.{{ element.accessorName }}();
+        },
+        "Property getter for the {{ element.name }} element."
+    );
+{% endfor %}
+
+    // Serialization, into a fixed little-endian layout.
+    cls.def( "to_bytes", &_ToBytes );
+    cls.def_static( "from_bytes", &_FromBytes );
+
+    // Pickling, with the serialized bytes as the state.
+    cls.def( pybind11::pickle(
+        []( const {{ valueType.className }}& i_composite ) { return pybind11::buffer( _ToBytes( i_composite ) ); },
+        &_FromBytes ) );
+    cls.def( "__reduce_ex__", []( const pybind11::object& i_composite, int i_protocol ) {
+        return ReduceEx( i_composite, i_protocol, /* outOfBand */ false );
+    } );
 }
@@ -0,0 +1,7 @@
+{% extends "python/types/bindVectorType.cpp" %}
+
+{% block bindings %}
+
+    // Identity element.
+    cls.def_static( "Identity", &{{ valueType.className }}::Identity );
+{%- endblock %}
@@ -2,10 +2,49 @@
 
 #include <gm/types/{{ valueType.headerFileName }}>
 
+#include "serialization.h"
+
 // Python bindings for {{ valueType.className }}.
 
 GM_NS_USING
 
+{%- if valueType.elementType.isScalar %}
+{%- set scalarCount = 1 %}
+{%- else %}
+{%- set scalarCount = valueType.elementType.elementSize %}
+{%- endif %}
+
+/// Serialize \p i_range into the fixed little-endian layout of serialization.h, the minimum then the maximum.
+static pybind11::bytes _ToBytes( const {{ valueType.className }}& i_range )
+{
+    BytesWriter writer( 2 * sizeof( {{ valueType.elementType.className }} ) );
+{%- if valueType.elementType.isScalar %}
+    writer.Write( &i_range.Min(), 1 );
+    writer.Write( &i_range.Max(), 1 );
+{%- else %}
+    writer.Write( i_range.Min().Data(), {{ scalarCount }} );
+    writer.Write( i_range.Max().Data(), {{ scalarCount }} );
+{%- endif %}
+    return writer.GetBytes();
+}
+
+/// Deserialize a {{ valueType.className }} from the fixed little-endian layout of serialization.h.
+static {{ valueType.className }} _FromBytes( const pybind11::buffer& i_buffer )
+{
+    BytesReader reader( i_buffer );
+    reader.ExpectByteCount( 2 * sizeof( {{ valueType.elementType.className }} ), "{{ valueType.className }}" );
+
+    {{ valueType.elementType.className }} min, max;
+{%- if valueType.elementType.isScalar %}
+    reader.Read( &min, 1 );
+    reader.Read( &max, 1 );
+{%- else %}
+    reader.Read( min.Data(), {{ scalarCount }} );
+    reader.Read( max.Data(), {{ scalarCount }} );
+{%- endif %}
+    return {{ valueType.className }}( min, max );
+}
+
 void Bind{{ valueType.className }}( pybind11::module& o_module )
 {
     pybind11::class_< {{ valueType.className }} > cls( o_module, "{{ valueType.className }}" );
@@ -59,4 +98,16 @@ void Bind{{ valueType.className }}( pybind11::module& o_module )
         ),
         "Property getter / setter for the maximum."
     );
+
+    // Serialization, into a fixed little-endian layout.
+    cls.def( "to_bytes", &_ToBytes );
+    cls.def_static( "from_bytes", &_FromBytes );
+
+    // Pickling, with the serialized bytes as the state.
+    cls.def( pybind11::pickle(
+        []( const {{ valueType.className }}& i_range ) { return pybind11::buffer( _ToBytes( i_range ) ); },
+        &_FromBytes ) );
+    cls.def( "__reduce_ex__", []( const pybind11::object& i_range, int i_protocol ) {
+        return ReduceEx( i_range, i_protocol, /* outOfBand */ false );
+    } );
 }
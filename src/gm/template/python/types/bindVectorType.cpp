@@ -2,13 +2,37 @@
 
 #include <gm/types/{{ valueType.headerFileName }}>
 
+#include "freeList.h"
+#include "serialization.h"
+
+#include <cstring>
+
 // Python bindings for {{ valueType.className }}.
 
 GM_NS_USING
 
+/// Serialize \p i_{{ valueType.varName }} into the fixed little-endian layout of serialization.h.
+static pybind11::bytes _ToBytes( const {{ valueType.className }}& i_{{ valueType.varName }} )
+{
+    BytesWriter writer( sizeof( {{ valueType.className }} ) );
+    writer.Write( i_{{ valueType.varName }}.Data(), {{ valueType.elementSize }} );
+    return writer.GetBytes();
+}
+
+/// Deserialize a {{ valueType.className }} from the fixed little-endian layout of serialization.h.
+static {{ valueType.className }} _FromBytes( const pybind11::buffer& i_buffer )
+{
+    BytesReader reader( i_buffer );
+    reader.ExpectByteCount( sizeof( {{ valueType.className }} ), "{{ valueType.className }}" );
+
+    {{ valueType.className }} {{ valueType.varName }};
+    reader.Read( {{ valueType.varName }}.Data(), {{ valueType.elementSize }} );
+    return {{ valueType.varName }};
+}
+
 void Bind{{ valueType.className }}( pybind11::module& o_module )
 {
-    pybind11::class_< {{ valueType.className }} > cls( o_module, "{{ valueType.className }}" );
+    pybind11::class_< {{ valueType.className }} > cls( o_module, "{{ valueType.className }}", pybind11::buffer_protocol() );
 
     // Default initializer.
     cls.def( pybind11::init<>() );
@@ -23,6 +47,54 @@ void Bind{{ valueType.className }}( pybind11::module& o_module )
 {%- endfor %}
     >() );
 
+    // Buffer initializer, copying the elements of any C-contiguous buffer with matching
+    // element format and count in a single block.
+    cls.def( pybind11::init( []( pybind11::buffer i_buffer ) {
+        pybind11::buffer_info info = i_buffer.request();
+        if ( info.format != pybind11::format_descriptor< {{ valueType.elementType.className }} >::format() )
+        {
+            throw pybind11::type_error( "Expected buffer of {{ valueType.elementType.className }} elements, got format '" +
+                                        info.format + "'." );
+        }
+
+        if ( info.size != {{ valueType.elementSize }} )
+        {
+            throw pybind11::value_error( "Expected buffer of {{ valueType.elementSize }} elements, got " +
+                                         std::to_string( info.size ) + "." );
+        }
+
+        pybind11::ssize_t stride = info.itemsize;
+        for ( pybind11::ssize_t dim = info.ndim - 1; dim >= 0; --dim )
+        {
+            if ( info.shape[ dim ] > 1 && info.strides[ dim ] != stride )
+            {
+                throw pybind11::value_error( "Expected a C-contiguous buffer." );
+            }
+            stride *= info.shape[ dim ];
+        }
+
+        {{ valueType.className }} {{ valueType.varName }};
+        std::memcpy( {{ valueType.varName }}.Data(), info.ptr, sizeof( {{ valueType.className }} ) );
+        return {{ valueType.varName }};
+    } ) );
+
+    // Buffer protocol, exposing the element storage without copying.
+    cls.def_buffer( []( {{ valueType.className }}& o_{{ valueType.varName }} ) -> pybind11::buffer_info {
+        return pybind11::buffer_info(
+            o_{{ valueType.varName }}.Data(),
+            sizeof( {{ valueType.elementType.className }} ),
+            pybind11::format_descriptor< {{ valueType.elementType.className }} >::format(),
+            {{ valueType.shape|length }},
+{%- if valueType.shape|length == 2 %}
+            { {{ valueType.shape[0] }}, {{ valueType.shape[1] }} },
+            { sizeof( {{ valueType.elementType.className }} ) * {{ valueType.shape[1] }}, sizeof( {{ valueType.elementType.className }} ) }
+{%- else %}
+            { {{ valueType.shape[0] }} },
+            { sizeof( {{ valueType.elementType.className }} ) }
+{%- endif %}
+        );
+    } );
+
     // Object representation.
     cls.def( "__repr__", []( const {{ valueType.className }}& i_vector ) {
         return pybind11::str( i_vector.GetString( "gm." ) );
@@ -108,28 +180,32 @@ void Bind{{ valueType.className }}( pybind11::module& o_module )
     );
 {%- endfor %}
 
+    // Recycle instances through a free list, such that the results of the arithmetic operators below are not
+    // allocated anew.
+    PyFreeList< {{ valueType.className }} >::Install( cls );
+
     // Vector addition.
     cls.def( "__add__", []( const {{ valueType.className }}& i_lhs,
                             const {{ valueType.className }}& i_rhs ) {
-        return i_lhs + i_rhs;
+        return PyFreeList< {{ valueType.className }} >::New( i_lhs + i_rhs );
     } );
 
     // Vector subtraction.
     cls.def( "__sub__", []( const {{ valueType.className }}& i_lhs,
                             const {{ valueType.className }}& i_rhs ) {
-        return i_lhs - i_rhs;
+        return PyFreeList< {{ valueType.className }} >::New( i_lhs - i_rhs );
     } );
 
     // Vector-scalar Multiplication.
     cls.def( "__mul__", []( const {{ valueType.className }}& i_lhs,
                             {{ valueType.elementType.className }} i_rhs ) {
-        return i_lhs * i_rhs;
+        return PyFreeList< {{ valueType.className }} >::New( i_lhs * i_rhs );
     } );
 
     // Scalar-vector Multiplication.
     cls.def( "__rmul__", []( const {{ valueType.className }}& i_rhs,
                              {{ valueType.elementType.className }} i_lhs ) {
-        return i_lhs * i_rhs;
+        return PyFreeList< {{ valueType.className }} >::New( i_lhs * i_rhs );
     } );
 
 
@@ -141,12 +217,12 @@ void Bind{{ valueType.className }}( pybind11::module& o_module )
             // TODO throw pybind11::zero_division_error();
             throw pybind11::value_error();
         }
-        return i_lhs / i_rhs;
+        return PyFreeList< {{ valueType.className }} >::New( i_lhs / i_rhs );
     } );
 
     // Unary negation.
     cls.def( "__neg__", []( const {{ valueType.className }}& i_vector ) {
-        return -i_vector;
+        return PyFreeList< {{ valueType.className }} >::New( -i_vector );
     } );
 
     // Equality.
@@ -158,6 +234,21 @@ void Bind{{ valueType.className }}( pybind11::module& o_module )
     // Element size.
     cls.def( "GetElementSize", &{{ valueType.className }}::GetElementSize );
 
+{% if valueType.isFloatingPoint -%}
     // Check for nans.
     cls.def( "HasNaNs", &{{ valueType.className }}::HasNaNs );
+{%- endif %}
+
+    // Serialization, into a fixed little-endian layout.
+    cls.def( "to_bytes", &_ToBytes );
+    cls.def_static( "from_bytes", &_FromBytes );
+
+    // Pickling, with the serialized bytes as the state.
+    cls.def( pybind11::pickle(
+        []( const {{ valueType.className }}& i_{{ valueType.varName }} ) { return pybind11::buffer( _ToBytes( i_{{ valueType.varName }} ) ); },
+        &_FromBytes ) );
+    cls.def( "__reduce_ex__", []( const pybind11::object& i_{{ valueType.varName }}, int i_protocol ) {
+        return ReduceEx( i_{{ valueType.varName }}, i_protocol, /* outOfBand */ false );
+    } );
+{%- block bindings %}{% endblock %}
 }
@@ -0,0 +1,96 @@
+#pragma once
+
+// Tracking of the live buffer exports of python instances of the resizable array types.
+//
+// The buffer protocol of an array type exports its element storage without copying, so resizing the array while a
+// buffer is exported would leave the consumer (a memoryview, a NumPy array, an out-of-band pickle buffer or an array
+// view) reading freed memory.  Instead, the exports of each instance are counted, and the resizing methods raise a
+// BufferError while any is live: as the builtin bytearray type.
+
+#include <pybind11/pybind11.h>
+
+#include <gm/gm.h>
+
+#include <unordered_map>
+
+GM_NS_OPEN
+
+/// \class PyBufferExports
+///
+/// The live buffer export counts of the python instances of the bound type of \p ValueT.
+template < typename ValueT >
+class PyBufferExports
+{
+public:
+    /// Count the buffer exports of the instances of the bound class \p i_class, which must implement the buffer
+    /// protocol.
+    static inline void Install( pybind11::class_< ValueT >& i_class )
+    {
+        State&        state = GetState();
+        PyTypeObject* type  = reinterpret_cast< PyTypeObject* >( i_class.ptr() );
+
+        state.m_getBuffer                    = type->tp_as_buffer->bf_getbuffer;
+        state.m_releaseBuffer                = type->tp_as_buffer->bf_releasebuffer;
+        type->tp_as_buffer->bf_getbuffer     = &GetBuffer;
+        type->tp_as_buffer->bf_releasebuffer = &ReleaseBuffer;
+    }
+
+    /// Get the number of live buffer exports of \p i_value.
+    static inline size_t GetCount( const ValueT& i_value )
+    {
+        const std::unordered_map< const ValueT*, size_t >& counts = GetState().m_counts;
+        auto                                               it     = counts.find( &i_value );
+        return it != counts.end() ? it->second : 0;
+    }
+
+    /// Throw a BufferError if \p i_value has live buffer exports, and thus cannot be resized.
+    static inline void CheckResizable( const ValueT& i_value )
+    {
+        if ( GetCount( i_value ) > 0 )
+        {
+            throw pybind11::buffer_error( "Existing exports of data: object cannot be re-sized." );
+        }
+    }
+
+private:
+    struct State
+    {
+        getbufferproc                               m_getBuffer     = nullptr;
+        releasebufferproc                           m_releaseBuffer = nullptr;
+        std::unordered_map< const ValueT*, size_t > m_counts;
+    };
+
+    static inline State& GetState()
+    {
+        static State s_state;
+        return s_state;
+    }
+
+    /// Export the buffer of \p i_object through the buffer protocol of pybind11, and count it.
+    static int GetBuffer( PyObject* i_object, Py_buffer* o_view, int i_flags )
+    {
+        State& state = GetState();
+        if ( state.m_getBuffer( i_object, o_view, i_flags ) != 0 )
+        {
+            return -1;
+        }
+
+        ++state.m_counts[ &pybind11::handle( i_object ).cast< const ValueT& >() ];
+        return 0;
+    }
+
+    /// Release a buffer exported by \p i_object, through the buffer protocol of pybind11.
+    static void ReleaseBuffer( PyObject* i_object, Py_buffer* io_view )
+    {
+        State& state = GetState();
+        auto   it    = state.m_counts.find( &pybind11::handle( i_object ).cast< const ValueT& >() );
+        if ( it != state.m_counts.end() && --it->second == 0 )
+        {
+            state.m_counts.erase( it );
+        }
+
+        state.m_releaseBuffer( i_object, io_view );
+    }
+};
+
+GM_NS_CLOSE
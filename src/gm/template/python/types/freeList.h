@@ -0,0 +1,133 @@
+#pragma once
+
+// Free lists of python instances of the value types, recycled by the arithmetic operators.
+//
+// Each pybind11 instance of a value type is a python object, plus a heap-allocated C++ value owned by its holder, so
+// tight arithmetic loops spend much of their time allocating and freeing short-lived results.  Instead, instances of
+// a bound type are kept on deallocation, up to a capacity, and recycled whole, python object and C++ value, by the
+// next result: as the free lists of the builtin float and tuple types.
+
+#include <pybind11/pybind11.h>
+
+#include <gm/gm.h>
+
+#include <vector>
+
+GM_NS_OPEN
+
+/// \class PyFreeList
+///
+/// A free list of the python instances of the bound type of \p ValueT.
+template < typename ValueT >
+class PyFreeList
+{
+public:
+    /// Default maximum number of instances kept, per type.
+    static constexpr size_t DefaultCapacity = 128;
+
+    /// Keep the instances of the bound class \p i_class on deallocation, and bind the free list accessors:
+    /// GetFreeListSize, GetFreeListCapacity and SetFreeListCapacity.
+    static inline void Install( pybind11::class_< ValueT >& i_class )
+    {
+        State&        state = GetState();
+        PyTypeObject* type  = reinterpret_cast< PyTypeObject* >( i_class.ptr() );
+        state.m_type        = type;
+        state.m_dealloc     = type->tp_dealloc;
+        type->tp_dealloc    = &Dealloc;
+
+        // Number of instances currently kept.
+        i_class.def_static( "GetFreeListSize", []() { return GetState().m_objects.size(); } );
+
+        // Maximum number of instances kept.
+        i_class.def_static( "GetFreeListCapacity", []() { return GetState().m_capacity; } );
+
+        // Set the maximum number of instances kept, freeing the excess.  A capacity of 0 disables the free list.
+        i_class.def_static( "SetFreeListCapacity", &SetCapacity, pybind11::arg( "capacity" ) );
+    }
+
+    /// Create a python instance holding \p i_value, recycled from the free list if possible.
+    static inline pybind11::object New( const ValueT& i_value )
+    {
+        State& state = GetState();
+        if ( state.m_objects.empty() )
+        {
+            return pybind11::cast( i_value );
+        }
+
+        PyObject* object = state.m_objects.back();
+        state.m_objects.pop_back();
+        _Py_NewReference( object );
+        *reinterpret_cast< pybind11::detail::instance* >( object )->get_value_and_holder().template value_ptr< ValueT >() =
+            i_value;
+        return pybind11::reinterpret_steal< pybind11::object >( object );
+    }
+
+    /// Set the maximum number of instances kept to \p i_capacity, freeing the excess.
+    static inline void SetCapacity( size_t i_capacity )
+    {
+        State& state      = GetState();
+        state.m_capacity = i_capacity;
+        while ( state.m_objects.size() > i_capacity )
+        {
+            PyObject* object = state.m_objects.back();
+            state.m_objects.pop_back();
+            Free( object );
+        }
+    }
+
+private:
+    struct State
+    {
+        PyTypeObject*            m_type     = nullptr;
+        destructor               m_dealloc  = nullptr;
+        size_t                   m_capacity = DefaultCapacity;
+        std::vector< PyObject* > m_objects;
+    };
+
+    static inline State& GetState()
+    {
+        static State s_state;
+        return s_state;
+    }
+
+    /// Deallocate \p i_object, keeping it on the free list if possible.
+    ///
+    /// Only plain instances of the exact bound type are kept: owning their value, without weak references, nor
+    /// objects kept alive through them.  Kept instances remain registered with pybind11, and keep their reference
+    /// to their type.
+    static void Dealloc( PyObject* i_object )
+    {
+        State&                          state    = GetState();
+        pybind11::detail::instance*     instance = reinterpret_cast< pybind11::detail::instance* >( i_object );
+        if ( Py_TYPE( i_object ) == state.m_type && state.m_objects.size() < state.m_capacity &&
+             instance->simple_layout && instance->owned && instance->simple_holder_constructed &&
+             !instance->has_patients && instance->weakrefs == nullptr )
+        {
+            state.m_objects.push_back( i_object );
+            return;
+        }
+
+        Free( i_object );
+    }
+
+    /// Deallocate \p i_object through the deallocator of pybind11.
+    static inline void Free( PyObject* i_object )
+    {
+        PyTypeObject* type = Py_TYPE( i_object );
+        GetState().m_dealloc( i_object );
+#if PY_VERSION_HEX < 0x03080000
+        // Before Python 3.8, pybind11 only releases the reference to the type of instances of its own deallocator.
+        if ( type == GetState().m_type )
+        {
+            Py_DECREF( type );
+        }
+#else
+        (void) type;
+#endif
+    }
+};
+
+template < typename ValueT >
+constexpr size_t PyFreeList< ValueT >::DefaultCapacity;
+
+GM_NS_CLOSE
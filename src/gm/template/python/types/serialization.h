@@ -0,0 +1,185 @@
+#pragma once
+
+// Compact binary serialization of the python bound types, shared by to_bytes / from_bytes and pickling.
+//
+// The layout is fixed, independently of the host: the scalars of a value are written back to back in storage
+// order (row-major for matrices, min before max for ranges, elements in declaration order for composites), each
+// in little-endian byte order, without header nor padding.  On little-endian hosts, serializing an array is thus a
+// single block copy.
+
+#include <pybind11/pybind11.h>
+
+#include <gm/gm.h>
+
+#include "../visibility.h"
+
+#include <algorithm>
+#include <cstdint>
+#include <cstring>
+#include <string>
+
+GM_NS_OPEN
+
+/// Whether the host stores scalars in little-endian byte order, matching the serialized layout.
+inline bool IsLittleEndianHost()
+{
+    const uint32_t value = 1;
+    unsigned char  firstByte;
+    std::memcpy( &firstByte, &value, 1 );
+    return firstByte == 1;
+}
+
+/// Copy \p i_byteCount bytes of scalars of \p i_scalarSize bytes each, from \p i_source into \p o_destination,
+/// swapping the byte order of each scalar on big-endian hosts.
+inline void CopyLittleEndian( const void* i_source, size_t i_byteCount, size_t i_scalarSize, void* o_destination )
+{
+    if ( i_byteCount == 0 )
+    {
+        return;
+    }
+
+    std::memcpy( o_destination, i_source, i_byteCount );
+    if ( !IsLittleEndianHost() )
+    {
+        unsigned char* bytes = static_cast< unsigned char* >( o_destination );
+        for ( size_t offset = 0; offset < i_byteCount; offset += i_scalarSize )
+        {
+            std::reverse( bytes + offset, bytes + offset + i_scalarSize );
+        }
+    }
+}
+
+/// \class BytesWriter
+///
+/// Write scalars in the serialized layout, directly into a python bytes object of a known size.
+class GM_PYTHON_HIDDEN BytesWriter
+{
+public:
+    explicit BytesWriter( size_t i_byteCount )
+        : m_bytes( pybind11::reinterpret_steal< pybind11::bytes >(
+              PyBytes_FromStringAndSize( nullptr, static_cast< Py_ssize_t >( i_byteCount ) ) ) )
+    {
+        if ( !m_bytes )
+        {
+            throw pybind11::error_already_set();
+        }
+
+        m_cursor = PyBytes_AS_STRING( m_bytes.ptr() );
+    }
+
+    /// Write \p i_count scalars from \p i_scalars.
+    template < typename ScalarT >
+    inline void Write( const ScalarT* i_scalars, size_t i_count )
+    {
+        CopyLittleEndian( i_scalars, i_count * sizeof( ScalarT ), sizeof( ScalarT ), m_cursor );
+        m_cursor += i_count * sizeof( ScalarT );
+    }
+
+    /// Get the written bytes object.
+    inline pybind11::bytes GetBytes() const
+    {
+        return m_bytes;
+    }
+
+private:
+    pybind11::bytes m_bytes;
+    char*           m_cursor = nullptr;
+};
+
+/// \class BytesReader
+///
+/// Read scalars in the serialized layout, from the C-contiguous storage of any python buffer, such as bytes,
+/// bytearray, memoryview or a pickle.PickleBuffer, regardless of its element format.
+class BytesReader
+{
+public:
+    explicit BytesReader( const pybind11::buffer& i_buffer )
+    {
+        if ( PyObject_GetBuffer( i_buffer.ptr(), &m_view, PyBUF_C_CONTIGUOUS ) != 0 )
+        {
+            throw pybind11::error_already_set();
+        }
+
+        if ( !PyBuffer_IsContiguous( &m_view, 'C' ) )
+        {
+            PyBuffer_Release( &m_view );
+            throw pybind11::value_error( "Expected a C-contiguous buffer." );
+        }
+
+        m_cursor = static_cast< const char* >( m_view.buf );
+    }
+
+    ~BytesReader()
+    {
+        PyBuffer_Release( &m_view );
+    }
+
+    BytesReader( const BytesReader& ) = delete;
+    BytesReader& operator=( const BytesReader& ) = delete;
+
+    /// Get the total number of bytes of the buffer.
+    inline size_t GetByteCount() const
+    {
+        return static_cast< size_t >( m_view.len );
+    }
+
+    /// Throw a ValueError if the buffer does not hold exactly \p i_byteCount bytes, of a \p i_typeName value.
+    inline void ExpectByteCount( size_t i_byteCount, const char* i_typeName ) const
+    {
+        if ( GetByteCount() != i_byteCount )
+        {
+            throw pybind11::value_error( "Expected " + std::to_string( i_byteCount ) + " bytes for " + i_typeName +
+                                         ", got " + std::to_string( GetByteCount() ) + "." );
+        }
+    }
+
+    /// Throw a ValueError if the buffer does not hold a multiple of \p i_byteCount bytes, of \p i_typeName
+    /// elements.
+    inline void ExpectByteCountMultiple( size_t i_byteCount, const char* i_typeName ) const
+    {
+        if ( GetByteCount() % i_byteCount != 0 )
+        {
+            throw pybind11::value_error( "Expected a multiple of " + std::to_string( i_byteCount ) + " bytes for " +
+                                         i_typeName + ", got " + std::to_string( GetByteCount() ) + "." );
+        }
+    }
+
+    /// Read \p i_count scalars into \p o_scalars.
+    template < typename ScalarT >
+    inline void Read( ScalarT* o_scalars, size_t i_count )
+    {
+        CopyLittleEndian( m_cursor, i_count * sizeof( ScalarT ), sizeof( ScalarT ), o_scalars );
+        m_cursor += i_count * sizeof( ScalarT );
+    }
+
+private:
+    Py_buffer   m_view;
+    const char* m_cursor = nullptr;
+};
+
+/// The __reduce_ex__ of a bound type, reconstructing \p i_object through copyreg.__newobj__ and __setstate__.
+///
+/// With pickle protocol 5, and if \p i_outOfBand is true, the state is a pickle.PickleBuffer over the storage of
+/// \p i_object, which the pickler can hand to a buffer_callback as an out-of-band buffer, without copying.  The
+/// storage is only exposed on little-endian hosts, where it matches the serialized layout.  Otherwise, the state is
+/// the serialized bytes of __getstate__.
+inline pybind11::tuple ReduceEx( const pybind11::object& i_object, int i_protocol, bool i_outOfBand )
+{
+    pybind11::object state;
+    if ( i_outOfBand && i_protocol >= 5 && IsLittleEndianHost() )
+    {
+        state = pybind11::module::import( "pickle" ).attr( "PickleBuffer" )( i_object );
+    }
+    else
+    {
+        state = i_object.attr( "__getstate__" )();
+    }
+
+    pybind11::object type = pybind11::reinterpret_borrow< pybind11::object >(
+        reinterpret_cast< PyObject* >( Py_TYPE( i_object.ptr() ) ) );
+    return pybind11::make_tuple( pybind11::module::import( "copyreg" ).attr( "__newobj__" ),
+                                 pybind11::make_tuple( type ),
+                                 state );
+}
+
+GM_NS_CLOSE
@@ -1,13 +1,33 @@
+import array
+import pickle
+import struct
 import unittest
 import gm
 
+{% import "python/types/typeUtils.py" as typeUtils %}
+
+{#
+    Generate an element value of the array, seeded by ``value``.
+#}
+{% macro GenElement(elementType, value) %}
+{%- if elementType.isScalar -%}
+    {{ elementType.PyValue(value) }}
+{%- elif elementType.isVector -%}
+    {{ typeUtils.GenArithmeticSequence(elementType, value) }}
+{%- else -%}
+    {{ typeUtils.GenArithmeticRange(elementType, value, value + 1) }}
+{%- endif -%}
+{% endmacro %}
+
+{% set typeCode = "f" if valueType.isFloatingPoint else "i" %}
+
 class Test{{ valueType.className }}(unittest.TestCase):
 
     def testDefaultInitialization(self):
-        gm.{{ valueType.className }}()
+        self.assertEqual(len(gm.{{ valueType.className }}()), 0)
 
     def testListInitialization(self):
-        gm.{{ valueType.className }}([
+        values = gm.{{ valueType.className }}([
 {%- for index in range(5) -%}
 {%- if valueType.elementType.isScalar -%}
             {{ valueType.elementType.className }}()
@@ -19,3 +39,158 @@ class Test{{ valueType.className }}(unittest.TestCase):
 {%- endif -%}
 {%- endfor -%}
         ])
+        self.assertEqual(len(values), 5)
+
+    def testSizedInitialization(self):
+        self.assertEqual(len(gm.{{ valueType.className }}(5)), 5)
+
+    def testAppend(self):
+        values = gm.{{ valueType.className }}()
+        values.append({{ GenElement(valueType.elementType, 1) }})
+        values.append({{ GenElement(valueType.elementType, 2) }})
+        self.assertEqual(values, gm.{{ valueType.className }}([{{ GenElement(valueType.elementType, 1) }}, {{ GenElement(valueType.elementType, 2) }}]))
+
+    def testExtend(self):
+        values = gm.{{ valueType.className }}([{{ GenElement(valueType.elementType, 1) }}])
+        values.extend(gm.{{ valueType.className }}([{{ GenElement(valueType.elementType, 2) }}]))
+        values.extend([{{ GenElement(valueType.elementType, 3) }}])
+        values.extend(array.array("{{ typeCode }}", [0] * {{ valueType.elementScalarSize * 2 }}))
+        self.assertEqual(len(values), 5)
+        self.assertEqual(values[:3], gm.{{ valueType.className }}([
+            {{ GenElement(valueType.elementType, 1) }},
+            {{ GenElement(valueType.elementType, 2) }},
+            {{ GenElement(valueType.elementType, 3) }},
+        ]))
+
+    def testExtendSelf(self):
+        values = gm.{{ valueType.className }}([
+            {{ GenElement(valueType.elementType, 1) }},
+            {{ GenElement(valueType.elementType, 2) }},
+        ])
+        values.extend(values)
+        self.assertEqual(values, gm.{{ valueType.className }}([
+            {{ GenElement(valueType.elementType, 1) }},
+            {{ GenElement(valueType.elementType, 2) }},
+            {{ GenElement(valueType.elementType, 1) }},
+            {{ GenElement(valueType.elementType, 2) }},
+        ]))
+
+    def testIndexing(self):
+        values = gm.{{ valueType.className }}(3)
+        values[-1] = {{ GenElement(valueType.elementType, 2) }}
+        self.assertEqual(values[2:], gm.{{ valueType.className }}([{{ GenElement(valueType.elementType, 2) }}]))
+        with self.assertRaises(IndexError):
+            values[3]
+        del values[0]
+        self.assertEqual(len(values), 2)
+
+    def testSlicing(self):
+        values = gm.{{ valueType.className }}([
+            {{ GenElement(valueType.elementType, 1) }},
+            {{ GenElement(valueType.elementType, 2) }},
+            {{ GenElement(valueType.elementType, 3) }},
+        ])
+        self.assertEqual(values[::2], gm.{{ valueType.className }}([{{ GenElement(valueType.elementType, 1) }}, {{ GenElement(valueType.elementType, 3) }}]))
+
+        values[1:] = gm.{{ valueType.className }}([{{ GenElement(valueType.elementType, 1) }}, {{ GenElement(valueType.elementType, 1) }}])
+        self.assertEqual(values[1:2], values[0:1])
+
+        with self.assertRaises(ValueError):
+            values[1:] = gm.{{ valueType.className }}(1)
+
+    def testSliceAssignmentSelf(self):
+        values = gm.{{ valueType.className }}([
+            {{ GenElement(valueType.elementType, 1) }},
+            {{ GenElement(valueType.elementType, 2) }},
+            {{ GenElement(valueType.elementType, 3) }},
+        ])
+        values[::-1] = values
+        self.assertEqual(values, gm.{{ valueType.className }}([
+            {{ GenElement(valueType.elementType, 3) }},
+            {{ GenElement(valueType.elementType, 2) }},
+            {{ GenElement(valueType.elementType, 1) }},
+        ]))
+
+    def testBufferProtocol(self):
+        values = gm.{{ valueType.className }}(4)
+        view = memoryview(values)
+        self.assertEqual(view.format, "{{ typeCode }}")
+        self.assertEqual(view.shape, {{ (4,) + valueType.elementShape }})
+        self.assertEqual(view.nbytes, {{ 4 * valueType.elementScalarSize * 4 }})
+
+    def testBufferExportsPreventResize(self):
+        values = gm.{{ valueType.className }}(4)
+        view = memoryview(values)
+        for resize in (
+            lambda: values.append({{ GenElement(valueType.elementType, 1) }}),
+            lambda: values.extend(gm.{{ valueType.className }}(1)),
+            lambda: values.extend(array.array("{{ typeCode }}", [0] * {{ valueType.elementScalarSize }})),
+            lambda: values.extend([{{ GenElement(valueType.elementType, 1) }}]),
+            lambda: values.resize(10000),
+            lambda: values.reserve(10000),
+            lambda: values.clear(),
+            lambda: values.__delitem__(0),
+        ):
+            with self.assertRaises(BufferError):
+                resize()
+        self.assertEqual(len(values), 4)
+
+        # Once the export is released, the array can be resized again.
+        view.release()
+        values.resize(10000)
+        self.assertEqual(len(values), 10000)
+
+    def testBufferInitialization(self):
+        buf = array.array("{{ typeCode }}", range({{ valueType.elementScalarSize * 3 }}))
+        values = gm.{{ valueType.className }}(buf)
+        self.assertEqual(len(values), 3)
+        self.assertEqual(memoryview(values).tobytes(), buf.tobytes())
+
+    def testBufferInitializationMismatch(self):
+        with self.assertRaises(TypeError):
+            gm.{{ valueType.className }}(array.array("d", [0.0] * {{ valueType.elementScalarSize }}))
+{% if valueType.elementScalarSize > 1 %}
+        with self.assertRaises(ValueError):
+            gm.{{ valueType.className }}(array.array("{{ typeCode }}", [0] * {{ valueType.elementScalarSize + 1 }}))
+{%- endif %}
+
+    def testPickle(self):
+        values = gm.{{ valueType.className }}([
+            {{ GenElement(valueType.elementType, 1) }},
+            {{ GenElement(valueType.elementType, 2) }},
+        ])
+        self.assertEqual(pickle.loads(pickle.dumps(values)), values)
+
+    def testPickleProtocols(self):
+        values = gm.{{ valueType.className }}([
+            {{ GenElement(valueType.elementType, 1) }},
+            {{ GenElement(valueType.elementType, 2) }},
+        ])
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(values, protocol=protocol)), values)
+
+    @unittest.skipIf(pickle.HIGHEST_PROTOCOL < 5, "Requires pickle protocol 5.")
+    def testPickleOutOfBand(self):
+        values = gm.{{ valueType.className }}(array.array("{{ typeCode }}", range({{ valueType.elementScalarSize * 3 }})))
+        buffers = []
+        data = pickle.dumps(values, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(pickle.loads(data, buffers=buffers), values)
+
+        # The out-of-band buffers can be transferred as raw bytes.
+        self.assertEqual(pickle.loads(data, buffers=[buffer.raw().tobytes() for buffer in buffers]), values)
+
+        empty = gm.{{ valueType.className }}()
+        self.assertEqual(pickle.loads(pickle.dumps(empty, protocol=5)), empty)
+
+    def testToBytes(self):
+        values = gm.{{ valueType.className }}(array.array("{{ typeCode }}", range({{ valueType.elementScalarSize * 3 }})))
+        data = values.to_bytes()
+        self.assertEqual(data, struct.pack("<{{ valueType.elementScalarSize * 3 }}{{ typeCode }}", *range({{ valueType.elementScalarSize * 3 }})))
+        self.assertEqual(gm.{{ valueType.className }}.from_bytes(data), values)
+        self.assertEqual(gm.{{ valueType.className }}.from_bytes(bytearray(data)), values)
+        self.assertEqual(len(gm.{{ valueType.className }}.from_bytes(b"")), 0)
+
+    def testFromBytesMismatch(self):
+        with self.assertRaises(ValueError):
+            gm.{{ valueType.className }}.from_bytes(b"\x00" * {{ valueType.elementScalarSize * 4 + 1 }})
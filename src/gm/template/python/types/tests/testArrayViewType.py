@@ -0,0 +1,86 @@
+import array
+import pickle
+import unittest
+import gm
+
+{% set typeCode = "f" if valueType.isFloatingPoint else "i" %}
+{% set viewName = valueType.className + "View" %}
+{% set scalarCount = valueType.elementScalarSize * 3 %}
+
+class Test{{ viewName }}(unittest.TestCase):
+
+    def testBufferView(self):
+        buf = array.array("{{ typeCode }}", range({{ scalarCount }}))
+        view = gm.{{ viewName }}(buf)
+        self.assertEqual(len(view), 3)
+        self.assertEqual(gm.{{ viewName }}.elementByteSize, {{ valueType.elementScalarSize * 4 }})
+        self.assertFalse(view.readOnly)
+        self.assertIs(view.owner, buf)
+        self.assertEqual(view.Copy(), gm.{{ valueType.className }}(buf))
+
+        # Writes through the view are visible in the viewed buffer.
+        view[2] = view[0]
+        self.assertEqual(buf[{{ valueType.elementScalarSize * 2 }}:].tolist(), buf[:{{ valueType.elementScalarSize }}].tolist())
+
+    def testBytesView(self):
+        data = gm.{{ valueType.className }}(array.array("{{ typeCode }}", range({{ scalarCount }}))).to_bytes()
+        view = gm.{{ viewName }}(data)
+        self.assertTrue(view.readOnly)
+        self.assertEqual(view.to_bytes(), data)
+        with self.assertRaises(TypeError):
+            view[0] = view[1]
+
+    def testOffsetAndSize(self):
+        buf = array.array("{{ typeCode }}", range({{ scalarCount }}))
+        view = gm.{{ viewName }}(buf, byteOffset={{ valueType.elementScalarSize * 4 }}, size=1)
+        self.assertEqual(len(view), 1)
+        self.assertEqual(view.byteOffset, {{ valueType.elementScalarSize * 4 }})
+        self.assertEqual(memoryview(view).tobytes(), buf[{{ valueType.elementScalarSize }}:{{ valueType.elementScalarSize * 2 }}].tobytes())
+
+        with self.assertRaises(ValueError):
+            gm.{{ viewName }}(buf, byteOffset={{ valueType.elementScalarSize * 4 }}, size=3)
+        with self.assertRaises(TypeError):
+            gm.{{ viewName }}(array.array("d", [0.0] * {{ valueType.elementScalarSize }}))
+
+    def testSlice(self):
+        buf = array.array("{{ typeCode }}", range({{ scalarCount }}))
+        view = gm.{{ viewName }}(buf)[1:]
+        self.assertEqual(len(view), 2)
+        self.assertEqual(view.byteOffset, {{ valueType.elementScalarSize * 4 }})
+        self.assertEqual(memoryview(view).tobytes(), buf[{{ valueType.elementScalarSize }}:].tobytes())
+        with self.assertRaises(ValueError):
+            gm.{{ viewName }}(buf)[::2]
+
+    def testRelease(self):
+        view = gm.{{ viewName }}(array.array("{{ typeCode }}", range({{ scalarCount }})))
+        view.Release()
+        self.assertEqual(len(view), 0)
+        self.assertIsNone(view.owner)
+
+    def testSharedMemory(self):
+        view = gm.{{ viewName }}.CreateShared(3)
+        try:
+            memoryview(view).cast("B")[:] = array.array("{{ typeCode }}", range({{ scalarCount }})).tobytes()
+            attached = gm.{{ viewName }}.AttachShared(view.owner.name, size=3)
+            self.assertEqual(attached.Copy(), view.Copy())
+
+            # Shared views are pickled by name.
+            copied = pickle.loads(pickle.dumps(view[1:]))
+            self.assertEqual(copied.owner.name, view.owner.name)
+            self.assertEqual(copied.Copy(), view[1:].Copy())
+
+            for sharedView in (attached, copied):
+                owner = sharedView.owner
+                sharedView.Release()
+                owner.close()
+        finally:
+            owner = view.owner
+            view.Release()
+            owner.close()
+            owner.unlink()
+
+    def testPickleCopy(self):
+        view = gm.{{ viewName }}(array.array("{{ typeCode }}", range({{ scalarCount }})))
+        copied = pickle.loads(pickle.dumps(view))
+        self.assertFalse(copied.readOnly)
+        self.assertEqual(copied.Copy(), view.Copy())
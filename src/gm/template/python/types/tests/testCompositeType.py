@@ -1,6 +1,9 @@
+import pickle
 import unittest
 import gm
 
+{% import "python/types/typeUtils.py" as typeUtils %}
+
 class Test{{ valueType.className }}(unittest.TestCase):
 
     def testDefaultInitialization(self):
@@ -15,3 +18,19 @@ class Test{{ valueType.className }}(unittest.TestCase):
 {%- endif -%}
 {%- endfor -%}
         )
+
+    def testPickle(self):
+        {{ valueType.varName }} = gm.{{ valueType.className }}(
+{%- for element in valueType.elements -%}
+            {{ typeUtils.GenUniformSequence(element.type, loop.index) }}
+{%- if not loop.last -%}
+        ,{{ " " }}
+{%- endif -%}
+{%- endfor -%}
+        )
+        self.assertEqual(gm.{{ valueType.className }}.from_bytes({{ valueType.varName }}.to_bytes()).{{ valueType.elements[0].name }}, {{ valueType.varName }}.{{ valueType.elements[0].name }})
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copied = pickle.loads(pickle.dumps({{ valueType.varName }}, protocol=protocol))
+{%- for element in valueType.elements + valueType.derivedElements %}
+            self.assertEqual(copied.{{ element.name }}, {{ valueType.varName }}.{{ element.name }})
+{%- endfor %}
@@ -0,0 +1,6 @@
+{% extends "python/types/tests/testVectorType.py" %}
+
+{% block tests %}
+    def testIdentity(self):
+        self.assertEqual(gm.{{ valueType.className }}.Identity(), gm.{{ valueType.className }}(0, 0, 0, 1))
+{% endblock %}
@@ -1,6 +1,9 @@
+import pickle
 import unittest
 import gm
 
+{% import "python/types/typeUtils.py" as typeUtils %}
+
 class Test{{ valueType.className }}(unittest.TestCase):
 
     def testDefaultInitialization(self):
@@ -16,3 +19,21 @@ class Test{{ valueType.className }}(unittest.TestCase):
             gm.{{ valueType.elementType.className }}(),
 {%- endif -%}
         )
+
+    def testToBytes(self):
+        value = {{- typeUtils.GenArithmeticRange(valueType, 1, 2) }}
+        data = value.to_bytes()
+        self.assertEqual(len(data), {{ 2 * (1 if valueType.elementType.isScalar else valueType.elementType.elementSize) * 4 }})
+        copied = gm.{{ valueType.className }}.from_bytes(data)
+        self.assertEqual(copied.min, value.min)
+        self.assertEqual(copied.max, value.max)
+
+        with self.assertRaises(ValueError):
+            gm.{{ valueType.className }}.from_bytes(data + data)
+
+    def testPickle(self):
+        value = {{- typeUtils.GenArithmeticRange(valueType, 1, 2) }}
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            copied = pickle.loads(pickle.dumps(value, protocol=protocol))
+            self.assertEqual(copied.min, value.min)
+            self.assertEqual(copied.max, value.max)
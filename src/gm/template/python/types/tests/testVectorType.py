@@ -1,3 +1,6 @@
+import array
+import pickle
+import struct
 import unittest
 import gm
 
@@ -34,6 +37,53 @@ class Test{{ valueType.className }}(unittest.TestCase):
         self.assertAlmostEqual({{ valueType.varName }}[ {{ index }} ], {{ valueType.PyValue(index * 2) }})
 {%- endfor %}
 
+    def testBufferProtocol(self):
+        {{ valueType.varName }} = {{- typeUtils.GenArithmeticSequence(valueType, 2) }}
+        view = memoryview({{ valueType.varName }})
+        self.assertEqual(view.format, "{{ "f" if valueType.isFloatingPoint else "i" }}")
+        self.assertEqual(view.shape, {{ valueType.shape }})
+        self.assertEqual(view.nbytes, {{ valueType.elementSize * 4 }})
+
+        # Writes through the view are visible on the source object.
+        view{{ "[0, 0]" if valueType.shape|length == 2 else "[0]" }} = {{ valueType.PyValue(7) }}
+        self.assertEqual({{ valueType.varName }}[0], {{ valueType.PyValue(7) }})
+
+    def testBufferInitialization(self):
+        buf = array.array("{{ "f" if valueType.isFloatingPoint else "i" }}", [
+{%- for index in range(valueType.elementSize) -%}
+    {{ valueType.PyValue(index * 2) }}
+{%- if index + 1 < valueType.elementSize -%}
+        ,{{ " " }}
+{%- endif -%}
+{%- endfor -%}
+        ])
+        self.assertEqual(gm.{{ valueType.className }}(buf), {{- typeUtils.GenArithmeticSequence(valueType, 2) -}})
+
+        # Round trip through another instance.
+        {{ valueType.varName }} = {{- typeUtils.GenArithmeticSequence(valueType, 2) }}
+        self.assertEqual(gm.{{ valueType.className }}({{ valueType.varName }}), {{ valueType.varName }})
+
+    def testBufferInitializationMismatch(self):
+        with self.assertRaises(TypeError):
+            gm.{{ valueType.className }}(array.array("d", [0.0] * {{ valueType.elementSize }}))
+
+        with self.assertRaises(ValueError):
+            gm.{{ valueType.className }}(array.array("{{ "f" if valueType.isFloatingPoint else "i" }}", [0] * {{ valueType.elementSize + 1 }}))
+
+    def testToBytes(self):
+        {{ valueType.varName }} = {{- typeUtils.GenArithmeticSequence(valueType, 2) }}
+        data = {{ valueType.varName }}.to_bytes()
+        self.assertEqual(data, struct.pack("<{{ valueType.elementSize }}{{ "f" if valueType.isFloatingPoint else "i" }}", *[{{ valueType.varName }}[index] for index in range({{ valueType.elementSize }})]))
+        self.assertEqual(gm.{{ valueType.className }}.from_bytes(data), {{ valueType.varName }})
+
+        with self.assertRaises(ValueError):
+            gm.{{ valueType.className }}.from_bytes(data[:-1])
+
+    def testPickle(self):
+        {{ valueType.varName }} = {{- typeUtils.GenArithmeticSequence(valueType, 2) }}
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps({{ valueType.varName }}, protocol=protocol)), {{ valueType.varName }})
+
 {% if valueType.shape|length == 2 %}
     def testMatrixElementReadAccess(self):
         {{ valueType.varName }} = {{- typeUtils.GenArithmeticSequence(valueType, 1) -}}
@@ -65,3 +115,4 @@ class Test{{ valueType.className }}(unittest.TestCase):
         {{ valueType.varName }}.{{ namedElement.name }} = {{ loop.index0 }}
         self.assertEqual({{ valueType.varName }}[{{ loop.index0 }}], {{ loop.index0 }})
 {% endfor %}
+{% block tests %}{% endblock %}
@@ -48,3 +48,13 @@
     )
 {%- endif -%}
 {% endmacro %}
+
+{#
+    Python utility macro to generate a range value with arithmetically increasing elements.
+#}
+{% macro GenArithmeticRange(rangeType, minValue, maxValue) -%}
+    gm.{{ rangeType.className }}(
+        {{- GenArithmeticSequence(rangeType.elementType, minValue) -}},
+        {{- GenArithmeticSequence(rangeType.elementType, maxValue) -}}
+    )
+{%- endmacro %}
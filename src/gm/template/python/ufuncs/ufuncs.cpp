@@ -0,0 +1,70 @@
+// NumPy universal functions, evaluating each batchable function interface with the active kernel set.
+//
+// Each ufunc is named after the kernel of its interface, e.g. DotProduct_Vec3f_Vec3f, and composes with the
+// NumPy iteration machinery: broadcasting of the outer dimensions, out= arguments and type casting.  Interfaces
+// over scalar operands are element-wise ufuncs, the others are generalized ufuncs with fixed core dimensions.
+
+#include "ufunc.h"
+
+namespace
+{
+{% set NUMPY_TYPES = {"float": "NPY_FLOAT", "int": "NPY_INT", "bool": "NPY_BOOL"} -%}
+{#- Functions which are associative and commutative, whose reductions can be evaluated in any order. #}
+{% set REORDERABLE_FUNCTIONS = ["Min", "Max"] -%}
+{% for function in functions -%}
+{% for interface in function.kernelInterfaces -%}
+{% set kernelName = function.KernelName(interface) -%}
+{% set operandTypes = interface.ufuncOperandTypes -%}
+void {{ kernelName }}( char** i_args, const npy_intp* i_dimensions, const npy_intp* i_steps, void* )
+{
+    const npy_intp* coreSteps = i_steps + {{ operandTypes|length }};
+    const gm_ufuncs::UfuncOperand operands[] = {
+{%- for valueType in operandTypes %}
+        gm_ufuncs::MakeUfuncOperand< {{ UfuncScalarType(valueType).className }} >( i_args[ {{ loop.index0 }} ], i_steps[ {{ loop.index0 }} ], { {{- UfuncCoreShape(valueType)|join(", ") -}} }, coreSteps ),
+{%- endfor %}
+    };
+    gm_ufuncs::EvaluateUfunc( &gm_kernels::KernelSet::{{ kernelName }}, i_dimensions[ 0 ], operands, {{ interface.inputArguments|length }} );
+}
+
+PyUFuncGenericFunction s_{{ kernelName }}Loop[] = { &{{ kernelName }} };
+char s_{{ kernelName }}Types[] = {
+{%- for valueType in operandTypes -%}
+    {{ NUMPY_TYPES[UfuncScalarType(valueType).className] }}{% if not loop.last %}, {% endif %}
+{%- endfor -%}
+};
+
+{% endfor -%}
+{% endfor %}
+} // namespace
+
+// Bind the ufuncs into the gm.ufuncs submodule \p o_module, importing NumPy.
+void BindUfuncs( pybind11::module& o_module )
+{
+    if ( _import_array() < 0 || _import_umath() < 0 )
+    {
+        throw pybind11::error_already_set();
+    }
+
+{% for function in functions -%}
+{% for interface in function.kernelInterfaces -%}
+{% set kernelName = function.KernelName(interface) -%}
+    gm_ufuncs::AddUfunc( o_module,
+                         "{{ kernelName }}",
+                         "Evaluate {{ function.name }} over arrays of ( {{ interface.arguments|map(attribute="type.className")|join(", ") }} ) elements.",
+                         s_{{ kernelName }}Loop,
+                         s_{{ kernelName }}Types,
+                         {{ interface.inputArguments|length }},
+                         {{ interface.ufuncOperandTypes|length - interface.inputArguments|length }},
+{%- if function.name in REORDERABLE_FUNCTIONS %}
+                         PyUFunc_ReorderableNone,
+{%- else %}
+                         PyUFunc_None,
+{%- endif %}
+{%- if interface.ufuncSignature %}
+                         "{{ interface.ufuncSignature }}" );
+{%- else %}
+                         nullptr );
+{%- endif %}
+{% endfor -%}
+{% endfor %}
+}
@@ -0,0 +1,16 @@
+#pragma once
+
+// Visibility of the internal classes of the python module.
+//
+// pybind11 declares its namespace with hidden visibility, such that GCC warns about classes of default visibility
+// holding pybind11 objects as fields (-Wattributes: declared with greater visibility than the type of its field).
+// These classes are internal to the python module, and are declared hidden too.
+
+/// \def GM_PYTHON_HIDDEN
+///
+/// Hidden visibility of a class internal to the python module.
+#if defined( __GNUG__ )
+#define GM_PYTHON_HIDDEN __attribute__( ( visibility( "hidden" ) ) )
+#else
+#define GM_PYTHON_HIDDEN
+#endif
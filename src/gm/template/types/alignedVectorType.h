@@ -0,0 +1,44 @@
+{% extends "types/vectorType.h" %}
+
+{% block includes %}
+{{ super() }}
+#include <gm/types/{{ valueType.unalignedType.headerFileName }}>
+{% endblock %}
+
+{% block classDoc %}
+///
+/// Over-aligned variant of \ref {{ valueType.unalignedType.className }}, stored at {{ valueType.alignment }} byte aligned addresses.
+///
+/// The storage is padded to a multiple of the alignment, such that the elements of packed arrays of this type
+/// never straddle an alignment boundary, and can be loaded with aligned SIMD instructions.  Use the explicit
+/// conversions to exchange values with the packed, unaligned \ref {{ valueType.unalignedType.className }}.
+///
+/// \note Prior to C++17, operator new is not required to honor alignments larger than that of std::max_align_t,
+/// such that heap allocated storage of this type must be allocated with an aligned allocator.
+{%- endblock %}
+
+{% block classAlignment %}alignas( {{ valueType.alignment }} ) {% endblock %}
+
+{% block conversions %}
+    // --------------------------------------------------------------------- //
+    /// \name Conversion from and to the unaligned type
+    // --------------------------------------------------------------------- //
+
+    /// Construct from the unaligned \ref {{ valueType.unalignedType.className }}.
+    ///
+    /// \param i_{{ valueType.varName }} the unaligned source {{ valueType.varName }}.
+    GM_HOST_DEVICE explicit inline {{ valueType.className }}( const {{ valueType.unalignedType.className }}& i_{{ valueType.varName }} )
+    {
+        std::memcpy( m_elements, i_{{ valueType.varName }}.Data(), sizeof( m_elements ) );
+    }
+
+    /// Get the unaligned \ref {{ valueType.unalignedType.className }} representation of this {{ valueType.varName }}.
+    ///
+    /// \return the unaligned {{ valueType.varName }}, with equal element values.
+    GM_HOST_DEVICE inline {{ valueType.unalignedType.className }} GetUnaligned() const
+    {
+        {{ valueType.unalignedType.className }} {{ valueType.varName }};
+        std::memcpy( {{ valueType.varName }}.Data(), m_elements, sizeof( m_elements ) );
+        return {{ valueType.varName }};
+    }
+{%- endblock %}
@@ -0,0 +1,25 @@
+{% extends "types/typeBase.h" %}
+
+{% block includes %}
+#include <vector>
+
+{% if not valueType.elementType.isScalar -%}
+#include <gm/types/{{ valueType.elementType.headerFileName }}>
+{%- endif %}
+{% endblock %}
+
+{% block body %}
+/// \typedef {{ valueType.className }}
+/// \ingroup gm_types_{{ valueType.CATEGORY }}
+///
+/// Type definition of a packed, contiguous and resizable array of {{ valueType.elementType.className }}(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as {{ valueType.elementScalarSize }} {{ valueType.scalarType.className }}(s) per element.
+using {{ valueType.className }} = std::vector< {{ valueType.elementType.className }} >;
+
+{% if not valueType.elementType.isScalar -%}
+static_assert( sizeof( {{ valueType.elementType.className }} ) == sizeof( {{ valueType.scalarType.className }} ) * {{ valueType.elementScalarSize }},
+               "{{ valueType.elementType.className }} must be tightly packed for {{ valueType.className }} storage." );
+{%- endif %}
+{% endblock %}
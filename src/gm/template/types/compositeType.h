@@ -6,7 +6,7 @@
 #include {{ include }}
 {% endfor %}
 
-{% for element in valueType.elements -%}
+{% for element in valueType.elements + valueType.derivedElements -%}
 {% if element.type.isVector or element.type.isComposite -%}
 #include <gm/types/{{ element.type.headerFileName }}>
 {%- endif %}
@@ -22,6 +22,15 @@
 {% for element in valueType.elements -%}
 /// - {{ element.name }} (\ref {{ element.type.className }})
 {% endfor -%}
+{% if valueType.derivedElements -%}
+///
+/// And derived elements, computed from the above upon construction:
+{% for element in valueType.derivedElements -%}
+/// - {{ element.name }} (\ref {{ element.type.className }})
+{% endfor -%}
+///
+/// The elements are immutable, such that the derived elements remain consistent.
+{% endif -%}
 class {{ valueType.className }} final
 {
 public:
@@ -33,7 +42,7 @@ public:
     GM_HOST_DEVICE constexpr inline {{ valueType.className }}()  = default;
 
     /// Element-wise constructor.
-    GM_HOST_DEVICE explicit constexpr inline {{ valueType.className }}(
+    GM_HOST_DEVICE explicit {% if valueType.isMutable %}constexpr {% endif %}inline {{ valueType.className }}(
 {% for index in range(valueType.elementSize) -%}
         const {{ valueType.elements[ index ].type.className }}& i_{{ valueType.elements[ index ].name }}
 {%- if index + 1 < valueType.elementSize -%}
@@ -48,6 +57,9 @@ public:
         ,
 {%- endif -%}
         m_{{ valueType.elements[ index ].name }}( i_{{ valueType.elements[ index ].name }} )
+{%- endfor %}
+{%- for element in valueType.derivedElements -%}
+        , m_{{ element.name }}( {{ element.initializer }} )
 {%- endfor %}
     {
     }
@@ -56,18 +68,19 @@ public:
     /// \name Element access
     // --------------------------------------------------------------------- //
 
-{% for element in valueType.elements %}
+{% for element in valueType.elements + valueType.derivedElements %}
     /// Const accessor for "{{ element.name }}".
     GM_HOST_DEVICE inline const {{ element.type.className }}& {{ element.accessorName }}() const
     {
         return m_{{ element.name }};
     }
-
+{% if valueType.isMutable %}
     /// Mutable accessor for "{{ element.name }}".
     GM_HOST_DEVICE inline {{ element.type.className }}& {{ element.accessorName }}()
     {
         return m_{{ element.name }};
     }
+{% endif -%}
 {% endfor %}
 
     // --------------------------------------------------------------------- //
@@ -106,6 +119,13 @@ private:
 {%- endif -%}
     ;
 {%- endfor %}
+{%- if valueType.derivedElements %}
+
+    // Derived element members.
+{% for element in valueType.derivedElements -%}
+    {{ element.type.className }} m_{{ element.name }};
+{%- endfor %}
+{%- endif %}
 };
 
 /// Operator overload for << to enable writing the string representation of \p i_composite into an output
@@ -0,0 +1,183 @@
+{% extends "types/typeBase.h" %}
+
+{% block includes %}
+#include <sstream>
+
+#include <gm/base/diagnostic.h>
+
+#include <gm/types/{{ valueType.elementType.headerFileName }}>
+{% endblock %}
+
+{% block body %}
+/// \class {{ valueType.className }}
+/// \ingroup gm_types_{{ valueType.CATEGORY }}
+///
+/// Structure-of-arrays packet of {{ valueType.laneCount }} \ref {{ valueType.elementType.className }} lanes.
+///
+/// Each of the {{ valueType.componentCount }} scalar components of a lane is stored in a separate, contiguous
+/// and aligned array spanning all the lanes, such that a single component of multiple lanes can be
+/// loaded into a SIMD register at once.
+class alignas( {{ valueType.alignment }} ) {{ valueType.className }} final
+{
+public:
+    /// \typedef ElementType
+    ///
+    /// Convenience type definition of the value type of a single lane.
+    using ElementType = {{ valueType.elementType.className }};
+
+    /// The number of lanes.
+    static constexpr size_t c_laneCount = {{ valueType.laneCount }};
+
+    /// The number of scalar components in a single lane.
+    static constexpr size_t c_componentCount = {{ valueType.componentCount }};
+
+    // --------------------------------------------------------------------- //
+    /// \name Construction
+    // --------------------------------------------------------------------- //
+
+    /// Default constructor, initializing all of the lane components to 0.
+    GM_HOST_DEVICE constexpr inline {{ valueType.className }}() = default;
+
+    /// Broadcast constructor, initializing all of the lanes to \p i_value.
+    GM_HOST_DEVICE explicit inline {{ valueType.className }}( const {{ valueType.elementType.className }}& i_value )
+    {
+        for ( size_t laneIndex = 0; laneIndex < c_laneCount; ++laneIndex )
+        {
+            SetLane( laneIndex, i_value );
+        }
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Lane access
+    // --------------------------------------------------------------------- //
+
+    /// Get the value of a single lane.
+    ///
+    /// \param i_laneIndex index of the lane.
+    ///
+    /// \pre \p i_laneIndex must be less than {{ valueType.laneCount }}.
+    ///
+    /// \return lane value.
+    GM_HOST_DEVICE inline {{ valueType.elementType.className }} GetLane( size_t i_laneIndex ) const
+    {
+        GM_ASSERT( i_laneIndex < c_laneCount );
+        return {{ valueType.elementType.className }}(
+{%- for component in range(valueType.componentCount) -%}
+            m_lanes[ {{ component }} ][ i_laneIndex ]{% if not loop.last %},{% endif %}
+{%- endfor -%}
+        );
+    }
+
+    /// Set the value of a single lane.
+    ///
+    /// \param i_laneIndex index of the lane.
+    /// \param i_value the lane value.
+    ///
+    /// \pre \p i_laneIndex must be less than {{ valueType.laneCount }}.
+    GM_HOST_DEVICE inline void SetLane( size_t i_laneIndex, const {{ valueType.elementType.className }}& i_value )
+    {
+        GM_ASSERT( i_laneIndex < c_laneCount );
+{% for component in range(valueType.componentCount) -%}
+{% if valueType.elementType.isVector -%}
+        m_lanes[ {{ component }} ][ i_laneIndex ] = i_value[ {{ component }} ];
+{% else -%}
+        m_lanes[ {{ component }} ][ i_laneIndex ] = i_value.{{ "Min" if component == 0 else "Max" }}();
+{% endif -%}
+{% endfor -%}
+    }
+
+    /// Scalar component read access of a single lane.
+    ///
+    /// \param i_componentIndex index of the component within the lane.
+    /// \param i_laneIndex index of the lane.
+    ///
+    /// \return immutable component value.
+    GM_HOST_DEVICE inline const {{ valueType.scalarType.className }}& operator()( size_t i_componentIndex, size_t i_laneIndex ) const
+    {
+        GM_ASSERT( i_componentIndex < c_componentCount );
+        GM_ASSERT( i_laneIndex < c_laneCount );
+        return m_lanes[ i_componentIndex ][ i_laneIndex ];
+    }
+
+    /// Scalar component write access of a single lane.
+    ///
+    /// \param i_componentIndex index of the component within the lane.
+    /// \param i_laneIndex index of the lane.
+    ///
+    /// \return mutable component value.
+    GM_HOST_DEVICE inline {{ valueType.scalarType.className }}& operator()( size_t i_componentIndex, size_t i_laneIndex )
+    {
+        GM_ASSERT( i_componentIndex < c_componentCount );
+        GM_ASSERT( i_laneIndex < c_laneCount );
+        return m_lanes[ i_componentIndex ][ i_laneIndex ];
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Raw lane storage access
+    // --------------------------------------------------------------------- //
+
+    /// Immutable access to the contiguous array of a single component, across all the lanes.
+    ///
+    /// \param i_componentIndex index of the component.
+    ///
+    /// \return pointer to the component of the first lane, aligned to {{ valueType.alignment }} bytes.
+    GM_HOST_DEVICE inline const {{ valueType.scalarType.className }}* Lanes( size_t i_componentIndex ) const
+    {
+        GM_ASSERT( i_componentIndex < c_componentCount );
+        return m_lanes[ i_componentIndex ];
+    }
+
+    /// Mutable access to the contiguous array of a single component, across all the lanes.
+    ///
+    /// \param i_componentIndex index of the component.
+    ///
+    /// \return pointer to the component of the first lane, aligned to {{ valueType.alignment }} bytes.
+    GM_HOST_DEVICE inline {{ valueType.scalarType.className }}* Lanes( size_t i_componentIndex )
+    {
+        GM_ASSERT( i_componentIndex < c_componentCount );
+        return m_lanes[ i_componentIndex ];
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Debug
+    // --------------------------------------------------------------------- //
+
+    /// Get the string representation.  For debugging purposes.
+    ///
+    /// \param i_classPrefix optional string to prefix class tokens.
+    ///
+    /// \return descriptive string representing this type instance.
+    inline std::string GetString( const std::string& i_classPrefix = std::string() ) const
+    {
+        std::stringstream ss;
+        ss << i_classPrefix << "{{ valueType.className }}( ";
+        for ( size_t laneIndex = 0; laneIndex < c_laneCount; ++laneIndex )
+        {
+            if ( laneIndex > 0 )
+            {
+                ss << ", ";
+            }
+            ss << GetLane( laneIndex ).GetString( i_classPrefix );
+        }
+        ss << " )";
+        return ss.str();
+    }
+
+private:
+    {{ valueType.scalarType.className }} m_lanes[ {{ valueType.componentCount }} ][ {{ valueType.laneCount }} ] = {};
+};
+
+/// Operator overload for << to enable writing the string representation of \p i_packet into an output
+/// stream \p o_outputStream.
+///
+/// \param o_outputStream the output stream to write into.
+/// \param i_packet the source packet.
+///
+/// \return the output stream.
+inline std::ostream& operator<<( std::ostream& o_outputStream, const {{ valueType.className }}& i_packet )
+{
+    o_outputStream << i_packet.GetString();
+    return o_outputStream;
+}
+
+{% endblock %}
@@ -0,0 +1,28 @@
+{% extends "types/vectorType.h" %}
+
+{% block classDoc %}
+///
+/// The elements are ordered (x, y, z, w), where x, y and z are the imaginary components and w is the real
+/// component.  A unit quaternion represents a rotation of \f$\theta\f$ radians about a unit axis \f$a\f$ as
+/// \f[
+/// q = ( a \sin( \theta / 2 ), \cos( \theta / 2 ) )
+/// \f]
+/// in a quarter of the storage of a \ref Mat4f.
+///
+/// Element-wise operations are inherited from the vector types, while the quaternion product, interpolation,
+/// vector rotation and matrix conversion are provided as functions.
+{%- endblock %}
+
+{% block identity %}
+    // --------------------------------------------------------------------- //
+    /// \name Quaternion identity element
+    // --------------------------------------------------------------------- //
+
+    /// Get the identity element for this quaternion type, representing no rotation.
+    ///
+    /// \return The identity element.
+    GM_HOST_DEVICE static constexpr inline {{ valueType.className }} Identity()
+    {
+        return {{ valueType.className }}( {{ valueType.CppValue( 0 ) }}, {{ valueType.CppValue( 0 ) }}, {{ valueType.CppValue( 0 ) }}, {{ valueType.CppValue( 1 ) }} );
+    }
+{%- endblock %}
@@ -0,0 +1,80 @@
+{#
+    C++ utility macros for generating the SIMD accelerated code paths of float vector types, see base/simd.h.
+
+    A type is accelerated if its elements can be evenly split into SSE (4 float) registers.
+#}
+
+{#
+    Whether the SIMD accelerated code paths are generated for ``valueType``.
+#}
+{% macro IsAccelerated(valueType) -%}
+{%- if valueType.isVector and valueType.isFloatingPoint and valueType.elementSize % 4 == 0 -%}
+True
+{%- endif -%}
+{%- endmacro %}
+
+{#
+    Generate an element-wise operation ``output[i] = lhs[i] <op> rhs[i]`` over all the elements of ``valueType``,
+    where ``output``, ``lhs`` and ``rhs`` are float pointer expressions.  If ``scalarRhs`` is set, then ``rhs`` is
+    instead a scalar expression broadcasted to all elements.
+
+    ``op`` is the name of the intrinsic operation, such as add, sub, mul or xor.
+
+    Must be generated within a GM_SIMD_SSE_ENABLED guarded block.  AVX registers are used if the elements
+    can be evenly split into them.  Aligned loads and stores are used if ``valueType`` is aligned to the
+    register width.
+#}
+{% macro ElementWise(valueType, op, output, lhs, rhs, scalarRhs=False) -%}
+{% set avxAccess = "" if valueType.isAligned and valueType.alignment >= 32 else "u" -%}
+{% set sseAccess = "" if valueType.isAligned and valueType.alignment >= 16 else "u" -%}
+{% if valueType.elementSize % 8 == 0 -%}
+#if defined( GM_SIMD_AVX2_ENABLED )
+{% for offset in range(0, valueType.elementSize, 8) -%}
+    _mm256_store{{ avxAccess }}_ps( {{ output }} + {{ offset }}, _mm256_{{ op }}_ps( _mm256_load{{ avxAccess }}_ps( {{ lhs }} + {{ offset }} ),
+{%- if scalarRhs -%}
+        _mm256_set1_ps( {{ rhs }} )
+{%- else -%}
+        _mm256_load{{ avxAccess }}_ps( {{ rhs }} + {{ offset }} )
+{%- endif -%}
+    ) );
+{% endfor -%}
+#else
+{% endif -%}
+{% for offset in range(0, valueType.elementSize, 4) -%}
+    _mm_store{{ sseAccess }}_ps( {{ output }} + {{ offset }}, _mm_{{ op }}_ps( _mm_load{{ sseAccess }}_ps( {{ lhs }} + {{ offset }} ),
+{%- if scalarRhs -%}
+        _mm_set1_ps( {{ rhs }} )
+{%- else -%}
+        _mm_load{{ sseAccess }}_ps( {{ rhs }} + {{ offset }} )
+{%- endif -%}
+    ) );
+{% endfor -%}
+{% if valueType.elementSize % 8 == 0 -%}
+#endif
+{% endif -%}
+{%- endmacro %}
+
+{#
+    SIMD register sets, from widest to narrowest, for generating code over lane-wide float arrays such as
+    the components of packet types.  Each entry describes:
+    - guard: the preprocessor definition enabling the register set.
+    - width: the number of float lanes per register.
+    - reg: the register type.
+    - prefix: the prefix of the intrinsic functions.
+#}
+{% set REGISTER_SETS = [
+    {"guard": "GM_SIMD_AVX2_ENABLED", "width": 8, "reg": "__m256", "prefix": "_mm256"},
+    {"guard": "GM_SIMD_SSE_ENABLED", "width": 4, "reg": "__m128", "prefix": "_mm"},
+] %}
+
+{#
+    Generate a lane-wise ordered comparison ``lhs <op> rhs`` of the ``registerSet`` (see REGISTER_SETS),
+    where ``op`` is one of LT, LE, GT or GE.
+#}
+{% macro Compare(registerSet, op, lhs, rhs) -%}
+{%- if registerSet.width == 8 -%}
+_mm256_cmp_ps( {{ lhs }}, {{ rhs }}, _CMP_{{ op }}_OQ )
+{%- else -%}
+_mm_cmp{{ op|lower }}_ps( {{ lhs }}, {{ rhs }} )
+{%- endif -%}
+{%- endmacro %}
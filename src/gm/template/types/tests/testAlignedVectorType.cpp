@@ -0,0 +1,24 @@
+{% extends "types/tests/testVectorType.cpp" %}
+
+{% block tests %}
+TEST_CASE( "{{ valueType.className }}_Alignment" )
+{
+    CHECK( alignof( gm::{{ valueType.className }} ) == {{ valueType.alignment }} );
+    CHECK( sizeof( gm::{{ valueType.className }} ) % {{ valueType.alignment }} == 0 );
+    CHECK( sizeof( gm::{{ valueType.className }} ) >= sizeof( gm::{{ valueType.unalignedType.className }} ) );
+
+    gm::{{ valueType.className }} {{ valueType.varName }}s[ 3 ];
+    for ( const gm::{{ valueType.className }}& {{ valueType.varName }} : {{ valueType.varName }}s )
+    {
+        CHECK( reinterpret_cast< uintptr_t >( {{ valueType.varName }}.Data() ) % {{ valueType.alignment }} == 0 );
+    }
+}
+
+TEST_CASE( "{{ valueType.className }}_UnalignedConversion" )
+{
+    gm::{{ valueType.unalignedType.className }} unaligned = {{- typeUtils.GenArithmeticSequence(valueType.unalignedType, 2) -}};
+    gm::{{ valueType.className }} aligned( unaligned );
+    CHECK( aligned == {{- typeUtils.GenArithmeticSequence(valueType, 2) -}} );
+    CHECK( aligned.GetUnaligned() == unaligned );
+}
+{% endblock %}
@@ -7,3 +7,13 @@ TEST_CASE( "{{ valueType.className }}_DefaultConstructor" )
     gm::{{ valueType.className }} {{ valueType.varName }};
     CHECK( {{ valueType.varName }}.size() == 0 );
 }
+
+TEST_CASE( "{{ valueType.className }}_ContiguousStorage" )
+{
+    gm::{{ valueType.className }} {{ valueType.varName }}( 5 );
+    CHECK( {{ valueType.varName }}.size() == 5 );
+
+    const {{ valueType.scalarType.className }}* first = reinterpret_cast< const {{ valueType.scalarType.className }}* >( &{{ valueType.varName }}[ 0 ] );
+    const {{ valueType.scalarType.className }}* last  = reinterpret_cast< const {{ valueType.scalarType.className }}* >( &{{ valueType.varName }}[ 4 ] );
+    CHECK( last - first == 4 * {{ valueType.elementScalarSize }} );
+}
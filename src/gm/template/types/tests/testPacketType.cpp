@@ -0,0 +1,58 @@
+#include <catch2/catch.hpp>
+
+#include <gm/types/{{ valueType.headerFileName }}>
+
+#include <cstdint>
+
+{% import "types/typeUtils.h" as typeUtils %}
+
+{#
+    Generate a lane value, seeded by ``value``.
+#}
+{% macro GenElement(elementType, value) %}
+{%- if elementType.isVector -%}
+    {{ typeUtils.GenUniformSequence(elementType, value) }}
+{%- else -%}
+    {{ typeUtils.GenRange(elementType, -value, value) }}
+{%- endif -%}
+{% endmacro %}
+
+TEST_CASE( "{{ valueType.className }}_DefaultConstructor" )
+{
+    gm::{{ valueType.className }} {{ valueType.varName }};
+    for ( size_t componentIndex = 0; componentIndex < {{ valueType.componentCount }}; ++componentIndex )
+    {
+        for ( size_t laneIndex = 0; laneIndex < {{ valueType.laneCount }}; ++laneIndex )
+        {
+            CHECK( {{ valueType.varName }}( componentIndex, laneIndex ) == {{ valueType.scalarType.CppValue(0) }} );
+        }
+    }
+}
+
+TEST_CASE( "{{ valueType.className }}_BroadcastConstructor" )
+{
+    gm::{{ valueType.className }} {{ valueType.varName }}( {{ GenElement(valueType.elementType, 2) }} );
+    for ( size_t laneIndex = 0; laneIndex < {{ valueType.laneCount }}; ++laneIndex )
+    {
+        CHECK( {{ valueType.varName }}.GetLane( laneIndex ) == {{ GenElement(valueType.elementType, 2) }} );
+    }
+}
+
+TEST_CASE( "{{ valueType.className }}_LaneAccess" )
+{
+    gm::{{ valueType.className }} {{ valueType.varName }};
+    {{ valueType.varName }}.SetLane( 0, {{ GenElement(valueType.elementType, 1) }} );
+    {{ valueType.varName }}.SetLane( {{ valueType.laneCount - 1 }}, {{ GenElement(valueType.elementType, 3) }} );
+    CHECK( {{ valueType.varName }}.GetLane( 0 ) == {{ GenElement(valueType.elementType, 1) }} );
+    CHECK( {{ valueType.varName }}.GetLane( 1 ) == {{ GenElement(valueType.elementType, 0) }} );
+    CHECK( {{ valueType.varName }}.GetLane( {{ valueType.laneCount - 1 }} ) == {{ GenElement(valueType.elementType, 3) }} );
+}
+
+TEST_CASE( "{{ valueType.className }}_StructureOfArraysStorage" )
+{
+    gm::{{ valueType.className }} {{ valueType.varName }};
+    {{ valueType.varName }}( 1, 2 ) = {{ valueType.scalarType.CppValue(5) }};
+    CHECK( {{ valueType.varName }}.Lanes( 1 )[ 2 ] == {{ valueType.scalarType.CppValue(5) }} );
+    CHECK( {{ valueType.varName }}.Lanes( 1 ) - {{ valueType.varName }}.Lanes( 0 ) == {{ valueType.laneCount }} );
+    CHECK( reinterpret_cast< std::uintptr_t >( {{ valueType.varName }}.Lanes( 0 ) ) % {{ valueType.alignment }} == 0 );
+}
@@ -0,0 +1,12 @@
+{% extends "types/tests/testVectorType.cpp" %}
+
+{% block tests %}
+TEST_CASE( "{{ valueType.className }}_Identity" )
+{
+    gm::{{ valueType.className }} {{ valueType.varName }} = gm::{{ valueType.className }}::Identity();
+    CHECK( {{ valueType.varName }}.X() == {{ valueType.CppValue( 0 ) }} );
+    CHECK( {{ valueType.varName }}.Y() == {{ valueType.CppValue( 0 ) }} );
+    CHECK( {{ valueType.varName }}.Z() == {{ valueType.CppValue( 0 ) }} );
+    CHECK( {{ valueType.varName }}.W() == {{ valueType.CppValue( 1 ) }} );
+}
+{% endblock %}
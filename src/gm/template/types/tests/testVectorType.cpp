@@ -43,6 +43,17 @@ TEST_CASE( "{{ valueType.className }}_ElementWriteAccess" )
 {%- endfor %}
 }
 
+TEST_CASE( "{{ valueType.className }}_DataAccess" )
+{
+    gm::{{ valueType.className }} {{ valueType.varName }} = {{- typeUtils.GenArithmeticSequence(valueType, 2) -}};
+    {{ valueType.elementType.className }}* data = {{ valueType.varName }}.Data();
+{% for index in range(valueType.elementSize) -%}
+    CHECK( data[ {{ index }} ] == {{ valueType.CppValue(index * 2) }} );
+{%- endfor %}
+    data[ 0 ] = {{ valueType.CppValue(7) }};
+    CHECK( {{ valueType.varName }}[ 0 ] == {{ valueType.CppValue(7) }} );
+}
+
 {% if valueType.shape|length == 2 -%}
 TEST_CASE( "{{ valueType.className }}_MatrixElementReadAccess" )
 {
@@ -176,3 +187,4 @@ TEST_CASE( "{{ valueType.className }}_Negation" )
     CHECK( -{{ valueType.varName }} == {{- typeUtils.GenArithmeticSequence(valueType, -2) -}} );
 }
 
+{% block tests %}{% endblock %}
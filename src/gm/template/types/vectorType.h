@@ -1,11 +1,17 @@
 {% extends "types/typeBase.h" %}
 
+{% import "types/simdUtils.h" as simdUtils %}
+{% set accelerated = simdUtils.IsAccelerated(valueType) %}
+
 {% block includes %}
 #include <cmath>
 #include <cstring>
 #include <sstream>
 
 #include <gm/base/diagnostic.h>
+{% if accelerated -%}
+#include <gm/base/simd.h>
+{% endif -%}
 {% if valueType.isFloatingPoint -%}
 #include <gm/base/almost.h>
 {%- endif %}
@@ -16,7 +22,8 @@
 /// \ingroup gm_types_{{ valueType.CATEGORY }}
 ///
 /// Class definition of a {{ valueType.varName }} with {{ valueType.elementSize }} {{ valueType.elementType.className }} elements.
-class {{ valueType.className }} final
+{%- block classDoc %}{% endblock %}
+class {% block classAlignment %}{% endblock %}{{ valueType.className }} final
 {
 public:
     /// \typedef ElementType
@@ -90,6 +97,26 @@ public:
         return m_elements[ i_index ];
     }
 
+    // --------------------------------------------------------------------- //
+    /// \name Raw element storage access
+    // --------------------------------------------------------------------- //
+
+    /// Mutable access to the contiguous, row-major storage of the {{ valueType.elementSize }} elements.
+    ///
+    /// \return pointer to the first element.
+    GM_HOST_DEVICE inline {{ valueType.elementType.className }}* Data()
+    {
+        return m_elements;
+    }
+
+    /// Immutable access to the contiguous, row-major storage of the {{ valueType.elementSize }} elements.
+    ///
+    /// \return pointer to the first element.
+    GM_HOST_DEVICE inline const {{ valueType.elementType.className }}* Data() const
+    {
+        return m_elements;
+    }
+
 {% if valueType.shape|length == 2 -%}
     // --------------------------------------------------------------------- //
     /// \name Matrix row column indexed element access
@@ -160,6 +187,10 @@ public:
 
 {%- endif %}
 
+{%- block identity %}{% endblock %}
+
+{%- block conversions %}{% endblock %}
+
 {% if valueType.shape|length == 1 and valueType.elementSize <= 4 -%}
     // --------------------------------------------------------------------- //
     /// \name Named element access.
@@ -203,6 +234,13 @@ public:
     {
 {% if valueType.isFloatingPoint -%}
         GM_ASSERT( !HasNaNs() );
+{%- endif %}
+{%- if accelerated %}
+#if defined( GM_SIMD_SSE_ENABLED )
+        {{ valueType.className }} result;
+        {{ simdUtils.ElementWise(valueType, "add", "result.m_elements", "m_elements", "i_vector.m_elements") -}}
+        return result;
+#else
 {%- endif %}
         return {{ valueType.className }}(
 {% for index in range(valueType.elementSize) -%}
@@ -212,6 +250,9 @@ public:
 {%- endif %}
 {%- endfor %}
         );
+{%- if accelerated %}
+#endif
+{%- endif %}
     }
 
     /// Element-wise vector addition assignment.
@@ -220,9 +261,18 @@ public:
 {% if valueType.isFloatingPoint -%}
         GM_ASSERT( !HasNaNs() );
 {%- endif %}
+
+{%- if accelerated %}
+#if defined( GM_SIMD_SSE_ENABLED )
+        {{ simdUtils.ElementWise(valueType, "add", "m_elements", "m_elements", "i_vector.m_elements") -}}
+#else
+{%- endif %}
 {% for index in range(valueType.elementSize) -%}
         m_elements[ {{ index }} ] += i_vector.m_elements[ {{ index }} ];
 {%- endfor %}
+{%- if accelerated %}
+#endif
+{%- endif %}
         return *this;
     }
 
@@ -231,6 +281,13 @@ public:
     {
 {% if valueType.isFloatingPoint -%}
         GM_ASSERT( !HasNaNs() );
+{%- endif %}
+{%- if accelerated %}
+#if defined( GM_SIMD_SSE_ENABLED )
+        {{ valueType.className }} result;
+        {{ simdUtils.ElementWise(valueType, "sub", "result.m_elements", "m_elements", "i_vector.m_elements") -}}
+        return result;
+#else
 {%- endif %}
         return {{ valueType.className }}(
 {% for index in range(valueType.elementSize) -%}
@@ -240,6 +297,9 @@ public:
 {%- endif %}
 {%- endfor %}
         );
+{%- if accelerated %}
+#endif
+{%- endif %}
     }
 
     /// Vector subtraction assignment.
@@ -248,9 +308,18 @@ public:
 {% if valueType.isFloatingPoint -%}
         GM_ASSERT( !HasNaNs() );
 {%- endif %}
+
+{%- if accelerated %}
+#if defined( GM_SIMD_SSE_ENABLED )
+        {{ simdUtils.ElementWise(valueType, "sub", "m_elements", "m_elements", "i_vector.m_elements") -}}
+#else
+{%- endif %}
 {% for index in range(valueType.elementSize) -%}
         m_elements[ {{ index }} ] -= i_vector.m_elements[ {{ index }} ];
 {%- endfor %}
+{%- if accelerated %}
+#endif
+{%- endif %}
         return *this;
     }
 
@@ -260,9 +329,18 @@ public:
 {% if valueType.isFloatingPoint -%}
         GM_ASSERT( !HasNaNs() );
 {%- endif -%}
+
+{%- if accelerated %}
+#if defined( GM_SIMD_SSE_ENABLED )
+        {{ simdUtils.ElementWise(valueType, "mul", "m_elements", "m_elements", "i_scalar", scalarRhs=True) -}}
+#else
+{%- endif %}
 {% for index in range(valueType.elementSize) -%}
         m_elements[ {{ index }} ] *= i_scalar;
 {%- endfor %}
+{%- if accelerated %}
+#endif
+{%- endif %}
         return *this;
     }
 
@@ -275,6 +353,13 @@ public:
         GM_ASSERT( i_scalar != {{ valueType.CppValue(0) }} );
 {% if valueType.isFloatingPoint -%}
         {{ valueType.elementType.className }} reciprocal = {{ valueType.CppValue(1) }} / i_scalar;
+{%- if accelerated %}
+#if defined( GM_SIMD_SSE_ENABLED )
+        {{ valueType.className }} result;
+        {{ simdUtils.ElementWise(valueType, "mul", "result.m_elements", "m_elements", "reciprocal", scalarRhs=True) -}}
+        return result;
+#else
+{%- endif %}
         return {{ valueType.className }}(
 {% for index in range(valueType.elementSize) -%}
         m_elements[ {{ index }} ] * reciprocal
@@ -282,6 +367,10 @@ public:
         ,
 {%- endif %}
 {%- endfor %}
+        );
+{%- if accelerated %}
+#endif
+{%- endif %}
 {%- else -%}
         return {{ valueType.className }}(
 {% for index in range(valueType.elementSize) -%}
@@ -290,8 +379,8 @@ public:
         ,
 {%- endif %}
 {%- endfor %}
-{%- endif %}
         );
+{%- endif %}
     }
 
     /// Scalar division assignment.
@@ -303,9 +392,17 @@ public:
         GM_ASSERT( i_scalar != {{ valueType.CppValue(0) }} );
 {% if valueType.isFloatingPoint -%}
         {{ valueType.elementType.className }} reciprocal = {{ valueType.CppValue(1) }} / i_scalar;
+{%- if accelerated %}
+#if defined( GM_SIMD_SSE_ENABLED )
+        {{ simdUtils.ElementWise(valueType, "mul", "m_elements", "m_elements", "reciprocal", scalarRhs=True) -}}
+#else
+{%- endif %}
 {% for index in range(valueType.elementSize) -%}
         m_elements[ {{ index }} ] *= reciprocal;
 {%- endfor %}
+{%- if accelerated %}
+#endif
+{%- endif %}
 {%- else -%}
 {% for index in range(valueType.elementSize) -%}
         m_elements[ {{ index }} ] /= i_scalar;
@@ -319,6 +416,14 @@ public:
     {
 {% if valueType.isFloatingPoint -%}
         GM_ASSERT( !HasNaNs() );
+{%- endif %}
+{%- if accelerated %}
+#if defined( GM_SIMD_SSE_ENABLED )
+        // Flip the sign bits.
+        {{ valueType.className }} result;
+        {{ simdUtils.ElementWise(valueType, "xor", "result.m_elements", "m_elements", "-0.0f", scalarRhs=True) -}}
+        return result;
+#else
 {%- endif %}
         return {{ valueType.className }}(
 {% for index in range(valueType.elementSize) -%}
@@ -328,6 +433,9 @@ public:
 {%- endif %}
 {%- endfor %}
         );
+{%- if accelerated %}
+#endif
+{%- endif %}
     }
 
     // --------------------------------------------------------------------- //
@@ -434,6 +542,13 @@ GM_HOST_DEVICE inline {{ valueType.className }} operator*( const {{ valueType.cl
 {
 {% if valueType.isFloatingPoint -%}
     GM_ASSERT( !i_vector.HasNaNs() );
+{%- endif %}
+{%- if accelerated %}
+#if defined( GM_SIMD_SSE_ENABLED )
+    {{ valueType.className }} result;
+    {{ simdUtils.ElementWise(valueType, "mul", "result.Data()", "i_vector.Data()", "i_scalar", scalarRhs=True) -}}
+    return result;
+#else
 {%- endif %}
     return {{ valueType.className }}(
 {% for index in range(valueType.elementSize) -%}
@@ -443,6 +558,9 @@ GM_HOST_DEVICE inline {{ valueType.className }} operator*( const {{ valueType.cl
 {%- endif %}
 {%- endfor %}
     );
+{%- if accelerated %}
+#endif
+{%- endif %}
 }
 
 /// Scalar-vector multiplication.
@@ -450,6 +568,13 @@ GM_HOST_DEVICE inline {{ valueType.className }} operator*( const {{ valueType.el
 {
 {% if valueType.isFloatingPoint -%}
     GM_ASSERT( !i_vector.HasNaNs() );
+{%- endif %}
+{%- if accelerated %}
+#if defined( GM_SIMD_SSE_ENABLED )
+    {{ valueType.className }} result;
+    {{ simdUtils.ElementWise(valueType, "mul", "result.Data()", "i_vector.Data()", "i_scalar", scalarRhs=True) -}}
+    return result;
+#else
 {%- endif %}
     return {{ valueType.className }}(
 {% for index in range(valueType.elementSize) -%}
@@ -459,6 +584,9 @@ GM_HOST_DEVICE inline {{ valueType.className }} operator*( const {{ valueType.el
 {%- endif %}
 {%- endfor %}
     );
+{%- if accelerated %}
+#endif
+{%- endif %}
 }
 
 /// Operator overload for << to enable writing the string representation of \p i_vector into an output
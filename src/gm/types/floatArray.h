@@ -0,0 +1,25 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file floatArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+GM_NS_OPEN
+
+/// \typedef FloatArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of float(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 1 float(s) per element.
+using FloatArray = std::vector< float >;
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,30 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file floatRangeArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/floatRange.h>
+
+GM_NS_OPEN
+
+/// \typedef FloatRangeArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of FloatRange(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 2 float(s) per element.
+using FloatRangeArray = std::vector< FloatRange >;
+
+static_assert( sizeof( FloatRange ) == sizeof( float ) * 2,
+               "FloatRange must be tightly packed for FloatRangeArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
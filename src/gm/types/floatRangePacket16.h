@@ -0,0 +1,182 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file floatRangePacket16.h
+/// \ingroup gm_types_packet
+
+#include <gm/gm.h>
+
+#include <sstream>
+
+#include <gm/base/diagnostic.h>
+
+#include <gm/types/floatRange.h>
+
+GM_NS_OPEN
+
+/// \class FloatRangePacket16
+/// \ingroup gm_types_packet
+///
+/// Structure-of-arrays packet of 16 \ref FloatRange lanes.
+///
+/// Each of the 2 scalar components of a lane is stored in a separate, contiguous
+/// and aligned array spanning all the lanes, such that a single component of multiple lanes can be
+/// loaded into a SIMD register at once.
+class alignas( 32 ) FloatRangePacket16 final
+{
+public:
+    /// \typedef ElementType
+    ///
+    /// Convenience type definition of the value type of a single lane.
+    using ElementType = FloatRange;
+
+    /// The number of lanes.
+    static constexpr size_t c_laneCount = 16;
+
+    /// The number of scalar components in a single lane.
+    static constexpr size_t c_componentCount = 2;
+
+    // --------------------------------------------------------------------- //
+    /// \name Construction
+    // --------------------------------------------------------------------- //
+
+    /// Default constructor, initializing all of the lane components to 0.
+    GM_HOST_DEVICE constexpr inline FloatRangePacket16() = default;
+
+    /// Broadcast constructor, initializing all of the lanes to \p i_value.
+    GM_HOST_DEVICE explicit inline FloatRangePacket16( const FloatRange& i_value )
+    {
+        for ( size_t laneIndex = 0; laneIndex < c_laneCount; ++laneIndex )
+        {
+            SetLane( laneIndex, i_value );
+        }
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Lane access
+    // --------------------------------------------------------------------- //
+
+    /// Get the value of a single lane.
+    ///
+    /// \param i_laneIndex index of the lane.
+    ///
+    /// \pre \p i_laneIndex must be less than 16.
+    ///
+    /// \return lane value.
+    GM_HOST_DEVICE inline FloatRange GetLane( size_t i_laneIndex ) const
+    {
+        GM_ASSERT( i_laneIndex < c_laneCount );
+        return FloatRange( m_lanes[ 0 ][ i_laneIndex ], m_lanes[ 1 ][ i_laneIndex ] );
+    }
+
+    /// Set the value of a single lane.
+    ///
+    /// \param i_laneIndex index of the lane.
+    /// \param i_value the lane value.
+    ///
+    /// \pre \p i_laneIndex must be less than 16.
+    GM_HOST_DEVICE inline void SetLane( size_t i_laneIndex, const FloatRange& i_value )
+    {
+        GM_ASSERT( i_laneIndex < c_laneCount );
+        m_lanes[ 0 ][ i_laneIndex ] = i_value.Min();
+        m_lanes[ 1 ][ i_laneIndex ] = i_value.Max();
+    }
+
+    /// Scalar component read access of a single lane.
+    ///
+    /// \param i_componentIndex index of the component within the lane.
+    /// \param i_laneIndex index of the lane.
+    ///
+    /// \return immutable component value.
+    GM_HOST_DEVICE inline const float& operator()( size_t i_componentIndex, size_t i_laneIndex ) const
+    {
+        GM_ASSERT( i_componentIndex < c_componentCount );
+        GM_ASSERT( i_laneIndex < c_laneCount );
+        return m_lanes[ i_componentIndex ][ i_laneIndex ];
+    }
+
+    /// Scalar component write access of a single lane.
+    ///
+    /// \param i_componentIndex index of the component within the lane.
+    /// \param i_laneIndex index of the lane.
+    ///
+    /// \return mutable component value.
+    GM_HOST_DEVICE inline float& operator()( size_t i_componentIndex, size_t i_laneIndex )
+    {
+        GM_ASSERT( i_componentIndex < c_componentCount );
+        GM_ASSERT( i_laneIndex < c_laneCount );
+        return m_lanes[ i_componentIndex ][ i_laneIndex ];
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Raw lane storage access
+    // --------------------------------------------------------------------- //
+
+    /// Immutable access to the contiguous array of a single component, across all the lanes.
+    ///
+    /// \param i_componentIndex index of the component.
+    ///
+    /// \return pointer to the component of the first lane, aligned to 32 bytes.
+    GM_HOST_DEVICE inline const float* Lanes( size_t i_componentIndex ) const
+    {
+        GM_ASSERT( i_componentIndex < c_componentCount );
+        return m_lanes[ i_componentIndex ];
+    }
+
+    /// Mutable access to the contiguous array of a single component, across all the lanes.
+    ///
+    /// \param i_componentIndex index of the component.
+    ///
+    /// \return pointer to the component of the first lane, aligned to 32 bytes.
+    GM_HOST_DEVICE inline float* Lanes( size_t i_componentIndex )
+    {
+        GM_ASSERT( i_componentIndex < c_componentCount );
+        return m_lanes[ i_componentIndex ];
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Debug
+    // --------------------------------------------------------------------- //
+
+    /// Get the string representation.  For debugging purposes.
+    ///
+    /// \param i_classPrefix optional string to prefix class tokens.
+    ///
+    /// \return descriptive string representing this type instance.
+    inline std::string GetString( const std::string& i_classPrefix = std::string() ) const
+    {
+        std::stringstream ss;
+        ss << i_classPrefix << "FloatRangePacket16( ";
+        for ( size_t laneIndex = 0; laneIndex < c_laneCount; ++laneIndex )
+        {
+            if ( laneIndex > 0 )
+            {
+                ss << ", ";
+            }
+            ss << GetLane( laneIndex ).GetString( i_classPrefix );
+        }
+        ss << " )";
+        return ss.str();
+    }
+
+private:
+    float m_lanes[ 2 ][ 16 ] = {};
+};
+
+/// Operator overload for << to enable writing the string representation of \p i_packet into an output
+/// stream \p o_outputStream.
+///
+/// \param o_outputStream the output stream to write into.
+/// \param i_packet the source packet.
+///
+/// \return the output stream.
+inline std::ostream& operator<<( std::ostream& o_outputStream, const FloatRangePacket16& i_packet )
+{
+    o_outputStream << i_packet.GetString();
+    return o_outputStream;
+}
+
+GM_NS_CLOSE
\ No newline at end of file
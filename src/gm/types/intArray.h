@@ -0,0 +1,25 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file intArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+GM_NS_OPEN
+
+/// \typedef IntArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of int(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 1 int(s) per element.
+using IntArray = std::vector< int >;
+
+GM_NS_CLOSE
\ No newline at end of file
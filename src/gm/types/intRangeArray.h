@@ -0,0 +1,29 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file intRangeArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/intRange.h>
+
+GM_NS_OPEN
+
+/// \typedef IntRangeArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of IntRange(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 2 int(s) per element.
+using IntRangeArray = std::vector< IntRange >;
+
+static_assert( sizeof( IntRange ) == sizeof( int ) * 2, "IntRange must be tightly packed for IntRangeArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
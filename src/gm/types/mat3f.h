@@ -92,6 +92,26 @@ public:
         return m_elements[ i_index ];
     }
 
+    // --------------------------------------------------------------------- //
+    /// \name Raw element storage access
+    // --------------------------------------------------------------------- //
+
+    /// Mutable access to the contiguous, row-major storage of the 9 elements.
+    ///
+    /// \return pointer to the first element.
+    GM_HOST_DEVICE inline float* Data()
+    {
+        return m_elements;
+    }
+
+    /// Immutable access to the contiguous, row-major storage of the 9 elements.
+    ///
+    /// \return pointer to the first element.
+    GM_HOST_DEVICE inline const float* Data() const
+    {
+        return m_elements;
+    }
+
     // --------------------------------------------------------------------- //
     /// \name Matrix row column indexed element access
     // --------------------------------------------------------------------- //
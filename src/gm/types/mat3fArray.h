@@ -0,0 +1,29 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file mat3fArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/mat3f.h>
+
+GM_NS_OPEN
+
+/// \typedef Mat3fArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of Mat3f(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 9 float(s) per element.
+using Mat3fArray = std::vector< Mat3f >;
+
+static_assert( sizeof( Mat3f ) == sizeof( float ) * 9, "Mat3f must be tightly packed for Mat3fArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -15,6 +15,7 @@
 
 #include <gm/base/almost.h>
 #include <gm/base/diagnostic.h>
+#include <gm/base/simd.h>
 
 GM_NS_OPEN
 
@@ -106,6 +107,26 @@ public:
         return m_elements[ i_index ];
     }
 
+    // --------------------------------------------------------------------- //
+    /// \name Raw element storage access
+    // --------------------------------------------------------------------- //
+
+    /// Mutable access to the contiguous, row-major storage of the 16 elements.
+    ///
+    /// \return pointer to the first element.
+    GM_HOST_DEVICE inline float* Data()
+    {
+        return m_elements;
+    }
+
+    /// Immutable access to the contiguous, row-major storage of the 16 elements.
+    ///
+    /// \return pointer to the first element.
+    GM_HOST_DEVICE inline const float* Data() const
+    {
+        return m_elements;
+    }
+
     // --------------------------------------------------------------------- //
     /// \name Matrix row column indexed element access
     // --------------------------------------------------------------------- //
@@ -168,6 +189,27 @@ public:
     GM_HOST_DEVICE inline Mat4f operator+( const Mat4f& i_vector ) const
     {
         GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        Mat4f result;
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_storeu_ps(
+            result.m_elements + 0,
+            _mm256_add_ps( _mm256_loadu_ps( m_elements + 0 ), _mm256_loadu_ps( i_vector.m_elements + 0 ) ) );
+        _mm256_storeu_ps(
+            result.m_elements + 8,
+            _mm256_add_ps( _mm256_loadu_ps( m_elements + 8 ), _mm256_loadu_ps( i_vector.m_elements + 8 ) ) );
+#else
+        _mm_storeu_ps( result.m_elements + 0,
+                       _mm_add_ps( _mm_loadu_ps( m_elements + 0 ), _mm_loadu_ps( i_vector.m_elements + 0 ) ) );
+        _mm_storeu_ps( result.m_elements + 4,
+                       _mm_add_ps( _mm_loadu_ps( m_elements + 4 ), _mm_loadu_ps( i_vector.m_elements + 4 ) ) );
+        _mm_storeu_ps( result.m_elements + 8,
+                       _mm_add_ps( _mm_loadu_ps( m_elements + 8 ), _mm_loadu_ps( i_vector.m_elements + 8 ) ) );
+        _mm_storeu_ps( result.m_elements + 12,
+                       _mm_add_ps( _mm_loadu_ps( m_elements + 12 ), _mm_loadu_ps( i_vector.m_elements + 12 ) ) );
+#endif
+        return result;
+#else
         return Mat4f( m_elements[ 0 ] + i_vector.m_elements[ 0 ],
                       m_elements[ 1 ] + i_vector.m_elements[ 1 ],
                       m_elements[ 2 ] + i_vector.m_elements[ 2 ],
@@ -184,12 +226,32 @@ public:
                       m_elements[ 13 ] + i_vector.m_elements[ 13 ],
                       m_elements[ 14 ] + i_vector.m_elements[ 14 ],
                       m_elements[ 15 ] + i_vector.m_elements[ 15 ] );
+#endif
     }
 
     /// Element-wise vector addition assignment.
     GM_HOST_DEVICE inline Mat4f& operator+=( const Mat4f& i_vector )
     {
         GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_storeu_ps(
+            m_elements + 0,
+            _mm256_add_ps( _mm256_loadu_ps( m_elements + 0 ), _mm256_loadu_ps( i_vector.m_elements + 0 ) ) );
+        _mm256_storeu_ps(
+            m_elements + 8,
+            _mm256_add_ps( _mm256_loadu_ps( m_elements + 8 ), _mm256_loadu_ps( i_vector.m_elements + 8 ) ) );
+#else
+        _mm_storeu_ps( m_elements + 0,
+                       _mm_add_ps( _mm_loadu_ps( m_elements + 0 ), _mm_loadu_ps( i_vector.m_elements + 0 ) ) );
+        _mm_storeu_ps( m_elements + 4,
+                       _mm_add_ps( _mm_loadu_ps( m_elements + 4 ), _mm_loadu_ps( i_vector.m_elements + 4 ) ) );
+        _mm_storeu_ps( m_elements + 8,
+                       _mm_add_ps( _mm_loadu_ps( m_elements + 8 ), _mm_loadu_ps( i_vector.m_elements + 8 ) ) );
+        _mm_storeu_ps( m_elements + 12,
+                       _mm_add_ps( _mm_loadu_ps( m_elements + 12 ), _mm_loadu_ps( i_vector.m_elements + 12 ) ) );
+#endif
+#else
         m_elements[ 0 ] += i_vector.m_elements[ 0 ];
         m_elements[ 1 ] += i_vector.m_elements[ 1 ];
         m_elements[ 2 ] += i_vector.m_elements[ 2 ];
@@ -206,6 +268,7 @@ public:
         m_elements[ 13 ] += i_vector.m_elements[ 13 ];
         m_elements[ 14 ] += i_vector.m_elements[ 14 ];
         m_elements[ 15 ] += i_vector.m_elements[ 15 ];
+#endif
         return *this;
     }
 
@@ -213,6 +276,27 @@ public:
     GM_HOST_DEVICE inline Mat4f operator-( const Mat4f& i_vector ) const
     {
         GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        Mat4f result;
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_storeu_ps(
+            result.m_elements + 0,
+            _mm256_sub_ps( _mm256_loadu_ps( m_elements + 0 ), _mm256_loadu_ps( i_vector.m_elements + 0 ) ) );
+        _mm256_storeu_ps(
+            result.m_elements + 8,
+            _mm256_sub_ps( _mm256_loadu_ps( m_elements + 8 ), _mm256_loadu_ps( i_vector.m_elements + 8 ) ) );
+#else
+        _mm_storeu_ps( result.m_elements + 0,
+                       _mm_sub_ps( _mm_loadu_ps( m_elements + 0 ), _mm_loadu_ps( i_vector.m_elements + 0 ) ) );
+        _mm_storeu_ps( result.m_elements + 4,
+                       _mm_sub_ps( _mm_loadu_ps( m_elements + 4 ), _mm_loadu_ps( i_vector.m_elements + 4 ) ) );
+        _mm_storeu_ps( result.m_elements + 8,
+                       _mm_sub_ps( _mm_loadu_ps( m_elements + 8 ), _mm_loadu_ps( i_vector.m_elements + 8 ) ) );
+        _mm_storeu_ps( result.m_elements + 12,
+                       _mm_sub_ps( _mm_loadu_ps( m_elements + 12 ), _mm_loadu_ps( i_vector.m_elements + 12 ) ) );
+#endif
+        return result;
+#else
         return Mat4f( m_elements[ 0 ] - i_vector.m_elements[ 0 ],
                       m_elements[ 1 ] - i_vector.m_elements[ 1 ],
                       m_elements[ 2 ] - i_vector.m_elements[ 2 ],
@@ -229,12 +313,32 @@ public:
                       m_elements[ 13 ] - i_vector.m_elements[ 13 ],
                       m_elements[ 14 ] - i_vector.m_elements[ 14 ],
                       m_elements[ 15 ] - i_vector.m_elements[ 15 ] );
+#endif
     }
 
     /// Vector subtraction assignment.
     GM_HOST_DEVICE inline Mat4f& operator-=( const Mat4f& i_vector )
     {
         GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_storeu_ps(
+            m_elements + 0,
+            _mm256_sub_ps( _mm256_loadu_ps( m_elements + 0 ), _mm256_loadu_ps( i_vector.m_elements + 0 ) ) );
+        _mm256_storeu_ps(
+            m_elements + 8,
+            _mm256_sub_ps( _mm256_loadu_ps( m_elements + 8 ), _mm256_loadu_ps( i_vector.m_elements + 8 ) ) );
+#else
+        _mm_storeu_ps( m_elements + 0,
+                       _mm_sub_ps( _mm_loadu_ps( m_elements + 0 ), _mm_loadu_ps( i_vector.m_elements + 0 ) ) );
+        _mm_storeu_ps( m_elements + 4,
+                       _mm_sub_ps( _mm_loadu_ps( m_elements + 4 ), _mm_loadu_ps( i_vector.m_elements + 4 ) ) );
+        _mm_storeu_ps( m_elements + 8,
+                       _mm_sub_ps( _mm_loadu_ps( m_elements + 8 ), _mm_loadu_ps( i_vector.m_elements + 8 ) ) );
+        _mm_storeu_ps( m_elements + 12,
+                       _mm_sub_ps( _mm_loadu_ps( m_elements + 12 ), _mm_loadu_ps( i_vector.m_elements + 12 ) ) );
+#endif
+#else
         m_elements[ 0 ] -= i_vector.m_elements[ 0 ];
         m_elements[ 1 ] -= i_vector.m_elements[ 1 ];
         m_elements[ 2 ] -= i_vector.m_elements[ 2 ];
@@ -251,6 +355,7 @@ public:
         m_elements[ 13 ] -= i_vector.m_elements[ 13 ];
         m_elements[ 14 ] -= i_vector.m_elements[ 14 ];
         m_elements[ 15 ] -= i_vector.m_elements[ 15 ];
+#endif
         return *this;
     }
 
@@ -258,6 +363,19 @@ public:
     GM_HOST_DEVICE inline Mat4f& operator*=( const float& i_scalar )
     {
         GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_storeu_ps( m_elements + 0,
+                          _mm256_mul_ps( _mm256_loadu_ps( m_elements + 0 ), _mm256_set1_ps( i_scalar ) ) );
+        _mm256_storeu_ps( m_elements + 8,
+                          _mm256_mul_ps( _mm256_loadu_ps( m_elements + 8 ), _mm256_set1_ps( i_scalar ) ) );
+#else
+        _mm_storeu_ps( m_elements + 0, _mm_mul_ps( _mm_loadu_ps( m_elements + 0 ), _mm_set1_ps( i_scalar ) ) );
+        _mm_storeu_ps( m_elements + 4, _mm_mul_ps( _mm_loadu_ps( m_elements + 4 ), _mm_set1_ps( i_scalar ) ) );
+        _mm_storeu_ps( m_elements + 8, _mm_mul_ps( _mm_loadu_ps( m_elements + 8 ), _mm_set1_ps( i_scalar ) ) );
+        _mm_storeu_ps( m_elements + 12, _mm_mul_ps( _mm_loadu_ps( m_elements + 12 ), _mm_set1_ps( i_scalar ) ) );
+#endif
+#else
         m_elements[ 0 ] *= i_scalar;
         m_elements[ 1 ] *= i_scalar;
         m_elements[ 2 ] *= i_scalar;
@@ -274,6 +392,7 @@ public:
         m_elements[ 13 ] *= i_scalar;
         m_elements[ 14 ] *= i_scalar;
         m_elements[ 15 ] *= i_scalar;
+#endif
         return *this;
     }
 
@@ -283,6 +402,22 @@ public:
         GM_ASSERT( !HasNaNs() );
         GM_ASSERT( i_scalar != 0.0f );
         float reciprocal = 1.0f / i_scalar;
+#if defined( GM_SIMD_SSE_ENABLED )
+        Mat4f result;
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_storeu_ps( result.m_elements + 0,
+                          _mm256_mul_ps( _mm256_loadu_ps( m_elements + 0 ), _mm256_set1_ps( reciprocal ) ) );
+        _mm256_storeu_ps( result.m_elements + 8,
+                          _mm256_mul_ps( _mm256_loadu_ps( m_elements + 8 ), _mm256_set1_ps( reciprocal ) ) );
+#else
+        _mm_storeu_ps( result.m_elements + 0, _mm_mul_ps( _mm_loadu_ps( m_elements + 0 ), _mm_set1_ps( reciprocal ) ) );
+        _mm_storeu_ps( result.m_elements + 4, _mm_mul_ps( _mm_loadu_ps( m_elements + 4 ), _mm_set1_ps( reciprocal ) ) );
+        _mm_storeu_ps( result.m_elements + 8, _mm_mul_ps( _mm_loadu_ps( m_elements + 8 ), _mm_set1_ps( reciprocal ) ) );
+        _mm_storeu_ps( result.m_elements + 12,
+                       _mm_mul_ps( _mm_loadu_ps( m_elements + 12 ), _mm_set1_ps( reciprocal ) ) );
+#endif
+        return result;
+#else
         return Mat4f( m_elements[ 0 ] * reciprocal,
                       m_elements[ 1 ] * reciprocal,
                       m_elements[ 2 ] * reciprocal,
@@ -299,6 +434,7 @@ public:
                       m_elements[ 13 ] * reciprocal,
                       m_elements[ 14 ] * reciprocal,
                       m_elements[ 15 ] * reciprocal );
+#endif
     }
 
     /// Scalar division assignment.
@@ -307,6 +443,19 @@ public:
         GM_ASSERT( !HasNaNs() );
         GM_ASSERT( i_scalar != 0.0f );
         float reciprocal = 1.0f / i_scalar;
+#if defined( GM_SIMD_SSE_ENABLED )
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_storeu_ps( m_elements + 0,
+                          _mm256_mul_ps( _mm256_loadu_ps( m_elements + 0 ), _mm256_set1_ps( reciprocal ) ) );
+        _mm256_storeu_ps( m_elements + 8,
+                          _mm256_mul_ps( _mm256_loadu_ps( m_elements + 8 ), _mm256_set1_ps( reciprocal ) ) );
+#else
+        _mm_storeu_ps( m_elements + 0, _mm_mul_ps( _mm_loadu_ps( m_elements + 0 ), _mm_set1_ps( reciprocal ) ) );
+        _mm_storeu_ps( m_elements + 4, _mm_mul_ps( _mm_loadu_ps( m_elements + 4 ), _mm_set1_ps( reciprocal ) ) );
+        _mm_storeu_ps( m_elements + 8, _mm_mul_ps( _mm_loadu_ps( m_elements + 8 ), _mm_set1_ps( reciprocal ) ) );
+        _mm_storeu_ps( m_elements + 12, _mm_mul_ps( _mm_loadu_ps( m_elements + 12 ), _mm_set1_ps( reciprocal ) ) );
+#endif
+#else
         m_elements[ 0 ] *= reciprocal;
         m_elements[ 1 ] *= reciprocal;
         m_elements[ 2 ] *= reciprocal;
@@ -323,6 +472,7 @@ public:
         m_elements[ 13 ] *= reciprocal;
         m_elements[ 14 ] *= reciprocal;
         m_elements[ 15 ] *= reciprocal;
+#endif
         return *this;
     }
 
@@ -330,6 +480,22 @@ public:
     GM_HOST_DEVICE inline Mat4f operator-() const
     {
         GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        // Flip the sign bits.
+        Mat4f result;
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_storeu_ps( result.m_elements + 0,
+                          _mm256_xor_ps( _mm256_loadu_ps( m_elements + 0 ), _mm256_set1_ps( -0.0f ) ) );
+        _mm256_storeu_ps( result.m_elements + 8,
+                          _mm256_xor_ps( _mm256_loadu_ps( m_elements + 8 ), _mm256_set1_ps( -0.0f ) ) );
+#else
+        _mm_storeu_ps( result.m_elements + 0, _mm_xor_ps( _mm_loadu_ps( m_elements + 0 ), _mm_set1_ps( -0.0f ) ) );
+        _mm_storeu_ps( result.m_elements + 4, _mm_xor_ps( _mm_loadu_ps( m_elements + 4 ), _mm_set1_ps( -0.0f ) ) );
+        _mm_storeu_ps( result.m_elements + 8, _mm_xor_ps( _mm_loadu_ps( m_elements + 8 ), _mm_set1_ps( -0.0f ) ) );
+        _mm_storeu_ps( result.m_elements + 12, _mm_xor_ps( _mm_loadu_ps( m_elements + 12 ), _mm_set1_ps( -0.0f ) ) );
+#endif
+        return result;
+#else
         return Mat4f( -m_elements[ 0 ],
                       -m_elements[ 1 ],
                       -m_elements[ 2 ],
@@ -346,6 +512,7 @@ public:
                       -m_elements[ 13 ],
                       -m_elements[ 14 ],
                       -m_elements[ 15 ] );
+#endif
     }
 
     // --------------------------------------------------------------------- //
@@ -461,6 +628,21 @@ private:
 GM_HOST_DEVICE inline Mat4f operator*( const Mat4f& i_vector, const float& i_scalar )
 {
     GM_ASSERT( !i_vector.HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+    Mat4f result;
+#if defined( GM_SIMD_AVX2_ENABLED )
+    _mm256_storeu_ps( result.Data() + 0,
+                      _mm256_mul_ps( _mm256_loadu_ps( i_vector.Data() + 0 ), _mm256_set1_ps( i_scalar ) ) );
+    _mm256_storeu_ps( result.Data() + 8,
+                      _mm256_mul_ps( _mm256_loadu_ps( i_vector.Data() + 8 ), _mm256_set1_ps( i_scalar ) ) );
+#else
+    _mm_storeu_ps( result.Data() + 0, _mm_mul_ps( _mm_loadu_ps( i_vector.Data() + 0 ), _mm_set1_ps( i_scalar ) ) );
+    _mm_storeu_ps( result.Data() + 4, _mm_mul_ps( _mm_loadu_ps( i_vector.Data() + 4 ), _mm_set1_ps( i_scalar ) ) );
+    _mm_storeu_ps( result.Data() + 8, _mm_mul_ps( _mm_loadu_ps( i_vector.Data() + 8 ), _mm_set1_ps( i_scalar ) ) );
+    _mm_storeu_ps( result.Data() + 12, _mm_mul_ps( _mm_loadu_ps( i_vector.Data() + 12 ), _mm_set1_ps( i_scalar ) ) );
+#endif
+    return result;
+#else
     return Mat4f( i_vector[ 0 ] * i_scalar,
                   i_vector[ 1 ] * i_scalar,
                   i_vector[ 2 ] * i_scalar,
@@ -477,12 +659,28 @@ GM_HOST_DEVICE inline Mat4f operator*( const Mat4f& i_vector, const float& i_sca
                   i_vector[ 13 ] * i_scalar,
                   i_vector[ 14 ] * i_scalar,
                   i_vector[ 15 ] * i_scalar );
+#endif
 }
 
 /// Scalar-vector multiplication.
 GM_HOST_DEVICE inline Mat4f operator*( const float& i_scalar, const Mat4f& i_vector )
 {
     GM_ASSERT( !i_vector.HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+    Mat4f result;
+#if defined( GM_SIMD_AVX2_ENABLED )
+    _mm256_storeu_ps( result.Data() + 0,
+                      _mm256_mul_ps( _mm256_loadu_ps( i_vector.Data() + 0 ), _mm256_set1_ps( i_scalar ) ) );
+    _mm256_storeu_ps( result.Data() + 8,
+                      _mm256_mul_ps( _mm256_loadu_ps( i_vector.Data() + 8 ), _mm256_set1_ps( i_scalar ) ) );
+#else
+    _mm_storeu_ps( result.Data() + 0, _mm_mul_ps( _mm_loadu_ps( i_vector.Data() + 0 ), _mm_set1_ps( i_scalar ) ) );
+    _mm_storeu_ps( result.Data() + 4, _mm_mul_ps( _mm_loadu_ps( i_vector.Data() + 4 ), _mm_set1_ps( i_scalar ) ) );
+    _mm_storeu_ps( result.Data() + 8, _mm_mul_ps( _mm_loadu_ps( i_vector.Data() + 8 ), _mm_set1_ps( i_scalar ) ) );
+    _mm_storeu_ps( result.Data() + 12, _mm_mul_ps( _mm_loadu_ps( i_vector.Data() + 12 ), _mm_set1_ps( i_scalar ) ) );
+#endif
+    return result;
+#else
     return Mat4f( i_vector[ 0 ] * i_scalar,
                   i_vector[ 1 ] * i_scalar,
                   i_vector[ 2 ] * i_scalar,
@@ -499,6 +697,7 @@ GM_HOST_DEVICE inline Mat4f operator*( const float& i_scalar, const Mat4f& i_vec
                   i_vector[ 13 ] * i_scalar,
                   i_vector[ 14 ] * i_scalar,
                   i_vector[ 15 ] * i_scalar );
+#endif
 }
 
 /// Operator overload for << to enable writing the string representation of \p i_vector into an output
@@ -0,0 +1,739 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file mat4fA.h
+/// \ingroup gm_types_alignedVector
+
+#include <gm/gm.h>
+
+#include <cmath>
+#include <cstring>
+#include <sstream>
+
+#include <gm/base/almost.h>
+#include <gm/base/diagnostic.h>
+#include <gm/base/simd.h>
+
+#include <gm/types/mat4f.h>
+
+GM_NS_OPEN
+
+/// \class Mat4fA
+/// \ingroup gm_types_alignedVector
+///
+/// Class definition of a matrix with 16 float elements.
+///
+/// Over-aligned variant of \ref Mat4f, stored at 32 byte aligned addresses.
+///
+/// The storage is padded to a multiple of the alignment, such that the elements of packed arrays of this type
+/// never straddle an alignment boundary, and can be loaded with aligned SIMD instructions.  Use the explicit
+/// conversions to exchange values with the packed, unaligned \ref Mat4f.
+///
+/// \note Prior to C++17, operator new is not required to honor alignments larger than that of std::max_align_t,
+/// such that heap allocated storage of this type must be allocated with an aligned allocator.
+class alignas( 32 ) Mat4fA final
+{
+public:
+    /// \typedef ElementType
+    ///
+    /// Convenience type definition of \ref Mat4fA's elements.
+    using ElementType = float;
+
+    // --------------------------------------------------------------------- //
+    /// \name Construction
+    // --------------------------------------------------------------------- //
+
+    /// Default constructor, initializing all of the element values to 0.
+    GM_HOST_DEVICE constexpr inline Mat4fA() = default;
+
+    /// Element-wise constructor.
+    GM_HOST_DEVICE explicit constexpr inline Mat4fA( const float& i_element0,
+                                                     const float& i_element1,
+                                                     const float& i_element2,
+                                                     const float& i_element3,
+                                                     const float& i_element4,
+                                                     const float& i_element5,
+                                                     const float& i_element6,
+                                                     const float& i_element7,
+                                                     const float& i_element8,
+                                                     const float& i_element9,
+                                                     const float& i_element10,
+                                                     const float& i_element11,
+                                                     const float& i_element12,
+                                                     const float& i_element13,
+                                                     const float& i_element14,
+                                                     const float& i_element15 )
+        : m_elements{i_element0,
+                     i_element1,
+                     i_element2,
+                     i_element3,
+                     i_element4,
+                     i_element5,
+                     i_element6,
+                     i_element7,
+                     i_element8,
+                     i_element9,
+                     i_element10,
+                     i_element11,
+                     i_element12,
+                     i_element13,
+                     i_element14,
+                     i_element15}
+    {
+        GM_ASSERT( !HasNaNs() );
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Indexed element access
+    // --------------------------------------------------------------------- //
+
+    /// Indexed element write access.
+    ///
+    /// \param i_index index of the element.
+    ///
+    /// \pre \p i_index must be less than 16.
+    ///
+    /// \return mutable element value.
+    GM_HOST_DEVICE inline float& operator[]( size_t i_index )
+    {
+        GM_ASSERT( !HasNaNs() );
+        GM_ASSERT( i_index < 16 );
+        return m_elements[ i_index ];
+    }
+
+    /// Indexed element read access.
+    ///
+    /// \param i_index index of the element.
+    ///
+    /// \pre \p i_index must be less than 16.
+    ///
+    /// \return immutable element value.
+    GM_HOST_DEVICE inline const float& operator[]( size_t i_index ) const
+    {
+        GM_ASSERT( !HasNaNs() );
+        GM_ASSERT( i_index < 16 );
+        return m_elements[ i_index ];
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Raw element storage access
+    // --------------------------------------------------------------------- //
+
+    /// Mutable access to the contiguous, row-major storage of the 16 elements.
+    ///
+    /// \return pointer to the first element.
+    GM_HOST_DEVICE inline float* Data()
+    {
+        return m_elements;
+    }
+
+    /// Immutable access to the contiguous, row-major storage of the 16 elements.
+    ///
+    /// \return pointer to the first element.
+    GM_HOST_DEVICE inline const float* Data() const
+    {
+        return m_elements;
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Matrix row column indexed element access
+    // --------------------------------------------------------------------- //
+
+    /// Matrix element read-access.
+    ///
+    /// \param i_row Row index.
+    /// \param i_column Column index.
+    ///
+    /// \pre \p i_row must be less than 4.
+    /// \pre \p i_column must be less than 4.
+    ///
+    /// \return Element value.
+    GM_HOST_DEVICE inline const float& operator()( size_t i_row, size_t i_column ) const
+    {
+        GM_ASSERT( !HasNaNs() );
+        GM_ASSERT( i_row < 4 );
+        GM_ASSERT( i_column < 4 );
+        return m_elements[ i_row * 4 + i_column ];
+    }
+
+    /// Matrix element write-access.
+    ///
+    /// \param i_row Row index.
+    /// \param i_column Column index.
+    ///
+    /// \pre \p i_row must be less than 4.
+    /// \pre \p i_column must be less than 4.
+    ///
+    /// \return Element value.
+    GM_HOST_DEVICE inline float& operator()( size_t i_row, size_t i_column )
+    {
+        GM_ASSERT( !HasNaNs() );
+        GM_ASSERT( i_row < 4 );
+        GM_ASSERT( i_column < 4 );
+        return m_elements[ i_row * 4 + i_column ];
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Matrix identity element
+    // --------------------------------------------------------------------- //
+
+    /// Get the identity element for this matrix type.
+    ///
+    /// \return The identity element.
+    GM_HOST_DEVICE static constexpr inline Mat4fA Identity()
+    {
+        return Mat4fA( 1.0f, 0.0f, 0.0f, 0.0f, 0.0f, 1.0f, 0.0f, 0.0f, 0.0f, 0.0f, 1.0f, 0.0f, 0.0f, 0.0f, 0.0f, 1.0f );
+    }
+    // --------------------------------------------------------------------- //
+    /// \name Conversion from and to the unaligned type
+    // --------------------------------------------------------------------- //
+
+    /// Construct from the unaligned \ref Mat4f.
+    ///
+    /// \param i_matrix the unaligned source matrix.
+    GM_HOST_DEVICE explicit inline Mat4fA( const Mat4f& i_matrix )
+    {
+        std::memcpy( m_elements, i_matrix.Data(), sizeof( m_elements ) );
+    }
+
+    /// Get the unaligned \ref Mat4f representation of this matrix.
+    ///
+    /// \return the unaligned matrix, with equal element values.
+    GM_HOST_DEVICE inline Mat4f GetUnaligned() const
+    {
+        Mat4f matrix;
+        std::memcpy( matrix.Data(), m_elements, sizeof( m_elements ) );
+        return matrix;
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Arithmetic operators
+    // --------------------------------------------------------------------- //
+
+    /// Element-wise vector addition.
+    ///
+    /// Corresponding elements of the current vector and \p i_vector are added to form a new vector.
+    ///
+    /// \return the new vector.
+    GM_HOST_DEVICE inline Mat4fA operator+( const Mat4fA& i_vector ) const
+    {
+        GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        Mat4fA result;
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_store_ps( result.m_elements + 0,
+                         _mm256_add_ps( _mm256_load_ps( m_elements + 0 ), _mm256_load_ps( i_vector.m_elements + 0 ) ) );
+        _mm256_store_ps( result.m_elements + 8,
+                         _mm256_add_ps( _mm256_load_ps( m_elements + 8 ), _mm256_load_ps( i_vector.m_elements + 8 ) ) );
+#else
+        _mm_store_ps( result.m_elements + 0,
+                      _mm_add_ps( _mm_load_ps( m_elements + 0 ), _mm_load_ps( i_vector.m_elements + 0 ) ) );
+        _mm_store_ps( result.m_elements + 4,
+                      _mm_add_ps( _mm_load_ps( m_elements + 4 ), _mm_load_ps( i_vector.m_elements + 4 ) ) );
+        _mm_store_ps( result.m_elements + 8,
+                      _mm_add_ps( _mm_load_ps( m_elements + 8 ), _mm_load_ps( i_vector.m_elements + 8 ) ) );
+        _mm_store_ps( result.m_elements + 12,
+                      _mm_add_ps( _mm_load_ps( m_elements + 12 ), _mm_load_ps( i_vector.m_elements + 12 ) ) );
+#endif
+        return result;
+#else
+        return Mat4fA( m_elements[ 0 ] + i_vector.m_elements[ 0 ],
+                       m_elements[ 1 ] + i_vector.m_elements[ 1 ],
+                       m_elements[ 2 ] + i_vector.m_elements[ 2 ],
+                       m_elements[ 3 ] + i_vector.m_elements[ 3 ],
+                       m_elements[ 4 ] + i_vector.m_elements[ 4 ],
+                       m_elements[ 5 ] + i_vector.m_elements[ 5 ],
+                       m_elements[ 6 ] + i_vector.m_elements[ 6 ],
+                       m_elements[ 7 ] + i_vector.m_elements[ 7 ],
+                       m_elements[ 8 ] + i_vector.m_elements[ 8 ],
+                       m_elements[ 9 ] + i_vector.m_elements[ 9 ],
+                       m_elements[ 10 ] + i_vector.m_elements[ 10 ],
+                       m_elements[ 11 ] + i_vector.m_elements[ 11 ],
+                       m_elements[ 12 ] + i_vector.m_elements[ 12 ],
+                       m_elements[ 13 ] + i_vector.m_elements[ 13 ],
+                       m_elements[ 14 ] + i_vector.m_elements[ 14 ],
+                       m_elements[ 15 ] + i_vector.m_elements[ 15 ] );
+#endif
+    }
+
+    /// Element-wise vector addition assignment.
+    GM_HOST_DEVICE inline Mat4fA& operator+=( const Mat4fA& i_vector )
+    {
+        GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_store_ps( m_elements + 0,
+                         _mm256_add_ps( _mm256_load_ps( m_elements + 0 ), _mm256_load_ps( i_vector.m_elements + 0 ) ) );
+        _mm256_store_ps( m_elements + 8,
+                         _mm256_add_ps( _mm256_load_ps( m_elements + 8 ), _mm256_load_ps( i_vector.m_elements + 8 ) ) );
+#else
+        _mm_store_ps( m_elements + 0,
+                      _mm_add_ps( _mm_load_ps( m_elements + 0 ), _mm_load_ps( i_vector.m_elements + 0 ) ) );
+        _mm_store_ps( m_elements + 4,
+                      _mm_add_ps( _mm_load_ps( m_elements + 4 ), _mm_load_ps( i_vector.m_elements + 4 ) ) );
+        _mm_store_ps( m_elements + 8,
+                      _mm_add_ps( _mm_load_ps( m_elements + 8 ), _mm_load_ps( i_vector.m_elements + 8 ) ) );
+        _mm_store_ps( m_elements + 12,
+                      _mm_add_ps( _mm_load_ps( m_elements + 12 ), _mm_load_ps( i_vector.m_elements + 12 ) ) );
+#endif
+#else
+        m_elements[ 0 ] += i_vector.m_elements[ 0 ];
+        m_elements[ 1 ] += i_vector.m_elements[ 1 ];
+        m_elements[ 2 ] += i_vector.m_elements[ 2 ];
+        m_elements[ 3 ] += i_vector.m_elements[ 3 ];
+        m_elements[ 4 ] += i_vector.m_elements[ 4 ];
+        m_elements[ 5 ] += i_vector.m_elements[ 5 ];
+        m_elements[ 6 ] += i_vector.m_elements[ 6 ];
+        m_elements[ 7 ] += i_vector.m_elements[ 7 ];
+        m_elements[ 8 ] += i_vector.m_elements[ 8 ];
+        m_elements[ 9 ] += i_vector.m_elements[ 9 ];
+        m_elements[ 10 ] += i_vector.m_elements[ 10 ];
+        m_elements[ 11 ] += i_vector.m_elements[ 11 ];
+        m_elements[ 12 ] += i_vector.m_elements[ 12 ];
+        m_elements[ 13 ] += i_vector.m_elements[ 13 ];
+        m_elements[ 14 ] += i_vector.m_elements[ 14 ];
+        m_elements[ 15 ] += i_vector.m_elements[ 15 ];
+#endif
+        return *this;
+    }
+
+    /// Vector subtraction.
+    GM_HOST_DEVICE inline Mat4fA operator-( const Mat4fA& i_vector ) const
+    {
+        GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        Mat4fA result;
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_store_ps( result.m_elements + 0,
+                         _mm256_sub_ps( _mm256_load_ps( m_elements + 0 ), _mm256_load_ps( i_vector.m_elements + 0 ) ) );
+        _mm256_store_ps( result.m_elements + 8,
+                         _mm256_sub_ps( _mm256_load_ps( m_elements + 8 ), _mm256_load_ps( i_vector.m_elements + 8 ) ) );
+#else
+        _mm_store_ps( result.m_elements + 0,
+                      _mm_sub_ps( _mm_load_ps( m_elements + 0 ), _mm_load_ps( i_vector.m_elements + 0 ) ) );
+        _mm_store_ps( result.m_elements + 4,
+                      _mm_sub_ps( _mm_load_ps( m_elements + 4 ), _mm_load_ps( i_vector.m_elements + 4 ) ) );
+        _mm_store_ps( result.m_elements + 8,
+                      _mm_sub_ps( _mm_load_ps( m_elements + 8 ), _mm_load_ps( i_vector.m_elements + 8 ) ) );
+        _mm_store_ps( result.m_elements + 12,
+                      _mm_sub_ps( _mm_load_ps( m_elements + 12 ), _mm_load_ps( i_vector.m_elements + 12 ) ) );
+#endif
+        return result;
+#else
+        return Mat4fA( m_elements[ 0 ] - i_vector.m_elements[ 0 ],
+                       m_elements[ 1 ] - i_vector.m_elements[ 1 ],
+                       m_elements[ 2 ] - i_vector.m_elements[ 2 ],
+                       m_elements[ 3 ] - i_vector.m_elements[ 3 ],
+                       m_elements[ 4 ] - i_vector.m_elements[ 4 ],
+                       m_elements[ 5 ] - i_vector.m_elements[ 5 ],
+                       m_elements[ 6 ] - i_vector.m_elements[ 6 ],
+                       m_elements[ 7 ] - i_vector.m_elements[ 7 ],
+                       m_elements[ 8 ] - i_vector.m_elements[ 8 ],
+                       m_elements[ 9 ] - i_vector.m_elements[ 9 ],
+                       m_elements[ 10 ] - i_vector.m_elements[ 10 ],
+                       m_elements[ 11 ] - i_vector.m_elements[ 11 ],
+                       m_elements[ 12 ] - i_vector.m_elements[ 12 ],
+                       m_elements[ 13 ] - i_vector.m_elements[ 13 ],
+                       m_elements[ 14 ] - i_vector.m_elements[ 14 ],
+                       m_elements[ 15 ] - i_vector.m_elements[ 15 ] );
+#endif
+    }
+
+    /// Vector subtraction assignment.
+    GM_HOST_DEVICE inline Mat4fA& operator-=( const Mat4fA& i_vector )
+    {
+        GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_store_ps( m_elements + 0,
+                         _mm256_sub_ps( _mm256_load_ps( m_elements + 0 ), _mm256_load_ps( i_vector.m_elements + 0 ) ) );
+        _mm256_store_ps( m_elements + 8,
+                         _mm256_sub_ps( _mm256_load_ps( m_elements + 8 ), _mm256_load_ps( i_vector.m_elements + 8 ) ) );
+#else
+        _mm_store_ps( m_elements + 0,
+                      _mm_sub_ps( _mm_load_ps( m_elements + 0 ), _mm_load_ps( i_vector.m_elements + 0 ) ) );
+        _mm_store_ps( m_elements + 4,
+                      _mm_sub_ps( _mm_load_ps( m_elements + 4 ), _mm_load_ps( i_vector.m_elements + 4 ) ) );
+        _mm_store_ps( m_elements + 8,
+                      _mm_sub_ps( _mm_load_ps( m_elements + 8 ), _mm_load_ps( i_vector.m_elements + 8 ) ) );
+        _mm_store_ps( m_elements + 12,
+                      _mm_sub_ps( _mm_load_ps( m_elements + 12 ), _mm_load_ps( i_vector.m_elements + 12 ) ) );
+#endif
+#else
+        m_elements[ 0 ] -= i_vector.m_elements[ 0 ];
+        m_elements[ 1 ] -= i_vector.m_elements[ 1 ];
+        m_elements[ 2 ] -= i_vector.m_elements[ 2 ];
+        m_elements[ 3 ] -= i_vector.m_elements[ 3 ];
+        m_elements[ 4 ] -= i_vector.m_elements[ 4 ];
+        m_elements[ 5 ] -= i_vector.m_elements[ 5 ];
+        m_elements[ 6 ] -= i_vector.m_elements[ 6 ];
+        m_elements[ 7 ] -= i_vector.m_elements[ 7 ];
+        m_elements[ 8 ] -= i_vector.m_elements[ 8 ];
+        m_elements[ 9 ] -= i_vector.m_elements[ 9 ];
+        m_elements[ 10 ] -= i_vector.m_elements[ 10 ];
+        m_elements[ 11 ] -= i_vector.m_elements[ 11 ];
+        m_elements[ 12 ] -= i_vector.m_elements[ 12 ];
+        m_elements[ 13 ] -= i_vector.m_elements[ 13 ];
+        m_elements[ 14 ] -= i_vector.m_elements[ 14 ];
+        m_elements[ 15 ] -= i_vector.m_elements[ 15 ];
+#endif
+        return *this;
+    }
+
+    /// Scalar multiplication assignment.
+    GM_HOST_DEVICE inline Mat4fA& operator*=( const float& i_scalar )
+    {
+        GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_store_ps( m_elements + 0,
+                         _mm256_mul_ps( _mm256_load_ps( m_elements + 0 ), _mm256_set1_ps( i_scalar ) ) );
+        _mm256_store_ps( m_elements + 8,
+                         _mm256_mul_ps( _mm256_load_ps( m_elements + 8 ), _mm256_set1_ps( i_scalar ) ) );
+#else
+        _mm_store_ps( m_elements + 0, _mm_mul_ps( _mm_load_ps( m_elements + 0 ), _mm_set1_ps( i_scalar ) ) );
+        _mm_store_ps( m_elements + 4, _mm_mul_ps( _mm_load_ps( m_elements + 4 ), _mm_set1_ps( i_scalar ) ) );
+        _mm_store_ps( m_elements + 8, _mm_mul_ps( _mm_load_ps( m_elements + 8 ), _mm_set1_ps( i_scalar ) ) );
+        _mm_store_ps( m_elements + 12, _mm_mul_ps( _mm_load_ps( m_elements + 12 ), _mm_set1_ps( i_scalar ) ) );
+#endif
+#else
+        m_elements[ 0 ] *= i_scalar;
+        m_elements[ 1 ] *= i_scalar;
+        m_elements[ 2 ] *= i_scalar;
+        m_elements[ 3 ] *= i_scalar;
+        m_elements[ 4 ] *= i_scalar;
+        m_elements[ 5 ] *= i_scalar;
+        m_elements[ 6 ] *= i_scalar;
+        m_elements[ 7 ] *= i_scalar;
+        m_elements[ 8 ] *= i_scalar;
+        m_elements[ 9 ] *= i_scalar;
+        m_elements[ 10 ] *= i_scalar;
+        m_elements[ 11 ] *= i_scalar;
+        m_elements[ 12 ] *= i_scalar;
+        m_elements[ 13 ] *= i_scalar;
+        m_elements[ 14 ] *= i_scalar;
+        m_elements[ 15 ] *= i_scalar;
+#endif
+        return *this;
+    }
+
+    /// Scalar division.
+    GM_HOST_DEVICE inline Mat4fA operator/( const float& i_scalar ) const
+    {
+        GM_ASSERT( !HasNaNs() );
+        GM_ASSERT( i_scalar != 0.0f );
+        float reciprocal = 1.0f / i_scalar;
+#if defined( GM_SIMD_SSE_ENABLED )
+        Mat4fA result;
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_store_ps( result.m_elements + 0,
+                         _mm256_mul_ps( _mm256_load_ps( m_elements + 0 ), _mm256_set1_ps( reciprocal ) ) );
+        _mm256_store_ps( result.m_elements + 8,
+                         _mm256_mul_ps( _mm256_load_ps( m_elements + 8 ), _mm256_set1_ps( reciprocal ) ) );
+#else
+        _mm_store_ps( result.m_elements + 0, _mm_mul_ps( _mm_load_ps( m_elements + 0 ), _mm_set1_ps( reciprocal ) ) );
+        _mm_store_ps( result.m_elements + 4, _mm_mul_ps( _mm_load_ps( m_elements + 4 ), _mm_set1_ps( reciprocal ) ) );
+        _mm_store_ps( result.m_elements + 8, _mm_mul_ps( _mm_load_ps( m_elements + 8 ), _mm_set1_ps( reciprocal ) ) );
+        _mm_store_ps( result.m_elements + 12, _mm_mul_ps( _mm_load_ps( m_elements + 12 ), _mm_set1_ps( reciprocal ) ) );
+#endif
+        return result;
+#else
+        return Mat4fA( m_elements[ 0 ] * reciprocal,
+                       m_elements[ 1 ] * reciprocal,
+                       m_elements[ 2 ] * reciprocal,
+                       m_elements[ 3 ] * reciprocal,
+                       m_elements[ 4 ] * reciprocal,
+                       m_elements[ 5 ] * reciprocal,
+                       m_elements[ 6 ] * reciprocal,
+                       m_elements[ 7 ] * reciprocal,
+                       m_elements[ 8 ] * reciprocal,
+                       m_elements[ 9 ] * reciprocal,
+                       m_elements[ 10 ] * reciprocal,
+                       m_elements[ 11 ] * reciprocal,
+                       m_elements[ 12 ] * reciprocal,
+                       m_elements[ 13 ] * reciprocal,
+                       m_elements[ 14 ] * reciprocal,
+                       m_elements[ 15 ] * reciprocal );
+#endif
+    }
+
+    /// Scalar division assignment.
+    GM_HOST_DEVICE inline Mat4fA& operator/=( const float& i_scalar )
+    {
+        GM_ASSERT( !HasNaNs() );
+        GM_ASSERT( i_scalar != 0.0f );
+        float reciprocal = 1.0f / i_scalar;
+#if defined( GM_SIMD_SSE_ENABLED )
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_store_ps( m_elements + 0,
+                         _mm256_mul_ps( _mm256_load_ps( m_elements + 0 ), _mm256_set1_ps( reciprocal ) ) );
+        _mm256_store_ps( m_elements + 8,
+                         _mm256_mul_ps( _mm256_load_ps( m_elements + 8 ), _mm256_set1_ps( reciprocal ) ) );
+#else
+        _mm_store_ps( m_elements + 0, _mm_mul_ps( _mm_load_ps( m_elements + 0 ), _mm_set1_ps( reciprocal ) ) );
+        _mm_store_ps( m_elements + 4, _mm_mul_ps( _mm_load_ps( m_elements + 4 ), _mm_set1_ps( reciprocal ) ) );
+        _mm_store_ps( m_elements + 8, _mm_mul_ps( _mm_load_ps( m_elements + 8 ), _mm_set1_ps( reciprocal ) ) );
+        _mm_store_ps( m_elements + 12, _mm_mul_ps( _mm_load_ps( m_elements + 12 ), _mm_set1_ps( reciprocal ) ) );
+#endif
+#else
+        m_elements[ 0 ] *= reciprocal;
+        m_elements[ 1 ] *= reciprocal;
+        m_elements[ 2 ] *= reciprocal;
+        m_elements[ 3 ] *= reciprocal;
+        m_elements[ 4 ] *= reciprocal;
+        m_elements[ 5 ] *= reciprocal;
+        m_elements[ 6 ] *= reciprocal;
+        m_elements[ 7 ] *= reciprocal;
+        m_elements[ 8 ] *= reciprocal;
+        m_elements[ 9 ] *= reciprocal;
+        m_elements[ 10 ] *= reciprocal;
+        m_elements[ 11 ] *= reciprocal;
+        m_elements[ 12 ] *= reciprocal;
+        m_elements[ 13 ] *= reciprocal;
+        m_elements[ 14 ] *= reciprocal;
+        m_elements[ 15 ] *= reciprocal;
+#endif
+        return *this;
+    }
+
+    /// Unary negation.
+    GM_HOST_DEVICE inline Mat4fA operator-() const
+    {
+        GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        // Flip the sign bits.
+        Mat4fA result;
+#if defined( GM_SIMD_AVX2_ENABLED )
+        _mm256_store_ps( result.m_elements + 0,
+                         _mm256_xor_ps( _mm256_load_ps( m_elements + 0 ), _mm256_set1_ps( -0.0f ) ) );
+        _mm256_store_ps( result.m_elements + 8,
+                         _mm256_xor_ps( _mm256_load_ps( m_elements + 8 ), _mm256_set1_ps( -0.0f ) ) );
+#else
+        _mm_store_ps( result.m_elements + 0, _mm_xor_ps( _mm_load_ps( m_elements + 0 ), _mm_set1_ps( -0.0f ) ) );
+        _mm_store_ps( result.m_elements + 4, _mm_xor_ps( _mm_load_ps( m_elements + 4 ), _mm_set1_ps( -0.0f ) ) );
+        _mm_store_ps( result.m_elements + 8, _mm_xor_ps( _mm_load_ps( m_elements + 8 ), _mm_set1_ps( -0.0f ) ) );
+        _mm_store_ps( result.m_elements + 12, _mm_xor_ps( _mm_load_ps( m_elements + 12 ), _mm_set1_ps( -0.0f ) ) );
+#endif
+        return result;
+#else
+        return Mat4fA( -m_elements[ 0 ],
+                       -m_elements[ 1 ],
+                       -m_elements[ 2 ],
+                       -m_elements[ 3 ],
+                       -m_elements[ 4 ],
+                       -m_elements[ 5 ],
+                       -m_elements[ 6 ],
+                       -m_elements[ 7 ],
+                       -m_elements[ 8 ],
+                       -m_elements[ 9 ],
+                       -m_elements[ 10 ],
+                       -m_elements[ 11 ],
+                       -m_elements[ 12 ],
+                       -m_elements[ 13 ],
+                       -m_elements[ 14 ],
+                       -m_elements[ 15 ] );
+#endif
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Comparison operators
+    // --------------------------------------------------------------------- //
+
+    /// Comparison operator
+    GM_HOST_DEVICE inline bool operator==( const Mat4fA& i_vector ) const
+    {
+        return AlmostEqual( m_elements[ 0 ], i_vector.m_elements[ 0 ] ) &&
+               AlmostEqual( m_elements[ 1 ], i_vector.m_elements[ 1 ] ) &&
+               AlmostEqual( m_elements[ 2 ], i_vector.m_elements[ 2 ] ) &&
+               AlmostEqual( m_elements[ 3 ], i_vector.m_elements[ 3 ] ) &&
+               AlmostEqual( m_elements[ 4 ], i_vector.m_elements[ 4 ] ) &&
+               AlmostEqual( m_elements[ 5 ], i_vector.m_elements[ 5 ] ) &&
+               AlmostEqual( m_elements[ 6 ], i_vector.m_elements[ 6 ] ) &&
+               AlmostEqual( m_elements[ 7 ], i_vector.m_elements[ 7 ] ) &&
+               AlmostEqual( m_elements[ 8 ], i_vector.m_elements[ 8 ] ) &&
+               AlmostEqual( m_elements[ 9 ], i_vector.m_elements[ 9 ] ) &&
+               AlmostEqual( m_elements[ 10 ], i_vector.m_elements[ 10 ] ) &&
+               AlmostEqual( m_elements[ 11 ], i_vector.m_elements[ 11 ] ) &&
+               AlmostEqual( m_elements[ 12 ], i_vector.m_elements[ 12 ] ) &&
+               AlmostEqual( m_elements[ 13 ], i_vector.m_elements[ 13 ] ) &&
+               AlmostEqual( m_elements[ 14 ], i_vector.m_elements[ 14 ] ) &&
+               AlmostEqual( m_elements[ 15 ], i_vector.m_elements[ 15 ] );
+    }
+
+    /// Not equal operator
+    GM_HOST_DEVICE inline bool operator!=( const Mat4fA& i_vector ) const
+    {
+        return !( ( *this ) == i_vector );
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Shape
+    // --------------------------------------------------------------------- //
+
+    /// Get the number of elements in this vector.
+    GM_HOST_DEVICE inline static size_t GetElementSize()
+    {
+        return 16;
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Debug
+    // --------------------------------------------------------------------- //
+
+    /// Are any of the element values NaNs?
+    GM_HOST_DEVICE inline bool HasNaNs() const
+    {
+        return std::isnan( m_elements[ 0 ] ) || std::isnan( m_elements[ 1 ] ) || std::isnan( m_elements[ 2 ] ) ||
+               std::isnan( m_elements[ 3 ] ) || std::isnan( m_elements[ 4 ] ) || std::isnan( m_elements[ 5 ] ) ||
+               std::isnan( m_elements[ 6 ] ) || std::isnan( m_elements[ 7 ] ) || std::isnan( m_elements[ 8 ] ) ||
+               std::isnan( m_elements[ 9 ] ) || std::isnan( m_elements[ 10 ] ) || std::isnan( m_elements[ 11 ] ) ||
+               std::isnan( m_elements[ 12 ] ) || std::isnan( m_elements[ 13 ] ) || std::isnan( m_elements[ 14 ] ) ||
+               std::isnan( m_elements[ 15 ] );
+    }
+
+    /// Get the string representation.  For debugging purposes.
+    ///
+    /// \param i_classPrefix optional string to prefix class tokens.
+    ///
+    /// \return descriptive string representing this type instance.
+    inline std::string GetString( const std::string& i_classPrefix = std::string() ) const
+    {
+        std::stringstream ss;
+        ss << i_classPrefix << "Mat4fA( ";
+        ss << "\n    ";
+        ss << m_elements[ 0 ];
+        ss << ", ";
+        ss << m_elements[ 1 ];
+        ss << ", ";
+        ss << m_elements[ 2 ];
+        ss << ", ";
+        ss << m_elements[ 3 ];
+        ss << ", ";
+        ss << "\n    ";
+        ss << m_elements[ 4 ];
+        ss << ", ";
+        ss << m_elements[ 5 ];
+        ss << ", ";
+        ss << m_elements[ 6 ];
+        ss << ", ";
+        ss << m_elements[ 7 ];
+        ss << ", ";
+        ss << "\n    ";
+        ss << m_elements[ 8 ];
+        ss << ", ";
+        ss << m_elements[ 9 ];
+        ss << ", ";
+        ss << m_elements[ 10 ];
+        ss << ", ";
+        ss << m_elements[ 11 ];
+        ss << ", ";
+        ss << "\n    ";
+        ss << m_elements[ 12 ];
+        ss << ", ";
+        ss << m_elements[ 13 ];
+        ss << ", ";
+        ss << m_elements[ 14 ];
+        ss << ", ";
+        ss << m_elements[ 15 ];
+        ss << "\n)";
+        return ss.str();
+    }
+
+private:
+    float m_elements[ 16 ] =
+        {0.0f, 0.0f, 0.0f, 0.0f, 0.0f, 0.0f, 0.0f, 0.0f, 0.0f, 0.0f, 0.0f, 0.0f, 0.0f, 0.0f, 0.0f, 0.0f};
+};
+
+/// Vector-scalar multiplication.
+GM_HOST_DEVICE inline Mat4fA operator*( const Mat4fA& i_vector, const float& i_scalar )
+{
+    GM_ASSERT( !i_vector.HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+    Mat4fA result;
+#if defined( GM_SIMD_AVX2_ENABLED )
+    _mm256_store_ps( result.Data() + 0,
+                     _mm256_mul_ps( _mm256_load_ps( i_vector.Data() + 0 ), _mm256_set1_ps( i_scalar ) ) );
+    _mm256_store_ps( result.Data() + 8,
+                     _mm256_mul_ps( _mm256_load_ps( i_vector.Data() + 8 ), _mm256_set1_ps( i_scalar ) ) );
+#else
+    _mm_store_ps( result.Data() + 0, _mm_mul_ps( _mm_load_ps( i_vector.Data() + 0 ), _mm_set1_ps( i_scalar ) ) );
+    _mm_store_ps( result.Data() + 4, _mm_mul_ps( _mm_load_ps( i_vector.Data() + 4 ), _mm_set1_ps( i_scalar ) ) );
+    _mm_store_ps( result.Data() + 8, _mm_mul_ps( _mm_load_ps( i_vector.Data() + 8 ), _mm_set1_ps( i_scalar ) ) );
+    _mm_store_ps( result.Data() + 12, _mm_mul_ps( _mm_load_ps( i_vector.Data() + 12 ), _mm_set1_ps( i_scalar ) ) );
+#endif
+    return result;
+#else
+    return Mat4fA( i_vector[ 0 ] * i_scalar,
+                   i_vector[ 1 ] * i_scalar,
+                   i_vector[ 2 ] * i_scalar,
+                   i_vector[ 3 ] * i_scalar,
+                   i_vector[ 4 ] * i_scalar,
+                   i_vector[ 5 ] * i_scalar,
+                   i_vector[ 6 ] * i_scalar,
+                   i_vector[ 7 ] * i_scalar,
+                   i_vector[ 8 ] * i_scalar,
+                   i_vector[ 9 ] * i_scalar,
+                   i_vector[ 10 ] * i_scalar,
+                   i_vector[ 11 ] * i_scalar,
+                   i_vector[ 12 ] * i_scalar,
+                   i_vector[ 13 ] * i_scalar,
+                   i_vector[ 14 ] * i_scalar,
+                   i_vector[ 15 ] * i_scalar );
+#endif
+}
+
+/// Scalar-vector multiplication.
+GM_HOST_DEVICE inline Mat4fA operator*( const float& i_scalar, const Mat4fA& i_vector )
+{
+    GM_ASSERT( !i_vector.HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+    Mat4fA result;
+#if defined( GM_SIMD_AVX2_ENABLED )
+    _mm256_store_ps( result.Data() + 0,
+                     _mm256_mul_ps( _mm256_load_ps( i_vector.Data() + 0 ), _mm256_set1_ps( i_scalar ) ) );
+    _mm256_store_ps( result.Data() + 8,
+                     _mm256_mul_ps( _mm256_load_ps( i_vector.Data() + 8 ), _mm256_set1_ps( i_scalar ) ) );
+#else
+    _mm_store_ps( result.Data() + 0, _mm_mul_ps( _mm_load_ps( i_vector.Data() + 0 ), _mm_set1_ps( i_scalar ) ) );
+    _mm_store_ps( result.Data() + 4, _mm_mul_ps( _mm_load_ps( i_vector.Data() + 4 ), _mm_set1_ps( i_scalar ) ) );
+    _mm_store_ps( result.Data() + 8, _mm_mul_ps( _mm_load_ps( i_vector.Data() + 8 ), _mm_set1_ps( i_scalar ) ) );
+    _mm_store_ps( result.Data() + 12, _mm_mul_ps( _mm_load_ps( i_vector.Data() + 12 ), _mm_set1_ps( i_scalar ) ) );
+#endif
+    return result;
+#else
+    return Mat4fA( i_vector[ 0 ] * i_scalar,
+                   i_vector[ 1 ] * i_scalar,
+                   i_vector[ 2 ] * i_scalar,
+                   i_vector[ 3 ] * i_scalar,
+                   i_vector[ 4 ] * i_scalar,
+                   i_vector[ 5 ] * i_scalar,
+                   i_vector[ 6 ] * i_scalar,
+                   i_vector[ 7 ] * i_scalar,
+                   i_vector[ 8 ] * i_scalar,
+                   i_vector[ 9 ] * i_scalar,
+                   i_vector[ 10 ] * i_scalar,
+                   i_vector[ 11 ] * i_scalar,
+                   i_vector[ 12 ] * i_scalar,
+                   i_vector[ 13 ] * i_scalar,
+                   i_vector[ 14 ] * i_scalar,
+                   i_vector[ 15 ] * i_scalar );
+#endif
+}
+
+/// Operator overload for << to enable writing the string representation of \p i_vector into an output
+/// stream \p o_outputStream.
+///
+/// \param o_outputStream the output stream to write into.
+/// \param i_vector the source vector value type.
+///
+/// \return the output stream.
+inline std::ostream& operator<<( std::ostream& o_outputStream, const Mat4fA& i_vector )
+{
+    o_outputStream << i_vector.GetString();
+    return o_outputStream;
+}
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,29 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file mat4fArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/mat4f.h>
+
+GM_NS_OPEN
+
+/// \typedef Mat4fArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of Mat4f(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 16 float(s) per element.
+using Mat4fArray = std::vector< Mat4f >;
+
+static_assert( sizeof( Mat4f ) == sizeof( float ) * 16, "Mat4f must be tightly packed for Mat4fArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,445 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file quatf.h
+/// \ingroup gm_types_quaternion
+
+#include <gm/gm.h>
+
+#include <cmath>
+#include <cstring>
+#include <sstream>
+
+#include <gm/base/almost.h>
+#include <gm/base/diagnostic.h>
+#include <gm/base/simd.h>
+
+GM_NS_OPEN
+
+/// \class Quatf
+/// \ingroup gm_types_quaternion
+///
+/// Class definition of a quaternion with 4 float elements.
+///
+/// The elements are ordered (x, y, z, w), where x, y and z are the imaginary components and w is the real
+/// component.  A unit quaternion represents a rotation of \f$\theta\f$ radians about a unit axis \f$a\f$ as
+/// \f[
+/// q = ( a \sin( \theta / 2 ), \cos( \theta / 2 ) )
+/// \f]
+/// in a quarter of the storage of a \ref Mat4f.
+///
+/// Element-wise operations are inherited from the vector types, while the quaternion product, interpolation,
+/// vector rotation and matrix conversion are provided as functions.
+class Quatf final
+{
+public:
+    /// \typedef ElementType
+    ///
+    /// Convenience type definition of \ref Quatf's elements.
+    using ElementType = float;
+
+    // --------------------------------------------------------------------- //
+    /// \name Construction
+    // --------------------------------------------------------------------- //
+
+    /// Default constructor, initializing all of the element values to 0.
+    GM_HOST_DEVICE constexpr inline Quatf() = default;
+
+    /// Element-wise constructor.
+    GM_HOST_DEVICE explicit constexpr inline Quatf( const float& i_element0,
+                                                    const float& i_element1,
+                                                    const float& i_element2,
+                                                    const float& i_element3 )
+        : m_elements{i_element0, i_element1, i_element2, i_element3}
+    {
+        GM_ASSERT( !HasNaNs() );
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Indexed element access
+    // --------------------------------------------------------------------- //
+
+    /// Indexed element write access.
+    ///
+    /// \param i_index index of the element.
+    ///
+    /// \pre \p i_index must be less than 4.
+    ///
+    /// \return mutable element value.
+    GM_HOST_DEVICE inline float& operator[]( size_t i_index )
+    {
+        GM_ASSERT( !HasNaNs() );
+        GM_ASSERT( i_index < 4 );
+        return m_elements[ i_index ];
+    }
+
+    /// Indexed element read access.
+    ///
+    /// \param i_index index of the element.
+    ///
+    /// \pre \p i_index must be less than 4.
+    ///
+    /// \return immutable element value.
+    GM_HOST_DEVICE inline const float& operator[]( size_t i_index ) const
+    {
+        GM_ASSERT( !HasNaNs() );
+        GM_ASSERT( i_index < 4 );
+        return m_elements[ i_index ];
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Raw element storage access
+    // --------------------------------------------------------------------- //
+
+    /// Mutable access to the contiguous, row-major storage of the 4 elements.
+    ///
+    /// \return pointer to the first element.
+    GM_HOST_DEVICE inline float* Data()
+    {
+        return m_elements;
+    }
+
+    /// Immutable access to the contiguous, row-major storage of the 4 elements.
+    ///
+    /// \return pointer to the first element.
+    GM_HOST_DEVICE inline const float* Data() const
+    {
+        return m_elements;
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Quaternion identity element
+    // --------------------------------------------------------------------- //
+
+    /// Get the identity element for this quaternion type, representing no rotation.
+    ///
+    /// \return The identity element.
+    GM_HOST_DEVICE static constexpr inline Quatf Identity()
+    {
+        return Quatf( 0.0f, 0.0f, 0.0f, 1.0f );
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Named element access.
+    // --------------------------------------------------------------------- //
+
+    /// Convenience named const accessor for the element at index 0.
+    ///
+    /// \return Const reference to the element at index 0.
+    GM_HOST_DEVICE inline const float& X() const
+    {
+        GM_ASSERT( !HasNaNs() );
+        return m_elements[ 0 ];
+    }
+
+    /// Convenience named mutable accessor for the element at index
+    ///
+    /// \return Mutable reference to the element at index 0.
+    GM_HOST_DEVICE inline float& X()
+    {
+        GM_ASSERT( !HasNaNs() );
+        return m_elements[ 0 ];
+    }
+    /// Convenience named const accessor for the element at index 1.
+    ///
+    /// \return Const reference to the element at index 1.
+    GM_HOST_DEVICE inline const float& Y() const
+    {
+        GM_ASSERT( !HasNaNs() );
+        return m_elements[ 1 ];
+    }
+
+    /// Convenience named mutable accessor for the element at index
+    ///
+    /// \return Mutable reference to the element at index 1.
+    GM_HOST_DEVICE inline float& Y()
+    {
+        GM_ASSERT( !HasNaNs() );
+        return m_elements[ 1 ];
+    }
+    /// Convenience named const accessor for the element at index 2.
+    ///
+    /// \return Const reference to the element at index 2.
+    GM_HOST_DEVICE inline const float& Z() const
+    {
+        GM_ASSERT( !HasNaNs() );
+        return m_elements[ 2 ];
+    }
+
+    /// Convenience named mutable accessor for the element at index
+    ///
+    /// \return Mutable reference to the element at index 2.
+    GM_HOST_DEVICE inline float& Z()
+    {
+        GM_ASSERT( !HasNaNs() );
+        return m_elements[ 2 ];
+    }
+    /// Convenience named const accessor for the element at index 3.
+    ///
+    /// \return Const reference to the element at index 3.
+    GM_HOST_DEVICE inline const float& W() const
+    {
+        GM_ASSERT( !HasNaNs() );
+        return m_elements[ 3 ];
+    }
+
+    /// Convenience named mutable accessor for the element at index
+    ///
+    /// \return Mutable reference to the element at index 3.
+    GM_HOST_DEVICE inline float& W()
+    {
+        GM_ASSERT( !HasNaNs() );
+        return m_elements[ 3 ];
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Arithmetic operators
+    // --------------------------------------------------------------------- //
+
+    /// Element-wise vector addition.
+    ///
+    /// Corresponding elements of the current vector and \p i_vector are added to form a new vector.
+    ///
+    /// \return the new vector.
+    GM_HOST_DEVICE inline Quatf operator+( const Quatf& i_vector ) const
+    {
+        GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        Quatf result;
+        _mm_storeu_ps( result.m_elements + 0,
+                       _mm_add_ps( _mm_loadu_ps( m_elements + 0 ), _mm_loadu_ps( i_vector.m_elements + 0 ) ) );
+        return result;
+#else
+        return Quatf( m_elements[ 0 ] + i_vector.m_elements[ 0 ],
+                      m_elements[ 1 ] + i_vector.m_elements[ 1 ],
+                      m_elements[ 2 ] + i_vector.m_elements[ 2 ],
+                      m_elements[ 3 ] + i_vector.m_elements[ 3 ] );
+#endif
+    }
+
+    /// Element-wise vector addition assignment.
+    GM_HOST_DEVICE inline Quatf& operator+=( const Quatf& i_vector )
+    {
+        GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        _mm_storeu_ps( m_elements + 0,
+                       _mm_add_ps( _mm_loadu_ps( m_elements + 0 ), _mm_loadu_ps( i_vector.m_elements + 0 ) ) );
+#else
+        m_elements[ 0 ] += i_vector.m_elements[ 0 ];
+        m_elements[ 1 ] += i_vector.m_elements[ 1 ];
+        m_elements[ 2 ] += i_vector.m_elements[ 2 ];
+        m_elements[ 3 ] += i_vector.m_elements[ 3 ];
+#endif
+        return *this;
+    }
+
+    /// Vector subtraction.
+    GM_HOST_DEVICE inline Quatf operator-( const Quatf& i_vector ) const
+    {
+        GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        Quatf result;
+        _mm_storeu_ps( result.m_elements + 0,
+                       _mm_sub_ps( _mm_loadu_ps( m_elements + 0 ), _mm_loadu_ps( i_vector.m_elements + 0 ) ) );
+        return result;
+#else
+        return Quatf( m_elements[ 0 ] - i_vector.m_elements[ 0 ],
+                      m_elements[ 1 ] - i_vector.m_elements[ 1 ],
+                      m_elements[ 2 ] - i_vector.m_elements[ 2 ],
+                      m_elements[ 3 ] - i_vector.m_elements[ 3 ] );
+#endif
+    }
+
+    /// Vector subtraction assignment.
+    GM_HOST_DEVICE inline Quatf& operator-=( const Quatf& i_vector )
+    {
+        GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        _mm_storeu_ps( m_elements + 0,
+                       _mm_sub_ps( _mm_loadu_ps( m_elements + 0 ), _mm_loadu_ps( i_vector.m_elements + 0 ) ) );
+#else
+        m_elements[ 0 ] -= i_vector.m_elements[ 0 ];
+        m_elements[ 1 ] -= i_vector.m_elements[ 1 ];
+        m_elements[ 2 ] -= i_vector.m_elements[ 2 ];
+        m_elements[ 3 ] -= i_vector.m_elements[ 3 ];
+#endif
+        return *this;
+    }
+
+    /// Scalar multiplication assignment.
+    GM_HOST_DEVICE inline Quatf& operator*=( const float& i_scalar )
+    {
+        GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        _mm_storeu_ps( m_elements + 0, _mm_mul_ps( _mm_loadu_ps( m_elements + 0 ), _mm_set1_ps( i_scalar ) ) );
+#else
+        m_elements[ 0 ] *= i_scalar;
+        m_elements[ 1 ] *= i_scalar;
+        m_elements[ 2 ] *= i_scalar;
+        m_elements[ 3 ] *= i_scalar;
+#endif
+        return *this;
+    }
+
+    /// Scalar division.
+    GM_HOST_DEVICE inline Quatf operator/( const float& i_scalar ) const
+    {
+        GM_ASSERT( !HasNaNs() );
+        GM_ASSERT( i_scalar != 0.0f );
+        float reciprocal = 1.0f / i_scalar;
+#if defined( GM_SIMD_SSE_ENABLED )
+        Quatf result;
+        _mm_storeu_ps( result.m_elements + 0, _mm_mul_ps( _mm_loadu_ps( m_elements + 0 ), _mm_set1_ps( reciprocal ) ) );
+        return result;
+#else
+        return Quatf( m_elements[ 0 ] * reciprocal,
+                      m_elements[ 1 ] * reciprocal,
+                      m_elements[ 2 ] * reciprocal,
+                      m_elements[ 3 ] * reciprocal );
+#endif
+    }
+
+    /// Scalar division assignment.
+    GM_HOST_DEVICE inline Quatf& operator/=( const float& i_scalar )
+    {
+        GM_ASSERT( !HasNaNs() );
+        GM_ASSERT( i_scalar != 0.0f );
+        float reciprocal = 1.0f / i_scalar;
+#if defined( GM_SIMD_SSE_ENABLED )
+        _mm_storeu_ps( m_elements + 0, _mm_mul_ps( _mm_loadu_ps( m_elements + 0 ), _mm_set1_ps( reciprocal ) ) );
+#else
+        m_elements[ 0 ] *= reciprocal;
+        m_elements[ 1 ] *= reciprocal;
+        m_elements[ 2 ] *= reciprocal;
+        m_elements[ 3 ] *= reciprocal;
+#endif
+        return *this;
+    }
+
+    /// Unary negation.
+    GM_HOST_DEVICE inline Quatf operator-() const
+    {
+        GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        // Flip the sign bits.
+        Quatf result;
+        _mm_storeu_ps( result.m_elements + 0, _mm_xor_ps( _mm_loadu_ps( m_elements + 0 ), _mm_set1_ps( -0.0f ) ) );
+        return result;
+#else
+        return Quatf( -m_elements[ 0 ], -m_elements[ 1 ], -m_elements[ 2 ], -m_elements[ 3 ] );
+#endif
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Comparison operators
+    // --------------------------------------------------------------------- //
+
+    /// Comparison operator
+    GM_HOST_DEVICE inline bool operator==( const Quatf& i_vector ) const
+    {
+        return AlmostEqual( m_elements[ 0 ], i_vector.m_elements[ 0 ] ) &&
+               AlmostEqual( m_elements[ 1 ], i_vector.m_elements[ 1 ] ) &&
+               AlmostEqual( m_elements[ 2 ], i_vector.m_elements[ 2 ] ) &&
+               AlmostEqual( m_elements[ 3 ], i_vector.m_elements[ 3 ] );
+    }
+
+    /// Not equal operator
+    GM_HOST_DEVICE inline bool operator!=( const Quatf& i_vector ) const
+    {
+        return !( ( *this ) == i_vector );
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Shape
+    // --------------------------------------------------------------------- //
+
+    /// Get the number of elements in this vector.
+    GM_HOST_DEVICE inline static size_t GetElementSize()
+    {
+        return 4;
+    }
+
+    // --------------------------------------------------------------------- //
+    /// \name Debug
+    // --------------------------------------------------------------------- //
+
+    /// Are any of the element values NaNs?
+    GM_HOST_DEVICE inline bool HasNaNs() const
+    {
+        return std::isnan( m_elements[ 0 ] ) || std::isnan( m_elements[ 1 ] ) || std::isnan( m_elements[ 2 ] ) ||
+               std::isnan( m_elements[ 3 ] );
+    }
+
+    /// Get the string representation.  For debugging purposes.
+    ///
+    /// \param i_classPrefix optional string to prefix class tokens.
+    ///
+    /// \return descriptive string representing this type instance.
+    inline std::string GetString( const std::string& i_classPrefix = std::string() ) const
+    {
+        std::stringstream ss;
+        ss << i_classPrefix << "Quatf( ";
+        ss << m_elements[ 0 ];
+        ss << ", ";
+        ss << m_elements[ 1 ];
+        ss << ", ";
+        ss << m_elements[ 2 ];
+        ss << ", ";
+        ss << m_elements[ 3 ];
+        ss << " )";
+        return ss.str();
+    }
+
+private:
+    float m_elements[ 4 ] = {0.0f, 0.0f, 0.0f, 0.0f};
+};
+
+/// Vector-scalar multiplication.
+GM_HOST_DEVICE inline Quatf operator*( const Quatf& i_vector, const float& i_scalar )
+{
+    GM_ASSERT( !i_vector.HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+    Quatf result;
+    _mm_storeu_ps( result.Data() + 0, _mm_mul_ps( _mm_loadu_ps( i_vector.Data() + 0 ), _mm_set1_ps( i_scalar ) ) );
+    return result;
+#else
+    return Quatf( i_vector[ 0 ] * i_scalar,
+                  i_vector[ 1 ] * i_scalar,
+                  i_vector[ 2 ] * i_scalar,
+                  i_vector[ 3 ] * i_scalar );
+#endif
+}
+
+/// Scalar-vector multiplication.
+GM_HOST_DEVICE inline Quatf operator*( const float& i_scalar, const Quatf& i_vector )
+{
+    GM_ASSERT( !i_vector.HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+    Quatf result;
+    _mm_storeu_ps( result.Data() + 0, _mm_mul_ps( _mm_loadu_ps( i_vector.Data() + 0 ), _mm_set1_ps( i_scalar ) ) );
+    return result;
+#else
+    return Quatf( i_vector[ 0 ] * i_scalar,
+                  i_vector[ 1 ] * i_scalar,
+                  i_vector[ 2 ] * i_scalar,
+                  i_vector[ 3 ] * i_scalar );
+#endif
+}
+
+/// Operator overload for << to enable writing the string representation of \p i_vector into an output
+/// stream \p o_outputStream.
+///
+/// \param o_outputStream the output stream to write into.
+/// \param i_vector the source vector value type.
+///
+/// \return the output stream.
+inline std::ostream& operator<<( std::ostream& o_outputStream, const Quatf& i_vector )
+{
+    o_outputStream << i_vector.GetString();
+    return o_outputStream;
+}
+
+GM_NS_CLOSE
\ No newline at end of file
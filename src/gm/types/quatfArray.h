@@ -0,0 +1,29 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file quatfArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/quatf.h>
+
+GM_NS_OPEN
+
+/// \typedef QuatfArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of Quatf(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 4 float(s) per element.
+using QuatfArray = std::vector< Quatf >;
+
+static_assert( sizeof( Quatf ) == sizeof( float ) * 4, "Quatf must be tightly packed for QuatfArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
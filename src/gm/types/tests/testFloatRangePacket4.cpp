@@ -0,0 +1,49 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/types/floatRangePacket4.h>
+
+#include <cstdint>
+
+TEST_CASE( "FloatRangePacket4_DefaultConstructor" )
+{
+    gm::FloatRangePacket4 packet;
+    for ( size_t componentIndex = 0; componentIndex < 2; ++componentIndex )
+    {
+        for ( size_t laneIndex = 0; laneIndex < 4; ++laneIndex )
+        {
+            CHECK( packet( componentIndex, laneIndex ) == 0.0f );
+        }
+    }
+}
+
+TEST_CASE( "FloatRangePacket4_BroadcastConstructor" )
+{
+    gm::FloatRangePacket4 packet( gm::FloatRange( -2.0f, 2.0f ) );
+    for ( size_t laneIndex = 0; laneIndex < 4; ++laneIndex )
+    {
+        CHECK( packet.GetLane( laneIndex ) == gm::FloatRange( -2.0f, 2.0f ) );
+    }
+}
+
+TEST_CASE( "FloatRangePacket4_LaneAccess" )
+{
+    gm::FloatRangePacket4 packet;
+    packet.SetLane( 0, gm::FloatRange( -1.0f, 1.0f ) );
+    packet.SetLane( 3, gm::FloatRange( -3.0f, 3.0f ) );
+    CHECK( packet.GetLane( 0 ) == gm::FloatRange( -1.0f, 1.0f ) );
+    CHECK( packet.GetLane( 1 ) == gm::FloatRange( 0.0f, 0.0f ) );
+    CHECK( packet.GetLane( 3 ) == gm::FloatRange( -3.0f, 3.0f ) );
+}
+
+TEST_CASE( "FloatRangePacket4_StructureOfArraysStorage" )
+{
+    gm::FloatRangePacket4 packet;
+    packet( 1, 2 ) = 5.0f;
+    CHECK( packet.Lanes( 1 )[ 2 ] == 5.0f );
+    CHECK( packet.Lanes( 1 ) - packet.Lanes( 0 ) == 4 );
+    CHECK( reinterpret_cast< std::uintptr_t >( packet.Lanes( 0 ) ) % 16 == 0 );
+}
\ No newline at end of file
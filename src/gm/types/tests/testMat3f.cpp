@@ -63,6 +63,23 @@ TEST_CASE( "Mat3f_ElementWriteAccess" )
     CHECK( matrix[ 8 ] == 40.0f );
 }
 
+TEST_CASE( "Mat3f_DataAccess" )
+{
+    gm::Mat3f matrix = gm::Mat3f( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f );
+    float*    data   = matrix.Data();
+    CHECK( data[ 0 ] == 0.0f );
+    CHECK( data[ 1 ] == 2.0f );
+    CHECK( data[ 2 ] == 4.0f );
+    CHECK( data[ 3 ] == 6.0f );
+    CHECK( data[ 4 ] == 8.0f );
+    CHECK( data[ 5 ] == 10.0f );
+    CHECK( data[ 6 ] == 12.0f );
+    CHECK( data[ 7 ] == 14.0f );
+    CHECK( data[ 8 ] == 16.0f );
+    data[ 0 ] = 7.0f;
+    CHECK( matrix[ 0 ] == 7.0f );
+}
+
 TEST_CASE( "Mat3f_MatrixElementReadAccess" )
 {
     gm::Mat3f matrix = gm::Mat3f( 0.0f, 1.0f, 2.0f, 3.0f, 4.0f, 5.0f, 6.0f, 7.0f, 8.0f );
@@ -0,0 +1,211 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/types/mat3fA.h>
+
+TEST_CASE( "Mat3fA_DefaultConstructor" )
+{
+    gm::Mat3fA matrix;
+    CHECK( matrix == gm::Mat3fA( 0.0f, 0.0f, 0.0f, 0.0f, 0.0f, 0.0f, 0.0f, 0.0f, 0.0f ) );
+}
+
+TEST_CASE( "Mat3fA_CopyConstructor" )
+{
+    gm::Mat3fA matrixA = gm::Mat3fA( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f );
+    gm::Mat3fA matrixB( matrixA );
+    CHECK( matrixA == matrixB );
+}
+
+TEST_CASE( "Mat3fA_CopyAssignmentConstructor" )
+{
+    gm::Mat3fA matrixA = gm::Mat3fA( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f );
+    gm::Mat3fA matrixB = matrixA;
+    CHECK( matrixA == matrixB );
+}
+
+TEST_CASE( "Mat3fA_ElementReadAccess" )
+{
+    gm::Mat3fA matrix = gm::Mat3fA( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f );
+    CHECK( matrix[ 0 ] == 0.0f );
+    CHECK( matrix[ 1 ] == 2.0f );
+    CHECK( matrix[ 2 ] == 4.0f );
+    CHECK( matrix[ 3 ] == 6.0f );
+    CHECK( matrix[ 4 ] == 8.0f );
+    CHECK( matrix[ 5 ] == 10.0f );
+    CHECK( matrix[ 6 ] == 12.0f );
+    CHECK( matrix[ 7 ] == 14.0f );
+    CHECK( matrix[ 8 ] == 16.0f );
+}
+
+TEST_CASE( "Mat3fA_ElementWriteAccess" )
+{
+    gm::Mat3fA matrix;
+    matrix[ 0 ] = 0.0f;
+    matrix[ 1 ] = 5.0f;
+    matrix[ 2 ] = 10.0f;
+    matrix[ 3 ] = 15.0f;
+    matrix[ 4 ] = 20.0f;
+    matrix[ 5 ] = 25.0f;
+    matrix[ 6 ] = 30.0f;
+    matrix[ 7 ] = 35.0f;
+    matrix[ 8 ] = 40.0f;
+    CHECK( matrix[ 0 ] == 0.0f );
+    CHECK( matrix[ 1 ] == 5.0f );
+    CHECK( matrix[ 2 ] == 10.0f );
+    CHECK( matrix[ 3 ] == 15.0f );
+    CHECK( matrix[ 4 ] == 20.0f );
+    CHECK( matrix[ 5 ] == 25.0f );
+    CHECK( matrix[ 6 ] == 30.0f );
+    CHECK( matrix[ 7 ] == 35.0f );
+    CHECK( matrix[ 8 ] == 40.0f );
+}
+
+TEST_CASE( "Mat3fA_DataAccess" )
+{
+    gm::Mat3fA matrix = gm::Mat3fA( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f );
+    float*     data   = matrix.Data();
+    CHECK( data[ 0 ] == 0.0f );
+    CHECK( data[ 1 ] == 2.0f );
+    CHECK( data[ 2 ] == 4.0f );
+    CHECK( data[ 3 ] == 6.0f );
+    CHECK( data[ 4 ] == 8.0f );
+    CHECK( data[ 5 ] == 10.0f );
+    CHECK( data[ 6 ] == 12.0f );
+    CHECK( data[ 7 ] == 14.0f );
+    CHECK( data[ 8 ] == 16.0f );
+    data[ 0 ] = 7.0f;
+    CHECK( matrix[ 0 ] == 7.0f );
+}
+
+TEST_CASE( "Mat3fA_MatrixElementReadAccess" )
+{
+    gm::Mat3fA matrix = gm::Mat3fA( 0.0f, 1.0f, 2.0f, 3.0f, 4.0f, 5.0f, 6.0f, 7.0f, 8.0f );
+    CHECK( matrix( 0, 0 ) == 0.0f );
+    CHECK( matrix( 0, 1 ) == 1.0f );
+    CHECK( matrix( 0, 2 ) == 2.0f );
+    CHECK( matrix( 1, 0 ) == 3.0f );
+    CHECK( matrix( 1, 1 ) == 4.0f );
+    CHECK( matrix( 1, 2 ) == 5.0f );
+    CHECK( matrix( 2, 0 ) == 6.0f );
+    CHECK( matrix( 2, 1 ) == 7.0f );
+    CHECK( matrix( 2, 2 ) == 8.0f );
+}
+
+TEST_CASE( "Mat3fA_MatrixElementWriteAccess" )
+{
+    gm::Mat3fA matrix;
+    matrix( 0, 0 ) = 0.0f;
+    matrix( 0, 1 ) = 1.0f;
+    matrix( 0, 2 ) = 2.0f;
+    matrix( 1, 0 ) = 3.0f;
+    matrix( 1, 1 ) = 4.0f;
+    matrix( 1, 2 ) = 5.0f;
+    matrix( 2, 0 ) = 6.0f;
+    matrix( 2, 1 ) = 7.0f;
+    matrix( 2, 2 ) = 8.0f;
+    CHECK( matrix == gm::Mat3fA( 0.0f, 1.0f, 2.0f, 3.0f, 4.0f, 5.0f, 6.0f, 7.0f, 8.0f ) );
+}
+
+TEST_CASE( "Mat3fA_Identity" )
+{
+    gm::Mat3fA matrix = gm::Mat3fA::Identity();
+
+    CHECK( matrix == gm::Mat3fA( 1.0f, 0.0f, 0.0f, 0.0f, 1.0f, 0.0f, 0.0f, 0.0f, 1.0f ) );
+}
+
+TEST_CASE( "Mat3fA_Addition" )
+{
+    gm::Mat3fA matrixA = gm::Mat3fA( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f );
+    gm::Mat3fA matrixB = gm::Mat3fA( 0.0f, 5.0f, 10.0f, 15.0f, 20.0f, 25.0f, 30.0f, 35.0f, 40.0f );
+    gm::Mat3fA matrixC = matrixA + matrixB;
+    CHECK( matrixC == gm::Mat3fA( 0.0f, 7.0f, 14.0f, 21.0f, 28.0f, 35.0f, 42.0f, 49.0f, 56.0f ) );
+}
+
+TEST_CASE( "Mat3fA_AdditionAssignment" )
+{
+    gm::Mat3fA matrixA = gm::Mat3fA( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f );
+    gm::Mat3fA matrixB = gm::Mat3fA( 0.0f, 5.0f, 10.0f, 15.0f, 20.0f, 25.0f, 30.0f, 35.0f, 40.0f );
+    matrixB += matrixA;
+    CHECK( matrixB == gm::Mat3fA( 0.0f, 7.0f, 14.0f, 21.0f, 28.0f, 35.0f, 42.0f, 49.0f, 56.0f ) );
+}
+
+TEST_CASE( "Mat3fA_Subtraction" )
+{
+    gm::Mat3fA matrixA = gm::Mat3fA( 0.0f, 7.0f, 14.0f, 21.0f, 28.0f, 35.0f, 42.0f, 49.0f, 56.0f );
+    gm::Mat3fA matrixB = gm::Mat3fA( 0.0f, 5.0f, 10.0f, 15.0f, 20.0f, 25.0f, 30.0f, 35.0f, 40.0f );
+    gm::Mat3fA matrixC = matrixA - matrixB;
+    CHECK( matrixC == gm::Mat3fA( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f ) );
+}
+
+TEST_CASE( "Mat3fA_SubtractionAssignment" )
+{
+    gm::Mat3fA matrixA = gm::Mat3fA( 0.0f, 5.0f, 10.0f, 15.0f, 20.0f, 25.0f, 30.0f, 35.0f, 40.0f );
+    gm::Mat3fA matrixB = gm::Mat3fA( 0.0f, 7.0f, 14.0f, 21.0f, 28.0f, 35.0f, 42.0f, 49.0f, 56.0f );
+    matrixB -= matrixA;
+    CHECK( matrixB == gm::Mat3fA( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f ) );
+}
+
+TEST_CASE( "Mat3fA_ScalarVectorMultiplication" )
+{
+    gm::Mat3fA matrixA = gm::Mat3fA( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f );
+    gm::Mat3fA matrixB = 5.0f * matrixA;
+    CHECK( matrixB == gm::Mat3fA( 0.0f, 10.0f, 20.0f, 30.0f, 40.0f, 50.0f, 60.0f, 70.0f, 80.0f ) );
+}
+
+TEST_CASE( "Mat3fA_VectorScalarMultiplication" )
+{
+    gm::Mat3fA matrixA = gm::Mat3fA( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f );
+    gm::Mat3fA matrixB = matrixA * 5.0f;
+    CHECK( matrixB == gm::Mat3fA( 0.0f, 10.0f, 20.0f, 30.0f, 40.0f, 50.0f, 60.0f, 70.0f, 80.0f ) );
+}
+
+TEST_CASE( "Mat3fA_ScalarMultiplicationAssignment" )
+{
+    gm::Mat3fA matrixA = gm::Mat3fA( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f );
+    matrixA *= 5;
+    CHECK( matrixA == gm::Mat3fA( 0.0f, 10.0f, 20.0f, 30.0f, 40.0f, 50.0f, 60.0f, 70.0f, 80.0f ) );
+}
+
+TEST_CASE( "Mat3fA_VectorScalarDivision" )
+{
+    gm::Mat3fA matrixA = gm::Mat3fA( 0.0f, 10.0f, 20.0f, 30.0f, 40.0f, 50.0f, 60.0f, 70.0f, 80.0f );
+    gm::Mat3fA matrixB = matrixA / 5.0f;
+    CHECK( matrixB == gm::Mat3fA( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f ) );
+}
+
+TEST_CASE( "Mat3fA_ScalarDivisionAssignment" )
+{
+    gm::Mat3fA matrixA = gm::Mat3fA( 0.0f, 10.0f, 20.0f, 30.0f, 40.0f, 50.0f, 60.0f, 70.0f, 80.0f );
+    matrixA /= 5;
+    CHECK( matrixA == gm::Mat3fA( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f ) );
+}
+
+TEST_CASE( "Mat3fA_Negation" )
+{
+    gm::Mat3fA matrix = gm::Mat3fA( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f );
+    CHECK( -matrix == gm::Mat3fA( 0.0f, -2.0f, -4.0f, -6.0f, -8.0f, -10.0f, -12.0f, -14.0f, -16.0f ) );
+}
+
+TEST_CASE( "Mat3fA_Alignment" )
+{
+    CHECK( alignof( gm::Mat3fA ) == 16 );
+    CHECK( sizeof( gm::Mat3fA ) % 16 == 0 );
+    CHECK( sizeof( gm::Mat3fA ) >= sizeof( gm::Mat3f ) );
+
+    gm::Mat3fA matrixs[ 3 ];
+    for ( const gm::Mat3fA& matrix : matrixs )
+    {
+        CHECK( reinterpret_cast< uintptr_t >( matrix.Data() ) % 16 == 0 );
+    }
+}
+
+TEST_CASE( "Mat3fA_UnalignedConversion" )
+{
+    gm::Mat3f  unaligned = gm::Mat3f( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f );
+    gm::Mat3fA aligned( unaligned );
+    CHECK( aligned == gm::Mat3fA( 0.0f, 2.0f, 4.0f, 6.0f, 8.0f, 10.0f, 12.0f, 14.0f, 16.0f ) );
+    CHECK( aligned.GetUnaligned() == unaligned );
+}
@@ -131,6 +131,45 @@ TEST_CASE( "Mat4f_ElementWriteAccess" )
     CHECK( matrix[ 15 ] == 75.0f );
 }
 
+TEST_CASE( "Mat4f_DataAccess" )
+{
+    gm::Mat4f matrix = gm::Mat4f( 0.0f,
+                                  2.0f,
+                                  4.0f,
+                                  6.0f,
+                                  8.0f,
+                                  10.0f,
+                                  12.0f,
+                                  14.0f,
+                                  16.0f,
+                                  18.0f,
+                                  20.0f,
+                                  22.0f,
+                                  24.0f,
+                                  26.0f,
+                                  28.0f,
+                                  30.0f );
+    float*    data   = matrix.Data();
+    CHECK( data[ 0 ] == 0.0f );
+    CHECK( data[ 1 ] == 2.0f );
+    CHECK( data[ 2 ] == 4.0f );
+    CHECK( data[ 3 ] == 6.0f );
+    CHECK( data[ 4 ] == 8.0f );
+    CHECK( data[ 5 ] == 10.0f );
+    CHECK( data[ 6 ] == 12.0f );
+    CHECK( data[ 7 ] == 14.0f );
+    CHECK( data[ 8 ] == 16.0f );
+    CHECK( data[ 9 ] == 18.0f );
+    CHECK( data[ 10 ] == 20.0f );
+    CHECK( data[ 11 ] == 22.0f );
+    CHECK( data[ 12 ] == 24.0f );
+    CHECK( data[ 13 ] == 26.0f );
+    CHECK( data[ 14 ] == 28.0f );
+    CHECK( data[ 15 ] == 30.0f );
+    data[ 0 ] = 7.0f;
+    CHECK( matrix[ 0 ] == 7.0f );
+}
+
 TEST_CASE( "Mat4f_MatrixElementReadAccess" )
 {
     gm::Mat4f matrix = gm::
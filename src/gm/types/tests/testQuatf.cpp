@@ -0,0 +1,192 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/types/quatf.h>
+
+TEST_CASE( "Quatf_DefaultConstructor" )
+{
+    gm::Quatf quaternion;
+    CHECK( quaternion == gm::Quatf( 0.0f, 0.0f, 0.0f, 0.0f ) );
+}
+
+TEST_CASE( "Quatf_CopyConstructor" )
+{
+    gm::Quatf quaternionA = gm::Quatf( 0.0f, 2.0f, 4.0f, 6.0f );
+    gm::Quatf quaternionB( quaternionA );
+    CHECK( quaternionA == quaternionB );
+}
+
+TEST_CASE( "Quatf_CopyAssignmentConstructor" )
+{
+    gm::Quatf quaternionA = gm::Quatf( 0.0f, 2.0f, 4.0f, 6.0f );
+    gm::Quatf quaternionB = quaternionA;
+    CHECK( quaternionA == quaternionB );
+}
+
+TEST_CASE( "Quatf_ElementReadAccess" )
+{
+    gm::Quatf quaternion = gm::Quatf( 0.0f, 2.0f, 4.0f, 6.0f );
+    CHECK( quaternion[ 0 ] == 0.0f );
+    CHECK( quaternion[ 1 ] == 2.0f );
+    CHECK( quaternion[ 2 ] == 4.0f );
+    CHECK( quaternion[ 3 ] == 6.0f );
+}
+
+TEST_CASE( "Quatf_ElementWriteAccess" )
+{
+    gm::Quatf quaternion;
+    quaternion[ 0 ] = 0.0f;
+    quaternion[ 1 ] = 5.0f;
+    quaternion[ 2 ] = 10.0f;
+    quaternion[ 3 ] = 15.0f;
+    CHECK( quaternion[ 0 ] == 0.0f );
+    CHECK( quaternion[ 1 ] == 5.0f );
+    CHECK( quaternion[ 2 ] == 10.0f );
+    CHECK( quaternion[ 3 ] == 15.0f );
+}
+
+TEST_CASE( "Quatf_DataAccess" )
+{
+    gm::Quatf quaternion = gm::Quatf( 0.0f, 2.0f, 4.0f, 6.0f );
+    float*    data       = quaternion.Data();
+    CHECK( data[ 0 ] == 0.0f );
+    CHECK( data[ 1 ] == 2.0f );
+    CHECK( data[ 2 ] == 4.0f );
+    CHECK( data[ 3 ] == 6.0f );
+    data[ 0 ] = 7.0f;
+    CHECK( quaternion[ 0 ] == 7.0f );
+}
+
+TEST_CASE( "Quatf_NamedElementReadAccessorX" )
+{
+    gm::Quatf quaternion = gm::Quatf( 0.0f, 1.0f, 2.0f, 3.0f );
+    CHECK( quaternion.X() == 0.0f );
+}
+
+TEST_CASE( "Quatf_NamedElementWriteAccessorX" )
+{
+    gm::Quatf quaternion;
+    quaternion.X() = 0.0f;
+    CHECK( quaternion[ 0 ] == 0.0f );
+}
+TEST_CASE( "Quatf_NamedElementReadAccessorY" )
+{
+    gm::Quatf quaternion = gm::Quatf( 0.0f, 1.0f, 2.0f, 3.0f );
+    CHECK( quaternion.Y() == 1.0f );
+}
+
+TEST_CASE( "Quatf_NamedElementWriteAccessorY" )
+{
+    gm::Quatf quaternion;
+    quaternion.Y() = 1.0f;
+    CHECK( quaternion[ 1 ] == 1.0f );
+}
+TEST_CASE( "Quatf_NamedElementReadAccessorZ" )
+{
+    gm::Quatf quaternion = gm::Quatf( 0.0f, 1.0f, 2.0f, 3.0f );
+    CHECK( quaternion.Z() == 2.0f );
+}
+
+TEST_CASE( "Quatf_NamedElementWriteAccessorZ" )
+{
+    gm::Quatf quaternion;
+    quaternion.Z() = 2.0f;
+    CHECK( quaternion[ 2 ] == 2.0f );
+}
+TEST_CASE( "Quatf_NamedElementReadAccessorW" )
+{
+    gm::Quatf quaternion = gm::Quatf( 0.0f, 1.0f, 2.0f, 3.0f );
+    CHECK( quaternion.W() == 3.0f );
+}
+
+TEST_CASE( "Quatf_NamedElementWriteAccessorW" )
+{
+    gm::Quatf quaternion;
+    quaternion.W() = 3.0f;
+    CHECK( quaternion[ 3 ] == 3.0f );
+}
+
+TEST_CASE( "Quatf_Addition" )
+{
+    gm::Quatf quaternionA = gm::Quatf( 0.0f, 2.0f, 4.0f, 6.0f );
+    gm::Quatf quaternionB = gm::Quatf( 0.0f, 5.0f, 10.0f, 15.0f );
+    gm::Quatf quaternionC = quaternionA + quaternionB;
+    CHECK( quaternionC == gm::Quatf( 0.0f, 7.0f, 14.0f, 21.0f ) );
+}
+
+TEST_CASE( "Quatf_AdditionAssignment" )
+{
+    gm::Quatf quaternionA = gm::Quatf( 0.0f, 2.0f, 4.0f, 6.0f );
+    gm::Quatf quaternionB = gm::Quatf( 0.0f, 5.0f, 10.0f, 15.0f );
+    quaternionB += quaternionA;
+    CHECK( quaternionB == gm::Quatf( 0.0f, 7.0f, 14.0f, 21.0f ) );
+}
+
+TEST_CASE( "Quatf_Subtraction" )
+{
+    gm::Quatf quaternionA = gm::Quatf( 0.0f, 7.0f, 14.0f, 21.0f );
+    gm::Quatf quaternionB = gm::Quatf( 0.0f, 5.0f, 10.0f, 15.0f );
+    gm::Quatf quaternionC = quaternionA - quaternionB;
+    CHECK( quaternionC == gm::Quatf( 0.0f, 2.0f, 4.0f, 6.0f ) );
+}
+
+TEST_CASE( "Quatf_SubtractionAssignment" )
+{
+    gm::Quatf quaternionA = gm::Quatf( 0.0f, 5.0f, 10.0f, 15.0f );
+    gm::Quatf quaternionB = gm::Quatf( 0.0f, 7.0f, 14.0f, 21.0f );
+    quaternionB -= quaternionA;
+    CHECK( quaternionB == gm::Quatf( 0.0f, 2.0f, 4.0f, 6.0f ) );
+}
+
+TEST_CASE( "Quatf_ScalarVectorMultiplication" )
+{
+    gm::Quatf quaternionA = gm::Quatf( 0.0f, 2.0f, 4.0f, 6.0f );
+    gm::Quatf quaternionB = 5.0f * quaternionA;
+    CHECK( quaternionB == gm::Quatf( 0.0f, 10.0f, 20.0f, 30.0f ) );
+}
+
+TEST_CASE( "Quatf_VectorScalarMultiplication" )
+{
+    gm::Quatf quaternionA = gm::Quatf( 0.0f, 2.0f, 4.0f, 6.0f );
+    gm::Quatf quaternionB = quaternionA * 5.0f;
+    CHECK( quaternionB == gm::Quatf( 0.0f, 10.0f, 20.0f, 30.0f ) );
+}
+
+TEST_CASE( "Quatf_ScalarMultiplicationAssignment" )
+{
+    gm::Quatf quaternionA = gm::Quatf( 0.0f, 2.0f, 4.0f, 6.0f );
+    quaternionA *= 5;
+    CHECK( quaternionA == gm::Quatf( 0.0f, 10.0f, 20.0f, 30.0f ) );
+}
+
+TEST_CASE( "Quatf_VectorScalarDivision" )
+{
+    gm::Quatf quaternionA = gm::Quatf( 0.0f, 10.0f, 20.0f, 30.0f );
+    gm::Quatf quaternionB = quaternionA / 5.0f;
+    CHECK( quaternionB == gm::Quatf( 0.0f, 2.0f, 4.0f, 6.0f ) );
+}
+
+TEST_CASE( "Quatf_ScalarDivisionAssignment" )
+{
+    gm::Quatf quaternionA = gm::Quatf( 0.0f, 10.0f, 20.0f, 30.0f );
+    quaternionA /= 5;
+    CHECK( quaternionA == gm::Quatf( 0.0f, 2.0f, 4.0f, 6.0f ) );
+}
+
+TEST_CASE( "Quatf_Negation" )
+{
+    gm::Quatf quaternion = gm::Quatf( 0.0f, 2.0f, 4.0f, 6.0f );
+    CHECK( -quaternion == gm::Quatf( 0.0f, -2.0f, -4.0f, -6.0f ) );
+}
+
+TEST_CASE( "Quatf_Identity" )
+{
+    gm::Quatf quaternion = gm::Quatf::Identity();
+    CHECK( quaternion.X() == 0.0f );
+    CHECK( quaternion.Y() == 0.0f );
+    CHECK( quaternion.Z() == 0.0f );
+    CHECK( quaternion.W() == 1.0f );
+}
@@ -0,0 +1,23 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/types/quatfArray.h>
+
+TEST_CASE( "QuatfArray_DefaultConstructor" )
+{
+    gm::QuatfArray array;
+    CHECK( array.size() == 0 );
+}
+
+TEST_CASE( "QuatfArray_ContiguousStorage" )
+{
+    gm::QuatfArray array( 5 );
+    CHECK( array.size() == 5 );
+
+    const float* first = reinterpret_cast< const float* >( &array[ 0 ] );
+    const float* last  = reinterpret_cast< const float* >( &array[ 4 ] );
+    CHECK( last - first == 4 * 4 );
+}
\ No newline at end of file
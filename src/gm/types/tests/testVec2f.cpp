@@ -42,6 +42,16 @@ TEST_CASE( "Vec2f_ElementWriteAccess" )
     CHECK( vector[ 1 ] == 5.0f );
 }
 
+TEST_CASE( "Vec2f_DataAccess" )
+{
+    gm::Vec2f vector = gm::Vec2f( 0.0f, 2.0f );
+    float*    data   = vector.Data();
+    CHECK( data[ 0 ] == 0.0f );
+    CHECK( data[ 1 ] == 2.0f );
+    data[ 0 ] = 7.0f;
+    CHECK( vector[ 0 ] == 7.0f );
+}
+
 TEST_CASE( "Vec2f_NamedElementReadAccessorX" )
 {
     gm::Vec2f vector = gm::Vec2f( 0.0f, 1.0f );
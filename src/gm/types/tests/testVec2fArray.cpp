@@ -0,0 +1,23 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/types/vec2fArray.h>
+
+TEST_CASE( "Vec2fArray_DefaultConstructor" )
+{
+    gm::Vec2fArray array;
+    CHECK( array.size() == 0 );
+}
+
+TEST_CASE( "Vec2fArray_ContiguousStorage" )
+{
+    gm::Vec2fArray array( 5 );
+    CHECK( array.size() == 5 );
+
+    const float* first = reinterpret_cast< const float* >( &array[ 0 ] );
+    const float* last  = reinterpret_cast< const float* >( &array[ 4 ] );
+    CHECK( last - first == 4 * 2 );
+}
\ No newline at end of file
@@ -42,6 +42,16 @@ TEST_CASE( "Vec2i_ElementWriteAccess" )
     CHECK( vector[ 1 ] == 5 );
 }
 
+TEST_CASE( "Vec2i_DataAccess" )
+{
+    gm::Vec2i vector = gm::Vec2i( 0, 2 );
+    int*      data   = vector.Data();
+    CHECK( data[ 0 ] == 0 );
+    CHECK( data[ 1 ] == 2 );
+    data[ 0 ] = 7;
+    CHECK( vector[ 0 ] == 7 );
+}
+
 TEST_CASE( "Vec2i_NamedElementReadAccessorX" )
 {
     gm::Vec2i vector = gm::Vec2i( 0, 1 );
@@ -45,6 +45,17 @@ TEST_CASE( "Vec3f_ElementWriteAccess" )
     CHECK( vector[ 2 ] == 10.0f );
 }
 
+TEST_CASE( "Vec3f_DataAccess" )
+{
+    gm::Vec3f vector = gm::Vec3f( 0.0f, 2.0f, 4.0f );
+    float*    data   = vector.Data();
+    CHECK( data[ 0 ] == 0.0f );
+    CHECK( data[ 1 ] == 2.0f );
+    CHECK( data[ 2 ] == 4.0f );
+    data[ 0 ] = 7.0f;
+    CHECK( vector[ 0 ] == 7.0f );
+}
+
 TEST_CASE( "Vec3f_NamedElementReadAccessorX" )
 {
     gm::Vec3f vector = gm::Vec3f( 0.0f, 1.0f, 2.0f );
@@ -0,0 +1,188 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/types/vec3fA.h>
+
+TEST_CASE( "Vec3fA_DefaultConstructor" )
+{
+    gm::Vec3fA vector;
+    CHECK( vector == gm::Vec3fA( 0.0f, 0.0f, 0.0f ) );
+}
+
+TEST_CASE( "Vec3fA_CopyConstructor" )
+{
+    gm::Vec3fA vectorA = gm::Vec3fA( 0.0f, 2.0f, 4.0f );
+    gm::Vec3fA vectorB( vectorA );
+    CHECK( vectorA == vectorB );
+}
+
+TEST_CASE( "Vec3fA_CopyAssignmentConstructor" )
+{
+    gm::Vec3fA vectorA = gm::Vec3fA( 0.0f, 2.0f, 4.0f );
+    gm::Vec3fA vectorB = vectorA;
+    CHECK( vectorA == vectorB );
+}
+
+TEST_CASE( "Vec3fA_ElementReadAccess" )
+{
+    gm::Vec3fA vector = gm::Vec3fA( 0.0f, 2.0f, 4.0f );
+    CHECK( vector[ 0 ] == 0.0f );
+    CHECK( vector[ 1 ] == 2.0f );
+    CHECK( vector[ 2 ] == 4.0f );
+}
+
+TEST_CASE( "Vec3fA_ElementWriteAccess" )
+{
+    gm::Vec3fA vector;
+    vector[ 0 ] = 0.0f;
+    vector[ 1 ] = 5.0f;
+    vector[ 2 ] = 10.0f;
+    CHECK( vector[ 0 ] == 0.0f );
+    CHECK( vector[ 1 ] == 5.0f );
+    CHECK( vector[ 2 ] == 10.0f );
+}
+
+TEST_CASE( "Vec3fA_DataAccess" )
+{
+    gm::Vec3fA vector = gm::Vec3fA( 0.0f, 2.0f, 4.0f );
+    float*     data   = vector.Data();
+    CHECK( data[ 0 ] == 0.0f );
+    CHECK( data[ 1 ] == 2.0f );
+    CHECK( data[ 2 ] == 4.0f );
+    data[ 0 ] = 7.0f;
+    CHECK( vector[ 0 ] == 7.0f );
+}
+
+TEST_CASE( "Vec3fA_NamedElementReadAccessorX" )
+{
+    gm::Vec3fA vector = gm::Vec3fA( 0.0f, 1.0f, 2.0f );
+    CHECK( vector.X() == 0.0f );
+}
+
+TEST_CASE( "Vec3fA_NamedElementWriteAccessorX" )
+{
+    gm::Vec3fA vector;
+    vector.X() = 0.0f;
+    CHECK( vector[ 0 ] == 0.0f );
+}
+TEST_CASE( "Vec3fA_NamedElementReadAccessorY" )
+{
+    gm::Vec3fA vector = gm::Vec3fA( 0.0f, 1.0f, 2.0f );
+    CHECK( vector.Y() == 1.0f );
+}
+
+TEST_CASE( "Vec3fA_NamedElementWriteAccessorY" )
+{
+    gm::Vec3fA vector;
+    vector.Y() = 1.0f;
+    CHECK( vector[ 1 ] == 1.0f );
+}
+TEST_CASE( "Vec3fA_NamedElementReadAccessorZ" )
+{
+    gm::Vec3fA vector = gm::Vec3fA( 0.0f, 1.0f, 2.0f );
+    CHECK( vector.Z() == 2.0f );
+}
+
+TEST_CASE( "Vec3fA_NamedElementWriteAccessorZ" )
+{
+    gm::Vec3fA vector;
+    vector.Z() = 2.0f;
+    CHECK( vector[ 2 ] == 2.0f );
+}
+
+TEST_CASE( "Vec3fA_Addition" )
+{
+    gm::Vec3fA vectorA = gm::Vec3fA( 0.0f, 2.0f, 4.0f );
+    gm::Vec3fA vectorB = gm::Vec3fA( 0.0f, 5.0f, 10.0f );
+    gm::Vec3fA vectorC = vectorA + vectorB;
+    CHECK( vectorC == gm::Vec3fA( 0.0f, 7.0f, 14.0f ) );
+}
+
+TEST_CASE( "Vec3fA_AdditionAssignment" )
+{
+    gm::Vec3fA vectorA = gm::Vec3fA( 0.0f, 2.0f, 4.0f );
+    gm::Vec3fA vectorB = gm::Vec3fA( 0.0f, 5.0f, 10.0f );
+    vectorB += vectorA;
+    CHECK( vectorB == gm::Vec3fA( 0.0f, 7.0f, 14.0f ) );
+}
+
+TEST_CASE( "Vec3fA_Subtraction" )
+{
+    gm::Vec3fA vectorA = gm::Vec3fA( 0.0f, 7.0f, 14.0f );
+    gm::Vec3fA vectorB = gm::Vec3fA( 0.0f, 5.0f, 10.0f );
+    gm::Vec3fA vectorC = vectorA - vectorB;
+    CHECK( vectorC == gm::Vec3fA( 0.0f, 2.0f, 4.0f ) );
+}
+
+TEST_CASE( "Vec3fA_SubtractionAssignment" )
+{
+    gm::Vec3fA vectorA = gm::Vec3fA( 0.0f, 5.0f, 10.0f );
+    gm::Vec3fA vectorB = gm::Vec3fA( 0.0f, 7.0f, 14.0f );
+    vectorB -= vectorA;
+    CHECK( vectorB == gm::Vec3fA( 0.0f, 2.0f, 4.0f ) );
+}
+
+TEST_CASE( "Vec3fA_ScalarVectorMultiplication" )
+{
+    gm::Vec3fA vectorA = gm::Vec3fA( 0.0f, 2.0f, 4.0f );
+    gm::Vec3fA vectorB = 5.0f * vectorA;
+    CHECK( vectorB == gm::Vec3fA( 0.0f, 10.0f, 20.0f ) );
+}
+
+TEST_CASE( "Vec3fA_VectorScalarMultiplication" )
+{
+    gm::Vec3fA vectorA = gm::Vec3fA( 0.0f, 2.0f, 4.0f );
+    gm::Vec3fA vectorB = vectorA * 5.0f;
+    CHECK( vectorB == gm::Vec3fA( 0.0f, 10.0f, 20.0f ) );
+}
+
+TEST_CASE( "Vec3fA_ScalarMultiplicationAssignment" )
+{
+    gm::Vec3fA vectorA = gm::Vec3fA( 0.0f, 2.0f, 4.0f );
+    vectorA *= 5;
+    CHECK( vectorA == gm::Vec3fA( 0.0f, 10.0f, 20.0f ) );
+}
+
+TEST_CASE( "Vec3fA_VectorScalarDivision" )
+{
+    gm::Vec3fA vectorA = gm::Vec3fA( 0.0f, 10.0f, 20.0f );
+    gm::Vec3fA vectorB = vectorA / 5.0f;
+    CHECK( vectorB == gm::Vec3fA( 0.0f, 2.0f, 4.0f ) );
+}
+
+TEST_CASE( "Vec3fA_ScalarDivisionAssignment" )
+{
+    gm::Vec3fA vectorA = gm::Vec3fA( 0.0f, 10.0f, 20.0f );
+    vectorA /= 5;
+    CHECK( vectorA == gm::Vec3fA( 0.0f, 2.0f, 4.0f ) );
+}
+
+TEST_CASE( "Vec3fA_Negation" )
+{
+    gm::Vec3fA vector = gm::Vec3fA( 0.0f, 2.0f, 4.0f );
+    CHECK( -vector == gm::Vec3fA( 0.0f, -2.0f, -4.0f ) );
+}
+
+TEST_CASE( "Vec3fA_Alignment" )
+{
+    CHECK( alignof( gm::Vec3fA ) == 16 );
+    CHECK( sizeof( gm::Vec3fA ) % 16 == 0 );
+    CHECK( sizeof( gm::Vec3fA ) >= sizeof( gm::Vec3f ) );
+
+    gm::Vec3fA vectors[ 3 ];
+    for ( const gm::Vec3fA& vector : vectors )
+    {
+        CHECK( reinterpret_cast< uintptr_t >( vector.Data() ) % 16 == 0 );
+    }
+}
+
+TEST_CASE( "Vec3fA_UnalignedConversion" )
+{
+    gm::Vec3f  unaligned = gm::Vec3f( 0.0f, 2.0f, 4.0f );
+    gm::Vec3fA aligned( unaligned );
+    CHECK( aligned == gm::Vec3fA( 0.0f, 2.0f, 4.0f ) );
+    CHECK( aligned.GetUnaligned() == unaligned );
+}
@@ -0,0 +1,49 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/types/vec3fPacket16.h>
+
+#include <cstdint>
+
+TEST_CASE( "Vec3fPacket16_DefaultConstructor" )
+{
+    gm::Vec3fPacket16 packet;
+    for ( size_t componentIndex = 0; componentIndex < 3; ++componentIndex )
+    {
+        for ( size_t laneIndex = 0; laneIndex < 16; ++laneIndex )
+        {
+            CHECK( packet( componentIndex, laneIndex ) == 0.0f );
+        }
+    }
+}
+
+TEST_CASE( "Vec3fPacket16_BroadcastConstructor" )
+{
+    gm::Vec3fPacket16 packet( gm::Vec3f( 2.0f, 2.0f, 2.0f ) );
+    for ( size_t laneIndex = 0; laneIndex < 16; ++laneIndex )
+    {
+        CHECK( packet.GetLane( laneIndex ) == gm::Vec3f( 2.0f, 2.0f, 2.0f ) );
+    }
+}
+
+TEST_CASE( "Vec3fPacket16_LaneAccess" )
+{
+    gm::Vec3fPacket16 packet;
+    packet.SetLane( 0, gm::Vec3f( 1.0f, 1.0f, 1.0f ) );
+    packet.SetLane( 15, gm::Vec3f( 3.0f, 3.0f, 3.0f ) );
+    CHECK( packet.GetLane( 0 ) == gm::Vec3f( 1.0f, 1.0f, 1.0f ) );
+    CHECK( packet.GetLane( 1 ) == gm::Vec3f( 0.0f, 0.0f, 0.0f ) );
+    CHECK( packet.GetLane( 15 ) == gm::Vec3f( 3.0f, 3.0f, 3.0f ) );
+}
+
+TEST_CASE( "Vec3fPacket16_StructureOfArraysStorage" )
+{
+    gm::Vec3fPacket16 packet;
+    packet( 1, 2 ) = 5.0f;
+    CHECK( packet.Lanes( 1 )[ 2 ] == 5.0f );
+    CHECK( packet.Lanes( 1 ) - packet.Lanes( 0 ) == 16 );
+    CHECK( reinterpret_cast< std::uintptr_t >( packet.Lanes( 0 ) ) % 32 == 0 );
+}
\ No newline at end of file
@@ -0,0 +1,49 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/types/vec3fPacket8.h>
+
+#include <cstdint>
+
+TEST_CASE( "Vec3fPacket8_DefaultConstructor" )
+{
+    gm::Vec3fPacket8 packet;
+    for ( size_t componentIndex = 0; componentIndex < 3; ++componentIndex )
+    {
+        for ( size_t laneIndex = 0; laneIndex < 8; ++laneIndex )
+        {
+            CHECK( packet( componentIndex, laneIndex ) == 0.0f );
+        }
+    }
+}
+
+TEST_CASE( "Vec3fPacket8_BroadcastConstructor" )
+{
+    gm::Vec3fPacket8 packet( gm::Vec3f( 2.0f, 2.0f, 2.0f ) );
+    for ( size_t laneIndex = 0; laneIndex < 8; ++laneIndex )
+    {
+        CHECK( packet.GetLane( laneIndex ) == gm::Vec3f( 2.0f, 2.0f, 2.0f ) );
+    }
+}
+
+TEST_CASE( "Vec3fPacket8_LaneAccess" )
+{
+    gm::Vec3fPacket8 packet;
+    packet.SetLane( 0, gm::Vec3f( 1.0f, 1.0f, 1.0f ) );
+    packet.SetLane( 7, gm::Vec3f( 3.0f, 3.0f, 3.0f ) );
+    CHECK( packet.GetLane( 0 ) == gm::Vec3f( 1.0f, 1.0f, 1.0f ) );
+    CHECK( packet.GetLane( 1 ) == gm::Vec3f( 0.0f, 0.0f, 0.0f ) );
+    CHECK( packet.GetLane( 7 ) == gm::Vec3f( 3.0f, 3.0f, 3.0f ) );
+}
+
+TEST_CASE( "Vec3fPacket8_StructureOfArraysStorage" )
+{
+    gm::Vec3fPacket8 packet;
+    packet( 1, 2 ) = 5.0f;
+    CHECK( packet.Lanes( 1 )[ 2 ] == 5.0f );
+    CHECK( packet.Lanes( 1 ) - packet.Lanes( 0 ) == 8 );
+    CHECK( reinterpret_cast< std::uintptr_t >( packet.Lanes( 0 ) ) % 32 == 0 );
+}
\ No newline at end of file
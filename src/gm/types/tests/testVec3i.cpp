@@ -45,6 +45,17 @@ TEST_CASE( "Vec3i_ElementWriteAccess" )
     CHECK( vector[ 2 ] == 10 );
 }
 
+TEST_CASE( "Vec3i_DataAccess" )
+{
+    gm::Vec3i vector = gm::Vec3i( 0, 2, 4 );
+    int*      data   = vector.Data();
+    CHECK( data[ 0 ] == 0 );
+    CHECK( data[ 1 ] == 2 );
+    CHECK( data[ 2 ] == 4 );
+    data[ 0 ] = 7;
+    CHECK( vector[ 0 ] == 7 );
+}
+
 TEST_CASE( "Vec3i_NamedElementReadAccessorX" )
 {
     gm::Vec3i vector = gm::Vec3i( 0, 1, 2 );
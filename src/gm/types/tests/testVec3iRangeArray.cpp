@@ -0,0 +1,23 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/types/vec3iRangeArray.h>
+
+TEST_CASE( "Vec3iRangeArray_DefaultConstructor" )
+{
+    gm::Vec3iRangeArray array;
+    CHECK( array.size() == 0 );
+}
+
+TEST_CASE( "Vec3iRangeArray_ContiguousStorage" )
+{
+    gm::Vec3iRangeArray array( 5 );
+    CHECK( array.size() == 5 );
+
+    const int* first = reinterpret_cast< const int* >( &array[ 0 ] );
+    const int* last  = reinterpret_cast< const int* >( &array[ 4 ] );
+    CHECK( last - first == 4 * 6 );
+}
\ No newline at end of file
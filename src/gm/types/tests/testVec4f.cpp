@@ -48,6 +48,18 @@ TEST_CASE( "Vec4f_ElementWriteAccess" )
     CHECK( vector[ 3 ] == 15.0f );
 }
 
+TEST_CASE( "Vec4f_DataAccess" )
+{
+    gm::Vec4f vector = gm::Vec4f( 0.0f, 2.0f, 4.0f, 6.0f );
+    float*    data   = vector.Data();
+    CHECK( data[ 0 ] == 0.0f );
+    CHECK( data[ 1 ] == 2.0f );
+    CHECK( data[ 2 ] == 4.0f );
+    CHECK( data[ 3 ] == 6.0f );
+    data[ 0 ] = 7.0f;
+    CHECK( vector[ 0 ] == 7.0f );
+}
+
 TEST_CASE( "Vec4f_NamedElementReadAccessorX" )
 {
     gm::Vec4f vector = gm::Vec4f( 0.0f, 1.0f, 2.0f, 3.0f );
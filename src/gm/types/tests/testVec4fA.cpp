@@ -0,0 +1,204 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#include <catch2/catch.hpp>
+
+#include <gm/types/vec4fA.h>
+
+TEST_CASE( "Vec4fA_DefaultConstructor" )
+{
+    gm::Vec4fA vector;
+    CHECK( vector == gm::Vec4fA( 0.0f, 0.0f, 0.0f, 0.0f ) );
+}
+
+TEST_CASE( "Vec4fA_CopyConstructor" )
+{
+    gm::Vec4fA vectorA = gm::Vec4fA( 0.0f, 2.0f, 4.0f, 6.0f );
+    gm::Vec4fA vectorB( vectorA );
+    CHECK( vectorA == vectorB );
+}
+
+TEST_CASE( "Vec4fA_CopyAssignmentConstructor" )
+{
+    gm::Vec4fA vectorA = gm::Vec4fA( 0.0f, 2.0f, 4.0f, 6.0f );
+    gm::Vec4fA vectorB = vectorA;
+    CHECK( vectorA == vectorB );
+}
+
+TEST_CASE( "Vec4fA_ElementReadAccess" )
+{
+    gm::Vec4fA vector = gm::Vec4fA( 0.0f, 2.0f, 4.0f, 6.0f );
+    CHECK( vector[ 0 ] == 0.0f );
+    CHECK( vector[ 1 ] == 2.0f );
+    CHECK( vector[ 2 ] == 4.0f );
+    CHECK( vector[ 3 ] == 6.0f );
+}
+
+TEST_CASE( "Vec4fA_ElementWriteAccess" )
+{
+    gm::Vec4fA vector;
+    vector[ 0 ] = 0.0f;
+    vector[ 1 ] = 5.0f;
+    vector[ 2 ] = 10.0f;
+    vector[ 3 ] = 15.0f;
+    CHECK( vector[ 0 ] == 0.0f );
+    CHECK( vector[ 1 ] == 5.0f );
+    CHECK( vector[ 2 ] == 10.0f );
+    CHECK( vector[ 3 ] == 15.0f );
+}
+
+TEST_CASE( "Vec4fA_DataAccess" )
+{
+    gm::Vec4fA vector = gm::Vec4fA( 0.0f, 2.0f, 4.0f, 6.0f );
+    float*     data   = vector.Data();
+    CHECK( data[ 0 ] == 0.0f );
+    CHECK( data[ 1 ] == 2.0f );
+    CHECK( data[ 2 ] == 4.0f );
+    CHECK( data[ 3 ] == 6.0f );
+    data[ 0 ] = 7.0f;
+    CHECK( vector[ 0 ] == 7.0f );
+}
+
+TEST_CASE( "Vec4fA_NamedElementReadAccessorX" )
+{
+    gm::Vec4fA vector = gm::Vec4fA( 0.0f, 1.0f, 2.0f, 3.0f );
+    CHECK( vector.X() == 0.0f );
+}
+
+TEST_CASE( "Vec4fA_NamedElementWriteAccessorX" )
+{
+    gm::Vec4fA vector;
+    vector.X() = 0.0f;
+    CHECK( vector[ 0 ] == 0.0f );
+}
+TEST_CASE( "Vec4fA_NamedElementReadAccessorY" )
+{
+    gm::Vec4fA vector = gm::Vec4fA( 0.0f, 1.0f, 2.0f, 3.0f );
+    CHECK( vector.Y() == 1.0f );
+}
+
+TEST_CASE( "Vec4fA_NamedElementWriteAccessorY" )
+{
+    gm::Vec4fA vector;
+    vector.Y() = 1.0f;
+    CHECK( vector[ 1 ] == 1.0f );
+}
+TEST_CASE( "Vec4fA_NamedElementReadAccessorZ" )
+{
+    gm::Vec4fA vector = gm::Vec4fA( 0.0f, 1.0f, 2.0f, 3.0f );
+    CHECK( vector.Z() == 2.0f );
+}
+
+TEST_CASE( "Vec4fA_NamedElementWriteAccessorZ" )
+{
+    gm::Vec4fA vector;
+    vector.Z() = 2.0f;
+    CHECK( vector[ 2 ] == 2.0f );
+}
+TEST_CASE( "Vec4fA_NamedElementReadAccessorW" )
+{
+    gm::Vec4fA vector = gm::Vec4fA( 0.0f, 1.0f, 2.0f, 3.0f );
+    CHECK( vector.W() == 3.0f );
+}
+
+TEST_CASE( "Vec4fA_NamedElementWriteAccessorW" )
+{
+    gm::Vec4fA vector;
+    vector.W() = 3.0f;
+    CHECK( vector[ 3 ] == 3.0f );
+}
+
+TEST_CASE( "Vec4fA_Addition" )
+{
+    gm::Vec4fA vectorA = gm::Vec4fA( 0.0f, 2.0f, 4.0f, 6.0f );
+    gm::Vec4fA vectorB = gm::Vec4fA( 0.0f, 5.0f, 10.0f, 15.0f );
+    gm::Vec4fA vectorC = vectorA + vectorB;
+    CHECK( vectorC == gm::Vec4fA( 0.0f, 7.0f, 14.0f, 21.0f ) );
+}
+
+TEST_CASE( "Vec4fA_AdditionAssignment" )
+{
+    gm::Vec4fA vectorA = gm::Vec4fA( 0.0f, 2.0f, 4.0f, 6.0f );
+    gm::Vec4fA vectorB = gm::Vec4fA( 0.0f, 5.0f, 10.0f, 15.0f );
+    vectorB += vectorA;
+    CHECK( vectorB == gm::Vec4fA( 0.0f, 7.0f, 14.0f, 21.0f ) );
+}
+
+TEST_CASE( "Vec4fA_Subtraction" )
+{
+    gm::Vec4fA vectorA = gm::Vec4fA( 0.0f, 7.0f, 14.0f, 21.0f );
+    gm::Vec4fA vectorB = gm::Vec4fA( 0.0f, 5.0f, 10.0f, 15.0f );
+    gm::Vec4fA vectorC = vectorA - vectorB;
+    CHECK( vectorC == gm::Vec4fA( 0.0f, 2.0f, 4.0f, 6.0f ) );
+}
+
+TEST_CASE( "Vec4fA_SubtractionAssignment" )
+{
+    gm::Vec4fA vectorA = gm::Vec4fA( 0.0f, 5.0f, 10.0f, 15.0f );
+    gm::Vec4fA vectorB = gm::Vec4fA( 0.0f, 7.0f, 14.0f, 21.0f );
+    vectorB -= vectorA;
+    CHECK( vectorB == gm::Vec4fA( 0.0f, 2.0f, 4.0f, 6.0f ) );
+}
+
+TEST_CASE( "Vec4fA_ScalarVectorMultiplication" )
+{
+    gm::Vec4fA vectorA = gm::Vec4fA( 0.0f, 2.0f, 4.0f, 6.0f );
+    gm::Vec4fA vectorB = 5.0f * vectorA;
+    CHECK( vectorB == gm::Vec4fA( 0.0f, 10.0f, 20.0f, 30.0f ) );
+}
+
+TEST_CASE( "Vec4fA_VectorScalarMultiplication" )
+{
+    gm::Vec4fA vectorA = gm::Vec4fA( 0.0f, 2.0f, 4.0f, 6.0f );
+    gm::Vec4fA vectorB = vectorA * 5.0f;
+    CHECK( vectorB == gm::Vec4fA( 0.0f, 10.0f, 20.0f, 30.0f ) );
+}
+
+TEST_CASE( "Vec4fA_ScalarMultiplicationAssignment" )
+{
+    gm::Vec4fA vectorA = gm::Vec4fA( 0.0f, 2.0f, 4.0f, 6.0f );
+    vectorA *= 5;
+    CHECK( vectorA == gm::Vec4fA( 0.0f, 10.0f, 20.0f, 30.0f ) );
+}
+
+TEST_CASE( "Vec4fA_VectorScalarDivision" )
+{
+    gm::Vec4fA vectorA = gm::Vec4fA( 0.0f, 10.0f, 20.0f, 30.0f );
+    gm::Vec4fA vectorB = vectorA / 5.0f;
+    CHECK( vectorB == gm::Vec4fA( 0.0f, 2.0f, 4.0f, 6.0f ) );
+}
+
+TEST_CASE( "Vec4fA_ScalarDivisionAssignment" )
+{
+    gm::Vec4fA vectorA = gm::Vec4fA( 0.0f, 10.0f, 20.0f, 30.0f );
+    vectorA /= 5;
+    CHECK( vectorA == gm::Vec4fA( 0.0f, 2.0f, 4.0f, 6.0f ) );
+}
+
+TEST_CASE( "Vec4fA_Negation" )
+{
+    gm::Vec4fA vector = gm::Vec4fA( 0.0f, 2.0f, 4.0f, 6.0f );
+    CHECK( -vector == gm::Vec4fA( 0.0f, -2.0f, -4.0f, -6.0f ) );
+}
+
+TEST_CASE( "Vec4fA_Alignment" )
+{
+    CHECK( alignof( gm::Vec4fA ) == 16 );
+    CHECK( sizeof( gm::Vec4fA ) % 16 == 0 );
+    CHECK( sizeof( gm::Vec4fA ) >= sizeof( gm::Vec4f ) );
+
+    gm::Vec4fA vectors[ 3 ];
+    for ( const gm::Vec4fA& vector : vectors )
+    {
+        CHECK( reinterpret_cast< uintptr_t >( vector.Data() ) % 16 == 0 );
+    }
+}
+
+TEST_CASE( "Vec4fA_UnalignedConversion" )
+{
+    gm::Vec4f  unaligned = gm::Vec4f( 0.0f, 2.0f, 4.0f, 6.0f );
+    gm::Vec4fA aligned( unaligned );
+    CHECK( aligned == gm::Vec4fA( 0.0f, 2.0f, 4.0f, 6.0f ) );
+    CHECK( aligned.GetUnaligned() == unaligned );
+}
@@ -48,6 +48,18 @@ TEST_CASE( "Vec4i_ElementWriteAccess" )
     CHECK( vector[ 3 ] == 15 );
 }
 
+TEST_CASE( "Vec4i_DataAccess" )
+{
+    gm::Vec4i vector = gm::Vec4i( 0, 2, 4, 6 );
+    int*      data   = vector.Data();
+    CHECK( data[ 0 ] == 0 );
+    CHECK( data[ 1 ] == 2 );
+    CHECK( data[ 2 ] == 4 );
+    CHECK( data[ 3 ] == 6 );
+    data[ 0 ] = 7;
+    CHECK( vector[ 0 ] == 7 );
+}
+
 TEST_CASE( "Vec4i_NamedElementReadAccessorX" )
 {
     gm::Vec4i vector = gm::Vec4i( 0, 1, 2, 3 );
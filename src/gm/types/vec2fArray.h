@@ -0,0 +1,29 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file vec2fArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/vec2f.h>
+
+GM_NS_OPEN
+
+/// \typedef Vec2fArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of Vec2f(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 2 float(s) per element.
+using Vec2fArray = std::vector< Vec2f >;
+
+static_assert( sizeof( Vec2f ) == sizeof( float ) * 2, "Vec2f must be tightly packed for Vec2fArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
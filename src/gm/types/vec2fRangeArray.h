@@ -0,0 +1,30 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file vec2fRangeArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/vec2fRange.h>
+
+GM_NS_OPEN
+
+/// \typedef Vec2fRangeArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of Vec2fRange(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 4 float(s) per element.
+using Vec2fRangeArray = std::vector< Vec2fRange >;
+
+static_assert( sizeof( Vec2fRange ) == sizeof( float ) * 4,
+               "Vec2fRange must be tightly packed for Vec2fRangeArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
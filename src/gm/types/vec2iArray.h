@@ -0,0 +1,29 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file vec2iArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/vec2i.h>
+
+GM_NS_OPEN
+
+/// \typedef Vec2iArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of Vec2i(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 2 int(s) per element.
+using Vec2iArray = std::vector< Vec2i >;
+
+static_assert( sizeof( Vec2i ) == sizeof( int ) * 2, "Vec2i must be tightly packed for Vec2iArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
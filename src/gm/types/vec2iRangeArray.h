@@ -0,0 +1,30 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file vec2iRangeArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/vec2iRange.h>
+
+GM_NS_OPEN
+
+/// \typedef Vec2iRangeArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of Vec2iRange(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 4 int(s) per element.
+using Vec2iRangeArray = std::vector< Vec2iRange >;
+
+static_assert( sizeof( Vec2iRange ) == sizeof( int ) * 4,
+               "Vec2iRange must be tightly packed for Vec2iRangeArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,29 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file vec3fArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/vec3f.h>
+
+GM_NS_OPEN
+
+/// \typedef Vec3fArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of Vec3f(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 3 float(s) per element.
+using Vec3fArray = std::vector< Vec3f >;
+
+static_assert( sizeof( Vec3f ) == sizeof( float ) * 3, "Vec3f must be tightly packed for Vec3fArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,30 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file vec3fRangeArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/vec3fRange.h>
+
+GM_NS_OPEN
+
+/// \typedef Vec3fRangeArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of Vec3fRange(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 6 float(s) per element.
+using Vec3fRangeArray = std::vector< Vec3fRange >;
+
+static_assert( sizeof( Vec3fRange ) == sizeof( float ) * 6,
+               "Vec3fRange must be tightly packed for Vec3fRangeArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
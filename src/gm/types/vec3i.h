@@ -74,6 +74,26 @@ public:
         return m_elements[ i_index ];
     }
 
+    // --------------------------------------------------------------------- //
+    /// \name Raw element storage access
+    // --------------------------------------------------------------------- //
+
+    /// Mutable access to the contiguous, row-major storage of the 3 elements.
+    ///
+    /// \return pointer to the first element.
+    GM_HOST_DEVICE inline int* Data()
+    {
+        return m_elements;
+    }
+
+    /// Immutable access to the contiguous, row-major storage of the 3 elements.
+    ///
+    /// \return pointer to the first element.
+    GM_HOST_DEVICE inline const int* Data() const
+    {
+        return m_elements;
+    }
+
     // --------------------------------------------------------------------- //
     /// \name Named element access.
     // --------------------------------------------------------------------- //
@@ -0,0 +1,29 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file vec3iArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/vec3i.h>
+
+GM_NS_OPEN
+
+/// \typedef Vec3iArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of Vec3i(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 3 int(s) per element.
+using Vec3iArray = std::vector< Vec3i >;
+
+static_assert( sizeof( Vec3i ) == sizeof( int ) * 3, "Vec3i must be tightly packed for Vec3iArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,30 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file vec3iRangeArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/vec3iRange.h>
+
+GM_NS_OPEN
+
+/// \typedef Vec3iRangeArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of Vec3iRange(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 6 int(s) per element.
+using Vec3iRangeArray = std::vector< Vec3iRange >;
+
+static_assert( sizeof( Vec3iRange ) == sizeof( int ) * 6,
+               "Vec3iRange must be tightly packed for Vec3iRangeArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
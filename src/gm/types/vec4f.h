@@ -15,6 +15,7 @@
 
 #include <gm/base/almost.h>
 #include <gm/base/diagnostic.h>
+#include <gm/base/simd.h>
 
 GM_NS_OPEN
 
@@ -79,6 +80,26 @@ public:
         return m_elements[ i_index ];
     }
 
+    // --------------------------------------------------------------------- //
+    /// \name Raw element storage access
+    // --------------------------------------------------------------------- //
+
+    /// Mutable access to the contiguous, row-major storage of the 4 elements.
+    ///
+    /// \return pointer to the first element.
+    GM_HOST_DEVICE inline float* Data()
+    {
+        return m_elements;
+    }
+
+    /// Immutable access to the contiguous, row-major storage of the 4 elements.
+    ///
+    /// \return pointer to the first element.
+    GM_HOST_DEVICE inline const float* Data() const
+    {
+        return m_elements;
+    }
+
     // --------------------------------------------------------------------- //
     /// \name Named element access.
     // --------------------------------------------------------------------- //
@@ -164,20 +185,32 @@ public:
     GM_HOST_DEVICE inline Vec4f operator+( const Vec4f& i_vector ) const
     {
         GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        Vec4f result;
+        _mm_storeu_ps( result.m_elements + 0,
+                       _mm_add_ps( _mm_loadu_ps( m_elements + 0 ), _mm_loadu_ps( i_vector.m_elements + 0 ) ) );
+        return result;
+#else
         return Vec4f( m_elements[ 0 ] + i_vector.m_elements[ 0 ],
                       m_elements[ 1 ] + i_vector.m_elements[ 1 ],
                       m_elements[ 2 ] + i_vector.m_elements[ 2 ],
                       m_elements[ 3 ] + i_vector.m_elements[ 3 ] );
+#endif
     }
 
     /// Element-wise vector addition assignment.
     GM_HOST_DEVICE inline Vec4f& operator+=( const Vec4f& i_vector )
     {
         GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        _mm_storeu_ps( m_elements + 0,
+                       _mm_add_ps( _mm_loadu_ps( m_elements + 0 ), _mm_loadu_ps( i_vector.m_elements + 0 ) ) );
+#else
         m_elements[ 0 ] += i_vector.m_elements[ 0 ];
         m_elements[ 1 ] += i_vector.m_elements[ 1 ];
         m_elements[ 2 ] += i_vector.m_elements[ 2 ];
         m_elements[ 3 ] += i_vector.m_elements[ 3 ];
+#endif
         return *this;
     }
 
@@ -185,20 +218,32 @@ public:
     GM_HOST_DEVICE inline Vec4f operator-( const Vec4f& i_vector ) const
     {
         GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        Vec4f result;
+        _mm_storeu_ps( result.m_elements + 0,
+                       _mm_sub_ps( _mm_loadu_ps( m_elements + 0 ), _mm_loadu_ps( i_vector.m_elements + 0 ) ) );
+        return result;
+#else
         return Vec4f( m_elements[ 0 ] - i_vector.m_elements[ 0 ],
                       m_elements[ 1 ] - i_vector.m_elements[ 1 ],
                       m_elements[ 2 ] - i_vector.m_elements[ 2 ],
                       m_elements[ 3 ] - i_vector.m_elements[ 3 ] );
+#endif
     }
 
     /// Vector subtraction assignment.
     GM_HOST_DEVICE inline Vec4f& operator-=( const Vec4f& i_vector )
     {
         GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        _mm_storeu_ps( m_elements + 0,
+                       _mm_sub_ps( _mm_loadu_ps( m_elements + 0 ), _mm_loadu_ps( i_vector.m_elements + 0 ) ) );
+#else
         m_elements[ 0 ] -= i_vector.m_elements[ 0 ];
         m_elements[ 1 ] -= i_vector.m_elements[ 1 ];
         m_elements[ 2 ] -= i_vector.m_elements[ 2 ];
         m_elements[ 3 ] -= i_vector.m_elements[ 3 ];
+#endif
         return *this;
     }
 
@@ -206,10 +251,14 @@ public:
     GM_HOST_DEVICE inline Vec4f& operator*=( const float& i_scalar )
     {
         GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        _mm_storeu_ps( m_elements + 0, _mm_mul_ps( _mm_loadu_ps( m_elements + 0 ), _mm_set1_ps( i_scalar ) ) );
+#else
         m_elements[ 0 ] *= i_scalar;
         m_elements[ 1 ] *= i_scalar;
         m_elements[ 2 ] *= i_scalar;
         m_elements[ 3 ] *= i_scalar;
+#endif
         return *this;
     }
 
@@ -219,10 +268,16 @@ public:
         GM_ASSERT( !HasNaNs() );
         GM_ASSERT( i_scalar != 0.0f );
         float reciprocal = 1.0f / i_scalar;
+#if defined( GM_SIMD_SSE_ENABLED )
+        Vec4f result;
+        _mm_storeu_ps( result.m_elements + 0, _mm_mul_ps( _mm_loadu_ps( m_elements + 0 ), _mm_set1_ps( reciprocal ) ) );
+        return result;
+#else
         return Vec4f( m_elements[ 0 ] * reciprocal,
                       m_elements[ 1 ] * reciprocal,
                       m_elements[ 2 ] * reciprocal,
                       m_elements[ 3 ] * reciprocal );
+#endif
     }
 
     /// Scalar division assignment.
@@ -231,10 +286,14 @@ public:
         GM_ASSERT( !HasNaNs() );
         GM_ASSERT( i_scalar != 0.0f );
         float reciprocal = 1.0f / i_scalar;
+#if defined( GM_SIMD_SSE_ENABLED )
+        _mm_storeu_ps( m_elements + 0, _mm_mul_ps( _mm_loadu_ps( m_elements + 0 ), _mm_set1_ps( reciprocal ) ) );
+#else
         m_elements[ 0 ] *= reciprocal;
         m_elements[ 1 ] *= reciprocal;
         m_elements[ 2 ] *= reciprocal;
         m_elements[ 3 ] *= reciprocal;
+#endif
         return *this;
     }
 
@@ -242,7 +301,14 @@ public:
     GM_HOST_DEVICE inline Vec4f operator-() const
     {
         GM_ASSERT( !HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+        // Flip the sign bits.
+        Vec4f result;
+        _mm_storeu_ps( result.m_elements + 0, _mm_xor_ps( _mm_loadu_ps( m_elements + 0 ), _mm_set1_ps( -0.0f ) ) );
+        return result;
+#else
         return Vec4f( -m_elements[ 0 ], -m_elements[ 1 ], -m_elements[ 2 ], -m_elements[ 3 ] );
+#endif
     }
 
     // --------------------------------------------------------------------- //
@@ -313,20 +379,32 @@ private:
 GM_HOST_DEVICE inline Vec4f operator*( const Vec4f& i_vector, const float& i_scalar )
 {
     GM_ASSERT( !i_vector.HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+    Vec4f result;
+    _mm_storeu_ps( result.Data() + 0, _mm_mul_ps( _mm_loadu_ps( i_vector.Data() + 0 ), _mm_set1_ps( i_scalar ) ) );
+    return result;
+#else
     return Vec4f( i_vector[ 0 ] * i_scalar,
                   i_vector[ 1 ] * i_scalar,
                   i_vector[ 2 ] * i_scalar,
                   i_vector[ 3 ] * i_scalar );
+#endif
 }
 
 /// Scalar-vector multiplication.
 GM_HOST_DEVICE inline Vec4f operator*( const float& i_scalar, const Vec4f& i_vector )
 {
     GM_ASSERT( !i_vector.HasNaNs() );
+#if defined( GM_SIMD_SSE_ENABLED )
+    Vec4f result;
+    _mm_storeu_ps( result.Data() + 0, _mm_mul_ps( _mm_loadu_ps( i_vector.Data() + 0 ), _mm_set1_ps( i_scalar ) ) );
+    return result;
+#else
     return Vec4f( i_vector[ 0 ] * i_scalar,
                   i_vector[ 1 ] * i_scalar,
                   i_vector[ 2 ] * i_scalar,
                   i_vector[ 3 ] * i_scalar );
+#endif
 }
 
 /// Operator overload for << to enable writing the string representation of \p i_vector into an output
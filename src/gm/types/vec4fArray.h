@@ -0,0 +1,29 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file vec4fArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/vec4f.h>
+
+GM_NS_OPEN
+
+/// \typedef Vec4fArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of Vec4f(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 4 float(s) per element.
+using Vec4fArray = std::vector< Vec4f >;
+
+static_assert( sizeof( Vec4f ) == sizeof( float ) * 4, "Vec4f must be tightly packed for Vec4fArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
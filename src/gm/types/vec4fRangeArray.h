@@ -0,0 +1,30 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file vec4fRangeArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/vec4fRange.h>
+
+GM_NS_OPEN
+
+/// \typedef Vec4fRangeArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of Vec4fRange(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 8 float(s) per element.
+using Vec4fRangeArray = std::vector< Vec4fRange >;
+
+static_assert( sizeof( Vec4fRange ) == sizeof( float ) * 8,
+               "Vec4fRange must be tightly packed for Vec4fRangeArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
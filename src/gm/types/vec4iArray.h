@@ -0,0 +1,29 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file vec4iArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/vec4i.h>
+
+GM_NS_OPEN
+
+/// \typedef Vec4iArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of Vec4i(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 4 int(s) per element.
+using Vec4iArray = std::vector< Vec4i >;
+
+static_assert( sizeof( Vec4i ) == sizeof( int ) * 4, "Vec4i must be tightly packed for Vec4iArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file
@@ -0,0 +1,30 @@
+//
+// This file is auto-generated, please do not modify directly!
+//
+
+#pragma once
+
+/// \file vec4iRangeArray.h
+/// \ingroup gm_types_array
+
+#include <gm/gm.h>
+
+#include <vector>
+
+#include <gm/types/vec4iRange.h>
+
+GM_NS_OPEN
+
+/// \typedef Vec4iRangeArray
+/// \ingroup gm_types_array
+///
+/// Type definition of a packed, contiguous and resizable array of Vec4iRange(s).
+///
+/// The elements are stored by value, back to back, such that the storage of the array
+/// can be addressed as 8 int(s) per element.
+using Vec4iRangeArray = std::vector< Vec4iRange >;
+
+static_assert( sizeof( Vec4iRange ) == sizeof( int ) * 8,
+               "Vec4iRange must be tightly packed for Vec4iRangeArray storage." );
+
+GM_NS_CLOSE
\ No newline at end of file